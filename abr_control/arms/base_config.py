@@ -1,19 +1,63 @@
 import cloudpickle
 import hashlib
 import importlib
+import json
 import numpy as np
 import os
+import scipy.linalg
 import sympy as sp
 from sympy.utilities.autowrap import autowrap
 import sys
+import timeit
+import tracemalloc
 
+import abr_control.arms.surrogate
+import abr_control.utils.codegen
 import abr_control.utils.os_utils
+import abr_control.utils.transformations
 from abr_control.utils.paths import cache_dir
+from abr_control.version import version
 
 
 # TODO : store lambdified functions, currently running into pickling errors
 # cloudpickle, dill, and pickle all run into problems
 
+# functions and expressions loaded in this process, shared by all instances
+# of a config, keyed on (config_folder, backend or 'expression', filename)
+_REGISTRY = {}
+
+
+def clear_registry():
+    """ Removes all functions and expressions from the shared registry
+
+    Instances keep the functions they have already loaded, call
+    robot_config._reset_functions() to reload them as well.
+    """
+
+    _REGISTRY.clear()
+
+
+def _horner(expression):
+    """ Rewrites an expression in Horner form in its sin and cos terms """
+
+    gens = sorted(expression.atoms(sp.sin, sp.cos), key=str)
+    if len(gens) == 0:
+        return expression
+    try:
+        return sp.horner(expression, *gens)
+    except sp.PolynomialError:
+        return expression
+
+
+# the strategies available to the simplification pipeline, CSE leaves the
+# expression as is and has the functions generated with cse=True
+SIMPLIFICATION_STRATEGIES = {
+    'trigsimp': sp.trigsimp,
+    'horner': _horner,
+    'cse': None,
+}
+
+
 class BaseConfig():
     """
     Defines useful functions for controlling a robot
@@ -27,6 +71,11 @@ class BaseConfig():
     desires a symbolic expression, call the _calc_* methods with
     lambdify = False. Lambdify is True by default.
 
+    Loaded functions and expressions are kept in a process wide registry,
+    so other instances of the same config, such as the controller's and the
+    simulator's, reuse them instead of loading them from file again. Worker
+    processes forked after the functions are loaded inherit the registry.
+
     Parameters
     ----------
     N_JOINTS : int
@@ -39,6 +88,10 @@ class BaseConfig():
         if True, a more efficient function is generated
         useful when execution time is more important than
         generation time
+    use_numba : boolean, optional (Default: False)
+        if True, functions are printed as Python code and compiled
+        with Numba, which needs no C compiler and also provides
+        parallel evaluation of batches. Ignored if use_cython is True
     MEANS : list of floats, Optional (Default: None)
         expected mean of joint angles and velocities in [rad] and [rad/sec]
         respectively. Expected value for each joint. Only used for adaptation
@@ -48,12 +101,16 @@ class BaseConfig():
 
     Attributes
     ----------
-        _c : function
-            placeholder for the full centripetal and Coriolis function
         _dJ : dictionary
             for Jacobian time derivative functions of joints and COMs
+        _dynamics_derivatives : function
+            placeholder for the partial derivatives of M, g, and c function
         _g : function
             placeholder for joint space gravity function
+        _Gamma : function
+            placeholder for the Christoffel symbols function
+        _Gamma_last : tuple
+            the last joint angles and Christoffel symbols calculated
         _J  : dictionary
             for Jacobian calculations
         _KZ : sympy.Matrix
@@ -68,40 +125,71 @@ class BaseConfig():
             placeholder for orientation functions of joints and COMs
         _R : dictionary
             for transform matrix calculations for joints and COMs
-        _S : function
-            placeholder for the partial centripetal and Coriolis function
         _T_inv : dictionary
             for inverse transform calculations for joints and COMs
         _Tx : dictionary
             for point transform calculations for joints and COMs
+        _Y : function
+            placeholder for the dynamics regressor function
+        _batch : dictionary
+            for functions evaluated over a batch of inputs
+        _in_use : set
+            names of the functions loaded or generated by this config
+        _manifest_cache : tuple
+            the config_folder and the manifest of functions saved there
+        _pregenerated_cache : tuple
+            the config_folder and the pre-generated functions shipped for it
+        _simplify_budget : float
+            time budget for the simplification of each expression [seconds]
+        _simplify_strategies : list
+            names of the simplification strategies applied to expressions
         config_folder : string
             location to save to and load functions from, based on the hash
             of the subclass, so that generated functions are saved uniquely
+        simplification_stats : dictionary
+            the operation counts before and after each simplification
+            strategy, for each expression simplified by this instance
     """
 
     def __init__(self, N_JOINTS, N_LINKS, ROBOT_NAME="robot",
-                 use_cython=False, MEANS=None, SCALES=None):
+                 use_cython=False, use_numba=False, MEANS=None, SCALES=None):
 
         self.N_JOINTS = N_JOINTS
         self.N_LINKS = N_LINKS
         self.ROBOT_NAME = ROBOT_NAME
         self.use_cython = use_cython
+        self.use_numba = use_numba and not use_cython
+        if self.use_numba:
+            try:
+                import numba  # noqa: F401
+            except ImportError:
+                raise Exception('Numba module needs to be installed to ' +
+                                'use the Numba backend.')
         # dictionaries set by the sub-config, used for scaling input into
         # neural systems. Calculate by recording data from movement of interest
         self.MEANS = MEANS  # expected mean of joints angles / velocities
         self.SCALES = SCALES  # expected variance of joint angles / velocities
 
         # create function placeholders and dictionaries
-        self._c = None
         self._dJ = {}
+        self._dynamics_derivatives = None
         self._g = None
+        self._Gamma = None
+        self._Gamma_last = None
         self._J = {}
         self._M = None
         self._orientation = {}
         self._R = {}
-        self._S = None
         self._T_inv = {}
         self._Tx = {}
+        self._Y = None
+        self._batch = {}
+        self._in_use = set()
+        self._manifest_cache = None
+        self._pregenerated_cache = None
+        self._simplify_budget = None
+        self._simplify_strategies = []
+        self.simplification_stats = {}
 
         self._KZ = sp.Matrix([0, 0, 1])
 
@@ -124,12 +212,14 @@ class BaseConfig():
         # set up our joint angle symbols
         self.q = [sp.Symbol('q%i' % ii) for ii in range(self.N_JOINTS)]
         self.dq = [sp.Symbol('dq%i' % ii) for ii in range(self.N_JOINTS)]
+        self.ddq = [sp.Symbol('ddq%i' % ii) for ii in range(self.N_JOINTS)]
         # set up an (x,y,z) offset
         self.x = [sp.Symbol('x'), sp.Symbol('y'), sp.Symbol('z')]
 
         self.gravity = sp.Matrix([[0, 0, -9.81, 0, 0, 0]]).T
 
-    def _generate_and_save_function(self, filename, expression, parameters):
+    def _generate_and_save_function(self, filename, expression, parameters,
+                                    cse=False):
         """ Creates a folder, saves generated cython functions
 
         Create a folder in the users cache directory, named based on a hash
@@ -137,20 +227,234 @@ class BaseConfig():
 
         If use_cython is True, uses the created folder to save the autowrap
         binaries, so that they can be loaded in quickly later.
+
+        If use_numba is True, saves the function as Numba compiled Python
+        code in the created folder, Numba caches the machine code there.
+
+        If cse is True, common subexpressions are pulled out of the
+        expression and calculated once in the lambdified function.
+
+        If a backend has been chosen for this function by autotune, that
+        backend is used instead.
         """
 
         # check for / create the save folder for this expression
         folder = self.config_folder + '/' + filename
         abr_control.utils.os_utils.makedirs(folder)
 
-        if self.use_cython is True:
+        cse = cse or 'cse' in self._simplify_strategies
+
+        # record the parameters so the function can be rebuilt by autotune
+        manifest = self._manifest()
+        entry = manifest['functions'].setdefault(filename, {})
+        entry['parameters'] = [str(parameter) for parameter in parameters]
+        entry['cse'] = cse
+        self._save_manifest()
+        self._in_use.add(filename)
+
+        backend = self._backend(filename)
+        function = self._build_function(
+            backend, filename, expression, parameters, cse)
+        _REGISTRY[(self.config_folder, backend, filename)] = function
+        return function
+
+    def _build_function(self, backend, filename, expression, parameters,
+                        cse=False):
+        """ Creates the function for an expression with the given backend
+
+        Parameters
+        ----------
+        backend : string
+            'numpy' or 'math' for a lambdified function using that module,
+            'cython' for an autowrapped function, or 'numba' for a Numba
+            compiled function
+        filename : string
+            the name of the function, used for the save folder
+        expression : sympy.Matrix
+            the expression to evaluate
+        parameters : list of sympy.Symbol
+            the input parameters of the function
+        cse : boolean, optional (Default: False)
+            if True common subexpressions are calculated once
+        """
+
+        folder = self.config_folder + '/' + filename
+        if backend == 'cython':
             # binaries saved by specifying tempdir parameter
             function = autowrap(expression, backend="cython",
                                 args=parameters, tempdir=folder)
-        function = sp.lambdify(parameters, expression, "numpy")
+        elif backend == 'numba':
+            function = self._generate_numba_module(
+                filename, expression, parameters).function
+        elif backend == 'math':
+            # scalar math module calls, cheaper than numpy for small inputs
+            math_function = sp.lambdify(
+                parameters, expression.tolist(), "math", cse=cse)
+
+            def function(*args):
+                return np.array(math_function(*args))
+        elif backend == 'numpy':
+            function = sp.lambdify(parameters, expression, "numpy", cse=cse)
+        else:
+            raise Exception('Invalid backend: %s' % backend)
 
         return function
 
+    def _backend(self, filename):
+        """ Returns the backend to generate or load a function with
+
+        The backend chosen by autotune is used if there is one, otherwise
+        the backend is set by use_cython and use_numba.
+
+        Parameters
+        ----------
+        filename : string
+            the name of the function
+        """
+
+        backend = self._manifest()['functions'].get(
+            filename, {}).get('backend', None)
+        if backend is None:
+            if self.use_cython is True:
+                backend = 'cython'
+            elif self.use_numba is True:
+                backend = 'numba'
+            else:
+                backend = 'numpy'
+        return backend
+
+    def _manifest(self):
+        """ Loads the manifest of the functions saved in config_folder
+
+        The manifest is a json file recording the parameters of each
+        generated function, and the backend chosen for it by autotune.
+        """
+
+        if self._manifest_cache is None or \
+                self._manifest_cache[0] != self.config_folder:
+            manifest_file = self.config_folder + '/manifest.json'
+            manifest = {'functions': {}}
+            if os.path.isfile(manifest_file):
+                with open(manifest_file, 'r') as mfile:
+                    manifest = json.load(mfile)
+            self._manifest_cache = (self.config_folder, manifest)
+        return self._manifest_cache[1]
+
+    def _save_manifest(self):
+        """ Writes the manifest to config_folder """
+
+        manifest = self._manifest()
+        with open(self.config_folder + '/manifest.json', 'w') as mfile:
+            json.dump(manifest, mfile, indent=2, sort_keys=True)
+
+    def _pregenerated_file(self):
+        """ Returns the location of the pre-generated functions module
+
+        Pre-generated functions are shipped in a saved_functions folder
+        next to the config file, in a module named after config_folder.
+        """
+
+        return '%s/saved_functions/%s.py' % (
+            os.path.dirname(sys.modules[self.__module__].__file__),
+            os.path.basename(self.config_folder))
+
+    def _pregenerated(self):
+        """ Loads the pre-generated functions shipped for this config
+
+        The functions are only used if the module was generated from
+        the current config file and with the current abr_control version,
+        otherwise an empty dictionary is returned.
+        """
+
+        if self._pregenerated_cache is None or \
+                self._pregenerated_cache[0] != self.config_folder:
+            functions = {}
+            module_file = self._pregenerated_file()
+            if os.path.isfile(module_file):
+                module = abr_control.utils.codegen.load_module(
+                    module_file, 'pregenerated_%s_%s' % (
+                        self.ROBOT_NAME, os.path.basename(self.config_folder)))
+                if (module.CONFIG_HASH == self.config_hash and
+                        module.VERSION == version):
+                    functions = module.FUNCTIONS
+                else:
+                    print('Pre-generated functions in %s are out of date, '
+                          'ignoring' % module_file)
+            self._pregenerated_cache = (self.config_folder, functions)
+        return self._pregenerated_cache[1]
+
+    def _generate_numba_module(self, filename, expression, parameters):
+        """ Loads or creates the Numba module for an expression
+
+        The module is saved as numba_function.py in the folder for the
+        expression, and contains both the scalar and batch functions.
+        """
+
+        folder = self.config_folder + '/' + filename
+        abr_control.utils.os_utils.makedirs(folder)
+        module_file = folder + '/numba_function.py'
+        if not os.path.isfile(module_file):
+            with open(module_file, 'w') as source:
+                source.write(abr_control.utils.codegen.numba_source(
+                    expression, parameters))
+        # name the module after its location, which is unique
+        return abr_control.utils.codegen.load_module(
+            module_file, os.path.relpath(module_file, cache_dir))
+
+    def _generate_batch_function(self, expression, parameters, cse=False,
+                                 filename=None):
+        """ Creates a function that evaluates an expression over a batch
+
+        Lambdified numpy functions broadcast over arrays of parameters,
+        but constant entries of a matrix are returned as scalars. The
+        expression is lambdified as a flat list here, and each entry is
+        broadcast into the output array.
+
+        The returned function takes one array of shape (K,) for each
+        parameter, and returns an array of shape (K,) + expression.shape
+
+        Parameters
+        ----------
+        expression : sympy.Matrix
+            the expression to evaluate
+        parameters : list of sympy.Symbol
+            the input parameters of the function
+        cse : boolean, optional (Default: False)
+            if True common subexpressions are calculated once
+        filename : string, optional (Default: None)
+            if use_numba is True, the compiled batch function is saved
+            to and loaded from the folder for this filename, and the
+            function is shared with other instances under this filename
+        """
+
+        key = (self.config_folder,
+               'numba_batch' if self.use_numba is True else 'numpy_batch',
+               filename)
+        if filename is not None and key in _REGISTRY:
+            return _REGISTRY[key]
+
+        if self.use_numba is True and filename is not None:
+            batch_function = self._generate_numba_module(
+                filename, expression, parameters).batch_function
+            _REGISTRY[key] = batch_function
+            return batch_function
+
+        shape = expression.shape
+        flat_function = sp.lambdify(
+            parameters, list(expression), "numpy", cse=cse)
+
+        def batch_function(*args):
+            n_batch = len(args[0])
+            values = flat_function(*args)
+            batch = np.empty((n_batch, len(values)))
+            for ii, value in enumerate(values):
+                batch[:, ii] = value
+            return batch.reshape((n_batch,) + shape)
+
+        if filename is not None:
+            _REGISTRY[key] = batch_function
+        return batch_function
+
     def _load_from_file(self, filename, lambdify):
         """ Attempts to load in saved files
 
@@ -171,12 +475,33 @@ class BaseConfig():
         expression = None
         function = None
 
+        function_key = (self.config_folder, self._backend(filename), filename)
+        expression_key = (self.config_folder, 'expression', filename)
+
+        if lambdify is True:
+            # check for the function loaded by another instance
+            function = _REGISTRY.get(function_key, None)
+            # use the pre-generated function shipped with the config if
+            # there is one, unless a compiled backend has been requested
+            if function is None and function_key[1] == 'numpy':
+                function = self._pregenerated().get(filename, None)
+            if function is not None:
+                _REGISTRY[function_key] = function
+                self._in_use.add(filename)
+                return expression, function
+
+        # check for the expression loaded by another instance
+        expression = _REGISTRY.get(expression_key, None)
+        if expression is not None:
+            return expression, function
+
         # check for / create the save folder for this expression
         folder = self.config_folder + '/' + filename
         if os.path.isdir(folder) is not False:
             # check to see should return function or expression
             if lambdify is True:
-                if self.use_cython is True:
+                backend = self._backend(filename)
+                if backend == 'cython':
                     # check for cython binaries
                     saved_file = [sf for sf in os.listdir(folder)
                                   if sf.endswith('.so')]
@@ -196,6 +521,18 @@ class BaseConfig():
                         if saved_file in sys.modules.keys():
                             del sys.modules[saved_file]
 
+                elif backend == 'numba':
+                    # check for Numba module
+                    module_file = folder + '/numba_function.py'
+                    if os.path.isfile(module_file):
+                        print('Loading Numba function from %s ...' % filename)
+                        function = self._generate_numba_module(
+                            filename, None, None).function
+
+                if function is not None:
+                    _REGISTRY[function_key] = function
+                    self._in_use.add(filename)
+
             if function is None:
                 # if function not loaded, check for saved expression
                 if os.path.isfile('%s/%s/%s' %
@@ -204,13 +541,394 @@ class BaseConfig():
                     expression = cloudpickle.load(open(
                         '%s/%s/%s' % (self.config_folder, filename, filename),
                         'rb'))
+                    _REGISTRY[expression_key] = expression
 
         return expression, function
 
+    def _evict_modules(self, filename):
+        """ Removes the generated modules of a function from sys.modules
+
+        Returns the removed modules, so they can be put back once the
+        function has been loaded again.
+
+        Parameters
+        ----------
+        filename : string
+            the name of the function
+        """
+
+        codegen = abr_control.utils.codegen
+        names = [
+            codegen.module_name(os.path.relpath(
+                '%s/%s/numba_function.py' % (self.config_folder, filename),
+                cache_dir)),
+            codegen.module_name('pregenerated_%s_%s' % (
+                self.ROBOT_NAME, os.path.basename(self.config_folder)))]
+        if self._backend(filename) == 'cython':
+            # the package imported from the function folder
+            names += [name for name in sys.modules
+                      if name == filename or name.startswith(filename + '.')]
+        return dict([(name, sys.modules.pop(name)) for name in names
+                     if name in sys.modules])
+
+    def _reset_functions(self):
+        """ Clears all loaded functions, so they are loaded again on use """
+
+        self._dJ = {}
+        self._dynamics_derivatives = None
+        self._g = None
+        self._Gamma = None
+        self._Gamma_last = None
+        self._J = {}
+        self._M = None
+        self._R = {}
+        self._T_inv = {}
+        self._Tx = {}
+        self._Y = None
+        self._batch = {}
+
+    def autotune(self, functions=None, backends=None, n_trials=1000):
+        """ Benchmarks the available backends and picks the fastest
+
+        For each function, the expression is built with each backend
+        and timed on random inputs. Functions without a saved expression,
+        such as those loaded from the pre-generated module shipped with
+        the config, have their expression generated first. The fastest
+        backend is recorded in the manifest in config_folder, so this and
+        every later instance of the config loads the fastest variant.
+
+        Parameters
+        ----------
+        functions : list of strings, optional (Default: None)
+            names of the functions to tune, ex: ['M', 'EE[0,0,0]_J'],
+            if None all functions loaded or generated so far are tuned
+        backends : list of strings, optional (Default: None)
+            the backends to compare, if None 'numpy', 'math', and
+            'cython' and 'numba' if they are installed
+        n_trials : int, optional (Default: 1000)
+            number of calls to average the evaluation time over
+        """
+
+        if backends is None:
+            backends = ['numpy', 'math']
+            try:
+                import Cython  # noqa: F401
+                backends.append('cython')
+            except ImportError:
+                pass
+            try:
+                import numba  # noqa: F401
+                backends.append('numba')
+            except ImportError:
+                pass
+
+        if functions is None:
+            functions = sorted(self._in_use)
+
+        manifest = self._manifest()
+        for filename in functions:
+            entry = manifest['functions'].setdefault(filename, {})
+            expression, parameters = self._calc_expression(filename)
+            args = tuple(np.random.uniform(-np.pi, np.pi, len(parameters)))
+
+            timings = {}
+            for backend in backends:
+                try:
+                    function = self._build_function(
+                        backend, filename, expression, parameters,
+                        entry.get('cse', 'cse' in self._simplify_strategies))
+                    # first call includes any compilation
+                    function(*args)
+                except Exception as e:
+                    print('%s backend failed for %s: %s' %
+                          (backend, filename, e))
+                    continue
+                timings[backend] = timeit.timeit(
+                    lambda: function(*args), number=n_trials) / n_trials
+
+            if len(timings) == 0:
+                print('No backend succeeded for %s, keeping the %s backend' %
+                      (filename, self._backend(filename)))
+                continue
+            entry['backend'] = min(timings, key=timings.get)
+            entry['timings'] = timings
+            print('%s: using %s backend, %.2f us per call' % (
+                filename, entry['backend'],
+                timings[entry['backend']] * 1e6))
+
+        self._save_manifest()
+        # load the chosen backends on the next call
+        self._reset_functions()
+
+        return dict([(filename, manifest['functions'][filename]['backend'])
+                     for filename in functions
+                     if 'backend' in manifest['functions'].get(filename, {})])
+
+    def _calc_expression(self, filename):
+        """ Returns the expression and input parameters of a function
+
+        The expression is loaded if it is saved, otherwise it is generated
+        by the _calc_* method for the function.
+
+        Parameters
+        ----------
+        filename : string
+            the name of the function, ex: 'M' or 'EE[0,0,0]_J'
+        """
+
+        q = self.q
+        dq = self.dq
+        x = self.x
+
+        calc = {
+            'c': (self._calc_c, q + dq),
+            'dynamics_derivatives': (self._calc_dynamics_derivatives, q + dq),
+            'g': (self._calc_g, q),
+            'Gamma': (self._calc_Gamma, q),
+            'M': (self._calc_M, q),
+            'S': (self._calc_S, q + dq),
+            'Y': (self._calc_Y, q + dq + self.ddq),
+        }
+        if filename in calc:
+            calc_function, parameters = calc[filename]
+            return calc_function(lambdify=False), parameters
+
+        # the other functions are named funcname_kind, where funcname is
+        # name[0,0,0] for the function without an offset
+        funcname, kind = filename.rsplit('_', 1)
+        name = funcname.replace('[0,0,0]', '')
+        if kind == 'R':
+            return self._calc_R(name, lambdify=False), q
+        x_value = [0, 0, 0] if funcname.endswith('[0,0,0]') else [1, 1, 1]
+        calc = {
+            'dJ': (self._calc_dJ, q + dq + x),
+            'J': (self._calc_J, q + x),
+            'Tinv': (self._calc_T_inv, q + x),
+            'Tx': (self._calc_Tx, q + x),
+        }
+        if kind not in calc:
+            raise Exception('Unknown function: %s' % filename)
+        calc_function, parameters = calc[kind]
+        return calc_function(name, x=x_value, lambdify=False), parameters
+
+    def report(self, functions=None, n_trials=1000, verbose=True):
+        """ Reports the complexity and cost of the generated functions
+
+        For each function the number of operations in the expression
+        before and after common subexpression elimination, the size of
+        the files saved for it, the time to load it and make the first
+        call as a new process would, the memory allocated while loading
+        it, and the mean and 99th percentile evaluation times are measured.
+        Expressions that are not saved yet are generated first.
+
+        Returns a list with a dictionary of these values for each function.
+        Load and evaluation times are in seconds, sizes in bytes. Memory is
+        measured with tracemalloc, so it does not include the code of
+        compiled backends. Generated modules are removed from sys.modules
+        before loading, so they are executed again. Compiled extension
+        modules can not be unloaded though, so the load time of cython
+        functions does not include loading the shared library. The backend
+        of functions loaded from the pre-generated module shipped with the
+        config is 'shipped', their load time is that of the whole module.
+
+        Parameters
+        ----------
+        functions : list of strings, optional (Default: None)
+            names of the functions to report on, ex: ['M', 'EE[0,0,0]_J'],
+            if None all functions with an expression saved in config_folder
+            and all functions loaded or generated so far
+        n_trials : int, optional (Default: 1000)
+            number of calls to measure the evaluation time over
+        verbose : boolean, optional (Default: True)
+            if True the report is printed as a table
+        """
+
+        if functions is None:
+            functions = sorted(set([
+                filename for filename in os.listdir(self.config_folder)
+                if os.path.isfile('%s/%s/%s' % (
+                    self.config_folder, filename, filename))]) |
+                self._in_use)
+
+        manifest = self._manifest()
+        rows = []
+        for filename in functions:
+            folder = self.config_folder + '/' + filename
+            expression, parameters = self._calc_expression(filename)
+
+            row = {'function': filename, 'backend': self._backend(filename)}
+            if (row['backend'] == 'numpy' and
+                    filename in self._pregenerated()):
+                row['backend'] = 'shipped'
+            entries = list(expression)
+            row['ops'] = int(sp.count_ops(entries))
+            replacements, reduced = sp.cse(entries)
+            row['cse_ops'] = int(sp.count_ops(
+                [subexpression for _, subexpression in replacements] +
+                reduced))
+            row['size'] = sum([
+                os.path.getsize(os.path.join(root, name))
+                for root, _, names in os.walk(folder) for name in names])
+
+            entry = manifest['functions'].get(filename, {})
+            if 'simplification' in entry:
+                row['simplification'] = entry['simplification']
+            args = tuple(np.random.uniform(-np.pi, np.pi, len(parameters)))
+
+            def load():
+                # load without the copies shared through the registry, and
+                # without the generated modules already imported, so the
+                # modules are executed again as in a new process
+                shared = dict([
+                    (key, _REGISTRY.pop(key)) for key in list(_REGISTRY)
+                    if key[0] == self.config_folder and key[2] == filename])
+                imported = self._evict_modules(filename)
+                if row['backend'] == 'shipped':
+                    # import the whole shipped module the function is in
+                    self._pregenerated_cache = None
+                    function = self._pregenerated()[filename]
+                else:
+                    saved, function = self._load_from_file(
+                        filename, lambdify=True)
+                    if function is None:
+                        function = self._build_function(
+                            self._backend(filename), filename,
+                            expression if saved is None else saved,
+                            parameters, entry.get(
+                                'cse', 'cse' in self._simplify_strategies))
+                # Numba loads the compiled code on the first call
+                function(*args)
+                sys.modules.update(imported)
+                _REGISTRY.update(shared)
+                return function
+
+            start = timeit.default_timer()
+            function = load()
+            row['load_time'] = timeit.default_timer() - start
+            # load again with tracing on, it slows the loading down
+            tracemalloc.start()
+            function = load()
+            row['memory'] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            times = np.zeros(n_trials)
+            for ii in range(n_trials):
+                start = timeit.default_timer()
+                function(*args)
+                times[ii] = timeit.default_timer() - start
+            row['mean_time'] = np.mean(times)
+            row['p99_time'] = np.percentile(times, 99)
+            rows.append(row)
+
+        if verbose:
+            print('%-24s %-7s %9s %9s %10s %10s %10s %10s %10s' % (
+                'function', 'backend', 'ops', 'cse ops', 'size [kB]',
+                'load [ms]', 'mean [us]', 'p99 [us]', 'mem [kB]'))
+            for row in rows:
+                print('%-24s %-7s %9i %9i %10.1f %10s %10s %10s %10s' % tuple([
+                    row['function'], row['backend'], row['ops'],
+                    row['cse_ops'], row['size'] / 1e3] + [
+                        '-' if key not in row else
+                        '%.1f' % (row[key] * scale)
+                        for key, scale in [('load_time', 1e3),
+                                           ('mean_time', 1e6),
+                                           ('p99_time', 1e6),
+                                           ('memory', 1e-3)]]))
+
+        return rows
+
+    def fit_surrogates(self, functions=['M', 'g'], domain=None,
+                       tolerance=1e-4, max_degree=32, max_points=1e5,
+                       n_validation=1000, force=False, verbose=True):
+        """ Replaces M and g with Chebyshev approximations
+
+        Each function is fit over the joints its expression depends on,
+        so for low DOF arms, or reduced models with some joints fixed, it
+        is evaluated as a short sum of Chebyshev polynomials instead of
+        the full expression. A function is only replaced if the estimated
+        error of the fit meets the tolerance and the surrogate evaluates
+        faster than the exact function, and the exact function is
+        called for joint angles outside of the domain. The surrogates are
+        removed when the functions are reset, ex: by
+        set_dynamics_parameters.
+
+        Returns a dictionary with the validation report of each function,
+        see abr_control.arms.surrogate.fit_chebyshev, with 'used' set
+        to True for the functions that were replaced.
+
+        Parameters
+        ----------
+        functions : list of strings, optional (Default: ['M', 'g'])
+            the functions to approximate
+        domain : numpy.array, optional (Default: None)
+            the [low, high] range of each joint [radians], shape
+            (N_JOINTS, 2), if None [-pi, pi] for every joint
+        tolerance : float, optional (Default: 1e-4)
+            the largest absolute error allowed in any element, checked
+            against an estimate of the error, which is not guaranteed
+        max_degree : int, optional (Default: 32)
+            the highest polynomial degree to try along each joint
+        max_points : int, optional (Default: 1e5)
+            the most evaluations of the exact function allowed for a fit
+        n_validation : int, optional (Default: 1000)
+            the number of random joint angles to validate the fit on
+        force : boolean, optional (Default: False)
+            if True the surrogates that meet the tolerance are used even
+            when they are slower than the exact functions
+        verbose : boolean, optional (Default: True)
+            if True the validation report is printed
+        """
+
+        if domain is None:
+            domain = np.tile([-np.pi, np.pi], (self.N_JOINTS, 1))
+        calc = {'M': self._calc_M, 'g': self._calc_g}
+
+        reports = {}
+        for name in functions:
+            if name not in calc:
+                raise Exception('No surrogate available for %s' % name)
+            expression = calc[name](lambdify=False)
+            dims = [ii for ii in range(self.N_JOINTS)
+                    if self.q[ii] in expression.free_symbols]
+            surrogate, report = abr_control.arms.surrogate.fit_chebyshev(
+                calc[name](), self.N_JOINTS, dims, domain,
+                tolerance=tolerance, max_degree=max_degree,
+                max_points=max_points, n_validation=n_validation)
+            reports[name] = report
+
+            report['used'] = surrogate is not None and (
+                force or report['surrogate_time'] < report['exact_time'])
+            if report['used']:
+                setattr(self, '_' + name, surrogate)
+                self._batch[name] = surrogate
+            if not verbose:
+                continue
+            if 'degree' not in report:
+                print('%s: joints %s, no degree fits in %i points, '
+                      'using exact function' % (name, dims, max_points))
+                continue
+            if surrogate is None:
+                result = 'tolerance not met, using exact function'
+            else:
+                result = '%s, %.1f us vs %.1f us exact' % (
+                    'using surrogate' if report['used'] else
+                    'slower than exact function, not used',
+                    report['surrogate_time'] * 1e6,
+                    report['exact_time'] * 1e6)
+            print('%s: joints %s, degree %i, max error %.2e, '
+                  'error estimate %.2e, %s' % (
+                      name, dims, report['degree'], report['max_error'],
+                      report['error_estimate'], result))
+
+        return reports
+
     def c(self, q, dq):
-        """ Loads or calculates the complete centripetal and Coriolis forces
+        """ Calculates the complete centripetal and Coriolis forces
         NOTE: the partial effects are calculated in the S method
 
+        Calculated from the Christoffel symbols as
+        c_k = sum_ij Gamma_kij * dq_i * dq_j
+
         Parameters
         ----------
         q : numpy.array
@@ -218,12 +936,54 @@ class BaseConfig():
         dq : numpy.array
             joint velocities [radians/second]
 
+        q and dq can also be of shape (K, N_JOINTS) to evaluate a batch
         """
-        # check for function in dictionary
-        if self._c is None:
-            self._c = self._calc_c()
-        parameters = tuple(q) + tuple(dq)
-        return np.array(self._c(*parameters), dtype='float32').flatten()
+        Gamma = self.Gamma(q)
+        c = np.einsum('...kij,...i,...j->...k', Gamma, dq, dq)
+        return np.asarray(c, dtype='float32')
+
+    def Gamma(self, q):
+        """ Loads or calculates the Christoffel symbols of the first kind
+
+        Returns the tensor Gamma with shape (N_JOINTS, N_JOINTS, N_JOINTS),
+        where Gamma_kij = .5 * (dM_kj/dq_i + dM_ki/dq_j - dM_ij/dq_k).
+        The result for the last q is kept, so that calls to c and S
+        for the same joint angles only evaluate Gamma once.
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians]
+
+        If q is of shape (K, N_JOINTS), Gamma is evaluated for the batch
+        and an array of shape (K, N_JOINTS, N_JOINTS, N_JOINTS) returned.
+        """
+
+        shape = (self.N_JOINTS, self.N_JOINTS, self.N_JOINTS)
+        q = np.asarray(q)
+        if (self._Gamma_last is not None and
+                self._Gamma_last[0].shape == q.shape and
+                np.array_equal(self._Gamma_last[0], q)):
+            return self._Gamma_last[1]
+
+        if q.ndim > 1:
+            if self._batch.get('Gamma', None) is None:
+                self._batch['Gamma'] = self._generate_batch_function(
+                    expression=self._calc_Gamma(lambdify=False),
+                    parameters=self.q, cse=True,
+                    filename='Gamma')
+            Gamma = self._batch['Gamma'](*q.T)
+            Gamma = Gamma.reshape((q.shape[0],) + shape)
+        else:
+            # check for function in dictionary
+            if self._Gamma is None:
+                self._Gamma = self._calc_Gamma()
+            parameters = tuple(q)
+            Gamma = np.array(
+                self._Gamma(*parameters), dtype='float32').reshape(shape)
+
+        self._Gamma_last = (np.copy(q), Gamma)
+        return Gamma
 
     def g(self, q):
         """ Loads or calculates the force of gravity in joint space
@@ -233,7 +993,15 @@ class BaseConfig():
         q : numpy.array
             joint angles [radians]
 
+        If q is of shape (K, N_JOINTS), g is evaluated for the batch
         """
+        if np.ndim(q) > 1:
+            if self._batch.get('g', None) is None:
+                self._batch['g'] = self._generate_batch_function(
+                    expression=self._calc_g(lambdify=False),
+                    parameters=self.q, filename='g')
+            return self._batch['g'](*np.asarray(q).T)[..., 0]
+
         # check for function in dictionary
         if self._g is None:
             self._g = self._calc_g()
@@ -254,14 +1022,74 @@ class BaseConfig():
             if not specified, (0, 0, 0) is hard coded in, rather than using
             variable (x, y, z), which results in significant speedups.
 
+        If q and dq are of shape (K, N_JOINTS), dJ is evaluated for the batch
         """
         funcname = name + '[0,0,0]' if np.allclose(x, 0) else name
+        if np.ndim(q) > 1:
+            filename = funcname + '_dJ'
+            if self._batch.get(filename, None) is None:
+                self._batch[filename] = self._generate_batch_function(
+                    expression=self._calc_dJ(name=name, x=x, lambdify=False),
+                    parameters=self.q+self.dq+self.x, cse=True,
+                    filename=filename)
+            q = np.asarray(q)
+            parameters = (tuple(q.T) + tuple(np.asarray(dq).T) +
+                          tuple(np.tile(x, (len(q), 1)).T))
+            return self._batch[filename](*parameters)
+
         # check for function in dictionary
         if self._dJ.get(funcname, None) is None:
             self._dJ[funcname] = self._calc_dJ(name=name, x=x)
         parameters = tuple(q) + tuple(dq) + tuple(x)
         return np.array(self._dJ[funcname](*parameters), dtype='float32')
 
+    def dynamics_derivatives(self, q, dq):
+        """ Loads or calculates the partial derivatives of M, g, and c
+
+        Returns a tuple (dMdq, dgdq, dcdq), where dMdq[k] is the derivative
+        of the inertia matrix with respect to q_k, shape (N, N, N), and
+        dgdq and dcdq are the Jacobians of g and c with respect to q,
+        shape (N, N). The derivative of c with respect to dq is 2 * S.
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians]
+        dq : numpy.array
+            joint velocities [radians/second]
+
+        q and dq can also be of shape (K, N_JOINTS) to evaluate a batch,
+        in which case each returned array has a leading dimension K
+        """
+
+        N = self.N_JOINTS
+        if np.ndim(q) > 1:
+            if self._batch.get('dynamics_derivatives', None) is None:
+                self._batch['dynamics_derivatives'] = (
+                    self._generate_batch_function(
+                        expression=self._calc_dynamics_derivatives(
+                            lambdify=False),
+                        parameters=self.q+self.dq, cse=True,
+                        filename='dynamics_derivatives'))
+            parameters = tuple(np.asarray(q).T) + tuple(np.asarray(dq).T)
+            derivatives = self._batch['dynamics_derivatives'](*parameters)
+        else:
+            # check for function in dictionary
+            if self._dynamics_derivatives is None:
+                self._dynamics_derivatives = (
+                    self._calc_dynamics_derivatives())
+            parameters = tuple(q) + tuple(dq)
+            derivatives = np.array(
+                self._dynamics_derivatives(*parameters), dtype='float64')
+
+        # unpack the stacked [dM/dq_0, ..., dM/dq_N-1, dg/dq, dc/dq] matrix
+        dMdq = derivatives[..., :N*N].reshape(
+            derivatives.shape[:-2] + (N, N, N))
+        dMdq = np.moveaxis(dMdq, -2, -3)
+        dgdq = derivatives[..., N*N:N*N+N]
+        dcdq = derivatives[..., N*N+N:]
+        return dMdq, dgdq, dcdq
+
     def J(self, name, q, x=[0, 0, 0]):
         """ Loads or calculates the Jacobian for a joint or link
 
@@ -275,15 +1103,97 @@ class BaseConfig():
             the [x,y,z] offset inside reference frame of 'name' [meters]
             if not specified, (0, 0, 0) is hard coded in, rather than using
             variable (x, y, z), which results in significant speedups.
+
+        If q is of shape (K, N_JOINTS), J is evaluated for the batch
         """
 
         funcname = name + '[0,0,0]' if np.allclose(x, 0) else name
+        if np.ndim(q) > 1:
+            filename = funcname + '_J'
+            if self._batch.get(filename, None) is None:
+                self._batch[filename] = self._generate_batch_function(
+                    expression=self._calc_J(name=name, x=x, lambdify=False),
+                    parameters=self.q+self.x, cse=True,
+                    filename=filename)
+            q = np.asarray(q)
+            parameters = tuple(q.T) + tuple(np.tile(x, (len(q), 1)).T)
+            return self._batch[filename](*parameters)
+
         # check for function in dictionary
         if self._J.get(funcname, None) is None:
             self._J[funcname] = self._calc_J(name=name, x=x)
         parameters = tuple(q) + tuple(x)
         return np.array(self._J[funcname](*parameters), dtype='float32')
 
+    def linearize(self, q, dq, u, dt=0.001, discretization='zoh'):
+        """ Linearizes the forward dynamics around an operating point
+
+        With state x = [q, dq] and the joint torques u as input, the
+        forward dynamics are ddq = M^-1 (u - c + g). Returns the matrices
+        of the continuous time linearization dx = A x + B u, and of the
+        discrete time linearization x[t+1] = Ad x[t] + Bd u[t].
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians]
+        dq : numpy.array
+            joint velocities [radians/second]
+        u : numpy.array
+            joint torques [Nm]
+        dt : float, optional (Default: 0.001)
+            time step of the discrete linearization [seconds]
+        discretization : string, optional (Default: 'zoh')
+            'zoh' for a zero-order hold on u, using the matrix exponential
+            'euler' for the forward Euler approximation
+
+        q, dq, and u can also be of shape (K, N_JOINTS) to linearize
+        around a batch of operating points, in which case A, B, Ad, and
+        Bd each have a leading dimension K
+        """
+
+        N = self.N_JOINTS
+        M = np.asarray(self.M(q), dtype='float64')
+        g = np.asarray(self.g(q), dtype='float64')
+        c = np.asarray(self.c(q, dq), dtype='float64')
+        S = np.asarray(self.S(q, dq), dtype='float64')
+        dMdq, dgdq, dcdq = self.dynamics_derivatives(q, dq)
+
+        M_inv = np.linalg.inv(M)
+        ddq = np.einsum('...ij,...j->...i', M_inv, u - c + g)
+
+        # M ddq = u - c + g, differentiating wrt q_k gives
+        # dM/dq_k ddq + M dddq/dq_k = dg/dq_k - dc/dq_k
+        dMdq_ddq = np.einsum('...kij,...j->...ik', dMdq, ddq)
+        dddqdq = np.matmul(M_inv, dgdq - dcdq - dMdq_ddq)
+        dddqddq = np.matmul(M_inv, -2.0 * S)
+
+        batch_shape = M.shape[:-2]
+        A = np.zeros(batch_shape + (2*N, 2*N))
+        A[..., :N, N:] = np.eye(N)
+        A[..., N:, :N] = dddqdq
+        A[..., N:, N:] = dddqddq
+        B = np.zeros(batch_shape + (2*N, N))
+        B[..., N:, :] = M_inv
+
+        if discretization == 'euler':
+            Ad = np.eye(2*N) + A * dt
+            Bd = B * dt
+        elif discretization == 'zoh':
+            # exponentiate the augmented system [[A, B], [0, 0]] * dt
+            AB = np.zeros(batch_shape + (3*N, 3*N))
+            AB[..., :2*N, :2*N] = A * dt
+            AB[..., :2*N, 2*N:] = B * dt
+            AB = AB.reshape((-1, 3*N, 3*N))
+            expAB = np.array([scipy.linalg.expm(AB_k) for AB_k in AB])
+            expAB = expAB.reshape(batch_shape + (3*N, 3*N))
+            Ad = expAB[..., :2*N, :2*N]
+            Bd = expAB[..., :2*N, 2*N:]
+        else:
+            raise Exception('Invalid discretization: %s' % discretization)
+
+        return A, B, Ad, Bd
+
     def M(self, q):
         """ Loads or calculates the joint space inertia matrix
 
@@ -291,8 +1201,18 @@ class BaseConfig():
         ----------
         q : numpy.array
             joint angles [radians]
+
+        If q is of shape (K, N_JOINTS), M is evaluated for the batch
         """
 
+        if np.ndim(q) > 1:
+            if self._batch.get('M', None) is None:
+                self._batch['M'] = self._generate_batch_function(
+                    expression=self._calc_M(lambdify=False),
+                    parameters=self.q, cse=True,
+                    filename='M')
+            return self._batch['M'](*np.asarray(q).T)
+
         # check for function in dictionary
         if self._M is None:
             self._M = self._calc_M()
@@ -310,19 +1230,34 @@ class BaseConfig():
             joint angles [radians]
         """
 
+        R = self.R(name, q)
+        return abr_control.utils.transformations.quaternion_from_matrix(R)
+
+    def R(self, name, q):
+        """ Loads or calculates the rotation matrix of a joint or link
+
+        Parameters
+        ----------
+        name : string
+            name of the joint, link, or end-effector
+        q : numpy.array
+            joint angles [radians]
+        """
+
         # check for function in dictionary
         if self._R.get(name, None) is None:
             self._R[name] = self._calc_R(name)
         parameters = tuple(q)
-
-        R = self._R[name](*parameters)
-        return abr_control.utils.transformations.quaternion_from_matrix(R)
+        return np.array(self._R[name](*parameters), dtype='float32')
 
     def S(self, q, dq):
-        """ Loads or calculates the centripetal and Coriolis forces matrix
+        """ Calculates the centripetal and Coriolis forces matrix
         such that np.dot(S, dq) is the full term
         NOTE: the full effects are calculated in the c method
 
+        Calculated from the Christoffel symbols as
+        S_kj = sum_i Gamma_kij * dq_i
+
         Parameters
         ----------
         q : numpy.array
@@ -330,13 +1265,11 @@ class BaseConfig():
         dq : numpy.array
             joint velocities [radians/second]
 
+        q and dq can also be of shape (K, N_JOINTS) to evaluate a batch
         """
-        # check for function in dictionary
-        if self._S is None:
-            self._S = self._calc_S()
-        parameters = tuple(q) + tuple(dq)
-        return np.array(self._S(*parameters), dtype='float32')
-
+        Gamma = self.Gamma(q)
+        S = np.einsum('...kij,...i->...kj', Gamma, dq)
+        return np.asarray(S, dtype='float32')
 
     def scaledown(self, name, x):
         """ Scales down the input to the -1 to 1 range, based on the
@@ -381,9 +1314,22 @@ class BaseConfig():
             the [x,y,z] offset inside reference frame of 'name' [meters]
             if not specified, (0, 0, 0) is hard coded in, rather than using
             variable (x, y, z), which results in significant speedups.
+
+        If q is of shape (K, N_JOINTS), Tx is evaluated for the batch
         """
 
         funcname = name + '[0,0,0]' if np.allclose(x, 0) else name
+        if np.ndim(q) > 1:
+            filename = funcname + '_Tx'
+            if self._batch.get(filename, None) is None:
+                self._batch[filename] = self._generate_batch_function(
+                    expression=self._calc_Tx(name, x=x, lambdify=False),
+                    parameters=self.q+self.x, cse=True,
+                    filename=filename)
+            q = np.asarray(q)
+            parameters = tuple(q.T) + tuple(np.tile(x, (len(q), 1)).T)
+            return self._batch[filename](*parameters)[:, :3, 0]
+
         # check for function in dictionary
         if self._Tx.get(funcname, None) is None:
             self._Tx[funcname] = self._calc_Tx(name, x=x)
@@ -412,6 +1358,213 @@ class BaseConfig():
         parameters = tuple(q) + tuple(x)
         return self._T_inv[funcname](*parameters)
 
+    def Y(self, q, dq, ddq):
+        """ Loads or calculates the dynamics regressor
+
+        The regressor is linear in the inertial parameters returned by
+        get_dynamics_parameters, such that the joint torques are
+        np.dot(Y, theta) = M * ddq + c - g
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians]
+        dq : numpy.array
+            joint velocities [radians/second]
+        ddq : numpy.array
+            joint accelerations [radians/second**2]
+
+        If q, dq, and ddq are of shape (K, N_JOINTS), the regressor is
+        evaluated for the batch and an array of shape (K, N_JOINTS, P)
+        in float64 is returned.
+        """
+
+        if np.ndim(q) > 1:
+            if self._batch.get('Y', None) is None:
+                self._batch['Y'] = self._generate_batch_function(
+                    expression=self._calc_Y(lambdify=False),
+                    parameters=self.q+self.dq+self.ddq, filename='Y')
+            parameters = (tuple(np.asarray(q).T) + tuple(np.asarray(dq).T) +
+                          tuple(np.asarray(ddq).T))
+            return self._batch['Y'](*parameters)
+
+        # check for function in dictionary
+        if self._Y is None:
+            self._Y = self._calc_Y()
+        parameters = tuple(q) + tuple(dq) + tuple(ddq)
+        return np.array(self._Y(*parameters), dtype='float32')
+
+    def get_dynamics_parameters(self):
+        """ Returns the inertial parameters of the links and joints
+
+        The parameters are ordered [mass, Ixx, Iyy, Izz] for each link,
+        followed by each joint, matching the columns of the regressor Y.
+        """
+
+        theta = []
+        for M_body in self._M_LINKS + self._M_JOINTS:
+            M_body = np.array(M_body, dtype='float64')
+            theta += [M_body[0, 0], M_body[3, 3], M_body[4, 4], M_body[5, 5]]
+        return np.array(theta)
+
+    def set_dynamics_parameters(self, theta):
+        """ Sets the inertial parameters of the links and joints
+
+        Used to feed identified parameters back into the config. The
+        inertia, gravity, and Coriolis functions are regenerated, and
+        saved in a subfolder keyed on the parameter values so they are
+        not mixed up with the functions for the original parameters.
+
+        Parameters
+        ----------
+        theta : numpy.array
+            the parameters, ordered as in get_dynamics_parameters
+        """
+
+        theta = np.asarray(theta, dtype='float64')
+        if theta.shape[0] != 4 * (self.N_LINKS + self.N_JOINTS):
+            raise Exception('dynamics parameter vector incorrect size')
+
+        # convert to floats, SymPy treats numpy scalars as matrices
+        M_bodies = [sp.diag(m, m, m, Ixx, Iyy, Izz)
+                    for (m, Ixx, Iyy, Izz) in theta.reshape(-1, 4).tolist()]
+        self._M_LINKS = M_bodies[:self.N_LINKS]
+        self._M_JOINTS = M_bodies[self.N_LINKS:]
+
+        # key the saved functions on the new parameter values
+        hasher = hashlib.md5()
+        hasher.update(theta.tobytes())
+        self._set_config_variant('theta', hasher.hexdigest())
+
+        # clear out the functions that depend on the parameters
+        self._reset_functions()
+
+    def set_simplification(self, strategies=['trigsimp', 'horner', 'cse'],
+                           time_budget=10.0):
+        """ Sets the simplification applied to generated expressions
+
+        Each expression is passed through the strategies in order as it
+        is generated, before it is saved, so the expressions derived from
+        it are built from the simplified form. 'trigsimp' and 'horner'
+        rewrite each entry of the expression and keep the result if it
+        has fewer operations, 'cse' has the functions generated with
+        common subexpression elimination. The operation counts before and
+        after each strategy are recorded in simplification_stats and in
+        the manifest in config_folder.
+
+        The functions are saved in a subfolder keyed on the strategies,
+        and regenerated on use.
+
+        Parameters
+        ----------
+        strategies : list of strings, optional
+            (Default: ['trigsimp', 'horner', 'cse'])
+            the strategies to apply, from SIMPLIFICATION_STRATEGIES,
+            an empty list turns simplification off
+        time_budget : float, optional (Default: 10.0)
+            the time allowed for simplifying each expression [seconds],
+            checked between entries, the remaining entries are left
+            as they are once it is used up
+        """
+
+        for strategy in strategies:
+            if strategy not in SIMPLIFICATION_STRATEGIES:
+                raise Exception('Invalid simplification strategy: %s' %
+                                strategy)
+        self._simplify_strategies = list(strategies)
+        self._simplify_budget = time_budget
+
+        self._set_config_variant(
+            'simplify', '_'.join(strategies) if strategies else None)
+        self._reset_functions()
+
+    def _set_config_variant(self, key, value):
+        """ Moves config_folder to a subfolder for a variant of the config
+
+        Functions generated for a variant, such as identified dynamics
+        parameters or simplified expressions, are saved separately from
+        those of the original config.
+
+        Parameters
+        ----------
+        key : string
+            the kind of variant, ex: 'theta'
+        value : string
+            identifies the variant, None removes the variant
+        """
+
+        if not hasattr(self, '_base_config_folder'):
+            self._base_config_folder = self.config_folder
+            self._config_variants = {}
+        if value is None:
+            self._config_variants.pop(key, None)
+        else:
+            self._config_variants[key] = value
+
+        self.config_folder = self._base_config_folder + ''.join([
+            '/%s_%s' % (variant, self._config_variants[variant])
+            for variant in sorted(self._config_variants)])
+        abr_control.utils.os_utils.makedirs(self.config_folder)
+
+    def _simplify(self, filename, expression):
+        """ Passes an expression through the simplification strategies
+
+        Returns the expression unchanged if no strategies are set.
+
+        Parameters
+        ----------
+        filename : string
+            the name of the function the expression is for
+        expression : sympy.Matrix
+            the expression to simplify
+        """
+
+        if len(self._simplify_strategies) == 0:
+            return expression
+
+        print('Simplifying %s' % filename)
+        shape = expression.shape
+        entries = list(expression)
+        stats = []
+        start = timeit.default_timer()
+        for strategy in self._simplify_strategies:
+            strategy_start = timeit.default_timer()
+            ops_before = int(sp.count_ops(entries))
+            complete = True
+            if strategy == 'cse':
+                replacements, reduced = sp.cse(entries)
+                ops_after = int(sp.count_ops(
+                    [subexpression for _, subexpression in replacements] +
+                    reduced))
+            else:
+                simplify = SIMPLIFICATION_STRATEGIES[strategy]
+                for ii, entry in enumerate(entries):
+                    if timeit.default_timer() - start > self._simplify_budget:
+                        complete = False
+                        break
+                    simplified = simplify(entry)
+                    if sp.count_ops(simplified) < sp.count_ops(entry):
+                        entries[ii] = simplified
+                ops_after = int(sp.count_ops(entries))
+
+            stats.append({
+                'strategy': strategy,
+                'ops_before': ops_before,
+                'ops_after': ops_after,
+                'time': timeit.default_timer() - strategy_start,
+                'complete': complete})
+            print('%s: %i -> %i operations' % (
+                strategy, ops_before, ops_after) +
+                ('' if complete else ', time budget used up'))
+
+        self.simplification_stats[filename] = stats
+        manifest = self._manifest()
+        manifest['functions'].setdefault(filename, {})['simplification'] = (
+            stats)
+        self._save_manifest()
+
+        return sp.Matrix(shape[0], shape[1], entries)
+
     def _calc_c(self, lambdify=True):
         """ Uses Sympy to generate the centrifugal and Coriolis forces
         Derivation from vector form 1 on slide 22 at:
@@ -436,17 +1589,9 @@ class BaseConfig():
 
             # first get the inertia matrix
             M = self._calc_M(lambdify=False)
-            # c_k = dq.T * C_k * dq
-            # C_k = .5 * (\frac{\partial m_k}{\partial q} +
-            #           \frac{\partial m_k}{\partial q}^T +
-            #           \frac{\partial M}{\partia q_k})
-            # where c_k and m_k are the kth element of c and column of M
-            c = sp.zeros(self.N_JOINTS, 1)
-            for kk in range(self.N_JOINTS):
-                dMkdq = M[:, kk].jacobian(sp.Matrix(self.q))
-                Ck = 0.5 * (dMkdq + dMkdq.T - M.diff(self.q[kk]))
-                c[kk] = sp.Matrix(self.dq).T * Ck * sp.Matrix(self.dq)
-            c = sp.Matrix(c)
+            c = self._coriolis_from_M(M)
+
+            c = self._simplify('c', c)
 
             # save to file
             abr_control.utils.os_utils.makedirs(
@@ -503,6 +1648,8 @@ class BaseConfig():
                 g += (J_joints[ii].T * self._M_JOINTS[ii] * self.gravity)
             g = sp.Matrix(g)
 
+            g = self._simplify('g', g)
+
             # save to file
             abr_control.utils.os_utils.makedirs(
                 '%s/g' % self.config_folder)
@@ -560,6 +1707,8 @@ class BaseConfig():
                         dJ[ii, jj] += J[ii, jj].diff(self.q[kk]) * self.dq[kk]
             dJ = sp.Matrix(dJ)
 
+            dJ = self._simplify(filename, dJ)
+
             # save expression to file
             abr_control.utils.os_utils.makedirs(
                 '%s/%s' % (self.config_folder, filename))
@@ -576,6 +1725,58 @@ class BaseConfig():
                 parameters=self.q+self.dq+self.x)
         return dJ_func
 
+    def _calc_dynamics_derivatives(self, lambdify=True):
+        """ Uses Sympy to generate the partial derivatives of M, g, and c
+
+        The derivatives are stacked side by side into a single
+        N_JOINTS x (N_JOINTS**2 + 2 * N_JOINTS) matrix
+        [dM/dq_0, ..., dM/dq_N-1, dg/dq, dc/dq], so that common
+        subexpressions are shared when the function is generated.
+
+        Parameters
+        ----------
+        lambdify : boolean, optional (Default: True)
+            if True returns a function to calculate the matrix.
+            If False returns the Sympy matrix
+        """
+
+        derivatives = None
+        derivatives_func = None
+        filename = 'dynamics_derivatives'
+        # check to see if we have our term saved in file
+        derivatives, derivatives_func = self._load_from_file(
+            filename, lambdify)
+
+        if derivatives is None and derivatives_func is None:
+            # if no saved file was loaded, generate function
+            print('Generating dynamics derivatives function')
+
+            q = sp.Matrix(self.q)
+            M = self._calc_M(lambdify=False)
+            g = self._calc_g(lambdify=False)
+            c = self._calc_c(lambdify=False)
+            derivatives = sp.Matrix.hstack(
+                *([M.diff(self.q[kk]) for kk in range(self.N_JOINTS)] +
+                  [g.jacobian(q), c.jacobian(q)]))
+
+            derivatives = self._simplify(filename, derivatives)
+
+            # save to file
+            abr_control.utils.os_utils.makedirs(
+                '%s/%s' % (self.config_folder, filename))
+            cloudpickle.dump(derivatives, open(
+                '%s/%s/%s' % (self.config_folder, filename, filename), 'wb'))
+
+        if lambdify is False:
+            # if should return expression not function
+            return derivatives
+
+        if derivatives_func is None:
+            derivatives_func = self._generate_and_save_function(
+                filename=filename, expression=derivatives,
+                parameters=self.q+self.dq, cse=True)
+        return derivatives_func
+
     def _calc_J(self, name, x, lambdify=True):
         """ Uses Sympy to generate the Jacobian for a joint or link
 
@@ -629,6 +1830,8 @@ class BaseConfig():
                 J[ii] = J[ii] + [0, 0, 0]
             J = sp.Matrix(J).T  # correct the orientation of J
 
+            J = self._simplify(filename, J)
+
             # save to file
             abr_control.utils.os_utils.makedirs(
                 '%s/%s' % (self.config_folder, filename))
@@ -684,6 +1887,8 @@ class BaseConfig():
                 M += (J_joints[ii].T * self._M_JOINTS[ii] * J_joints[ii])
             M = sp.Matrix(M)
 
+            M = self._simplify('M', M)
+
             # save to file
             abr_control.utils.os_utils.makedirs(
                 '%s/M' % (self.config_folder))
@@ -716,13 +1921,15 @@ class BaseConfig():
         filename = name + '_R'
 
         # check to see if we have the rotation matrix saved in file
-        R, R_func = self._load_from_file(filename, lambdify=True)
+        R, R_func = self._load_from_file(filename, lambdify)
 
         if R is None and R_func is None:
             # if no saved file was loaded, generate function
             print('Generating rotation matrix function.')
             R = self._calc_T(name=name)[:3, :3]
 
+            R = self._simplify(filename, R)
+
             # save to file
             abr_control.utils.os_utils.makedirs(
                 '%s/%s' % (self.config_folder, filename))
@@ -730,6 +1937,10 @@ class BaseConfig():
                 '%s/%s/%s' % (self.config_folder, filename, filename),
                 'wb'))
 
+        if lambdify is False:
+            # if should return expression not function
+            return R
+
         if R_func is None:
             R_func = self._generate_and_save_function(
                 filename=filename, expression=R,
@@ -760,20 +1971,17 @@ class BaseConfig():
 
             # first get the inertia matrix
             M = self._calc_M(lambdify=False)
-            # C_k = .5 * (\frac{\partial m_k}{\partial q} +
-            #           \frac{\partial m_k}{\partial q}^T +
-            #           \frac{\partial M}{\partia q_k})
             # S_kj = sum_i (C_{kij}(q) * dq[i])
-            # where c_k and m_k are the kth element of c and column of M
+            C = self._christoffel_from_M(M)
             S = sp.zeros(self.N_JOINTS, self.N_JOINTS)
             for kk in range(self.N_JOINTS):
-                dMkdq = M[:, kk].jacobian(sp.Matrix(self.q))
-                Ck = 0.5 * (dMkdq + dMkdq.T - M.diff(self.q[kk]))
                 for jj in range(self.N_JOINTS):
-                    S[kk] = np.sum([Ck[ii, jj] * self.dq[ii]
-                                    for ii in range(self.N_JOINTS)])
+                    S[kk, jj] = sum([C[kk][ii, jj] * self.dq[ii]
+                                     for ii in range(self.N_JOINTS)])
             S = sp.Matrix(S)
 
+            S = self._simplify('S', S)
+
             # save to file
             abr_control.utils.os_utils.makedirs(
                 '%s/S' % self.config_folder)
@@ -840,11 +2048,13 @@ class BaseConfig():
                 Tx = T * sp.Matrix(self.x + [1])
             Tx = sp.Matrix(Tx)
 
+            Tx = self._simplify(filename, Tx)
+
             # save to file
             abr_control.utils.os_utils.makedirs(
                 '%s/%s' % (self.config_folder, filename))
             cloudpickle.dump(sp.Matrix(Tx), open(
-                '%s/%s/%s.Tx' % (self.config_folder, filename, filename),
+                '%s/%s/%s' % (self.config_folder, filename, filename),
                 'wb'))
 
         if lambdify is False:
@@ -892,11 +2102,13 @@ class BaseConfig():
                 sp.Matrix([[0, 0, 0, 1]]))
             T_inv = sp.Matrix(T_inv)
 
+            T_inv = self._simplify(filename, T_inv)
+
             # save to file
             abr_control.utils.os_utils.makedirs(
                 '%s/%s' % (self.config_folder, filename))
             cloudpickle.dump(T_inv, open(
-                '%s/%s.T_inv' % (self.config_folder, filename), 'wb'))
+                '%s/%s/%s' % (self.config_folder, filename, filename), 'wb'))
 
         if lambdify is False:
             # if should return expression not function
@@ -907,3 +2119,159 @@ class BaseConfig():
                 filename=filename, expression=T_inv,
                 parameters=self.q+self.x)
         return T_inv_func
+
+    def _calc_Y(self, lambdify=True):
+        """ Uses Sympy to generate the dynamics regressor
+
+        The joint space inertia matrix, gravity, and Coriolis terms are
+        all linear in the inertial parameters of each link and joint, so
+        the joint torques can be written np.dot(Y(q, dq, ddq), theta).
+        Each column of Y is found by generating the dynamics for a single
+        parameter set to 1 and all others set to 0.
+
+        NOTE: assumes the inertia matrices of the links and joints are
+        diagonal, with the mass repeated along the first three elements
+
+        Parameters
+        ----------
+        lambdify : boolean, optional (Default: True)
+            if True returns a function to calculate the matrix.
+            If False returns the Sympy matrix
+        """
+
+        Y = None
+        Y_func = None
+        # check to see if we have our regressor saved in file
+        Y, Y_func = self._load_from_file('Y', lambdify)
+
+        if Y is None and Y_func is None:
+            # if no saved file was loaded, generate function
+            print('Generating dynamics regressor function')
+
+            # get the Jacobians for each link's COM and each joint
+            J_bodies = ([self._calc_J('link%s' % ii, x=[0, 0, 0],
+                                      lambdify=False)
+                         for ii in range(self.N_LINKS)] +
+                        [self._calc_J('joint%s' % ii, x=[0, 0, 0],
+                                      lambdify=False)
+                         for ii in range(self.N_JOINTS)])
+
+            ddq = sp.Matrix(self.ddq)
+            columns = []
+            for J in J_bodies:
+                # the mass acts along the linear velocity rows of J
+                Jv = J[:3, :]
+                M_m = Jv.T * Jv
+                g_m = Jv.T * self.gravity[:3, :]
+                columns.append(M_m * ddq + self._coriolis_from_M(M_m) - g_m)
+                # each moment of inertia acts along an angular velocity row
+                for ii in range(3, 6):
+                    Jw = J[ii, :]
+                    M_I = Jw.T * Jw
+                    columns.append(M_I * ddq + self._coriolis_from_M(M_I))
+            Y = sp.Matrix.hstack(*columns)
+
+            Y = self._simplify('Y', Y)
+
+            # save to file
+            abr_control.utils.os_utils.makedirs(
+                '%s/Y' % self.config_folder)
+            cloudpickle.dump(Y, open(
+                '%s/Y/Y' % self.config_folder, 'wb'))
+
+        if lambdify is False:
+            # if should return expression not function
+            return Y
+
+        if Y_func is None:
+            Y_func = self._generate_and_save_function(
+                filename='Y', expression=Y,
+                parameters=self.q+self.dq+self.ddq)
+        return Y_func
+
+    def _calc_Gamma(self, lambdify=True):
+        """ Uses Sympy to generate the Christoffel symbols of the first kind
+
+        The tensor is stored as an N_JOINTS x N_JOINTS**2 matrix, where
+        row k is Gamma_k flattened in row-major order, and reshaped to
+        N_JOINTS x N_JOINTS x N_JOINTS in the Gamma method.
+
+        Parameters
+        ----------
+        lambdify : boolean, optional (Default: True)
+            if True returns a function to calculate the matrix.
+            If False returns the Sympy matrix
+        """
+
+        Gamma = None
+        Gamma_func = None
+        # check to see if we have our term saved in file
+        Gamma, Gamma_func = self._load_from_file('Gamma', lambdify)
+
+        if Gamma is None and Gamma_func is None:
+            # if no saved file was loaded, generate function
+            print('Generating Christoffel symbols function')
+
+            # first get the inertia matrix
+            M = self._calc_M(lambdify=False)
+            C = self._christoffel_from_M(M)
+            Gamma = sp.Matrix([list(Ck) for Ck in C])
+
+            Gamma = self._simplify('Gamma', Gamma)
+
+            # save to file
+            abr_control.utils.os_utils.makedirs(
+                '%s/Gamma' % self.config_folder)
+            cloudpickle.dump(Gamma, open(
+                '%s/Gamma/Gamma' % self.config_folder, 'wb'))
+
+        if lambdify is False:
+            # if should return expression not function
+            return Gamma
+
+        if Gamma_func is None:
+            Gamma_func = self._generate_and_save_function(
+                filename='Gamma', expression=Gamma,
+                parameters=self.q)
+        return Gamma_func
+
+    def _christoffel_from_M(self, M):
+        """ Uses Sympy to generate the Christoffel symbols of an inertia matrix
+
+        Returns a list of N_JOINTS matrices, where element k is C_k.
+
+        Parameters
+        ----------
+        M : sympy.Matrix
+            the joint space inertia matrix
+        """
+
+        # C_k = .5 * (\frac{\partial m_k}{\partial q} +
+        #           \frac{\partial m_k}{\partial q}^T +
+        #           \frac{\partial M}{\partia q_k})
+        # where m_k is the kth column of M
+        C = []
+        for kk in range(self.N_JOINTS):
+            dMkdq = M[:, kk].jacobian(sp.Matrix(self.q))
+            C.append(0.5 * (dMkdq + dMkdq.T - M.diff(self.q[kk])))
+        return C
+
+    def _coriolis_from_M(self, M):
+        """ Uses Sympy to generate the centripetal and Coriolis forces
+        for an inertia matrix
+        Derivation from vector form 1 on slide 22 at:
+        www.diag.uniroma1.it/~deluca/rob2_en/03_LagrangianDynamics_1.pdf
+
+        Parameters
+        ----------
+        M : sympy.Matrix
+            the joint space inertia matrix
+        """
+
+        # c_k = dq.T * C_k * dq
+        # where c_k is the kth element of c
+        dq = sp.Matrix(self.dq)
+        c = sp.zeros(self.N_JOINTS, 1)
+        for kk, Ck in enumerate(self._christoffel_from_M(M)):
+            c[kk] = dq.T * Ck * dq
+        return sp.Matrix(c)
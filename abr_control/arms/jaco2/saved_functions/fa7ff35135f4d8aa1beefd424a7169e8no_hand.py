@@ -0,0 +1,7459 @@
+# generated by abr_control.utils.export, do not edit
+import math
+
+import numpy as np
+
+VERSION = '0.1.0'
+CONFIG_HASH = 'fa7ff35135f4d8aa1beefd424a7169e8'
+
+
+# M
+def function0(q0, q1, q2, q3, q4, q5):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = 4.3259e-5*_cse0
+    _cse3 = math.sin(q1)
+    _cse4 = math.cos(q1)
+    _cse5 = 0.20902*_cse3 + 0.0019519*_cse4
+    _cse6 = -_cse5
+    _cse7 = _cse0*_cse6
+    _cse8 = 0.028922995*_cse1 - _cse2 + _cse7
+    _cse9 = 2.16295e-5*_cse0
+    _cse10 = 0.0144614975*_cse1 + 0.5*_cse7 - _cse9
+    _cse11 = -_cse1*_cse6 + 4.3259e-5*_cse1
+    _cse12 = -0.028922995*_cse0 - _cse11
+    _cse13 = -0.5*_cse1*_cse6 + 2.16295e-5*_cse1
+    _cse14 = -0.0144614975*_cse0 - _cse13
+    _cse15 = _cse0*_cse3
+    _cse16 = math.sin(q2)
+    _cse17 = math.cos(q2)
+    _cse18 = 0.081945*_cse16 - 0.00048786*_cse17
+    _cse19 = _cse18*_cse4
+    _cse20 = _cse0*_cse19
+    _cse21 = 0.00048786*_cse16 + 0.081945*_cse17
+    _cse22 = -_cse21
+    _cse23 = _cse22*_cse3
+    _cse24 = _cse0*_cse23
+    _cse25 = -5.49e-7*_cse0*_cse4 - 0.5*_cse0*_cse6 + 0.102515*_cse15 + 0.5*_cse20 + 0.5*_cse24 + _cse9
+    _cse26 = -0.0035510025*_cse1 - _cse25
+    _cse27 = -1.098e-6*_cse0*_cse4 - _cse0*_cse6 + 0.20503*_cse15 + _cse2 + _cse20 + _cse24
+    _cse28 = -0.007102005*_cse1 - _cse27
+    _cse29 = _cse1*_cse3
+    _cse30 = _cse1*_cse19
+    _cse31 = _cse1*_cse23
+    _cse32 = -5.49e-7*_cse1*_cse4 + _cse13 + 0.102515*_cse29 + 0.5*_cse30 + 0.5*_cse31
+    _cse33 = 0.0035510025*_cse0 - _cse32
+    _cse34 = -1.098e-6*_cse1*_cse4 + _cse11 + 0.20503*_cse29 + _cse30 + _cse31
+    _cse35 = 0.007102005*_cse0 - _cse34
+    _cse36 = _cse0*_cse4
+    _cse37 = _cse16*_cse36
+    _cse38 = math.sin(q3)
+    _cse39 = math.cos(q3)
+    _cse40 = 0.00040053*_cse38 - 0.012581*_cse39
+    _cse41 = -_cse40
+    _cse42 = 0.999999998572139*_cse1
+    _cse43 = 6.57617443000635e-7*_cse0
+    _cse44 = _cse16*_cse3
+    _cse45 = _cse17*_cse4
+    _cse46 = _cse42 + _cse43*_cse44 + _cse43*_cse45
+    _cse47 = -0.012581*_cse38 - 0.00040053*_cse39
+    _cse48 = 6.57617443000635e-7*_cse1
+    _cse49 = 0.999999998572139*_cse0
+    _cse50 = _cse44*_cse49 + _cse45*_cse49 - _cse48
+    _cse51 = 0.0038906673398998*_cse45
+    _cse52 = 0.0038906673398998*_cse44
+    _cse53 = _cse0*_cse51 + _cse0*_cse52 + 0.0068032576553314*_cse1 + _cse27 - _cse41*_cse46 - _cse47*_cse50
+    _cse54 = 0.1592*_cse0*_cse17*_cse3 - 0.1592*_cse37 - _cse53
+    _cse55 = 0.0019453336699499*_cse45
+    _cse56 = 0.0019453336699499*_cse44
+    _cse57 = _cse0*_cse55 + _cse0*_cse56 + 0.0034016288276657*_cse1 + _cse25 - 0.5*_cse41*_cse46 - 0.5*_cse47*_cse50
+    _cse58 = 0.0796*_cse0*_cse17*_cse3 - 0.0796*_cse37 - _cse57
+    _cse59 = _cse1*_cse4
+    _cse60 = _cse16*_cse59
+    _cse61 = _cse44*_cse48 + _cse45*_cse48 - _cse49
+    _cse62 = _cse42*_cse44 + _cse42*_cse45 + _cse43
+    _cse63 = -0.0068032576553314*_cse0 + _cse1*_cse51 + _cse1*_cse52 + _cse34 - _cse41*_cse61 - _cse47*_cse62
+    _cse64 = 0.1592*_cse1*_cse17*_cse3 - 0.1592*_cse60 - _cse63
+    _cse65 = -0.0034016288276657*_cse0 + _cse1*_cse55 + _cse1*_cse56 + _cse32 - 0.5*_cse41*_cse61 - 0.5*_cse47*_cse62
+    _cse66 = 0.0796*_cse1*_cse17*_cse3 - 0.0796*_cse60 - _cse65
+    _cse67 = math.sin(q4)
+    _cse68 = math.cos(q4)
+    _cse69 = 0.00052974*_cse67 - 0.012272*_cse68
+    _cse70 = -_cse69
+    _cse71 = _cse15*_cse17
+    _cse72 = _cse39*_cse46
+    _cse73 = _cse38*_cse50
+    _cse74 = 0.51802699*_cse38 + 0.75940555*_cse39
+    _cse75 = -_cse74
+    _cse76 = _cse46*_cse75
+    _cse77 = 0.45991232*_cse38 + 0.85536427*_cse39
+    _cse78 = _cse50*_cse77
+    _cse79 = 0.75940555*_cse38 - 0.51802699*_cse39
+    _cse80 = _cse50*_cse79
+    _cse81 = 0.85536427*_cse38 - 0.45991232*_cse39
+    _cse82 = _cse46*_cse81
+    _cse83 = -0.818687841791724*_cse37 + 0.818687841791724*_cse71 + 0.212878838804554*_cse72 - 0.212878838804554*_cse73 + 0.758601438*_cse76 + 0.458851168*_cse78 + 0.758601438*_cse80 + 0.458851168*_cse82
+    _cse84 = -0.012272*_cse67 - 0.00052974*_cse68
+    _cse85 = 0.000346321299837637*_cse37 - 0.000346321299837637*_cse71 + 0.517383113*_cse76 - 0.855753802*_cse78 + 0.517383113*_cse80 - 0.855753802*_cse82
+    _cse86 = 0.210033941789101*_cse0*_cse17*_cse3 - 0.210033941789101*_cse37 + 0.0315500189858492*_cse39*_cse46 - _cse53 + _cse70*_cse83 - 0.0315500189858492*_cse73 - 0.0189192713225*_cse76 - 0.01084270231829*_cse78 - 0.0189192713225*_cse80 - 0.01084270231829*_cse82 + _cse84*_cse85
+    _cse87 = 0.10501697089455*_cse0*_cse17*_cse3 - 0.10501697089455*_cse37 + 0.0157750094929246*_cse39*_cse46 - _cse57 + 0.5*_cse70*_cse83 - 0.0157750094929246*_cse73 - 0.00945963566125*_cse76 - 0.005421351159145*_cse78 - 0.00945963566125*_cse80 - 0.005421351159145*_cse82 + 0.5*_cse84*_cse85
+    _cse88 = _cse17*_cse29
+    _cse89 = 0.818687841791724*_cse88
+    _cse90 = 0.818687841791724*_cse60
+    _cse91 = _cse38*_cse62
+    _cse92 = _cse61*_cse75
+    _cse93 = _cse62*_cse77
+    _cse94 = _cse62*_cse79
+    _cse95 = _cse61*_cse81
+    _cse96 = 0.212878838804554*_cse39*_cse61 + _cse89 - _cse90 - 0.212878838804554*_cse91 + 0.758601438*_cse92 + 0.458851168*_cse93 + 0.758601438*_cse94 + 0.458851168*_cse95
+    _cse97 = 0.000346321299837637*_cse88
+    _cse98 = 0.000346321299837637*_cse60
+    _cse99 = 0.517383113*_cse92 - 0.855753802*_cse93 + 0.517383113*_cse94 - 0.855753802*_cse95 - _cse97 + _cse98
+    _cse100 = 0.210033941789101*_cse1*_cse17*_cse3 + 0.0315500189858492*_cse39*_cse61 - 0.210033941789101*_cse60 - _cse63 + _cse70*_cse96 + _cse84*_cse99 - 0.0315500189858492*_cse91 - 0.0189192713225*_cse92 - 0.01084270231829*_cse93 - 0.0189192713225*_cse94 - 0.01084270231829*_cse95
+    _cse101 = 0.10501697089455*_cse1*_cse17*_cse3 + 0.0157750094929246*_cse39*_cse61 - 0.10501697089455*_cse60 - _cse65 + 0.5*_cse70*_cse96 + 0.5*_cse84*_cse99 - 0.0157750094929246*_cse91 - 0.00945963566125*_cse92 - 0.005421351159145*_cse93 - 0.00945963566125*_cse94 - 0.005421351159145*_cse95
+    _cse102 = 0.0019519*_cse3 - 0.20902*_cse4
+    _cse103 = _cse0*_cse102
+    _cse104 = _cse1*_cse102
+    _cse105 = 1.098e-6*_cse15
+    _cse106 = 0.20503*_cse36
+    _cse107 = _cse22*_cse36
+    _cse108 = _cse15*_cse18
+    _cse109 = _cse0*_cse102 - _cse105 - _cse106 - _cse107 + _cse108
+    _cse110 = _cse22*_cse59
+    _cse111 = _cse18*_cse29
+    _cse112 = -_cse104 + _cse110 - _cse111 + 1.098e-6*_cse29 + 0.20503*_cse59
+    _cse113 = 0.1592*_cse0
+    _cse114 = -0.0038906673398998*_cse37 + 0.0038906673398998*_cse71
+    _cse115 = _cse113*_cse44 + _cse113*_cse45 + _cse114
+    _cse116 = _cse17*_cse3
+    _cse117 = -6.57617443000635e-7*_cse0*_cse16*_cse4 + _cse116*_cse43
+    _cse118 = -_cse117
+    _cse119 = _cse118*_cse41
+    _cse120 = -0.999999998572139*_cse0*_cse16*_cse4 + _cse116*_cse49
+    _cse121 = -_cse120
+    _cse122 = _cse121*_cse47
+    _cse123 = _cse103 - _cse105 - _cse106 - _cse107 + _cse108 + _cse119 + _cse122
+    _cse124 = _cse115 + _cse123
+    _cse125 = _cse16*_cse4
+    _cse126 = _cse116*_cse48 - _cse125*_cse48
+    _cse127 = _cse126*_cse41
+    _cse128 = _cse116*_cse42 - _cse125*_cse42
+    _cse129 = _cse128*_cse47
+    _cse130 = 0.0038906673398998*_cse60
+    _cse131 = 0.1592*_cse1
+    _cse132 = _cse131*_cse45
+    _cse133 = _cse131*_cse44
+    _cse134 = 0.0038906673398998*_cse88
+    _cse135 = _cse112 + _cse127 + _cse129 + _cse130 - _cse132 - _cse133 - _cse134
+    _cse136 = 0.818687841791724*_cse44
+    _cse137 = _cse0*_cse136
+    _cse138 = 0.818687841791724*_cse45
+    _cse139 = _cse0*_cse138
+    _cse140 = _cse121*_cse38
+    _cse141 = _cse118*_cse39
+    _cse142 = _cse121*_cse77
+    _cse143 = _cse121*_cse79
+    _cse144 = _cse118*_cse75
+    _cse145 = _cse118*_cse81
+    _cse146 = _cse70*(_cse137 + _cse139 - 0.212878838804554*_cse140 + 0.212878838804554*_cse141 + 0.458851168*_cse142 + 0.758601438*_cse143 + 0.758601438*_cse144 + 0.458851168*_cse145)
+    _cse147 = 0.000346321299837637*_cse45
+    _cse148 = 0.000346321299837637*_cse44
+    _cse149 = _cse0*_cse147 + _cse0*_cse148
+    _cse150 = _cse84*(0.517383113*_cse118*_cse75 + 0.517383113*_cse121*_cse79 - 0.855753802*_cse142 - 0.855753802*_cse145 - _cse149)
+    _cse151 = 0.210033941789101*_cse0
+    _cse152 = _cse114 + _cse151*_cse44 + _cse151*_cse45
+    _cse153 = _cse123 - 0.0315500189858492*_cse140 + 0.0315500189858492*_cse141 - 0.01084270231829*_cse142 - 0.0189192713225*_cse143 - 0.0189192713225*_cse144 - 0.01084270231829*_cse145 + _cse146 + _cse150 + _cse152
+    _cse154 = _cse1*_cse136
+    _cse155 = _cse1*_cse138
+    _cse156 = _cse128*_cse38
+    _cse157 = _cse126*_cse75
+    _cse158 = _cse126*_cse81
+    _cse159 = _cse128*_cse77
+    _cse160 = _cse128*_cse79
+    _cse161 = 0.212878838804554*_cse126*_cse39 - _cse154 - _cse155 - 0.212878838804554*_cse156 + 0.758601438*_cse157 + 0.458851168*_cse158 + 0.458851168*_cse159 + 0.758601438*_cse160
+    _cse162 = _cse1*_cse147 + _cse1*_cse148
+    _cse163 = 0.517383113*_cse157 - 0.855753802*_cse158 - 0.855753802*_cse159 + 0.517383113*_cse160 + _cse162
+    _cse164 = -_cse130 + _cse134
+    _cse165 = 0.210033941789101*_cse1
+    _cse166 = _cse165*_cse44 + _cse165*_cse45
+    _cse167 = _cse1*_cse22*_cse4 + 1.098e-6*_cse1*_cse3 + 0.20503*_cse1*_cse4 - _cse104 - _cse111 + 0.0315500189858492*_cse126*_cse39 + _cse126*_cse41 + _cse128*_cse47 - 0.0315500189858492*_cse156 - 0.0189192713225*_cse157 - 0.01084270231829*_cse158 - 0.01084270231829*_cse159 - 0.0189192713225*_cse160 + _cse161*_cse70 + _cse163*_cse84 - _cse164 - _cse166
+    _cse168 = _cse21*_cse59
+    _cse169 = _cse111 + _cse168
+    _cse170 = _cse21*_cse36
+    _cse171 = _cse108 + _cse170
+    _cse172 = -_cse171
+    _cse173 = -_cse126
+    _cse174 = _cse173*_cse41
+    _cse175 = -_cse128
+    _cse176 = _cse175*_cse47
+    _cse177 = _cse164 + _cse169 + _cse174 + _cse176
+    _cse178 = _cse132 + _cse133 + _cse177
+    _cse179 = -_cse117*_cse41 - _cse120*_cse47 + _cse171
+    _cse180 = -_cse115 - _cse179
+    _cse181 = _cse175*_cse38
+    _cse182 = _cse173*_cse39
+    _cse183 = _cse175*_cse77
+    _cse184 = _cse175*_cse79
+    _cse185 = _cse173*_cse75
+    _cse186 = _cse173*_cse81
+    _cse187 = _cse70*(_cse154 + _cse155 - 0.212878838804554*_cse181 + 0.212878838804554*_cse182 + 0.458851168*_cse183 + 0.758601438*_cse184 + 0.758601438*_cse185 + 0.458851168*_cse186)
+    _cse188 = _cse84*(-_cse162 + 0.517383113*_cse173*_cse75 + 0.517383113*_cse175*_cse79 - 0.855753802*_cse183 - 0.855753802*_cse186)
+    _cse189 = _cse166 + _cse177 - 0.0315500189858492*_cse181 + 0.0315500189858492*_cse182 - 0.01084270231829*_cse183 - 0.0189192713225*_cse184 - 0.0189192713225*_cse185 - 0.01084270231829*_cse186 + _cse187 + _cse188
+    _cse190 = _cse120*_cse38
+    _cse191 = _cse117*_cse75
+    _cse192 = _cse117*_cse81
+    _cse193 = _cse120*_cse77
+    _cse194 = _cse120*_cse79
+    _cse195 = 0.212878838804554*_cse117*_cse39 - _cse137 - _cse139 - 0.212878838804554*_cse190 + 0.758601438*_cse191 + 0.458851168*_cse192 + 0.458851168*_cse193 + 0.758601438*_cse194
+    _cse196 = _cse149 + 0.517383113*_cse191 - 0.855753802*_cse192 - 0.855753802*_cse193 + 0.517383113*_cse194
+    _cse197 = 0.0315500189858492*_cse117*_cse39 - _cse152 - _cse179 - 0.0315500189858492*_cse190 - 0.0189192713225*_cse191 - 0.01084270231829*_cse192 - 0.01084270231829*_cse193 - 0.0189192713225*_cse194 + _cse195*_cse70 + _cse196*_cse84
+    _cse198 = _cse46*_cse47
+    _cse199 = _cse40*_cse50
+    _cse200 = _cse198 + _cse199
+    _cse201 = -_cse61
+    _cse202 = _cse201*_cse47
+    _cse203 = -_cse62
+    _cse204 = _cse203*_cse40
+    _cse205 = _cse202 + _cse204
+    _cse206 = _cse38*_cse46
+    _cse207 = _cse39*_cse50
+    _cse208 = -_cse81
+    _cse209 = _cse208*_cse50
+    _cse210 = _cse46*_cse77
+    _cse211 = _cse50*_cse74
+    _cse212 = _cse46*_cse79
+    _cse213 = -0.855753802*_cse209 - 0.855753802*_cse210 + 0.517383113*_cse46*_cse79 + 0.517383113*_cse50*_cse74
+    _cse214 = -0.212878838804554*_cse206 - 0.212878838804554*_cse207 + 0.458851168*_cse209 + 0.458851168*_cse210 + 0.758601438*_cse211 + 0.758601438*_cse212
+    _cse215 = -0.0315500189858492*_cse206 - 0.0315500189858492*_cse207 - 0.01084270231829*_cse209 - 0.01084270231829*_cse210 - 0.0189192713225*_cse211 - 0.0189192713225*_cse212 + _cse213*_cse84 + _cse214*_cse70 + _cse40*_cse50 + _cse46*_cse47
+    _cse216 = _cse203*_cse39
+    _cse217 = _cse201*_cse38
+    _cse218 = _cse203*_cse208
+    _cse219 = _cse201*_cse77
+    _cse220 = _cse203*_cse74
+    _cse221 = _cse201*_cse79
+    _cse222 = 0.517383113*_cse201*_cse79 + 0.517383113*_cse203*_cse74 - 0.855753802*_cse218 - 0.855753802*_cse219
+    _cse223 = -0.212878838804554*_cse216 - 0.212878838804554*_cse217 + 0.458851168*_cse218 + 0.458851168*_cse219 + 0.758601438*_cse220 + 0.758601438*_cse221
+    _cse224 = _cse201*_cse47 + _cse203*_cse40 - 0.0315500189858492*_cse216 - 0.0315500189858492*_cse217 - 0.01084270231829*_cse218 - 0.01084270231829*_cse219 - 0.0189192713225*_cse220 - 0.0189192713225*_cse221 + _cse222*_cse84 + _cse223*_cse70
+    _cse225 = 0.06*_cse44 + 0.06*_cse45
+    _cse226 = _cse69*_cse85
+    _cse227 = _cse83*_cse84
+    _cse228 = _cse226 + _cse227
+    _cse229 = _cse201*_cse75
+    _cse230 = _cse203*_cse77
+    _cse231 = _cse203*_cse79
+    _cse232 = _cse201*_cse81
+    _cse233 = 0.517383113*_cse229 - 0.855753802*_cse230 + 0.517383113*_cse231 - 0.855753802*_cse232 + _cse97 - _cse98
+    _cse234 = _cse233*_cse69
+    _cse235 = 0.212878838804554*_cse38
+    _cse236 = 0.212878838804554*_cse39
+    _cse237 = _cse201*_cse236 - _cse203*_cse235 + 0.758601438*_cse229 + 0.458851168*_cse230 + 0.758601438*_cse231 + 0.458851168*_cse232 - _cse89 + _cse90
+    _cse238 = _cse237*_cse84
+    _cse239 = _cse234 + _cse238
+    _cse240 = -6.57617443000635e-7*_cse116 + 6.57617443000635e-7*_cse16*_cse4
+    _cse241 = _cse240*_cse39
+    _cse242 = -0.999999998572139*_cse116 + 0.999999998572139*_cse16*_cse4
+    _cse243 = _cse242*_cse38
+    _cse244 = _cse242*_cse77
+    _cse245 = _cse240*_cse81
+    _cse246 = _cse242*_cse79
+    _cse247 = _cse240*_cse75
+    _cse248 = 0.016320119783919*_cse241 - 0.016320119783919*_cse243 - 0.00956167656*_cse244 - 0.00956167656*_cse245 - 0.01584114*_cse246 - 0.01584114*_cse247 + 0.0229695527610715*_cse44 + 0.0229695527610715*_cse45
+    _cse249 = -_cse147 - _cse148 + 0.517383113*_cse240*_cse75 + 0.517383113*_cse242*_cse79 - 0.855753802*_cse244 - 0.855753802*_cse245
+    _cse250 = _cse249*_cse67
+    _cse251 = -0.78972966*_cse67 + 0.45479896*_cse68
+    _cse252 = 0.40329059*_cse67 + 0.89059413*_cse68
+    _cse253 = _cse249*_cse252
+    _cse254 = _cse136 + _cse138 - _cse235*_cse242 + _cse236*_cse240 + 0.458851168*_cse244 + 0.458851168*_cse245 + 0.758601438*_cse246 + 0.758601438*_cse247
+    _cse255 = 0.45479896*_cse67 + 0.78972966*_cse68
+    _cse256 = 0.89059413*_cse67 - 0.40329059*_cse68
+    _cse257 = _cse254*_cse256
+    _cse258 = -0.00658730976817627*_cse16*_cse3 - 0.00658730976817627*_cse17*_cse4 - 0.00468035601688406*_cse240*_cse39 + 0.00468035601688406*_cse243 + 0.00274213982566424*_cse244 + 0.00274213982566424*_cse245 + 0.00454299207940609*_cse246 + 0.00454299207940609*_cse247 - 0.00821759494*_cse249*_cse251 + 0.00820299991767329*_cse250 + 0.00419168864*_cse253 - 0.00821759494*_cse254*_cse255 - 0.00820299991767329*_cse254*_cse68 + 0.00419168864*_cse257
+    _cse259 = -_cse258
+    _cse260 = 0.5*_cse104
+    _cse261 = 0.5*_cse103
+    _cse262 = 5.49e-7*_cse15
+    _cse263 = 0.102515*_cse36
+    _cse264 = 0.5*_cse107
+    _cse265 = 0.5*_cse108
+    _cse266 = 0.5*_cse0*_cse102 - _cse262 - _cse263 - _cse264 + _cse265
+    _cse267 = 0.5*_cse111
+    _cse268 = 0.5*_cse110 - _cse260 - _cse267 + 5.49e-7*_cse29 + 0.102515*_cse59
+    _cse269 = 0.0796*_cse0
+    _cse270 = -0.0019453336699499*_cse37 + 0.0019453336699499*_cse71
+    _cse271 = _cse269*_cse44 + _cse269*_cse45 + _cse270
+    _cse272 = 0.5*_cse119 + 0.5*_cse122 + _cse261 - _cse262 - _cse263 - _cse264 + _cse265
+    _cse273 = _cse271 + _cse272
+    _cse274 = 0.0019453336699499*_cse60
+    _cse275 = 0.0796*_cse1
+    _cse276 = _cse275*_cse45
+    _cse277 = _cse275*_cse44
+    _cse278 = 0.0019453336699499*_cse88
+    _cse279 = 0.5*_cse127 + 0.5*_cse129 + _cse268 + _cse274 - _cse276 - _cse277 - _cse278
+    _cse280 = 0.10501697089455*_cse0
+    _cse281 = _cse270 + _cse280*_cse44 + _cse280*_cse45
+    _cse282 = -0.0157750094929246*_cse140 + 0.0157750094929246*_cse141 - 0.005421351159145*_cse142 - 0.00945963566125*_cse143 - 0.00945963566125*_cse144 - 0.005421351159145*_cse145 + 0.5*_cse146 + 0.5*_cse150 + _cse272 + _cse281
+    _cse283 = -_cse274 + _cse278
+    _cse284 = 0.10501697089455*_cse1
+    _cse285 = _cse284*_cse44 + _cse284*_cse45
+    _cse286 = 0.5*_cse1*_cse22*_cse4 + 5.49e-7*_cse1*_cse3 + 0.102515*_cse1*_cse4 + 0.0157750094929246*_cse126*_cse39 + 0.5*_cse126*_cse41 + 0.5*_cse128*_cse47 - 0.0157750094929246*_cse156 - 0.00945963566125*_cse157 - 0.005421351159145*_cse158 - 0.005421351159145*_cse159 - 0.00945963566125*_cse160 + 0.5*_cse161*_cse70 + 0.5*_cse163*_cse84 - _cse260 - _cse267 - _cse283 - _cse285
+    _cse287 = _cse0**2
+    _cse288 = _cse1**2
+    _cse289 = 0.5*_cse102**2
+    _cse290 = _cse19 + _cse23 + 0.41405*_cse3 + 0.001950802*_cse4
+    _cse291 = 0.5*_cse19
+    _cse292 = 0.5*_cse23 + _cse291 + 0.207025*_cse3 + 0.000975401*_cse4
+    _cse293 = 0.1592*_cse125
+    _cse294 = 0.1592*_cse116
+    _cse295 = 6.57617443000635e-7*_cse44 + 6.57617443000635e-7*_cse45
+    _cse296 = -_cse295
+    _cse297 = _cse296*_cse41
+    _cse298 = 0.999999998572139*_cse44 + 0.999999998572139*_cse45
+    _cse299 = -_cse298
+    _cse300 = _cse299*_cse47
+    _cse301 = _cse51 + _cse52
+    _cse302 = _cse290 + _cse297 + _cse300 + _cse301
+    _cse303 = _cse293 - _cse294 + _cse302
+    _cse304 = 0.0796*_cse125
+    _cse305 = 0.0796*_cse116
+    _cse306 = _cse55 + _cse56
+    _cse307 = _cse292 + 0.5*_cse297 + 0.5*_cse300 + _cse306
+    _cse308 = _cse304 - _cse305 + _cse307
+    _cse309 = 0.818687841791724*_cse116
+    _cse310 = 0.818687841791724*_cse125
+    _cse311 = _cse299*_cse77
+    _cse312 = _cse299*_cse79
+    _cse313 = _cse296*_cse75
+    _cse314 = _cse296*_cse81
+    _cse315 = _cse70*(-_cse235*_cse299 + _cse236*_cse296 - _cse309 + _cse310 + 0.458851168*_cse311 + 0.758601438*_cse312 + 0.758601438*_cse313 + 0.458851168*_cse314)
+    _cse316 = -0.000346321299837637*_cse116 + 0.000346321299837637*_cse125
+    _cse317 = _cse84*(0.517383113*_cse296*_cse75 + 0.517383113*_cse299*_cse79 - 0.855753802*_cse311 - 0.855753802*_cse314 - _cse316)
+    _cse318 = _cse296*_cse39
+    _cse319 = _cse299*_cse38
+    _cse320 = -0.210033941789101*_cse116 + 0.210033941789101*_cse125
+    _cse321 = _cse302 - 0.01084270231829*_cse311 - 0.0189192713225*_cse312 - 0.0189192713225*_cse313 - 0.01084270231829*_cse314 + _cse315 + _cse317 + 0.0315500189858492*_cse318 - 0.0315500189858492*_cse319 + _cse320
+    _cse322 = -0.10501697089455*_cse116 + 0.10501697089455*_cse125
+    _cse323 = _cse307 - 0.005421351159145*_cse311 - 0.00945963566125*_cse312 - 0.00945963566125*_cse313 - 0.005421351159145*_cse314 + 0.5*_cse315 + 0.5*_cse317 + 0.0157750094929246*_cse318 - 0.0157750094929246*_cse319 + _cse322
+    _cse324 = _cse21*_cse3
+    _cse325 = -_cse19 + _cse324
+    _cse326 = _cse295*_cse41
+    _cse327 = _cse298*_cse47
+    _cse328 = -_cse293 + _cse294 + _cse325 + _cse326 + _cse327 - _cse51 - _cse52
+    _cse329 = _cse295*_cse75
+    _cse330 = _cse295*_cse81
+    _cse331 = _cse298*_cse77
+    _cse332 = _cse298*_cse79
+    _cse333 = -_cse235*_cse298 + _cse236*_cse295 + _cse309 - _cse310 + 0.758601438*_cse329 + 0.458851168*_cse330 + 0.458851168*_cse331 + 0.758601438*_cse332
+    _cse334 = _cse316 + 0.517383113*_cse329 - 0.855753802*_cse330 - 0.855753802*_cse331 + 0.517383113*_cse332
+    _cse335 = 0.0315500189858492*_cse38
+    _cse336 = -_cse19 + _cse21*_cse3 + 0.0315500189858492*_cse295*_cse39 + _cse295*_cse41 - _cse298*_cse335 + _cse298*_cse47 - _cse301 - _cse320 - 0.0189192713225*_cse329 - 0.01084270231829*_cse330 - 0.01084270231829*_cse331 - 0.0189192713225*_cse332 + _cse333*_cse70 + _cse334*_cse84
+    _cse337 = 0.08*_cse288
+    _cse338 = 0.08*_cse287
+    _cse339 = -_cse337 - _cse338
+    _cse340 = _cse0*_cse16*_cse4 - _cse71
+    _cse341 = 0.06*_cse1*_cse340
+    _cse342 = -_cse60 + _cse88
+    _cse343 = 0.06*_cse0*_cse342
+    _cse344 = _cse242*_cse40
+    _cse345 = _cse240*_cse47
+    _cse346 = _cse344 + _cse345
+    _cse347 = _cse208*_cse242
+    _cse348 = _cse242*_cse74
+    _cse349 = _cse240*_cse77
+    _cse350 = _cse240*_cse79
+    _cse351 = 0.517383113*_cse240*_cse79 + 0.517383113*_cse242*_cse74 - 0.855753802*_cse347 - 0.855753802*_cse349
+    _cse352 = -_cse235*_cse240 - _cse236*_cse242 + 0.458851168*_cse347 + 0.758601438*_cse348 + 0.458851168*_cse349 + 0.758601438*_cse350
+    _cse353 = -_cse240*_cse335 + _cse240*_cse47 - 0.0315500189858492*_cse242*_cse39 + _cse242*_cse40 - 0.01084270231829*_cse347 - 0.0189192713225*_cse348 - 0.01084270231829*_cse349 - 0.0189192713225*_cse350 + _cse351*_cse84 + _cse352*_cse70
+    _cse354 = 0.574238819026787*_cse37 - 0.574238819026787*_cse71 - 0.408002994597976*_cse72 + 0.408002994597976*_cse73 + 0.3960285*_cse76 + 0.239041914*_cse78 + 0.3960285*_cse80 + 0.239041914*_cse82
+    _cse355 = 0.04*_cse1*_cse354
+    _cse356 = _cse203*_cse38
+    _cse357 = _cse201*_cse39
+    _cse358 = 0.3960285*_cse229 + 0.239041914*_cse230 + 0.3960285*_cse231 + 0.239041914*_cse232 + 0.408002994597976*_cse356 - 0.408002994597976*_cse357 - 0.574238819026787*_cse60 + 0.574238819026787*_cse88
+    _cse359 = 0.04*_cse0*_cse358
+    _cse360 = _cse249*_cse69
+    _cse361 = _cse254*_cse84
+    _cse362 = _cse360 + _cse361
+    _cse363 = 0.410149995883665*_cse67
+    _cse364 = 0.410879747*_cse251
+    _cse365 = 0.209584432*_cse252
+    _cse366 = 0.410149995883665*_cse68
+    _cse367 = 0.410879747*_cse255
+    _cse368 = 0.209584432*_cse256
+    _cse369 = _cse363*_cse85 - _cse364*_cse85 + _cse365*_cse85 - _cse366*_cse83 - _cse367*_cse83 + _cse368*_cse83 + 0.329365488408814*_cse37 - 0.329365488408814*_cse71 - 0.234017800844203*_cse72 + 0.234017800844203*_cse73 + 0.227149603970304*_cse76 + 0.137106991283212*_cse78 + 0.227149603970304*_cse80 + 0.137106991283212*_cse82
+    _cse370 = 0.227149603970304*_cse229 + 0.137106991283212*_cse230 + 0.227149603970304*_cse231 + 0.137106991283212*_cse232 + _cse233*_cse363 - _cse233*_cse364 + _cse233*_cse365 - _cse237*_cse366 - _cse237*_cse367 + _cse237*_cse368 + 0.234017800844203*_cse356 - 0.234017800844203*_cse357 - 0.329365488408814*_cse60 + 0.329365488408814*_cse88
+    _cse371 = 0.02*_cse0*_cse370 + 0.02*_cse1*_cse369
+    _cse372 = 0.5*_cse170 + _cse265
+    _cse373 = -_cse372
+    _cse374 = 0.5*_cse168 + _cse267
+    _cse375 = -0.5*_cse117*_cse41 - 0.5*_cse120*_cse47 + _cse372
+    _cse376 = -_cse271 - _cse375
+    _cse377 = 0.5*_cse174 + 0.5*_cse176 + _cse283 + _cse374
+    _cse378 = _cse276 + _cse277 + _cse377
+    _cse379 = 0.0157750094929246*_cse117*_cse39 - 0.0157750094929246*_cse190 - 0.00945963566125*_cse191 - 0.005421351159145*_cse192 - 0.005421351159145*_cse193 - 0.00945963566125*_cse194 + 0.5*_cse195*_cse70 + 0.5*_cse196*_cse84 - _cse281 - _cse375
+    _cse380 = -0.0157750094929246*_cse181 + 0.0157750094929246*_cse182 - 0.005421351159145*_cse183 - 0.00945963566125*_cse184 - 0.00945963566125*_cse185 - 0.005421351159145*_cse186 + 0.5*_cse187 + 0.5*_cse188 + _cse285 + _cse377
+    _cse381 = -_cse291 + 0.5*_cse324
+    _cse382 = -_cse304 + _cse305 + 0.5*_cse326 + 0.5*_cse327 + _cse381 - _cse55 - _cse56
+    _cse383 = 0.0157750094929246*_cse38
+    _cse384 = 0.5*_cse21*_cse3 - _cse291 + 0.0157750094929246*_cse295*_cse39 + 0.5*_cse295*_cse41 - _cse298*_cse383 + 0.5*_cse298*_cse47 - _cse306 - _cse322 - 0.00945963566125*_cse329 - 0.005421351159145*_cse330 - 0.005421351159145*_cse331 - 0.00945963566125*_cse332 + 0.5*_cse333*_cse70 + 0.5*_cse334*_cse84
+    _cse385 = 0.5*_cse198 + 0.5*_cse199
+    _cse386 = 0.5*_cse202 + 0.5*_cse204
+    _cse387 = -0.0157750094929246*_cse206 - 0.0157750094929246*_cse207 - 0.005421351159145*_cse209 - 0.005421351159145*_cse210 - 0.00945963566125*_cse211 - 0.00945963566125*_cse212 + 0.5*_cse213*_cse84 + 0.5*_cse214*_cse70 + 0.5*_cse40*_cse50 + 0.5*_cse46*_cse47
+    _cse388 = 0.5*_cse201*_cse47 + 0.5*_cse203*_cse40 - 0.0157750094929246*_cse216 - 0.0157750094929246*_cse217 - 0.005421351159145*_cse218 - 0.005421351159145*_cse219 - 0.00945963566125*_cse220 - 0.00945963566125*_cse221 + 0.5*_cse222*_cse84 + 0.5*_cse223*_cse70
+    _cse389 = 0.02*_cse0*_cse16*_cse4 - 0.02*_cse71
+    _cse390 = 3*_cse389
+    _cse391 = _cse1*_cse390
+    _cse392 = -0.02*_cse60 + 0.02*_cse88
+    _cse393 = 3*_cse392
+    _cse394 = _cse0*_cse393
+    _cse395 = 0.5*_cse344 + 0.5*_cse345
+    _cse396 = -_cse240*_cse383 + 0.5*_cse240*_cse47 - 0.0157750094929246*_cse242*_cse39 + 0.5*_cse242*_cse40 - 0.005421351159145*_cse347 - 0.00945963566125*_cse348 - 0.005421351159145*_cse349 - 0.00945963566125*_cse350 + 0.5*_cse351*_cse84 + 0.5*_cse352*_cse70
+    _cse397 = -0.02*_cse44 - 0.02*_cse45
+    _cse398 = -_cse44 - _cse45
+    _cse399 = -0.408002994597976*_cse241 + 0.408002994597976*_cse243 + 0.239041914*_cse244 + 0.239041914*_cse245 + 0.3960285*_cse246 + 0.3960285*_cse247 - 0.574238819026787*_cse44 - 0.574238819026787*_cse45
+    _cse400 = 2*_cse399
+    _cse401 = 2*_cse354
+    _cse402 = 2*_cse358
+    _cse403 = -0.234017800844203*_cse241 + 0.234017800844203*_cse243 + 0.137106991283212*_cse244 + 0.137106991283212*_cse245 + 0.227149603970304*_cse246 + 0.227149603970304*_cse247 - 0.410879747*_cse249*_cse251 + 0.410149995883665*_cse250 + 0.209584432*_cse253 - 0.410879747*_cse254*_cse255 - 0.410149995883665*_cse254*_cse68 + 0.209584432*_cse257 - 0.329365488408814*_cse44 - 0.329365488408814*_cse45
+    _cse404 = 0.5*_cse226 + 0.5*_cse227
+    _cse405 = 0.5*_cse234 + 0.5*_cse238
+    _cse406 = 0.0114847763805357*_cse37 - 0.0114847763805357*_cse71 - 0.00816005989195952*_cse72 + 0.00816005989195952*_cse73 + 0.00792057*_cse76 + 0.00478083828*_cse78 + 0.00792057*_cse80 + 0.00478083828*_cse82
+    _cse407 = 2*_cse406
+    _cse408 = _cse1*_cse407
+    _cse409 = 0.00792057*_cse229 + 0.00478083828*_cse230 + 0.00792057*_cse231 + 0.00478083828*_cse232 + 0.00816005989195952*_cse356 - 0.00816005989195952*_cse357 - 0.0114847763805357*_cse60 + 0.0114847763805357*_cse88
+    _cse410 = 2*_cse409
+    _cse411 = _cse0*_cse410
+    _cse412 = 0.5*_cse360 + 0.5*_cse361
+    _cse413 = -0.00816005989195952*_cse241 + 0.00816005989195952*_cse243 + 0.00478083828*_cse244 + 0.00478083828*_cse245 + 0.00792057*_cse246 + 0.00792057*_cse247 - 0.0114847763805357*_cse44 - 0.0114847763805357*_cse45
+    _cse414 = 0.00820299991767329*_cse67
+    _cse415 = 0.00821759494*_cse251
+    _cse416 = 0.00419168864*_cse252
+    _cse417 = 0.00820299991767329*_cse68
+    _cse418 = 0.00821759494*_cse255
+    _cse419 = 0.00419168864*_cse256
+    _cse420 = 0.00658730976817627*_cse37 + _cse414*_cse85 - _cse415*_cse85 + _cse416*_cse85 - _cse417*_cse83 - _cse418*_cse83 + _cse419*_cse83 - 0.00658730976817627*_cse71 - 0.00468035601688406*_cse72 + 0.00468035601688406*_cse73 + 0.00454299207940609*_cse76 + 0.00274213982566424*_cse78 + 0.00454299207940609*_cse80 + 0.00274213982566424*_cse82
+    _cse421 = 0.00454299207940609*_cse229 + 0.00274213982566424*_cse230 + 0.00454299207940609*_cse231 + 0.00274213982566424*_cse232 + _cse233*_cse414 - _cse233*_cse415 + _cse233*_cse416 - _cse237*_cse417 - _cse237*_cse418 + _cse237*_cse419 + 0.00468035601688406*_cse356 - 0.00468035601688406*_cse357 - 0.00658730976817627*_cse60 + 0.00658730976817627*_cse88
+    _cse422 = _cse0*_cse421 + _cse1*_cse420
+    out = np.empty((6, 6))
+    out[0, 0] = _cse10*_cse8 + _cse100*_cse101 + _cse12*_cse14 + _cse26*_cse28 + _cse33*_cse35 + _cse54*_cse58 + _cse64*_cse66 + _cse86*_cse87 + (-2.1217e-5*_cse0 - 4.8455e-5*_cse1)*(-1.06085e-5*_cse0 - 2.42275e-5*_cse1) + (2.42275e-5*_cse0 - 1.06085e-5*_cse1)*(4.8455e-5*_cse0 - 2.1217e-5*_cse1) + 0.12
+    out[0, 1] = -_cse10*_cse104 + _cse101*_cse153 + _cse103*_cse14 + _cse109*_cse33 + _cse112*_cse26 + _cse124*_cse66 + _cse135*_cse58 + _cse167*_cse87
+    out[0, 2] = _cse101*_cse197 + _cse169*_cse26 + _cse172*_cse33 + _cse178*_cse58 + _cse180*_cse66 + _cse189*_cse87
+    out[0, 3] = _cse101*_cse215 + _cse200*_cse66 + _cse205*_cse58 + _cse224*_cse87 + _cse225
+    out[0, 4] = _cse101*_cse228 + _cse239*_cse87 + _cse248
+    out[0, 5] = _cse259
+    out[1, 0] = _cse100*_cse282 + _cse12*_cse261 - _cse260*_cse8 + _cse266*_cse35 + _cse268*_cse28 + _cse273*_cse64 + _cse279*_cse54 + _cse286*_cse86
+    out[1, 1] = _cse109*_cse266 + _cse112*_cse268 + _cse124*_cse273 + _cse135*_cse279 + _cse153*_cse282 + _cse167*_cse286 + _cse287*_cse289 + 0.1*_cse287 + _cse288*_cse289 + 0.1*_cse288 + _cse290*_cse292 + _cse303*_cse308 + _cse321*_cse323 + _cse5*(0.10451*_cse3 + 0.00097595*_cse4)
+    out[1, 2] = _cse169*_cse268 + _cse172*_cse266 + _cse178*_cse279 + _cse180*_cse273 + _cse189*_cse286 + _cse197*_cse282 + _cse292*_cse325 + _cse308*_cse328 + _cse323*_cse336 + _cse339
+    out[1, 3] = _cse200*_cse273 + _cse205*_cse279 + _cse215*_cse282 + _cse224*_cse286 + _cse308*_cse346 + _cse323*_cse353 - _cse341 - _cse343
+    out[1, 4] = _cse228*_cse282 + _cse239*_cse286 + _cse323*_cse362 - _cse355 - _cse359
+    out[1, 5] = -_cse371
+    out[2, 0] = _cse100*_cse379 + _cse28*_cse374 + _cse35*_cse373 + _cse376*_cse64 + _cse378*_cse54 + _cse380*_cse86
+    out[2, 1] = _cse109*_cse373 + _cse112*_cse374 + _cse124*_cse376 + _cse135*_cse378 + _cse153*_cse379 + _cse167*_cse380 + _cse290*_cse381 + _cse303*_cse382 + _cse321*_cse384 + _cse339
+    out[2, 2] = _cse169*_cse374 + _cse172*_cse373 + _cse178*_cse378 + _cse180*_cse376 + _cse189*_cse380 + _cse197*_cse379 + _cse325*_cse381 + _cse328*_cse382 + _cse336*_cse384 + _cse337 + _cse338
+    out[2, 3] = _cse200*_cse376 + _cse205*_cse378 + _cse215*_cse379 + _cse224*_cse380 + _cse341 + _cse343 + _cse346*_cse382 + _cse353*_cse384
+    out[2, 4] = _cse228*_cse379 + _cse239*_cse380 + _cse355 + _cse359 + _cse362*_cse384
+    out[2, 5] = _cse371
+    out[3, 0] = _cse100*_cse387 + _cse225 + _cse385*_cse64 + _cse386*_cse54 + _cse388*_cse86
+    out[3, 1] = _cse124*_cse385 + _cse135*_cse386 + _cse153*_cse387 + _cse167*_cse388 + _cse303*_cse395 + _cse321*_cse396 - _cse391 - _cse394
+    out[3, 2] = _cse178*_cse386 + _cse180*_cse385 + _cse189*_cse388 + _cse197*_cse387 + _cse328*_cse395 + _cse336*_cse396 + _cse391 + _cse394
+    out[3, 3] = _cse200*_cse385 + _cse205*_cse386 + _cse215*_cse387 + _cse224*_cse388 + _cse340*_cse390 + _cse342*_cse393 + _cse346*_cse395 + _cse353*_cse396 + 3*_cse397*_cse398
+    out[3, 4] = _cse228*_cse387 + _cse239*_cse388 + _cse362*_cse396 + _cse389*_cse401 + _cse392*_cse402 + _cse397*_cse400
+    out[3, 5] = _cse369*_cse389 + _cse370*_cse392 + _cse397*_cse403
+    out[4, 0] = _cse100*_cse404 + _cse248 + _cse405*_cse86
+    out[4, 1] = _cse153*_cse404 + _cse167*_cse405 + _cse321*_cse412 - _cse408 - _cse411
+    out[4, 2] = _cse189*_cse405 + _cse197*_cse404 + _cse336*_cse412 + _cse408 + _cse411
+    out[4, 3] = _cse215*_cse404 + _cse224*_cse405 + _cse340*_cse407 + _cse342*_cse410 + _cse353*_cse412 + 2*_cse398*_cse413
+    out[4, 4] = _cse228*_cse404 + _cse239*_cse405 + _cse362*_cse412 + _cse400*_cse413 + _cse401*_cse406 + _cse402*_cse409
+    out[4, 5] = _cse369*_cse406 + _cse370*_cse409 + _cse403*_cse413
+    out[5, 0] = _cse259
+    out[5, 1] = -_cse422
+    out[5, 2] = _cse422
+    out[5, 3] = _cse258*_cse398 + _cse340*_cse420 + _cse342*_cse421
+    out[5, 4] = _cse258*_cse399 + _cse354*_cse420 + _cse358*_cse421
+    out[5, 5] = _cse258*_cse403 + _cse369*_cse420 + _cse370*_cse421
+    return out
+
+
+# g
+def function1(q0, q1, q2, q3, q4, q5):
+    _cse0 = math.sin(q1)
+    _cse1 = math.cos(q1)
+    _cse2 = math.cos(q3)
+    _cse3 = math.sin(q2)
+    _cse4 = _cse0*_cse3
+    _cse5 = math.cos(q2)
+    _cse6 = _cse1*_cse5
+    _cse7 = 6.57617443000635e-7*_cse4 + 6.57617443000635e-7*_cse6
+    _cse8 = -_cse7
+    _cse9 = _cse2*_cse8
+    _cse10 = 0.00048786*_cse3 + 0.081945*_cse5
+    _cse11 = 14.715*_cse0
+    _cse12 = _cse0*_cse5
+    _cse13 = 0.818687841791724*_cse12
+    _cse14 = _cse1*_cse3
+    _cse15 = 0.818687841791724*_cse14
+    _cse16 = math.sin(q3)
+    _cse17 = 0.999999998572139*_cse4 + 0.999999998572139*_cse6
+    _cse18 = -_cse17
+    _cse19 = 0.45991232*_cse16 + 0.85536427*_cse2
+    _cse20 = _cse18*_cse19
+    _cse21 = 0.75940555*_cse16 - 0.51802699*_cse2
+    _cse22 = 0.51802699*_cse16 + 0.75940555*_cse2
+    _cse23 = -_cse22
+    _cse24 = 0.85536427*_cse16 - 0.45991232*_cse2
+    _cse25 = _cse24*_cse8
+    _cse26 = math.sin(q4)
+    _cse27 = math.cos(q4)
+    _cse28 = 0.00052974*_cse26 - 0.012272*_cse27
+    _cse29 = -4.905*_cse28
+    _cse30 = -0.000346321299837637*_cse12 + 0.000346321299837637*_cse14
+    _cse31 = -0.06019416*_cse26 - 0.0025983747*_cse27
+    _cse32 = 0.00040053*_cse16 - 0.012581*_cse2
+    _cse33 = -9.81*_cse32
+    _cse34 = -0.12341961*_cse16 - 0.0039291993*_cse2
+    _cse35 = 14.715*_cse1*(0.081945*_cse3 - 0.00048786*_cse5) - 1.81109248447554*_cse12 + 1.81109248447554*_cse14 + 0.038167446604417*_cse4 + 0.038167446604417*_cse6
+    _cse36 = _cse17*_cse21
+    _cse37 = _cse23*_cse7
+    _cse38 = _cse16*_cse17
+    _cse39 = _cse17*_cse19
+    _cse40 = _cse24*_cse7
+    _cse41 = _cse2*_cse7
+    _cse42 = 0.999999998572139*_cse1*_cse3 - 0.999999998572139*_cse12
+    _cse43 = _cse2*_cse42
+    _cse44 = 6.57617443000635e-7*_cse1*_cse3 - 6.57617443000635e-7*_cse12
+    _cse45 = _cse16*_cse44
+    _cse46 = -_cse24*_cse42
+    _cse47 = _cse22*_cse42
+    _cse48 = _cse19*_cse44
+    _cse49 = _cse21*_cse44
+    _cse50 = _cse19*_cse42
+    _cse51 = _cse24*_cse44
+    out = np.empty((6, 1))
+    out[0, 0] = 0
+    out[1, 0] = -7.11798885*_cse0 - 0.03828012093*_cse1 + _cse10*_cse11 + 0.15475284312559*_cse16*_cse18 + 0.0531834548712125*_cse18*_cse19 + 0.0927990258368625*_cse18*_cse21 - _cse18*_cse34 + 0.0927990258368625*_cse23*_cse8 + 0.0531834548712125*_cse24*_cse8 - _cse29*(-_cse13 + _cse15 - 0.212878838804554*_cse16*_cse18 + 0.758601438*_cse18*_cse21 + 0.458851168*_cse20 + 0.758601438*_cse23*_cse8 + 0.458851168*_cse25 + 0.212878838804554*_cse9) - _cse31*(0.517383113*_cse18*_cse21 - 0.855753802*_cse20 + 0.517383113*_cse23*_cse8 - 0.855753802*_cse25 - _cse30) - _cse33*_cse8 - _cse35 - 0.15475284312559*_cse9
+    out[2, 0] = -_cse10*_cse11 - _cse17*_cse34 - _cse29*(_cse13 - _cse15 + 0.758601438*_cse36 + 0.758601438*_cse37 - 0.212878838804554*_cse38 + 0.458851168*_cse39 + 0.458851168*_cse40 + 0.212878838804554*_cse41) - _cse31*(_cse30 + 0.517383113*_cse36 + 0.517383113*_cse37 - 0.855753802*_cse39 - 0.855753802*_cse40) - _cse33*_cse7 + _cse35 + 0.0927990258368625*_cse36 + 0.0927990258368625*_cse37 + 0.15475284312559*_cse38 + 0.0531834548712125*_cse39 + 0.0531834548712125*_cse40 - 0.15475284312559*_cse41
+    out[3, 0] = -_cse29*(-0.212878838804554*_cse43 - 0.212878838804554*_cse45 + 0.458851168*_cse46 + 0.758601438*_cse47 + 0.458851168*_cse48 + 0.758601438*_cse49) - _cse31*(0.517383113*_cse21*_cse44 + 0.517383113*_cse22*_cse42 - 0.855753802*_cse46 - 0.855753802*_cse48) - 9.81*_cse32*_cse42 - _cse34*_cse44 + 0.15475284312559*_cse43 + 0.15475284312559*_cse45 + 0.0531834548712125*_cse46 + 0.0927990258368625*_cse47 + 0.0531834548712125*_cse48 + 0.0927990258368625*_cse49
+    out[4, 0] = -4.905*_cse28*(0.517383113*_cse21*_cse42 + 0.517383113*_cse23*_cse44 - 0.000346321299837637*_cse4 - 0.855753802*_cse50 - 0.855753802*_cse51 - 0.000346321299837637*_cse6) - _cse31*(-0.212878838804554*_cse16*_cse42 + 0.212878838804554*_cse2*_cse44 + 0.758601438*_cse21*_cse42 + 0.758601438*_cse23*_cse44 + 0.818687841791724*_cse4 + 0.458851168*_cse50 + 0.458851168*_cse51 + 0.818687841791724*_cse6)
+    out[5, 0] = 0
+    return out
+
+
+# Gamma
+def function2(q0, q1, q2, q3, q4, q5):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = 2.1217e-5*_cse0 + 4.8455e-5*_cse1
+    _cse3 = 1.211375e-5*_cse0 - 5.30425e-6*_cse1
+    _cse4 = 1.06085e-5*_cse0 + 2.42275e-5*_cse1
+    _cse5 = 2.42275e-5*_cse0 - 1.06085e-5*_cse1
+    _cse6 = 2.16295e-5*_cse0
+    _cse7 = math.sin(q1)
+    _cse8 = math.cos(q1)
+    _cse9 = 0.20902*_cse7 + 0.0019519*_cse8
+    _cse10 = -_cse9
+    _cse11 = _cse0*_cse10
+    _cse12 = 0.5*_cse11
+    _cse13 = 0.0144614975*_cse1 + _cse12 - _cse6
+    _cse14 = -_cse13
+    _cse15 = -_cse1*_cse10 + 4.3259e-5*_cse1
+    _cse16 = -0.028922995*_cse0 - _cse15
+    _cse17 = 0.5*_cse16
+    _cse18 = 4.3259e-5*_cse0
+    _cse19 = 0.028922995*_cse1 + _cse11 - _cse18
+    _cse20 = -0.5*_cse1*_cse10 + 2.16295e-5*_cse1
+    _cse21 = -0.00723074875*_cse0 - 0.5*_cse20
+    _cse22 = -_cse19
+    _cse23 = _cse0*_cse7
+    _cse24 = _cse0*_cse8
+    _cse25 = math.sin(q2)
+    _cse26 = math.cos(q2)
+    _cse27 = 0.081945*_cse25 - 0.00048786*_cse26
+    _cse28 = _cse27*_cse8
+    _cse29 = _cse0*_cse28
+    _cse30 = 0.00048786*_cse25 + 0.081945*_cse26
+    _cse31 = -_cse30
+    _cse32 = _cse31*_cse7
+    _cse33 = _cse0*_cse32
+    _cse34 = 0.20503*_cse23 - 1.098e-6*_cse24 + _cse29 + _cse33
+    _cse35 = -_cse11 + _cse18 + _cse34
+    _cse36 = 0.007102005*_cse1 + _cse35
+    _cse37 = _cse1*_cse7
+    _cse38 = _cse1*_cse28
+    _cse39 = 0.5*_cse38
+    _cse40 = _cse1*_cse32
+    _cse41 = -5.49e-7*_cse1*_cse8 + 0.102515*_cse37 + _cse39 + 0.5*_cse40
+    _cse42 = _cse20 + _cse41
+    _cse43 = 0.0035510025*_cse0 - _cse42
+    _cse44 = 0.5*_cse43
+    _cse45 = 0.5*_cse29
+    _cse46 = 0.102515*_cse23 - 5.49e-7*_cse24 + 0.5*_cse33 + _cse45
+    _cse47 = -_cse12 + _cse46 + _cse6
+    _cse48 = 0.0035510025*_cse1 + _cse47
+    _cse49 = -1.098e-6*_cse1*_cse8 + 0.20503*_cse37 + _cse38 + _cse40
+    _cse50 = _cse15 + _cse49
+    _cse51 = 0.007102005*_cse0 - _cse50
+    _cse52 = 0.5*_cse51
+    _cse53 = -_cse48
+    _cse54 = -_cse36
+    _cse55 = _cse25*_cse8
+    _cse56 = _cse0*_cse55
+    _cse57 = 0.1592*_cse56
+    _cse58 = _cse26*_cse7
+    _cse59 = _cse0*_cse58
+    _cse60 = 0.1592*_cse59
+    _cse61 = _cse57 - _cse60
+    _cse62 = _cse26*_cse8
+    _cse63 = 0.0038906673398998*_cse62
+    _cse64 = _cse0*_cse63
+    _cse65 = _cse25*_cse7
+    _cse66 = 0.0038906673398998*_cse65
+    _cse67 = _cse0*_cse66
+    _cse68 = _cse64 + _cse67
+    _cse69 = 0.0068032576553314*_cse1 + _cse35 + _cse68
+    _cse70 = _cse61 + _cse69
+    _cse71 = math.sin(q3)
+    _cse72 = math.cos(q3)
+    _cse73 = 0.00040053*_cse71 - 0.012581*_cse72
+    _cse74 = -_cse73
+    _cse75 = 0.999999998572139*_cse1
+    _cse76 = 6.57617443000635e-7*_cse0
+    _cse77 = _cse62*_cse76 + _cse65*_cse76
+    _cse78 = _cse75 + _cse77
+    _cse79 = -_cse78
+    _cse80 = _cse74*_cse79
+    _cse81 = 0.012581*_cse71 + 0.00040053*_cse72
+    _cse82 = -_cse81
+    _cse83 = 0.999999998572139*_cse0
+    _cse84 = _cse62*_cse83 + _cse65*_cse83
+    _cse85 = -6.57617443000635e-7*_cse1 + _cse84
+    _cse86 = -_cse85
+    _cse87 = _cse82*_cse86
+    _cse88 = _cse80 + _cse87
+    _cse89 = _cse70 + _cse88
+    _cse90 = 0.0019453336699499*_cse62
+    _cse91 = _cse1*_cse90
+    _cse92 = 0.0019453336699499*_cse65
+    _cse93 = _cse1*_cse92
+    _cse94 = _cse91 + _cse93
+    _cse95 = _cse1*_cse55
+    _cse96 = 0.0796*_cse95
+    _cse97 = _cse1*_cse58
+    _cse98 = 0.0796*_cse97
+    _cse99 = _cse96 - _cse98
+    _cse100 = _cse94 + _cse99
+    _cse101 = 6.57617443000635e-7*_cse1
+    _cse102 = _cse101*_cse62 + _cse101*_cse65
+    _cse103 = _cse102 - _cse83
+    _cse104 = _cse62*_cse75 + _cse65*_cse75
+    _cse105 = _cse104 + _cse76
+    _cse106 = -0.0034016288276657*_cse0 - 0.5*_cse103*_cse74 - 0.5*_cse105*_cse82 + _cse42
+    _cse107 = -_cse100 - _cse106
+    _cse108 = 0.5*_cse107
+    _cse109 = 0.0796*_cse56
+    _cse110 = 0.0796*_cse59
+    _cse111 = _cse109 - _cse110
+    _cse112 = _cse0*_cse90
+    _cse113 = _cse0*_cse92
+    _cse114 = _cse112 + _cse113
+    _cse115 = 0.0034016288276657*_cse1 + _cse114 + _cse47
+    _cse116 = _cse111 + _cse115
+    _cse117 = 0.5*_cse80 + 0.5*_cse87
+    _cse118 = _cse116 + _cse117
+    _cse119 = _cse1*_cse63
+    _cse120 = _cse1*_cse66
+    _cse121 = _cse119 + _cse120
+    _cse122 = 0.1592*_cse95
+    _cse123 = 0.1592*_cse97
+    _cse124 = _cse122 - _cse123
+    _cse125 = _cse121 + _cse124
+    _cse126 = -0.0068032576553314*_cse0 - _cse103*_cse74 - _cse105*_cse82 + _cse50
+    _cse127 = -_cse125 - _cse126
+    _cse128 = 0.5*_cse127
+    _cse129 = -0.5*_cse74*_cse78 - 0.5*_cse82*_cse85
+    _cse130 = -_cse116 - _cse129
+    _cse131 = -_cse74*_cse78 - _cse82*_cse85
+    _cse132 = -_cse131 - _cse70
+    _cse133 = math.sin(q4)
+    _cse134 = math.cos(q4)
+    _cse135 = 0.00052974*_cse133 - 0.012272*_cse134
+    _cse136 = -_cse135
+    _cse137 = 0.75940555*_cse71 - 0.51802699*_cse72
+    _cse138 = _cse137*_cse86
+    _cse139 = 0.51802699*_cse71 + 0.75940555*_cse72
+    _cse140 = -_cse139
+    _cse141 = _cse140*_cse79
+    _cse142 = _cse72*_cse79
+    _cse143 = 0.45991232*_cse71 + 0.85536427*_cse72
+    _cse144 = _cse143*_cse86
+    _cse145 = 0.85536427*_cse71 - 0.45991232*_cse72
+    _cse146 = _cse145*_cse79
+    _cse147 = _cse71*_cse86
+    _cse148 = 0.818687841791724*_cse55
+    _cse149 = _cse0*_cse148
+    _cse150 = 0.818687841791724*_cse58
+    _cse151 = _cse0*_cse150
+    _cse152 = _cse149 - _cse151
+    _cse153 = _cse136*(0.758601438*_cse138 + 0.758601438*_cse141 + 0.212878838804554*_cse142 + 0.458851168*_cse144 + 0.458851168*_cse146 - 0.212878838804554*_cse147 + _cse152)
+    _cse154 = 0.012272*_cse133 + 0.00052974*_cse134
+    _cse155 = -_cse154
+    _cse156 = 0.000346321299837637*_cse58
+    _cse157 = _cse0*_cse156
+    _cse158 = 0.000346321299837637*_cse55
+    _cse159 = _cse0*_cse158
+    _cse160 = _cse155*(0.517383113*_cse138 + 0.517383113*_cse141 - 0.855753802*_cse144 - 0.855753802*_cse146 + _cse157 - _cse159)
+    _cse161 = 0.210033941789101*_cse56 - 0.210033941789101*_cse59
+    _cse162 = _cse161 + _cse69
+    _cse163 = -0.0189192713225*_cse138 - 0.0189192713225*_cse141 + 0.0315500189858492*_cse142 - 0.01084270231829*_cse144 - 0.01084270231829*_cse146 - 0.0315500189858492*_cse147 + _cse153 + _cse160 + _cse162 + _cse88
+    _cse164 = _cse105*_cse143
+    _cse165 = _cse103*_cse145
+    _cse166 = _cse105*_cse137
+    _cse167 = _cse103*_cse140
+    _cse168 = _cse105*_cse71
+    _cse169 = _cse103*_cse72
+    _cse170 = 0.818687841791724*_cse97
+    _cse171 = 0.818687841791724*_cse95
+    _cse172 = _cse170 - _cse171
+    _cse173 = 0.458851168*_cse164 + 0.458851168*_cse165 + 0.758601438*_cse166 + 0.758601438*_cse167 - 0.212878838804554*_cse168 + 0.212878838804554*_cse169 + _cse172
+    _cse174 = 0.000346321299837637*_cse95
+    _cse175 = 0.000346321299837637*_cse97
+    _cse176 = _cse174 - _cse175
+    _cse177 = -0.855753802*_cse164 - 0.855753802*_cse165 + 0.517383113*_cse166 + 0.517383113*_cse167 + _cse176
+    _cse178 = 0.10501697089455*_cse95 - 0.10501697089455*_cse97
+    _cse179 = 0.0157750094929246*_cse103*_cse72 - _cse106 + 0.5*_cse136*_cse173 + 0.5*_cse155*_cse177 - 0.005421351159145*_cse164 - 0.005421351159145*_cse165 - 0.00945963566125*_cse166 - 0.00945963566125*_cse167 - 0.0157750094929246*_cse168 - _cse178 - _cse94
+    _cse180 = 0.5*_cse179
+    _cse181 = 0.10501697089455*_cse56 - 0.10501697089455*_cse59
+    _cse182 = _cse115 + _cse181
+    _cse183 = _cse117 - 0.00945963566125*_cse138 - 0.00945963566125*_cse141 + 0.0157750094929246*_cse142 - 0.005421351159145*_cse144 - 0.005421351159145*_cse146 - 0.0157750094929246*_cse147 + 0.5*_cse153 + 0.5*_cse160 + _cse182
+    _cse184 = 0.210033941789101*_cse95 - 0.210033941789101*_cse97
+    _cse185 = 0.0315500189858492*_cse103*_cse72 - _cse121 - _cse126 + _cse136*_cse173 + _cse155*_cse177 - 0.01084270231829*_cse164 - 0.01084270231829*_cse165 - 0.0189192713225*_cse166 - 0.0189192713225*_cse167 - 0.0315500189858492*_cse168 - _cse184
+    _cse186 = 0.5*_cse185
+    _cse187 = _cse143*_cse85
+    _cse188 = _cse145*_cse78
+    _cse189 = _cse137*_cse85
+    _cse190 = _cse140*_cse78
+    _cse191 = _cse71*_cse85
+    _cse192 = 0.0157750094929246*_cse191
+    _cse193 = _cse72*_cse78
+    _cse194 = 0.212878838804554*_cse193
+    _cse195 = 0.212878838804554*_cse191
+    _cse196 = -_cse149 + _cse151
+    _cse197 = 0.458851168*_cse187 + 0.458851168*_cse188 + 0.758601438*_cse189 + 0.758601438*_cse190 + _cse194 - _cse195 + _cse196
+    _cse198 = -_cse157 + _cse159
+    _cse199 = -0.855753802*_cse187 - 0.855753802*_cse188 + 0.517383113*_cse189 + 0.517383113*_cse190 + _cse198
+    _cse200 = 0.0157750094929246*_cse193
+    _cse201 = -_cse129 + 0.5*_cse136*_cse197 + 0.5*_cse155*_cse199 - _cse182 - 0.005421351159145*_cse187 - 0.005421351159145*_cse188 - 0.00945963566125*_cse189 - 0.00945963566125*_cse190 - _cse192 + _cse200
+    _cse202 = 0.0315500189858492*_cse191
+    _cse203 = 0.0315500189858492*_cse193
+    _cse204 = -_cse131 + _cse136*_cse197 + _cse155*_cse199 - _cse162 - 0.01084270231829*_cse187 - 0.01084270231829*_cse188 - 0.0189192713225*_cse189 - 0.0189192713225*_cse190 - _cse202 + _cse203
+    _cse205 = 5.49e-7*_cse23
+    _cse206 = 0.102515*_cse24
+    _cse207 = 0.0019519*_cse7 - 0.20902*_cse8
+    _cse208 = _cse31*_cse8
+    _cse209 = _cse0*_cse208
+    _cse210 = 0.5*_cse209
+    _cse211 = _cse27*_cse7
+    _cse212 = _cse0*_cse211
+    _cse213 = 0.5*_cse212
+    _cse214 = 0.5*_cse0*_cse207 - _cse205 - _cse206 - _cse210 + _cse213
+    _cse215 = 0.5*_cse36
+    _cse216 = 5.49e-7*_cse37
+    _cse217 = _cse1*_cse8
+    _cse218 = 0.102515*_cse217
+    _cse219 = _cse1*_cse207
+    _cse220 = 0.5*_cse219
+    _cse221 = _cse1*_cse208
+    _cse222 = 0.5*_cse221
+    _cse223 = _cse1*_cse211
+    _cse224 = 0.5*_cse223
+    _cse225 = _cse216 + _cse218 - _cse220 + _cse222 - _cse224
+    _cse226 = 0.0796*_cse62
+    _cse227 = 0.0796*_cse65
+    _cse228 = -0.0019453336699499*_cse56 + 0.0019453336699499*_cse59
+    _cse229 = _cse0*_cse226 + _cse0*_cse227 + _cse228
+    _cse230 = _cse0*_cse207
+    _cse231 = 0.5*_cse230
+    _cse232 = -6.57617443000635e-7*_cse0*_cse25*_cse8 + _cse58*_cse76
+    _cse233 = -_cse232
+    _cse234 = _cse233*_cse74
+    _cse235 = -0.999999998572139*_cse0*_cse25*_cse8 + _cse58*_cse83
+    _cse236 = -_cse235
+    _cse237 = _cse236*_cse82
+    _cse238 = -_cse205 - _cse206 - _cse210 + _cse213 + _cse231 + 0.5*_cse234 + 0.5*_cse237
+    _cse239 = _cse229 + _cse238
+    _cse240 = 0.5*_cse89
+    _cse241 = -_cse101*_cse55 + _cse101*_cse58
+    _cse242 = _cse241*_cse74
+    _cse243 = -_cse55*_cse75 + _cse58*_cse75
+    _cse244 = _cse243*_cse82
+    _cse245 = 0.0019453336699499*_cse95
+    _cse246 = _cse1*_cse226
+    _cse247 = _cse1*_cse227
+    _cse248 = 0.0019453336699499*_cse97
+    _cse249 = _cse225 + 0.5*_cse242 + 0.5*_cse244 + _cse245 - _cse246 - _cse247 - _cse248
+    _cse250 = 0.818687841791724*_cse65
+    _cse251 = _cse0*_cse250
+    _cse252 = 0.818687841791724*_cse62
+    _cse253 = _cse0*_cse252
+    _cse254 = _cse236*_cse71
+    _cse255 = _cse233*_cse72
+    _cse256 = _cse143*_cse236
+    _cse257 = _cse137*_cse236
+    _cse258 = _cse140*_cse233
+    _cse259 = _cse145*_cse233
+    _cse260 = _cse251 + _cse253 - 0.212878838804554*_cse254 + 0.212878838804554*_cse255 + 0.458851168*_cse256 + 0.758601438*_cse257 + 0.758601438*_cse258 + 0.458851168*_cse259
+    _cse261 = _cse136*_cse260
+    _cse262 = 0.000346321299837637*_cse62
+    _cse263 = 0.000346321299837637*_cse65
+    _cse264 = _cse0*_cse262 + _cse0*_cse263
+    _cse265 = 0.517383113*_cse137*_cse236 + 0.517383113*_cse140*_cse233 - 0.855753802*_cse256 - 0.855753802*_cse259 - _cse264
+    _cse266 = _cse155*_cse265
+    _cse267 = 0.10501697089455*_cse62
+    _cse268 = 0.10501697089455*_cse65
+    _cse269 = _cse0*_cse267 + _cse0*_cse268 + _cse228
+    _cse270 = _cse238 - 0.0157750094929246*_cse254 + 0.0157750094929246*_cse255 - 0.005421351159145*_cse256 - 0.00945963566125*_cse257 - 0.00945963566125*_cse258 - 0.005421351159145*_cse259 + 0.5*_cse261 + 0.5*_cse266 + _cse269
+    _cse271 = 0.5*_cse163
+    _cse272 = -_cse245 + _cse248
+    _cse273 = -_cse216 - _cse218 + _cse220 - _cse222 + _cse224 + _cse272
+    _cse274 = _cse1*_cse267 + _cse1*_cse268
+    _cse275 = _cse143*_cse243
+    _cse276 = _cse145*_cse241
+    _cse277 = _cse137*_cse243
+    _cse278 = _cse140*_cse241
+    _cse279 = _cse243*_cse71
+    _cse280 = _cse1*_cse250
+    _cse281 = _cse1*_cse252
+    _cse282 = _cse241*_cse72
+    _cse283 = 0.458851168*_cse275 + 0.458851168*_cse276 + 0.758601438*_cse277 + 0.758601438*_cse278 - 0.212878838804554*_cse279 - _cse280 - _cse281 + 0.212878838804554*_cse282
+    _cse284 = _cse1*_cse262 + _cse1*_cse263
+    _cse285 = -0.855753802*_cse275 - 0.855753802*_cse276 + 0.517383113*_cse277 + 0.517383113*_cse278 + _cse284
+    _cse286 = -0.5*_cse241*_cse74 - 0.5*_cse243*_cse82
+    _cse287 = -0.5*_cse136*_cse283 - 0.5*_cse155*_cse285 - 0.0157750094929246*_cse241*_cse72 + 0.005421351159145*_cse275 + 0.005421351159145*_cse276 + 0.00945963566125*_cse277 + 0.00945963566125*_cse278 + 0.0157750094929246*_cse279 + _cse286
+    _cse288 = -_cse273 - _cse274 - _cse287
+    _cse289 = -_cse225
+    _cse290 = 1.0*_cse51
+    _cse291 = 1.0*_cse54
+    _cse292 = -_cse241
+    _cse293 = _cse292*_cse74
+    _cse294 = -_cse243
+    _cse295 = _cse294*_cse82
+    _cse296 = 0.5*_cse293 + 0.5*_cse295
+    _cse297 = _cse273 + _cse296
+    _cse298 = _cse246 + _cse247 + _cse297
+    _cse299 = 1.0*_cse127
+    _cse300 = 1.0*_cse132
+    _cse301 = _cse294*_cse71
+    _cse302 = _cse292*_cse72
+    _cse303 = _cse143*_cse294
+    _cse304 = _cse137*_cse294
+    _cse305 = _cse140*_cse292
+    _cse306 = _cse145*_cse292
+    _cse307 = _cse280 + _cse281 - 0.212878838804554*_cse301 + 0.212878838804554*_cse302 + 0.458851168*_cse303 + 0.758601438*_cse304 + 0.758601438*_cse305 + 0.458851168*_cse306
+    _cse308 = _cse136*_cse307
+    _cse309 = 0.517383113*_cse137*_cse294 + 0.517383113*_cse140*_cse292 - _cse284 - 0.855753802*_cse303 - 0.855753802*_cse306
+    _cse310 = _cse155*_cse309
+    _cse311 = -0.0157750094929246*_cse301 + 0.0157750094929246*_cse302 - 0.005421351159145*_cse303 - 0.00945963566125*_cse304 - 0.00945963566125*_cse305 - 0.005421351159145*_cse306 + 0.5*_cse308 + 0.5*_cse310
+    _cse312 = _cse274 + _cse297 + _cse311
+    _cse313 = 1.0*_cse185
+    _cse314 = 1.0*_cse204
+    _cse315 = 1.098e-6*_cse23
+    _cse316 = 0.20503*_cse24
+    _cse317 = _cse0*_cse207 - _cse209 + _cse212 - _cse315 - _cse316
+    _cse318 = 0.5*_cse48
+    _cse319 = 1.098e-6*_cse37
+    _cse320 = 0.20503*_cse217
+    _cse321 = -_cse219 + _cse221 - _cse223 + _cse319 + _cse320
+    _cse322 = 0.1592*_cse62
+    _cse323 = 0.1592*_cse65
+    _cse324 = -0.0038906673398998*_cse56 + 0.0038906673398998*_cse59
+    _cse325 = _cse0*_cse322 + _cse0*_cse323 + _cse324
+    _cse326 = -_cse209 + _cse212 + _cse230 + _cse234 + _cse237 - _cse315 - _cse316
+    _cse327 = _cse325 + _cse326
+    _cse328 = 0.5*_cse118
+    _cse329 = 0.0038906673398998*_cse95
+    _cse330 = _cse1*_cse322
+    _cse331 = _cse1*_cse323
+    _cse332 = 0.0038906673398998*_cse97
+    _cse333 = _cse242 + _cse244 + _cse321 + _cse329 - _cse330 - _cse331 - _cse332
+    _cse334 = 0.210033941789101*_cse62
+    _cse335 = 0.210033941789101*_cse65
+    _cse336 = _cse0*_cse334 + _cse0*_cse335 + _cse324
+    _cse337 = -0.0315500189858492*_cse254 + 0.0315500189858492*_cse255 - 0.01084270231829*_cse256 - 0.0189192713225*_cse257 - 0.0189192713225*_cse258 - 0.01084270231829*_cse259 + _cse261 + _cse266 + _cse326 + _cse336
+    _cse338 = 0.5*_cse183
+    _cse339 = -_cse329 + _cse332
+    _cse340 = _cse219 - _cse221 + _cse223 - _cse319 - _cse320 + _cse339
+    _cse341 = _cse1*_cse334 + _cse1*_cse335
+    _cse342 = -_cse241*_cse74 - _cse243*_cse82
+    _cse343 = -_cse136*_cse283 - _cse155*_cse285 - 0.0315500189858492*_cse241*_cse72 + 0.01084270231829*_cse275 + 0.01084270231829*_cse276 + 0.0189192713225*_cse277 + 0.0189192713225*_cse278 + 0.0315500189858492*_cse279 + _cse342
+    _cse344 = -_cse340 - _cse341 - _cse343
+    _cse345 = 0.25*_cse230
+    _cse346 = 0.25*_cse16
+    _cse347 = _cse219*_cse346
+    _cse348 = _cse21*_cse219
+    _cse349 = _cse347 + _cse348
+    _cse350 = _cse30*_cse8
+    _cse351 = _cse1*_cse350
+    _cse352 = _cse223 + _cse351
+    _cse353 = _cse0*_cse350
+    _cse354 = _cse213 + 0.5*_cse353
+    _cse355 = -_cse354
+    _cse356 = _cse224 + 0.5*_cse351
+    _cse357 = -_cse356
+    _cse358 = _cse212 + _cse353
+    _cse359 = -_cse358
+    _cse360 = _cse293 + _cse295
+    _cse361 = _cse339 + _cse352
+    _cse362 = _cse330 + _cse331 + _cse361
+    _cse363 = _cse360 + _cse362
+    _cse364 = -0.5*_cse232*_cse74 - 0.5*_cse235*_cse82 + _cse354
+    _cse365 = -_cse229 - _cse364
+    _cse366 = _cse272 + _cse356
+    _cse367 = _cse246 + _cse247 + _cse366
+    _cse368 = _cse296 + _cse367
+    _cse369 = -_cse286 - _cse367
+    _cse370 = -_cse232*_cse74 - _cse235*_cse82 + _cse358
+    _cse371 = -_cse325 - _cse370
+    _cse372 = _cse341 + _cse361
+    _cse373 = -0.0315500189858492*_cse301 + 0.0315500189858492*_cse302 - 0.01084270231829*_cse303 - 0.0189192713225*_cse304 - 0.0189192713225*_cse305 - 0.01084270231829*_cse306 + _cse308 + _cse310
+    _cse374 = _cse360 + _cse372 + _cse373
+    _cse375 = _cse143*_cse235
+    _cse376 = _cse145*_cse232
+    _cse377 = _cse137*_cse235
+    _cse378 = _cse140*_cse232
+    _cse379 = _cse235*_cse71
+    _cse380 = _cse232*_cse72
+    _cse381 = -_cse251 - _cse253 + 0.458851168*_cse375 + 0.458851168*_cse376 + 0.758601438*_cse377 + 0.758601438*_cse378 - 0.212878838804554*_cse379 + 0.212878838804554*_cse380
+    _cse382 = _cse264 - 0.855753802*_cse375 - 0.855753802*_cse376 + 0.517383113*_cse377 + 0.517383113*_cse378
+    _cse383 = 0.5*_cse136*_cse381 + 0.5*_cse155*_cse382 + 0.0157750094929246*_cse232*_cse72 - _cse269 - _cse364 - 0.005421351159145*_cse375 - 0.005421351159145*_cse376 - 0.00945963566125*_cse377 - 0.00945963566125*_cse378 - 0.0157750094929246*_cse379
+    _cse384 = _cse274 + _cse366
+    _cse385 = _cse296 + _cse311 + _cse384
+    _cse386 = -_cse287 - _cse384
+    _cse387 = _cse136*_cse381 + _cse155*_cse382 + 0.0315500189858492*_cse232*_cse72 - _cse336 - _cse370 - 0.01084270231829*_cse375 - 0.01084270231829*_cse376 - 0.0189192713225*_cse377 - 0.0189192713225*_cse378 - 0.0315500189858492*_cse379
+    _cse388 = _cse78*_cse82
+    _cse389 = _cse73*_cse85
+    _cse390 = 0.5*_cse388 + 0.5*_cse389
+    _cse391 = _cse388 + _cse389
+    _cse392 = -_cse103
+    _cse393 = _cse392*_cse82
+    _cse394 = -_cse105
+    _cse395 = _cse394*_cse73
+    _cse396 = _cse393 + _cse395
+    _cse397 = _cse103*_cse82
+    _cse398 = _cse105*_cse73
+    _cse399 = 0.5*_cse397 + 0.5*_cse398
+    _cse400 = 0.5*_cse393 + 0.5*_cse395
+    _cse401 = _cse71*_cse78
+    _cse402 = _cse72*_cse85
+    _cse403 = -_cse145
+    _cse404 = _cse403*_cse85
+    _cse405 = _cse143*_cse78
+    _cse406 = _cse139*_cse85
+    _cse407 = _cse137*_cse78
+    _cse408 = 0.517383113*_cse137*_cse78 + 0.517383113*_cse139*_cse85 - 0.855753802*_cse404 - 0.855753802*_cse405
+    _cse409 = -0.212878838804554*_cse401 - 0.212878838804554*_cse402 + 0.458851168*_cse404 + 0.458851168*_cse405 + 0.758601438*_cse406 + 0.758601438*_cse407
+    _cse410 = 0.5*_cse136*_cse409 + 0.5*_cse155*_cse408 - 0.0157750094929246*_cse401 - 0.0157750094929246*_cse402 - 0.005421351159145*_cse404 - 0.005421351159145*_cse405 - 0.00945963566125*_cse406 - 0.00945963566125*_cse407 + 0.5*_cse73*_cse85 + 0.5*_cse78*_cse82
+    _cse411 = _cse136*_cse409 + _cse155*_cse408 - 0.0315500189858492*_cse401 - 0.0315500189858492*_cse402 - 0.01084270231829*_cse404 - 0.01084270231829*_cse405 - 0.0189192713225*_cse406 - 0.0189192713225*_cse407 + _cse73*_cse85 + _cse78*_cse82
+    _cse412 = _cse394*_cse72
+    _cse413 = _cse392*_cse71
+    _cse414 = _cse394*_cse403
+    _cse415 = _cse143*_cse392
+    _cse416 = _cse139*_cse394
+    _cse417 = _cse137*_cse392
+    _cse418 = 0.517383113*_cse137*_cse392 + 0.517383113*_cse139*_cse394 - 0.855753802*_cse414 - 0.855753802*_cse415
+    _cse419 = -0.212878838804554*_cse412 - 0.212878838804554*_cse413 + 0.458851168*_cse414 + 0.458851168*_cse415 + 0.758601438*_cse416 + 0.758601438*_cse417
+    _cse420 = _cse136*_cse419 + _cse155*_cse418 + _cse392*_cse82 + _cse394*_cse73 - 0.0315500189858492*_cse412 - 0.0315500189858492*_cse413 - 0.01084270231829*_cse414 - 0.01084270231829*_cse415 - 0.0189192713225*_cse416 - 0.0189192713225*_cse417
+    _cse421 = 0.5*_cse136*_cse419 + 0.5*_cse155*_cse418 + 0.5*_cse392*_cse82 + 0.5*_cse394*_cse73 - 0.0157750094929246*_cse412 - 0.0157750094929246*_cse413 - 0.005421351159145*_cse414 - 0.005421351159145*_cse415 - 0.00945963566125*_cse416 - 0.00945963566125*_cse417
+    _cse422 = _cse103*_cse71
+    _cse423 = _cse105*_cse72
+    _cse424 = _cse105*_cse403
+    _cse425 = _cse103*_cse143
+    _cse426 = _cse105*_cse139
+    _cse427 = _cse103*_cse137
+    _cse428 = 0.517383113*_cse103*_cse137 + 0.517383113*_cse105*_cse139 - 0.855753802*_cse424 - 0.855753802*_cse425
+    _cse429 = -0.212878838804554*_cse422 - 0.212878838804554*_cse423 + 0.458851168*_cse424 + 0.458851168*_cse425 + 0.758601438*_cse426 + 0.758601438*_cse427
+    _cse430 = 0.5*_cse103*_cse82 + 0.5*_cse105*_cse73 + 0.5*_cse136*_cse429 + 0.5*_cse155*_cse428 - 0.0157750094929246*_cse422 - 0.0157750094929246*_cse423 - 0.005421351159145*_cse424 - 0.005421351159145*_cse425 - 0.00945963566125*_cse426 - 0.00945963566125*_cse427
+    _cse431 = _cse135*_cse199
+    _cse432 = _cse155*_cse197
+    _cse433 = 0.5*_cse431 + 0.5*_cse432
+    _cse434 = _cse135*_cse177
+    _cse435 = _cse155*_cse173
+    _cse436 = 0.5*_cse434 + 0.5*_cse435
+    _cse437 = _cse140*_cse392
+    _cse438 = _cse143*_cse394
+    _cse439 = _cse137*_cse394
+    _cse440 = _cse145*_cse392
+    _cse441 = -_cse174 + _cse175 + 0.517383113*_cse437 - 0.855753802*_cse438 + 0.517383113*_cse439 - 0.855753802*_cse440
+    _cse442 = _cse135*_cse441
+    _cse443 = 0.212878838804554*_cse72
+    _cse444 = _cse392*_cse443
+    _cse445 = 0.212878838804554*_cse71
+    _cse446 = _cse394*_cse445
+    _cse447 = -_cse170 + _cse171
+    _cse448 = 0.758601438*_cse437 + 0.458851168*_cse438 + 0.758601438*_cse439 + 0.458851168*_cse440 + _cse444 - _cse446 + _cse447
+    _cse449 = _cse155*_cse448
+    _cse450 = 0.5*_cse442 + 0.5*_cse449
+    _cse451 = _cse431 + _cse432
+    _cse452 = _cse442 + _cse449
+    _cse453 = _cse289*_cse52
+    _cse454 = 0.5*_cse214
+    _cse455 = _cse454*_cse54
+    _cse456 = _cse128*_cse298
+    _cse457 = 0.5*_cse239
+    _cse458 = _cse132*_cse457
+    _cse459 = _cse186*_cse312
+    _cse460 = 0.5*_cse270
+    _cse461 = _cse204*_cse460
+    _cse462 = _cse19*_cse345
+    _cse463 = -_cse321
+    _cse464 = 0.5*_cse317
+    _cse465 = _cse340 + _cse360
+    _cse466 = _cse330 + _cse331 + _cse465
+    _cse467 = 0.5*_cse327
+    _cse468 = _cse341 + _cse373 + _cse465
+    _cse469 = 0.5*_cse337
+    _cse470 = _cse108*_cse466 + _cse13*_cse231 + _cse130*_cse467 + _cse180*_cse468 + _cse201*_cse469 + _cse44*_cse463 + _cse464*_cse53
+    _cse471 = _cse0*_cse9
+    _cse472 = _cse46 + 0.5*_cse471
+    _cse473 = _cse1*_cse9
+    _cse474 = 0.5*_cse473
+    _cse475 = _cse41 + _cse474
+    _cse476 = -_cse475
+    _cse477 = -_cse77
+    _cse478 = _cse477*_cse74
+    _cse479 = -_cse84
+    _cse480 = _cse479*_cse82
+    _cse481 = 0.5*_cse478 + 0.5*_cse480
+    _cse482 = _cse111 + _cse481
+    _cse483 = _cse114 + _cse472
+    _cse484 = _cse482 + _cse483
+    _cse485 = -0.5*_cse102*_cse74 - 0.5*_cse104*_cse82
+    _cse486 = _cse475 + _cse485
+    _cse487 = -_cse100 - _cse486
+    _cse488 = _cse137*_cse479
+    _cse489 = _cse140*_cse477
+    _cse490 = _cse143*_cse479
+    _cse491 = _cse145*_cse477
+    _cse492 = _cse136*(_cse152 + _cse443*_cse477 - _cse445*_cse479 + 0.758601438*_cse488 + 0.758601438*_cse489 + 0.458851168*_cse490 + 0.458851168*_cse491)
+    _cse493 = _cse155*(0.517383113*_cse137*_cse479 + 0.517383113*_cse140*_cse477 - _cse198 - 0.855753802*_cse490 - 0.855753802*_cse491)
+    _cse494 = 0.0157750094929246*_cse72
+    _cse495 = 0.0157750094929246*_cse71
+    _cse496 = _cse181 + _cse477*_cse494 - _cse479*_cse495 + _cse481 - 0.00945963566125*_cse488 - 0.00945963566125*_cse489 - 0.005421351159145*_cse490 - 0.005421351159145*_cse491 + 0.5*_cse492 + 0.5*_cse493
+    _cse497 = _cse483 + _cse496
+    _cse498 = _cse104*_cse143
+    _cse499 = _cse102*_cse145
+    _cse500 = _cse104*_cse137
+    _cse501 = _cse102*_cse140
+    _cse502 = _cse102*_cse443 - _cse104*_cse445 + _cse172 + 0.458851168*_cse498 + 0.458851168*_cse499 + 0.758601438*_cse500 + 0.758601438*_cse501
+    _cse503 = _cse176 - 0.855753802*_cse498 - 0.855753802*_cse499 + 0.517383113*_cse500 + 0.517383113*_cse501
+    _cse504 = -0.0157750094929246*_cse102*_cse72 + _cse104*_cse495 - 0.5*_cse136*_cse502 - 0.5*_cse155*_cse503 + _cse178 + 0.005421351159145*_cse498 + 0.005421351159145*_cse499 + 0.00945963566125*_cse500 + 0.00945963566125*_cse501
+    _cse505 = -_cse486 - _cse504 - _cse94
+    _cse506 = _cse289*_cse464
+    _cse507 = _cse321*_cse454
+    _cse508 = _cse298*_cse467
+    _cse509 = _cse333*_cse457
+    _cse510 = _cse312*_cse469
+    _cse511 = _cse344*_cse460
+    _cse512 = _cse225*_cse464 + _cse249*_cse467 + _cse288*_cse469 + _cse454*_cse463 + _cse457*_cse466 + _cse460*_cse468
+    _cse513 = _cse30*_cse7
+    _cse514 = 0.5*_cse513
+    _cse515 = _cse0*_cse514
+    _cse516 = -_cse45 + _cse515
+    _cse517 = 0.5*_cse1
+    _cse518 = _cse513*_cse517
+    _cse519 = _cse39 - _cse518
+    _cse520 = _cse74*_cse77
+    _cse521 = _cse82*_cse84
+    _cse522 = -_cse109 + _cse110 - _cse112 - _cse113 + _cse516 + 0.5*_cse520 + 0.5*_cse521
+    _cse523 = -_cse102
+    _cse524 = _cse523*_cse74
+    _cse525 = -_cse104
+    _cse526 = _cse525*_cse82
+    _cse527 = -_cse518 + _cse94
+    _cse528 = _cse39 + 0.5*_cse524 + 0.5*_cse526 + _cse527
+    _cse529 = _cse528 + _cse99
+    _cse530 = _cse143*_cse84
+    _cse531 = _cse145*_cse77
+    _cse532 = _cse137*_cse84
+    _cse533 = _cse140*_cse77
+    _cse534 = _cse196 + _cse443*_cse77 - _cse445*_cse84 + 0.458851168*_cse530 + 0.458851168*_cse531 + 0.758601438*_cse532 + 0.758601438*_cse533
+    _cse535 = _cse198 - 0.855753802*_cse530 - 0.855753802*_cse531 + 0.517383113*_cse532 + 0.517383113*_cse533
+    _cse536 = _cse114 - _cse515
+    _cse537 = 0.5*_cse136*_cse534 + 0.5*_cse155*_cse535 - _cse181 - _cse45 - _cse495*_cse84 - 0.005421351159145*_cse530 - 0.005421351159145*_cse531 - 0.00945963566125*_cse532 - 0.00945963566125*_cse533 - _cse536 + 0.0157750094929246*_cse72*_cse77 + 0.5*_cse74*_cse77 + 0.5*_cse82*_cse84
+    _cse538 = _cse137*_cse525
+    _cse539 = _cse140*_cse523
+    _cse540 = _cse143*_cse525
+    _cse541 = _cse145*_cse523
+    _cse542 = _cse136*(_cse443*_cse523 - _cse445*_cse525 + _cse447 + 0.758601438*_cse538 + 0.758601438*_cse539 + 0.458851168*_cse540 + 0.458851168*_cse541)
+    _cse543 = _cse155*(0.517383113*_cse137*_cse525 + 0.517383113*_cse140*_cse523 - _cse176 - 0.855753802*_cse540 - 0.855753802*_cse541)
+    _cse544 = _cse178 + _cse494*_cse523 - _cse495*_cse525 + _cse528 - 0.00945963566125*_cse538 - 0.00945963566125*_cse539 - 0.005421351159145*_cse540 - 0.005421351159145*_cse541 + 0.5*_cse542 + 0.5*_cse543
+    _cse545 = _cse290*_cse516 + _cse291*_cse519 + _cse299*_cse522 + _cse300*_cse529 + _cse313*_cse537 + _cse314*_cse544
+    _cse546 = 0.5*_cse355
+    _cse547 = 0.5*_cse466
+    _cse548 = 0.5*_cse468
+    _cse549 = 0.5*_cse359
+    _cse550 = 0.5*_cse298
+    _cse551 = 0.5*_cse312
+    _cse552 = -_cse289*_cse549 - _cse352*_cse454 + _cse356*_cse464 - _cse363*_cse457 + _cse365*_cse547 + _cse368*_cse467 - _cse371*_cse550 - _cse374*_cse460 + _cse383*_cse548 + _cse385*_cse469 - _cse387*_cse551 + _cse463*_cse546
+    _cse553 = -_cse1*_cse25*_cse8 + _cse97
+    _cse554 = -_cse553
+    _cse555 = 0.03*_cse1
+    _cse556 = _cse554*_cse555
+    _cse557 = _cse553*_cse555
+    _cse558 = _cse556 + _cse557
+    _cse559 = _cse241*_cse82
+    _cse560 = _cse243*_cse73
+    _cse561 = 0.5*_cse559 + 0.5*_cse560
+    _cse562 = _cse236*_cse73
+    _cse563 = _cse233*_cse82
+    _cse564 = 0.5*_cse562 + 0.5*_cse563
+    _cse565 = _cse143*_cse241
+    _cse566 = _cse137*_cse241
+    _cse567 = _cse243*_cse403
+    _cse568 = _cse139*_cse243
+    _cse569 = 0.517383113*_cse137*_cse241 + 0.517383113*_cse139*_cse243 - 0.855753802*_cse565 - 0.855753802*_cse567
+    _cse570 = -_cse241*_cse445 - _cse243*_cse443 + 0.458851168*_cse565 + 0.758601438*_cse566 + 0.458851168*_cse567 + 0.758601438*_cse568
+    _cse571 = 0.5*_cse136*_cse570 + 0.5*_cse155*_cse569 - _cse241*_cse495 + 0.5*_cse241*_cse82 - _cse243*_cse494 + 0.5*_cse243*_cse73 - 0.005421351159145*_cse565 - 0.00945963566125*_cse566 - 0.005421351159145*_cse567 - 0.00945963566125*_cse568
+    _cse572 = _cse236*_cse403
+    _cse573 = _cse139*_cse236
+    _cse574 = _cse143*_cse233
+    _cse575 = _cse137*_cse233
+    _cse576 = 0.517383113*_cse137*_cse233 + 0.517383113*_cse139*_cse236 - 0.855753802*_cse572 - 0.855753802*_cse574
+    _cse577 = -_cse233*_cse445 - _cse236*_cse443 + 0.458851168*_cse572 + 0.758601438*_cse573 + 0.458851168*_cse574 + 0.758601438*_cse575
+    _cse578 = 0.5*_cse136*_cse577 + 0.5*_cse155*_cse576 - _cse233*_cse495 + 0.5*_cse233*_cse82 - _cse236*_cse494 + 0.5*_cse236*_cse73 - 0.005421351159145*_cse572 - 0.00945963566125*_cse573 - 0.005421351159145*_cse574 - 0.00945963566125*_cse575
+    _cse579 = 0.03*_cse55
+    _cse580 = 0.03*_cse58
+    _cse581 = _cse579 - _cse580
+    _cse582 = _cse299*_cse564 + _cse300*_cse561 + _cse313*_cse578 + _cse314*_cse571 + _cse581
+    _cse583 = _cse390*_cse547 - _cse391*_cse550 - _cse396*_cse457 + _cse400*_cse467 + _cse410*_cse548 - _cse411*_cse551 - _cse420*_cse460 + _cse421*_cse469
+    _cse584 = 0.574238819026787*_cse97
+    _cse585 = 0.574238819026787*_cse95
+    _cse586 = 0.239041914*_cse164 + 0.239041914*_cse165 + 0.3960285*_cse166 + 0.3960285*_cse167 + 0.408002994597976*_cse168 - 0.408002994597976*_cse169 - _cse584 + _cse585
+    _cse587 = 0.02*_cse1
+    _cse588 = _cse586*_cse587
+    _cse589 = _cse394*_cse71
+    _cse590 = _cse392*_cse72
+    _cse591 = 0.3960285*_cse437 + 0.239041914*_cse438 + 0.3960285*_cse439 + 0.239041914*_cse440 + _cse584 - _cse585 + 0.408002994597976*_cse589 - 0.408002994597976*_cse590
+    _cse592 = _cse587*_cse591
+    _cse593 = _cse588 + _cse592
+    _cse594 = _cse433*_cse548 + _cse450*_cse469 - _cse451*_cse551 - _cse452*_cse460
+    _cse595 = _cse135*_cse285
+    _cse596 = _cse155*_cse283
+    _cse597 = 0.5*_cse595 + 0.5*_cse596
+    _cse598 = _cse135*_cse265
+    _cse599 = _cse155*_cse260
+    _cse600 = 0.5*_cse598 + 0.5*_cse599
+    _cse601 = 6.57617443000635e-7*_cse62 + 6.57617443000635e-7*_cse65
+    _cse602 = -_cse601
+    _cse603 = _cse602*_cse72
+    _cse604 = 0.00816005989195952*_cse603
+    _cse605 = 0.999999998572139*_cse62 + 0.999999998572139*_cse65
+    _cse606 = -_cse605
+    _cse607 = _cse606*_cse71
+    _cse608 = 0.00816005989195952*_cse607
+    _cse609 = _cse143*_cse606
+    _cse610 = 0.00478083828*_cse609
+    _cse611 = _cse145*_cse602
+    _cse612 = 0.00478083828*_cse611
+    _cse613 = _cse137*_cse606
+    _cse614 = 0.00792057*_cse613
+    _cse615 = _cse140*_cse602
+    _cse616 = 0.00792057*_cse615
+    _cse617 = 0.0114847763805357*_cse55
+    _cse618 = 0.0114847763805357*_cse58
+    _cse619 = _cse617 - _cse618
+    _cse620 = _cse313*_cse600 + _cse314*_cse597 + _cse604 - _cse608 - _cse610 - _cse612 - _cse614 - _cse616 + _cse619
+    _cse621 = 0.329365488408814*_cse97
+    _cse622 = 0.329365488408814*_cse95
+    _cse623 = 0.410149995883665*_cse133
+    _cse624 = -0.78972966*_cse133 + 0.45479896*_cse134
+    _cse625 = 0.410879747*_cse624
+    _cse626 = 0.40329059*_cse133 + 0.89059413*_cse134
+    _cse627 = 0.209584432*_cse626
+    _cse628 = 0.410149995883665*_cse134
+    _cse629 = 0.45479896*_cse133 + 0.78972966*_cse134
+    _cse630 = 0.410879747*_cse629
+    _cse631 = 0.89059413*_cse133 - 0.40329059*_cse134
+    _cse632 = 0.209584432*_cse631
+    _cse633 = 0.137106991283212*_cse164 + 0.137106991283212*_cse165 + 0.227149603970304*_cse166 + 0.227149603970304*_cse167 + 0.234017800844203*_cse168 - 0.234017800844203*_cse169 - _cse173*_cse628 - _cse173*_cse630 + _cse173*_cse632 + _cse177*_cse623 - _cse177*_cse625 + _cse177*_cse627 - _cse621 + _cse622
+    _cse634 = 0.01*_cse1
+    _cse635 = _cse633*_cse634
+    _cse636 = 0.227149603970304*_cse437 + 0.137106991283212*_cse438 + 0.227149603970304*_cse439 + 0.137106991283212*_cse440 + _cse441*_cse623 - _cse441*_cse625 + _cse441*_cse627 - _cse448*_cse628 - _cse448*_cse630 + _cse448*_cse632 + 0.234017800844203*_cse589 - 0.234017800844203*_cse590 + _cse621 - _cse622
+    _cse637 = _cse634*_cse636
+    _cse638 = -_cse635 - _cse637
+    _cse639 = -_cse156 + _cse158
+    _cse640 = 0.517383113*_cse137*_cse606 + 0.517383113*_cse140*_cse602 - 0.855753802*_cse609 - 0.855753802*_cse611 - _cse639
+    _cse641 = 0.00209584432*_cse626
+    _cse642 = _cse148 - _cse150 + _cse443*_cse602 - _cse445*_cse606 + 0.458851168*_cse609 + 0.458851168*_cse611 + 0.758601438*_cse613 + 0.758601438*_cse615
+    _cse643 = 0.00209584432*_cse631
+    _cse644 = 0.00410149995883665*_cse133
+    _cse645 = 0.00329365488408814*_cse58
+    _cse646 = 0.00329365488408814*_cse55
+    _cse647 = -0.00410149995883665*_cse134*_cse642 - 0.00234017800844203*_cse602*_cse72 + 0.00234017800844203*_cse607 + 0.00137106991283212*_cse609 + 0.00137106991283212*_cse611 + 0.00227149603970304*_cse613 + 0.00227149603970304*_cse615 - 0.00410879747*_cse624*_cse640 - 0.00410879747*_cse629*_cse642 + _cse640*_cse641 + _cse640*_cse644 + _cse642*_cse643 + _cse645 - _cse646
+    _cse648 = _cse357*_cse52
+    _cse649 = _cse54*_cse546
+    _cse650 = _cse128*_cse369
+    _cse651 = 0.5*_cse365
+    _cse652 = _cse132*_cse651
+    _cse653 = _cse186*_cse386
+    _cse654 = 0.5*_cse383
+    _cse655 = _cse204*_cse654
+    _cse656 = -_cse352
+    _cse657 = -_cse342 - _cse362
+    _cse658 = 0.5*_cse371
+    _cse659 = -_cse343 - _cse372
+    _cse660 = 0.5*_cse387
+    _cse661 = _cse108*_cse657 + _cse130*_cse658 + _cse180*_cse659 + _cse201*_cse660 + _cse44*_cse656 + _cse53*_cse549
+    _cse662 = _cse225*_cse549 + _cse249*_cse658 + _cse288*_cse660 - _cse321*_cse546 - _cse333*_cse651 - _cse344*_cse654 - _cse357*_cse464 - _cse369*_cse467 - _cse386*_cse469 + _cse454*_cse656 + _cse457*_cse657 + _cse460*_cse659
+    _cse663 = -_cse27
+    _cse664 = _cse217*_cse663
+    _cse665 = _cse518 + 0.5*_cse664
+    _cse666 = _cse24*_cse663
+    _cse667 = 0.5*_cse666
+    _cse668 = -_cse515 - _cse667
+    _cse669 = _cse102*_cse74
+    _cse670 = _cse104*_cse82
+    _cse671 = _cse665 + 0.5*_cse669 + 0.5*_cse670 - _cse91 - _cse93 - _cse96 + _cse98
+    _cse672 = _cse536 - _cse667
+    _cse673 = _cse482 + _cse672
+    _cse674 = 0.5*_cse1*_cse663*_cse8 - _cse485 - _cse504 - _cse527
+    _cse675 = _cse496 + _cse672
+    _cse676 = _cse352*_cse546
+    _cse677 = _cse357*_cse549
+    _cse678 = _cse363*_cse651
+    _cse679 = _cse369*_cse658
+    _cse680 = _cse374*_cse654
+    _cse681 = _cse386*_cse660
+    _cse682 = _cse356*_cse549 + _cse368*_cse658 + _cse385*_cse660 + _cse546*_cse656 + _cse651*_cse657 + _cse654*_cse659
+    _cse683 = -_cse556 - _cse557
+    _cse684 = _cse294*_cse73
+    _cse685 = _cse292*_cse82
+    _cse686 = 0.5*_cse684 + 0.5*_cse685
+    _cse687 = _cse232*_cse82
+    _cse688 = _cse235*_cse73
+    _cse689 = 0.5*_cse687 + 0.5*_cse688
+    _cse690 = _cse294*_cse403
+    _cse691 = _cse139*_cse294
+    _cse692 = _cse143*_cse292
+    _cse693 = _cse137*_cse292
+    _cse694 = 0.517383113*_cse137*_cse292 + 0.517383113*_cse139*_cse294 - 0.855753802*_cse690 - 0.855753802*_cse692
+    _cse695 = -_cse292*_cse445 - _cse294*_cse443 + 0.458851168*_cse690 + 0.758601438*_cse691 + 0.458851168*_cse692 + 0.758601438*_cse693
+    _cse696 = 0.5*_cse136*_cse695 + 0.5*_cse155*_cse694 - _cse292*_cse495 + 0.5*_cse292*_cse82 - _cse294*_cse494 + 0.5*_cse294*_cse73 - 0.005421351159145*_cse690 - 0.00945963566125*_cse691 - 0.005421351159145*_cse692 - 0.00945963566125*_cse693
+    _cse697 = _cse143*_cse232
+    _cse698 = _cse137*_cse232
+    _cse699 = _cse235*_cse403
+    _cse700 = _cse139*_cse235
+    _cse701 = 0.517383113*_cse137*_cse232 + 0.517383113*_cse139*_cse235 - 0.855753802*_cse697 - 0.855753802*_cse699
+    _cse702 = -_cse232*_cse445 - _cse235*_cse443 + 0.458851168*_cse697 + 0.758601438*_cse698 + 0.458851168*_cse699 + 0.758601438*_cse700
+    _cse703 = 0.5*_cse136*_cse702 + 0.5*_cse155*_cse701 - _cse232*_cse495 + 0.5*_cse232*_cse82 - _cse235*_cse494 + 0.5*_cse235*_cse73 - 0.005421351159145*_cse697 - 0.00945963566125*_cse698 - 0.005421351159145*_cse699 - 0.00945963566125*_cse700
+    _cse704 = -_cse579 + _cse580
+    _cse705 = _cse299*_cse689 + _cse300*_cse686 + _cse313*_cse703 + _cse314*_cse696 + _cse704
+    _cse706 = 0.5*_cse390
+    _cse707 = 0.5*_cse659
+    _cse708 = 0.5*_cse391
+    _cse709 = 0.5*_cse386
+    _cse710 = -_cse369*_cse708 - _cse396*_cse651 + _cse400*_cse658 + _cse410*_cse707 - _cse411*_cse709 - _cse420*_cse654 + _cse421*_cse660 + _cse657*_cse706
+    _cse711 = _cse451*_cse709
+    _cse712 = _cse452*_cse654
+    _cse713 = _cse135*_cse309
+    _cse714 = _cse155*_cse307
+    _cse715 = 0.5*_cse713 + 0.5*_cse714
+    _cse716 = _cse135*_cse382
+    _cse717 = _cse155*_cse381
+    _cse718 = 0.5*_cse716 + 0.5*_cse717
+    _cse719 = _cse605*_cse71
+    _cse720 = _cse143*_cse605
+    _cse721 = _cse145*_cse601
+    _cse722 = _cse137*_cse605
+    _cse723 = _cse140*_cse601
+    _cse724 = _cse601*_cse72
+    _cse725 = _cse619 + 0.00816005989195952*_cse719 + 0.00478083828*_cse720 + 0.00478083828*_cse721 + 0.00792057*_cse722 + 0.00792057*_cse723 - 0.00816005989195952*_cse724
+    _cse726 = -1.0*_cse185*_cse718 - 1.0*_cse204*_cse715 + _cse725
+    _cse727 = _cse635 + _cse637
+    _cse728 = _cse639 - 0.855753802*_cse720 - 0.855753802*_cse721 + 0.517383113*_cse722 + 0.517383113*_cse723
+    _cse729 = -_cse148 + _cse150 + _cse443*_cse601 - _cse445*_cse605 + 0.458851168*_cse720 + 0.458851168*_cse721 + 0.758601438*_cse722 + 0.758601438*_cse723
+    _cse730 = -0.00410149995883665*_cse134*_cse729 - 0.00234017800844203*_cse601*_cse72 - 0.00410879747*_cse624*_cse728 - 0.00410879747*_cse629*_cse729 + _cse641*_cse728 + _cse643*_cse729 + _cse644*_cse728 - _cse645 + _cse646 + 0.00234017800844203*_cse719 + 0.00137106991283212*_cse720 + 0.00137106991283212*_cse721 + 0.00227149603970304*_cse722 + 0.00227149603970304*_cse723
+    _cse731 = _cse128*_cse399
+    _cse732 = _cse132*_cse706
+    _cse733 = _cse186*_cse430
+    _cse734 = 0.5*_cse410
+    _cse735 = _cse204*_cse734
+    _cse736 = _cse397 + _cse398
+    _cse737 = _cse103*_cse82 + _cse105*_cse73 + _cse136*_cse429 + _cse155*_cse428 - 0.0315500189858492*_cse422 - 0.0315500189858492*_cse423 - 0.01084270231829*_cse424 - 0.01084270231829*_cse425 - 0.0189192713225*_cse426 - 0.0189192713225*_cse427
+    _cse738 = 0.5*_cse411
+    _cse739 = _cse108*_cse736 + _cse130*_cse708 + _cse180*_cse737 + _cse201*_cse738
+    _cse740 = -0.02*_cse1*_cse25*_cse8 + 0.02*_cse97
+    _cse741 = -_cse740
+    _cse742 = 1.5*_cse1
+    _cse743 = _cse741*_cse742
+    _cse744 = _cse740*_cse742
+    _cse745 = _cse743 + _cse744
+    _cse746 = _cse249*_cse708 + _cse288*_cse738 - _cse333*_cse706 - _cse344*_cse734 - _cse399*_cse467 - _cse430*_cse469 + _cse457*_cse736 + _cse460*_cse737
+    _cse747 = -_cse743 - _cse744
+    _cse748 = -_cse363*_cse706 + _cse368*_cse708 - _cse374*_cse734 + _cse385*_cse738 - _cse399*_cse658 - _cse430*_cse660 + _cse651*_cse736 + _cse654*_cse737
+    _cse749 = _cse73*_cse78
+    _cse750 = _cse81*_cse85
+    _cse751 = 0.5*_cse749 + 0.5*_cse750
+    _cse752 = _cse392*_cse73
+    _cse753 = _cse394*_cse81
+    _cse754 = 0.5*_cse752 + 0.5*_cse753
+    _cse755 = _cse403*_cse78
+    _cse756 = -_cse137
+    _cse757 = _cse756*_cse85
+    _cse758 = -_cse143
+    _cse759 = _cse758*_cse85
+    _cse760 = _cse139*_cse78
+    _cse761 = 0.517383113*_cse139*_cse78 - 0.855753802*_cse755 + 0.517383113*_cse756*_cse85 - 0.855753802*_cse759
+    _cse762 = -_cse194 + _cse195 + 0.458851168*_cse755 + 0.758601438*_cse757 + 0.458851168*_cse759 + 0.758601438*_cse760
+    _cse763 = 0.5*_cse136*_cse762 + 0.5*_cse155*_cse761 + _cse192 - _cse200 + 0.5*_cse73*_cse78 - 0.005421351159145*_cse755 - 0.00945963566125*_cse757 - 0.005421351159145*_cse759 - 0.00945963566125*_cse760 + 0.5*_cse81*_cse85
+    _cse764 = _cse392*_cse403
+    _cse765 = _cse394*_cse756
+    _cse766 = _cse394*_cse758
+    _cse767 = _cse139*_cse392
+    _cse768 = 0.517383113*_cse139*_cse392 + 0.517383113*_cse394*_cse756 - 0.855753802*_cse764 - 0.855753802*_cse766
+    _cse769 = -_cse444 + _cse446 + 0.458851168*_cse764 + 0.758601438*_cse765 + 0.458851168*_cse766 + 0.758601438*_cse767
+    _cse770 = 0.5*_cse136*_cse769 + 0.5*_cse155*_cse768 - _cse392*_cse494 + 0.5*_cse392*_cse73 + 0.0157750094929246*_cse394*_cse71 + 0.5*_cse394*_cse81 - 0.005421351159145*_cse764 - 0.00945963566125*_cse765 - 0.005421351159145*_cse766 - 0.00945963566125*_cse767
+    _cse771 = _cse399*_cse708
+    _cse772 = _cse396*_cse706
+    _cse773 = _cse430*_cse738
+    _cse774 = _cse420*_cse734
+    _cse775 = 0.02*_cse0*_cse25*_cse8 - 0.02*_cse59
+    _cse776 = 1.5*_cse775
+    _cse777 = _cse554*_cse776
+    _cse778 = _cse553*_cse776
+    _cse779 = _cse0*_cse25*_cse8 - _cse59
+    _cse780 = 1.5*_cse779
+    _cse781 = _cse741*_cse780
+    _cse782 = _cse740*_cse780
+    _cse783 = _cse400*_cse708 + _cse421*_cse738 + _cse706*_cse736 + _cse734*_cse737
+    _cse784 = 0.5*_cse451
+    _cse785 = _cse430*_cse784
+    _cse786 = _cse452*_cse734
+    _cse787 = 0.239041914*_cse187 + 0.239041914*_cse188 + 0.3960285*_cse189 + 0.3960285*_cse190 + 0.408002994597976*_cse191 - 0.408002994597976*_cse193 + 0.574238819026787*_cse56 - 0.574238819026787*_cse59
+    _cse788 = 1.0*_cse787
+    _cse789 = _cse741*_cse788
+    _cse790 = _cse740*_cse788
+    _cse791 = 1.0*_cse775
+    _cse792 = _cse586*_cse791
+    _cse793 = _cse591*_cse791
+    _cse794 = _cse135*_cse408
+    _cse795 = _cse155*_cse409
+    _cse796 = 0.5*_cse794 + 0.5*_cse795
+    _cse797 = _cse135*_cse418
+    _cse798 = _cse155*_cse419
+    _cse799 = 0.5*_cse797 + 0.5*_cse798
+    _cse800 = -0.999999998572139*_cse25*_cse8 + 0.999999998572139*_cse58
+    _cse801 = -_cse800
+    _cse802 = _cse72*_cse801
+    _cse803 = -6.57617443000635e-7*_cse25*_cse8 + 6.57617443000635e-7*_cse58
+    _cse804 = -_cse803
+    _cse805 = _cse71*_cse804
+    _cse806 = _cse403*_cse801
+    _cse807 = _cse139*_cse801
+    _cse808 = _cse143*_cse804
+    _cse809 = _cse137*_cse804
+    _cse810 = 0.00816005989195952*_cse802 + 0.00816005989195952*_cse805 + 0.00478083828*_cse806 + 0.00792057*_cse807 + 0.00478083828*_cse808 + 0.00792057*_cse809
+    _cse811 = -1.0*_cse185*_cse796 - 1.0*_cse204*_cse799 + _cse810
+    _cse812 = 0.0685534956416061*_cse187 + 0.0685534956416061*_cse188 + 0.113574801985152*_cse189 + 0.113574801985152*_cse190 + 0.117008900422102*_cse191 - 0.117008900422102*_cse193 - 0.5*_cse197*_cse628 - 0.5*_cse197*_cse630 + 0.5*_cse197*_cse632 + 0.5*_cse199*_cse623 - 0.5*_cse199*_cse625 + 0.5*_cse199*_cse627 + 0.164682744204407*_cse56 - 0.164682744204407*_cse59
+    _cse813 = _cse741*_cse812
+    _cse814 = _cse740*_cse812
+    _cse815 = 0.5*_cse775
+    _cse816 = _cse633*_cse815
+    _cse817 = _cse636*_cse815
+    _cse818 = 0.517383113*_cse137*_cse804 + 0.517383113*_cse139*_cse801 - 0.855753802*_cse806 - 0.855753802*_cse808
+    _cse819 = -_cse443*_cse801 - _cse445*_cse804 + 0.458851168*_cse806 + 0.758601438*_cse807 + 0.458851168*_cse808 + 0.758601438*_cse809
+    _cse820 = -0.00410149995883665*_cse134*_cse819 - 0.00410879747*_cse624*_cse818 - 0.00410879747*_cse629*_cse819 + _cse641*_cse818 + _cse643*_cse819 + _cse644*_cse818 + 0.00234017800844203*_cse802 + 0.00234017800844203*_cse805 + 0.00137106991283212*_cse806 + 0.00227149603970304*_cse807 + 0.00137106991283212*_cse808 + 0.00227149603970304*_cse809
+    _cse821 = _cse186*_cse436
+    _cse822 = 0.5*_cse433
+    _cse823 = _cse204*_cse822
+    _cse824 = _cse434 + _cse435
+    _cse825 = _cse180*_cse824 + _cse201*_cse784
+    _cse826 = _cse436*_cse469
+    _cse827 = _cse344*_cse822
+    _cse828 = 0.0114847763805357*_cse97
+    _cse829 = 0.0114847763805357*_cse95
+    _cse830 = 0.00478083828*_cse164 + 0.00478083828*_cse165 + 0.00792057*_cse166 + 0.00792057*_cse167 + 0.00816005989195952*_cse168 - 0.00816005989195952*_cse169 - _cse828 + _cse829
+    _cse831 = 1.0*_cse1
+    _cse832 = _cse830*_cse831
+    _cse833 = 0.00792057*_cse437 + 0.00478083828*_cse438 + 0.00792057*_cse439 + 0.00478083828*_cse440 + 0.00816005989195952*_cse589 - 0.00816005989195952*_cse590 + _cse828 - _cse829
+    _cse834 = _cse831*_cse833
+    _cse835 = _cse832 + _cse834
+    _cse836 = _cse374*_cse822 - 0.5*_cse383*_cse824 - 0.5*_cse385*_cse451 + _cse436*_cse660
+    _cse837 = _cse0*_cse617 - _cse0*_cse618 + 0.00478083828*_cse187 + 0.00478083828*_cse188 + 0.00792057*_cse189 + 0.00792057*_cse190 + 0.00816005989195952*_cse191 - 0.00816005989195952*_cse193
+    _cse838 = 1.0*_cse837
+    _cse839 = 1.0*_cse779
+    _cse840 = _cse553*_cse838 + _cse554*_cse838 + _cse830*_cse839 + _cse833*_cse839
+    _cse841 = -0.5*_cse410*_cse824 + _cse420*_cse822 - 0.5*_cse421*_cse451 + _cse436*_cse738
+    _cse842 = _cse154*_cse199
+    _cse843 = _cse135*_cse197
+    _cse844 = 0.5*_cse842 + 0.5*_cse843
+    _cse845 = _cse154*_cse441
+    _cse846 = _cse135*_cse448
+    _cse847 = 0.5*_cse845 + 0.5*_cse846
+    _cse848 = _cse586*_cse838 + _cse591*_cse838 + _cse788*_cse830 + _cse788*_cse833
+    _cse849 = _cse436*_cse784 + _cse452*_cse822 + _cse848
+    _cse850 = 0.5*_cse837
+    _cse851 = _cse633*_cse850 + _cse636*_cse850 + _cse812*_cse830 + _cse812*_cse833
+    _cse852 = _cse143*_cse801
+    _cse853 = _cse145*_cse804
+    _cse854 = _cse262 + _cse263
+    _cse855 = 0.517383113*_cse137*_cse801 + 0.517383113*_cse140*_cse804 - 0.855753802*_cse852 - 0.855753802*_cse853 - _cse854
+    _cse856 = -_cse631
+    _cse857 = _cse855*_cse856
+    _cse858 = 0.00209584432*_cse857
+    _cse859 = _cse445*_cse801
+    _cse860 = _cse443*_cse804
+    _cse861 = _cse137*_cse801
+    _cse862 = _cse140*_cse804
+    _cse863 = _cse250 + _cse252 + 0.458851168*_cse852 + 0.458851168*_cse853 - _cse859 + _cse860 + 0.758601438*_cse861 + 0.758601438*_cse862
+    _cse864 = _cse641*_cse863
+    _cse865 = 0.00410149995883665*_cse134*_cse855
+    _cse866 = _cse644*_cse863
+    _cse867 = -_cse629
+    _cse868 = -0.00410879747*_cse624*_cse863 - 0.00410879747*_cse855*_cse867 + _cse858 + _cse864 + _cse865 + _cse866
+    _cse869 = 0.00658730976817627*_cse97
+    _cse870 = 0.00658730976817627*_cse95
+    _cse871 = 0.00820299991767329*_cse133
+    _cse872 = 0.00821759494*_cse624
+    _cse873 = 0.00419168864*_cse626
+    _cse874 = 0.00820299991767329*_cse134
+    _cse875 = 0.00821759494*_cse629
+    _cse876 = 0.00419168864*_cse631
+    _cse877 = 0.00274213982566424*_cse164 + 0.00274213982566424*_cse165 + 0.00454299207940609*_cse166 + 0.00454299207940609*_cse167 + 0.00468035601688406*_cse168 - 0.00468035601688406*_cse169 - _cse173*_cse874 - _cse173*_cse875 + _cse173*_cse876 + _cse177*_cse871 - _cse177*_cse872 + _cse177*_cse873 - _cse869 + _cse870
+    _cse878 = _cse517*_cse877
+    _cse879 = 0.00454299207940609*_cse437 + 0.00274213982566424*_cse438 + 0.00454299207940609*_cse439 + 0.00274213982566424*_cse440 + _cse441*_cse871 - _cse441*_cse872 + _cse441*_cse873 - _cse448*_cse874 - _cse448*_cse875 + _cse448*_cse876 + 0.00468035601688406*_cse589 - 0.00468035601688406*_cse590 + _cse869 - _cse870
+    _cse880 = _cse517*_cse879
+    _cse881 = _cse647 - _cse878 - _cse880
+    _cse882 = _cse730 + _cse878 + _cse880
+    _cse883 = 0.00137106991283212*_cse187 + 0.00137106991283212*_cse188 + 0.00227149603970304*_cse189 + 0.00227149603970304*_cse190 + 0.00234017800844203*_cse191 - 0.00234017800844203*_cse193 - 0.5*_cse197*_cse874 - 0.5*_cse197*_cse875 + 0.5*_cse197*_cse876 + 0.5*_cse199*_cse871 - 0.5*_cse199*_cse872 + 0.5*_cse199*_cse873 + 0.00329365488408814*_cse56 - 0.00329365488408814*_cse59
+    _cse884 = 0.5*_cse779
+    _cse885 = _cse553*_cse883 + _cse554*_cse883 + _cse820 + _cse877*_cse884 + _cse879*_cse884
+    _cse886 = 0.5*_cse787
+    _cse887 = _cse586*_cse883 + _cse591*_cse883 + _cse868 + _cse877*_cse886 + _cse879*_cse886
+    _cse888 = _cse633*_cse883 + _cse636*_cse883 + _cse812*_cse877 + _cse812*_cse879
+    _cse889 = 1.0*_cse317
+    _cse890 = 1.0*_cse321
+    _cse891 = 1.0*_cse327
+    _cse892 = 1.0*_cse333
+    _cse893 = 1.0*_cse337
+    _cse894 = 1.0*_cse344
+    _cse895 = _cse355*_cse890 + _cse357*_cse889 + _cse365*_cse892 + _cse369*_cse891 + _cse383*_cse894 + _cse386*_cse893
+    _cse896 = _cse390*_cse892 + _cse399*_cse891 + _cse410*_cse894 + _cse430*_cse893 + _cse704 + _cse747
+    _cse897 = -_cse604 + _cse608 + _cse610 + _cse612 + _cse614 + _cse616 - _cse617 + _cse618
+    _cse898 = _cse433*_cse894 + _cse436*_cse893 - _cse832 - _cse834 + _cse897
+    _cse899 = _cse34 + _cse471
+    _cse900 = 0.5*_cse476
+    _cse901 = _cse473 + _cse49
+    _cse902 = -0.5*_cse901
+    _cse903 = _cse478 + _cse480
+    _cse904 = _cse61 + _cse903
+    _cse905 = _cse68 + _cse899
+    _cse906 = _cse904 + _cse905
+    _cse907 = 0.5*_cse487
+    _cse908 = -_cse102*_cse74 - _cse104*_cse82
+    _cse909 = _cse901 + _cse908
+    _cse910 = -0.5*_cse125 - 0.5*_cse909
+    _cse911 = 0.0315500189858492*_cse72
+    _cse912 = 0.0315500189858492*_cse71
+    _cse913 = _cse161 + _cse477*_cse911 - _cse479*_cse912 - 0.0189192713225*_cse488 - 0.0189192713225*_cse489 - 0.01084270231829*_cse490 - 0.01084270231829*_cse491 + _cse492 + _cse493 + _cse903
+    _cse914 = _cse905 + _cse913
+    _cse915 = 0.5*_cse505
+    _cse916 = -0.0315500189858492*_cse102*_cse72 + _cse104*_cse912 - _cse136*_cse502 - _cse155*_cse503 + _cse184 + 0.01084270231829*_cse498 + 0.01084270231829*_cse499 + 0.0189192713225*_cse500 + 0.0189192713225*_cse501
+    _cse917 = -0.5*_cse121 - 0.5*_cse909 - 0.5*_cse916
+    _cse918 = 0.25*_cse207*(0.41804*_cse7 + 0.0039038*_cse8)
+    _cse919 = _cse28 + _cse32 + 0.41405*_cse7 + 0.001950802*_cse8
+    _cse920 = 0.000975401*_cse7
+    _cse921 = 0.5*_cse211
+    _cse922 = 0.5*_cse208 + 0.207025*_cse8 - _cse920 - _cse921
+    _cse923 = 0.5*_cse922
+    _cse924 = 0.5*_cse28
+    _cse925 = 0.5*_cse32 + 0.207025*_cse7 + 0.000975401*_cse8 + _cse924
+    _cse926 = 0.001950802*_cse7
+    _cse927 = _cse208 - _cse211 + 0.41405*_cse8 - _cse926
+    _cse928 = 0.5*_cse927
+    _cse929 = 0.1592*_cse55
+    _cse930 = 0.1592*_cse58
+    _cse931 = _cse602*_cse74
+    _cse932 = _cse606*_cse82
+    _cse933 = _cse63 + _cse66
+    _cse934 = _cse919 + _cse931 + _cse932 + _cse933
+    _cse935 = _cse929 - _cse930 + _cse934
+    _cse936 = _cse74*_cse803
+    _cse937 = _cse800*_cse82
+    _cse938 = 0.0019453336699499*_cse55
+    _cse939 = 0.0019453336699499*_cse58
+    _cse940 = -_cse226 - _cse227 + 0.5*_cse936 + 0.5*_cse937 + _cse938 - _cse939
+    _cse941 = _cse922 + _cse940
+    _cse942 = 0.5*_cse941
+    _cse943 = 0.0796*_cse55
+    _cse944 = 0.0796*_cse58
+    _cse945 = _cse90 + _cse92
+    _cse946 = _cse925 + 0.5*_cse931 + 0.5*_cse932 + _cse945
+    _cse947 = _cse943 - _cse944 + _cse946
+    _cse948 = 0.0038906673398998*_cse55
+    _cse949 = 0.0038906673398998*_cse58
+    _cse950 = -_cse322 - _cse323 + _cse936 + _cse937 + _cse948 - _cse949
+    _cse951 = 0.5*_cse927 + 0.5*_cse950
+    _cse952 = _cse136*_cse642
+    _cse953 = _cse155*_cse640
+    _cse954 = 0.210033941789101*_cse55 - 0.210033941789101*_cse58
+    _cse955 = 0.0315500189858492*_cse603 - 0.0315500189858492*_cse607 - 0.01084270231829*_cse609 - 0.01084270231829*_cse611 - 0.0189192713225*_cse613 - 0.0189192713225*_cse615 + _cse934 + _cse952 + _cse953 + _cse954
+    _cse956 = _cse143*_cse800
+    _cse957 = _cse145*_cse803
+    _cse958 = _cse137*_cse800
+    _cse959 = _cse140*_cse803
+    _cse960 = -_cse250 - _cse252 + _cse443*_cse803 - _cse445*_cse800 + 0.458851168*_cse956 + 0.458851168*_cse957 + 0.758601438*_cse958 + 0.758601438*_cse959
+    _cse961 = _cse854 - 0.855753802*_cse956 - 0.855753802*_cse957 + 0.517383113*_cse958 + 0.517383113*_cse959
+    _cse962 = -_cse938 + _cse939
+    _cse963 = _cse267 + _cse268
+    _cse964 = -0.5*_cse136*_cse960 - 0.5*_cse155*_cse961 + _cse495*_cse800 - 0.0157750094929246*_cse72*_cse803 - 0.5*_cse74*_cse803 - 0.5*_cse800*_cse82 + 0.005421351159145*_cse956 + 0.005421351159145*_cse957 + 0.00945963566125*_cse958 + 0.00945963566125*_cse959 + _cse962 + _cse963
+    _cse965 = 0.5*_cse31*_cse8 + 0.207025*_cse8 - _cse920 - _cse921 - _cse964
+    _cse966 = 0.5*_cse965
+    _cse967 = 0.10501697089455*_cse55 - 0.10501697089455*_cse58
+    _cse968 = _cse494*_cse602 - _cse495*_cse606 - 0.005421351159145*_cse609 - 0.005421351159145*_cse611 - 0.00945963566125*_cse613 - 0.00945963566125*_cse615 + _cse946 + 0.5*_cse952 + 0.5*_cse953 + _cse967
+    _cse969 = -_cse948 + _cse949
+    _cse970 = _cse334 + _cse335
+    _cse971 = -_cse136*_cse960 - _cse155*_cse961 - 0.0315500189858492*_cse72*_cse803 - _cse74*_cse803 - _cse800*_cse82 + _cse800*_cse912 + 0.01084270231829*_cse956 + 0.01084270231829*_cse957 + 0.0189192713225*_cse958 + 0.0189192713225*_cse959 + _cse969 + _cse970
+    _cse972 = -0.5*_cse211 + 0.5*_cse31*_cse8 + 0.207025*_cse8 - 0.5*_cse926 - 0.5*_cse971
+    _cse973 = 0.5*_cse350
+    _cse974 = _cse921 + _cse973
+    _cse975 = _cse919*_cse974
+    _cse976 = _cse514 - _cse924
+    _cse977 = -_cse28 + _cse513
+    _cse978 = _cse74*_cse804
+    _cse979 = _cse801*_cse82
+    _cse980 = _cse962 + _cse974 + 0.5*_cse978 + 0.5*_cse979
+    _cse981 = _cse226 + _cse227 + _cse980
+    _cse982 = 1.0*_cse935
+    _cse983 = _cse601*_cse74
+    _cse984 = _cse605*_cse82
+    _cse985 = -_cse90 - _cse92 - _cse943 + _cse944 + _cse976 + 0.5*_cse983 + 0.5*_cse984
+    _cse986 = -_cse63 - _cse66 - _cse929 + _cse930 + _cse977 + _cse983 + _cse984
+    _cse987 = _cse136*_cse863
+    _cse988 = _cse155*_cse855
+    _cse989 = _cse494*_cse804 - _cse495*_cse801
+    _cse990 = -0.005421351159145*_cse852 - 0.005421351159145*_cse853 - 0.00945963566125*_cse861 - 0.00945963566125*_cse862 + _cse963 + _cse980 + 0.5*_cse987 + 0.5*_cse988 + _cse989
+    _cse991 = 1.0*_cse955
+    _cse992 = _cse136*_cse729 + _cse155*_cse728 - _cse28 + _cse30*_cse7 + 0.0315500189858492*_cse601*_cse72 + _cse601*_cse74 + _cse605*_cse82 - 0.0315500189858492*_cse719 - 0.01084270231829*_cse720 - 0.01084270231829*_cse721 - 0.0189192713225*_cse722 - 0.0189192713225*_cse723 - _cse933 - _cse954
+    _cse993 = 0.5*_cse136*_cse729 + 0.5*_cse155*_cse728 + 0.5*_cse30*_cse7 - _cse495*_cse605 + 0.0157750094929246*_cse601*_cse72 + 0.5*_cse601*_cse74 + 0.5*_cse605*_cse82 - 0.005421351159145*_cse720 - 0.005421351159145*_cse721 - 0.00945963566125*_cse722 - 0.00945963566125*_cse723 - _cse924 - _cse945 - _cse967
+    _cse994 = _cse73*_cse801
+    _cse995 = _cse804*_cse82
+    _cse996 = 0.5*_cse994 + 0.5*_cse995
+    _cse997 = 0.5*_cse136*_cse819 + 0.5*_cse155*_cse818 - _cse494*_cse801 - _cse495*_cse804 + 0.5*_cse73*_cse801 + 0.5*_cse804*_cse82 - 0.005421351159145*_cse806 - 0.00945963566125*_cse807 - 0.005421351159145*_cse808 - 0.00945963566125*_cse809
+    _cse998 = _cse606*_cse73
+    _cse999 = _cse602*_cse82
+    _cse1000 = 0.5*_cse998 + 0.5*_cse999
+    _cse1001 = _cse403*_cse606
+    _cse1002 = _cse139*_cse606
+    _cse1003 = _cse143*_cse602
+    _cse1004 = _cse137*_cse602
+    _cse1005 = -0.855753802*_cse1001 - 0.855753802*_cse1003 + 0.517383113*_cse137*_cse602 + 0.517383113*_cse139*_cse606
+    _cse1006 = 0.458851168*_cse1001 + 0.758601438*_cse1002 + 0.458851168*_cse1003 + 0.758601438*_cse1004 - _cse443*_cse606 - _cse445*_cse602
+    _cse1007 = -0.005421351159145*_cse1001 - 0.00945963566125*_cse1002 - 0.005421351159145*_cse1003 - 0.00945963566125*_cse1004 + 0.5*_cse1005*_cse155 + 0.5*_cse1006*_cse136 - _cse494*_cse606 - _cse495*_cse602 + 0.5*_cse602*_cse82 + 0.5*_cse606*_cse73
+    _cse1008 = _cse994 + _cse995
+    _cse1009 = _cse136*_cse819 + _cse155*_cse818 + _cse73*_cse801 - 0.0315500189858492*_cse802 + _cse804*_cse82 - 0.0315500189858492*_cse805 - 0.01084270231829*_cse806 - 0.0189192713225*_cse807 - 0.01084270231829*_cse808 - 0.0189192713225*_cse809
+    _cse1010 = _cse587*_cse62 + _cse587*_cse65
+    _cse1011 = 1.5*_cse0
+    _cse1012 = _cse1010*_cse1011
+    _cse1013 = _cse0*_cse65
+    _cse1014 = _cse0*_cse62
+    _cse1015 = 0.02*_cse1013 + 0.02*_cse1014
+    _cse1016 = -_cse1015
+    _cse1017 = _cse1016*_cse742
+    _cse1018 = -_cse1012 - _cse1017
+    _cse1019 = _cse1*_cse65
+    _cse1020 = _cse1*_cse62
+    _cse1021 = _cse1019 + _cse1020
+    _cse1022 = 0.03*_cse0
+    _cse1023 = _cse1021*_cse1022
+    _cse1024 = _cse1013 + _cse1014
+    _cse1025 = -_cse1024
+    _cse1026 = _cse1025*_cse555
+    _cse1027 = _cse1023 + _cse1026
+    _cse1028 = _cse135*_cse855
+    _cse1029 = _cse155*_cse863
+    _cse1030 = 0.5*_cse1028 + 0.5*_cse1029
+    _cse1031 = _cse135*_cse640
+    _cse1032 = _cse155*_cse642
+    _cse1033 = 0.5*_cse1031 + 0.5*_cse1032
+    _cse1034 = _cse1028 + _cse1029
+    _cse1035 = 0.0114847763805357*_cse1019
+    _cse1036 = 0.0114847763805357*_cse1020
+    _cse1037 = _cse1035 + _cse1036 + 0.00478083828*_cse275 + 0.00478083828*_cse276 + 0.00792057*_cse277 + 0.00792057*_cse278 + 0.00816005989195952*_cse279 - 0.00816005989195952*_cse282
+    _cse1038 = 1.0*_cse0
+    _cse1039 = _cse1037*_cse1038
+    _cse1040 = 0.0114847763805357*_cse1013
+    _cse1041 = 0.0114847763805357*_cse1014
+    _cse1042 = -_cse1040 - _cse1041 + 0.00816005989195952*_cse254 - 0.00816005989195952*_cse255 + 0.00478083828*_cse256 + 0.00792057*_cse257 + 0.00792057*_cse258 + 0.00478083828*_cse259
+    _cse1043 = _cse1042*_cse831
+    _cse1044 = 0.574238819026787*_cse1019
+    _cse1045 = 0.574238819026787*_cse1020
+    _cse1046 = _cse1044 + _cse1045 + 0.239041914*_cse275 + 0.239041914*_cse276 + 0.3960285*_cse277 + 0.3960285*_cse278 + 0.408002994597976*_cse279 - 0.408002994597976*_cse282
+    _cse1047 = 0.02*_cse0
+    _cse1048 = 0.574238819026787*_cse1013
+    _cse1049 = 0.574238819026787*_cse1014
+    _cse1050 = -_cse1048 - _cse1049 + 0.408002994597976*_cse254 - 0.408002994597976*_cse255 + 0.239041914*_cse256 + 0.3960285*_cse257 + 0.3960285*_cse258 + 0.239041914*_cse259
+    _cse1051 = _cse1046*_cse1047 + _cse1050*_cse587
+    _cse1052 = 0.329365488408814*_cse1019
+    _cse1053 = 0.329365488408814*_cse1020
+    _cse1054 = _cse1052 + _cse1053 + 0.137106991283212*_cse275 + 0.137106991283212*_cse276 + 0.227149603970304*_cse277 + 0.227149603970304*_cse278 + 0.234017800844203*_cse279 - 0.234017800844203*_cse282 - _cse283*_cse628 - _cse283*_cse630 + _cse283*_cse632 + _cse285*_cse623 - _cse285*_cse625 + _cse285*_cse627
+    _cse1055 = 0.01*_cse0
+    _cse1056 = _cse1054*_cse1055
+    _cse1057 = 0.329365488408814*_cse1013
+    _cse1058 = 0.329365488408814*_cse1014
+    _cse1059 = -_cse1057 - _cse1058 + 0.234017800844203*_cse254 - 0.234017800844203*_cse255 + 0.137106991283212*_cse256 + 0.227149603970304*_cse257 + 0.227149603970304*_cse258 + 0.137106991283212*_cse259 - _cse260*_cse628 - _cse260*_cse630 + _cse260*_cse632 + _cse265*_cse623 - _cse265*_cse625 + _cse265*_cse627
+    _cse1060 = _cse1059*_cse634
+    _cse1061 = 0.00658730976817627*_cse1019
+    _cse1062 = 0.00658730976817627*_cse1020
+    _cse1063 = _cse1061 + _cse1062 + 0.00274213982566424*_cse275 + 0.00274213982566424*_cse276 + 0.00454299207940609*_cse277 + 0.00454299207940609*_cse278 + 0.00468035601688406*_cse279 - 0.00468035601688406*_cse282 - _cse283*_cse874 - _cse283*_cse875 + _cse283*_cse876 + _cse285*_cse871 - _cse285*_cse872 + _cse285*_cse873
+    _cse1064 = 0.5*_cse0
+    _cse1065 = 0.00658730976817627*_cse1013
+    _cse1066 = 0.00658730976817627*_cse1014
+    _cse1067 = -_cse1065 - _cse1066 + 0.00468035601688406*_cse254 - 0.00468035601688406*_cse255 + 0.00274213982566424*_cse256 + 0.00454299207940609*_cse257 + 0.00454299207940609*_cse258 + 0.00274213982566424*_cse259 - _cse260*_cse874 - _cse260*_cse875 + _cse260*_cse876 + _cse265*_cse871 - _cse265*_cse872 + _cse265*_cse873
+    _cse1068 = _cse1063*_cse1064 + _cse1067*_cse517
+    _cse1069 = _cse0*_cse513
+    _cse1070 = _cse1069 - _cse29
+    _cse1071 = _cse1*_cse513
+    _cse1072 = -0.5*_cse1071 + 0.5*_cse38
+    _cse1073 = _cse1070 + _cse520 + _cse521 - _cse57 + _cse60 - _cse64 - _cse67
+    _cse1074 = -_cse1071 + _cse121
+    _cse1075 = _cse1074 + _cse38 + _cse524 + _cse526
+    _cse1076 = 0.5*_cse1075 + 0.5*_cse124
+    _cse1077 = -_cse1069 + _cse68
+    _cse1078 = -_cse1077 + _cse136*_cse534 + _cse155*_cse535 - _cse161 - _cse29 - 0.01084270231829*_cse530 - 0.01084270231829*_cse531 - 0.0189192713225*_cse532 - 0.0189192713225*_cse533 + 0.0315500189858492*_cse72*_cse77 + _cse74*_cse77 + _cse82*_cse84 - _cse84*_cse912
+    _cse1079 = _cse1075 + _cse184 + _cse523*_cse911 - _cse525*_cse912 - 0.0189192713225*_cse538 - 0.0189192713225*_cse539 - 0.01084270231829*_cse540 - 0.01084270231829*_cse541 + _cse542 + _cse543
+    _cse1080 = 0.5*_cse1079
+    _cse1081 = 0.5*_cse519
+    _cse1082 = 0.5*_cse529
+    _cse1083 = 0.5*_cse544
+    _cse1084 = _cse1070*_cse44 + _cse1072*_cse53 + _cse1073*_cse108 + _cse1076*_cse130 + _cse1078*_cse180 + _cse1080*_cse201 - _cse1081*_cse54 - _cse1082*_cse132 - _cse1083*_cse204 - _cse128*_cse522 - _cse186*_cse537 - _cse516*_cse52
+    _cse1085 = 0.5*_cse975
+    _cse1086 = _cse464*_cse516
+    _cse1087 = _cse1081*_cse321
+    _cse1088 = 0.5*_cse981
+    _cse1089 = _cse1088*_cse935
+    _cse1090 = _cse467*_cse522
+    _cse1091 = _cse1082*_cse333
+    _cse1092 = 0.5*_cse990
+    _cse1093 = _cse1092*_cse955
+    _cse1094 = _cse469*_cse537
+    _cse1095 = _cse1083*_cse344
+    _cse1096 = _cse211 + _cse350
+    _cse1097 = 0.5*_cse1096
+    _cse1098 = _cse1096 + _cse969 + _cse978 + _cse979
+    _cse1099 = 0.5*_cse1098 + 0.5*_cse322 + 0.5*_cse323
+    _cse1100 = -_cse801*_cse912 + _cse804*_cse911
+    _cse1101 = _cse1098 + _cse1100 - 0.01084270231829*_cse852 - 0.01084270231829*_cse853 - 0.0189192713225*_cse861 - 0.0189192713225*_cse862 + _cse970 + _cse987 + _cse988
+    _cse1102 = 0.5*_cse1101
+    _cse1103 = _cse1070*_cse454 + _cse1072*_cse225 + _cse1073*_cse457 + _cse1076*_cse249 + _cse1078*_cse460 + _cse1080*_cse288 + _cse1097*_cse925 + _cse1099*_cse947 + _cse1102*_cse968
+    _cse1104 = _cse663*_cse7
+    _cse1105 = 0.5*_cse1104 - _cse973
+    _cse1106 = _cse1105*_cse919
+    _cse1107 = _cse1105 + _cse940
+    _cse1108 = 0.5*_cse663*_cse7 - _cse964 - _cse973
+    _cse1109 = _cse974*_cse977
+    _cse1110 = 0.5*_cse1109
+    _cse1111 = _cse1081*_cse352
+    _cse1112 = _cse516*_cse549
+    _cse1113 = _cse1088*_cse986
+    _cse1114 = _cse1082*_cse363
+    _cse1115 = _cse522*_cse658
+    _cse1116 = _cse1092*_cse992
+    _cse1117 = _cse1083*_cse374
+    _cse1118 = _cse537*_cse660
+    _cse1119 = _cse1070*_cse546 + _cse1072*_cse356 + _cse1073*_cse651 + _cse1076*_cse368 + _cse1078*_cse654 + _cse1080*_cse385 + _cse1097*_cse976 + _cse1099*_cse985 + _cse1102*_cse993
+    _cse1120 = _cse601*_cse82
+    _cse1121 = _cse605*_cse73
+    _cse1122 = 0.5*_cse1120 + 0.5*_cse1121
+    _cse1123 = _cse143*_cse601
+    _cse1124 = _cse137*_cse601
+    _cse1125 = _cse403*_cse605
+    _cse1126 = _cse139*_cse605
+    _cse1127 = -0.855753802*_cse1123 - 0.855753802*_cse1125 + 0.517383113*_cse137*_cse601 + 0.517383113*_cse139*_cse605
+    _cse1128 = 0.458851168*_cse1123 + 0.758601438*_cse1124 + 0.458851168*_cse1125 + 0.758601438*_cse1126 - _cse443*_cse605 - _cse445*_cse601
+    _cse1129 = -0.005421351159145*_cse1123 - 0.00945963566125*_cse1124 - 0.005421351159145*_cse1125 - 0.00945963566125*_cse1126 + 0.5*_cse1127*_cse155 + 0.5*_cse1128*_cse136 - _cse494*_cse605 - _cse495*_cse601 + 0.5*_cse601*_cse82 + 0.5*_cse605*_cse73
+    _cse1130 = _cse1015*_cse742
+    _cse1131 = -_cse1010
+    _cse1132 = _cse1011*_cse1131
+    _cse1133 = _cse1122*_cse982 + _cse1129*_cse991 - _cse1130 - _cse1132 + _cse686*_cse892 + _cse689*_cse891 + _cse696*_cse894 + _cse703*_cse893
+    _cse1134 = -_cse1008*_cse1088 - _cse1009*_cse1092 + _cse1073*_cse706 + _cse1076*_cse400 + _cse1078*_cse734 + _cse1080*_cse421 - _cse1082*_cse396 - _cse1083*_cse420 + _cse1099*_cse996 + _cse1102*_cse997 - _cse522*_cse708 - _cse537*_cse738
+    _cse1135 = _cse1034*_cse1092
+    _cse1136 = _cse537*_cse784
+    _cse1137 = _cse1083*_cse452
+    _cse1138 = _cse135*_cse728
+    _cse1139 = _cse155*_cse729
+    _cse1140 = 0.5*_cse1138 + 0.5*_cse1139
+    _cse1141 = -_cse1035 - _cse1036 + 0.00816005989195952*_cse301 - 0.00816005989195952*_cse302 + 0.00478083828*_cse303 + 0.00792057*_cse304 + 0.00792057*_cse305 + 0.00478083828*_cse306
+    _cse1142 = _cse1040 + _cse1041 + 0.00478083828*_cse375 + 0.00478083828*_cse376 + 0.00792057*_cse377 + 0.00792057*_cse378 + 0.00816005989195952*_cse379 - 0.00816005989195952*_cse380
+    _cse1143 = _cse1038*_cse1141 + _cse1142*_cse831
+    _cse1144 = -1.0*_cse1140*_cse955 + _cse1143 - 1.0*_cse337*_cse718 - 1.0*_cse344*_cse715
+    _cse1145 = -_cse1061 - _cse1062 + 0.00468035601688406*_cse301 - 0.00468035601688406*_cse302 + 0.00274213982566424*_cse303 + 0.00454299207940609*_cse304 + 0.00454299207940609*_cse305 + 0.00274213982566424*_cse306 - _cse307*_cse874 - _cse307*_cse875 + _cse307*_cse876 + _cse309*_cse871 - _cse309*_cse872 + _cse309*_cse873
+    _cse1146 = _cse1065 + _cse1066 + 0.00274213982566424*_cse375 + 0.00274213982566424*_cse376 + 0.00454299207940609*_cse377 + 0.00454299207940609*_cse378 + 0.00468035601688406*_cse379 - 0.00468035601688406*_cse380 - _cse381*_cse874 - _cse381*_cse875 + _cse381*_cse876 + _cse382*_cse871 - _cse382*_cse872 + _cse382*_cse873
+    _cse1147 = _cse1064*_cse1145 + _cse1146*_cse517
+    _cse1148 = _cse1056 + _cse1060
+    _cse1149 = _cse559 + _cse560
+    _cse1150 = 0.5*_cse1149
+    _cse1151 = _cse562 + _cse563
+    _cse1152 = _cse136*_cse570 + _cse155*_cse569 + _cse241*_cse82 - _cse241*_cse912 + _cse243*_cse73 - _cse243*_cse911 - 0.01084270231829*_cse565 - 0.0189192713225*_cse566 - 0.01084270231829*_cse567 - 0.0189192713225*_cse568
+    _cse1153 = 0.5*_cse1152
+    _cse1154 = _cse136*_cse577 + _cse155*_cse576 + _cse233*_cse82 - _cse233*_cse912 + _cse236*_cse73 - _cse236*_cse911 - 0.01084270231829*_cse572 - 0.0189192713225*_cse573 - 0.01084270231829*_cse574 - 0.0189192713225*_cse575
+    _cse1155 = 0.5*_cse561
+    _cse1156 = 0.5*_cse571
+    _cse1157 = _cse108*_cse1151 + _cse1150*_cse130 + _cse1153*_cse201 + _cse1154*_cse180 - _cse1155*_cse132 - _cse1156*_cse204 - _cse128*_cse564 - _cse186*_cse578
+    _cse1158 = 0.5*_cse1000
+    _cse1159 = _cse1158*_cse935
+    _cse1160 = _cse1155*_cse333
+    _cse1161 = _cse467*_cse564
+    _cse1162 = 0.5*_cse1007
+    _cse1163 = _cse1162*_cse955
+    _cse1164 = _cse1156*_cse344
+    _cse1165 = _cse469*_cse578
+    _cse1166 = _cse998 + _cse999
+    _cse1167 = 0.5*_cse1166
+    _cse1168 = -0.01084270231829*_cse1001 - 0.0189192713225*_cse1002 - 0.01084270231829*_cse1003 - 0.0189192713225*_cse1004 + _cse1005*_cse155 + _cse1006*_cse136 + _cse602*_cse82 - _cse602*_cse912 + _cse606*_cse73 - _cse606*_cse911
+    _cse1169 = 0.5*_cse1168
+    _cse1170 = _cse1150*_cse249 + _cse1151*_cse457 + _cse1153*_cse288 + _cse1154*_cse460 + _cse1167*_cse947 + _cse1169*_cse968
+    _cse1171 = _cse1150*_cse368 + _cse1151*_cse651 + _cse1153*_cse385 + _cse1154*_cse654 - _cse1155*_cse363 - _cse1156*_cse374 - _cse1158*_cse986 - _cse1162*_cse992 + _cse1167*_cse985 + _cse1169*_cse993 - _cse564*_cse658 - _cse578*_cse660
+    _cse1172 = _cse801*_cse81
+    _cse1173 = _cse73*_cse804
+    _cse1174 = 0.5*_cse1172 + 0.5*_cse1173
+    _cse1175 = _cse403*_cse804
+    _cse1176 = _cse758*_cse801
+    _cse1177 = _cse756*_cse801
+    _cse1178 = _cse139*_cse804
+    _cse1179 = 0.458851168*_cse1175 + 0.458851168*_cse1176 + 0.758601438*_cse1177 + 0.758601438*_cse1178 + _cse859 - _cse860
+    _cse1180 = -0.855753802*_cse1175 - 0.855753802*_cse1176 + 0.517383113*_cse1177 + 0.517383113*_cse1178
+    _cse1181 = -0.005421351159145*_cse1175 - 0.005421351159145*_cse1176 - 0.00945963566125*_cse1177 - 0.00945963566125*_cse1178 + 0.5*_cse1179*_cse136 + 0.5*_cse1180*_cse155 + 0.5*_cse73*_cse804 + 0.5*_cse801*_cse81 - _cse989
+    _cse1182 = -_cse55 + _cse58
+    _cse1183 = -0.02*_cse62 - 0.02*_cse65
+    _cse1184 = 1.5*_cse1183
+    _cse1185 = -0.02*_cse55 + 0.02*_cse58
+    _cse1186 = -_cse62 - _cse65
+    _cse1187 = 1.5*_cse1186
+    _cse1188 = 1.5*_cse740
+    _cse1189 = 1.5*_cse553
+    _cse1190 = _cse1010*_cse1189 + _cse1016*_cse780 + _cse1021*_cse1188 + _cse1025*_cse776 + _cse1182*_cse1184 + _cse1185*_cse1187
+    _cse1191 = _cse1008*_cse1158 + _cse1009*_cse1162 + _cse1155*_cse396 + _cse1156*_cse420 + _cse1190 + _cse564*_cse708 + _cse578*_cse738
+    _cse1192 = _cse1034*_cse1162
+    _cse1193 = _cse578*_cse784
+    _cse1194 = _cse1156*_cse452
+    _cse1195 = _cse135*_cse818
+    _cse1196 = _cse155*_cse819
+    _cse1197 = 0.5*_cse1195 + 0.5*_cse1196
+    _cse1198 = 0.00816005989195952*_cse401 + 0.00816005989195952*_cse402 + 0.00478083828*_cse404 + 0.00478083828*_cse405 + 0.00792057*_cse406 + 0.00792057*_cse407
+    _cse1199 = _cse1198*_cse831
+    _cse1200 = 0.00816005989195952*_cse412 + 0.00816005989195952*_cse413 + 0.00478083828*_cse414 + 0.00478083828*_cse415 + 0.00792057*_cse416 + 0.00792057*_cse417
+    _cse1201 = _cse1038*_cse1200
+    _cse1202 = _cse1199 + _cse1201
+    _cse1203 = -1.0*_cse1197*_cse955 + _cse1202 - 1.0*_cse337*_cse796 - 1.0*_cse344*_cse799
+    _cse1204 = _cse71*_cse801
+    _cse1205 = _cse72*_cse804
+    _cse1206 = 0.408002994597976*_cse1204 - 0.408002994597976*_cse1205 - 0.574238819026787*_cse62 - 0.574238819026787*_cse65 + 0.239041914*_cse852 + 0.239041914*_cse853 + 0.3960285*_cse861 + 0.3960285*_cse862
+    _cse1207 = 1.0*_cse1206
+    _cse1208 = 0.574238819026787*_cse58
+    _cse1209 = 0.574238819026787*_cse55
+    _cse1210 = _cse1208 - _cse1209 - 0.408002994597976*_cse603 + 0.408002994597976*_cse607 + 0.239041914*_cse609 + 0.239041914*_cse611 + 0.3960285*_cse613 + 0.3960285*_cse615
+    _cse1211 = 1.0*_cse1210
+    _cse1212 = 1.0*_cse591
+    _cse1213 = 1.0*_cse1046
+    _cse1214 = _cse1010*_cse1212 + _cse1016*_cse788 + _cse1050*_cse791 + _cse1183*_cse1211 + _cse1185*_cse1207 + _cse1213*_cse740
+    _cse1215 = 0.00468035601688406*_cse401 + 0.00468035601688406*_cse402 + 0.00274213982566424*_cse404 + 0.00274213982566424*_cse405 + 0.00454299207940609*_cse406 + 0.00454299207940609*_cse407 + _cse408*_cse871 - _cse408*_cse872 + _cse408*_cse873 - _cse409*_cse874 - _cse409*_cse875 + _cse409*_cse876
+    _cse1216 = _cse1215*_cse517
+    _cse1217 = 0.00468035601688406*_cse412 + 0.00468035601688406*_cse413 + 0.00274213982566424*_cse414 + 0.00274213982566424*_cse415 + 0.00454299207940609*_cse416 + 0.00454299207940609*_cse417 + _cse418*_cse871 - _cse418*_cse872 + _cse418*_cse873 - _cse419*_cse874 - _cse419*_cse875 + _cse419*_cse876
+    _cse1218 = _cse1064*_cse1217
+    _cse1219 = _cse1216 + _cse1218
+    _cse1220 = 0.117008900422102*_cse1204 - 0.117008900422102*_cse1205 - 0.164682744204407*_cse62 + 0.5*_cse623*_cse855 - 0.5*_cse625*_cse855 + 0.5*_cse627*_cse855 - 0.5*_cse628*_cse863 - 0.5*_cse630*_cse863 + 0.5*_cse632*_cse863 - 0.164682744204407*_cse65 + 0.0685534956416061*_cse852 + 0.0685534956416061*_cse853 + 0.113574801985152*_cse861 + 0.113574801985152*_cse862
+    _cse1221 = 0.329365488408814*_cse58
+    _cse1222 = 0.329365488408814*_cse55
+    _cse1223 = 0.5*_cse1221 - 0.5*_cse1222 - 0.117008900422102*_cse603 + 0.117008900422102*_cse607 + 0.0685534956416061*_cse609 + 0.0685534956416061*_cse611 + 0.113574801985152*_cse613 + 0.113574801985152*_cse615 + 0.5*_cse623*_cse640 - 0.5*_cse625*_cse640 + 0.5*_cse627*_cse640 - 0.5*_cse628*_cse642 - 0.5*_cse630*_cse642 + 0.5*_cse632*_cse642
+    _cse1224 = 0.5*_cse636
+    _cse1225 = 0.5*_cse1054
+    _cse1226 = _cse1010*_cse1224 + _cse1016*_cse812 + _cse1059*_cse815 + _cse1183*_cse1223 + _cse1185*_cse1220 + _cse1225*_cse740
+    _cse1227 = _cse595 + _cse596
+    _cse1228 = 0.5*_cse1227
+    _cse1229 = _cse598 + _cse599
+    _cse1230 = 0.5*_cse597
+    _cse1231 = _cse1230*_cse204
+    _cse1232 = _cse186*_cse600
+    _cse1233 = 0.5*_cse1033
+    _cse1234 = _cse1233*_cse955
+    _cse1235 = _cse1230*_cse344
+    _cse1236 = _cse469*_cse600
+    _cse1237 = _cse1031 + _cse1032
+    _cse1238 = 0.5*_cse1237
+    _cse1239 = _cse1228*_cse288 + _cse1229*_cse460 + _cse1238*_cse968
+    _cse1240 = _cse1233*_cse992
+    _cse1241 = _cse1230*_cse374
+    _cse1242 = _cse600*_cse660
+    _cse1243 = _cse1039 + _cse1043
+    _cse1244 = _cse1009*_cse1233
+    _cse1245 = _cse1230*_cse420
+    _cse1246 = _cse600*_cse738
+    _cse1247 = 0.00816005989195952*_cse1204 - 0.00816005989195952*_cse1205 - 0.0114847763805357*_cse62 - 0.0114847763805357*_cse65 + 0.00478083828*_cse852 + 0.00478083828*_cse853 + 0.00792057*_cse861 + 0.00792057*_cse862
+    _cse1248 = 1.0*_cse1247
+    _cse1249 = 1.0*_cse1186
+    _cse1250 = 1.0*_cse833
+    _cse1251 = 1.0*_cse553
+    _cse1252 = _cse1021*_cse1250 + _cse1025*_cse838 + _cse1037*_cse1251 + _cse1042*_cse839 + _cse1182*_cse1248 + _cse1249*_cse897
+    _cse1253 = _cse154*_cse855
+    _cse1254 = _cse135*_cse863
+    _cse1255 = 0.5*_cse1253 + 0.5*_cse1254
+    _cse1256 = _cse1037*_cse1212 + _cse1042*_cse788 + _cse1050*_cse838 + _cse1207*_cse897 + _cse1211*_cse1247 + _cse1213*_cse833
+    _cse1257 = _cse1034*_cse1233 + _cse1230*_cse452 + _cse1256 + _cse600*_cse784
+    _cse1258 = 0.00419168864*_cse856
+    _cse1259 = 0.00821759494*_cse867
+    _cse1260 = _cse1258*_cse199 - _cse1259*_cse199 + _cse197*_cse871 - _cse197*_cse872 + _cse197*_cse873 + _cse199*_cse874
+    _cse1261 = _cse1260*_cse517
+    _cse1262 = _cse1258*_cse441 - _cse1259*_cse441 + _cse441*_cse874 + _cse448*_cse871 - _cse448*_cse872 + _cse448*_cse873
+    _cse1263 = _cse1064*_cse1262
+    _cse1264 = _cse1261 + _cse1263
+    _cse1265 = _cse1037*_cse1224 + _cse1042*_cse812 + _cse1059*_cse850 + _cse1220*_cse897 + _cse1223*_cse1247 + _cse1225*_cse833
+    _cse1266 = _cse1068 + _cse1147
+    _cse1267 = 0.00468035601688406*_cse1204 - 0.00468035601688406*_cse1205 - 0.00658730976817627*_cse62 - 0.00658730976817627*_cse65 + 0.00274213982566424*_cse852 + 0.00274213982566424*_cse853 + _cse855*_cse871 - _cse855*_cse872 + _cse855*_cse873 + 0.00454299207940609*_cse861 + 0.00454299207940609*_cse862 - _cse863*_cse874 - _cse863*_cse875 + _cse863*_cse876
+    _cse1268 = 0.5*_cse1267
+    _cse1269 = 0.00658730976817627*_cse58
+    _cse1270 = 0.00658730976817627*_cse55
+    _cse1271 = _cse1269 - _cse1270 - 0.00468035601688406*_cse603 + 0.00468035601688406*_cse607 + 0.00274213982566424*_cse609 + 0.00274213982566424*_cse611 + 0.00454299207940609*_cse613 + 0.00454299207940609*_cse615 + _cse640*_cse871 - _cse640*_cse872 + _cse640*_cse873 - _cse642*_cse874 - _cse642*_cse875 + _cse642*_cse876
+    _cse1272 = 0.5*_cse1271
+    _cse1273 = 0.5*_cse879
+    _cse1274 = 0.5*_cse1063
+    _cse1275 = _cse1021*_cse1273 + _cse1025*_cse883 + _cse1067*_cse884 + _cse1182*_cse1268 + _cse1186*_cse1272 + _cse1274*_cse553
+    _cse1276 = _cse1219 + _cse1275
+    _cse1277 = _cse1046*_cse1273 + _cse1050*_cse883 + _cse1067*_cse886 + _cse1206*_cse1272 + _cse1210*_cse1268 + _cse1274*_cse591
+    _cse1278 = _cse1264 + _cse1277
+    _cse1279 = _cse1059*_cse883 + _cse1063*_cse1224 + _cse1067*_cse812 + _cse1220*_cse1271 + _cse1223*_cse1267 + _cse1225*_cse879
+    _cse1280 = 1.0*_cse352
+    _cse1281 = 1.0*_cse359
+    _cse1282 = 1.0*_cse363
+    _cse1283 = 1.0*_cse371
+    _cse1284 = 1.0*_cse374
+    _cse1285 = 1.0*_cse387
+    _cse1286 = _cse1280*_cse214 + _cse1281*_cse289 + _cse1282*_cse239 + _cse1283*_cse298 + _cse1284*_cse270 + _cse1285*_cse312
+    _cse1287 = _cse1282*_cse390 + _cse1283*_cse399 + _cse1284*_cse410 + _cse1285*_cse430 + _cse581 + _cse745
+    _cse1288 = _cse1284*_cse433 + _cse1285*_cse436 + _cse725 + _cse835
+    _cse1289 = 1.0*_cse986
+    _cse1290 = 1.0*_cse992
+    _cse1291 = _cse1024*_cse555
+    _cse1292 = -_cse1021
+    _cse1293 = _cse1022*_cse1292
+    _cse1294 = _cse1000*_cse1289 + _cse1007*_cse1290 + _cse1012 + _cse1017 + _cse1282*_cse561 + _cse1283*_cse564 + _cse1284*_cse571 + _cse1285*_cse578
+    _cse1295 = -_cse1044 - _cse1045 + 0.408002994597976*_cse301 - 0.408002994597976*_cse302 + 0.239041914*_cse303 + 0.3960285*_cse304 + 0.3960285*_cse305 + 0.239041914*_cse306
+    _cse1296 = _cse1047*_cse1295
+    _cse1297 = _cse1048 + _cse1049 + 0.239041914*_cse375 + 0.239041914*_cse376 + 0.3960285*_cse377 + 0.3960285*_cse378 + 0.408002994597976*_cse379 - 0.408002994597976*_cse380
+    _cse1298 = _cse1297*_cse587
+    _cse1299 = _cse1033*_cse1290 + _cse1243 + _cse1284*_cse597 + _cse1285*_cse600
+    _cse1300 = -_cse1052 - _cse1053 + 0.234017800844203*_cse301 - 0.234017800844203*_cse302 + 0.137106991283212*_cse303 + 0.227149603970304*_cse304 + 0.227149603970304*_cse305 + 0.137106991283212*_cse306 - _cse307*_cse628 - _cse307*_cse630 + _cse307*_cse632 + _cse309*_cse623 - _cse309*_cse625 + _cse309*_cse627
+    _cse1301 = _cse1055*_cse1300
+    _cse1302 = _cse1057 + _cse1058 + 0.137106991283212*_cse375 + 0.137106991283212*_cse376 + 0.227149603970304*_cse377 + 0.227149603970304*_cse378 + 0.234017800844203*_cse379 - 0.234017800844203*_cse380 - _cse381*_cse628 - _cse381*_cse630 + _cse381*_cse632 + _cse382*_cse623 - _cse382*_cse625 + _cse382*_cse627
+    _cse1303 = _cse1302*_cse634
+    _cse1304 = _cse1071 + _cse664
+    _cse1305 = 0.5*_cse1304
+    _cse1306 = 0.5*_cse665
+    _cse1307 = -_cse1069 - _cse666
+    _cse1308 = -0.5*_cse119 - 0.5*_cse120 - 0.5*_cse122 + 0.5*_cse123 + 0.5*_cse1304 + 0.5*_cse669 + 0.5*_cse670
+    _cse1309 = 0.5*_cse671
+    _cse1310 = _cse1077 - _cse666
+    _cse1311 = _cse1310 + _cse904
+    _cse1312 = 0.5*_cse1*_cse663*_cse8 - 0.5*_cse1074 - 0.5*_cse908 - 0.5*_cse916
+    _cse1313 = 0.5*_cse674
+    _cse1314 = _cse1310 + _cse913
+    _cse1315 = _cse1104 - _cse350
+    _cse1316 = 0.5*_cse1315
+    _cse1317 = 0.5*_cse1107
+    _cse1318 = 0.5*_cse1315 + 0.5*_cse950
+    _cse1319 = 0.5*_cse1108
+    _cse1320 = -0.5*_cse350 + 0.5*_cse663*_cse7 - 0.5*_cse971
+    _cse1321 = _cse1130 + _cse1132
+    _cse1322 = -_cse1291 - _cse1293
+    _cse1323 = -_cse1296 - _cse1298
+    _cse1324 = -_cse1301 - _cse1303
+    _cse1325 = _cse684 + _cse685
+    _cse1326 = 0.5*_cse1325
+    _cse1327 = _cse687 + _cse688
+    _cse1328 = _cse136*_cse695 + _cse155*_cse694 + _cse292*_cse82 - _cse292*_cse912 + _cse294*_cse73 - _cse294*_cse911 - 0.01084270231829*_cse690 - 0.0189192713225*_cse691 - 0.01084270231829*_cse692 - 0.0189192713225*_cse693
+    _cse1329 = 0.5*_cse1328
+    _cse1330 = _cse136*_cse702 + _cse155*_cse701 + _cse232*_cse82 - _cse232*_cse912 + _cse235*_cse73 - _cse235*_cse911 - 0.01084270231829*_cse697 - 0.0189192713225*_cse698 - 0.01084270231829*_cse699 - 0.0189192713225*_cse700
+    _cse1331 = 0.5*_cse686
+    _cse1332 = 0.5*_cse696
+    _cse1333 = _cse108*_cse1327 - _cse128*_cse689 + _cse130*_cse1326 - _cse132*_cse1331 + _cse1329*_cse201 + _cse1330*_cse180 - _cse1332*_cse204 - _cse186*_cse703
+    _cse1334 = _cse1120 + _cse1121
+    _cse1335 = 0.5*_cse1334
+    _cse1336 = -0.01084270231829*_cse1123 - 0.0189192713225*_cse1124 - 0.01084270231829*_cse1125 - 0.0189192713225*_cse1126 + _cse1127*_cse155 + _cse1128*_cse136 + _cse601*_cse82 - _cse601*_cse912 + _cse605*_cse73 - _cse605*_cse911
+    _cse1337 = 0.5*_cse1336
+    _cse1338 = 0.5*_cse1122
+    _cse1339 = 0.5*_cse1129
+    _cse1340 = _cse1326*_cse249 + _cse1327*_cse457 + _cse1329*_cse288 + _cse1330*_cse460 - _cse1331*_cse333 - _cse1332*_cse344 + _cse1335*_cse947 + _cse1337*_cse968 - _cse1338*_cse935 - _cse1339*_cse955 - _cse467*_cse689 - _cse469*_cse703
+    _cse1341 = _cse1338*_cse986
+    _cse1342 = _cse1331*_cse363
+    _cse1343 = _cse658*_cse689
+    _cse1344 = _cse1339*_cse992
+    _cse1345 = _cse1332*_cse374
+    _cse1346 = _cse660*_cse703
+    _cse1347 = _cse1326*_cse368 + _cse1327*_cse651 + _cse1329*_cse385 + _cse1330*_cse654 + _cse1335*_cse985 + _cse1337*_cse993
+    _cse1348 = -_cse1182
+    _cse1349 = -_cse1185
+    _cse1350 = _cse1015*_cse780 + _cse1024*_cse776 + _cse1131*_cse1189 + _cse1184*_cse1348 + _cse1187*_cse1349 + _cse1188*_cse1292
+    _cse1351 = _cse1008*_cse1338 + _cse1009*_cse1339 + _cse1331*_cse396 + _cse1332*_cse420 + _cse1350 + _cse689*_cse708 + _cse703*_cse738
+    _cse1352 = _cse1034*_cse1339
+    _cse1353 = _cse703*_cse784
+    _cse1354 = _cse1332*_cse452
+    _cse1355 = -_cse1199 - _cse1201
+    _cse1356 = -1.0*_cse1197*_cse992 + _cse1355 - 1.0*_cse374*_cse799 - 1.0*_cse387*_cse796
+    _cse1357 = -_cse1208 + _cse1209 + 0.408002994597976*_cse719 + 0.239041914*_cse720 + 0.239041914*_cse721 + 0.3960285*_cse722 + 0.3960285*_cse723 - 0.408002994597976*_cse724
+    _cse1358 = 1.0*_cse1183
+    _cse1359 = 1.0*_cse740
+    _cse1360 = _cse1015*_cse788 + _cse1131*_cse1212 + _cse1207*_cse1349 + _cse1295*_cse1359 + _cse1297*_cse791 + _cse1357*_cse1358
+    _cse1361 = -_cse1216 - _cse1218
+    _cse1362 = -_cse1221 + _cse1222 + _cse623*_cse728 - _cse625*_cse728 + _cse627*_cse728 - _cse628*_cse729 - _cse630*_cse729 + _cse632*_cse729 + 0.234017800844203*_cse719 + 0.137106991283212*_cse720 + 0.137106991283212*_cse721 + 0.227149603970304*_cse722 + 0.227149603970304*_cse723 - 0.234017800844203*_cse724
+    _cse1363 = 0.5*_cse1362
+    _cse1364 = 0.5*_cse1300
+    _cse1365 = _cse1015*_cse812 + _cse1131*_cse1224 + _cse1183*_cse1363 + _cse1220*_cse1349 + _cse1302*_cse815 + _cse1364*_cse740
+    _cse1366 = _cse713 + _cse714
+    _cse1367 = 0.5*_cse1366
+    _cse1368 = _cse716 + _cse717
+    _cse1369 = 0.5*_cse715
+    _cse1370 = _cse1369*_cse204
+    _cse1371 = _cse186*_cse718
+    _cse1372 = _cse1138 + _cse1139
+    _cse1373 = 0.5*_cse1372
+    _cse1374 = 0.5*_cse1140
+    _cse1375 = _cse1367*_cse288 + _cse1368*_cse460 - _cse1369*_cse344 + _cse1373*_cse968 - _cse1374*_cse955 - _cse469*_cse718
+    _cse1376 = _cse1374*_cse992
+    _cse1377 = _cse1369*_cse374
+    _cse1378 = _cse660*_cse718
+    _cse1379 = _cse1367*_cse385 + _cse1368*_cse654 + _cse1373*_cse993
+    _cse1380 = _cse1009*_cse1374
+    _cse1381 = _cse1369*_cse420
+    _cse1382 = _cse718*_cse738
+    _cse1383 = _cse1024*_cse838 + _cse1141*_cse1251 + _cse1142*_cse839 + _cse1248*_cse1348 + _cse1249*_cse725 + _cse1250*_cse1292
+    _cse1384 = _cse1141*_cse1212 + _cse1142*_cse788 + _cse1207*_cse725 + _cse1248*_cse1357 + _cse1250*_cse1295 + _cse1297*_cse838
+    _cse1385 = _cse1034*_cse1374 + _cse1369*_cse452 + _cse1384 + _cse718*_cse784
+    _cse1386 = -_cse1261 - _cse1263
+    _cse1387 = _cse1141*_cse1224 + _cse1142*_cse812 + _cse1220*_cse725 + _cse1247*_cse1363 + _cse1302*_cse850 + _cse1364*_cse833
+    _cse1388 = -_cse1269 + _cse1270 + 0.00468035601688406*_cse719 + 0.00274213982566424*_cse720 + 0.00274213982566424*_cse721 + 0.00454299207940609*_cse722 + 0.00454299207940609*_cse723 - 0.00468035601688406*_cse724 + _cse728*_cse871 - _cse728*_cse872 + _cse728*_cse873 - _cse729*_cse874 - _cse729*_cse875 + _cse729*_cse876
+    _cse1389 = 0.5*_cse1388
+    _cse1390 = 0.5*_cse1145
+    _cse1391 = _cse1024*_cse883 + _cse1146*_cse884 + _cse1186*_cse1389 + _cse1268*_cse1348 + _cse1273*_cse1292 + _cse1390*_cse553
+    _cse1392 = _cse1361 + _cse1391
+    _cse1393 = _cse1146*_cse886 + _cse1206*_cse1389 + _cse1268*_cse1357 + _cse1273*_cse1295 + _cse1297*_cse883 + _cse1390*_cse591
+    _cse1394 = _cse1386 + _cse1393
+    _cse1395 = _cse1145*_cse1224 + _cse1146*_cse812 + _cse1220*_cse1388 + _cse1268*_cse1362 + _cse1273*_cse1300 + _cse1302*_cse883
+    _cse1396 = 1.0*_cse391
+    _cse1397 = 1.0*_cse396
+    _cse1398 = 1.0*_cse411
+    _cse1399 = 1.0*_cse420
+    _cse1400 = _cse1396*_cse298 + _cse1397*_cse239 + _cse1398*_cse312 + _cse1399*_cse270 + _cse581 + _cse683
+    _cse1401 = _cse1396*_cse369 + _cse1397*_cse365 + _cse1398*_cse386 + _cse1399*_cse383 + _cse558 + _cse704
+    _cse1402 = _cse777 + _cse778 + _cse781 + _cse782
+    _cse1403 = _cse1398*_cse436 + _cse1399*_cse433 + _cse810 + _cse840
+    _cse1404 = 1.0*_cse1008
+    _cse1405 = 1.0*_cse1009
+    _cse1406 = 0.06*_cse0
+    _cse1407 = 0.06*_cse1
+    _cse1408 = _cse1027 + _cse1322 + _cse1396*_cse522 + _cse1397*_cse529 + _cse1398*_cse537 + _cse1399*_cse544 + _cse1404*_cse981 + _cse1405*_cse990
+    _cse1409 = 0.408002994597976*_cse401 + 0.408002994597976*_cse402 + 0.239041914*_cse404 + 0.239041914*_cse405 + 0.3960285*_cse406 + 0.3960285*_cse407
+    _cse1410 = _cse1409*_cse587
+    _cse1411 = 0.408002994597976*_cse412 + 0.408002994597976*_cse413 + 0.239041914*_cse414 + 0.239041914*_cse415 + 0.3960285*_cse416 + 0.3960285*_cse417
+    _cse1412 = _cse1047*_cse1411
+    _cse1413 = _cse1410 + _cse1412
+    _cse1414 = _cse1033*_cse1405 + _cse1252 + _cse1398*_cse600 + _cse1399*_cse597
+    _cse1415 = 0.234017800844203*_cse401 + 0.234017800844203*_cse402 + 0.137106991283212*_cse404 + 0.137106991283212*_cse405 + 0.227149603970304*_cse406 + 0.227149603970304*_cse407 + _cse408*_cse623 - _cse408*_cse625 + _cse408*_cse627 - _cse409*_cse628 - _cse409*_cse630 + _cse409*_cse632
+    _cse1416 = _cse1415*_cse634
+    _cse1417 = 0.234017800844203*_cse412 + 0.234017800844203*_cse413 + 0.137106991283212*_cse414 + 0.137106991283212*_cse415 + 0.227149603970304*_cse416 + 0.227149603970304*_cse417 + _cse418*_cse623 - _cse418*_cse625 + _cse418*_cse627 - _cse419*_cse628 - _cse419*_cse630 + _cse419*_cse632
+    _cse1418 = _cse1055*_cse1417
+    _cse1419 = _cse1416 + _cse1418
+    _cse1420 = -_cse1410 - _cse1412
+    _cse1421 = _cse1140*_cse1405 + _cse1383 + _cse1398*_cse718 + _cse1399*_cse715
+    _cse1422 = -_cse1416 - _cse1418
+    _cse1423 = _cse749 + _cse750
+    _cse1424 = 0.5*_cse752 + 0.5*_cse753
+    _cse1425 = _cse136*_cse762 + _cse155*_cse761 + _cse202 - _cse203 + _cse73*_cse78 - 0.01084270231829*_cse755 - 0.0189192713225*_cse757 - 0.01084270231829*_cse759 - 0.0189192713225*_cse760 + _cse81*_cse85
+    _cse1426 = 0.5*_cse136*_cse769 + 0.5*_cse155*_cse768 + 0.5*_cse392*_cse73 + 0.0157750094929246*_cse394*_cse71 + 0.5*_cse394*_cse81 - 0.0157750094929246*_cse590 - 0.005421351159145*_cse764 - 0.00945963566125*_cse765 - 0.005421351159145*_cse766 - 0.00945963566125*_cse767
+    _cse1427 = 0.5*_cse754
+    _cse1428 = 0.5*_cse770
+    _cse1429 = 0.5*_cse1172 + 0.5*_cse1173
+    _cse1430 = -0.5*_cse1100 - 0.005421351159145*_cse1175 - 0.005421351159145*_cse1176 - 0.00945963566125*_cse1177 - 0.00945963566125*_cse1178 + 0.5*_cse1179*_cse136 + 0.5*_cse1180*_cse155 + 0.5*_cse73*_cse804 + 0.5*_cse801*_cse81
+    _cse1431 = 0.5*_cse1174
+    _cse1432 = 0.5*_cse1181
+    _cse1433 = 0.408002994597976*_cse802 + 0.408002994597976*_cse805 + 0.239041914*_cse806 + 0.3960285*_cse807 + 0.239041914*_cse808 + 0.3960285*_cse809
+    _cse1434 = _cse623*_cse818 - _cse625*_cse818 + _cse627*_cse818 - _cse628*_cse819 - _cse630*_cse819 + _cse632*_cse819 + 0.234017800844203*_cse802 + 0.234017800844203*_cse805 + 0.137106991283212*_cse806 + 0.227149603970304*_cse807 + 0.137106991283212*_cse808 + 0.227149603970304*_cse809
+    _cse1435 = 0.5*_cse1434
+    _cse1436 = 0.00468035601688406*_cse802 + 0.00468035601688406*_cse805 + 0.00274213982566424*_cse806 + 0.00454299207940609*_cse807 + 0.00274213982566424*_cse808 + 0.00454299207940609*_cse809 + _cse818*_cse871 - _cse818*_cse872 + _cse818*_cse873 - _cse819*_cse874 - _cse819*_cse875 + _cse819*_cse876
+    _cse1437 = 0.5*_cse1417
+    _cse1438 = _cse794 + _cse795
+    _cse1439 = _cse797 + _cse798
+    _cse1440 = 0.5*_cse1439
+    _cse1441 = _cse186*_cse796
+    _cse1442 = 0.5*_cse799
+    _cse1443 = _cse1442*_cse204
+    _cse1444 = _cse1195 + _cse1196
+    _cse1445 = 0.5*_cse1444
+    _cse1446 = 0.5*_cse1197
+    _cse1447 = _cse1438*_cse460 + _cse1440*_cse288 - _cse1442*_cse344 + _cse1445*_cse968 - _cse1446*_cse955 - _cse469*_cse796
+    _cse1448 = _cse1438*_cse654 + _cse1440*_cse385 - _cse1442*_cse374 + _cse1445*_cse993 - _cse1446*_cse992 - _cse660*_cse796
+    _cse1449 = _cse1009*_cse1446
+    _cse1450 = _cse738*_cse796
+    _cse1451 = _cse1442*_cse420
+    _cse1452 = _cse1438*_cse734 + _cse1440*_cse421 + _cse1445*_cse997
+    _cse1453 = _cse1198*_cse788 + _cse1200*_cse1212 + _cse1207*_cse810 + _cse1248*_cse1433 + _cse1250*_cse1411 + _cse1409*_cse838
+    _cse1454 = _cse1034*_cse1446 + _cse1442*_cse452 + _cse1453 + _cse784*_cse796
+    _cse1455 = _cse855*_cse867
+    _cse1456 = -0.00821759494*_cse1455 + _cse855*_cse874 + 0.00419168864*_cse857 + _cse863*_cse871 - _cse863*_cse872 + _cse863*_cse873
+    _cse1457 = -0.5*_cse1186*_cse1456 - 0.5*_cse1260*_cse779 - 0.5*_cse1262*_cse553
+    _cse1458 = _cse1198*_cse812 + _cse1200*_cse1224 + _cse1220*_cse810 + _cse1247*_cse1435 + _cse1415*_cse850 + _cse1437*_cse833
+    _cse1459 = 0.5*_cse1206
+    _cse1460 = 0.5*_cse591
+    _cse1461 = _cse1215*_cse886 + _cse1217*_cse1460 + _cse1268*_cse1433 + _cse1273*_cse1411 + _cse1409*_cse883 + _cse1436*_cse1459
+    _cse1462 = _cse1457 + _cse1461
+    _cse1463 = _cse1215*_cse812 + _cse1217*_cse1224 + _cse1220*_cse1436 + _cse1268*_cse1434 + _cse1273*_cse1417 + _cse1415*_cse883
+    _cse1464 = 1.0*_cse451
+    _cse1465 = 1.0*_cse452
+    _cse1466 = -1.0*_cse270*_cse452 - 1.0*_cse312*_cse451 + _cse593 + _cse897
+    _cse1467 = -1.0*_cse383*_cse452 - 1.0*_cse386*_cse451 - _cse588 - _cse592 + _cse725
+    _cse1468 = -1.0*_cse410*_cse452 - 1.0*_cse430*_cse451 - _cse789 - _cse790 - _cse792 - _cse793 + _cse810
+    _cse1469 = 1.0*_cse1034
+    _cse1470 = 0.04*_cse0
+    _cse1471 = 0.04*_cse1
+    _cse1472 = _cse1051 + _cse1323 + _cse1464*_cse537 + _cse1465*_cse544 + _cse1469*_cse990
+    _cse1473 = _cse1007*_cse1469 + _cse1214 + _cse1420 + _cse1464*_cse578 + _cse1465*_cse571
+    _cse1474 = 0.209584432*_cse856
+    _cse1475 = 0.410879747*_cse867
+    _cse1476 = _cse1474*_cse199 - _cse1475*_cse199 + _cse197*_cse623 - _cse197*_cse625 + _cse197*_cse627 + _cse199*_cse628
+    _cse1477 = _cse1476*_cse634
+    _cse1478 = _cse1474*_cse441 - _cse1475*_cse441 + _cse441*_cse628 + _cse448*_cse623 - _cse448*_cse625 + _cse448*_cse627
+    _cse1479 = _cse1055*_cse1478
+    _cse1480 = _cse1477 + _cse1479
+    _cse1481 = _cse1129*_cse1469 + _cse1360 + _cse1413 + _cse1464*_cse703 + _cse1465*_cse696
+    _cse1482 = -_cse1477 - _cse1479
+    _cse1483 = -0.410879747*_cse1455 + _cse623*_cse863 - _cse625*_cse863 + _cse627*_cse863 + _cse628*_cse855 + 0.209584432*_cse857
+    _cse1484 = 0.5*_cse1483
+    _cse1485 = _cse1183*_cse1484
+    _cse1486 = 0.5*_cse1478
+    _cse1487 = _cse1486*_cse740
+    _cse1488 = _cse1476*_cse815
+    _cse1489 = _cse842 + _cse843
+    _cse1490 = 0.5*_cse845 + 0.5*_cse846
+    _cse1491 = 0.5*_cse847
+    _cse1492 = 0.5*_cse1253 + 0.5*_cse1254
+    _cse1493 = 0.5*_cse1255
+    _cse1494 = _cse1220*_cse1456 + _cse1224*_cse1262 + _cse1260*_cse812 + _cse1268*_cse1483 + _cse1273*_cse1478 + _cse1476*_cse883
+    _cse1495 = -_cse647 - _cse727
+    _cse1496 = -_cse638 - _cse730
+    _cse1497 = _cse813 + _cse814 + _cse816 + _cse817 - _cse820
+    _cse1498 = 0.00410879747*_cse1455 + 0.00410879747*_cse624*_cse863 + _cse851 - _cse858 - _cse864 - _cse865 - _cse866
+    _cse1499 = _cse1148 + _cse1324
+    _cse1500 = _cse1226 + _cse1422
+    _cse1501 = _cse1265 + _cse1482
+    _cse1502 = _cse1365 + _cse1419
+    _cse1503 = _cse1387 + _cse1480
+    _cse1504 = _cse1458 + _cse1485 + _cse1487 + _cse1488
+    out = np.empty((6, 36))
+    out[0, 0] = _cse108*_cse132 + _cse108*_cse89 + _cse118*_cse128 + _cse128*_cse130 + _cse13*_cse17 + _cse14*_cse17 + _cse163*_cse180 + _cse180*_cse204 + _cse183*_cse186 + _cse186*_cse201 + _cse19*_cse21 + _cse21*_cse22 + _cse36*_cse44 + _cse44*_cse54 + _cse48*_cse52 + _cse52*_cse53
+    out[0, 1] = -_cse108*_cse333 + _cse128*_cse249 - _cse14*_cse231 - _cse180*_cse344 + _cse186*_cse288 + _cse19*_cse231 + _cse214*_cse215 + _cse214*_cse291 + _cse22*_cse345 + _cse225*_cse52 + _cse239*_cse240 + _cse239*_cse300 + _cse270*_cse271 + _cse270*_cse314 + _cse289*_cse290 + _cse298*_cse299 + _cse312*_cse313 - _cse317*_cse318 - _cse321*_cse44 - _cse327*_cse328 - _cse337*_cse338 + _cse349
+    out[0, 2] = -_cse108*_cse363 + _cse128*_cse368 - _cse180*_cse374 + _cse186*_cse385 + _cse215*_cse355 + _cse240*_cse365 + _cse271*_cse383 + _cse290*_cse357 + _cse291*_cse355 + _cse299*_cse369 + _cse300*_cse365 + _cse313*_cse386 + _cse314*_cse383 - _cse318*_cse359 - _cse328*_cse371 - _cse338*_cse387 - _cse352*_cse44 + _cse356*_cse52
+    out[0, 3] = -_cse108*_cse396 + _cse128*_cse400 - _cse180*_cse420 + _cse186*_cse421 + _cse240*_cse390 + _cse271*_cse410 + _cse299*_cse399 + _cse300*_cse390 + _cse313*_cse430 + _cse314*_cse410 - _cse328*_cse391 - _cse338*_cse411
+    out[0, 4] = -_cse180*_cse452 + _cse186*_cse450 + _cse271*_cse433 + _cse313*_cse436 + _cse314*_cse433 - _cse338*_cse451
+    out[0, 5] = 0
+    out[0, 6] = _cse349 + _cse453 + _cse455 + _cse456 + _cse458 + _cse459 + _cse461 + _cse462 + _cse470
+    out[0, 7] = _cse17*_cse471 - _cse19*_cse474 + _cse290*_cse472 + _cse291*_cse476 + _cse299*_cse484 + _cse300*_cse487 + _cse313*_cse497 + _cse314*_cse505 - _cse506 - _cse507 - _cse508 - _cse509 - _cse510 - _cse511 + _cse512
+    out[0, 8] = _cse545 + _cse552
+    out[0, 9] = _cse558 + _cse582 + _cse583
+    out[0, 10] = _cse593 + _cse594 + _cse620
+    out[0, 11] = -_cse638 - _cse647
+    out[0, 12] = _cse648 + _cse649 + _cse650 + _cse652 + _cse653 + _cse655 + _cse661
+    out[0, 13] = _cse545 + _cse662
+    out[0, 14] = _cse290*_cse668 + _cse291*_cse665 + _cse299*_cse673 + _cse300*_cse671 + _cse313*_cse675 + _cse314*_cse674 - _cse676 - _cse677 - _cse678 - _cse679 - _cse680 - _cse681 + _cse682
+    out[0, 15] = _cse683 + _cse705 + _cse710
+    out[0, 16] = 0.5*_cse387*_cse450 + 0.5*_cse433*_cse659 - _cse593 - _cse711 - _cse712 - _cse726
+    out[0, 17] = -_cse727 - _cse730
+    out[0, 18] = _cse731 + _cse732 + _cse733 + _cse735 + _cse739
+    out[0, 19] = _cse582 + _cse745 + _cse746
+    out[0, 20] = _cse705 + _cse747 + _cse748
+    out[0, 21] = _cse299*_cse751 + _cse300*_cse754 + _cse313*_cse763 + _cse314*_cse770 - _cse771 - _cse772 - _cse773 - _cse774 - _cse777 - _cse778 - _cse781 - _cse782 + _cse783
+    out[0, 22] = 0.5*_cse411*_cse450 + 0.5*_cse433*_cse737 - _cse785 - _cse786 - _cse789 - _cse790 - _cse792 - _cse793 - _cse811
+    out[0, 23] = -_cse813 - _cse814 - _cse816 - _cse817 - _cse820
+    out[0, 24] = _cse821 + _cse823 + _cse825
+    out[0, 25] = _cse288*_cse784 + _cse460*_cse824 + _cse620 - _cse826 - _cse827 + _cse835
+    out[0, 26] = -_cse726 - _cse835 - _cse836
+    out[0, 27] = -_cse811 - _cse840 - _cse841
+    out[0, 28] = 1.0*_cse185*_cse844 + 1.0*_cse204*_cse847 + 0.5*_cse433*_cse824 + 0.5*_cse450*_cse451 - _cse849
+    out[0, 29] = -_cse851 - _cse868
+    out[0, 30] = 0
+    out[0, 31] = -_cse881
+    out[0, 32] = -_cse882
+    out[0, 33] = -_cse885
+    out[0, 34] = -_cse887
+    out[0, 35] = -_cse888
+    out[1, 0] = _cse107*_cse892 + _cse118*_cse891 + 1.0*_cse14*_cse230 + _cse179*_cse894 + _cse183*_cse893 - _cse347 - _cse348 + _cse43*_cse890 - _cse453 - _cse455 - _cse456 - _cse458 - _cse459 - _cse461 - _cse462 + _cse470 + _cse48*_cse889
+    out[1, 1] = _cse506 + _cse507 + _cse508 + _cse509 + _cse510 + _cse511 + _cse512
+    out[1, 2] = _cse552 + _cse895
+    out[1, 3] = _cse583 + _cse896
+    out[1, 4] = _cse594 + _cse898
+    out[1, 5] = _cse881
+    out[1, 6] = _cse108*_cse906 - _cse128*_cse484 - _cse13*_cse474 + _cse130*_cse910 - _cse132*_cse907 + _cse180*_cse914 - _cse186*_cse497 + 0.25*_cse19*_cse473 + _cse201*_cse917 - _cse204*_cse915 + _cse21*_cse471 + _cse214*_cse890 + _cse239*_cse892 + _cse270*_cse894 + _cse289*_cse889 + _cse298*_cse891 + _cse312*_cse893 - _cse346*_cse471 + _cse44*_cse899 - _cse472*_cse52 + _cse53*_cse902 - _cse54*_cse900
+    out[1, 7] = _cse0**2*_cse918 + _cse1**2*_cse918 - 0.5*_cse207*(0.10451*_cse7 + 0.00097595*_cse8) + _cse225*_cse902 + _cse249*_cse910 + _cse288*_cse917 + _cse321*_cse900 + _cse333*_cse907 + _cse344*_cse915 + _cse454*_cse899 + _cse457*_cse906 + _cse460*_cse914 + _cse464*_cse472 + _cse467*_cse484 + _cse469*_cse497 + 0.5*_cse9*(-0.00097595*_cse7 + 0.10451*_cse8) + _cse919*_cse923 + _cse925*_cse928 + _cse935*_cse942 + _cse947*_cse951 + _cse955*_cse966 + _cse968*_cse972
+    out[1, 8] = -_cse352*_cse900 + _cse356*_cse902 - _cse363*_cse907 + _cse368*_cse910 - _cse374*_cse915 + _cse385*_cse917 - _cse472*_cse549 - _cse484*_cse658 - _cse497*_cse660 + _cse516*_cse889 + _cse519*_cse890 + _cse522*_cse891 + _cse529*_cse892 + _cse537*_cse893 + _cse544*_cse894 + _cse546*_cse899 + _cse651*_cse906 + _cse654*_cse914 - _cse923*_cse977 + _cse928*_cse976 - _cse942*_cse986 + _cse951*_cse985 - _cse966*_cse992 + _cse972*_cse993 + 1.0*_cse975 + _cse981*_cse982 + _cse990*_cse991
+    out[1, 9] = _cse1000*_cse982 + _cse1007*_cse991 - _cse1008*_cse942 - _cse1009*_cse966 + _cse1018 + _cse1027 - _cse396*_cse907 + _cse400*_cse910 - _cse420*_cse915 + _cse421*_cse917 - _cse484*_cse708 - _cse497*_cse738 + _cse561*_cse892 + _cse564*_cse891 + _cse571*_cse894 + _cse578*_cse893 + _cse706*_cse906 + _cse734*_cse914 + _cse951*_cse996 + _cse972*_cse997
+    out[1, 10] = _cse1030*_cse972 + _cse1033*_cse991 - _cse1034*_cse966 - _cse1039 - _cse1043 + _cse1051 + _cse450*_cse917 - _cse452*_cse915 - _cse497*_cse784 + _cse597*_cse894 + _cse600*_cse893 + _cse822*_cse914
+    out[1, 11] = _cse1056 + _cse1060 - _cse1068
+    out[1, 12] = _cse1084 + _cse895
+    out[1, 13] = _cse1085 + _cse1086 + _cse1087 + _cse1089 + _cse1090 + _cse1091 + _cse1093 + _cse1094 + _cse1095 + _cse1103
+    out[1, 14] = 1.0*_cse1106 + _cse1107*_cse982 + _cse1108*_cse991 - _cse1110 - _cse1111 - _cse1112 - _cse1113 - _cse1114 - _cse1115 - _cse1116 - _cse1117 - _cse1118 + _cse1119 + _cse665*_cse890 + _cse668*_cse889 + _cse671*_cse892 + _cse673*_cse891 + _cse674*_cse894 + _cse675*_cse893
+    out[1, 15] = -_cse1023 - _cse1026 + _cse1133 + _cse1134
+    out[1, 16] = 0.5*_cse1030*_cse1101 - _cse1051 + 0.5*_cse1078*_cse433 + 0.5*_cse1079*_cse450 - _cse1135 - _cse1136 - _cse1137 - _cse1144
+    out[1, 17] = -_cse1147 - _cse1148
+    out[1, 18] = _cse1157 + _cse896
+    out[1, 19] = _cse1159 + _cse1160 + _cse1161 + _cse1163 + _cse1164 + _cse1165 + _cse1170
+    out[1, 20] = _cse1018 + _cse1133 + _cse1171
+    out[1, 21] = 0.5*_cse1149*_cse400 + 0.5*_cse1151*_cse390 + 0.5*_cse1152*_cse421 + 0.5*_cse1154*_cse410 + 0.5*_cse1166*_cse996 + 0.5*_cse1168*_cse997 + 1.0*_cse1174*_cse935 + 1.0*_cse1181*_cse955 - _cse1191 + 1.0*_cse327*_cse751 + 1.0*_cse333*_cse754 + 1.0*_cse337*_cse763 + 1.0*_cse344*_cse770
+    out[1, 22] = 0.5*_cse1030*_cse1168 + 0.5*_cse1152*_cse450 + 0.5*_cse1154*_cse433 - _cse1192 - _cse1193 - _cse1194 - _cse1203 - _cse1214
+    out[1, 23] = -_cse1219 - _cse1226
+    out[1, 24] = _cse1228*_cse201 + _cse1229*_cse180 - _cse1231 - _cse1232 + _cse898
+    out[1, 25] = _cse1234 + _cse1235 + _cse1236 + _cse1239
+    out[1, 26] = -_cse1144 + 0.5*_cse1227*_cse385 + 0.5*_cse1229*_cse383 + 0.5*_cse1237*_cse993 - _cse1240 - _cse1241 - _cse1242 - _cse1243
+    out[1, 27] = -_cse1203 + 0.5*_cse1227*_cse421 + 0.5*_cse1229*_cse410 + 0.5*_cse1237*_cse997 - _cse1244 - _cse1245 - _cse1246 - _cse1252
+    out[1, 28] = 0.5*_cse1030*_cse1237 + 0.5*_cse1227*_cse450 + 0.5*_cse1229*_cse433 + 1.0*_cse1255*_cse955 - _cse1257 + 1.0*_cse337*_cse844 + 1.0*_cse344*_cse847
+    out[1, 29] = -_cse1264 - _cse1265
+    out[1, 30] = _cse881
+    out[1, 31] = 0
+    out[1, 32] = -_cse1266
+    out[1, 33] = -_cse1276
+    out[1, 34] = -_cse1278
+    out[1, 35] = -_cse1279
+    out[2, 0] = _cse107*_cse1282 + _cse118*_cse1283 + _cse1280*_cse43 + _cse1281*_cse48 + _cse1284*_cse179 + _cse1285*_cse183 - _cse648 - _cse649 - _cse650 - _cse652 - _cse653 - _cse655 + _cse661
+    out[2, 1] = _cse1286 + _cse662
+    out[2, 2] = _cse676 + _cse677 + _cse678 + _cse679 + _cse680 + _cse681 + _cse682
+    out[2, 3] = _cse1287 + _cse710
+    out[2, 4] = _cse1288 + _cse433*_cse707 + _cse450*_cse660 - _cse711 - _cse712
+    out[2, 5] = _cse882
+    out[2, 6] = _cse1084 + _cse1286
+    out[2, 7] = -_cse1085 - _cse1086 - _cse1087 - _cse1089 - _cse1090 - _cse1091 - _cse1093 - _cse1094 - _cse1095 + _cse1103 + _cse1280*_cse476 + _cse1281*_cse472 + _cse1282*_cse487 + _cse1283*_cse484 + _cse1284*_cse505 + _cse1285*_cse497 + _cse1289*_cse941 + _cse1290*_cse965 + 1.0*_cse922*_cse977
+    out[2, 8] = _cse1110 + _cse1111 + _cse1112 + _cse1113 + _cse1114 + _cse1115 + _cse1116 + _cse1117 + _cse1118 + _cse1119
+    out[2, 9] = _cse1134 + _cse1291 + _cse1293 + _cse1294
+    out[2, 10] = _cse1030*_cse1102 + _cse1078*_cse822 + _cse1080*_cse450 - _cse1135 - _cse1136 - _cse1137 + _cse1296 + _cse1298 + _cse1299
+    out[2, 11] = _cse1068 + _cse1301 + _cse1303
+    out[2, 12] = _cse108*_cse1311 - _cse128*_cse673 + _cse1280*_cse355 + _cse1281*_cse357 + _cse1282*_cse365 + _cse1283*_cse369 + _cse1284*_cse383 + _cse1285*_cse386 + _cse130*_cse1308 + _cse1305*_cse53 - _cse1306*_cse54 + _cse1307*_cse44 - _cse1309*_cse132 + _cse1312*_cse201 - _cse1313*_cse204 + _cse1314*_cse180 - _cse186*_cse675 - _cse52*_cse668
+    out[2, 13] = -0.5*_cse1106 + 1.0*_cse1109 + _cse1280*_cse519 + _cse1281*_cse516 + _cse1282*_cse529 + _cse1283*_cse522 + _cse1284*_cse544 + _cse1285*_cse537 + _cse1289*_cse981 + _cse1290*_cse990 + _cse1305*_cse225 - _cse1306*_cse321 + _cse1307*_cse454 + _cse1308*_cse249 - _cse1309*_cse333 + _cse1311*_cse457 + _cse1312*_cse288 - _cse1313*_cse344 + _cse1314*_cse460 + _cse1316*_cse925 - _cse1317*_cse935 + _cse1318*_cse947 - _cse1319*_cse955 + _cse1320*_cse968 - _cse464*_cse668 - _cse467*_cse673 - _cse469*_cse675
+    out[2, 14] = 0.5*_cse1105*_cse977 + _cse1305*_cse356 + _cse1306*_cse352 + _cse1307*_cse546 + _cse1308*_cse368 + _cse1309*_cse363 + _cse1311*_cse651 + _cse1312*_cse385 + _cse1313*_cse374 + _cse1314*_cse654 + _cse1316*_cse976 + _cse1317*_cse986 + _cse1318*_cse985 + _cse1319*_cse992 + _cse1320*_cse993 + _cse549*_cse668 + _cse658*_cse673 + _cse660*_cse675
+    out[2, 15] = -_cse1008*_cse1317 - _cse1009*_cse1319 + _cse1122*_cse1289 + _cse1129*_cse1290 + _cse1282*_cse686 + _cse1283*_cse689 + _cse1284*_cse696 + _cse1285*_cse703 + _cse1308*_cse400 - _cse1309*_cse396 + _cse1311*_cse706 + _cse1312*_cse421 - _cse1313*_cse420 + _cse1314*_cse734 + _cse1318*_cse996 + _cse1320*_cse997 + _cse1321 + _cse1322 - _cse673*_cse708 - _cse675*_cse738
+    out[2, 16] = _cse1030*_cse1320 - _cse1034*_cse1319 + _cse1140*_cse1290 + _cse1143 + _cse1284*_cse715 + _cse1285*_cse718 + _cse1312*_cse450 - _cse1313*_cse452 + _cse1314*_cse822 + _cse1323 - _cse675*_cse784
+    out[2, 17] = _cse1147 + _cse1324
+    out[2, 18] = _cse1287 + _cse1333
+    out[2, 19] = _cse1294 + _cse1321 + _cse1340
+    out[2, 20] = _cse1341 + _cse1342 + _cse1343 + _cse1344 + _cse1345 + _cse1346 + _cse1347
+    out[2, 21] = 1.0*_cse1174*_cse986 + 1.0*_cse1181*_cse992 + 0.5*_cse1325*_cse400 + 0.5*_cse1327*_cse390 + 0.5*_cse1328*_cse421 + 0.5*_cse1330*_cse410 + 0.5*_cse1334*_cse996 + 0.5*_cse1336*_cse997 - _cse1351 + 1.0*_cse363*_cse754 + 1.0*_cse371*_cse751 + 1.0*_cse374*_cse770 + 1.0*_cse387*_cse763
+    out[2, 22] = 0.5*_cse1030*_cse1336 + 0.5*_cse1328*_cse450 + 0.5*_cse1330*_cse433 - _cse1352 - _cse1353 - _cse1354 - _cse1356 - _cse1360
+    out[2, 23] = -_cse1361 - _cse1365
+    out[2, 24] = _cse1288 + _cse1367*_cse201 + _cse1368*_cse180 - _cse1370 - _cse1371
+    out[2, 25] = _cse1143 + _cse1299 + _cse1375
+    out[2, 26] = _cse1376 + _cse1377 + _cse1378 + _cse1379
+    out[2, 27] = -_cse1356 + 0.5*_cse1366*_cse421 + 0.5*_cse1368*_cse410 + 0.5*_cse1372*_cse997 - _cse1380 - _cse1381 - _cse1382 - _cse1383
+    out[2, 28] = 0.5*_cse1030*_cse1372 + 1.0*_cse1255*_cse992 + 0.5*_cse1366*_cse450 + 0.5*_cse1368*_cse433 - _cse1385 + 1.0*_cse374*_cse847 + 1.0*_cse387*_cse844
+    out[2, 29] = -_cse1386 - _cse1387
+    out[2, 30] = _cse882
+    out[2, 31] = _cse1266
+    out[2, 32] = 0
+    out[2, 33] = -_cse1392
+    out[2, 34] = -_cse1394
+    out[2, 35] = -_cse1395
+    out[3, 0] = _cse107*_cse1397 + _cse118*_cse1396 + _cse1398*_cse183 + _cse1399*_cse179 - _cse731 - _cse732 - _cse733 - _cse735 + _cse739
+    out[3, 1] = _cse1400 + _cse746
+    out[3, 2] = _cse1401 + _cse748
+    out[3, 3] = _cse1402 + _cse771 + _cse772 + _cse773 + _cse774 + _cse783
+    out[3, 4] = _cse1403 + _cse450*_cse738 + _cse737*_cse822 - _cse785 - _cse786
+    out[3, 5] = _cse885
+    out[3, 6] = _cse1157 + _cse1400
+    out[3, 7] = -_cse1021*_cse1406 - _cse1025*_cse1407 - _cse1159 - _cse1160 - _cse1161 - _cse1163 - _cse1164 - _cse1165 + _cse1170 + _cse1396*_cse484 + _cse1397*_cse487 + _cse1398*_cse497 + _cse1399*_cse505 + _cse1404*_cse941 + _cse1405*_cse965
+    out[3, 8] = _cse1171 + _cse1408
+    out[3, 9] = _cse1150*_cse400 + _cse1151*_cse706 + _cse1153*_cse421 + _cse1154*_cse734 + _cse1167*_cse996 + _cse1169*_cse997 + _cse1191
+    out[3, 10] = _cse1030*_cse1169 + _cse1153*_cse450 + _cse1154*_cse822 - _cse1192 - _cse1193 - _cse1194 + _cse1413 + _cse1414
+    out[3, 11] = _cse1275 + _cse1419
+    out[3, 12] = _cse1333 + _cse1401
+    out[3, 13] = _cse1340 + _cse1408
+    out[3, 14] = _cse1024*_cse1407 + _cse1107*_cse1404 + _cse1108*_cse1405 + _cse1292*_cse1406 - _cse1341 - _cse1342 - _cse1343 - _cse1344 - _cse1345 - _cse1346 + _cse1347 + _cse1396*_cse673 + _cse1397*_cse671 + _cse1398*_cse675 + _cse1399*_cse674
+    out[3, 15] = _cse1326*_cse400 + _cse1327*_cse706 + _cse1329*_cse421 + _cse1330*_cse734 + _cse1335*_cse996 + _cse1337*_cse997 + _cse1351
+    out[3, 16] = _cse1030*_cse1337 + _cse1329*_cse450 + _cse1330*_cse822 - _cse1352 - _cse1353 - _cse1354 + _cse1420 + _cse1421
+    out[3, 17] = _cse1391 + _cse1422
+    out[3, 18] = _cse108*_cse1423 - _cse128*_cse751 + _cse130*_cse1424 - _cse132*_cse1427 + _cse1396*_cse399 + _cse1397*_cse390 + _cse1398*_cse430 + _cse1399*_cse410 + _cse1402 + _cse1425*_cse180 + _cse1426*_cse201 - _cse1428*_cse204 - _cse186*_cse763
+    out[3, 19] = _cse1000*_cse1404 + _cse1007*_cse1405 + _cse1190 + _cse1396*_cse564 + _cse1397*_cse561 + _cse1398*_cse578 + _cse1399*_cse571 + _cse1423*_cse457 + _cse1424*_cse249 + _cse1425*_cse460 + _cse1426*_cse288 - _cse1427*_cse333 - _cse1428*_cse344 + _cse1429*_cse947 + _cse1430*_cse968 - _cse1431*_cse935 - _cse1432*_cse955 - _cse467*_cse751 - _cse469*_cse763
+    out[3, 20] = _cse1122*_cse1404 + _cse1129*_cse1405 + _cse1350 + _cse1396*_cse689 + _cse1397*_cse686 + _cse1398*_cse703 + _cse1399*_cse696 + _cse1423*_cse651 + _cse1424*_cse368 + _cse1425*_cse654 + _cse1426*_cse385 - _cse1427*_cse363 - _cse1428*_cse374 + _cse1429*_cse985 + _cse1430*_cse993 - _cse1431*_cse986 - _cse1432*_cse992 - _cse658*_cse751 - _cse660*_cse763
+    out[3, 21] = _cse1008*_cse1431 + _cse1009*_cse1432 + _cse1423*_cse706 + _cse1424*_cse400 + _cse1425*_cse734 + _cse1426*_cse421 + _cse1427*_cse396 + _cse1428*_cse420 + _cse1429*_cse996 + _cse1430*_cse997 + _cse708*_cse751 + _cse738*_cse763
+    out[3, 22] = _cse1030*_cse1430 - _cse1034*_cse1432 + _cse1197*_cse1405 + _cse1198*_cse839 + _cse1200*_cse1251 + _cse1249*_cse810 - _cse1358*_cse1433 - _cse1359*_cse1411 + _cse1398*_cse796 + _cse1399*_cse799 - _cse1409*_cse791 + _cse1425*_cse822 + _cse1426*_cse450 - _cse1428*_cse452 - _cse763*_cse784
+    out[3, 23] = -_cse1183*_cse1435 + 0.5*_cse1186*_cse1436 + _cse1215*_cse884 + 0.5*_cse1217*_cse553 - _cse1415*_cse815 - _cse1437*_cse740
+    out[3, 24] = _cse1403 + _cse1438*_cse180 + _cse1440*_cse201 - _cse1441 - _cse1443
+    out[3, 25] = _cse1202 + _cse1414 + _cse1447
+    out[3, 26] = _cse1355 + _cse1421 + _cse1448
+    out[3, 27] = _cse1449 + _cse1450 + _cse1451 + _cse1452
+    out[3, 28] = 1.0*_cse1009*_cse1255 + 0.5*_cse1030*_cse1444 + 0.5*_cse1438*_cse433 + 0.5*_cse1439*_cse450 - _cse1454 + 1.0*_cse411*_cse844 + 1.0*_cse420*_cse847
+    out[3, 29] = -_cse1457 - _cse1458
+    out[3, 30] = _cse885
+    out[3, 31] = _cse1276
+    out[3, 32] = _cse1392
+    out[3, 33] = 0
+    out[3, 34] = -_cse1462
+    out[3, 35] = -_cse1463
+    out[4, 0] = _cse1464*_cse183 + _cse1465*_cse179 - _cse821 - _cse823 + _cse825
+    out[4, 1] = -_cse1466 + 0.5*_cse270*_cse824 + 0.5*_cse288*_cse451 - _cse826 - _cse827
+    out[4, 2] = -_cse1467 - _cse836
+    out[4, 3] = -_cse1468 - _cse841
+    out[4, 4] = _cse450*_cse784 + _cse822*_cse824 + _cse849
+    out[4, 5] = _cse887
+    out[4, 6] = 0.5*_cse1227*_cse201 + 0.5*_cse1229*_cse179 - _cse1231 - _cse1232 - _cse1466
+    out[4, 7] = -_cse1046*_cse1470 - _cse1050*_cse1471 - _cse1234 - _cse1235 - _cse1236 + _cse1239 + _cse1464*_cse497 + _cse1465*_cse505 + _cse1469*_cse965
+    out[4, 8] = _cse1228*_cse385 + _cse1229*_cse654 + _cse1238*_cse993 - _cse1240 - _cse1241 - _cse1242 + _cse1472
+    out[4, 9] = _cse1228*_cse421 + _cse1229*_cse734 + _cse1238*_cse997 - _cse1244 - _cse1245 - _cse1246 + _cse1473
+    out[4, 10] = _cse1030*_cse1238 + _cse1228*_cse450 + _cse1229*_cse822 + _cse1257
+    out[4, 11] = _cse1277 + _cse1480
+    out[4, 12] = 0.5*_cse1366*_cse201 + 0.5*_cse1368*_cse179 - _cse1370 - _cse1371 - _cse1467
+    out[4, 13] = _cse1375 + _cse1472
+    out[4, 14] = _cse1108*_cse1469 + _cse1295*_cse1470 + _cse1297*_cse1471 - _cse1376 - _cse1377 - _cse1378 + _cse1379 + _cse1464*_cse675 + _cse1465*_cse674
+    out[4, 15] = _cse1367*_cse421 + _cse1368*_cse734 + _cse1373*_cse997 - _cse1380 - _cse1381 - _cse1382 + _cse1481
+    out[4, 16] = _cse1030*_cse1373 + _cse1367*_cse450 + _cse1368*_cse822 + _cse1385
+    out[4, 17] = _cse1393 + _cse1482
+    out[4, 18] = 0.5*_cse1438*_cse179 + 0.5*_cse1439*_cse201 - _cse1441 - _cse1443 - _cse1468
+    out[4, 19] = _cse1447 + _cse1473
+    out[4, 20] = _cse1448 + _cse1481
+    out[4, 21] = _cse1181*_cse1469 + 2.0*_cse1183*_cse1433 + 2.0*_cse1409*_cse775 + 2.0*_cse1411*_cse740 - _cse1449 - _cse1450 - _cse1451 + _cse1452 + _cse1464*_cse763 + _cse1465*_cse770
+    out[4, 22] = _cse1030*_cse1445 + _cse1438*_cse822 + _cse1440*_cse450 + _cse1454
+    out[4, 23] = _cse1461 - _cse1485 - _cse1487 - _cse1488
+    out[4, 24] = _cse1464*_cse436 + _cse1465*_cse433 + _cse1489*_cse180 + _cse1490*_cse201 - _cse1491*_cse204 - _cse186*_cse844 + _cse848
+    out[4, 25] = _cse1033*_cse1469 + _cse1256 + _cse1464*_cse600 + _cse1465*_cse597 + _cse1489*_cse460 + _cse1490*_cse288 - _cse1491*_cse344 + _cse1492*_cse968 - _cse1493*_cse955 - _cse469*_cse844
+    out[4, 26] = _cse1140*_cse1469 + _cse1384 + _cse1464*_cse718 + _cse1465*_cse715 + _cse1489*_cse654 + _cse1490*_cse385 - _cse1491*_cse374 + _cse1492*_cse993 - _cse1493*_cse992 - _cse660*_cse844
+    out[4, 27] = -_cse1009*_cse1493 + _cse1197*_cse1469 + _cse1453 + _cse1464*_cse796 + _cse1465*_cse799 + _cse1489*_cse734 + _cse1490*_cse421 - _cse1491*_cse420 + _cse1492*_cse997 - _cse738*_cse844
+    out[4, 28] = _cse1030*_cse1492 + _cse1034*_cse1493 + _cse1489*_cse822 + _cse1490*_cse450 + _cse1491*_cse452 + _cse784*_cse844
+    out[4, 29] = -_cse1247*_cse1484 + _cse1260*_cse886 + _cse1262*_cse1460 + _cse1456*_cse1459 - _cse1476*_cse850 - _cse1486*_cse833
+    out[4, 30] = _cse887
+    out[4, 31] = _cse1278
+    out[4, 32] = _cse1394
+    out[4, 33] = _cse1462
+    out[4, 34] = 0
+    out[4, 35] = -_cse1494
+    out[5, 0] = 0
+    out[5, 1] = _cse1495
+    out[5, 2] = _cse1496
+    out[5, 3] = _cse1497
+    out[5, 4] = _cse1498
+    out[5, 5] = _cse888
+    out[5, 6] = _cse1495
+    out[5, 7] = -_cse1047*_cse1054 - _cse1059*_cse587
+    out[5, 8] = _cse1499
+    out[5, 9] = _cse1500
+    out[5, 10] = _cse1501
+    out[5, 11] = _cse1279
+    out[5, 12] = _cse1496
+    out[5, 13] = _cse1499
+    out[5, 14] = _cse1047*_cse1300 + _cse1302*_cse587
+    out[5, 15] = _cse1502
+    out[5, 16] = _cse1503
+    out[5, 17] = _cse1395
+    out[5, 18] = _cse1497
+    out[5, 19] = _cse1500
+    out[5, 20] = _cse1502
+    out[5, 21] = _cse1358*_cse1434 + _cse1359*_cse1417 + _cse1415*_cse791
+    out[5, 22] = _cse1504
+    out[5, 23] = _cse1463
+    out[5, 24] = _cse1498
+    out[5, 25] = _cse1501
+    out[5, 26] = _cse1503
+    out[5, 27] = _cse1504
+    out[5, 28] = _cse1248*_cse1483 + _cse1250*_cse1478 + _cse1476*_cse838
+    out[5, 29] = _cse1494
+    out[5, 30] = _cse888
+    out[5, 31] = _cse1279
+    out[5, 32] = _cse1395
+    out[5, 33] = _cse1463
+    out[5, 34] = _cse1494
+    out[5, 35] = 0
+    return out
+
+
+# joint0[0,0,0]_Tx
+def function3(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = -3.27120000000000e-5
+    out[1, 0] = -1.73240000000000e-5
+    out[2, 0] = 0.156750000000000
+    out[3, 0] = 1
+    return out
+
+
+# joint0[0,0,0]_J
+def function4(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint0[0,0,0]_dJ
+def function5(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint1[0,0,0]_Tx
+def function6(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((4, 1))
+    out[0, 0] = 8.3995e-5*_cse0 + 4.3259e-5*_cse1 - 3.2712e-5
+    out[1, 0] = -4.3259e-5*_cse0 + 8.3995e-5*_cse1 - 1.7324e-5
+    out[2, 0] = 0.275128000000000
+    out[3, 0] = 1
+    return out
+
+
+# joint1[0,0,0]_J
+def function7(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = -4.3259e-5*_cse0 + 8.3995e-5*_cse1
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -8.3995e-5*_cse0 - 4.3259e-5*_cse1
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint1[0,0,0]_dJ
+def function8(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = dq0*(-8.3995e-5*_cse0 - 4.3259e-5*_cse1)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = dq0*(4.3259e-5*_cse0 - 8.3995e-5*_cse1)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse1*dq0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse0*dq0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint2[0,0,0]_Tx
+def function9(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = 1.098e-6*_cse3
+    _cse5 = -0.20902*_cse2 - 0.0019519*_cse3
+    out = np.empty((4, 1))
+    out[0, 0] = 0.005828995*_cse0 + 0.20503*_cse1*_cse2 - _cse1*_cse4 - _cse1*_cse5 + 4.3259e-5*_cse1 - 3.2712e-5
+    out[1, 0] = -0.20503*_cse0*_cse2 + _cse0*_cse4 + _cse0*_cse5 - 4.3259e-5*_cse0 + 0.005828995*_cse1 - 1.7324e-5
+    out[2, 0] = 0.001950802*_cse2 - 0.41405*_cse3 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# joint2[0,0,0]_J
+def function10(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse6 = 1.098e-6*_cse2
+    _cse7 = 0.20503*_cse4
+    _cse8 = 0.0019519*_cse2 - 0.20902*_cse4
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse3 + 1.098e-6*_cse0*_cse4 + _cse0*_cse5 - 4.3259e-5*_cse0 + 0.005828995*_cse1
+    out[0, 1] = _cse1*_cse6 + _cse1*_cse7 - _cse1*_cse8
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -0.005828995*_cse0 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 + _cse1*_cse5 - 4.3259e-5*_cse1
+    out[1, 1] = -_cse0*_cse6 - _cse0*_cse7 + _cse0*_cse8
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0.41405*_cse2 + 0.001950802*_cse4
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint2[0,0,0]_dJ
+def function11(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = 1.098e-6*_cse1
+    _cse3 = math.cos(q1)
+    _cse4 = 0.20503*_cse3
+    _cse5 = 0.0019519*_cse1 - 0.20902*_cse3
+    _cse6 = -_cse0*_cse2 - _cse0*_cse4 + _cse0*_cse5
+    _cse7 = math.cos(q0)
+    _cse8 = 0.20902*_cse1 + 0.0019519*_cse3
+    _cse9 = -_cse8
+    _cse10 = 0.20503*_cse1
+    _cse11 = _cse10*_cse7 - 1.098e-6*_cse3*_cse7
+    _cse12 = -_cse2*_cse7 - _cse4*_cse7 + _cse5*_cse7
+    _cse13 = 1.098e-6*_cse0*_cse3
+    _cse14 = _cse7*dq0
+    _cse15 = _cse0*dq0
+    out = np.empty((6, 6))
+    out[0, 0] = _cse6*dq1 + dq0*(-0.005828995*_cse0 - _cse11 + _cse7*_cse9 - 4.3259e-5*_cse7)
+    out[0, 1] = _cse6*dq0 + dq1*(-_cse11 - _cse7*_cse8)
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse12*dq1 + dq0*(0.20503*_cse0*_cse1 - _cse0*_cse9 + 4.3259e-5*_cse0 - _cse13 - 0.005828995*_cse7)
+    out[1, 1] = _cse12*dq0 + dq1*(_cse0*_cse10 + _cse0*_cse8 - _cse13)
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = dq1*(-0.001950802*_cse1 + 0.41405*_cse3)
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse14
+    out[3, 2] = _cse14
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse15
+    out[4, 2] = -_cse15
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint3[0,0,0]_Tx
+def function12(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = 0.12393*_cse8
+    _cse10 = 0.12393*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = _cse0*_cse2
+    _cse16 = _cse0*_cse4
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + _cse10*_cse5 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse3*_cse7 - _cse3*_cse9 + 0.20503*_cse3 - 1.098e-6*_cse5 - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.12393*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse10*_cse16 - _cse11*_cse16 - _cse13*_cse15 - _cse14*_cse16 - _cse15*_cse7 - 0.20503*_cse15 - 1.7324e-5
+    out[2, 0] = _cse10*_cse2 + _cse11*_cse2 - _cse13*_cse4 + _cse14*_cse2 + 0.001950802*_cse2 - _cse4*_cse7 + _cse4*_cse9 - 0.41405*_cse4 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# joint3[0,0,0]_J
+def function13(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = 0.12393*_cse5
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse20 = _cse1*_cse2
+    _cse21 = _cse20*_cse8
+    _cse22 = 0.12393*_cse1
+    _cse23 = _cse1*_cse4
+    _cse24 = _cse23*_cse5
+    _cse25 = _cse11*_cse22 + _cse17*_cse20 + 0.0038906673398998*_cse21 + _cse22*_cse6 - 0.0038906673398998*_cse24
+    _cse26 = _cse0*_cse2
+    _cse27 = _cse26*_cse8
+    _cse28 = 0.12393*_cse0
+    _cse29 = _cse11*_cse28 + _cse17*_cse26 + 0.0038906673398998*_cse27 + _cse28*_cse6 - 0.0038906673398998*_cse5*_cse9
+    _cse30 = _cse10*_cse4 + _cse12 + _cse18 - 0.12393*_cse2*_cse8 + _cse7
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.12393*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse10*_cse9
+    out[0, 1] = _cse1*_cse15*_cse4 - _cse1*_cse19 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse25
+    out[0, 2] = _cse14*_cse23 + _cse25
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.12393*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 - _cse10*_cse23
+    out[1, 1] = _cse0*_cse19 - _cse15*_cse9 - 1.098e-6*_cse26 + _cse29 - 0.20503*_cse9
+    out[1, 2] = -_cse14*_cse9 - _cse29
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse16 + 0.41405*_cse2 + _cse30 + 0.001950802*_cse4
+    out[2, 2] = _cse14*_cse2 - _cse30
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse21 - _cse24
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse27
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint3[0,0,0]_dJ
+def function14(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = math.sin(q2)
+    _cse3 = math.cos(q2)
+    _cse4 = 0.00048786*_cse2 + 0.081945*_cse3
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q1)
+    _cse7 = 0.081945*_cse2 - 0.00048786*_cse3
+    _cse8 = _cse6*_cse7
+    _cse9 = _cse3*_cse6
+    _cse10 = 0.0038906673398998*_cse9
+    _cse11 = _cse0*_cse1
+    _cse12 = 0.12393*_cse3
+    _cse13 = _cse0*_cse6
+    _cse14 = 0.12393*_cse2
+    _cse15 = _cse1*_cse2
+    _cse16 = 0.0038906673398998*_cse15
+    _cse17 = _cse0*_cse10 - _cse0*_cse16 + _cse0*_cse8 + _cse11*_cse12 + _cse13*_cse14
+    _cse18 = -_cse0*_cse5 - _cse17
+    _cse19 = -0.20902*_cse1 + 0.0019519*_cse6
+    _cse20 = -_cse4
+    _cse21 = _cse1*_cse20
+    _cse22 = _cse0*_cse19 - _cse0*_cse21 - 0.20503*_cse11 - 1.098e-6*_cse13 + _cse17
+    _cse23 = math.cos(q0)
+    _cse24 = 0.0019519*_cse1 + 0.20902*_cse6
+    _cse25 = -_cse24
+    _cse26 = _cse23*_cse6
+    _cse27 = _cse1*_cse23
+    _cse28 = _cse27*_cse3
+    _cse29 = 0.0038906673398998*_cse28
+    _cse30 = _cse2*_cse26
+    _cse31 = 0.0038906673398998*_cse30
+    _cse32 = 0.12393*_cse15*_cse23
+    _cse33 = _cse23*_cse9
+    _cse34 = 0.12393*_cse33
+    _cse35 = _cse27*_cse7 + _cse29 + _cse31 + _cse32 - _cse34
+    _cse36 = -1.098e-6*_cse1*_cse23 + _cse20*_cse26 + 0.20503*_cse26 + _cse35
+    _cse37 = _cse26*_cse4
+    _cse38 = _cse35 - _cse37
+    _cse39 = -_cse7
+    _cse40 = _cse10*_cse23 + _cse12*_cse27 + _cse14*_cse26 - _cse16*_cse23 + _cse23*_cse8
+    _cse41 = -_cse23*_cse5 - _cse40
+    _cse42 = _cse19*_cse23 - _cse21*_cse23 - 1.098e-6*_cse26 - 0.20503*_cse27 + _cse40
+    _cse43 = _cse11*_cse3
+    _cse44 = 0.0038906673398998*_cse43
+    _cse45 = _cse13*_cse2
+    _cse46 = 0.0038906673398998*_cse45
+    _cse47 = 0.12393*_cse0*_cse15
+    _cse48 = _cse0*_cse9
+    _cse49 = 0.12393*_cse48
+    _cse50 = _cse11*_cse7 + _cse44 + _cse46 + _cse47 - _cse49
+    _cse51 = -1.098e-6*_cse11 + _cse13*_cse20 + 0.20503*_cse13 + _cse50
+    _cse52 = _cse13*_cse4
+    _cse53 = -_cse50 + _cse52
+    _cse54 = _cse1*_cse12
+    _cse55 = _cse14*_cse6
+    _cse56 = -_cse16
+    _cse57 = _cse10 + _cse5 + _cse54 + _cse55 + _cse56
+    _cse58 = _cse57 + _cse8
+    _cse59 = _cse23*dq0
+    _cse60 = _cse28 + _cse30
+    _cse61 = _cse0*dq0
+    _cse62 = _cse43 + _cse45
+    _cse63 = -_cse15 + _cse9
+    out = np.empty((6, 6))
+    out[0, 0] = _cse18*dq2 + _cse22*dq1 + dq0*(0.0068032576553314*_cse0 + _cse23*_cse25 - 4.3259e-5*_cse23 - _cse36)
+    out[0, 1] = _cse22*dq0 + _cse38*dq2 + dq1*(-_cse23*_cse24 - _cse36)
+    out[0, 2] = _cse18*dq0 + _cse38*dq1 + dq2*(_cse27*_cse39 - _cse29 - _cse31 - _cse32 + _cse34 + _cse37)
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse41*dq2 + _cse42*dq1 + dq0*(-_cse0*_cse25 + 4.3259e-5*_cse0 + 0.0068032576553314*_cse23 + _cse51)
+    out[1, 1] = _cse42*dq0 + _cse53*dq2 + dq1*(_cse0*_cse24 + _cse51)
+    out[1, 2] = _cse41*dq0 + _cse53*dq1 + dq2*(-_cse11*_cse39 + _cse44 + _cse46 + _cse47 - _cse49 - _cse52)
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse58*dq2 + dq1*(_cse1*_cse20 + 0.41405*_cse1 - _cse10 - _cse54 - _cse55 - _cse56 - 0.001950802*_cse6 - _cse8)
+    out[2, 2] = _cse58*dq1 + dq2*(_cse39*_cse6 - _cse57)
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse59
+    out[3, 2] = _cse59
+    out[3, 3] = _cse60*dq1 - _cse60*dq2 + dq0*(_cse0*_cse1*_cse2 - _cse48)
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse61
+    out[4, 2] = -_cse61
+    out[4, 3] = -_cse62*dq1 + _cse62*dq2 + dq0*(_cse1*_cse2*_cse23 - _cse33)
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse63*dq1 - _cse63*dq2
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint4[0,0,0]_Tx
+def function15(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = math.sin(q2)
+    _cse5 = math.cos(q2)
+    _cse6 = -0.20902*_cse2 - 0.0019519*_cse3
+    _cse7 = -0.00048786*_cse4 - 0.081945*_cse5
+    _cse8 = 0.081945*_cse4 - 0.00048786*_cse5
+    _cse9 = 6.57617443000635e-7*_cse0
+    _cse10 = 0.999999998572139*_cse1
+    _cse11 = _cse2*_cse4
+    _cse12 = _cse3*_cse5
+    _cse13 = -_cse10*_cse11 - _cse10*_cse12 - _cse9
+    _cse14 = math.sin(q3)
+    _cse15 = 0.01707203272254*_cse14
+    _cse16 = math.cos(q3)
+    _cse17 = 6.57617443000635e-7*_cse1
+    _cse18 = 0.999999998572139*_cse0 - _cse11*_cse17 - _cse12*_cse17
+    _cse19 = -0.002520822938738*_cse14 - 0.00369541928741*_cse16
+    _cse20 = 0.001085531048896*_cse14 + 0.002018916286481*_cse16
+    _cse21 = 0.00369541928741*_cse14 - 0.002520822938738*_cse16
+    _cse22 = 0.002018916286481*_cse14 - 0.001085531048896*_cse16
+    _cse23 = -0.012581*_cse14 - 0.00040053*_cse16
+    _cse24 = -0.00040053*_cse14 + 0.012581*_cse16
+    _cse25 = _cse0*_cse2
+    _cse26 = _cse0*_cse3
+    _cse27 = _cse10 + _cse11*_cse9 + _cse12*_cse9
+    _cse28 = 0.999999998572139*_cse0
+    _cse29 = _cse11*_cse28 + _cse12*_cse28 - _cse17
+    _cse30 = _cse2*_cse5
+    _cse31 = 0.999999998572139*_cse3*_cse4 - 0.999999998572139*_cse30
+    _cse32 = 6.57617443000635e-7*_cse3*_cse4 - 6.57617443000635e-7*_cse30
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 + 0.0038906673398998*_cse1*_cse2*_cse4 - 0.189657077295935*_cse1*_cse2*_cse5 + _cse1*_cse2*_cse7 + 0.20503*_cse1*_cse2 + 0.189657077295935*_cse1*_cse3*_cse4 + 0.0038906673398998*_cse1*_cse3*_cse5 + _cse1*_cse3*_cse8 - 1.098e-6*_cse1*_cse3 - _cse1*_cse6 + 4.3259e-5*_cse1 - _cse13*_cse15 - _cse13*_cse20 - _cse13*_cse21 + _cse13*_cse23 + 0.01707203272254*_cse16*_cse18 - _cse18*_cse19 - _cse18*_cse22 + _cse18*_cse24 - 3.2712e-5
+    out[1, 0] = 0.189657077295935*_cse0*_cse2*_cse5 + 1.098e-6*_cse0*_cse3 + _cse0*_cse6 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse15*_cse29 + 0.01707203272254*_cse16*_cse27 - _cse19*_cse27 - _cse20*_cse29 - _cse21*_cse29 - _cse22*_cse27 + _cse23*_cse29 + _cse24*_cse27 - 0.0038906673398998*_cse25*_cse4 - _cse25*_cse7 - 0.20503*_cse25 - 0.189657077295935*_cse26*_cse4 - 0.0038906673398998*_cse26*_cse5 - _cse26*_cse8 - 1.7324e-5
+    out[2, 0] = 0.189657077295935*_cse11 + 0.189657077295935*_cse12 - _cse15*_cse31 + 0.01707203272254*_cse16*_cse32 - _cse19*_cse32 + _cse2*_cse8 + 0.001950802*_cse2 - _cse20*_cse31 - _cse21*_cse31 - _cse22*_cse32 + _cse23*_cse31 + _cse24*_cse32 - 0.0038906673398998*_cse3*_cse4 - _cse3*_cse7 - 0.41405*_cse3 + 0.0038906673398998*_cse30 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# joint4[0,0,0]_J
+def function16(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0
+    _cse25 = _cse11*_cse24 - _cse23 + _cse24*_cse6
+    _cse26 = math.sin(q3)
+    _cse27 = 0.01707203272254*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse26
+    _cse29 = -_cse28
+    _cse30 = 0.0048662*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse26
+    _cse32 = 0.0023603*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse26
+    _cse34 = 0.0048662*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse26
+    _cse36 = 0.0023603*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse26
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse26
+    _cse39 = -_cse38
+    _cse40 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse41 = _cse2*_cse8
+    _cse42 = _cse4*_cse5
+    _cse43 = _cse23*_cse41 - _cse23*_cse42
+    _cse44 = _cse20*_cse41 - _cse20*_cse42
+    _cse45 = _cse1*_cse2
+    _cse46 = _cse45*_cse8
+    _cse47 = 0.189657077295935*_cse1
+    _cse48 = _cse1*_cse4
+    _cse49 = _cse48*_cse5
+    _cse50 = _cse11*_cse47 + _cse17*_cse45 + 0.0038906673398998*_cse46 + _cse47*_cse6 - 0.0038906673398998*_cse49
+    _cse51 = -_cse43
+    _cse52 = -_cse44
+    _cse53 = 0.01707203272254*_cse19
+    _cse54 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse55 = -_cse54
+    _cse56 = -0.999999998572139*_cse0 + _cse11*_cse23 + _cse23*_cse6
+    _cse57 = -_cse56
+    _cse58 = -0.0023603*_cse35
+    _cse59 = 0.0048662*_cse28
+    _cse60 = _cse0*_cse2
+    _cse61 = 0.189657077295935*_cse0
+    _cse62 = _cse6*_cse61
+    _cse63 = _cse60*_cse8
+    _cse64 = 0.0038906673398998*_cse63
+    _cse65 = 0.0038906673398998*_cse10
+    _cse66 = _cse11*_cse61
+    _cse67 = _cse17*_cse60
+    _cse68 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse24*_cse41
+    _cse69 = -_cse68
+    _cse70 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse41
+    _cse71 = -_cse70
+    _cse72 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse73 = -_cse72
+    _cse74 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse75 = -_cse74
+    _cse76 = _cse12 + _cse18 - 0.189657077295935*_cse41 + 0.189657077295935*_cse42 + _cse7
+    _cse77 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse41
+    _cse78 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse41
+    _cse79 = 0.408002994597976*_cse26
+    _cse80 = 0.408002994597976*_cse19
+    _cse81 = 0.3960285*_cse29
+    _cse82 = 0.239041914*_cse31
+    _cse83 = 0.3960285*_cse33
+    _cse84 = 0.239041914*_cse35
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.189657077295935*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.189657077295935*_cse10 + 0.01707203272254*_cse19*_cse22 - _cse22*_cse30 - _cse22*_cse36 + _cse22*_cse39 - _cse25*_cse27 - _cse25*_cse32 - _cse25*_cse34 + _cse25*_cse37
+    out[0, 1] = _cse1*_cse15*_cse4 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse1*_cse40 + 0.01707203272254*_cse19*_cse43 - _cse27*_cse44 - _cse30*_cse43 - _cse32*_cse44 - _cse34*_cse44 - _cse36*_cse43 + _cse37*_cse44 + _cse39*_cse43 - _cse50
+    out[0, 2] = _cse14*_cse48 - _cse27*_cse52 - _cse30*_cse51 - _cse32*_cse52 - _cse34*_cse52 - _cse36*_cse51 + _cse37*_cse52 + _cse39*_cse51 + _cse50 + _cse51*_cse53
+    out[0, 3] = -_cse27*_cse57 - _cse32*_cse57 - _cse34*_cse57 + _cse37*_cse57 + _cse38*_cse55 - _cse53*_cse55 - _cse55*_cse58 - _cse55*_cse59
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.189657077295935*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 + 0.01707203272254*_cse19*_cse56 - _cse27*_cse54 - _cse30*_cse56 - _cse32*_cse54 - _cse34*_cse54 - _cse36*_cse56 + _cse37*_cse54 + _cse39*_cse56 - 0.189657077295935*_cse49
+    out[1, 1] = _cse0*_cse40 - _cse15*_cse9 + 0.01707203272254*_cse19*_cse71 - _cse27*_cse69 - _cse30*_cse71 - _cse32*_cse69 - _cse34*_cse69 - _cse36*_cse71 + _cse37*_cse69 + _cse39*_cse71 - 1.098e-6*_cse60 + _cse62 + _cse64 - _cse65 + _cse66 + _cse67 - 0.20503*_cse9
+    out[1, 2] = -_cse14*_cse9 + 0.01707203272254*_cse19*_cse70 - _cse27*_cse68 - _cse30*_cse70 - _cse32*_cse68 - _cse34*_cse68 - _cse36*_cse70 + _cse37*_cse68 + _cse39*_cse70 - _cse62 - _cse64 + _cse65 - _cse66 - _cse67
+    out[1, 3] = -_cse22*_cse27 - _cse22*_cse32 - _cse22*_cse34 + _cse22*_cse37 + _cse25*_cse38 - _cse25*_cse53 - _cse25*_cse58 - _cse25*_cse59
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse16 + 0.41405*_cse2 - _cse27*_cse75 - _cse30*_cse73 - _cse32*_cse75 - _cse34*_cse75 - _cse36*_cse73 + _cse37*_cse75 + _cse39*_cse73 + 0.001950802*_cse4 + _cse53*_cse73 + _cse76
+    out[2, 2] = _cse14*_cse2 + 0.01707203272254*_cse19*_cse72 - _cse27*_cse74 - _cse30*_cse72 - _cse32*_cse74 - _cse34*_cse74 - _cse36*_cse72 + _cse37*_cse74 + _cse39*_cse72 - _cse76
+    out[2, 3] = -_cse27*_cse78 - _cse32*_cse78 - _cse34*_cse78 + _cse37*_cse78 + _cse38*_cse77 - _cse53*_cse77 - _cse58*_cse77 - _cse59*_cse77
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse46 - _cse49
+    out[3, 4] = 0.574238819026787*_cse46 - 0.574238819026787*_cse49 + _cse55*_cse79 + _cse55*_cse82 + _cse55*_cse83 - _cse57*_cse80 + _cse57*_cse81 + _cse57*_cse84
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse63
+    out[4, 4] = 0.574238819026787*_cse10 - _cse22*_cse80 + _cse22*_cse81 + _cse22*_cse84 + _cse25*_cse79 + _cse25*_cse82 + _cse25*_cse83 - 0.574238819026787*_cse63
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 - 0.574238819026787*_cse6 + _cse77*_cse79 + _cse77*_cse82 + _cse77*_cse83 - _cse78*_cse80 + _cse78*_cse81 + _cse78*_cse84
+    out[5, 5] = 0
+    return out
+
+
+# joint4[0,0,0]_dJ
+def function17(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = 0.999999998572139*_cse0
+    _cse2 = math.sin(q0)
+    _cse3 = 6.57617443000635e-7*_cse2
+    _cse4 = math.sin(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse4*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = math.cos(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = _cse3*_cse6 + _cse3*_cse9
+    _cse11 = _cse1 + _cse10
+    _cse12 = math.sin(q3)
+    _cse13 = 0.01707203272254*_cse12
+    _cse14 = 6.57617443000635e-7*_cse0
+    _cse15 = 0.999999998572139*_cse2
+    _cse16 = _cse15*_cse6 + _cse15*_cse9
+    _cse17 = -_cse14 + _cse16
+    _cse18 = math.cos(q3)
+    _cse19 = 0.01707203272254*_cse18
+    _cse20 = 0.85536427*_cse12 - 0.45991232*_cse18
+    _cse21 = -_cse20
+    _cse22 = 0.0023603*_cse21
+    _cse23 = 0.45991232*_cse12 + 0.85536427*_cse18
+    _cse24 = 0.0023603*_cse23
+    _cse25 = 0.51802699*_cse12 + 0.75940555*_cse18
+    _cse26 = 0.0048662*_cse25
+    _cse27 = 0.75940555*_cse12 - 0.51802699*_cse18
+    _cse28 = 0.0048662*_cse27
+    _cse29 = 0.012581*_cse12 + 0.00040053*_cse18
+    _cse30 = -_cse29
+    _cse31 = 0.00040053*_cse12 - 0.012581*_cse18
+    _cse32 = -_cse11*_cse13 - _cse11*_cse24 - _cse11*_cse28 + _cse11*_cse30 - _cse17*_cse19 - _cse17*_cse22 - _cse17*_cse26 + _cse17*_cse31
+    _cse33 = _cse2*_cse4
+    _cse34 = _cse33*_cse5
+    _cse35 = 0.189657077295935*_cse34
+    _cse36 = _cse4*_cse8
+    _cse37 = 0.0038906673398998*_cse36
+    _cse38 = _cse2*_cse37
+    _cse39 = _cse5*_cse7
+    _cse40 = 0.0038906673398998*_cse39
+    _cse41 = _cse2*_cse40
+    _cse42 = _cse2*_cse7
+    _cse43 = _cse42*_cse8
+    _cse44 = 0.189657077295935*_cse43
+    _cse45 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse46 = _cse45*_cse7
+    _cse47 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse48 = _cse4*_cse47
+    _cse49 = _cse2*_cse48
+    _cse50 = -6.57617443000635e-7*_cse2*_cse5*_cse7 + _cse3*_cse36
+    _cse51 = _cse15*_cse36 - 0.999999998572139*_cse2*_cse5*_cse7
+    _cse52 = -_cse25
+    _cse53 = 0.0048662*_cse52
+    _cse54 = 0.0023603*_cse20
+    _cse55 = -_cse31
+    _cse56 = -_cse13*_cse51 + 0.01707203272254*_cse18*_cse50 - _cse2*_cse46 - _cse24*_cse51 - _cse28*_cse51 + _cse30*_cse51 - _cse35 - _cse38 + _cse41 - _cse44 - _cse49 - _cse50*_cse53 - _cse50*_cse54 + _cse50*_cse55
+    _cse57 = 0.0019519*_cse4 - 0.20902*_cse7
+    _cse58 = -_cse45
+    _cse59 = _cse58*_cse7
+    _cse60 = -_cse51
+    _cse61 = -_cse50
+    _cse62 = -_cse13*_cse60 + 0.01707203272254*_cse18*_cse61 + _cse2*_cse57 - _cse2*_cse59 - _cse24*_cse60 - _cse28*_cse60 + _cse30*_cse60 - 1.098e-6*_cse33 + _cse35 + _cse38 - _cse41 - 0.20503*_cse42 + _cse44 + _cse49 - _cse53*_cse61 - _cse54*_cse61 + _cse55*_cse61
+    _cse63 = _cse14*_cse6 + _cse14*_cse9
+    _cse64 = -_cse15 + _cse63
+    _cse65 = 0.20902*_cse4 + 0.0019519*_cse7
+    _cse66 = -_cse65
+    _cse67 = _cse1*_cse6 + _cse1*_cse9
+    _cse68 = _cse3 + _cse67
+    _cse69 = _cse0*_cse7
+    _cse70 = _cse47*_cse69
+    _cse71 = _cse69*_cse8
+    _cse72 = 0.0038906673398998*_cse71
+    _cse73 = _cse0*_cse4
+    _cse74 = _cse5*_cse73
+    _cse75 = 0.0038906673398998*_cse74
+    _cse76 = _cse0*_cse39
+    _cse77 = 0.189657077295935*_cse76
+    _cse78 = _cse0*_cse36
+    _cse79 = -0.189657077295935*_cse78
+    _cse80 = -1.098e-6*_cse0*_cse7 + _cse58*_cse73 + _cse70 + _cse72 + 0.20503*_cse73 + _cse75 + _cse77 + _cse79
+    _cse81 = _cse14*_cse36 - _cse14*_cse39
+    _cse82 = _cse1*_cse36 - _cse1*_cse39
+    _cse83 = -_cse13*_cse81 - _cse19*_cse82 - _cse22*_cse82 - _cse24*_cse81 - _cse26*_cse82 - _cse28*_cse81 + _cse30*_cse81 + _cse31*_cse82
+    _cse84 = -_cse63
+    _cse85 = -_cse67
+    _cse86 = -_cse45*_cse73 + _cse72 + _cse75 + _cse77 + _cse79
+    _cse87 = -_cse13*_cse85 + _cse19*_cse84 - _cse24*_cse85 - _cse28*_cse85 + _cse30*_cse85 - _cse53*_cse84 - _cse54*_cse84 + _cse55*_cse84 + _cse70 + _cse86
+    _cse88 = _cse13*_cse67 - 0.01707203272254*_cse18*_cse63 + _cse24*_cse67 + _cse28*_cse67 - _cse30*_cse67 + _cse53*_cse63 + _cse54*_cse63 - _cse55*_cse63
+    _cse89 = -_cse82
+    _cse90 = -_cse81
+    _cse91 = -_cse13*_cse90 - _cse19*_cse89 - _cse22*_cse89 - _cse24*_cse90 - _cse26*_cse89 - _cse28*_cse90 + _cse30*_cse90 + _cse31*_cse89
+    _cse92 = -_cse47
+    _cse93 = -_cse68
+    _cse94 = -_cse64
+    _cse95 = -0.0048662*_cse27
+    _cse96 = -0.0023603*_cse23
+    _cse97 = -_cse13*_cse64 - _cse19*_cse68 - _cse22*_cse68 - _cse24*_cse64 - _cse26*_cse68 - _cse28*_cse64 + _cse30*_cse64 + _cse31*_cse68
+    _cse98 = 0.189657077295935*_cse74
+    _cse99 = _cse0*_cse37
+    _cse100 = _cse0*_cse40
+    _cse101 = 0.189657077295935*_cse71
+    _cse102 = _cse0*_cse48
+    _cse103 = -_cse0*_cse46 + _cse100 - _cse101 - _cse102 - _cse13*_cse82 + 0.01707203272254*_cse18*_cse81 - _cse24*_cse82 - _cse28*_cse82 + _cse30*_cse82 - _cse53*_cse81 - _cse54*_cse81 + _cse55*_cse81 - _cse98 - _cse99
+    _cse104 = _cse0*_cse57 - _cse0*_cse59 - _cse100 + _cse101 + _cse102 - _cse13*_cse89 + 0.01707203272254*_cse18*_cse90 - _cse24*_cse89 - _cse28*_cse89 + _cse30*_cse89 - _cse53*_cse90 - _cse54*_cse90 + _cse55*_cse90 - 0.20503*_cse69 - 1.098e-6*_cse73 + _cse98 + _cse99
+    _cse105 = -_cse11
+    _cse106 = -_cse17
+    _cse107 = 0.0038906673398998*_cse43
+    _cse108 = 0.0038906673398998*_cse34
+    _cse109 = _cse2*_cse39
+    _cse110 = 0.189657077295935*_cse109
+    _cse111 = _cse2*_cse36
+    _cse112 = 0.189657077295935*_cse111
+    _cse113 = _cse107 + _cse108 + _cse110 - _cse112 + _cse42*_cse47
+    _cse114 = _cse113 + _cse33*_cse58 + 0.20503*_cse33 - 1.098e-6*_cse42
+    _cse115 = -_cse13*_cse61 - _cse19*_cse60 - _cse22*_cse60 - _cse24*_cse61 - _cse26*_cse60 - _cse28*_cse61 + _cse30*_cse61 + _cse31*_cse60
+    _cse116 = _cse33*_cse45
+    _cse117 = 0.01707203272254*_cse10*_cse18 - _cse10*_cse53 - _cse10*_cse54 + _cse10*_cse55 - _cse113 + _cse116 - _cse13*_cse16 - _cse16*_cse24 - _cse16*_cse28 + _cse16*_cse30
+    _cse118 = -_cse10
+    _cse119 = -_cse16
+    _cse120 = _cse119*_cse24
+    _cse121 = _cse118*_cse54
+    _cse122 = _cse119*_cse13
+    _cse123 = _cse119*_cse28
+    _cse124 = _cse118*_cse53
+    _cse125 = -_cse13*_cse50 - _cse19*_cse51 - _cse22*_cse51 - _cse24*_cse50 - _cse26*_cse51 - _cse28*_cse50 + _cse30*_cse50 + _cse31*_cse51
+    _cse126 = 0.999999998572139*_cse6 + 0.999999998572139*_cse9
+    _cse127 = -_cse126
+    _cse128 = 6.57617443000635e-7*_cse6 + 6.57617443000635e-7*_cse9
+    _cse129 = -_cse128
+    _cse130 = -_cse127*_cse19 - _cse127*_cse22 - _cse127*_cse26 + _cse127*_cse31 - _cse129*_cse13 - _cse129*_cse24 - _cse129*_cse28 + _cse129*_cse30
+    _cse131 = 6.57617443000635e-7*_cse36 - 6.57617443000635e-7*_cse39
+    _cse132 = -_cse131
+    _cse133 = 0.999999998572139*_cse36 - 0.999999998572139*_cse39
+    _cse134 = -_cse133
+    _cse135 = -_cse13*_cse134 + _cse132*_cse19
+    _cse136 = 0.189657077295935*_cse9
+    _cse137 = 0.189657077295935*_cse6
+    _cse138 = -_cse40
+    _cse139 = _cse136 + _cse137 + _cse138 + _cse37 + _cse46
+    _cse140 = -_cse132*_cse53 - _cse132*_cse54 + _cse132*_cse55 - _cse134*_cse24 - _cse134*_cse28 + _cse134*_cse30 + _cse135 + _cse139 + _cse48
+    _cse141 = _cse13*_cse133 - 0.01707203272254*_cse131*_cse18 + _cse131*_cse53 + _cse131*_cse54 - _cse131*_cse55 + _cse133*_cse24 + _cse133*_cse28 - _cse133*_cse30
+    _cse142 = -_cse126*_cse19 - _cse126*_cse22 - _cse126*_cse26 + _cse126*_cse31 - _cse128*_cse13 - _cse128*_cse24 - _cse128*_cse28 + _cse128*_cse30
+    _cse143 = _cse0*dq0
+    _cse144 = _cse71 + _cse74
+    _cse145 = 0.574238819026787*_cse74
+    _cse146 = 0.574238819026787*_cse71
+    _cse147 = 0.408002994597976*_cse18
+    _cse148 = 0.408002994597976*_cse12
+    _cse149 = 0.3960285*_cse52
+    _cse150 = 0.239041914*_cse20
+    _cse151 = 0.239041914*_cse23
+    _cse152 = 0.3960285*_cse27
+    _cse153 = 0.239041914*_cse21
+    _cse154 = 0.3960285*_cse25
+    _cse155 = _cse2*dq0
+    _cse156 = _cse34 + _cse43
+    _cse157 = 0.574238819026787*_cse34
+    _cse158 = 0.574238819026787*_cse43
+    _cse159 = _cse36 - _cse39
+    _cse160 = 0.574238819026787*_cse36
+    _cse161 = 0.574238819026787*_cse39
+    out = np.empty((6, 6))
+    out[0, 0] = _cse32*dq3 + _cse56*dq2 + _cse62*dq1 + dq0*(_cse0*_cse66 - 4.3259e-5*_cse0 - _cse13*_cse68 + 0.01707203272254*_cse18*_cse64 + 0.0068032576553314*_cse2 - _cse24*_cse68 - _cse28*_cse68 + _cse30*_cse68 - _cse53*_cse64 - _cse54*_cse64 + _cse55*_cse64 - _cse80)
+    out[0, 1] = _cse62*dq0 + _cse83*dq3 + _cse87*dq2 + dq1*(-_cse0*_cse65 - _cse80 - _cse88)
+    out[0, 2] = _cse56*dq0 + _cse87*dq1 + _cse91*dq3 + dq2*(_cse0*_cse7*_cse92 - _cse86 - _cse88)
+    out[0, 3] = _cse32*dq0 + _cse83*dq1 + _cse91*dq2 + dq3*(0.01707203272254*_cse12*_cse93 - _cse19*_cse94 - _cse22*_cse94 - _cse26*_cse94 + _cse29*_cse93 + _cse31*_cse94 - _cse93*_cse95 - _cse93*_cse96)
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse103*dq2 + _cse104*dq1 + _cse97*dq3 + dq0*(0.0068032576553314*_cse0 + _cse105*_cse19 - _cse105*_cse53 - _cse105*_cse54 + _cse105*_cse55 - _cse106*_cse13 - _cse106*_cse24 - _cse106*_cse28 + _cse106*_cse30 + _cse114 - _cse2*_cse66 + 4.3259e-5*_cse2)
+    out[1, 1] = _cse104*dq0 + _cse115*dq3 + _cse117*dq2 + dq1*(_cse114 + _cse118*_cse19 + _cse118*_cse55 + _cse119*_cse30 - _cse120 - _cse121 - _cse122 - _cse123 - _cse124 + _cse2*_cse65)
+    out[1, 2] = _cse103*dq0 + _cse117*dq1 + _cse125*dq3 + dq2*(_cse107 + _cse108 + _cse110 - _cse112 - _cse116 + 0.01707203272254*_cse118*_cse18 + _cse118*_cse55 + _cse119*_cse30 - _cse120 - _cse121 - _cse122 - _cse123 - _cse124 - _cse42*_cse92)
+    out[1, 3] = _cse115*dq1 + _cse125*dq2 + _cse97*dq0 + dq3*(-_cse11*_cse19 - _cse11*_cse22 - _cse11*_cse26 + _cse11*_cse31 + 0.01707203272254*_cse12*_cse17 + _cse17*_cse29 - _cse17*_cse95 - _cse17*_cse96)
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse130*dq3 + _cse140*dq2 + dq1*(-_cse136 - _cse137 - _cse138 - _cse141 - _cse37 - 0.001950802*_cse4 - _cse48 + _cse58*_cse7 + 0.41405*_cse7)
+    out[2, 2] = _cse140*dq1 + _cse142*dq3 + dq2*(-_cse139 - _cse141 + _cse4*_cse92)
+    out[2, 3] = _cse130*dq1 + _cse142*dq2 + dq3*(-_cse132*_cse22 - _cse132*_cse26 + _cse132*_cse31 + _cse134*_cse29 - _cse134*_cse95 - _cse134*_cse96 - _cse135)
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse143
+    out[3, 2] = _cse143
+    out[3, 3] = _cse144*dq1 - _cse144*dq2 + dq0*(-_cse111 + _cse2*_cse5*_cse7)
+    out[3, 4] = dq0*(0.574238819026787*_cse109 - _cse11*_cse147 + _cse11*_cse149 + _cse11*_cse150 - 0.574238819026787*_cse111 + _cse148*_cse17 + _cse151*_cse17 + _cse152*_cse17) + dq1*(_cse145 + _cse146 - _cse147*_cse81 + _cse148*_cse82 + _cse149*_cse81 + _cse150*_cse81 + _cse151*_cse82 + _cse152*_cse82) + dq2*(-_cse145 - _cse146 - _cse147*_cse90 + _cse148*_cse89 + _cse149*_cse90 + _cse150*_cse90 + _cse151*_cse89 + _cse152*_cse89) + dq3*(_cse147*_cse93 + _cse148*_cse94 + _cse151*_cse94 + _cse152*_cse94 + _cse153*_cse93 + _cse154*_cse93)
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse155
+    out[4, 2] = -_cse155
+    out[4, 3] = -_cse156*dq1 + _cse156*dq2 + dq0*(_cse0*_cse5*_cse7 - _cse78)
+    out[4, 4] = dq0*(-_cse147*_cse64 + _cse148*_cse68 + _cse149*_cse64 + _cse150*_cse64 + _cse151*_cse68 + _cse152*_cse68 + 0.574238819026787*_cse76 - 0.574238819026787*_cse78) + dq1*(-_cse147*_cse61 + _cse148*_cse60 + _cse149*_cse61 + _cse150*_cse61 + _cse151*_cse60 + _cse152*_cse60 - _cse157 - _cse158) + dq2*(-_cse147*_cse50 + _cse148*_cse51 + _cse149*_cse50 + _cse150*_cse50 + _cse151*_cse51 + _cse152*_cse51 + _cse157 + _cse158) + dq3*(_cse11*_cse148 + _cse11*_cse151 + _cse11*_cse152 + _cse147*_cse17 + _cse153*_cse17 + _cse154*_cse17)
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse159*dq1 - _cse159*dq2
+    out[5, 4] = dq1*(_cse127*_cse148 + _cse127*_cse151 + _cse127*_cse152 - _cse129*_cse147 + _cse129*_cse149 + _cse129*_cse150 + _cse160 - _cse161) + dq2*(_cse126*_cse148 + _cse126*_cse151 + _cse126*_cse152 - _cse128*_cse147 + _cse128*_cse149 + _cse128*_cse150 - _cse160 + _cse161) + dq3*(_cse132*_cse148 + _cse132*_cse151 + _cse132*_cse152 + _cse134*_cse147 + _cse134*_cse153 + _cse134*_cse154)
+    out[5, 5] = 0
+    return out
+
+
+# joint5[0,0,0]_Tx
+def function18(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse3*_cse8
+    _cse10 = _cse5*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = math.sin(q3)
+    _cse16 = 6.57617443000635e-7*_cse0
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = _cse2*_cse6
+    _cse19 = _cse4*_cse8
+    _cse20 = -_cse16 - _cse17*_cse18 - _cse17*_cse19
+    _cse21 = _cse15*_cse20
+    _cse22 = math.cos(q3)
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0 - _cse18*_cse23 - _cse19*_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = -0.012581*_cse15 - 0.00040053*_cse22
+    _cse27 = -0.00040053*_cse15 + 0.012581*_cse22
+    _cse28 = -0.51802699*_cse15 - 0.75940555*_cse22
+    _cse29 = _cse24*_cse28
+    _cse30 = 0.45991232*_cse15 + 0.85536427*_cse22
+    _cse31 = _cse20*_cse30
+    _cse32 = 0.75940555*_cse15 - 0.51802699*_cse22
+    _cse33 = _cse20*_cse32
+    _cse34 = 0.85536427*_cse15 - 0.45991232*_cse22
+    _cse35 = _cse24*_cse34
+    _cse36 = -0.000346321299837637*_cse10 + 0.517383113*_cse29 - 0.855753802*_cse31 + 0.517383113*_cse33 - 0.855753802*_cse35 + 0.000346321299837637*_cse9
+    _cse37 = math.sin(q4)
+    _cse38 = 0.01718495619792*_cse37
+    _cse39 = math.cos(q4)
+    _cse40 = -0.012272*_cse37 - 0.00052974*_cse39
+    _cse41 = -0.78972966*_cse37 + 0.45479896*_cse39
+    _cse42 = 0.0050298*_cse41
+    _cse43 = 0.000787787838506*_cse37 + 0.001739686573542*_cse39
+    _cse44 = 0.818687841791724*_cse10 - 0.212878838804554*_cse21 + 0.212878838804554*_cse25 + 0.758601438*_cse29 + 0.458851168*_cse31 + 0.758601438*_cse33 + 0.458851168*_cse35 - 0.818687841791724*_cse9
+    _cse45 = 0.01718495619792*_cse39
+    _cse46 = -0.00052974*_cse37 + 0.012272*_cse39
+    _cse47 = 0.45479896*_cse37 + 0.78972966*_cse39
+    _cse48 = 0.0050298*_cse47
+    _cse49 = 0.001739686573542*_cse37 - 0.000787787838506*_cse39
+    _cse50 = _cse0*_cse2
+    _cse51 = _cse0*_cse4
+    _cse52 = _cse51*_cse6
+    _cse53 = _cse16*_cse18 + _cse16*_cse19 + _cse17
+    _cse54 = 0.999999998572139*_cse0
+    _cse55 = _cse18*_cse54 + _cse19*_cse54 - _cse23
+    _cse56 = _cse15*_cse55
+    _cse57 = _cse28*_cse53
+    _cse58 = _cse30*_cse55
+    _cse59 = _cse32*_cse55
+    _cse60 = _cse34*_cse53
+    _cse61 = _cse50*_cse8
+    _cse62 = 0.000346321299837637*_cse52 + 0.517383113*_cse57 - 0.855753802*_cse58 + 0.517383113*_cse59 - 0.855753802*_cse60 - 0.000346321299837637*_cse61
+    _cse63 = 0.212878838804554*_cse22*_cse53 - 0.818687841791724*_cse52 - 0.212878838804554*_cse56 + 0.758601438*_cse57 + 0.458851168*_cse58 + 0.758601438*_cse59 + 0.458851168*_cse60 + 0.818687841791724*_cse61
+    _cse64 = _cse2*_cse8
+    _cse65 = 0.999999998572139*_cse4*_cse6 - 0.999999998572139*_cse64
+    _cse66 = _cse15*_cse65
+    _cse67 = 6.57617443000635e-7*_cse4*_cse6 - 6.57617443000635e-7*_cse64
+    _cse68 = _cse22*_cse67
+    _cse69 = _cse30*_cse65
+    _cse70 = _cse32*_cse65
+    _cse71 = _cse28*_cse67
+    _cse72 = _cse34*_cse67
+    _cse73 = -0.000346321299837637*_cse18 - 0.000346321299837637*_cse19 + 0.517383113*_cse28*_cse67 + 0.517383113*_cse32*_cse65 - 0.855753802*_cse69 - 0.855753802*_cse72
+    _cse74 = 0.818687841791724*_cse18 + 0.818687841791724*_cse19 - 0.212878838804554*_cse66 + 0.212878838804554*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70 + 0.758601438*_cse71 + 0.458851168*_cse72
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + 0.227539183449751*_cse10 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse20*_cse26 - 0.0439876856535455*_cse21 + _cse24*_cse27 + 0.0439876856535455*_cse25 - 0.0309919044627574*_cse29 + _cse3*_cse7 + 0.20503*_cse3 - 0.0181297165934418*_cse31 - 0.0309919044627574*_cse33 - 0.0181297165934418*_cse35 - _cse36*_cse38 + _cse36*_cse40 + _cse36*_cse42 - _cse36*_cse43 + _cse44*_cse45 + _cse44*_cse46 + _cse44*_cse48 - _cse44*_cse49 - 1.098e-6*_cse5 - 0.227539183449751*_cse9 - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.227539183449751*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse11*_cse51 - _cse13*_cse50 - _cse14*_cse51 + 0.0439876856535455*_cse22*_cse53 + _cse26*_cse55 + _cse27*_cse53 - _cse38*_cse62 + 0.01718495619792*_cse39*_cse63 + _cse40*_cse62 + 0.0050298*_cse41*_cse62 - _cse43*_cse62 + _cse46*_cse63 + 0.0050298*_cse47*_cse63 - _cse49*_cse63 - _cse50*_cse7 - 0.20503*_cse50 - 0.227539183449751*_cse52 - 0.0439876856535455*_cse56 - 0.0309919044627574*_cse57 - 0.0181297165934418*_cse58 - 0.0309919044627574*_cse59 - 0.0181297165934418*_cse60 - 1.7324e-5
+    out[2, 0] = -_cse13*_cse4 + _cse14*_cse2 + 0.227539183449751*_cse18 + 0.227539183449751*_cse19 + 0.001950802*_cse2 + _cse26*_cse65 + _cse27*_cse67 - _cse38*_cse73 - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + _cse40*_cse73 + _cse42*_cse73 - _cse43*_cse73 + _cse45*_cse74 + _cse46*_cse74 + _cse48*_cse74 - _cse49*_cse74 + 0.0038906673398998*_cse64 - 0.0439876856535455*_cse66 + 0.0439876856535455*_cse68 - 0.0181297165934418*_cse69 - 0.0309919044627574*_cse70 - 0.0309919044627574*_cse71 - 0.0181297165934418*_cse72 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# joint5[0,0,0]_J
+def function19(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = math.sin(q3)
+    _cse24 = 6.57617443000635e-7*_cse1
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse11*_cse25 - _cse24 + _cse25*_cse6
+    _cse27 = _cse23*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse23
+    _cse29 = -_cse28
+    _cse30 = _cse22*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse23
+    _cse32 = _cse26*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse23
+    _cse34 = _cse26*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse23
+    _cse36 = _cse22*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse23
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse23
+    _cse39 = -_cse38
+    _cse40 = _cse0*_cse2
+    _cse41 = _cse40*_cse8
+    _cse42 = 0.000346321299837637*_cse10 + 0.517383113*_cse30 - 0.855753802*_cse32 + 0.517383113*_cse34 - 0.855753802*_cse36 - 0.000346321299837637*_cse41
+    _cse43 = math.sin(q4)
+    _cse44 = 0.01718495619792*_cse43
+    _cse45 = math.cos(q4)
+    _cse46 = -0.78972966*_cse43 + 0.45479896*_cse45
+    _cse47 = 0.40329059*_cse43 + 0.89059413*_cse45
+    _cse48 = 0.0019534*_cse47
+    _cse49 = -0.012272*_cse43 - 0.00052974*_cse45
+    _cse50 = _cse19*_cse22
+    _cse51 = -0.818687841791724*_cse10 - 0.212878838804554*_cse27 + 0.758601438*_cse30 + 0.458851168*_cse32 + 0.758601438*_cse34 + 0.458851168*_cse36 + 0.818687841791724*_cse41 + 0.212878838804554*_cse50
+    _cse52 = 0.45479896*_cse43 + 0.78972966*_cse45
+    _cse53 = 0.89059413*_cse43 - 0.40329059*_cse45
+    _cse54 = 0.0019534*_cse53
+    _cse55 = 0.00052974*_cse43 - 0.012272*_cse45
+    _cse56 = -_cse55
+    _cse57 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse58 = 0.818687841791724*_cse6
+    _cse59 = _cse1*_cse58
+    _cse60 = 0.818687841791724*_cse11
+    _cse61 = _cse1*_cse60
+    _cse62 = _cse2*_cse8
+    _cse63 = _cse4*_cse5
+    _cse64 = _cse24*_cse62 - _cse24*_cse63
+    _cse65 = _cse20*_cse62 - _cse20*_cse63
+    _cse66 = _cse23*_cse65
+    _cse67 = _cse29*_cse64
+    _cse68 = _cse35*_cse64
+    _cse69 = _cse31*_cse65
+    _cse70 = _cse33*_cse65
+    _cse71 = 0.212878838804554*_cse19*_cse64 - _cse59 - _cse61 - 0.212878838804554*_cse66 + 0.758601438*_cse67 + 0.458851168*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70
+    _cse72 = 0.000346321299837637*_cse11
+    _cse73 = 0.000346321299837637*_cse6
+    _cse74 = _cse1*_cse72 + _cse1*_cse73
+    _cse75 = 0.517383113*_cse67 - 0.855753802*_cse68 - 0.855753802*_cse69 + 0.517383113*_cse70 + _cse74
+    _cse76 = _cse1*_cse2
+    _cse77 = _cse76*_cse8
+    _cse78 = 0.227539183449751*_cse1
+    _cse79 = _cse1*_cse4
+    _cse80 = _cse5*_cse79
+    _cse81 = _cse11*_cse78 + _cse17*_cse76 + _cse6*_cse78 + 0.0038906673398998*_cse77 - 0.0038906673398998*_cse80
+    _cse82 = -_cse65
+    _cse83 = _cse23*_cse82
+    _cse84 = -_cse64
+    _cse85 = _cse19*_cse84
+    _cse86 = _cse31*_cse82
+    _cse87 = _cse33*_cse82
+    _cse88 = _cse29*_cse84
+    _cse89 = _cse35*_cse84
+    _cse90 = _cse59 + _cse61 - 0.212878838804554*_cse83 + 0.212878838804554*_cse85 + 0.458851168*_cse86 + 0.758601438*_cse87 + 0.758601438*_cse88 + 0.458851168*_cse89
+    _cse91 = 0.517383113*_cse29*_cse84 + 0.517383113*_cse33*_cse82 - _cse74 - 0.855753802*_cse86 - 0.855753802*_cse89
+    _cse92 = 0.01718495619792*_cse45
+    _cse93 = 0.0050298*_cse46
+    _cse94 = 0.0050298*_cse52
+    _cse95 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse96 = -_cse95
+    _cse97 = _cse19*_cse96
+    _cse98 = -0.999999998572139*_cse0 + _cse11*_cse24 + _cse24*_cse6
+    _cse99 = -_cse98
+    _cse100 = _cse23*_cse99
+    _cse101 = -_cse35
+    _cse102 = _cse101*_cse96
+    _cse103 = _cse31*_cse99
+    _cse104 = _cse28*_cse96
+    _cse105 = _cse33*_cse99
+    _cse106 = -0.855753802*_cse102 - 0.855753802*_cse103 + 0.517383113*_cse28*_cse96 + 0.517383113*_cse33*_cse99
+    _cse107 = -0.212878838804554*_cse100 + 0.458851168*_cse102 + 0.458851168*_cse103 + 0.758601438*_cse104 + 0.758601438*_cse105 - 0.212878838804554*_cse97
+    _cse108 = 0.000346321299837637*_cse77
+    _cse109 = 0.000346321299837637*_cse80
+    _cse110 = _cse29*_cse99
+    _cse111 = _cse31*_cse96
+    _cse112 = _cse33*_cse96
+    _cse113 = _cse35*_cse99
+    _cse114 = _cse108 - _cse109 + 0.517383113*_cse110 - 0.855753802*_cse111 + 0.517383113*_cse112 - 0.855753802*_cse113
+    _cse115 = -0.0019534*_cse53
+    _cse116 = -_cse52
+    _cse117 = 0.818687841791724*_cse77
+    _cse118 = 0.818687841791724*_cse80
+    _cse119 = 0.212878838804554*_cse23
+    _cse120 = 0.212878838804554*_cse19
+    _cse121 = 0.758601438*_cse110 + 0.458851168*_cse111 + 0.758601438*_cse112 + 0.458851168*_cse113 - _cse117 + _cse118 - _cse119*_cse96 + _cse120*_cse99
+    _cse122 = 0.0439876856535455*_cse23
+    _cse123 = _cse29*_cse98
+    _cse124 = _cse31*_cse95
+    _cse125 = _cse33*_cse95
+    _cse126 = _cse35*_cse98
+    _cse127 = -_cse108 + _cse109 + 0.517383113*_cse123 - 0.855753802*_cse124 + 0.517383113*_cse125 - 0.855753802*_cse126
+    _cse128 = _cse117 - _cse118 - _cse119*_cse95 + _cse120*_cse98 + 0.758601438*_cse123 + 0.458851168*_cse124 + 0.758601438*_cse125 + 0.458851168*_cse126
+    _cse129 = _cse0*_cse58
+    _cse130 = _cse0*_cse60
+    _cse131 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse25*_cse62
+    _cse132 = -_cse131
+    _cse133 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse62
+    _cse134 = -_cse133
+    _cse135 = _cse132*_cse31
+    _cse136 = _cse132*_cse33
+    _cse137 = _cse134*_cse29
+    _cse138 = _cse134*_cse35
+    _cse139 = -_cse119*_cse132 + _cse120*_cse134 + _cse129 + _cse130 + 0.458851168*_cse135 + 0.758601438*_cse136 + 0.758601438*_cse137 + 0.458851168*_cse138
+    _cse140 = _cse0*_cse72 + _cse0*_cse73
+    _cse141 = 0.517383113*_cse132*_cse33 + 0.517383113*_cse134*_cse29 - 0.855753802*_cse135 - 0.855753802*_cse138 - _cse140
+    _cse142 = 0.0439876856535455*_cse19
+    _cse143 = 0.227539183449751*_cse0
+    _cse144 = -0.0038906673398998*_cse10 + _cse11*_cse143 + _cse143*_cse6 + _cse17*_cse40 + 0.0038906673398998*_cse41
+    _cse145 = _cse133*_cse29
+    _cse146 = _cse133*_cse35
+    _cse147 = _cse131*_cse31
+    _cse148 = _cse131*_cse33
+    _cse149 = -_cse119*_cse131 + _cse120*_cse133 - _cse129 - _cse130 + 0.758601438*_cse145 + 0.458851168*_cse146 + 0.458851168*_cse147 + 0.758601438*_cse148
+    _cse150 = _cse140 + 0.517383113*_cse145 - 0.855753802*_cse146 - 0.855753802*_cse147 + 0.517383113*_cse148
+    _cse151 = _cse101*_cse26
+    _cse152 = _cse22*_cse31
+    _cse153 = _cse26*_cse28
+    _cse154 = _cse22*_cse33
+    _cse155 = -0.855753802*_cse151 - 0.855753802*_cse152 + 0.517383113*_cse22*_cse33 + 0.517383113*_cse26*_cse28
+    _cse156 = -_cse119*_cse22 - _cse120*_cse26 + 0.458851168*_cse151 + 0.458851168*_cse152 + 0.758601438*_cse153 + 0.758601438*_cse154
+    _cse157 = 0.818687841791724*_cse62
+    _cse158 = 0.818687841791724*_cse63
+    _cse159 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse160 = -_cse159
+    _cse161 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse162 = -_cse161
+    _cse163 = _cse160*_cse31
+    _cse164 = _cse160*_cse33
+    _cse165 = _cse162*_cse29
+    _cse166 = _cse162*_cse35
+    _cse167 = -_cse119*_cse160 + _cse120*_cse162 - _cse157 + _cse158 + 0.458851168*_cse163 + 0.758601438*_cse164 + 0.758601438*_cse165 + 0.458851168*_cse166
+    _cse168 = -0.000346321299837637*_cse62 + 0.000346321299837637*_cse63
+    _cse169 = 0.517383113*_cse160*_cse33 + 0.517383113*_cse162*_cse29 - 0.855753802*_cse163 - 0.855753802*_cse166 - _cse168
+    _cse170 = _cse12 + _cse18 - 0.227539183449751*_cse62 + 0.227539183449751*_cse63 + _cse7
+    _cse171 = _cse161*_cse29
+    _cse172 = _cse161*_cse35
+    _cse173 = _cse159*_cse31
+    _cse174 = _cse159*_cse33
+    _cse175 = -_cse119*_cse159 + _cse120*_cse161 + _cse157 - _cse158 + 0.758601438*_cse171 + 0.458851168*_cse172 + 0.458851168*_cse173 + 0.758601438*_cse174
+    _cse176 = _cse168 + 0.517383113*_cse171 - 0.855753802*_cse172 - 0.855753802*_cse173 + 0.517383113*_cse174
+    _cse177 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse62
+    _cse178 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse62
+    _cse179 = _cse101*_cse177
+    _cse180 = _cse177*_cse28
+    _cse181 = _cse178*_cse31
+    _cse182 = _cse178*_cse33
+    _cse183 = 0.517383113*_cse177*_cse28 + 0.517383113*_cse178*_cse33 - 0.855753802*_cse179 - 0.855753802*_cse181
+    _cse184 = -_cse119*_cse178 - _cse120*_cse177 + 0.458851168*_cse179 + 0.758601438*_cse180 + 0.458851168*_cse181 + 0.758601438*_cse182
+    _cse185 = _cse177*_cse31
+    _cse186 = _cse178*_cse35
+    _cse187 = 0.517383113*_cse177*_cse33 + 0.517383113*_cse178*_cse29 - 0.855753802*_cse185 - 0.855753802*_cse186 - _cse72 - _cse73
+    _cse188 = _cse177*_cse33
+    _cse189 = _cse178*_cse29
+    _cse190 = -_cse119*_cse177 + _cse120*_cse178 + 0.458851168*_cse185 + 0.458851168*_cse186 + 0.758601438*_cse188 + 0.758601438*_cse189 + _cse58 + _cse60
+    _cse191 = _cse23*_cse96
+    _cse192 = _cse19*_cse99
+    _cse193 = 0.410149995883665*_cse43
+    _cse194 = 0.410879747*_cse46
+    _cse195 = 0.209584432*_cse47
+    _cse196 = 0.410149995883665*_cse45
+    _cse197 = 0.410879747*_cse52
+    _cse198 = 0.209584432*_cse53
+    _cse199 = _cse177*_cse23
+    _cse200 = _cse178*_cse19
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.227539183449751*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.227539183449751*_cse10 + 0.0439876856535455*_cse19*_cse22 + _cse22*_cse39 + _cse26*_cse37 - 0.0439876856535455*_cse27 - 0.0309919044627574*_cse30 - 0.0181297165934418*_cse32 - 0.0309919044627574*_cse34 - 0.0181297165934418*_cse36 - _cse42*_cse44 + 0.0050298*_cse42*_cse46 - _cse42*_cse48 + _cse42*_cse49 + 0.01718495619792*_cse45*_cse51 + 0.0050298*_cse51*_cse52 - _cse51*_cse54 + _cse51*_cse56
+    out[0, 1] = _cse1*_cse15*_cse4 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse1*_cse57 + 0.0439876856535455*_cse19*_cse64 + _cse37*_cse65 + _cse39*_cse64 - _cse44*_cse75 + 0.01718495619792*_cse45*_cse71 + 0.0050298*_cse46*_cse75 - _cse48*_cse75 + _cse49*_cse75 + 0.0050298*_cse52*_cse71 - _cse54*_cse71 + _cse56*_cse71 - 0.0439876856535455*_cse66 - 0.0309919044627574*_cse67 - 0.0181297165934418*_cse68 - 0.0181297165934418*_cse69 - 0.0309919044627574*_cse70 - _cse81
+    out[0, 2] = _cse14*_cse79 + _cse37*_cse82 + _cse39*_cse84 - _cse44*_cse91 - _cse48*_cse91 + _cse49*_cse91 - _cse54*_cse90 + _cse56*_cse90 + _cse81 - 0.0439876856535455*_cse83 + 0.0439876856535455*_cse85 - 0.0181297165934418*_cse86 - 0.0309919044627574*_cse87 - 0.0309919044627574*_cse88 - 0.0181297165934418*_cse89 + _cse90*_cse92 + _cse90*_cse94 + _cse91*_cse93
+    out[0, 3] = -0.0439876856535455*_cse100 - 0.0181297165934418*_cse102 - 0.0181297165934418*_cse103 - 0.0309919044627574*_cse104 - 0.0309919044627574*_cse105 - _cse106*_cse44 + 0.0050298*_cse106*_cse46 - _cse106*_cse48 + _cse106*_cse49 + 0.01718495619792*_cse107*_cse45 + 0.0050298*_cse107*_cse52 - _cse107*_cse54 + _cse107*_cse56 + _cse37*_cse99 + _cse38*_cse96 - 0.0439876856535455*_cse97
+    out[0, 4] = -_cse114*_cse115 + 0.0050298*_cse114*_cse116 + _cse114*_cse55 - _cse114*_cse92 - _cse121*_cse44 + 0.0050298*_cse121*_cse46 - _cse121*_cse48 + _cse121*_cse49
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.227539183449751*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 - _cse122*_cse95 - 0.0309919044627574*_cse123 - 0.0181297165934418*_cse124 - 0.0309919044627574*_cse125 - 0.0181297165934418*_cse126 - _cse127*_cse44 + 0.0050298*_cse127*_cse46 - _cse127*_cse48 + _cse127*_cse49 + 0.01718495619792*_cse128*_cse45 + 0.0050298*_cse128*_cse52 - _cse128*_cse54 + _cse128*_cse56 + 0.0439876856535455*_cse19*_cse98 + _cse37*_cse95 + _cse39*_cse98 - 0.227539183449751*_cse80
+    out[1, 1] = _cse0*_cse57 - _cse122*_cse132 + _cse132*_cse37 + _cse134*_cse142 + _cse134*_cse39 - 0.0181297165934418*_cse135 - 0.0309919044627574*_cse136 - 0.0309919044627574*_cse137 - 0.0181297165934418*_cse138 - _cse139*_cse54 + _cse139*_cse56 + _cse139*_cse92 + _cse139*_cse94 - _cse141*_cse44 - _cse141*_cse48 + _cse141*_cse49 + _cse141*_cse93 + _cse144 - _cse15*_cse9 - 1.098e-6*_cse40 - 0.20503*_cse9
+    out[1, 2] = -_cse122*_cse131 + _cse131*_cse37 + 0.0439876856535455*_cse133*_cse19 + _cse133*_cse39 - _cse14*_cse9 - _cse144 - 0.0309919044627574*_cse145 - 0.0181297165934418*_cse146 - 0.0181297165934418*_cse147 - 0.0309919044627574*_cse148 + 0.01718495619792*_cse149*_cse45 + 0.0050298*_cse149*_cse52 - _cse149*_cse54 + _cse149*_cse56 - _cse150*_cse44 + 0.0050298*_cse150*_cse46 - _cse150*_cse48 + _cse150*_cse49
+    out[1, 3] = -_cse122*_cse22 - _cse142*_cse26 - 0.0181297165934418*_cse151 - 0.0181297165934418*_cse152 - 0.0309919044627574*_cse153 - 0.0309919044627574*_cse154 - _cse155*_cse44 + 0.0050298*_cse155*_cse46 - _cse155*_cse48 + _cse155*_cse49 + 0.01718495619792*_cse156*_cse45 + 0.0050298*_cse156*_cse52 - _cse156*_cse54 + _cse156*_cse56 + _cse22*_cse37 + _cse26*_cse38
+    out[1, 4] = -_cse115*_cse42 + 0.0050298*_cse116*_cse42 + _cse42*_cse55 - _cse42*_cse92 - _cse44*_cse51 + 0.0050298*_cse46*_cse51 - _cse48*_cse51 + _cse49*_cse51
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse122*_cse160 + _cse142*_cse162 + _cse16 + _cse160*_cse37 + _cse162*_cse39 - 0.0181297165934418*_cse163 - 0.0309919044627574*_cse164 - 0.0309919044627574*_cse165 - 0.0181297165934418*_cse166 - _cse167*_cse54 + _cse167*_cse56 + _cse167*_cse92 + _cse167*_cse94 - _cse169*_cse44 - _cse169*_cse48 + _cse169*_cse49 + _cse169*_cse93 + _cse170 + 0.41405*_cse2 + 0.001950802*_cse4
+    out[2, 2] = -_cse122*_cse159 + _cse14*_cse2 + _cse159*_cse37 + 0.0439876856535455*_cse161*_cse19 + _cse161*_cse39 - _cse170 - 0.0309919044627574*_cse171 - 0.0181297165934418*_cse172 - 0.0181297165934418*_cse173 - 0.0309919044627574*_cse174 + 0.01718495619792*_cse175*_cse45 + 0.0050298*_cse175*_cse52 - _cse175*_cse54 + _cse175*_cse56 - _cse176*_cse44 + 0.0050298*_cse176*_cse46 - _cse176*_cse48 + _cse176*_cse49
+    out[2, 3] = -_cse122*_cse178 - _cse142*_cse177 + _cse177*_cse38 + _cse178*_cse37 - 0.0181297165934418*_cse179 - 0.0309919044627574*_cse180 - 0.0181297165934418*_cse181 - 0.0309919044627574*_cse182 - _cse183*_cse44 + 0.0050298*_cse183*_cse46 - _cse183*_cse48 + _cse183*_cse49 + 0.01718495619792*_cse184*_cse45 + 0.0050298*_cse184*_cse52 - _cse184*_cse54 + _cse184*_cse56
+    out[2, 4] = -_cse115*_cse187 + 0.0050298*_cse116*_cse187 + _cse187*_cse55 - _cse187*_cse92 - _cse190*_cse44 + 0.0050298*_cse190*_cse46 - _cse190*_cse48 + _cse190*_cse49
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse77 - _cse80
+    out[3, 4] = 0.3960285*_cse110 + 0.239041914*_cse111 + 0.3960285*_cse112 + 0.239041914*_cse113 + 0.408002994597976*_cse191 - 0.408002994597976*_cse192 + 0.574238819026787*_cse77 - 0.574238819026787*_cse80
+    out[3, 5] = 0.227149603970304*_cse110 + 0.137106991283212*_cse111 + 0.227149603970304*_cse112 + 0.137106991283212*_cse113 + _cse114*_cse193 - _cse114*_cse194 + _cse114*_cse195 - _cse121*_cse196 - _cse121*_cse197 + _cse121*_cse198 + 0.234017800844203*_cse191 - 0.234017800844203*_cse192 + 0.329365488408814*_cse77 - 0.329365488408814*_cse80
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse41
+    out[4, 4] = 0.574238819026787*_cse10 + 0.408002994597976*_cse27 + 0.3960285*_cse30 + 0.239041914*_cse32 + 0.3960285*_cse34 + 0.239041914*_cse36 - 0.574238819026787*_cse41 - 0.408002994597976*_cse50
+    out[4, 5] = 0.329365488408814*_cse10 + _cse193*_cse42 - _cse194*_cse42 + _cse195*_cse42 - _cse196*_cse51 - _cse197*_cse51 + _cse198*_cse51 + 0.234017800844203*_cse27 + 0.227149603970304*_cse30 + 0.137106991283212*_cse32 + 0.227149603970304*_cse34 + 0.137106991283212*_cse36 - 0.329365488408814*_cse41 - 0.234017800844203*_cse50
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + 0.239041914*_cse185 + 0.239041914*_cse186 + 0.3960285*_cse188 + 0.3960285*_cse189 + 0.408002994597976*_cse199 - 0.408002994597976*_cse200 - 0.574238819026787*_cse6
+    out[5, 5] = -0.329365488408814*_cse11 + 0.137106991283212*_cse185 + 0.137106991283212*_cse186 + _cse187*_cse193 - _cse187*_cse194 + _cse187*_cse195 + 0.227149603970304*_cse188 + 0.227149603970304*_cse189 - _cse190*_cse196 - _cse190*_cse197 + _cse190*_cse198 + 0.234017800844203*_cse199 - 0.234017800844203*_cse200 - 0.329365488408814*_cse6
+    return out
+
+
+# joint5[0,0,0]_dJ
+def function20(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = 6.57617443000635e-7*_cse0
+    _cse2 = math.sin(q0)
+    _cse3 = 0.999999998572139*_cse2
+    _cse4 = math.sin(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse4*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = math.cos(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = _cse3*_cse6 + _cse3*_cse9
+    _cse11 = -_cse1 + _cse10
+    _cse12 = math.sin(q3)
+    _cse13 = math.cos(q3)
+    _cse14 = 0.75940555*_cse12 - 0.51802699*_cse13
+    _cse15 = _cse11*_cse14
+    _cse16 = 0.999999998572139*_cse0
+    _cse17 = 6.57617443000635e-7*_cse2
+    _cse18 = _cse17*_cse6 + _cse17*_cse9
+    _cse19 = _cse16 + _cse18
+    _cse20 = 0.51802699*_cse12 + 0.75940555*_cse13
+    _cse21 = -_cse20
+    _cse22 = _cse19*_cse21
+    _cse23 = 0.45991232*_cse12 + 0.85536427*_cse13
+    _cse24 = _cse11*_cse23
+    _cse25 = 0.85536427*_cse12 - 0.45991232*_cse13
+    _cse26 = _cse19*_cse25
+    _cse27 = _cse5*_cse7
+    _cse28 = 0.000346321299837637*_cse27
+    _cse29 = _cse2*_cse28
+    _cse30 = _cse4*_cse8
+    _cse31 = 0.000346321299837637*_cse30
+    _cse32 = _cse2*_cse31
+    _cse33 = _cse29 - _cse32
+    _cse34 = 0.517383113*_cse15 + 0.517383113*_cse22 - 0.855753802*_cse24 - 0.855753802*_cse26 + _cse33
+    _cse35 = math.cos(q4)
+    _cse36 = 0.01718495619792*_cse35
+    _cse37 = math.sin(q4)
+    _cse38 = -0.40329059*_cse35 + 0.89059413*_cse37
+    _cse39 = -_cse38
+    _cse40 = 0.0019534*_cse39
+    _cse41 = 0.78972966*_cse35 + 0.45479896*_cse37
+    _cse42 = -_cse41
+    _cse43 = -0.012272*_cse35 + 0.00052974*_cse37
+    _cse44 = 0.212878838804554*_cse13
+    _cse45 = _cse19*_cse44
+    _cse46 = 0.212878838804554*_cse12
+    _cse47 = _cse11*_cse46
+    _cse48 = 0.818687841791724*_cse30
+    _cse49 = _cse2*_cse48
+    _cse50 = 0.818687841791724*_cse27
+    _cse51 = _cse2*_cse50
+    _cse52 = _cse49 - _cse51
+    _cse53 = 0.758601438*_cse15 + 0.758601438*_cse22 + 0.458851168*_cse24 + 0.458851168*_cse26 + _cse45 - _cse47 + _cse52
+    _cse54 = 0.01718495619792*_cse37
+    _cse55 = -0.45479896*_cse35 + 0.78972966*_cse37
+    _cse56 = -_cse55
+    _cse57 = 0.89059413*_cse35 + 0.40329059*_cse37
+    _cse58 = 0.0019534*_cse57
+    _cse59 = 0.00052974*_cse35 + 0.012272*_cse37
+    _cse60 = -_cse59
+    _cse61 = -_cse34*_cse36 - _cse34*_cse40 + 0.0050298*_cse34*_cse42 + _cse34*_cse43 - _cse53*_cse54 + 0.0050298*_cse53*_cse56 - _cse53*_cse58 + _cse53*_cse60
+    _cse62 = _cse12*_cse19
+    _cse63 = _cse11*_cse13
+    _cse64 = -_cse25
+    _cse65 = _cse11*_cse64
+    _cse66 = _cse19*_cse23
+    _cse67 = _cse11*_cse20
+    _cse68 = _cse14*_cse19
+    _cse69 = 0.012581*_cse12 + 0.00040053*_cse13
+    _cse70 = -_cse69
+    _cse71 = 0.00040053*_cse12 - 0.012581*_cse13
+    _cse72 = 0.517383113*_cse11*_cse20 + 0.517383113*_cse14*_cse19 - 0.855753802*_cse65 - 0.855753802*_cse66
+    _cse73 = -0.212878838804554*_cse62 - 0.212878838804554*_cse63 + 0.458851168*_cse65 + 0.458851168*_cse66 + 0.758601438*_cse67 + 0.758601438*_cse68
+    _cse74 = 0.0019534*_cse38
+    _cse75 = -_cse43
+    _cse76 = _cse11*_cse71 + _cse19*_cse70 + 0.01718495619792*_cse35*_cse73 + 0.0050298*_cse41*_cse73 - _cse54*_cse72 + 0.0050298*_cse56*_cse72 - _cse58*_cse72 + _cse60*_cse72 - 0.0439876856535455*_cse62 - 0.0439876856535455*_cse63 - 0.0181297165934418*_cse65 - 0.0181297165934418*_cse66 - 0.0309919044627574*_cse67 - 0.0309919044627574*_cse68 - _cse73*_cse74 + _cse73*_cse75
+    _cse77 = _cse2*_cse4
+    _cse78 = _cse5*_cse77
+    _cse79 = 0.818687841791724*_cse78
+    _cse80 = _cse2*_cse7
+    _cse81 = _cse8*_cse80
+    _cse82 = 0.818687841791724*_cse81
+    _cse83 = _cse17*_cse30 - 6.57617443000635e-7*_cse2*_cse5*_cse7
+    _cse84 = _cse13*_cse83
+    _cse85 = -0.999999998572139*_cse2*_cse5*_cse7 + _cse3*_cse30
+    _cse86 = _cse12*_cse85
+    _cse87 = _cse21*_cse83
+    _cse88 = _cse25*_cse83
+    _cse89 = _cse23*_cse85
+    _cse90 = _cse14*_cse85
+    _cse91 = -_cse79 - _cse82 + 0.212878838804554*_cse84 - 0.212878838804554*_cse86 + 0.758601438*_cse87 + 0.458851168*_cse88 + 0.458851168*_cse89 + 0.758601438*_cse90
+    _cse92 = -_cse71
+    _cse93 = 0.000346321299837637*_cse78 + 0.000346321299837637*_cse81
+    _cse94 = 0.517383113*_cse87 - 0.855753802*_cse88 - 0.855753802*_cse89 + 0.517383113*_cse90 + _cse93
+    _cse95 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse96 = _cse7*_cse95
+    _cse97 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse98 = _cse4*_cse97
+    _cse99 = 0.0038906673398998*_cse30
+    _cse100 = 0.0038906673398998*_cse27
+    _cse101 = -_cse100*_cse2 + _cse2*_cse98 + _cse2*_cse99 + 0.227539183449751*_cse78 + 0.227539183449751*_cse81
+    _cse102 = -_cse101 + 0.0439876856535455*_cse13*_cse83 - _cse2*_cse96 + 0.01718495619792*_cse35*_cse91 + 0.0050298*_cse41*_cse91 - _cse54*_cse94 + 0.0050298*_cse56*_cse94 - _cse58*_cse94 + _cse60*_cse94 + _cse70*_cse85 - _cse74*_cse91 + _cse75*_cse91 + _cse83*_cse92 - 0.0439876856535455*_cse86 - 0.0309919044627574*_cse87 - 0.0181297165934418*_cse88 - 0.0181297165934418*_cse89 - 0.0309919044627574*_cse90
+    _cse103 = 0.0019519*_cse4 - 0.20902*_cse7
+    _cse104 = -_cse85
+    _cse105 = _cse104*_cse12
+    _cse106 = -_cse83
+    _cse107 = _cse106*_cse13
+    _cse108 = _cse104*_cse23
+    _cse109 = _cse104*_cse14
+    _cse110 = _cse106*_cse21
+    _cse111 = _cse106*_cse25
+    _cse112 = -0.212878838804554*_cse105 + 0.212878838804554*_cse107 + 0.458851168*_cse108 + 0.758601438*_cse109 + 0.758601438*_cse110 + 0.458851168*_cse111 + _cse79 + _cse82
+    _cse113 = 0.517383113*_cse104*_cse14 + 0.517383113*_cse106*_cse21 - 0.855753802*_cse108 - 0.855753802*_cse111 - _cse93
+    _cse114 = 0.0050298*_cse56
+    _cse115 = 0.0050298*_cse41
+    _cse116 = -_cse95
+    _cse117 = _cse116*_cse7
+    _cse118 = _cse101 + _cse103*_cse2 + _cse104*_cse70 - 0.0439876856535455*_cse105 + _cse106*_cse92 + 0.0439876856535455*_cse107 - 0.0181297165934418*_cse108 - 0.0309919044627574*_cse109 - 0.0309919044627574*_cse110 - 0.0181297165934418*_cse111 + _cse112*_cse115 + _cse112*_cse36 - _cse112*_cse74 + _cse112*_cse75 + _cse113*_cse114 - _cse113*_cse54 - _cse113*_cse58 + _cse113*_cse60 - _cse117*_cse2 - 1.098e-6*_cse77 - 0.20503*_cse80
+    _cse119 = _cse16*_cse6 + _cse16*_cse9
+    _cse120 = _cse119 + _cse17
+    _cse121 = _cse120*_cse14
+    _cse122 = _cse1*_cse6 + _cse1*_cse9
+    _cse123 = _cse122 - _cse3
+    _cse124 = _cse123*_cse21
+    _cse125 = _cse123*_cse13
+    _cse126 = _cse120*_cse23
+    _cse127 = _cse123*_cse25
+    _cse128 = _cse12*_cse120
+    _cse129 = _cse0*_cse48
+    _cse130 = _cse0*_cse50
+    _cse131 = _cse129 - _cse130
+    _cse132 = 0.758601438*_cse121 + 0.758601438*_cse124 + 0.212878838804554*_cse125 + 0.458851168*_cse126 + 0.458851168*_cse127 - 0.212878838804554*_cse128 + _cse131
+    _cse133 = 0.20902*_cse4 + 0.0019519*_cse7
+    _cse134 = -_cse133
+    _cse135 = _cse0*_cse28
+    _cse136 = _cse0*_cse31
+    _cse137 = _cse135 - _cse136
+    _cse138 = 0.517383113*_cse121 + 0.517383113*_cse124 - 0.855753802*_cse126 - 0.855753802*_cse127 + _cse137
+    _cse139 = _cse0*_cse7
+    _cse140 = _cse139*_cse97
+    _cse141 = _cse139*_cse8
+    _cse142 = 0.0038906673398998*_cse141
+    _cse143 = _cse0*_cse4
+    _cse144 = _cse143*_cse5
+    _cse145 = 0.0038906673398998*_cse144
+    _cse146 = _cse0*_cse27
+    _cse147 = 0.227539183449751*_cse146
+    _cse148 = _cse0*_cse30
+    _cse149 = -0.227539183449751*_cse148
+    _cse150 = -1.098e-6*_cse0*_cse7 + _cse116*_cse143 + _cse140 + _cse142 + 0.20503*_cse143 + _cse145 + _cse147 + _cse149
+    _cse151 = -_cse16*_cse27 + _cse16*_cse30
+    _cse152 = _cse14*_cse151
+    _cse153 = -_cse1*_cse27 + _cse1*_cse30
+    _cse154 = _cse153*_cse21
+    _cse155 = _cse151*_cse23
+    _cse156 = _cse153*_cse25
+    _cse157 = 0.000346321299837637*_cse141 + 0.000346321299837637*_cse144
+    _cse158 = 0.517383113*_cse152 + 0.517383113*_cse154 - 0.855753802*_cse155 - 0.855753802*_cse156 + _cse157
+    _cse159 = 0.818687841791724*_cse144
+    _cse160 = 0.818687841791724*_cse141
+    _cse161 = -_cse151*_cse46 + 0.758601438*_cse152 + _cse153*_cse44 + 0.758601438*_cse154 + 0.458851168*_cse155 + 0.458851168*_cse156 - _cse159 - _cse160
+    _cse162 = -_cse158*_cse36 - _cse158*_cse40 + 0.0050298*_cse158*_cse42 + _cse158*_cse43 - _cse161*_cse54 + 0.0050298*_cse161*_cse56 - _cse161*_cse58 + _cse161*_cse60
+    _cse163 = 0.0439876856535455*_cse12
+    _cse164 = 0.0439876856535455*_cse13
+    _cse165 = _cse153*_cse23
+    _cse166 = _cse14*_cse153
+    _cse167 = _cse151*_cse64
+    _cse168 = _cse151*_cse20
+    _cse169 = 0.517383113*_cse14*_cse153 + 0.517383113*_cse151*_cse20 - 0.855753802*_cse165 - 0.855753802*_cse167
+    _cse170 = -_cse151*_cse44 - _cse153*_cse46 + 0.458851168*_cse165 + 0.758601438*_cse166 + 0.458851168*_cse167 + 0.758601438*_cse168
+    _cse171 = -_cse151*_cse164 + _cse151*_cse71 - _cse153*_cse163 + _cse153*_cse70 - 0.0181297165934418*_cse165 - 0.0309919044627574*_cse166 - 0.0181297165934418*_cse167 - 0.0309919044627574*_cse168 - _cse169*_cse54 + 0.0050298*_cse169*_cse56 - _cse169*_cse58 + _cse169*_cse60 + 0.01718495619792*_cse170*_cse35 + 0.0050298*_cse170*_cse41 - _cse170*_cse74 + _cse170*_cse75
+    _cse172 = -_cse119
+    _cse173 = _cse14*_cse172
+    _cse174 = -_cse122
+    _cse175 = _cse174*_cse21
+    _cse176 = _cse172*_cse23
+    _cse177 = _cse174*_cse25
+    _cse178 = -_cse129 + _cse130
+    _cse179 = -_cse172*_cse46 + 0.758601438*_cse173 + _cse174*_cse44 + 0.758601438*_cse175 + 0.458851168*_cse176 + 0.458851168*_cse177 + _cse178
+    _cse180 = -_cse137 + 0.517383113*_cse14*_cse172 + 0.517383113*_cse174*_cse21 - 0.855753802*_cse176 - 0.855753802*_cse177
+    _cse181 = _cse142 - _cse143*_cse95 + _cse145 + _cse147 + _cse149
+    _cse182 = _cse114*_cse180 + _cse115*_cse179 + _cse140 - _cse163*_cse172 + _cse164*_cse174 + _cse172*_cse70 - 0.0309919044627574*_cse173 + _cse174*_cse92 - 0.0309919044627574*_cse175 - 0.0181297165934418*_cse176 - 0.0181297165934418*_cse177 + _cse179*_cse36 - _cse179*_cse74 + _cse179*_cse75 - _cse180*_cse54 - _cse180*_cse58 + _cse180*_cse60 + _cse181
+    _cse183 = _cse119*_cse14
+    _cse184 = _cse122*_cse21
+    _cse185 = _cse119*_cse23
+    _cse186 = _cse122*_cse25
+    _cse187 = -_cse119*_cse46 + _cse122*_cse44 + _cse131 + 0.758601438*_cse183 + 0.758601438*_cse184 + 0.458851168*_cse185 + 0.458851168*_cse186
+    _cse188 = _cse137 + 0.517383113*_cse183 + 0.517383113*_cse184 - 0.855753802*_cse185 - 0.855753802*_cse186
+    _cse189 = _cse119*_cse163 - _cse119*_cse70 - 0.0439876856535455*_cse122*_cse13 - _cse122*_cse92 + 0.0309919044627574*_cse183 + 0.0309919044627574*_cse184 + 0.0181297165934418*_cse185 + 0.0181297165934418*_cse186 - 0.01718495619792*_cse187*_cse35 - 0.0050298*_cse187*_cse41 + _cse187*_cse74 - _cse187*_cse75 + _cse188*_cse54 - 0.0050298*_cse188*_cse56 + _cse188*_cse58 - _cse188*_cse60
+    _cse190 = -_cse151
+    _cse191 = _cse190*_cse23
+    _cse192 = -_cse153
+    _cse193 = _cse192*_cse25
+    _cse194 = 0.517383113*_cse14*_cse190 - _cse157 - 0.855753802*_cse191 + 0.517383113*_cse192*_cse21 - 0.855753802*_cse193
+    _cse195 = _cse14*_cse190
+    _cse196 = _cse192*_cse21
+    _cse197 = _cse159 + _cse160 - _cse190*_cse46 + 0.458851168*_cse191 + _cse192*_cse44 + 0.458851168*_cse193 + 0.758601438*_cse195 + 0.758601438*_cse196
+    _cse198 = -_cse194*_cse36 - _cse194*_cse40 + 0.0050298*_cse194*_cse42 + _cse194*_cse43 - _cse197*_cse54 + 0.0050298*_cse197*_cse56 - _cse197*_cse58 + _cse197*_cse60
+    _cse199 = _cse190*_cse64
+    _cse200 = _cse190*_cse20
+    _cse201 = _cse192*_cse23
+    _cse202 = _cse14*_cse192
+    _cse203 = 0.517383113*_cse14*_cse192 + 0.517383113*_cse190*_cse20 - 0.855753802*_cse199 - 0.855753802*_cse201
+    _cse204 = -_cse190*_cse44 - _cse192*_cse46 + 0.458851168*_cse199 + 0.758601438*_cse200 + 0.458851168*_cse201 + 0.758601438*_cse202
+    _cse205 = -_cse163*_cse192 - _cse164*_cse190 + _cse190*_cse71 + _cse192*_cse70 - 0.0181297165934418*_cse199 - 0.0309919044627574*_cse200 - 0.0181297165934418*_cse201 - 0.0309919044627574*_cse202 - _cse203*_cse54 + 0.0050298*_cse203*_cse56 - _cse203*_cse58 + _cse203*_cse60 + 0.01718495619792*_cse204*_cse35 + 0.0050298*_cse204*_cse41 - _cse204*_cse74 + _cse204*_cse75
+    _cse206 = -_cse97
+    _cse207 = -_cse120
+    _cse208 = _cse207*_cse64
+    _cse209 = -_cse123
+    _cse210 = _cse209*_cse23
+    _cse211 = 0.517383113*_cse14*_cse209 + 0.517383113*_cse20*_cse207 - 0.855753802*_cse208 - 0.855753802*_cse210
+    _cse212 = _cse20*_cse207
+    _cse213 = _cse14*_cse209
+    _cse214 = -_cse207*_cse44 + 0.458851168*_cse208 - _cse209*_cse46 + 0.458851168*_cse210 + 0.758601438*_cse212 + 0.758601438*_cse213
+    _cse215 = -_cse211*_cse36 - _cse211*_cse40 + 0.0050298*_cse211*_cse42 + _cse211*_cse43 - _cse214*_cse54 + 0.0050298*_cse214*_cse56 - _cse214*_cse58 + _cse214*_cse60
+    _cse216 = _cse209*_cse64
+    _cse217 = -_cse14
+    _cse218 = _cse207*_cse217
+    _cse219 = -_cse23
+    _cse220 = _cse207*_cse219
+    _cse221 = _cse20*_cse209
+    _cse222 = 0.517383113*_cse20*_cse209 + 0.517383113*_cse207*_cse217 - 0.855753802*_cse216 - 0.855753802*_cse220
+    _cse223 = _cse207*_cse46
+    _cse224 = _cse209*_cse44
+    _cse225 = 0.458851168*_cse216 + 0.758601438*_cse218 + 0.458851168*_cse220 + 0.758601438*_cse221 + _cse223 - _cse224
+    _cse226 = _cse209*_cse21
+    _cse227 = _cse207*_cse23
+    _cse228 = _cse14*_cse207
+    _cse229 = _cse209*_cse25
+    _cse230 = -_cse135 + _cse136 + 0.517383113*_cse226 - 0.855753802*_cse227 + 0.517383113*_cse228 - 0.855753802*_cse229
+    _cse231 = -0.0019534*_cse57
+    _cse232 = 0.0050298*_cse55
+    _cse233 = _cse178 - _cse223 + _cse224 + 0.758601438*_cse226 + 0.458851168*_cse227 + 0.758601438*_cse228 + 0.458851168*_cse229
+    _cse234 = 0.0050298*_cse42
+    _cse235 = -_cse132*_cse54 + 0.0050298*_cse132*_cse56 - _cse132*_cse58 + _cse132*_cse60 - _cse138*_cse36 - _cse138*_cse40 + 0.0050298*_cse138*_cse42 + _cse138*_cse43
+    _cse236 = _cse120*_cse64
+    _cse237 = _cse123*_cse23
+    _cse238 = _cse120*_cse20
+    _cse239 = _cse123*_cse14
+    _cse240 = 0.517383113*_cse120*_cse20 + 0.517383113*_cse123*_cse14 - 0.855753802*_cse236 - 0.855753802*_cse237
+    _cse241 = -_cse120*_cse44 - _cse123*_cse46 + 0.458851168*_cse236 + 0.458851168*_cse237 + 0.758601438*_cse238 + 0.758601438*_cse239
+    _cse242 = -_cse120*_cse164 + _cse120*_cse71 - _cse123*_cse163 + _cse123*_cse70 - 0.0181297165934418*_cse236 - 0.0181297165934418*_cse237 - 0.0309919044627574*_cse238 - 0.0309919044627574*_cse239 - _cse240*_cse54 + 0.0050298*_cse240*_cse56 - _cse240*_cse58 + _cse240*_cse60 + 0.01718495619792*_cse241*_cse35 + 0.0050298*_cse241*_cse41 - _cse241*_cse74 + _cse241*_cse75
+    _cse243 = -_cse0*_cse100 + _cse0*_cse98 + _cse0*_cse99 + 0.227539183449751*_cse141 + 0.227539183449751*_cse144
+    _cse244 = -_cse0*_cse96 + 0.0439876856535455*_cse13*_cse153 - _cse151*_cse163 + _cse151*_cse70 - 0.0309919044627574*_cse152 + _cse153*_cse92 - 0.0309919044627574*_cse154 - 0.0181297165934418*_cse155 - 0.0181297165934418*_cse156 - _cse158*_cse54 + 0.0050298*_cse158*_cse56 - _cse158*_cse58 + _cse158*_cse60 + 0.01718495619792*_cse161*_cse35 + 0.0050298*_cse161*_cse41 - _cse161*_cse74 + _cse161*_cse75 - _cse243
+    _cse245 = _cse0*_cse103 - _cse0*_cse117 + _cse114*_cse194 + _cse115*_cse197 - 0.20503*_cse139 - 1.098e-6*_cse143 - _cse163*_cse190 + _cse164*_cse192 + _cse190*_cse70 - 0.0181297165934418*_cse191 + _cse192*_cse92 - 0.0181297165934418*_cse193 - _cse194*_cse54 - _cse194*_cse58 + _cse194*_cse60 - 0.0309919044627574*_cse195 - 0.0309919044627574*_cse196 + _cse197*_cse36 - _cse197*_cse74 + _cse197*_cse75 + _cse243
+    _cse246 = -_cse11
+    _cse247 = _cse14*_cse246
+    _cse248 = -_cse19
+    _cse249 = _cse21*_cse248
+    _cse250 = _cse23*_cse246
+    _cse251 = _cse248*_cse25
+    _cse252 = -_cse49 + _cse51
+    _cse253 = -_cse246*_cse46 + 0.758601438*_cse247 + _cse248*_cse44 + 0.758601438*_cse249 + 0.458851168*_cse250 + 0.458851168*_cse251 + _cse252
+    _cse254 = 0.517383113*_cse247 + 0.517383113*_cse249 - 0.855753802*_cse250 - 0.855753802*_cse251 - _cse29 + _cse32
+    _cse255 = _cse80*_cse97
+    _cse256 = 0.0038906673398998*_cse81
+    _cse257 = 0.0038906673398998*_cse78
+    _cse258 = _cse2*_cse27
+    _cse259 = 0.227539183449751*_cse258
+    _cse260 = _cse2*_cse30
+    _cse261 = -0.227539183449751*_cse260
+    _cse262 = _cse116*_cse77 + _cse255 + _cse256 + _cse257 + _cse259 + _cse261 + 0.20503*_cse77 - 1.098e-6*_cse80
+    _cse263 = -_cse112*_cse54 + 0.0050298*_cse112*_cse56 - _cse112*_cse58 + _cse112*_cse60 - _cse113*_cse36 - _cse113*_cse40 + 0.0050298*_cse113*_cse42 + _cse113*_cse43
+    _cse264 = _cse104*_cse64
+    _cse265 = _cse104*_cse20
+    _cse266 = _cse106*_cse23
+    _cse267 = _cse106*_cse14
+    _cse268 = 0.517383113*_cse104*_cse20 + 0.517383113*_cse106*_cse14 - 0.855753802*_cse264 - 0.855753802*_cse266
+    _cse269 = -_cse104*_cse44 - _cse106*_cse46 + 0.458851168*_cse264 + 0.758601438*_cse265 + 0.458851168*_cse266 + 0.758601438*_cse267
+    _cse270 = -_cse104*_cse164 + _cse104*_cse71 - _cse106*_cse163 + _cse106*_cse70 - 0.0181297165934418*_cse264 - 0.0309919044627574*_cse265 - 0.0181297165934418*_cse266 - 0.0309919044627574*_cse267 - _cse268*_cse54 + 0.0050298*_cse268*_cse56 - _cse268*_cse58 + _cse268*_cse60 + 0.01718495619792*_cse269*_cse35 + 0.0050298*_cse269*_cse41 - _cse269*_cse74 + _cse269*_cse75
+    _cse271 = _cse10*_cse14
+    _cse272 = _cse18*_cse21
+    _cse273 = _cse10*_cse23
+    _cse274 = _cse18*_cse25
+    _cse275 = -_cse10*_cse46 + _cse18*_cse44 + 0.758601438*_cse271 + 0.758601438*_cse272 + 0.458851168*_cse273 + 0.458851168*_cse274 + _cse52
+    _cse276 = 0.517383113*_cse271 + 0.517383113*_cse272 - 0.855753802*_cse273 - 0.855753802*_cse274 + _cse33
+    _cse277 = _cse256 + _cse257 + _cse259 + _cse261 - _cse77*_cse95
+    _cse278 = -_cse10*_cse163 + _cse10*_cse70 + 0.0439876856535455*_cse13*_cse18 + _cse18*_cse92 - _cse255 - 0.0309919044627574*_cse271 - 0.0309919044627574*_cse272 - 0.0181297165934418*_cse273 - 0.0181297165934418*_cse274 + 0.01718495619792*_cse275*_cse35 + 0.0050298*_cse275*_cse41 - _cse275*_cse74 + _cse275*_cse75 - _cse276*_cse54 + 0.0050298*_cse276*_cse56 - _cse276*_cse58 + _cse276*_cse60 - _cse277
+    _cse279 = -_cse10
+    _cse280 = _cse14*_cse279
+    _cse281 = -_cse18
+    _cse282 = _cse21*_cse281
+    _cse283 = _cse23*_cse279
+    _cse284 = _cse25*_cse281
+    _cse285 = _cse252 - _cse279*_cse46 + 0.758601438*_cse280 + _cse281*_cse44 + 0.758601438*_cse282 + 0.458851168*_cse283 + 0.458851168*_cse284
+    _cse286 = 0.517383113*_cse14*_cse279 + 0.517383113*_cse21*_cse281 - 0.855753802*_cse283 - 0.855753802*_cse284 - _cse33
+    _cse287 = _cse114*_cse286 + _cse115*_cse285 - _cse163*_cse279 + _cse164*_cse281 + _cse279*_cse70 - 0.0309919044627574*_cse280 + _cse281*_cse92 - 0.0309919044627574*_cse282 - 0.0181297165934418*_cse283 - 0.0181297165934418*_cse284 + _cse285*_cse36 - _cse285*_cse74 + _cse285*_cse75 - _cse286*_cse54 - _cse286*_cse58 + _cse286*_cse60
+    _cse288 = -_cse36*_cse94 - _cse40*_cse94 + 0.0050298*_cse42*_cse94 + _cse43*_cse94 - _cse54*_cse91 + 0.0050298*_cse56*_cse91 - _cse58*_cse91 + _cse60*_cse91
+    _cse289 = _cse23*_cse83
+    _cse290 = _cse14*_cse83
+    _cse291 = _cse64*_cse85
+    _cse292 = _cse20*_cse85
+    _cse293 = 0.517383113*_cse14*_cse83 + 0.517383113*_cse20*_cse85 - 0.855753802*_cse289 - 0.855753802*_cse291
+    _cse294 = 0.458851168*_cse289 + 0.758601438*_cse290 + 0.458851168*_cse291 + 0.758601438*_cse292 - _cse44*_cse85 - _cse46*_cse83
+    _cse295 = -_cse163*_cse83 - _cse164*_cse85 - 0.0181297165934418*_cse289 - 0.0309919044627574*_cse290 - 0.0181297165934418*_cse291 - 0.0309919044627574*_cse292 - _cse293*_cse54 + 0.0050298*_cse293*_cse56 - _cse293*_cse58 + _cse293*_cse60 + 0.01718495619792*_cse294*_cse35 + 0.0050298*_cse294*_cse41 - _cse294*_cse74 + _cse294*_cse75 + _cse70*_cse83 + _cse71*_cse85
+    _cse296 = -_cse36*_cse72 - _cse40*_cse72 + 0.0050298*_cse42*_cse72 + _cse43*_cse72 - _cse54*_cse73 + 0.0050298*_cse56*_cse73 - _cse58*_cse73 + _cse60*_cse73
+    _cse297 = _cse19*_cse64
+    _cse298 = _cse11*_cse217
+    _cse299 = _cse11*_cse219
+    _cse300 = _cse19*_cse20
+    _cse301 = 0.517383113*_cse11*_cse217 + 0.517383113*_cse19*_cse20 - 0.855753802*_cse297 - 0.855753802*_cse299
+    _cse302 = 0.458851168*_cse297 + 0.758601438*_cse298 + 0.458851168*_cse299 + 0.758601438*_cse300 - _cse45 + _cse47
+    _cse303 = 0.999999998572139*_cse6 + 0.999999998572139*_cse9
+    _cse304 = -_cse303
+    _cse305 = _cse23*_cse304
+    _cse306 = 6.57617443000635e-7*_cse6 + 6.57617443000635e-7*_cse9
+    _cse307 = -_cse306
+    _cse308 = _cse25*_cse307
+    _cse309 = _cse28 - _cse31
+    _cse310 = 0.517383113*_cse14*_cse304 + 0.517383113*_cse21*_cse307 - 0.855753802*_cse305 - 0.855753802*_cse308 - _cse309
+    _cse311 = _cse14*_cse304
+    _cse312 = _cse21*_cse307
+    _cse313 = -_cse304*_cse46 + 0.458851168*_cse305 + _cse307*_cse44 + 0.458851168*_cse308 + 0.758601438*_cse311 + 0.758601438*_cse312 - _cse48 + _cse50
+    _cse314 = -_cse310*_cse36 - _cse310*_cse40 + 0.0050298*_cse310*_cse42 + _cse310*_cse43 - _cse313*_cse54 + 0.0050298*_cse313*_cse56 - _cse313*_cse58 + _cse313*_cse60
+    _cse315 = _cse304*_cse64
+    _cse316 = _cse20*_cse304
+    _cse317 = _cse23*_cse307
+    _cse318 = _cse14*_cse307
+    _cse319 = 0.517383113*_cse14*_cse307 + 0.517383113*_cse20*_cse304 - 0.855753802*_cse315 - 0.855753802*_cse317
+    _cse320 = -_cse304*_cse44 - _cse307*_cse46 + 0.458851168*_cse315 + 0.758601438*_cse316 + 0.458851168*_cse317 + 0.758601438*_cse318
+    _cse321 = -_cse163*_cse307 - _cse164*_cse304 + _cse304*_cse71 + _cse307*_cse70 - 0.0181297165934418*_cse315 - 0.0309919044627574*_cse316 - 0.0181297165934418*_cse317 - 0.0309919044627574*_cse318 - _cse319*_cse54 + 0.0050298*_cse319*_cse56 - _cse319*_cse58 + _cse319*_cse60 + 0.01718495619792*_cse320*_cse35 + 0.0050298*_cse320*_cse41 - _cse320*_cse74 + _cse320*_cse75
+    _cse322 = 0.818687841791724*_cse6
+    _cse323 = 0.818687841791724*_cse9
+    _cse324 = -0.999999998572139*_cse27 + 0.999999998572139*_cse30
+    _cse325 = -_cse324
+    _cse326 = _cse325*_cse46
+    _cse327 = -6.57617443000635e-7*_cse27 + 6.57617443000635e-7*_cse30
+    _cse328 = -_cse327
+    _cse329 = _cse328*_cse44
+    _cse330 = _cse23*_cse325
+    _cse331 = _cse14*_cse325
+    _cse332 = _cse21*_cse328
+    _cse333 = _cse25*_cse328
+    _cse334 = _cse322 + _cse323 - _cse326 + _cse329 + 0.458851168*_cse330 + 0.758601438*_cse331 + 0.758601438*_cse332 + 0.458851168*_cse333
+    _cse335 = 0.000346321299837637*_cse6 + 0.000346321299837637*_cse9
+    _cse336 = 0.517383113*_cse14*_cse325 + 0.517383113*_cse21*_cse328 - 0.855753802*_cse330 - 0.855753802*_cse333 - _cse335
+    _cse337 = _cse334*_cse36
+    _cse338 = _cse336*_cse54
+    _cse339 = -_cse163*_cse325 + _cse164*_cse328
+    _cse340 = 0.227539183449751*_cse9
+    _cse341 = 0.227539183449751*_cse6
+    _cse342 = -_cse100
+    _cse343 = _cse340 + _cse341 + _cse342 + _cse96 + _cse99
+    _cse344 = _cse114*_cse336 + _cse115*_cse334 + _cse325*_cse70 + _cse328*_cse92 - 0.0181297165934418*_cse330 - 0.0309919044627574*_cse331 - 0.0309919044627574*_cse332 - 0.0181297165934418*_cse333 - _cse334*_cse74 + _cse334*_cse75 - _cse336*_cse58 + _cse336*_cse60 + _cse337 - _cse338 + _cse339 + _cse343 + _cse98
+    _cse345 = _cse21*_cse327
+    _cse346 = _cse25*_cse327
+    _cse347 = _cse23*_cse324
+    _cse348 = _cse14*_cse324
+    _cse349 = -_cse322 - _cse323 - _cse324*_cse46 + _cse327*_cse44 + 0.758601438*_cse345 + 0.458851168*_cse346 + 0.458851168*_cse347 + 0.758601438*_cse348
+    _cse350 = _cse335 + 0.517383113*_cse345 - 0.855753802*_cse346 - 0.855753802*_cse347 + 0.517383113*_cse348
+    _cse351 = -0.0439876856535455*_cse13*_cse327 + _cse163*_cse324 - _cse324*_cse70 - _cse327*_cse92 + 0.0309919044627574*_cse345 + 0.0181297165934418*_cse346 + 0.0181297165934418*_cse347 + 0.0309919044627574*_cse348 - 0.01718495619792*_cse349*_cse35 - 0.0050298*_cse349*_cse41 + _cse349*_cse74 - _cse349*_cse75 + _cse350*_cse54 - 0.0050298*_cse350*_cse56 + _cse350*_cse58 - _cse350*_cse60
+    _cse352 = _cse14*_cse303
+    _cse353 = _cse21*_cse306
+    _cse354 = _cse23*_cse303
+    _cse355 = _cse25*_cse306
+    _cse356 = _cse309 + 0.517383113*_cse352 + 0.517383113*_cse353 - 0.855753802*_cse354 - 0.855753802*_cse355
+    _cse357 = -_cse303*_cse46 + _cse306*_cse44 + 0.758601438*_cse352 + 0.758601438*_cse353 + 0.458851168*_cse354 + 0.458851168*_cse355 + _cse48 - _cse50
+    _cse358 = -_cse356*_cse36 - _cse356*_cse40 + 0.0050298*_cse356*_cse42 + _cse356*_cse43 - _cse357*_cse54 + 0.0050298*_cse357*_cse56 - _cse357*_cse58 + _cse357*_cse60
+    _cse359 = _cse23*_cse306
+    _cse360 = _cse14*_cse306
+    _cse361 = _cse303*_cse64
+    _cse362 = _cse20*_cse303
+    _cse363 = 0.517383113*_cse14*_cse306 + 0.517383113*_cse20*_cse303 - 0.855753802*_cse359 - 0.855753802*_cse361
+    _cse364 = -_cse303*_cse44 - _cse306*_cse46 + 0.458851168*_cse359 + 0.758601438*_cse360 + 0.458851168*_cse361 + 0.758601438*_cse362
+    _cse365 = -_cse163*_cse306 - _cse164*_cse303 + _cse303*_cse71 + _cse306*_cse70 + 0.01718495619792*_cse35*_cse364 - 0.0181297165934418*_cse359 - 0.0309919044627574*_cse360 - 0.0181297165934418*_cse361 - 0.0309919044627574*_cse362 - _cse363*_cse54 + 0.0050298*_cse363*_cse56 - _cse363*_cse58 + _cse363*_cse60 + 0.0050298*_cse364*_cse41 - _cse364*_cse74 + _cse364*_cse75
+    _cse366 = _cse325*_cse64
+    _cse367 = _cse23*_cse328
+    _cse368 = 0.517383113*_cse14*_cse328 + 0.517383113*_cse20*_cse325 - 0.855753802*_cse366 - 0.855753802*_cse367
+    _cse369 = _cse20*_cse325
+    _cse370 = _cse14*_cse328
+    _cse371 = -_cse325*_cse44 - _cse328*_cse46 + 0.458851168*_cse366 + 0.458851168*_cse367 + 0.758601438*_cse369 + 0.758601438*_cse370
+    _cse372 = -_cse36*_cse368 - _cse368*_cse40 + 0.0050298*_cse368*_cse42 + _cse368*_cse43 - _cse371*_cse54 + 0.0050298*_cse371*_cse56 - _cse371*_cse58 + _cse371*_cse60
+    _cse373 = _cse217*_cse325
+    _cse374 = _cse219*_cse325
+    _cse375 = _cse328*_cse64
+    _cse376 = _cse20*_cse328
+    _cse377 = _cse326 - _cse329 + 0.758601438*_cse373 + 0.458851168*_cse374 + 0.458851168*_cse375 + 0.758601438*_cse376
+    _cse378 = 0.517383113*_cse373 - 0.855753802*_cse374 - 0.855753802*_cse375 + 0.517383113*_cse376
+    _cse379 = _cse0*dq0
+    _cse380 = _cse141 + _cse144
+    _cse381 = 0.574238819026787*_cse144
+    _cse382 = 0.574238819026787*_cse141
+    _cse383 = 0.408002994597976*_cse13
+    _cse384 = 0.408002994597976*_cse12
+    _cse385 = 0.410149995883665*_cse35
+    _cse386 = 0.209584432*_cse39
+    _cse387 = 0.410879747*_cse42
+    _cse388 = 0.410149995883665*_cse37
+    _cse389 = 0.410879747*_cse56
+    _cse390 = 0.209584432*_cse57
+    _cse391 = 0.329365488408814*_cse144
+    _cse392 = 0.329365488408814*_cse141
+    _cse393 = 0.234017800844203*_cse13
+    _cse394 = 0.234017800844203*_cse12
+    _cse395 = 0.410879747*_cse41
+    _cse396 = 0.209584432*_cse38
+    _cse397 = _cse2*dq0
+    _cse398 = _cse78 + _cse81
+    _cse399 = 0.574238819026787*_cse78
+    _cse400 = 0.574238819026787*_cse81
+    _cse401 = 0.329365488408814*_cse78
+    _cse402 = 0.329365488408814*_cse81
+    _cse403 = -_cse27 + _cse30
+    _cse404 = 0.574238819026787*_cse30
+    _cse405 = 0.574238819026787*_cse27
+    _cse406 = 0.329365488408814*_cse30
+    _cse407 = 0.329365488408814*_cse27
+    out = np.empty((6, 6))
+    out[0, 0] = _cse102*dq2 + _cse118*dq1 + _cse61*dq4 + _cse76*dq3 + dq0*(_cse0*_cse134 - 4.3259e-5*_cse0 + _cse120*_cse70 - 0.0309919044627574*_cse121 + 0.0439876856535455*_cse123*_cse13 + _cse123*_cse92 - 0.0309919044627574*_cse124 - 0.0181297165934418*_cse126 - 0.0181297165934418*_cse127 - 0.0439876856535455*_cse128 + 0.01718495619792*_cse132*_cse35 + 0.0050298*_cse132*_cse41 - _cse132*_cse74 + _cse132*_cse75 - _cse138*_cse54 + 0.0050298*_cse138*_cse56 - _cse138*_cse58 + _cse138*_cse60 - _cse150 + 0.0068032576553314*_cse2)
+    out[0, 1] = _cse118*dq0 + _cse162*dq4 + _cse171*dq3 + _cse182*dq2 + dq1*(-_cse0*_cse133 - _cse150 - _cse189)
+    out[0, 2] = _cse102*dq0 + _cse182*dq1 + _cse198*dq4 + _cse205*dq3 + dq2*(_cse0*_cse206*_cse7 - _cse181 - _cse189)
+    out[0, 3] = _cse171*dq1 + _cse205*dq2 + _cse215*dq4 + _cse76*dq0 + dq3*(0.0439876856535455*_cse12*_cse207 - _cse164*_cse209 + _cse207*_cse69 + _cse209*_cse71 - 0.0181297165934418*_cse216 - 0.0309919044627574*_cse218 - 0.0181297165934418*_cse220 - 0.0309919044627574*_cse221 - _cse222*_cse54 + 0.0050298*_cse222*_cse56 - _cse222*_cse58 + _cse222*_cse60 + 0.01718495619792*_cse225*_cse35 + 0.0050298*_cse225*_cse41 - _cse225*_cse74 + _cse225*_cse75)
+    out[0, 4] = _cse162*dq1 + _cse198*dq2 + _cse215*dq3 + _cse61*dq0 + dq4*(-_cse230*_cse231 + _cse230*_cse232 + _cse230*_cse54 + _cse230*_cse59 + _cse233*_cse234 - _cse233*_cse36 - _cse233*_cse40 + _cse233*_cse43)
+    out[0, 5] = 0
+    out[1, 0] = _cse235*dq4 + _cse242*dq3 + _cse244*dq2 + _cse245*dq1 + dq0*(0.0068032576553314*_cse0 + _cse114*_cse254 + _cse115*_cse253 - _cse134*_cse2 - _cse163*_cse246 + _cse164*_cse248 + 4.3259e-5*_cse2 + _cse246*_cse70 - 0.0309919044627574*_cse247 + _cse248*_cse92 - 0.0309919044627574*_cse249 - 0.0181297165934418*_cse250 - 0.0181297165934418*_cse251 + _cse253*_cse36 - _cse253*_cse74 + _cse253*_cse75 - _cse254*_cse54 - _cse254*_cse58 + _cse254*_cse60 + _cse262)
+    out[1, 1] = _cse245*dq0 + _cse263*dq4 + _cse270*dq3 + _cse278*dq2 + dq1*(_cse133*_cse2 + _cse262 + _cse287)
+    out[1, 2] = _cse244*dq0 + _cse278*dq1 + _cse288*dq4 + _cse295*dq3 + dq2*(-_cse206*_cse80 + _cse277 + _cse287)
+    out[1, 3] = _cse242*dq0 + _cse270*dq1 + _cse295*dq2 + _cse296*dq4 + dq3*(0.0439876856535455*_cse11*_cse12 + _cse11*_cse69 - _cse164*_cse19 + _cse19*_cse71 - 0.0181297165934418*_cse297 - 0.0309919044627574*_cse298 - 0.0181297165934418*_cse299 - 0.0309919044627574*_cse300 - _cse301*_cse54 + 0.0050298*_cse301*_cse56 - _cse301*_cse58 + _cse301*_cse60 + 0.01718495619792*_cse302*_cse35 + 0.0050298*_cse302*_cse41 - _cse302*_cse74 + _cse302*_cse75)
+    out[1, 4] = _cse235*dq0 + _cse263*dq1 + _cse288*dq2 + _cse296*dq3 + dq4*(-_cse231*_cse34 + _cse232*_cse34 + _cse234*_cse53 + _cse34*_cse54 + _cse34*_cse59 - _cse36*_cse53 - _cse40*_cse53 + _cse43*_cse53)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse314*dq4 + _cse321*dq3 + _cse344*dq2 + dq1*(_cse116*_cse7 - _cse340 - _cse341 - _cse342 - _cse351 - 0.001950802*_cse4 + 0.41405*_cse7 - _cse98 - _cse99)
+    out[2, 2] = _cse344*dq1 + _cse358*dq4 + _cse365*dq3 + dq2*(_cse206*_cse4 - _cse343 - _cse351)
+    out[2, 3] = _cse321*dq1 + _cse365*dq2 + _cse372*dq4 + dq3*(_cse325*_cse69 + _cse328*_cse71 - _cse339 + 0.01718495619792*_cse35*_cse377 - 0.0309919044627574*_cse373 - 0.0181297165934418*_cse374 - 0.0181297165934418*_cse375 - 0.0309919044627574*_cse376 + 0.0050298*_cse377*_cse41 - _cse377*_cse74 + _cse377*_cse75 - _cse378*_cse54 + 0.0050298*_cse378*_cse56 - _cse378*_cse58 + _cse378*_cse60)
+    out[2, 4] = _cse314*dq1 + _cse358*dq2 + _cse372*dq3 + dq4*(-_cse231*_cse336 + _cse232*_cse336 + _cse234*_cse334 - _cse334*_cse40 + _cse334*_cse43 + _cse336*_cse59 - _cse337 + _cse338)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse379
+    out[3, 2] = _cse379
+    out[3, 3] = _cse380*dq1 - _cse380*dq2 + dq0*(_cse2*_cse5*_cse7 - _cse260)
+    out[3, 4] = dq0*(_cse11*_cse384 + 0.3960285*_cse15 - _cse19*_cse383 + 0.3960285*_cse22 + 0.239041914*_cse24 + 0.574238819026787*_cse258 + 0.239041914*_cse26 - 0.574238819026787*_cse260) + dq1*(_cse151*_cse384 + 0.3960285*_cse152 - _cse153*_cse383 + 0.3960285*_cse154 + 0.239041914*_cse155 + 0.239041914*_cse156 + _cse381 + _cse382) + dq2*(_cse190*_cse384 + 0.239041914*_cse191 - _cse192*_cse383 + 0.239041914*_cse193 + 0.3960285*_cse195 + 0.3960285*_cse196 - _cse381 - _cse382) + dq3*(_cse207*_cse383 + 0.239041914*_cse208 + _cse209*_cse384 + 0.239041914*_cse210 + 0.3960285*_cse212 + 0.3960285*_cse213)
+    out[3, 5] = dq0*(_cse11*_cse394 + 0.227149603970304*_cse15 - _cse19*_cse393 + 0.227149603970304*_cse22 + 0.137106991283212*_cse24 + 0.329365488408814*_cse258 + 0.137106991283212*_cse26 - 0.329365488408814*_cse260 + _cse34*_cse388 - _cse34*_cse389 + _cse34*_cse390 - _cse385*_cse53 - _cse395*_cse53 + _cse396*_cse53) + dq1*(_cse151*_cse394 + 0.227149603970304*_cse152 - _cse153*_cse393 + 0.227149603970304*_cse154 + 0.137106991283212*_cse155 + 0.137106991283212*_cse156 + _cse158*_cse388 - _cse158*_cse389 + _cse158*_cse390 - _cse161*_cse385 - _cse161*_cse395 + _cse161*_cse396 + _cse391 + _cse392) + dq2*(_cse190*_cse394 + 0.137106991283212*_cse191 - _cse192*_cse393 + 0.137106991283212*_cse193 + _cse194*_cse388 - _cse194*_cse389 + _cse194*_cse390 + 0.227149603970304*_cse195 + 0.227149603970304*_cse196 - _cse197*_cse385 - _cse197*_cse395 + _cse197*_cse396 - _cse391 - _cse392) + dq3*(_cse207*_cse393 + 0.137106991283212*_cse208 + _cse209*_cse394 + 0.137106991283212*_cse210 + _cse211*_cse388 - _cse211*_cse389 + _cse211*_cse390 + 0.227149603970304*_cse212 + 0.227149603970304*_cse213 - _cse214*_cse385 - _cse214*_cse395 + _cse214*_cse396) + dq4*(_cse230*_cse385 + _cse230*_cse386 - _cse230*_cse387 + _cse233*_cse388 - _cse233*_cse389 + _cse233*_cse390)
+    out[4, 0] = 0
+    out[4, 1] = _cse397
+    out[4, 2] = -_cse397
+    out[4, 3] = -_cse398*dq1 + _cse398*dq2 + dq0*(_cse0*_cse5*_cse7 - _cse148)
+    out[4, 4] = dq0*(0.3960285*_cse121 + 0.3960285*_cse124 - 0.408002994597976*_cse125 + 0.239041914*_cse126 + 0.239041914*_cse127 + 0.408002994597976*_cse128 + 0.574238819026787*_cse146 - 0.574238819026787*_cse148) + dq1*(0.408002994597976*_cse105 - 0.408002994597976*_cse107 + 0.239041914*_cse108 + 0.3960285*_cse109 + 0.3960285*_cse110 + 0.239041914*_cse111 - _cse399 - _cse400) + dq2*(_cse399 + _cse400 - 0.408002994597976*_cse84 + 0.408002994597976*_cse86 + 0.3960285*_cse87 + 0.239041914*_cse88 + 0.239041914*_cse89 + 0.3960285*_cse90) + dq3*(0.408002994597976*_cse62 + 0.408002994597976*_cse63 + 0.239041914*_cse65 + 0.239041914*_cse66 + 0.3960285*_cse67 + 0.3960285*_cse68)
+    out[4, 5] = dq0*(0.227149603970304*_cse121 + 0.227149603970304*_cse124 - 0.234017800844203*_cse125 + 0.137106991283212*_cse126 + 0.137106991283212*_cse127 + 0.234017800844203*_cse128 - _cse132*_cse385 - _cse132*_cse395 + _cse132*_cse396 + _cse138*_cse388 - _cse138*_cse389 + _cse138*_cse390 + 0.329365488408814*_cse146 - 0.329365488408814*_cse148) + dq1*(0.234017800844203*_cse105 - 0.234017800844203*_cse107 + 0.137106991283212*_cse108 + 0.227149603970304*_cse109 + 0.227149603970304*_cse110 + 0.137106991283212*_cse111 - _cse112*_cse385 - _cse112*_cse395 + _cse112*_cse396 + _cse113*_cse388 - _cse113*_cse389 + _cse113*_cse390 - _cse401 - _cse402) + dq2*(-_cse385*_cse91 + _cse388*_cse94 - _cse389*_cse94 + _cse390*_cse94 - _cse395*_cse91 + _cse396*_cse91 + _cse401 + _cse402 - 0.234017800844203*_cse84 + 0.234017800844203*_cse86 + 0.227149603970304*_cse87 + 0.137106991283212*_cse88 + 0.137106991283212*_cse89 + 0.227149603970304*_cse90) + dq3*(-_cse385*_cse73 + _cse388*_cse72 - _cse389*_cse72 + _cse390*_cse72 - _cse395*_cse73 + _cse396*_cse73 + 0.234017800844203*_cse62 + 0.234017800844203*_cse63 + 0.137106991283212*_cse65 + 0.137106991283212*_cse66 + 0.227149603970304*_cse67 + 0.227149603970304*_cse68) + dq4*(_cse34*_cse385 + _cse34*_cse386 - _cse34*_cse387 + _cse388*_cse53 - _cse389*_cse53 + _cse390*_cse53)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse403*dq1 - _cse403*dq2
+    out[5, 4] = dq1*(_cse304*_cse384 + 0.239041914*_cse305 - _cse307*_cse383 + 0.239041914*_cse308 + 0.3960285*_cse311 + 0.3960285*_cse312 + _cse404 - _cse405) + dq2*(_cse303*_cse384 - _cse306*_cse383 + 0.3960285*_cse352 + 0.3960285*_cse353 + 0.239041914*_cse354 + 0.239041914*_cse355 - _cse404 + _cse405) + dq3*(_cse325*_cse383 + _cse328*_cse384 + 0.239041914*_cse366 + 0.239041914*_cse367 + 0.3960285*_cse369 + 0.3960285*_cse370)
+    out[5, 5] = dq1*(_cse304*_cse394 + 0.137106991283212*_cse305 - _cse307*_cse393 + 0.137106991283212*_cse308 + _cse310*_cse388 - _cse310*_cse389 + _cse310*_cse390 + 0.227149603970304*_cse311 + 0.227149603970304*_cse312 - _cse313*_cse385 - _cse313*_cse395 + _cse313*_cse396 + _cse406 - _cse407) + dq2*(_cse303*_cse394 - _cse306*_cse393 + 0.227149603970304*_cse352 + 0.227149603970304*_cse353 + 0.137106991283212*_cse354 + 0.137106991283212*_cse355 + _cse356*_cse388 - _cse356*_cse389 + _cse356*_cse390 - _cse357*_cse385 - _cse357*_cse395 + _cse357*_cse396 - _cse406 + _cse407) + dq3*(_cse325*_cse393 + _cse328*_cse394 + 0.137106991283212*_cse366 + 0.137106991283212*_cse367 + _cse368*_cse388 - _cse368*_cse389 + _cse368*_cse390 + 0.227149603970304*_cse369 + 0.227149603970304*_cse370 - _cse371*_cse385 - _cse371*_cse395 + _cse371*_cse396) + dq4*(_cse334*_cse388 - _cse334*_cse389 + _cse334*_cse390 + _cse336*_cse385 + _cse336*_cse386 - _cse336*_cse387)
+    return out
+
+
+# link0[0,0,0]_Tx
+def function21(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0.0783690000000000
+    out[3, 0] = 1
+    return out
+
+
+# link0[0,0,0]_J
+def function22(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link0[0,0,0]_dJ
+def function23(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link1[0,0,0]_Tx
+def function24(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((4, 1))
+    out[0, 0] = -4.8455e-5*_cse0 + 2.1217e-5*_cse1 - 3.2712e-5
+    out[1, 0] = -2.1217e-5*_cse0 - 4.8455e-5*_cse1 - 1.7324e-5
+    out[2, 0] = 0.236265000000000
+    out[3, 0] = 1
+    return out
+
+
+# link1[0,0,0]_J
+def function25(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = -2.1217e-5*_cse0 - 4.8455e-5*_cse1
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 4.8455e-5*_cse0 - 2.1217e-5*_cse1
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link1[0,0,0]_dJ
+def function26(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = dq0*(4.8455e-5*_cse0 - 2.1217e-5*_cse1)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = dq0*(2.1217e-5*_cse0 + 4.8455e-5*_cse1)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse1*dq0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse0*dq0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link2[0,0,0]_Tx
+def function27(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = -0.20902*_cse2 - 0.0019519*_cse3
+    out = np.empty((4, 1))
+    out[0, 0] = 0.028922995*_cse0 - _cse1*_cse4 + 4.3259e-5*_cse1 - 3.2712e-5
+    out[1, 0] = _cse0*_cse4 - 4.3259e-5*_cse0 + 0.028922995*_cse1 - 1.7324e-5
+    out[2, 0] = 0.0019519*_cse2 - 0.20902*_cse3 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# link2[0,0,0]_J
+def function28(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = 0.20902*_cse2 + 0.0019519*_cse3
+    _cse5 = -_cse4
+    _cse6 = 0.0019519*_cse2 - 0.20902*_cse3
+    out = np.empty((6, 6))
+    out[0, 0] = _cse0*_cse5 - 4.3259e-5*_cse0 + 0.028922995*_cse1
+    out[0, 1] = -_cse1*_cse6
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -0.028922995*_cse0 + _cse1*_cse5 - 4.3259e-5*_cse1
+    out[1, 1] = _cse0*_cse6
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse4
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link2[0,0,0]_dJ
+def function29(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = math.cos(q1)
+    _cse3 = 0.0019519*_cse1 - 0.20902*_cse2
+    _cse4 = _cse3*dq1
+    _cse5 = math.cos(q0)
+    _cse6 = 0.20902*_cse1 + 0.0019519*_cse2
+    _cse7 = -_cse6
+    _cse8 = _cse0*dq0
+    _cse9 = _cse6*dq1
+    _cse10 = _cse5*dq0
+    out = np.empty((6, 6))
+    out[0, 0] = _cse0*_cse4 + dq0*(-0.028922995*_cse0 + _cse5*_cse7 - 4.3259e-5*_cse5)
+    out[0, 1] = _cse3*_cse8 - _cse5*_cse9
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse4*_cse5 + dq0*(-_cse0*_cse7 + 4.3259e-5*_cse0 - 0.028922995*_cse5)
+    out[1, 1] = _cse0*_cse9 + _cse10*_cse3
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse3*dq1
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse10
+    out[3, 2] = _cse10
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse8
+    out[4, 2] = -_cse8
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link3[0,0,0]_Tx
+def function30(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = -0.20902*_cse2 - 0.0019519*_cse3
+    _cse5 = math.sin(q2)
+    _cse6 = math.cos(q2)
+    _cse7 = -0.00048786*_cse5 - 0.081945*_cse6
+    _cse8 = 0.081945*_cse5 - 0.00048786*_cse6
+    _cse9 = _cse0*_cse2
+    out = np.empty((4, 1))
+    out[0, 0] = -0.007102005*_cse0 + _cse1*_cse2*_cse7 + 0.20503*_cse1*_cse2 + _cse1*_cse3*_cse8 - 1.098e-6*_cse1*_cse3 - _cse1*_cse4 + 4.3259e-5*_cse1 - 3.2712e-5
+    out[1, 0] = -_cse0*_cse3*_cse8 + 1.098e-6*_cse0*_cse3 + _cse0*_cse4 - 4.3259e-5*_cse0 - 0.007102005*_cse1 - _cse7*_cse9 - 0.20503*_cse9 - 1.7324e-5
+    out[2, 0] = _cse2*_cse8 + 0.001950802*_cse2 - _cse3*_cse7 - 0.41405*_cse3 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# link3[0,0,0]_J
+def function31(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = math.cos(q2)
+    _cse8 = 0.00048786*_cse6 + 0.081945*_cse7
+    _cse9 = -_cse8
+    _cse10 = _cse2*_cse9
+    _cse11 = 0.081945*_cse6 - 0.00048786*_cse7
+    _cse12 = _cse11*_cse4
+    _cse13 = _cse1*_cse2
+    _cse14 = _cse1*_cse4
+    _cse15 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse16 = _cse11*_cse13
+    _cse17 = _cse0*_cse2
+    _cse18 = _cse0*_cse4
+    _cse19 = _cse11*_cse17
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse10 - _cse0*_cse12 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 + _cse0*_cse5 - 4.3259e-5*_cse0 - 0.007102005*_cse1
+    out[0, 1] = -_cse1*_cse15 + 1.098e-6*_cse13 + _cse14*_cse9 + 0.20503*_cse14 - _cse16
+    out[0, 2] = _cse14*_cse8 + _cse16
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0.007102005*_cse0 - _cse1*_cse10 - _cse1*_cse12 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 + _cse1*_cse5 - 4.3259e-5*_cse1
+    out[1, 1] = _cse0*_cse15 - 1.098e-6*_cse17 - _cse18*_cse9 - 0.20503*_cse18 + _cse19
+    out[1, 2] = -_cse18*_cse8 - _cse19
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse10 + _cse12 + 0.41405*_cse2 + 0.001950802*_cse4
+    out[2, 2] = -_cse12 + _cse2*_cse8
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse13*_cse7 - _cse14*_cse6
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse6 - _cse17*_cse7
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse2*_cse6 - _cse4*_cse7
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link3[0,0,0]_dJ
+def function32(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = math.sin(q2)
+    _cse3 = math.cos(q2)
+    _cse4 = 0.00048786*_cse2 + 0.081945*_cse3
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q1)
+    _cse7 = 0.081945*_cse2 - 0.00048786*_cse3
+    _cse8 = _cse6*_cse7
+    _cse9 = _cse0*_cse8
+    _cse10 = -_cse0*_cse5 - _cse9
+    _cse11 = _cse0*_cse6
+    _cse12 = _cse0*_cse1
+    _cse13 = -0.20902*_cse1 + 0.0019519*_cse6
+    _cse14 = -_cse4
+    _cse15 = _cse1*_cse14
+    _cse16 = _cse0*_cse13 - _cse0*_cse15 - 1.098e-6*_cse11 - 0.20503*_cse12 + _cse9
+    _cse17 = math.cos(q0)
+    _cse18 = 0.0019519*_cse1 + 0.20902*_cse6
+    _cse19 = -_cse18
+    _cse20 = _cse17*_cse6
+    _cse21 = _cse1*_cse17
+    _cse22 = _cse21*_cse7
+    _cse23 = -1.098e-6*_cse1*_cse17 + _cse14*_cse20 + 0.20503*_cse20 + _cse22
+    _cse24 = _cse20*_cse4
+    _cse25 = _cse22 - _cse24
+    _cse26 = -_cse7
+    _cse27 = _cse17*_cse8
+    _cse28 = -_cse17*_cse5 - _cse27
+    _cse29 = _cse13*_cse17 - _cse15*_cse17 - 1.098e-6*_cse20 - 0.20503*_cse21 + _cse27
+    _cse30 = _cse12*_cse7
+    _cse31 = _cse11*_cse14 + 0.20503*_cse11 - 1.098e-6*_cse12 + _cse30
+    _cse32 = _cse11*_cse4
+    _cse33 = -_cse30 + _cse32
+    _cse34 = _cse5 + _cse8
+    _cse35 = _cse17*dq0
+    _cse36 = _cse2*_cse20 + _cse21*_cse3
+    _cse37 = _cse3*_cse6
+    _cse38 = _cse0*dq0
+    _cse39 = _cse11*_cse2 + _cse12*_cse3
+    _cse40 = -_cse1*_cse2 + _cse37
+    out = np.empty((6, 6))
+    out[0, 0] = _cse10*dq2 + _cse16*dq1 + dq0*(0.007102005*_cse0 + _cse17*_cse19 - 4.3259e-5*_cse17 - _cse23)
+    out[0, 1] = _cse16*dq0 + _cse25*dq2 + dq1*(-_cse17*_cse18 - _cse23)
+    out[0, 2] = _cse10*dq0 + _cse25*dq1 + dq2*(_cse21*_cse26 + _cse24)
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse28*dq2 + _cse29*dq1 + dq0*(-_cse0*_cse19 + 4.3259e-5*_cse0 + 0.007102005*_cse17 + _cse31)
+    out[1, 1] = _cse29*dq0 + _cse33*dq2 + dq1*(_cse0*_cse18 + _cse31)
+    out[1, 2] = _cse28*dq0 + _cse33*dq1 + dq2*(-_cse12*_cse26 - _cse32)
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse34*dq2 + dq1*(0.41405*_cse1 + _cse15 - 0.001950802*_cse6 - _cse8)
+    out[2, 2] = _cse34*dq1 + dq2*(_cse26*_cse6 - _cse5)
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse35
+    out[3, 2] = _cse35
+    out[3, 3] = _cse36*dq1 - _cse36*dq2 + dq0*(_cse0*_cse1*_cse2 - _cse0*_cse37)
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse38
+    out[4, 2] = -_cse38
+    out[4, 3] = -_cse39*dq1 + _cse39*dq2 + dq0*(_cse1*_cse17*_cse2 - _cse17*_cse37)
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse40*dq1 - _cse40*dq2
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link4[0,0,0]_Tx
+def function33(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = 0.1592*_cse6
+    _cse10 = 0.0038906673398998*_cse8
+    _cse11 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse12 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse13 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse14 = math.sin(q3)
+    _cse15 = math.cos(q3)
+    _cse16 = -0.012581*_cse14 - 0.00040053*_cse15
+    _cse17 = 6.57617443000635e-7*_cse0
+    _cse18 = 0.999999998572139*_cse1
+    _cse19 = _cse2*_cse6
+    _cse20 = _cse4*_cse8
+    _cse21 = -0.00040053*_cse14 + 0.012581*_cse15
+    _cse22 = 6.57617443000635e-7*_cse1
+    _cse23 = _cse0*_cse2
+    _cse24 = _cse0*_cse4
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse2*_cse8
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse11 + 4.3259e-5*_cse1 + _cse10*_cse5 + _cse12*_cse3 + _cse13*_cse5 + _cse16*(-_cse17 - _cse18*_cse19 - _cse18*_cse20) + _cse21*(0.999999998572139*_cse0 - _cse19*_cse22 - _cse20*_cse22) + _cse3*_cse7 - 0.1592*_cse3*_cse8 + 0.20503*_cse3 + _cse5*_cse9 - 1.098e-6*_cse5 - 3.2712e-5
+    out[1, 0] = _cse0*_cse11 + 0.1592*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse10*_cse24 - _cse12*_cse23 - _cse13*_cse24 + _cse16*(_cse19*_cse25 + _cse20*_cse25 - _cse22) + _cse21*(_cse17*_cse19 + _cse17*_cse20 + _cse18) - _cse23*_cse7 - 0.20503*_cse23 - _cse24*_cse9 - 1.7324e-5
+    out[2, 0] = -_cse12*_cse4 + _cse13*_cse2 + _cse16*(-0.999999998572139*_cse26 + 0.999999998572139*_cse4*_cse6) + 0.1592*_cse19 + 0.001950802*_cse2 + 0.1592*_cse20 + _cse21*(-6.57617443000635e-7*_cse26 + 6.57617443000635e-7*_cse4*_cse6) + 0.0038906673398998*_cse26 - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# link4[0,0,0]_J
+def function34(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.sin(q3)
+    _cse20 = math.cos(q3)
+    _cse21 = -0.012581*_cse19 - 0.00040053*_cse20
+    _cse22 = 6.57617443000635e-7*_cse1
+    _cse23 = 0.999999998572139*_cse0
+    _cse24 = _cse11*_cse23 - _cse22 + _cse23*_cse6
+    _cse25 = 0.00040053*_cse19 - 0.012581*_cse20
+    _cse26 = -_cse25
+    _cse27 = 0.999999998572139*_cse1
+    _cse28 = 6.57617443000635e-7*_cse0
+    _cse29 = _cse11*_cse28 + _cse27 + _cse28*_cse6
+    _cse30 = _cse1*_cse2
+    _cse31 = _cse1*_cse4
+    _cse32 = 0.1592*_cse1
+    _cse33 = _cse32*_cse6
+    _cse34 = _cse30*_cse8
+    _cse35 = 0.0038906673398998*_cse34
+    _cse36 = _cse31*_cse5
+    _cse37 = 0.0038906673398998*_cse36
+    _cse38 = _cse11*_cse32
+    _cse39 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse40 = _cse17*_cse30
+    _cse41 = _cse2*_cse8
+    _cse42 = _cse4*_cse5
+    _cse43 = _cse22*_cse41 - _cse22*_cse42
+    _cse44 = _cse27*_cse41 - _cse27*_cse42
+    _cse45 = -0.999999998572139*_cse0 + _cse11*_cse22 + _cse22*_cse6
+    _cse46 = -_cse45
+    _cse47 = _cse11*_cse27 + _cse27*_cse6 + _cse28
+    _cse48 = -_cse47
+    _cse49 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse28*_cse41
+    _cse50 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse23*_cse41
+    _cse51 = _cse0*_cse2
+    _cse52 = 0.1592*_cse0
+    _cse53 = _cse51*_cse8
+    _cse54 = -0.0038906673398998*_cse10 + _cse11*_cse52 + _cse17*_cse51 + _cse52*_cse6 + 0.0038906673398998*_cse53
+    _cse55 = 0.1592*_cse41
+    _cse56 = 0.1592*_cse42
+    _cse57 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse58 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse59 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse41
+    _cse60 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse41
+    _cse61 = 0.408002994597976*_cse19
+    _cse62 = 0.408002994597976*_cse20
+    _cse63 = -0.205153451809215*_cse19 - 0.300746240858175*_cse20
+    _cse64 = 0.10993832124498*_cse19 + 0.204467912268013*_cse20
+    _cse65 = 0.300746240858175*_cse19 - 0.205153451809215*_cse20
+    _cse66 = 0.204467912268013*_cse19 - 0.10993832124498*_cse20
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.1592*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.1592*_cse10 + _cse21*_cse24 + _cse26*_cse29
+    out[0, 1] = -_cse1*_cse39 + _cse15*_cse31 + _cse21*_cse44 + _cse26*_cse43 + 1.098e-6*_cse30 + 0.20503*_cse31 - _cse33 - _cse35 + _cse37 - _cse38 - _cse40
+    out[0, 2] = _cse14*_cse31 - _cse21*_cse44 - _cse26*_cse43 + _cse33 + _cse35 - _cse37 + _cse38 + _cse40
+    out[0, 3] = _cse21*_cse46 + _cse25*_cse48
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.1592*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 + _cse21*_cse47 + _cse26*_cse45 - 0.1592*_cse36
+    out[1, 1] = _cse0*_cse39 - _cse15*_cse9 - _cse21*_cse50 - _cse26*_cse49 - 1.098e-6*_cse51 + _cse54 - 0.20503*_cse9
+    out[1, 2] = -_cse14*_cse9 + _cse21*_cse50 + _cse26*_cse49 - _cse54
+    out[1, 3] = _cse21*_cse29 + _cse24*_cse25
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse12 + _cse16 + _cse18 + 0.41405*_cse2 - _cse21*_cse57 - _cse26*_cse58 + 0.001950802*_cse4 - _cse55 + _cse56 + _cse7
+    out[2, 2] = -_cse12 + _cse14*_cse2 - _cse18 + _cse21*_cse57 + _cse26*_cse58 + _cse55 - _cse56 - _cse7
+    out[2, 3] = _cse21*_cse60 + _cse25*_cse59
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse34 - _cse36
+    out[3, 4] = 0.574238819026787*_cse34 - 0.574238819026787*_cse36 - _cse46*_cse62 + _cse46*_cse63 + _cse46*_cse66 + _cse48*_cse61 + _cse48*_cse64 + _cse48*_cse65
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse53
+    out[4, 4] = 0.574238819026787*_cse10 + _cse24*_cse61 + _cse24*_cse64 + _cse24*_cse65 - _cse29*_cse62 + _cse29*_cse63 + _cse29*_cse66 - 0.574238819026787*_cse53
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + _cse59*_cse61 + _cse59*_cse64 + _cse59*_cse65 - 0.574238819026787*_cse6 - _cse60*_cse62 + _cse60*_cse63 + _cse60*_cse66
+    out[5, 5] = 0
+    return out
+
+
+# link4[0,0,0]_dJ
+def function35(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q3)
+    _cse1 = math.cos(q3)
+    _cse2 = 0.012581*_cse0 + 0.00040053*_cse1
+    _cse3 = -_cse2
+    _cse4 = math.cos(q0)
+    _cse5 = 0.999999998572139*_cse4
+    _cse6 = math.sin(q0)
+    _cse7 = 6.57617443000635e-7*_cse6
+    _cse8 = math.sin(q1)
+    _cse9 = math.sin(q2)
+    _cse10 = _cse8*_cse9
+    _cse11 = math.cos(q1)
+    _cse12 = math.cos(q2)
+    _cse13 = _cse11*_cse12
+    _cse14 = _cse10*_cse7 + _cse13*_cse7
+    _cse15 = _cse14 + _cse5
+    _cse16 = 0.00040053*_cse0 - 0.012581*_cse1
+    _cse17 = 6.57617443000635e-7*_cse4
+    _cse18 = 0.999999998572139*_cse6
+    _cse19 = _cse10*_cse18 + _cse13*_cse18
+    _cse20 = -_cse17 + _cse19
+    _cse21 = _cse15*_cse3 + _cse16*_cse20
+    _cse22 = -_cse16
+    _cse23 = _cse12*_cse8
+    _cse24 = -6.57617443000635e-7*_cse11*_cse6*_cse9 + _cse23*_cse7
+    _cse25 = -0.999999998572139*_cse11*_cse6*_cse9 + _cse18*_cse23
+    _cse26 = 0.081945*_cse12 + 0.00048786*_cse9
+    _cse27 = _cse11*_cse26
+    _cse28 = -0.00048786*_cse12 + 0.081945*_cse9
+    _cse29 = _cse28*_cse8
+    _cse30 = _cse11*_cse6
+    _cse31 = _cse12*_cse30
+    _cse32 = _cse6*_cse8
+    _cse33 = _cse32*_cse9
+    _cse34 = 0.0038906673398998*_cse23
+    _cse35 = _cse11*_cse9
+    _cse36 = 0.0038906673398998*_cse35
+    _cse37 = _cse29*_cse6 + 0.1592*_cse31 + 0.1592*_cse33 + _cse34*_cse6 - _cse36*_cse6
+    _cse38 = _cse22*_cse24 + _cse25*_cse3 - _cse27*_cse6 - _cse37
+    _cse39 = -0.20902*_cse11 + 0.0019519*_cse8
+    _cse40 = -_cse24
+    _cse41 = -_cse25
+    _cse42 = -_cse26
+    _cse43 = _cse11*_cse42
+    _cse44 = _cse22*_cse40 + _cse3*_cse41 - 0.20503*_cse30 - 1.098e-6*_cse32 + _cse37 + _cse39*_cse6 - _cse43*_cse6
+    _cse45 = _cse10*_cse17 + _cse13*_cse17
+    _cse46 = -_cse18 + _cse45
+    _cse47 = 0.0019519*_cse11 + 0.20902*_cse8
+    _cse48 = -_cse47
+    _cse49 = _cse10*_cse5 + _cse13*_cse5
+    _cse50 = _cse49 + _cse7
+    _cse51 = _cse4*_cse8
+    _cse52 = _cse11*_cse4
+    _cse53 = _cse35*_cse4
+    _cse54 = 0.1592*_cse53
+    _cse55 = _cse12*_cse52
+    _cse56 = 0.0038906673398998*_cse55
+    _cse57 = _cse51*_cse9
+    _cse58 = 0.0038906673398998*_cse57
+    _cse59 = _cse23*_cse4
+    _cse60 = 0.1592*_cse59
+    _cse61 = _cse28*_cse52 + _cse54 + _cse56 + _cse58 - _cse60
+    _cse62 = -1.098e-6*_cse11*_cse4 + _cse42*_cse51 + 0.20503*_cse51 + _cse61
+    _cse63 = _cse17*_cse23 - _cse17*_cse35
+    _cse64 = _cse23*_cse5 - _cse35*_cse5
+    _cse65 = _cse16*_cse64 + _cse3*_cse63
+    _cse66 = _cse26*_cse51
+    _cse67 = -_cse22*_cse45 - _cse3*_cse49 + _cse61 - _cse66
+    _cse68 = -_cse64
+    _cse69 = -_cse63
+    _cse70 = _cse16*_cse68 + _cse3*_cse69
+    _cse71 = -_cse28
+    _cse72 = -_cse46
+    _cse73 = -_cse50
+    _cse74 = _cse16*_cse50 + _cse3*_cse46
+    _cse75 = _cse29*_cse4 + _cse34*_cse4 - _cse36*_cse4 + 0.1592*_cse55 + 0.1592*_cse57
+    _cse76 = _cse22*_cse63 - _cse27*_cse4 + _cse3*_cse64 - _cse75
+    _cse77 = _cse22*_cse69 + _cse3*_cse68 + _cse39*_cse4 - _cse4*_cse43 - 1.098e-6*_cse51 - 0.20503*_cse52 + _cse75
+    _cse78 = _cse35*_cse6
+    _cse79 = 0.1592*_cse78
+    _cse80 = 0.0038906673398998*_cse31
+    _cse81 = 0.0038906673398998*_cse33
+    _cse82 = _cse23*_cse6
+    _cse83 = 0.1592*_cse82
+    _cse84 = _cse79 + _cse80 + _cse81 - _cse83
+    _cse85 = _cse28*_cse30
+    _cse86 = -1.098e-6*_cse30 + _cse32*_cse42 + 0.20503*_cse32 + _cse85
+    _cse87 = _cse16*_cse41 + _cse3*_cse40
+    _cse88 = _cse26*_cse32
+    _cse89 = _cse14*_cse22 + _cse19*_cse3 - _cse79 - _cse80 - _cse81 + _cse83 - _cse85 + _cse88
+    _cse90 = -_cse14*_cse22 - _cse19*_cse3 + _cse84
+    _cse91 = _cse16*_cse25 + _cse24*_cse3
+    _cse92 = 0.999999998572139*_cse10 + 0.999999998572139*_cse13
+    _cse93 = -_cse92
+    _cse94 = 6.57617443000635e-7*_cse10 + 6.57617443000635e-7*_cse13
+    _cse95 = -_cse94
+    _cse96 = _cse16*_cse93 + _cse3*_cse95
+    _cse97 = 0.1592*_cse10
+    _cse98 = 0.1592*_cse13
+    _cse99 = 0.999999998572139*_cse23 - 0.999999998572139*_cse35
+    _cse100 = -_cse99
+    _cse101 = 6.57617443000635e-7*_cse23 - 6.57617443000635e-7*_cse35
+    _cse102 = -_cse101
+    _cse103 = _cse100*_cse3 + _cse102*_cse22 + _cse27 + _cse29 + _cse34 - _cse36 + _cse97 + _cse98
+    _cse104 = _cse101*_cse22 + _cse3*_cse99 - _cse34 + _cse36 - _cse97 - _cse98
+    _cse105 = _cse16*_cse92 + _cse3*_cse94
+    _cse106 = _cse4*dq0
+    _cse107 = _cse55 + _cse57
+    _cse108 = 0.574238819026787*_cse57
+    _cse109 = 0.574238819026787*_cse55
+    _cse110 = 0.408002994597976*_cse1
+    _cse111 = 0.408002994597976*_cse0
+    _cse112 = 0.51802699*_cse0 + 0.75940555*_cse1
+    _cse113 = -0.3960285*_cse112
+    _cse114 = 0.85536427*_cse0 - 0.45991232*_cse1
+    _cse115 = 0.239041914*_cse114
+    _cse116 = 0.10993832124498*_cse0 + 0.204467912268013*_cse1
+    _cse117 = 0.300746240858175*_cse0 - 0.205153451809215*_cse1
+    _cse118 = -0.239041914*_cse114
+    _cse119 = 0.3960285*_cse112
+    _cse120 = _cse6*dq0
+    _cse121 = _cse31 + _cse33
+    _cse122 = 0.574238819026787*_cse33
+    _cse123 = 0.574238819026787*_cse31
+    _cse124 = _cse23 - _cse35
+    _cse125 = 0.574238819026787*_cse23
+    _cse126 = 0.574238819026787*_cse35
+    out = np.empty((6, 6))
+    out[0, 0] = _cse21*dq3 + _cse38*dq2 + _cse44*dq1 + dq0*(_cse22*_cse46 + _cse3*_cse50 + _cse4*_cse48 - 4.3259e-5*_cse4 + 0.0068032576553314*_cse6 - _cse62)
+    out[0, 1] = _cse44*dq0 + _cse65*dq3 + _cse67*dq2 + dq1*(_cse22*_cse45 + _cse3*_cse49 - _cse4*_cse47 - _cse62)
+    out[0, 2] = _cse38*dq0 + _cse67*dq1 + _cse70*dq3 + dq2*(_cse22*_cse45 + _cse3*_cse49 + _cse52*_cse71 - _cse54 - _cse56 - _cse58 + _cse60 + _cse66)
+    out[0, 3] = _cse21*dq0 + _cse65*dq1 + _cse70*dq2 + dq3*(_cse16*_cse72 + _cse2*_cse73)
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse74*dq3 + _cse76*dq2 + _cse77*dq1 + dq0*(-_cse15*_cse22 - _cse20*_cse3 + 0.0068032576553314*_cse4 - _cse48*_cse6 + 4.3259e-5*_cse6 + _cse84 + _cse86)
+    out[1, 1] = _cse77*dq0 + _cse87*dq3 + _cse89*dq2 + dq1*(_cse47*_cse6 + _cse86 + _cse90)
+    out[1, 2] = _cse76*dq0 + _cse89*dq1 + _cse91*dq3 + dq2*(-_cse30*_cse71 - _cse88 + _cse90)
+    out[1, 3] = _cse74*dq0 + _cse87*dq1 + _cse91*dq2 + dq3*(_cse15*_cse16 + _cse2*_cse20)
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse103*dq2 + _cse96*dq3 + dq1*(_cse104 + 0.41405*_cse11 - _cse29 + _cse43 - 0.001950802*_cse8)
+    out[2, 2] = _cse103*dq1 + _cse105*dq3 + dq2*(_cse104 - _cse27 + _cse71*_cse8)
+    out[2, 3] = _cse105*dq2 + _cse96*dq1 + dq3*(_cse100*_cse2 + _cse102*_cse16)
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse106
+    out[3, 2] = _cse106
+    out[3, 3] = _cse107*dq1 - _cse107*dq2 + dq0*(_cse11*_cse6*_cse9 - _cse82)
+    out[3, 4] = dq0*(-_cse110*_cse15 + _cse111*_cse20 + _cse113*_cse15 + _cse115*_cse15 + _cse116*_cse20 + _cse117*_cse20 + 0.574238819026787*_cse78 - 0.574238819026787*_cse82) + dq1*(_cse108 + _cse109 - _cse110*_cse63 + _cse111*_cse64 + _cse113*_cse63 + _cse115*_cse63 + _cse116*_cse64 + _cse117*_cse64) + dq2*(-_cse108 - _cse109 - _cse110*_cse69 + _cse111*_cse68 + _cse113*_cse69 + _cse115*_cse69 + _cse116*_cse68 + _cse117*_cse68) + dq3*(_cse110*_cse73 + _cse111*_cse72 + _cse116*_cse72 + _cse117*_cse72 + _cse118*_cse73 + _cse119*_cse73)
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse120
+    out[4, 2] = -_cse120
+    out[4, 3] = -_cse121*dq1 + _cse121*dq2 + dq0*(_cse11*_cse4*_cse9 - _cse59)
+    out[4, 4] = dq0*(-_cse110*_cse46 + _cse111*_cse50 + _cse113*_cse46 + _cse115*_cse46 + _cse116*_cse50 + _cse117*_cse50 + 0.574238819026787*_cse53 - 0.574238819026787*_cse59) + dq1*(-_cse110*_cse40 + _cse111*_cse41 + _cse113*_cse40 + _cse115*_cse40 + _cse116*_cse41 + _cse117*_cse41 - _cse122 - _cse123) + dq2*(-_cse110*_cse24 + _cse111*_cse25 + _cse113*_cse24 + _cse115*_cse24 + _cse116*_cse25 + _cse117*_cse25 + _cse122 + _cse123) + dq3*(_cse110*_cse20 + _cse111*_cse15 + _cse116*_cse15 + _cse117*_cse15 + _cse118*_cse20 + _cse119*_cse20)
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse124*dq1 - _cse124*dq2
+    out[5, 4] = dq1*(-_cse110*_cse95 + _cse111*_cse93 + _cse113*_cse95 + _cse115*_cse95 + _cse116*_cse93 + _cse117*_cse93 + _cse125 - _cse126) + dq2*(-_cse110*_cse94 + _cse111*_cse92 + _cse113*_cse94 + _cse115*_cse94 + _cse116*_cse92 + _cse117*_cse92 - _cse125 + _cse126) + dq3*(_cse100*_cse110 + _cse100*_cse118 + _cse100*_cse119 + _cse102*_cse111 + _cse102*_cse116 + _cse102*_cse117)
+    out[5, 5] = 0
+    return out
+
+
+# link5[0,0,0]_Tx
+def function36(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse3*_cse8
+    _cse10 = _cse5*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = math.sin(q3)
+    _cse16 = 6.57617443000635e-7*_cse0
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = _cse2*_cse6
+    _cse19 = _cse4*_cse8
+    _cse20 = -_cse16 - _cse17*_cse18 - _cse17*_cse19
+    _cse21 = _cse15*_cse20
+    _cse22 = math.cos(q3)
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0 - _cse18*_cse23 - _cse19*_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = -0.012581*_cse15 - 0.00040053*_cse22
+    _cse27 = -0.00040053*_cse15 + 0.012581*_cse22
+    _cse28 = -0.51802699*_cse15 - 0.75940555*_cse22
+    _cse29 = _cse24*_cse28
+    _cse30 = 0.45991232*_cse15 + 0.85536427*_cse22
+    _cse31 = _cse20*_cse30
+    _cse32 = 0.75940555*_cse15 - 0.51802699*_cse22
+    _cse33 = _cse20*_cse32
+    _cse34 = 0.85536427*_cse15 - 0.45991232*_cse22
+    _cse35 = _cse24*_cse34
+    _cse36 = math.sin(q4)
+    _cse37 = math.cos(q4)
+    _cse38 = -0.012272*_cse36 - 0.00052974*_cse37
+    _cse39 = -0.00052974*_cse36 + 0.012272*_cse37
+    _cse40 = _cse0*_cse2
+    _cse41 = _cse0*_cse4
+    _cse42 = _cse41*_cse6
+    _cse43 = _cse16*_cse18 + _cse16*_cse19 + _cse17
+    _cse44 = 0.999999998572139*_cse0
+    _cse45 = _cse18*_cse44 + _cse19*_cse44 - _cse23
+    _cse46 = _cse15*_cse45
+    _cse47 = _cse28*_cse43
+    _cse48 = _cse30*_cse45
+    _cse49 = _cse32*_cse45
+    _cse50 = _cse34*_cse43
+    _cse51 = _cse40*_cse8
+    _cse52 = _cse2*_cse8
+    _cse53 = 0.999999998572139*_cse4*_cse6 - 0.999999998572139*_cse52
+    _cse54 = _cse15*_cse53
+    _cse55 = 6.57617443000635e-7*_cse4*_cse6 - 6.57617443000635e-7*_cse52
+    _cse56 = _cse22*_cse55
+    _cse57 = _cse30*_cse53
+    _cse58 = _cse32*_cse53
+    _cse59 = _cse28*_cse55
+    _cse60 = _cse34*_cse55
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + 0.210033941789101*_cse10 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse20*_cse26 - 0.0315500189858492*_cse21 + _cse24*_cse27 + 0.0315500189858492*_cse25 - 0.0189192713225*_cse29 + _cse3*_cse7 + 0.20503*_cse3 - 0.01084270231829*_cse31 - 0.0189192713225*_cse33 - 0.01084270231829*_cse35 + _cse38*(-0.000346321299837637*_cse10 + 0.517383113*_cse29 - 0.855753802*_cse31 + 0.517383113*_cse33 - 0.855753802*_cse35 + 0.000346321299837637*_cse9) + _cse39*(0.818687841791724*_cse10 - 0.212878838804554*_cse21 + 0.212878838804554*_cse25 + 0.758601438*_cse29 + 0.458851168*_cse31 + 0.758601438*_cse33 + 0.458851168*_cse35 - 0.818687841791724*_cse9) - 1.098e-6*_cse5 - 0.210033941789101*_cse9 - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.210033941789101*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse11*_cse41 - _cse13*_cse40 - _cse14*_cse41 + 0.0315500189858492*_cse22*_cse43 + _cse26*_cse45 + _cse27*_cse43 + _cse38*(0.000346321299837637*_cse42 + 0.517383113*_cse47 - 0.855753802*_cse48 + 0.517383113*_cse49 - 0.855753802*_cse50 - 0.000346321299837637*_cse51) + _cse39*(0.212878838804554*_cse22*_cse43 - 0.818687841791724*_cse42 - 0.212878838804554*_cse46 + 0.758601438*_cse47 + 0.458851168*_cse48 + 0.758601438*_cse49 + 0.458851168*_cse50 + 0.818687841791724*_cse51) - _cse40*_cse7 - 0.20503*_cse40 - 0.210033941789101*_cse42 - 0.0315500189858492*_cse46 - 0.0189192713225*_cse47 - 0.01084270231829*_cse48 - 0.0189192713225*_cse49 - 0.01084270231829*_cse50 - 1.7324e-5
+    out[2, 0] = -_cse13*_cse4 + _cse14*_cse2 + 0.210033941789101*_cse18 + 0.210033941789101*_cse19 + 0.001950802*_cse2 + _cse26*_cse53 + _cse27*_cse55 + _cse38*(-0.000346321299837637*_cse18 - 0.000346321299837637*_cse19 + 0.517383113*_cse28*_cse55 + 0.517383113*_cse32*_cse53 - 0.855753802*_cse57 - 0.855753802*_cse60) + _cse39*(0.818687841791724*_cse18 + 0.818687841791724*_cse19 - 0.212878838804554*_cse54 + 0.212878838804554*_cse56 + 0.458851168*_cse57 + 0.758601438*_cse58 + 0.758601438*_cse59 + 0.458851168*_cse60) - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + 0.0038906673398998*_cse52 - 0.0315500189858492*_cse54 + 0.0315500189858492*_cse56 - 0.01084270231829*_cse57 - 0.0189192713225*_cse58 - 0.0189192713225*_cse59 - 0.01084270231829*_cse60 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# link5[0,0,0]_J
+def function37(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = math.sin(q3)
+    _cse24 = 6.57617443000635e-7*_cse1
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse11*_cse25 - _cse24 + _cse25*_cse6
+    _cse27 = _cse23*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse23
+    _cse29 = -_cse28
+    _cse30 = _cse22*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse23
+    _cse32 = _cse26*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse23
+    _cse34 = _cse26*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse23
+    _cse36 = _cse22*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse23
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse23
+    _cse39 = -_cse38
+    _cse40 = math.sin(q4)
+    _cse41 = math.cos(q4)
+    _cse42 = -0.012272*_cse40 - 0.00052974*_cse41
+    _cse43 = _cse0*_cse2
+    _cse44 = _cse43*_cse8
+    _cse45 = 0.000346321299837637*_cse10 + 0.517383113*_cse30 - 0.855753802*_cse32 + 0.517383113*_cse34 - 0.855753802*_cse36 - 0.000346321299837637*_cse44
+    _cse46 = 0.00052974*_cse40 - 0.012272*_cse41
+    _cse47 = -_cse46
+    _cse48 = _cse19*_cse22
+    _cse49 = -0.818687841791724*_cse10 - 0.212878838804554*_cse27 + 0.758601438*_cse30 + 0.458851168*_cse32 + 0.758601438*_cse34 + 0.458851168*_cse36 + 0.818687841791724*_cse44 + 0.212878838804554*_cse48
+    _cse50 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse51 = 0.818687841791724*_cse6
+    _cse52 = _cse1*_cse51
+    _cse53 = 0.818687841791724*_cse11
+    _cse54 = _cse1*_cse53
+    _cse55 = _cse2*_cse8
+    _cse56 = _cse4*_cse5
+    _cse57 = _cse24*_cse55 - _cse24*_cse56
+    _cse58 = _cse20*_cse55 - _cse20*_cse56
+    _cse59 = _cse23*_cse58
+    _cse60 = _cse29*_cse57
+    _cse61 = _cse35*_cse57
+    _cse62 = _cse31*_cse58
+    _cse63 = _cse33*_cse58
+    _cse64 = 0.000346321299837637*_cse11
+    _cse65 = 0.000346321299837637*_cse6
+    _cse66 = _cse1*_cse64 + _cse1*_cse65
+    _cse67 = _cse1*_cse2
+    _cse68 = _cse67*_cse8
+    _cse69 = 0.210033941789101*_cse1
+    _cse70 = _cse1*_cse4
+    _cse71 = _cse5*_cse70
+    _cse72 = _cse11*_cse69 + _cse17*_cse67 + _cse6*_cse69 + 0.0038906673398998*_cse68 - 0.0038906673398998*_cse71
+    _cse73 = -_cse58
+    _cse74 = _cse23*_cse73
+    _cse75 = -_cse57
+    _cse76 = _cse19*_cse75
+    _cse77 = _cse31*_cse73
+    _cse78 = _cse33*_cse73
+    _cse79 = _cse29*_cse75
+    _cse80 = _cse35*_cse75
+    _cse81 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse82 = -_cse81
+    _cse83 = _cse19*_cse82
+    _cse84 = -0.999999998572139*_cse0 + _cse11*_cse24 + _cse24*_cse6
+    _cse85 = -_cse84
+    _cse86 = _cse23*_cse85
+    _cse87 = -_cse35
+    _cse88 = _cse82*_cse87
+    _cse89 = _cse31*_cse85
+    _cse90 = _cse28*_cse82
+    _cse91 = _cse33*_cse85
+    _cse92 = 0.000346321299837637*_cse68
+    _cse93 = 0.000346321299837637*_cse71
+    _cse94 = _cse29*_cse85
+    _cse95 = _cse31*_cse82
+    _cse96 = _cse33*_cse82
+    _cse97 = _cse35*_cse85
+    _cse98 = _cse92 - _cse93 + 0.517383113*_cse94 - 0.855753802*_cse95 + 0.517383113*_cse96 - 0.855753802*_cse97
+    _cse99 = 0.818687841791724*_cse68
+    _cse100 = 0.818687841791724*_cse71
+    _cse101 = 0.212878838804554*_cse23
+    _cse102 = 0.212878838804554*_cse19
+    _cse103 = _cse100 - _cse101*_cse82 + _cse102*_cse85 + 0.758601438*_cse94 + 0.458851168*_cse95 + 0.758601438*_cse96 + 0.458851168*_cse97 - _cse99
+    _cse104 = 0.0315500189858492*_cse23
+    _cse105 = _cse29*_cse84
+    _cse106 = _cse31*_cse81
+    _cse107 = _cse33*_cse81
+    _cse108 = _cse35*_cse84
+    _cse109 = _cse0*_cse51
+    _cse110 = _cse0*_cse53
+    _cse111 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse25*_cse55
+    _cse112 = -_cse111
+    _cse113 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse55
+    _cse114 = -_cse113
+    _cse115 = _cse112*_cse31
+    _cse116 = _cse112*_cse33
+    _cse117 = _cse114*_cse29
+    _cse118 = _cse114*_cse35
+    _cse119 = _cse0*_cse64 + _cse0*_cse65
+    _cse120 = 0.0315500189858492*_cse19
+    _cse121 = 0.210033941789101*_cse0
+    _cse122 = -0.0038906673398998*_cse10 + _cse11*_cse121 + _cse121*_cse6 + _cse17*_cse43 + 0.0038906673398998*_cse44
+    _cse123 = _cse113*_cse29
+    _cse124 = _cse113*_cse35
+    _cse125 = _cse111*_cse31
+    _cse126 = _cse111*_cse33
+    _cse127 = _cse26*_cse87
+    _cse128 = _cse22*_cse31
+    _cse129 = _cse26*_cse28
+    _cse130 = _cse22*_cse33
+    _cse131 = 0.818687841791724*_cse55
+    _cse132 = 0.818687841791724*_cse56
+    _cse133 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse134 = -_cse133
+    _cse135 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse136 = -_cse135
+    _cse137 = _cse134*_cse31
+    _cse138 = _cse134*_cse33
+    _cse139 = _cse136*_cse29
+    _cse140 = _cse136*_cse35
+    _cse141 = -0.000346321299837637*_cse55 + 0.000346321299837637*_cse56
+    _cse142 = _cse12 + _cse18 - 0.210033941789101*_cse55 + 0.210033941789101*_cse56 + _cse7
+    _cse143 = _cse135*_cse29
+    _cse144 = _cse135*_cse35
+    _cse145 = _cse133*_cse31
+    _cse146 = _cse133*_cse33
+    _cse147 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse55
+    _cse148 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse55
+    _cse149 = _cse147*_cse87
+    _cse150 = _cse147*_cse28
+    _cse151 = _cse148*_cse31
+    _cse152 = _cse148*_cse33
+    _cse153 = _cse147*_cse31
+    _cse154 = _cse148*_cse35
+    _cse155 = 0.517383113*_cse147*_cse33 + 0.517383113*_cse148*_cse29 - 0.855753802*_cse153 - 0.855753802*_cse154 - _cse64 - _cse65
+    _cse156 = _cse147*_cse33
+    _cse157 = _cse148*_cse29
+    _cse158 = -_cse101*_cse147 + _cse102*_cse148 + 0.458851168*_cse153 + 0.458851168*_cse154 + 0.758601438*_cse156 + 0.758601438*_cse157 + _cse51 + _cse53
+    _cse159 = _cse23*_cse82
+    _cse160 = _cse19*_cse85
+    _cse161 = 0.410149995883665*_cse40
+    _cse162 = -0.324483922899196*_cse40 + 0.186867681620663*_cse41
+    _cse163 = 0.0845234292360949*_cse40 + 0.186654664878584*_cse41
+    _cse164 = 0.410149995883665*_cse41
+    _cse165 = 0.186867681620663*_cse40 + 0.324483922899196*_cse41
+    _cse166 = 0.186654664878584*_cse40 - 0.0845234292360949*_cse41
+    _cse167 = _cse147*_cse23
+    _cse168 = _cse148*_cse19
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.210033941789101*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.210033941789101*_cse10 + 0.0315500189858492*_cse19*_cse22 + _cse22*_cse39 + _cse26*_cse37 - 0.0315500189858492*_cse27 - 0.0189192713225*_cse30 - 0.01084270231829*_cse32 - 0.0189192713225*_cse34 - 0.01084270231829*_cse36 + _cse42*_cse45 + _cse47*_cse49
+    out[0, 1] = _cse1*_cse15*_cse4 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse1*_cse50 + 0.0315500189858492*_cse19*_cse57 + _cse37*_cse58 + _cse39*_cse57 + _cse42*(0.517383113*_cse60 - 0.855753802*_cse61 - 0.855753802*_cse62 + 0.517383113*_cse63 + _cse66) + _cse47*(0.212878838804554*_cse19*_cse57 - _cse52 - _cse54 - 0.212878838804554*_cse59 + 0.758601438*_cse60 + 0.458851168*_cse61 + 0.458851168*_cse62 + 0.758601438*_cse63) - 0.0315500189858492*_cse59 - 0.0189192713225*_cse60 - 0.01084270231829*_cse61 - 0.01084270231829*_cse62 - 0.0189192713225*_cse63 - _cse72
+    out[0, 2] = _cse14*_cse70 + _cse37*_cse73 + _cse39*_cse75 + _cse42*(0.517383113*_cse29*_cse75 + 0.517383113*_cse33*_cse73 - _cse66 - 0.855753802*_cse77 - 0.855753802*_cse80) + _cse47*(_cse52 + _cse54 - 0.212878838804554*_cse74 + 0.212878838804554*_cse76 + 0.458851168*_cse77 + 0.758601438*_cse78 + 0.758601438*_cse79 + 0.458851168*_cse80) + _cse72 - 0.0315500189858492*_cse74 + 0.0315500189858492*_cse76 - 0.01084270231829*_cse77 - 0.0189192713225*_cse78 - 0.0189192713225*_cse79 - 0.01084270231829*_cse80
+    out[0, 3] = _cse37*_cse85 + _cse38*_cse82 + _cse42*(0.517383113*_cse28*_cse82 + 0.517383113*_cse33*_cse85 - 0.855753802*_cse88 - 0.855753802*_cse89) + _cse47*(-0.212878838804554*_cse83 - 0.212878838804554*_cse86 + 0.458851168*_cse88 + 0.458851168*_cse89 + 0.758601438*_cse90 + 0.758601438*_cse91) - 0.0315500189858492*_cse83 - 0.0315500189858492*_cse86 - 0.01084270231829*_cse88 - 0.01084270231829*_cse89 - 0.0189192713225*_cse90 - 0.0189192713225*_cse91
+    out[0, 4] = _cse103*_cse42 + _cse46*_cse98
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.210033941789101*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 - _cse104*_cse81 - 0.0189192713225*_cse105 - 0.01084270231829*_cse106 - 0.0189192713225*_cse107 - 0.01084270231829*_cse108 + 0.0315500189858492*_cse19*_cse84 + _cse37*_cse81 + _cse39*_cse84 + _cse42*(0.517383113*_cse105 - 0.855753802*_cse106 + 0.517383113*_cse107 - 0.855753802*_cse108 - _cse92 + _cse93) + _cse47*(-_cse100 - _cse101*_cse81 + _cse102*_cse84 + 0.758601438*_cse105 + 0.458851168*_cse106 + 0.758601438*_cse107 + 0.458851168*_cse108 + _cse99) - 0.210033941789101*_cse71
+    out[1, 1] = _cse0*_cse50 - _cse104*_cse112 + _cse112*_cse37 + _cse114*_cse120 + _cse114*_cse39 - 0.01084270231829*_cse115 - 0.0189192713225*_cse116 - 0.0189192713225*_cse117 - 0.01084270231829*_cse118 + _cse122 - _cse15*_cse9 + _cse42*(0.517383113*_cse112*_cse33 + 0.517383113*_cse114*_cse29 - 0.855753802*_cse115 - 0.855753802*_cse118 - _cse119) - 1.098e-6*_cse43 + _cse47*(-_cse101*_cse112 + _cse102*_cse114 + _cse109 + _cse110 + 0.458851168*_cse115 + 0.758601438*_cse116 + 0.758601438*_cse117 + 0.458851168*_cse118) - 0.20503*_cse9
+    out[1, 2] = -_cse104*_cse111 + _cse111*_cse37 + 0.0315500189858492*_cse113*_cse19 + _cse113*_cse39 - _cse122 - 0.0189192713225*_cse123 - 0.01084270231829*_cse124 - 0.01084270231829*_cse125 - 0.0189192713225*_cse126 - _cse14*_cse9 + _cse42*(_cse119 + 0.517383113*_cse123 - 0.855753802*_cse124 - 0.855753802*_cse125 + 0.517383113*_cse126) + _cse47*(-_cse101*_cse111 + _cse102*_cse113 - _cse109 - _cse110 + 0.758601438*_cse123 + 0.458851168*_cse124 + 0.458851168*_cse125 + 0.758601438*_cse126)
+    out[1, 3] = -_cse104*_cse22 - _cse120*_cse26 - 0.01084270231829*_cse127 - 0.01084270231829*_cse128 - 0.0189192713225*_cse129 - 0.0189192713225*_cse130 + _cse22*_cse37 + _cse26*_cse38 + _cse42*(-0.855753802*_cse127 - 0.855753802*_cse128 + 0.517383113*_cse22*_cse33 + 0.517383113*_cse26*_cse28) + _cse47*(-_cse101*_cse22 - _cse102*_cse26 + 0.458851168*_cse127 + 0.458851168*_cse128 + 0.758601438*_cse129 + 0.758601438*_cse130)
+    out[1, 4] = _cse42*_cse49 + _cse45*_cse46
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse104*_cse134 + _cse120*_cse136 + _cse134*_cse37 + _cse136*_cse39 - 0.01084270231829*_cse137 - 0.0189192713225*_cse138 - 0.0189192713225*_cse139 - 0.01084270231829*_cse140 + _cse142 + _cse16 + 0.41405*_cse2 + 0.001950802*_cse4 + _cse42*(0.517383113*_cse134*_cse33 + 0.517383113*_cse136*_cse29 - 0.855753802*_cse137 - 0.855753802*_cse140 - _cse141) + _cse47*(-_cse101*_cse134 + _cse102*_cse136 - _cse131 + _cse132 + 0.458851168*_cse137 + 0.758601438*_cse138 + 0.758601438*_cse139 + 0.458851168*_cse140)
+    out[2, 2] = -_cse104*_cse133 + _cse133*_cse37 + 0.0315500189858492*_cse135*_cse19 + _cse135*_cse39 + _cse14*_cse2 - _cse142 - 0.0189192713225*_cse143 - 0.01084270231829*_cse144 - 0.01084270231829*_cse145 - 0.0189192713225*_cse146 + _cse42*(_cse141 + 0.517383113*_cse143 - 0.855753802*_cse144 - 0.855753802*_cse145 + 0.517383113*_cse146) + _cse47*(-_cse101*_cse133 + _cse102*_cse135 + _cse131 - _cse132 + 0.758601438*_cse143 + 0.458851168*_cse144 + 0.458851168*_cse145 + 0.758601438*_cse146)
+    out[2, 3] = -_cse104*_cse148 - _cse120*_cse147 + _cse147*_cse38 + _cse148*_cse37 - 0.01084270231829*_cse149 - 0.0189192713225*_cse150 - 0.01084270231829*_cse151 - 0.0189192713225*_cse152 + _cse42*(0.517383113*_cse147*_cse28 + 0.517383113*_cse148*_cse33 - 0.855753802*_cse149 - 0.855753802*_cse151) + _cse47*(-_cse101*_cse148 - _cse102*_cse147 + 0.458851168*_cse149 + 0.758601438*_cse150 + 0.458851168*_cse151 + 0.758601438*_cse152)
+    out[2, 4] = _cse155*_cse46 + _cse158*_cse42
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse68 - _cse71
+    out[3, 4] = 0.408002994597976*_cse159 - 0.408002994597976*_cse160 + 0.574238819026787*_cse68 - 0.574238819026787*_cse71 + 0.3960285*_cse94 + 0.239041914*_cse95 + 0.3960285*_cse96 + 0.239041914*_cse97
+    out[3, 5] = -_cse103*_cse164 - _cse103*_cse165 + _cse103*_cse166 + 0.234017800844203*_cse159 - 0.234017800844203*_cse160 + _cse161*_cse98 - _cse162*_cse98 + _cse163*_cse98 + 0.329365488408814*_cse68 - 0.329365488408814*_cse71 + 0.227149603970304*_cse94 + 0.137106991283212*_cse95 + 0.227149603970304*_cse96 + 0.137106991283212*_cse97
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse44
+    out[4, 4] = 0.574238819026787*_cse10 + 0.408002994597976*_cse27 + 0.3960285*_cse30 + 0.239041914*_cse32 + 0.3960285*_cse34 + 0.239041914*_cse36 - 0.574238819026787*_cse44 - 0.408002994597976*_cse48
+    out[4, 5] = 0.329365488408814*_cse10 + _cse161*_cse45 - _cse162*_cse45 + _cse163*_cse45 - _cse164*_cse49 - _cse165*_cse49 + _cse166*_cse49 + 0.234017800844203*_cse27 + 0.227149603970304*_cse30 + 0.137106991283212*_cse32 + 0.227149603970304*_cse34 + 0.137106991283212*_cse36 - 0.329365488408814*_cse44 - 0.234017800844203*_cse48
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + 0.239041914*_cse153 + 0.239041914*_cse154 + 0.3960285*_cse156 + 0.3960285*_cse157 + 0.408002994597976*_cse167 - 0.408002994597976*_cse168 - 0.574238819026787*_cse6
+    out[5, 5] = -0.329365488408814*_cse11 + 0.137106991283212*_cse153 + 0.137106991283212*_cse154 + _cse155*_cse161 - _cse155*_cse162 + _cse155*_cse163 + 0.227149603970304*_cse156 + 0.227149603970304*_cse157 - _cse158*_cse164 - _cse158*_cse165 + _cse158*_cse166 + 0.234017800844203*_cse167 - 0.234017800844203*_cse168 - 0.329365488408814*_cse6
+    return out
+
+
+# link5[0,0,0]_dJ
+def function38(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q4)
+    _cse1 = math.cos(q4)
+    _cse2 = 0.00052974*_cse0 - 0.012272*_cse1
+    _cse3 = math.cos(q0)
+    _cse4 = 6.57617443000635e-7*_cse3
+    _cse5 = math.sin(q0)
+    _cse6 = 0.999999998572139*_cse5
+    _cse7 = math.sin(q1)
+    _cse8 = math.sin(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = math.cos(q1)
+    _cse11 = math.cos(q2)
+    _cse12 = _cse10*_cse11
+    _cse13 = _cse12*_cse6 + _cse6*_cse9
+    _cse14 = _cse13 - _cse4
+    _cse15 = math.sin(q3)
+    _cse16 = math.cos(q3)
+    _cse17 = 0.75940555*_cse15 - 0.51802699*_cse16
+    _cse18 = _cse14*_cse17
+    _cse19 = 0.999999998572139*_cse3
+    _cse20 = 6.57617443000635e-7*_cse5
+    _cse21 = _cse12*_cse20 + _cse20*_cse9
+    _cse22 = _cse19 + _cse21
+    _cse23 = 0.51802699*_cse15 + 0.75940555*_cse16
+    _cse24 = -_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = 0.45991232*_cse15 + 0.85536427*_cse16
+    _cse27 = _cse14*_cse26
+    _cse28 = 0.85536427*_cse15 - 0.45991232*_cse16
+    _cse29 = _cse22*_cse28
+    _cse30 = _cse10*_cse8
+    _cse31 = 0.000346321299837637*_cse30
+    _cse32 = _cse31*_cse5
+    _cse33 = _cse11*_cse7
+    _cse34 = 0.000346321299837637*_cse33
+    _cse35 = _cse34*_cse5
+    _cse36 = _cse32 - _cse35
+    _cse37 = 0.517383113*_cse18 + 0.517383113*_cse25 - 0.855753802*_cse27 - 0.855753802*_cse29 + _cse36
+    _cse38 = 0.012272*_cse0 + 0.00052974*_cse1
+    _cse39 = -_cse38
+    _cse40 = 0.212878838804554*_cse16
+    _cse41 = _cse22*_cse40
+    _cse42 = 0.212878838804554*_cse15
+    _cse43 = _cse14*_cse42
+    _cse44 = 0.818687841791724*_cse33
+    _cse45 = _cse44*_cse5
+    _cse46 = 0.818687841791724*_cse30
+    _cse47 = _cse46*_cse5
+    _cse48 = _cse45 - _cse47
+    _cse49 = 0.758601438*_cse18 + 0.758601438*_cse25 + 0.458851168*_cse27 + 0.458851168*_cse29 + _cse41 - _cse43 + _cse48
+    _cse50 = _cse2*_cse37 + _cse39*_cse49
+    _cse51 = _cse15*_cse22
+    _cse52 = _cse14*_cse16
+    _cse53 = -_cse28
+    _cse54 = _cse14*_cse53
+    _cse55 = _cse22*_cse26
+    _cse56 = _cse14*_cse23
+    _cse57 = _cse17*_cse22
+    _cse58 = 0.012581*_cse15 + 0.00040053*_cse16
+    _cse59 = -_cse58
+    _cse60 = 0.00040053*_cse15 - 0.012581*_cse16
+    _cse61 = 0.517383113*_cse14*_cse23 + 0.517383113*_cse17*_cse22 - 0.855753802*_cse54 - 0.855753802*_cse55
+    _cse62 = -_cse2
+    _cse63 = -0.212878838804554*_cse51 - 0.212878838804554*_cse52 + 0.458851168*_cse54 + 0.458851168*_cse55 + 0.758601438*_cse56 + 0.758601438*_cse57
+    _cse64 = _cse14*_cse60 + _cse22*_cse59 + _cse39*_cse61 - 0.0315500189858492*_cse51 - 0.0315500189858492*_cse52 - 0.01084270231829*_cse54 - 0.01084270231829*_cse55 - 0.0189192713225*_cse56 - 0.0189192713225*_cse57 + _cse62*_cse63
+    _cse65 = _cse5*_cse7
+    _cse66 = _cse65*_cse8
+    _cse67 = 0.818687841791724*_cse66
+    _cse68 = _cse10*_cse5
+    _cse69 = _cse11*_cse68
+    _cse70 = 0.818687841791724*_cse69
+    _cse71 = -6.57617443000635e-7*_cse10*_cse5*_cse8 + _cse20*_cse33
+    _cse72 = _cse16*_cse71
+    _cse73 = -0.999999998572139*_cse10*_cse5*_cse8 + _cse33*_cse6
+    _cse74 = _cse15*_cse73
+    _cse75 = _cse24*_cse71
+    _cse76 = _cse28*_cse71
+    _cse77 = _cse26*_cse73
+    _cse78 = _cse17*_cse73
+    _cse79 = -_cse67 - _cse70 + 0.212878838804554*_cse72 - 0.212878838804554*_cse74 + 0.758601438*_cse75 + 0.458851168*_cse76 + 0.458851168*_cse77 + 0.758601438*_cse78
+    _cse80 = -_cse60
+    _cse81 = 0.000346321299837637*_cse66 + 0.000346321299837637*_cse69
+    _cse82 = 0.517383113*_cse75 - 0.855753802*_cse76 - 0.855753802*_cse77 + 0.517383113*_cse78 + _cse81
+    _cse83 = 0.081945*_cse11 + 0.00048786*_cse8
+    _cse84 = _cse10*_cse83
+    _cse85 = -0.00048786*_cse11 + 0.081945*_cse8
+    _cse86 = _cse7*_cse85
+    _cse87 = 0.0038906673398998*_cse33
+    _cse88 = 0.0038906673398998*_cse30
+    _cse89 = _cse5*_cse86 + _cse5*_cse87 - _cse5*_cse88 + 0.210033941789101*_cse66 + 0.210033941789101*_cse69
+    _cse90 = 0.0315500189858492*_cse16*_cse71 + _cse39*_cse82 - _cse5*_cse84 + _cse59*_cse73 + _cse62*_cse79 + _cse71*_cse80 - 0.0315500189858492*_cse74 - 0.0189192713225*_cse75 - 0.01084270231829*_cse76 - 0.01084270231829*_cse77 - 0.0189192713225*_cse78 - _cse89
+    _cse91 = -0.20902*_cse10 + 0.0019519*_cse7
+    _cse92 = -_cse73
+    _cse93 = _cse15*_cse92
+    _cse94 = -_cse71
+    _cse95 = _cse16*_cse94
+    _cse96 = _cse26*_cse92
+    _cse97 = _cse17*_cse92
+    _cse98 = _cse24*_cse94
+    _cse99 = _cse28*_cse94
+    _cse100 = _cse67 + _cse70 - 0.212878838804554*_cse93 + 0.212878838804554*_cse95 + 0.458851168*_cse96 + 0.758601438*_cse97 + 0.758601438*_cse98 + 0.458851168*_cse99
+    _cse101 = 0.517383113*_cse17*_cse92 + 0.517383113*_cse24*_cse94 - _cse81 - 0.855753802*_cse96 - 0.855753802*_cse99
+    _cse102 = -_cse83
+    _cse103 = _cse10*_cse102
+    _cse104 = _cse100*_cse62 + _cse101*_cse39 - _cse103*_cse5 + _cse5*_cse91 + _cse59*_cse92 - 1.098e-6*_cse65 - 0.20503*_cse68 + _cse80*_cse94 + _cse89 - 0.0315500189858492*_cse93 + 0.0315500189858492*_cse95 - 0.01084270231829*_cse96 - 0.0189192713225*_cse97 - 0.0189192713225*_cse98 - 0.01084270231829*_cse99
+    _cse105 = _cse12*_cse19 + _cse19*_cse9
+    _cse106 = _cse105 + _cse20
+    _cse107 = _cse106*_cse17
+    _cse108 = _cse12*_cse4 + _cse4*_cse9
+    _cse109 = _cse108 - _cse6
+    _cse110 = _cse109*_cse24
+    _cse111 = _cse109*_cse16
+    _cse112 = _cse106*_cse26
+    _cse113 = _cse109*_cse28
+    _cse114 = _cse106*_cse15
+    _cse115 = _cse3*_cse44
+    _cse116 = _cse3*_cse46
+    _cse117 = _cse115 - _cse116
+    _cse118 = 0.758601438*_cse107 + 0.758601438*_cse110 + 0.212878838804554*_cse111 + 0.458851168*_cse112 + 0.458851168*_cse113 - 0.212878838804554*_cse114 + _cse117
+    _cse119 = 0.0019519*_cse10 + 0.20902*_cse7
+    _cse120 = -_cse119
+    _cse121 = _cse3*_cse31
+    _cse122 = _cse3*_cse34
+    _cse123 = _cse121 - _cse122
+    _cse124 = 0.517383113*_cse107 + 0.517383113*_cse110 - 0.855753802*_cse112 - 0.855753802*_cse113 + _cse123
+    _cse125 = _cse10*_cse3
+    _cse126 = _cse125*_cse85
+    _cse127 = _cse11*_cse125
+    _cse128 = 0.0038906673398998*_cse127
+    _cse129 = _cse3*_cse7
+    _cse130 = _cse129*_cse8
+    _cse131 = 0.0038906673398998*_cse130
+    _cse132 = _cse3*_cse30
+    _cse133 = 0.210033941789101*_cse132
+    _cse134 = _cse3*_cse33
+    _cse135 = -0.210033941789101*_cse134
+    _cse136 = -1.098e-6*_cse10*_cse3 + _cse102*_cse129 + _cse126 + _cse128 + 0.20503*_cse129 + _cse131 + _cse133 + _cse135
+    _cse137 = -_cse19*_cse30 + _cse19*_cse33
+    _cse138 = _cse137*_cse17
+    _cse139 = -_cse30*_cse4 + _cse33*_cse4
+    _cse140 = _cse139*_cse24
+    _cse141 = _cse137*_cse26
+    _cse142 = _cse139*_cse28
+    _cse143 = 0.000346321299837637*_cse127 + 0.000346321299837637*_cse130
+    _cse144 = 0.517383113*_cse138 + 0.517383113*_cse140 - 0.855753802*_cse141 - 0.855753802*_cse142 + _cse143
+    _cse145 = 0.818687841791724*_cse130
+    _cse146 = 0.818687841791724*_cse127
+    _cse147 = -_cse137*_cse42 + 0.758601438*_cse138 + _cse139*_cse40 + 0.758601438*_cse140 + 0.458851168*_cse141 + 0.458851168*_cse142 - _cse145 - _cse146
+    _cse148 = _cse144*_cse2 + _cse147*_cse39
+    _cse149 = 0.0315500189858492*_cse15
+    _cse150 = 0.0315500189858492*_cse16
+    _cse151 = _cse139*_cse26
+    _cse152 = _cse139*_cse17
+    _cse153 = _cse137*_cse53
+    _cse154 = _cse137*_cse23
+    _cse155 = -_cse137*_cse150 + _cse137*_cse60 - _cse139*_cse149 + _cse139*_cse59 - 0.01084270231829*_cse151 - 0.0189192713225*_cse152 - 0.01084270231829*_cse153 - 0.0189192713225*_cse154 + _cse39*(0.517383113*_cse137*_cse23 + 0.517383113*_cse139*_cse17 - 0.855753802*_cse151 - 0.855753802*_cse153) + _cse62*(-_cse137*_cse40 - _cse139*_cse42 + 0.458851168*_cse151 + 0.758601438*_cse152 + 0.458851168*_cse153 + 0.758601438*_cse154)
+    _cse156 = -_cse105
+    _cse157 = _cse156*_cse17
+    _cse158 = -_cse108
+    _cse159 = _cse158*_cse24
+    _cse160 = _cse156*_cse26
+    _cse161 = _cse158*_cse28
+    _cse162 = -_cse115 + _cse116
+    _cse163 = _cse128 - _cse129*_cse83 + _cse131 + _cse133 + _cse135
+    _cse164 = _cse126 - _cse149*_cse156 + _cse150*_cse158 + _cse156*_cse59 - 0.0189192713225*_cse157 + _cse158*_cse80 - 0.0189192713225*_cse159 - 0.01084270231829*_cse160 - 0.01084270231829*_cse161 + _cse163 + _cse39*(-_cse123 + 0.517383113*_cse156*_cse17 + 0.517383113*_cse158*_cse24 - 0.855753802*_cse160 - 0.855753802*_cse161) + _cse62*(-_cse156*_cse42 + 0.758601438*_cse157 + _cse158*_cse40 + 0.758601438*_cse159 + 0.458851168*_cse160 + 0.458851168*_cse161 + _cse162)
+    _cse165 = _cse105*_cse17
+    _cse166 = _cse108*_cse24
+    _cse167 = _cse105*_cse26
+    _cse168 = _cse108*_cse28
+    _cse169 = _cse105*_cse149 - _cse105*_cse59 - 0.0315500189858492*_cse108*_cse16 - _cse108*_cse80 + 0.0189192713225*_cse165 + 0.0189192713225*_cse166 + 0.01084270231829*_cse167 + 0.01084270231829*_cse168 - _cse39*(_cse123 + 0.517383113*_cse165 + 0.517383113*_cse166 - 0.855753802*_cse167 - 0.855753802*_cse168) - _cse62*(-_cse105*_cse42 + _cse108*_cse40 + _cse117 + 0.758601438*_cse165 + 0.758601438*_cse166 + 0.458851168*_cse167 + 0.458851168*_cse168)
+    _cse170 = -_cse137
+    _cse171 = _cse170*_cse26
+    _cse172 = -_cse139
+    _cse173 = _cse172*_cse28
+    _cse174 = -_cse143 + 0.517383113*_cse17*_cse170 - 0.855753802*_cse171 + 0.517383113*_cse172*_cse24 - 0.855753802*_cse173
+    _cse175 = _cse17*_cse170
+    _cse176 = _cse172*_cse24
+    _cse177 = _cse145 + _cse146 - _cse170*_cse42 + 0.458851168*_cse171 + _cse172*_cse40 + 0.458851168*_cse173 + 0.758601438*_cse175 + 0.758601438*_cse176
+    _cse178 = _cse174*_cse2 + _cse177*_cse39
+    _cse179 = _cse170*_cse53
+    _cse180 = _cse170*_cse23
+    _cse181 = _cse172*_cse26
+    _cse182 = _cse17*_cse172
+    _cse183 = -_cse149*_cse172 - _cse150*_cse170 + _cse170*_cse60 + _cse172*_cse59 - 0.01084270231829*_cse179 - 0.0189192713225*_cse180 - 0.01084270231829*_cse181 - 0.0189192713225*_cse182 + _cse39*(0.517383113*_cse17*_cse172 + 0.517383113*_cse170*_cse23 - 0.855753802*_cse179 - 0.855753802*_cse181) + _cse62*(-_cse170*_cse40 - _cse172*_cse42 + 0.458851168*_cse179 + 0.758601438*_cse180 + 0.458851168*_cse181 + 0.758601438*_cse182)
+    _cse184 = -_cse85
+    _cse185 = -_cse106
+    _cse186 = _cse185*_cse53
+    _cse187 = -_cse109
+    _cse188 = _cse187*_cse26
+    _cse189 = 0.517383113*_cse17*_cse187 + 0.517383113*_cse185*_cse23 - 0.855753802*_cse186 - 0.855753802*_cse188
+    _cse190 = _cse185*_cse23
+    _cse191 = _cse17*_cse187
+    _cse192 = -_cse185*_cse40 + 0.458851168*_cse186 - _cse187*_cse42 + 0.458851168*_cse188 + 0.758601438*_cse190 + 0.758601438*_cse191
+    _cse193 = _cse189*_cse2 + _cse192*_cse39
+    _cse194 = _cse187*_cse53
+    _cse195 = -_cse17
+    _cse196 = _cse185*_cse195
+    _cse197 = -_cse26
+    _cse198 = _cse185*_cse197
+    _cse199 = _cse187*_cse23
+    _cse200 = _cse185*_cse42
+    _cse201 = _cse187*_cse40
+    _cse202 = _cse187*_cse24
+    _cse203 = _cse185*_cse26
+    _cse204 = _cse17*_cse185
+    _cse205 = _cse187*_cse28
+    _cse206 = -_cse121 + _cse122 + 0.517383113*_cse202 - 0.855753802*_cse203 + 0.517383113*_cse204 - 0.855753802*_cse205
+    _cse207 = _cse162 - _cse200 + _cse201 + 0.758601438*_cse202 + 0.458851168*_cse203 + 0.758601438*_cse204 + 0.458851168*_cse205
+    _cse208 = _cse118*_cse39 + _cse124*_cse2
+    _cse209 = _cse106*_cse53
+    _cse210 = _cse109*_cse26
+    _cse211 = _cse106*_cse23
+    _cse212 = _cse109*_cse17
+    _cse213 = -_cse106*_cse150 + _cse106*_cse60 - _cse109*_cse149 + _cse109*_cse59 - 0.01084270231829*_cse209 - 0.01084270231829*_cse210 - 0.0189192713225*_cse211 - 0.0189192713225*_cse212 + _cse39*(0.517383113*_cse106*_cse23 + 0.517383113*_cse109*_cse17 - 0.855753802*_cse209 - 0.855753802*_cse210) + _cse62*(-_cse106*_cse40 - _cse109*_cse42 + 0.458851168*_cse209 + 0.458851168*_cse210 + 0.758601438*_cse211 + 0.758601438*_cse212)
+    _cse214 = 0.210033941789101*_cse127 + 0.210033941789101*_cse130 + _cse3*_cse86 + _cse3*_cse87 - _cse3*_cse88
+    _cse215 = -_cse137*_cse149 + _cse137*_cse59 - 0.0189192713225*_cse138 + 0.0315500189858492*_cse139*_cse16 + _cse139*_cse80 - 0.0189192713225*_cse140 - 0.01084270231829*_cse141 - 0.01084270231829*_cse142 + _cse144*_cse39 + _cse147*_cse62 - _cse214 - _cse3*_cse84
+    _cse216 = -_cse103*_cse3 - 0.20503*_cse125 - 1.098e-6*_cse129 - _cse149*_cse170 + _cse150*_cse172 + _cse170*_cse59 - 0.01084270231829*_cse171 + _cse172*_cse80 - 0.01084270231829*_cse173 + _cse174*_cse39 - 0.0189192713225*_cse175 - 0.0189192713225*_cse176 + _cse177*_cse62 + _cse214 + _cse3*_cse91
+    _cse217 = -_cse14
+    _cse218 = _cse17*_cse217
+    _cse219 = -_cse22
+    _cse220 = _cse219*_cse24
+    _cse221 = _cse217*_cse26
+    _cse222 = _cse219*_cse28
+    _cse223 = -_cse45 + _cse47
+    _cse224 = _cse68*_cse85
+    _cse225 = 0.0038906673398998*_cse69
+    _cse226 = 0.0038906673398998*_cse66
+    _cse227 = _cse30*_cse5
+    _cse228 = 0.210033941789101*_cse227
+    _cse229 = _cse33*_cse5
+    _cse230 = -0.210033941789101*_cse229
+    _cse231 = _cse102*_cse65 + _cse224 + _cse225 + _cse226 + _cse228 + _cse230 + 0.20503*_cse65 - 1.098e-6*_cse68
+    _cse232 = _cse100*_cse39 + _cse101*_cse2
+    _cse233 = _cse53*_cse92
+    _cse234 = _cse23*_cse92
+    _cse235 = _cse26*_cse94
+    _cse236 = _cse17*_cse94
+    _cse237 = -_cse149*_cse94 - _cse150*_cse92 - 0.01084270231829*_cse233 - 0.0189192713225*_cse234 - 0.01084270231829*_cse235 - 0.0189192713225*_cse236 + _cse39*(0.517383113*_cse17*_cse94 + 0.517383113*_cse23*_cse92 - 0.855753802*_cse233 - 0.855753802*_cse235) + _cse59*_cse94 + _cse60*_cse92 + _cse62*(0.458851168*_cse233 + 0.758601438*_cse234 + 0.458851168*_cse235 + 0.758601438*_cse236 - _cse40*_cse92 - _cse42*_cse94)
+    _cse238 = _cse13*_cse17
+    _cse239 = _cse21*_cse24
+    _cse240 = _cse13*_cse26
+    _cse241 = _cse21*_cse28
+    _cse242 = _cse225 + _cse226 + _cse228 + _cse230 - _cse65*_cse83
+    _cse243 = -_cse13*_cse149 + _cse13*_cse59 + 0.0315500189858492*_cse16*_cse21 + _cse21*_cse80 - _cse224 - 0.0189192713225*_cse238 - 0.0189192713225*_cse239 - 0.01084270231829*_cse240 - 0.01084270231829*_cse241 - _cse242 + _cse39*(0.517383113*_cse238 + 0.517383113*_cse239 - 0.855753802*_cse240 - 0.855753802*_cse241 + _cse36) + _cse62*(-_cse13*_cse42 + _cse21*_cse40 + 0.758601438*_cse238 + 0.758601438*_cse239 + 0.458851168*_cse240 + 0.458851168*_cse241 + _cse48)
+    _cse244 = -_cse13
+    _cse245 = _cse17*_cse244
+    _cse246 = -_cse21
+    _cse247 = _cse24*_cse246
+    _cse248 = _cse244*_cse26
+    _cse249 = _cse246*_cse28
+    _cse250 = -_cse149*_cse244 + _cse150*_cse246 + _cse244*_cse59 - 0.0189192713225*_cse245 + _cse246*_cse80 - 0.0189192713225*_cse247 - 0.01084270231829*_cse248 - 0.01084270231829*_cse249 + _cse39*(0.517383113*_cse17*_cse244 + 0.517383113*_cse24*_cse246 - 0.855753802*_cse248 - 0.855753802*_cse249 - _cse36) + _cse62*(_cse223 - _cse244*_cse42 + 0.758601438*_cse245 + _cse246*_cse40 + 0.758601438*_cse247 + 0.458851168*_cse248 + 0.458851168*_cse249)
+    _cse251 = _cse2*_cse82 + _cse39*_cse79
+    _cse252 = _cse26*_cse71
+    _cse253 = _cse17*_cse71
+    _cse254 = _cse53*_cse73
+    _cse255 = _cse23*_cse73
+    _cse256 = -_cse149*_cse71 - _cse150*_cse73 - 0.01084270231829*_cse252 - 0.0189192713225*_cse253 - 0.01084270231829*_cse254 - 0.0189192713225*_cse255 + _cse39*(0.517383113*_cse17*_cse71 + 0.517383113*_cse23*_cse73 - 0.855753802*_cse252 - 0.855753802*_cse254) + _cse59*_cse71 + _cse60*_cse73 + _cse62*(0.458851168*_cse252 + 0.758601438*_cse253 + 0.458851168*_cse254 + 0.758601438*_cse255 - _cse40*_cse73 - _cse42*_cse71)
+    _cse257 = _cse2*_cse61 + _cse39*_cse63
+    _cse258 = _cse22*_cse53
+    _cse259 = _cse14*_cse195
+    _cse260 = _cse14*_cse197
+    _cse261 = _cse22*_cse23
+    _cse262 = 0.999999998572139*_cse12 + 0.999999998572139*_cse9
+    _cse263 = -_cse262
+    _cse264 = _cse26*_cse263
+    _cse265 = 6.57617443000635e-7*_cse12 + 6.57617443000635e-7*_cse9
+    _cse266 = -_cse265
+    _cse267 = _cse266*_cse28
+    _cse268 = _cse31 - _cse34
+    _cse269 = 0.517383113*_cse17*_cse263 + 0.517383113*_cse24*_cse266 - 0.855753802*_cse264 - 0.855753802*_cse267 - _cse268
+    _cse270 = _cse17*_cse263
+    _cse271 = _cse24*_cse266
+    _cse272 = -_cse263*_cse42 + 0.458851168*_cse264 + _cse266*_cse40 + 0.458851168*_cse267 + 0.758601438*_cse270 + 0.758601438*_cse271 - _cse44 + _cse46
+    _cse273 = _cse2*_cse269 + _cse272*_cse39
+    _cse274 = _cse263*_cse53
+    _cse275 = _cse23*_cse263
+    _cse276 = _cse26*_cse266
+    _cse277 = _cse17*_cse266
+    _cse278 = -_cse149*_cse266 - _cse150*_cse263 + _cse263*_cse60 + _cse266*_cse59 - 0.01084270231829*_cse274 - 0.0189192713225*_cse275 - 0.01084270231829*_cse276 - 0.0189192713225*_cse277 + _cse39*(0.517383113*_cse17*_cse266 + 0.517383113*_cse23*_cse263 - 0.855753802*_cse274 - 0.855753802*_cse276) + _cse62*(-_cse263*_cse40 - _cse266*_cse42 + 0.458851168*_cse274 + 0.758601438*_cse275 + 0.458851168*_cse276 + 0.758601438*_cse277)
+    _cse279 = 0.818687841791724*_cse9
+    _cse280 = 0.818687841791724*_cse12
+    _cse281 = -0.999999998572139*_cse30 + 0.999999998572139*_cse33
+    _cse282 = -_cse281
+    _cse283 = _cse282*_cse42
+    _cse284 = -6.57617443000635e-7*_cse30 + 6.57617443000635e-7*_cse33
+    _cse285 = -_cse284
+    _cse286 = _cse285*_cse40
+    _cse287 = _cse26*_cse282
+    _cse288 = _cse17*_cse282
+    _cse289 = _cse24*_cse285
+    _cse290 = _cse28*_cse285
+    _cse291 = _cse279 + _cse280 - _cse283 + _cse286 + 0.458851168*_cse287 + 0.758601438*_cse288 + 0.758601438*_cse289 + 0.458851168*_cse290
+    _cse292 = 0.000346321299837637*_cse12 + 0.000346321299837637*_cse9
+    _cse293 = 0.517383113*_cse17*_cse282 + 0.517383113*_cse24*_cse285 - 0.855753802*_cse287 - 0.855753802*_cse290 - _cse292
+    _cse294 = -_cse149*_cse282 + _cse150*_cse285
+    _cse295 = 0.210033941789101*_cse12
+    _cse296 = 0.210033941789101*_cse9
+    _cse297 = -_cse88
+    _cse298 = _cse295 + _cse296 + _cse297 + _cse84 + _cse87
+    _cse299 = _cse282*_cse59 + _cse285*_cse80 - 0.01084270231829*_cse287 - 0.0189192713225*_cse288 - 0.0189192713225*_cse289 - 0.01084270231829*_cse290 + _cse291*_cse62 + _cse293*_cse39 + _cse294 + _cse298 + _cse86
+    _cse300 = _cse24*_cse284
+    _cse301 = _cse28*_cse284
+    _cse302 = _cse26*_cse281
+    _cse303 = _cse17*_cse281
+    _cse304 = _cse149*_cse281 - 0.0315500189858492*_cse16*_cse284 - _cse281*_cse59 - _cse284*_cse80 + 0.0189192713225*_cse300 + 0.01084270231829*_cse301 + 0.01084270231829*_cse302 + 0.0189192713225*_cse303 - _cse39*(_cse292 + 0.517383113*_cse300 - 0.855753802*_cse301 - 0.855753802*_cse302 + 0.517383113*_cse303) - _cse62*(-_cse279 - _cse280 - _cse281*_cse42 + _cse284*_cse40 + 0.758601438*_cse300 + 0.458851168*_cse301 + 0.458851168*_cse302 + 0.758601438*_cse303)
+    _cse305 = _cse17*_cse262
+    _cse306 = _cse24*_cse265
+    _cse307 = _cse26*_cse262
+    _cse308 = _cse265*_cse28
+    _cse309 = _cse268 + 0.517383113*_cse305 + 0.517383113*_cse306 - 0.855753802*_cse307 - 0.855753802*_cse308
+    _cse310 = -_cse262*_cse42 + _cse265*_cse40 + 0.758601438*_cse305 + 0.758601438*_cse306 + 0.458851168*_cse307 + 0.458851168*_cse308 + _cse44 - _cse46
+    _cse311 = _cse2*_cse309 + _cse310*_cse39
+    _cse312 = _cse26*_cse265
+    _cse313 = _cse17*_cse265
+    _cse314 = _cse262*_cse53
+    _cse315 = _cse23*_cse262
+    _cse316 = -_cse149*_cse265 - _cse150*_cse262 + _cse262*_cse60 + _cse265*_cse59 - 0.01084270231829*_cse312 - 0.0189192713225*_cse313 - 0.01084270231829*_cse314 - 0.0189192713225*_cse315 + _cse39*(0.517383113*_cse17*_cse265 + 0.517383113*_cse23*_cse262 - 0.855753802*_cse312 - 0.855753802*_cse314) + _cse62*(-_cse262*_cse40 - _cse265*_cse42 + 0.458851168*_cse312 + 0.758601438*_cse313 + 0.458851168*_cse314 + 0.758601438*_cse315)
+    _cse317 = _cse282*_cse53
+    _cse318 = _cse26*_cse285
+    _cse319 = 0.517383113*_cse17*_cse285 + 0.517383113*_cse23*_cse282 - 0.855753802*_cse317 - 0.855753802*_cse318
+    _cse320 = _cse23*_cse282
+    _cse321 = _cse17*_cse285
+    _cse322 = -_cse282*_cse40 - _cse285*_cse42 + 0.458851168*_cse317 + 0.458851168*_cse318 + 0.758601438*_cse320 + 0.758601438*_cse321
+    _cse323 = _cse2*_cse319 + _cse322*_cse39
+    _cse324 = _cse195*_cse282
+    _cse325 = _cse197*_cse282
+    _cse326 = _cse285*_cse53
+    _cse327 = _cse23*_cse285
+    _cse328 = _cse3*dq0
+    _cse329 = _cse127 + _cse130
+    _cse330 = 0.574238819026787*_cse130
+    _cse331 = 0.574238819026787*_cse127
+    _cse332 = 0.408002994597976*_cse16
+    _cse333 = 0.408002994597976*_cse15
+    _cse334 = 0.410149995883665*_cse1
+    _cse335 = 0.89059413*_cse0 - 0.40329059*_cse1
+    _cse336 = -0.209584432*_cse335
+    _cse337 = 0.45479896*_cse0 + 0.78972966*_cse1
+    _cse338 = -0.410879747*_cse337
+    _cse339 = 0.410149995883665*_cse0
+    _cse340 = -0.324483922899196*_cse0 + 0.186867681620663*_cse1
+    _cse341 = 0.0845234292360949*_cse0 + 0.186654664878584*_cse1
+    _cse342 = 0.329365488408814*_cse130
+    _cse343 = 0.329365488408814*_cse127
+    _cse344 = 0.234017800844203*_cse16
+    _cse345 = 0.234017800844203*_cse15
+    _cse346 = 0.410879747*_cse337
+    _cse347 = 0.209584432*_cse335
+    _cse348 = _cse5*dq0
+    _cse349 = _cse66 + _cse69
+    _cse350 = 0.574238819026787*_cse66
+    _cse351 = 0.574238819026787*_cse69
+    _cse352 = 0.329365488408814*_cse66
+    _cse353 = 0.329365488408814*_cse69
+    _cse354 = -_cse30 + _cse33
+    _cse355 = 0.574238819026787*_cse33
+    _cse356 = 0.574238819026787*_cse30
+    _cse357 = 0.329365488408814*_cse33
+    _cse358 = 0.329365488408814*_cse30
+    out = np.empty((6, 6))
+    out[0, 0] = _cse104*dq1 + _cse50*dq4 + _cse64*dq3 + _cse90*dq2 + dq0*(_cse106*_cse59 - 0.0189192713225*_cse107 + 0.0315500189858492*_cse109*_cse16 + _cse109*_cse80 - 0.0189192713225*_cse110 - 0.01084270231829*_cse112 - 0.01084270231829*_cse113 - 0.0315500189858492*_cse114 + _cse118*_cse62 + _cse120*_cse3 + _cse124*_cse39 - _cse136 - 4.3259e-5*_cse3 + 0.0068032576553314*_cse5)
+    out[0, 1] = _cse104*dq0 + _cse148*dq4 + _cse155*dq3 + _cse164*dq2 + dq1*(-_cse119*_cse3 - _cse136 - _cse169)
+    out[0, 2] = _cse164*dq1 + _cse178*dq4 + _cse183*dq3 + _cse90*dq0 + dq2*(_cse10*_cse184*_cse3 - _cse163 - _cse169)
+    out[0, 3] = _cse155*dq1 + _cse183*dq2 + _cse193*dq4 + _cse64*dq0 + dq3*(0.0315500189858492*_cse15*_cse185 - _cse150*_cse187 + _cse185*_cse58 + _cse187*_cse60 - 0.01084270231829*_cse194 - 0.0189192713225*_cse196 - 0.01084270231829*_cse198 - 0.0189192713225*_cse199 + _cse39*(0.517383113*_cse185*_cse195 + 0.517383113*_cse187*_cse23 - 0.855753802*_cse194 - 0.855753802*_cse198) + _cse62*(0.458851168*_cse194 + 0.758601438*_cse196 + 0.458851168*_cse198 + 0.758601438*_cse199 + _cse200 - _cse201))
+    out[0, 4] = _cse148*dq1 + _cse178*dq2 + _cse193*dq3 + _cse50*dq0 + dq4*(_cse2*_cse207 + _cse206*_cse38)
+    out[0, 5] = 0
+    out[1, 0] = _cse208*dq4 + _cse213*dq3 + _cse215*dq2 + _cse216*dq1 + dq0*(-_cse120*_cse5 - _cse149*_cse217 + _cse150*_cse219 + _cse217*_cse59 - 0.0189192713225*_cse218 + _cse219*_cse80 - 0.0189192713225*_cse220 - 0.01084270231829*_cse221 - 0.01084270231829*_cse222 + _cse231 + 0.0068032576553314*_cse3 + _cse39*(0.517383113*_cse218 + 0.517383113*_cse220 - 0.855753802*_cse221 - 0.855753802*_cse222 - _cse32 + _cse35) + 4.3259e-5*_cse5 + _cse62*(-_cse217*_cse42 + 0.758601438*_cse218 + _cse219*_cse40 + 0.758601438*_cse220 + 0.458851168*_cse221 + 0.458851168*_cse222 + _cse223))
+    out[1, 1] = _cse216*dq0 + _cse232*dq4 + _cse237*dq3 + _cse243*dq2 + dq1*(_cse119*_cse5 + _cse231 + _cse250)
+    out[1, 2] = _cse215*dq0 + _cse243*dq1 + _cse251*dq4 + _cse256*dq3 + dq2*(-_cse184*_cse68 + _cse242 + _cse250)
+    out[1, 3] = _cse213*dq0 + _cse237*dq1 + _cse256*dq2 + _cse257*dq4 + dq3*(0.0315500189858492*_cse14*_cse15 + _cse14*_cse58 - _cse150*_cse22 + _cse22*_cse60 - 0.01084270231829*_cse258 - 0.0189192713225*_cse259 - 0.01084270231829*_cse260 - 0.0189192713225*_cse261 + _cse39*(0.517383113*_cse14*_cse195 + 0.517383113*_cse22*_cse23 - 0.855753802*_cse258 - 0.855753802*_cse260) + _cse62*(0.458851168*_cse258 + 0.758601438*_cse259 + 0.458851168*_cse260 + 0.758601438*_cse261 - _cse41 + _cse43))
+    out[1, 4] = _cse208*dq0 + _cse232*dq1 + _cse251*dq2 + _cse257*dq3 + dq4*(_cse2*_cse49 + _cse37*_cse38)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse273*dq4 + _cse278*dq3 + _cse299*dq2 + dq1*(_cse10*_cse102 + 0.41405*_cse10 - _cse295 - _cse296 - _cse297 - _cse304 - 0.001950802*_cse7 - _cse86 - _cse87)
+    out[2, 2] = _cse299*dq1 + _cse311*dq4 + _cse316*dq3 + dq2*(_cse184*_cse7 - _cse298 - _cse304)
+    out[2, 3] = _cse278*dq1 + _cse316*dq2 + _cse323*dq4 + dq3*(_cse282*_cse58 + _cse285*_cse60 - _cse294 - 0.0189192713225*_cse324 - 0.01084270231829*_cse325 - 0.01084270231829*_cse326 - 0.0189192713225*_cse327 + _cse39*(0.517383113*_cse324 - 0.855753802*_cse325 - 0.855753802*_cse326 + 0.517383113*_cse327) + _cse62*(_cse283 - _cse286 + 0.758601438*_cse324 + 0.458851168*_cse325 + 0.458851168*_cse326 + 0.758601438*_cse327))
+    out[2, 4] = _cse273*dq1 + _cse311*dq2 + _cse323*dq3 + dq4*(_cse2*_cse291 + _cse293*_cse38)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse328
+    out[3, 2] = _cse328
+    out[3, 3] = _cse329*dq1 - _cse329*dq2 + dq0*(_cse10*_cse5*_cse8 - _cse229)
+    out[3, 4] = dq0*(_cse14*_cse333 + 0.3960285*_cse18 - _cse22*_cse332 + 0.574238819026787*_cse227 - 0.574238819026787*_cse229 + 0.3960285*_cse25 + 0.239041914*_cse27 + 0.239041914*_cse29) + dq1*(_cse137*_cse333 + 0.3960285*_cse138 - _cse139*_cse332 + 0.3960285*_cse140 + 0.239041914*_cse141 + 0.239041914*_cse142 + _cse330 + _cse331) + dq2*(_cse170*_cse333 + 0.239041914*_cse171 - _cse172*_cse332 + 0.239041914*_cse173 + 0.3960285*_cse175 + 0.3960285*_cse176 - _cse330 - _cse331) + dq3*(_cse185*_cse332 + 0.239041914*_cse186 + _cse187*_cse333 + 0.239041914*_cse188 + 0.3960285*_cse190 + 0.3960285*_cse191)
+    out[3, 5] = dq0*(_cse14*_cse345 + 0.227149603970304*_cse18 - _cse22*_cse344 + 0.329365488408814*_cse227 - 0.329365488408814*_cse229 + 0.227149603970304*_cse25 + 0.137106991283212*_cse27 + 0.137106991283212*_cse29 - _cse334*_cse49 + _cse339*_cse37 - _cse340*_cse37 + _cse341*_cse37 - _cse346*_cse49 + _cse347*_cse49) + dq1*(_cse137*_cse345 + 0.227149603970304*_cse138 - _cse139*_cse344 + 0.227149603970304*_cse140 + 0.137106991283212*_cse141 + 0.137106991283212*_cse142 + _cse144*_cse339 - _cse144*_cse340 + _cse144*_cse341 - _cse147*_cse334 - _cse147*_cse346 + _cse147*_cse347 + _cse342 + _cse343) + dq2*(_cse170*_cse345 + 0.137106991283212*_cse171 - _cse172*_cse344 + 0.137106991283212*_cse173 + _cse174*_cse339 - _cse174*_cse340 + _cse174*_cse341 + 0.227149603970304*_cse175 + 0.227149603970304*_cse176 - _cse177*_cse334 - _cse177*_cse346 + _cse177*_cse347 - _cse342 - _cse343) + dq3*(_cse185*_cse344 + 0.137106991283212*_cse186 + _cse187*_cse345 + 0.137106991283212*_cse188 + _cse189*_cse339 - _cse189*_cse340 + _cse189*_cse341 + 0.227149603970304*_cse190 + 0.227149603970304*_cse191 - _cse192*_cse334 - _cse192*_cse346 + _cse192*_cse347) + dq4*(_cse206*_cse334 + _cse206*_cse336 - _cse206*_cse338 + _cse207*_cse339 - _cse207*_cse340 + _cse207*_cse341)
+    out[4, 0] = 0
+    out[4, 1] = _cse348
+    out[4, 2] = -_cse348
+    out[4, 3] = -_cse349*dq1 + _cse349*dq2 + dq0*(_cse10*_cse3*_cse8 - _cse134)
+    out[4, 4] = dq0*(0.3960285*_cse107 + 0.3960285*_cse110 - 0.408002994597976*_cse111 + 0.239041914*_cse112 + 0.239041914*_cse113 + 0.408002994597976*_cse114 + 0.574238819026787*_cse132 - 0.574238819026787*_cse134) + dq1*(-_cse350 - _cse351 + 0.408002994597976*_cse93 - 0.408002994597976*_cse95 + 0.239041914*_cse96 + 0.3960285*_cse97 + 0.3960285*_cse98 + 0.239041914*_cse99) + dq2*(_cse350 + _cse351 - 0.408002994597976*_cse72 + 0.408002994597976*_cse74 + 0.3960285*_cse75 + 0.239041914*_cse76 + 0.239041914*_cse77 + 0.3960285*_cse78) + dq3*(0.408002994597976*_cse51 + 0.408002994597976*_cse52 + 0.239041914*_cse54 + 0.239041914*_cse55 + 0.3960285*_cse56 + 0.3960285*_cse57)
+    out[4, 5] = dq0*(0.227149603970304*_cse107 + 0.227149603970304*_cse110 - 0.234017800844203*_cse111 + 0.137106991283212*_cse112 + 0.137106991283212*_cse113 + 0.234017800844203*_cse114 - _cse118*_cse334 - _cse118*_cse346 + _cse118*_cse347 + _cse124*_cse339 - _cse124*_cse340 + _cse124*_cse341 + 0.329365488408814*_cse132 - 0.329365488408814*_cse134) + dq1*(-_cse100*_cse334 - _cse100*_cse346 + _cse100*_cse347 + _cse101*_cse339 - _cse101*_cse340 + _cse101*_cse341 - _cse352 - _cse353 + 0.234017800844203*_cse93 - 0.234017800844203*_cse95 + 0.137106991283212*_cse96 + 0.227149603970304*_cse97 + 0.227149603970304*_cse98 + 0.137106991283212*_cse99) + dq2*(-_cse334*_cse79 + _cse339*_cse82 - _cse340*_cse82 + _cse341*_cse82 - _cse346*_cse79 + _cse347*_cse79 + _cse352 + _cse353 - 0.234017800844203*_cse72 + 0.234017800844203*_cse74 + 0.227149603970304*_cse75 + 0.137106991283212*_cse76 + 0.137106991283212*_cse77 + 0.227149603970304*_cse78) + dq3*(-_cse334*_cse63 + _cse339*_cse61 - _cse340*_cse61 + _cse341*_cse61 - _cse346*_cse63 + _cse347*_cse63 + 0.234017800844203*_cse51 + 0.234017800844203*_cse52 + 0.137106991283212*_cse54 + 0.137106991283212*_cse55 + 0.227149603970304*_cse56 + 0.227149603970304*_cse57) + dq4*(_cse334*_cse37 + _cse336*_cse37 - _cse338*_cse37 + _cse339*_cse49 - _cse340*_cse49 + _cse341*_cse49)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse354*dq1 - _cse354*dq2
+    out[5, 4] = dq1*(_cse263*_cse333 + 0.239041914*_cse264 - _cse266*_cse332 + 0.239041914*_cse267 + 0.3960285*_cse270 + 0.3960285*_cse271 + _cse355 - _cse356) + dq2*(_cse262*_cse333 - _cse265*_cse332 + 0.3960285*_cse305 + 0.3960285*_cse306 + 0.239041914*_cse307 + 0.239041914*_cse308 - _cse355 + _cse356) + dq3*(_cse282*_cse332 + _cse285*_cse333 + 0.239041914*_cse317 + 0.239041914*_cse318 + 0.3960285*_cse320 + 0.3960285*_cse321)
+    out[5, 5] = dq1*(_cse263*_cse345 + 0.137106991283212*_cse264 - _cse266*_cse344 + 0.137106991283212*_cse267 + _cse269*_cse339 - _cse269*_cse340 + _cse269*_cse341 + 0.227149603970304*_cse270 + 0.227149603970304*_cse271 - _cse272*_cse334 - _cse272*_cse346 + _cse272*_cse347 + _cse357 - _cse358) + dq2*(_cse262*_cse345 - _cse265*_cse344 + 0.227149603970304*_cse305 + 0.227149603970304*_cse306 + 0.137106991283212*_cse307 + 0.137106991283212*_cse308 + _cse309*_cse339 - _cse309*_cse340 + _cse309*_cse341 - _cse310*_cse334 - _cse310*_cse346 + _cse310*_cse347 - _cse357 + _cse358) + dq3*(_cse282*_cse344 + _cse285*_cse345 + 0.137106991283212*_cse317 + 0.137106991283212*_cse318 + _cse319*_cse339 - _cse319*_cse340 + _cse319*_cse341 + 0.227149603970304*_cse320 + 0.227149603970304*_cse321 - _cse322*_cse334 - _cse322*_cse346 + _cse322*_cse347) + dq4*(_cse291*_cse339 - _cse291*_cse340 + _cse291*_cse341 + _cse293*_cse334 + _cse293*_cse336 - _cse293*_cse338)
+    return out
+
+
+# EE[0,0,0]_Tx
+def function39(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse3*_cse8
+    _cse10 = _cse5*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = math.sin(q3)
+    _cse16 = 6.57617443000635e-7*_cse0
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = _cse2*_cse6
+    _cse19 = _cse4*_cse8
+    _cse20 = -_cse16 - _cse17*_cse18 - _cse17*_cse19
+    _cse21 = _cse15*_cse20
+    _cse22 = math.cos(q3)
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0 - _cse18*_cse23 - _cse19*_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = -0.012581*_cse15 - 0.00040053*_cse22
+    _cse27 = -0.00040053*_cse15 + 0.012581*_cse22
+    _cse28 = -0.51802699*_cse15 - 0.75940555*_cse22
+    _cse29 = _cse24*_cse28
+    _cse30 = 0.45991232*_cse15 + 0.85536427*_cse22
+    _cse31 = _cse20*_cse30
+    _cse32 = 0.75940555*_cse15 - 0.51802699*_cse22
+    _cse33 = _cse20*_cse32
+    _cse34 = 0.85536427*_cse15 - 0.45991232*_cse22
+    _cse35 = _cse24*_cse34
+    _cse36 = -0.000346321299837637*_cse10 + 0.517383113*_cse29 - 0.855753802*_cse31 + 0.517383113*_cse33 - 0.855753802*_cse35 + 0.000346321299837637*_cse9
+    _cse37 = math.sin(q4)
+    _cse38 = 0.01718495619792*_cse37
+    _cse39 = math.cos(q4)
+    _cse40 = -0.012272*_cse37 - 0.00052974*_cse39
+    _cse41 = -0.78972966*_cse37 + 0.45479896*_cse39
+    _cse42 = 0.0050298*_cse41
+    _cse43 = 0.000787787838506*_cse37 + 0.001739686573542*_cse39
+    _cse44 = 0.818687841791724*_cse10 - 0.212878838804554*_cse21 + 0.212878838804554*_cse25 + 0.758601438*_cse29 + 0.458851168*_cse31 + 0.758601438*_cse33 + 0.458851168*_cse35 - 0.818687841791724*_cse9
+    _cse45 = 0.01718495619792*_cse39
+    _cse46 = -0.00052974*_cse37 + 0.012272*_cse39
+    _cse47 = 0.45479896*_cse37 + 0.78972966*_cse39
+    _cse48 = 0.0050298*_cse47
+    _cse49 = 0.001739686573542*_cse37 - 0.000787787838506*_cse39
+    _cse50 = _cse0*_cse2
+    _cse51 = _cse0*_cse4
+    _cse52 = _cse51*_cse6
+    _cse53 = _cse16*_cse18 + _cse16*_cse19 + _cse17
+    _cse54 = 0.999999998572139*_cse0
+    _cse55 = _cse18*_cse54 + _cse19*_cse54 - _cse23
+    _cse56 = _cse15*_cse55
+    _cse57 = _cse28*_cse53
+    _cse58 = _cse30*_cse55
+    _cse59 = _cse32*_cse55
+    _cse60 = _cse34*_cse53
+    _cse61 = _cse50*_cse8
+    _cse62 = 0.000346321299837637*_cse52 + 0.517383113*_cse57 - 0.855753802*_cse58 + 0.517383113*_cse59 - 0.855753802*_cse60 - 0.000346321299837637*_cse61
+    _cse63 = 0.212878838804554*_cse22*_cse53 - 0.818687841791724*_cse52 - 0.212878838804554*_cse56 + 0.758601438*_cse57 + 0.458851168*_cse58 + 0.758601438*_cse59 + 0.458851168*_cse60 + 0.818687841791724*_cse61
+    _cse64 = _cse2*_cse8
+    _cse65 = 0.999999998572139*_cse4*_cse6 - 0.999999998572139*_cse64
+    _cse66 = _cse15*_cse65
+    _cse67 = 6.57617443000635e-7*_cse4*_cse6 - 6.57617443000635e-7*_cse64
+    _cse68 = _cse22*_cse67
+    _cse69 = _cse30*_cse65
+    _cse70 = _cse32*_cse65
+    _cse71 = _cse28*_cse67
+    _cse72 = _cse34*_cse67
+    _cse73 = -0.000346321299837637*_cse18 - 0.000346321299837637*_cse19 + 0.517383113*_cse28*_cse67 + 0.517383113*_cse32*_cse65 - 0.855753802*_cse69 - 0.855753802*_cse72
+    _cse74 = 0.818687841791724*_cse18 + 0.818687841791724*_cse19 - 0.212878838804554*_cse66 + 0.212878838804554*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70 + 0.758601438*_cse71 + 0.458851168*_cse72
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + 0.227539183449751*_cse10 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse20*_cse26 - 0.0439876856535455*_cse21 + _cse24*_cse27 + 0.0439876856535455*_cse25 - 0.0309919044627574*_cse29 + _cse3*_cse7 + 0.20503*_cse3 - 0.0181297165934418*_cse31 - 0.0309919044627574*_cse33 - 0.0181297165934418*_cse35 - _cse36*_cse38 + _cse36*_cse40 + _cse36*_cse42 - _cse36*_cse43 + _cse44*_cse45 + _cse44*_cse46 + _cse44*_cse48 - _cse44*_cse49 - 1.098e-6*_cse5 - 0.227539183449751*_cse9 - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.227539183449751*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse11*_cse51 - _cse13*_cse50 - _cse14*_cse51 + 0.0439876856535455*_cse22*_cse53 + _cse26*_cse55 + _cse27*_cse53 - _cse38*_cse62 + 0.01718495619792*_cse39*_cse63 + _cse40*_cse62 + 0.0050298*_cse41*_cse62 - _cse43*_cse62 + _cse46*_cse63 + 0.0050298*_cse47*_cse63 - _cse49*_cse63 - _cse50*_cse7 - 0.20503*_cse50 - 0.227539183449751*_cse52 - 0.0439876856535455*_cse56 - 0.0309919044627574*_cse57 - 0.0181297165934418*_cse58 - 0.0309919044627574*_cse59 - 0.0181297165934418*_cse60 - 1.7324e-5
+    out[2, 0] = -_cse13*_cse4 + _cse14*_cse2 + 0.227539183449751*_cse18 + 0.227539183449751*_cse19 + 0.001950802*_cse2 + _cse26*_cse65 + _cse27*_cse67 - _cse38*_cse73 - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + _cse40*_cse73 + _cse42*_cse73 - _cse43*_cse73 + _cse45*_cse74 + _cse46*_cse74 + _cse48*_cse74 - _cse49*_cse74 + 0.0038906673398998*_cse64 - 0.0439876856535455*_cse66 + 0.0439876856535455*_cse68 - 0.0181297165934418*_cse69 - 0.0309919044627574*_cse70 - 0.0309919044627574*_cse71 - 0.0181297165934418*_cse72 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# EE[0,0,0]_J
+def function40(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = math.sin(q3)
+    _cse24 = 6.57617443000635e-7*_cse1
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse11*_cse25 - _cse24 + _cse25*_cse6
+    _cse27 = _cse23*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse23
+    _cse29 = -_cse28
+    _cse30 = _cse22*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse23
+    _cse32 = _cse26*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse23
+    _cse34 = _cse26*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse23
+    _cse36 = _cse22*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse23
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse23
+    _cse39 = -_cse38
+    _cse40 = _cse0*_cse2
+    _cse41 = _cse40*_cse8
+    _cse42 = 0.000346321299837637*_cse10 + 0.517383113*_cse30 - 0.855753802*_cse32 + 0.517383113*_cse34 - 0.855753802*_cse36 - 0.000346321299837637*_cse41
+    _cse43 = math.sin(q4)
+    _cse44 = 0.01718495619792*_cse43
+    _cse45 = math.cos(q4)
+    _cse46 = -0.78972966*_cse43 + 0.45479896*_cse45
+    _cse47 = 0.40329059*_cse43 + 0.89059413*_cse45
+    _cse48 = 0.0019534*_cse47
+    _cse49 = -0.012272*_cse43 - 0.00052974*_cse45
+    _cse50 = _cse19*_cse22
+    _cse51 = -0.818687841791724*_cse10 - 0.212878838804554*_cse27 + 0.758601438*_cse30 + 0.458851168*_cse32 + 0.758601438*_cse34 + 0.458851168*_cse36 + 0.818687841791724*_cse41 + 0.212878838804554*_cse50
+    _cse52 = 0.45479896*_cse43 + 0.78972966*_cse45
+    _cse53 = 0.89059413*_cse43 - 0.40329059*_cse45
+    _cse54 = 0.0019534*_cse53
+    _cse55 = 0.00052974*_cse43 - 0.012272*_cse45
+    _cse56 = -_cse55
+    _cse57 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse58 = 0.818687841791724*_cse6
+    _cse59 = _cse1*_cse58
+    _cse60 = 0.818687841791724*_cse11
+    _cse61 = _cse1*_cse60
+    _cse62 = _cse2*_cse8
+    _cse63 = _cse4*_cse5
+    _cse64 = _cse24*_cse62 - _cse24*_cse63
+    _cse65 = _cse20*_cse62 - _cse20*_cse63
+    _cse66 = _cse23*_cse65
+    _cse67 = _cse29*_cse64
+    _cse68 = _cse35*_cse64
+    _cse69 = _cse31*_cse65
+    _cse70 = _cse33*_cse65
+    _cse71 = 0.212878838804554*_cse19*_cse64 - _cse59 - _cse61 - 0.212878838804554*_cse66 + 0.758601438*_cse67 + 0.458851168*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70
+    _cse72 = 0.000346321299837637*_cse11
+    _cse73 = 0.000346321299837637*_cse6
+    _cse74 = _cse1*_cse72 + _cse1*_cse73
+    _cse75 = 0.517383113*_cse67 - 0.855753802*_cse68 - 0.855753802*_cse69 + 0.517383113*_cse70 + _cse74
+    _cse76 = _cse1*_cse2
+    _cse77 = _cse76*_cse8
+    _cse78 = 0.227539183449751*_cse1
+    _cse79 = _cse1*_cse4
+    _cse80 = _cse5*_cse79
+    _cse81 = _cse11*_cse78 + _cse17*_cse76 + _cse6*_cse78 + 0.0038906673398998*_cse77 - 0.0038906673398998*_cse80
+    _cse82 = -_cse65
+    _cse83 = _cse23*_cse82
+    _cse84 = -_cse64
+    _cse85 = _cse19*_cse84
+    _cse86 = _cse31*_cse82
+    _cse87 = _cse33*_cse82
+    _cse88 = _cse29*_cse84
+    _cse89 = _cse35*_cse84
+    _cse90 = _cse59 + _cse61 - 0.212878838804554*_cse83 + 0.212878838804554*_cse85 + 0.458851168*_cse86 + 0.758601438*_cse87 + 0.758601438*_cse88 + 0.458851168*_cse89
+    _cse91 = 0.517383113*_cse29*_cse84 + 0.517383113*_cse33*_cse82 - _cse74 - 0.855753802*_cse86 - 0.855753802*_cse89
+    _cse92 = 0.01718495619792*_cse45
+    _cse93 = 0.0050298*_cse46
+    _cse94 = 0.0050298*_cse52
+    _cse95 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse96 = -_cse95
+    _cse97 = _cse19*_cse96
+    _cse98 = -0.999999998572139*_cse0 + _cse11*_cse24 + _cse24*_cse6
+    _cse99 = -_cse98
+    _cse100 = _cse23*_cse99
+    _cse101 = -_cse35
+    _cse102 = _cse101*_cse96
+    _cse103 = _cse31*_cse99
+    _cse104 = _cse28*_cse96
+    _cse105 = _cse33*_cse99
+    _cse106 = -0.855753802*_cse102 - 0.855753802*_cse103 + 0.517383113*_cse28*_cse96 + 0.517383113*_cse33*_cse99
+    _cse107 = -0.212878838804554*_cse100 + 0.458851168*_cse102 + 0.458851168*_cse103 + 0.758601438*_cse104 + 0.758601438*_cse105 - 0.212878838804554*_cse97
+    _cse108 = 0.000346321299837637*_cse77
+    _cse109 = 0.000346321299837637*_cse80
+    _cse110 = _cse29*_cse99
+    _cse111 = _cse31*_cse96
+    _cse112 = _cse33*_cse96
+    _cse113 = _cse35*_cse99
+    _cse114 = _cse108 - _cse109 + 0.517383113*_cse110 - 0.855753802*_cse111 + 0.517383113*_cse112 - 0.855753802*_cse113
+    _cse115 = -0.0019534*_cse53
+    _cse116 = -_cse52
+    _cse117 = 0.818687841791724*_cse77
+    _cse118 = 0.818687841791724*_cse80
+    _cse119 = 0.212878838804554*_cse23
+    _cse120 = 0.212878838804554*_cse19
+    _cse121 = 0.758601438*_cse110 + 0.458851168*_cse111 + 0.758601438*_cse112 + 0.458851168*_cse113 - _cse117 + _cse118 - _cse119*_cse96 + _cse120*_cse99
+    _cse122 = 0.0439876856535455*_cse23
+    _cse123 = _cse29*_cse98
+    _cse124 = _cse31*_cse95
+    _cse125 = _cse33*_cse95
+    _cse126 = _cse35*_cse98
+    _cse127 = -_cse108 + _cse109 + 0.517383113*_cse123 - 0.855753802*_cse124 + 0.517383113*_cse125 - 0.855753802*_cse126
+    _cse128 = _cse117 - _cse118 - _cse119*_cse95 + _cse120*_cse98 + 0.758601438*_cse123 + 0.458851168*_cse124 + 0.758601438*_cse125 + 0.458851168*_cse126
+    _cse129 = _cse0*_cse58
+    _cse130 = _cse0*_cse60
+    _cse131 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse25*_cse62
+    _cse132 = -_cse131
+    _cse133 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse62
+    _cse134 = -_cse133
+    _cse135 = _cse132*_cse31
+    _cse136 = _cse132*_cse33
+    _cse137 = _cse134*_cse29
+    _cse138 = _cse134*_cse35
+    _cse139 = -_cse119*_cse132 + _cse120*_cse134 + _cse129 + _cse130 + 0.458851168*_cse135 + 0.758601438*_cse136 + 0.758601438*_cse137 + 0.458851168*_cse138
+    _cse140 = _cse0*_cse72 + _cse0*_cse73
+    _cse141 = 0.517383113*_cse132*_cse33 + 0.517383113*_cse134*_cse29 - 0.855753802*_cse135 - 0.855753802*_cse138 - _cse140
+    _cse142 = 0.0439876856535455*_cse19
+    _cse143 = 0.227539183449751*_cse0
+    _cse144 = -0.0038906673398998*_cse10 + _cse11*_cse143 + _cse143*_cse6 + _cse17*_cse40 + 0.0038906673398998*_cse41
+    _cse145 = _cse133*_cse29
+    _cse146 = _cse133*_cse35
+    _cse147 = _cse131*_cse31
+    _cse148 = _cse131*_cse33
+    _cse149 = -_cse119*_cse131 + _cse120*_cse133 - _cse129 - _cse130 + 0.758601438*_cse145 + 0.458851168*_cse146 + 0.458851168*_cse147 + 0.758601438*_cse148
+    _cse150 = _cse140 + 0.517383113*_cse145 - 0.855753802*_cse146 - 0.855753802*_cse147 + 0.517383113*_cse148
+    _cse151 = _cse101*_cse26
+    _cse152 = _cse22*_cse31
+    _cse153 = _cse26*_cse28
+    _cse154 = _cse22*_cse33
+    _cse155 = -0.855753802*_cse151 - 0.855753802*_cse152 + 0.517383113*_cse22*_cse33 + 0.517383113*_cse26*_cse28
+    _cse156 = -_cse119*_cse22 - _cse120*_cse26 + 0.458851168*_cse151 + 0.458851168*_cse152 + 0.758601438*_cse153 + 0.758601438*_cse154
+    _cse157 = 0.818687841791724*_cse62
+    _cse158 = 0.818687841791724*_cse63
+    _cse159 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse160 = -_cse159
+    _cse161 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse162 = -_cse161
+    _cse163 = _cse160*_cse31
+    _cse164 = _cse160*_cse33
+    _cse165 = _cse162*_cse29
+    _cse166 = _cse162*_cse35
+    _cse167 = -_cse119*_cse160 + _cse120*_cse162 - _cse157 + _cse158 + 0.458851168*_cse163 + 0.758601438*_cse164 + 0.758601438*_cse165 + 0.458851168*_cse166
+    _cse168 = -0.000346321299837637*_cse62 + 0.000346321299837637*_cse63
+    _cse169 = 0.517383113*_cse160*_cse33 + 0.517383113*_cse162*_cse29 - 0.855753802*_cse163 - 0.855753802*_cse166 - _cse168
+    _cse170 = _cse12 + _cse18 - 0.227539183449751*_cse62 + 0.227539183449751*_cse63 + _cse7
+    _cse171 = _cse161*_cse29
+    _cse172 = _cse161*_cse35
+    _cse173 = _cse159*_cse31
+    _cse174 = _cse159*_cse33
+    _cse175 = -_cse119*_cse159 + _cse120*_cse161 + _cse157 - _cse158 + 0.758601438*_cse171 + 0.458851168*_cse172 + 0.458851168*_cse173 + 0.758601438*_cse174
+    _cse176 = _cse168 + 0.517383113*_cse171 - 0.855753802*_cse172 - 0.855753802*_cse173 + 0.517383113*_cse174
+    _cse177 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse62
+    _cse178 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse62
+    _cse179 = _cse101*_cse177
+    _cse180 = _cse177*_cse28
+    _cse181 = _cse178*_cse31
+    _cse182 = _cse178*_cse33
+    _cse183 = 0.517383113*_cse177*_cse28 + 0.517383113*_cse178*_cse33 - 0.855753802*_cse179 - 0.855753802*_cse181
+    _cse184 = -_cse119*_cse178 - _cse120*_cse177 + 0.458851168*_cse179 + 0.758601438*_cse180 + 0.458851168*_cse181 + 0.758601438*_cse182
+    _cse185 = _cse177*_cse31
+    _cse186 = _cse178*_cse35
+    _cse187 = 0.517383113*_cse177*_cse33 + 0.517383113*_cse178*_cse29 - 0.855753802*_cse185 - 0.855753802*_cse186 - _cse72 - _cse73
+    _cse188 = _cse177*_cse33
+    _cse189 = _cse178*_cse29
+    _cse190 = -_cse119*_cse177 + _cse120*_cse178 + 0.458851168*_cse185 + 0.458851168*_cse186 + 0.758601438*_cse188 + 0.758601438*_cse189 + _cse58 + _cse60
+    _cse191 = _cse23*_cse96
+    _cse192 = _cse19*_cse99
+    _cse193 = 0.410149995883665*_cse43
+    _cse194 = 0.410879747*_cse46
+    _cse195 = 0.209584432*_cse47
+    _cse196 = 0.410149995883665*_cse45
+    _cse197 = 0.410879747*_cse52
+    _cse198 = 0.209584432*_cse53
+    _cse199 = _cse177*_cse23
+    _cse200 = _cse178*_cse19
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.227539183449751*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.227539183449751*_cse10 + 0.0439876856535455*_cse19*_cse22 + _cse22*_cse39 + _cse26*_cse37 - 0.0439876856535455*_cse27 - 0.0309919044627574*_cse30 - 0.0181297165934418*_cse32 - 0.0309919044627574*_cse34 - 0.0181297165934418*_cse36 - _cse42*_cse44 + 0.0050298*_cse42*_cse46 - _cse42*_cse48 + _cse42*_cse49 + 0.01718495619792*_cse45*_cse51 + 0.0050298*_cse51*_cse52 - _cse51*_cse54 + _cse51*_cse56
+    out[0, 1] = _cse1*_cse15*_cse4 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse1*_cse57 + 0.0439876856535455*_cse19*_cse64 + _cse37*_cse65 + _cse39*_cse64 - _cse44*_cse75 + 0.01718495619792*_cse45*_cse71 + 0.0050298*_cse46*_cse75 - _cse48*_cse75 + _cse49*_cse75 + 0.0050298*_cse52*_cse71 - _cse54*_cse71 + _cse56*_cse71 - 0.0439876856535455*_cse66 - 0.0309919044627574*_cse67 - 0.0181297165934418*_cse68 - 0.0181297165934418*_cse69 - 0.0309919044627574*_cse70 - _cse81
+    out[0, 2] = _cse14*_cse79 + _cse37*_cse82 + _cse39*_cse84 - _cse44*_cse91 - _cse48*_cse91 + _cse49*_cse91 - _cse54*_cse90 + _cse56*_cse90 + _cse81 - 0.0439876856535455*_cse83 + 0.0439876856535455*_cse85 - 0.0181297165934418*_cse86 - 0.0309919044627574*_cse87 - 0.0309919044627574*_cse88 - 0.0181297165934418*_cse89 + _cse90*_cse92 + _cse90*_cse94 + _cse91*_cse93
+    out[0, 3] = -0.0439876856535455*_cse100 - 0.0181297165934418*_cse102 - 0.0181297165934418*_cse103 - 0.0309919044627574*_cse104 - 0.0309919044627574*_cse105 - _cse106*_cse44 + 0.0050298*_cse106*_cse46 - _cse106*_cse48 + _cse106*_cse49 + 0.01718495619792*_cse107*_cse45 + 0.0050298*_cse107*_cse52 - _cse107*_cse54 + _cse107*_cse56 + _cse37*_cse99 + _cse38*_cse96 - 0.0439876856535455*_cse97
+    out[0, 4] = -_cse114*_cse115 + 0.0050298*_cse114*_cse116 + _cse114*_cse55 - _cse114*_cse92 - _cse121*_cse44 + 0.0050298*_cse121*_cse46 - _cse121*_cse48 + _cse121*_cse49
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.227539183449751*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 - _cse122*_cse95 - 0.0309919044627574*_cse123 - 0.0181297165934418*_cse124 - 0.0309919044627574*_cse125 - 0.0181297165934418*_cse126 - _cse127*_cse44 + 0.0050298*_cse127*_cse46 - _cse127*_cse48 + _cse127*_cse49 + 0.01718495619792*_cse128*_cse45 + 0.0050298*_cse128*_cse52 - _cse128*_cse54 + _cse128*_cse56 + 0.0439876856535455*_cse19*_cse98 + _cse37*_cse95 + _cse39*_cse98 - 0.227539183449751*_cse80
+    out[1, 1] = _cse0*_cse57 - _cse122*_cse132 + _cse132*_cse37 + _cse134*_cse142 + _cse134*_cse39 - 0.0181297165934418*_cse135 - 0.0309919044627574*_cse136 - 0.0309919044627574*_cse137 - 0.0181297165934418*_cse138 - _cse139*_cse54 + _cse139*_cse56 + _cse139*_cse92 + _cse139*_cse94 - _cse141*_cse44 - _cse141*_cse48 + _cse141*_cse49 + _cse141*_cse93 + _cse144 - _cse15*_cse9 - 1.098e-6*_cse40 - 0.20503*_cse9
+    out[1, 2] = -_cse122*_cse131 + _cse131*_cse37 + 0.0439876856535455*_cse133*_cse19 + _cse133*_cse39 - _cse14*_cse9 - _cse144 - 0.0309919044627574*_cse145 - 0.0181297165934418*_cse146 - 0.0181297165934418*_cse147 - 0.0309919044627574*_cse148 + 0.01718495619792*_cse149*_cse45 + 0.0050298*_cse149*_cse52 - _cse149*_cse54 + _cse149*_cse56 - _cse150*_cse44 + 0.0050298*_cse150*_cse46 - _cse150*_cse48 + _cse150*_cse49
+    out[1, 3] = -_cse122*_cse22 - _cse142*_cse26 - 0.0181297165934418*_cse151 - 0.0181297165934418*_cse152 - 0.0309919044627574*_cse153 - 0.0309919044627574*_cse154 - _cse155*_cse44 + 0.0050298*_cse155*_cse46 - _cse155*_cse48 + _cse155*_cse49 + 0.01718495619792*_cse156*_cse45 + 0.0050298*_cse156*_cse52 - _cse156*_cse54 + _cse156*_cse56 + _cse22*_cse37 + _cse26*_cse38
+    out[1, 4] = -_cse115*_cse42 + 0.0050298*_cse116*_cse42 + _cse42*_cse55 - _cse42*_cse92 - _cse44*_cse51 + 0.0050298*_cse46*_cse51 - _cse48*_cse51 + _cse49*_cse51
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse122*_cse160 + _cse142*_cse162 + _cse16 + _cse160*_cse37 + _cse162*_cse39 - 0.0181297165934418*_cse163 - 0.0309919044627574*_cse164 - 0.0309919044627574*_cse165 - 0.0181297165934418*_cse166 - _cse167*_cse54 + _cse167*_cse56 + _cse167*_cse92 + _cse167*_cse94 - _cse169*_cse44 - _cse169*_cse48 + _cse169*_cse49 + _cse169*_cse93 + _cse170 + 0.41405*_cse2 + 0.001950802*_cse4
+    out[2, 2] = -_cse122*_cse159 + _cse14*_cse2 + _cse159*_cse37 + 0.0439876856535455*_cse161*_cse19 + _cse161*_cse39 - _cse170 - 0.0309919044627574*_cse171 - 0.0181297165934418*_cse172 - 0.0181297165934418*_cse173 - 0.0309919044627574*_cse174 + 0.01718495619792*_cse175*_cse45 + 0.0050298*_cse175*_cse52 - _cse175*_cse54 + _cse175*_cse56 - _cse176*_cse44 + 0.0050298*_cse176*_cse46 - _cse176*_cse48 + _cse176*_cse49
+    out[2, 3] = -_cse122*_cse178 - _cse142*_cse177 + _cse177*_cse38 + _cse178*_cse37 - 0.0181297165934418*_cse179 - 0.0309919044627574*_cse180 - 0.0181297165934418*_cse181 - 0.0309919044627574*_cse182 - _cse183*_cse44 + 0.0050298*_cse183*_cse46 - _cse183*_cse48 + _cse183*_cse49 + 0.01718495619792*_cse184*_cse45 + 0.0050298*_cse184*_cse52 - _cse184*_cse54 + _cse184*_cse56
+    out[2, 4] = -_cse115*_cse187 + 0.0050298*_cse116*_cse187 + _cse187*_cse55 - _cse187*_cse92 - _cse190*_cse44 + 0.0050298*_cse190*_cse46 - _cse190*_cse48 + _cse190*_cse49
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse77 - _cse80
+    out[3, 4] = 0.3960285*_cse110 + 0.239041914*_cse111 + 0.3960285*_cse112 + 0.239041914*_cse113 + 0.408002994597976*_cse191 - 0.408002994597976*_cse192 + 0.574238819026787*_cse77 - 0.574238819026787*_cse80
+    out[3, 5] = 0.227149603970304*_cse110 + 0.137106991283212*_cse111 + 0.227149603970304*_cse112 + 0.137106991283212*_cse113 + _cse114*_cse193 - _cse114*_cse194 + _cse114*_cse195 - _cse121*_cse196 - _cse121*_cse197 + _cse121*_cse198 + 0.234017800844203*_cse191 - 0.234017800844203*_cse192 + 0.329365488408814*_cse77 - 0.329365488408814*_cse80
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse41
+    out[4, 4] = 0.574238819026787*_cse10 + 0.408002994597976*_cse27 + 0.3960285*_cse30 + 0.239041914*_cse32 + 0.3960285*_cse34 + 0.239041914*_cse36 - 0.574238819026787*_cse41 - 0.408002994597976*_cse50
+    out[4, 5] = 0.329365488408814*_cse10 + _cse193*_cse42 - _cse194*_cse42 + _cse195*_cse42 - _cse196*_cse51 - _cse197*_cse51 + _cse198*_cse51 + 0.234017800844203*_cse27 + 0.227149603970304*_cse30 + 0.137106991283212*_cse32 + 0.227149603970304*_cse34 + 0.137106991283212*_cse36 - 0.329365488408814*_cse41 - 0.234017800844203*_cse50
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + 0.239041914*_cse185 + 0.239041914*_cse186 + 0.3960285*_cse188 + 0.3960285*_cse189 + 0.408002994597976*_cse199 - 0.408002994597976*_cse200 - 0.574238819026787*_cse6
+    out[5, 5] = -0.329365488408814*_cse11 + 0.137106991283212*_cse185 + 0.137106991283212*_cse186 + _cse187*_cse193 - _cse187*_cse194 + _cse187*_cse195 + 0.227149603970304*_cse188 + 0.227149603970304*_cse189 - _cse190*_cse196 - _cse190*_cse197 + _cse190*_cse198 + 0.234017800844203*_cse199 - 0.234017800844203*_cse200 - 0.329365488408814*_cse6
+    return out
+
+
+# EE[0,0,0]_dJ
+def function41(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = 6.57617443000635e-7*_cse0
+    _cse2 = math.sin(q0)
+    _cse3 = 0.999999998572139*_cse2
+    _cse4 = math.sin(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse4*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = math.cos(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = _cse3*_cse6 + _cse3*_cse9
+    _cse11 = -_cse1 + _cse10
+    _cse12 = math.sin(q3)
+    _cse13 = math.cos(q3)
+    _cse14 = 0.75940555*_cse12 - 0.51802699*_cse13
+    _cse15 = _cse11*_cse14
+    _cse16 = 0.999999998572139*_cse0
+    _cse17 = 6.57617443000635e-7*_cse2
+    _cse18 = _cse17*_cse6 + _cse17*_cse9
+    _cse19 = _cse16 + _cse18
+    _cse20 = 0.51802699*_cse12 + 0.75940555*_cse13
+    _cse21 = -_cse20
+    _cse22 = _cse19*_cse21
+    _cse23 = 0.45991232*_cse12 + 0.85536427*_cse13
+    _cse24 = _cse11*_cse23
+    _cse25 = 0.85536427*_cse12 - 0.45991232*_cse13
+    _cse26 = _cse19*_cse25
+    _cse27 = _cse5*_cse7
+    _cse28 = 0.000346321299837637*_cse27
+    _cse29 = _cse2*_cse28
+    _cse30 = _cse4*_cse8
+    _cse31 = 0.000346321299837637*_cse30
+    _cse32 = _cse2*_cse31
+    _cse33 = _cse29 - _cse32
+    _cse34 = 0.517383113*_cse15 + 0.517383113*_cse22 - 0.855753802*_cse24 - 0.855753802*_cse26 + _cse33
+    _cse35 = math.cos(q4)
+    _cse36 = 0.01718495619792*_cse35
+    _cse37 = math.sin(q4)
+    _cse38 = -0.40329059*_cse35 + 0.89059413*_cse37
+    _cse39 = -_cse38
+    _cse40 = 0.0019534*_cse39
+    _cse41 = 0.78972966*_cse35 + 0.45479896*_cse37
+    _cse42 = -_cse41
+    _cse43 = -0.012272*_cse35 + 0.00052974*_cse37
+    _cse44 = 0.212878838804554*_cse13
+    _cse45 = _cse19*_cse44
+    _cse46 = 0.212878838804554*_cse12
+    _cse47 = _cse11*_cse46
+    _cse48 = 0.818687841791724*_cse30
+    _cse49 = _cse2*_cse48
+    _cse50 = 0.818687841791724*_cse27
+    _cse51 = _cse2*_cse50
+    _cse52 = _cse49 - _cse51
+    _cse53 = 0.758601438*_cse15 + 0.758601438*_cse22 + 0.458851168*_cse24 + 0.458851168*_cse26 + _cse45 - _cse47 + _cse52
+    _cse54 = 0.01718495619792*_cse37
+    _cse55 = -0.45479896*_cse35 + 0.78972966*_cse37
+    _cse56 = -_cse55
+    _cse57 = 0.89059413*_cse35 + 0.40329059*_cse37
+    _cse58 = 0.0019534*_cse57
+    _cse59 = 0.00052974*_cse35 + 0.012272*_cse37
+    _cse60 = -_cse59
+    _cse61 = -_cse34*_cse36 - _cse34*_cse40 + 0.0050298*_cse34*_cse42 + _cse34*_cse43 - _cse53*_cse54 + 0.0050298*_cse53*_cse56 - _cse53*_cse58 + _cse53*_cse60
+    _cse62 = _cse12*_cse19
+    _cse63 = _cse11*_cse13
+    _cse64 = -_cse25
+    _cse65 = _cse11*_cse64
+    _cse66 = _cse19*_cse23
+    _cse67 = _cse11*_cse20
+    _cse68 = _cse14*_cse19
+    _cse69 = 0.012581*_cse12 + 0.00040053*_cse13
+    _cse70 = -_cse69
+    _cse71 = 0.00040053*_cse12 - 0.012581*_cse13
+    _cse72 = 0.517383113*_cse11*_cse20 + 0.517383113*_cse14*_cse19 - 0.855753802*_cse65 - 0.855753802*_cse66
+    _cse73 = -0.212878838804554*_cse62 - 0.212878838804554*_cse63 + 0.458851168*_cse65 + 0.458851168*_cse66 + 0.758601438*_cse67 + 0.758601438*_cse68
+    _cse74 = 0.0019534*_cse38
+    _cse75 = -_cse43
+    _cse76 = _cse11*_cse71 + _cse19*_cse70 + 0.01718495619792*_cse35*_cse73 + 0.0050298*_cse41*_cse73 - _cse54*_cse72 + 0.0050298*_cse56*_cse72 - _cse58*_cse72 + _cse60*_cse72 - 0.0439876856535455*_cse62 - 0.0439876856535455*_cse63 - 0.0181297165934418*_cse65 - 0.0181297165934418*_cse66 - 0.0309919044627574*_cse67 - 0.0309919044627574*_cse68 - _cse73*_cse74 + _cse73*_cse75
+    _cse77 = _cse2*_cse4
+    _cse78 = _cse5*_cse77
+    _cse79 = 0.818687841791724*_cse78
+    _cse80 = _cse2*_cse7
+    _cse81 = _cse8*_cse80
+    _cse82 = 0.818687841791724*_cse81
+    _cse83 = _cse17*_cse30 - 6.57617443000635e-7*_cse2*_cse5*_cse7
+    _cse84 = _cse13*_cse83
+    _cse85 = -0.999999998572139*_cse2*_cse5*_cse7 + _cse3*_cse30
+    _cse86 = _cse12*_cse85
+    _cse87 = _cse21*_cse83
+    _cse88 = _cse25*_cse83
+    _cse89 = _cse23*_cse85
+    _cse90 = _cse14*_cse85
+    _cse91 = -_cse79 - _cse82 + 0.212878838804554*_cse84 - 0.212878838804554*_cse86 + 0.758601438*_cse87 + 0.458851168*_cse88 + 0.458851168*_cse89 + 0.758601438*_cse90
+    _cse92 = -_cse71
+    _cse93 = 0.000346321299837637*_cse78 + 0.000346321299837637*_cse81
+    _cse94 = 0.517383113*_cse87 - 0.855753802*_cse88 - 0.855753802*_cse89 + 0.517383113*_cse90 + _cse93
+    _cse95 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse96 = _cse7*_cse95
+    _cse97 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse98 = _cse4*_cse97
+    _cse99 = 0.0038906673398998*_cse30
+    _cse100 = 0.0038906673398998*_cse27
+    _cse101 = -_cse100*_cse2 + _cse2*_cse98 + _cse2*_cse99 + 0.227539183449751*_cse78 + 0.227539183449751*_cse81
+    _cse102 = -_cse101 + 0.0439876856535455*_cse13*_cse83 - _cse2*_cse96 + 0.01718495619792*_cse35*_cse91 + 0.0050298*_cse41*_cse91 - _cse54*_cse94 + 0.0050298*_cse56*_cse94 - _cse58*_cse94 + _cse60*_cse94 + _cse70*_cse85 - _cse74*_cse91 + _cse75*_cse91 + _cse83*_cse92 - 0.0439876856535455*_cse86 - 0.0309919044627574*_cse87 - 0.0181297165934418*_cse88 - 0.0181297165934418*_cse89 - 0.0309919044627574*_cse90
+    _cse103 = 0.0019519*_cse4 - 0.20902*_cse7
+    _cse104 = -_cse85
+    _cse105 = _cse104*_cse12
+    _cse106 = -_cse83
+    _cse107 = _cse106*_cse13
+    _cse108 = _cse104*_cse23
+    _cse109 = _cse104*_cse14
+    _cse110 = _cse106*_cse21
+    _cse111 = _cse106*_cse25
+    _cse112 = -0.212878838804554*_cse105 + 0.212878838804554*_cse107 + 0.458851168*_cse108 + 0.758601438*_cse109 + 0.758601438*_cse110 + 0.458851168*_cse111 + _cse79 + _cse82
+    _cse113 = 0.517383113*_cse104*_cse14 + 0.517383113*_cse106*_cse21 - 0.855753802*_cse108 - 0.855753802*_cse111 - _cse93
+    _cse114 = 0.0050298*_cse56
+    _cse115 = 0.0050298*_cse41
+    _cse116 = -_cse95
+    _cse117 = _cse116*_cse7
+    _cse118 = _cse101 + _cse103*_cse2 + _cse104*_cse70 - 0.0439876856535455*_cse105 + _cse106*_cse92 + 0.0439876856535455*_cse107 - 0.0181297165934418*_cse108 - 0.0309919044627574*_cse109 - 0.0309919044627574*_cse110 - 0.0181297165934418*_cse111 + _cse112*_cse115 + _cse112*_cse36 - _cse112*_cse74 + _cse112*_cse75 + _cse113*_cse114 - _cse113*_cse54 - _cse113*_cse58 + _cse113*_cse60 - _cse117*_cse2 - 1.098e-6*_cse77 - 0.20503*_cse80
+    _cse119 = _cse16*_cse6 + _cse16*_cse9
+    _cse120 = _cse119 + _cse17
+    _cse121 = _cse120*_cse14
+    _cse122 = _cse1*_cse6 + _cse1*_cse9
+    _cse123 = _cse122 - _cse3
+    _cse124 = _cse123*_cse21
+    _cse125 = _cse123*_cse13
+    _cse126 = _cse120*_cse23
+    _cse127 = _cse123*_cse25
+    _cse128 = _cse12*_cse120
+    _cse129 = _cse0*_cse48
+    _cse130 = _cse0*_cse50
+    _cse131 = _cse129 - _cse130
+    _cse132 = 0.758601438*_cse121 + 0.758601438*_cse124 + 0.212878838804554*_cse125 + 0.458851168*_cse126 + 0.458851168*_cse127 - 0.212878838804554*_cse128 + _cse131
+    _cse133 = 0.20902*_cse4 + 0.0019519*_cse7
+    _cse134 = -_cse133
+    _cse135 = _cse0*_cse28
+    _cse136 = _cse0*_cse31
+    _cse137 = _cse135 - _cse136
+    _cse138 = 0.517383113*_cse121 + 0.517383113*_cse124 - 0.855753802*_cse126 - 0.855753802*_cse127 + _cse137
+    _cse139 = _cse0*_cse7
+    _cse140 = _cse139*_cse97
+    _cse141 = _cse139*_cse8
+    _cse142 = 0.0038906673398998*_cse141
+    _cse143 = _cse0*_cse4
+    _cse144 = _cse143*_cse5
+    _cse145 = 0.0038906673398998*_cse144
+    _cse146 = _cse0*_cse27
+    _cse147 = 0.227539183449751*_cse146
+    _cse148 = _cse0*_cse30
+    _cse149 = -0.227539183449751*_cse148
+    _cse150 = -1.098e-6*_cse0*_cse7 + _cse116*_cse143 + _cse140 + _cse142 + 0.20503*_cse143 + _cse145 + _cse147 + _cse149
+    _cse151 = -_cse16*_cse27 + _cse16*_cse30
+    _cse152 = _cse14*_cse151
+    _cse153 = -_cse1*_cse27 + _cse1*_cse30
+    _cse154 = _cse153*_cse21
+    _cse155 = _cse151*_cse23
+    _cse156 = _cse153*_cse25
+    _cse157 = 0.000346321299837637*_cse141 + 0.000346321299837637*_cse144
+    _cse158 = 0.517383113*_cse152 + 0.517383113*_cse154 - 0.855753802*_cse155 - 0.855753802*_cse156 + _cse157
+    _cse159 = 0.818687841791724*_cse144
+    _cse160 = 0.818687841791724*_cse141
+    _cse161 = -_cse151*_cse46 + 0.758601438*_cse152 + _cse153*_cse44 + 0.758601438*_cse154 + 0.458851168*_cse155 + 0.458851168*_cse156 - _cse159 - _cse160
+    _cse162 = -_cse158*_cse36 - _cse158*_cse40 + 0.0050298*_cse158*_cse42 + _cse158*_cse43 - _cse161*_cse54 + 0.0050298*_cse161*_cse56 - _cse161*_cse58 + _cse161*_cse60
+    _cse163 = 0.0439876856535455*_cse12
+    _cse164 = 0.0439876856535455*_cse13
+    _cse165 = _cse153*_cse23
+    _cse166 = _cse14*_cse153
+    _cse167 = _cse151*_cse64
+    _cse168 = _cse151*_cse20
+    _cse169 = 0.517383113*_cse14*_cse153 + 0.517383113*_cse151*_cse20 - 0.855753802*_cse165 - 0.855753802*_cse167
+    _cse170 = -_cse151*_cse44 - _cse153*_cse46 + 0.458851168*_cse165 + 0.758601438*_cse166 + 0.458851168*_cse167 + 0.758601438*_cse168
+    _cse171 = -_cse151*_cse164 + _cse151*_cse71 - _cse153*_cse163 + _cse153*_cse70 - 0.0181297165934418*_cse165 - 0.0309919044627574*_cse166 - 0.0181297165934418*_cse167 - 0.0309919044627574*_cse168 - _cse169*_cse54 + 0.0050298*_cse169*_cse56 - _cse169*_cse58 + _cse169*_cse60 + 0.01718495619792*_cse170*_cse35 + 0.0050298*_cse170*_cse41 - _cse170*_cse74 + _cse170*_cse75
+    _cse172 = -_cse119
+    _cse173 = _cse14*_cse172
+    _cse174 = -_cse122
+    _cse175 = _cse174*_cse21
+    _cse176 = _cse172*_cse23
+    _cse177 = _cse174*_cse25
+    _cse178 = -_cse129 + _cse130
+    _cse179 = -_cse172*_cse46 + 0.758601438*_cse173 + _cse174*_cse44 + 0.758601438*_cse175 + 0.458851168*_cse176 + 0.458851168*_cse177 + _cse178
+    _cse180 = -_cse137 + 0.517383113*_cse14*_cse172 + 0.517383113*_cse174*_cse21 - 0.855753802*_cse176 - 0.855753802*_cse177
+    _cse181 = _cse142 - _cse143*_cse95 + _cse145 + _cse147 + _cse149
+    _cse182 = _cse114*_cse180 + _cse115*_cse179 + _cse140 - _cse163*_cse172 + _cse164*_cse174 + _cse172*_cse70 - 0.0309919044627574*_cse173 + _cse174*_cse92 - 0.0309919044627574*_cse175 - 0.0181297165934418*_cse176 - 0.0181297165934418*_cse177 + _cse179*_cse36 - _cse179*_cse74 + _cse179*_cse75 - _cse180*_cse54 - _cse180*_cse58 + _cse180*_cse60 + _cse181
+    _cse183 = _cse119*_cse14
+    _cse184 = _cse122*_cse21
+    _cse185 = _cse119*_cse23
+    _cse186 = _cse122*_cse25
+    _cse187 = -_cse119*_cse46 + _cse122*_cse44 + _cse131 + 0.758601438*_cse183 + 0.758601438*_cse184 + 0.458851168*_cse185 + 0.458851168*_cse186
+    _cse188 = _cse137 + 0.517383113*_cse183 + 0.517383113*_cse184 - 0.855753802*_cse185 - 0.855753802*_cse186
+    _cse189 = _cse119*_cse163 - _cse119*_cse70 - 0.0439876856535455*_cse122*_cse13 - _cse122*_cse92 + 0.0309919044627574*_cse183 + 0.0309919044627574*_cse184 + 0.0181297165934418*_cse185 + 0.0181297165934418*_cse186 - 0.01718495619792*_cse187*_cse35 - 0.0050298*_cse187*_cse41 + _cse187*_cse74 - _cse187*_cse75 + _cse188*_cse54 - 0.0050298*_cse188*_cse56 + _cse188*_cse58 - _cse188*_cse60
+    _cse190 = -_cse151
+    _cse191 = _cse190*_cse23
+    _cse192 = -_cse153
+    _cse193 = _cse192*_cse25
+    _cse194 = 0.517383113*_cse14*_cse190 - _cse157 - 0.855753802*_cse191 + 0.517383113*_cse192*_cse21 - 0.855753802*_cse193
+    _cse195 = _cse14*_cse190
+    _cse196 = _cse192*_cse21
+    _cse197 = _cse159 + _cse160 - _cse190*_cse46 + 0.458851168*_cse191 + _cse192*_cse44 + 0.458851168*_cse193 + 0.758601438*_cse195 + 0.758601438*_cse196
+    _cse198 = -_cse194*_cse36 - _cse194*_cse40 + 0.0050298*_cse194*_cse42 + _cse194*_cse43 - _cse197*_cse54 + 0.0050298*_cse197*_cse56 - _cse197*_cse58 + _cse197*_cse60
+    _cse199 = _cse190*_cse64
+    _cse200 = _cse190*_cse20
+    _cse201 = _cse192*_cse23
+    _cse202 = _cse14*_cse192
+    _cse203 = 0.517383113*_cse14*_cse192 + 0.517383113*_cse190*_cse20 - 0.855753802*_cse199 - 0.855753802*_cse201
+    _cse204 = -_cse190*_cse44 - _cse192*_cse46 + 0.458851168*_cse199 + 0.758601438*_cse200 + 0.458851168*_cse201 + 0.758601438*_cse202
+    _cse205 = -_cse163*_cse192 - _cse164*_cse190 + _cse190*_cse71 + _cse192*_cse70 - 0.0181297165934418*_cse199 - 0.0309919044627574*_cse200 - 0.0181297165934418*_cse201 - 0.0309919044627574*_cse202 - _cse203*_cse54 + 0.0050298*_cse203*_cse56 - _cse203*_cse58 + _cse203*_cse60 + 0.01718495619792*_cse204*_cse35 + 0.0050298*_cse204*_cse41 - _cse204*_cse74 + _cse204*_cse75
+    _cse206 = -_cse97
+    _cse207 = -_cse120
+    _cse208 = _cse207*_cse64
+    _cse209 = -_cse123
+    _cse210 = _cse209*_cse23
+    _cse211 = 0.517383113*_cse14*_cse209 + 0.517383113*_cse20*_cse207 - 0.855753802*_cse208 - 0.855753802*_cse210
+    _cse212 = _cse20*_cse207
+    _cse213 = _cse14*_cse209
+    _cse214 = -_cse207*_cse44 + 0.458851168*_cse208 - _cse209*_cse46 + 0.458851168*_cse210 + 0.758601438*_cse212 + 0.758601438*_cse213
+    _cse215 = -_cse211*_cse36 - _cse211*_cse40 + 0.0050298*_cse211*_cse42 + _cse211*_cse43 - _cse214*_cse54 + 0.0050298*_cse214*_cse56 - _cse214*_cse58 + _cse214*_cse60
+    _cse216 = _cse209*_cse64
+    _cse217 = -_cse14
+    _cse218 = _cse207*_cse217
+    _cse219 = -_cse23
+    _cse220 = _cse207*_cse219
+    _cse221 = _cse20*_cse209
+    _cse222 = 0.517383113*_cse20*_cse209 + 0.517383113*_cse207*_cse217 - 0.855753802*_cse216 - 0.855753802*_cse220
+    _cse223 = _cse207*_cse46
+    _cse224 = _cse209*_cse44
+    _cse225 = 0.458851168*_cse216 + 0.758601438*_cse218 + 0.458851168*_cse220 + 0.758601438*_cse221 + _cse223 - _cse224
+    _cse226 = _cse209*_cse21
+    _cse227 = _cse207*_cse23
+    _cse228 = _cse14*_cse207
+    _cse229 = _cse209*_cse25
+    _cse230 = -_cse135 + _cse136 + 0.517383113*_cse226 - 0.855753802*_cse227 + 0.517383113*_cse228 - 0.855753802*_cse229
+    _cse231 = -0.0019534*_cse57
+    _cse232 = 0.0050298*_cse55
+    _cse233 = _cse178 - _cse223 + _cse224 + 0.758601438*_cse226 + 0.458851168*_cse227 + 0.758601438*_cse228 + 0.458851168*_cse229
+    _cse234 = 0.0050298*_cse42
+    _cse235 = -_cse132*_cse54 + 0.0050298*_cse132*_cse56 - _cse132*_cse58 + _cse132*_cse60 - _cse138*_cse36 - _cse138*_cse40 + 0.0050298*_cse138*_cse42 + _cse138*_cse43
+    _cse236 = _cse120*_cse64
+    _cse237 = _cse123*_cse23
+    _cse238 = _cse120*_cse20
+    _cse239 = _cse123*_cse14
+    _cse240 = 0.517383113*_cse120*_cse20 + 0.517383113*_cse123*_cse14 - 0.855753802*_cse236 - 0.855753802*_cse237
+    _cse241 = -_cse120*_cse44 - _cse123*_cse46 + 0.458851168*_cse236 + 0.458851168*_cse237 + 0.758601438*_cse238 + 0.758601438*_cse239
+    _cse242 = -_cse120*_cse164 + _cse120*_cse71 - _cse123*_cse163 + _cse123*_cse70 - 0.0181297165934418*_cse236 - 0.0181297165934418*_cse237 - 0.0309919044627574*_cse238 - 0.0309919044627574*_cse239 - _cse240*_cse54 + 0.0050298*_cse240*_cse56 - _cse240*_cse58 + _cse240*_cse60 + 0.01718495619792*_cse241*_cse35 + 0.0050298*_cse241*_cse41 - _cse241*_cse74 + _cse241*_cse75
+    _cse243 = -_cse0*_cse100 + _cse0*_cse98 + _cse0*_cse99 + 0.227539183449751*_cse141 + 0.227539183449751*_cse144
+    _cse244 = -_cse0*_cse96 + 0.0439876856535455*_cse13*_cse153 - _cse151*_cse163 + _cse151*_cse70 - 0.0309919044627574*_cse152 + _cse153*_cse92 - 0.0309919044627574*_cse154 - 0.0181297165934418*_cse155 - 0.0181297165934418*_cse156 - _cse158*_cse54 + 0.0050298*_cse158*_cse56 - _cse158*_cse58 + _cse158*_cse60 + 0.01718495619792*_cse161*_cse35 + 0.0050298*_cse161*_cse41 - _cse161*_cse74 + _cse161*_cse75 - _cse243
+    _cse245 = _cse0*_cse103 - _cse0*_cse117 + _cse114*_cse194 + _cse115*_cse197 - 0.20503*_cse139 - 1.098e-6*_cse143 - _cse163*_cse190 + _cse164*_cse192 + _cse190*_cse70 - 0.0181297165934418*_cse191 + _cse192*_cse92 - 0.0181297165934418*_cse193 - _cse194*_cse54 - _cse194*_cse58 + _cse194*_cse60 - 0.0309919044627574*_cse195 - 0.0309919044627574*_cse196 + _cse197*_cse36 - _cse197*_cse74 + _cse197*_cse75 + _cse243
+    _cse246 = -_cse11
+    _cse247 = _cse14*_cse246
+    _cse248 = -_cse19
+    _cse249 = _cse21*_cse248
+    _cse250 = _cse23*_cse246
+    _cse251 = _cse248*_cse25
+    _cse252 = -_cse49 + _cse51
+    _cse253 = -_cse246*_cse46 + 0.758601438*_cse247 + _cse248*_cse44 + 0.758601438*_cse249 + 0.458851168*_cse250 + 0.458851168*_cse251 + _cse252
+    _cse254 = 0.517383113*_cse247 + 0.517383113*_cse249 - 0.855753802*_cse250 - 0.855753802*_cse251 - _cse29 + _cse32
+    _cse255 = _cse80*_cse97
+    _cse256 = 0.0038906673398998*_cse81
+    _cse257 = 0.0038906673398998*_cse78
+    _cse258 = _cse2*_cse27
+    _cse259 = 0.227539183449751*_cse258
+    _cse260 = _cse2*_cse30
+    _cse261 = -0.227539183449751*_cse260
+    _cse262 = _cse116*_cse77 + _cse255 + _cse256 + _cse257 + _cse259 + _cse261 + 0.20503*_cse77 - 1.098e-6*_cse80
+    _cse263 = -_cse112*_cse54 + 0.0050298*_cse112*_cse56 - _cse112*_cse58 + _cse112*_cse60 - _cse113*_cse36 - _cse113*_cse40 + 0.0050298*_cse113*_cse42 + _cse113*_cse43
+    _cse264 = _cse104*_cse64
+    _cse265 = _cse104*_cse20
+    _cse266 = _cse106*_cse23
+    _cse267 = _cse106*_cse14
+    _cse268 = 0.517383113*_cse104*_cse20 + 0.517383113*_cse106*_cse14 - 0.855753802*_cse264 - 0.855753802*_cse266
+    _cse269 = -_cse104*_cse44 - _cse106*_cse46 + 0.458851168*_cse264 + 0.758601438*_cse265 + 0.458851168*_cse266 + 0.758601438*_cse267
+    _cse270 = -_cse104*_cse164 + _cse104*_cse71 - _cse106*_cse163 + _cse106*_cse70 - 0.0181297165934418*_cse264 - 0.0309919044627574*_cse265 - 0.0181297165934418*_cse266 - 0.0309919044627574*_cse267 - _cse268*_cse54 + 0.0050298*_cse268*_cse56 - _cse268*_cse58 + _cse268*_cse60 + 0.01718495619792*_cse269*_cse35 + 0.0050298*_cse269*_cse41 - _cse269*_cse74 + _cse269*_cse75
+    _cse271 = _cse10*_cse14
+    _cse272 = _cse18*_cse21
+    _cse273 = _cse10*_cse23
+    _cse274 = _cse18*_cse25
+    _cse275 = -_cse10*_cse46 + _cse18*_cse44 + 0.758601438*_cse271 + 0.758601438*_cse272 + 0.458851168*_cse273 + 0.458851168*_cse274 + _cse52
+    _cse276 = 0.517383113*_cse271 + 0.517383113*_cse272 - 0.855753802*_cse273 - 0.855753802*_cse274 + _cse33
+    _cse277 = _cse256 + _cse257 + _cse259 + _cse261 - _cse77*_cse95
+    _cse278 = -_cse10*_cse163 + _cse10*_cse70 + 0.0439876856535455*_cse13*_cse18 + _cse18*_cse92 - _cse255 - 0.0309919044627574*_cse271 - 0.0309919044627574*_cse272 - 0.0181297165934418*_cse273 - 0.0181297165934418*_cse274 + 0.01718495619792*_cse275*_cse35 + 0.0050298*_cse275*_cse41 - _cse275*_cse74 + _cse275*_cse75 - _cse276*_cse54 + 0.0050298*_cse276*_cse56 - _cse276*_cse58 + _cse276*_cse60 - _cse277
+    _cse279 = -_cse10
+    _cse280 = _cse14*_cse279
+    _cse281 = -_cse18
+    _cse282 = _cse21*_cse281
+    _cse283 = _cse23*_cse279
+    _cse284 = _cse25*_cse281
+    _cse285 = _cse252 - _cse279*_cse46 + 0.758601438*_cse280 + _cse281*_cse44 + 0.758601438*_cse282 + 0.458851168*_cse283 + 0.458851168*_cse284
+    _cse286 = 0.517383113*_cse14*_cse279 + 0.517383113*_cse21*_cse281 - 0.855753802*_cse283 - 0.855753802*_cse284 - _cse33
+    _cse287 = _cse114*_cse286 + _cse115*_cse285 - _cse163*_cse279 + _cse164*_cse281 + _cse279*_cse70 - 0.0309919044627574*_cse280 + _cse281*_cse92 - 0.0309919044627574*_cse282 - 0.0181297165934418*_cse283 - 0.0181297165934418*_cse284 + _cse285*_cse36 - _cse285*_cse74 + _cse285*_cse75 - _cse286*_cse54 - _cse286*_cse58 + _cse286*_cse60
+    _cse288 = -_cse36*_cse94 - _cse40*_cse94 + 0.0050298*_cse42*_cse94 + _cse43*_cse94 - _cse54*_cse91 + 0.0050298*_cse56*_cse91 - _cse58*_cse91 + _cse60*_cse91
+    _cse289 = _cse23*_cse83
+    _cse290 = _cse14*_cse83
+    _cse291 = _cse64*_cse85
+    _cse292 = _cse20*_cse85
+    _cse293 = 0.517383113*_cse14*_cse83 + 0.517383113*_cse20*_cse85 - 0.855753802*_cse289 - 0.855753802*_cse291
+    _cse294 = 0.458851168*_cse289 + 0.758601438*_cse290 + 0.458851168*_cse291 + 0.758601438*_cse292 - _cse44*_cse85 - _cse46*_cse83
+    _cse295 = -_cse163*_cse83 - _cse164*_cse85 - 0.0181297165934418*_cse289 - 0.0309919044627574*_cse290 - 0.0181297165934418*_cse291 - 0.0309919044627574*_cse292 - _cse293*_cse54 + 0.0050298*_cse293*_cse56 - _cse293*_cse58 + _cse293*_cse60 + 0.01718495619792*_cse294*_cse35 + 0.0050298*_cse294*_cse41 - _cse294*_cse74 + _cse294*_cse75 + _cse70*_cse83 + _cse71*_cse85
+    _cse296 = -_cse36*_cse72 - _cse40*_cse72 + 0.0050298*_cse42*_cse72 + _cse43*_cse72 - _cse54*_cse73 + 0.0050298*_cse56*_cse73 - _cse58*_cse73 + _cse60*_cse73
+    _cse297 = _cse19*_cse64
+    _cse298 = _cse11*_cse217
+    _cse299 = _cse11*_cse219
+    _cse300 = _cse19*_cse20
+    _cse301 = 0.517383113*_cse11*_cse217 + 0.517383113*_cse19*_cse20 - 0.855753802*_cse297 - 0.855753802*_cse299
+    _cse302 = 0.458851168*_cse297 + 0.758601438*_cse298 + 0.458851168*_cse299 + 0.758601438*_cse300 - _cse45 + _cse47
+    _cse303 = 0.999999998572139*_cse6 + 0.999999998572139*_cse9
+    _cse304 = -_cse303
+    _cse305 = _cse23*_cse304
+    _cse306 = 6.57617443000635e-7*_cse6 + 6.57617443000635e-7*_cse9
+    _cse307 = -_cse306
+    _cse308 = _cse25*_cse307
+    _cse309 = _cse28 - _cse31
+    _cse310 = 0.517383113*_cse14*_cse304 + 0.517383113*_cse21*_cse307 - 0.855753802*_cse305 - 0.855753802*_cse308 - _cse309
+    _cse311 = _cse14*_cse304
+    _cse312 = _cse21*_cse307
+    _cse313 = -_cse304*_cse46 + 0.458851168*_cse305 + _cse307*_cse44 + 0.458851168*_cse308 + 0.758601438*_cse311 + 0.758601438*_cse312 - _cse48 + _cse50
+    _cse314 = -_cse310*_cse36 - _cse310*_cse40 + 0.0050298*_cse310*_cse42 + _cse310*_cse43 - _cse313*_cse54 + 0.0050298*_cse313*_cse56 - _cse313*_cse58 + _cse313*_cse60
+    _cse315 = _cse304*_cse64
+    _cse316 = _cse20*_cse304
+    _cse317 = _cse23*_cse307
+    _cse318 = _cse14*_cse307
+    _cse319 = 0.517383113*_cse14*_cse307 + 0.517383113*_cse20*_cse304 - 0.855753802*_cse315 - 0.855753802*_cse317
+    _cse320 = -_cse304*_cse44 - _cse307*_cse46 + 0.458851168*_cse315 + 0.758601438*_cse316 + 0.458851168*_cse317 + 0.758601438*_cse318
+    _cse321 = -_cse163*_cse307 - _cse164*_cse304 + _cse304*_cse71 + _cse307*_cse70 - 0.0181297165934418*_cse315 - 0.0309919044627574*_cse316 - 0.0181297165934418*_cse317 - 0.0309919044627574*_cse318 - _cse319*_cse54 + 0.0050298*_cse319*_cse56 - _cse319*_cse58 + _cse319*_cse60 + 0.01718495619792*_cse320*_cse35 + 0.0050298*_cse320*_cse41 - _cse320*_cse74 + _cse320*_cse75
+    _cse322 = 0.818687841791724*_cse6
+    _cse323 = 0.818687841791724*_cse9
+    _cse324 = -0.999999998572139*_cse27 + 0.999999998572139*_cse30
+    _cse325 = -_cse324
+    _cse326 = _cse325*_cse46
+    _cse327 = -6.57617443000635e-7*_cse27 + 6.57617443000635e-7*_cse30
+    _cse328 = -_cse327
+    _cse329 = _cse328*_cse44
+    _cse330 = _cse23*_cse325
+    _cse331 = _cse14*_cse325
+    _cse332 = _cse21*_cse328
+    _cse333 = _cse25*_cse328
+    _cse334 = _cse322 + _cse323 - _cse326 + _cse329 + 0.458851168*_cse330 + 0.758601438*_cse331 + 0.758601438*_cse332 + 0.458851168*_cse333
+    _cse335 = 0.000346321299837637*_cse6 + 0.000346321299837637*_cse9
+    _cse336 = 0.517383113*_cse14*_cse325 + 0.517383113*_cse21*_cse328 - 0.855753802*_cse330 - 0.855753802*_cse333 - _cse335
+    _cse337 = _cse334*_cse36
+    _cse338 = _cse336*_cse54
+    _cse339 = -_cse163*_cse325 + _cse164*_cse328
+    _cse340 = 0.227539183449751*_cse9
+    _cse341 = 0.227539183449751*_cse6
+    _cse342 = -_cse100
+    _cse343 = _cse340 + _cse341 + _cse342 + _cse96 + _cse99
+    _cse344 = _cse114*_cse336 + _cse115*_cse334 + _cse325*_cse70 + _cse328*_cse92 - 0.0181297165934418*_cse330 - 0.0309919044627574*_cse331 - 0.0309919044627574*_cse332 - 0.0181297165934418*_cse333 - _cse334*_cse74 + _cse334*_cse75 - _cse336*_cse58 + _cse336*_cse60 + _cse337 - _cse338 + _cse339 + _cse343 + _cse98
+    _cse345 = _cse21*_cse327
+    _cse346 = _cse25*_cse327
+    _cse347 = _cse23*_cse324
+    _cse348 = _cse14*_cse324
+    _cse349 = -_cse322 - _cse323 - _cse324*_cse46 + _cse327*_cse44 + 0.758601438*_cse345 + 0.458851168*_cse346 + 0.458851168*_cse347 + 0.758601438*_cse348
+    _cse350 = _cse335 + 0.517383113*_cse345 - 0.855753802*_cse346 - 0.855753802*_cse347 + 0.517383113*_cse348
+    _cse351 = -0.0439876856535455*_cse13*_cse327 + _cse163*_cse324 - _cse324*_cse70 - _cse327*_cse92 + 0.0309919044627574*_cse345 + 0.0181297165934418*_cse346 + 0.0181297165934418*_cse347 + 0.0309919044627574*_cse348 - 0.01718495619792*_cse349*_cse35 - 0.0050298*_cse349*_cse41 + _cse349*_cse74 - _cse349*_cse75 + _cse350*_cse54 - 0.0050298*_cse350*_cse56 + _cse350*_cse58 - _cse350*_cse60
+    _cse352 = _cse14*_cse303
+    _cse353 = _cse21*_cse306
+    _cse354 = _cse23*_cse303
+    _cse355 = _cse25*_cse306
+    _cse356 = _cse309 + 0.517383113*_cse352 + 0.517383113*_cse353 - 0.855753802*_cse354 - 0.855753802*_cse355
+    _cse357 = -_cse303*_cse46 + _cse306*_cse44 + 0.758601438*_cse352 + 0.758601438*_cse353 + 0.458851168*_cse354 + 0.458851168*_cse355 + _cse48 - _cse50
+    _cse358 = -_cse356*_cse36 - _cse356*_cse40 + 0.0050298*_cse356*_cse42 + _cse356*_cse43 - _cse357*_cse54 + 0.0050298*_cse357*_cse56 - _cse357*_cse58 + _cse357*_cse60
+    _cse359 = _cse23*_cse306
+    _cse360 = _cse14*_cse306
+    _cse361 = _cse303*_cse64
+    _cse362 = _cse20*_cse303
+    _cse363 = 0.517383113*_cse14*_cse306 + 0.517383113*_cse20*_cse303 - 0.855753802*_cse359 - 0.855753802*_cse361
+    _cse364 = -_cse303*_cse44 - _cse306*_cse46 + 0.458851168*_cse359 + 0.758601438*_cse360 + 0.458851168*_cse361 + 0.758601438*_cse362
+    _cse365 = -_cse163*_cse306 - _cse164*_cse303 + _cse303*_cse71 + _cse306*_cse70 + 0.01718495619792*_cse35*_cse364 - 0.0181297165934418*_cse359 - 0.0309919044627574*_cse360 - 0.0181297165934418*_cse361 - 0.0309919044627574*_cse362 - _cse363*_cse54 + 0.0050298*_cse363*_cse56 - _cse363*_cse58 + _cse363*_cse60 + 0.0050298*_cse364*_cse41 - _cse364*_cse74 + _cse364*_cse75
+    _cse366 = _cse325*_cse64
+    _cse367 = _cse23*_cse328
+    _cse368 = 0.517383113*_cse14*_cse328 + 0.517383113*_cse20*_cse325 - 0.855753802*_cse366 - 0.855753802*_cse367
+    _cse369 = _cse20*_cse325
+    _cse370 = _cse14*_cse328
+    _cse371 = -_cse325*_cse44 - _cse328*_cse46 + 0.458851168*_cse366 + 0.458851168*_cse367 + 0.758601438*_cse369 + 0.758601438*_cse370
+    _cse372 = -_cse36*_cse368 - _cse368*_cse40 + 0.0050298*_cse368*_cse42 + _cse368*_cse43 - _cse371*_cse54 + 0.0050298*_cse371*_cse56 - _cse371*_cse58 + _cse371*_cse60
+    _cse373 = _cse217*_cse325
+    _cse374 = _cse219*_cse325
+    _cse375 = _cse328*_cse64
+    _cse376 = _cse20*_cse328
+    _cse377 = _cse326 - _cse329 + 0.758601438*_cse373 + 0.458851168*_cse374 + 0.458851168*_cse375 + 0.758601438*_cse376
+    _cse378 = 0.517383113*_cse373 - 0.855753802*_cse374 - 0.855753802*_cse375 + 0.517383113*_cse376
+    _cse379 = _cse0*dq0
+    _cse380 = _cse141 + _cse144
+    _cse381 = 0.574238819026787*_cse144
+    _cse382 = 0.574238819026787*_cse141
+    _cse383 = 0.408002994597976*_cse13
+    _cse384 = 0.408002994597976*_cse12
+    _cse385 = 0.410149995883665*_cse35
+    _cse386 = 0.209584432*_cse39
+    _cse387 = 0.410879747*_cse42
+    _cse388 = 0.410149995883665*_cse37
+    _cse389 = 0.410879747*_cse56
+    _cse390 = 0.209584432*_cse57
+    _cse391 = 0.329365488408814*_cse144
+    _cse392 = 0.329365488408814*_cse141
+    _cse393 = 0.234017800844203*_cse13
+    _cse394 = 0.234017800844203*_cse12
+    _cse395 = 0.410879747*_cse41
+    _cse396 = 0.209584432*_cse38
+    _cse397 = _cse2*dq0
+    _cse398 = _cse78 + _cse81
+    _cse399 = 0.574238819026787*_cse78
+    _cse400 = 0.574238819026787*_cse81
+    _cse401 = 0.329365488408814*_cse78
+    _cse402 = 0.329365488408814*_cse81
+    _cse403 = -_cse27 + _cse30
+    _cse404 = 0.574238819026787*_cse30
+    _cse405 = 0.574238819026787*_cse27
+    _cse406 = 0.329365488408814*_cse30
+    _cse407 = 0.329365488408814*_cse27
+    out = np.empty((6, 6))
+    out[0, 0] = _cse102*dq2 + _cse118*dq1 + _cse61*dq4 + _cse76*dq3 + dq0*(_cse0*_cse134 - 4.3259e-5*_cse0 + _cse120*_cse70 - 0.0309919044627574*_cse121 + 0.0439876856535455*_cse123*_cse13 + _cse123*_cse92 - 0.0309919044627574*_cse124 - 0.0181297165934418*_cse126 - 0.0181297165934418*_cse127 - 0.0439876856535455*_cse128 + 0.01718495619792*_cse132*_cse35 + 0.0050298*_cse132*_cse41 - _cse132*_cse74 + _cse132*_cse75 - _cse138*_cse54 + 0.0050298*_cse138*_cse56 - _cse138*_cse58 + _cse138*_cse60 - _cse150 + 0.0068032576553314*_cse2)
+    out[0, 1] = _cse118*dq0 + _cse162*dq4 + _cse171*dq3 + _cse182*dq2 + dq1*(-_cse0*_cse133 - _cse150 - _cse189)
+    out[0, 2] = _cse102*dq0 + _cse182*dq1 + _cse198*dq4 + _cse205*dq3 + dq2*(_cse0*_cse206*_cse7 - _cse181 - _cse189)
+    out[0, 3] = _cse171*dq1 + _cse205*dq2 + _cse215*dq4 + _cse76*dq0 + dq3*(0.0439876856535455*_cse12*_cse207 - _cse164*_cse209 + _cse207*_cse69 + _cse209*_cse71 - 0.0181297165934418*_cse216 - 0.0309919044627574*_cse218 - 0.0181297165934418*_cse220 - 0.0309919044627574*_cse221 - _cse222*_cse54 + 0.0050298*_cse222*_cse56 - _cse222*_cse58 + _cse222*_cse60 + 0.01718495619792*_cse225*_cse35 + 0.0050298*_cse225*_cse41 - _cse225*_cse74 + _cse225*_cse75)
+    out[0, 4] = _cse162*dq1 + _cse198*dq2 + _cse215*dq3 + _cse61*dq0 + dq4*(-_cse230*_cse231 + _cse230*_cse232 + _cse230*_cse54 + _cse230*_cse59 + _cse233*_cse234 - _cse233*_cse36 - _cse233*_cse40 + _cse233*_cse43)
+    out[0, 5] = 0
+    out[1, 0] = _cse235*dq4 + _cse242*dq3 + _cse244*dq2 + _cse245*dq1 + dq0*(0.0068032576553314*_cse0 + _cse114*_cse254 + _cse115*_cse253 - _cse134*_cse2 - _cse163*_cse246 + _cse164*_cse248 + 4.3259e-5*_cse2 + _cse246*_cse70 - 0.0309919044627574*_cse247 + _cse248*_cse92 - 0.0309919044627574*_cse249 - 0.0181297165934418*_cse250 - 0.0181297165934418*_cse251 + _cse253*_cse36 - _cse253*_cse74 + _cse253*_cse75 - _cse254*_cse54 - _cse254*_cse58 + _cse254*_cse60 + _cse262)
+    out[1, 1] = _cse245*dq0 + _cse263*dq4 + _cse270*dq3 + _cse278*dq2 + dq1*(_cse133*_cse2 + _cse262 + _cse287)
+    out[1, 2] = _cse244*dq0 + _cse278*dq1 + _cse288*dq4 + _cse295*dq3 + dq2*(-_cse206*_cse80 + _cse277 + _cse287)
+    out[1, 3] = _cse242*dq0 + _cse270*dq1 + _cse295*dq2 + _cse296*dq4 + dq3*(0.0439876856535455*_cse11*_cse12 + _cse11*_cse69 - _cse164*_cse19 + _cse19*_cse71 - 0.0181297165934418*_cse297 - 0.0309919044627574*_cse298 - 0.0181297165934418*_cse299 - 0.0309919044627574*_cse300 - _cse301*_cse54 + 0.0050298*_cse301*_cse56 - _cse301*_cse58 + _cse301*_cse60 + 0.01718495619792*_cse302*_cse35 + 0.0050298*_cse302*_cse41 - _cse302*_cse74 + _cse302*_cse75)
+    out[1, 4] = _cse235*dq0 + _cse263*dq1 + _cse288*dq2 + _cse296*dq3 + dq4*(-_cse231*_cse34 + _cse232*_cse34 + _cse234*_cse53 + _cse34*_cse54 + _cse34*_cse59 - _cse36*_cse53 - _cse40*_cse53 + _cse43*_cse53)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse314*dq4 + _cse321*dq3 + _cse344*dq2 + dq1*(_cse116*_cse7 - _cse340 - _cse341 - _cse342 - _cse351 - 0.001950802*_cse4 + 0.41405*_cse7 - _cse98 - _cse99)
+    out[2, 2] = _cse344*dq1 + _cse358*dq4 + _cse365*dq3 + dq2*(_cse206*_cse4 - _cse343 - _cse351)
+    out[2, 3] = _cse321*dq1 + _cse365*dq2 + _cse372*dq4 + dq3*(_cse325*_cse69 + _cse328*_cse71 - _cse339 + 0.01718495619792*_cse35*_cse377 - 0.0309919044627574*_cse373 - 0.0181297165934418*_cse374 - 0.0181297165934418*_cse375 - 0.0309919044627574*_cse376 + 0.0050298*_cse377*_cse41 - _cse377*_cse74 + _cse377*_cse75 - _cse378*_cse54 + 0.0050298*_cse378*_cse56 - _cse378*_cse58 + _cse378*_cse60)
+    out[2, 4] = _cse314*dq1 + _cse358*dq2 + _cse372*dq3 + dq4*(-_cse231*_cse336 + _cse232*_cse336 + _cse234*_cse334 - _cse334*_cse40 + _cse334*_cse43 + _cse336*_cse59 - _cse337 + _cse338)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse379
+    out[3, 2] = _cse379
+    out[3, 3] = _cse380*dq1 - _cse380*dq2 + dq0*(_cse2*_cse5*_cse7 - _cse260)
+    out[3, 4] = dq0*(_cse11*_cse384 + 0.3960285*_cse15 - _cse19*_cse383 + 0.3960285*_cse22 + 0.239041914*_cse24 + 0.574238819026787*_cse258 + 0.239041914*_cse26 - 0.574238819026787*_cse260) + dq1*(_cse151*_cse384 + 0.3960285*_cse152 - _cse153*_cse383 + 0.3960285*_cse154 + 0.239041914*_cse155 + 0.239041914*_cse156 + _cse381 + _cse382) + dq2*(_cse190*_cse384 + 0.239041914*_cse191 - _cse192*_cse383 + 0.239041914*_cse193 + 0.3960285*_cse195 + 0.3960285*_cse196 - _cse381 - _cse382) + dq3*(_cse207*_cse383 + 0.239041914*_cse208 + _cse209*_cse384 + 0.239041914*_cse210 + 0.3960285*_cse212 + 0.3960285*_cse213)
+    out[3, 5] = dq0*(_cse11*_cse394 + 0.227149603970304*_cse15 - _cse19*_cse393 + 0.227149603970304*_cse22 + 0.137106991283212*_cse24 + 0.329365488408814*_cse258 + 0.137106991283212*_cse26 - 0.329365488408814*_cse260 + _cse34*_cse388 - _cse34*_cse389 + _cse34*_cse390 - _cse385*_cse53 - _cse395*_cse53 + _cse396*_cse53) + dq1*(_cse151*_cse394 + 0.227149603970304*_cse152 - _cse153*_cse393 + 0.227149603970304*_cse154 + 0.137106991283212*_cse155 + 0.137106991283212*_cse156 + _cse158*_cse388 - _cse158*_cse389 + _cse158*_cse390 - _cse161*_cse385 - _cse161*_cse395 + _cse161*_cse396 + _cse391 + _cse392) + dq2*(_cse190*_cse394 + 0.137106991283212*_cse191 - _cse192*_cse393 + 0.137106991283212*_cse193 + _cse194*_cse388 - _cse194*_cse389 + _cse194*_cse390 + 0.227149603970304*_cse195 + 0.227149603970304*_cse196 - _cse197*_cse385 - _cse197*_cse395 + _cse197*_cse396 - _cse391 - _cse392) + dq3*(_cse207*_cse393 + 0.137106991283212*_cse208 + _cse209*_cse394 + 0.137106991283212*_cse210 + _cse211*_cse388 - _cse211*_cse389 + _cse211*_cse390 + 0.227149603970304*_cse212 + 0.227149603970304*_cse213 - _cse214*_cse385 - _cse214*_cse395 + _cse214*_cse396) + dq4*(_cse230*_cse385 + _cse230*_cse386 - _cse230*_cse387 + _cse233*_cse388 - _cse233*_cse389 + _cse233*_cse390)
+    out[4, 0] = 0
+    out[4, 1] = _cse397
+    out[4, 2] = -_cse397
+    out[4, 3] = -_cse398*dq1 + _cse398*dq2 + dq0*(_cse0*_cse5*_cse7 - _cse148)
+    out[4, 4] = dq0*(0.3960285*_cse121 + 0.3960285*_cse124 - 0.408002994597976*_cse125 + 0.239041914*_cse126 + 0.239041914*_cse127 + 0.408002994597976*_cse128 + 0.574238819026787*_cse146 - 0.574238819026787*_cse148) + dq1*(0.408002994597976*_cse105 - 0.408002994597976*_cse107 + 0.239041914*_cse108 + 0.3960285*_cse109 + 0.3960285*_cse110 + 0.239041914*_cse111 - _cse399 - _cse400) + dq2*(_cse399 + _cse400 - 0.408002994597976*_cse84 + 0.408002994597976*_cse86 + 0.3960285*_cse87 + 0.239041914*_cse88 + 0.239041914*_cse89 + 0.3960285*_cse90) + dq3*(0.408002994597976*_cse62 + 0.408002994597976*_cse63 + 0.239041914*_cse65 + 0.239041914*_cse66 + 0.3960285*_cse67 + 0.3960285*_cse68)
+    out[4, 5] = dq0*(0.227149603970304*_cse121 + 0.227149603970304*_cse124 - 0.234017800844203*_cse125 + 0.137106991283212*_cse126 + 0.137106991283212*_cse127 + 0.234017800844203*_cse128 - _cse132*_cse385 - _cse132*_cse395 + _cse132*_cse396 + _cse138*_cse388 - _cse138*_cse389 + _cse138*_cse390 + 0.329365488408814*_cse146 - 0.329365488408814*_cse148) + dq1*(0.234017800844203*_cse105 - 0.234017800844203*_cse107 + 0.137106991283212*_cse108 + 0.227149603970304*_cse109 + 0.227149603970304*_cse110 + 0.137106991283212*_cse111 - _cse112*_cse385 - _cse112*_cse395 + _cse112*_cse396 + _cse113*_cse388 - _cse113*_cse389 + _cse113*_cse390 - _cse401 - _cse402) + dq2*(-_cse385*_cse91 + _cse388*_cse94 - _cse389*_cse94 + _cse390*_cse94 - _cse395*_cse91 + _cse396*_cse91 + _cse401 + _cse402 - 0.234017800844203*_cse84 + 0.234017800844203*_cse86 + 0.227149603970304*_cse87 + 0.137106991283212*_cse88 + 0.137106991283212*_cse89 + 0.227149603970304*_cse90) + dq3*(-_cse385*_cse73 + _cse388*_cse72 - _cse389*_cse72 + _cse390*_cse72 - _cse395*_cse73 + _cse396*_cse73 + 0.234017800844203*_cse62 + 0.234017800844203*_cse63 + 0.137106991283212*_cse65 + 0.137106991283212*_cse66 + 0.227149603970304*_cse67 + 0.227149603970304*_cse68) + dq4*(_cse34*_cse385 + _cse34*_cse386 - _cse34*_cse387 + _cse388*_cse53 - _cse389*_cse53 + _cse390*_cse53)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse403*dq1 - _cse403*dq2
+    out[5, 4] = dq1*(_cse304*_cse384 + 0.239041914*_cse305 - _cse307*_cse383 + 0.239041914*_cse308 + 0.3960285*_cse311 + 0.3960285*_cse312 + _cse404 - _cse405) + dq2*(_cse303*_cse384 - _cse306*_cse383 + 0.3960285*_cse352 + 0.3960285*_cse353 + 0.239041914*_cse354 + 0.239041914*_cse355 - _cse404 + _cse405) + dq3*(_cse325*_cse383 + _cse328*_cse384 + 0.239041914*_cse366 + 0.239041914*_cse367 + 0.3960285*_cse369 + 0.3960285*_cse370)
+    out[5, 5] = dq1*(_cse304*_cse394 + 0.137106991283212*_cse305 - _cse307*_cse393 + 0.137106991283212*_cse308 + _cse310*_cse388 - _cse310*_cse389 + _cse310*_cse390 + 0.227149603970304*_cse311 + 0.227149603970304*_cse312 - _cse313*_cse385 - _cse313*_cse395 + _cse313*_cse396 + _cse406 - _cse407) + dq2*(_cse303*_cse394 - _cse306*_cse393 + 0.227149603970304*_cse352 + 0.227149603970304*_cse353 + 0.137106991283212*_cse354 + 0.137106991283212*_cse355 + _cse356*_cse388 - _cse356*_cse389 + _cse356*_cse390 - _cse357*_cse385 - _cse357*_cse395 + _cse357*_cse396 - _cse406 + _cse407) + dq3*(_cse325*_cse393 + _cse328*_cse394 + 0.137106991283212*_cse366 + 0.137106991283212*_cse367 + _cse368*_cse388 - _cse368*_cse389 + _cse368*_cse390 + 0.227149603970304*_cse369 + 0.227149603970304*_cse370 - _cse371*_cse385 - _cse371*_cse395 + _cse371*_cse396) + dq4*(_cse334*_cse388 - _cse334*_cse389 + _cse334*_cse390 + _cse336*_cse385 + _cse336*_cse386 - _cse336*_cse387)
+    return out
+
+
+# EE_Tx
+def function42(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse3*_cse8
+    _cse10 = _cse5*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = math.sin(q3)
+    _cse16 = 6.57617443000635e-7*_cse0
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = _cse2*_cse6
+    _cse19 = _cse4*_cse8
+    _cse20 = -_cse16 - _cse17*_cse18 - _cse17*_cse19
+    _cse21 = _cse15*_cse20
+    _cse22 = math.cos(q3)
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0 - _cse18*_cse23 - _cse19*_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = -0.012581*_cse15 - 0.00040053*_cse22
+    _cse27 = -0.00040053*_cse15 + 0.012581*_cse22
+    _cse28 = -0.51802699*_cse15 - 0.75940555*_cse22
+    _cse29 = _cse24*_cse28
+    _cse30 = 0.45991232*_cse15 + 0.85536427*_cse22
+    _cse31 = _cse20*_cse30
+    _cse32 = 0.75940555*_cse15 - 0.51802699*_cse22
+    _cse33 = _cse20*_cse32
+    _cse34 = 0.85536427*_cse15 - 0.45991232*_cse22
+    _cse35 = _cse24*_cse34
+    _cse36 = math.sin(q4)
+    _cse37 = -0.000346321299837637*_cse10 + 0.517383113*_cse29 - 0.855753802*_cse31 + 0.517383113*_cse33 - 0.855753802*_cse35 + 0.000346321299837637*_cse9
+    _cse38 = _cse36*_cse37
+    _cse39 = math.cos(q4)
+    _cse40 = -0.012272*_cse36 - 0.00052974*_cse39
+    _cse41 = -0.78972966*_cse36 + 0.45479896*_cse39
+    _cse42 = _cse37*_cse41
+    _cse43 = 0.40329059*_cse36 + 0.89059413*_cse39
+    _cse44 = _cse37*_cse43
+    _cse45 = 0.818687841791724*_cse10 - 0.212878838804554*_cse21 + 0.212878838804554*_cse25 + 0.758601438*_cse29 + 0.458851168*_cse31 + 0.758601438*_cse33 + 0.458851168*_cse35 - 0.818687841791724*_cse9
+    _cse46 = _cse39*_cse45
+    _cse47 = -0.00052974*_cse36 + 0.012272*_cse39
+    _cse48 = 0.45479896*_cse36 + 0.78972966*_cse39
+    _cse49 = _cse45*_cse48
+    _cse50 = 0.89059413*_cse36 - 0.40329059*_cse39
+    _cse51 = _cse45*_cse50
+    _cse52 = _cse0*_cse2
+    _cse53 = _cse0*_cse4
+    _cse54 = _cse53*_cse6
+    _cse55 = _cse16*_cse18 + _cse16*_cse19 + _cse17
+    _cse56 = 0.999999998572139*_cse0
+    _cse57 = _cse18*_cse56 + _cse19*_cse56 - _cse23
+    _cse58 = _cse15*_cse57
+    _cse59 = _cse28*_cse55
+    _cse60 = _cse30*_cse57
+    _cse61 = _cse32*_cse57
+    _cse62 = _cse34*_cse55
+    _cse63 = _cse52*_cse8
+    _cse64 = 0.000346321299837637*_cse54 + 0.517383113*_cse59 - 0.855753802*_cse60 + 0.517383113*_cse61 - 0.855753802*_cse62 - 0.000346321299837637*_cse63
+    _cse65 = _cse36*_cse64
+    _cse66 = _cse43*_cse64
+    _cse67 = _cse22*_cse55
+    _cse68 = -0.818687841791724*_cse54 - 0.212878838804554*_cse58 + 0.758601438*_cse59 + 0.458851168*_cse60 + 0.758601438*_cse61 + 0.458851168*_cse62 + 0.818687841791724*_cse63 + 0.212878838804554*_cse67
+    _cse69 = _cse50*_cse68
+    _cse70 = _cse41*_cse64
+    _cse71 = _cse48*_cse68
+    _cse72 = _cse2*_cse8
+    _cse73 = 0.999999998572139*_cse4*_cse6 - 0.999999998572139*_cse72
+    _cse74 = _cse15*_cse73
+    _cse75 = 6.57617443000635e-7*_cse4*_cse6 - 6.57617443000635e-7*_cse72
+    _cse76 = _cse22*_cse75
+    _cse77 = _cse30*_cse73
+    _cse78 = _cse32*_cse73
+    _cse79 = _cse28*_cse75
+    _cse80 = _cse34*_cse75
+    _cse81 = -0.000346321299837637*_cse18 - 0.000346321299837637*_cse19 + 0.517383113*_cse28*_cse75 + 0.517383113*_cse32*_cse73 - 0.855753802*_cse77 - 0.855753802*_cse80
+    _cse82 = _cse36*_cse81
+    _cse83 = _cse41*_cse81
+    _cse84 = _cse43*_cse81
+    _cse85 = 0.818687841791724*_cse18 + 0.818687841791724*_cse19 - 0.212878838804554*_cse74 + 0.212878838804554*_cse76 + 0.458851168*_cse77 + 0.758601438*_cse78 + 0.758601438*_cse79 + 0.458851168*_cse80
+    _cse86 = _cse39*_cse85
+    _cse87 = _cse48*_cse85
+    _cse88 = _cse50*_cse85
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + 0.227539183449751*_cse10 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse20*_cse26 - 0.0439876856535455*_cse21 + _cse24*_cse27 + 0.0439876856535455*_cse25 - 0.0309919044627574*_cse29 + _cse3*_cse7 + 0.20503*_cse3 - 0.0181297165934418*_cse31 - 0.0309919044627574*_cse33 - 0.0181297165934418*_cse35 + _cse37*_cse40 - 0.01718495619792*_cse38 + 0.0050298*_cse42 - 0.0019534*_cse44 + _cse45*_cse47 + 0.01718495619792*_cse46 + 0.0050298*_cse49 - 1.098e-6*_cse5 - 0.0019534*_cse51 - 0.227539183449751*_cse9 + x*(-2.75322908921405e-6*_cse10 + 1.9561995392714e-6*_cse21 - 1.9561995392714e-6*_cse25 + 1.8987869684628e-6*_cse29 + 1.14610355371469e-6*_cse31 + 1.8987869684628e-6*_cse33 + 1.14610355371469e-6*_cse35 - 0.45478971*_cse42 - 0.890598824*_cse44 - 0.45478971*_cse49 - 0.890598824*_cse51 + 2.75322908921405e-6*_cse9) + y*(0.470391945795628*_cse1*_cse4*_cse6 - 0.334218649384678*_cse21 + 0.334218649384678*_cse22*_cse24 - 0.324409654194476*_cse29 - 0.19581293936857*_cse31 - 0.324409654194476*_cse33 - 0.19581293936857*_cse35 + 0.403618758*_cse37*_cse43 - 0.213215245107779*_cse38 + 0.213215245107779*_cse39*_cse45 - 0.790154512*_cse42 + 0.403618758*_cse45*_cse50 - 0.790154512*_cse49 - 0.470391945795628*_cse9) + z*(-0.329365488408814*_cse10 + 0.234017800844203*_cse21 - 0.234017800844203*_cse25 + 0.227149603970304*_cse29 + 0.137106991283212*_cse31 + 0.227149603970304*_cse33 + 0.137106991283212*_cse35 + 0.410149995883665*_cse38 - 0.410879747*_cse42 + 0.209584432*_cse44 - 0.410149995883665*_cse46 - 0.410879747*_cse49 + 0.209584432*_cse51 + 0.329365488408814*_cse9) - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.227539183449751*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse11*_cse53 - _cse13*_cse52 - _cse14*_cse53 + 0.0439876856535455*_cse22*_cse55 + _cse26*_cse57 + _cse27*_cse55 + 0.01718495619792*_cse39*_cse68 + _cse40*_cse64 + 0.0050298*_cse41*_cse64 + _cse47*_cse68 + 0.0050298*_cse48*_cse68 - _cse52*_cse7 - 0.20503*_cse52 - 0.227539183449751*_cse54 - 0.0439876856535455*_cse58 - 0.0309919044627574*_cse59 - 0.0181297165934418*_cse60 - 0.0309919044627574*_cse61 - 0.0181297165934418*_cse62 - 0.01718495619792*_cse65 - 0.0019534*_cse66 - 0.0019534*_cse69 + x*(2.75322908921405e-6*_cse54 + 1.9561995392714e-6*_cse58 + 1.8987869684628e-6*_cse59 + 1.14610355371469e-6*_cse60 + 1.8987869684628e-6*_cse61 + 1.14610355371469e-6*_cse62 - 2.75322908921405e-6*_cse63 - 0.890598824*_cse66 - 1.9561995392714e-6*_cse67 - 0.890598824*_cse69 - 0.45478971*_cse70 - 0.45478971*_cse71) + y*(0.470391945795628*_cse0*_cse2*_cse8 + 0.334218649384678*_cse22*_cse55 + 0.213215245107779*_cse39*_cse68 + 0.403618758*_cse43*_cse64 + 0.403618758*_cse50*_cse68 - 0.470391945795628*_cse54 - 0.334218649384678*_cse58 - 0.324409654194476*_cse59 - 0.19581293936857*_cse60 - 0.324409654194476*_cse61 - 0.19581293936857*_cse62 - 0.213215245107779*_cse65 - 0.790154512*_cse70 - 0.790154512*_cse71) + z*(-0.410149995883665*_cse39*_cse68 + 0.329365488408814*_cse54 + 0.234017800844203*_cse58 + 0.227149603970304*_cse59 + 0.137106991283212*_cse60 + 0.227149603970304*_cse61 + 0.137106991283212*_cse62 - 0.329365488408814*_cse63 + 0.410149995883665*_cse65 + 0.209584432*_cse66 - 0.234017800844203*_cse67 + 0.209584432*_cse69 - 0.410879747*_cse70 - 0.410879747*_cse71) - 1.7324e-5
+    out[2, 0] = -_cse13*_cse4 + _cse14*_cse2 + 0.227539183449751*_cse18 + 0.227539183449751*_cse19 + 0.001950802*_cse2 + _cse26*_cse73 + _cse27*_cse75 - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + _cse40*_cse81 + _cse47*_cse85 + 0.0038906673398998*_cse72 - 0.0439876856535455*_cse74 + 0.0439876856535455*_cse76 - 0.0181297165934418*_cse77 - 0.0309919044627574*_cse78 - 0.0309919044627574*_cse79 - 0.0181297165934418*_cse80 - 0.01718495619792*_cse82 + 0.0050298*_cse83 - 0.0019534*_cse84 + 0.01718495619792*_cse86 + 0.0050298*_cse87 - 0.0019534*_cse88 + x*(1.9561995392714e-6*_cse15*_cse73 - 2.75322908921405e-6*_cse18 - 2.75322908921405e-6*_cse19 + 1.8987869684628e-6*_cse28*_cse75 + 1.14610355371469e-6*_cse30*_cse73 + 1.8987869684628e-6*_cse32*_cse73 + 1.14610355371469e-6*_cse34*_cse75 - 1.9561995392714e-6*_cse76 - 0.45478971*_cse83 - 0.890598824*_cse84 - 0.45478971*_cse87 - 0.890598824*_cse88) + y*(0.470391945795628*_cse2*_cse6 + 0.334218649384678*_cse22*_cse75 + 0.213215245107779*_cse39*_cse85 + 0.470391945795628*_cse4*_cse8 + 0.403618758*_cse43*_cse81 + 0.403618758*_cse50*_cse85 - 0.334218649384678*_cse74 - 0.19581293936857*_cse77 - 0.324409654194476*_cse78 - 0.324409654194476*_cse79 - 0.19581293936857*_cse80 - 0.213215245107779*_cse82 - 0.790154512*_cse83 - 0.790154512*_cse87) + z*(-0.329365488408814*_cse18 - 0.329365488408814*_cse19 + 0.234017800844203*_cse74 - 0.234017800844203*_cse76 + 0.137106991283212*_cse77 + 0.227149603970304*_cse78 + 0.227149603970304*_cse79 + 0.137106991283212*_cse80 + 0.410149995883665*_cse82 - 0.410879747*_cse83 + 0.209584432*_cse84 - 0.410149995883665*_cse86 - 0.410879747*_cse87 + 0.209584432*_cse88) + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# EE_J
+def function43(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = math.sin(q3)
+    _cse24 = 6.57617443000635e-7*_cse1
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse11*_cse25 - _cse24 + _cse25*_cse6
+    _cse27 = _cse23*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse23
+    _cse29 = -_cse28
+    _cse30 = _cse22*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse23
+    _cse32 = _cse26*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse23
+    _cse34 = _cse26*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse23
+    _cse36 = _cse22*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse23
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse23
+    _cse39 = -_cse38
+    _cse40 = math.sin(q4)
+    _cse41 = _cse0*_cse2
+    _cse42 = _cse41*_cse8
+    _cse43 = 0.000346321299837637*_cse10 + 0.517383113*_cse30 - 0.855753802*_cse32 + 0.517383113*_cse34 - 0.855753802*_cse36 - 0.000346321299837637*_cse42
+    _cse44 = _cse40*_cse43
+    _cse45 = math.cos(q4)
+    _cse46 = -0.78972966*_cse40 + 0.45479896*_cse45
+    _cse47 = 0.40329059*_cse40 + 0.89059413*_cse45
+    _cse48 = _cse43*_cse47
+    _cse49 = -0.012272*_cse40 - 0.00052974*_cse45
+    _cse50 = _cse19*_cse22
+    _cse51 = -0.818687841791724*_cse10 - 0.212878838804554*_cse27 + 0.758601438*_cse30 + 0.458851168*_cse32 + 0.758601438*_cse34 + 0.458851168*_cse36 + 0.818687841791724*_cse42 + 0.212878838804554*_cse50
+    _cse52 = 0.45479896*_cse40 + 0.78972966*_cse45
+    _cse53 = 0.89059413*_cse40 - 0.40329059*_cse45
+    _cse54 = _cse51*_cse53
+    _cse55 = 0.00052974*_cse40 - 0.012272*_cse45
+    _cse56 = -_cse55
+    _cse57 = _cse43*_cse46
+    _cse58 = _cse51*_cse52
+    _cse59 = 0.329365488408814*_cse10 + 0.234017800844203*_cse27 + 0.227149603970304*_cse30 + 0.137106991283212*_cse32 + 0.227149603970304*_cse34 + 0.137106991283212*_cse36 - 0.329365488408814*_cse42 + 0.410149995883665*_cse44 - 0.410149995883665*_cse45*_cse51 + 0.209584432*_cse48 - 0.234017800844203*_cse50 + 0.209584432*_cse54 - 0.410879747*_cse57 - 0.410879747*_cse58
+    _cse60 = _cse1*_cse2
+    _cse61 = _cse1*_cse4
+    _cse62 = 0.227539183449751*_cse1
+    _cse63 = _cse6*_cse62
+    _cse64 = _cse60*_cse8
+    _cse65 = 0.0038906673398998*_cse64
+    _cse66 = _cse5*_cse61
+    _cse67 = 0.0038906673398998*_cse66
+    _cse68 = _cse11*_cse62
+    _cse69 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse70 = _cse17*_cse60
+    _cse71 = _cse2*_cse8
+    _cse72 = _cse4*_cse5
+    _cse73 = _cse24*_cse71 - _cse24*_cse72
+    _cse74 = _cse19*_cse73
+    _cse75 = _cse20*_cse71 - _cse20*_cse72
+    _cse76 = _cse23*_cse75
+    _cse77 = _cse29*_cse73
+    _cse78 = _cse35*_cse73
+    _cse79 = _cse31*_cse75
+    _cse80 = _cse33*_cse75
+    _cse81 = 0.000346321299837637*_cse11
+    _cse82 = 0.000346321299837637*_cse6
+    _cse83 = _cse1*_cse81 + _cse1*_cse82
+    _cse84 = 0.517383113*_cse77 - 0.855753802*_cse78 - 0.855753802*_cse79 + 0.517383113*_cse80 + _cse83
+    _cse85 = _cse40*_cse84
+    _cse86 = _cse46*_cse84
+    _cse87 = _cse47*_cse84
+    _cse88 = 0.818687841791724*_cse6
+    _cse89 = _cse1*_cse88
+    _cse90 = 0.818687841791724*_cse11
+    _cse91 = _cse1*_cse90
+    _cse92 = 0.212878838804554*_cse74 - 0.212878838804554*_cse76 + 0.758601438*_cse77 + 0.458851168*_cse78 + 0.458851168*_cse79 + 0.758601438*_cse80 - _cse89 - _cse91
+    _cse93 = _cse45*_cse92
+    _cse94 = _cse52*_cse92
+    _cse95 = _cse53*_cse92
+    _cse96 = 2.75322908921405e-6*_cse1
+    _cse97 = _cse11*_cse96 + _cse6*_cse96
+    _cse98 = 0.470391945795628*_cse1
+    _cse99 = _cse6*_cse98
+    _cse100 = _cse11*_cse98
+    _cse101 = 0.329365488408814*_cse6
+    _cse102 = _cse1*_cse101
+    _cse103 = 0.329365488408814*_cse11
+    _cse104 = _cse1*_cse103
+    _cse105 = -_cse75
+    _cse106 = _cse105*_cse23
+    _cse107 = -_cse73
+    _cse108 = _cse107*_cse19
+    _cse109 = _cse105*_cse31
+    _cse110 = _cse105*_cse33
+    _cse111 = _cse107*_cse29
+    _cse112 = _cse107*_cse35
+    _cse113 = 0.517383113*_cse105*_cse33 + 0.517383113*_cse107*_cse29 - 0.855753802*_cse109 - 0.855753802*_cse112 - _cse83
+    _cse114 = _cse113*_cse40
+    _cse115 = _cse113*_cse46
+    _cse116 = _cse113*_cse47
+    _cse117 = -0.212878838804554*_cse106 + 0.212878838804554*_cse108 + 0.458851168*_cse109 + 0.758601438*_cse110 + 0.758601438*_cse111 + 0.458851168*_cse112 + _cse89 + _cse91
+    _cse118 = _cse117*_cse45
+    _cse119 = _cse117*_cse52
+    _cse120 = _cse117*_cse53
+    _cse121 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse122 = -_cse121
+    _cse123 = _cse122*_cse19
+    _cse124 = -0.999999998572139*_cse0 + _cse11*_cse24 + _cse24*_cse6
+    _cse125 = -_cse124
+    _cse126 = _cse125*_cse23
+    _cse127 = -_cse35
+    _cse128 = _cse122*_cse127
+    _cse129 = _cse125*_cse31
+    _cse130 = _cse122*_cse28
+    _cse131 = _cse125*_cse33
+    _cse132 = 0.517383113*_cse122*_cse28 + 0.517383113*_cse125*_cse33 - 0.855753802*_cse128 - 0.855753802*_cse129
+    _cse133 = _cse132*_cse40
+    _cse134 = _cse132*_cse46
+    _cse135 = _cse132*_cse47
+    _cse136 = -0.212878838804554*_cse123 - 0.212878838804554*_cse126 + 0.458851168*_cse128 + 0.458851168*_cse129 + 0.758601438*_cse130 + 0.758601438*_cse131
+    _cse137 = _cse136*_cse45
+    _cse138 = _cse136*_cse52
+    _cse139 = _cse136*_cse53
+    _cse140 = 0.000346321299837637*_cse64
+    _cse141 = 0.000346321299837637*_cse66
+    _cse142 = _cse125*_cse29
+    _cse143 = _cse122*_cse31
+    _cse144 = _cse122*_cse33
+    _cse145 = _cse125*_cse35
+    _cse146 = _cse140 - _cse141 + 0.517383113*_cse142 - 0.855753802*_cse143 + 0.517383113*_cse144 - 0.855753802*_cse145
+    _cse147 = _cse146*_cse45
+    _cse148 = -_cse53
+    _cse149 = _cse146*_cse148
+    _cse150 = -_cse52
+    _cse151 = _cse146*_cse150
+    _cse152 = 0.818687841791724*_cse64
+    _cse153 = 0.818687841791724*_cse66
+    _cse154 = 0.212878838804554*_cse23
+    _cse155 = 0.212878838804554*_cse19
+    _cse156 = -_cse122*_cse154 + _cse125*_cse155 + 0.758601438*_cse142 + 0.458851168*_cse143 + 0.758601438*_cse144 + 0.458851168*_cse145 - _cse152 + _cse153
+    _cse157 = _cse156*_cse40
+    _cse158 = _cse156*_cse46
+    _cse159 = _cse156*_cse47
+    _cse160 = _cse124*_cse19
+    _cse161 = _cse121*_cse23
+    _cse162 = _cse124*_cse29
+    _cse163 = _cse121*_cse31
+    _cse164 = _cse121*_cse33
+    _cse165 = _cse124*_cse35
+    _cse166 = -_cse140 + _cse141 + 0.517383113*_cse162 - 0.855753802*_cse163 + 0.517383113*_cse164 - 0.855753802*_cse165
+    _cse167 = _cse166*_cse40
+    _cse168 = _cse166*_cse46
+    _cse169 = _cse166*_cse47
+    _cse170 = -_cse121*_cse154 + _cse124*_cse155 + _cse152 - _cse153 + 0.758601438*_cse162 + 0.458851168*_cse163 + 0.758601438*_cse164 + 0.458851168*_cse165
+    _cse171 = _cse170*_cse45
+    _cse172 = _cse170*_cse52
+    _cse173 = _cse170*_cse53
+    _cse174 = 0.329365488408814*_cse64
+    _cse175 = 0.329365488408814*_cse66
+    _cse176 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse71
+    _cse177 = -_cse176
+    _cse178 = _cse177*_cse19
+    _cse179 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse25*_cse71
+    _cse180 = -_cse179
+    _cse181 = _cse180*_cse31
+    _cse182 = _cse177*_cse35
+    _cse183 = _cse0*_cse81 + _cse0*_cse82
+    _cse184 = 0.517383113*_cse177*_cse29 + 0.517383113*_cse180*_cse33 - 0.855753802*_cse181 - 0.855753802*_cse182 - _cse183
+    _cse185 = _cse184*_cse46
+    _cse186 = _cse0*_cse88
+    _cse187 = _cse0*_cse90
+    _cse188 = _cse180*_cse33
+    _cse189 = _cse177*_cse29
+    _cse190 = -_cse154*_cse180 + _cse155*_cse177 + 0.458851168*_cse181 + 0.458851168*_cse182 + _cse186 + _cse187 + 0.758601438*_cse188 + 0.758601438*_cse189
+    _cse191 = _cse190*_cse52
+    _cse192 = _cse184*_cse47
+    _cse193 = _cse190*_cse53
+    _cse194 = 2.75322908921405e-6*_cse0
+    _cse195 = _cse11*_cse194 + _cse194*_cse6
+    _cse196 = 0.470391945795628*_cse0
+    _cse197 = _cse196*_cse6
+    _cse198 = _cse11*_cse196
+    _cse199 = _cse180*_cse23
+    _cse200 = _cse184*_cse40
+    _cse201 = _cse0*_cse101
+    _cse202 = _cse0*_cse103
+    _cse203 = _cse190*_cse45
+    _cse204 = 0.227539183449751*_cse0
+    _cse205 = -0.0038906673398998*_cse10 + _cse11*_cse204 + _cse17*_cse41 + _cse204*_cse6 + 0.0038906673398998*_cse42
+    _cse206 = _cse179*_cse33
+    _cse207 = _cse176*_cse29
+    _cse208 = _cse179*_cse23
+    _cse209 = _cse179*_cse31
+    _cse210 = _cse176*_cse35
+    _cse211 = _cse176*_cse19
+    _cse212 = _cse183 + 0.517383113*_cse206 + 0.517383113*_cse207 - 0.855753802*_cse209 - 0.855753802*_cse210
+    _cse213 = _cse212*_cse46
+    _cse214 = -_cse154*_cse179 + _cse155*_cse176 - _cse186 - _cse187 + 0.758601438*_cse206 + 0.758601438*_cse207 + 0.458851168*_cse209 + 0.458851168*_cse210
+    _cse215 = _cse214*_cse52
+    _cse216 = _cse212*_cse47
+    _cse217 = _cse214*_cse53
+    _cse218 = _cse212*_cse40
+    _cse219 = _cse22*_cse23
+    _cse220 = _cse19*_cse26
+    _cse221 = _cse127*_cse26
+    _cse222 = _cse22*_cse31
+    _cse223 = _cse26*_cse28
+    _cse224 = _cse22*_cse33
+    _cse225 = 0.517383113*_cse22*_cse33 - 0.855753802*_cse221 - 0.855753802*_cse222 + 0.517383113*_cse26*_cse28
+    _cse226 = _cse225*_cse40
+    _cse227 = _cse225*_cse46
+    _cse228 = _cse225*_cse47
+    _cse229 = -_cse154*_cse22 - _cse155*_cse26 + 0.458851168*_cse221 + 0.458851168*_cse222 + 0.758601438*_cse223 + 0.758601438*_cse224
+    _cse230 = _cse229*_cse45
+    _cse231 = _cse229*_cse52
+    _cse232 = _cse229*_cse53
+    _cse233 = _cse43*_cse45
+    _cse234 = _cse148*_cse43
+    _cse235 = _cse150*_cse43
+    _cse236 = _cse40*_cse51
+    _cse237 = _cse46*_cse51
+    _cse238 = _cse47*_cse51
+    _cse239 = 0.227539183449751*_cse71
+    _cse240 = 0.227539183449751*_cse72
+    _cse241 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse242 = -_cse241
+    _cse243 = _cse23*_cse242
+    _cse244 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse245 = -_cse244
+    _cse246 = _cse19*_cse245
+    _cse247 = _cse242*_cse31
+    _cse248 = _cse242*_cse33
+    _cse249 = _cse245*_cse29
+    _cse250 = _cse245*_cse35
+    _cse251 = -0.000346321299837637*_cse71 + 0.000346321299837637*_cse72
+    _cse252 = 0.517383113*_cse242*_cse33 + 0.517383113*_cse245*_cse29 - 0.855753802*_cse247 - 0.855753802*_cse250 - _cse251
+    _cse253 = _cse252*_cse40
+    _cse254 = _cse252*_cse46
+    _cse255 = _cse252*_cse47
+    _cse256 = 0.818687841791724*_cse71
+    _cse257 = 0.818687841791724*_cse72
+    _cse258 = -_cse154*_cse242 + _cse155*_cse245 + 0.458851168*_cse247 + 0.758601438*_cse248 + 0.758601438*_cse249 + 0.458851168*_cse250 - _cse256 + _cse257
+    _cse259 = _cse258*_cse45
+    _cse260 = _cse258*_cse52
+    _cse261 = _cse258*_cse53
+    _cse262 = 2.75322908921405e-6*_cse71
+    _cse263 = 2.75322908921405e-6*_cse72
+    _cse264 = 0.470391945795628*_cse71
+    _cse265 = 0.470391945795628*_cse72
+    _cse266 = 0.329365488408814*_cse71
+    _cse267 = 0.329365488408814*_cse72
+    _cse268 = _cse19*_cse244
+    _cse269 = _cse23*_cse241
+    _cse270 = _cse244*_cse29
+    _cse271 = _cse244*_cse35
+    _cse272 = _cse241*_cse31
+    _cse273 = _cse241*_cse33
+    _cse274 = _cse251 + 0.517383113*_cse270 - 0.855753802*_cse271 - 0.855753802*_cse272 + 0.517383113*_cse273
+    _cse275 = _cse274*_cse40
+    _cse276 = _cse274*_cse46
+    _cse277 = _cse274*_cse47
+    _cse278 = -_cse154*_cse241 + _cse155*_cse244 + _cse256 - _cse257 + 0.758601438*_cse270 + 0.458851168*_cse271 + 0.458851168*_cse272 + 0.758601438*_cse273
+    _cse279 = _cse278*_cse45
+    _cse280 = _cse278*_cse52
+    _cse281 = _cse278*_cse53
+    _cse282 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse71
+    _cse283 = _cse19*_cse282
+    _cse284 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse71
+    _cse285 = _cse23*_cse284
+    _cse286 = _cse127*_cse282
+    _cse287 = _cse28*_cse282
+    _cse288 = _cse284*_cse31
+    _cse289 = _cse284*_cse33
+    _cse290 = 0.517383113*_cse28*_cse282 + 0.517383113*_cse284*_cse33 - 0.855753802*_cse286 - 0.855753802*_cse288
+    _cse291 = _cse290*_cse40
+    _cse292 = _cse290*_cse46
+    _cse293 = _cse290*_cse47
+    _cse294 = -_cse154*_cse284 - _cse155*_cse282 + 0.458851168*_cse286 + 0.758601438*_cse287 + 0.458851168*_cse288 + 0.758601438*_cse289
+    _cse295 = _cse294*_cse45
+    _cse296 = _cse294*_cse52
+    _cse297 = _cse294*_cse53
+    _cse298 = _cse282*_cse31
+    _cse299 = _cse284*_cse35
+    _cse300 = 0.517383113*_cse282*_cse33 + 0.517383113*_cse284*_cse29 - 0.855753802*_cse298 - 0.855753802*_cse299 - _cse81 - _cse82
+    _cse301 = _cse300*_cse45
+    _cse302 = _cse148*_cse300
+    _cse303 = _cse150*_cse300
+    _cse304 = _cse282*_cse33
+    _cse305 = _cse284*_cse29
+    _cse306 = -_cse154*_cse282 + _cse155*_cse284 + 0.458851168*_cse298 + 0.458851168*_cse299 + 0.758601438*_cse304 + 0.758601438*_cse305 + _cse88 + _cse90
+    _cse307 = _cse306*_cse40
+    _cse308 = _cse306*_cse46
+    _cse309 = _cse306*_cse47
+    _cse310 = _cse122*_cse23
+    _cse311 = _cse125*_cse19
+    _cse312 = 0.410149995883665*_cse40
+    _cse313 = 0.410879747*_cse46
+    _cse314 = 0.209584432*_cse47
+    _cse315 = 0.410149995883665*_cse45
+    _cse316 = 0.410879747*_cse52
+    _cse317 = 0.209584432*_cse53
+    _cse318 = _cse23*_cse282
+    _cse319 = _cse19*_cse284
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.227539183449751*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.227539183449751*_cse10 + 0.0439876856535455*_cse19*_cse22 + _cse22*_cse39 + _cse26*_cse37 - 0.0439876856535455*_cse27 - 0.0309919044627574*_cse30 - 0.0181297165934418*_cse32 - 0.0309919044627574*_cse34 - 0.0181297165934418*_cse36 + 0.0050298*_cse43*_cse46 + _cse43*_cse49 - 0.01718495619792*_cse44 + 0.01718495619792*_cse45*_cse51 - 0.0019534*_cse48 + 0.0050298*_cse51*_cse52 + _cse51*_cse56 - 0.0019534*_cse54 + _cse59*z + x*(2.75322908921405e-6*_cse10 + 1.9561995392714e-6*_cse27 + 1.8987869684628e-6*_cse30 + 1.14610355371469e-6*_cse32 + 1.8987869684628e-6*_cse34 + 1.14610355371469e-6*_cse36 - 2.75322908921405e-6*_cse42 - 0.890598824*_cse48 - 1.9561995392714e-6*_cse50 - 0.890598824*_cse54 - 0.45478971*_cse57 - 0.45478971*_cse58) + y*(0.470391945795628*_cse0*_cse2*_cse8 - 0.470391945795628*_cse10 + 0.334218649384678*_cse19*_cse22 - 0.334218649384678*_cse27 - 0.324409654194476*_cse30 - 0.19581293936857*_cse32 - 0.324409654194476*_cse34 - 0.19581293936857*_cse36 + 0.403618758*_cse43*_cse47 - 0.213215245107779*_cse44 + 0.213215245107779*_cse45*_cse51 + 0.403618758*_cse51*_cse53 - 0.790154512*_cse57 - 0.790154512*_cse58)
+    out[0, 1] = -_cse1*_cse69 + _cse15*_cse61 + _cse37*_cse75 + _cse39*_cse73 + _cse49*_cse84 + _cse56*_cse92 + 1.098e-6*_cse60 + 0.20503*_cse61 - _cse63 - _cse65 + _cse67 - _cse68 - _cse70 + 0.0439876856535455*_cse74 - 0.0439876856535455*_cse76 - 0.0309919044627574*_cse77 - 0.0181297165934418*_cse78 - 0.0181297165934418*_cse79 - 0.0309919044627574*_cse80 - 0.01718495619792*_cse85 + 0.0050298*_cse86 - 0.0019534*_cse87 + 0.01718495619792*_cse93 + 0.0050298*_cse94 - 0.0019534*_cse95 + x*(-1.9561995392714e-6*_cse74 + 1.9561995392714e-6*_cse76 + 1.8987869684628e-6*_cse77 + 1.14610355371469e-6*_cse78 + 1.14610355371469e-6*_cse79 + 1.8987869684628e-6*_cse80 - 0.45478971*_cse86 - 0.890598824*_cse87 - 0.45478971*_cse94 - 0.890598824*_cse95 + _cse97) + y*(-_cse100 + 0.334218649384678*_cse19*_cse73 + 0.213215245107779*_cse45*_cse92 + 0.403618758*_cse47*_cse84 + 0.403618758*_cse53*_cse92 - 0.334218649384678*_cse76 - 0.324409654194476*_cse77 - 0.19581293936857*_cse78 - 0.19581293936857*_cse79 - 0.324409654194476*_cse80 - 0.213215245107779*_cse85 - 0.790154512*_cse86 - 0.790154512*_cse94 - _cse99) + z*(_cse102 + _cse104 - 0.234017800844203*_cse74 + 0.234017800844203*_cse76 + 0.227149603970304*_cse77 + 0.137106991283212*_cse78 + 0.137106991283212*_cse79 + 0.227149603970304*_cse80 + 0.410149995883665*_cse85 - 0.410879747*_cse86 + 0.209584432*_cse87 - 0.410149995883665*_cse93 - 0.410879747*_cse94 + 0.209584432*_cse95)
+    out[0, 2] = _cse105*_cse37 - 0.0439876856535455*_cse106 + _cse107*_cse39 + 0.0439876856535455*_cse108 - 0.0181297165934418*_cse109 - 0.0309919044627574*_cse110 - 0.0309919044627574*_cse111 - 0.0181297165934418*_cse112 + _cse113*_cse49 - 0.01718495619792*_cse114 + 0.0050298*_cse115 - 0.0019534*_cse116 + _cse117*_cse56 + 0.01718495619792*_cse118 + 0.0050298*_cse119 - 0.0019534*_cse120 + _cse14*_cse61 + _cse63 + _cse65 - _cse67 + _cse68 + _cse70 + x*(1.9561995392714e-6*_cse105*_cse23 + 1.14610355371469e-6*_cse105*_cse31 + 1.8987869684628e-6*_cse105*_cse33 + 1.8987869684628e-6*_cse107*_cse29 + 1.14610355371469e-6*_cse107*_cse35 - 1.9561995392714e-6*_cse108 - 0.45478971*_cse115 - 0.890598824*_cse116 - 0.45478971*_cse119 - 0.890598824*_cse120 - _cse97) + y*(_cse100 - 0.334218649384678*_cse106 + 0.334218649384678*_cse107*_cse19 - 0.19581293936857*_cse109 - 0.324409654194476*_cse110 - 0.324409654194476*_cse111 - 0.19581293936857*_cse112 + 0.403618758*_cse113*_cse47 - 0.213215245107779*_cse114 - 0.790154512*_cse115 + 0.213215245107779*_cse117*_cse45 + 0.403618758*_cse117*_cse53 - 0.790154512*_cse119 + _cse99) + z*(-_cse102 - _cse104 + 0.234017800844203*_cse106 - 0.234017800844203*_cse108 + 0.137106991283212*_cse109 + 0.227149603970304*_cse110 + 0.227149603970304*_cse111 + 0.137106991283212*_cse112 + 0.410149995883665*_cse114 - 0.410879747*_cse115 + 0.209584432*_cse116 - 0.410149995883665*_cse118 - 0.410879747*_cse119 + 0.209584432*_cse120)
+    out[0, 3] = _cse122*_cse38 - 0.0439876856535455*_cse123 + _cse125*_cse37 - 0.0439876856535455*_cse126 - 0.0181297165934418*_cse128 - 0.0181297165934418*_cse129 - 0.0309919044627574*_cse130 - 0.0309919044627574*_cse131 + _cse132*_cse49 - 0.01718495619792*_cse133 + 0.0050298*_cse134 - 0.0019534*_cse135 + _cse136*_cse56 + 0.01718495619792*_cse137 + 0.0050298*_cse138 - 0.0019534*_cse139 + x*(1.9561995392714e-6*_cse123 + 1.9561995392714e-6*_cse126 + 1.14610355371469e-6*_cse128 + 1.14610355371469e-6*_cse129 + 1.8987869684628e-6*_cse130 + 1.8987869684628e-6*_cse131 - 0.45478971*_cse134 - 0.890598824*_cse135 - 0.45478971*_cse138 - 0.890598824*_cse139) + y*(-0.334218649384678*_cse123 - 0.334218649384678*_cse126 - 0.19581293936857*_cse128 - 0.19581293936857*_cse129 - 0.324409654194476*_cse130 - 0.324409654194476*_cse131 + 0.403618758*_cse132*_cse47 - 0.213215245107779*_cse133 - 0.790154512*_cse134 + 0.213215245107779*_cse136*_cse45 + 0.403618758*_cse136*_cse53 - 0.790154512*_cse138) + z*(0.234017800844203*_cse123 + 0.234017800844203*_cse126 + 0.137106991283212*_cse128 + 0.137106991283212*_cse129 + 0.227149603970304*_cse130 + 0.227149603970304*_cse131 + 0.410149995883665*_cse133 - 0.410879747*_cse134 + 0.209584432*_cse135 - 0.410149995883665*_cse137 - 0.410879747*_cse138 + 0.209584432*_cse139)
+    out[0, 4] = _cse146*_cse55 - 0.01718495619792*_cse147 - 0.0019534*_cse149 + 0.0050298*_cse151 + _cse156*_cse49 - 0.01718495619792*_cse157 + 0.0050298*_cse158 - 0.0019534*_cse159 + x*(-0.890598824*_cse149 - 0.45478971*_cse151 - 0.45478971*_cse158 - 0.890598824*_cse159) + y*(0.403618758*_cse146*_cse148 - 0.213215245107779*_cse147 - 0.790154512*_cse151 + 0.403618758*_cse156*_cse47 - 0.213215245107779*_cse157 - 0.790154512*_cse158) + z*(0.410149995883665*_cse147 + 0.209584432*_cse149 - 0.410879747*_cse151 + 0.410149995883665*_cse157 - 0.410879747*_cse158 + 0.209584432*_cse159)
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 + _cse121*_cse37 + _cse124*_cse39 + 0.0439876856535455*_cse160 - 0.0439876856535455*_cse161 - 0.0309919044627574*_cse162 - 0.0181297165934418*_cse163 - 0.0309919044627574*_cse164 - 0.0181297165934418*_cse165 + _cse166*_cse49 - 0.01718495619792*_cse167 + 0.0050298*_cse168 - 0.0019534*_cse169 + _cse170*_cse56 + 0.01718495619792*_cse171 + 0.0050298*_cse172 - 0.0019534*_cse173 + 0.227539183449751*_cse64 - 0.227539183449751*_cse66 + x*(-1.9561995392714e-6*_cse160 + 1.9561995392714e-6*_cse161 + 1.8987869684628e-6*_cse162 + 1.14610355371469e-6*_cse163 + 1.8987869684628e-6*_cse164 + 1.14610355371469e-6*_cse165 - 0.45478971*_cse168 - 0.890598824*_cse169 - 0.45478971*_cse172 - 0.890598824*_cse173 - 2.75322908921405e-6*_cse64 + 2.75322908921405e-6*_cse66) + y*(0.470391945795628*_cse1*_cse2*_cse8 + 0.334218649384678*_cse124*_cse19 - 0.334218649384678*_cse161 - 0.324409654194476*_cse162 - 0.19581293936857*_cse163 - 0.324409654194476*_cse164 - 0.19581293936857*_cse165 + 0.403618758*_cse166*_cse47 - 0.213215245107779*_cse167 - 0.790154512*_cse168 + 0.213215245107779*_cse170*_cse45 + 0.403618758*_cse170*_cse53 - 0.790154512*_cse172 - 0.470391945795628*_cse66) + z*(-0.234017800844203*_cse160 + 0.234017800844203*_cse161 + 0.227149603970304*_cse162 + 0.137106991283212*_cse163 + 0.227149603970304*_cse164 + 0.137106991283212*_cse165 + 0.410149995883665*_cse167 - 0.410879747*_cse168 + 0.209584432*_cse169 - 0.410149995883665*_cse171 - 0.410879747*_cse172 + 0.209584432*_cse173 - _cse174 + _cse175)
+    out[1, 1] = _cse0*_cse69 - _cse15*_cse9 + _cse177*_cse39 + 0.0439876856535455*_cse178 + _cse180*_cse37 - 0.0181297165934418*_cse181 - 0.0181297165934418*_cse182 + _cse184*_cse49 + 0.0050298*_cse185 - 0.0309919044627574*_cse188 - 0.0309919044627574*_cse189 + _cse190*_cse56 + 0.0050298*_cse191 - 0.0019534*_cse192 - 0.0019534*_cse193 - 0.0439876856535455*_cse199 - 0.01718495619792*_cse200 + 0.01718495619792*_cse203 + _cse205 - 1.098e-6*_cse41 - 0.20503*_cse9 + x*(1.8987869684628e-6*_cse177*_cse29 + 1.14610355371469e-6*_cse177*_cse35 - 1.9561995392714e-6*_cse178 + 1.9561995392714e-6*_cse180*_cse23 + 1.14610355371469e-6*_cse180*_cse31 + 1.8987869684628e-6*_cse180*_cse33 - 0.45478971*_cse185 - 0.45478971*_cse191 - 0.890598824*_cse192 - 0.890598824*_cse193 - _cse195) + y*(0.334218649384678*_cse177*_cse19 - 0.19581293936857*_cse181 - 0.19581293936857*_cse182 + 0.403618758*_cse184*_cse47 - 0.790154512*_cse185 - 0.324409654194476*_cse188 - 0.324409654194476*_cse189 + 0.213215245107779*_cse190*_cse45 + 0.403618758*_cse190*_cse53 - 0.790154512*_cse191 + _cse197 + _cse198 - 0.334218649384678*_cse199 - 0.213215245107779*_cse200) + z*(-0.234017800844203*_cse178 + 0.137106991283212*_cse181 + 0.137106991283212*_cse182 - 0.410879747*_cse185 + 0.227149603970304*_cse188 + 0.227149603970304*_cse189 - 0.410879747*_cse191 + 0.209584432*_cse192 + 0.209584432*_cse193 + 0.234017800844203*_cse199 + 0.410149995883665*_cse200 - _cse201 - _cse202 - 0.410149995883665*_cse203)
+    out[1, 2] = -_cse14*_cse9 + 0.0439876856535455*_cse176*_cse19 + _cse176*_cse39 + _cse179*_cse37 - _cse205 - 0.0309919044627574*_cse206 - 0.0309919044627574*_cse207 - 0.0439876856535455*_cse208 - 0.0181297165934418*_cse209 - 0.0181297165934418*_cse210 + 0.0050298*_cse212*_cse46 + _cse212*_cse49 + 0.01718495619792*_cse214*_cse45 + 0.0050298*_cse214*_cse52 + _cse214*_cse56 - 0.0019534*_cse216 - 0.0019534*_cse217 - 0.01718495619792*_cse218 + x*(_cse195 + 1.8987869684628e-6*_cse206 + 1.8987869684628e-6*_cse207 + 1.9561995392714e-6*_cse208 + 1.14610355371469e-6*_cse209 + 1.14610355371469e-6*_cse210 - 1.9561995392714e-6*_cse211 - 0.45478971*_cse213 - 0.45478971*_cse215 - 0.890598824*_cse216 - 0.890598824*_cse217) + y*(0.334218649384678*_cse176*_cse19 - _cse197 - _cse198 - 0.324409654194476*_cse206 - 0.324409654194476*_cse207 - 0.334218649384678*_cse208 - 0.19581293936857*_cse209 - 0.19581293936857*_cse210 + 0.403618758*_cse212*_cse47 - 0.790154512*_cse213 + 0.213215245107779*_cse214*_cse45 + 0.403618758*_cse214*_cse53 - 0.790154512*_cse215 - 0.213215245107779*_cse218) + z*(_cse201 + _cse202 + 0.227149603970304*_cse206 + 0.227149603970304*_cse207 + 0.234017800844203*_cse208 + 0.137106991283212*_cse209 + 0.137106991283212*_cse210 - 0.234017800844203*_cse211 - 0.410879747*_cse213 - 0.410149995883665*_cse214*_cse45 - 0.410879747*_cse215 + 0.209584432*_cse216 + 0.209584432*_cse217 + 0.410149995883665*_cse218)
+    out[1, 3] = -0.0439876856535455*_cse219 + _cse22*_cse37 - 0.0439876856535455*_cse220 - 0.0181297165934418*_cse221 - 0.0181297165934418*_cse222 - 0.0309919044627574*_cse223 - 0.0309919044627574*_cse224 + _cse225*_cse49 - 0.01718495619792*_cse226 + 0.0050298*_cse227 - 0.0019534*_cse228 + _cse229*_cse56 + 0.01718495619792*_cse230 + 0.0050298*_cse231 - 0.0019534*_cse232 + _cse26*_cse38 + x*(1.9561995392714e-6*_cse219 + 1.9561995392714e-6*_cse220 + 1.14610355371469e-6*_cse221 + 1.14610355371469e-6*_cse222 + 1.8987869684628e-6*_cse223 + 1.8987869684628e-6*_cse224 - 0.45478971*_cse227 - 0.890598824*_cse228 - 0.45478971*_cse231 - 0.890598824*_cse232) + y*(-0.334218649384678*_cse219 - 0.334218649384678*_cse220 - 0.19581293936857*_cse221 - 0.19581293936857*_cse222 - 0.324409654194476*_cse223 - 0.324409654194476*_cse224 + 0.403618758*_cse225*_cse47 - 0.213215245107779*_cse226 - 0.790154512*_cse227 + 0.213215245107779*_cse229*_cse45 + 0.403618758*_cse229*_cse53 - 0.790154512*_cse231) + z*(0.234017800844203*_cse219 + 0.234017800844203*_cse220 + 0.137106991283212*_cse221 + 0.137106991283212*_cse222 + 0.227149603970304*_cse223 + 0.227149603970304*_cse224 + 0.410149995883665*_cse226 - 0.410879747*_cse227 + 0.209584432*_cse228 - 0.410149995883665*_cse230 - 0.410879747*_cse231 + 0.209584432*_cse232)
+    out[1, 4] = -0.01718495619792*_cse233 - 0.0019534*_cse234 + 0.0050298*_cse235 - 0.01718495619792*_cse236 + 0.0050298*_cse237 - 0.0019534*_cse238 + _cse43*_cse55 + _cse49*_cse51 + x*(-0.890598824*_cse234 - 0.45478971*_cse235 - 0.45478971*_cse237 - 0.890598824*_cse238) + y*(0.403618758*_cse148*_cse43 - 0.213215245107779*_cse233 - 0.790154512*_cse235 - 0.213215245107779*_cse236 - 0.790154512*_cse237 + 0.403618758*_cse47*_cse51) + z*(0.410149995883665*_cse233 + 0.209584432*_cse234 - 0.410879747*_cse235 + 0.410149995883665*_cse236 - 0.410879747*_cse237 + 0.209584432*_cse238)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse12 + _cse16 + _cse18 + 0.41405*_cse2 - _cse239 + _cse240 + _cse242*_cse37 - 0.0439876856535455*_cse243 + _cse245*_cse39 + 0.0439876856535455*_cse246 - 0.0181297165934418*_cse247 - 0.0309919044627574*_cse248 - 0.0309919044627574*_cse249 - 0.0181297165934418*_cse250 + _cse252*_cse49 - 0.01718495619792*_cse253 + 0.0050298*_cse254 - 0.0019534*_cse255 + _cse258*_cse56 + 0.01718495619792*_cse259 + 0.0050298*_cse260 - 0.0019534*_cse261 + 0.001950802*_cse4 + _cse7 + x*(1.9561995392714e-6*_cse243 - 1.9561995392714e-6*_cse246 + 1.14610355371469e-6*_cse247 + 1.8987869684628e-6*_cse248 + 1.8987869684628e-6*_cse249 + 1.14610355371469e-6*_cse250 - 0.45478971*_cse254 - 0.890598824*_cse255 - 0.45478971*_cse260 - 0.890598824*_cse261 + _cse262 - _cse263) + y*(0.334218649384678*_cse19*_cse245 - 0.334218649384678*_cse243 - 0.19581293936857*_cse247 - 0.324409654194476*_cse248 - 0.324409654194476*_cse249 - 0.19581293936857*_cse250 + 0.403618758*_cse252*_cse47 - 0.213215245107779*_cse253 - 0.790154512*_cse254 + 0.213215245107779*_cse258*_cse45 + 0.403618758*_cse258*_cse53 - 0.790154512*_cse260 - _cse264 + _cse265) + z*(0.234017800844203*_cse243 - 0.234017800844203*_cse246 + 0.137106991283212*_cse247 + 0.227149603970304*_cse248 + 0.227149603970304*_cse249 + 0.137106991283212*_cse250 + 0.410149995883665*_cse253 - 0.410879747*_cse254 + 0.209584432*_cse255 - 0.410149995883665*_cse259 - 0.410879747*_cse260 + 0.209584432*_cse261 + _cse266 - _cse267)
+    out[2, 2] = -_cse12 + _cse14*_cse2 - _cse18 + _cse239 - _cse240 + _cse241*_cse37 + _cse244*_cse39 + 0.0439876856535455*_cse268 - 0.0439876856535455*_cse269 - 0.0309919044627574*_cse270 - 0.0181297165934418*_cse271 - 0.0181297165934418*_cse272 - 0.0309919044627574*_cse273 + _cse274*_cse49 - 0.01718495619792*_cse275 + 0.0050298*_cse276 - 0.0019534*_cse277 + _cse278*_cse56 + 0.01718495619792*_cse279 + 0.0050298*_cse280 - 0.0019534*_cse281 - _cse7 + x*(-_cse262 + _cse263 - 1.9561995392714e-6*_cse268 + 1.9561995392714e-6*_cse269 + 1.8987869684628e-6*_cse270 + 1.14610355371469e-6*_cse271 + 1.14610355371469e-6*_cse272 + 1.8987869684628e-6*_cse273 - 0.45478971*_cse276 - 0.890598824*_cse277 - 0.45478971*_cse280 - 0.890598824*_cse281) + y*(0.334218649384678*_cse19*_cse244 + _cse264 - _cse265 - 0.334218649384678*_cse269 - 0.324409654194476*_cse270 - 0.19581293936857*_cse271 - 0.19581293936857*_cse272 - 0.324409654194476*_cse273 + 0.403618758*_cse274*_cse47 - 0.213215245107779*_cse275 - 0.790154512*_cse276 + 0.213215245107779*_cse278*_cse45 + 0.403618758*_cse278*_cse53 - 0.790154512*_cse280) + z*(-_cse266 + _cse267 - 0.234017800844203*_cse268 + 0.234017800844203*_cse269 + 0.227149603970304*_cse270 + 0.137106991283212*_cse271 + 0.137106991283212*_cse272 + 0.227149603970304*_cse273 + 0.410149995883665*_cse275 - 0.410879747*_cse276 + 0.209584432*_cse277 - 0.410149995883665*_cse279 - 0.410879747*_cse280 + 0.209584432*_cse281)
+    out[2, 3] = _cse282*_cse38 - 0.0439876856535455*_cse283 + _cse284*_cse37 - 0.0439876856535455*_cse285 - 0.0181297165934418*_cse286 - 0.0309919044627574*_cse287 - 0.0181297165934418*_cse288 - 0.0309919044627574*_cse289 + _cse290*_cse49 - 0.01718495619792*_cse291 + 0.0050298*_cse292 - 0.0019534*_cse293 + _cse294*_cse56 + 0.01718495619792*_cse295 + 0.0050298*_cse296 - 0.0019534*_cse297 + x*(1.9561995392714e-6*_cse283 + 1.9561995392714e-6*_cse285 + 1.14610355371469e-6*_cse286 + 1.8987869684628e-6*_cse287 + 1.14610355371469e-6*_cse288 + 1.8987869684628e-6*_cse289 - 0.45478971*_cse292 - 0.890598824*_cse293 - 0.45478971*_cse296 - 0.890598824*_cse297) + y*(-0.334218649384678*_cse283 - 0.334218649384678*_cse285 - 0.19581293936857*_cse286 - 0.324409654194476*_cse287 - 0.19581293936857*_cse288 - 0.324409654194476*_cse289 + 0.403618758*_cse290*_cse47 - 0.213215245107779*_cse291 - 0.790154512*_cse292 + 0.213215245107779*_cse294*_cse45 + 0.403618758*_cse294*_cse53 - 0.790154512*_cse296) + z*(0.234017800844203*_cse283 + 0.234017800844203*_cse285 + 0.137106991283212*_cse286 + 0.227149603970304*_cse287 + 0.137106991283212*_cse288 + 0.227149603970304*_cse289 + 0.410149995883665*_cse291 - 0.410879747*_cse292 + 0.209584432*_cse293 - 0.410149995883665*_cse295 - 0.410879747*_cse296 + 0.209584432*_cse297)
+    out[2, 4] = _cse300*_cse55 - 0.01718495619792*_cse301 - 0.0019534*_cse302 + 0.0050298*_cse303 + _cse306*_cse49 - 0.01718495619792*_cse307 + 0.0050298*_cse308 - 0.0019534*_cse309 + x*(-0.890598824*_cse302 - 0.45478971*_cse303 - 0.45478971*_cse308 - 0.890598824*_cse309) + y*(0.403618758*_cse148*_cse300 - 0.213215245107779*_cse301 - 0.790154512*_cse303 + 0.403618758*_cse306*_cse47 - 0.213215245107779*_cse307 - 0.790154512*_cse308) + z*(0.410149995883665*_cse301 + 0.209584432*_cse302 - 0.410879747*_cse303 + 0.410149995883665*_cse307 - 0.410879747*_cse308 + 0.209584432*_cse309)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse64 - _cse66
+    out[3, 4] = 0.3960285*_cse142 + 0.239041914*_cse143 + 0.3960285*_cse144 + 0.239041914*_cse145 + 0.408002994597976*_cse310 - 0.408002994597976*_cse311 + 0.574238819026787*_cse64 - 0.574238819026787*_cse66
+    out[3, 5] = 0.227149603970304*_cse142 + 0.137106991283212*_cse143 + 0.227149603970304*_cse144 + 0.137106991283212*_cse145 + _cse146*_cse312 - _cse146*_cse313 + _cse146*_cse314 - _cse156*_cse315 - _cse156*_cse316 + _cse156*_cse317 + _cse174 - _cse175 + 0.234017800844203*_cse310 - 0.234017800844203*_cse311
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse42
+    out[4, 4] = 0.574238819026787*_cse10 + 0.408002994597976*_cse27 + 0.3960285*_cse30 + 0.239041914*_cse32 + 0.3960285*_cse34 + 0.239041914*_cse36 - 0.574238819026787*_cse42 - 0.408002994597976*_cse50
+    out[4, 5] = _cse59
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + 0.239041914*_cse298 + 0.239041914*_cse299 + 0.3960285*_cse304 + 0.3960285*_cse305 + 0.408002994597976*_cse318 - 0.408002994597976*_cse319 - 0.574238819026787*_cse6
+    out[5, 5] = -_cse101 - _cse103 + 0.137106991283212*_cse298 + 0.137106991283212*_cse299 + _cse300*_cse312 - _cse300*_cse313 + _cse300*_cse314 + 0.227149603970304*_cse304 + 0.227149603970304*_cse305 - _cse306*_cse315 - _cse306*_cse316 + _cse306*_cse317 + 0.234017800844203*_cse318 - 0.234017800844203*_cse319
+    return out
+
+
+# EE_dJ
+def function44(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q4)
+    _cse1 = math.cos(q0)
+    _cse2 = 6.57617443000635e-7*_cse1
+    _cse3 = math.sin(q0)
+    _cse4 = 0.999999998572139*_cse3
+    _cse5 = math.sin(q1)
+    _cse6 = math.sin(q2)
+    _cse7 = _cse5*_cse6
+    _cse8 = math.cos(q1)
+    _cse9 = math.cos(q2)
+    _cse10 = _cse8*_cse9
+    _cse11 = _cse10*_cse4 + _cse4*_cse7
+    _cse12 = _cse11 - _cse2
+    _cse13 = math.sin(q3)
+    _cse14 = math.cos(q3)
+    _cse15 = 0.75940555*_cse13 - 0.51802699*_cse14
+    _cse16 = _cse12*_cse15
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = 6.57617443000635e-7*_cse3
+    _cse19 = _cse10*_cse18 + _cse18*_cse7
+    _cse20 = _cse17 + _cse19
+    _cse21 = 0.51802699*_cse13 + 0.75940555*_cse14
+    _cse22 = -_cse21
+    _cse23 = _cse20*_cse22
+    _cse24 = 0.45991232*_cse13 + 0.85536427*_cse14
+    _cse25 = _cse12*_cse24
+    _cse26 = 0.85536427*_cse13 - 0.45991232*_cse14
+    _cse27 = _cse20*_cse26
+    _cse28 = _cse6*_cse8
+    _cse29 = 0.000346321299837637*_cse28
+    _cse30 = _cse29*_cse3
+    _cse31 = _cse5*_cse9
+    _cse32 = 0.000346321299837637*_cse31
+    _cse33 = _cse3*_cse32
+    _cse34 = _cse30 - _cse33
+    _cse35 = 0.517383113*_cse16 + 0.517383113*_cse23 - 0.855753802*_cse25 - 0.855753802*_cse27 + _cse34
+    _cse36 = _cse0*_cse35
+    _cse37 = math.sin(q4)
+    _cse38 = -0.012272*_cse0 + 0.00052974*_cse37
+    _cse39 = -0.40329059*_cse0 + 0.89059413*_cse37
+    _cse40 = -_cse39
+    _cse41 = _cse35*_cse40
+    _cse42 = 0.78972966*_cse0 + 0.45479896*_cse37
+    _cse43 = -_cse42
+    _cse44 = _cse35*_cse43
+    _cse45 = 0.212878838804554*_cse14
+    _cse46 = _cse20*_cse45
+    _cse47 = 0.212878838804554*_cse13
+    _cse48 = _cse12*_cse47
+    _cse49 = 0.818687841791724*_cse31
+    _cse50 = _cse3*_cse49
+    _cse51 = 0.818687841791724*_cse28
+    _cse52 = _cse3*_cse51
+    _cse53 = _cse50 - _cse52
+    _cse54 = 0.758601438*_cse16 + 0.758601438*_cse23 + 0.458851168*_cse25 + 0.458851168*_cse27 + _cse46 - _cse48 + _cse53
+    _cse55 = _cse37*_cse54
+    _cse56 = 0.00052974*_cse0 + 0.012272*_cse37
+    _cse57 = -_cse56
+    _cse58 = -0.45479896*_cse0 + 0.78972966*_cse37
+    _cse59 = -_cse58
+    _cse60 = _cse54*_cse59
+    _cse61 = 0.89059413*_cse0 + 0.40329059*_cse37
+    _cse62 = _cse54*_cse61
+    _cse63 = 0.410149995883665*_cse36 + 0.209584432*_cse41 - 0.410879747*_cse44 + 0.410149995883665*_cse55 - 0.410879747*_cse60 + 0.209584432*_cse62
+    _cse64 = _cse35*_cse38 - 0.01718495619792*_cse36 - 0.0019534*_cse41 + 0.0050298*_cse44 + _cse54*_cse57 - 0.01718495619792*_cse55 + 0.0050298*_cse60 - 0.0019534*_cse62 + _cse63*z + x*(-0.890598824*_cse41 - 0.45478971*_cse44 - 0.45478971*_cse60 - 0.890598824*_cse62) + y*(0.403618758*_cse35*_cse40 - 0.213215245107779*_cse36 - 0.790154512*_cse44 + 0.403618758*_cse54*_cse61 - 0.213215245107779*_cse55 - 0.790154512*_cse60)
+    _cse65 = -0.999999998572139*_cse3*_cse6*_cse8 + _cse31*_cse4
+    _cse66 = _cse15*_cse65
+    _cse67 = _cse18*_cse31 - 6.57617443000635e-7*_cse3*_cse6*_cse8
+    _cse68 = _cse22*_cse67
+    _cse69 = _cse13*_cse65
+    _cse70 = _cse24*_cse65
+    _cse71 = _cse26*_cse67
+    _cse72 = _cse14*_cse67
+    _cse73 = _cse3*_cse8
+    _cse74 = _cse73*_cse9
+    _cse75 = _cse3*_cse5
+    _cse76 = _cse6*_cse75
+    _cse77 = 0.000346321299837637*_cse74 + 0.000346321299837637*_cse76
+    _cse78 = 0.517383113*_cse66 + 0.517383113*_cse68 - 0.855753802*_cse70 - 0.855753802*_cse71 + _cse77
+    _cse79 = _cse59*_cse78
+    _cse80 = 0.818687841791724*_cse76
+    _cse81 = 0.818687841791724*_cse74
+    _cse82 = 0.758601438*_cse66 + 0.758601438*_cse68 - 0.212878838804554*_cse69 + 0.458851168*_cse70 + 0.458851168*_cse71 + 0.212878838804554*_cse72 - _cse80 - _cse81
+    _cse83 = _cse42*_cse82
+    _cse84 = _cse61*_cse78
+    _cse85 = _cse39*_cse82
+    _cse86 = 2.75322908921405e-6*_cse74 + 2.75322908921405e-6*_cse76
+    _cse87 = 0.470391945795628*_cse76
+    _cse88 = 0.470391945795628*_cse74
+    _cse89 = _cse37*_cse78
+    _cse90 = 0.329365488408814*_cse76
+    _cse91 = 0.329365488408814*_cse74
+    _cse92 = -0.410149995883665*_cse0*_cse82 + 0.227149603970304*_cse66 + 0.227149603970304*_cse68 + 0.234017800844203*_cse69 + 0.137106991283212*_cse70 + 0.137106991283212*_cse71 - 0.234017800844203*_cse72 - 0.410879747*_cse79 - 0.410879747*_cse83 + 0.209584432*_cse84 + 0.209584432*_cse85 + 0.410149995883665*_cse89 + _cse90 + _cse91
+    _cse93 = -_cse38
+    _cse94 = 0.00040053*_cse13 - 0.012581*_cse14
+    _cse95 = -_cse94
+    _cse96 = 0.012581*_cse13 + 0.00040053*_cse14
+    _cse97 = -_cse96
+    _cse98 = 0.00048786*_cse6 + 0.081945*_cse9
+    _cse99 = _cse8*_cse98
+    _cse100 = 0.081945*_cse6 - 0.00048786*_cse9
+    _cse101 = _cse100*_cse5
+    _cse102 = 0.0038906673398998*_cse31
+    _cse103 = 0.0038906673398998*_cse28
+    _cse104 = _cse101*_cse3 + _cse102*_cse3 - _cse103*_cse3 + 0.227539183449751*_cse74 + 0.227539183449751*_cse76
+    _cse105 = 0.01718495619792*_cse0*_cse82 - _cse104 + 0.0439876856535455*_cse14*_cse67 - _cse3*_cse99 + 0.0050298*_cse42*_cse82 + _cse57*_cse78 + 0.0050298*_cse59*_cse78 + _cse65*_cse97 - 0.0309919044627574*_cse66 + _cse67*_cse95 - 0.0309919044627574*_cse68 - 0.0439876856535455*_cse69 - 0.0181297165934418*_cse70 - 0.0181297165934418*_cse71 + _cse82*_cse93 - 0.0019534*_cse84 - 0.0019534*_cse85 - 0.01718495619792*_cse89 + _cse92*z + x*(1.8987869684628e-6*_cse66 + 1.8987869684628e-6*_cse68 + 1.9561995392714e-6*_cse69 + 1.14610355371469e-6*_cse70 + 1.14610355371469e-6*_cse71 - 1.9561995392714e-6*_cse72 - 0.45478971*_cse79 - 0.45478971*_cse83 - 0.890598824*_cse84 - 0.890598824*_cse85 + _cse86) + y*(0.213215245107779*_cse0*_cse82 + 0.334218649384678*_cse14*_cse67 + 0.403618758*_cse39*_cse82 + 0.403618758*_cse61*_cse78 - 0.324409654194476*_cse66 - 0.324409654194476*_cse68 - 0.334218649384678*_cse69 - 0.19581293936857*_cse70 - 0.19581293936857*_cse71 - 0.790154512*_cse79 - 0.790154512*_cse83 - _cse87 - _cse88 - 0.213215245107779*_cse89)
+    _cse106 = -_cse67
+    _cse107 = _cse106*_cse14
+    _cse108 = -_cse65
+    _cse109 = _cse108*_cse24
+    _cse110 = _cse106*_cse26
+    _cse111 = 0.517383113*_cse106*_cse22 + 0.517383113*_cse108*_cse15 - 0.855753802*_cse109 - 0.855753802*_cse110 - _cse77
+    _cse112 = _cse111*_cse59
+    _cse113 = _cse108*_cse13
+    _cse114 = _cse108*_cse15
+    _cse115 = _cse106*_cse22
+    _cse116 = 0.212878838804554*_cse107 + 0.458851168*_cse109 + 0.458851168*_cse110 - 0.212878838804554*_cse113 + 0.758601438*_cse114 + 0.758601438*_cse115 + _cse80 + _cse81
+    _cse117 = _cse116*_cse42
+    _cse118 = _cse111*_cse61
+    _cse119 = _cse116*_cse39
+    _cse120 = _cse111*_cse37
+    _cse121 = _cse0*_cse116
+    _cse122 = -0.234017800844203*_cse107 + 0.137106991283212*_cse109 + 0.137106991283212*_cse110 - 0.410879747*_cse112 + 0.234017800844203*_cse113 + 0.227149603970304*_cse114 + 0.227149603970304*_cse115 - 0.410879747*_cse117 + 0.209584432*_cse118 + 0.209584432*_cse119 + 0.410149995883665*_cse120 - 0.410149995883665*_cse121 - _cse90 - _cse91
+    _cse123 = 0.0019519*_cse5 - 0.20902*_cse8
+    _cse124 = -_cse98
+    _cse125 = _cse124*_cse8
+    _cse126 = _cse104 + _cse106*_cse95 + 0.0439876856535455*_cse107 + _cse108*_cse97 - 0.0181297165934418*_cse109 - 0.0181297165934418*_cse110 + _cse111*_cse57 + 0.0050298*_cse112 - 0.0439876856535455*_cse113 - 0.0309919044627574*_cse114 - 0.0309919044627574*_cse115 + _cse116*_cse93 + 0.0050298*_cse117 - 0.0019534*_cse118 - 0.0019534*_cse119 - 0.01718495619792*_cse120 + 0.01718495619792*_cse121 + _cse122*z + _cse123*_cse3 - _cse125*_cse3 - 0.20503*_cse73 - 1.098e-6*_cse75 + x*(1.8987869684628e-6*_cse106*_cse22 + 1.14610355371469e-6*_cse106*_cse26 - 1.9561995392714e-6*_cse107 + 1.9561995392714e-6*_cse108*_cse13 + 1.8987869684628e-6*_cse108*_cse15 + 1.14610355371469e-6*_cse108*_cse24 - 0.45478971*_cse112 - 0.45478971*_cse117 - 0.890598824*_cse118 - 0.890598824*_cse119 - _cse86) + y*(0.213215245107779*_cse0*_cse116 + 0.334218649384678*_cse106*_cse14 - 0.19581293936857*_cse109 - 0.19581293936857*_cse110 + 0.403618758*_cse111*_cse61 - 0.790154512*_cse112 - 0.334218649384678*_cse113 - 0.324409654194476*_cse114 - 0.324409654194476*_cse115 + 0.403618758*_cse116*_cse39 - 0.790154512*_cse117 - 0.213215245107779*_cse120 + _cse87 + _cse88)
+    _cse127 = _cse13*_cse20
+    _cse128 = _cse12*_cse14
+    _cse129 = -_cse26
+    _cse130 = _cse12*_cse129
+    _cse131 = _cse20*_cse24
+    _cse132 = _cse12*_cse21
+    _cse133 = _cse15*_cse20
+    _cse134 = 0.517383113*_cse12*_cse21 - 0.855753802*_cse130 - 0.855753802*_cse131 + 0.517383113*_cse15*_cse20
+    _cse135 = _cse134*_cse37
+    _cse136 = _cse134*_cse59
+    _cse137 = _cse134*_cse61
+    _cse138 = -0.212878838804554*_cse127 - 0.212878838804554*_cse128 + 0.458851168*_cse130 + 0.458851168*_cse131 + 0.758601438*_cse132 + 0.758601438*_cse133
+    _cse139 = _cse0*_cse138
+    _cse140 = _cse138*_cse42
+    _cse141 = _cse138*_cse39
+    _cse142 = 0.234017800844203*_cse127 + 0.234017800844203*_cse128 + 0.137106991283212*_cse130 + 0.137106991283212*_cse131 + 0.227149603970304*_cse132 + 0.227149603970304*_cse133 + 0.410149995883665*_cse135 - 0.410879747*_cse136 + 0.209584432*_cse137 - 0.410149995883665*_cse139 - 0.410879747*_cse140 + 0.209584432*_cse141
+    _cse143 = _cse12*_cse94 - 0.0439876856535455*_cse127 - 0.0439876856535455*_cse128 - 0.0181297165934418*_cse130 - 0.0181297165934418*_cse131 - 0.0309919044627574*_cse132 - 0.0309919044627574*_cse133 + _cse134*_cse57 - 0.01718495619792*_cse135 + 0.0050298*_cse136 - 0.0019534*_cse137 + _cse138*_cse93 + 0.01718495619792*_cse139 + 0.0050298*_cse140 - 0.0019534*_cse141 + _cse142*z + _cse20*_cse97 + x*(1.9561995392714e-6*_cse127 + 1.9561995392714e-6*_cse128 + 1.14610355371469e-6*_cse130 + 1.14610355371469e-6*_cse131 + 1.8987869684628e-6*_cse132 + 1.8987869684628e-6*_cse133 - 0.45478971*_cse136 - 0.890598824*_cse137 - 0.45478971*_cse140 - 0.890598824*_cse141) + y*(0.213215245107779*_cse0*_cse138 - 0.334218649384678*_cse127 - 0.334218649384678*_cse128 - 0.19581293936857*_cse130 - 0.19581293936857*_cse131 - 0.324409654194476*_cse132 - 0.324409654194476*_cse133 + 0.403618758*_cse134*_cse61 - 0.213215245107779*_cse135 - 0.790154512*_cse136 + 0.403618758*_cse138*_cse39 - 0.790154512*_cse140)
+    _cse144 = _cse10*_cse17 + _cse17*_cse7
+    _cse145 = _cse144 + _cse18
+    _cse146 = _cse145*_cse15
+    _cse147 = _cse10*_cse2 + _cse2*_cse7
+    _cse148 = _cse147 - _cse4
+    _cse149 = _cse148*_cse22
+    _cse150 = _cse13*_cse145
+    _cse151 = _cse145*_cse24
+    _cse152 = _cse148*_cse26
+    _cse153 = _cse14*_cse148
+    _cse154 = _cse1*_cse29
+    _cse155 = _cse1*_cse32
+    _cse156 = _cse154 - _cse155
+    _cse157 = 0.517383113*_cse146 + 0.517383113*_cse149 - 0.855753802*_cse151 - 0.855753802*_cse152 + _cse156
+    _cse158 = _cse157*_cse59
+    _cse159 = _cse1*_cse49
+    _cse160 = _cse1*_cse51
+    _cse161 = _cse159 - _cse160
+    _cse162 = 0.758601438*_cse146 + 0.758601438*_cse149 - 0.212878838804554*_cse150 + 0.458851168*_cse151 + 0.458851168*_cse152 + 0.212878838804554*_cse153 + _cse161
+    _cse163 = _cse162*_cse42
+    _cse164 = _cse157*_cse61
+    _cse165 = _cse162*_cse39
+    _cse166 = _cse1*_cse28
+    _cse167 = 2.75322908921405e-6*_cse166
+    _cse168 = _cse1*_cse31
+    _cse169 = 2.75322908921405e-6*_cse168
+    _cse170 = _cse167 - _cse169
+    _cse171 = _cse157*_cse37
+    _cse172 = 0.470391945795628*_cse166
+    _cse173 = 0.470391945795628*_cse168
+    _cse174 = _cse172 - _cse173
+    _cse175 = _cse0*_cse162
+    _cse176 = 0.329365488408814*_cse166
+    _cse177 = 0.329365488408814*_cse168
+    _cse178 = _cse176 - _cse177
+    _cse179 = 0.227149603970304*_cse146 + 0.227149603970304*_cse149 + 0.234017800844203*_cse150 + 0.137106991283212*_cse151 + 0.137106991283212*_cse152 - 0.234017800844203*_cse153 - 0.410879747*_cse158 - 0.410879747*_cse163 + 0.209584432*_cse164 + 0.209584432*_cse165 + 0.410149995883665*_cse171 - 0.410149995883665*_cse175 + _cse178
+    _cse180 = 0.20902*_cse5 + 0.0019519*_cse8
+    _cse181 = -_cse180
+    _cse182 = _cse1*_cse8
+    _cse183 = _cse1*_cse5
+    _cse184 = 0.20503*_cse183
+    _cse185 = _cse100*_cse182
+    _cse186 = _cse124*_cse183
+    _cse187 = 0.227539183449751*_cse168
+    _cse188 = _cse182*_cse9
+    _cse189 = 0.0038906673398998*_cse188
+    _cse190 = _cse183*_cse6
+    _cse191 = 0.0038906673398998*_cse190
+    _cse192 = 0.227539183449751*_cse166
+    _cse193 = _cse187 - _cse189 - _cse191 - _cse192
+    _cse194 = -_cse17*_cse28 + _cse17*_cse31
+    _cse195 = _cse15*_cse194
+    _cse196 = -_cse2*_cse28 + _cse2*_cse31
+    _cse197 = _cse196*_cse22
+    _cse198 = _cse194*_cse24
+    _cse199 = _cse196*_cse26
+    _cse200 = 0.000346321299837637*_cse188 + 0.000346321299837637*_cse190
+    _cse201 = 0.517383113*_cse195 + 0.517383113*_cse197 - 0.855753802*_cse198 - 0.855753802*_cse199 + _cse200
+    _cse202 = _cse0*_cse201
+    _cse203 = _cse201*_cse40
+    _cse204 = _cse201*_cse43
+    _cse205 = 0.818687841791724*_cse190
+    _cse206 = 0.818687841791724*_cse188
+    _cse207 = -_cse194*_cse47 + 0.758601438*_cse195 + _cse196*_cse45 + 0.758601438*_cse197 + 0.458851168*_cse198 + 0.458851168*_cse199 - _cse205 - _cse206
+    _cse208 = _cse207*_cse37
+    _cse209 = _cse207*_cse59
+    _cse210 = _cse207*_cse61
+    _cse211 = _cse201*_cse38 - 0.01718495619792*_cse202 - 0.0019534*_cse203 + 0.0050298*_cse204 + _cse207*_cse57 - 0.01718495619792*_cse208 + 0.0050298*_cse209 - 0.0019534*_cse210 + x*(-0.890598824*_cse203 - 0.45478971*_cse204 - 0.45478971*_cse209 - 0.890598824*_cse210) + y*(0.403618758*_cse201*_cse40 - 0.213215245107779*_cse202 - 0.790154512*_cse204 + 0.403618758*_cse207*_cse61 - 0.213215245107779*_cse208 - 0.790154512*_cse209) + z*(0.410149995883665*_cse202 + 0.209584432*_cse203 - 0.410879747*_cse204 + 0.410149995883665*_cse208 - 0.410879747*_cse209 + 0.209584432*_cse210)
+    _cse212 = _cse13*_cse196
+    _cse213 = _cse14*_cse194
+    _cse214 = _cse196*_cse24
+    _cse215 = _cse15*_cse196
+    _cse216 = _cse129*_cse194
+    _cse217 = _cse194*_cse21
+    _cse218 = 0.517383113*_cse15*_cse196 + 0.517383113*_cse194*_cse21 - 0.855753802*_cse214 - 0.855753802*_cse216
+    _cse219 = _cse218*_cse37
+    _cse220 = _cse218*_cse59
+    _cse221 = _cse218*_cse61
+    _cse222 = -_cse194*_cse45 - _cse196*_cse47 + 0.458851168*_cse214 + 0.758601438*_cse215 + 0.458851168*_cse216 + 0.758601438*_cse217
+    _cse223 = _cse0*_cse222
+    _cse224 = _cse222*_cse42
+    _cse225 = _cse222*_cse39
+    _cse226 = _cse194*_cse94 + _cse196*_cse97 - 0.0439876856535455*_cse212 - 0.0439876856535455*_cse213 - 0.0181297165934418*_cse214 - 0.0309919044627574*_cse215 - 0.0181297165934418*_cse216 - 0.0309919044627574*_cse217 + _cse218*_cse57 - 0.01718495619792*_cse219 + 0.0050298*_cse220 - 0.0019534*_cse221 + _cse222*_cse93 + 0.01718495619792*_cse223 + 0.0050298*_cse224 - 0.0019534*_cse225 + x*(1.9561995392714e-6*_cse212 + 1.9561995392714e-6*_cse213 + 1.14610355371469e-6*_cse214 + 1.8987869684628e-6*_cse215 + 1.14610355371469e-6*_cse216 + 1.8987869684628e-6*_cse217 - 0.45478971*_cse220 - 0.890598824*_cse221 - 0.45478971*_cse224 - 0.890598824*_cse225) + y*(0.213215245107779*_cse0*_cse222 - 0.334218649384678*_cse212 - 0.334218649384678*_cse213 - 0.19581293936857*_cse214 - 0.324409654194476*_cse215 - 0.19581293936857*_cse216 - 0.324409654194476*_cse217 + 0.403618758*_cse218*_cse61 - 0.213215245107779*_cse219 - 0.790154512*_cse220 + 0.403618758*_cse222*_cse39 - 0.790154512*_cse224) + z*(0.234017800844203*_cse212 + 0.234017800844203*_cse213 + 0.137106991283212*_cse214 + 0.227149603970304*_cse215 + 0.137106991283212*_cse216 + 0.227149603970304*_cse217 + 0.410149995883665*_cse219 - 0.410879747*_cse220 + 0.209584432*_cse221 - 0.410149995883665*_cse223 - 0.410879747*_cse224 + 0.209584432*_cse225)
+    _cse227 = -_cse144
+    _cse228 = _cse13*_cse227
+    _cse229 = -_cse147
+    _cse230 = _cse14*_cse229
+    _cse231 = _cse227*_cse24
+    _cse232 = _cse15*_cse227
+    _cse233 = _cse22*_cse229
+    _cse234 = _cse229*_cse26
+    _cse235 = 0.517383113*_cse15*_cse227 - _cse156 + 0.517383113*_cse22*_cse229 - 0.855753802*_cse231 - 0.855753802*_cse234
+    _cse236 = _cse235*_cse59
+    _cse237 = _cse235*_cse61
+    _cse238 = -_cse159 + _cse160
+    _cse239 = -_cse227*_cse47 + _cse229*_cse45 + 0.458851168*_cse231 + 0.758601438*_cse232 + 0.758601438*_cse233 + 0.458851168*_cse234 + _cse238
+    _cse240 = _cse239*_cse42
+    _cse241 = _cse239*_cse39
+    _cse242 = _cse235*_cse37
+    _cse243 = _cse0*_cse239
+    _cse244 = _cse183*_cse98
+    _cse245 = _cse185 - _cse187 + _cse189 + _cse191 + _cse192
+    _cse246 = _cse227*_cse97 - 0.0439876856535455*_cse228 + _cse229*_cse95 + 0.0439876856535455*_cse230 - 0.0181297165934418*_cse231 - 0.0309919044627574*_cse232 - 0.0309919044627574*_cse233 - 0.0181297165934418*_cse234 + _cse235*_cse57 + 0.0050298*_cse236 - 0.0019534*_cse237 + _cse239*_cse93 + 0.0050298*_cse240 - 0.0019534*_cse241 - 0.01718495619792*_cse242 + 0.01718495619792*_cse243 - _cse244 + _cse245 + x*(-_cse167 + _cse169 + 1.9561995392714e-6*_cse228 - 1.9561995392714e-6*_cse230 + 1.14610355371469e-6*_cse231 + 1.8987869684628e-6*_cse232 + 1.8987869684628e-6*_cse233 + 1.14610355371469e-6*_cse234 - 0.45478971*_cse236 - 0.890598824*_cse237 - 0.45478971*_cse240 - 0.890598824*_cse241) + y*(0.213215245107779*_cse0*_cse239 + 0.334218649384678*_cse14*_cse229 + _cse172 - _cse173 - 0.334218649384678*_cse228 - 0.19581293936857*_cse231 - 0.324409654194476*_cse232 - 0.324409654194476*_cse233 - 0.19581293936857*_cse234 + 0.403618758*_cse235*_cse61 - 0.790154512*_cse236 + 0.403618758*_cse239*_cse39 - 0.790154512*_cse240 - 0.213215245107779*_cse242) + z*(-_cse176 + _cse177 + 0.234017800844203*_cse228 - 0.234017800844203*_cse230 + 0.137106991283212*_cse231 + 0.227149603970304*_cse232 + 0.227149603970304*_cse233 + 0.137106991283212*_cse234 - 0.410879747*_cse236 + 0.209584432*_cse237 - 0.410879747*_cse240 + 0.209584432*_cse241 + 0.410149995883665*_cse242 - 0.410149995883665*_cse243)
+    _cse247 = _cse144*_cse15
+    _cse248 = _cse147*_cse22
+    _cse249 = _cse13*_cse144
+    _cse250 = _cse144*_cse24
+    _cse251 = _cse147*_cse26
+    _cse252 = _cse14*_cse147
+    _cse253 = _cse156 + 0.517383113*_cse247 + 0.517383113*_cse248 - 0.855753802*_cse250 - 0.855753802*_cse251
+    _cse254 = _cse253*_cse59
+    _cse255 = -_cse144*_cse47 + _cse147*_cse45 + _cse161 + 0.758601438*_cse247 + 0.758601438*_cse248 + 0.458851168*_cse250 + 0.458851168*_cse251
+    _cse256 = _cse255*_cse42
+    _cse257 = _cse253*_cse61
+    _cse258 = _cse255*_cse39
+    _cse259 = _cse170 + 1.8987869684628e-6*_cse247 + 1.8987869684628e-6*_cse248 + 1.9561995392714e-6*_cse249 + 1.14610355371469e-6*_cse250 + 1.14610355371469e-6*_cse251 - 1.9561995392714e-6*_cse252 - 0.45478971*_cse254 - 0.45478971*_cse256 - 0.890598824*_cse257 - 0.890598824*_cse258
+    _cse260 = _cse253*_cse37
+    _cse261 = 0.213215245107779*_cse0*_cse255 + 0.334218649384678*_cse14*_cse147 - _cse174 - 0.324409654194476*_cse247 - 0.324409654194476*_cse248 - 0.334218649384678*_cse249 - 0.19581293936857*_cse250 - 0.19581293936857*_cse251 + 0.403618758*_cse253*_cse61 - 0.790154512*_cse254 + 0.403618758*_cse255*_cse39 - 0.790154512*_cse256 - 0.213215245107779*_cse260
+    _cse262 = _cse0*_cse255
+    _cse263 = _cse178 + 0.227149603970304*_cse247 + 0.227149603970304*_cse248 + 0.234017800844203*_cse249 + 0.137106991283212*_cse250 + 0.137106991283212*_cse251 - 0.234017800844203*_cse252 - 0.410879747*_cse254 - 0.410879747*_cse256 + 0.209584432*_cse257 + 0.209584432*_cse258 + 0.410149995883665*_cse260 - 0.410149995883665*_cse262
+    _cse264 = 0.0439876856535455*_cse249
+    _cse265 = 0.0181297165934418*_cse250
+    _cse266 = 0.0181297165934418*_cse251
+    _cse267 = 0.01718495619792*_cse260
+    _cse268 = 0.0019534*_cse257
+    _cse269 = 0.0019534*_cse258
+    _cse270 = 0.0309919044627574*_cse247
+    _cse271 = 0.0309919044627574*_cse248
+    _cse272 = -_cse194
+    _cse273 = _cse24*_cse272
+    _cse274 = -_cse196
+    _cse275 = _cse26*_cse274
+    _cse276 = 0.517383113*_cse15*_cse272 - _cse200 + 0.517383113*_cse22*_cse274 - 0.855753802*_cse273 - 0.855753802*_cse275
+    _cse277 = _cse0*_cse276
+    _cse278 = _cse276*_cse40
+    _cse279 = _cse276*_cse43
+    _cse280 = _cse15*_cse272
+    _cse281 = _cse22*_cse274
+    _cse282 = _cse205 + _cse206 - _cse272*_cse47 + 0.458851168*_cse273 + _cse274*_cse45 + 0.458851168*_cse275 + 0.758601438*_cse280 + 0.758601438*_cse281
+    _cse283 = _cse282*_cse37
+    _cse284 = _cse282*_cse59
+    _cse285 = _cse282*_cse61
+    _cse286 = _cse276*_cse38 - 0.01718495619792*_cse277 - 0.0019534*_cse278 + 0.0050298*_cse279 + _cse282*_cse57 - 0.01718495619792*_cse283 + 0.0050298*_cse284 - 0.0019534*_cse285 + x*(-0.890598824*_cse278 - 0.45478971*_cse279 - 0.45478971*_cse284 - 0.890598824*_cse285) + y*(0.403618758*_cse276*_cse40 - 0.213215245107779*_cse277 - 0.790154512*_cse279 + 0.403618758*_cse282*_cse61 - 0.213215245107779*_cse283 - 0.790154512*_cse284) + z*(0.410149995883665*_cse277 + 0.209584432*_cse278 - 0.410879747*_cse279 + 0.410149995883665*_cse283 - 0.410879747*_cse284 + 0.209584432*_cse285)
+    _cse287 = _cse14*_cse272
+    _cse288 = _cse13*_cse274
+    _cse289 = _cse129*_cse272
+    _cse290 = _cse21*_cse272
+    _cse291 = _cse24*_cse274
+    _cse292 = _cse15*_cse274
+    _cse293 = 0.517383113*_cse15*_cse274 + 0.517383113*_cse21*_cse272 - 0.855753802*_cse289 - 0.855753802*_cse291
+    _cse294 = _cse293*_cse37
+    _cse295 = _cse293*_cse59
+    _cse296 = _cse293*_cse61
+    _cse297 = -_cse272*_cse45 - _cse274*_cse47 + 0.458851168*_cse289 + 0.758601438*_cse290 + 0.458851168*_cse291 + 0.758601438*_cse292
+    _cse298 = _cse0*_cse297
+    _cse299 = _cse297*_cse42
+    _cse300 = _cse297*_cse39
+    _cse301 = _cse272*_cse94 + _cse274*_cse97 - 0.0439876856535455*_cse287 - 0.0439876856535455*_cse288 - 0.0181297165934418*_cse289 - 0.0309919044627574*_cse290 - 0.0181297165934418*_cse291 - 0.0309919044627574*_cse292 + _cse293*_cse57 - 0.01718495619792*_cse294 + 0.0050298*_cse295 - 0.0019534*_cse296 + _cse297*_cse93 + 0.01718495619792*_cse298 + 0.0050298*_cse299 - 0.0019534*_cse300 + x*(1.9561995392714e-6*_cse287 + 1.9561995392714e-6*_cse288 + 1.14610355371469e-6*_cse289 + 1.8987869684628e-6*_cse290 + 1.14610355371469e-6*_cse291 + 1.8987869684628e-6*_cse292 - 0.45478971*_cse295 - 0.890598824*_cse296 - 0.45478971*_cse299 - 0.890598824*_cse300) + y*(0.213215245107779*_cse0*_cse297 - 0.334218649384678*_cse287 - 0.334218649384678*_cse288 - 0.19581293936857*_cse289 - 0.324409654194476*_cse290 - 0.19581293936857*_cse291 - 0.324409654194476*_cse292 + 0.403618758*_cse293*_cse61 - 0.213215245107779*_cse294 - 0.790154512*_cse295 + 0.403618758*_cse297*_cse39 - 0.790154512*_cse299) + z*(0.234017800844203*_cse287 + 0.234017800844203*_cse288 + 0.137106991283212*_cse289 + 0.227149603970304*_cse290 + 0.137106991283212*_cse291 + 0.227149603970304*_cse292 + 0.410149995883665*_cse294 - 0.410879747*_cse295 + 0.209584432*_cse296 - 0.410149995883665*_cse298 - 0.410879747*_cse299 + 0.209584432*_cse300)
+    _cse302 = -_cse100
+    _cse303 = -_cse145
+    _cse304 = _cse129*_cse303
+    _cse305 = -_cse148
+    _cse306 = _cse24*_cse305
+    _cse307 = 0.517383113*_cse15*_cse305 + 0.517383113*_cse21*_cse303 - 0.855753802*_cse304 - 0.855753802*_cse306
+    _cse308 = _cse0*_cse307
+    _cse309 = _cse307*_cse40
+    _cse310 = _cse307*_cse43
+    _cse311 = _cse21*_cse303
+    _cse312 = _cse15*_cse305
+    _cse313 = -_cse303*_cse45 + 0.458851168*_cse304 - _cse305*_cse47 + 0.458851168*_cse306 + 0.758601438*_cse311 + 0.758601438*_cse312
+    _cse314 = _cse313*_cse37
+    _cse315 = _cse313*_cse59
+    _cse316 = _cse313*_cse61
+    _cse317 = _cse307*_cse38 - 0.01718495619792*_cse308 - 0.0019534*_cse309 + 0.0050298*_cse310 + _cse313*_cse57 - 0.01718495619792*_cse314 + 0.0050298*_cse315 - 0.0019534*_cse316 + x*(-0.890598824*_cse309 - 0.45478971*_cse310 - 0.45478971*_cse315 - 0.890598824*_cse316) + y*(0.403618758*_cse307*_cse40 - 0.213215245107779*_cse308 - 0.790154512*_cse310 + 0.403618758*_cse313*_cse61 - 0.213215245107779*_cse314 - 0.790154512*_cse315) + z*(0.410149995883665*_cse308 + 0.209584432*_cse309 - 0.410879747*_cse310 + 0.410149995883665*_cse314 - 0.410879747*_cse315 + 0.209584432*_cse316)
+    _cse318 = _cse13*_cse303
+    _cse319 = _cse14*_cse305
+    _cse320 = _cse129*_cse305
+    _cse321 = -_cse15
+    _cse322 = _cse303*_cse321
+    _cse323 = -_cse24
+    _cse324 = _cse303*_cse323
+    _cse325 = _cse21*_cse305
+    _cse326 = 0.517383113*_cse21*_cse305 + 0.517383113*_cse303*_cse321 - 0.855753802*_cse320 - 0.855753802*_cse324
+    _cse327 = _cse326*_cse37
+    _cse328 = _cse326*_cse59
+    _cse329 = _cse326*_cse61
+    _cse330 = _cse303*_cse47
+    _cse331 = _cse305*_cse45
+    _cse332 = 0.458851168*_cse320 + 0.758601438*_cse322 + 0.458851168*_cse324 + 0.758601438*_cse325 + _cse330 - _cse331
+    _cse333 = _cse0*_cse332
+    _cse334 = _cse332*_cse42
+    _cse335 = _cse332*_cse39
+    _cse336 = _cse22*_cse305
+    _cse337 = _cse24*_cse303
+    _cse338 = _cse15*_cse303
+    _cse339 = _cse26*_cse305
+    _cse340 = -_cse154 + _cse155 + 0.517383113*_cse336 - 0.855753802*_cse337 + 0.517383113*_cse338 - 0.855753802*_cse339
+    _cse341 = _cse340*_cse37
+    _cse342 = -_cse61
+    _cse343 = _cse340*_cse342
+    _cse344 = _cse340*_cse58
+    _cse345 = _cse238 - _cse330 + _cse331 + 0.758601438*_cse336 + 0.458851168*_cse337 + 0.758601438*_cse338 + 0.458851168*_cse339
+    _cse346 = _cse0*_cse345
+    _cse347 = _cse345*_cse40
+    _cse348 = _cse345*_cse43
+    _cse349 = _cse0*_cse157
+    _cse350 = _cse157*_cse40
+    _cse351 = _cse157*_cse43
+    _cse352 = _cse162*_cse37
+    _cse353 = _cse162*_cse59
+    _cse354 = _cse162*_cse61
+    _cse355 = _cse157*_cse38 + _cse162*_cse57 - 0.01718495619792*_cse349 - 0.0019534*_cse350 + 0.0050298*_cse351 - 0.01718495619792*_cse352 + 0.0050298*_cse353 - 0.0019534*_cse354 + x*(-0.890598824*_cse350 - 0.45478971*_cse351 - 0.45478971*_cse353 - 0.890598824*_cse354) + y*(0.403618758*_cse157*_cse40 + 0.403618758*_cse162*_cse61 - 0.213215245107779*_cse349 - 0.790154512*_cse351 - 0.213215245107779*_cse352 - 0.790154512*_cse353) + z*(0.410149995883665*_cse349 + 0.209584432*_cse350 - 0.410879747*_cse351 + 0.410149995883665*_cse352 - 0.410879747*_cse353 + 0.209584432*_cse354)
+    _cse356 = _cse13*_cse194
+    _cse357 = _cse14*_cse196
+    _cse358 = _cse201*_cse59
+    _cse359 = _cse207*_cse42
+    _cse360 = _cse201*_cse61
+    _cse361 = _cse207*_cse39
+    _cse362 = 2.75322908921405e-6*_cse188 + 2.75322908921405e-6*_cse190
+    _cse363 = 0.470391945795628*_cse190
+    _cse364 = 0.470391945795628*_cse188
+    _cse365 = _cse201*_cse37
+    _cse366 = 0.329365488408814*_cse190
+    _cse367 = 0.329365488408814*_cse188
+    _cse368 = -0.410149995883665*_cse0*_cse207 + 0.227149603970304*_cse195 + 0.227149603970304*_cse197 + 0.137106991283212*_cse198 + 0.137106991283212*_cse199 + 0.234017800844203*_cse356 - 0.234017800844203*_cse357 - 0.410879747*_cse358 - 0.410879747*_cse359 + 0.209584432*_cse360 + 0.209584432*_cse361 + 0.410149995883665*_cse365 + _cse366 + _cse367
+    _cse369 = _cse1*_cse101 + _cse1*_cse102 - _cse1*_cse103 + 0.227539183449751*_cse188 + 0.227539183449751*_cse190
+    _cse370 = 0.01718495619792*_cse0*_cse207 - _cse1*_cse99 + 0.0439876856535455*_cse14*_cse196 + _cse194*_cse97 - 0.0309919044627574*_cse195 + _cse196*_cse95 - 0.0309919044627574*_cse197 - 0.0181297165934418*_cse198 - 0.0181297165934418*_cse199 + _cse201*_cse57 + 0.0050298*_cse201*_cse59 + 0.0050298*_cse207*_cse42 + _cse207*_cse93 - 0.0439876856535455*_cse356 - 0.0019534*_cse360 - 0.0019534*_cse361 - 0.01718495619792*_cse365 + _cse368*z - _cse369 + x*(1.8987869684628e-6*_cse195 + 1.8987869684628e-6*_cse197 + 1.14610355371469e-6*_cse198 + 1.14610355371469e-6*_cse199 + 1.9561995392714e-6*_cse356 - 1.9561995392714e-6*_cse357 - 0.45478971*_cse358 - 0.45478971*_cse359 - 0.890598824*_cse360 - 0.890598824*_cse361 + _cse362) + y*(0.213215245107779*_cse0*_cse207 + 0.334218649384678*_cse14*_cse196 - 0.324409654194476*_cse195 - 0.324409654194476*_cse197 - 0.19581293936857*_cse198 - 0.19581293936857*_cse199 + 0.403618758*_cse201*_cse61 + 0.403618758*_cse207*_cse39 - 0.334218649384678*_cse356 - 0.790154512*_cse358 - 0.790154512*_cse359 - _cse363 - _cse364 - 0.213215245107779*_cse365)
+    _cse371 = _cse14*_cse274
+    _cse372 = _cse276*_cse59
+    _cse373 = _cse282*_cse42
+    _cse374 = _cse276*_cse61
+    _cse375 = _cse282*_cse39
+    _cse376 = _cse13*_cse272
+    _cse377 = _cse276*_cse37
+    _cse378 = _cse0*_cse282
+    _cse379 = 0.137106991283212*_cse273 + 0.137106991283212*_cse275 + 0.227149603970304*_cse280 + 0.227149603970304*_cse281 - _cse366 - _cse367 - 0.234017800844203*_cse371 - 0.410879747*_cse372 - 0.410879747*_cse373 + 0.209584432*_cse374 + 0.209584432*_cse375 + 0.234017800844203*_cse376 + 0.410149995883665*_cse377 - 0.410149995883665*_cse378
+    _cse380 = _cse1*_cse123 - _cse1*_cse125 - 0.20503*_cse182 - 1.098e-6*_cse183 + _cse272*_cse97 - 0.0181297165934418*_cse273 + _cse274*_cse95 - 0.0181297165934418*_cse275 + _cse276*_cse57 - 0.0309919044627574*_cse280 - 0.0309919044627574*_cse281 + _cse282*_cse93 + _cse369 + 0.0439876856535455*_cse371 + 0.0050298*_cse372 + 0.0050298*_cse373 - 0.0019534*_cse374 - 0.0019534*_cse375 - 0.0439876856535455*_cse376 - 0.01718495619792*_cse377 + 0.01718495619792*_cse378 + _cse379*z + x*(1.9561995392714e-6*_cse13*_cse272 + 1.8987869684628e-6*_cse15*_cse272 + 1.8987869684628e-6*_cse22*_cse274 + 1.14610355371469e-6*_cse24*_cse272 + 1.14610355371469e-6*_cse26*_cse274 - _cse362 - 1.9561995392714e-6*_cse371 - 0.45478971*_cse372 - 0.45478971*_cse373 - 0.890598824*_cse374 - 0.890598824*_cse375) + y*(0.213215245107779*_cse0*_cse282 + 0.334218649384678*_cse14*_cse274 - 0.19581293936857*_cse273 - 0.19581293936857*_cse275 + 0.403618758*_cse276*_cse61 - 0.324409654194476*_cse280 - 0.324409654194476*_cse281 + 0.403618758*_cse282*_cse39 + _cse363 + _cse364 - 0.790154512*_cse372 - 0.790154512*_cse373 - 0.334218649384678*_cse376 - 0.213215245107779*_cse377)
+    _cse381 = _cse13*_cse148
+    _cse382 = _cse14*_cse145
+    _cse383 = _cse129*_cse145
+    _cse384 = _cse148*_cse24
+    _cse385 = _cse145*_cse21
+    _cse386 = _cse148*_cse15
+    _cse387 = 0.517383113*_cse145*_cse21 + 0.517383113*_cse148*_cse15 - 0.855753802*_cse383 - 0.855753802*_cse384
+    _cse388 = _cse37*_cse387
+    _cse389 = _cse387*_cse59
+    _cse390 = _cse387*_cse61
+    _cse391 = -_cse145*_cse45 - _cse148*_cse47 + 0.458851168*_cse383 + 0.458851168*_cse384 + 0.758601438*_cse385 + 0.758601438*_cse386
+    _cse392 = _cse0*_cse391
+    _cse393 = _cse391*_cse42
+    _cse394 = _cse39*_cse391
+    _cse395 = _cse145*_cse94 + _cse148*_cse97 - 0.0439876856535455*_cse381 - 0.0439876856535455*_cse382 - 0.0181297165934418*_cse383 - 0.0181297165934418*_cse384 - 0.0309919044627574*_cse385 - 0.0309919044627574*_cse386 + _cse387*_cse57 - 0.01718495619792*_cse388 + 0.0050298*_cse389 - 0.0019534*_cse390 + _cse391*_cse93 + 0.01718495619792*_cse392 + 0.0050298*_cse393 - 0.0019534*_cse394 + x*(1.9561995392714e-6*_cse381 + 1.9561995392714e-6*_cse382 + 1.14610355371469e-6*_cse383 + 1.14610355371469e-6*_cse384 + 1.8987869684628e-6*_cse385 + 1.8987869684628e-6*_cse386 - 0.45478971*_cse389 - 0.890598824*_cse390 - 0.45478971*_cse393 - 0.890598824*_cse394) + y*(0.213215245107779*_cse0*_cse391 - 0.334218649384678*_cse381 - 0.334218649384678*_cse382 - 0.19581293936857*_cse383 - 0.19581293936857*_cse384 - 0.324409654194476*_cse385 - 0.324409654194476*_cse386 + 0.403618758*_cse387*_cse61 - 0.213215245107779*_cse388 - 0.790154512*_cse389 + 0.403618758*_cse39*_cse391 - 0.790154512*_cse393) + z*(0.234017800844203*_cse381 + 0.234017800844203*_cse382 + 0.137106991283212*_cse383 + 0.137106991283212*_cse384 + 0.227149603970304*_cse385 + 0.227149603970304*_cse386 + 0.410149995883665*_cse388 - 0.410879747*_cse389 + 0.209584432*_cse390 - 0.410149995883665*_cse392 - 0.410879747*_cse393 + 0.209584432*_cse394)
+    _cse396 = -_cse12
+    _cse397 = _cse15*_cse396
+    _cse398 = -_cse20
+    _cse399 = _cse22*_cse398
+    _cse400 = _cse13*_cse396
+    _cse401 = _cse24*_cse396
+    _cse402 = _cse26*_cse398
+    _cse403 = _cse14*_cse398
+    _cse404 = -_cse30 + _cse33 + 0.517383113*_cse397 + 0.517383113*_cse399 - 0.855753802*_cse401 - 0.855753802*_cse402
+    _cse405 = _cse404*_cse59
+    _cse406 = -_cse50 + _cse52
+    _cse407 = -_cse396*_cse47 + 0.758601438*_cse397 + _cse398*_cse45 + 0.758601438*_cse399 + 0.458851168*_cse401 + 0.458851168*_cse402 + _cse406
+    _cse408 = _cse407*_cse42
+    _cse409 = _cse404*_cse61
+    _cse410 = _cse39*_cse407
+    _cse411 = _cse3*_cse31
+    _cse412 = 2.75322908921405e-6*_cse411
+    _cse413 = _cse28*_cse3
+    _cse414 = 2.75322908921405e-6*_cse413
+    _cse415 = _cse412 - _cse414
+    _cse416 = _cse37*_cse404
+    _cse417 = 0.470391945795628*_cse411
+    _cse418 = 0.470391945795628*_cse413
+    _cse419 = _cse417 - _cse418
+    _cse420 = _cse0*_cse407
+    _cse421 = 0.329365488408814*_cse411
+    _cse422 = 0.329365488408814*_cse413
+    _cse423 = _cse421 - _cse422
+    _cse424 = 0.0038906673398998*_cse74
+    _cse425 = 0.0038906673398998*_cse76
+    _cse426 = 0.227539183449751*_cse413
+    _cse427 = 0.227539183449751*_cse411
+    _cse428 = _cse424 + _cse425 + _cse426 - _cse427
+    _cse429 = _cse100*_cse73
+    _cse430 = _cse124*_cse75 + _cse429 - 1.098e-6*_cse73 + 0.20503*_cse75
+    _cse431 = _cse0*_cse111
+    _cse432 = _cse111*_cse40
+    _cse433 = _cse111*_cse43
+    _cse434 = _cse116*_cse37
+    _cse435 = _cse116*_cse59
+    _cse436 = _cse116*_cse61
+    _cse437 = _cse111*_cse38 + _cse116*_cse57 - 0.01718495619792*_cse431 - 0.0019534*_cse432 + 0.0050298*_cse433 - 0.01718495619792*_cse434 + 0.0050298*_cse435 - 0.0019534*_cse436 + x*(-0.890598824*_cse432 - 0.45478971*_cse433 - 0.45478971*_cse435 - 0.890598824*_cse436) + y*(0.403618758*_cse111*_cse40 + 0.403618758*_cse116*_cse61 - 0.213215245107779*_cse431 - 0.790154512*_cse433 - 0.213215245107779*_cse434 - 0.790154512*_cse435) + z*(0.410149995883665*_cse431 + 0.209584432*_cse432 - 0.410879747*_cse433 + 0.410149995883665*_cse434 - 0.410879747*_cse435 + 0.209584432*_cse436)
+    _cse438 = _cse108*_cse14
+    _cse439 = _cse106*_cse13
+    _cse440 = _cse108*_cse129
+    _cse441 = _cse108*_cse21
+    _cse442 = _cse106*_cse24
+    _cse443 = _cse106*_cse15
+    _cse444 = 0.517383113*_cse106*_cse15 + 0.517383113*_cse108*_cse21 - 0.855753802*_cse440 - 0.855753802*_cse442
+    _cse445 = _cse37*_cse444
+    _cse446 = _cse444*_cse59
+    _cse447 = _cse444*_cse61
+    _cse448 = -_cse106*_cse47 - _cse108*_cse45 + 0.458851168*_cse440 + 0.758601438*_cse441 + 0.458851168*_cse442 + 0.758601438*_cse443
+    _cse449 = _cse0*_cse448
+    _cse450 = _cse42*_cse448
+    _cse451 = _cse39*_cse448
+    _cse452 = _cse106*_cse97 + _cse108*_cse94 - 0.0439876856535455*_cse438 - 0.0439876856535455*_cse439 - 0.0181297165934418*_cse440 - 0.0309919044627574*_cse441 - 0.0181297165934418*_cse442 - 0.0309919044627574*_cse443 + _cse444*_cse57 - 0.01718495619792*_cse445 + 0.0050298*_cse446 - 0.0019534*_cse447 + _cse448*_cse93 + 0.01718495619792*_cse449 + 0.0050298*_cse450 - 0.0019534*_cse451 + x*(1.9561995392714e-6*_cse438 + 1.9561995392714e-6*_cse439 + 1.14610355371469e-6*_cse440 + 1.8987869684628e-6*_cse441 + 1.14610355371469e-6*_cse442 + 1.8987869684628e-6*_cse443 - 0.45478971*_cse446 - 0.890598824*_cse447 - 0.45478971*_cse450 - 0.890598824*_cse451) + y*(0.213215245107779*_cse0*_cse448 + 0.403618758*_cse39*_cse448 - 0.334218649384678*_cse438 - 0.334218649384678*_cse439 - 0.19581293936857*_cse440 - 0.324409654194476*_cse441 - 0.19581293936857*_cse442 - 0.324409654194476*_cse443 + 0.403618758*_cse444*_cse61 - 0.213215245107779*_cse445 - 0.790154512*_cse446 - 0.790154512*_cse450) + z*(0.234017800844203*_cse438 + 0.234017800844203*_cse439 + 0.137106991283212*_cse440 + 0.227149603970304*_cse441 + 0.137106991283212*_cse442 + 0.227149603970304*_cse443 + 0.410149995883665*_cse445 - 0.410879747*_cse446 + 0.209584432*_cse447 - 0.410149995883665*_cse449 - 0.410879747*_cse450 + 0.209584432*_cse451)
+    _cse453 = _cse75*_cse98
+    _cse454 = _cse14*_cse19
+    _cse455 = _cse11*_cse13
+    _cse456 = _cse19*_cse22
+    _cse457 = _cse19*_cse26
+    _cse458 = _cse11*_cse24
+    _cse459 = _cse11*_cse15
+    _cse460 = _cse34 + 0.517383113*_cse456 - 0.855753802*_cse457 - 0.855753802*_cse458 + 0.517383113*_cse459
+    _cse461 = _cse37*_cse460
+    _cse462 = _cse460*_cse59
+    _cse463 = _cse460*_cse61
+    _cse464 = -_cse11*_cse47 + _cse19*_cse45 + 0.758601438*_cse456 + 0.458851168*_cse457 + 0.458851168*_cse458 + 0.758601438*_cse459 + _cse53
+    _cse465 = _cse0*_cse464
+    _cse466 = _cse42*_cse464
+    _cse467 = _cse39*_cse464
+    _cse468 = -_cse421 + _cse422
+    _cse469 = _cse11*_cse97 + _cse19*_cse95 - _cse424 - _cse425 - _cse426 + _cse427 - _cse429 + _cse453 + 0.0439876856535455*_cse454 - 0.0439876856535455*_cse455 - 0.0309919044627574*_cse456 - 0.0181297165934418*_cse457 - 0.0181297165934418*_cse458 - 0.0309919044627574*_cse459 + _cse460*_cse57 - 0.01718495619792*_cse461 + 0.0050298*_cse462 - 0.0019534*_cse463 + _cse464*_cse93 + 0.01718495619792*_cse465 + 0.0050298*_cse466 - 0.0019534*_cse467 + x*(-_cse412 + _cse414 - 1.9561995392714e-6*_cse454 + 1.9561995392714e-6*_cse455 + 1.8987869684628e-6*_cse456 + 1.14610355371469e-6*_cse457 + 1.14610355371469e-6*_cse458 + 1.8987869684628e-6*_cse459 - 0.45478971*_cse462 - 0.890598824*_cse463 - 0.45478971*_cse466 - 0.890598824*_cse467) + y*(0.213215245107779*_cse0*_cse464 + 0.334218649384678*_cse14*_cse19 + 0.403618758*_cse39*_cse464 + _cse417 - _cse418 - 0.334218649384678*_cse455 - 0.324409654194476*_cse456 - 0.19581293936857*_cse457 - 0.19581293936857*_cse458 - 0.324409654194476*_cse459 + 0.403618758*_cse460*_cse61 - 0.213215245107779*_cse461 - 0.790154512*_cse462 - 0.790154512*_cse466) + z*(-0.234017800844203*_cse454 + 0.234017800844203*_cse455 + 0.227149603970304*_cse456 + 0.137106991283212*_cse457 + 0.137106991283212*_cse458 + 0.227149603970304*_cse459 + 0.410149995883665*_cse461 - 0.410879747*_cse462 + 0.209584432*_cse463 - 0.410149995883665*_cse465 - 0.410879747*_cse466 + 0.209584432*_cse467 + _cse468)
+    _cse470 = -_cse11
+    _cse471 = _cse15*_cse470
+    _cse472 = -_cse19
+    _cse473 = _cse22*_cse472
+    _cse474 = _cse13*_cse470
+    _cse475 = _cse24*_cse470
+    _cse476 = _cse26*_cse472
+    _cse477 = _cse14*_cse472
+    _cse478 = 0.517383113*_cse15*_cse470 + 0.517383113*_cse22*_cse472 - _cse34 - 0.855753802*_cse475 - 0.855753802*_cse476
+    _cse479 = _cse478*_cse59
+    _cse480 = _cse406 + _cse45*_cse472 - _cse47*_cse470 + 0.758601438*_cse471 + 0.758601438*_cse473 + 0.458851168*_cse475 + 0.458851168*_cse476
+    _cse481 = _cse42*_cse480
+    _cse482 = _cse478*_cse61
+    _cse483 = _cse39*_cse480
+    _cse484 = _cse37*_cse478
+    _cse485 = _cse0*_cse480
+    _cse486 = _cse428 + _cse470*_cse97 - 0.0309919044627574*_cse471 + _cse472*_cse95 - 0.0309919044627574*_cse473 - 0.0439876856535455*_cse474 - 0.0181297165934418*_cse475 - 0.0181297165934418*_cse476 + 0.0439876856535455*_cse477 + _cse478*_cse57 + 0.0050298*_cse479 + _cse480*_cse93 + 0.0050298*_cse481 - 0.0019534*_cse482 - 0.0019534*_cse483 - 0.01718495619792*_cse484 + 0.01718495619792*_cse485 + x*(_cse415 + 1.8987869684628e-6*_cse471 + 1.8987869684628e-6*_cse473 + 1.9561995392714e-6*_cse474 + 1.14610355371469e-6*_cse475 + 1.14610355371469e-6*_cse476 - 1.9561995392714e-6*_cse477 - 0.45478971*_cse479 - 0.45478971*_cse481 - 0.890598824*_cse482 - 0.890598824*_cse483) + y*(0.213215245107779*_cse0*_cse480 + 0.334218649384678*_cse14*_cse472 + 0.403618758*_cse39*_cse480 - _cse419 - 0.324409654194476*_cse471 - 0.324409654194476*_cse473 - 0.334218649384678*_cse474 - 0.19581293936857*_cse475 - 0.19581293936857*_cse476 + 0.403618758*_cse478*_cse61 - 0.790154512*_cse479 - 0.790154512*_cse481 - 0.213215245107779*_cse484) + z*(_cse423 + 0.227149603970304*_cse471 + 0.227149603970304*_cse473 + 0.234017800844203*_cse474 + 0.137106991283212*_cse475 + 0.137106991283212*_cse476 - 0.234017800844203*_cse477 - 0.410879747*_cse479 - 0.410879747*_cse481 + 0.209584432*_cse482 + 0.209584432*_cse483 + 0.410149995883665*_cse484 - 0.410149995883665*_cse485)
+    _cse487 = _cse0*_cse78
+    _cse488 = _cse40*_cse78
+    _cse489 = _cse43*_cse78
+    _cse490 = _cse37*_cse82
+    _cse491 = _cse59*_cse82
+    _cse492 = _cse61*_cse82
+    _cse493 = _cse38*_cse78 - 0.01718495619792*_cse487 - 0.0019534*_cse488 + 0.0050298*_cse489 - 0.01718495619792*_cse490 + 0.0050298*_cse491 - 0.0019534*_cse492 + _cse57*_cse82 + x*(-0.890598824*_cse488 - 0.45478971*_cse489 - 0.45478971*_cse491 - 0.890598824*_cse492) + y*(0.403618758*_cse40*_cse78 - 0.213215245107779*_cse487 - 0.790154512*_cse489 - 0.213215245107779*_cse490 - 0.790154512*_cse491 + 0.403618758*_cse61*_cse82) + z*(0.410149995883665*_cse487 + 0.209584432*_cse488 - 0.410879747*_cse489 + 0.410149995883665*_cse490 - 0.410879747*_cse491 + 0.209584432*_cse492)
+    _cse494 = _cse13*_cse67
+    _cse495 = _cse14*_cse65
+    _cse496 = _cse24*_cse67
+    _cse497 = _cse15*_cse67
+    _cse498 = _cse129*_cse65
+    _cse499 = _cse21*_cse65
+    _cse500 = 0.517383113*_cse15*_cse67 + 0.517383113*_cse21*_cse65 - 0.855753802*_cse496 - 0.855753802*_cse498
+    _cse501 = _cse37*_cse500
+    _cse502 = _cse500*_cse59
+    _cse503 = _cse500*_cse61
+    _cse504 = -_cse45*_cse65 - _cse47*_cse67 + 0.458851168*_cse496 + 0.758601438*_cse497 + 0.458851168*_cse498 + 0.758601438*_cse499
+    _cse505 = _cse0*_cse504
+    _cse506 = _cse42*_cse504
+    _cse507 = _cse39*_cse504
+    _cse508 = -0.0439876856535455*_cse494 - 0.0439876856535455*_cse495 - 0.0181297165934418*_cse496 - 0.0309919044627574*_cse497 - 0.0181297165934418*_cse498 - 0.0309919044627574*_cse499 + _cse500*_cse57 - 0.01718495619792*_cse501 + 0.0050298*_cse502 - 0.0019534*_cse503 + _cse504*_cse93 + 0.01718495619792*_cse505 + 0.0050298*_cse506 - 0.0019534*_cse507 + _cse65*_cse94 + _cse67*_cse97 + x*(1.9561995392714e-6*_cse494 + 1.9561995392714e-6*_cse495 + 1.14610355371469e-6*_cse496 + 1.8987869684628e-6*_cse497 + 1.14610355371469e-6*_cse498 + 1.8987869684628e-6*_cse499 - 0.45478971*_cse502 - 0.890598824*_cse503 - 0.45478971*_cse506 - 0.890598824*_cse507) + y*(0.213215245107779*_cse0*_cse504 + 0.403618758*_cse39*_cse504 - 0.334218649384678*_cse494 - 0.334218649384678*_cse495 - 0.19581293936857*_cse496 - 0.324409654194476*_cse497 - 0.19581293936857*_cse498 - 0.324409654194476*_cse499 + 0.403618758*_cse500*_cse61 - 0.213215245107779*_cse501 - 0.790154512*_cse502 - 0.790154512*_cse506) + z*(0.234017800844203*_cse494 + 0.234017800844203*_cse495 + 0.137106991283212*_cse496 + 0.227149603970304*_cse497 + 0.137106991283212*_cse498 + 0.227149603970304*_cse499 + 0.410149995883665*_cse501 - 0.410879747*_cse502 + 0.209584432*_cse503 - 0.410149995883665*_cse505 - 0.410879747*_cse506 + 0.209584432*_cse507)
+    _cse509 = _cse0*_cse134
+    _cse510 = _cse134*_cse40
+    _cse511 = _cse134*_cse43
+    _cse512 = _cse138*_cse37
+    _cse513 = _cse138*_cse59
+    _cse514 = _cse138*_cse61
+    _cse515 = _cse134*_cse38 + _cse138*_cse57 - 0.01718495619792*_cse509 - 0.0019534*_cse510 + 0.0050298*_cse511 - 0.01718495619792*_cse512 + 0.0050298*_cse513 - 0.0019534*_cse514 + x*(-0.890598824*_cse510 - 0.45478971*_cse511 - 0.45478971*_cse513 - 0.890598824*_cse514) + y*(0.403618758*_cse134*_cse40 + 0.403618758*_cse138*_cse61 - 0.213215245107779*_cse509 - 0.790154512*_cse511 - 0.213215245107779*_cse512 - 0.790154512*_cse513) + z*(0.410149995883665*_cse509 + 0.209584432*_cse510 - 0.410879747*_cse511 + 0.410149995883665*_cse512 - 0.410879747*_cse513 + 0.209584432*_cse514)
+    _cse516 = _cse14*_cse20
+    _cse517 = _cse12*_cse13
+    _cse518 = _cse129*_cse20
+    _cse519 = _cse12*_cse321
+    _cse520 = _cse12*_cse323
+    _cse521 = _cse20*_cse21
+    _cse522 = 0.517383113*_cse12*_cse321 + 0.517383113*_cse20*_cse21 - 0.855753802*_cse518 - 0.855753802*_cse520
+    _cse523 = _cse37*_cse522
+    _cse524 = _cse522*_cse59
+    _cse525 = _cse522*_cse61
+    _cse526 = -_cse46 + _cse48 + 0.458851168*_cse518 + 0.758601438*_cse519 + 0.458851168*_cse520 + 0.758601438*_cse521
+    _cse527 = _cse0*_cse526
+    _cse528 = _cse42*_cse526
+    _cse529 = _cse39*_cse526
+    _cse530 = 0.234017800844203*_cse516
+    _cse531 = 0.234017800844203*_cse517
+    _cse532 = _cse35*_cse37
+    _cse533 = _cse342*_cse35
+    _cse534 = _cse35*_cse58
+    _cse535 = _cse0*_cse54
+    _cse536 = _cse40*_cse54
+    _cse537 = _cse43*_cse54
+    _cse538 = 0.410149995883665*_cse532
+    _cse539 = 0.410149995883665*_cse535
+    _cse540 = 0.999999998572139*_cse10 + 0.999999998572139*_cse7
+    _cse541 = -_cse540
+    _cse542 = _cse24*_cse541
+    _cse543 = 6.57617443000635e-7*_cse10 + 6.57617443000635e-7*_cse7
+    _cse544 = -_cse543
+    _cse545 = _cse26*_cse544
+    _cse546 = _cse29 - _cse32
+    _cse547 = 0.517383113*_cse15*_cse541 + 0.517383113*_cse22*_cse544 - 0.855753802*_cse542 - 0.855753802*_cse545 - _cse546
+    _cse548 = _cse0*_cse547
+    _cse549 = _cse40*_cse547
+    _cse550 = _cse43*_cse547
+    _cse551 = _cse15*_cse541
+    _cse552 = _cse22*_cse544
+    _cse553 = _cse45*_cse544 - _cse47*_cse541 - _cse49 + _cse51 + 0.458851168*_cse542 + 0.458851168*_cse545 + 0.758601438*_cse551 + 0.758601438*_cse552
+    _cse554 = _cse37*_cse553
+    _cse555 = _cse553*_cse59
+    _cse556 = _cse553*_cse61
+    _cse557 = _cse38*_cse547 - 0.01718495619792*_cse548 - 0.0019534*_cse549 + 0.0050298*_cse550 + _cse553*_cse57 - 0.01718495619792*_cse554 + 0.0050298*_cse555 - 0.0019534*_cse556 + x*(-0.890598824*_cse549 - 0.45478971*_cse550 - 0.45478971*_cse555 - 0.890598824*_cse556) + y*(0.403618758*_cse40*_cse547 - 0.213215245107779*_cse548 - 0.790154512*_cse550 + 0.403618758*_cse553*_cse61 - 0.213215245107779*_cse554 - 0.790154512*_cse555) + z*(0.410149995883665*_cse548 + 0.209584432*_cse549 - 0.410879747*_cse550 + 0.410149995883665*_cse554 - 0.410879747*_cse555 + 0.209584432*_cse556)
+    _cse558 = _cse14*_cse541
+    _cse559 = _cse13*_cse544
+    _cse560 = _cse129*_cse541
+    _cse561 = _cse21*_cse541
+    _cse562 = _cse24*_cse544
+    _cse563 = _cse15*_cse544
+    _cse564 = 0.517383113*_cse15*_cse544 + 0.517383113*_cse21*_cse541 - 0.855753802*_cse560 - 0.855753802*_cse562
+    _cse565 = _cse37*_cse564
+    _cse566 = _cse564*_cse59
+    _cse567 = _cse564*_cse61
+    _cse568 = -_cse45*_cse541 - _cse47*_cse544 + 0.458851168*_cse560 + 0.758601438*_cse561 + 0.458851168*_cse562 + 0.758601438*_cse563
+    _cse569 = _cse0*_cse568
+    _cse570 = _cse42*_cse568
+    _cse571 = _cse39*_cse568
+    _cse572 = _cse541*_cse94 + _cse544*_cse97 - 0.0439876856535455*_cse558 - 0.0439876856535455*_cse559 - 0.0181297165934418*_cse560 - 0.0309919044627574*_cse561 - 0.0181297165934418*_cse562 - 0.0309919044627574*_cse563 + _cse564*_cse57 - 0.01718495619792*_cse565 + 0.0050298*_cse566 - 0.0019534*_cse567 + _cse568*_cse93 + 0.01718495619792*_cse569 + 0.0050298*_cse570 - 0.0019534*_cse571 + x*(1.9561995392714e-6*_cse558 + 1.9561995392714e-6*_cse559 + 1.14610355371469e-6*_cse560 + 1.8987869684628e-6*_cse561 + 1.14610355371469e-6*_cse562 + 1.8987869684628e-6*_cse563 - 0.45478971*_cse566 - 0.890598824*_cse567 - 0.45478971*_cse570 - 0.890598824*_cse571) + y*(0.213215245107779*_cse0*_cse568 + 0.403618758*_cse39*_cse568 - 0.334218649384678*_cse558 - 0.334218649384678*_cse559 - 0.19581293936857*_cse560 - 0.324409654194476*_cse561 - 0.19581293936857*_cse562 - 0.324409654194476*_cse563 + 0.403618758*_cse564*_cse61 - 0.213215245107779*_cse565 - 0.790154512*_cse566 - 0.790154512*_cse570) + z*(0.234017800844203*_cse558 + 0.234017800844203*_cse559 + 0.137106991283212*_cse560 + 0.227149603970304*_cse561 + 0.137106991283212*_cse562 + 0.227149603970304*_cse563 + 0.410149995883665*_cse565 - 0.410879747*_cse566 + 0.209584432*_cse567 - 0.410149995883665*_cse569 - 0.410879747*_cse570 + 0.209584432*_cse571)
+    _cse573 = 0.227539183449751*_cse7
+    _cse574 = 0.227539183449751*_cse10
+    _cse575 = -0.999999998572139*_cse28 + 0.999999998572139*_cse31
+    _cse576 = -_cse575
+    _cse577 = _cse13*_cse576
+    _cse578 = 0.0439876856535455*_cse577
+    _cse579 = -6.57617443000635e-7*_cse28 + 6.57617443000635e-7*_cse31
+    _cse580 = -_cse579
+    _cse581 = _cse14*_cse580
+    _cse582 = 0.0439876856535455*_cse581
+    _cse583 = _cse24*_cse576
+    _cse584 = _cse15*_cse576
+    _cse585 = _cse22*_cse580
+    _cse586 = _cse26*_cse580
+    _cse587 = 0.000346321299837637*_cse10 + 0.000346321299837637*_cse7
+    _cse588 = 0.517383113*_cse15*_cse576 + 0.517383113*_cse22*_cse580 - 0.855753802*_cse583 - 0.855753802*_cse586 - _cse587
+    _cse589 = _cse37*_cse588
+    _cse590 = 0.01718495619792*_cse589
+    _cse591 = _cse588*_cse59
+    _cse592 = _cse588*_cse61
+    _cse593 = 0.818687841791724*_cse7
+    _cse594 = 0.818687841791724*_cse10
+    _cse595 = _cse47*_cse576
+    _cse596 = _cse45*_cse580
+    _cse597 = 0.458851168*_cse583 + 0.758601438*_cse584 + 0.758601438*_cse585 + 0.458851168*_cse586 + _cse593 + _cse594 - _cse595 + _cse596
+    _cse598 = _cse0*_cse597
+    _cse599 = 0.01718495619792*_cse598
+    _cse600 = _cse42*_cse597
+    _cse601 = _cse39*_cse597
+    _cse602 = -1.9561995392714e-6*_cse577 + 1.9561995392714e-6*_cse581
+    _cse603 = 2.75322908921405e-6*_cse10 + 2.75322908921405e-6*_cse7
+    _cse604 = 0.334218649384678*_cse577
+    _cse605 = 0.334218649384678*_cse581
+    _cse606 = 0.470391945795628*_cse10
+    _cse607 = 0.470391945795628*_cse7
+    _cse608 = 0.213215245107779*_cse589 - 0.213215245107779*_cse598
+    _cse609 = 0.329365488408814*_cse7
+    _cse610 = 0.329365488408814*_cse10
+    _cse611 = 0.234017800844203*_cse577
+    _cse612 = 0.234017800844203*_cse581
+    _cse613 = 0.410149995883665*_cse589
+    _cse614 = 0.410149995883665*_cse598
+    _cse615 = _cse101 + _cse102 - _cse103 + _cse57*_cse588 + _cse573 + _cse574 + _cse576*_cse97 - _cse578 + _cse580*_cse95 + _cse582 - 0.0181297165934418*_cse583 - 0.0309919044627574*_cse584 - 0.0309919044627574*_cse585 - 0.0181297165934418*_cse586 - _cse590 + 0.0050298*_cse591 - 0.0019534*_cse592 + _cse597*_cse93 + _cse599 + 0.0050298*_cse600 - 0.0019534*_cse601 + _cse99 + x*(1.8987869684628e-6*_cse15*_cse576 + 1.8987869684628e-6*_cse22*_cse580 + 1.14610355371469e-6*_cse24*_cse576 + 1.14610355371469e-6*_cse26*_cse580 - 0.45478971*_cse591 - 0.890598824*_cse592 - 0.45478971*_cse600 - 0.890598824*_cse601 - _cse602 - _cse603) + y*(0.403618758*_cse39*_cse597 - 0.19581293936857*_cse583 - 0.324409654194476*_cse584 - 0.324409654194476*_cse585 - 0.19581293936857*_cse586 + 0.403618758*_cse588*_cse61 - 0.790154512*_cse591 - 0.790154512*_cse600 - _cse604 + _cse605 + _cse606 + _cse607 - _cse608) + z*(0.137106991283212*_cse583 + 0.227149603970304*_cse584 + 0.227149603970304*_cse585 + 0.137106991283212*_cse586 - 0.410879747*_cse591 + 0.209584432*_cse592 - 0.410879747*_cse600 + 0.209584432*_cse601 - _cse609 - _cse610 + _cse611 - _cse612 + _cse613 - _cse614)
+    _cse616 = _cse15*_cse575
+    _cse617 = _cse22*_cse579
+    _cse618 = _cse13*_cse575
+    _cse619 = _cse24*_cse575
+    _cse620 = _cse26*_cse579
+    _cse621 = _cse14*_cse579
+    _cse622 = _cse587 + 0.517383113*_cse616 + 0.517383113*_cse617 - 0.855753802*_cse619 - 0.855753802*_cse620
+    _cse623 = _cse59*_cse622
+    _cse624 = _cse45*_cse579 - _cse47*_cse575 - _cse593 - _cse594 + 0.758601438*_cse616 + 0.758601438*_cse617 + 0.458851168*_cse619 + 0.458851168*_cse620
+    _cse625 = _cse42*_cse624
+    _cse626 = _cse61*_cse622
+    _cse627 = _cse39*_cse624
+    _cse628 = _cse37*_cse622
+    _cse629 = _cse0*_cse624
+    _cse630 = -_cse102 + _cse103 + _cse57*_cse622 - _cse573 - _cse574 + _cse575*_cse97 + _cse579*_cse95 - 0.0309919044627574*_cse616 - 0.0309919044627574*_cse617 - 0.0439876856535455*_cse618 - 0.0181297165934418*_cse619 - 0.0181297165934418*_cse620 + 0.0439876856535455*_cse621 + 0.0050298*_cse623 + _cse624*_cse93 + 0.0050298*_cse625 - 0.0019534*_cse626 - 0.0019534*_cse627 - 0.01718495619792*_cse628 + 0.01718495619792*_cse629 + x*(_cse603 + 1.8987869684628e-6*_cse616 + 1.8987869684628e-6*_cse617 + 1.9561995392714e-6*_cse618 + 1.14610355371469e-6*_cse619 + 1.14610355371469e-6*_cse620 - 1.9561995392714e-6*_cse621 - 0.45478971*_cse623 - 0.45478971*_cse625 - 0.890598824*_cse626 - 0.890598824*_cse627) + y*(0.213215245107779*_cse0*_cse624 + 0.334218649384678*_cse14*_cse579 + 0.403618758*_cse39*_cse624 - _cse606 - _cse607 + 0.403618758*_cse61*_cse622 - 0.324409654194476*_cse616 - 0.324409654194476*_cse617 - 0.334218649384678*_cse618 - 0.19581293936857*_cse619 - 0.19581293936857*_cse620 - 0.790154512*_cse623 - 0.790154512*_cse625 - 0.213215245107779*_cse628) + z*(_cse609 + _cse610 + 0.227149603970304*_cse616 + 0.227149603970304*_cse617 + 0.234017800844203*_cse618 + 0.137106991283212*_cse619 + 0.137106991283212*_cse620 - 0.234017800844203*_cse621 - 0.410879747*_cse623 - 0.410879747*_cse625 + 0.209584432*_cse626 + 0.209584432*_cse627 + 0.410149995883665*_cse628 - 0.410149995883665*_cse629)
+    _cse631 = _cse15*_cse540
+    _cse632 = _cse22*_cse543
+    _cse633 = _cse24*_cse540
+    _cse634 = _cse26*_cse543
+    _cse635 = _cse546 + 0.517383113*_cse631 + 0.517383113*_cse632 - 0.855753802*_cse633 - 0.855753802*_cse634
+    _cse636 = _cse0*_cse635
+    _cse637 = _cse40*_cse635
+    _cse638 = _cse43*_cse635
+    _cse639 = _cse45*_cse543 - _cse47*_cse540 + _cse49 - _cse51 + 0.758601438*_cse631 + 0.758601438*_cse632 + 0.458851168*_cse633 + 0.458851168*_cse634
+    _cse640 = _cse37*_cse639
+    _cse641 = _cse59*_cse639
+    _cse642 = _cse61*_cse639
+    _cse643 = _cse38*_cse635 + _cse57*_cse639 - 0.01718495619792*_cse636 - 0.0019534*_cse637 + 0.0050298*_cse638 - 0.01718495619792*_cse640 + 0.0050298*_cse641 - 0.0019534*_cse642 + x*(-0.890598824*_cse637 - 0.45478971*_cse638 - 0.45478971*_cse641 - 0.890598824*_cse642) + y*(0.403618758*_cse40*_cse635 + 0.403618758*_cse61*_cse639 - 0.213215245107779*_cse636 - 0.790154512*_cse638 - 0.213215245107779*_cse640 - 0.790154512*_cse641) + z*(0.410149995883665*_cse636 + 0.209584432*_cse637 - 0.410879747*_cse638 + 0.410149995883665*_cse640 - 0.410879747*_cse641 + 0.209584432*_cse642)
+    _cse644 = _cse13*_cse543
+    _cse645 = _cse14*_cse540
+    _cse646 = _cse24*_cse543
+    _cse647 = _cse15*_cse543
+    _cse648 = _cse129*_cse540
+    _cse649 = _cse21*_cse540
+    _cse650 = 0.517383113*_cse15*_cse543 + 0.517383113*_cse21*_cse540 - 0.855753802*_cse646 - 0.855753802*_cse648
+    _cse651 = _cse37*_cse650
+    _cse652 = _cse59*_cse650
+    _cse653 = _cse61*_cse650
+    _cse654 = -_cse45*_cse540 - _cse47*_cse543 + 0.458851168*_cse646 + 0.758601438*_cse647 + 0.458851168*_cse648 + 0.758601438*_cse649
+    _cse655 = _cse0*_cse654
+    _cse656 = _cse42*_cse654
+    _cse657 = _cse39*_cse654
+    _cse658 = _cse540*_cse94 + _cse543*_cse97 + _cse57*_cse650 - 0.0439876856535455*_cse644 - 0.0439876856535455*_cse645 - 0.0181297165934418*_cse646 - 0.0309919044627574*_cse647 - 0.0181297165934418*_cse648 - 0.0309919044627574*_cse649 - 0.01718495619792*_cse651 + 0.0050298*_cse652 - 0.0019534*_cse653 + _cse654*_cse93 + 0.01718495619792*_cse655 + 0.0050298*_cse656 - 0.0019534*_cse657 + x*(1.9561995392714e-6*_cse644 + 1.9561995392714e-6*_cse645 + 1.14610355371469e-6*_cse646 + 1.8987869684628e-6*_cse647 + 1.14610355371469e-6*_cse648 + 1.8987869684628e-6*_cse649 - 0.45478971*_cse652 - 0.890598824*_cse653 - 0.45478971*_cse656 - 0.890598824*_cse657) + y*(0.213215245107779*_cse0*_cse654 + 0.403618758*_cse39*_cse654 + 0.403618758*_cse61*_cse650 - 0.334218649384678*_cse644 - 0.334218649384678*_cse645 - 0.19581293936857*_cse646 - 0.324409654194476*_cse647 - 0.19581293936857*_cse648 - 0.324409654194476*_cse649 - 0.213215245107779*_cse651 - 0.790154512*_cse652 - 0.790154512*_cse656) + z*(0.234017800844203*_cse644 + 0.234017800844203*_cse645 + 0.137106991283212*_cse646 + 0.227149603970304*_cse647 + 0.137106991283212*_cse648 + 0.227149603970304*_cse649 + 0.410149995883665*_cse651 - 0.410879747*_cse652 + 0.209584432*_cse653 - 0.410149995883665*_cse655 - 0.410879747*_cse656 + 0.209584432*_cse657)
+    _cse659 = _cse129*_cse576
+    _cse660 = _cse24*_cse580
+    _cse661 = 0.517383113*_cse15*_cse580 + 0.517383113*_cse21*_cse576 - 0.855753802*_cse659 - 0.855753802*_cse660
+    _cse662 = _cse0*_cse661
+    _cse663 = _cse40*_cse661
+    _cse664 = _cse43*_cse661
+    _cse665 = _cse21*_cse576
+    _cse666 = _cse15*_cse580
+    _cse667 = -_cse45*_cse576 - _cse47*_cse580 + 0.458851168*_cse659 + 0.458851168*_cse660 + 0.758601438*_cse665 + 0.758601438*_cse666
+    _cse668 = _cse37*_cse667
+    _cse669 = _cse59*_cse667
+    _cse670 = _cse61*_cse667
+    _cse671 = _cse38*_cse661 + _cse57*_cse667 - 0.01718495619792*_cse662 - 0.0019534*_cse663 + 0.0050298*_cse664 - 0.01718495619792*_cse668 + 0.0050298*_cse669 - 0.0019534*_cse670 + x*(-0.890598824*_cse663 - 0.45478971*_cse664 - 0.45478971*_cse669 - 0.890598824*_cse670) + y*(0.403618758*_cse40*_cse661 + 0.403618758*_cse61*_cse667 - 0.213215245107779*_cse662 - 0.790154512*_cse664 - 0.213215245107779*_cse668 - 0.790154512*_cse669) + z*(0.410149995883665*_cse662 + 0.209584432*_cse663 - 0.410879747*_cse664 + 0.410149995883665*_cse668 - 0.410879747*_cse669 + 0.209584432*_cse670)
+    _cse672 = _cse321*_cse576
+    _cse673 = _cse323*_cse576
+    _cse674 = _cse129*_cse580
+    _cse675 = _cse21*_cse580
+    _cse676 = 0.517383113*_cse672 - 0.855753802*_cse673 - 0.855753802*_cse674 + 0.517383113*_cse675
+    _cse677 = _cse37*_cse676
+    _cse678 = _cse59*_cse676
+    _cse679 = _cse61*_cse676
+    _cse680 = _cse595 - _cse596 + 0.758601438*_cse672 + 0.458851168*_cse673 + 0.458851168*_cse674 + 0.758601438*_cse675
+    _cse681 = _cse0*_cse680
+    _cse682 = _cse42*_cse680
+    _cse683 = _cse39*_cse680
+    _cse684 = _cse342*_cse588
+    _cse685 = _cse58*_cse588
+    _cse686 = _cse40*_cse597
+    _cse687 = _cse43*_cse597
+    _cse688 = _cse1*dq0
+    _cse689 = _cse188 + _cse190
+    _cse690 = 0.574238819026787*_cse190
+    _cse691 = 0.574238819026787*_cse188
+    _cse692 = _cse14*_cse303
+    _cse693 = _cse13*_cse305
+    _cse694 = 0.410149995883665*_cse0
+    _cse695 = 0.209584432*_cse40
+    _cse696 = 0.410879747*_cse43
+    _cse697 = 0.410149995883665*_cse37
+    _cse698 = 0.410879747*_cse59
+    _cse699 = 0.209584432*_cse61
+    _cse700 = 0.410879747*_cse42
+    _cse701 = 0.209584432*_cse39
+    _cse702 = _cse3*dq0
+    _cse703 = _cse74 + _cse76
+    _cse704 = 0.574238819026787*_cse76
+    _cse705 = 0.574238819026787*_cse74
+    _cse706 = -_cse28 + _cse31
+    _cse707 = 0.408002994597976*_cse14
+    _cse708 = 0.408002994597976*_cse13
+    _cse709 = 0.574238819026787*_cse31
+    _cse710 = 0.574238819026787*_cse28
+    _cse711 = 0.234017800844203*_cse14
+    _cse712 = 0.234017800844203*_cse13
+    _cse713 = 0.329365488408814*_cse31
+    _cse714 = 0.329365488408814*_cse28
+    out = np.empty((6, 6))
+    out[0, 0] = _cse105*dq2 + _cse126*dq1 + _cse143*dq3 + _cse64*dq4 + dq0*(_cse1*_cse181 - 4.3259e-5*_cse1 + _cse145*_cse97 - 0.0309919044627574*_cse146 + _cse148*_cse95 - 0.0309919044627574*_cse149 - 0.0439876856535455*_cse150 - 0.0181297165934418*_cse151 - 0.0181297165934418*_cse152 + 0.0439876856535455*_cse153 + _cse157*_cse57 + 0.0050298*_cse158 + _cse162*_cse93 + 0.0050298*_cse163 - 0.0019534*_cse164 - 0.0019534*_cse165 - 0.01718495619792*_cse171 + 0.01718495619792*_cse175 + _cse179*z + 1.098e-6*_cse182 - _cse184 - _cse185 - _cse186 + _cse193 + 0.0068032576553314*_cse3 + x*(1.8987869684628e-6*_cse146 + 1.8987869684628e-6*_cse149 + 1.9561995392714e-6*_cse150 + 1.14610355371469e-6*_cse151 + 1.14610355371469e-6*_cse152 - 1.9561995392714e-6*_cse153 - 0.45478971*_cse158 - 0.45478971*_cse163 - 0.890598824*_cse164 - 0.890598824*_cse165 + _cse170) + y*(0.213215245107779*_cse0*_cse162 + 0.334218649384678*_cse14*_cse148 - 0.324409654194476*_cse146 - 0.324409654194476*_cse149 - 0.334218649384678*_cse150 - 0.19581293936857*_cse151 - 0.19581293936857*_cse152 + 0.403618758*_cse157*_cse61 - 0.790154512*_cse158 + 0.403618758*_cse162*_cse39 - 0.790154512*_cse163 - 0.213215245107779*_cse171 - _cse174))
+    out[0, 1] = _cse126*dq0 + _cse211*dq4 + _cse226*dq3 + _cse246*dq2 + dq1*(0.01718495619792*_cse0*_cse255 - _cse1*_cse180 + 1.098e-6*_cse1*_cse8 + 0.0439876856535455*_cse14*_cse147 + _cse144*_cse97 + _cse147*_cse95 - _cse184 - _cse186 - _cse245 + _cse253*_cse57 + 0.0050298*_cse253*_cse59 + 0.0050298*_cse255*_cse42 + _cse255*_cse93 + _cse259*x + _cse261*y + _cse263*z - _cse264 - _cse265 - _cse266 - _cse267 - _cse268 - _cse269 - _cse270 - _cse271)
+    out[0, 2] = _cse105*dq0 + _cse246*dq1 + _cse286*dq4 + _cse301*dq3 + dq2*(_cse144*_cse97 + _cse147*_cse95 + _cse182*_cse302 + _cse193 + _cse244 + 0.0439876856535455*_cse252 + _cse253*_cse57 + 0.0050298*_cse254 + _cse255*_cse93 + 0.0050298*_cse256 + _cse259*x + _cse261*y + 0.01718495619792*_cse262 + _cse263*z - _cse264 - _cse265 - _cse266 - _cse267 - _cse268 - _cse269 - _cse270 - _cse271)
+    out[0, 3] = _cse143*dq0 + _cse226*dq1 + _cse301*dq2 + _cse317*dq4 + dq3*(_cse303*_cse96 + _cse305*_cse94 + 0.0439876856535455*_cse318 - 0.0439876856535455*_cse319 - 0.0181297165934418*_cse320 - 0.0309919044627574*_cse322 - 0.0181297165934418*_cse324 - 0.0309919044627574*_cse325 + _cse326*_cse57 - 0.01718495619792*_cse327 + 0.0050298*_cse328 - 0.0019534*_cse329 + _cse332*_cse93 + 0.01718495619792*_cse333 + 0.0050298*_cse334 - 0.0019534*_cse335 + x*(-1.9561995392714e-6*_cse318 + 1.9561995392714e-6*_cse319 + 1.14610355371469e-6*_cse320 + 1.8987869684628e-6*_cse322 + 1.14610355371469e-6*_cse324 + 1.8987869684628e-6*_cse325 - 0.45478971*_cse328 - 0.890598824*_cse329 - 0.45478971*_cse334 - 0.890598824*_cse335) + y*(0.213215245107779*_cse0*_cse332 + 0.334218649384678*_cse13*_cse303 - 0.334218649384678*_cse319 - 0.19581293936857*_cse320 - 0.324409654194476*_cse322 - 0.19581293936857*_cse324 - 0.324409654194476*_cse325 + 0.403618758*_cse326*_cse61 - 0.213215245107779*_cse327 - 0.790154512*_cse328 + 0.403618758*_cse332*_cse39 - 0.790154512*_cse334) + z*(-0.234017800844203*_cse318 + 0.234017800844203*_cse319 + 0.137106991283212*_cse320 + 0.227149603970304*_cse322 + 0.137106991283212*_cse324 + 0.227149603970304*_cse325 + 0.410149995883665*_cse327 - 0.410879747*_cse328 + 0.209584432*_cse329 - 0.410149995883665*_cse333 - 0.410879747*_cse334 + 0.209584432*_cse335))
+    out[0, 4] = _cse211*dq1 + _cse286*dq2 + _cse317*dq3 + _cse64*dq0 + dq4*(_cse340*_cse56 + 0.01718495619792*_cse341 - 0.0019534*_cse343 + 0.0050298*_cse344 + _cse345*_cse38 - 0.01718495619792*_cse346 - 0.0019534*_cse347 + 0.0050298*_cse348 + x*(-0.890598824*_cse343 - 0.45478971*_cse344 - 0.890598824*_cse347 - 0.45478971*_cse348) + y*(0.213215245107779*_cse341 + 0.403618758*_cse343 - 0.790154512*_cse344 - 0.213215245107779*_cse346 + 0.403618758*_cse347 - 0.790154512*_cse348) + z*(-0.410149995883665*_cse341 + 0.209584432*_cse343 - 0.410879747*_cse344 + 0.410149995883665*_cse346 + 0.209584432*_cse347 - 0.410879747*_cse348))
+    out[0, 5] = 0
+    out[1, 0] = _cse355*dq4 + _cse370*dq2 + _cse380*dq1 + _cse395*dq3 + dq0*(0.0068032576553314*_cse1 - _cse181*_cse3 + 4.3259e-5*_cse3 + _cse396*_cse97 - 0.0309919044627574*_cse397 + _cse398*_cse95 - 0.0309919044627574*_cse399 - 0.0439876856535455*_cse400 - 0.0181297165934418*_cse401 - 0.0181297165934418*_cse402 + 0.0439876856535455*_cse403 + _cse404*_cse57 + 0.0050298*_cse405 + _cse407*_cse93 + 0.0050298*_cse408 - 0.0019534*_cse409 - 0.0019534*_cse410 - 0.01718495619792*_cse416 + 0.01718495619792*_cse420 + _cse428 + _cse430 + x*(1.8987869684628e-6*_cse397 + 1.8987869684628e-6*_cse399 + 1.9561995392714e-6*_cse400 + 1.14610355371469e-6*_cse401 + 1.14610355371469e-6*_cse402 - 1.9561995392714e-6*_cse403 - 0.45478971*_cse405 - 0.45478971*_cse408 - 0.890598824*_cse409 - 0.890598824*_cse410 + _cse415) + y*(0.213215245107779*_cse0*_cse407 + 0.334218649384678*_cse14*_cse398 + 0.403618758*_cse39*_cse407 - 0.324409654194476*_cse397 - 0.324409654194476*_cse399 - 0.334218649384678*_cse400 - 0.19581293936857*_cse401 - 0.19581293936857*_cse402 + 0.403618758*_cse404*_cse61 - 0.790154512*_cse405 - 0.790154512*_cse408 - 0.213215245107779*_cse416 - _cse419) + z*(0.227149603970304*_cse397 + 0.227149603970304*_cse399 + 0.234017800844203*_cse400 + 0.137106991283212*_cse401 + 0.137106991283212*_cse402 - 0.234017800844203*_cse403 - 0.410879747*_cse405 - 0.410879747*_cse408 + 0.209584432*_cse409 + 0.209584432*_cse410 + 0.410149995883665*_cse416 - 0.410149995883665*_cse420 + _cse423))
+    out[1, 1] = _cse380*dq0 + _cse437*dq4 + _cse452*dq3 + _cse469*dq2 + dq1*(_cse180*_cse3 + _cse430 + _cse486)
+    out[1, 2] = _cse370*dq0 + _cse469*dq1 + _cse493*dq4 + _cse508*dq3 + dq2*(-_cse302*_cse73 - _cse453 + _cse486)
+    out[1, 3] = _cse395*dq0 + _cse452*dq1 + _cse508*dq2 + _cse515*dq4 + dq3*(_cse12*_cse96 + _cse20*_cse94 - 0.0439876856535455*_cse516 + 0.0439876856535455*_cse517 - 0.0181297165934418*_cse518 - 0.0309919044627574*_cse519 - 0.0181297165934418*_cse520 - 0.0309919044627574*_cse521 + _cse522*_cse57 - 0.01718495619792*_cse523 + 0.0050298*_cse524 - 0.0019534*_cse525 + _cse526*_cse93 + 0.01718495619792*_cse527 + 0.0050298*_cse528 - 0.0019534*_cse529 + x*(1.9561995392714e-6*_cse516 - 1.9561995392714e-6*_cse517 + 1.14610355371469e-6*_cse518 + 1.8987869684628e-6*_cse519 + 1.14610355371469e-6*_cse520 + 1.8987869684628e-6*_cse521 - 0.45478971*_cse524 - 0.890598824*_cse525 - 0.45478971*_cse528 - 0.890598824*_cse529) + y*(0.213215245107779*_cse0*_cse526 + 0.334218649384678*_cse12*_cse13 + 0.403618758*_cse39*_cse526 - 0.334218649384678*_cse516 - 0.19581293936857*_cse518 - 0.324409654194476*_cse519 - 0.19581293936857*_cse520 - 0.324409654194476*_cse521 + 0.403618758*_cse522*_cse61 - 0.213215245107779*_cse523 - 0.790154512*_cse524 - 0.790154512*_cse528) + z*(0.137106991283212*_cse518 + 0.227149603970304*_cse519 + 0.137106991283212*_cse520 + 0.227149603970304*_cse521 + 0.410149995883665*_cse523 - 0.410879747*_cse524 + 0.209584432*_cse525 - 0.410149995883665*_cse527 - 0.410879747*_cse528 + 0.209584432*_cse529 + _cse530 - _cse531))
+    out[1, 4] = _cse355*dq0 + _cse437*dq1 + _cse493*dq2 + _cse515*dq3 + dq4*(_cse35*_cse56 + _cse38*_cse54 + 0.01718495619792*_cse532 - 0.0019534*_cse533 + 0.0050298*_cse534 - 0.01718495619792*_cse535 - 0.0019534*_cse536 + 0.0050298*_cse537 + x*(-0.890598824*_cse533 - 0.45478971*_cse534 - 0.890598824*_cse536 - 0.45478971*_cse537) + y*(0.213215245107779*_cse532 + 0.403618758*_cse533 - 0.790154512*_cse534 - 0.213215245107779*_cse535 + 0.403618758*_cse536 - 0.790154512*_cse537) + z*(0.209584432*_cse533 - 0.410879747*_cse534 + 0.209584432*_cse536 - 0.410879747*_cse537 - _cse538 + _cse539))
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse557*dq4 + _cse572*dq3 + _cse615*dq2 + dq1*(-_cse101 + _cse125 - 0.001950802*_cse5 + _cse630 + 0.41405*_cse8)
+    out[2, 2] = _cse615*dq1 + _cse643*dq4 + _cse658*dq3 + dq2*(_cse302*_cse5 + _cse630 - _cse99)
+    out[2, 3] = _cse572*dq1 + _cse658*dq2 + _cse671*dq4 + dq3*(_cse57*_cse676 + _cse576*_cse96 + _cse578 + _cse580*_cse94 - _cse582 - 0.0309919044627574*_cse672 - 0.0181297165934418*_cse673 - 0.0181297165934418*_cse674 - 0.0309919044627574*_cse675 - 0.01718495619792*_cse677 + 0.0050298*_cse678 - 0.0019534*_cse679 + _cse680*_cse93 + 0.01718495619792*_cse681 + 0.0050298*_cse682 - 0.0019534*_cse683 + x*(_cse602 + 1.8987869684628e-6*_cse672 + 1.14610355371469e-6*_cse673 + 1.14610355371469e-6*_cse674 + 1.8987869684628e-6*_cse675 - 0.45478971*_cse678 - 0.890598824*_cse679 - 0.45478971*_cse682 - 0.890598824*_cse683) + y*(0.213215245107779*_cse0*_cse680 + 0.403618758*_cse39*_cse680 + _cse604 - _cse605 + 0.403618758*_cse61*_cse676 - 0.324409654194476*_cse672 - 0.19581293936857*_cse673 - 0.19581293936857*_cse674 - 0.324409654194476*_cse675 - 0.213215245107779*_cse677 - 0.790154512*_cse678 - 0.790154512*_cse682) + z*(-_cse611 + _cse612 + 0.227149603970304*_cse672 + 0.137106991283212*_cse673 + 0.137106991283212*_cse674 + 0.227149603970304*_cse675 + 0.410149995883665*_cse677 - 0.410879747*_cse678 + 0.209584432*_cse679 - 0.410149995883665*_cse681 - 0.410879747*_cse682 + 0.209584432*_cse683))
+    out[2, 4] = _cse557*dq1 + _cse643*dq2 + _cse671*dq3 + dq4*(_cse38*_cse597 + _cse56*_cse588 + _cse590 - _cse599 - 0.0019534*_cse684 + 0.0050298*_cse685 - 0.0019534*_cse686 + 0.0050298*_cse687 + x*(-0.890598824*_cse684 - 0.45478971*_cse685 - 0.890598824*_cse686 - 0.45478971*_cse687) + y*(_cse608 + 0.403618758*_cse684 - 0.790154512*_cse685 + 0.403618758*_cse686 - 0.790154512*_cse687) + z*(-_cse613 + _cse614 + 0.209584432*_cse684 - 0.410879747*_cse685 + 0.209584432*_cse686 - 0.410879747*_cse687))
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse688
+    out[3, 2] = _cse688
+    out[3, 3] = _cse689*dq1 - _cse689*dq2 + dq0*(_cse3*_cse6*_cse8 - _cse411)
+    out[3, 4] = dq0*(0.3960285*_cse16 + 0.3960285*_cse23 + 0.239041914*_cse25 + 0.239041914*_cse27 - 0.574238819026787*_cse411 + 0.574238819026787*_cse413 - 0.408002994597976*_cse516 + 0.408002994597976*_cse517) + dq1*(0.3960285*_cse195 + 0.3960285*_cse197 + 0.239041914*_cse198 + 0.239041914*_cse199 + 0.408002994597976*_cse356 - 0.408002994597976*_cse357 + _cse690 + _cse691) + dq2*(0.239041914*_cse273 + 0.239041914*_cse275 + 0.3960285*_cse280 + 0.3960285*_cse281 - 0.408002994597976*_cse371 + 0.408002994597976*_cse376 - _cse690 - _cse691) + dq3*(0.239041914*_cse304 + 0.239041914*_cse306 + 0.3960285*_cse311 + 0.3960285*_cse312 + 0.408002994597976*_cse692 + 0.408002994597976*_cse693)
+    out[3, 5] = _cse368*dq1 + _cse379*dq2 + dq0*(0.227149603970304*_cse16 + 0.227149603970304*_cse23 + 0.137106991283212*_cse25 + 0.137106991283212*_cse27 - _cse35*_cse698 + _cse35*_cse699 + _cse468 - _cse530 + _cse531 + _cse538 - _cse539 - _cse54*_cse700 + _cse54*_cse701) + dq3*(0.137106991283212*_cse304 + 0.137106991283212*_cse306 + _cse307*_cse697 - _cse307*_cse698 + _cse307*_cse699 + 0.227149603970304*_cse311 + 0.227149603970304*_cse312 - _cse313*_cse694 - _cse313*_cse700 + _cse313*_cse701 + 0.234017800844203*_cse692 + 0.234017800844203*_cse693) + dq4*(_cse340*_cse694 + _cse340*_cse695 - _cse340*_cse696 + _cse345*_cse697 - _cse345*_cse698 + _cse345*_cse699)
+    out[4, 0] = 0
+    out[4, 1] = _cse702
+    out[4, 2] = -_cse702
+    out[4, 3] = -_cse703*dq1 + _cse703*dq2 + dq0*(_cse1*_cse6*_cse8 - _cse168)
+    out[4, 4] = dq0*(0.3960285*_cse146 + 0.3960285*_cse149 + 0.408002994597976*_cse150 + 0.239041914*_cse151 + 0.239041914*_cse152 - 0.408002994597976*_cse153 + 0.574238819026787*_cse166 - 0.574238819026787*_cse168) + dq1*(-0.408002994597976*_cse107 + 0.239041914*_cse109 + 0.239041914*_cse110 + 0.408002994597976*_cse113 + 0.3960285*_cse114 + 0.3960285*_cse115 - _cse704 - _cse705) + dq2*(0.3960285*_cse66 + 0.3960285*_cse68 + 0.408002994597976*_cse69 + 0.239041914*_cse70 + _cse704 + _cse705 + 0.239041914*_cse71 - 0.408002994597976*_cse72) + dq3*(0.408002994597976*_cse127 + 0.408002994597976*_cse128 + 0.239041914*_cse130 + 0.239041914*_cse131 + 0.3960285*_cse132 + 0.3960285*_cse133)
+    out[4, 5] = _cse122*dq1 + _cse142*dq3 + _cse179*dq0 + _cse63*dq4 + _cse92*dq2
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse706*dq1 - _cse706*dq2
+    out[5, 4] = dq1*(_cse541*_cse708 + 0.239041914*_cse542 - _cse544*_cse707 + 0.239041914*_cse545 + 0.3960285*_cse551 + 0.3960285*_cse552 + _cse709 - _cse710) + dq2*(_cse540*_cse708 - _cse543*_cse707 + 0.3960285*_cse631 + 0.3960285*_cse632 + 0.239041914*_cse633 + 0.239041914*_cse634 - _cse709 + _cse710) + dq3*(_cse576*_cse707 + _cse580*_cse708 + 0.239041914*_cse659 + 0.239041914*_cse660 + 0.3960285*_cse665 + 0.3960285*_cse666)
+    out[5, 5] = dq1*(_cse541*_cse712 + 0.137106991283212*_cse542 - _cse544*_cse711 + 0.137106991283212*_cse545 + _cse547*_cse697 - _cse547*_cse698 + _cse547*_cse699 + 0.227149603970304*_cse551 + 0.227149603970304*_cse552 - _cse553*_cse694 - _cse553*_cse700 + _cse553*_cse701 + _cse713 - _cse714) + dq2*(_cse540*_cse712 - _cse543*_cse711 + 0.227149603970304*_cse631 + 0.227149603970304*_cse632 + 0.137106991283212*_cse633 + 0.137106991283212*_cse634 + _cse635*_cse697 - _cse635*_cse698 + _cse635*_cse699 - _cse639*_cse694 - _cse639*_cse700 + _cse639*_cse701 - _cse713 + _cse714) + dq3*(_cse576*_cse711 + _cse580*_cse712 + 0.137106991283212*_cse659 + 0.137106991283212*_cse660 + _cse661*_cse697 - _cse661*_cse698 + _cse661*_cse699 + 0.227149603970304*_cse665 + 0.227149603970304*_cse666 - _cse667*_cse694 - _cse667*_cse700 + _cse667*_cse701) + dq4*(_cse588*_cse694 + _cse588*_cse695 - _cse588*_cse696 + _cse597*_cse697 - _cse597*_cse698 + _cse597*_cse699)
+    return out
+
+
+FUNCTIONS = {
+    'M': function0,
+    'g': function1,
+    'Gamma': function2,
+    'joint0[0,0,0]_Tx': function3,
+    'joint0[0,0,0]_J': function4,
+    'joint0[0,0,0]_dJ': function5,
+    'joint1[0,0,0]_Tx': function6,
+    'joint1[0,0,0]_J': function7,
+    'joint1[0,0,0]_dJ': function8,
+    'joint2[0,0,0]_Tx': function9,
+    'joint2[0,0,0]_J': function10,
+    'joint2[0,0,0]_dJ': function11,
+    'joint3[0,0,0]_Tx': function12,
+    'joint3[0,0,0]_J': function13,
+    'joint3[0,0,0]_dJ': function14,
+    'joint4[0,0,0]_Tx': function15,
+    'joint4[0,0,0]_J': function16,
+    'joint4[0,0,0]_dJ': function17,
+    'joint5[0,0,0]_Tx': function18,
+    'joint5[0,0,0]_J': function19,
+    'joint5[0,0,0]_dJ': function20,
+    'link0[0,0,0]_Tx': function21,
+    'link0[0,0,0]_J': function22,
+    'link0[0,0,0]_dJ': function23,
+    'link1[0,0,0]_Tx': function24,
+    'link1[0,0,0]_J': function25,
+    'link1[0,0,0]_dJ': function26,
+    'link2[0,0,0]_Tx': function27,
+    'link2[0,0,0]_J': function28,
+    'link2[0,0,0]_dJ': function29,
+    'link3[0,0,0]_Tx': function30,
+    'link3[0,0,0]_J': function31,
+    'link3[0,0,0]_dJ': function32,
+    'link4[0,0,0]_Tx': function33,
+    'link4[0,0,0]_J': function34,
+    'link4[0,0,0]_dJ': function35,
+    'link5[0,0,0]_Tx': function36,
+    'link5[0,0,0]_J': function37,
+    'link5[0,0,0]_dJ': function38,
+    'EE[0,0,0]_Tx': function39,
+    'EE[0,0,0]_J': function40,
+    'EE[0,0,0]_dJ': function41,
+    'EE_Tx': function42,
+    'EE_J': function43,
+    'EE_dJ': function44,
+}
@@ -0,0 +1,9035 @@
+# generated by abr_control.utils.export, do not edit
+import math
+
+import numpy as np
+
+VERSION = '0.1.0'
+CONFIG_HASH = 'fa7ff35135f4d8aa1beefd424a7169e8'
+
+
+# M
+def function0(q0, q1, q2, q3, q4, q5):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = 4.3259e-5*_cse0
+    _cse3 = math.sin(q1)
+    _cse4 = math.cos(q1)
+    _cse5 = 0.20902*_cse3 + 0.0019519*_cse4
+    _cse6 = -_cse5
+    _cse7 = _cse0*_cse6
+    _cse8 = 0.028922995*_cse1 - _cse2 + _cse7
+    _cse9 = 2.16295e-5*_cse0
+    _cse10 = 0.0144614975*_cse1 + 0.5*_cse7 - _cse9
+    _cse11 = -_cse1*_cse6 + 4.3259e-5*_cse1
+    _cse12 = -0.028922995*_cse0 - _cse11
+    _cse13 = -0.5*_cse1*_cse6 + 2.16295e-5*_cse1
+    _cse14 = -0.0144614975*_cse0 - _cse13
+    _cse15 = _cse0*_cse3
+    _cse16 = math.sin(q2)
+    _cse17 = math.cos(q2)
+    _cse18 = 0.081945*_cse16 - 0.00048786*_cse17
+    _cse19 = _cse18*_cse4
+    _cse20 = _cse0*_cse19
+    _cse21 = 0.00048786*_cse16 + 0.081945*_cse17
+    _cse22 = -_cse21
+    _cse23 = _cse22*_cse3
+    _cse24 = _cse0*_cse23
+    _cse25 = -5.49e-7*_cse0*_cse4 - 0.5*_cse0*_cse6 + 0.102515*_cse15 + 0.5*_cse20 + 0.5*_cse24 + _cse9
+    _cse26 = -0.0035510025*_cse1 - _cse25
+    _cse27 = -1.098e-6*_cse0*_cse4 - _cse0*_cse6 + 0.20503*_cse15 + _cse2 + _cse20 + _cse24
+    _cse28 = -0.007102005*_cse1 - _cse27
+    _cse29 = _cse1*_cse3
+    _cse30 = _cse1*_cse19
+    _cse31 = _cse1*_cse23
+    _cse32 = -5.49e-7*_cse1*_cse4 + _cse13 + 0.102515*_cse29 + 0.5*_cse30 + 0.5*_cse31
+    _cse33 = 0.0035510025*_cse0 - _cse32
+    _cse34 = -1.098e-6*_cse1*_cse4 + _cse11 + 0.20503*_cse29 + _cse30 + _cse31
+    _cse35 = 0.007102005*_cse0 - _cse34
+    _cse36 = _cse0*_cse4
+    _cse37 = _cse16*_cse36
+    _cse38 = math.sin(q3)
+    _cse39 = math.cos(q3)
+    _cse40 = 0.00040053*_cse38 - 0.012581*_cse39
+    _cse41 = -_cse40
+    _cse42 = 0.999999998572139*_cse1
+    _cse43 = 6.57617443000635e-7*_cse0
+    _cse44 = _cse16*_cse3
+    _cse45 = _cse17*_cse4
+    _cse46 = _cse42 + _cse43*_cse44 + _cse43*_cse45
+    _cse47 = -0.012581*_cse38 - 0.00040053*_cse39
+    _cse48 = 6.57617443000635e-7*_cse1
+    _cse49 = 0.999999998572139*_cse0
+    _cse50 = _cse44*_cse49 + _cse45*_cse49 - _cse48
+    _cse51 = 0.0038906673398998*_cse45
+    _cse52 = 0.0038906673398998*_cse44
+    _cse53 = _cse0*_cse51 + _cse0*_cse52 + 0.0068032576553314*_cse1 + _cse27 - _cse41*_cse46 - _cse47*_cse50
+    _cse54 = 0.1592*_cse0*_cse17*_cse3 - 0.1592*_cse37 - _cse53
+    _cse55 = 0.0019453336699499*_cse45
+    _cse56 = 0.0019453336699499*_cse44
+    _cse57 = _cse0*_cse55 + _cse0*_cse56 + 0.0034016288276657*_cse1 + _cse25 - 0.5*_cse41*_cse46 - 0.5*_cse47*_cse50
+    _cse58 = 0.0796*_cse0*_cse17*_cse3 - 0.0796*_cse37 - _cse57
+    _cse59 = _cse1*_cse4
+    _cse60 = _cse16*_cse59
+    _cse61 = _cse44*_cse48 + _cse45*_cse48 - _cse49
+    _cse62 = _cse42*_cse44 + _cse42*_cse45 + _cse43
+    _cse63 = -0.0068032576553314*_cse0 + _cse1*_cse51 + _cse1*_cse52 + _cse34 - _cse41*_cse61 - _cse47*_cse62
+    _cse64 = 0.1592*_cse1*_cse17*_cse3 - 0.1592*_cse60 - _cse63
+    _cse65 = -0.0034016288276657*_cse0 + _cse1*_cse55 + _cse1*_cse56 + _cse32 - 0.5*_cse41*_cse61 - 0.5*_cse47*_cse62
+    _cse66 = 0.0796*_cse1*_cse17*_cse3 - 0.0796*_cse60 - _cse65
+    _cse67 = 0.45991232*_cse38 + 0.85536427*_cse39
+    _cse68 = _cse50*_cse67
+    _cse69 = 0.85536427*_cse38 - 0.45991232*_cse39
+    _cse70 = _cse46*_cse69
+    _cse71 = 0.75940555*_cse38 - 0.51802699*_cse39
+    _cse72 = _cse50*_cse71
+    _cse73 = 0.51802699*_cse38 + 0.75940555*_cse39
+    _cse74 = -_cse73
+    _cse75 = _cse46*_cse74
+    _cse76 = _cse38*_cse50
+    _cse77 = math.sin(q4)
+    _cse78 = math.cos(q4)
+    _cse79 = 0.00052974*_cse77 - 0.012272*_cse78
+    _cse80 = -_cse79
+    _cse81 = _cse15*_cse17
+    _cse82 = _cse39*_cse46
+    _cse83 = -0.818687841791724*_cse37 + 0.458851168*_cse68 + 0.458851168*_cse70 + 0.758601438*_cse72 + 0.758601438*_cse75 - 0.212878838804554*_cse76 + 0.818687841791724*_cse81 + 0.212878838804554*_cse82
+    _cse84 = -0.012272*_cse77 - 0.00052974*_cse78
+    _cse85 = 0.000346321299837637*_cse37 - 0.855753802*_cse68 - 0.855753802*_cse70 + 0.517383113*_cse72 + 0.517383113*_cse75 - 0.000346321299837637*_cse81
+    _cse86 = _cse53 - _cse80*_cse83 - _cse84*_cse85
+    _cse87 = 0.210033941789101*_cse0*_cse17*_cse3 - 0.210033941789101*_cse37 + 0.0315500189858492*_cse39*_cse46 - 0.01084270231829*_cse68 - 0.01084270231829*_cse70 - 0.0189192713225*_cse72 - 0.0189192713225*_cse75 - 0.0315500189858492*_cse76 - _cse86
+    _cse88 = 0.10501697089455*_cse0*_cse17*_cse3 - 0.10501697089455*_cse37 + 0.0157750094929246*_cse39*_cse46 - _cse57 - 0.005421351159145*_cse68 - 0.005421351159145*_cse70 - 0.00945963566125*_cse72 - 0.00945963566125*_cse75 - 0.0157750094929246*_cse76 + 0.5*_cse80*_cse83 + 0.5*_cse84*_cse85
+    _cse89 = _cse62*_cse67
+    _cse90 = _cse61*_cse69
+    _cse91 = _cse62*_cse71
+    _cse92 = _cse61*_cse74
+    _cse93 = _cse38*_cse62
+    _cse94 = _cse17*_cse29
+    _cse95 = 0.818687841791724*_cse94
+    _cse96 = 0.818687841791724*_cse60
+    _cse97 = 0.212878838804554*_cse39*_cse61 + 0.458851168*_cse89 + 0.458851168*_cse90 + 0.758601438*_cse91 + 0.758601438*_cse92 - 0.212878838804554*_cse93 + _cse95 - _cse96
+    _cse98 = 0.000346321299837637*_cse94
+    _cse99 = 0.000346321299837637*_cse60
+    _cse100 = -0.855753802*_cse89 - 0.855753802*_cse90 + 0.517383113*_cse91 + 0.517383113*_cse92 - _cse98 + _cse99
+    _cse101 = -_cse100*_cse84 + _cse63 - _cse80*_cse97
+    _cse102 = 0.210033941789101*_cse1*_cse17*_cse3 - _cse101 + 0.0315500189858492*_cse39*_cse61 - 0.210033941789101*_cse60 - 0.01084270231829*_cse89 - 0.01084270231829*_cse90 - 0.0189192713225*_cse91 - 0.0189192713225*_cse92 - 0.0315500189858492*_cse93
+    _cse103 = 0.10501697089455*_cse1*_cse17*_cse3 + 0.5*_cse100*_cse84 + 0.0157750094929246*_cse39*_cse61 - 0.10501697089455*_cse60 - _cse65 + 0.5*_cse80*_cse97 - 0.005421351159145*_cse89 - 0.005421351159145*_cse90 - 0.00945963566125*_cse91 - 0.00945963566125*_cse92 - 0.0157750094929246*_cse93
+    _cse104 = _cse77*_cse85
+    _cse105 = 0.40329059*_cse77 + 0.89059413*_cse78
+    _cse106 = _cse105*_cse85
+    _cse107 = 0.89059413*_cse77 - 0.40329059*_cse78
+    _cse108 = _cse107*_cse83
+    _cse109 = -0.78972966*_cse77 + 0.45479896*_cse78
+    _cse110 = 0.45479896*_cse77 + 0.78972966*_cse78
+    _cse111 = 0.253888422522456*_cse0*_cse17*_cse3 - 0.0499969558686132*_cse104 - 0.01872015456*_cse106 - 0.01872015456*_cse108 + 0.03790017976*_cse109*_cse85 + 0.03790017976*_cse110*_cse83 - 0.253888422522456*_cse37 + 0.0627091097210817*_cse39*_cse46 - 0.0290982758960988*_cse68 - 0.0290982758960988*_cse70 - 0.0491638727803817*_cse72 - 0.0491638727803817*_cse75 - 0.0627091097210817*_cse76 + 0.0499969558686132*_cse78*_cse83 - _cse86
+    _cse112 = 0.00097266683497495*_cse44
+    _cse113 = 0.00097266683497495*_cse45
+    _cse114 = -_cse0*_cse112 - _cse0*_cse113 + 0.0634721056306141*_cse0*_cse17*_cse3 + 2.745e-7*_cse0*_cse4 + 0.25*_cse0*_cse6 - 1.081475e-5*_cse0 - 0.00170081441383285*_cse1 - 0.0124992389671533*_cse104 - 0.00468003864*_cse106 - 0.00468003864*_cse108 + 0.00947504494*_cse109*_cse85 + 0.00947504494*_cse110*_cse83 - 0.0512575*_cse15 - 0.25*_cse20 - 0.25*_cse24 - 0.0634721056306141*_cse37 + 0.0156772774302704*_cse39*_cse46 + 0.25*_cse41*_cse46 + 0.25*_cse47*_cse50 - 0.00727456897402469*_cse68 - 0.00727456897402469*_cse70 - 0.0122909681950954*_cse72 - 0.0122909681950954*_cse75 - 0.0156772774302704*_cse76 + 0.0124992389671533*_cse78*_cse83 + 0.25*_cse80*_cse83 + 0.25*_cse84*_cse85
+    _cse115 = _cse100*_cse77
+    _cse116 = _cse100*_cse105
+    _cse117 = _cse107*_cse97
+    _cse118 = 0.253888422522456*_cse1*_cse17*_cse3 + 0.03790017976*_cse100*_cse109 - _cse101 + 0.03790017976*_cse110*_cse97 - 0.0499969558686132*_cse115 - 0.01872015456*_cse116 - 0.01872015456*_cse117 + 0.0627091097210817*_cse39*_cse61 - 0.253888422522456*_cse60 + 0.0499969558686132*_cse78*_cse97 - 0.0290982758960988*_cse89 - 0.0290982758960988*_cse90 - 0.0491638727803817*_cse91 - 0.0491638727803817*_cse92 - 0.0627091097210817*_cse93
+    _cse119 = 0.00170081441383285*_cse0 - _cse1*_cse112 - _cse1*_cse113 + 0.0634721056306141*_cse1*_cse17*_cse3 + 2.745e-7*_cse1*_cse4 + 0.25*_cse1*_cse6 - 1.081475e-5*_cse1 + 0.00947504494*_cse100*_cse109 + 0.25*_cse100*_cse84 + 0.00947504494*_cse110*_cse97 - 0.0124992389671533*_cse115 - 0.00468003864*_cse116 - 0.00468003864*_cse117 - 0.0512575*_cse29 - 0.25*_cse30 - 0.25*_cse31 + 0.0156772774302704*_cse39*_cse61 + 0.25*_cse41*_cse61 + 0.25*_cse47*_cse62 - 0.0634721056306141*_cse60 + 0.0124992389671533*_cse78*_cse97 + 0.25*_cse80*_cse97 - 0.00727456897402469*_cse89 - 0.00727456897402469*_cse90 - 0.0122909681950954*_cse91 - 0.0122909681950954*_cse92 - 0.0156772774302704*_cse93
+    _cse120 = 0.0019519*_cse3 - 0.20902*_cse4
+    _cse121 = _cse0*_cse120
+    _cse122 = _cse1*_cse120
+    _cse123 = 1.098e-6*_cse15
+    _cse124 = 0.20503*_cse36
+    _cse125 = _cse22*_cse36
+    _cse126 = _cse15*_cse18
+    _cse127 = _cse0*_cse120 - _cse123 - _cse124 - _cse125 + _cse126
+    _cse128 = _cse22*_cse59
+    _cse129 = _cse18*_cse29
+    _cse130 = -_cse122 + _cse128 - _cse129 + 1.098e-6*_cse29 + 0.20503*_cse59
+    _cse131 = 0.1592*_cse0
+    _cse132 = -0.0038906673398998*_cse37 + 0.0038906673398998*_cse81
+    _cse133 = _cse131*_cse44 + _cse131*_cse45 + _cse132
+    _cse134 = _cse17*_cse3
+    _cse135 = -6.57617443000635e-7*_cse0*_cse16*_cse4 + _cse134*_cse43
+    _cse136 = -_cse135
+    _cse137 = _cse136*_cse41
+    _cse138 = -0.999999998572139*_cse0*_cse16*_cse4 + _cse134*_cse49
+    _cse139 = -_cse138
+    _cse140 = _cse139*_cse47
+    _cse141 = _cse121 - _cse123 - _cse124 - _cse125 + _cse126 + _cse137 + _cse140
+    _cse142 = _cse133 + _cse141
+    _cse143 = _cse16*_cse4
+    _cse144 = _cse134*_cse48 - _cse143*_cse48
+    _cse145 = _cse144*_cse41
+    _cse146 = _cse134*_cse42 - _cse143*_cse42
+    _cse147 = _cse146*_cse47
+    _cse148 = 0.0038906673398998*_cse60
+    _cse149 = 0.1592*_cse1
+    _cse150 = _cse149*_cse45
+    _cse151 = _cse149*_cse44
+    _cse152 = 0.0038906673398998*_cse94
+    _cse153 = _cse130 + _cse145 + _cse147 + _cse148 - _cse150 - _cse151 - _cse152
+    _cse154 = _cse136*_cse39
+    _cse155 = _cse139*_cse67
+    _cse156 = _cse136*_cse69
+    _cse157 = _cse139*_cse71
+    _cse158 = _cse136*_cse74
+    _cse159 = _cse139*_cse38
+    _cse160 = 0.210033941789101*_cse0
+    _cse161 = _cse132 + _cse160*_cse44 + _cse160*_cse45
+    _cse162 = 0.818687841791724*_cse44
+    _cse163 = _cse0*_cse162
+    _cse164 = 0.818687841791724*_cse45
+    _cse165 = _cse0*_cse164
+    _cse166 = 0.212878838804554*_cse154 + 0.458851168*_cse155 + 0.458851168*_cse156 + 0.758601438*_cse157 + 0.758601438*_cse158 - 0.212878838804554*_cse159 + _cse163 + _cse165
+    _cse167 = _cse166*_cse80
+    _cse168 = 0.000346321299837637*_cse45
+    _cse169 = 0.000346321299837637*_cse44
+    _cse170 = _cse0*_cse168 + _cse0*_cse169
+    _cse171 = 0.517383113*_cse136*_cse74 + 0.517383113*_cse139*_cse71 - 0.855753802*_cse155 - 0.855753802*_cse156 - _cse170
+    _cse172 = _cse171*_cse84
+    _cse173 = _cse141 + _cse167 + _cse172
+    _cse174 = 0.0315500189858492*_cse154 - 0.01084270231829*_cse155 - 0.01084270231829*_cse156 - 0.0189192713225*_cse157 - 0.0189192713225*_cse158 - 0.0315500189858492*_cse159 + _cse161 + _cse173
+    _cse175 = _cse146*_cse67
+    _cse176 = _cse144*_cse69
+    _cse177 = _cse146*_cse71
+    _cse178 = _cse144*_cse74
+    _cse179 = _cse146*_cse38
+    _cse180 = 0.210033941789101*_cse1
+    _cse181 = _cse180*_cse44 + _cse180*_cse45
+    _cse182 = _cse1*_cse162
+    _cse183 = _cse1*_cse164
+    _cse184 = 0.212878838804554*_cse144*_cse39 + 0.458851168*_cse175 + 0.458851168*_cse176 + 0.758601438*_cse177 + 0.758601438*_cse178 - 0.212878838804554*_cse179 - _cse182 - _cse183
+    _cse185 = _cse1*_cse168 + _cse1*_cse169
+    _cse186 = -0.855753802*_cse175 - 0.855753802*_cse176 + 0.517383113*_cse177 + 0.517383113*_cse178 + _cse185
+    _cse187 = -_cse148 + _cse152
+    _cse188 = -_cse1*_cse22*_cse4 - 1.098e-6*_cse1*_cse3 - 0.20503*_cse1*_cse4 + _cse122 + _cse129 - _cse144*_cse41 - _cse146*_cse47 - _cse184*_cse80 - _cse186*_cse84 + _cse187
+    _cse189 = 0.0315500189858492*_cse144*_cse39 - 0.01084270231829*_cse175 - 0.01084270231829*_cse176 - 0.0189192713225*_cse177 - 0.0189192713225*_cse178 - 0.0315500189858492*_cse179 - _cse181 - _cse188
+    _cse190 = 0.0499969558686132*_cse78
+    _cse191 = 0.03790017976*_cse109
+    _cse192 = 0.03790017976*_cse110
+    _cse193 = 0.0499969558686132*_cse77
+    _cse194 = 0.01872015456*_cse105
+    _cse195 = 0.01872015456*_cse107
+    _cse196 = 0.253888422522456*_cse0
+    _cse197 = _cse132 + _cse196*_cse44 + _cse196*_cse45
+    _cse198 = 0.0627091097210817*_cse154 - 0.0290982758960988*_cse155 - 0.0290982758960988*_cse156 - 0.0491638727803817*_cse157 - 0.0491638727803817*_cse158 - 0.0627091097210817*_cse159 + _cse166*_cse190 + _cse166*_cse192 - _cse166*_cse195 + _cse171*_cse191 - _cse171*_cse193 - _cse171*_cse194 + _cse173 + _cse197
+    _cse199 = 0.253888422522456*_cse1
+    _cse200 = _cse199*_cse44 + _cse199*_cse45
+    _cse201 = 0.03790017976*_cse109*_cse186 + 0.03790017976*_cse110*_cse184 + 0.0627091097210817*_cse144*_cse39 - 0.0290982758960988*_cse175 - 0.0290982758960988*_cse176 - 0.0491638727803817*_cse177 - 0.0491638727803817*_cse178 - 0.0627091097210817*_cse179 - _cse184*_cse195 + 0.0499969558686132*_cse184*_cse78 - _cse186*_cse193 - _cse186*_cse194 - _cse188 - _cse200
+    _cse202 = _cse21*_cse59
+    _cse203 = _cse129 + _cse202
+    _cse204 = _cse21*_cse36
+    _cse205 = _cse126 + _cse204
+    _cse206 = -_cse205
+    _cse207 = -_cse144
+    _cse208 = _cse207*_cse41
+    _cse209 = -_cse146
+    _cse210 = _cse209*_cse47
+    _cse211 = _cse187 + _cse203 + _cse208 + _cse210
+    _cse212 = _cse150 + _cse151 + _cse211
+    _cse213 = -_cse135*_cse41 - _cse138*_cse47 + _cse205
+    _cse214 = -_cse133 - _cse213
+    _cse215 = _cse207*_cse39
+    _cse216 = _cse209*_cse67
+    _cse217 = _cse207*_cse69
+    _cse218 = _cse209*_cse71
+    _cse219 = _cse207*_cse74
+    _cse220 = _cse209*_cse38
+    _cse221 = _cse182 + _cse183 + 0.212878838804554*_cse215 + 0.458851168*_cse216 + 0.458851168*_cse217 + 0.758601438*_cse218 + 0.758601438*_cse219 - 0.212878838804554*_cse220
+    _cse222 = _cse221*_cse80
+    _cse223 = -_cse185 + 0.517383113*_cse207*_cse74 + 0.517383113*_cse209*_cse71 - 0.855753802*_cse216 - 0.855753802*_cse217
+    _cse224 = _cse223*_cse84
+    _cse225 = _cse211 + _cse222 + _cse224
+    _cse226 = _cse181 + 0.0315500189858492*_cse215 - 0.01084270231829*_cse216 - 0.01084270231829*_cse217 - 0.0189192713225*_cse218 - 0.0189192713225*_cse219 - 0.0315500189858492*_cse220 + _cse225
+    _cse227 = _cse138*_cse67
+    _cse228 = _cse135*_cse69
+    _cse229 = _cse138*_cse71
+    _cse230 = _cse135*_cse74
+    _cse231 = _cse138*_cse38
+    _cse232 = 0.212878838804554*_cse135*_cse39 - _cse163 - _cse165 + 0.458851168*_cse227 + 0.458851168*_cse228 + 0.758601438*_cse229 + 0.758601438*_cse230 - 0.212878838804554*_cse231
+    _cse233 = _cse170 - 0.855753802*_cse227 - 0.855753802*_cse228 + 0.517383113*_cse229 + 0.517383113*_cse230
+    _cse234 = _cse213 - _cse232*_cse80 - _cse233*_cse84
+    _cse235 = 0.0315500189858492*_cse135*_cse39 - _cse161 - 0.01084270231829*_cse227 - 0.01084270231829*_cse228 - 0.0189192713225*_cse229 - 0.0189192713225*_cse230 - 0.0315500189858492*_cse231 - _cse234
+    _cse236 = _cse190*_cse221 + _cse191*_cse223 + _cse192*_cse221 - _cse193*_cse223 - _cse194*_cse223 - _cse195*_cse221 + _cse200 + 0.0627091097210817*_cse215 - 0.0290982758960988*_cse216 - 0.0290982758960988*_cse217 - 0.0491638727803817*_cse218 - 0.0491638727803817*_cse219 - 0.0627091097210817*_cse220 + _cse225
+    _cse237 = 0.03790017976*_cse109*_cse233 + 0.03790017976*_cse110*_cse232 + 0.0627091097210817*_cse135*_cse39 - _cse193*_cse233 - _cse194*_cse233 - _cse195*_cse232 - _cse197 - 0.0290982758960988*_cse227 - 0.0290982758960988*_cse228 - 0.0491638727803817*_cse229 - 0.0491638727803817*_cse230 - 0.0627091097210817*_cse231 + 0.0499969558686132*_cse232*_cse78 - _cse234
+    _cse238 = _cse46*_cse47
+    _cse239 = _cse40*_cse50
+    _cse240 = _cse238 + _cse239
+    _cse241 = -_cse61
+    _cse242 = _cse241*_cse47
+    _cse243 = -_cse62
+    _cse244 = _cse243*_cse40
+    _cse245 = _cse242 + _cse244
+    _cse246 = _cse46*_cse67
+    _cse247 = -_cse69
+    _cse248 = _cse247*_cse50
+    _cse249 = _cse50*_cse73
+    _cse250 = _cse46*_cse71
+    _cse251 = _cse38*_cse46
+    _cse252 = _cse39*_cse50
+    _cse253 = 0.458851168*_cse246 + 0.458851168*_cse248 + 0.758601438*_cse249 + 0.758601438*_cse250 - 0.212878838804554*_cse251 - 0.212878838804554*_cse252
+    _cse254 = -0.855753802*_cse246 - 0.855753802*_cse248 + 0.517383113*_cse46*_cse71 + 0.517383113*_cse50*_cse73
+    _cse255 = -_cse253*_cse80 - _cse254*_cse84 - _cse40*_cse50 - _cse46*_cse47
+    _cse256 = -0.01084270231829*_cse246 - 0.01084270231829*_cse248 - 0.0189192713225*_cse249 - 0.0189192713225*_cse250 - 0.0315500189858492*_cse251 - 0.0315500189858492*_cse252 - _cse255
+    _cse257 = _cse241*_cse67
+    _cse258 = _cse243*_cse247
+    _cse259 = _cse243*_cse73
+    _cse260 = _cse241*_cse71
+    _cse261 = _cse241*_cse38
+    _cse262 = _cse243*_cse39
+    _cse263 = 0.458851168*_cse257 + 0.458851168*_cse258 + 0.758601438*_cse259 + 0.758601438*_cse260 - 0.212878838804554*_cse261 - 0.212878838804554*_cse262
+    _cse264 = 0.517383113*_cse241*_cse71 + 0.517383113*_cse243*_cse73 - 0.855753802*_cse257 - 0.855753802*_cse258
+    _cse265 = -_cse241*_cse47 - _cse243*_cse40 - _cse263*_cse80 - _cse264*_cse84
+    _cse266 = -0.01084270231829*_cse257 - 0.01084270231829*_cse258 - 0.0189192713225*_cse259 - 0.0189192713225*_cse260 - 0.0315500189858492*_cse261 - 0.0315500189858492*_cse262 - _cse265
+    _cse267 = 0.03790017976*_cse109*_cse254 + 0.03790017976*_cse110*_cse253 - _cse193*_cse254 - _cse194*_cse254 - _cse195*_cse253 - 0.0290982758960988*_cse246 - 0.0290982758960988*_cse248 - 0.0491638727803817*_cse249 - 0.0491638727803817*_cse250 - 0.0627091097210817*_cse251 - 0.0627091097210817*_cse252 + 0.0499969558686132*_cse253*_cse78 - _cse255
+    _cse268 = 0.03790017976*_cse109*_cse264 + 0.03790017976*_cse110*_cse263 - _cse193*_cse264 - _cse194*_cse264 - _cse195*_cse263 - 0.0290982758960988*_cse257 - 0.0290982758960988*_cse258 - 0.0491638727803817*_cse259 - 0.0491638727803817*_cse260 - 0.0627091097210817*_cse261 - 0.0627091097210817*_cse262 + 0.0499969558686132*_cse263*_cse78 - _cse265
+    _cse269 = 0.07*_cse44 + 0.07*_cse45
+    _cse270 = _cse79*_cse85
+    _cse271 = _cse83*_cse84
+    _cse272 = _cse270 + _cse271
+    _cse273 = _cse241*_cse74
+    _cse274 = _cse243*_cse67
+    _cse275 = _cse243*_cse71
+    _cse276 = _cse241*_cse69
+    _cse277 = 0.517383113*_cse273 - 0.855753802*_cse274 + 0.517383113*_cse275 - 0.855753802*_cse276 + _cse98 - _cse99
+    _cse278 = _cse277*_cse79
+    _cse279 = 0.212878838804554*_cse38
+    _cse280 = 0.212878838804554*_cse39
+    _cse281 = _cse241*_cse280 - _cse243*_cse279 + 0.758601438*_cse273 + 0.458851168*_cse274 + 0.758601438*_cse275 + 0.458851168*_cse276 - _cse95 + _cse96
+    _cse282 = _cse281*_cse84
+    _cse283 = _cse278 + _cse282
+    _cse284 = -_cse107
+    _cse285 = 0.01872015456*_cse284
+    _cse286 = -_cse110
+    _cse287 = 0.03790017976*_cse109*_cse83 - _cse190*_cse85 - _cse193*_cse83 - _cse194*_cse83 - _cse285*_cse85 + 0.03790017976*_cse286*_cse85 + _cse79*_cse85 + _cse83*_cse84
+    _cse288 = 0.03790017976*_cse109*_cse281 - _cse190*_cse277 - _cse193*_cse281 - _cse194*_cse281 - _cse277*_cse285 + 0.03790017976*_cse277*_cse286 + _cse277*_cse79 + _cse281*_cse84
+    _cse289 = -6.57617443000635e-7*_cse134 + 6.57617443000635e-7*_cse16*_cse4
+    _cse290 = _cse289*_cse39
+    _cse291 = -0.999999998572139*_cse134 + 0.999999998572139*_cse16*_cse4
+    _cse292 = _cse291*_cse67
+    _cse293 = _cse289*_cse69
+    _cse294 = _cse291*_cse71
+    _cse295 = _cse289*_cse74
+    _cse296 = _cse291*_cse38
+    _cse297 = 0.0204001497298988*_cse290 - 0.0119520957*_cse292 - 0.0119520957*_cse293 - 0.019801425*_cse294 - 0.019801425*_cse295 - 0.0204001497298988*_cse296 + 0.0287119409513393*_cse44 + 0.0287119409513393*_cse45
+    _cse298 = -_cse168 - _cse169 + 0.517383113*_cse289*_cse74 + 0.517383113*_cse291*_cse71 - 0.855753802*_cse292 - 0.855753802*_cse293
+    _cse299 = _cse298*_cse77
+    _cse300 = _cse105*_cse298
+    _cse301 = _cse162 + _cse164 - _cse279*_cse291 + _cse280*_cse289 + 0.458851168*_cse292 + 0.458851168*_cse293 + 0.758601438*_cse294 + 0.758601438*_cse295
+    _cse302 = _cse107*_cse301
+    _cse303 = 0.01232639241*_cse109*_cse298 + 0.01232639241*_cse110*_cse301 + 0.00988096465226441*_cse16*_cse3 + 0.00988096465226441*_cse17*_cse4 + 0.0070205340253261*_cse289*_cse39 - 0.00411320973849636*_cse292 - 0.00411320973849636*_cse293 - 0.00681448811910913*_cse294 - 0.00681448811910913*_cse295 - 0.0070205340253261*_cse296 - 0.0123044998765099*_cse299 - 0.00628753296*_cse300 + 0.0123044998765099*_cse301*_cse78 - 0.00628753296*_cse302
+    _cse304 = 0.5*_cse122
+    _cse305 = 0.5*_cse121
+    _cse306 = 5.49e-7*_cse15
+    _cse307 = 0.102515*_cse36
+    _cse308 = 0.5*_cse125
+    _cse309 = 0.5*_cse126
+    _cse310 = 0.5*_cse0*_cse120 - _cse306 - _cse307 - _cse308 + _cse309
+    _cse311 = 0.5*_cse129
+    _cse312 = 0.5*_cse128 + 5.49e-7*_cse29 - _cse304 - _cse311 + 0.102515*_cse59
+    _cse313 = 0.0796*_cse0
+    _cse314 = -0.0019453336699499*_cse37 + 0.0019453336699499*_cse81
+    _cse315 = _cse313*_cse44 + _cse313*_cse45 + _cse314
+    _cse316 = 0.5*_cse137 + 0.5*_cse140 + _cse305 - _cse306 - _cse307 - _cse308 + _cse309
+    _cse317 = _cse315 + _cse316
+    _cse318 = 0.0019453336699499*_cse60
+    _cse319 = 0.0796*_cse1
+    _cse320 = _cse319*_cse45
+    _cse321 = _cse319*_cse44
+    _cse322 = 0.0019453336699499*_cse94
+    _cse323 = 0.5*_cse145 + 0.5*_cse147 + _cse312 + _cse318 - _cse320 - _cse321 - _cse322
+    _cse324 = 0.10501697089455*_cse0
+    _cse325 = _cse314 + _cse324*_cse44 + _cse324*_cse45
+    _cse326 = 0.0157750094929246*_cse154 - 0.005421351159145*_cse155 - 0.005421351159145*_cse156 - 0.00945963566125*_cse157 - 0.00945963566125*_cse158 - 0.0157750094929246*_cse159 + 0.5*_cse167 + 0.5*_cse172 + _cse316 + _cse325
+    _cse327 = -_cse318 + _cse322
+    _cse328 = 0.10501697089455*_cse1
+    _cse329 = _cse328*_cse44 + _cse328*_cse45
+    _cse330 = 0.5*_cse1*_cse22*_cse4 + 5.49e-7*_cse1*_cse3 + 0.102515*_cse1*_cse4 + 0.0157750094929246*_cse144*_cse39 + 0.5*_cse144*_cse41 + 0.5*_cse146*_cse47 - 0.005421351159145*_cse175 - 0.005421351159145*_cse176 - 0.00945963566125*_cse177 - 0.00945963566125*_cse178 - 0.0157750094929246*_cse179 + 0.5*_cse184*_cse80 + 0.5*_cse186*_cse84 - _cse304 - _cse311 - _cse327 - _cse329
+    _cse331 = 0.0124992389671533*_cse78
+    _cse332 = 0.00947504494*_cse109
+    _cse333 = 0.00947504494*_cse110
+    _cse334 = 0.0124992389671533*_cse77
+    _cse335 = 0.00468003864*_cse105
+    _cse336 = 0.00468003864*_cse107
+    _cse337 = 0.0634721056306141*_cse0
+    _cse338 = 0.25*_cse126 + _cse337*_cse44 + _cse337*_cse45 - 0.00097266683497495*_cse37 + 0.00097266683497495*_cse81
+    _cse339 = 0.25*_cse121 - 0.25*_cse125 + 0.25*_cse137 + 0.25*_cse140 - 2.745e-7*_cse15 + 0.0156772774302704*_cse154 - 0.00727456897402469*_cse155 - 0.00727456897402469*_cse156 - 0.0122909681950954*_cse157 - 0.0122909681950954*_cse158 - 0.0156772774302704*_cse159 + _cse166*_cse331 + _cse166*_cse333 - _cse166*_cse336 + 0.25*_cse167 + _cse171*_cse332 - _cse171*_cse334 - _cse171*_cse335 + 0.25*_cse172 + _cse338 - 0.0512575*_cse36
+    _cse340 = 0.0634721056306141*_cse1
+    _cse341 = 0.25*_cse129 + _cse340*_cse44 + _cse340*_cse45 - 0.00097266683497495*_cse60 + 0.00097266683497495*_cse94
+    _cse342 = 0.25*_cse1*_cse22*_cse4 + 2.745e-7*_cse1*_cse3 + 0.0512575*_cse1*_cse4 + 0.00947504494*_cse109*_cse186 + 0.00947504494*_cse110*_cse184 - 0.25*_cse122 + 0.0156772774302704*_cse144*_cse39 + 0.25*_cse144*_cse41 + 0.25*_cse146*_cse47 - 0.00727456897402469*_cse175 - 0.00727456897402469*_cse176 - 0.0122909681950954*_cse177 - 0.0122909681950954*_cse178 - 0.0156772774302704*_cse179 - _cse184*_cse336 + 0.0124992389671533*_cse184*_cse78 + 0.25*_cse184*_cse80 - _cse186*_cse334 - _cse186*_cse335 + 0.25*_cse186*_cse84 - _cse341
+    _cse343 = _cse0**2
+    _cse344 = _cse1**2
+    _cse345 = 0.5*_cse120**2
+    _cse346 = _cse19 + _cse23 + 0.41405*_cse3 + 0.001950802*_cse4
+    _cse347 = 0.5*_cse19
+    _cse348 = 0.5*_cse23 + 0.207025*_cse3 + _cse347 + 0.000975401*_cse4
+    _cse349 = 0.1592*_cse143
+    _cse350 = 0.1592*_cse134
+    _cse351 = 6.57617443000635e-7*_cse44 + 6.57617443000635e-7*_cse45
+    _cse352 = -_cse351
+    _cse353 = _cse352*_cse41
+    _cse354 = 0.999999998572139*_cse44 + 0.999999998572139*_cse45
+    _cse355 = -_cse354
+    _cse356 = _cse355*_cse47
+    _cse357 = _cse51 + _cse52
+    _cse358 = _cse346 + _cse353 + _cse356 + _cse357
+    _cse359 = _cse349 - _cse350 + _cse358
+    _cse360 = 0.0796*_cse143
+    _cse361 = 0.0796*_cse134
+    _cse362 = _cse55 + _cse56
+    _cse363 = _cse348 + 0.5*_cse353 + 0.5*_cse356 + _cse362
+    _cse364 = _cse360 - _cse361 + _cse363
+    _cse365 = _cse352*_cse39
+    _cse366 = _cse355*_cse67
+    _cse367 = _cse352*_cse69
+    _cse368 = _cse355*_cse71
+    _cse369 = _cse352*_cse74
+    _cse370 = _cse355*_cse38
+    _cse371 = -0.210033941789101*_cse134 + 0.210033941789101*_cse143
+    _cse372 = 0.818687841791724*_cse134
+    _cse373 = 0.818687841791724*_cse143
+    _cse374 = -_cse279*_cse355 + _cse280*_cse352 + 0.458851168*_cse366 + 0.458851168*_cse367 + 0.758601438*_cse368 + 0.758601438*_cse369 - _cse372 + _cse373
+    _cse375 = _cse374*_cse80
+    _cse376 = -0.000346321299837637*_cse134 + 0.000346321299837637*_cse143
+    _cse377 = 0.517383113*_cse352*_cse74 + 0.517383113*_cse355*_cse71 - 0.855753802*_cse366 - 0.855753802*_cse367 - _cse376
+    _cse378 = _cse377*_cse84
+    _cse379 = _cse358 + _cse375 + _cse378
+    _cse380 = 0.0315500189858492*_cse365 - 0.01084270231829*_cse366 - 0.01084270231829*_cse367 - 0.0189192713225*_cse368 - 0.0189192713225*_cse369 - 0.0315500189858492*_cse370 + _cse371 + _cse379
+    _cse381 = -0.10501697089455*_cse134 + 0.10501697089455*_cse143
+    _cse382 = _cse363 + 0.0157750094929246*_cse365 - 0.005421351159145*_cse366 - 0.005421351159145*_cse367 - 0.00945963566125*_cse368 - 0.00945963566125*_cse369 - 0.0157750094929246*_cse370 + 0.5*_cse375 + 0.5*_cse378 + _cse381
+    _cse383 = -0.253888422522456*_cse134 + 0.253888422522456*_cse143
+    _cse384 = _cse190*_cse374 + _cse191*_cse377 + _cse192*_cse374 - _cse193*_cse377 - _cse194*_cse377 - _cse195*_cse374 + 0.0627091097210817*_cse365 - 0.0290982758960988*_cse366 - 0.0290982758960988*_cse367 - 0.0491638727803817*_cse368 - 0.0491638727803817*_cse369 - 0.0627091097210817*_cse370 + _cse379 + _cse383
+    _cse385 = _cse112 + _cse113 - 0.0634721056306141*_cse134 + 0.0634721056306141*_cse143 + 0.25*_cse19
+    _cse386 = 0.25*_cse23 + 0.1035125*_cse3 + _cse331*_cse374 + _cse332*_cse377 + _cse333*_cse374 - _cse334*_cse377 - _cse335*_cse377 - _cse336*_cse374 + 0.25*_cse353 + 0.25*_cse356 + 0.0156772774302704*_cse365 - 0.00727456897402469*_cse366 - 0.00727456897402469*_cse367 - 0.0122909681950954*_cse368 - 0.0122909681950954*_cse369 - 0.0156772774302704*_cse370 + 0.25*_cse375 + 0.25*_cse378 + _cse385 + 0.0004877005*_cse4
+    _cse387 = _cse21*_cse3
+    _cse388 = -_cse19 + _cse387
+    _cse389 = _cse351*_cse41
+    _cse390 = _cse354*_cse47
+    _cse391 = -_cse349 + _cse350 + _cse388 + _cse389 + _cse390 - _cse51 - _cse52
+    _cse392 = _cse354*_cse67
+    _cse393 = _cse351*_cse69
+    _cse394 = _cse354*_cse71
+    _cse395 = _cse351*_cse74
+    _cse396 = _cse354*_cse38
+    _cse397 = -_cse279*_cse354 + _cse280*_cse351 + _cse372 - _cse373 + 0.458851168*_cse392 + 0.458851168*_cse393 + 0.758601438*_cse394 + 0.758601438*_cse395
+    _cse398 = _cse376 - 0.855753802*_cse392 - 0.855753802*_cse393 + 0.517383113*_cse394 + 0.517383113*_cse395
+    _cse399 = _cse19 - _cse21*_cse3 - _cse351*_cse41 - _cse354*_cse47 + _cse357 - _cse397*_cse80 - _cse398*_cse84
+    _cse400 = 0.0315500189858492*_cse351*_cse39 - _cse371 - 0.01084270231829*_cse392 - 0.01084270231829*_cse393 - 0.0189192713225*_cse394 - 0.0189192713225*_cse395 - 0.0315500189858492*_cse396 - _cse399
+    _cse401 = 0.03790017976*_cse109*_cse398 + 0.03790017976*_cse110*_cse397 - _cse193*_cse398 - _cse194*_cse398 - _cse195*_cse397 + 0.0627091097210817*_cse351*_cse39 - _cse383 - 0.0290982758960988*_cse392 - 0.0290982758960988*_cse393 - 0.0491638727803817*_cse394 - 0.0491638727803817*_cse395 - 0.0627091097210817*_cse396 + 0.0499969558686132*_cse397*_cse78 - _cse399
+    _cse402 = 0.09*_cse344
+    _cse403 = 0.09*_cse343
+    _cse404 = -_cse402 - _cse403
+    _cse405 = _cse0*_cse16*_cse4 - _cse81
+    _cse406 = 0.07*_cse1*_cse405
+    _cse407 = -_cse60 + _cse94
+    _cse408 = 0.07*_cse0*_cse407
+    _cse409 = _cse291*_cse40
+    _cse410 = _cse289*_cse47
+    _cse411 = _cse409 + _cse410
+    _cse412 = _cse289*_cse67
+    _cse413 = _cse247*_cse291
+    _cse414 = _cse291*_cse73
+    _cse415 = _cse289*_cse71
+    _cse416 = _cse289*_cse38
+    _cse417 = _cse291*_cse39
+    _cse418 = -_cse279*_cse289 - _cse280*_cse291 + 0.458851168*_cse412 + 0.458851168*_cse413 + 0.758601438*_cse414 + 0.758601438*_cse415
+    _cse419 = 0.517383113*_cse289*_cse71 + 0.517383113*_cse291*_cse73 - 0.855753802*_cse412 - 0.855753802*_cse413
+    _cse420 = -_cse289*_cse47 - _cse291*_cse40 - _cse418*_cse80 - _cse419*_cse84
+    _cse421 = -0.01084270231829*_cse412 - 0.01084270231829*_cse413 - 0.0189192713225*_cse414 - 0.0189192713225*_cse415 - 0.0315500189858492*_cse416 - 0.0315500189858492*_cse417 - _cse420
+    _cse422 = 0.03790017976*_cse109*_cse419 + 0.03790017976*_cse110*_cse418 - _cse193*_cse419 - _cse194*_cse419 - _cse195*_cse418 - 0.0290982758960988*_cse412 - 0.0290982758960988*_cse413 - 0.0491638727803817*_cse414 - 0.0491638727803817*_cse415 - 0.0627091097210817*_cse416 - 0.0627091097210817*_cse417 + 0.0499969558686132*_cse418*_cse78 - _cse420
+    _cse423 = 0.574238819026787*_cse37 + 0.239041914*_cse68 + 0.239041914*_cse70 + 0.3960285*_cse72 + 0.3960285*_cse75 + 0.408002994597976*_cse76 - 0.574238819026787*_cse81 - 0.408002994597976*_cse82
+    _cse424 = 0.05*_cse1*_cse423
+    _cse425 = _cse243*_cse38
+    _cse426 = _cse241*_cse39
+    _cse427 = 0.3960285*_cse273 + 0.239041914*_cse274 + 0.3960285*_cse275 + 0.239041914*_cse276 + 0.408002994597976*_cse425 - 0.408002994597976*_cse426 - 0.574238819026787*_cse60 + 0.574238819026787*_cse94
+    _cse428 = 0.05*_cse0*_cse427
+    _cse429 = _cse298*_cse79
+    _cse430 = _cse301*_cse84
+    _cse431 = _cse429 + _cse430
+    _cse432 = 0.03790017976*_cse109*_cse301 - _cse190*_cse298 - _cse193*_cse301 - _cse194*_cse301 - _cse285*_cse298 + 0.03790017976*_cse286*_cse298 + _cse298*_cse79 + _cse301*_cse84
+    _cse433 = _cse109*_cse85
+    _cse434 = _cse78*_cse83
+    _cse435 = _cse110*_cse83
+    _cse436 = 0.410149995883665*_cse104 + 0.209584432*_cse106 + 0.209584432*_cse108 + 0.329365488408814*_cse37 - 0.410879747*_cse433 - 0.410149995883665*_cse434 - 0.410879747*_cse435 + 0.137106991283212*_cse68 + 0.137106991283212*_cse70 + 0.227149603970304*_cse72 + 0.227149603970304*_cse75 + 0.234017800844203*_cse76 - 0.329365488408814*_cse81 - 0.234017800844203*_cse82
+    _cse437 = _cse277*_cse77
+    _cse438 = _cse109*_cse277
+    _cse439 = _cse105*_cse277
+    _cse440 = _cse281*_cse78
+    _cse441 = _cse110*_cse281
+    _cse442 = _cse107*_cse281
+    _cse443 = 0.227149603970304*_cse273 + 0.137106991283212*_cse274 + 0.227149603970304*_cse275 + 0.137106991283212*_cse276 + 0.234017800844203*_cse425 - 0.234017800844203*_cse426 + 0.410149995883665*_cse437 - 0.410879747*_cse438 + 0.209584432*_cse439 - 0.410149995883665*_cse440 - 0.410879747*_cse441 + 0.209584432*_cse442 - 0.329365488408814*_cse60 + 0.329365488408814*_cse94
+    _cse444 = 0.03*_cse0*_cse443 + 0.03*_cse1*_cse436
+    _cse445 = 0.5*_cse204 + _cse309
+    _cse446 = -_cse445
+    _cse447 = 0.5*_cse202 + _cse311
+    _cse448 = -0.5*_cse135*_cse41 - 0.5*_cse138*_cse47 + _cse445
+    _cse449 = -_cse315 - _cse448
+    _cse450 = 0.5*_cse208 + 0.5*_cse210 + _cse327 + _cse447
+    _cse451 = _cse320 + _cse321 + _cse450
+    _cse452 = 0.0157750094929246*_cse135*_cse39 - 0.005421351159145*_cse227 - 0.005421351159145*_cse228 - 0.00945963566125*_cse229 - 0.00945963566125*_cse230 - 0.0157750094929246*_cse231 + 0.5*_cse232*_cse80 + 0.5*_cse233*_cse84 - _cse325 - _cse448
+    _cse453 = 0.0157750094929246*_cse215 - 0.005421351159145*_cse216 - 0.005421351159145*_cse217 - 0.00945963566125*_cse218 - 0.00945963566125*_cse219 - 0.0157750094929246*_cse220 + 0.5*_cse222 + 0.5*_cse224 + _cse329 + _cse450
+    _cse454 = 0.00947504494*_cse109*_cse233 + 0.00947504494*_cse110*_cse232 + 0.0156772774302704*_cse135*_cse39 + 0.25*_cse135*_cse41 + 0.25*_cse138*_cse47 - 0.25*_cse204 - 0.00727456897402469*_cse227 - 0.00727456897402469*_cse228 - 0.0122909681950954*_cse229 - 0.0122909681950954*_cse230 - 0.0156772774302704*_cse231 - _cse232*_cse336 + 0.0124992389671533*_cse232*_cse78 + 0.25*_cse232*_cse80 - _cse233*_cse334 - _cse233*_cse335 + 0.25*_cse233*_cse84 - _cse338
+    _cse455 = 0.25*_cse202 + 0.25*_cse208 + 0.25*_cse210 + 0.0156772774302704*_cse215 - 0.00727456897402469*_cse216 - 0.00727456897402469*_cse217 - 0.0122909681950954*_cse218 - 0.0122909681950954*_cse219 - 0.0156772774302704*_cse220 + _cse221*_cse331 + _cse221*_cse333 - _cse221*_cse336 + 0.25*_cse222 + _cse223*_cse332 - _cse223*_cse334 - _cse223*_cse335 + 0.25*_cse224 + _cse341
+    _cse456 = -_cse347 + 0.5*_cse387
+    _cse457 = -_cse360 + _cse361 + 0.5*_cse389 + 0.5*_cse390 + _cse456 - _cse55 - _cse56
+    _cse458 = 0.5*_cse21*_cse3 - _cse347 + 0.0157750094929246*_cse351*_cse39 + 0.5*_cse351*_cse41 + 0.5*_cse354*_cse47 - _cse362 - _cse381 - 0.005421351159145*_cse392 - 0.005421351159145*_cse393 - 0.00945963566125*_cse394 - 0.00945963566125*_cse395 - 0.0157750094929246*_cse396 + 0.5*_cse397*_cse80 + 0.5*_cse398*_cse84
+    _cse459 = 0.00947504494*_cse109*_cse398 + 0.00947504494*_cse110*_cse397 + 0.25*_cse21*_cse3 - _cse334*_cse398 - _cse335*_cse398 - _cse336*_cse397 + 0.0156772774302704*_cse351*_cse39 + 0.25*_cse351*_cse41 + 0.25*_cse354*_cse47 - _cse385 - 0.00727456897402469*_cse392 - 0.00727456897402469*_cse393 - 0.0122909681950954*_cse394 - 0.0122909681950954*_cse395 - 0.0156772774302704*_cse396 + 0.0124992389671533*_cse397*_cse78 + 0.25*_cse397*_cse80 + 0.25*_cse398*_cse84
+    _cse460 = 0.5*_cse238 + 0.5*_cse239
+    _cse461 = 0.5*_cse242 + 0.5*_cse244
+    _cse462 = -0.005421351159145*_cse246 - 0.005421351159145*_cse248 - 0.00945963566125*_cse249 - 0.00945963566125*_cse250 - 0.0157750094929246*_cse251 - 0.0157750094929246*_cse252 + 0.5*_cse253*_cse80 + 0.5*_cse254*_cse84 + 0.5*_cse40*_cse50 + 0.5*_cse46*_cse47
+    _cse463 = 0.5*_cse241*_cse47 + 0.5*_cse243*_cse40 - 0.005421351159145*_cse257 - 0.005421351159145*_cse258 - 0.00945963566125*_cse259 - 0.00945963566125*_cse260 - 0.0157750094929246*_cse261 - 0.0157750094929246*_cse262 + 0.5*_cse263*_cse80 + 0.5*_cse264*_cse84
+    _cse464 = 0.00947504494*_cse109*_cse254 + 0.00947504494*_cse110*_cse253 - 0.00727456897402469*_cse246 - 0.00727456897402469*_cse248 - 0.0122909681950954*_cse249 - 0.0122909681950954*_cse250 - 0.0156772774302704*_cse251 - 0.0156772774302704*_cse252 - _cse253*_cse336 + 0.0124992389671533*_cse253*_cse78 + 0.25*_cse253*_cse80 - _cse254*_cse334 - _cse254*_cse335 + 0.25*_cse254*_cse84 + 0.25*_cse40*_cse50 + 0.25*_cse46*_cse47
+    _cse465 = 0.00947504494*_cse109*_cse264 + 0.00947504494*_cse110*_cse263 + 0.25*_cse241*_cse47 + 0.25*_cse243*_cse40 - 0.00727456897402469*_cse257 - 0.00727456897402469*_cse258 - 0.0122909681950954*_cse259 - 0.0122909681950954*_cse260 - 0.0156772774302704*_cse261 - 0.0156772774302704*_cse262 - _cse263*_cse336 + 0.0124992389671533*_cse263*_cse78 + 0.25*_cse263*_cse80 - _cse264*_cse334 - _cse264*_cse335 + 0.25*_cse264*_cse84
+    _cse466 = 0.02*_cse0*_cse16*_cse4 - 0.02*_cse81
+    _cse467 = 3*_cse466
+    _cse468 = _cse1*_cse467
+    _cse469 = 0.01*_cse0*_cse16*_cse4 - 0.01*_cse81
+    _cse470 = _cse1*_cse469
+    _cse471 = -0.01*_cse60 + 0.01*_cse94
+    _cse472 = _cse0*_cse471
+    _cse473 = -0.02*_cse60 + 0.02*_cse94
+    _cse474 = 3*_cse473
+    _cse475 = _cse0*_cse474
+    _cse476 = 0.5*_cse409 + 0.5*_cse410
+    _cse477 = 0.5*_cse289*_cse47 + 0.5*_cse291*_cse40 - 0.005421351159145*_cse412 - 0.005421351159145*_cse413 - 0.00945963566125*_cse414 - 0.00945963566125*_cse415 - 0.0157750094929246*_cse416 - 0.0157750094929246*_cse417 + 0.5*_cse418*_cse80 + 0.5*_cse419*_cse84
+    _cse478 = 0.00947504494*_cse109*_cse419 + 0.00947504494*_cse110*_cse418 + 0.25*_cse289*_cse47 + 0.25*_cse291*_cse40 - _cse334*_cse419 - _cse335*_cse419 - _cse336*_cse418 - 0.00727456897402469*_cse412 - 0.00727456897402469*_cse413 - 0.0122909681950954*_cse414 - 0.0122909681950954*_cse415 - 0.0156772774302704*_cse416 - 0.0156772774302704*_cse417 + 0.0124992389671533*_cse418*_cse78 + 0.25*_cse418*_cse80 + 0.25*_cse419*_cse84
+    _cse479 = -0.01*_cse44 - 0.01*_cse45
+    _cse480 = -_cse44 - _cse45
+    _cse481 = -0.02*_cse44 - 0.02*_cse45
+    _cse482 = -0.408002994597976*_cse290 + 0.239041914*_cse292 + 0.239041914*_cse293 + 0.3960285*_cse294 + 0.3960285*_cse295 + 0.408002994597976*_cse296 - 0.574238819026787*_cse44 - 0.574238819026787*_cse45
+    _cse483 = 2*_cse482
+    _cse484 = 2*_cse423
+    _cse485 = 2*_cse427
+    _cse486 = _cse109*_cse298
+    _cse487 = _cse301*_cse78
+    _cse488 = _cse110*_cse301
+    _cse489 = -0.234017800844203*_cse290 + 0.137106991283212*_cse292 + 0.137106991283212*_cse293 + 0.227149603970304*_cse294 + 0.227149603970304*_cse295 + 0.234017800844203*_cse296 + 0.410149995883665*_cse299 + 0.209584432*_cse300 + 0.209584432*_cse302 - 0.329365488408814*_cse44 - 0.329365488408814*_cse45 - 0.410879747*_cse486 - 0.410149995883665*_cse487 - 0.410879747*_cse488
+    _cse490 = 0.5*_cse270 + 0.5*_cse271
+    _cse491 = 0.5*_cse278 + 0.5*_cse282
+    _cse492 = 0.00468003864*_cse284
+    _cse493 = 0.00947504494*_cse109*_cse83 + 0.00947504494*_cse286*_cse85 - _cse331*_cse85 - _cse334*_cse83 - _cse335*_cse83 - _cse492*_cse85 + 0.25*_cse79*_cse85 + 0.25*_cse83*_cse84
+    _cse494 = 0.00947504494*_cse109*_cse281 + 0.00947504494*_cse277*_cse286 - _cse277*_cse331 - _cse277*_cse492 + 0.25*_cse277*_cse79 - _cse281*_cse334 - _cse281*_cse335 + 0.25*_cse281*_cse84
+    _cse495 = 0.00574238819026787*_cse37 + 0.00239041914*_cse68 + 0.00239041914*_cse70 + 0.003960285*_cse72 + 0.003960285*_cse75 + 0.00408002994597976*_cse76 - 0.00574238819026787*_cse81 - 0.00408002994597976*_cse82
+    _cse496 = _cse1*_cse495
+    _cse497 = 0.0114847763805357*_cse37 + 0.00478083828*_cse68 + 0.00478083828*_cse70 + 0.00792057*_cse72 + 0.00792057*_cse75 + 0.00816005989195952*_cse76 - 0.0114847763805357*_cse81 - 0.00816005989195952*_cse82
+    _cse498 = 2*_cse497
+    _cse499 = _cse1*_cse498
+    _cse500 = 0.003960285*_cse273 + 0.00239041914*_cse274 + 0.003960285*_cse275 + 0.00239041914*_cse276 + 0.00408002994597976*_cse425 - 0.00408002994597976*_cse426 - 0.00574238819026787*_cse60 + 0.00574238819026787*_cse94
+    _cse501 = _cse0*_cse500
+    _cse502 = 0.00792057*_cse273 + 0.00478083828*_cse274 + 0.00792057*_cse275 + 0.00478083828*_cse276 + 0.00816005989195952*_cse425 - 0.00816005989195952*_cse426 - 0.0114847763805357*_cse60 + 0.0114847763805357*_cse94
+    _cse503 = 2*_cse502
+    _cse504 = _cse0*_cse503
+    _cse505 = 0.5*_cse429 + 0.5*_cse430
+    _cse506 = 0.00947504494*_cse109*_cse301 + 0.00947504494*_cse286*_cse298 - _cse298*_cse331 - _cse298*_cse492 + 0.25*_cse298*_cse79 - _cse301*_cse334 - _cse301*_cse335 + 0.25*_cse301*_cse84
+    _cse507 = -0.00408002994597976*_cse290 + 0.00239041914*_cse292 + 0.00239041914*_cse293 + 0.003960285*_cse294 + 0.003960285*_cse295 + 0.00408002994597976*_cse296 - 0.00574238819026787*_cse44 - 0.00574238819026787*_cse45
+    _cse508 = -0.00816005989195952*_cse290 + 0.00478083828*_cse292 + 0.00478083828*_cse293 + 0.00792057*_cse294 + 0.00792057*_cse295 + 0.00816005989195952*_cse296 - 0.0114847763805357*_cse44 - 0.0114847763805357*_cse45
+    _cse509 = 0.00410149995883665*_cse104 + 0.00209584432*_cse106 + 0.00209584432*_cse108 + 0.00329365488408814*_cse37 - 0.00410879747*_cse433 - 0.00410149995883665*_cse434 - 0.00410879747*_cse435 + 0.00137106991283212*_cse68 + 0.00137106991283212*_cse70 + 0.00227149603970304*_cse72 + 0.00227149603970304*_cse75 + 0.00234017800844203*_cse76 - 0.00329365488408814*_cse81 - 0.00234017800844203*_cse82
+    _cse510 = 0.00820299991767329*_cse104 + 0.00419168864*_cse106 + 0.00419168864*_cse108 + 0.00658730976817627*_cse37 - 0.00821759494*_cse433 - 0.00820299991767329*_cse434 - 0.00821759494*_cse435 + 0.00274213982566424*_cse68 + 0.00274213982566424*_cse70 + 0.00454299207940609*_cse72 + 0.00454299207940609*_cse75 + 0.00468035601688406*_cse76 - 0.00658730976817627*_cse81 - 0.00468035601688406*_cse82
+    _cse511 = 0.00227149603970304*_cse273 + 0.00137106991283212*_cse274 + 0.00227149603970304*_cse275 + 0.00137106991283212*_cse276 + 0.00234017800844203*_cse425 - 0.00234017800844203*_cse426 + 0.00410149995883665*_cse437 - 0.00410879747*_cse438 + 0.00209584432*_cse439 - 0.00410149995883665*_cse440 - 0.00410879747*_cse441 + 0.00209584432*_cse442 - 0.00329365488408814*_cse60 + 0.00329365488408814*_cse94
+    _cse512 = 0.00454299207940609*_cse273 + 0.00274213982566424*_cse274 + 0.00454299207940609*_cse275 + 0.00274213982566424*_cse276 + 0.00468035601688406*_cse425 - 0.00468035601688406*_cse426 + 0.00820299991767329*_cse437 - 0.00821759494*_cse438 + 0.00419168864*_cse439 - 0.00820299991767329*_cse440 - 0.00821759494*_cse441 + 0.00419168864*_cse442 - 0.00658730976817627*_cse60 + 0.00658730976817627*_cse94
+    _cse513 = _cse0*_cse511 + _cse0*_cse512 + _cse1*_cse509 + _cse1*_cse510
+    _cse514 = -0.00234017800844203*_cse290 + 0.00137106991283212*_cse292 + 0.00137106991283212*_cse293 + 0.00227149603970304*_cse294 + 0.00227149603970304*_cse295 + 0.00234017800844203*_cse296 + 0.00410149995883665*_cse299 + 0.00209584432*_cse300 + 0.00209584432*_cse302 - 0.00329365488408814*_cse44 - 0.00329365488408814*_cse45 - 0.00410879747*_cse486 - 0.00410149995883665*_cse487 - 0.00410879747*_cse488
+    _cse515 = -0.00468035601688406*_cse290 + 0.00274213982566424*_cse292 + 0.00274213982566424*_cse293 + 0.00454299207940609*_cse294 + 0.00454299207940609*_cse295 + 0.00468035601688406*_cse296 + 0.00820299991767329*_cse299 + 0.00419168864*_cse300 + 0.00419168864*_cse302 - 0.00658730976817627*_cse44 - 0.00658730976817627*_cse45 - 0.00821759494*_cse486 - 0.00820299991767329*_cse487 - 0.00821759494*_cse488
+    out = np.empty((6, 6))
+    out[0, 0] = _cse10*_cse8 + _cse102*_cse103 + _cse111*_cse114 + _cse118*_cse119 + _cse12*_cse14 + _cse26*_cse28 + _cse33*_cse35 + _cse54*_cse58 + _cse64*_cse66 + _cse87*_cse88 + (-2.1217e-5*_cse0 - 4.8455e-5*_cse1)*(-1.06085e-5*_cse0 - 2.42275e-5*_cse1) + (2.42275e-5*_cse0 - 1.06085e-5*_cse1)*(4.8455e-5*_cse0 - 2.1217e-5*_cse1) + 0.13
+    out[0, 1] = -_cse10*_cse122 + _cse103*_cse174 + _cse114*_cse201 + _cse119*_cse198 + _cse121*_cse14 + _cse127*_cse33 + _cse130*_cse26 + _cse142*_cse66 + _cse153*_cse58 + _cse189*_cse88
+    out[0, 2] = _cse103*_cse235 + _cse114*_cse236 + _cse119*_cse237 + _cse203*_cse26 + _cse206*_cse33 + _cse212*_cse58 + _cse214*_cse66 + _cse226*_cse88
+    out[0, 3] = _cse103*_cse256 + _cse114*_cse268 + _cse119*_cse267 + _cse240*_cse66 + _cse245*_cse58 + _cse266*_cse88 + _cse269
+    out[0, 4] = _cse103*_cse272 + _cse114*_cse288 + _cse119*_cse287 + _cse283*_cse88 + _cse297
+    out[0, 5] = _cse303
+    out[1, 0] = _cse102*_cse326 + _cse111*_cse342 + _cse118*_cse339 + _cse12*_cse305 + _cse28*_cse312 - _cse304*_cse8 + _cse310*_cse35 + _cse317*_cse64 + _cse323*_cse54 + _cse330*_cse87
+    out[1, 1] = _cse127*_cse310 + _cse130*_cse312 + _cse142*_cse317 + _cse153*_cse323 + _cse174*_cse326 + _cse189*_cse330 + _cse198*_cse339 + _cse201*_cse342 + _cse343*_cse345 + 0.11*_cse343 + _cse344*_cse345 + 0.11*_cse344 + _cse346*_cse348 + _cse359*_cse364 + _cse380*_cse382 + _cse384*_cse386 + _cse5*(0.10451*_cse3 + 0.00097595*_cse4)
+    out[1, 2] = _cse203*_cse312 + _cse206*_cse310 + _cse212*_cse323 + _cse214*_cse317 + _cse226*_cse330 + _cse235*_cse326 + _cse236*_cse342 + _cse237*_cse339 + _cse348*_cse388 + _cse364*_cse391 + _cse382*_cse400 + _cse386*_cse401 + _cse404
+    out[1, 3] = _cse240*_cse317 + _cse245*_cse323 + _cse256*_cse326 + _cse266*_cse330 + _cse267*_cse339 + _cse268*_cse342 + _cse364*_cse411 + _cse382*_cse421 + _cse386*_cse422 - _cse406 - _cse408
+    out[1, 4] = _cse272*_cse326 + _cse283*_cse330 + _cse287*_cse339 + _cse288*_cse342 + _cse382*_cse431 + _cse386*_cse432 - _cse424 - _cse428
+    out[1, 5] = -_cse444
+    out[2, 0] = _cse102*_cse452 + _cse111*_cse455 + _cse118*_cse454 + _cse28*_cse447 + _cse35*_cse446 + _cse449*_cse64 + _cse451*_cse54 + _cse453*_cse87
+    out[2, 1] = _cse127*_cse446 + _cse130*_cse447 + _cse142*_cse449 + _cse153*_cse451 + _cse174*_cse452 + _cse189*_cse453 + _cse198*_cse454 + _cse201*_cse455 + _cse346*_cse456 + _cse359*_cse457 + _cse380*_cse458 + _cse384*_cse459 + _cse404
+    out[2, 2] = _cse203*_cse447 + _cse206*_cse446 + _cse212*_cse451 + _cse214*_cse449 + _cse226*_cse453 + _cse235*_cse452 + _cse236*_cse455 + _cse237*_cse454 + _cse388*_cse456 + _cse391*_cse457 + _cse400*_cse458 + _cse401*_cse459 + _cse402 + _cse403
+    out[2, 3] = _cse240*_cse449 + _cse245*_cse451 + _cse256*_cse452 + _cse266*_cse453 + _cse267*_cse454 + _cse268*_cse455 + _cse406 + _cse408 + _cse411*_cse457 + _cse421*_cse458 + _cse422*_cse459
+    out[2, 4] = _cse272*_cse452 + _cse283*_cse453 + _cse287*_cse454 + _cse288*_cse455 + _cse424 + _cse428 + _cse431*_cse458 + _cse432*_cse459
+    out[2, 5] = _cse444
+    out[3, 0] = _cse102*_cse462 + _cse111*_cse465 + _cse118*_cse464 + _cse269 + _cse460*_cse64 + _cse461*_cse54 + _cse463*_cse87
+    out[3, 1] = _cse142*_cse460 + _cse153*_cse461 + _cse174*_cse462 + _cse189*_cse463 + _cse198*_cse464 + _cse201*_cse465 + _cse359*_cse476 + _cse380*_cse477 + _cse384*_cse478 - _cse468 - _cse470 - _cse472 - _cse475
+    out[3, 2] = _cse212*_cse461 + _cse214*_cse460 + _cse226*_cse463 + _cse235*_cse462 + _cse236*_cse465 + _cse237*_cse464 + _cse391*_cse476 + _cse400*_cse477 + _cse401*_cse478 + _cse468 + _cse470 + _cse472 + _cse475
+    out[3, 3] = _cse240*_cse460 + _cse245*_cse461 + _cse256*_cse462 + _cse266*_cse463 + _cse267*_cse464 + _cse268*_cse465 + _cse405*_cse467 + _cse405*_cse469 + _cse407*_cse471 + _cse407*_cse474 + _cse411*_cse476 + _cse421*_cse477 + _cse422*_cse478 + _cse479*_cse480 + 3*_cse480*_cse481
+    out[3, 4] = _cse272*_cse462 + _cse283*_cse463 + _cse287*_cse464 + _cse288*_cse465 + _cse423*_cse469 + _cse427*_cse471 + _cse431*_cse477 + _cse432*_cse478 + _cse466*_cse484 + _cse473*_cse485 + _cse479*_cse482 + _cse481*_cse483
+    out[3, 5] = _cse436*_cse466 + _cse436*_cse469 + _cse443*_cse471 + _cse443*_cse473 + _cse479*_cse489 + _cse481*_cse489
+    out[4, 0] = _cse102*_cse490 + _cse111*_cse494 + _cse118*_cse493 + _cse297 + _cse491*_cse87
+    out[4, 1] = _cse174*_cse490 + _cse189*_cse491 + _cse198*_cse493 + _cse201*_cse494 + _cse380*_cse505 + _cse384*_cse506 - _cse496 - _cse499 - _cse501 - _cse504
+    out[4, 2] = _cse226*_cse491 + _cse235*_cse490 + _cse236*_cse494 + _cse237*_cse493 + _cse400*_cse505 + _cse401*_cse506 + _cse496 + _cse499 + _cse501 + _cse504
+    out[4, 3] = _cse256*_cse490 + _cse266*_cse491 + _cse267*_cse493 + _cse268*_cse494 + _cse405*_cse495 + _cse405*_cse498 + _cse407*_cse500 + _cse407*_cse503 + _cse421*_cse505 + _cse422*_cse506 + _cse480*_cse507 + 2*_cse480*_cse508
+    out[4, 4] = _cse272*_cse490 + _cse283*_cse491 + _cse287*_cse493 + _cse288*_cse494 + _cse423*_cse495 + _cse427*_cse500 + _cse431*_cse505 + _cse432*_cse506 + _cse482*_cse507 + _cse483*_cse508 + _cse484*_cse497 + _cse485*_cse502
+    out[4, 5] = _cse436*_cse495 + _cse436*_cse497 + _cse443*_cse500 + _cse443*_cse502 + _cse489*_cse507 + _cse489*_cse508
+    out[5, 0] = _cse303
+    out[5, 1] = -_cse513
+    out[5, 2] = _cse513
+    out[5, 3] = _cse405*_cse509 + _cse405*_cse510 + _cse407*_cse511 + _cse407*_cse512 + _cse480*_cse514 + _cse480*_cse515
+    out[5, 4] = _cse423*_cse509 + _cse423*_cse510 + _cse427*_cse511 + _cse427*_cse512 + _cse482*_cse514 + _cse482*_cse515
+    out[5, 5] = _cse436*_cse509 + _cse436*_cse510 + _cse443*_cse511 + _cse443*_cse512 + _cse489*_cse514 + _cse489*_cse515
+    return out
+
+
+# g
+def function1(q0, q1, q2, q3, q4, q5):
+    _cse0 = math.sin(q1)
+    _cse1 = math.cos(q1)
+    _cse2 = math.cos(q3)
+    _cse3 = math.sin(q2)
+    _cse4 = _cse0*_cse3
+    _cse5 = math.cos(q2)
+    _cse6 = _cse1*_cse5
+    _cse7 = 6.57617443000635e-7*_cse4 + 6.57617443000635e-7*_cse6
+    _cse8 = -_cse7
+    _cse9 = _cse2*_cse8
+    _cse10 = _cse0*_cse5
+    _cse11 = 0.818687841791724*_cse10
+    _cse12 = _cse1*_cse3
+    _cse13 = 0.818687841791724*_cse12
+    _cse14 = math.sin(q3)
+    _cse15 = 0.999999998572139*_cse4 + 0.999999998572139*_cse6
+    _cse16 = -_cse15
+    _cse17 = 0.45991232*_cse14 + 0.85536427*_cse2
+    _cse18 = _cse16*_cse17
+    _cse19 = 0.75940555*_cse14 - 0.51802699*_cse2
+    _cse20 = 0.51802699*_cse14 + 0.75940555*_cse2
+    _cse21 = -_cse20
+    _cse22 = 0.85536427*_cse14 - 0.45991232*_cse2
+    _cse23 = _cse22*_cse8
+    _cse24 = -_cse11 + _cse13 - 0.212878838804554*_cse14*_cse16 + 0.758601438*_cse16*_cse19 + 0.458851168*_cse18 + 0.758601438*_cse21*_cse8 + 0.458851168*_cse23 + 0.212878838804554*_cse9
+    _cse25 = math.sin(q4)
+    _cse26 = math.cos(q4)
+    _cse27 = 0.00052974*_cse25 - 0.012272*_cse26
+    _cse28 = -7.3575*_cse27
+    _cse29 = -0.000346321299837637*_cse10 + 0.000346321299837637*_cse12
+    _cse30 = 0.517383113*_cse16*_cse19 - 0.855753802*_cse18 + 0.517383113*_cse21*_cse8 - 0.855753802*_cse23 - _cse29
+    _cse31 = -0.09029124*_cse25 - 0.00389756205*_cse26
+    _cse32 = 0.00048786*_cse3 + 0.081945*_cse5
+    _cse33 = 17.1675*_cse0
+    _cse34 = -0.0734055226259085*_cse25 + 0.0422736501355662*_cse26
+    _cse35 = 0.45479896*_cse25 + 0.78972966*_cse26
+    _cse36 = 0.0929501908614*_cse35
+    _cse37 = 0.00040053*_cse14 - 0.012581*_cse2
+    _cse38 = -12.2625*_cse37
+    _cse39 = -0.1542745125*_cse14 - 0.004911499125*_cse2
+    _cse40 = 0.122617534267774*_cse26
+    _cse41 = 0.40329059*_cse25 + 0.89059413*_cse26
+    _cse42 = 0.89059413*_cse25 - 0.40329059*_cse26
+    _cse43 = 17.1675*_cse1*(0.081945*_cse3 - 0.00048786*_cse5) - 2.43375384071186*_cse10 + 2.43375384071186*_cse12 + 0.0477093082555213*_cse4 + 0.0477093082555213*_cse6
+    _cse44 = _cse14*_cse15
+    _cse45 = _cse15*_cse19
+    _cse46 = _cse21*_cse7
+    _cse47 = _cse15*_cse17
+    _cse48 = _cse22*_cse7
+    _cse49 = _cse29 + 0.517383113*_cse45 + 0.517383113*_cse46 - 0.855753802*_cse47 - 0.855753802*_cse48
+    _cse50 = 0.0459111790584*_cse41
+    _cse51 = _cse2*_cse7
+    _cse52 = _cse11 - _cse13 - 0.212878838804554*_cse44 + 0.758601438*_cse45 + 0.758601438*_cse46 + 0.458851168*_cse47 + 0.458851168*_cse48 + 0.212878838804554*_cse51
+    _cse53 = 0.0459111790584*_cse42
+    _cse54 = 0.122617534267774*_cse25
+    _cse55 = 0.999999998572139*_cse1*_cse3 - 0.999999998572139*_cse10
+    _cse56 = _cse2*_cse55
+    _cse57 = 6.57617443000635e-7*_cse1*_cse3 - 6.57617443000635e-7*_cse10
+    _cse58 = _cse14*_cse57
+    _cse59 = -_cse22*_cse55
+    _cse60 = _cse20*_cse55
+    _cse61 = _cse17*_cse57
+    _cse62 = _cse19*_cse57
+    _cse63 = 0.517383113*_cse19*_cse57 + 0.517383113*_cse20*_cse55 - 0.855753802*_cse59 - 0.855753802*_cse61
+    _cse64 = -0.212878838804554*_cse56 - 0.212878838804554*_cse58 + 0.458851168*_cse59 + 0.758601438*_cse60 + 0.458851168*_cse61 + 0.758601438*_cse62
+    _cse65 = _cse17*_cse55
+    _cse66 = _cse22*_cse57
+    _cse67 = 0.517383113*_cse19*_cse55 + 0.517383113*_cse21*_cse57 - 0.000346321299837637*_cse4 - 0.000346321299837637*_cse6 - 0.855753802*_cse65 - 0.855753802*_cse66
+    _cse68 = -0.212878838804554*_cse14*_cse55 + 0.758601438*_cse19*_cse55 + 0.212878838804554*_cse2*_cse57 + 0.758601438*_cse21*_cse57 + 0.818687841791724*_cse4 + 0.818687841791724*_cse6 + 0.458851168*_cse65 + 0.458851168*_cse66
+    out = np.empty((6, 1))
+    out[0, 0] = 0
+    out[1, 0] = -8.133446475*_cse0 - 0.043064462835*_cse1 + 0.308546934716543*_cse14*_cse16 + 0.124546976506395*_cse16*_cse17 + 0.213373423830749*_cse16*_cse19 - _cse16*_cse39 + 0.213373423830749*_cse21*_cse8 + 0.124546976506395*_cse22*_cse8 - _cse24*_cse28 - _cse24*_cse36 - _cse24*_cse40 + 0.0459111790584*_cse24*_cse42 + 0.122617534267774*_cse25*_cse30 - _cse30*_cse31 - _cse30*_cse34 + 0.0459111790584*_cse30*_cse41 + _cse32*_cse33 - _cse38*_cse8 - _cse43 - 0.308546934716543*_cse9
+    out[2, 0] = -_cse15*_cse39 - _cse28*_cse52 - _cse31*_cse49 - _cse32*_cse33 - _cse34*_cse49 - _cse36*_cse52 - _cse38*_cse7 - _cse40*_cse52 + _cse43 + 0.308546934716543*_cse44 + 0.213373423830749*_cse45 + 0.213373423830749*_cse46 + 0.124546976506395*_cse47 + 0.124546976506395*_cse48 + _cse49*_cse50 + _cse49*_cse54 - 0.308546934716543*_cse51 + _cse52*_cse53
+    out[3, 0] = -_cse28*_cse64 - _cse31*_cse63 - _cse34*_cse63 - _cse36*_cse64 - 12.2625*_cse37*_cse55 - _cse39*_cse57 - _cse40*_cse64 + _cse50*_cse63 + _cse53*_cse64 + _cse54*_cse63 + 0.308546934716543*_cse56 + 0.308546934716543*_cse58 + 0.124546976506395*_cse59 + 0.213373423830749*_cse60 + 0.124546976506395*_cse61 + 0.213373423830749*_cse62
+    out[4, 0] = -7.3575*_cse27*_cse67 - _cse31*_cse68 - _cse34*_cse68 + 0.0929501908614*_cse35*_cse67 + _cse40*_cse67 - 0.0459111790584*_cse42*_cse67 + _cse50*_cse68 + _cse54*_cse68
+    out[5, 0] = 0
+    return out
+
+
+# Gamma
+def function2(q0, q1, q2, q3, q4, q5):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = 2.1217e-5*_cse0 + 4.8455e-5*_cse1
+    _cse3 = 1.211375e-5*_cse0 - 5.30425e-6*_cse1
+    _cse4 = 1.06085e-5*_cse0 + 2.42275e-5*_cse1
+    _cse5 = 2.42275e-5*_cse0 - 1.06085e-5*_cse1
+    _cse6 = 2.16295e-5*_cse0
+    _cse7 = math.sin(q1)
+    _cse8 = math.cos(q1)
+    _cse9 = 0.20902*_cse7 + 0.0019519*_cse8
+    _cse10 = -_cse9
+    _cse11 = _cse0*_cse10
+    _cse12 = 0.5*_cse11
+    _cse13 = 0.0144614975*_cse1 + _cse12 - _cse6
+    _cse14 = -_cse13
+    _cse15 = -_cse1*_cse10 + 4.3259e-5*_cse1
+    _cse16 = -0.028922995*_cse0 - _cse15
+    _cse17 = 0.5*_cse16
+    _cse18 = 4.3259e-5*_cse0
+    _cse19 = 0.028922995*_cse1 + _cse11 - _cse18
+    _cse20 = -0.5*_cse1*_cse10 + 2.16295e-5*_cse1
+    _cse21 = -0.00723074875*_cse0 - 0.5*_cse20
+    _cse22 = -_cse19
+    _cse23 = _cse0*_cse7
+    _cse24 = _cse0*_cse8
+    _cse25 = math.sin(q2)
+    _cse26 = math.cos(q2)
+    _cse27 = 0.081945*_cse25 - 0.00048786*_cse26
+    _cse28 = _cse27*_cse8
+    _cse29 = _cse0*_cse28
+    _cse30 = 0.00048786*_cse25 + 0.081945*_cse26
+    _cse31 = -_cse30
+    _cse32 = _cse31*_cse7
+    _cse33 = _cse0*_cse32
+    _cse34 = 0.20503*_cse23 - 1.098e-6*_cse24 + _cse29 + _cse33
+    _cse35 = -_cse11 + _cse18 + _cse34
+    _cse36 = 0.007102005*_cse1 + _cse35
+    _cse37 = _cse1*_cse7
+    _cse38 = _cse1*_cse28
+    _cse39 = 0.5*_cse38
+    _cse40 = _cse1*_cse32
+    _cse41 = -5.49e-7*_cse1*_cse8 + 0.102515*_cse37 + _cse39 + 0.5*_cse40
+    _cse42 = _cse20 + _cse41
+    _cse43 = 0.0035510025*_cse0 - _cse42
+    _cse44 = 0.5*_cse43
+    _cse45 = 0.5*_cse29
+    _cse46 = 0.102515*_cse23 - 5.49e-7*_cse24 + 0.5*_cse33 + _cse45
+    _cse47 = -_cse12 + _cse46 + _cse6
+    _cse48 = 0.0035510025*_cse1 + _cse47
+    _cse49 = -1.098e-6*_cse1*_cse8 + 0.20503*_cse37 + _cse38 + _cse40
+    _cse50 = _cse15 + _cse49
+    _cse51 = 0.007102005*_cse0 - _cse50
+    _cse52 = 0.5*_cse51
+    _cse53 = -_cse48
+    _cse54 = -_cse36
+    _cse55 = _cse25*_cse8
+    _cse56 = _cse0*_cse55
+    _cse57 = 0.1592*_cse56
+    _cse58 = _cse26*_cse7
+    _cse59 = _cse0*_cse58
+    _cse60 = 0.1592*_cse59
+    _cse61 = _cse57 - _cse60
+    _cse62 = _cse26*_cse8
+    _cse63 = 0.0038906673398998*_cse62
+    _cse64 = _cse0*_cse63
+    _cse65 = _cse25*_cse7
+    _cse66 = 0.0038906673398998*_cse65
+    _cse67 = _cse0*_cse66
+    _cse68 = _cse64 + _cse67
+    _cse69 = 0.0068032576553314*_cse1 + _cse35 + _cse68
+    _cse70 = _cse61 + _cse69
+    _cse71 = math.sin(q3)
+    _cse72 = math.cos(q3)
+    _cse73 = 0.00040053*_cse71 - 0.012581*_cse72
+    _cse74 = -_cse73
+    _cse75 = 0.999999998572139*_cse1
+    _cse76 = 6.57617443000635e-7*_cse0
+    _cse77 = _cse62*_cse76 + _cse65*_cse76
+    _cse78 = _cse75 + _cse77
+    _cse79 = -_cse78
+    _cse80 = _cse74*_cse79
+    _cse81 = 0.012581*_cse71 + 0.00040053*_cse72
+    _cse82 = -_cse81
+    _cse83 = 0.999999998572139*_cse0
+    _cse84 = _cse62*_cse83 + _cse65*_cse83
+    _cse85 = -6.57617443000635e-7*_cse1 + _cse84
+    _cse86 = -_cse85
+    _cse87 = _cse82*_cse86
+    _cse88 = _cse80 + _cse87
+    _cse89 = _cse70 + _cse88
+    _cse90 = 0.0019453336699499*_cse62
+    _cse91 = _cse1*_cse90
+    _cse92 = 0.0019453336699499*_cse65
+    _cse93 = _cse1*_cse92
+    _cse94 = _cse91 + _cse93
+    _cse95 = _cse1*_cse55
+    _cse96 = 0.0796*_cse95
+    _cse97 = _cse1*_cse58
+    _cse98 = 0.0796*_cse97
+    _cse99 = _cse96 - _cse98
+    _cse100 = _cse94 + _cse99
+    _cse101 = 6.57617443000635e-7*_cse1
+    _cse102 = _cse101*_cse62 + _cse101*_cse65
+    _cse103 = _cse102 - _cse83
+    _cse104 = _cse62*_cse75 + _cse65*_cse75
+    _cse105 = _cse104 + _cse76
+    _cse106 = -0.0034016288276657*_cse0 - 0.5*_cse103*_cse74 - 0.5*_cse105*_cse82 + _cse42
+    _cse107 = -_cse100 - _cse106
+    _cse108 = 0.5*_cse107
+    _cse109 = 0.0796*_cse56
+    _cse110 = 0.0796*_cse59
+    _cse111 = _cse109 - _cse110
+    _cse112 = _cse0*_cse90
+    _cse113 = _cse0*_cse92
+    _cse114 = _cse112 + _cse113
+    _cse115 = 0.0034016288276657*_cse1 + _cse114 + _cse47
+    _cse116 = _cse111 + _cse115
+    _cse117 = 0.5*_cse80 + 0.5*_cse87
+    _cse118 = _cse116 + _cse117
+    _cse119 = _cse1*_cse63
+    _cse120 = _cse1*_cse66
+    _cse121 = _cse119 + _cse120
+    _cse122 = 0.1592*_cse95
+    _cse123 = 0.1592*_cse97
+    _cse124 = _cse122 - _cse123
+    _cse125 = _cse121 + _cse124
+    _cse126 = -0.0068032576553314*_cse0 - _cse103*_cse74 - _cse105*_cse82 + _cse50
+    _cse127 = -_cse125 - _cse126
+    _cse128 = 0.5*_cse127
+    _cse129 = -0.5*_cse74*_cse78 - 0.5*_cse82*_cse85
+    _cse130 = -_cse116 - _cse129
+    _cse131 = -_cse74*_cse78 - _cse82*_cse85
+    _cse132 = -_cse131 - _cse70
+    _cse133 = _cse72*_cse79
+    _cse134 = 0.45991232*_cse71 + 0.85536427*_cse72
+    _cse135 = _cse134*_cse86
+    _cse136 = 0.85536427*_cse71 - 0.45991232*_cse72
+    _cse137 = _cse136*_cse79
+    _cse138 = 0.75940555*_cse71 - 0.51802699*_cse72
+    _cse139 = _cse138*_cse86
+    _cse140 = 0.51802699*_cse71 + 0.75940555*_cse72
+    _cse141 = -_cse140
+    _cse142 = _cse141*_cse79
+    _cse143 = _cse71*_cse86
+    _cse144 = 0.210033941789101*_cse56 - 0.210033941789101*_cse59
+    _cse145 = _cse144 + _cse69
+    _cse146 = math.sin(q4)
+    _cse147 = math.cos(q4)
+    _cse148 = 0.00052974*_cse146 - 0.012272*_cse147
+    _cse149 = -_cse148
+    _cse150 = 0.818687841791724*_cse55
+    _cse151 = _cse0*_cse150
+    _cse152 = 0.818687841791724*_cse58
+    _cse153 = _cse0*_cse152
+    _cse154 = _cse151 - _cse153
+    _cse155 = 0.212878838804554*_cse133 + 0.458851168*_cse135 + 0.458851168*_cse137 + 0.758601438*_cse139 + 0.758601438*_cse142 - 0.212878838804554*_cse143 + _cse154
+    _cse156 = _cse149*_cse155
+    _cse157 = 0.012272*_cse146 + 0.00052974*_cse147
+    _cse158 = -_cse157
+    _cse159 = 0.000346321299837637*_cse58
+    _cse160 = _cse0*_cse159
+    _cse161 = 0.000346321299837637*_cse55
+    _cse162 = _cse0*_cse161
+    _cse163 = -0.855753802*_cse135 - 0.855753802*_cse137 + 0.517383113*_cse139 + 0.517383113*_cse142 + _cse160 - _cse162
+    _cse164 = _cse158*_cse163
+    _cse165 = _cse156 + _cse164 + _cse88
+    _cse166 = 0.0315500189858492*_cse133 - 0.01084270231829*_cse135 - 0.01084270231829*_cse137 - 0.0189192713225*_cse139 - 0.0189192713225*_cse142 - 0.0315500189858492*_cse143 + _cse145 + _cse165
+    _cse167 = _cse105*_cse134
+    _cse168 = _cse103*_cse136
+    _cse169 = _cse105*_cse138
+    _cse170 = _cse103*_cse141
+    _cse171 = _cse105*_cse71
+    _cse172 = _cse103*_cse72
+    _cse173 = 0.818687841791724*_cse97
+    _cse174 = 0.818687841791724*_cse95
+    _cse175 = _cse173 - _cse174
+    _cse176 = 0.458851168*_cse167 + 0.458851168*_cse168 + 0.758601438*_cse169 + 0.758601438*_cse170 - 0.212878838804554*_cse171 + 0.212878838804554*_cse172 + _cse175
+    _cse177 = 0.000346321299837637*_cse95
+    _cse178 = 0.000346321299837637*_cse97
+    _cse179 = _cse177 - _cse178
+    _cse180 = -0.855753802*_cse167 - 0.855753802*_cse168 + 0.517383113*_cse169 + 0.517383113*_cse170 + _cse179
+    _cse181 = 0.10501697089455*_cse95 - 0.10501697089455*_cse97
+    _cse182 = 0.0157750094929246*_cse103*_cse72 - _cse106 + 0.5*_cse149*_cse176 + 0.5*_cse158*_cse180 - 0.005421351159145*_cse167 - 0.005421351159145*_cse168 - 0.00945963566125*_cse169 - 0.00945963566125*_cse170 - 0.0157750094929246*_cse171 - _cse181 - _cse94
+    _cse183 = 0.5*_cse182
+    _cse184 = 0.10501697089455*_cse56 - 0.10501697089455*_cse59
+    _cse185 = _cse115 + _cse184
+    _cse186 = _cse117 + 0.0157750094929246*_cse133 - 0.005421351159145*_cse135 - 0.005421351159145*_cse137 - 0.00945963566125*_cse139 - 0.00945963566125*_cse142 - 0.0157750094929246*_cse143 + 0.5*_cse156 + 0.5*_cse164 + _cse185
+    _cse187 = 0.210033941789101*_cse95 - 0.210033941789101*_cse97
+    _cse188 = _cse121 + _cse126 - _cse149*_cse176 - _cse158*_cse180
+    _cse189 = 0.0315500189858492*_cse103*_cse72 - 0.01084270231829*_cse167 - 0.01084270231829*_cse168 - 0.0189192713225*_cse169 - 0.0189192713225*_cse170 - 0.0315500189858492*_cse171 - _cse187 - _cse188
+    _cse190 = 0.5*_cse189
+    _cse191 = _cse134*_cse85
+    _cse192 = _cse136*_cse78
+    _cse193 = _cse138*_cse85
+    _cse194 = _cse141*_cse78
+    _cse195 = _cse71*_cse85
+    _cse196 = 0.0157750094929246*_cse195
+    _cse197 = _cse72*_cse78
+    _cse198 = 0.212878838804554*_cse197
+    _cse199 = 0.212878838804554*_cse195
+    _cse200 = -_cse151 + _cse153
+    _cse201 = 0.458851168*_cse191 + 0.458851168*_cse192 + 0.758601438*_cse193 + 0.758601438*_cse194 + _cse198 - _cse199 + _cse200
+    _cse202 = -_cse160 + _cse162
+    _cse203 = -0.855753802*_cse191 - 0.855753802*_cse192 + 0.517383113*_cse193 + 0.517383113*_cse194 + _cse202
+    _cse204 = 0.0157750094929246*_cse197
+    _cse205 = -_cse129 + 0.5*_cse149*_cse201 + 0.5*_cse158*_cse203 - _cse185 - 0.005421351159145*_cse191 - 0.005421351159145*_cse192 - 0.00945963566125*_cse193 - 0.00945963566125*_cse194 - _cse196 + _cse204
+    _cse206 = 0.0315500189858492*_cse195
+    _cse207 = 0.0315500189858492*_cse197
+    _cse208 = _cse131 - _cse149*_cse201 - _cse158*_cse203
+    _cse209 = -_cse145 - 0.01084270231829*_cse191 - 0.01084270231829*_cse192 - 0.0189192713225*_cse193 - 0.0189192713225*_cse194 - _cse206 + _cse207 - _cse208
+    _cse210 = _cse147*_cse155
+    _cse211 = 0.78972966*_cse146 - 0.45479896*_cse147
+    _cse212 = -_cse211
+    _cse213 = _cse163*_cse212
+    _cse214 = 0.45479896*_cse146 + 0.78972966*_cse147
+    _cse215 = _cse155*_cse214
+    _cse216 = _cse146*_cse163
+    _cse217 = 0.40329059*_cse146 + 0.89059413*_cse147
+    _cse218 = _cse163*_cse217
+    _cse219 = 0.89059413*_cse146 - 0.40329059*_cse147
+    _cse220 = _cse155*_cse219
+    _cse221 = 0.253888422522456*_cse56 - 0.253888422522456*_cse59
+    _cse222 = _cse221 + _cse69
+    _cse223 = 0.0627091097210817*_cse133 - 0.0290982758960988*_cse135 - 0.0290982758960988*_cse137 - 0.0491638727803817*_cse139 - 0.0491638727803817*_cse142 - 0.0627091097210817*_cse143 + _cse165 + 0.0499969558686132*_cse210 + 0.03790017976*_cse213 + 0.03790017976*_cse215 - 0.0499969558686132*_cse216 - 0.01872015456*_cse218 - 0.01872015456*_cse220 + _cse222
+    _cse224 = _cse146*_cse180
+    _cse225 = _cse180*_cse217
+    _cse226 = _cse176*_cse219
+    _cse227 = 0.25*_cse38
+    _cse228 = 0.00097266683497495*_cse62
+    _cse229 = _cse1*_cse228
+    _cse230 = 0.00097266683497495*_cse65
+    _cse231 = _cse1*_cse230
+    _cse232 = 0.0634721056306141*_cse95
+    _cse233 = -0.0634721056306141*_cse97
+    _cse234 = -2.745e-7*_cse1*_cse8 + _cse227 + _cse229 + _cse231 + _cse232 + _cse233 + 0.0512575*_cse37 + 0.25*_cse40
+    _cse235 = 0.00170081441383285*_cse0 + 0.25*_cse1*_cse10 - 1.081475e-5*_cse1 + 0.0156772774302704*_cse103*_cse72 + 0.25*_cse103*_cse74 + 0.25*_cse105*_cse82 + 0.0124992389671533*_cse147*_cse176 + 0.25*_cse149*_cse176 + 0.25*_cse158*_cse180 - 0.00727456897402469*_cse167 - 0.00727456897402469*_cse168 - 0.0122909681950954*_cse169 - 0.0122909681950954*_cse170 - 0.0156772774302704*_cse171 + 0.00947504494*_cse176*_cse214 + 0.00947504494*_cse180*_cse212 - 0.0124992389671533*_cse224 - 0.00468003864*_cse225 - 0.00468003864*_cse226 - _cse234
+    _cse236 = 0.5*_cse235
+    _cse237 = 0.25*_cse29
+    _cse238 = _cse0*_cse228
+    _cse239 = _cse0*_cse230
+    _cse240 = 0.0634721056306141*_cse56
+    _cse241 = -0.0634721056306141*_cse59
+    _cse242 = 0.0512575*_cse23 + _cse237 + _cse238 + _cse239 - 2.745e-7*_cse24 + _cse240 + _cse241 + 0.25*_cse33
+    _cse243 = 1.081475e-5*_cse0 + 0.00170081441383285*_cse1 - 0.25*_cse11 + _cse242
+    _cse244 = 0.0156772774302704*_cse133 - 0.00727456897402469*_cse135 - 0.00727456897402469*_cse137 - 0.0122909681950954*_cse139 - 0.0122909681950954*_cse142 - 0.0156772774302704*_cse143 + 0.25*_cse156 + 0.25*_cse164 + 0.0124992389671533*_cse210 + 0.00947504494*_cse213 + 0.00947504494*_cse215 - 0.0124992389671533*_cse216 - 0.00468003864*_cse218 - 0.00468003864*_cse220 + _cse243 + 0.25*_cse80 + 0.25*_cse87
+    _cse245 = 0.253888422522456*_cse95 - 0.253888422522456*_cse97
+    _cse246 = 0.0627091097210817*_cse103*_cse72 + 0.0499969558686132*_cse147*_cse176 - 0.0290982758960988*_cse167 - 0.0290982758960988*_cse168 - 0.0491638727803817*_cse169 - 0.0491638727803817*_cse170 - 0.0627091097210817*_cse171 + 0.03790017976*_cse176*_cse214 + 0.03790017976*_cse180*_cse212 - _cse188 - 0.0499969558686132*_cse224 - 0.01872015456*_cse225 - 0.01872015456*_cse226 - _cse245
+    _cse247 = 0.5*_cse246
+    _cse248 = _cse203*_cse217
+    _cse249 = _cse201*_cse219
+    _cse250 = 0.0156772774302704*_cse195
+    _cse251 = 0.0156772774302704*_cse197
+    _cse252 = _cse146*_cse203
+    _cse253 = _cse147*_cse201
+    _cse254 = 0.0124992389671533*_cse252 - 0.0124992389671533*_cse253
+    _cse255 = 0.25*_cse149*_cse201 + 0.25*_cse158*_cse203 - 0.00727456897402469*_cse191 - 0.00727456897402469*_cse192 - 0.0122909681950954*_cse193 - 0.0122909681950954*_cse194 + 0.00947504494*_cse201*_cse214 + 0.00947504494*_cse203*_cse212 - _cse243 - 0.00468003864*_cse248 - 0.00468003864*_cse249 - _cse250 + _cse251 - _cse254 + 0.25*_cse74*_cse78 + 0.25*_cse82*_cse85
+    _cse256 = 0.0627091097210817*_cse195
+    _cse257 = 0.0627091097210817*_cse197
+    _cse258 = 0.0499969558686132*_cse252 - 0.0499969558686132*_cse253
+    _cse259 = -0.0290982758960988*_cse191 - 0.0290982758960988*_cse192 - 0.0491638727803817*_cse193 - 0.0491638727803817*_cse194 + 0.03790017976*_cse201*_cse214 + 0.03790017976*_cse203*_cse212 - _cse208 - _cse222 - 0.01872015456*_cse248 - 0.01872015456*_cse249 - _cse256 + _cse257 - _cse258
+    _cse260 = 5.49e-7*_cse23
+    _cse261 = 0.102515*_cse24
+    _cse262 = 0.0019519*_cse7 - 0.20902*_cse8
+    _cse263 = _cse31*_cse8
+    _cse264 = _cse0*_cse263
+    _cse265 = 0.5*_cse264
+    _cse266 = _cse27*_cse7
+    _cse267 = _cse0*_cse266
+    _cse268 = 0.5*_cse267
+    _cse269 = 0.5*_cse0*_cse262 - _cse260 - _cse261 - _cse265 + _cse268
+    _cse270 = 0.5*_cse36
+    _cse271 = 5.49e-7*_cse37
+    _cse272 = _cse1*_cse8
+    _cse273 = 0.102515*_cse272
+    _cse274 = _cse1*_cse262
+    _cse275 = 0.5*_cse274
+    _cse276 = _cse1*_cse263
+    _cse277 = 0.5*_cse276
+    _cse278 = _cse1*_cse266
+    _cse279 = 0.5*_cse278
+    _cse280 = _cse271 + _cse273 - _cse275 + _cse277 - _cse279
+    _cse281 = 0.0796*_cse62
+    _cse282 = 0.0796*_cse65
+    _cse283 = -0.0019453336699499*_cse56 + 0.0019453336699499*_cse59
+    _cse284 = _cse0*_cse281 + _cse0*_cse282 + _cse283
+    _cse285 = _cse0*_cse262
+    _cse286 = 0.5*_cse285
+    _cse287 = -6.57617443000635e-7*_cse0*_cse25*_cse8 + _cse58*_cse76
+    _cse288 = -_cse287
+    _cse289 = _cse288*_cse74
+    _cse290 = -0.999999998572139*_cse0*_cse25*_cse8 + _cse58*_cse83
+    _cse291 = -_cse290
+    _cse292 = _cse291*_cse82
+    _cse293 = -_cse260 - _cse261 - _cse265 + _cse268 + _cse286 + 0.5*_cse289 + 0.5*_cse292
+    _cse294 = _cse284 + _cse293
+    _cse295 = 0.5*_cse89
+    _cse296 = -_cse101*_cse55 + _cse101*_cse58
+    _cse297 = _cse296*_cse74
+    _cse298 = -_cse55*_cse75 + _cse58*_cse75
+    _cse299 = _cse298*_cse82
+    _cse300 = 0.0019453336699499*_cse95
+    _cse301 = _cse1*_cse281
+    _cse302 = _cse1*_cse282
+    _cse303 = 0.0019453336699499*_cse97
+    _cse304 = _cse280 + 0.5*_cse297 + 0.5*_cse299 + _cse300 - _cse301 - _cse302 - _cse303
+    _cse305 = 0.818687841791724*_cse65
+    _cse306 = _cse0*_cse305
+    _cse307 = 0.818687841791724*_cse62
+    _cse308 = _cse0*_cse307
+    _cse309 = _cse291*_cse71
+    _cse310 = _cse288*_cse72
+    _cse311 = _cse134*_cse291
+    _cse312 = _cse138*_cse291
+    _cse313 = _cse141*_cse288
+    _cse314 = _cse136*_cse288
+    _cse315 = _cse306 + _cse308 - 0.212878838804554*_cse309 + 0.212878838804554*_cse310 + 0.458851168*_cse311 + 0.758601438*_cse312 + 0.758601438*_cse313 + 0.458851168*_cse314
+    _cse316 = _cse149*_cse315
+    _cse317 = 0.000346321299837637*_cse62
+    _cse318 = 0.000346321299837637*_cse65
+    _cse319 = _cse0*_cse317 + _cse0*_cse318
+    _cse320 = 0.517383113*_cse138*_cse291 + 0.517383113*_cse141*_cse288 - 0.855753802*_cse311 - 0.855753802*_cse314 - _cse319
+    _cse321 = _cse158*_cse320
+    _cse322 = 0.10501697089455*_cse62
+    _cse323 = 0.10501697089455*_cse65
+    _cse324 = _cse0*_cse322 + _cse0*_cse323 + _cse283
+    _cse325 = _cse293 - 0.0157750094929246*_cse309 + 0.0157750094929246*_cse310 - 0.005421351159145*_cse311 - 0.00945963566125*_cse312 - 0.00945963566125*_cse313 - 0.005421351159145*_cse314 + 0.5*_cse316 + 0.5*_cse321 + _cse324
+    _cse326 = 0.5*_cse166
+    _cse327 = -_cse300 + _cse303
+    _cse328 = -_cse271 - _cse273 + _cse275 - _cse277 + _cse279 + _cse327
+    _cse329 = _cse1*_cse322 + _cse1*_cse323
+    _cse330 = _cse134*_cse298
+    _cse331 = _cse136*_cse296
+    _cse332 = _cse138*_cse298
+    _cse333 = _cse141*_cse296
+    _cse334 = _cse298*_cse71
+    _cse335 = _cse1*_cse305
+    _cse336 = _cse1*_cse307
+    _cse337 = _cse296*_cse72
+    _cse338 = 0.458851168*_cse330 + 0.458851168*_cse331 + 0.758601438*_cse332 + 0.758601438*_cse333 - 0.212878838804554*_cse334 - _cse335 - _cse336 + 0.212878838804554*_cse337
+    _cse339 = _cse1*_cse317 + _cse1*_cse318
+    _cse340 = -0.855753802*_cse330 - 0.855753802*_cse331 + 0.517383113*_cse332 + 0.517383113*_cse333 + _cse339
+    _cse341 = -0.5*_cse296*_cse74 - 0.5*_cse298*_cse82
+    _cse342 = -0.5*_cse149*_cse338 - 0.5*_cse158*_cse340 - 0.0157750094929246*_cse296*_cse72 + 0.005421351159145*_cse330 + 0.005421351159145*_cse331 + 0.00945963566125*_cse332 + 0.00945963566125*_cse333 + 0.0157750094929246*_cse334 + _cse341
+    _cse343 = -_cse328 - _cse329 - _cse342
+    _cse344 = 0.25*_cse285
+    _cse345 = 0.0124992389671533*_cse147
+    _cse346 = 0.00947504494*_cse212
+    _cse347 = 0.00947504494*_cse214
+    _cse348 = 0.0124992389671533*_cse146
+    _cse349 = 0.00468003864*_cse217
+    _cse350 = 0.00468003864*_cse219
+    _cse351 = 0.0634721056306141*_cse62
+    _cse352 = 0.0634721056306141*_cse65
+    _cse353 = _cse0*_cse351 + _cse0*_cse352 + 0.25*_cse267 - 0.00097266683497495*_cse56 + 0.00097266683497495*_cse59
+    _cse354 = -2.745e-7*_cse23 - 0.0512575*_cse24 - 0.25*_cse264 + 0.25*_cse289 + 0.25*_cse292 - 0.0156772774302704*_cse309 + 0.0156772774302704*_cse310 - 0.00727456897402469*_cse311 - 0.0122909681950954*_cse312 - 0.0122909681950954*_cse313 - 0.00727456897402469*_cse314 + _cse315*_cse345 + _cse315*_cse347 - _cse315*_cse350 + 0.25*_cse316 + _cse320*_cse346 - _cse320*_cse348 - _cse320*_cse349 + 0.25*_cse321 + _cse344 + _cse353
+    _cse355 = 0.5*_cse223
+    _cse356 = -0.0124992389671533*_cse147*_cse338 - 0.25*_cse149*_cse338 - 0.25*_cse158*_cse340 - 0.00947504494*_cse212*_cse340 - 0.00947504494*_cse214*_cse338 - 0.0156772774302704*_cse296*_cse72 - 0.25*_cse296*_cse74 - 0.25*_cse298*_cse82 + 0.00727456897402469*_cse330 + 0.00727456897402469*_cse331 + 0.0122909681950954*_cse332 + 0.0122909681950954*_cse333 + 0.0156772774302704*_cse334 + _cse338*_cse350 + _cse340*_cse348 + _cse340*_cse349
+    _cse357 = 0.25*_cse274
+    _cse358 = _cse1*_cse351 + _cse1*_cse352 + 0.25*_cse278 - 0.00097266683497495*_cse95 + 0.00097266683497495*_cse97
+    _cse359 = -0.0512575*_cse272 - 0.25*_cse276 + _cse357 + _cse358 - 2.745e-7*_cse37
+    _cse360 = -_cse356 - _cse359
+    _cse361 = -_cse280
+    _cse362 = 1.0*_cse51
+    _cse363 = 1.0*_cse54
+    _cse364 = -_cse296
+    _cse365 = _cse364*_cse74
+    _cse366 = -_cse298
+    _cse367 = _cse366*_cse82
+    _cse368 = 0.5*_cse365 + 0.5*_cse367
+    _cse369 = _cse328 + _cse368
+    _cse370 = _cse301 + _cse302 + _cse369
+    _cse371 = 1.0*_cse127
+    _cse372 = 1.0*_cse132
+    _cse373 = _cse366*_cse71
+    _cse374 = _cse364*_cse72
+    _cse375 = _cse134*_cse366
+    _cse376 = _cse138*_cse366
+    _cse377 = _cse141*_cse364
+    _cse378 = _cse136*_cse364
+    _cse379 = _cse335 + _cse336 - 0.212878838804554*_cse373 + 0.212878838804554*_cse374 + 0.458851168*_cse375 + 0.758601438*_cse376 + 0.758601438*_cse377 + 0.458851168*_cse378
+    _cse380 = _cse149*_cse379
+    _cse381 = 0.517383113*_cse138*_cse366 + 0.517383113*_cse141*_cse364 - _cse339 - 0.855753802*_cse375 - 0.855753802*_cse378
+    _cse382 = _cse158*_cse381
+    _cse383 = -0.0157750094929246*_cse373 + 0.0157750094929246*_cse374 - 0.005421351159145*_cse375 - 0.00945963566125*_cse376 - 0.00945963566125*_cse377 - 0.005421351159145*_cse378 + 0.5*_cse380 + 0.5*_cse382
+    _cse384 = _cse329 + _cse369 + _cse383
+    _cse385 = 1.0*_cse189
+    _cse386 = 1.0*_cse209
+    _cse387 = _cse345*_cse379 + _cse346*_cse381 + _cse347*_cse379 - _cse348*_cse381 - _cse349*_cse381 - _cse350*_cse379 + 0.25*_cse365 + 0.25*_cse367 - 0.0156772774302704*_cse373 + 0.0156772774302704*_cse374 - 0.00727456897402469*_cse375 - 0.0122909681950954*_cse376 - 0.0122909681950954*_cse377 - 0.00727456897402469*_cse378 + 0.25*_cse380 + 0.25*_cse382
+    _cse388 = _cse359 + _cse387
+    _cse389 = 1.0*_cse246
+    _cse390 = 1.0*_cse259
+    _cse391 = 1.098e-6*_cse23
+    _cse392 = 0.20503*_cse24
+    _cse393 = _cse0*_cse262 - _cse264 + _cse267 - _cse391 - _cse392
+    _cse394 = 0.5*_cse48
+    _cse395 = 1.098e-6*_cse37
+    _cse396 = 0.20503*_cse272
+    _cse397 = -_cse274 + _cse276 - _cse278 + _cse395 + _cse396
+    _cse398 = 0.1592*_cse62
+    _cse399 = 0.1592*_cse65
+    _cse400 = -0.0038906673398998*_cse56 + 0.0038906673398998*_cse59
+    _cse401 = _cse0*_cse398 + _cse0*_cse399 + _cse400
+    _cse402 = -_cse264 + _cse267 + _cse285 + _cse289 + _cse292 - _cse391 - _cse392
+    _cse403 = _cse401 + _cse402
+    _cse404 = 0.5*_cse118
+    _cse405 = 0.0038906673398998*_cse95
+    _cse406 = _cse1*_cse398
+    _cse407 = _cse1*_cse399
+    _cse408 = 0.0038906673398998*_cse97
+    _cse409 = _cse297 + _cse299 + _cse397 + _cse405 - _cse406 - _cse407 - _cse408
+    _cse410 = 0.210033941789101*_cse62
+    _cse411 = 0.210033941789101*_cse65
+    _cse412 = _cse0*_cse410 + _cse0*_cse411 + _cse400
+    _cse413 = _cse316 + _cse321 + _cse402
+    _cse414 = -0.0315500189858492*_cse309 + 0.0315500189858492*_cse310 - 0.01084270231829*_cse311 - 0.0189192713225*_cse312 - 0.0189192713225*_cse313 - 0.01084270231829*_cse314 + _cse412 + _cse413
+    _cse415 = 0.5*_cse186
+    _cse416 = -_cse405 + _cse408
+    _cse417 = _cse274 - _cse276 + _cse278 - _cse395 - _cse396 + _cse416
+    _cse418 = _cse1*_cse410 + _cse1*_cse411
+    _cse419 = -_cse296*_cse74 - _cse298*_cse82
+    _cse420 = -_cse149*_cse338 - _cse158*_cse340 + _cse419
+    _cse421 = -0.0315500189858492*_cse296*_cse72 + 0.01084270231829*_cse330 + 0.01084270231829*_cse331 + 0.0189192713225*_cse332 + 0.0189192713225*_cse333 + 0.0315500189858492*_cse334 + _cse420
+    _cse422 = -_cse417 - _cse418 - _cse421
+    _cse423 = 0.0499969558686132*_cse147
+    _cse424 = 0.03790017976*_cse212
+    _cse425 = 0.03790017976*_cse214
+    _cse426 = 0.0499969558686132*_cse146
+    _cse427 = 0.01872015456*_cse217
+    _cse428 = 0.01872015456*_cse219
+    _cse429 = 0.253888422522456*_cse62
+    _cse430 = 0.253888422522456*_cse65
+    _cse431 = _cse0*_cse429 + _cse0*_cse430 + _cse400
+    _cse432 = -0.0627091097210817*_cse309 + 0.0627091097210817*_cse310 - 0.0290982758960988*_cse311 - 0.0491638727803817*_cse312 - 0.0491638727803817*_cse313 - 0.0290982758960988*_cse314 + _cse315*_cse423 + _cse315*_cse425 - _cse315*_cse428 + _cse320*_cse424 - _cse320*_cse426 - _cse320*_cse427 + _cse413 + _cse431
+    _cse433 = 0.5*_cse244
+    _cse434 = _cse1*_cse429 + _cse1*_cse430
+    _cse435 = -0.0499969558686132*_cse147*_cse338 - 0.03790017976*_cse212*_cse340 - 0.03790017976*_cse214*_cse338 - 0.0627091097210817*_cse296*_cse72 + 0.0290982758960988*_cse330 + 0.0290982758960988*_cse331 + 0.0491638727803817*_cse332 + 0.0491638727803817*_cse333 + 0.0627091097210817*_cse334 + _cse338*_cse428 + _cse340*_cse426 + _cse340*_cse427 + _cse420
+    _cse436 = -_cse417 - _cse434 - _cse435
+    _cse437 = _cse16*_cse357
+    _cse438 = _cse21*_cse274
+    _cse439 = _cse437 + _cse438
+    _cse440 = _cse30*_cse8
+    _cse441 = _cse1*_cse440
+    _cse442 = _cse278 + _cse441
+    _cse443 = _cse0*_cse440
+    _cse444 = _cse268 + 0.5*_cse443
+    _cse445 = -_cse444
+    _cse446 = _cse279 + 0.5*_cse441
+    _cse447 = -_cse446
+    _cse448 = _cse267 + _cse443
+    _cse449 = -_cse448
+    _cse450 = _cse365 + _cse367
+    _cse451 = _cse416 + _cse442
+    _cse452 = _cse406 + _cse407 + _cse451
+    _cse453 = _cse450 + _cse452
+    _cse454 = -0.5*_cse287*_cse74 - 0.5*_cse290*_cse82 + _cse444
+    _cse455 = -_cse284 - _cse454
+    _cse456 = _cse327 + _cse446
+    _cse457 = _cse301 + _cse302 + _cse456
+    _cse458 = _cse368 + _cse457
+    _cse459 = -_cse341 - _cse457
+    _cse460 = -_cse287*_cse74 - _cse290*_cse82 + _cse448
+    _cse461 = -_cse401 - _cse460
+    _cse462 = _cse418 + _cse451
+    _cse463 = _cse380 + _cse382
+    _cse464 = _cse450 + _cse463
+    _cse465 = -0.0315500189858492*_cse373 + 0.0315500189858492*_cse374 - 0.01084270231829*_cse375 - 0.0189192713225*_cse376 - 0.0189192713225*_cse377 - 0.01084270231829*_cse378
+    _cse466 = _cse462 + _cse464 + _cse465
+    _cse467 = _cse134*_cse290
+    _cse468 = _cse136*_cse287
+    _cse469 = _cse138*_cse290
+    _cse470 = _cse141*_cse287
+    _cse471 = _cse290*_cse71
+    _cse472 = _cse287*_cse72
+    _cse473 = -_cse306 - _cse308 + 0.458851168*_cse467 + 0.458851168*_cse468 + 0.758601438*_cse469 + 0.758601438*_cse470 - 0.212878838804554*_cse471 + 0.212878838804554*_cse472
+    _cse474 = _cse319 - 0.855753802*_cse467 - 0.855753802*_cse468 + 0.517383113*_cse469 + 0.517383113*_cse470
+    _cse475 = 0.5*_cse149*_cse473 + 0.5*_cse158*_cse474 + 0.0157750094929246*_cse287*_cse72 - _cse324 - _cse454 - 0.005421351159145*_cse467 - 0.005421351159145*_cse468 - 0.00945963566125*_cse469 - 0.00945963566125*_cse470 - 0.0157750094929246*_cse471
+    _cse476 = _cse329 + _cse456
+    _cse477 = _cse368 + _cse383 + _cse476
+    _cse478 = -_cse342 - _cse476
+    _cse479 = -_cse149*_cse473 - _cse158*_cse474 + _cse460
+    _cse480 = 0.0315500189858492*_cse287*_cse72 - _cse412 - 0.01084270231829*_cse467 - 0.01084270231829*_cse468 - 0.0189192713225*_cse469 - 0.0189192713225*_cse470 - 0.0315500189858492*_cse471 - _cse479
+    _cse481 = _cse434 + _cse451
+    _cse482 = -0.0627091097210817*_cse373 + 0.0627091097210817*_cse374 - 0.0290982758960988*_cse375 - 0.0491638727803817*_cse376 - 0.0491638727803817*_cse377 - 0.0290982758960988*_cse378 + _cse379*_cse423 + _cse379*_cse425 - _cse379*_cse428 + _cse381*_cse424 - _cse381*_cse426 - _cse381*_cse427
+    _cse483 = _cse464 + _cse481 + _cse482
+    _cse484 = 0.0124992389671533*_cse147*_cse473 + 0.25*_cse149*_cse473 + 0.25*_cse158*_cse474 + 0.00947504494*_cse212*_cse474 + 0.00947504494*_cse214*_cse473 + 0.0156772774302704*_cse287*_cse72 + 0.25*_cse287*_cse74 + 0.25*_cse290*_cse82 - _cse348*_cse474 - _cse349*_cse474 - _cse350*_cse473 - _cse353 - 0.25*_cse443 - 0.00727456897402469*_cse467 - 0.00727456897402469*_cse468 - 0.0122909681950954*_cse469 - 0.0122909681950954*_cse470 - 0.0156772774302704*_cse471
+    _cse485 = _cse358 + 0.25*_cse441
+    _cse486 = _cse387 + _cse485
+    _cse487 = -_cse356 - _cse485
+    _cse488 = 0.0499969558686132*_cse147*_cse473 + 0.03790017976*_cse212*_cse474 + 0.03790017976*_cse214*_cse473 + 0.0627091097210817*_cse287*_cse72 - _cse426*_cse474 - _cse427*_cse474 - _cse428*_cse473 - _cse431 - 0.0290982758960988*_cse467 - 0.0290982758960988*_cse468 - 0.0491638727803817*_cse469 - 0.0491638727803817*_cse470 - 0.0627091097210817*_cse471 - _cse479
+    _cse489 = _cse78*_cse82
+    _cse490 = _cse73*_cse85
+    _cse491 = 0.5*_cse489 + 0.5*_cse490
+    _cse492 = _cse489 + _cse490
+    _cse493 = -_cse103
+    _cse494 = _cse493*_cse82
+    _cse495 = -_cse105
+    _cse496 = _cse495*_cse73
+    _cse497 = _cse494 + _cse496
+    _cse498 = _cse103*_cse82
+    _cse499 = _cse105*_cse73
+    _cse500 = 0.5*_cse498 + 0.5*_cse499
+    _cse501 = 0.5*_cse494 + 0.5*_cse496
+    _cse502 = _cse71*_cse78
+    _cse503 = _cse72*_cse85
+    _cse504 = -_cse136
+    _cse505 = _cse504*_cse85
+    _cse506 = _cse134*_cse78
+    _cse507 = _cse140*_cse85
+    _cse508 = _cse138*_cse78
+    _cse509 = 0.517383113*_cse138*_cse78 + 0.517383113*_cse140*_cse85 - 0.855753802*_cse505 - 0.855753802*_cse506
+    _cse510 = -0.212878838804554*_cse502 - 0.212878838804554*_cse503 + 0.458851168*_cse505 + 0.458851168*_cse506 + 0.758601438*_cse507 + 0.758601438*_cse508
+    _cse511 = 0.5*_cse149*_cse510 + 0.5*_cse158*_cse509 - 0.0157750094929246*_cse502 - 0.0157750094929246*_cse503 - 0.005421351159145*_cse505 - 0.005421351159145*_cse506 - 0.00945963566125*_cse507 - 0.00945963566125*_cse508 + 0.5*_cse73*_cse85 + 0.5*_cse78*_cse82
+    _cse512 = -_cse149*_cse510 - _cse158*_cse509 - _cse73*_cse85 - _cse78*_cse82
+    _cse513 = -0.0315500189858492*_cse502 - 0.0315500189858492*_cse503 - 0.01084270231829*_cse505 - 0.01084270231829*_cse506 - 0.0189192713225*_cse507 - 0.0189192713225*_cse508 - _cse512
+    _cse514 = _cse134*_cse493
+    _cse515 = _cse495*_cse504
+    _cse516 = _cse140*_cse495
+    _cse517 = _cse138*_cse493
+    _cse518 = _cse493*_cse71
+    _cse519 = _cse495*_cse72
+    _cse520 = 0.458851168*_cse514 + 0.458851168*_cse515 + 0.758601438*_cse516 + 0.758601438*_cse517 - 0.212878838804554*_cse518 - 0.212878838804554*_cse519
+    _cse521 = 0.517383113*_cse138*_cse493 + 0.517383113*_cse140*_cse495 - 0.855753802*_cse514 - 0.855753802*_cse515
+    _cse522 = -_cse149*_cse520 - _cse158*_cse521 - _cse493*_cse82 - _cse495*_cse73
+    _cse523 = -0.01084270231829*_cse514 - 0.01084270231829*_cse515 - 0.0189192713225*_cse516 - 0.0189192713225*_cse517 - 0.0315500189858492*_cse518 - 0.0315500189858492*_cse519 - _cse522
+    _cse524 = 0.5*_cse149*_cse520 + 0.5*_cse158*_cse521 + 0.5*_cse493*_cse82 + 0.5*_cse495*_cse73 - 0.005421351159145*_cse514 - 0.005421351159145*_cse515 - 0.00945963566125*_cse516 - 0.00945963566125*_cse517 - 0.0157750094929246*_cse518 - 0.0157750094929246*_cse519
+    _cse525 = _cse103*_cse71
+    _cse526 = _cse105*_cse72
+    _cse527 = _cse105*_cse504
+    _cse528 = _cse103*_cse134
+    _cse529 = _cse105*_cse140
+    _cse530 = _cse103*_cse138
+    _cse531 = 0.517383113*_cse103*_cse138 + 0.517383113*_cse105*_cse140 - 0.855753802*_cse527 - 0.855753802*_cse528
+    _cse532 = -0.212878838804554*_cse525 - 0.212878838804554*_cse526 + 0.458851168*_cse527 + 0.458851168*_cse528 + 0.758601438*_cse529 + 0.758601438*_cse530
+    _cse533 = 0.5*_cse103*_cse82 + 0.5*_cse105*_cse73 + 0.5*_cse149*_cse532 + 0.5*_cse158*_cse531 - 0.0157750094929246*_cse525 - 0.0157750094929246*_cse526 - 0.005421351159145*_cse527 - 0.005421351159145*_cse528 - 0.00945963566125*_cse529 - 0.00945963566125*_cse530
+    _cse534 = 0.0124992389671533*_cse147*_cse510 + 0.25*_cse149*_cse510 + 0.25*_cse158*_cse509 + 0.00947504494*_cse212*_cse509 + 0.00947504494*_cse214*_cse510 - _cse348*_cse509 - _cse349*_cse509 - _cse350*_cse510 - 0.0156772774302704*_cse502 - 0.0156772774302704*_cse503 - 0.00727456897402469*_cse505 - 0.00727456897402469*_cse506 - 0.0122909681950954*_cse507 - 0.0122909681950954*_cse508 + 0.25*_cse73*_cse85 + 0.25*_cse78*_cse82
+    _cse535 = 0.0499969558686132*_cse147*_cse510 + 0.03790017976*_cse212*_cse509 + 0.03790017976*_cse214*_cse510 - _cse426*_cse509 - _cse427*_cse509 - _cse428*_cse510 - 0.0627091097210817*_cse502 - 0.0627091097210817*_cse503 - 0.0290982758960988*_cse505 - 0.0290982758960988*_cse506 - 0.0491638727803817*_cse507 - 0.0491638727803817*_cse508 - _cse512
+    _cse536 = 0.0499969558686132*_cse147*_cse520 + 0.03790017976*_cse212*_cse521 + 0.03790017976*_cse214*_cse520 - _cse426*_cse521 - _cse427*_cse521 - _cse428*_cse520 - 0.0290982758960988*_cse514 - 0.0290982758960988*_cse515 - 0.0491638727803817*_cse516 - 0.0491638727803817*_cse517 - 0.0627091097210817*_cse518 - 0.0627091097210817*_cse519 - _cse522
+    _cse537 = 0.0124992389671533*_cse147*_cse520 + 0.25*_cse149*_cse520 + 0.25*_cse158*_cse521 + 0.00947504494*_cse212*_cse521 + 0.00947504494*_cse214*_cse520 - _cse348*_cse521 - _cse349*_cse521 - _cse350*_cse520 + 0.25*_cse493*_cse82 + 0.25*_cse495*_cse73 - 0.00727456897402469*_cse514 - 0.00727456897402469*_cse515 - 0.0122909681950954*_cse516 - 0.0122909681950954*_cse517 - 0.0156772774302704*_cse518 - 0.0156772774302704*_cse519
+    _cse538 = 0.25*_cse103*_cse82 + 0.25*_cse105*_cse73 + 0.0124992389671533*_cse147*_cse532 + 0.25*_cse149*_cse532 + 0.25*_cse158*_cse531 + 0.00947504494*_cse212*_cse531 + 0.00947504494*_cse214*_cse532 - _cse348*_cse531 - _cse349*_cse531 - _cse350*_cse532 - 0.0156772774302704*_cse525 - 0.0156772774302704*_cse526 - 0.00727456897402469*_cse527 - 0.00727456897402469*_cse528 - 0.0122909681950954*_cse529 - 0.0122909681950954*_cse530
+    _cse539 = _cse148*_cse203
+    _cse540 = _cse158*_cse201
+    _cse541 = 0.5*_cse539 + 0.5*_cse540
+    _cse542 = _cse148*_cse180
+    _cse543 = _cse158*_cse176
+    _cse544 = 0.5*_cse542 + 0.5*_cse543
+    _cse545 = _cse141*_cse493
+    _cse546 = _cse134*_cse495
+    _cse547 = _cse138*_cse495
+    _cse548 = _cse136*_cse493
+    _cse549 = -_cse177 + _cse178 + 0.517383113*_cse545 - 0.855753802*_cse546 + 0.517383113*_cse547 - 0.855753802*_cse548
+    _cse550 = _cse148*_cse549
+    _cse551 = 0.212878838804554*_cse72
+    _cse552 = _cse493*_cse551
+    _cse553 = 0.212878838804554*_cse71
+    _cse554 = _cse495*_cse553
+    _cse555 = -_cse173 + _cse174
+    _cse556 = 0.758601438*_cse545 + 0.458851168*_cse546 + 0.758601438*_cse547 + 0.458851168*_cse548 + _cse552 - _cse554 + _cse555
+    _cse557 = _cse158*_cse556
+    _cse558 = 0.5*_cse550 + 0.5*_cse557
+    _cse559 = _cse539 + _cse540
+    _cse560 = _cse550 + _cse557
+    _cse561 = -_cse219
+    _cse562 = 0.00468003864*_cse561
+    _cse563 = -_cse214
+    _cse564 = 0.25*_cse148*_cse203 + 0.25*_cse158*_cse201 + 0.00947504494*_cse201*_cse212 - _cse201*_cse348 - _cse201*_cse349 - _cse203*_cse345 - _cse203*_cse562 + 0.00947504494*_cse203*_cse563
+    _cse565 = 0.25*_cse148*_cse180 + 0.25*_cse158*_cse176 + 0.00947504494*_cse176*_cse212 - _cse176*_cse348 - _cse176*_cse349 - _cse180*_cse345 - _cse180*_cse562 + 0.00947504494*_cse180*_cse563
+    _cse566 = 0.25*_cse148*_cse549 + 0.25*_cse158*_cse556 + 0.00947504494*_cse212*_cse556 - _cse345*_cse549 - _cse348*_cse556 - _cse349*_cse556 - _cse549*_cse562 + 0.00947504494*_cse549*_cse563
+    _cse567 = 0.01872015456*_cse561
+    _cse568 = _cse148*_cse203 + _cse158*_cse201 + 0.03790017976*_cse201*_cse212 - _cse201*_cse426 - _cse201*_cse427 - _cse203*_cse423 + 0.03790017976*_cse203*_cse563 - _cse203*_cse567
+    _cse569 = _cse148*_cse549 + _cse158*_cse556 + 0.03790017976*_cse212*_cse556 - _cse423*_cse549 - _cse426*_cse556 - _cse427*_cse556 + 0.03790017976*_cse549*_cse563 - _cse549*_cse567
+    _cse570 = _cse361*_cse52
+    _cse571 = 0.5*_cse269
+    _cse572 = _cse54*_cse571
+    _cse573 = _cse128*_cse370
+    _cse574 = 0.5*_cse294
+    _cse575 = _cse132*_cse574
+    _cse576 = _cse190*_cse384
+    _cse577 = 0.5*_cse325
+    _cse578 = _cse209*_cse577
+    _cse579 = _cse247*_cse388
+    _cse580 = 0.5*_cse354
+    _cse581 = _cse259*_cse580
+    _cse582 = _cse19*_cse344
+    _cse583 = -_cse397
+    _cse584 = 0.5*_cse393
+    _cse585 = _cse417 + _cse450
+    _cse586 = _cse406 + _cse407 + _cse585
+    _cse587 = 0.5*_cse403
+    _cse588 = _cse463 + _cse585
+    _cse589 = _cse418 + _cse465 + _cse588
+    _cse590 = 0.5*_cse414
+    _cse591 = _cse434 + _cse482 + _cse588
+    _cse592 = 0.5*_cse432
+    _cse593 = _cse108*_cse586 + _cse13*_cse286 + _cse130*_cse587 + _cse183*_cse589 + _cse205*_cse590 + _cse236*_cse591 + _cse255*_cse592 + _cse44*_cse583 + _cse53*_cse584
+    _cse594 = _cse0*_cse9
+    _cse595 = _cse46 + 0.5*_cse594
+    _cse596 = _cse1*_cse9
+    _cse597 = 0.5*_cse596
+    _cse598 = _cse41 + _cse597
+    _cse599 = -_cse598
+    _cse600 = -_cse77
+    _cse601 = _cse600*_cse74
+    _cse602 = -_cse84
+    _cse603 = _cse602*_cse82
+    _cse604 = 0.5*_cse601 + 0.5*_cse603
+    _cse605 = _cse111 + _cse604
+    _cse606 = _cse114 + _cse595
+    _cse607 = _cse605 + _cse606
+    _cse608 = -0.5*_cse102*_cse74 - 0.5*_cse104*_cse82
+    _cse609 = _cse598 + _cse608
+    _cse610 = -_cse100 - _cse609
+    _cse611 = _cse138*_cse602
+    _cse612 = _cse141*_cse600
+    _cse613 = _cse134*_cse602
+    _cse614 = _cse136*_cse600
+    _cse615 = _cse154 + _cse551*_cse600 - _cse553*_cse602 + 0.758601438*_cse611 + 0.758601438*_cse612 + 0.458851168*_cse613 + 0.458851168*_cse614
+    _cse616 = _cse149*_cse615
+    _cse617 = 0.517383113*_cse138*_cse602 + 0.517383113*_cse141*_cse600 - _cse202 - 0.855753802*_cse613 - 0.855753802*_cse614
+    _cse618 = _cse158*_cse617
+    _cse619 = 0.0157750094929246*_cse72
+    _cse620 = 0.0157750094929246*_cse71
+    _cse621 = _cse184 + _cse600*_cse619 - _cse602*_cse620 + _cse604 - 0.00945963566125*_cse611 - 0.00945963566125*_cse612 - 0.005421351159145*_cse613 - 0.005421351159145*_cse614 + 0.5*_cse616 + 0.5*_cse618
+    _cse622 = _cse606 + _cse621
+    _cse623 = _cse104*_cse134
+    _cse624 = _cse102*_cse136
+    _cse625 = _cse104*_cse138
+    _cse626 = _cse102*_cse141
+    _cse627 = _cse102*_cse551 - _cse104*_cse553 + _cse175 + 0.458851168*_cse623 + 0.458851168*_cse624 + 0.758601438*_cse625 + 0.758601438*_cse626
+    _cse628 = _cse179 - 0.855753802*_cse623 - 0.855753802*_cse624 + 0.517383113*_cse625 + 0.517383113*_cse626
+    _cse629 = -0.0157750094929246*_cse102*_cse72 + _cse104*_cse620 - 0.5*_cse149*_cse627 - 0.5*_cse158*_cse628 + _cse181 + 0.005421351159145*_cse623 + 0.005421351159145*_cse624 + 0.00945963566125*_cse625 + 0.00945963566125*_cse626
+    _cse630 = -_cse609 - _cse629 - _cse94
+    _cse631 = 0.25*_cse594
+    _cse632 = 0.0156772774302704*_cse72
+    _cse633 = 0.0156772774302704*_cse71
+    _cse634 = _cse345*_cse615 + _cse346*_cse617 + _cse347*_cse615 - _cse348*_cse617 - _cse349*_cse617 - _cse350*_cse615 + _cse600*_cse632 + 0.25*_cse601 - _cse602*_cse633 + 0.25*_cse603 - 0.0122909681950954*_cse611 - 0.0122909681950954*_cse612 - 0.00727456897402469*_cse613 - 0.00727456897402469*_cse614 + 0.25*_cse616 + 0.25*_cse618
+    _cse635 = _cse242 + _cse631 + _cse634
+    _cse636 = 0.25*_cse596
+    _cse637 = -0.0156772774302704*_cse102*_cse72 - 0.25*_cse102*_cse74 + _cse104*_cse633 - 0.25*_cse104*_cse82 - 0.0124992389671533*_cse147*_cse627 - 0.25*_cse149*_cse627 - 0.25*_cse158*_cse628 - 0.00947504494*_cse212*_cse628 - 0.00947504494*_cse214*_cse627 + _cse348*_cse628 + _cse349*_cse628 + _cse350*_cse627 + 0.00727456897402469*_cse623 + 0.00727456897402469*_cse624 + 0.0122909681950954*_cse625 + 0.0122909681950954*_cse626
+    _cse638 = -_cse234 - _cse636 - _cse637
+    _cse639 = _cse361*_cse584
+    _cse640 = _cse397*_cse571
+    _cse641 = _cse370*_cse587
+    _cse642 = _cse409*_cse574
+    _cse643 = _cse384*_cse590
+    _cse644 = _cse422*_cse577
+    _cse645 = _cse388*_cse592
+    _cse646 = _cse436*_cse580
+    _cse647 = _cse280*_cse584 + _cse304*_cse587 + _cse343*_cse590 + _cse360*_cse592 + _cse571*_cse583 + _cse574*_cse586 + _cse577*_cse589 + _cse580*_cse591
+    _cse648 = _cse30*_cse7
+    _cse649 = 0.5*_cse648
+    _cse650 = _cse0*_cse649
+    _cse651 = -_cse45 + _cse650
+    _cse652 = 0.5*_cse1
+    _cse653 = _cse648*_cse652
+    _cse654 = _cse39 - _cse653
+    _cse655 = _cse74*_cse77
+    _cse656 = _cse82*_cse84
+    _cse657 = -_cse109 + _cse110 - _cse112 - _cse113 + _cse651 + 0.5*_cse655 + 0.5*_cse656
+    _cse658 = -_cse102
+    _cse659 = _cse658*_cse74
+    _cse660 = -_cse104
+    _cse661 = _cse660*_cse82
+    _cse662 = -_cse653 + _cse94
+    _cse663 = _cse39 + 0.5*_cse659 + 0.5*_cse661 + _cse662
+    _cse664 = _cse663 + _cse99
+    _cse665 = _cse134*_cse84
+    _cse666 = _cse136*_cse77
+    _cse667 = _cse138*_cse84
+    _cse668 = _cse141*_cse77
+    _cse669 = _cse200 + _cse551*_cse77 - _cse553*_cse84 + 0.458851168*_cse665 + 0.458851168*_cse666 + 0.758601438*_cse667 + 0.758601438*_cse668
+    _cse670 = _cse202 - 0.855753802*_cse665 - 0.855753802*_cse666 + 0.517383113*_cse667 + 0.517383113*_cse668
+    _cse671 = _cse114 - _cse650
+    _cse672 = 0.5*_cse149*_cse669 + 0.5*_cse158*_cse670 - _cse184 - _cse45 - _cse620*_cse84 - 0.005421351159145*_cse665 - 0.005421351159145*_cse666 - 0.00945963566125*_cse667 - 0.00945963566125*_cse668 - _cse671 + 0.0157750094929246*_cse72*_cse77 + 0.5*_cse74*_cse77 + 0.5*_cse82*_cse84
+    _cse673 = _cse138*_cse660
+    _cse674 = _cse141*_cse658
+    _cse675 = _cse134*_cse660
+    _cse676 = _cse136*_cse658
+    _cse677 = _cse551*_cse658 - _cse553*_cse660 + _cse555 + 0.758601438*_cse673 + 0.758601438*_cse674 + 0.458851168*_cse675 + 0.458851168*_cse676
+    _cse678 = _cse149*_cse677
+    _cse679 = 0.517383113*_cse138*_cse660 + 0.517383113*_cse141*_cse658 - _cse179 - 0.855753802*_cse675 - 0.855753802*_cse676
+    _cse680 = _cse158*_cse679
+    _cse681 = _cse181 + _cse619*_cse658 - _cse620*_cse660 + _cse663 - 0.00945963566125*_cse673 - 0.00945963566125*_cse674 - 0.005421351159145*_cse675 - 0.005421351159145*_cse676 + 0.5*_cse678 + 0.5*_cse680
+    _cse682 = 0.25*_cse648
+    _cse683 = -_cse0*_cse682 + _cse238 + _cse239 + _cse240 + _cse241
+    _cse684 = 0.0124992389671533*_cse147*_cse669 + 0.25*_cse149*_cse669 + 0.25*_cse158*_cse670 + 0.00947504494*_cse212*_cse670 + 0.00947504494*_cse214*_cse669 - _cse237 - _cse348*_cse670 - _cse349*_cse670 - _cse350*_cse669 - _cse633*_cse84 - 0.00727456897402469*_cse665 - 0.00727456897402469*_cse666 - 0.0122909681950954*_cse667 - 0.0122909681950954*_cse668 - _cse683 + 0.0156772774302704*_cse72*_cse77 + 0.25*_cse74*_cse77 + 0.25*_cse82*_cse84
+    _cse685 = -_cse1*_cse682 + _cse229 + _cse231 + _cse232 + _cse233
+    _cse686 = _cse227 + _cse345*_cse677 + _cse346*_cse679 + _cse347*_cse677 - _cse348*_cse679 - _cse349*_cse679 - _cse350*_cse677 + _cse632*_cse658 - _cse633*_cse660 + 0.25*_cse659 + 0.25*_cse661 - 0.0122909681950954*_cse673 - 0.0122909681950954*_cse674 - 0.00727456897402469*_cse675 - 0.00727456897402469*_cse676 + 0.25*_cse678 + 0.25*_cse680 + _cse685
+    _cse687 = _cse362*_cse651 + _cse363*_cse654 + _cse371*_cse657 + _cse372*_cse664 + _cse385*_cse672 + _cse386*_cse681 + _cse389*_cse684 + _cse390*_cse686
+    _cse688 = 0.5*_cse445
+    _cse689 = 0.5*_cse586
+    _cse690 = 0.5*_cse589
+    _cse691 = 0.5*_cse591
+    _cse692 = 0.5*_cse449
+    _cse693 = 0.5*_cse370
+    _cse694 = 0.5*_cse384
+    _cse695 = 0.5*_cse388
+    _cse696 = -_cse361*_cse692 - _cse442*_cse571 + _cse446*_cse584 - _cse453*_cse574 + _cse455*_cse689 + _cse458*_cse587 - _cse461*_cse693 - _cse466*_cse577 + _cse475*_cse690 + _cse477*_cse590 - _cse480*_cse694 - _cse483*_cse580 + _cse484*_cse691 + _cse486*_cse592 - _cse488*_cse695 + _cse583*_cse688
+    _cse697 = -_cse1*_cse25*_cse8 + _cse97
+    _cse698 = -_cse697
+    _cse699 = 0.035*_cse1
+    _cse700 = _cse698*_cse699
+    _cse701 = _cse697*_cse699
+    _cse702 = _cse700 + _cse701
+    _cse703 = _cse296*_cse82
+    _cse704 = _cse298*_cse73
+    _cse705 = 0.5*_cse703 + 0.5*_cse704
+    _cse706 = _cse291*_cse73
+    _cse707 = _cse288*_cse82
+    _cse708 = 0.5*_cse706 + 0.5*_cse707
+    _cse709 = _cse134*_cse296
+    _cse710 = _cse138*_cse296
+    _cse711 = _cse298*_cse504
+    _cse712 = _cse140*_cse298
+    _cse713 = 0.517383113*_cse138*_cse296 + 0.517383113*_cse140*_cse298 - 0.855753802*_cse709 - 0.855753802*_cse711
+    _cse714 = -_cse296*_cse553 - _cse298*_cse551 + 0.458851168*_cse709 + 0.758601438*_cse710 + 0.458851168*_cse711 + 0.758601438*_cse712
+    _cse715 = 0.5*_cse149*_cse714 + 0.5*_cse158*_cse713 - _cse296*_cse620 + 0.5*_cse296*_cse82 - _cse298*_cse619 + 0.5*_cse298*_cse73 - 0.005421351159145*_cse709 - 0.00945963566125*_cse710 - 0.005421351159145*_cse711 - 0.00945963566125*_cse712
+    _cse716 = _cse291*_cse504
+    _cse717 = _cse140*_cse291
+    _cse718 = _cse134*_cse288
+    _cse719 = _cse138*_cse288
+    _cse720 = 0.517383113*_cse138*_cse288 + 0.517383113*_cse140*_cse291 - 0.855753802*_cse716 - 0.855753802*_cse718
+    _cse721 = -_cse288*_cse553 - _cse291*_cse551 + 0.458851168*_cse716 + 0.758601438*_cse717 + 0.458851168*_cse718 + 0.758601438*_cse719
+    _cse722 = 0.5*_cse149*_cse721 + 0.5*_cse158*_cse720 - _cse288*_cse620 + 0.5*_cse288*_cse82 - _cse291*_cse619 + 0.5*_cse291*_cse73 - 0.005421351159145*_cse716 - 0.00945963566125*_cse717 - 0.005421351159145*_cse718 - 0.00945963566125*_cse719
+    _cse723 = 0.0124992389671533*_cse147*_cse714 + 0.25*_cse149*_cse714 + 0.25*_cse158*_cse713 + 0.00947504494*_cse212*_cse713 + 0.00947504494*_cse214*_cse714 - _cse296*_cse633 + 0.25*_cse296*_cse82 - _cse298*_cse632 + 0.25*_cse298*_cse73 - _cse348*_cse713 - _cse349*_cse713 - _cse350*_cse714 - 0.00727456897402469*_cse709 - 0.0122909681950954*_cse710 - 0.00727456897402469*_cse711 - 0.0122909681950954*_cse712
+    _cse724 = 0.0124992389671533*_cse147*_cse721 + 0.25*_cse149*_cse721 + 0.25*_cse158*_cse720 + 0.00947504494*_cse212*_cse720 + 0.00947504494*_cse214*_cse721 - _cse288*_cse633 + 0.25*_cse288*_cse82 - _cse291*_cse632 + 0.25*_cse291*_cse73 - _cse348*_cse720 - _cse349*_cse720 - _cse350*_cse721 - 0.00727456897402469*_cse716 - 0.0122909681950954*_cse717 - 0.00727456897402469*_cse718 - 0.0122909681950954*_cse719
+    _cse725 = 0.035*_cse55
+    _cse726 = 0.035*_cse58
+    _cse727 = _cse725 - _cse726
+    _cse728 = _cse371*_cse708 + _cse372*_cse705 + _cse385*_cse722 + _cse386*_cse715 + _cse389*_cse724 + _cse390*_cse723 + _cse727
+    _cse729 = _cse491*_cse689 - _cse492*_cse693 - _cse497*_cse574 + _cse501*_cse587 + _cse511*_cse690 - _cse513*_cse694 - _cse523*_cse577 + _cse524*_cse590 + _cse534*_cse691 - _cse535*_cse695 - _cse536*_cse580 + _cse537*_cse592
+    _cse730 = 0.574238819026787*_cse97
+    _cse731 = 0.574238819026787*_cse95
+    _cse732 = 0.239041914*_cse167 + 0.239041914*_cse168 + 0.3960285*_cse169 + 0.3960285*_cse170 + 0.408002994597976*_cse171 - 0.408002994597976*_cse172 - _cse730 + _cse731
+    _cse733 = 0.025*_cse1
+    _cse734 = _cse495*_cse71
+    _cse735 = _cse493*_cse72
+    _cse736 = 0.3960285*_cse545 + 0.239041914*_cse546 + 0.3960285*_cse547 + 0.239041914*_cse548 + _cse730 - _cse731 + 0.408002994597976*_cse734 - 0.408002994597976*_cse735
+    _cse737 = _cse732*_cse733 + _cse733*_cse736
+    _cse738 = 0.0143559704756697*_cse55
+    _cse739 = 0.0143559704756697*_cse58
+    _cse740 = _cse738 - _cse739
+    _cse741 = _cse737 + _cse740
+    _cse742 = _cse541*_cse690 + _cse558*_cse590 - _cse559*_cse694 - _cse560*_cse577 + _cse564*_cse691 + _cse566*_cse592 - _cse568*_cse695 - _cse569*_cse580
+    _cse743 = _cse148*_cse340
+    _cse744 = _cse158*_cse338
+    _cse745 = 0.5*_cse743 + 0.5*_cse744
+    _cse746 = _cse148*_cse320
+    _cse747 = _cse158*_cse315
+    _cse748 = 0.5*_cse746 + 0.5*_cse747
+    _cse749 = 0.25*_cse148*_cse340 + 0.25*_cse158*_cse338 + 0.00947504494*_cse212*_cse338 - _cse338*_cse348 - _cse338*_cse349 - _cse340*_cse345 - _cse340*_cse562 + 0.00947504494*_cse340*_cse563
+    _cse750 = 0.25*_cse148*_cse320 + 0.25*_cse158*_cse315 + 0.00947504494*_cse212*_cse315 - _cse315*_cse348 - _cse315*_cse349 - _cse320*_cse345 - _cse320*_cse562 + 0.00947504494*_cse320*_cse563
+    _cse751 = 6.57617443000635e-7*_cse62 + 6.57617443000635e-7*_cse65
+    _cse752 = -_cse751
+    _cse753 = _cse72*_cse752
+    _cse754 = 0.0102000748649494*_cse753
+    _cse755 = 0.999999998572139*_cse62 + 0.999999998572139*_cse65
+    _cse756 = -_cse755
+    _cse757 = _cse134*_cse756
+    _cse758 = 0.00597604785*_cse757
+    _cse759 = _cse136*_cse752
+    _cse760 = 0.00597604785*_cse759
+    _cse761 = _cse138*_cse756
+    _cse762 = 0.0099007125*_cse761
+    _cse763 = _cse141*_cse752
+    _cse764 = 0.0099007125*_cse763
+    _cse765 = _cse71*_cse756
+    _cse766 = 0.0102000748649494*_cse765
+    _cse767 = _cse385*_cse748 + _cse386*_cse745 + _cse389*_cse750 + _cse390*_cse749 + _cse754 - _cse758 - _cse760 - _cse762 - _cse764 - _cse766
+    _cse768 = 0.329365488408814*_cse97
+    _cse769 = 0.329365488408814*_cse95
+    _cse770 = _cse180*_cse212
+    _cse771 = _cse147*_cse176
+    _cse772 = _cse176*_cse214
+    _cse773 = 0.137106991283212*_cse167 + 0.137106991283212*_cse168 + 0.227149603970304*_cse169 + 0.227149603970304*_cse170 + 0.234017800844203*_cse171 - 0.234017800844203*_cse172 + 0.410149995883665*_cse224 + 0.209584432*_cse225 + 0.209584432*_cse226 - _cse768 + _cse769 - 0.410879747*_cse770 - 0.410149995883665*_cse771 - 0.410879747*_cse772
+    _cse774 = 0.015*_cse1
+    _cse775 = _cse773*_cse774
+    _cse776 = _cse146*_cse549
+    _cse777 = _cse212*_cse549
+    _cse778 = _cse217*_cse549
+    _cse779 = _cse147*_cse556
+    _cse780 = _cse214*_cse556
+    _cse781 = _cse219*_cse556
+    _cse782 = 0.227149603970304*_cse545 + 0.137106991283212*_cse546 + 0.227149603970304*_cse547 + 0.137106991283212*_cse548 + 0.234017800844203*_cse734 - 0.234017800844203*_cse735 + _cse768 - _cse769 + 0.410149995883665*_cse776 - 0.410879747*_cse777 + 0.209584432*_cse778 - 0.410149995883665*_cse779 - 0.410879747*_cse780 + 0.209584432*_cse781
+    _cse783 = _cse774*_cse782
+    _cse784 = -_cse775 - _cse783
+    _cse785 = 0.00494048232613221*_cse58
+    _cse786 = -_cse159 + _cse161
+    _cse787 = 0.517383113*_cse138*_cse756 + 0.517383113*_cse141*_cse752 - 0.855753802*_cse757 - 0.855753802*_cse759 - _cse786
+    _cse788 = 0.00314376648*_cse217
+    _cse789 = _cse150 - _cse152 + _cse551*_cse752 - _cse553*_cse756 + 0.458851168*_cse757 + 0.458851168*_cse759 + 0.758601438*_cse761 + 0.758601438*_cse763
+    _cse790 = 0.00314376648*_cse219
+    _cse791 = 0.00615224993825497*_cse146
+    _cse792 = 0.00494048232613221*_cse55
+    _cse793 = -0.00615224993825497*_cse147*_cse789 - 0.006163196205*_cse212*_cse787 - 0.006163196205*_cse214*_cse789 - 0.00351026701266305*_cse72*_cse752 + 0.00205660486924818*_cse757 + 0.00205660486924818*_cse759 + 0.00340724405955457*_cse761 + 0.00340724405955457*_cse763 + 0.00351026701266305*_cse765 + _cse785 + _cse787*_cse788 + _cse787*_cse791 + _cse789*_cse790 - _cse792
+    _cse794 = _cse447*_cse52
+    _cse795 = _cse54*_cse688
+    _cse796 = _cse128*_cse459
+    _cse797 = 0.5*_cse455
+    _cse798 = _cse132*_cse797
+    _cse799 = _cse190*_cse478
+    _cse800 = 0.5*_cse475
+    _cse801 = _cse209*_cse800
+    _cse802 = _cse247*_cse487
+    _cse803 = 0.5*_cse484
+    _cse804 = _cse259*_cse803
+    _cse805 = -_cse442
+    _cse806 = -_cse419 - _cse452
+    _cse807 = 0.5*_cse461
+    _cse808 = -_cse421 - _cse462
+    _cse809 = 0.5*_cse480
+    _cse810 = -_cse435 - _cse481
+    _cse811 = 0.5*_cse488
+    _cse812 = _cse108*_cse806 + _cse130*_cse807 + _cse183*_cse808 + _cse205*_cse809 + _cse236*_cse810 + _cse255*_cse811 + _cse44*_cse805 + _cse53*_cse692
+    _cse813 = _cse280*_cse692 + _cse304*_cse807 + _cse343*_cse809 + _cse360*_cse811 - _cse397*_cse688 - _cse409*_cse797 - _cse422*_cse800 - _cse436*_cse803 - _cse447*_cse584 - _cse459*_cse587 - _cse478*_cse590 - _cse487*_cse592 + _cse571*_cse805 + _cse574*_cse806 + _cse577*_cse808 + _cse580*_cse810
+    _cse814 = -_cse27
+    _cse815 = _cse272*_cse814
+    _cse816 = _cse653 + 0.5*_cse815
+    _cse817 = _cse24*_cse814
+    _cse818 = 0.5*_cse817
+    _cse819 = -_cse650 - _cse818
+    _cse820 = _cse102*_cse74
+    _cse821 = _cse104*_cse82
+    _cse822 = _cse816 + 0.5*_cse820 + 0.5*_cse821 - _cse91 - _cse93 - _cse96 + _cse98
+    _cse823 = _cse671 - _cse818
+    _cse824 = _cse605 + _cse823
+    _cse825 = 0.5*_cse1*_cse8*_cse814 - _cse608 - _cse629 - _cse662
+    _cse826 = _cse621 + _cse823
+    _cse827 = 0.25*_cse1*_cse8*_cse814 - _cse637 - _cse685
+    _cse828 = _cse634 + _cse683 - 0.25*_cse817
+    _cse829 = _cse442*_cse688
+    _cse830 = _cse447*_cse692
+    _cse831 = _cse453*_cse797
+    _cse832 = _cse459*_cse807
+    _cse833 = _cse466*_cse800
+    _cse834 = _cse478*_cse809
+    _cse835 = _cse483*_cse803
+    _cse836 = _cse487*_cse811
+    _cse837 = _cse446*_cse692 + _cse458*_cse807 + _cse477*_cse809 + _cse486*_cse811 + _cse688*_cse805 + _cse797*_cse806 + _cse800*_cse808 + _cse803*_cse810
+    _cse838 = -_cse700 - _cse701
+    _cse839 = _cse366*_cse73
+    _cse840 = _cse364*_cse82
+    _cse841 = 0.5*_cse839 + 0.5*_cse840
+    _cse842 = _cse287*_cse82
+    _cse843 = _cse290*_cse73
+    _cse844 = 0.5*_cse842 + 0.5*_cse843
+    _cse845 = _cse366*_cse504
+    _cse846 = _cse140*_cse366
+    _cse847 = _cse134*_cse364
+    _cse848 = _cse138*_cse364
+    _cse849 = 0.517383113*_cse138*_cse364 + 0.517383113*_cse140*_cse366 - 0.855753802*_cse845 - 0.855753802*_cse847
+    _cse850 = -_cse364*_cse553 - _cse366*_cse551 + 0.458851168*_cse845 + 0.758601438*_cse846 + 0.458851168*_cse847 + 0.758601438*_cse848
+    _cse851 = 0.5*_cse149*_cse850 + 0.5*_cse158*_cse849 - _cse364*_cse620 + 0.5*_cse364*_cse82 - _cse366*_cse619 + 0.5*_cse366*_cse73 - 0.005421351159145*_cse845 - 0.00945963566125*_cse846 - 0.005421351159145*_cse847 - 0.00945963566125*_cse848
+    _cse852 = _cse134*_cse287
+    _cse853 = _cse138*_cse287
+    _cse854 = _cse290*_cse504
+    _cse855 = _cse140*_cse290
+    _cse856 = 0.517383113*_cse138*_cse287 + 0.517383113*_cse140*_cse290 - 0.855753802*_cse852 - 0.855753802*_cse854
+    _cse857 = -_cse287*_cse553 - _cse290*_cse551 + 0.458851168*_cse852 + 0.758601438*_cse853 + 0.458851168*_cse854 + 0.758601438*_cse855
+    _cse858 = 0.5*_cse149*_cse857 + 0.5*_cse158*_cse856 - _cse287*_cse620 + 0.5*_cse287*_cse82 - _cse290*_cse619 + 0.5*_cse290*_cse73 - 0.005421351159145*_cse852 - 0.00945963566125*_cse853 - 0.005421351159145*_cse854 - 0.00945963566125*_cse855
+    _cse859 = 0.0124992389671533*_cse147*_cse850 + 0.25*_cse149*_cse850 + 0.25*_cse158*_cse849 + 0.00947504494*_cse212*_cse849 + 0.00947504494*_cse214*_cse850 - _cse348*_cse849 - _cse349*_cse849 - _cse350*_cse850 - _cse364*_cse633 + 0.25*_cse364*_cse82 - _cse366*_cse632 + 0.25*_cse366*_cse73 - 0.00727456897402469*_cse845 - 0.0122909681950954*_cse846 - 0.00727456897402469*_cse847 - 0.0122909681950954*_cse848
+    _cse860 = 0.0124992389671533*_cse147*_cse857 + 0.25*_cse149*_cse857 + 0.25*_cse158*_cse856 + 0.00947504494*_cse212*_cse856 + 0.00947504494*_cse214*_cse857 - _cse287*_cse633 + 0.25*_cse287*_cse82 - _cse290*_cse632 + 0.25*_cse290*_cse73 - _cse348*_cse856 - _cse349*_cse856 - _cse350*_cse857 - 0.00727456897402469*_cse852 - 0.0122909681950954*_cse853 - 0.00727456897402469*_cse854 - 0.0122909681950954*_cse855
+    _cse861 = -_cse725 + _cse726
+    _cse862 = _cse371*_cse844 + _cse372*_cse841 + _cse385*_cse858 + _cse386*_cse851 + _cse389*_cse860 + _cse390*_cse859 + _cse861
+    _cse863 = 0.5*_cse491
+    _cse864 = 0.5*_cse808
+    _cse865 = 0.5*_cse810
+    _cse866 = 0.5*_cse492
+    _cse867 = 0.5*_cse478
+    _cse868 = 0.5*_cse487
+    _cse869 = -_cse459*_cse866 - _cse497*_cse797 + _cse501*_cse807 + _cse511*_cse864 - _cse513*_cse867 - _cse523*_cse800 + _cse524*_cse809 + _cse534*_cse865 - _cse535*_cse868 - _cse536*_cse803 + _cse537*_cse811 + _cse806*_cse863
+    _cse870 = _cse559*_cse867
+    _cse871 = _cse560*_cse800
+    _cse872 = _cse568*_cse868
+    _cse873 = _cse569*_cse803
+    _cse874 = _cse148*_cse381
+    _cse875 = _cse158*_cse379
+    _cse876 = 0.5*_cse874 + 0.5*_cse875
+    _cse877 = _cse148*_cse474
+    _cse878 = _cse158*_cse473
+    _cse879 = 0.5*_cse877 + 0.5*_cse878
+    _cse880 = 0.25*_cse148*_cse381 + 0.25*_cse158*_cse379 + 0.00947504494*_cse212*_cse379 - _cse345*_cse381 - _cse348*_cse379 - _cse349*_cse379 - _cse381*_cse562 + 0.00947504494*_cse381*_cse563
+    _cse881 = 0.25*_cse148*_cse474 + 0.25*_cse158*_cse473 + 0.00947504494*_cse212*_cse473 - _cse345*_cse474 - _cse348*_cse473 - _cse349*_cse473 - _cse474*_cse562 + 0.00947504494*_cse474*_cse563
+    _cse882 = _cse134*_cse755
+    _cse883 = 0.00597604785*_cse882
+    _cse884 = _cse136*_cse751
+    _cse885 = 0.00597604785*_cse884
+    _cse886 = _cse138*_cse755
+    _cse887 = 0.0099007125*_cse886
+    _cse888 = _cse141*_cse751
+    _cse889 = 0.0099007125*_cse888
+    _cse890 = _cse71*_cse755
+    _cse891 = 0.0102000748649494*_cse890
+    _cse892 = _cse72*_cse751
+    _cse893 = 0.0102000748649494*_cse892
+    _cse894 = _cse883 + _cse885 + _cse887 + _cse889 + _cse891 - _cse893
+    _cse895 = -1.0*_cse189*_cse879 - 1.0*_cse209*_cse876 - 1.0*_cse246*_cse881 - 1.0*_cse259*_cse880 + _cse894
+    _cse896 = _cse775 + _cse783
+    _cse897 = _cse786 - 0.855753802*_cse882 - 0.855753802*_cse884 + 0.517383113*_cse886 + 0.517383113*_cse888
+    _cse898 = -_cse150 + _cse152 + _cse551*_cse751 - _cse553*_cse755 + 0.458851168*_cse882 + 0.458851168*_cse884 + 0.758601438*_cse886 + 0.758601438*_cse888
+    _cse899 = -0.00615224993825497*_cse147*_cse898 - 0.006163196205*_cse212*_cse897 - 0.006163196205*_cse214*_cse898 - 0.00351026701266305*_cse72*_cse751 - _cse785 + _cse788*_cse897 + _cse790*_cse898 + _cse791*_cse897 + _cse792 + 0.00205660486924818*_cse882 + 0.00205660486924818*_cse884 + 0.00340724405955457*_cse886 + 0.00340724405955457*_cse888 + 0.00351026701266305*_cse890
+    _cse900 = _cse128*_cse500
+    _cse901 = _cse132*_cse863
+    _cse902 = _cse190*_cse533
+    _cse903 = 0.5*_cse511
+    _cse904 = _cse209*_cse903
+    _cse905 = _cse247*_cse538
+    _cse906 = 0.5*_cse534
+    _cse907 = _cse259*_cse906
+    _cse908 = _cse498 + _cse499
+    _cse909 = -_cse103*_cse82 - _cse105*_cse73 - _cse149*_cse532 - _cse158*_cse531
+    _cse910 = -0.0315500189858492*_cse525 - 0.0315500189858492*_cse526 - 0.01084270231829*_cse527 - 0.01084270231829*_cse528 - 0.0189192713225*_cse529 - 0.0189192713225*_cse530 - _cse909
+    _cse911 = 0.5*_cse513
+    _cse912 = 0.0499969558686132*_cse147*_cse532 + 0.03790017976*_cse212*_cse531 + 0.03790017976*_cse214*_cse532 - _cse426*_cse531 - _cse427*_cse531 - _cse428*_cse532 - 0.0627091097210817*_cse525 - 0.0627091097210817*_cse526 - 0.0290982758960988*_cse527 - 0.0290982758960988*_cse528 - 0.0491638727803817*_cse529 - 0.0491638727803817*_cse530 - _cse909
+    _cse913 = 0.5*_cse535
+    _cse914 = _cse108*_cse908 + _cse130*_cse866 + _cse183*_cse910 + _cse205*_cse911 + _cse236*_cse912 + _cse255*_cse913
+    _cse915 = _cse304*_cse866 + _cse343*_cse911 + _cse360*_cse913 - _cse409*_cse863 - _cse422*_cse903 - _cse436*_cse906 - _cse500*_cse587 - _cse533*_cse590 - _cse538*_cse592 + _cse574*_cse908 + _cse577*_cse910 + _cse580*_cse912
+    _cse916 = -0.01*_cse1*_cse25*_cse8 + 0.01*_cse97
+    _cse917 = -_cse916
+    _cse918 = _cse652*_cse917
+    _cse919 = _cse652*_cse916
+    _cse920 = -0.02*_cse1*_cse25*_cse8 + 0.02*_cse97
+    _cse921 = -_cse920
+    _cse922 = 1.5*_cse1
+    _cse923 = _cse921*_cse922
+    _cse924 = _cse920*_cse922
+    _cse925 = _cse918 + _cse919 + _cse923 + _cse924
+    _cse926 = -_cse453*_cse863 + _cse458*_cse866 - _cse466*_cse903 + _cse477*_cse911 - _cse483*_cse906 + _cse486*_cse913 - _cse500*_cse807 - _cse533*_cse809 - _cse538*_cse811 + _cse797*_cse908 + _cse800*_cse910 + _cse803*_cse912
+    _cse927 = -_cse918 - _cse919 - _cse923 - _cse924
+    _cse928 = _cse73*_cse78
+    _cse929 = _cse81*_cse85
+    _cse930 = 0.5*_cse928 + 0.5*_cse929
+    _cse931 = _cse493*_cse73
+    _cse932 = _cse495*_cse81
+    _cse933 = 0.5*_cse931 + 0.5*_cse932
+    _cse934 = _cse504*_cse78
+    _cse935 = -_cse138
+    _cse936 = _cse85*_cse935
+    _cse937 = -_cse134
+    _cse938 = _cse85*_cse937
+    _cse939 = _cse140*_cse78
+    _cse940 = 0.517383113*_cse140*_cse78 + 0.517383113*_cse85*_cse935 - 0.855753802*_cse934 - 0.855753802*_cse938
+    _cse941 = -_cse198 + _cse199 + 0.458851168*_cse934 + 0.758601438*_cse936 + 0.458851168*_cse938 + 0.758601438*_cse939
+    _cse942 = 0.5*_cse149*_cse941 + 0.5*_cse158*_cse940 + _cse196 - _cse204 + 0.5*_cse73*_cse78 + 0.5*_cse81*_cse85 - 0.005421351159145*_cse934 - 0.00945963566125*_cse936 - 0.005421351159145*_cse938 - 0.00945963566125*_cse939
+    _cse943 = _cse493*_cse504
+    _cse944 = _cse495*_cse935
+    _cse945 = _cse495*_cse937
+    _cse946 = _cse140*_cse493
+    _cse947 = 0.517383113*_cse140*_cse493 + 0.517383113*_cse495*_cse935 - 0.855753802*_cse943 - 0.855753802*_cse945
+    _cse948 = -_cse552 + _cse554 + 0.458851168*_cse943 + 0.758601438*_cse944 + 0.458851168*_cse945 + 0.758601438*_cse946
+    _cse949 = 0.5*_cse149*_cse948 + 0.5*_cse158*_cse947 - _cse493*_cse619 + 0.5*_cse493*_cse73 + 0.0157750094929246*_cse495*_cse71 + 0.5*_cse495*_cse81 - 0.005421351159145*_cse943 - 0.00945963566125*_cse944 - 0.005421351159145*_cse945 - 0.00945963566125*_cse946
+    _cse950 = 0.0124992389671533*_cse147*_cse941 + 0.25*_cse149*_cse941 + 0.25*_cse158*_cse940 + 0.00947504494*_cse212*_cse940 + 0.00947504494*_cse214*_cse941 + _cse250 - _cse251 - _cse348*_cse940 - _cse349*_cse940 - _cse350*_cse941 + 0.25*_cse73*_cse78 + 0.25*_cse81*_cse85 - 0.00727456897402469*_cse934 - 0.0122909681950954*_cse936 - 0.00727456897402469*_cse938 - 0.0122909681950954*_cse939
+    _cse951 = 0.0124992389671533*_cse147*_cse948 + 0.25*_cse149*_cse948 + 0.25*_cse158*_cse947 + 0.00947504494*_cse212*_cse947 + 0.00947504494*_cse214*_cse948 - _cse348*_cse947 - _cse349*_cse947 - _cse350*_cse948 - _cse493*_cse632 + 0.25*_cse493*_cse73 + 0.0156772774302704*_cse495*_cse71 + 0.25*_cse495*_cse81 - 0.00727456897402469*_cse943 - 0.0122909681950954*_cse944 - 0.00727456897402469*_cse945 - 0.0122909681950954*_cse946
+    _cse952 = 0.01*_cse0*_cse25*_cse8 - 0.01*_cse59
+    _cse953 = 0.5*_cse952
+    _cse954 = _cse0*_cse25*_cse8 - _cse59
+    _cse955 = 0.5*_cse954
+    _cse956 = 0.02*_cse0*_cse25*_cse8 - 0.02*_cse59
+    _cse957 = 1.5*_cse956
+    _cse958 = 1.5*_cse954
+    _cse959 = _cse697*_cse953 + _cse697*_cse957 + _cse698*_cse953 + _cse698*_cse957 + _cse916*_cse955 + _cse917*_cse955 + _cse920*_cse958 + _cse921*_cse958
+    _cse960 = _cse497*_cse863 + _cse500*_cse866 + _cse523*_cse903 + _cse533*_cse911 + _cse536*_cse906 + _cse538*_cse913 + _cse959
+    _cse961 = 0.5*_cse559
+    _cse962 = _cse533*_cse961
+    _cse963 = _cse560*_cse903
+    _cse964 = 0.5*_cse568
+    _cse965 = _cse538*_cse964
+    _cse966 = _cse569*_cse906
+    _cse967 = 0.239041914*_cse191 + 0.239041914*_cse192 + 0.3960285*_cse193 + 0.3960285*_cse194 + 0.408002994597976*_cse195 - 0.408002994597976*_cse197 + 0.574238819026787*_cse56 - 0.574238819026787*_cse59
+    _cse968 = 0.5*_cse967
+    _cse969 = 1.0*_cse967
+    _cse970 = 1.0*_cse956
+    _cse971 = _cse732*_cse953 + _cse732*_cse970 + _cse736*_cse953 + _cse736*_cse970 + _cse916*_cse968 + _cse917*_cse968 + _cse920*_cse969 + _cse921*_cse969
+    _cse972 = _cse148*_cse509
+    _cse973 = _cse158*_cse510
+    _cse974 = 0.5*_cse972 + 0.5*_cse973
+    _cse975 = _cse148*_cse521
+    _cse976 = _cse158*_cse520
+    _cse977 = 0.5*_cse975 + 0.5*_cse976
+    _cse978 = 0.25*_cse148*_cse509 + 0.25*_cse158*_cse510 + 0.00947504494*_cse212*_cse510 - _cse345*_cse509 - _cse348*_cse510 - _cse349*_cse510 - _cse509*_cse562 + 0.00947504494*_cse509*_cse563
+    _cse979 = 0.25*_cse148*_cse521 + 0.25*_cse158*_cse520 + 0.00947504494*_cse212*_cse520 - _cse345*_cse521 - _cse348*_cse520 - _cse349*_cse520 - _cse521*_cse562 + 0.00947504494*_cse521*_cse563
+    _cse980 = -6.57617443000635e-7*_cse25*_cse8 + 6.57617443000635e-7*_cse58
+    _cse981 = -_cse980
+    _cse982 = _cse134*_cse981
+    _cse983 = 0.00597604785*_cse982
+    _cse984 = -0.999999998572139*_cse25*_cse8 + 0.999999998572139*_cse58
+    _cse985 = -_cse984
+    _cse986 = _cse504*_cse985
+    _cse987 = 0.00597604785*_cse986
+    _cse988 = _cse140*_cse985
+    _cse989 = 0.0099007125*_cse988
+    _cse990 = _cse138*_cse981
+    _cse991 = 0.0099007125*_cse990
+    _cse992 = _cse71*_cse981
+    _cse993 = 0.0102000748649494*_cse992
+    _cse994 = _cse72*_cse985
+    _cse995 = 0.0102000748649494*_cse994
+    _cse996 = _cse983 + _cse987 + _cse989 + _cse991 + _cse993 + _cse995
+    _cse997 = -1.0*_cse189*_cse974 - 1.0*_cse209*_cse977 - 1.0*_cse246*_cse978 - 1.0*_cse259*_cse979 + _cse996
+    _cse998 = _cse203*_cse212
+    _cse999 = _cse201*_cse214
+    _cse1000 = 0.0685534956416061*_cse191 + 0.0685534956416061*_cse192 + 0.113574801985152*_cse193 + 0.113574801985152*_cse194 + 0.117008900422102*_cse195 - 0.117008900422102*_cse197 + 0.104792216*_cse248 + 0.104792216*_cse249 + 0.205074997941832*_cse252 - 0.205074997941832*_cse253 + 0.164682744204407*_cse56 - 0.164682744204407*_cse59 - 0.2054398735*_cse998 - 0.2054398735*_cse999
+    _cse1001 = 0.5*_cse956
+    _cse1002 = _cse1000*_cse916 + _cse1000*_cse917 + _cse1000*_cse920 + _cse1000*_cse921 + _cse1001*_cse773 + _cse1001*_cse782 + _cse773*_cse953 + _cse782*_cse953
+    _cse1003 = 0.00351026701266305*_cse992
+    _cse1004 = 0.00351026701266305*_cse994
+    _cse1005 = 0.00340724405955457*_cse988
+    _cse1006 = 0.00340724405955457*_cse990
+    _cse1007 = 0.00205660486924818*_cse982
+    _cse1008 = 0.00205660486924818*_cse986
+    _cse1009 = 0.517383113*_cse138*_cse981 + 0.517383113*_cse140*_cse985 - 0.855753802*_cse982 - 0.855753802*_cse986
+    _cse1010 = _cse1009*_cse788
+    _cse1011 = -_cse551*_cse985 - _cse553*_cse981 + 0.458851168*_cse982 + 0.458851168*_cse986 + 0.758601438*_cse988 + 0.758601438*_cse990
+    _cse1012 = _cse1011*_cse790
+    _cse1013 = _cse1009*_cse791
+    _cse1014 = _cse1003 + _cse1004 + _cse1005 + _cse1006 + _cse1007 + _cse1008 - 0.006163196205*_cse1009*_cse212 + _cse1010 - 0.00615224993825497*_cse1011*_cse147 - 0.006163196205*_cse1011*_cse214 + _cse1012 + _cse1013
+    _cse1015 = _cse190*_cse544
+    _cse1016 = 0.5*_cse541
+    _cse1017 = _cse1016*_cse209
+    _cse1018 = _cse247*_cse565
+    _cse1019 = 0.5*_cse564
+    _cse1020 = _cse1019*_cse259
+    _cse1021 = _cse542 + _cse543
+    _cse1022 = _cse148*_cse180 + _cse158*_cse176 + 0.03790017976*_cse176*_cse212 - _cse176*_cse426 - _cse176*_cse427 - _cse180*_cse423 + 0.03790017976*_cse180*_cse563 - _cse180*_cse567
+    _cse1023 = _cse1021*_cse183 + _cse1022*_cse236 + _cse205*_cse961 + _cse255*_cse964
+    _cse1024 = _cse544*_cse590
+    _cse1025 = _cse1016*_cse422
+    _cse1026 = _cse565*_cse592
+    _cse1027 = _cse1019*_cse436
+    _cse1028 = 0.00574238819026787*_cse97
+    _cse1029 = 0.00574238819026787*_cse95
+    _cse1030 = -_cse1028 + _cse1029 + 0.00239041914*_cse167 + 0.00239041914*_cse168 + 0.003960285*_cse169 + 0.003960285*_cse170 + 0.00408002994597976*_cse171 - 0.00408002994597976*_cse172
+    _cse1031 = _cse1030*_cse652
+    _cse1032 = _cse1028 - _cse1029 + 0.003960285*_cse545 + 0.00239041914*_cse546 + 0.003960285*_cse547 + 0.00239041914*_cse548 + 0.00408002994597976*_cse734 - 0.00408002994597976*_cse735
+    _cse1033 = _cse1032*_cse652
+    _cse1034 = 0.0114847763805357*_cse97
+    _cse1035 = 0.0114847763805357*_cse95
+    _cse1036 = -_cse1034 + _cse1035 + 0.00478083828*_cse167 + 0.00478083828*_cse168 + 0.00792057*_cse169 + 0.00792057*_cse170 + 0.00816005989195952*_cse171 - 0.00816005989195952*_cse172
+    _cse1037 = 1.0*_cse1
+    _cse1038 = _cse1036*_cse1037
+    _cse1039 = _cse1034 - _cse1035 + 0.00792057*_cse545 + 0.00478083828*_cse546 + 0.00792057*_cse547 + 0.00478083828*_cse548 + 0.00816005989195952*_cse734 - 0.00816005989195952*_cse735
+    _cse1040 = _cse1037*_cse1039
+    _cse1041 = _cse1031 + _cse1033 + _cse1038 + _cse1040 + _cse740
+    _cse1042 = _cse544*_cse809
+    _cse1043 = _cse1016*_cse466
+    _cse1044 = _cse565*_cse811
+    _cse1045 = _cse1019*_cse483
+    _cse1046 = _cse544*_cse911
+    _cse1047 = _cse1016*_cse523
+    _cse1048 = _cse565*_cse913
+    _cse1049 = _cse1019*_cse536
+    _cse1050 = 0.00239041914*_cse191 + 0.00239041914*_cse192 + 0.003960285*_cse193 + 0.003960285*_cse194 + 0.00408002994597976*_cse195 - 0.00408002994597976*_cse197 + 0.00574238819026787*_cse56 - 0.00574238819026787*_cse59
+    _cse1051 = 0.5*_cse1050
+    _cse1052 = 0.00478083828*_cse191 + 0.00478083828*_cse192 + 0.00792057*_cse193 + 0.00792057*_cse194 + 0.00816005989195952*_cse195 - 0.00816005989195952*_cse197 + 0.0114847763805357*_cse56 - 0.0114847763805357*_cse59
+    _cse1053 = 1.0*_cse1052
+    _cse1054 = 1.0*_cse954
+    _cse1055 = _cse1030*_cse955 + _cse1032*_cse955 + _cse1036*_cse1054 + _cse1039*_cse1054 + _cse1051*_cse697 + _cse1051*_cse698 + _cse1053*_cse697 + _cse1053*_cse698
+    _cse1056 = _cse157*_cse203
+    _cse1057 = _cse148*_cse201
+    _cse1058 = 0.5*_cse1056 + 0.5*_cse1057
+    _cse1059 = _cse157*_cse549
+    _cse1060 = _cse148*_cse556
+    _cse1061 = 0.5*_cse1059 + 0.5*_cse1060
+    _cse1062 = 0.00947504494*_cse211
+    _cse1063 = 0.00947504494*_cse563
+    _cse1064 = -_cse217
+    _cse1065 = 0.00468003864*_cse1064
+    _cse1066 = 0.25*_cse1056 + 0.25*_cse1057 + _cse1062*_cse203 + _cse1063*_cse201 - _cse1065*_cse203 - _cse201*_cse562 + _cse254
+    _cse1067 = 0.25*_cse1059 + 0.25*_cse1060 + _cse1062*_cse549 + _cse1063*_cse556 - _cse1065*_cse549 - _cse345*_cse556 + _cse348*_cse549 - _cse556*_cse562
+    _cse1068 = _cse1030*_cse968 + _cse1032*_cse968 + _cse1036*_cse969 + _cse1039*_cse969 + _cse1051*_cse732 + _cse1051*_cse736 + _cse1053*_cse732 + _cse1053*_cse736
+    _cse1069 = _cse1016*_cse560 + _cse1019*_cse569 + _cse1068 + _cse544*_cse961 + _cse565*_cse964
+    _cse1070 = _cse134*_cse985
+    _cse1071 = _cse136*_cse981
+    _cse1072 = _cse317 + _cse318
+    _cse1073 = -0.855753802*_cse1070 - 0.855753802*_cse1071 - _cse1072 + 0.517383113*_cse138*_cse985 + 0.517383113*_cse141*_cse981
+    _cse1074 = _cse1073*_cse561
+    _cse1075 = 0.00314376648*_cse1074
+    _cse1076 = _cse553*_cse985
+    _cse1077 = _cse551*_cse981
+    _cse1078 = _cse138*_cse985
+    _cse1079 = _cse141*_cse981
+    _cse1080 = 0.458851168*_cse1070 + 0.458851168*_cse1071 - _cse1076 + _cse1077 + 0.758601438*_cse1078 + 0.758601438*_cse1079 + _cse305 + _cse307
+    _cse1081 = _cse1080*_cse788
+    _cse1082 = 0.00615224993825497*_cse147
+    _cse1083 = _cse1073*_cse1082
+    _cse1084 = _cse1080*_cse791
+    _cse1085 = -0.006163196205*_cse1073*_cse563 + _cse1075 - 0.006163196205*_cse1080*_cse212 + _cse1081 + _cse1083 + _cse1084
+    _cse1086 = 0.5*_cse1052
+    _cse1087 = _cse1000*_cse1030 + _cse1000*_cse1032 + _cse1000*_cse1036 + _cse1000*_cse1039 + _cse1051*_cse773 + _cse1051*_cse782 + _cse1086*_cse773 + _cse1086*_cse782
+    _cse1088 = 0.00329365488408814*_cse97
+    _cse1089 = 0.00329365488408814*_cse95
+    _cse1090 = -_cse1088 + _cse1089 + 0.00137106991283212*_cse167 + 0.00137106991283212*_cse168 + 0.00227149603970304*_cse169 + 0.00227149603970304*_cse170 + 0.00234017800844203*_cse171 - 0.00234017800844203*_cse172 + 0.00410149995883665*_cse224 + 0.00209584432*_cse225 + 0.00209584432*_cse226 - 0.00410879747*_cse770 - 0.00410149995883665*_cse771 - 0.00410879747*_cse772
+    _cse1091 = _cse1090*_cse652
+    _cse1092 = _cse1088 - _cse1089 + 0.00227149603970304*_cse545 + 0.00137106991283212*_cse546 + 0.00227149603970304*_cse547 + 0.00137106991283212*_cse548 + 0.00234017800844203*_cse734 - 0.00234017800844203*_cse735 + 0.00410149995883665*_cse776 - 0.00410879747*_cse777 + 0.00209584432*_cse778 - 0.00410149995883665*_cse779 - 0.00410879747*_cse780 + 0.00209584432*_cse781
+    _cse1093 = _cse1092*_cse652
+    _cse1094 = 0.00658730976817627*_cse97
+    _cse1095 = 0.00658730976817627*_cse95
+    _cse1096 = -_cse1094 + _cse1095 + 0.00274213982566424*_cse167 + 0.00274213982566424*_cse168 + 0.00454299207940609*_cse169 + 0.00454299207940609*_cse170 + 0.00468035601688406*_cse171 - 0.00468035601688406*_cse172 + 0.00820299991767329*_cse224 + 0.00419168864*_cse225 + 0.00419168864*_cse226 - 0.00821759494*_cse770 - 0.00820299991767329*_cse771 - 0.00821759494*_cse772
+    _cse1097 = _cse1096*_cse652
+    _cse1098 = _cse1094 - _cse1095 + 0.00454299207940609*_cse545 + 0.00274213982566424*_cse546 + 0.00454299207940609*_cse547 + 0.00274213982566424*_cse548 + 0.00468035601688406*_cse734 - 0.00468035601688406*_cse735 + 0.00820299991767329*_cse776 - 0.00821759494*_cse777 + 0.00419168864*_cse778 - 0.00820299991767329*_cse779 - 0.00821759494*_cse780 + 0.00419168864*_cse781
+    _cse1099 = _cse1098*_cse652
+    _cse1100 = -_cse1091 - _cse1093 - _cse1097 - _cse1099 + _cse793
+    _cse1101 = _cse1091 + _cse1093 + _cse1097 + _cse1099 + _cse899
+    _cse1102 = 0.00137106991283212*_cse191 + 0.00137106991283212*_cse192 + 0.00227149603970304*_cse193 + 0.00227149603970304*_cse194 + 0.00234017800844203*_cse195 - 0.00234017800844203*_cse197 + 0.00209584432*_cse248 + 0.00209584432*_cse249 + 0.00410149995883665*_cse252 - 0.00410149995883665*_cse253 + 0.00329365488408814*_cse56 - 0.00329365488408814*_cse59 - 0.00410879747*_cse998 - 0.00410879747*_cse999
+    _cse1103 = 0.5*_cse698
+    _cse1104 = 0.00274213982566424*_cse191 + 0.00274213982566424*_cse192 + 0.00454299207940609*_cse193 + 0.00454299207940609*_cse194 + 0.00468035601688406*_cse195 - 0.00468035601688406*_cse197 + 0.00419168864*_cse248 + 0.00419168864*_cse249 + 0.00820299991767329*_cse252 - 0.00820299991767329*_cse253 + 0.00658730976817627*_cse56 - 0.00658730976817627*_cse59 - 0.00821759494*_cse998 - 0.00821759494*_cse999
+    _cse1105 = 0.5*_cse697
+    _cse1106 = _cse1014 + _cse1090*_cse955 + _cse1092*_cse955 + _cse1096*_cse955 + _cse1098*_cse955 + _cse1102*_cse1103 + _cse1102*_cse1105 + _cse1103*_cse1104 + _cse1104*_cse1105
+    _cse1107 = 0.5*_cse732
+    _cse1108 = 0.5*_cse736
+    _cse1109 = _cse1085 + _cse1090*_cse968 + _cse1092*_cse968 + _cse1096*_cse968 + _cse1098*_cse968 + _cse1102*_cse1107 + _cse1102*_cse1108 + _cse1104*_cse1107 + _cse1104*_cse1108
+    _cse1110 = 0.5*_cse1102
+    _cse1111 = 0.5*_cse1104
+    _cse1112 = _cse1000*_cse1090 + _cse1000*_cse1092 + _cse1000*_cse1096 + _cse1000*_cse1098 + _cse1110*_cse773 + _cse1110*_cse782 + _cse1111*_cse773 + _cse1111*_cse782
+    _cse1113 = 1.0*_cse393
+    _cse1114 = 1.0*_cse397
+    _cse1115 = 1.0*_cse403
+    _cse1116 = 1.0*_cse409
+    _cse1117 = 1.0*_cse414
+    _cse1118 = 1.0*_cse422
+    _cse1119 = 1.0*_cse432
+    _cse1120 = 1.0*_cse436
+    _cse1121 = _cse1113*_cse447 + _cse1114*_cse445 + _cse1115*_cse459 + _cse1116*_cse455 + _cse1117*_cse478 + _cse1118*_cse475 + _cse1119*_cse487 + _cse1120*_cse484
+    _cse1122 = _cse1115*_cse500 + _cse1116*_cse491 + _cse1117*_cse533 + _cse1118*_cse511 + _cse1119*_cse538 + _cse1120*_cse534 + _cse861 + _cse927
+    _cse1123 = -_cse738
+    _cse1124 = -_cse754 + _cse758 + _cse760 + _cse762 + _cse764 + _cse766
+    _cse1125 = -_cse1031 - _cse1033 - _cse1038 - _cse1040 + _cse1117*_cse544 + _cse1118*_cse541 + _cse1119*_cse565 + _cse1120*_cse564 + _cse1123 + _cse1124 + _cse739
+    _cse1126 = _cse34 + _cse594
+    _cse1127 = 0.5*_cse599
+    _cse1128 = _cse49 + _cse596
+    _cse1129 = -0.5*_cse1128
+    _cse1130 = _cse601 + _cse603
+    _cse1131 = _cse1130 + _cse61
+    _cse1132 = _cse1126 + _cse68
+    _cse1133 = _cse1131 + _cse1132
+    _cse1134 = 0.5*_cse610
+    _cse1135 = -_cse102*_cse74 - _cse104*_cse82
+    _cse1136 = _cse1128 + _cse1135
+    _cse1137 = -0.5*_cse1136 - 0.5*_cse125
+    _cse1138 = 0.0315500189858492*_cse72
+    _cse1139 = 0.0315500189858492*_cse71
+    _cse1140 = _cse1138*_cse600 - _cse1139*_cse602 + _cse144 - 0.0189192713225*_cse611 - 0.0189192713225*_cse612 - 0.01084270231829*_cse613 - 0.01084270231829*_cse614
+    _cse1141 = _cse1130 + _cse616 + _cse618
+    _cse1142 = _cse1132 + _cse1141
+    _cse1143 = _cse1140 + _cse1142
+    _cse1144 = 0.5*_cse630
+    _cse1145 = -0.0315500189858492*_cse102*_cse72 + _cse104*_cse1139 + _cse187 + 0.01084270231829*_cse623 + 0.01084270231829*_cse624 + 0.0189192713225*_cse625 + 0.0189192713225*_cse626
+    _cse1146 = -_cse149*_cse627 - _cse158*_cse628
+    _cse1147 = _cse1136 + _cse1146 + _cse121
+    _cse1148 = -0.5*_cse1145 - 0.5*_cse1147
+    _cse1149 = 0.0627091097210817*_cse72
+    _cse1150 = 0.0627091097210817*_cse71
+    _cse1151 = _cse1149*_cse600 - _cse1150*_cse602 + _cse221 + _cse423*_cse615 + _cse424*_cse617 + _cse425*_cse615 - _cse426*_cse617 - _cse427*_cse617 - _cse428*_cse615 - 0.0491638727803817*_cse611 - 0.0491638727803817*_cse612 - 0.0290982758960988*_cse613 - 0.0290982758960988*_cse614
+    _cse1152 = _cse1142 + _cse1151
+    _cse1153 = 0.5*_cse638
+    _cse1154 = -0.0627091097210817*_cse102*_cse72 + _cse104*_cse1150 - 0.0499969558686132*_cse147*_cse627 - 0.03790017976*_cse212*_cse628 - 0.03790017976*_cse214*_cse627 + _cse245 + _cse426*_cse628 + _cse427*_cse628 + _cse428*_cse627 + 0.0290982758960988*_cse623 + 0.0290982758960988*_cse624 + 0.0491638727803817*_cse625 + 0.0491638727803817*_cse626
+    _cse1155 = -0.5*_cse1147 - 0.5*_cse1154
+    _cse1156 = 0.25*_cse262*(0.41804*_cse7 + 0.0039038*_cse8)
+    _cse1157 = _cse28 + _cse32 + 0.41405*_cse7 + 0.001950802*_cse8
+    _cse1158 = 0.000975401*_cse7
+    _cse1159 = 0.5*_cse266
+    _cse1160 = -_cse1158 - _cse1159 + 0.5*_cse263 + 0.207025*_cse8
+    _cse1161 = 0.5*_cse1160
+    _cse1162 = 0.5*_cse28
+    _cse1163 = _cse1162 + 0.5*_cse32 + 0.207025*_cse7 + 0.000975401*_cse8
+    _cse1164 = 0.001950802*_cse7
+    _cse1165 = -_cse1164 + _cse263 - _cse266 + 0.41405*_cse8
+    _cse1166 = 0.5*_cse1165
+    _cse1167 = 0.1592*_cse55
+    _cse1168 = 0.1592*_cse58
+    _cse1169 = _cse74*_cse752
+    _cse1170 = _cse756*_cse82
+    _cse1171 = _cse63 + _cse66
+    _cse1172 = _cse1157 + _cse1169 + _cse1170 + _cse1171
+    _cse1173 = _cse1167 - _cse1168 + _cse1172
+    _cse1174 = _cse74*_cse980
+    _cse1175 = _cse82*_cse984
+    _cse1176 = 0.0019453336699499*_cse55
+    _cse1177 = 0.0019453336699499*_cse58
+    _cse1178 = 0.5*_cse1174 + 0.5*_cse1175 + _cse1176 - _cse1177 - _cse281 - _cse282
+    _cse1179 = _cse1160 + _cse1178
+    _cse1180 = 0.5*_cse1179
+    _cse1181 = 0.0796*_cse55
+    _cse1182 = 0.0796*_cse58
+    _cse1183 = _cse90 + _cse92
+    _cse1184 = _cse1163 + 0.5*_cse1169 + 0.5*_cse1170 + _cse1183
+    _cse1185 = _cse1181 - _cse1182 + _cse1184
+    _cse1186 = 0.0038906673398998*_cse55
+    _cse1187 = 0.0038906673398998*_cse58
+    _cse1188 = _cse1174 + _cse1175 + _cse1186 - _cse1187 - _cse398 - _cse399
+    _cse1189 = 0.5*_cse1165 + 0.5*_cse1188
+    _cse1190 = 0.210033941789101*_cse55 - 0.210033941789101*_cse58
+    _cse1191 = _cse149*_cse789
+    _cse1192 = _cse158*_cse787
+    _cse1193 = _cse1172 + _cse1191 + _cse1192
+    _cse1194 = _cse1190 + _cse1193 + 0.0315500189858492*_cse753 - 0.01084270231829*_cse757 - 0.01084270231829*_cse759 - 0.0189192713225*_cse761 - 0.0189192713225*_cse763 - 0.0315500189858492*_cse765
+    _cse1195 = _cse134*_cse984
+    _cse1196 = _cse136*_cse980
+    _cse1197 = _cse138*_cse984
+    _cse1198 = _cse141*_cse980
+    _cse1199 = 0.458851168*_cse1195 + 0.458851168*_cse1196 + 0.758601438*_cse1197 + 0.758601438*_cse1198 - _cse305 - _cse307 + _cse551*_cse980 - _cse553*_cse984
+    _cse1200 = _cse1072 - 0.855753802*_cse1195 - 0.855753802*_cse1196 + 0.517383113*_cse1197 + 0.517383113*_cse1198
+    _cse1201 = -_cse1176 + _cse1177
+    _cse1202 = _cse322 + _cse323
+    _cse1203 = 0.005421351159145*_cse1195 + 0.005421351159145*_cse1196 + 0.00945963566125*_cse1197 + 0.00945963566125*_cse1198 - 0.5*_cse1199*_cse149 - 0.5*_cse1200*_cse158 + _cse1201 + _cse1202 + _cse620*_cse984 - 0.0157750094929246*_cse72*_cse980 - 0.5*_cse74*_cse980 - 0.5*_cse82*_cse984
+    _cse1204 = -_cse1158 - _cse1159 - _cse1203 + 0.5*_cse31*_cse8 + 0.207025*_cse8
+    _cse1205 = 0.5*_cse1204
+    _cse1206 = 0.10501697089455*_cse55 - 0.10501697089455*_cse58
+    _cse1207 = _cse1184 + 0.5*_cse1191 + 0.5*_cse1192 + _cse1206 + _cse619*_cse752 - _cse620*_cse756 - 0.005421351159145*_cse757 - 0.005421351159145*_cse759 - 0.00945963566125*_cse761 - 0.00945963566125*_cse763
+    _cse1208 = _cse410 + _cse411
+    _cse1209 = _cse1139*_cse984 + 0.01084270231829*_cse1195 + 0.01084270231829*_cse1196 + 0.0189192713225*_cse1197 + 0.0189192713225*_cse1198 + _cse1208 - 0.0315500189858492*_cse72*_cse980
+    _cse1210 = -_cse1186 + _cse1187
+    _cse1211 = -_cse1199*_cse149 - _cse1200*_cse158 + _cse1210 - _cse74*_cse980 - _cse82*_cse984
+    _cse1212 = _cse1164 + _cse1211 + _cse266 - _cse31*_cse8 - 0.41405*_cse8
+    _cse1213 = -0.5*_cse1209 - 0.5*_cse1212
+    _cse1214 = 0.253888422522456*_cse55 - 0.253888422522456*_cse58
+    _cse1215 = _cse1193 + _cse1214 + _cse423*_cse789 + _cse424*_cse787 + _cse425*_cse789 - _cse426*_cse787 - _cse427*_cse787 - _cse428*_cse789 + 0.0627091097210817*_cse753 - 0.0290982758960988*_cse757 - 0.0290982758960988*_cse759 - 0.0491638727803817*_cse761 - 0.0491638727803817*_cse763 - 0.0627091097210817*_cse765
+    _cse1216 = 0.25*_cse266
+    _cse1217 = 0.00097266683497495*_cse58
+    _cse1218 = -0.00097266683497495*_cse55
+    _cse1219 = 0.00727456897402469*_cse1195 + 0.00727456897402469*_cse1196 + 0.0122909681950954*_cse1197 + 0.0122909681950954*_cse1198 - 0.0124992389671533*_cse1199*_cse147 - 0.25*_cse1199*_cse149 - 0.00947504494*_cse1199*_cse214 + _cse1199*_cse350 - 0.25*_cse1200*_cse158 - 0.00947504494*_cse1200*_cse212 + _cse1200*_cse348 + _cse1200*_cse349 + _cse633*_cse984 - 0.0156772774302704*_cse72*_cse980 - 0.25*_cse74*_cse980 - 0.25*_cse82*_cse984
+    _cse1220 = -_cse1216 - _cse1217 - _cse1218 - _cse1219 + 0.25*_cse31*_cse8 - _cse351 - _cse352 - 0.0004877005*_cse7 + 0.1035125*_cse8
+    _cse1221 = 0.5*_cse1220
+    _cse1222 = _cse228 + _cse230 + 0.25*_cse28 + 0.0634721056306141*_cse55 - 0.0634721056306141*_cse58
+    _cse1223 = 0.25*_cse1169 + 0.25*_cse1170 + 0.25*_cse1191 + 0.25*_cse1192 + _cse1222 + 0.25*_cse32 + _cse345*_cse789 + _cse346*_cse787 + _cse347*_cse789 - _cse348*_cse787 - _cse349*_cse787 - _cse350*_cse789 + _cse632*_cse752 - _cse633*_cse756 + 0.1035125*_cse7 - 0.00727456897402469*_cse757 - 0.00727456897402469*_cse759 - 0.0122909681950954*_cse761 - 0.0122909681950954*_cse763 + 0.0004877005*_cse8
+    _cse1224 = _cse429 + _cse430
+    _cse1225 = _cse1150*_cse984 + 0.0290982758960988*_cse1195 + 0.0290982758960988*_cse1196 + 0.0491638727803817*_cse1197 + 0.0491638727803817*_cse1198 - 0.0499969558686132*_cse1199*_cse147 - 0.03790017976*_cse1199*_cse214 + _cse1199*_cse428 - 0.03790017976*_cse1200*_cse212 + _cse1200*_cse426 + _cse1200*_cse427 + _cse1224 - 0.0627091097210817*_cse72*_cse980
+    _cse1226 = -0.5*_cse1212 - 0.5*_cse1225
+    _cse1227 = 0.5*_cse440
+    _cse1228 = _cse1159 + _cse1227
+    _cse1229 = _cse1157*_cse1228
+    _cse1230 = -_cse1162 + _cse649
+    _cse1231 = -_cse28 + _cse648
+    _cse1232 = _cse74*_cse981
+    _cse1233 = _cse82*_cse985
+    _cse1234 = _cse1201 + _cse1228 + 0.5*_cse1232 + 0.5*_cse1233
+    _cse1235 = _cse1234 + _cse281 + _cse282
+    _cse1236 = 1.0*_cse1173
+    _cse1237 = _cse74*_cse751
+    _cse1238 = _cse755*_cse82
+    _cse1239 = -_cse1181 + _cse1182 + _cse1230 + 0.5*_cse1237 + 0.5*_cse1238 - _cse90 - _cse92
+    _cse1240 = -_cse1167 + _cse1168 + _cse1231 + _cse1237 + _cse1238 - _cse63 - _cse66
+    _cse1241 = _cse1080*_cse149
+    _cse1242 = _cse1073*_cse158
+    _cse1243 = _cse619*_cse981 - _cse620*_cse985
+    _cse1244 = -0.005421351159145*_cse1070 - 0.005421351159145*_cse1071 - 0.00945963566125*_cse1078 - 0.00945963566125*_cse1079 + _cse1202 + _cse1234 + 0.5*_cse1241 + 0.5*_cse1242 + _cse1243
+    _cse1245 = 1.0*_cse1194
+    _cse1246 = _cse1171 - _cse149*_cse898 - _cse158*_cse897 + _cse28 - _cse30*_cse7 - _cse74*_cse751 - _cse755*_cse82
+    _cse1247 = -_cse1190 - _cse1246 + 0.0315500189858492*_cse72*_cse751 - 0.01084270231829*_cse882 - 0.01084270231829*_cse884 - 0.0189192713225*_cse886 - 0.0189192713225*_cse888 - 0.0315500189858492*_cse890
+    _cse1248 = -_cse1162 - _cse1183 - _cse1206 + 0.5*_cse149*_cse898 + 0.5*_cse158*_cse897 + 0.5*_cse30*_cse7 - _cse620*_cse755 + 0.0157750094929246*_cse72*_cse751 + 0.5*_cse74*_cse751 + 0.5*_cse755*_cse82 - 0.005421351159145*_cse882 - 0.005421351159145*_cse884 - 0.00945963566125*_cse886 - 0.00945963566125*_cse888
+    _cse1249 = _cse1080*_cse345
+    _cse1250 = _cse1073*_cse348
+    _cse1251 = _cse632*_cse981 - _cse633*_cse985
+    _cse1252 = _cse1217 + _cse1218 + _cse351 + _cse352 + 0.25*_cse440
+    _cse1253 = -0.00727456897402469*_cse1070 - 0.00727456897402469*_cse1071 + _cse1073*_cse346 - _cse1073*_cse349 - 0.0122909681950954*_cse1078 - 0.0122909681950954*_cse1079 + _cse1080*_cse347 - _cse1080*_cse350 + _cse1216 + 0.25*_cse1232 + 0.25*_cse1233 + 0.25*_cse1241 + 0.25*_cse1242 + _cse1249 - _cse1250 + _cse1251 + _cse1252
+    _cse1254 = 1.0*_cse1215
+    _cse1255 = -_cse1214 - _cse1246 + 0.0499969558686132*_cse147*_cse898 + 0.03790017976*_cse212*_cse897 + 0.03790017976*_cse214*_cse898 - _cse426*_cse897 - _cse427*_cse897 - _cse428*_cse898 + 0.0627091097210817*_cse72*_cse751 - 0.0290982758960988*_cse882 - 0.0290982758960988*_cse884 - 0.0491638727803817*_cse886 - 0.0491638727803817*_cse888 - 0.0627091097210817*_cse890
+    _cse1256 = -_cse1222 + 0.0124992389671533*_cse147*_cse898 + 0.25*_cse149*_cse898 + 0.25*_cse158*_cse897 + 0.00947504494*_cse212*_cse897 + 0.00947504494*_cse214*_cse898 + 0.25*_cse30*_cse7 - _cse348*_cse897 - _cse349*_cse897 - _cse350*_cse898 - _cse633*_cse755 + 0.0156772774302704*_cse72*_cse751 + 0.25*_cse74*_cse751 + 0.25*_cse755*_cse82 - 0.00727456897402469*_cse882 - 0.00727456897402469*_cse884 - 0.0122909681950954*_cse886 - 0.0122909681950954*_cse888
+    _cse1257 = _cse73*_cse985
+    _cse1258 = _cse82*_cse981
+    _cse1259 = 0.5*_cse1257 + 0.5*_cse1258
+    _cse1260 = 0.5*_cse1009*_cse158 + 0.5*_cse1011*_cse149 - _cse619*_cse985 - _cse620*_cse981 + 0.5*_cse73*_cse985 + 0.5*_cse82*_cse981 - 0.005421351159145*_cse982 - 0.005421351159145*_cse986 - 0.00945963566125*_cse988 - 0.00945963566125*_cse990
+    _cse1261 = 0.25*_cse1009*_cse158 + 0.00947504494*_cse1009*_cse212 - _cse1009*_cse348 - _cse1009*_cse349 + 0.0124992389671533*_cse1011*_cse147 + 0.25*_cse1011*_cse149 + 0.00947504494*_cse1011*_cse214 - _cse1011*_cse350 - _cse632*_cse985 - _cse633*_cse981 + 0.25*_cse73*_cse985 + 0.25*_cse82*_cse981 - 0.00727456897402469*_cse982 - 0.00727456897402469*_cse986 - 0.0122909681950954*_cse988 - 0.0122909681950954*_cse990
+    _cse1262 = _cse73*_cse756
+    _cse1263 = _cse752*_cse82
+    _cse1264 = 0.5*_cse1262 + 0.5*_cse1263
+    _cse1265 = _cse504*_cse756
+    _cse1266 = _cse140*_cse756
+    _cse1267 = _cse134*_cse752
+    _cse1268 = _cse138*_cse752
+    _cse1269 = -0.855753802*_cse1265 - 0.855753802*_cse1267 + 0.517383113*_cse138*_cse752 + 0.517383113*_cse140*_cse756
+    _cse1270 = 0.458851168*_cse1265 + 0.758601438*_cse1266 + 0.458851168*_cse1267 + 0.758601438*_cse1268 - _cse551*_cse756 - _cse553*_cse752
+    _cse1271 = -0.005421351159145*_cse1265 - 0.00945963566125*_cse1266 - 0.005421351159145*_cse1267 - 0.00945963566125*_cse1268 + 0.5*_cse1269*_cse158 + 0.5*_cse1270*_cse149 - _cse619*_cse756 - _cse620*_cse752 + 0.5*_cse73*_cse756 + 0.5*_cse752*_cse82
+    _cse1272 = -0.00727456897402469*_cse1265 - 0.0122909681950954*_cse1266 - 0.00727456897402469*_cse1267 - 0.0122909681950954*_cse1268 + 0.25*_cse1269*_cse158 + 0.00947504494*_cse1269*_cse212 - _cse1269*_cse348 - _cse1269*_cse349 + 0.0124992389671533*_cse1270*_cse147 + 0.25*_cse1270*_cse149 + 0.00947504494*_cse1270*_cse214 - _cse1270*_cse350 - _cse632*_cse756 - _cse633*_cse752 + 0.25*_cse73*_cse756 + 0.25*_cse752*_cse82
+    _cse1273 = _cse1257 + _cse1258
+    _cse1274 = -_cse1009*_cse158 - _cse1011*_cse149 - _cse73*_cse985 - _cse82*_cse981
+    _cse1275 = -_cse1274 - 0.01084270231829*_cse982 - 0.01084270231829*_cse986 - 0.0189192713225*_cse988 - 0.0189192713225*_cse990 - 0.0315500189858492*_cse992 - 0.0315500189858492*_cse994
+    _cse1276 = 0.03790017976*_cse1009*_cse212 - _cse1009*_cse426 - _cse1009*_cse427 + 0.0499969558686132*_cse1011*_cse147 + 0.03790017976*_cse1011*_cse214 - _cse1011*_cse428 - _cse1274 - 0.0290982758960988*_cse982 - 0.0290982758960988*_cse986 - 0.0491638727803817*_cse988 - 0.0491638727803817*_cse990 - 0.0627091097210817*_cse992 - 0.0627091097210817*_cse994
+    _cse1277 = _cse1*_cse65
+    _cse1278 = _cse1*_cse62
+    _cse1279 = _cse1277 + _cse1278
+    _cse1280 = 0.035*_cse0
+    _cse1281 = _cse1279*_cse1280
+    _cse1282 = _cse0*_cse65
+    _cse1283 = _cse0*_cse62
+    _cse1284 = _cse1282 + _cse1283
+    _cse1285 = -_cse1284
+    _cse1286 = _cse1285*_cse699
+    _cse1287 = _cse1281 + _cse1286
+    _cse1288 = 0.01*_cse1277 + 0.01*_cse1278
+    _cse1289 = 0.5*_cse0
+    _cse1290 = _cse1288*_cse1289
+    _cse1291 = 0.01*_cse1282 + 0.01*_cse1283
+    _cse1292 = -_cse1291
+    _cse1293 = _cse1292*_cse652
+    _cse1294 = 0.02*_cse1277 + 0.02*_cse1278
+    _cse1295 = 1.5*_cse0
+    _cse1296 = _cse1294*_cse1295
+    _cse1297 = 0.02*_cse1282 + 0.02*_cse1283
+    _cse1298 = -_cse1297
+    _cse1299 = _cse1298*_cse922
+    _cse1300 = -_cse1290 - _cse1293 - _cse1296 - _cse1299
+    _cse1301 = _cse1073*_cse148
+    _cse1302 = _cse1080*_cse158
+    _cse1303 = 0.5*_cse1301 + 0.5*_cse1302
+    _cse1304 = 0.25*_cse1073*_cse148 - _cse1073*_cse345 - _cse1073*_cse562 + 0.00947504494*_cse1073*_cse563 + 0.25*_cse1080*_cse158 + 0.00947504494*_cse1080*_cse212 - _cse1080*_cse348 - _cse1080*_cse349
+    _cse1305 = _cse148*_cse787
+    _cse1306 = _cse158*_cse789
+    _cse1307 = 0.5*_cse1305 + 0.5*_cse1306
+    _cse1308 = 0.25*_cse148*_cse787 + 0.25*_cse158*_cse789 + 0.00947504494*_cse212*_cse789 - _cse345*_cse787 - _cse348*_cse789 - _cse349*_cse789 - _cse562*_cse787 + 0.00947504494*_cse563*_cse787
+    _cse1309 = _cse1301 + _cse1302
+    _cse1310 = _cse1073*_cse148 - _cse1073*_cse423 + 0.03790017976*_cse1073*_cse563 - _cse1073*_cse567 + _cse1080*_cse158 + 0.03790017976*_cse1080*_cse212 - _cse1080*_cse426 - _cse1080*_cse427
+    _cse1311 = 0.00574238819026787*_cse1277
+    _cse1312 = 0.00574238819026787*_cse1278
+    _cse1313 = _cse1311 + _cse1312 + 0.00239041914*_cse330 + 0.00239041914*_cse331 + 0.003960285*_cse332 + 0.003960285*_cse333 + 0.00408002994597976*_cse334 - 0.00408002994597976*_cse337
+    _cse1314 = _cse1289*_cse1313
+    _cse1315 = 0.00574238819026787*_cse1282
+    _cse1316 = 0.00574238819026787*_cse1283
+    _cse1317 = -_cse1315 - _cse1316 + 0.00408002994597976*_cse309 - 0.00408002994597976*_cse310 + 0.00239041914*_cse311 + 0.003960285*_cse312 + 0.003960285*_cse313 + 0.00239041914*_cse314
+    _cse1318 = _cse1317*_cse652
+    _cse1319 = 0.0114847763805357*_cse1277
+    _cse1320 = 0.0114847763805357*_cse1278
+    _cse1321 = _cse1319 + _cse1320 + 0.00478083828*_cse330 + 0.00478083828*_cse331 + 0.00792057*_cse332 + 0.00792057*_cse333 + 0.00816005989195952*_cse334 - 0.00816005989195952*_cse337
+    _cse1322 = 1.0*_cse0
+    _cse1323 = _cse1321*_cse1322
+    _cse1324 = 0.0114847763805357*_cse1282
+    _cse1325 = 0.0114847763805357*_cse1283
+    _cse1326 = -_cse1324 - _cse1325 + 0.00816005989195952*_cse309 - 0.00816005989195952*_cse310 + 0.00478083828*_cse311 + 0.00792057*_cse312 + 0.00792057*_cse313 + 0.00478083828*_cse314
+    _cse1327 = _cse1037*_cse1326
+    _cse1328 = 0.574238819026787*_cse1277
+    _cse1329 = 0.574238819026787*_cse1278
+    _cse1330 = _cse1328 + _cse1329 + 0.239041914*_cse330 + 0.239041914*_cse331 + 0.3960285*_cse332 + 0.3960285*_cse333 + 0.408002994597976*_cse334 - 0.408002994597976*_cse337
+    _cse1331 = 0.025*_cse0
+    _cse1332 = _cse1330*_cse1331
+    _cse1333 = 0.574238819026787*_cse1282
+    _cse1334 = 0.574238819026787*_cse1283
+    _cse1335 = -_cse1333 - _cse1334 + 0.408002994597976*_cse309 - 0.408002994597976*_cse310 + 0.239041914*_cse311 + 0.3960285*_cse312 + 0.3960285*_cse313 + 0.239041914*_cse314
+    _cse1336 = _cse1335*_cse733
+    _cse1337 = _cse1332 + _cse1336
+    _cse1338 = 0.329365488408814*_cse1277
+    _cse1339 = 0.329365488408814*_cse1278
+    _cse1340 = 0.410149995883665*_cse146
+    _cse1341 = 0.410879747*_cse212
+    _cse1342 = 0.209584432*_cse217
+    _cse1343 = 0.410149995883665*_cse147
+    _cse1344 = 0.410879747*_cse214
+    _cse1345 = 0.209584432*_cse219
+    _cse1346 = _cse1338 + _cse1339 + _cse1340*_cse340 - _cse1341*_cse340 + _cse1342*_cse340 - _cse1343*_cse338 - _cse1344*_cse338 + _cse1345*_cse338 + 0.137106991283212*_cse330 + 0.137106991283212*_cse331 + 0.227149603970304*_cse332 + 0.227149603970304*_cse333 + 0.234017800844203*_cse334 - 0.234017800844203*_cse337
+    _cse1347 = 0.015*_cse0
+    _cse1348 = _cse1346*_cse1347
+    _cse1349 = 0.329365488408814*_cse1282
+    _cse1350 = 0.329365488408814*_cse1283
+    _cse1351 = _cse1340*_cse320 - _cse1341*_cse320 + _cse1342*_cse320 - _cse1343*_cse315 - _cse1344*_cse315 + _cse1345*_cse315 - _cse1349 - _cse1350 + 0.234017800844203*_cse309 - 0.234017800844203*_cse310 + 0.137106991283212*_cse311 + 0.227149603970304*_cse312 + 0.227149603970304*_cse313 + 0.137106991283212*_cse314
+    _cse1352 = _cse1351*_cse774
+    _cse1353 = 0.00329365488408814*_cse1277
+    _cse1354 = 0.00329365488408814*_cse1278
+    _cse1355 = 0.00410149995883665*_cse146
+    _cse1356 = 0.00410879747*_cse212
+    _cse1357 = 0.00209584432*_cse217
+    _cse1358 = 0.00410149995883665*_cse147
+    _cse1359 = 0.00410879747*_cse214
+    _cse1360 = 0.00209584432*_cse219
+    _cse1361 = _cse1353 + _cse1354 + _cse1355*_cse340 - _cse1356*_cse340 + _cse1357*_cse340 - _cse1358*_cse338 - _cse1359*_cse338 + _cse1360*_cse338 + 0.00137106991283212*_cse330 + 0.00137106991283212*_cse331 + 0.00227149603970304*_cse332 + 0.00227149603970304*_cse333 + 0.00234017800844203*_cse334 - 0.00234017800844203*_cse337
+    _cse1362 = 0.00329365488408814*_cse1282
+    _cse1363 = 0.00329365488408814*_cse1283
+    _cse1364 = _cse1355*_cse320 - _cse1356*_cse320 + _cse1357*_cse320 - _cse1358*_cse315 - _cse1359*_cse315 + _cse1360*_cse315 - _cse1362 - _cse1363 + 0.00234017800844203*_cse309 - 0.00234017800844203*_cse310 + 0.00137106991283212*_cse311 + 0.00227149603970304*_cse312 + 0.00227149603970304*_cse313 + 0.00137106991283212*_cse314
+    _cse1365 = 0.00658730976817627*_cse1277
+    _cse1366 = 0.00658730976817627*_cse1278
+    _cse1367 = 0.00820299991767329*_cse146
+    _cse1368 = 0.00821759494*_cse212
+    _cse1369 = 0.00419168864*_cse217
+    _cse1370 = 0.00820299991767329*_cse147
+    _cse1371 = 0.00821759494*_cse214
+    _cse1372 = 0.00419168864*_cse219
+    _cse1373 = _cse1365 + _cse1366 + _cse1367*_cse340 - _cse1368*_cse340 + _cse1369*_cse340 - _cse1370*_cse338 - _cse1371*_cse338 + _cse1372*_cse338 + 0.00274213982566424*_cse330 + 0.00274213982566424*_cse331 + 0.00454299207940609*_cse332 + 0.00454299207940609*_cse333 + 0.00468035601688406*_cse334 - 0.00468035601688406*_cse337
+    _cse1374 = 0.00658730976817627*_cse1282
+    _cse1375 = 0.00658730976817627*_cse1283
+    _cse1376 = _cse1367*_cse320 - _cse1368*_cse320 + _cse1369*_cse320 - _cse1370*_cse315 - _cse1371*_cse315 + _cse1372*_cse315 - _cse1374 - _cse1375 + 0.00468035601688406*_cse309 - 0.00468035601688406*_cse310 + 0.00274213982566424*_cse311 + 0.00454299207940609*_cse312 + 0.00454299207940609*_cse313 + 0.00274213982566424*_cse314
+    _cse1377 = _cse1289*_cse1361 + _cse1289*_cse1373 + _cse1364*_cse652 + _cse1376*_cse652
+    _cse1378 = _cse0*_cse648
+    _cse1379 = _cse1378 - _cse29
+    _cse1380 = _cse1*_cse648
+    _cse1381 = -0.5*_cse1380 + 0.5*_cse38
+    _cse1382 = _cse1379 - _cse57 + _cse60 - _cse64 + _cse655 + _cse656 - _cse67
+    _cse1383 = _cse121 - _cse1380
+    _cse1384 = _cse1383 + _cse38 + _cse659 + _cse661
+    _cse1385 = 0.5*_cse124 + 0.5*_cse1384
+    _cse1386 = -_cse1378 + _cse68
+    _cse1387 = _cse1386 - _cse149*_cse669 - _cse158*_cse670 + _cse29 - _cse74*_cse77 - _cse82*_cse84
+    _cse1388 = -_cse1139*_cse84 - _cse1387 - _cse144 - 0.01084270231829*_cse665 - 0.01084270231829*_cse666 - 0.0189192713225*_cse667 - 0.0189192713225*_cse668 + 0.0315500189858492*_cse72*_cse77
+    _cse1389 = _cse1384 + _cse678 + _cse680
+    _cse1390 = 0.5*_cse1138*_cse658 - 0.5*_cse1139*_cse660 + 0.5*_cse1389 + 0.5*_cse187 - 0.00945963566125*_cse673 - 0.00945963566125*_cse674 - 0.005421351159145*_cse675 - 0.005421351159145*_cse676
+    _cse1391 = -_cse1150*_cse84 - _cse1387 + 0.0499969558686132*_cse147*_cse669 + 0.03790017976*_cse212*_cse670 + 0.03790017976*_cse214*_cse669 - _cse221 - _cse426*_cse670 - _cse427*_cse670 - _cse428*_cse669 - 0.0290982758960988*_cse665 - 0.0290982758960988*_cse666 - 0.0491638727803817*_cse667 - 0.0491638727803817*_cse668 + 0.0627091097210817*_cse72*_cse77
+    _cse1392 = 0.5*_cse1149*_cse658 - 0.5*_cse1150*_cse660 + 0.5*_cse1389 + 0.5*_cse245 + 0.5*_cse423*_cse677 + 0.5*_cse424*_cse679 + 0.5*_cse425*_cse677 - 0.5*_cse426*_cse679 - 0.5*_cse427*_cse679 - 0.5*_cse428*_cse677 - 0.0245819363901909*_cse673 - 0.0245819363901909*_cse674 - 0.0145491379480494*_cse675 - 0.0145491379480494*_cse676
+    _cse1393 = 0.5*_cse654
+    _cse1394 = 0.5*_cse664
+    _cse1395 = 0.5*_cse681
+    _cse1396 = 0.5*_cse686
+    _cse1397 = _cse108*_cse1382 - _cse128*_cse657 + _cse130*_cse1385 - _cse132*_cse1394 + _cse1379*_cse44 + _cse1381*_cse53 + _cse1388*_cse183 + _cse1390*_cse205 + _cse1391*_cse236 + _cse1392*_cse255 - _cse1393*_cse54 - _cse1395*_cse209 - _cse1396*_cse259 - _cse190*_cse672 - _cse247*_cse684 - _cse52*_cse651
+    _cse1398 = 0.5*_cse1229
+    _cse1399 = _cse584*_cse651
+    _cse1400 = _cse1393*_cse397
+    _cse1401 = 0.5*_cse1235
+    _cse1402 = _cse1173*_cse1401
+    _cse1403 = _cse587*_cse657
+    _cse1404 = _cse1394*_cse409
+    _cse1405 = 0.5*_cse1244
+    _cse1406 = _cse1194*_cse1405
+    _cse1407 = _cse590*_cse672
+    _cse1408 = _cse1395*_cse422
+    _cse1409 = 0.5*_cse1253
+    _cse1410 = _cse1215*_cse1409
+    _cse1411 = _cse592*_cse684
+    _cse1412 = _cse1396*_cse436
+    _cse1413 = _cse266 + _cse440
+    _cse1414 = 0.5*_cse1413
+    _cse1415 = _cse1210 + _cse1232 + _cse1233 + _cse1413
+    _cse1416 = 0.5*_cse1415 + 0.5*_cse398 + 0.5*_cse399
+    _cse1417 = _cse1138*_cse981 - _cse1139*_cse985
+    _cse1418 = _cse1241 + _cse1242 + _cse1415
+    _cse1419 = -0.005421351159145*_cse1070 - 0.005421351159145*_cse1071 - 0.00945963566125*_cse1078 - 0.00945963566125*_cse1079 + 0.5*_cse1208 + 0.5*_cse1417 + 0.5*_cse1418
+    _cse1420 = _cse1080*_cse423
+    _cse1421 = _cse1073*_cse426
+    _cse1422 = _cse1149*_cse981 - _cse1150*_cse985
+    _cse1423 = -0.0145491379480494*_cse1070 - 0.0145491379480494*_cse1071 + 0.5*_cse1073*_cse424 - 0.5*_cse1073*_cse427 - 0.0245819363901909*_cse1078 - 0.0245819363901909*_cse1079 + 0.5*_cse1080*_cse425 - 0.5*_cse1080*_cse428 + 0.5*_cse1224 + 0.5*_cse1418 + 0.5*_cse1420 - 0.5*_cse1421 + 0.5*_cse1422
+    _cse1424 = _cse1163*_cse1414 + _cse1185*_cse1416 + _cse1207*_cse1419 + _cse1223*_cse1423 + _cse1379*_cse571 + _cse1381*_cse280 + _cse1382*_cse574 + _cse1385*_cse304 + _cse1388*_cse577 + _cse1390*_cse343 + _cse1391*_cse580 + _cse1392*_cse360
+    _cse1425 = _cse7*_cse814
+    _cse1426 = -_cse1227 + 0.5*_cse1425
+    _cse1427 = _cse1157*_cse1426
+    _cse1428 = _cse1178 + _cse1426
+    _cse1429 = -_cse1203 - _cse1227 + 0.5*_cse7*_cse814
+    _cse1430 = -_cse1219 - _cse1252 + 0.25*_cse7*_cse814
+    _cse1431 = _cse1228*_cse1231
+    _cse1432 = 0.5*_cse1431
+    _cse1433 = _cse1393*_cse442
+    _cse1434 = _cse651*_cse692
+    _cse1435 = _cse1240*_cse1401
+    _cse1436 = _cse1394*_cse453
+    _cse1437 = _cse657*_cse807
+    _cse1438 = _cse1247*_cse1405
+    _cse1439 = _cse1395*_cse466
+    _cse1440 = _cse672*_cse809
+    _cse1441 = _cse1255*_cse1409
+    _cse1442 = _cse1396*_cse483
+    _cse1443 = _cse684*_cse811
+    _cse1444 = _cse1230*_cse1414 + _cse1239*_cse1416 + _cse1248*_cse1419 + _cse1256*_cse1423 + _cse1379*_cse688 + _cse1381*_cse446 + _cse1382*_cse797 + _cse1385*_cse458 + _cse1388*_cse800 + _cse1390*_cse477 + _cse1391*_cse803 + _cse1392*_cse486
+    _cse1445 = _cse751*_cse82
+    _cse1446 = _cse73*_cse755
+    _cse1447 = 0.5*_cse1445 + 0.5*_cse1446
+    _cse1448 = _cse134*_cse751
+    _cse1449 = _cse138*_cse751
+    _cse1450 = _cse504*_cse755
+    _cse1451 = _cse140*_cse755
+    _cse1452 = 0.517383113*_cse138*_cse751 + 0.517383113*_cse140*_cse755 - 0.855753802*_cse1448 - 0.855753802*_cse1450
+    _cse1453 = 0.458851168*_cse1448 + 0.758601438*_cse1449 + 0.458851168*_cse1450 + 0.758601438*_cse1451 - _cse551*_cse755 - _cse553*_cse751
+    _cse1454 = -0.005421351159145*_cse1448 - 0.00945963566125*_cse1449 - 0.005421351159145*_cse1450 - 0.00945963566125*_cse1451 + 0.5*_cse1452*_cse158 + 0.5*_cse1453*_cse149 - _cse619*_cse755 - _cse620*_cse751 + 0.5*_cse73*_cse755 + 0.5*_cse751*_cse82
+    _cse1455 = -0.00727456897402469*_cse1448 - 0.0122909681950954*_cse1449 - 0.00727456897402469*_cse1450 - 0.0122909681950954*_cse1451 + 0.25*_cse1452*_cse158 + 0.00947504494*_cse1452*_cse212 - _cse1452*_cse348 - _cse1452*_cse349 + 0.0124992389671533*_cse1453*_cse147 + 0.25*_cse1453*_cse149 + 0.00947504494*_cse1453*_cse214 - _cse1453*_cse350 - _cse632*_cse755 - _cse633*_cse751 + 0.25*_cse73*_cse755 + 0.25*_cse751*_cse82
+    _cse1456 = _cse1291*_cse652
+    _cse1457 = -_cse1288
+    _cse1458 = _cse1289*_cse1457
+    _cse1459 = _cse1297*_cse922
+    _cse1460 = -_cse1294
+    _cse1461 = _cse1295*_cse1460
+    _cse1462 = _cse1115*_cse844 + _cse1116*_cse841 + _cse1117*_cse858 + _cse1118*_cse851 + _cse1119*_cse860 + _cse1120*_cse859 + _cse1236*_cse1447 + _cse1245*_cse1454 + _cse1254*_cse1455 - _cse1456 - _cse1458 - _cse1459 - _cse1461
+    _cse1463 = _cse1259*_cse1416 + _cse1260*_cse1419 + _cse1261*_cse1423 - _cse1273*_cse1401 - _cse1275*_cse1405 - _cse1276*_cse1409 + _cse1382*_cse863 + _cse1385*_cse501 + _cse1388*_cse903 + _cse1390*_cse524 + _cse1391*_cse906 + _cse1392*_cse537 - _cse1394*_cse497 - _cse1395*_cse523 - _cse1396*_cse536 - _cse657*_cse866 - _cse672*_cse911 - _cse684*_cse913
+    _cse1464 = _cse148*_cse897
+    _cse1465 = _cse158*_cse898
+    _cse1466 = 0.5*_cse1464 + 0.5*_cse1465
+    _cse1467 = 0.25*_cse148*_cse897 + 0.25*_cse158*_cse898 + 0.00947504494*_cse212*_cse898 - _cse345*_cse897 - _cse348*_cse898 - _cse349*_cse898 - _cse562*_cse897 + 0.00947504494*_cse563*_cse897
+    _cse1468 = -_cse1311 - _cse1312 + 0.00408002994597976*_cse373 - 0.00408002994597976*_cse374 + 0.00239041914*_cse375 + 0.003960285*_cse376 + 0.003960285*_cse377 + 0.00239041914*_cse378
+    _cse1469 = _cse1289*_cse1468
+    _cse1470 = _cse1315 + _cse1316 + 0.00239041914*_cse467 + 0.00239041914*_cse468 + 0.003960285*_cse469 + 0.003960285*_cse470 + 0.00408002994597976*_cse471 - 0.00408002994597976*_cse472
+    _cse1471 = _cse1470*_cse652
+    _cse1472 = -_cse1319 - _cse1320 + 0.00816005989195952*_cse373 - 0.00816005989195952*_cse374 + 0.00478083828*_cse375 + 0.00792057*_cse376 + 0.00792057*_cse377 + 0.00478083828*_cse378
+    _cse1473 = _cse1322*_cse1472
+    _cse1474 = _cse1324 + _cse1325 + 0.00478083828*_cse467 + 0.00478083828*_cse468 + 0.00792057*_cse469 + 0.00792057*_cse470 + 0.00816005989195952*_cse471 - 0.00816005989195952*_cse472
+    _cse1475 = _cse1037*_cse1474
+    _cse1476 = _cse1016*_cse1388 + _cse1019*_cse1391 + _cse1303*_cse1419 + _cse1304*_cse1423 - _cse1309*_cse1405 - _cse1310*_cse1409 + _cse1390*_cse558 + _cse1392*_cse566 - _cse1395*_cse560 - _cse1396*_cse569 - _cse672*_cse961 - _cse684*_cse964
+    _cse1477 = _cse1348 + _cse1352
+    _cse1478 = -_cse1353 - _cse1354 + _cse1355*_cse381 - _cse1356*_cse381 + _cse1357*_cse381 - _cse1358*_cse379 - _cse1359*_cse379 + _cse1360*_cse379 + 0.00234017800844203*_cse373 - 0.00234017800844203*_cse374 + 0.00137106991283212*_cse375 + 0.00227149603970304*_cse376 + 0.00227149603970304*_cse377 + 0.00137106991283212*_cse378
+    _cse1479 = _cse1355*_cse474 - _cse1356*_cse474 + _cse1357*_cse474 - _cse1358*_cse473 - _cse1359*_cse473 + _cse1360*_cse473 + _cse1362 + _cse1363 + 0.00137106991283212*_cse467 + 0.00137106991283212*_cse468 + 0.00227149603970304*_cse469 + 0.00227149603970304*_cse470 + 0.00234017800844203*_cse471 - 0.00234017800844203*_cse472
+    _cse1480 = -_cse1365 - _cse1366 + _cse1367*_cse381 - _cse1368*_cse381 + _cse1369*_cse381 - _cse1370*_cse379 - _cse1371*_cse379 + _cse1372*_cse379 + 0.00468035601688406*_cse373 - 0.00468035601688406*_cse374 + 0.00274213982566424*_cse375 + 0.00454299207940609*_cse376 + 0.00454299207940609*_cse377 + 0.00274213982566424*_cse378
+    _cse1481 = _cse1367*_cse474 - _cse1368*_cse474 + _cse1369*_cse474 - _cse1370*_cse473 - _cse1371*_cse473 + _cse1372*_cse473 + _cse1374 + _cse1375 + 0.00274213982566424*_cse467 + 0.00274213982566424*_cse468 + 0.00454299207940609*_cse469 + 0.00454299207940609*_cse470 + 0.00468035601688406*_cse471 - 0.00468035601688406*_cse472
+    _cse1482 = _cse1289*_cse1478 + _cse1289*_cse1480 + _cse1479*_cse652 + _cse1481*_cse652
+    _cse1483 = _cse703 + _cse704
+    _cse1484 = 0.5*_cse1483
+    _cse1485 = _cse706 + _cse707
+    _cse1486 = -_cse149*_cse714 - _cse158*_cse713 - _cse296*_cse82 - _cse298*_cse73
+    _cse1487 = -_cse1138*_cse298 - _cse1139*_cse296 - _cse1486 - 0.01084270231829*_cse709 - 0.0189192713225*_cse710 - 0.01084270231829*_cse711 - 0.0189192713225*_cse712
+    _cse1488 = 0.5*_cse1487
+    _cse1489 = -_cse149*_cse721 - _cse158*_cse720 - _cse288*_cse82 - _cse291*_cse73
+    _cse1490 = -_cse1138*_cse291 - _cse1139*_cse288 - _cse1489 - 0.01084270231829*_cse716 - 0.0189192713225*_cse717 - 0.01084270231829*_cse718 - 0.0189192713225*_cse719
+    _cse1491 = -_cse1149*_cse298 - _cse1150*_cse296 + 0.0499969558686132*_cse147*_cse714 - _cse1486 + 0.03790017976*_cse212*_cse713 + 0.03790017976*_cse214*_cse714 - _cse426*_cse713 - _cse427*_cse713 - _cse428*_cse714 - 0.0290982758960988*_cse709 - 0.0491638727803817*_cse710 - 0.0290982758960988*_cse711 - 0.0491638727803817*_cse712
+    _cse1492 = 0.5*_cse1491
+    _cse1493 = -_cse1149*_cse291 - _cse1150*_cse288 + 0.0499969558686132*_cse147*_cse721 - _cse1489 + 0.03790017976*_cse212*_cse720 + 0.03790017976*_cse214*_cse721 - _cse426*_cse720 - _cse427*_cse720 - _cse428*_cse721 - 0.0290982758960988*_cse716 - 0.0491638727803817*_cse717 - 0.0290982758960988*_cse718 - 0.0491638727803817*_cse719
+    _cse1494 = 0.5*_cse705
+    _cse1495 = 0.5*_cse715
+    _cse1496 = 0.5*_cse723
+    _cse1497 = _cse108*_cse1485 - _cse128*_cse708 + _cse130*_cse1484 - _cse132*_cse1494 + _cse1488*_cse205 + _cse1490*_cse183 + _cse1492*_cse255 + _cse1493*_cse236 - _cse1495*_cse209 - _cse1496*_cse259 - _cse190*_cse722 - _cse247*_cse724
+    _cse1498 = 0.5*_cse1264
+    _cse1499 = _cse1173*_cse1498
+    _cse1500 = _cse1494*_cse409
+    _cse1501 = _cse587*_cse708
+    _cse1502 = 0.5*_cse1271
+    _cse1503 = _cse1194*_cse1502
+    _cse1504 = _cse1495*_cse422
+    _cse1505 = _cse590*_cse722
+    _cse1506 = 0.5*_cse1272
+    _cse1507 = _cse1215*_cse1506
+    _cse1508 = _cse1496*_cse436
+    _cse1509 = _cse592*_cse724
+    _cse1510 = _cse1262 + _cse1263
+    _cse1511 = 0.5*_cse1510
+    _cse1512 = -_cse1269*_cse158 - _cse1270*_cse149 - _cse73*_cse756 - _cse752*_cse82
+    _cse1513 = -_cse1138*_cse756 - _cse1139*_cse752 - 0.01084270231829*_cse1265 - 0.0189192713225*_cse1266 - 0.01084270231829*_cse1267 - 0.0189192713225*_cse1268 - _cse1512
+    _cse1514 = 0.5*_cse1513
+    _cse1515 = -_cse1149*_cse756 - _cse1150*_cse752 - 0.0290982758960988*_cse1265 - 0.0491638727803817*_cse1266 - 0.0290982758960988*_cse1267 - 0.0491638727803817*_cse1268 + 0.03790017976*_cse1269*_cse212 - _cse1269*_cse426 - _cse1269*_cse427 + 0.0499969558686132*_cse1270*_cse147 + 0.03790017976*_cse1270*_cse214 - _cse1270*_cse428 - _cse1512
+    _cse1516 = 0.5*_cse1515
+    _cse1517 = _cse1185*_cse1511 + _cse1207*_cse1514 + _cse1223*_cse1516 + _cse1484*_cse304 + _cse1485*_cse574 + _cse1488*_cse343 + _cse1490*_cse577 + _cse1492*_cse360 + _cse1493*_cse580
+    _cse1518 = _cse1239*_cse1511 - _cse1240*_cse1498 - _cse1247*_cse1502 + _cse1248*_cse1514 - _cse1255*_cse1506 + _cse1256*_cse1516 + _cse1484*_cse458 + _cse1485*_cse797 + _cse1488*_cse477 + _cse1490*_cse800 + _cse1492*_cse486 + _cse1493*_cse803 - _cse1494*_cse453 - _cse1495*_cse466 - _cse1496*_cse483 - _cse708*_cse807 - _cse722*_cse809 - _cse724*_cse811
+    _cse1519 = _cse81*_cse985
+    _cse1520 = _cse73*_cse981
+    _cse1521 = 0.5*_cse1519 + 0.5*_cse1520
+    _cse1522 = _cse504*_cse981
+    _cse1523 = _cse937*_cse985
+    _cse1524 = _cse935*_cse985
+    _cse1525 = _cse140*_cse981
+    _cse1526 = _cse1076 - _cse1077 + 0.458851168*_cse1522 + 0.458851168*_cse1523 + 0.758601438*_cse1524 + 0.758601438*_cse1525
+    _cse1527 = -0.855753802*_cse1522 - 0.855753802*_cse1523 + 0.517383113*_cse1524 + 0.517383113*_cse1525
+    _cse1528 = -_cse1243 + 0.5*_cse149*_cse1526 - 0.005421351159145*_cse1522 - 0.005421351159145*_cse1523 - 0.00945963566125*_cse1524 - 0.00945963566125*_cse1525 + 0.5*_cse1527*_cse158 + 0.5*_cse73*_cse981 + 0.5*_cse81*_cse985
+    _cse1529 = -_cse1251 + 0.0124992389671533*_cse147*_cse1526 + 0.25*_cse149*_cse1526 - 0.00727456897402469*_cse1522 - 0.00727456897402469*_cse1523 - 0.0122909681950954*_cse1524 - 0.0122909681950954*_cse1525 + 0.00947504494*_cse1526*_cse214 - _cse1526*_cse350 + 0.25*_cse1527*_cse158 + 0.00947504494*_cse1527*_cse212 - _cse1527*_cse348 - _cse1527*_cse349 + 0.25*_cse73*_cse981 + 0.25*_cse81*_cse985
+    _cse1530 = -_cse55 + _cse58
+    _cse1531 = -0.01*_cse62 - 0.01*_cse65
+    _cse1532 = 0.5*_cse1531
+    _cse1533 = -_cse62 - _cse65
+    _cse1534 = -0.01*_cse55 + 0.01*_cse58
+    _cse1535 = 0.5*_cse1534
+    _cse1536 = 0.5*_cse916
+    _cse1537 = -0.02*_cse62 - 0.02*_cse65
+    _cse1538 = 1.5*_cse1537
+    _cse1539 = -0.02*_cse55 + 0.02*_cse58
+    _cse1540 = 1.5*_cse1533
+    _cse1541 = 1.5*_cse920
+    _cse1542 = 1.5*_cse697
+    _cse1543 = _cse1105*_cse1288 + _cse1279*_cse1536 + _cse1279*_cse1541 + _cse1285*_cse953 + _cse1285*_cse957 + _cse1292*_cse955 + _cse1294*_cse1542 + _cse1298*_cse958 + _cse1530*_cse1532 + _cse1530*_cse1538 + _cse1533*_cse1535 + _cse1539*_cse1540
+    _cse1544 = _cse1273*_cse1498 + _cse1275*_cse1502 + _cse1276*_cse1506 + _cse1494*_cse497 + _cse1495*_cse523 + _cse1496*_cse536 + _cse1543 + _cse708*_cse866 + _cse722*_cse911 + _cse724*_cse913
+    _cse1545 = _cse1309*_cse1502
+    _cse1546 = _cse722*_cse961
+    _cse1547 = _cse1495*_cse560
+    _cse1548 = _cse1310*_cse1506
+    _cse1549 = _cse724*_cse964
+    _cse1550 = _cse1496*_cse569
+    _cse1551 = _cse71*_cse985
+    _cse1552 = _cse72*_cse981
+    _cse1553 = 0.239041914*_cse1070 + 0.239041914*_cse1071 + 0.3960285*_cse1078 + 0.3960285*_cse1079 + 0.408002994597976*_cse1551 - 0.408002994597976*_cse1552 - 0.574238819026787*_cse62 - 0.574238819026787*_cse65
+    _cse1554 = 0.574238819026787*_cse58
+    _cse1555 = 0.574238819026787*_cse55
+    _cse1556 = _cse1554 - _cse1555 - 0.408002994597976*_cse753 + 0.239041914*_cse757 + 0.239041914*_cse759 + 0.3960285*_cse761 + 0.3960285*_cse763 + 0.408002994597976*_cse765
+    _cse1557 = 1.0*_cse1553
+    _cse1558 = 1.0*_cse1556
+    _cse1559 = 1.0*_cse736
+    _cse1560 = 1.0*_cse1330
+    _cse1561 = _cse1108*_cse1288 + _cse1292*_cse968 + _cse1294*_cse1559 + _cse1298*_cse969 + _cse1330*_cse1536 + _cse1335*_cse953 + _cse1335*_cse970 + _cse1532*_cse1556 + _cse1535*_cse1553 + _cse1537*_cse1558 + _cse1539*_cse1557 + _cse1560*_cse920
+    _cse1562 = _cse1009*_cse148
+    _cse1563 = _cse1011*_cse158
+    _cse1564 = 0.5*_cse1562 + 0.5*_cse1563
+    _cse1565 = 0.25*_cse1009*_cse148 - _cse1009*_cse345 - _cse1009*_cse562 + 0.00947504494*_cse1009*_cse563 + 0.25*_cse1011*_cse158 + 0.00947504494*_cse1011*_cse212 - _cse1011*_cse348 - _cse1011*_cse349
+    _cse1566 = 0.00408002994597976*_cse502 + 0.00408002994597976*_cse503 + 0.00239041914*_cse505 + 0.00239041914*_cse506 + 0.003960285*_cse507 + 0.003960285*_cse508
+    _cse1567 = _cse1566*_cse652
+    _cse1568 = 0.00239041914*_cse514 + 0.00239041914*_cse515 + 0.003960285*_cse516 + 0.003960285*_cse517 + 0.00408002994597976*_cse518 + 0.00408002994597976*_cse519
+    _cse1569 = _cse1289*_cse1568
+    _cse1570 = 0.00816005989195952*_cse502 + 0.00816005989195952*_cse503 + 0.00478083828*_cse505 + 0.00478083828*_cse506 + 0.00792057*_cse507 + 0.00792057*_cse508
+    _cse1571 = _cse1037*_cse1570
+    _cse1572 = 0.00478083828*_cse514 + 0.00478083828*_cse515 + 0.00792057*_cse516 + 0.00792057*_cse517 + 0.00816005989195952*_cse518 + 0.00816005989195952*_cse519
+    _cse1573 = _cse1322*_cse1572
+    _cse1574 = _cse1567 + _cse1569 + _cse1571 + _cse1573
+    _cse1575 = -1.0*_cse1194*_cse1564 - 1.0*_cse1215*_cse1565 + _cse1574 - 1.0*_cse414*_cse974 - 1.0*_cse422*_cse977 - 1.0*_cse432*_cse978 - 1.0*_cse436*_cse979
+    _cse1576 = 0.137106991283212*_cse1070 + 0.137106991283212*_cse1071 + _cse1073*_cse1340 - _cse1073*_cse1341 + _cse1073*_cse1342 + 0.227149603970304*_cse1078 + 0.227149603970304*_cse1079 - _cse1080*_cse1343 - _cse1080*_cse1344 + _cse1080*_cse1345 + 0.234017800844203*_cse1551 - 0.234017800844203*_cse1552 - 0.329365488408814*_cse62 - 0.329365488408814*_cse65
+    _cse1577 = 0.5*_cse1576
+    _cse1578 = 0.329365488408814*_cse58
+    _cse1579 = 0.329365488408814*_cse55
+    _cse1580 = _cse1340*_cse787 - _cse1341*_cse787 + _cse1342*_cse787 - _cse1343*_cse789 - _cse1344*_cse789 + _cse1345*_cse789 + _cse1578 - _cse1579 - 0.234017800844203*_cse753 + 0.137106991283212*_cse757 + 0.137106991283212*_cse759 + 0.227149603970304*_cse761 + 0.227149603970304*_cse763 + 0.234017800844203*_cse765
+    _cse1581 = 0.5*_cse1580
+    _cse1582 = 0.5*_cse782
+    _cse1583 = 0.5*_cse1346
+    _cse1584 = _cse1000*_cse1292 + _cse1000*_cse1298 + _cse1001*_cse1351 + _cse1288*_cse1582 + _cse1294*_cse1582 + _cse1346*_cse1536 + _cse1351*_cse953 + _cse1532*_cse1580 + _cse1535*_cse1576 + _cse1537*_cse1581 + _cse1539*_cse1577 + _cse1583*_cse920
+    _cse1585 = _cse1355*_cse509 - _cse1356*_cse509 + _cse1357*_cse509 - _cse1358*_cse510 - _cse1359*_cse510 + _cse1360*_cse510 + 0.00234017800844203*_cse502 + 0.00234017800844203*_cse503 + 0.00137106991283212*_cse505 + 0.00137106991283212*_cse506 + 0.00227149603970304*_cse507 + 0.00227149603970304*_cse508
+    _cse1586 = _cse1585*_cse652
+    _cse1587 = _cse1355*_cse521 - _cse1356*_cse521 + _cse1357*_cse521 - _cse1358*_cse520 - _cse1359*_cse520 + _cse1360*_cse520 + 0.00137106991283212*_cse514 + 0.00137106991283212*_cse515 + 0.00227149603970304*_cse516 + 0.00227149603970304*_cse517 + 0.00234017800844203*_cse518 + 0.00234017800844203*_cse519
+    _cse1588 = _cse1289*_cse1587
+    _cse1589 = _cse1367*_cse509 - _cse1368*_cse509 + _cse1369*_cse509 - _cse1370*_cse510 - _cse1371*_cse510 + _cse1372*_cse510 + 0.00468035601688406*_cse502 + 0.00468035601688406*_cse503 + 0.00274213982566424*_cse505 + 0.00274213982566424*_cse506 + 0.00454299207940609*_cse507 + 0.00454299207940609*_cse508
+    _cse1590 = _cse1589*_cse652
+    _cse1591 = _cse1367*_cse521 - _cse1368*_cse521 + _cse1369*_cse521 - _cse1370*_cse520 - _cse1371*_cse520 + _cse1372*_cse520 + 0.00274213982566424*_cse514 + 0.00274213982566424*_cse515 + 0.00454299207940609*_cse516 + 0.00454299207940609*_cse517 + 0.00468035601688406*_cse518 + 0.00468035601688406*_cse519
+    _cse1592 = _cse1289*_cse1591
+    _cse1593 = _cse1586 + _cse1588 + _cse1590 + _cse1592
+    _cse1594 = _cse743 + _cse744
+    _cse1595 = 0.5*_cse1594
+    _cse1596 = _cse746 + _cse747
+    _cse1597 = _cse148*_cse340 + _cse158*_cse338 + 0.03790017976*_cse212*_cse338 - _cse338*_cse426 - _cse338*_cse427 - _cse340*_cse423 + 0.03790017976*_cse340*_cse563 - _cse340*_cse567
+    _cse1598 = 0.5*_cse1597
+    _cse1599 = _cse148*_cse320 + _cse158*_cse315 + 0.03790017976*_cse212*_cse315 - _cse315*_cse426 - _cse315*_cse427 - _cse320*_cse423 + 0.03790017976*_cse320*_cse563 - _cse320*_cse567
+    _cse1600 = 0.5*_cse745
+    _cse1601 = _cse1600*_cse209
+    _cse1602 = _cse190*_cse748
+    _cse1603 = 0.5*_cse749
+    _cse1604 = _cse1603*_cse259
+    _cse1605 = _cse247*_cse750
+    _cse1606 = 0.5*_cse1307
+    _cse1607 = _cse1194*_cse1606
+    _cse1608 = _cse1600*_cse422
+    _cse1609 = _cse590*_cse748
+    _cse1610 = 0.5*_cse1308
+    _cse1611 = _cse1215*_cse1610
+    _cse1612 = _cse1603*_cse436
+    _cse1613 = _cse592*_cse750
+    _cse1614 = _cse1305 + _cse1306
+    _cse1615 = 0.5*_cse1614
+    _cse1616 = _cse148*_cse787 + _cse158*_cse789 + 0.03790017976*_cse212*_cse789 - _cse423*_cse787 - _cse426*_cse789 - _cse427*_cse789 + 0.03790017976*_cse563*_cse787 - _cse567*_cse787
+    _cse1617 = 0.5*_cse1616
+    _cse1618 = _cse1207*_cse1615 + _cse1223*_cse1617 + _cse1595*_cse343 + _cse1596*_cse577 + _cse1598*_cse360 + _cse1599*_cse580
+    _cse1619 = _cse1247*_cse1606
+    _cse1620 = _cse1600*_cse466
+    _cse1621 = _cse748*_cse809
+    _cse1622 = _cse1255*_cse1610
+    _cse1623 = _cse1603*_cse483
+    _cse1624 = _cse750*_cse811
+    _cse1625 = _cse1314 + _cse1318 + _cse1323 + _cse1327
+    _cse1626 = _cse1469 + _cse1471 + _cse1473 + _cse1475
+    _cse1627 = _cse1275*_cse1606
+    _cse1628 = _cse1600*_cse523
+    _cse1629 = _cse748*_cse911
+    _cse1630 = _cse1276*_cse1610
+    _cse1631 = _cse1603*_cse536
+    _cse1632 = _cse750*_cse913
+    _cse1633 = 0.00239041914*_cse1070 + 0.00239041914*_cse1071 + 0.003960285*_cse1078 + 0.003960285*_cse1079 + 0.00408002994597976*_cse1551 - 0.00408002994597976*_cse1552 - 0.00574238819026787*_cse62 - 0.00574238819026787*_cse65
+    _cse1634 = 0.5*_cse1633
+    _cse1635 = 0.00574238819026787*_cse58
+    _cse1636 = 0.00574238819026787*_cse55
+    _cse1637 = _cse1635 - _cse1636 - 0.00408002994597976*_cse753 + 0.00239041914*_cse757 + 0.00239041914*_cse759 + 0.003960285*_cse761 + 0.003960285*_cse763 + 0.00408002994597976*_cse765
+    _cse1638 = 0.5*_cse1637
+    _cse1639 = 0.5*_cse1032
+    _cse1640 = 0.00478083828*_cse1070 + 0.00478083828*_cse1071 + 0.00792057*_cse1078 + 0.00792057*_cse1079 + 0.00816005989195952*_cse1551 - 0.00816005989195952*_cse1552 - 0.0114847763805357*_cse62 - 0.0114847763805357*_cse65
+    _cse1641 = 1.0*_cse1640
+    _cse1642 = 0.0114847763805357*_cse58
+    _cse1643 = 0.0114847763805357*_cse55
+    _cse1644 = _cse1642 - _cse1643 - 0.00816005989195952*_cse753 + 0.00478083828*_cse757 + 0.00478083828*_cse759 + 0.00792057*_cse761 + 0.00792057*_cse763 + 0.00816005989195952*_cse765
+    _cse1645 = 1.0*_cse1533
+    _cse1646 = 1.0*_cse1039
+    _cse1647 = 1.0*_cse697
+    _cse1648 = _cse1051*_cse1285 + _cse1053*_cse1285 + _cse1054*_cse1326 + _cse1105*_cse1313 + _cse1279*_cse1639 + _cse1279*_cse1646 + _cse1317*_cse955 + _cse1321*_cse1647 + _cse1530*_cse1634 + _cse1530*_cse1641 + _cse1533*_cse1638 + _cse1644*_cse1645
+    _cse1649 = _cse1073*_cse157
+    _cse1650 = _cse1080*_cse148
+    _cse1651 = 0.5*_cse1649 + 0.5*_cse1650
+    _cse1652 = _cse1062*_cse1073 + _cse1063*_cse1080 - _cse1065*_cse1073 - _cse1080*_cse562 - _cse1249 + _cse1250 + 0.25*_cse1649 + 0.25*_cse1650
+    _cse1653 = _cse1039*_cse1560 + _cse1051*_cse1335 + _cse1053*_cse1335 + _cse1108*_cse1313 + _cse1317*_cse968 + _cse1321*_cse1559 + _cse1326*_cse969 + _cse1330*_cse1639 + _cse1553*_cse1638 + _cse1556*_cse1634 + _cse1557*_cse1644 + _cse1558*_cse1640
+    _cse1654 = _cse1309*_cse1606 + _cse1310*_cse1610 + _cse1600*_cse560 + _cse1603*_cse569 + _cse1653 + _cse748*_cse961 + _cse750*_cse964
+    _cse1655 = _cse1000*_cse1317 + _cse1000*_cse1326 + _cse1032*_cse1583 + _cse1039*_cse1583 + _cse1051*_cse1351 + _cse1086*_cse1351 + _cse1313*_cse1582 + _cse1321*_cse1582 + _cse1577*_cse1637 + _cse1577*_cse1644 + _cse1581*_cse1633 + _cse1581*_cse1640
+    _cse1656 = 0.00209584432*_cse561
+    _cse1657 = 0.00410879747*_cse563
+    _cse1658 = _cse1355*_cse201 - _cse1356*_cse201 + _cse1357*_cse201 + _cse1358*_cse203 + _cse1656*_cse203 - _cse1657*_cse203
+    _cse1659 = _cse1658*_cse652
+    _cse1660 = _cse1355*_cse556 - _cse1356*_cse556 + _cse1357*_cse556 + _cse1358*_cse549 + _cse1656*_cse549 - _cse1657*_cse549
+    _cse1661 = _cse1289*_cse1660
+    _cse1662 = 0.00419168864*_cse561
+    _cse1663 = 0.00821759494*_cse563
+    _cse1664 = _cse1367*_cse201 - _cse1368*_cse201 + _cse1369*_cse201 + _cse1370*_cse203 + _cse1662*_cse203 - _cse1663*_cse203
+    _cse1665 = _cse1664*_cse652
+    _cse1666 = _cse1367*_cse556 - _cse1368*_cse556 + _cse1369*_cse556 + _cse1370*_cse549 + _cse1662*_cse549 - _cse1663*_cse549
+    _cse1667 = _cse1289*_cse1666
+    _cse1668 = _cse1659 + _cse1661 + _cse1665 + _cse1667
+    _cse1669 = _cse1377 + _cse1482
+    _cse1670 = 0.00137106991283212*_cse1070 + 0.00137106991283212*_cse1071 + _cse1073*_cse1355 - _cse1073*_cse1356 + _cse1073*_cse1357 + 0.00227149603970304*_cse1078 + 0.00227149603970304*_cse1079 - _cse1080*_cse1358 - _cse1080*_cse1359 + _cse1080*_cse1360 + 0.00234017800844203*_cse1551 - 0.00234017800844203*_cse1552 - 0.00329365488408814*_cse62 - 0.00329365488408814*_cse65
+    _cse1671 = 0.5*_cse1530
+    _cse1672 = 0.00274213982566424*_cse1070 + 0.00274213982566424*_cse1071 + _cse1073*_cse1367 - _cse1073*_cse1368 + _cse1073*_cse1369 + 0.00454299207940609*_cse1078 + 0.00454299207940609*_cse1079 - _cse1080*_cse1370 - _cse1080*_cse1371 + _cse1080*_cse1372 + 0.00468035601688406*_cse1551 - 0.00468035601688406*_cse1552 - 0.00658730976817627*_cse62 - 0.00658730976817627*_cse65
+    _cse1673 = 0.00329365488408814*_cse58
+    _cse1674 = 0.00329365488408814*_cse55
+    _cse1675 = _cse1355*_cse787 - _cse1356*_cse787 + _cse1357*_cse787 - _cse1358*_cse789 - _cse1359*_cse789 + _cse1360*_cse789 + _cse1673 - _cse1674 - 0.00234017800844203*_cse753 + 0.00137106991283212*_cse757 + 0.00137106991283212*_cse759 + 0.00227149603970304*_cse761 + 0.00227149603970304*_cse763 + 0.00234017800844203*_cse765
+    _cse1676 = 0.5*_cse1533
+    _cse1677 = 0.00658730976817627*_cse58
+    _cse1678 = 0.00658730976817627*_cse55
+    _cse1679 = _cse1367*_cse787 - _cse1368*_cse787 + _cse1369*_cse787 - _cse1370*_cse789 - _cse1371*_cse789 + _cse1372*_cse789 + _cse1677 - _cse1678 - 0.00468035601688406*_cse753 + 0.00274213982566424*_cse757 + 0.00274213982566424*_cse759 + 0.00454299207940609*_cse761 + 0.00454299207940609*_cse763 + 0.00468035601688406*_cse765
+    _cse1680 = 0.5*_cse1279
+    _cse1681 = _cse1092*_cse1680 + _cse1098*_cse1680 + _cse1105*_cse1361 + _cse1105*_cse1373 + _cse1110*_cse1285 + _cse1111*_cse1285 + _cse1364*_cse955 + _cse1376*_cse955 + _cse1670*_cse1671 + _cse1671*_cse1672 + _cse1675*_cse1676 + _cse1676*_cse1679
+    _cse1682 = _cse1593 + _cse1681
+    _cse1683 = 0.5*_cse1553
+    _cse1684 = 0.5*_cse1556
+    _cse1685 = 0.5*_cse1330
+    _cse1686 = _cse1092*_cse1685 + _cse1098*_cse1685 + _cse1108*_cse1361 + _cse1108*_cse1373 + _cse1110*_cse1335 + _cse1111*_cse1335 + _cse1364*_cse968 + _cse1376*_cse968 + _cse1670*_cse1684 + _cse1672*_cse1684 + _cse1675*_cse1683 + _cse1679*_cse1683
+    _cse1687 = _cse1668 + _cse1686
+    _cse1688 = _cse1000*_cse1364 + _cse1000*_cse1376 + _cse1092*_cse1583 + _cse1098*_cse1583 + _cse1110*_cse1351 + _cse1111*_cse1351 + _cse1361*_cse1582 + _cse1373*_cse1582 + _cse1577*_cse1675 + _cse1577*_cse1679 + _cse1581*_cse1670 + _cse1581*_cse1672
+    _cse1689 = 1.0*_cse442
+    _cse1690 = 1.0*_cse449
+    _cse1691 = 1.0*_cse453
+    _cse1692 = 1.0*_cse461
+    _cse1693 = 1.0*_cse466
+    _cse1694 = 1.0*_cse480
+    _cse1695 = 1.0*_cse483
+    _cse1696 = 1.0*_cse488
+    _cse1697 = _cse1689*_cse269 + _cse1690*_cse361 + _cse1691*_cse294 + _cse1692*_cse370 + _cse1693*_cse325 + _cse1694*_cse384 + _cse1695*_cse354 + _cse1696*_cse388
+    _cse1698 = _cse1691*_cse491 + _cse1692*_cse500 + _cse1693*_cse511 + _cse1694*_cse533 + _cse1695*_cse534 + _cse1696*_cse538 + _cse727 + _cse925
+    _cse1699 = _cse1041 + _cse1693*_cse541 + _cse1694*_cse544 + _cse1695*_cse564 + _cse1696*_cse565 + _cse894
+    _cse1700 = 1.0*_cse1240
+    _cse1701 = 1.0*_cse1247
+    _cse1702 = 1.0*_cse1255
+    _cse1703 = _cse1284*_cse699
+    _cse1704 = -_cse1279
+    _cse1705 = _cse1280*_cse1704
+    _cse1706 = _cse1264*_cse1700 + _cse1271*_cse1701 + _cse1272*_cse1702 + _cse1290 + _cse1293 + _cse1296 + _cse1299 + _cse1691*_cse705 + _cse1692*_cse708 + _cse1693*_cse715 + _cse1694*_cse722 + _cse1695*_cse723 + _cse1696*_cse724
+    _cse1707 = -_cse1328 - _cse1329 + 0.408002994597976*_cse373 - 0.408002994597976*_cse374 + 0.239041914*_cse375 + 0.3960285*_cse376 + 0.3960285*_cse377 + 0.239041914*_cse378
+    _cse1708 = _cse1331*_cse1707
+    _cse1709 = _cse1333 + _cse1334 + 0.239041914*_cse467 + 0.239041914*_cse468 + 0.3960285*_cse469 + 0.3960285*_cse470 + 0.408002994597976*_cse471 - 0.408002994597976*_cse472
+    _cse1710 = _cse1709*_cse733
+    _cse1711 = _cse1307*_cse1701 + _cse1308*_cse1702 + _cse1625 + _cse1693*_cse745 + _cse1694*_cse748 + _cse1695*_cse749 + _cse1696*_cse750
+    _cse1712 = -_cse1338 - _cse1339 + _cse1340*_cse381 - _cse1341*_cse381 + _cse1342*_cse381 - _cse1343*_cse379 - _cse1344*_cse379 + _cse1345*_cse379 + 0.234017800844203*_cse373 - 0.234017800844203*_cse374 + 0.137106991283212*_cse375 + 0.227149603970304*_cse376 + 0.227149603970304*_cse377 + 0.137106991283212*_cse378
+    _cse1713 = _cse1347*_cse1712
+    _cse1714 = _cse1340*_cse474 - _cse1341*_cse474 + _cse1342*_cse474 - _cse1343*_cse473 - _cse1344*_cse473 + _cse1345*_cse473 + _cse1349 + _cse1350 + 0.137106991283212*_cse467 + 0.137106991283212*_cse468 + 0.227149603970304*_cse469 + 0.227149603970304*_cse470 + 0.234017800844203*_cse471 - 0.234017800844203*_cse472
+    _cse1715 = _cse1714*_cse774
+    _cse1716 = _cse1380 + _cse815
+    _cse1717 = 0.5*_cse1716
+    _cse1718 = 0.5*_cse816
+    _cse1719 = -_cse1378 - _cse817
+    _cse1720 = -0.5*_cse119 - 0.5*_cse120 - 0.5*_cse122 + 0.5*_cse123 + 0.5*_cse1716 + 0.5*_cse820 + 0.5*_cse821
+    _cse1721 = 0.5*_cse822
+    _cse1722 = _cse1386 - _cse817
+    _cse1723 = _cse1131 + _cse1722
+    _cse1724 = -_cse1*_cse8*_cse814 + _cse1135 + _cse1146 + _cse1383
+    _cse1725 = -0.5*_cse1145 - 0.5*_cse1724
+    _cse1726 = 0.5*_cse825
+    _cse1727 = _cse1141 + _cse1722
+    _cse1728 = _cse1140 + _cse1727
+    _cse1729 = -0.5*_cse1154 - 0.5*_cse1724
+    _cse1730 = 0.5*_cse827
+    _cse1731 = _cse1151 + _cse1727
+    _cse1732 = _cse1425 - _cse440
+    _cse1733 = 0.5*_cse1732
+    _cse1734 = 0.5*_cse1428
+    _cse1735 = 0.5*_cse1188 + 0.5*_cse1732
+    _cse1736 = 0.5*_cse1429
+    _cse1737 = _cse1211 + _cse440 - _cse7*_cse814
+    _cse1738 = -0.5*_cse1209 - 0.5*_cse1737
+    _cse1739 = 0.5*_cse1430
+    _cse1740 = -0.5*_cse1225 - 0.5*_cse1737
+    _cse1741 = -_cse1703 - _cse1705
+    _cse1742 = _cse1456 + _cse1458 + _cse1459 + _cse1461
+    _cse1743 = -_cse1708 - _cse1710
+    _cse1744 = -_cse1713 - _cse1715
+    _cse1745 = _cse839 + _cse840
+    _cse1746 = 0.5*_cse1745
+    _cse1747 = _cse842 + _cse843
+    _cse1748 = -_cse149*_cse850 - _cse158*_cse849 - _cse364*_cse82 - _cse366*_cse73
+    _cse1749 = -_cse1138*_cse366 - _cse1139*_cse364 - _cse1748 - 0.01084270231829*_cse845 - 0.0189192713225*_cse846 - 0.01084270231829*_cse847 - 0.0189192713225*_cse848
+    _cse1750 = 0.5*_cse1749
+    _cse1751 = -_cse149*_cse857 - _cse158*_cse856 - _cse287*_cse82 - _cse290*_cse73
+    _cse1752 = -_cse1138*_cse290 - _cse1139*_cse287 - _cse1751 - 0.01084270231829*_cse852 - 0.0189192713225*_cse853 - 0.01084270231829*_cse854 - 0.0189192713225*_cse855
+    _cse1753 = -_cse1149*_cse366 - _cse1150*_cse364 + 0.0499969558686132*_cse147*_cse850 - _cse1748 + 0.03790017976*_cse212*_cse849 + 0.03790017976*_cse214*_cse850 - _cse426*_cse849 - _cse427*_cse849 - _cse428*_cse850 - 0.0290982758960988*_cse845 - 0.0491638727803817*_cse846 - 0.0290982758960988*_cse847 - 0.0491638727803817*_cse848
+    _cse1754 = 0.5*_cse1753
+    _cse1755 = -_cse1149*_cse290 - _cse1150*_cse287 + 0.0499969558686132*_cse147*_cse857 - _cse1751 + 0.03790017976*_cse212*_cse856 + 0.03790017976*_cse214*_cse857 - _cse426*_cse856 - _cse427*_cse856 - _cse428*_cse857 - 0.0290982758960988*_cse852 - 0.0491638727803817*_cse853 - 0.0290982758960988*_cse854 - 0.0491638727803817*_cse855
+    _cse1756 = 0.5*_cse841
+    _cse1757 = 0.5*_cse851
+    _cse1758 = 0.5*_cse859
+    _cse1759 = _cse108*_cse1747 - _cse128*_cse844 + _cse130*_cse1746 - _cse132*_cse1756 + _cse1750*_cse205 + _cse1752*_cse183 + _cse1754*_cse255 + _cse1755*_cse236 - _cse1757*_cse209 - _cse1758*_cse259 - _cse190*_cse858 - _cse247*_cse860
+    _cse1760 = _cse1445 + _cse1446
+    _cse1761 = 0.5*_cse1760
+    _cse1762 = -_cse1452*_cse158 - _cse1453*_cse149 - _cse73*_cse755 - _cse751*_cse82
+    _cse1763 = -_cse1138*_cse755 - _cse1139*_cse751 - 0.01084270231829*_cse1448 - 0.0189192713225*_cse1449 - 0.01084270231829*_cse1450 - 0.0189192713225*_cse1451 - _cse1762
+    _cse1764 = 0.5*_cse1763
+    _cse1765 = -_cse1149*_cse755 - _cse1150*_cse751 - 0.0290982758960988*_cse1448 - 0.0491638727803817*_cse1449 - 0.0290982758960988*_cse1450 - 0.0491638727803817*_cse1451 + 0.03790017976*_cse1452*_cse212 - _cse1452*_cse426 - _cse1452*_cse427 + 0.0499969558686132*_cse1453*_cse147 + 0.03790017976*_cse1453*_cse214 - _cse1453*_cse428 - _cse1762
+    _cse1766 = 0.5*_cse1765
+    _cse1767 = 0.5*_cse1447
+    _cse1768 = 0.5*_cse1454
+    _cse1769 = 0.5*_cse1455
+    _cse1770 = -_cse1173*_cse1767 + _cse1185*_cse1761 - _cse1194*_cse1768 + _cse1207*_cse1764 - _cse1215*_cse1769 + _cse1223*_cse1766 + _cse1746*_cse304 + _cse1747*_cse574 + _cse1750*_cse343 + _cse1752*_cse577 + _cse1754*_cse360 + _cse1755*_cse580 - _cse1756*_cse409 - _cse1757*_cse422 - _cse1758*_cse436 - _cse587*_cse844 - _cse590*_cse858 - _cse592*_cse860
+    _cse1771 = _cse1240*_cse1767
+    _cse1772 = _cse1756*_cse453
+    _cse1773 = _cse807*_cse844
+    _cse1774 = _cse1247*_cse1768
+    _cse1775 = _cse1757*_cse466
+    _cse1776 = _cse809*_cse858
+    _cse1777 = _cse1255*_cse1769
+    _cse1778 = _cse1758*_cse483
+    _cse1779 = _cse811*_cse860
+    _cse1780 = _cse1239*_cse1761 + _cse1248*_cse1764 + _cse1256*_cse1766 + _cse1746*_cse458 + _cse1747*_cse797 + _cse1750*_cse477 + _cse1752*_cse800 + _cse1754*_cse486 + _cse1755*_cse803
+    _cse1781 = -_cse1530
+    _cse1782 = -_cse1534
+    _cse1783 = -_cse1539
+    _cse1784 = _cse1105*_cse1457 + _cse1284*_cse953 + _cse1284*_cse957 + _cse1291*_cse955 + _cse1297*_cse958 + _cse1460*_cse1542 + _cse1532*_cse1781 + _cse1536*_cse1704 + _cse1538*_cse1781 + _cse1540*_cse1783 + _cse1541*_cse1704 + _cse1676*_cse1782
+    _cse1785 = _cse1273*_cse1767 + _cse1275*_cse1768 + _cse1276*_cse1769 + _cse1756*_cse497 + _cse1757*_cse523 + _cse1758*_cse536 + _cse1784 + _cse844*_cse866 + _cse858*_cse911 + _cse860*_cse913
+    _cse1786 = _cse1309*_cse1768
+    _cse1787 = _cse858*_cse961
+    _cse1788 = _cse1757*_cse560
+    _cse1789 = _cse1310*_cse1769
+    _cse1790 = _cse860*_cse964
+    _cse1791 = _cse1758*_cse569
+    _cse1792 = -_cse1554 + _cse1555 + 0.239041914*_cse882 + 0.239041914*_cse884 + 0.3960285*_cse886 + 0.3960285*_cse888 + 0.408002994597976*_cse890 - 0.408002994597976*_cse892
+    _cse1793 = 1.0*_cse1537
+    _cse1794 = 1.0*_cse920
+    _cse1795 = _cse1108*_cse1457 + _cse1291*_cse968 + _cse1297*_cse969 + _cse1460*_cse1559 + _cse1532*_cse1792 + _cse1536*_cse1707 + _cse1557*_cse1783 + _cse1683*_cse1782 + _cse1707*_cse1794 + _cse1709*_cse953 + _cse1709*_cse970 + _cse1792*_cse1793
+    _cse1796 = -_cse1567 - _cse1569 - _cse1571 - _cse1573
+    _cse1797 = -1.0*_cse1247*_cse1564 - 1.0*_cse1255*_cse1565 + _cse1796 - 1.0*_cse466*_cse977 - 1.0*_cse480*_cse974 - 1.0*_cse483*_cse979 - 1.0*_cse488*_cse978
+    _cse1798 = _cse1340*_cse897 - _cse1341*_cse897 + _cse1342*_cse897 - _cse1343*_cse898 - _cse1344*_cse898 + _cse1345*_cse898 - _cse1578 + _cse1579 + 0.137106991283212*_cse882 + 0.137106991283212*_cse884 + 0.227149603970304*_cse886 + 0.227149603970304*_cse888 + 0.234017800844203*_cse890 - 0.234017800844203*_cse892
+    _cse1799 = 0.5*_cse1798
+    _cse1800 = 0.5*_cse1712
+    _cse1801 = _cse1000*_cse1291 + _cse1000*_cse1297 + _cse1001*_cse1714 + _cse1457*_cse1582 + _cse1460*_cse1582 + _cse1532*_cse1798 + _cse1536*_cse1712 + _cse1537*_cse1799 + _cse1577*_cse1782 + _cse1577*_cse1783 + _cse1714*_cse953 + _cse1800*_cse920
+    _cse1802 = -_cse1586 - _cse1588 - _cse1590 - _cse1592
+    _cse1803 = _cse874 + _cse875
+    _cse1804 = 0.5*_cse1803
+    _cse1805 = _cse877 + _cse878
+    _cse1806 = _cse148*_cse381 + _cse158*_cse379 + 0.03790017976*_cse212*_cse379 - _cse379*_cse426 - _cse379*_cse427 - _cse381*_cse423 + 0.03790017976*_cse381*_cse563 - _cse381*_cse567
+    _cse1807 = 0.5*_cse1806
+    _cse1808 = _cse148*_cse474 + _cse158*_cse473 + 0.03790017976*_cse212*_cse473 - _cse423*_cse474 - _cse426*_cse473 - _cse427*_cse473 + 0.03790017976*_cse474*_cse563 - _cse474*_cse567
+    _cse1809 = 0.5*_cse876
+    _cse1810 = 0.5*_cse880
+    _cse1811 = _cse1804*_cse205 + _cse1805*_cse183 + _cse1807*_cse255 + _cse1808*_cse236 - _cse1809*_cse209 - _cse1810*_cse259 - _cse190*_cse879 - _cse247*_cse881
+    _cse1812 = _cse1464 + _cse1465
+    _cse1813 = 0.5*_cse1812
+    _cse1814 = _cse148*_cse897 + _cse158*_cse898 + 0.03790017976*_cse212*_cse898 - _cse423*_cse897 - _cse426*_cse898 - _cse427*_cse898 + 0.03790017976*_cse563*_cse897 - _cse567*_cse897
+    _cse1815 = 0.5*_cse1814
+    _cse1816 = 0.5*_cse1466
+    _cse1817 = 0.5*_cse1467
+    _cse1818 = -_cse1194*_cse1816 + _cse1207*_cse1813 - _cse1215*_cse1817 + _cse1223*_cse1815 + _cse1804*_cse343 + _cse1805*_cse577 + _cse1807*_cse360 + _cse1808*_cse580 - _cse1809*_cse422 - _cse1810*_cse436 - _cse590*_cse879 - _cse592*_cse881
+    _cse1819 = _cse1247*_cse1816
+    _cse1820 = _cse1809*_cse466
+    _cse1821 = _cse809*_cse879
+    _cse1822 = _cse1255*_cse1817
+    _cse1823 = _cse1810*_cse483
+    _cse1824 = _cse811*_cse881
+    _cse1825 = _cse1248*_cse1813 + _cse1256*_cse1815 + _cse1804*_cse477 + _cse1805*_cse800 + _cse1807*_cse486 + _cse1808*_cse803
+    _cse1826 = _cse1275*_cse1816
+    _cse1827 = _cse1809*_cse523
+    _cse1828 = _cse879*_cse911
+    _cse1829 = _cse1276*_cse1817
+    _cse1830 = _cse1810*_cse536
+    _cse1831 = _cse881*_cse913
+    _cse1832 = -_cse1635 + _cse1636 + 0.00239041914*_cse882 + 0.00239041914*_cse884 + 0.003960285*_cse886 + 0.003960285*_cse888 + 0.00408002994597976*_cse890 - 0.00408002994597976*_cse892
+    _cse1833 = -_cse1642 + _cse1643 + 0.00478083828*_cse882 + 0.00478083828*_cse884 + 0.00792057*_cse886 + 0.00792057*_cse888 + 0.00816005989195952*_cse890 - 0.00816005989195952*_cse892
+    _cse1834 = _cse1051*_cse1284 + _cse1053*_cse1284 + _cse1054*_cse1474 + _cse1105*_cse1468 + _cse1470*_cse955 + _cse1472*_cse1647 + _cse1634*_cse1781 + _cse1639*_cse1704 + _cse1641*_cse1781 + _cse1645*_cse1833 + _cse1646*_cse1704 + _cse1676*_cse1832
+    _cse1835 = _cse1051*_cse1709 + _cse1053*_cse1709 + _cse1108*_cse1468 + _cse1470*_cse968 + _cse1472*_cse1559 + _cse1474*_cse969 + _cse1557*_cse1833 + _cse1634*_cse1792 + _cse1639*_cse1707 + _cse1641*_cse1792 + _cse1646*_cse1707 + _cse1683*_cse1832
+    _cse1836 = _cse1309*_cse1816 + _cse1310*_cse1817 + _cse1809*_cse560 + _cse1810*_cse569 + _cse1835 + _cse879*_cse961 + _cse881*_cse964
+    _cse1837 = _cse1000*_cse1470 + _cse1000*_cse1474 + _cse1039*_cse1800 + _cse1051*_cse1714 + _cse1086*_cse1714 + _cse1468*_cse1582 + _cse1472*_cse1582 + _cse1577*_cse1832 + _cse1577*_cse1833 + _cse1634*_cse1798 + _cse1639*_cse1712 + _cse1640*_cse1799
+    _cse1838 = -_cse1659 - _cse1661 - _cse1665 - _cse1667
+    _cse1839 = 0.5*_cse1781
+    _cse1840 = _cse1355*_cse897 - _cse1356*_cse897 + _cse1357*_cse897 - _cse1358*_cse898 - _cse1359*_cse898 + _cse1360*_cse898 - _cse1673 + _cse1674 + 0.00137106991283212*_cse882 + 0.00137106991283212*_cse884 + 0.00227149603970304*_cse886 + 0.00227149603970304*_cse888 + 0.00234017800844203*_cse890 - 0.00234017800844203*_cse892
+    _cse1841 = _cse1367*_cse897 - _cse1368*_cse897 + _cse1369*_cse897 - _cse1370*_cse898 - _cse1371*_cse898 + _cse1372*_cse898 - _cse1677 + _cse1678 + 0.00274213982566424*_cse882 + 0.00274213982566424*_cse884 + 0.00454299207940609*_cse886 + 0.00454299207940609*_cse888 + 0.00468035601688406*_cse890 - 0.00468035601688406*_cse892
+    _cse1842 = 0.5*_cse1704
+    _cse1843 = _cse1092*_cse1842 + _cse1098*_cse1842 + _cse1105*_cse1478 + _cse1105*_cse1480 + _cse1110*_cse1284 + _cse1111*_cse1284 + _cse1479*_cse955 + _cse1481*_cse955 + _cse1670*_cse1839 + _cse1672*_cse1839 + _cse1676*_cse1840 + _cse1676*_cse1841
+    _cse1844 = _cse1802 + _cse1843
+    _cse1845 = 0.5*_cse1792
+    _cse1846 = 0.5*_cse1707
+    _cse1847 = _cse1092*_cse1846 + _cse1098*_cse1846 + _cse1108*_cse1478 + _cse1108*_cse1480 + _cse1110*_cse1709 + _cse1111*_cse1709 + _cse1479*_cse968 + _cse1481*_cse968 + _cse1670*_cse1845 + _cse1672*_cse1845 + _cse1683*_cse1840 + _cse1683*_cse1841
+    _cse1848 = _cse1838 + _cse1847
+    _cse1849 = _cse1000*_cse1479 + _cse1000*_cse1481 + _cse1092*_cse1800 + _cse1098*_cse1800 + _cse1110*_cse1714 + _cse1111*_cse1714 + _cse1478*_cse1582 + _cse1480*_cse1582 + _cse1577*_cse1840 + _cse1577*_cse1841 + _cse1670*_cse1799 + _cse1672*_cse1799
+    _cse1850 = 1.0*_cse492
+    _cse1851 = 1.0*_cse497
+    _cse1852 = 1.0*_cse513
+    _cse1853 = 1.0*_cse523
+    _cse1854 = 1.0*_cse535
+    _cse1855 = 1.0*_cse536
+    _cse1856 = _cse1850*_cse370 + _cse1851*_cse294 + _cse1852*_cse384 + _cse1853*_cse325 + _cse1854*_cse388 + _cse1855*_cse354 + _cse727 + _cse838
+    _cse1857 = _cse1850*_cse459 + _cse1851*_cse455 + _cse1852*_cse478 + _cse1853*_cse475 + _cse1854*_cse487 + _cse1855*_cse484 + _cse702 + _cse861
+    _cse1858 = _cse1055 + _cse1852*_cse544 + _cse1853*_cse541 + _cse1854*_cse565 + _cse1855*_cse564 + _cse996
+    _cse1859 = 1.0*_cse1273
+    _cse1860 = 1.0*_cse1275
+    _cse1861 = 1.0*_cse1276
+    _cse1862 = 0.07*_cse0
+    _cse1863 = 0.07*_cse1
+    _cse1864 = _cse1235*_cse1859 + _cse1244*_cse1860 + _cse1253*_cse1861 + _cse1287 + _cse1741 + _cse1850*_cse657 + _cse1851*_cse664 + _cse1852*_cse672 + _cse1853*_cse681 + _cse1854*_cse684 + _cse1855*_cse686
+    _cse1865 = 0.408002994597976*_cse502 + 0.408002994597976*_cse503 + 0.239041914*_cse505 + 0.239041914*_cse506 + 0.3960285*_cse507 + 0.3960285*_cse508
+    _cse1866 = _cse1865*_cse733
+    _cse1867 = 0.239041914*_cse514 + 0.239041914*_cse515 + 0.3960285*_cse516 + 0.3960285*_cse517 + 0.408002994597976*_cse518 + 0.408002994597976*_cse519
+    _cse1868 = _cse1331*_cse1867
+    _cse1869 = _cse1866 + _cse1868
+    _cse1870 = _cse1307*_cse1860 + _cse1308*_cse1861 + _cse1648 + _cse1852*_cse748 + _cse1853*_cse745 + _cse1854*_cse750 + _cse1855*_cse749
+    _cse1871 = _cse1340*_cse509 - _cse1341*_cse509 + _cse1342*_cse509 - _cse1343*_cse510 - _cse1344*_cse510 + _cse1345*_cse510 + 0.234017800844203*_cse502 + 0.234017800844203*_cse503 + 0.137106991283212*_cse505 + 0.137106991283212*_cse506 + 0.227149603970304*_cse507 + 0.227149603970304*_cse508
+    _cse1872 = _cse1871*_cse774
+    _cse1873 = _cse1340*_cse521 - _cse1341*_cse521 + _cse1342*_cse521 - _cse1343*_cse520 - _cse1344*_cse520 + _cse1345*_cse520 + 0.137106991283212*_cse514 + 0.137106991283212*_cse515 + 0.227149603970304*_cse516 + 0.227149603970304*_cse517 + 0.234017800844203*_cse518 + 0.234017800844203*_cse519
+    _cse1874 = _cse1347*_cse1873
+    _cse1875 = _cse1872 + _cse1874
+    _cse1876 = -_cse1866 - _cse1868
+    _cse1877 = _cse1466*_cse1860 + _cse1467*_cse1861 + _cse1834 + _cse1852*_cse879 + _cse1853*_cse876 + _cse1854*_cse881 + _cse1855*_cse880
+    _cse1878 = -_cse1872 - _cse1874
+    _cse1879 = _cse928 + _cse929
+    _cse1880 = 0.5*_cse931 + 0.5*_cse932
+    _cse1881 = -_cse149*_cse941 - _cse158*_cse940 - _cse73*_cse78 - _cse81*_cse85
+    _cse1882 = -_cse1881 + _cse206 - _cse207 - 0.01084270231829*_cse934 - 0.0189192713225*_cse936 - 0.01084270231829*_cse938 - 0.0189192713225*_cse939
+    _cse1883 = -_cse149*_cse948 - _cse158*_cse947 - _cse493*_cse73 - _cse495*_cse81
+    _cse1884 = -0.5*_cse1883 + 0.0157750094929246*_cse495*_cse71 - 0.0157750094929246*_cse735 - 0.005421351159145*_cse943 - 0.00945963566125*_cse944 - 0.005421351159145*_cse945 - 0.00945963566125*_cse946
+    _cse1885 = 0.0499969558686132*_cse147*_cse941 - _cse1881 + 0.03790017976*_cse212*_cse940 + 0.03790017976*_cse214*_cse941 + _cse256 - _cse257 - _cse426*_cse940 - _cse427*_cse940 - _cse428*_cse941 - 0.0290982758960988*_cse934 - 0.0491638727803817*_cse936 - 0.0290982758960988*_cse938 - 0.0491638727803817*_cse939
+    _cse1886 = 0.0249984779343066*_cse147*_cse948 - 0.5*_cse1883 + 0.01895008988*_cse212*_cse947 + 0.01895008988*_cse214*_cse948 - 0.5*_cse426*_cse947 - 0.5*_cse427*_cse947 - 0.5*_cse428*_cse948 + 0.0313545548605409*_cse495*_cse71 - 0.0313545548605409*_cse735 - 0.0145491379480494*_cse943 - 0.0245819363901909*_cse944 - 0.0145491379480494*_cse945 - 0.0245819363901909*_cse946
+    _cse1887 = 0.5*_cse933
+    _cse1888 = 0.5*_cse949
+    _cse1889 = 0.5*_cse951
+    _cse1890 = 0.5*_cse1519 + 0.5*_cse1520
+    _cse1891 = -_cse149*_cse1526 - _cse1527*_cse158 - _cse73*_cse981 - _cse81*_cse985
+    _cse1892 = -0.5*_cse1417 - 0.005421351159145*_cse1522 - 0.005421351159145*_cse1523 - 0.00945963566125*_cse1524 - 0.00945963566125*_cse1525 - 0.5*_cse1891
+    _cse1893 = -0.5*_cse1422 + 0.0249984779343066*_cse147*_cse1526 - 0.0145491379480494*_cse1522 - 0.0145491379480494*_cse1523 - 0.0245819363901909*_cse1524 - 0.0245819363901909*_cse1525 + 0.01895008988*_cse1526*_cse214 - 0.5*_cse1526*_cse428 + 0.01895008988*_cse1527*_cse212 - 0.5*_cse1527*_cse426 - 0.5*_cse1527*_cse427 - 0.5*_cse1891
+    _cse1894 = 0.5*_cse1521
+    _cse1895 = 0.5*_cse1528
+    _cse1896 = 0.5*_cse1529
+    _cse1897 = 0.239041914*_cse982 + 0.239041914*_cse986 + 0.3960285*_cse988 + 0.3960285*_cse990 + 0.408002994597976*_cse992 + 0.408002994597976*_cse994
+    _cse1898 = 0.00239041914*_cse982 + 0.00239041914*_cse986 + 0.003960285*_cse988 + 0.003960285*_cse990 + 0.00408002994597976*_cse992 + 0.00408002994597976*_cse994
+    _cse1899 = 0.00478083828*_cse982 + 0.00478083828*_cse986 + 0.00792057*_cse988 + 0.00792057*_cse990 + 0.00816005989195952*_cse992 + 0.00816005989195952*_cse994
+    _cse1900 = _cse1009*_cse1340 - _cse1009*_cse1341 + _cse1009*_cse1342 - _cse1011*_cse1343 - _cse1011*_cse1344 + _cse1011*_cse1345 + 0.137106991283212*_cse982 + 0.137106991283212*_cse986 + 0.227149603970304*_cse988 + 0.227149603970304*_cse990 + 0.234017800844203*_cse992 + 0.234017800844203*_cse994
+    _cse1901 = 0.5*_cse1900
+    _cse1902 = _cse1009*_cse1355 - _cse1009*_cse1356 + _cse1009*_cse1357 - _cse1011*_cse1358 - _cse1011*_cse1359 + _cse1011*_cse1360 + 0.00137106991283212*_cse982 + 0.00137106991283212*_cse986 + 0.00227149603970304*_cse988 + 0.00227149603970304*_cse990 + 0.00234017800844203*_cse992 + 0.00234017800844203*_cse994
+    _cse1903 = _cse1009*_cse1367 - _cse1009*_cse1368 + _cse1009*_cse1369 - _cse1011*_cse1370 - _cse1011*_cse1371 + _cse1011*_cse1372 + 0.00274213982566424*_cse982 + 0.00274213982566424*_cse986 + 0.00454299207940609*_cse988 + 0.00454299207940609*_cse990 + 0.00468035601688406*_cse992 + 0.00468035601688406*_cse994
+    _cse1904 = 0.5*_cse1873
+    _cse1905 = _cse972 + _cse973
+    _cse1906 = _cse975 + _cse976
+    _cse1907 = 0.5*_cse1906
+    _cse1908 = _cse148*_cse509 + _cse158*_cse510 + 0.03790017976*_cse212*_cse510 - _cse423*_cse509 - _cse426*_cse510 - _cse427*_cse510 + 0.03790017976*_cse509*_cse563 - _cse509*_cse567
+    _cse1909 = _cse148*_cse521 + _cse158*_cse520 + 0.03790017976*_cse212*_cse520 - _cse423*_cse521 - _cse426*_cse520 - _cse427*_cse520 + 0.03790017976*_cse521*_cse563 - _cse521*_cse567
+    _cse1910 = 0.5*_cse1909
+    _cse1911 = 0.5*_cse977
+    _cse1912 = 0.5*_cse979
+    _cse1913 = _cse183*_cse1905 - _cse190*_cse974 + _cse1907*_cse205 + _cse1908*_cse236 + _cse1910*_cse255 - _cse1911*_cse209 - _cse1912*_cse259 - _cse247*_cse978
+    _cse1914 = _cse1562 + _cse1563
+    _cse1915 = 0.5*_cse1914
+    _cse1916 = _cse1009*_cse148 - _cse1009*_cse423 + 0.03790017976*_cse1009*_cse563 - _cse1009*_cse567 + _cse1011*_cse158 + 0.03790017976*_cse1011*_cse212 - _cse1011*_cse426 - _cse1011*_cse427
+    _cse1917 = 0.5*_cse1916
+    _cse1918 = 0.5*_cse1564
+    _cse1919 = 0.5*_cse1565
+    _cse1920 = -_cse1194*_cse1918 + _cse1207*_cse1915 - _cse1215*_cse1919 + _cse1223*_cse1917 + _cse1905*_cse577 + _cse1907*_cse343 + _cse1908*_cse580 + _cse1910*_cse360 - _cse1911*_cse422 - _cse1912*_cse436 - _cse590*_cse974 - _cse592*_cse978
+    _cse1921 = -_cse1247*_cse1918 + _cse1248*_cse1915 - _cse1255*_cse1919 + _cse1256*_cse1917 + _cse1905*_cse800 + _cse1907*_cse477 + _cse1908*_cse803 + _cse1910*_cse486 - _cse1911*_cse466 - _cse1912*_cse483 - _cse809*_cse974 - _cse811*_cse978
+    _cse1922 = _cse1275*_cse1918
+    _cse1923 = _cse911*_cse974
+    _cse1924 = _cse1911*_cse523
+    _cse1925 = _cse1276*_cse1919
+    _cse1926 = _cse913*_cse978
+    _cse1927 = _cse1912*_cse536
+    _cse1928 = _cse1260*_cse1915 + _cse1261*_cse1917 + _cse1905*_cse903 + _cse1907*_cse524 + _cse1908*_cse906 + _cse1910*_cse537
+    _cse1929 = _cse1051*_cse1865 + _cse1053*_cse1865 + _cse1108*_cse1568 + _cse1557*_cse1899 + _cse1559*_cse1572 + _cse1566*_cse968 + _cse1570*_cse969 + _cse1634*_cse1897 + _cse1639*_cse1867 + _cse1641*_cse1897 + _cse1646*_cse1867 + _cse1683*_cse1898
+    _cse1930 = _cse1309*_cse1918 + _cse1310*_cse1919 + _cse1911*_cse560 + _cse1912*_cse569 + _cse1929 + _cse961*_cse974 + _cse964*_cse978
+    _cse1931 = _cse1073*_cse563
+    _cse1932 = _cse1073*_cse1358 + 0.00209584432*_cse1074 + _cse1080*_cse1355 - _cse1080*_cse1356 + _cse1080*_cse1357 - 0.00410879747*_cse1931
+    _cse1933 = _cse1073*_cse1370 + 0.00419168864*_cse1074 + _cse1080*_cse1367 - _cse1080*_cse1368 + _cse1080*_cse1369 - 0.00821759494*_cse1931
+    _cse1934 = -0.5*_cse1533*_cse1932 - 0.5*_cse1533*_cse1933 - 0.5*_cse1658*_cse954 - 0.5*_cse1660*_cse697 - 0.5*_cse1664*_cse954 - 0.5*_cse1666*_cse697
+    _cse1935 = _cse1000*_cse1566 + _cse1000*_cse1570 + _cse1039*_cse1904 + _cse1051*_cse1871 + _cse1086*_cse1871 + _cse1568*_cse1582 + _cse1572*_cse1582 + _cse1577*_cse1898 + _cse1577*_cse1899 + _cse1634*_cse1900 + _cse1639*_cse1873 + _cse1640*_cse1901
+    _cse1936 = 0.5*_cse1897
+    _cse1937 = 0.5*_cse1867
+    _cse1938 = _cse1092*_cse1937 + _cse1098*_cse1937 + _cse1108*_cse1587 + _cse1108*_cse1591 + _cse1110*_cse1865 + _cse1111*_cse1865 + _cse1585*_cse968 + _cse1589*_cse968 + _cse1670*_cse1936 + _cse1672*_cse1936 + _cse1683*_cse1902 + _cse1683*_cse1903
+    _cse1939 = _cse1934 + _cse1938
+    _cse1940 = _cse1000*_cse1585 + _cse1000*_cse1589 + _cse1092*_cse1904 + _cse1098*_cse1904 + _cse1110*_cse1871 + _cse1111*_cse1871 + _cse1577*_cse1902 + _cse1577*_cse1903 + _cse1582*_cse1587 + _cse1582*_cse1591 + _cse1670*_cse1901 + _cse1672*_cse1901
+    _cse1941 = 1.0*_cse559
+    _cse1942 = 1.0*_cse560
+    _cse1943 = 1.0*_cse568
+    _cse1944 = 1.0*_cse569
+    _cse1945 = _cse1123 + _cse737 + _cse739
+    _cse1946 = _cse1124 + _cse1945 - 1.0*_cse325*_cse560 - 1.0*_cse354*_cse569 - 1.0*_cse384*_cse559 - 1.0*_cse388*_cse568
+    _cse1947 = _cse1941*_cse478 + _cse1942*_cse475 + _cse1943*_cse487 + _cse1944*_cse484 + _cse1945 - _cse883 - _cse885 - _cse887 - _cse889 - _cse891 + _cse893
+    _cse1948 = _cse1941*_cse533 + _cse1942*_cse511 + _cse1943*_cse538 + _cse1944*_cse534 + _cse971 - _cse983 - _cse987 - _cse989 - _cse991 - _cse993 - _cse995
+    _cse1949 = 1.0*_cse1309
+    _cse1950 = 1.0*_cse1310
+    _cse1951 = 0.05*_cse0
+    _cse1952 = 0.05*_cse1
+    _cse1953 = _cse1244*_cse1949 + _cse1253*_cse1950 + _cse1337 + _cse1743 + _cse1941*_cse672 + _cse1942*_cse681 + _cse1943*_cse684 + _cse1944*_cse686
+    _cse1954 = _cse1271*_cse1949 + _cse1272*_cse1950 + _cse1561 + _cse1876 + _cse1941*_cse722 + _cse1942*_cse715 + _cse1943*_cse724 + _cse1944*_cse723
+    _cse1955 = 0.209584432*_cse561
+    _cse1956 = 0.410879747*_cse563
+    _cse1957 = _cse1340*_cse201 - _cse1341*_cse201 + _cse1342*_cse201 + _cse1343*_cse203 + _cse1955*_cse203 - _cse1956*_cse203
+    _cse1958 = _cse1957*_cse774
+    _cse1959 = _cse1340*_cse556 - _cse1341*_cse556 + _cse1342*_cse556 + _cse1343*_cse549 + _cse1955*_cse549 - _cse1956*_cse549
+    _cse1960 = _cse1347*_cse1959
+    _cse1961 = _cse1958 + _cse1960
+    _cse1962 = _cse1454*_cse1949 + _cse1455*_cse1950 + _cse1795 + _cse1869 + _cse1941*_cse858 + _cse1942*_cse851 + _cse1943*_cse860 + _cse1944*_cse859
+    _cse1963 = -_cse1958 - _cse1960
+    _cse1964 = 1.0*_cse1531
+    _cse1965 = 1.0*_cse916
+    _cse1966 = 1.0*_cse952
+    _cse1967 = _cse1073*_cse1343 + 0.209584432*_cse1074 + _cse1080*_cse1340 - _cse1080*_cse1341 + _cse1080*_cse1342 - 0.410879747*_cse1931
+    _cse1968 = _cse1532*_cse1967
+    _cse1969 = 0.5*_cse1967
+    _cse1970 = _cse1537*_cse1969
+    _cse1971 = _cse1536*_cse1959
+    _cse1972 = _cse1957*_cse953
+    _cse1973 = 0.5*_cse1959
+    _cse1974 = _cse1973*_cse920
+    _cse1975 = _cse1001*_cse1957
+    _cse1976 = _cse1056 + _cse1057
+    _cse1977 = _cse1059 + _cse1060
+    _cse1978 = 0.5*_cse1977
+    _cse1979 = 0.03790017976*_cse211
+    _cse1980 = 0.03790017976*_cse563
+    _cse1981 = 0.01872015456*_cse1064
+    _cse1982 = _cse1976 + _cse1979*_cse203 + _cse1980*_cse201 - _cse1981*_cse203 - _cse201*_cse567 + _cse258
+    _cse1983 = 0.5*_cse1977 + 0.5*_cse1979*_cse549 + 0.5*_cse1980*_cse556 - 0.5*_cse1981*_cse549 - 0.5*_cse423*_cse556 + 0.5*_cse426*_cse549 - 0.5*_cse556*_cse567
+    _cse1984 = 0.5*_cse1061
+    _cse1985 = 0.5*_cse1067
+    _cse1986 = _cse1649 + _cse1650
+    _cse1987 = 0.5*_cse1986
+    _cse1988 = 0.5*_cse1073*_cse1979 - 0.5*_cse1073*_cse1981 + 0.5*_cse1080*_cse1980 - 0.5*_cse1080*_cse567 - 0.5*_cse1420 + 0.5*_cse1421 + 0.5*_cse1986
+    _cse1989 = 0.5*_cse1651
+    _cse1990 = 0.5*_cse1652
+    _cse1991 = _cse1000*_cse1658 + _cse1000*_cse1664 + _cse1092*_cse1973 + _cse1098*_cse1973 + _cse1110*_cse1957 + _cse1111*_cse1957 + _cse1577*_cse1932 + _cse1577*_cse1933 + _cse1582*_cse1660 + _cse1582*_cse1666 + _cse1670*_cse1969 + _cse1672*_cse1969
+    _cse1992 = -_cse793 - _cse896
+    _cse1993 = -_cse784 - _cse899
+    _cse1994 = 0.006163196205*_cse212
+    _cse1995 = _cse1002 - _cse1003 - _cse1004 - _cse1005 - _cse1006 - _cse1007 - _cse1008 + _cse1009*_cse1994 - _cse1010 + _cse1011*_cse1082 + 0.006163196205*_cse1011*_cse214 - _cse1012 - _cse1013
+    _cse1996 = -_cse1075 + _cse1080*_cse1994 - _cse1081 - _cse1083 - _cse1084 + _cse1087 + 0.006163196205*_cse1931
+    _cse1997 = 0.03*_cse1
+    _cse1998 = 0.03*_cse0
+    _cse1999 = _cse1477 + _cse1744
+    _cse2000 = _cse1584 + _cse1878
+    _cse2001 = _cse1655 + _cse1963
+    _cse2002 = _cse1801 + _cse1875
+    _cse2003 = _cse1837 + _cse1961
+    _cse2004 = _cse1935 + _cse1968 + _cse1970 + _cse1971 + _cse1972 + _cse1974 + _cse1975
+    out = np.empty((6, 36))
+    out[0, 0] = _cse108*_cse132 + _cse108*_cse89 + _cse118*_cse128 + _cse128*_cse130 + _cse13*_cse17 + _cse14*_cse17 + _cse166*_cse183 + _cse183*_cse209 + _cse186*_cse190 + _cse19*_cse21 + _cse190*_cse205 + _cse21*_cse22 + _cse223*_cse236 + _cse236*_cse259 + _cse244*_cse247 + _cse247*_cse255 + _cse36*_cse44 + _cse44*_cse54 + _cse48*_cse52 + _cse52*_cse53
+    out[0, 1] = -_cse108*_cse409 + _cse128*_cse304 - _cse14*_cse286 - _cse183*_cse422 + _cse19*_cse286 + _cse190*_cse343 + _cse22*_cse344 - _cse236*_cse436 + _cse247*_cse360 + _cse269*_cse270 + _cse269*_cse363 + _cse280*_cse52 + _cse294*_cse295 + _cse294*_cse372 + _cse325*_cse326 + _cse325*_cse386 + _cse354*_cse355 + _cse354*_cse390 + _cse361*_cse362 + _cse370*_cse371 + _cse384*_cse385 + _cse388*_cse389 - _cse393*_cse394 - _cse397*_cse44 - _cse403*_cse404 - _cse414*_cse415 - _cse432*_cse433 + _cse439
+    out[0, 2] = -_cse108*_cse453 + _cse128*_cse458 - _cse183*_cse466 + _cse190*_cse477 - _cse236*_cse483 + _cse247*_cse486 + _cse270*_cse445 + _cse295*_cse455 + _cse326*_cse475 + _cse355*_cse484 + _cse362*_cse447 + _cse363*_cse445 + _cse371*_cse459 + _cse372*_cse455 + _cse385*_cse478 + _cse386*_cse475 + _cse389*_cse487 + _cse390*_cse484 - _cse394*_cse449 - _cse404*_cse461 - _cse415*_cse480 - _cse433*_cse488 - _cse44*_cse442 + _cse446*_cse52
+    out[0, 3] = -_cse108*_cse497 + _cse128*_cse501 - _cse183*_cse523 + _cse190*_cse524 - _cse236*_cse536 + _cse247*_cse537 + _cse295*_cse491 + _cse326*_cse511 + _cse355*_cse534 + _cse371*_cse500 + _cse372*_cse491 + _cse385*_cse533 + _cse386*_cse511 + _cse389*_cse538 + _cse390*_cse534 - _cse404*_cse492 - _cse415*_cse513 - _cse433*_cse535
+    out[0, 4] = -_cse183*_cse560 + _cse190*_cse558 - _cse236*_cse569 + _cse247*_cse566 + _cse326*_cse541 + _cse355*_cse564 + _cse385*_cse544 + _cse386*_cse541 + _cse389*_cse565 + _cse390*_cse564 - _cse415*_cse559 - _cse433*_cse568
+    out[0, 5] = 0
+    out[0, 6] = _cse439 + _cse570 + _cse572 + _cse573 + _cse575 + _cse576 + _cse578 + _cse579 + _cse581 + _cse582 + _cse593
+    out[0, 7] = _cse17*_cse594 - _cse19*_cse597 + _cse362*_cse595 + _cse363*_cse599 + _cse371*_cse607 + _cse372*_cse610 + _cse385*_cse622 + _cse386*_cse630 + _cse389*_cse635 + _cse390*_cse638 - _cse639 - _cse640 - _cse641 - _cse642 - _cse643 - _cse644 - _cse645 - _cse646 + _cse647
+    out[0, 8] = _cse687 + _cse696
+    out[0, 9] = _cse702 + _cse728 + _cse729
+    out[0, 10] = _cse741 + _cse742 + _cse767
+    out[0, 11] = -_cse784 - _cse793
+    out[0, 12] = _cse794 + _cse795 + _cse796 + _cse798 + _cse799 + _cse801 + _cse802 + _cse804 + _cse812
+    out[0, 13] = _cse687 + _cse813
+    out[0, 14] = _cse362*_cse819 + _cse363*_cse816 + _cse371*_cse824 + _cse372*_cse822 + _cse385*_cse826 + _cse386*_cse825 + _cse389*_cse828 + _cse390*_cse827 - _cse829 - _cse830 - _cse831 - _cse832 - _cse833 - _cse834 - _cse835 - _cse836 + _cse837
+    out[0, 15] = _cse838 + _cse862 + _cse869
+    out[0, 16] = 0.5*_cse480*_cse558 + 0.5*_cse488*_cse566 + 0.5*_cse541*_cse808 + 0.5*_cse564*_cse810 - _cse741 - _cse870 - _cse871 - _cse872 - _cse873 - _cse895
+    out[0, 17] = -_cse896 - _cse899
+    out[0, 18] = _cse900 + _cse901 + _cse902 + _cse904 + _cse905 + _cse907 + _cse914
+    out[0, 19] = _cse728 + _cse915 + _cse925
+    out[0, 20] = _cse862 + _cse926 + _cse927
+    out[0, 21] = 1.0*_cse127*_cse930 + 1.0*_cse132*_cse933 + 1.0*_cse189*_cse942 + 1.0*_cse209*_cse949 + 1.0*_cse246*_cse950 + 1.0*_cse259*_cse951 + 0.5*_cse491*_cse908 + 0.5*_cse492*_cse501 + 0.5*_cse511*_cse910 + 0.5*_cse513*_cse524 + 0.5*_cse534*_cse912 + 0.5*_cse535*_cse537 - _cse960
+    out[0, 22] = 0.5*_cse513*_cse558 + 0.5*_cse535*_cse566 + 0.5*_cse541*_cse910 + 0.5*_cse564*_cse912 - _cse962 - _cse963 - _cse965 - _cse966 - _cse971 - _cse997
+    out[0, 23] = -_cse1002 - _cse1014
+    out[0, 24] = _cse1015 + _cse1017 + _cse1018 + _cse1020 + _cse1023
+    out[0, 25] = _cse1021*_cse577 + _cse1022*_cse580 - _cse1024 - _cse1025 - _cse1026 - _cse1027 + _cse1041 + _cse343*_cse961 + _cse360*_cse964 + _cse767
+    out[0, 26] = 0.5*_cse1021*_cse475 + 0.5*_cse1022*_cse484 - _cse1041 - _cse1042 - _cse1043 - _cse1044 - _cse1045 + 0.5*_cse477*_cse559 + 0.5*_cse486*_cse568 - _cse895
+    out[0, 27] = 0.5*_cse1021*_cse511 + 0.5*_cse1022*_cse534 - _cse1046 - _cse1047 - _cse1048 - _cse1049 - _cse1055 + 0.5*_cse524*_cse559 + 0.5*_cse537*_cse568 - _cse997
+    out[0, 28] = 0.5*_cse1021*_cse541 + 0.5*_cse1022*_cse564 + 1.0*_cse1058*_cse189 + 1.0*_cse1061*_cse209 + 1.0*_cse1066*_cse246 + 1.0*_cse1067*_cse259 - _cse1069 + 0.5*_cse558*_cse559 + 0.5*_cse566*_cse568
+    out[0, 29] = -_cse1085 - _cse1087
+    out[0, 30] = 0
+    out[0, 31] = -_cse1100
+    out[0, 32] = -_cse1101
+    out[0, 33] = -_cse1106
+    out[0, 34] = -_cse1109
+    out[0, 35] = -_cse1112
+    out[1, 0] = _cse107*_cse1116 + _cse1113*_cse48 + _cse1114*_cse43 + _cse1115*_cse118 + _cse1117*_cse186 + _cse1118*_cse182 + _cse1119*_cse244 + _cse1120*_cse235 + 1.0*_cse14*_cse285 - _cse437 - _cse438 - _cse570 - _cse572 - _cse573 - _cse575 - _cse576 - _cse578 - _cse579 - _cse581 - _cse582 + _cse593
+    out[1, 1] = _cse639 + _cse640 + _cse641 + _cse642 + _cse643 + _cse644 + _cse645 + _cse646 + _cse647
+    out[1, 2] = _cse1121 + _cse696
+    out[1, 3] = _cse1122 + _cse729
+    out[1, 4] = _cse1125 + _cse742
+    out[1, 5] = _cse1100
+    out[1, 6] = _cse108*_cse1133 + _cse1113*_cse361 + _cse1114*_cse269 + _cse1115*_cse370 + _cse1116*_cse294 + _cse1117*_cse384 + _cse1118*_cse325 + _cse1119*_cse388 + _cse1120*_cse354 + _cse1126*_cse44 - _cse1127*_cse54 + _cse1129*_cse53 - _cse1134*_cse132 + _cse1137*_cse130 + _cse1143*_cse183 - _cse1144*_cse209 + _cse1148*_cse205 + _cse1152*_cse236 - _cse1153*_cse259 + _cse1155*_cse255 - _cse128*_cse607 - _cse13*_cse597 - _cse16*_cse631 + _cse19*_cse636 - _cse190*_cse622 + _cse21*_cse594 - _cse247*_cse635 - _cse52*_cse595
+    out[1, 7] = _cse0**2*_cse1156 + _cse1**2*_cse1156 + _cse1126*_cse571 + _cse1127*_cse397 + _cse1129*_cse280 + _cse1133*_cse574 + _cse1134*_cse409 + _cse1137*_cse304 + _cse1143*_cse577 + _cse1144*_cse422 + _cse1148*_cse343 + _cse1152*_cse580 + _cse1153*_cse436 + _cse1155*_cse360 + _cse1157*_cse1161 + _cse1163*_cse1166 + _cse1173*_cse1180 + _cse1185*_cse1189 + _cse1194*_cse1205 + _cse1207*_cse1213 + _cse1215*_cse1221 + _cse1223*_cse1226 - 0.5*_cse262*(0.10451*_cse7 + 0.00097595*_cse8) + _cse584*_cse595 + _cse587*_cse607 + _cse590*_cse622 + _cse592*_cse635 + 0.5*_cse9*(-0.00097595*_cse7 + 0.10451*_cse8)
+    out[1, 8] = _cse1113*_cse651 + _cse1114*_cse654 + _cse1115*_cse657 + _cse1116*_cse664 + _cse1117*_cse672 + _cse1118*_cse681 + _cse1119*_cse684 + _cse1120*_cse686 + _cse1126*_cse688 - _cse1127*_cse442 + _cse1129*_cse446 + _cse1133*_cse797 - _cse1134*_cse453 + _cse1137*_cse458 + _cse1143*_cse800 - _cse1144*_cse466 + _cse1148*_cse477 + _cse1152*_cse803 - _cse1153*_cse483 + _cse1155*_cse486 - _cse1161*_cse1231 + _cse1166*_cse1230 - _cse1180*_cse1240 + _cse1189*_cse1239 - _cse1205*_cse1247 + _cse1213*_cse1248 - _cse1221*_cse1255 + _cse1226*_cse1256 + 1.0*_cse1229 + _cse1235*_cse1236 + _cse1244*_cse1245 + _cse1253*_cse1254 - _cse595*_cse692 - _cse607*_cse807 - _cse622*_cse809 - _cse635*_cse811
+    out[1, 9] = _cse1115*_cse708 + _cse1116*_cse705 + _cse1117*_cse722 + _cse1118*_cse715 + _cse1119*_cse724 + _cse1120*_cse723 + _cse1133*_cse863 - _cse1134*_cse497 + _cse1137*_cse501 + _cse1143*_cse903 - _cse1144*_cse523 + _cse1148*_cse524 + _cse1152*_cse906 - _cse1153*_cse536 + _cse1155*_cse537 - _cse1180*_cse1273 + _cse1189*_cse1259 - _cse1205*_cse1275 + _cse1213*_cse1260 - _cse1221*_cse1276 + _cse1226*_cse1261 + _cse1236*_cse1264 + _cse1245*_cse1271 + _cse1254*_cse1272 + _cse1287 + _cse1300 - _cse607*_cse866 - _cse622*_cse911 - _cse635*_cse913
+    out[1, 10] = _cse1016*_cse1143 + _cse1019*_cse1152 + _cse1117*_cse748 + _cse1118*_cse745 + _cse1119*_cse750 + _cse1120*_cse749 - _cse1144*_cse560 + _cse1148*_cse558 - _cse1153*_cse569 + _cse1155*_cse566 - _cse1205*_cse1309 + _cse1213*_cse1303 - _cse1221*_cse1310 + _cse1226*_cse1304 + _cse1245*_cse1307 + _cse1254*_cse1308 - _cse1314 - _cse1318 - _cse1323 - _cse1327 + _cse1337 - _cse622*_cse961 - _cse635*_cse964
+    out[1, 11] = _cse1348 + _cse1352 - _cse1377
+    out[1, 12] = _cse1121 + _cse1397
+    out[1, 13] = _cse1398 + _cse1399 + _cse1400 + _cse1402 + _cse1403 + _cse1404 + _cse1406 + _cse1407 + _cse1408 + _cse1410 + _cse1411 + _cse1412 + _cse1424
+    out[1, 14] = _cse1113*_cse819 + _cse1114*_cse816 + _cse1115*_cse824 + _cse1116*_cse822 + _cse1117*_cse826 + _cse1118*_cse825 + _cse1119*_cse828 + _cse1120*_cse827 + _cse1236*_cse1428 + _cse1245*_cse1429 + _cse1254*_cse1430 + 1.0*_cse1427 - _cse1432 - _cse1433 - _cse1434 - _cse1435 - _cse1436 - _cse1437 - _cse1438 - _cse1439 - _cse1440 - _cse1441 - _cse1442 - _cse1443 + _cse1444
+    out[1, 15] = -_cse1281 - _cse1286 + _cse1462 + _cse1463
+    out[1, 16] = _cse1117*_cse879 + _cse1118*_cse876 + _cse1119*_cse881 + _cse1120*_cse880 + _cse1245*_cse1466 + _cse1254*_cse1467 - _cse1332 - _cse1336 - _cse1469 - _cse1471 - _cse1473 - _cse1475 + _cse1476
+    out[1, 17] = -_cse1477 - _cse1482
+    out[1, 18] = _cse1122 + _cse1497
+    out[1, 19] = _cse1499 + _cse1500 + _cse1501 + _cse1503 + _cse1504 + _cse1505 + _cse1507 + _cse1508 + _cse1509 + _cse1517
+    out[1, 20] = _cse1300 + _cse1462 + _cse1518
+    out[1, 21] = 1.0*_cse1173*_cse1521 + 1.0*_cse1194*_cse1528 + 1.0*_cse1215*_cse1529 + 0.5*_cse1259*_cse1510 + 0.5*_cse1260*_cse1513 + 0.5*_cse1261*_cse1515 + 0.5*_cse1483*_cse501 + 0.5*_cse1485*_cse491 + 0.5*_cse1487*_cse524 + 0.5*_cse1490*_cse511 + 0.5*_cse1491*_cse537 + 0.5*_cse1493*_cse534 - _cse1544 + 1.0*_cse403*_cse930 + 1.0*_cse409*_cse933 + 1.0*_cse414*_cse942 + 1.0*_cse422*_cse949 + 1.0*_cse432*_cse950 + 1.0*_cse436*_cse951
+    out[1, 22] = 0.5*_cse1303*_cse1513 + 0.5*_cse1304*_cse1515 + 0.5*_cse1487*_cse558 + 0.5*_cse1490*_cse541 + 0.5*_cse1491*_cse566 + 0.5*_cse1493*_cse564 - _cse1545 - _cse1546 - _cse1547 - _cse1548 - _cse1549 - _cse1550 - _cse1561 - _cse1575
+    out[1, 23] = -_cse1584 - _cse1593
+    out[1, 24] = _cse1125 + _cse1595*_cse205 + _cse1596*_cse183 + _cse1598*_cse255 + _cse1599*_cse236 - _cse1601 - _cse1602 - _cse1604 - _cse1605
+    out[1, 25] = _cse1607 + _cse1608 + _cse1609 + _cse1611 + _cse1612 + _cse1613 + _cse1618
+    out[1, 26] = 1.0*_cse1194*_cse1466 + 1.0*_cse1215*_cse1467 + 0.5*_cse1248*_cse1614 + 0.5*_cse1256*_cse1616 + 0.5*_cse1594*_cse477 + 0.5*_cse1596*_cse475 + 0.5*_cse1597*_cse486 + 0.5*_cse1599*_cse484 - _cse1619 - _cse1620 - _cse1621 - _cse1622 - _cse1623 - _cse1624 - _cse1625 - _cse1626 + 1.0*_cse414*_cse879 + 1.0*_cse422*_cse876 + 1.0*_cse432*_cse881 + 1.0*_cse436*_cse880
+    out[1, 27] = 0.5*_cse1260*_cse1614 + 0.5*_cse1261*_cse1616 - _cse1575 + 0.5*_cse1594*_cse524 + 0.5*_cse1596*_cse511 + 0.5*_cse1597*_cse537 + 0.5*_cse1599*_cse534 - _cse1627 - _cse1628 - _cse1629 - _cse1630 - _cse1631 - _cse1632 - _cse1648
+    out[1, 28] = 1.0*_cse1058*_cse414 + 1.0*_cse1061*_cse422 + 1.0*_cse1066*_cse432 + 1.0*_cse1067*_cse436 + 1.0*_cse1194*_cse1651 + 1.0*_cse1215*_cse1652 + 0.5*_cse1303*_cse1614 + 0.5*_cse1304*_cse1616 + 0.5*_cse1594*_cse558 + 0.5*_cse1596*_cse541 + 0.5*_cse1597*_cse566 + 0.5*_cse1599*_cse564 - _cse1654
+    out[1, 29] = -_cse1655 - _cse1668
+    out[1, 30] = _cse1100
+    out[1, 31] = 0
+    out[1, 32] = -_cse1669
+    out[1, 33] = -_cse1682
+    out[1, 34] = -_cse1687
+    out[1, 35] = -_cse1688
+    out[2, 0] = _cse107*_cse1691 + _cse118*_cse1692 + _cse1689*_cse43 + _cse1690*_cse48 + _cse1693*_cse182 + _cse1694*_cse186 + _cse1695*_cse235 + _cse1696*_cse244 - _cse794 - _cse795 - _cse796 - _cse798 - _cse799 - _cse801 - _cse802 - _cse804 + _cse812
+    out[2, 1] = _cse1697 + _cse813
+    out[2, 2] = _cse829 + _cse830 + _cse831 + _cse832 + _cse833 + _cse834 + _cse835 + _cse836 + _cse837
+    out[2, 3] = _cse1698 + _cse869
+    out[2, 4] = _cse1699 + _cse541*_cse864 + _cse558*_cse809 + _cse564*_cse865 + _cse566*_cse811 - _cse870 - _cse871 - _cse872 - _cse873
+    out[2, 5] = _cse1101
+    out[2, 6] = _cse1397 + _cse1697
+    out[2, 7] = 1.0*_cse1160*_cse1231 + _cse1179*_cse1700 + _cse1204*_cse1701 + _cse1220*_cse1702 - _cse1398 - _cse1399 - _cse1400 - _cse1402 - _cse1403 - _cse1404 - _cse1406 - _cse1407 - _cse1408 - _cse1410 - _cse1411 - _cse1412 + _cse1424 + _cse1689*_cse599 + _cse1690*_cse595 + _cse1691*_cse610 + _cse1692*_cse607 + _cse1693*_cse630 + _cse1694*_cse622 + _cse1695*_cse638 + _cse1696*_cse635
+    out[2, 8] = _cse1432 + _cse1433 + _cse1434 + _cse1435 + _cse1436 + _cse1437 + _cse1438 + _cse1439 + _cse1440 + _cse1441 + _cse1442 + _cse1443 + _cse1444
+    out[2, 9] = _cse1463 + _cse1703 + _cse1705 + _cse1706
+    out[2, 10] = _cse1476 + _cse1708 + _cse1710 + _cse1711
+    out[2, 11] = _cse1377 + _cse1713 + _cse1715
+    out[2, 12] = _cse108*_cse1723 - _cse128*_cse824 + _cse130*_cse1720 - _cse132*_cse1721 + _cse1689*_cse445 + _cse1690*_cse447 + _cse1691*_cse455 + _cse1692*_cse459 + _cse1693*_cse475 + _cse1694*_cse478 + _cse1695*_cse484 + _cse1696*_cse487 + _cse1717*_cse53 - _cse1718*_cse54 + _cse1719*_cse44 + _cse1725*_cse205 - _cse1726*_cse209 + _cse1728*_cse183 + _cse1729*_cse255 - _cse1730*_cse259 + _cse1731*_cse236 - _cse190*_cse826 - _cse247*_cse828 - _cse52*_cse819
+    out[2, 13] = _cse1163*_cse1733 - _cse1173*_cse1734 + _cse1185*_cse1735 - _cse1194*_cse1736 + _cse1207*_cse1738 - _cse1215*_cse1739 + _cse1223*_cse1740 + _cse1235*_cse1700 + _cse1244*_cse1701 + _cse1253*_cse1702 - 0.5*_cse1427 + 1.0*_cse1431 + _cse1689*_cse654 + _cse1690*_cse651 + _cse1691*_cse664 + _cse1692*_cse657 + _cse1693*_cse681 + _cse1694*_cse672 + _cse1695*_cse686 + _cse1696*_cse684 + _cse1717*_cse280 - _cse1718*_cse397 + _cse1719*_cse571 + _cse1720*_cse304 - _cse1721*_cse409 + _cse1723*_cse574 + _cse1725*_cse343 - _cse1726*_cse422 + _cse1728*_cse577 + _cse1729*_cse360 - _cse1730*_cse436 + _cse1731*_cse580 - _cse584*_cse819 - _cse587*_cse824 - _cse590*_cse826 - _cse592*_cse828
+    out[2, 14] = _cse1230*_cse1733 + 0.5*_cse1231*_cse1426 + _cse1239*_cse1735 + _cse1240*_cse1734 + _cse1247*_cse1736 + _cse1248*_cse1738 + _cse1255*_cse1739 + _cse1256*_cse1740 + _cse1717*_cse446 + _cse1718*_cse442 + _cse1719*_cse688 + _cse1720*_cse458 + _cse1721*_cse453 + _cse1723*_cse797 + _cse1725*_cse477 + _cse1726*_cse466 + _cse1728*_cse800 + _cse1729*_cse486 + _cse1730*_cse483 + _cse1731*_cse803 + _cse692*_cse819 + _cse807*_cse824 + _cse809*_cse826 + _cse811*_cse828
+    out[2, 15] = _cse1259*_cse1735 + _cse1260*_cse1738 + _cse1261*_cse1740 - _cse1273*_cse1734 - _cse1275*_cse1736 - _cse1276*_cse1739 + _cse1447*_cse1700 + _cse1454*_cse1701 + _cse1455*_cse1702 + _cse1691*_cse841 + _cse1692*_cse844 + _cse1693*_cse851 + _cse1694*_cse858 + _cse1695*_cse859 + _cse1696*_cse860 + _cse1720*_cse501 - _cse1721*_cse497 + _cse1723*_cse863 + _cse1725*_cse524 - _cse1726*_cse523 + _cse1728*_cse903 + _cse1729*_cse537 - _cse1730*_cse536 + _cse1731*_cse906 + _cse1741 + _cse1742 - _cse824*_cse866 - _cse826*_cse911 - _cse828*_cse913
+    out[2, 16] = _cse1016*_cse1728 + _cse1019*_cse1731 + _cse1303*_cse1738 + _cse1304*_cse1740 - _cse1309*_cse1736 - _cse1310*_cse1739 + _cse1466*_cse1701 + _cse1467*_cse1702 + _cse1626 + _cse1693*_cse876 + _cse1694*_cse879 + _cse1695*_cse880 + _cse1696*_cse881 + _cse1725*_cse558 - _cse1726*_cse560 + _cse1729*_cse566 - _cse1730*_cse569 + _cse1743 - _cse826*_cse961 - _cse828*_cse964
+    out[2, 17] = _cse1482 + _cse1744
+    out[2, 18] = _cse1698 + _cse1759
+    out[2, 19] = _cse1706 + _cse1742 + _cse1770
+    out[2, 20] = _cse1771 + _cse1772 + _cse1773 + _cse1774 + _cse1775 + _cse1776 + _cse1777 + _cse1778 + _cse1779 + _cse1780
+    out[2, 21] = 1.0*_cse1240*_cse1521 + 1.0*_cse1247*_cse1528 + 1.0*_cse1255*_cse1529 + 0.5*_cse1259*_cse1760 + 0.5*_cse1260*_cse1763 + 0.5*_cse1261*_cse1765 + 0.5*_cse1745*_cse501 + 0.5*_cse1747*_cse491 + 0.5*_cse1749*_cse524 + 0.5*_cse1752*_cse511 + 0.5*_cse1753*_cse537 + 0.5*_cse1755*_cse534 - _cse1785 + 1.0*_cse453*_cse933 + 1.0*_cse461*_cse930 + 1.0*_cse466*_cse949 + 1.0*_cse480*_cse942 + 1.0*_cse483*_cse951 + 1.0*_cse488*_cse950
+    out[2, 22] = 0.5*_cse1303*_cse1763 + 0.5*_cse1304*_cse1765 + 0.5*_cse1749*_cse558 + 0.5*_cse1752*_cse541 + 0.5*_cse1753*_cse566 + 0.5*_cse1755*_cse564 - _cse1786 - _cse1787 - _cse1788 - _cse1789 - _cse1790 - _cse1791 - _cse1795 - _cse1797
+    out[2, 23] = -_cse1801 - _cse1802
+    out[2, 24] = _cse1699 + _cse1811
+    out[2, 25] = _cse1626 + _cse1711 + _cse1818
+    out[2, 26] = _cse1819 + _cse1820 + _cse1821 + _cse1822 + _cse1823 + _cse1824 + _cse1825
+    out[2, 27] = 0.5*_cse1260*_cse1812 + 0.5*_cse1261*_cse1814 - _cse1797 + 0.5*_cse1803*_cse524 + 0.5*_cse1805*_cse511 + 0.5*_cse1806*_cse537 + 0.5*_cse1808*_cse534 - _cse1826 - _cse1827 - _cse1828 - _cse1829 - _cse1830 - _cse1831 - _cse1834
+    out[2, 28] = 1.0*_cse1058*_cse480 + 1.0*_cse1061*_cse466 + 1.0*_cse1066*_cse488 + 1.0*_cse1067*_cse483 + 1.0*_cse1247*_cse1651 + 1.0*_cse1255*_cse1652 + 0.5*_cse1303*_cse1812 + 0.5*_cse1304*_cse1814 + 0.5*_cse1803*_cse558 + 0.5*_cse1805*_cse541 + 0.5*_cse1806*_cse566 + 0.5*_cse1808*_cse564 - _cse1836
+    out[2, 29] = -_cse1837 - _cse1838
+    out[2, 30] = _cse1101
+    out[2, 31] = _cse1669
+    out[2, 32] = 0
+    out[2, 33] = -_cse1844
+    out[2, 34] = -_cse1848
+    out[2, 35] = -_cse1849
+    out[3, 0] = _cse107*_cse1851 + _cse118*_cse1850 + _cse182*_cse1853 + _cse1852*_cse186 + _cse1854*_cse244 + _cse1855*_cse235 - _cse900 - _cse901 - _cse902 - _cse904 - _cse905 - _cse907 + _cse914
+    out[3, 1] = _cse1856 + _cse915
+    out[3, 2] = _cse1857 + _cse926
+    out[3, 3] = _cse501*_cse866 + _cse524*_cse911 + _cse537*_cse913 + _cse863*_cse908 + _cse903*_cse910 + _cse906*_cse912 + _cse960
+    out[3, 4] = _cse1016*_cse910 + _cse1019*_cse912 + _cse1858 + _cse558*_cse911 + _cse566*_cse913 - _cse962 - _cse963 - _cse965 - _cse966
+    out[3, 5] = _cse1106
+    out[3, 6] = _cse1497 + _cse1856
+    out[3, 7] = _cse1179*_cse1859 + _cse1204*_cse1860 + _cse1220*_cse1861 - _cse1279*_cse1862 - _cse1285*_cse1863 - _cse1499 - _cse1500 - _cse1501 - _cse1503 - _cse1504 - _cse1505 - _cse1507 - _cse1508 - _cse1509 + _cse1517 + _cse1850*_cse607 + _cse1851*_cse610 + _cse1852*_cse622 + _cse1853*_cse630 + _cse1854*_cse635 + _cse1855*_cse638
+    out[3, 8] = _cse1518 + _cse1864
+    out[3, 9] = _cse1259*_cse1511 + _cse1260*_cse1514 + _cse1261*_cse1516 + _cse1484*_cse501 + _cse1485*_cse863 + _cse1488*_cse524 + _cse1490*_cse903 + _cse1492*_cse537 + _cse1493*_cse906 + _cse1544
+    out[3, 10] = _cse1016*_cse1490 + _cse1019*_cse1493 + _cse1303*_cse1514 + _cse1304*_cse1516 + _cse1488*_cse558 + _cse1492*_cse566 - _cse1545 - _cse1546 - _cse1547 - _cse1548 - _cse1549 - _cse1550 + _cse1869 + _cse1870
+    out[3, 11] = _cse1681 + _cse1875
+    out[3, 12] = _cse1759 + _cse1857
+    out[3, 13] = _cse1770 + _cse1864
+    out[3, 14] = _cse1284*_cse1863 + _cse1428*_cse1859 + _cse1429*_cse1860 + _cse1430*_cse1861 + _cse1704*_cse1862 - _cse1771 - _cse1772 - _cse1773 - _cse1774 - _cse1775 - _cse1776 - _cse1777 - _cse1778 - _cse1779 + _cse1780 + _cse1850*_cse824 + _cse1851*_cse822 + _cse1852*_cse826 + _cse1853*_cse825 + _cse1854*_cse828 + _cse1855*_cse827
+    out[3, 15] = _cse1259*_cse1761 + _cse1260*_cse1764 + _cse1261*_cse1766 + _cse1746*_cse501 + _cse1747*_cse863 + _cse1750*_cse524 + _cse1752*_cse903 + _cse1754*_cse537 + _cse1755*_cse906 + _cse1785
+    out[3, 16] = _cse1016*_cse1752 + _cse1019*_cse1755 + _cse1303*_cse1764 + _cse1304*_cse1766 + _cse1750*_cse558 + _cse1754*_cse566 - _cse1786 - _cse1787 - _cse1788 - _cse1789 - _cse1790 - _cse1791 + _cse1876 + _cse1877
+    out[3, 17] = _cse1843 + _cse1878
+    out[3, 18] = _cse108*_cse1879 - _cse128*_cse930 + _cse130*_cse1880 - _cse132*_cse1887 + _cse183*_cse1882 + _cse1850*_cse500 + _cse1851*_cse491 + _cse1852*_cse533 + _cse1853*_cse511 + _cse1854*_cse538 + _cse1855*_cse534 + _cse1884*_cse205 + _cse1885*_cse236 + _cse1886*_cse255 - _cse1888*_cse209 - _cse1889*_cse259 - _cse190*_cse942 - _cse247*_cse950 + _cse959
+    out[3, 19] = -_cse1173*_cse1894 + _cse1185*_cse1890 - _cse1194*_cse1895 + _cse1207*_cse1892 - _cse1215*_cse1896 + _cse1223*_cse1893 + _cse1264*_cse1859 + _cse1271*_cse1860 + _cse1272*_cse1861 + _cse1543 + _cse1850*_cse708 + _cse1851*_cse705 + _cse1852*_cse722 + _cse1853*_cse715 + _cse1854*_cse724 + _cse1855*_cse723 + _cse1879*_cse574 + _cse1880*_cse304 + _cse1882*_cse577 + _cse1884*_cse343 + _cse1885*_cse580 + _cse1886*_cse360 - _cse1887*_cse409 - _cse1888*_cse422 - _cse1889*_cse436 - _cse587*_cse930 - _cse590*_cse942 - _cse592*_cse950
+    out[3, 20] = _cse1239*_cse1890 - _cse1240*_cse1894 - _cse1247*_cse1895 + _cse1248*_cse1892 - _cse1255*_cse1896 + _cse1256*_cse1893 + _cse1447*_cse1859 + _cse1454*_cse1860 + _cse1455*_cse1861 + _cse1784 + _cse1850*_cse844 + _cse1851*_cse841 + _cse1852*_cse858 + _cse1853*_cse851 + _cse1854*_cse860 + _cse1855*_cse859 + _cse1879*_cse797 + _cse1880*_cse458 + _cse1882*_cse800 + _cse1884*_cse477 + _cse1885*_cse803 + _cse1886*_cse486 - _cse1887*_cse453 - _cse1888*_cse466 - _cse1889*_cse483 - _cse807*_cse930 - _cse809*_cse942 - _cse811*_cse950
+    out[3, 21] = _cse1259*_cse1890 + _cse1260*_cse1892 + _cse1261*_cse1893 + _cse1273*_cse1894 + _cse1275*_cse1895 + _cse1276*_cse1896 + _cse1879*_cse863 + _cse1880*_cse501 + _cse1882*_cse903 + _cse1884*_cse524 + _cse1885*_cse906 + _cse1886*_cse537 + _cse1887*_cse497 + _cse1888*_cse523 + _cse1889*_cse536 + _cse866*_cse930 + _cse911*_cse942 + _cse913*_cse950
+    out[3, 22] = _cse1016*_cse1882 + _cse1019*_cse1885 + _cse1054*_cse1570 + _cse1105*_cse1568 + _cse1303*_cse1892 + _cse1304*_cse1893 - _cse1309*_cse1895 - _cse1310*_cse1896 - _cse1532*_cse1897 - _cse1536*_cse1867 + _cse1564*_cse1860 + _cse1565*_cse1861 + _cse1566*_cse955 + _cse1572*_cse1647 + _cse1645*_cse1899 + _cse1676*_cse1898 - _cse1793*_cse1897 - _cse1794*_cse1867 + _cse1852*_cse974 + _cse1853*_cse977 + _cse1854*_cse978 + _cse1855*_cse979 - _cse1865*_cse953 - _cse1865*_cse970 + _cse1884*_cse558 + _cse1886*_cse566 - _cse1888*_cse560 - _cse1889*_cse569 - _cse942*_cse961 - _cse950*_cse964
+    out[3, 23] = -_cse1001*_cse1871 + _cse1105*_cse1587 + _cse1105*_cse1591 - _cse1532*_cse1900 - _cse1536*_cse1873 - _cse1537*_cse1901 + _cse1585*_cse955 + _cse1589*_cse955 + _cse1676*_cse1902 + _cse1676*_cse1903 - _cse1871*_cse953 - _cse1904*_cse920
+    out[3, 24] = _cse1858 + _cse1913
+    out[3, 25] = _cse1574 + _cse1870 + _cse1920
+    out[3, 26] = _cse1796 + _cse1877 + _cse1921
+    out[3, 27] = _cse1922 + _cse1923 + _cse1924 + _cse1925 + _cse1926 + _cse1927 + _cse1928
+    out[3, 28] = 1.0*_cse1058*_cse513 + 1.0*_cse1061*_cse523 + 1.0*_cse1066*_cse535 + 1.0*_cse1067*_cse536 + 1.0*_cse1275*_cse1651 + 1.0*_cse1276*_cse1652 + 0.5*_cse1303*_cse1914 + 0.5*_cse1304*_cse1916 + 0.5*_cse1905*_cse541 + 0.5*_cse1906*_cse558 + 0.5*_cse1908*_cse564 + 0.5*_cse1909*_cse566 - _cse1930
+    out[3, 29] = -_cse1934 - _cse1935
+    out[3, 30] = _cse1106
+    out[3, 31] = _cse1682
+    out[3, 32] = _cse1844
+    out[3, 33] = 0
+    out[3, 34] = -_cse1939
+    out[3, 35] = -_cse1940
+    out[4, 0] = -_cse1015 - _cse1017 - _cse1018 - _cse1020 + _cse1023 + _cse182*_cse1942 + _cse186*_cse1941 + _cse1943*_cse244 + _cse1944*_cse235
+    out[4, 1] = 0.5*_cse1021*_cse325 + 0.5*_cse1022*_cse354 - _cse1024 - _cse1025 - _cse1026 - _cse1027 - _cse1946 + 0.5*_cse343*_cse559 + 0.5*_cse360*_cse568
+    out[4, 2] = _cse1021*_cse800 + _cse1022*_cse803 - _cse1042 - _cse1043 - _cse1044 - _cse1045 + _cse1947 + _cse477*_cse961 + _cse486*_cse964
+    out[4, 3] = _cse1021*_cse903 + _cse1022*_cse906 - _cse1046 - _cse1047 - _cse1048 - _cse1049 + _cse1948 + _cse524*_cse961 + _cse537*_cse964
+    out[4, 4] = _cse1016*_cse1021 + _cse1019*_cse1022 + _cse1069 + _cse558*_cse961 + _cse566*_cse964
+    out[4, 5] = _cse1109
+    out[4, 6] = 0.5*_cse1594*_cse205 + 0.5*_cse1596*_cse182 + 0.5*_cse1597*_cse255 + 0.5*_cse1599*_cse235 - _cse1601 - _cse1602 - _cse1604 - _cse1605 - _cse1946
+    out[4, 7] = _cse1204*_cse1949 + _cse1220*_cse1950 - _cse1330*_cse1951 - _cse1335*_cse1952 - _cse1607 - _cse1608 - _cse1609 - _cse1611 - _cse1612 - _cse1613 + _cse1618 + _cse1941*_cse622 + _cse1942*_cse630 + _cse1943*_cse635 + _cse1944*_cse638
+    out[4, 8] = _cse1248*_cse1615 + _cse1256*_cse1617 + _cse1595*_cse477 + _cse1596*_cse800 + _cse1598*_cse486 + _cse1599*_cse803 - _cse1619 - _cse1620 - _cse1621 - _cse1622 - _cse1623 - _cse1624 + _cse1953
+    out[4, 9] = _cse1260*_cse1615 + _cse1261*_cse1617 + _cse1595*_cse524 + _cse1596*_cse903 + _cse1598*_cse537 + _cse1599*_cse906 - _cse1627 - _cse1628 - _cse1629 - _cse1630 - _cse1631 - _cse1632 + _cse1954
+    out[4, 10] = _cse1016*_cse1596 + _cse1019*_cse1599 + _cse1303*_cse1615 + _cse1304*_cse1617 + _cse1595*_cse558 + _cse1598*_cse566 + _cse1654
+    out[4, 11] = _cse1686 + _cse1961
+    out[4, 12] = _cse1811 + _cse1947
+    out[4, 13] = _cse1818 + _cse1953
+    out[4, 14] = _cse1429*_cse1949 + _cse1430*_cse1950 + _cse1707*_cse1951 + _cse1709*_cse1952 - _cse1819 - _cse1820 - _cse1821 - _cse1822 - _cse1823 - _cse1824 + _cse1825 + _cse1941*_cse826 + _cse1942*_cse825 + _cse1943*_cse828 + _cse1944*_cse827
+    out[4, 15] = _cse1260*_cse1813 + _cse1261*_cse1815 + _cse1804*_cse524 + _cse1805*_cse903 + _cse1807*_cse537 + _cse1808*_cse906 - _cse1826 - _cse1827 - _cse1828 - _cse1829 - _cse1830 - _cse1831 + _cse1962
+    out[4, 16] = _cse1016*_cse1805 + _cse1019*_cse1808 + _cse1303*_cse1813 + _cse1304*_cse1815 + _cse1804*_cse558 + _cse1807*_cse566 + _cse1836
+    out[4, 17] = _cse1847 + _cse1963
+    out[4, 18] = _cse1913 + _cse1948
+    out[4, 19] = _cse1920 + _cse1954
+    out[4, 20] = _cse1921 + _cse1962
+    out[4, 21] = _cse1528*_cse1949 + _cse1529*_cse1950 + 2.0*_cse1537*_cse1897 + _cse1865*_cse1966 + 2.0*_cse1865*_cse956 + _cse1867*_cse1965 + 2.0*_cse1867*_cse920 + _cse1897*_cse1964 - _cse1922 - _cse1923 - _cse1924 - _cse1925 - _cse1926 - _cse1927 + _cse1928 + _cse1941*_cse942 + _cse1942*_cse949 + _cse1943*_cse950 + _cse1944*_cse951
+    out[4, 22] = _cse1016*_cse1905 + _cse1019*_cse1908 + _cse1303*_cse1915 + _cse1304*_cse1917 + _cse1907*_cse558 + _cse1910*_cse566 + _cse1930
+    out[4, 23] = _cse1938 - _cse1968 - _cse1970 - _cse1971 - _cse1972 - _cse1974 - _cse1975
+    out[4, 24] = -_cse1058*_cse190 - _cse1066*_cse247 + _cse1068 + _cse183*_cse1976 + _cse1941*_cse544 + _cse1942*_cse541 + _cse1943*_cse565 + _cse1944*_cse564 + _cse1978*_cse205 + _cse1982*_cse236 + _cse1983*_cse255 - _cse1984*_cse209 - _cse1985*_cse259
+    out[4, 25] = -_cse1058*_cse590 - _cse1066*_cse592 - _cse1194*_cse1989 + _cse1207*_cse1987 - _cse1215*_cse1990 + _cse1223*_cse1988 + _cse1307*_cse1949 + _cse1308*_cse1950 + _cse1653 + _cse1941*_cse748 + _cse1942*_cse745 + _cse1943*_cse750 + _cse1944*_cse749 + _cse1976*_cse577 + _cse1978*_cse343 + _cse1982*_cse580 + _cse1983*_cse360 - _cse1984*_cse422 - _cse1985*_cse436
+    out[4, 26] = -_cse1058*_cse809 - _cse1066*_cse811 - _cse1247*_cse1989 + _cse1248*_cse1987 - _cse1255*_cse1990 + _cse1256*_cse1988 + _cse1466*_cse1949 + _cse1467*_cse1950 + _cse1835 + _cse1941*_cse879 + _cse1942*_cse876 + _cse1943*_cse881 + _cse1944*_cse880 + _cse1976*_cse800 + _cse1978*_cse477 + _cse1982*_cse803 + _cse1983*_cse486 - _cse1984*_cse466 - _cse1985*_cse483
+    out[4, 27] = -_cse1058*_cse911 - _cse1066*_cse913 + _cse1260*_cse1987 + _cse1261*_cse1988 - _cse1275*_cse1989 - _cse1276*_cse1990 + _cse1564*_cse1949 + _cse1565*_cse1950 + _cse1929 + _cse1941*_cse974 + _cse1942*_cse977 + _cse1943*_cse978 + _cse1944*_cse979 + _cse1976*_cse903 + _cse1978*_cse524 + _cse1982*_cse906 + _cse1983*_cse537 - _cse1984*_cse523 - _cse1985*_cse536
+    out[4, 28] = _cse1016*_cse1976 + _cse1019*_cse1982 + _cse1058*_cse961 + _cse1066*_cse964 + _cse1303*_cse1987 + _cse1304*_cse1988 + _cse1309*_cse1989 + _cse1310*_cse1990 + _cse1978*_cse558 + _cse1983*_cse566 + _cse1984*_cse560 + _cse1985*_cse569
+    out[4, 29] = -_cse1039*_cse1973 - _cse1051*_cse1957 - _cse1086*_cse1957 + _cse1108*_cse1660 + _cse1108*_cse1666 - _cse1634*_cse1967 - _cse1639*_cse1959 - _cse1640*_cse1969 + _cse1658*_cse968 + _cse1664*_cse968 + _cse1683*_cse1932 + _cse1683*_cse1933
+    out[4, 30] = _cse1109
+    out[4, 31] = _cse1687
+    out[4, 32] = _cse1848
+    out[4, 33] = _cse1939
+    out[4, 34] = 0
+    out[4, 35] = -_cse1991
+    out[5, 0] = 0
+    out[5, 1] = _cse1992
+    out[5, 2] = _cse1993
+    out[5, 3] = _cse1995
+    out[5, 4] = _cse1996
+    out[5, 5] = _cse1112
+    out[5, 6] = _cse1992
+    out[5, 7] = -_cse1346*_cse1998 - _cse1351*_cse1997
+    out[5, 8] = _cse1999
+    out[5, 9] = _cse2000
+    out[5, 10] = _cse2001
+    out[5, 11] = _cse1688
+    out[5, 12] = _cse1993
+    out[5, 13] = _cse1999
+    out[5, 14] = _cse1712*_cse1998 + _cse1714*_cse1997
+    out[5, 15] = _cse2002
+    out[5, 16] = _cse2003
+    out[5, 17] = _cse1849
+    out[5, 18] = _cse1995
+    out[5, 19] = _cse2000
+    out[5, 20] = _cse2002
+    out[5, 21] = _cse1793*_cse1900 + _cse1794*_cse1873 + _cse1871*_cse1966 + _cse1871*_cse970 + _cse1873*_cse1965 + _cse1900*_cse1964
+    out[5, 22] = _cse2004
+    out[5, 23] = _cse1940
+    out[5, 24] = _cse1996
+    out[5, 25] = _cse2001
+    out[5, 26] = _cse2003
+    out[5, 27] = _cse2004
+    out[5, 28] = 1.0*_cse1032*_cse1959 + 1.0*_cse1050*_cse1957 + _cse1053*_cse1957 + 1.0*_cse1633*_cse1967 + _cse1641*_cse1967 + _cse1646*_cse1959
+    out[5, 29] = _cse1991
+    out[5, 30] = _cse1112
+    out[5, 31] = _cse1688
+    out[5, 32] = _cse1849
+    out[5, 33] = _cse1940
+    out[5, 34] = _cse1991
+    out[5, 35] = 0
+    return out
+
+
+# joint0[0,0,0]_Tx
+def function3(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = -3.27120000000000e-5
+    out[1, 0] = -1.73240000000000e-5
+    out[2, 0] = 0.156750000000000
+    out[3, 0] = 1
+    return out
+
+
+# joint0[0,0,0]_J
+def function4(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint0[0,0,0]_dJ
+def function5(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint1[0,0,0]_Tx
+def function6(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((4, 1))
+    out[0, 0] = 8.3995e-5*_cse0 + 4.3259e-5*_cse1 - 3.2712e-5
+    out[1, 0] = -4.3259e-5*_cse0 + 8.3995e-5*_cse1 - 1.7324e-5
+    out[2, 0] = 0.275128000000000
+    out[3, 0] = 1
+    return out
+
+
+# joint1[0,0,0]_J
+def function7(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = -4.3259e-5*_cse0 + 8.3995e-5*_cse1
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -8.3995e-5*_cse0 - 4.3259e-5*_cse1
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint1[0,0,0]_dJ
+def function8(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = dq0*(-8.3995e-5*_cse0 - 4.3259e-5*_cse1)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = dq0*(4.3259e-5*_cse0 - 8.3995e-5*_cse1)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse1*dq0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse0*dq0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint2[0,0,0]_Tx
+def function9(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = 1.098e-6*_cse3
+    _cse5 = -0.20902*_cse2 - 0.0019519*_cse3
+    out = np.empty((4, 1))
+    out[0, 0] = 0.005828995*_cse0 + 0.20503*_cse1*_cse2 - _cse1*_cse4 - _cse1*_cse5 + 4.3259e-5*_cse1 - 3.2712e-5
+    out[1, 0] = -0.20503*_cse0*_cse2 + _cse0*_cse4 + _cse0*_cse5 - 4.3259e-5*_cse0 + 0.005828995*_cse1 - 1.7324e-5
+    out[2, 0] = 0.001950802*_cse2 - 0.41405*_cse3 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# joint2[0,0,0]_J
+def function10(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse6 = 1.098e-6*_cse2
+    _cse7 = 0.20503*_cse4
+    _cse8 = 0.0019519*_cse2 - 0.20902*_cse4
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse3 + 1.098e-6*_cse0*_cse4 + _cse0*_cse5 - 4.3259e-5*_cse0 + 0.005828995*_cse1
+    out[0, 1] = _cse1*_cse6 + _cse1*_cse7 - _cse1*_cse8
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -0.005828995*_cse0 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 + _cse1*_cse5 - 4.3259e-5*_cse1
+    out[1, 1] = -_cse0*_cse6 - _cse0*_cse7 + _cse0*_cse8
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0.41405*_cse2 + 0.001950802*_cse4
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint2[0,0,0]_dJ
+def function11(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = 1.098e-6*_cse1
+    _cse3 = math.cos(q1)
+    _cse4 = 0.20503*_cse3
+    _cse5 = 0.0019519*_cse1 - 0.20902*_cse3
+    _cse6 = -_cse0*_cse2 - _cse0*_cse4 + _cse0*_cse5
+    _cse7 = math.cos(q0)
+    _cse8 = 0.20902*_cse1 + 0.0019519*_cse3
+    _cse9 = -_cse8
+    _cse10 = 0.20503*_cse1
+    _cse11 = _cse10*_cse7 - 1.098e-6*_cse3*_cse7
+    _cse12 = -_cse2*_cse7 - _cse4*_cse7 + _cse5*_cse7
+    _cse13 = 1.098e-6*_cse0*_cse3
+    _cse14 = _cse7*dq0
+    _cse15 = _cse0*dq0
+    out = np.empty((6, 6))
+    out[0, 0] = _cse6*dq1 + dq0*(-0.005828995*_cse0 - _cse11 + _cse7*_cse9 - 4.3259e-5*_cse7)
+    out[0, 1] = _cse6*dq0 + dq1*(-_cse11 - _cse7*_cse8)
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse12*dq1 + dq0*(0.20503*_cse0*_cse1 - _cse0*_cse9 + 4.3259e-5*_cse0 - _cse13 - 0.005828995*_cse7)
+    out[1, 1] = _cse12*dq0 + dq1*(_cse0*_cse10 + _cse0*_cse8 - _cse13)
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = dq1*(-0.001950802*_cse1 + 0.41405*_cse3)
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse14
+    out[3, 2] = _cse14
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse15
+    out[4, 2] = -_cse15
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint3[0,0,0]_Tx
+def function12(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = 0.12393*_cse8
+    _cse10 = 0.12393*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = _cse0*_cse2
+    _cse16 = _cse0*_cse4
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + _cse10*_cse5 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse3*_cse7 - _cse3*_cse9 + 0.20503*_cse3 - 1.098e-6*_cse5 - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.12393*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse10*_cse16 - _cse11*_cse16 - _cse13*_cse15 - _cse14*_cse16 - _cse15*_cse7 - 0.20503*_cse15 - 1.7324e-5
+    out[2, 0] = _cse10*_cse2 + _cse11*_cse2 - _cse13*_cse4 + _cse14*_cse2 + 0.001950802*_cse2 - _cse4*_cse7 + _cse4*_cse9 - 0.41405*_cse4 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# joint3[0,0,0]_J
+def function13(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = 0.12393*_cse5
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse20 = _cse1*_cse2
+    _cse21 = _cse20*_cse8
+    _cse22 = 0.12393*_cse1
+    _cse23 = _cse1*_cse4
+    _cse24 = _cse23*_cse5
+    _cse25 = _cse11*_cse22 + _cse17*_cse20 + 0.0038906673398998*_cse21 + _cse22*_cse6 - 0.0038906673398998*_cse24
+    _cse26 = _cse0*_cse2
+    _cse27 = _cse26*_cse8
+    _cse28 = 0.12393*_cse0
+    _cse29 = _cse11*_cse28 + _cse17*_cse26 + 0.0038906673398998*_cse27 + _cse28*_cse6 - 0.0038906673398998*_cse5*_cse9
+    _cse30 = _cse10*_cse4 + _cse12 + _cse18 - 0.12393*_cse2*_cse8 + _cse7
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.12393*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse10*_cse9
+    out[0, 1] = _cse1*_cse15*_cse4 - _cse1*_cse19 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse25
+    out[0, 2] = _cse14*_cse23 + _cse25
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.12393*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 - _cse10*_cse23
+    out[1, 1] = _cse0*_cse19 - _cse15*_cse9 - 1.098e-6*_cse26 + _cse29 - 0.20503*_cse9
+    out[1, 2] = -_cse14*_cse9 - _cse29
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse16 + 0.41405*_cse2 + _cse30 + 0.001950802*_cse4
+    out[2, 2] = _cse14*_cse2 - _cse30
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse21 - _cse24
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse27
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint3[0,0,0]_dJ
+def function14(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = math.sin(q2)
+    _cse3 = math.cos(q2)
+    _cse4 = 0.00048786*_cse2 + 0.081945*_cse3
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q1)
+    _cse7 = 0.081945*_cse2 - 0.00048786*_cse3
+    _cse8 = _cse6*_cse7
+    _cse9 = _cse3*_cse6
+    _cse10 = 0.0038906673398998*_cse9
+    _cse11 = _cse0*_cse1
+    _cse12 = 0.12393*_cse3
+    _cse13 = _cse0*_cse6
+    _cse14 = 0.12393*_cse2
+    _cse15 = _cse1*_cse2
+    _cse16 = 0.0038906673398998*_cse15
+    _cse17 = _cse0*_cse10 - _cse0*_cse16 + _cse0*_cse8 + _cse11*_cse12 + _cse13*_cse14
+    _cse18 = -_cse0*_cse5 - _cse17
+    _cse19 = -0.20902*_cse1 + 0.0019519*_cse6
+    _cse20 = -_cse4
+    _cse21 = _cse1*_cse20
+    _cse22 = _cse0*_cse19 - _cse0*_cse21 - 0.20503*_cse11 - 1.098e-6*_cse13 + _cse17
+    _cse23 = math.cos(q0)
+    _cse24 = 0.0019519*_cse1 + 0.20902*_cse6
+    _cse25 = -_cse24
+    _cse26 = _cse23*_cse6
+    _cse27 = _cse1*_cse23
+    _cse28 = _cse27*_cse3
+    _cse29 = 0.0038906673398998*_cse28
+    _cse30 = _cse2*_cse26
+    _cse31 = 0.0038906673398998*_cse30
+    _cse32 = 0.12393*_cse15*_cse23
+    _cse33 = _cse23*_cse9
+    _cse34 = 0.12393*_cse33
+    _cse35 = _cse27*_cse7 + _cse29 + _cse31 + _cse32 - _cse34
+    _cse36 = -1.098e-6*_cse1*_cse23 + _cse20*_cse26 + 0.20503*_cse26 + _cse35
+    _cse37 = _cse26*_cse4
+    _cse38 = _cse35 - _cse37
+    _cse39 = -_cse7
+    _cse40 = _cse10*_cse23 + _cse12*_cse27 + _cse14*_cse26 - _cse16*_cse23 + _cse23*_cse8
+    _cse41 = -_cse23*_cse5 - _cse40
+    _cse42 = _cse19*_cse23 - _cse21*_cse23 - 1.098e-6*_cse26 - 0.20503*_cse27 + _cse40
+    _cse43 = _cse11*_cse3
+    _cse44 = 0.0038906673398998*_cse43
+    _cse45 = _cse13*_cse2
+    _cse46 = 0.0038906673398998*_cse45
+    _cse47 = 0.12393*_cse0*_cse15
+    _cse48 = _cse0*_cse9
+    _cse49 = 0.12393*_cse48
+    _cse50 = _cse11*_cse7 + _cse44 + _cse46 + _cse47 - _cse49
+    _cse51 = -1.098e-6*_cse11 + _cse13*_cse20 + 0.20503*_cse13 + _cse50
+    _cse52 = _cse13*_cse4
+    _cse53 = -_cse50 + _cse52
+    _cse54 = _cse1*_cse12
+    _cse55 = _cse14*_cse6
+    _cse56 = -_cse16
+    _cse57 = _cse10 + _cse5 + _cse54 + _cse55 + _cse56
+    _cse58 = _cse57 + _cse8
+    _cse59 = _cse23*dq0
+    _cse60 = _cse28 + _cse30
+    _cse61 = _cse0*dq0
+    _cse62 = _cse43 + _cse45
+    _cse63 = -_cse15 + _cse9
+    out = np.empty((6, 6))
+    out[0, 0] = _cse18*dq2 + _cse22*dq1 + dq0*(0.0068032576553314*_cse0 + _cse23*_cse25 - 4.3259e-5*_cse23 - _cse36)
+    out[0, 1] = _cse22*dq0 + _cse38*dq2 + dq1*(-_cse23*_cse24 - _cse36)
+    out[0, 2] = _cse18*dq0 + _cse38*dq1 + dq2*(_cse27*_cse39 - _cse29 - _cse31 - _cse32 + _cse34 + _cse37)
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse41*dq2 + _cse42*dq1 + dq0*(-_cse0*_cse25 + 4.3259e-5*_cse0 + 0.0068032576553314*_cse23 + _cse51)
+    out[1, 1] = _cse42*dq0 + _cse53*dq2 + dq1*(_cse0*_cse24 + _cse51)
+    out[1, 2] = _cse41*dq0 + _cse53*dq1 + dq2*(-_cse11*_cse39 + _cse44 + _cse46 + _cse47 - _cse49 - _cse52)
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse58*dq2 + dq1*(_cse1*_cse20 + 0.41405*_cse1 - _cse10 - _cse54 - _cse55 - _cse56 - 0.001950802*_cse6 - _cse8)
+    out[2, 2] = _cse58*dq1 + dq2*(_cse39*_cse6 - _cse57)
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse59
+    out[3, 2] = _cse59
+    out[3, 3] = _cse60*dq1 - _cse60*dq2 + dq0*(_cse0*_cse1*_cse2 - _cse48)
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse61
+    out[4, 2] = -_cse61
+    out[4, 3] = -_cse62*dq1 + _cse62*dq2 + dq0*(_cse1*_cse2*_cse23 - _cse33)
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse63*dq1 - _cse63*dq2
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint4[0,0,0]_Tx
+def function15(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = math.sin(q2)
+    _cse5 = math.cos(q2)
+    _cse6 = -0.20902*_cse2 - 0.0019519*_cse3
+    _cse7 = -0.00048786*_cse4 - 0.081945*_cse5
+    _cse8 = 0.081945*_cse4 - 0.00048786*_cse5
+    _cse9 = 6.57617443000635e-7*_cse0
+    _cse10 = 0.999999998572139*_cse1
+    _cse11 = _cse2*_cse4
+    _cse12 = _cse3*_cse5
+    _cse13 = -_cse10*_cse11 - _cse10*_cse12 - _cse9
+    _cse14 = math.sin(q3)
+    _cse15 = 0.01707203272254*_cse14
+    _cse16 = math.cos(q3)
+    _cse17 = 6.57617443000635e-7*_cse1
+    _cse18 = 0.999999998572139*_cse0 - _cse11*_cse17 - _cse12*_cse17
+    _cse19 = -0.002520822938738*_cse14 - 0.00369541928741*_cse16
+    _cse20 = 0.001085531048896*_cse14 + 0.002018916286481*_cse16
+    _cse21 = 0.00369541928741*_cse14 - 0.002520822938738*_cse16
+    _cse22 = 0.002018916286481*_cse14 - 0.001085531048896*_cse16
+    _cse23 = -0.012581*_cse14 - 0.00040053*_cse16
+    _cse24 = -0.00040053*_cse14 + 0.012581*_cse16
+    _cse25 = _cse0*_cse2
+    _cse26 = _cse0*_cse3
+    _cse27 = _cse10 + _cse11*_cse9 + _cse12*_cse9
+    _cse28 = 0.999999998572139*_cse0
+    _cse29 = _cse11*_cse28 + _cse12*_cse28 - _cse17
+    _cse30 = _cse2*_cse5
+    _cse31 = 0.999999998572139*_cse3*_cse4 - 0.999999998572139*_cse30
+    _cse32 = 6.57617443000635e-7*_cse3*_cse4 - 6.57617443000635e-7*_cse30
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 + 0.0038906673398998*_cse1*_cse2*_cse4 - 0.189657077295935*_cse1*_cse2*_cse5 + _cse1*_cse2*_cse7 + 0.20503*_cse1*_cse2 + 0.189657077295935*_cse1*_cse3*_cse4 + 0.0038906673398998*_cse1*_cse3*_cse5 + _cse1*_cse3*_cse8 - 1.098e-6*_cse1*_cse3 - _cse1*_cse6 + 4.3259e-5*_cse1 - _cse13*_cse15 - _cse13*_cse20 - _cse13*_cse21 + _cse13*_cse23 + 0.01707203272254*_cse16*_cse18 - _cse18*_cse19 - _cse18*_cse22 + _cse18*_cse24 - 3.2712e-5
+    out[1, 0] = 0.189657077295935*_cse0*_cse2*_cse5 + 1.098e-6*_cse0*_cse3 + _cse0*_cse6 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse15*_cse29 + 0.01707203272254*_cse16*_cse27 - _cse19*_cse27 - _cse20*_cse29 - _cse21*_cse29 - _cse22*_cse27 + _cse23*_cse29 + _cse24*_cse27 - 0.0038906673398998*_cse25*_cse4 - _cse25*_cse7 - 0.20503*_cse25 - 0.189657077295935*_cse26*_cse4 - 0.0038906673398998*_cse26*_cse5 - _cse26*_cse8 - 1.7324e-5
+    out[2, 0] = 0.189657077295935*_cse11 + 0.189657077295935*_cse12 - _cse15*_cse31 + 0.01707203272254*_cse16*_cse32 - _cse19*_cse32 + _cse2*_cse8 + 0.001950802*_cse2 - _cse20*_cse31 - _cse21*_cse31 - _cse22*_cse32 + _cse23*_cse31 + _cse24*_cse32 - 0.0038906673398998*_cse3*_cse4 - _cse3*_cse7 - 0.41405*_cse3 + 0.0038906673398998*_cse30 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# joint4[0,0,0]_J
+def function16(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0
+    _cse25 = _cse11*_cse24 - _cse23 + _cse24*_cse6
+    _cse26 = math.sin(q3)
+    _cse27 = 0.01707203272254*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse26
+    _cse29 = -_cse28
+    _cse30 = 0.0048662*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse26
+    _cse32 = 0.0023603*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse26
+    _cse34 = 0.0048662*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse26
+    _cse36 = 0.0023603*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse26
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse26
+    _cse39 = -_cse38
+    _cse40 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse41 = _cse2*_cse8
+    _cse42 = _cse4*_cse5
+    _cse43 = _cse23*_cse41 - _cse23*_cse42
+    _cse44 = _cse20*_cse41 - _cse20*_cse42
+    _cse45 = _cse1*_cse2
+    _cse46 = _cse45*_cse8
+    _cse47 = 0.189657077295935*_cse1
+    _cse48 = _cse1*_cse4
+    _cse49 = _cse48*_cse5
+    _cse50 = _cse11*_cse47 + _cse17*_cse45 + 0.0038906673398998*_cse46 + _cse47*_cse6 - 0.0038906673398998*_cse49
+    _cse51 = -_cse43
+    _cse52 = -_cse44
+    _cse53 = 0.01707203272254*_cse19
+    _cse54 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse55 = -_cse54
+    _cse56 = -0.999999998572139*_cse0 + _cse11*_cse23 + _cse23*_cse6
+    _cse57 = -_cse56
+    _cse58 = -0.0023603*_cse35
+    _cse59 = 0.0048662*_cse28
+    _cse60 = _cse0*_cse2
+    _cse61 = 0.189657077295935*_cse0
+    _cse62 = _cse6*_cse61
+    _cse63 = _cse60*_cse8
+    _cse64 = 0.0038906673398998*_cse63
+    _cse65 = 0.0038906673398998*_cse10
+    _cse66 = _cse11*_cse61
+    _cse67 = _cse17*_cse60
+    _cse68 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse24*_cse41
+    _cse69 = -_cse68
+    _cse70 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse41
+    _cse71 = -_cse70
+    _cse72 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse73 = -_cse72
+    _cse74 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse75 = -_cse74
+    _cse76 = _cse12 + _cse18 - 0.189657077295935*_cse41 + 0.189657077295935*_cse42 + _cse7
+    _cse77 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse41
+    _cse78 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse41
+    _cse79 = 0.408002994597976*_cse26
+    _cse80 = 0.408002994597976*_cse19
+    _cse81 = 0.3960285*_cse29
+    _cse82 = 0.239041914*_cse31
+    _cse83 = 0.3960285*_cse33
+    _cse84 = 0.239041914*_cse35
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.189657077295935*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.189657077295935*_cse10 + 0.01707203272254*_cse19*_cse22 - _cse22*_cse30 - _cse22*_cse36 + _cse22*_cse39 - _cse25*_cse27 - _cse25*_cse32 - _cse25*_cse34 + _cse25*_cse37
+    out[0, 1] = _cse1*_cse15*_cse4 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse1*_cse40 + 0.01707203272254*_cse19*_cse43 - _cse27*_cse44 - _cse30*_cse43 - _cse32*_cse44 - _cse34*_cse44 - _cse36*_cse43 + _cse37*_cse44 + _cse39*_cse43 - _cse50
+    out[0, 2] = _cse14*_cse48 - _cse27*_cse52 - _cse30*_cse51 - _cse32*_cse52 - _cse34*_cse52 - _cse36*_cse51 + _cse37*_cse52 + _cse39*_cse51 + _cse50 + _cse51*_cse53
+    out[0, 3] = -_cse27*_cse57 - _cse32*_cse57 - _cse34*_cse57 + _cse37*_cse57 + _cse38*_cse55 - _cse53*_cse55 - _cse55*_cse58 - _cse55*_cse59
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.189657077295935*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 + 0.01707203272254*_cse19*_cse56 - _cse27*_cse54 - _cse30*_cse56 - _cse32*_cse54 - _cse34*_cse54 - _cse36*_cse56 + _cse37*_cse54 + _cse39*_cse56 - 0.189657077295935*_cse49
+    out[1, 1] = _cse0*_cse40 - _cse15*_cse9 + 0.01707203272254*_cse19*_cse71 - _cse27*_cse69 - _cse30*_cse71 - _cse32*_cse69 - _cse34*_cse69 - _cse36*_cse71 + _cse37*_cse69 + _cse39*_cse71 - 1.098e-6*_cse60 + _cse62 + _cse64 - _cse65 + _cse66 + _cse67 - 0.20503*_cse9
+    out[1, 2] = -_cse14*_cse9 + 0.01707203272254*_cse19*_cse70 - _cse27*_cse68 - _cse30*_cse70 - _cse32*_cse68 - _cse34*_cse68 - _cse36*_cse70 + _cse37*_cse68 + _cse39*_cse70 - _cse62 - _cse64 + _cse65 - _cse66 - _cse67
+    out[1, 3] = -_cse22*_cse27 - _cse22*_cse32 - _cse22*_cse34 + _cse22*_cse37 + _cse25*_cse38 - _cse25*_cse53 - _cse25*_cse58 - _cse25*_cse59
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse16 + 0.41405*_cse2 - _cse27*_cse75 - _cse30*_cse73 - _cse32*_cse75 - _cse34*_cse75 - _cse36*_cse73 + _cse37*_cse75 + _cse39*_cse73 + 0.001950802*_cse4 + _cse53*_cse73 + _cse76
+    out[2, 2] = _cse14*_cse2 + 0.01707203272254*_cse19*_cse72 - _cse27*_cse74 - _cse30*_cse72 - _cse32*_cse74 - _cse34*_cse74 - _cse36*_cse72 + _cse37*_cse74 + _cse39*_cse72 - _cse76
+    out[2, 3] = -_cse27*_cse78 - _cse32*_cse78 - _cse34*_cse78 + _cse37*_cse78 + _cse38*_cse77 - _cse53*_cse77 - _cse58*_cse77 - _cse59*_cse77
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse46 - _cse49
+    out[3, 4] = 0.574238819026787*_cse46 - 0.574238819026787*_cse49 + _cse55*_cse79 + _cse55*_cse82 + _cse55*_cse83 - _cse57*_cse80 + _cse57*_cse81 + _cse57*_cse84
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse63
+    out[4, 4] = 0.574238819026787*_cse10 - _cse22*_cse80 + _cse22*_cse81 + _cse22*_cse84 + _cse25*_cse79 + _cse25*_cse82 + _cse25*_cse83 - 0.574238819026787*_cse63
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 - 0.574238819026787*_cse6 + _cse77*_cse79 + _cse77*_cse82 + _cse77*_cse83 - _cse78*_cse80 + _cse78*_cse81 + _cse78*_cse84
+    out[5, 5] = 0
+    return out
+
+
+# joint4[0,0,0]_dJ
+def function17(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = 0.999999998572139*_cse0
+    _cse2 = math.sin(q0)
+    _cse3 = 6.57617443000635e-7*_cse2
+    _cse4 = math.sin(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse4*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = math.cos(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = _cse3*_cse6 + _cse3*_cse9
+    _cse11 = _cse1 + _cse10
+    _cse12 = math.sin(q3)
+    _cse13 = 0.01707203272254*_cse12
+    _cse14 = 6.57617443000635e-7*_cse0
+    _cse15 = 0.999999998572139*_cse2
+    _cse16 = _cse15*_cse6 + _cse15*_cse9
+    _cse17 = -_cse14 + _cse16
+    _cse18 = math.cos(q3)
+    _cse19 = 0.01707203272254*_cse18
+    _cse20 = 0.85536427*_cse12 - 0.45991232*_cse18
+    _cse21 = -_cse20
+    _cse22 = 0.0023603*_cse21
+    _cse23 = 0.45991232*_cse12 + 0.85536427*_cse18
+    _cse24 = 0.0023603*_cse23
+    _cse25 = 0.51802699*_cse12 + 0.75940555*_cse18
+    _cse26 = 0.0048662*_cse25
+    _cse27 = 0.75940555*_cse12 - 0.51802699*_cse18
+    _cse28 = 0.0048662*_cse27
+    _cse29 = 0.012581*_cse12 + 0.00040053*_cse18
+    _cse30 = -_cse29
+    _cse31 = 0.00040053*_cse12 - 0.012581*_cse18
+    _cse32 = -_cse11*_cse13 - _cse11*_cse24 - _cse11*_cse28 + _cse11*_cse30 - _cse17*_cse19 - _cse17*_cse22 - _cse17*_cse26 + _cse17*_cse31
+    _cse33 = _cse2*_cse4
+    _cse34 = _cse33*_cse5
+    _cse35 = 0.189657077295935*_cse34
+    _cse36 = _cse4*_cse8
+    _cse37 = 0.0038906673398998*_cse36
+    _cse38 = _cse2*_cse37
+    _cse39 = _cse5*_cse7
+    _cse40 = 0.0038906673398998*_cse39
+    _cse41 = _cse2*_cse40
+    _cse42 = _cse2*_cse7
+    _cse43 = _cse42*_cse8
+    _cse44 = 0.189657077295935*_cse43
+    _cse45 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse46 = _cse45*_cse7
+    _cse47 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse48 = _cse4*_cse47
+    _cse49 = _cse2*_cse48
+    _cse50 = -6.57617443000635e-7*_cse2*_cse5*_cse7 + _cse3*_cse36
+    _cse51 = _cse15*_cse36 - 0.999999998572139*_cse2*_cse5*_cse7
+    _cse52 = -_cse25
+    _cse53 = 0.0048662*_cse52
+    _cse54 = 0.0023603*_cse20
+    _cse55 = -_cse31
+    _cse56 = -_cse13*_cse51 + 0.01707203272254*_cse18*_cse50 - _cse2*_cse46 - _cse24*_cse51 - _cse28*_cse51 + _cse30*_cse51 - _cse35 - _cse38 + _cse41 - _cse44 - _cse49 - _cse50*_cse53 - _cse50*_cse54 + _cse50*_cse55
+    _cse57 = 0.0019519*_cse4 - 0.20902*_cse7
+    _cse58 = -_cse45
+    _cse59 = _cse58*_cse7
+    _cse60 = -_cse51
+    _cse61 = -_cse50
+    _cse62 = -_cse13*_cse60 + 0.01707203272254*_cse18*_cse61 + _cse2*_cse57 - _cse2*_cse59 - _cse24*_cse60 - _cse28*_cse60 + _cse30*_cse60 - 1.098e-6*_cse33 + _cse35 + _cse38 - _cse41 - 0.20503*_cse42 + _cse44 + _cse49 - _cse53*_cse61 - _cse54*_cse61 + _cse55*_cse61
+    _cse63 = _cse14*_cse6 + _cse14*_cse9
+    _cse64 = -_cse15 + _cse63
+    _cse65 = 0.20902*_cse4 + 0.0019519*_cse7
+    _cse66 = -_cse65
+    _cse67 = _cse1*_cse6 + _cse1*_cse9
+    _cse68 = _cse3 + _cse67
+    _cse69 = _cse0*_cse7
+    _cse70 = _cse47*_cse69
+    _cse71 = _cse69*_cse8
+    _cse72 = 0.0038906673398998*_cse71
+    _cse73 = _cse0*_cse4
+    _cse74 = _cse5*_cse73
+    _cse75 = 0.0038906673398998*_cse74
+    _cse76 = _cse0*_cse39
+    _cse77 = 0.189657077295935*_cse76
+    _cse78 = _cse0*_cse36
+    _cse79 = -0.189657077295935*_cse78
+    _cse80 = -1.098e-6*_cse0*_cse7 + _cse58*_cse73 + _cse70 + _cse72 + 0.20503*_cse73 + _cse75 + _cse77 + _cse79
+    _cse81 = _cse14*_cse36 - _cse14*_cse39
+    _cse82 = _cse1*_cse36 - _cse1*_cse39
+    _cse83 = -_cse13*_cse81 - _cse19*_cse82 - _cse22*_cse82 - _cse24*_cse81 - _cse26*_cse82 - _cse28*_cse81 + _cse30*_cse81 + _cse31*_cse82
+    _cse84 = -_cse63
+    _cse85 = -_cse67
+    _cse86 = -_cse45*_cse73 + _cse72 + _cse75 + _cse77 + _cse79
+    _cse87 = -_cse13*_cse85 + _cse19*_cse84 - _cse24*_cse85 - _cse28*_cse85 + _cse30*_cse85 - _cse53*_cse84 - _cse54*_cse84 + _cse55*_cse84 + _cse70 + _cse86
+    _cse88 = _cse13*_cse67 - 0.01707203272254*_cse18*_cse63 + _cse24*_cse67 + _cse28*_cse67 - _cse30*_cse67 + _cse53*_cse63 + _cse54*_cse63 - _cse55*_cse63
+    _cse89 = -_cse82
+    _cse90 = -_cse81
+    _cse91 = -_cse13*_cse90 - _cse19*_cse89 - _cse22*_cse89 - _cse24*_cse90 - _cse26*_cse89 - _cse28*_cse90 + _cse30*_cse90 + _cse31*_cse89
+    _cse92 = -_cse47
+    _cse93 = -_cse68
+    _cse94 = -_cse64
+    _cse95 = -0.0048662*_cse27
+    _cse96 = -0.0023603*_cse23
+    _cse97 = -_cse13*_cse64 - _cse19*_cse68 - _cse22*_cse68 - _cse24*_cse64 - _cse26*_cse68 - _cse28*_cse64 + _cse30*_cse64 + _cse31*_cse68
+    _cse98 = 0.189657077295935*_cse74
+    _cse99 = _cse0*_cse37
+    _cse100 = _cse0*_cse40
+    _cse101 = 0.189657077295935*_cse71
+    _cse102 = _cse0*_cse48
+    _cse103 = -_cse0*_cse46 + _cse100 - _cse101 - _cse102 - _cse13*_cse82 + 0.01707203272254*_cse18*_cse81 - _cse24*_cse82 - _cse28*_cse82 + _cse30*_cse82 - _cse53*_cse81 - _cse54*_cse81 + _cse55*_cse81 - _cse98 - _cse99
+    _cse104 = _cse0*_cse57 - _cse0*_cse59 - _cse100 + _cse101 + _cse102 - _cse13*_cse89 + 0.01707203272254*_cse18*_cse90 - _cse24*_cse89 - _cse28*_cse89 + _cse30*_cse89 - _cse53*_cse90 - _cse54*_cse90 + _cse55*_cse90 - 0.20503*_cse69 - 1.098e-6*_cse73 + _cse98 + _cse99
+    _cse105 = -_cse11
+    _cse106 = -_cse17
+    _cse107 = 0.0038906673398998*_cse43
+    _cse108 = 0.0038906673398998*_cse34
+    _cse109 = _cse2*_cse39
+    _cse110 = 0.189657077295935*_cse109
+    _cse111 = _cse2*_cse36
+    _cse112 = 0.189657077295935*_cse111
+    _cse113 = _cse107 + _cse108 + _cse110 - _cse112 + _cse42*_cse47
+    _cse114 = _cse113 + _cse33*_cse58 + 0.20503*_cse33 - 1.098e-6*_cse42
+    _cse115 = -_cse13*_cse61 - _cse19*_cse60 - _cse22*_cse60 - _cse24*_cse61 - _cse26*_cse60 - _cse28*_cse61 + _cse30*_cse61 + _cse31*_cse60
+    _cse116 = _cse33*_cse45
+    _cse117 = 0.01707203272254*_cse10*_cse18 - _cse10*_cse53 - _cse10*_cse54 + _cse10*_cse55 - _cse113 + _cse116 - _cse13*_cse16 - _cse16*_cse24 - _cse16*_cse28 + _cse16*_cse30
+    _cse118 = -_cse10
+    _cse119 = -_cse16
+    _cse120 = _cse119*_cse24
+    _cse121 = _cse118*_cse54
+    _cse122 = _cse119*_cse13
+    _cse123 = _cse119*_cse28
+    _cse124 = _cse118*_cse53
+    _cse125 = -_cse13*_cse50 - _cse19*_cse51 - _cse22*_cse51 - _cse24*_cse50 - _cse26*_cse51 - _cse28*_cse50 + _cse30*_cse50 + _cse31*_cse51
+    _cse126 = 0.999999998572139*_cse6 + 0.999999998572139*_cse9
+    _cse127 = -_cse126
+    _cse128 = 6.57617443000635e-7*_cse6 + 6.57617443000635e-7*_cse9
+    _cse129 = -_cse128
+    _cse130 = -_cse127*_cse19 - _cse127*_cse22 - _cse127*_cse26 + _cse127*_cse31 - _cse129*_cse13 - _cse129*_cse24 - _cse129*_cse28 + _cse129*_cse30
+    _cse131 = 6.57617443000635e-7*_cse36 - 6.57617443000635e-7*_cse39
+    _cse132 = -_cse131
+    _cse133 = 0.999999998572139*_cse36 - 0.999999998572139*_cse39
+    _cse134 = -_cse133
+    _cse135 = -_cse13*_cse134 + _cse132*_cse19
+    _cse136 = 0.189657077295935*_cse9
+    _cse137 = 0.189657077295935*_cse6
+    _cse138 = -_cse40
+    _cse139 = _cse136 + _cse137 + _cse138 + _cse37 + _cse46
+    _cse140 = -_cse132*_cse53 - _cse132*_cse54 + _cse132*_cse55 - _cse134*_cse24 - _cse134*_cse28 + _cse134*_cse30 + _cse135 + _cse139 + _cse48
+    _cse141 = _cse13*_cse133 - 0.01707203272254*_cse131*_cse18 + _cse131*_cse53 + _cse131*_cse54 - _cse131*_cse55 + _cse133*_cse24 + _cse133*_cse28 - _cse133*_cse30
+    _cse142 = -_cse126*_cse19 - _cse126*_cse22 - _cse126*_cse26 + _cse126*_cse31 - _cse128*_cse13 - _cse128*_cse24 - _cse128*_cse28 + _cse128*_cse30
+    _cse143 = _cse0*dq0
+    _cse144 = _cse71 + _cse74
+    _cse145 = 0.574238819026787*_cse74
+    _cse146 = 0.574238819026787*_cse71
+    _cse147 = 0.408002994597976*_cse18
+    _cse148 = 0.408002994597976*_cse12
+    _cse149 = 0.3960285*_cse52
+    _cse150 = 0.239041914*_cse20
+    _cse151 = 0.239041914*_cse23
+    _cse152 = 0.3960285*_cse27
+    _cse153 = 0.239041914*_cse21
+    _cse154 = 0.3960285*_cse25
+    _cse155 = _cse2*dq0
+    _cse156 = _cse34 + _cse43
+    _cse157 = 0.574238819026787*_cse34
+    _cse158 = 0.574238819026787*_cse43
+    _cse159 = _cse36 - _cse39
+    _cse160 = 0.574238819026787*_cse36
+    _cse161 = 0.574238819026787*_cse39
+    out = np.empty((6, 6))
+    out[0, 0] = _cse32*dq3 + _cse56*dq2 + _cse62*dq1 + dq0*(_cse0*_cse66 - 4.3259e-5*_cse0 - _cse13*_cse68 + 0.01707203272254*_cse18*_cse64 + 0.0068032576553314*_cse2 - _cse24*_cse68 - _cse28*_cse68 + _cse30*_cse68 - _cse53*_cse64 - _cse54*_cse64 + _cse55*_cse64 - _cse80)
+    out[0, 1] = _cse62*dq0 + _cse83*dq3 + _cse87*dq2 + dq1*(-_cse0*_cse65 - _cse80 - _cse88)
+    out[0, 2] = _cse56*dq0 + _cse87*dq1 + _cse91*dq3 + dq2*(_cse0*_cse7*_cse92 - _cse86 - _cse88)
+    out[0, 3] = _cse32*dq0 + _cse83*dq1 + _cse91*dq2 + dq3*(0.01707203272254*_cse12*_cse93 - _cse19*_cse94 - _cse22*_cse94 - _cse26*_cse94 + _cse29*_cse93 + _cse31*_cse94 - _cse93*_cse95 - _cse93*_cse96)
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse103*dq2 + _cse104*dq1 + _cse97*dq3 + dq0*(0.0068032576553314*_cse0 + _cse105*_cse19 - _cse105*_cse53 - _cse105*_cse54 + _cse105*_cse55 - _cse106*_cse13 - _cse106*_cse24 - _cse106*_cse28 + _cse106*_cse30 + _cse114 - _cse2*_cse66 + 4.3259e-5*_cse2)
+    out[1, 1] = _cse104*dq0 + _cse115*dq3 + _cse117*dq2 + dq1*(_cse114 + _cse118*_cse19 + _cse118*_cse55 + _cse119*_cse30 - _cse120 - _cse121 - _cse122 - _cse123 - _cse124 + _cse2*_cse65)
+    out[1, 2] = _cse103*dq0 + _cse117*dq1 + _cse125*dq3 + dq2*(_cse107 + _cse108 + _cse110 - _cse112 - _cse116 + 0.01707203272254*_cse118*_cse18 + _cse118*_cse55 + _cse119*_cse30 - _cse120 - _cse121 - _cse122 - _cse123 - _cse124 - _cse42*_cse92)
+    out[1, 3] = _cse115*dq1 + _cse125*dq2 + _cse97*dq0 + dq3*(-_cse11*_cse19 - _cse11*_cse22 - _cse11*_cse26 + _cse11*_cse31 + 0.01707203272254*_cse12*_cse17 + _cse17*_cse29 - _cse17*_cse95 - _cse17*_cse96)
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse130*dq3 + _cse140*dq2 + dq1*(-_cse136 - _cse137 - _cse138 - _cse141 - _cse37 - 0.001950802*_cse4 - _cse48 + _cse58*_cse7 + 0.41405*_cse7)
+    out[2, 2] = _cse140*dq1 + _cse142*dq3 + dq2*(-_cse139 - _cse141 + _cse4*_cse92)
+    out[2, 3] = _cse130*dq1 + _cse142*dq2 + dq3*(-_cse132*_cse22 - _cse132*_cse26 + _cse132*_cse31 + _cse134*_cse29 - _cse134*_cse95 - _cse134*_cse96 - _cse135)
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse143
+    out[3, 2] = _cse143
+    out[3, 3] = _cse144*dq1 - _cse144*dq2 + dq0*(-_cse111 + _cse2*_cse5*_cse7)
+    out[3, 4] = dq0*(0.574238819026787*_cse109 - _cse11*_cse147 + _cse11*_cse149 + _cse11*_cse150 - 0.574238819026787*_cse111 + _cse148*_cse17 + _cse151*_cse17 + _cse152*_cse17) + dq1*(_cse145 + _cse146 - _cse147*_cse81 + _cse148*_cse82 + _cse149*_cse81 + _cse150*_cse81 + _cse151*_cse82 + _cse152*_cse82) + dq2*(-_cse145 - _cse146 - _cse147*_cse90 + _cse148*_cse89 + _cse149*_cse90 + _cse150*_cse90 + _cse151*_cse89 + _cse152*_cse89) + dq3*(_cse147*_cse93 + _cse148*_cse94 + _cse151*_cse94 + _cse152*_cse94 + _cse153*_cse93 + _cse154*_cse93)
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse155
+    out[4, 2] = -_cse155
+    out[4, 3] = -_cse156*dq1 + _cse156*dq2 + dq0*(_cse0*_cse5*_cse7 - _cse78)
+    out[4, 4] = dq0*(-_cse147*_cse64 + _cse148*_cse68 + _cse149*_cse64 + _cse150*_cse64 + _cse151*_cse68 + _cse152*_cse68 + 0.574238819026787*_cse76 - 0.574238819026787*_cse78) + dq1*(-_cse147*_cse61 + _cse148*_cse60 + _cse149*_cse61 + _cse150*_cse61 + _cse151*_cse60 + _cse152*_cse60 - _cse157 - _cse158) + dq2*(-_cse147*_cse50 + _cse148*_cse51 + _cse149*_cse50 + _cse150*_cse50 + _cse151*_cse51 + _cse152*_cse51 + _cse157 + _cse158) + dq3*(_cse11*_cse148 + _cse11*_cse151 + _cse11*_cse152 + _cse147*_cse17 + _cse153*_cse17 + _cse154*_cse17)
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse159*dq1 - _cse159*dq2
+    out[5, 4] = dq1*(_cse127*_cse148 + _cse127*_cse151 + _cse127*_cse152 - _cse129*_cse147 + _cse129*_cse149 + _cse129*_cse150 + _cse160 - _cse161) + dq2*(_cse126*_cse148 + _cse126*_cse151 + _cse126*_cse152 - _cse128*_cse147 + _cse128*_cse149 + _cse128*_cse150 - _cse160 + _cse161) + dq3*(_cse132*_cse148 + _cse132*_cse151 + _cse132*_cse152 + _cse134*_cse147 + _cse134*_cse153 + _cse134*_cse154)
+    out[5, 5] = 0
+    return out
+
+
+# joint5[0,0,0]_Tx
+def function18(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse3*_cse8
+    _cse10 = _cse5*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = math.sin(q3)
+    _cse16 = 6.57617443000635e-7*_cse0
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = _cse2*_cse6
+    _cse19 = _cse4*_cse8
+    _cse20 = -_cse16 - _cse17*_cse18 - _cse17*_cse19
+    _cse21 = _cse15*_cse20
+    _cse22 = math.cos(q3)
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0 - _cse18*_cse23 - _cse19*_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = -0.012581*_cse15 - 0.00040053*_cse22
+    _cse27 = -0.00040053*_cse15 + 0.012581*_cse22
+    _cse28 = -0.51802699*_cse15 - 0.75940555*_cse22
+    _cse29 = _cse24*_cse28
+    _cse30 = 0.45991232*_cse15 + 0.85536427*_cse22
+    _cse31 = _cse20*_cse30
+    _cse32 = 0.75940555*_cse15 - 0.51802699*_cse22
+    _cse33 = _cse20*_cse32
+    _cse34 = 0.85536427*_cse15 - 0.45991232*_cse22
+    _cse35 = _cse24*_cse34
+    _cse36 = -0.000346321299837637*_cse10 + 0.517383113*_cse29 - 0.855753802*_cse31 + 0.517383113*_cse33 - 0.855753802*_cse35 + 0.000346321299837637*_cse9
+    _cse37 = math.sin(q4)
+    _cse38 = 0.01718495619792*_cse37
+    _cse39 = math.cos(q4)
+    _cse40 = -0.012272*_cse37 - 0.00052974*_cse39
+    _cse41 = -0.78972966*_cse37 + 0.45479896*_cse39
+    _cse42 = 0.0050298*_cse41
+    _cse43 = 0.000787787838506*_cse37 + 0.001739686573542*_cse39
+    _cse44 = 0.818687841791724*_cse10 - 0.212878838804554*_cse21 + 0.212878838804554*_cse25 + 0.758601438*_cse29 + 0.458851168*_cse31 + 0.758601438*_cse33 + 0.458851168*_cse35 - 0.818687841791724*_cse9
+    _cse45 = 0.01718495619792*_cse39
+    _cse46 = -0.00052974*_cse37 + 0.012272*_cse39
+    _cse47 = 0.45479896*_cse37 + 0.78972966*_cse39
+    _cse48 = 0.0050298*_cse47
+    _cse49 = 0.001739686573542*_cse37 - 0.000787787838506*_cse39
+    _cse50 = _cse0*_cse2
+    _cse51 = _cse0*_cse4
+    _cse52 = _cse51*_cse6
+    _cse53 = _cse16*_cse18 + _cse16*_cse19 + _cse17
+    _cse54 = 0.999999998572139*_cse0
+    _cse55 = _cse18*_cse54 + _cse19*_cse54 - _cse23
+    _cse56 = _cse15*_cse55
+    _cse57 = _cse28*_cse53
+    _cse58 = _cse30*_cse55
+    _cse59 = _cse32*_cse55
+    _cse60 = _cse34*_cse53
+    _cse61 = _cse50*_cse8
+    _cse62 = 0.000346321299837637*_cse52 + 0.517383113*_cse57 - 0.855753802*_cse58 + 0.517383113*_cse59 - 0.855753802*_cse60 - 0.000346321299837637*_cse61
+    _cse63 = 0.212878838804554*_cse22*_cse53 - 0.818687841791724*_cse52 - 0.212878838804554*_cse56 + 0.758601438*_cse57 + 0.458851168*_cse58 + 0.758601438*_cse59 + 0.458851168*_cse60 + 0.818687841791724*_cse61
+    _cse64 = _cse2*_cse8
+    _cse65 = 0.999999998572139*_cse4*_cse6 - 0.999999998572139*_cse64
+    _cse66 = _cse15*_cse65
+    _cse67 = 6.57617443000635e-7*_cse4*_cse6 - 6.57617443000635e-7*_cse64
+    _cse68 = _cse22*_cse67
+    _cse69 = _cse30*_cse65
+    _cse70 = _cse32*_cse65
+    _cse71 = _cse28*_cse67
+    _cse72 = _cse34*_cse67
+    _cse73 = -0.000346321299837637*_cse18 - 0.000346321299837637*_cse19 + 0.517383113*_cse28*_cse67 + 0.517383113*_cse32*_cse65 - 0.855753802*_cse69 - 0.855753802*_cse72
+    _cse74 = 0.818687841791724*_cse18 + 0.818687841791724*_cse19 - 0.212878838804554*_cse66 + 0.212878838804554*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70 + 0.758601438*_cse71 + 0.458851168*_cse72
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + 0.227539183449751*_cse10 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse20*_cse26 - 0.0439876856535455*_cse21 + _cse24*_cse27 + 0.0439876856535455*_cse25 - 0.0309919044627574*_cse29 + _cse3*_cse7 + 0.20503*_cse3 - 0.0181297165934418*_cse31 - 0.0309919044627574*_cse33 - 0.0181297165934418*_cse35 - _cse36*_cse38 + _cse36*_cse40 + _cse36*_cse42 - _cse36*_cse43 + _cse44*_cse45 + _cse44*_cse46 + _cse44*_cse48 - _cse44*_cse49 - 1.098e-6*_cse5 - 0.227539183449751*_cse9 - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.227539183449751*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse11*_cse51 - _cse13*_cse50 - _cse14*_cse51 + 0.0439876856535455*_cse22*_cse53 + _cse26*_cse55 + _cse27*_cse53 - _cse38*_cse62 + 0.01718495619792*_cse39*_cse63 + _cse40*_cse62 + 0.0050298*_cse41*_cse62 - _cse43*_cse62 + _cse46*_cse63 + 0.0050298*_cse47*_cse63 - _cse49*_cse63 - _cse50*_cse7 - 0.20503*_cse50 - 0.227539183449751*_cse52 - 0.0439876856535455*_cse56 - 0.0309919044627574*_cse57 - 0.0181297165934418*_cse58 - 0.0309919044627574*_cse59 - 0.0181297165934418*_cse60 - 1.7324e-5
+    out[2, 0] = -_cse13*_cse4 + _cse14*_cse2 + 0.227539183449751*_cse18 + 0.227539183449751*_cse19 + 0.001950802*_cse2 + _cse26*_cse65 + _cse27*_cse67 - _cse38*_cse73 - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + _cse40*_cse73 + _cse42*_cse73 - _cse43*_cse73 + _cse45*_cse74 + _cse46*_cse74 + _cse48*_cse74 - _cse49*_cse74 + 0.0038906673398998*_cse64 - 0.0439876856535455*_cse66 + 0.0439876856535455*_cse68 - 0.0181297165934418*_cse69 - 0.0309919044627574*_cse70 - 0.0309919044627574*_cse71 - 0.0181297165934418*_cse72 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# joint5[0,0,0]_J
+def function19(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = math.sin(q3)
+    _cse24 = 6.57617443000635e-7*_cse1
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse11*_cse25 - _cse24 + _cse25*_cse6
+    _cse27 = _cse23*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse23
+    _cse29 = -_cse28
+    _cse30 = _cse22*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse23
+    _cse32 = _cse26*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse23
+    _cse34 = _cse26*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse23
+    _cse36 = _cse22*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse23
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse23
+    _cse39 = -_cse38
+    _cse40 = _cse0*_cse2
+    _cse41 = _cse40*_cse8
+    _cse42 = 0.000346321299837637*_cse10 + 0.517383113*_cse30 - 0.855753802*_cse32 + 0.517383113*_cse34 - 0.855753802*_cse36 - 0.000346321299837637*_cse41
+    _cse43 = math.sin(q4)
+    _cse44 = 0.01718495619792*_cse43
+    _cse45 = math.cos(q4)
+    _cse46 = -0.78972966*_cse43 + 0.45479896*_cse45
+    _cse47 = 0.40329059*_cse43 + 0.89059413*_cse45
+    _cse48 = 0.0019534*_cse47
+    _cse49 = -0.012272*_cse43 - 0.00052974*_cse45
+    _cse50 = _cse19*_cse22
+    _cse51 = -0.818687841791724*_cse10 - 0.212878838804554*_cse27 + 0.758601438*_cse30 + 0.458851168*_cse32 + 0.758601438*_cse34 + 0.458851168*_cse36 + 0.818687841791724*_cse41 + 0.212878838804554*_cse50
+    _cse52 = 0.45479896*_cse43 + 0.78972966*_cse45
+    _cse53 = 0.89059413*_cse43 - 0.40329059*_cse45
+    _cse54 = 0.0019534*_cse53
+    _cse55 = 0.00052974*_cse43 - 0.012272*_cse45
+    _cse56 = -_cse55
+    _cse57 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse58 = 0.818687841791724*_cse6
+    _cse59 = _cse1*_cse58
+    _cse60 = 0.818687841791724*_cse11
+    _cse61 = _cse1*_cse60
+    _cse62 = _cse2*_cse8
+    _cse63 = _cse4*_cse5
+    _cse64 = _cse24*_cse62 - _cse24*_cse63
+    _cse65 = _cse20*_cse62 - _cse20*_cse63
+    _cse66 = _cse23*_cse65
+    _cse67 = _cse29*_cse64
+    _cse68 = _cse35*_cse64
+    _cse69 = _cse31*_cse65
+    _cse70 = _cse33*_cse65
+    _cse71 = 0.212878838804554*_cse19*_cse64 - _cse59 - _cse61 - 0.212878838804554*_cse66 + 0.758601438*_cse67 + 0.458851168*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70
+    _cse72 = 0.000346321299837637*_cse11
+    _cse73 = 0.000346321299837637*_cse6
+    _cse74 = _cse1*_cse72 + _cse1*_cse73
+    _cse75 = 0.517383113*_cse67 - 0.855753802*_cse68 - 0.855753802*_cse69 + 0.517383113*_cse70 + _cse74
+    _cse76 = _cse1*_cse2
+    _cse77 = _cse76*_cse8
+    _cse78 = 0.227539183449751*_cse1
+    _cse79 = _cse1*_cse4
+    _cse80 = _cse5*_cse79
+    _cse81 = _cse11*_cse78 + _cse17*_cse76 + _cse6*_cse78 + 0.0038906673398998*_cse77 - 0.0038906673398998*_cse80
+    _cse82 = -_cse65
+    _cse83 = _cse23*_cse82
+    _cse84 = -_cse64
+    _cse85 = _cse19*_cse84
+    _cse86 = _cse31*_cse82
+    _cse87 = _cse33*_cse82
+    _cse88 = _cse29*_cse84
+    _cse89 = _cse35*_cse84
+    _cse90 = _cse59 + _cse61 - 0.212878838804554*_cse83 + 0.212878838804554*_cse85 + 0.458851168*_cse86 + 0.758601438*_cse87 + 0.758601438*_cse88 + 0.458851168*_cse89
+    _cse91 = 0.517383113*_cse29*_cse84 + 0.517383113*_cse33*_cse82 - _cse74 - 0.855753802*_cse86 - 0.855753802*_cse89
+    _cse92 = 0.01718495619792*_cse45
+    _cse93 = 0.0050298*_cse46
+    _cse94 = 0.0050298*_cse52
+    _cse95 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse96 = -_cse95
+    _cse97 = _cse19*_cse96
+    _cse98 = -0.999999998572139*_cse0 + _cse11*_cse24 + _cse24*_cse6
+    _cse99 = -_cse98
+    _cse100 = _cse23*_cse99
+    _cse101 = -_cse35
+    _cse102 = _cse101*_cse96
+    _cse103 = _cse31*_cse99
+    _cse104 = _cse28*_cse96
+    _cse105 = _cse33*_cse99
+    _cse106 = -0.855753802*_cse102 - 0.855753802*_cse103 + 0.517383113*_cse28*_cse96 + 0.517383113*_cse33*_cse99
+    _cse107 = -0.212878838804554*_cse100 + 0.458851168*_cse102 + 0.458851168*_cse103 + 0.758601438*_cse104 + 0.758601438*_cse105 - 0.212878838804554*_cse97
+    _cse108 = 0.000346321299837637*_cse77
+    _cse109 = 0.000346321299837637*_cse80
+    _cse110 = _cse29*_cse99
+    _cse111 = _cse31*_cse96
+    _cse112 = _cse33*_cse96
+    _cse113 = _cse35*_cse99
+    _cse114 = _cse108 - _cse109 + 0.517383113*_cse110 - 0.855753802*_cse111 + 0.517383113*_cse112 - 0.855753802*_cse113
+    _cse115 = -0.0019534*_cse53
+    _cse116 = -_cse52
+    _cse117 = 0.818687841791724*_cse77
+    _cse118 = 0.818687841791724*_cse80
+    _cse119 = 0.212878838804554*_cse23
+    _cse120 = 0.212878838804554*_cse19
+    _cse121 = 0.758601438*_cse110 + 0.458851168*_cse111 + 0.758601438*_cse112 + 0.458851168*_cse113 - _cse117 + _cse118 - _cse119*_cse96 + _cse120*_cse99
+    _cse122 = 0.0439876856535455*_cse23
+    _cse123 = _cse29*_cse98
+    _cse124 = _cse31*_cse95
+    _cse125 = _cse33*_cse95
+    _cse126 = _cse35*_cse98
+    _cse127 = -_cse108 + _cse109 + 0.517383113*_cse123 - 0.855753802*_cse124 + 0.517383113*_cse125 - 0.855753802*_cse126
+    _cse128 = _cse117 - _cse118 - _cse119*_cse95 + _cse120*_cse98 + 0.758601438*_cse123 + 0.458851168*_cse124 + 0.758601438*_cse125 + 0.458851168*_cse126
+    _cse129 = _cse0*_cse58
+    _cse130 = _cse0*_cse60
+    _cse131 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse25*_cse62
+    _cse132 = -_cse131
+    _cse133 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse62
+    _cse134 = -_cse133
+    _cse135 = _cse132*_cse31
+    _cse136 = _cse132*_cse33
+    _cse137 = _cse134*_cse29
+    _cse138 = _cse134*_cse35
+    _cse139 = -_cse119*_cse132 + _cse120*_cse134 + _cse129 + _cse130 + 0.458851168*_cse135 + 0.758601438*_cse136 + 0.758601438*_cse137 + 0.458851168*_cse138
+    _cse140 = _cse0*_cse72 + _cse0*_cse73
+    _cse141 = 0.517383113*_cse132*_cse33 + 0.517383113*_cse134*_cse29 - 0.855753802*_cse135 - 0.855753802*_cse138 - _cse140
+    _cse142 = 0.0439876856535455*_cse19
+    _cse143 = 0.227539183449751*_cse0
+    _cse144 = -0.0038906673398998*_cse10 + _cse11*_cse143 + _cse143*_cse6 + _cse17*_cse40 + 0.0038906673398998*_cse41
+    _cse145 = _cse133*_cse29
+    _cse146 = _cse133*_cse35
+    _cse147 = _cse131*_cse31
+    _cse148 = _cse131*_cse33
+    _cse149 = -_cse119*_cse131 + _cse120*_cse133 - _cse129 - _cse130 + 0.758601438*_cse145 + 0.458851168*_cse146 + 0.458851168*_cse147 + 0.758601438*_cse148
+    _cse150 = _cse140 + 0.517383113*_cse145 - 0.855753802*_cse146 - 0.855753802*_cse147 + 0.517383113*_cse148
+    _cse151 = _cse101*_cse26
+    _cse152 = _cse22*_cse31
+    _cse153 = _cse26*_cse28
+    _cse154 = _cse22*_cse33
+    _cse155 = -0.855753802*_cse151 - 0.855753802*_cse152 + 0.517383113*_cse22*_cse33 + 0.517383113*_cse26*_cse28
+    _cse156 = -_cse119*_cse22 - _cse120*_cse26 + 0.458851168*_cse151 + 0.458851168*_cse152 + 0.758601438*_cse153 + 0.758601438*_cse154
+    _cse157 = 0.818687841791724*_cse62
+    _cse158 = 0.818687841791724*_cse63
+    _cse159 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse160 = -_cse159
+    _cse161 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse162 = -_cse161
+    _cse163 = _cse160*_cse31
+    _cse164 = _cse160*_cse33
+    _cse165 = _cse162*_cse29
+    _cse166 = _cse162*_cse35
+    _cse167 = -_cse119*_cse160 + _cse120*_cse162 - _cse157 + _cse158 + 0.458851168*_cse163 + 0.758601438*_cse164 + 0.758601438*_cse165 + 0.458851168*_cse166
+    _cse168 = -0.000346321299837637*_cse62 + 0.000346321299837637*_cse63
+    _cse169 = 0.517383113*_cse160*_cse33 + 0.517383113*_cse162*_cse29 - 0.855753802*_cse163 - 0.855753802*_cse166 - _cse168
+    _cse170 = _cse12 + _cse18 - 0.227539183449751*_cse62 + 0.227539183449751*_cse63 + _cse7
+    _cse171 = _cse161*_cse29
+    _cse172 = _cse161*_cse35
+    _cse173 = _cse159*_cse31
+    _cse174 = _cse159*_cse33
+    _cse175 = -_cse119*_cse159 + _cse120*_cse161 + _cse157 - _cse158 + 0.758601438*_cse171 + 0.458851168*_cse172 + 0.458851168*_cse173 + 0.758601438*_cse174
+    _cse176 = _cse168 + 0.517383113*_cse171 - 0.855753802*_cse172 - 0.855753802*_cse173 + 0.517383113*_cse174
+    _cse177 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse62
+    _cse178 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse62
+    _cse179 = _cse101*_cse177
+    _cse180 = _cse177*_cse28
+    _cse181 = _cse178*_cse31
+    _cse182 = _cse178*_cse33
+    _cse183 = 0.517383113*_cse177*_cse28 + 0.517383113*_cse178*_cse33 - 0.855753802*_cse179 - 0.855753802*_cse181
+    _cse184 = -_cse119*_cse178 - _cse120*_cse177 + 0.458851168*_cse179 + 0.758601438*_cse180 + 0.458851168*_cse181 + 0.758601438*_cse182
+    _cse185 = _cse177*_cse31
+    _cse186 = _cse178*_cse35
+    _cse187 = 0.517383113*_cse177*_cse33 + 0.517383113*_cse178*_cse29 - 0.855753802*_cse185 - 0.855753802*_cse186 - _cse72 - _cse73
+    _cse188 = _cse177*_cse33
+    _cse189 = _cse178*_cse29
+    _cse190 = -_cse119*_cse177 + _cse120*_cse178 + 0.458851168*_cse185 + 0.458851168*_cse186 + 0.758601438*_cse188 + 0.758601438*_cse189 + _cse58 + _cse60
+    _cse191 = _cse23*_cse96
+    _cse192 = _cse19*_cse99
+    _cse193 = 0.410149995883665*_cse43
+    _cse194 = 0.410879747*_cse46
+    _cse195 = 0.209584432*_cse47
+    _cse196 = 0.410149995883665*_cse45
+    _cse197 = 0.410879747*_cse52
+    _cse198 = 0.209584432*_cse53
+    _cse199 = _cse177*_cse23
+    _cse200 = _cse178*_cse19
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.227539183449751*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.227539183449751*_cse10 + 0.0439876856535455*_cse19*_cse22 + _cse22*_cse39 + _cse26*_cse37 - 0.0439876856535455*_cse27 - 0.0309919044627574*_cse30 - 0.0181297165934418*_cse32 - 0.0309919044627574*_cse34 - 0.0181297165934418*_cse36 - _cse42*_cse44 + 0.0050298*_cse42*_cse46 - _cse42*_cse48 + _cse42*_cse49 + 0.01718495619792*_cse45*_cse51 + 0.0050298*_cse51*_cse52 - _cse51*_cse54 + _cse51*_cse56
+    out[0, 1] = _cse1*_cse15*_cse4 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse1*_cse57 + 0.0439876856535455*_cse19*_cse64 + _cse37*_cse65 + _cse39*_cse64 - _cse44*_cse75 + 0.01718495619792*_cse45*_cse71 + 0.0050298*_cse46*_cse75 - _cse48*_cse75 + _cse49*_cse75 + 0.0050298*_cse52*_cse71 - _cse54*_cse71 + _cse56*_cse71 - 0.0439876856535455*_cse66 - 0.0309919044627574*_cse67 - 0.0181297165934418*_cse68 - 0.0181297165934418*_cse69 - 0.0309919044627574*_cse70 - _cse81
+    out[0, 2] = _cse14*_cse79 + _cse37*_cse82 + _cse39*_cse84 - _cse44*_cse91 - _cse48*_cse91 + _cse49*_cse91 - _cse54*_cse90 + _cse56*_cse90 + _cse81 - 0.0439876856535455*_cse83 + 0.0439876856535455*_cse85 - 0.0181297165934418*_cse86 - 0.0309919044627574*_cse87 - 0.0309919044627574*_cse88 - 0.0181297165934418*_cse89 + _cse90*_cse92 + _cse90*_cse94 + _cse91*_cse93
+    out[0, 3] = -0.0439876856535455*_cse100 - 0.0181297165934418*_cse102 - 0.0181297165934418*_cse103 - 0.0309919044627574*_cse104 - 0.0309919044627574*_cse105 - _cse106*_cse44 + 0.0050298*_cse106*_cse46 - _cse106*_cse48 + _cse106*_cse49 + 0.01718495619792*_cse107*_cse45 + 0.0050298*_cse107*_cse52 - _cse107*_cse54 + _cse107*_cse56 + _cse37*_cse99 + _cse38*_cse96 - 0.0439876856535455*_cse97
+    out[0, 4] = -_cse114*_cse115 + 0.0050298*_cse114*_cse116 + _cse114*_cse55 - _cse114*_cse92 - _cse121*_cse44 + 0.0050298*_cse121*_cse46 - _cse121*_cse48 + _cse121*_cse49
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.227539183449751*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 - _cse122*_cse95 - 0.0309919044627574*_cse123 - 0.0181297165934418*_cse124 - 0.0309919044627574*_cse125 - 0.0181297165934418*_cse126 - _cse127*_cse44 + 0.0050298*_cse127*_cse46 - _cse127*_cse48 + _cse127*_cse49 + 0.01718495619792*_cse128*_cse45 + 0.0050298*_cse128*_cse52 - _cse128*_cse54 + _cse128*_cse56 + 0.0439876856535455*_cse19*_cse98 + _cse37*_cse95 + _cse39*_cse98 - 0.227539183449751*_cse80
+    out[1, 1] = _cse0*_cse57 - _cse122*_cse132 + _cse132*_cse37 + _cse134*_cse142 + _cse134*_cse39 - 0.0181297165934418*_cse135 - 0.0309919044627574*_cse136 - 0.0309919044627574*_cse137 - 0.0181297165934418*_cse138 - _cse139*_cse54 + _cse139*_cse56 + _cse139*_cse92 + _cse139*_cse94 - _cse141*_cse44 - _cse141*_cse48 + _cse141*_cse49 + _cse141*_cse93 + _cse144 - _cse15*_cse9 - 1.098e-6*_cse40 - 0.20503*_cse9
+    out[1, 2] = -_cse122*_cse131 + _cse131*_cse37 + 0.0439876856535455*_cse133*_cse19 + _cse133*_cse39 - _cse14*_cse9 - _cse144 - 0.0309919044627574*_cse145 - 0.0181297165934418*_cse146 - 0.0181297165934418*_cse147 - 0.0309919044627574*_cse148 + 0.01718495619792*_cse149*_cse45 + 0.0050298*_cse149*_cse52 - _cse149*_cse54 + _cse149*_cse56 - _cse150*_cse44 + 0.0050298*_cse150*_cse46 - _cse150*_cse48 + _cse150*_cse49
+    out[1, 3] = -_cse122*_cse22 - _cse142*_cse26 - 0.0181297165934418*_cse151 - 0.0181297165934418*_cse152 - 0.0309919044627574*_cse153 - 0.0309919044627574*_cse154 - _cse155*_cse44 + 0.0050298*_cse155*_cse46 - _cse155*_cse48 + _cse155*_cse49 + 0.01718495619792*_cse156*_cse45 + 0.0050298*_cse156*_cse52 - _cse156*_cse54 + _cse156*_cse56 + _cse22*_cse37 + _cse26*_cse38
+    out[1, 4] = -_cse115*_cse42 + 0.0050298*_cse116*_cse42 + _cse42*_cse55 - _cse42*_cse92 - _cse44*_cse51 + 0.0050298*_cse46*_cse51 - _cse48*_cse51 + _cse49*_cse51
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse122*_cse160 + _cse142*_cse162 + _cse16 + _cse160*_cse37 + _cse162*_cse39 - 0.0181297165934418*_cse163 - 0.0309919044627574*_cse164 - 0.0309919044627574*_cse165 - 0.0181297165934418*_cse166 - _cse167*_cse54 + _cse167*_cse56 + _cse167*_cse92 + _cse167*_cse94 - _cse169*_cse44 - _cse169*_cse48 + _cse169*_cse49 + _cse169*_cse93 + _cse170 + 0.41405*_cse2 + 0.001950802*_cse4
+    out[2, 2] = -_cse122*_cse159 + _cse14*_cse2 + _cse159*_cse37 + 0.0439876856535455*_cse161*_cse19 + _cse161*_cse39 - _cse170 - 0.0309919044627574*_cse171 - 0.0181297165934418*_cse172 - 0.0181297165934418*_cse173 - 0.0309919044627574*_cse174 + 0.01718495619792*_cse175*_cse45 + 0.0050298*_cse175*_cse52 - _cse175*_cse54 + _cse175*_cse56 - _cse176*_cse44 + 0.0050298*_cse176*_cse46 - _cse176*_cse48 + _cse176*_cse49
+    out[2, 3] = -_cse122*_cse178 - _cse142*_cse177 + _cse177*_cse38 + _cse178*_cse37 - 0.0181297165934418*_cse179 - 0.0309919044627574*_cse180 - 0.0181297165934418*_cse181 - 0.0309919044627574*_cse182 - _cse183*_cse44 + 0.0050298*_cse183*_cse46 - _cse183*_cse48 + _cse183*_cse49 + 0.01718495619792*_cse184*_cse45 + 0.0050298*_cse184*_cse52 - _cse184*_cse54 + _cse184*_cse56
+    out[2, 4] = -_cse115*_cse187 + 0.0050298*_cse116*_cse187 + _cse187*_cse55 - _cse187*_cse92 - _cse190*_cse44 + 0.0050298*_cse190*_cse46 - _cse190*_cse48 + _cse190*_cse49
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse77 - _cse80
+    out[3, 4] = 0.3960285*_cse110 + 0.239041914*_cse111 + 0.3960285*_cse112 + 0.239041914*_cse113 + 0.408002994597976*_cse191 - 0.408002994597976*_cse192 + 0.574238819026787*_cse77 - 0.574238819026787*_cse80
+    out[3, 5] = 0.227149603970304*_cse110 + 0.137106991283212*_cse111 + 0.227149603970304*_cse112 + 0.137106991283212*_cse113 + _cse114*_cse193 - _cse114*_cse194 + _cse114*_cse195 - _cse121*_cse196 - _cse121*_cse197 + _cse121*_cse198 + 0.234017800844203*_cse191 - 0.234017800844203*_cse192 + 0.329365488408814*_cse77 - 0.329365488408814*_cse80
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse41
+    out[4, 4] = 0.574238819026787*_cse10 + 0.408002994597976*_cse27 + 0.3960285*_cse30 + 0.239041914*_cse32 + 0.3960285*_cse34 + 0.239041914*_cse36 - 0.574238819026787*_cse41 - 0.408002994597976*_cse50
+    out[4, 5] = 0.329365488408814*_cse10 + _cse193*_cse42 - _cse194*_cse42 + _cse195*_cse42 - _cse196*_cse51 - _cse197*_cse51 + _cse198*_cse51 + 0.234017800844203*_cse27 + 0.227149603970304*_cse30 + 0.137106991283212*_cse32 + 0.227149603970304*_cse34 + 0.137106991283212*_cse36 - 0.329365488408814*_cse41 - 0.234017800844203*_cse50
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + 0.239041914*_cse185 + 0.239041914*_cse186 + 0.3960285*_cse188 + 0.3960285*_cse189 + 0.408002994597976*_cse199 - 0.408002994597976*_cse200 - 0.574238819026787*_cse6
+    out[5, 5] = -0.329365488408814*_cse11 + 0.137106991283212*_cse185 + 0.137106991283212*_cse186 + _cse187*_cse193 - _cse187*_cse194 + _cse187*_cse195 + 0.227149603970304*_cse188 + 0.227149603970304*_cse189 - _cse190*_cse196 - _cse190*_cse197 + _cse190*_cse198 + 0.234017800844203*_cse199 - 0.234017800844203*_cse200 - 0.329365488408814*_cse6
+    return out
+
+
+# joint5[0,0,0]_dJ
+def function20(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = 6.57617443000635e-7*_cse0
+    _cse2 = math.sin(q0)
+    _cse3 = 0.999999998572139*_cse2
+    _cse4 = math.sin(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse4*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = math.cos(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = _cse3*_cse6 + _cse3*_cse9
+    _cse11 = -_cse1 + _cse10
+    _cse12 = math.sin(q3)
+    _cse13 = math.cos(q3)
+    _cse14 = 0.75940555*_cse12 - 0.51802699*_cse13
+    _cse15 = _cse11*_cse14
+    _cse16 = 0.999999998572139*_cse0
+    _cse17 = 6.57617443000635e-7*_cse2
+    _cse18 = _cse17*_cse6 + _cse17*_cse9
+    _cse19 = _cse16 + _cse18
+    _cse20 = 0.51802699*_cse12 + 0.75940555*_cse13
+    _cse21 = -_cse20
+    _cse22 = _cse19*_cse21
+    _cse23 = 0.45991232*_cse12 + 0.85536427*_cse13
+    _cse24 = _cse11*_cse23
+    _cse25 = 0.85536427*_cse12 - 0.45991232*_cse13
+    _cse26 = _cse19*_cse25
+    _cse27 = _cse5*_cse7
+    _cse28 = 0.000346321299837637*_cse27
+    _cse29 = _cse2*_cse28
+    _cse30 = _cse4*_cse8
+    _cse31 = 0.000346321299837637*_cse30
+    _cse32 = _cse2*_cse31
+    _cse33 = _cse29 - _cse32
+    _cse34 = 0.517383113*_cse15 + 0.517383113*_cse22 - 0.855753802*_cse24 - 0.855753802*_cse26 + _cse33
+    _cse35 = math.cos(q4)
+    _cse36 = 0.01718495619792*_cse35
+    _cse37 = math.sin(q4)
+    _cse38 = -0.40329059*_cse35 + 0.89059413*_cse37
+    _cse39 = -_cse38
+    _cse40 = 0.0019534*_cse39
+    _cse41 = 0.78972966*_cse35 + 0.45479896*_cse37
+    _cse42 = -_cse41
+    _cse43 = -0.012272*_cse35 + 0.00052974*_cse37
+    _cse44 = 0.212878838804554*_cse13
+    _cse45 = _cse19*_cse44
+    _cse46 = 0.212878838804554*_cse12
+    _cse47 = _cse11*_cse46
+    _cse48 = 0.818687841791724*_cse30
+    _cse49 = _cse2*_cse48
+    _cse50 = 0.818687841791724*_cse27
+    _cse51 = _cse2*_cse50
+    _cse52 = _cse49 - _cse51
+    _cse53 = 0.758601438*_cse15 + 0.758601438*_cse22 + 0.458851168*_cse24 + 0.458851168*_cse26 + _cse45 - _cse47 + _cse52
+    _cse54 = 0.01718495619792*_cse37
+    _cse55 = -0.45479896*_cse35 + 0.78972966*_cse37
+    _cse56 = -_cse55
+    _cse57 = 0.89059413*_cse35 + 0.40329059*_cse37
+    _cse58 = 0.0019534*_cse57
+    _cse59 = 0.00052974*_cse35 + 0.012272*_cse37
+    _cse60 = -_cse59
+    _cse61 = -_cse34*_cse36 - _cse34*_cse40 + 0.0050298*_cse34*_cse42 + _cse34*_cse43 - _cse53*_cse54 + 0.0050298*_cse53*_cse56 - _cse53*_cse58 + _cse53*_cse60
+    _cse62 = _cse12*_cse19
+    _cse63 = _cse11*_cse13
+    _cse64 = -_cse25
+    _cse65 = _cse11*_cse64
+    _cse66 = _cse19*_cse23
+    _cse67 = _cse11*_cse20
+    _cse68 = _cse14*_cse19
+    _cse69 = 0.012581*_cse12 + 0.00040053*_cse13
+    _cse70 = -_cse69
+    _cse71 = 0.00040053*_cse12 - 0.012581*_cse13
+    _cse72 = 0.517383113*_cse11*_cse20 + 0.517383113*_cse14*_cse19 - 0.855753802*_cse65 - 0.855753802*_cse66
+    _cse73 = -0.212878838804554*_cse62 - 0.212878838804554*_cse63 + 0.458851168*_cse65 + 0.458851168*_cse66 + 0.758601438*_cse67 + 0.758601438*_cse68
+    _cse74 = 0.0019534*_cse38
+    _cse75 = -_cse43
+    _cse76 = _cse11*_cse71 + _cse19*_cse70 + 0.01718495619792*_cse35*_cse73 + 0.0050298*_cse41*_cse73 - _cse54*_cse72 + 0.0050298*_cse56*_cse72 - _cse58*_cse72 + _cse60*_cse72 - 0.0439876856535455*_cse62 - 0.0439876856535455*_cse63 - 0.0181297165934418*_cse65 - 0.0181297165934418*_cse66 - 0.0309919044627574*_cse67 - 0.0309919044627574*_cse68 - _cse73*_cse74 + _cse73*_cse75
+    _cse77 = _cse2*_cse4
+    _cse78 = _cse5*_cse77
+    _cse79 = 0.818687841791724*_cse78
+    _cse80 = _cse2*_cse7
+    _cse81 = _cse8*_cse80
+    _cse82 = 0.818687841791724*_cse81
+    _cse83 = _cse17*_cse30 - 6.57617443000635e-7*_cse2*_cse5*_cse7
+    _cse84 = _cse13*_cse83
+    _cse85 = -0.999999998572139*_cse2*_cse5*_cse7 + _cse3*_cse30
+    _cse86 = _cse12*_cse85
+    _cse87 = _cse21*_cse83
+    _cse88 = _cse25*_cse83
+    _cse89 = _cse23*_cse85
+    _cse90 = _cse14*_cse85
+    _cse91 = -_cse79 - _cse82 + 0.212878838804554*_cse84 - 0.212878838804554*_cse86 + 0.758601438*_cse87 + 0.458851168*_cse88 + 0.458851168*_cse89 + 0.758601438*_cse90
+    _cse92 = -_cse71
+    _cse93 = 0.000346321299837637*_cse78 + 0.000346321299837637*_cse81
+    _cse94 = 0.517383113*_cse87 - 0.855753802*_cse88 - 0.855753802*_cse89 + 0.517383113*_cse90 + _cse93
+    _cse95 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse96 = _cse7*_cse95
+    _cse97 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse98 = _cse4*_cse97
+    _cse99 = 0.0038906673398998*_cse30
+    _cse100 = 0.0038906673398998*_cse27
+    _cse101 = -_cse100*_cse2 + _cse2*_cse98 + _cse2*_cse99 + 0.227539183449751*_cse78 + 0.227539183449751*_cse81
+    _cse102 = -_cse101 + 0.0439876856535455*_cse13*_cse83 - _cse2*_cse96 + 0.01718495619792*_cse35*_cse91 + 0.0050298*_cse41*_cse91 - _cse54*_cse94 + 0.0050298*_cse56*_cse94 - _cse58*_cse94 + _cse60*_cse94 + _cse70*_cse85 - _cse74*_cse91 + _cse75*_cse91 + _cse83*_cse92 - 0.0439876856535455*_cse86 - 0.0309919044627574*_cse87 - 0.0181297165934418*_cse88 - 0.0181297165934418*_cse89 - 0.0309919044627574*_cse90
+    _cse103 = 0.0019519*_cse4 - 0.20902*_cse7
+    _cse104 = -_cse85
+    _cse105 = _cse104*_cse12
+    _cse106 = -_cse83
+    _cse107 = _cse106*_cse13
+    _cse108 = _cse104*_cse23
+    _cse109 = _cse104*_cse14
+    _cse110 = _cse106*_cse21
+    _cse111 = _cse106*_cse25
+    _cse112 = -0.212878838804554*_cse105 + 0.212878838804554*_cse107 + 0.458851168*_cse108 + 0.758601438*_cse109 + 0.758601438*_cse110 + 0.458851168*_cse111 + _cse79 + _cse82
+    _cse113 = 0.517383113*_cse104*_cse14 + 0.517383113*_cse106*_cse21 - 0.855753802*_cse108 - 0.855753802*_cse111 - _cse93
+    _cse114 = 0.0050298*_cse56
+    _cse115 = 0.0050298*_cse41
+    _cse116 = -_cse95
+    _cse117 = _cse116*_cse7
+    _cse118 = _cse101 + _cse103*_cse2 + _cse104*_cse70 - 0.0439876856535455*_cse105 + _cse106*_cse92 + 0.0439876856535455*_cse107 - 0.0181297165934418*_cse108 - 0.0309919044627574*_cse109 - 0.0309919044627574*_cse110 - 0.0181297165934418*_cse111 + _cse112*_cse115 + _cse112*_cse36 - _cse112*_cse74 + _cse112*_cse75 + _cse113*_cse114 - _cse113*_cse54 - _cse113*_cse58 + _cse113*_cse60 - _cse117*_cse2 - 1.098e-6*_cse77 - 0.20503*_cse80
+    _cse119 = _cse16*_cse6 + _cse16*_cse9
+    _cse120 = _cse119 + _cse17
+    _cse121 = _cse120*_cse14
+    _cse122 = _cse1*_cse6 + _cse1*_cse9
+    _cse123 = _cse122 - _cse3
+    _cse124 = _cse123*_cse21
+    _cse125 = _cse123*_cse13
+    _cse126 = _cse120*_cse23
+    _cse127 = _cse123*_cse25
+    _cse128 = _cse12*_cse120
+    _cse129 = _cse0*_cse48
+    _cse130 = _cse0*_cse50
+    _cse131 = _cse129 - _cse130
+    _cse132 = 0.758601438*_cse121 + 0.758601438*_cse124 + 0.212878838804554*_cse125 + 0.458851168*_cse126 + 0.458851168*_cse127 - 0.212878838804554*_cse128 + _cse131
+    _cse133 = 0.20902*_cse4 + 0.0019519*_cse7
+    _cse134 = -_cse133
+    _cse135 = _cse0*_cse28
+    _cse136 = _cse0*_cse31
+    _cse137 = _cse135 - _cse136
+    _cse138 = 0.517383113*_cse121 + 0.517383113*_cse124 - 0.855753802*_cse126 - 0.855753802*_cse127 + _cse137
+    _cse139 = _cse0*_cse7
+    _cse140 = _cse139*_cse97
+    _cse141 = _cse139*_cse8
+    _cse142 = 0.0038906673398998*_cse141
+    _cse143 = _cse0*_cse4
+    _cse144 = _cse143*_cse5
+    _cse145 = 0.0038906673398998*_cse144
+    _cse146 = _cse0*_cse27
+    _cse147 = 0.227539183449751*_cse146
+    _cse148 = _cse0*_cse30
+    _cse149 = -0.227539183449751*_cse148
+    _cse150 = -1.098e-6*_cse0*_cse7 + _cse116*_cse143 + _cse140 + _cse142 + 0.20503*_cse143 + _cse145 + _cse147 + _cse149
+    _cse151 = -_cse16*_cse27 + _cse16*_cse30
+    _cse152 = _cse14*_cse151
+    _cse153 = -_cse1*_cse27 + _cse1*_cse30
+    _cse154 = _cse153*_cse21
+    _cse155 = _cse151*_cse23
+    _cse156 = _cse153*_cse25
+    _cse157 = 0.000346321299837637*_cse141 + 0.000346321299837637*_cse144
+    _cse158 = 0.517383113*_cse152 + 0.517383113*_cse154 - 0.855753802*_cse155 - 0.855753802*_cse156 + _cse157
+    _cse159 = 0.818687841791724*_cse144
+    _cse160 = 0.818687841791724*_cse141
+    _cse161 = -_cse151*_cse46 + 0.758601438*_cse152 + _cse153*_cse44 + 0.758601438*_cse154 + 0.458851168*_cse155 + 0.458851168*_cse156 - _cse159 - _cse160
+    _cse162 = -_cse158*_cse36 - _cse158*_cse40 + 0.0050298*_cse158*_cse42 + _cse158*_cse43 - _cse161*_cse54 + 0.0050298*_cse161*_cse56 - _cse161*_cse58 + _cse161*_cse60
+    _cse163 = 0.0439876856535455*_cse12
+    _cse164 = 0.0439876856535455*_cse13
+    _cse165 = _cse153*_cse23
+    _cse166 = _cse14*_cse153
+    _cse167 = _cse151*_cse64
+    _cse168 = _cse151*_cse20
+    _cse169 = 0.517383113*_cse14*_cse153 + 0.517383113*_cse151*_cse20 - 0.855753802*_cse165 - 0.855753802*_cse167
+    _cse170 = -_cse151*_cse44 - _cse153*_cse46 + 0.458851168*_cse165 + 0.758601438*_cse166 + 0.458851168*_cse167 + 0.758601438*_cse168
+    _cse171 = -_cse151*_cse164 + _cse151*_cse71 - _cse153*_cse163 + _cse153*_cse70 - 0.0181297165934418*_cse165 - 0.0309919044627574*_cse166 - 0.0181297165934418*_cse167 - 0.0309919044627574*_cse168 - _cse169*_cse54 + 0.0050298*_cse169*_cse56 - _cse169*_cse58 + _cse169*_cse60 + 0.01718495619792*_cse170*_cse35 + 0.0050298*_cse170*_cse41 - _cse170*_cse74 + _cse170*_cse75
+    _cse172 = -_cse119
+    _cse173 = _cse14*_cse172
+    _cse174 = -_cse122
+    _cse175 = _cse174*_cse21
+    _cse176 = _cse172*_cse23
+    _cse177 = _cse174*_cse25
+    _cse178 = -_cse129 + _cse130
+    _cse179 = -_cse172*_cse46 + 0.758601438*_cse173 + _cse174*_cse44 + 0.758601438*_cse175 + 0.458851168*_cse176 + 0.458851168*_cse177 + _cse178
+    _cse180 = -_cse137 + 0.517383113*_cse14*_cse172 + 0.517383113*_cse174*_cse21 - 0.855753802*_cse176 - 0.855753802*_cse177
+    _cse181 = _cse142 - _cse143*_cse95 + _cse145 + _cse147 + _cse149
+    _cse182 = _cse114*_cse180 + _cse115*_cse179 + _cse140 - _cse163*_cse172 + _cse164*_cse174 + _cse172*_cse70 - 0.0309919044627574*_cse173 + _cse174*_cse92 - 0.0309919044627574*_cse175 - 0.0181297165934418*_cse176 - 0.0181297165934418*_cse177 + _cse179*_cse36 - _cse179*_cse74 + _cse179*_cse75 - _cse180*_cse54 - _cse180*_cse58 + _cse180*_cse60 + _cse181
+    _cse183 = _cse119*_cse14
+    _cse184 = _cse122*_cse21
+    _cse185 = _cse119*_cse23
+    _cse186 = _cse122*_cse25
+    _cse187 = -_cse119*_cse46 + _cse122*_cse44 + _cse131 + 0.758601438*_cse183 + 0.758601438*_cse184 + 0.458851168*_cse185 + 0.458851168*_cse186
+    _cse188 = _cse137 + 0.517383113*_cse183 + 0.517383113*_cse184 - 0.855753802*_cse185 - 0.855753802*_cse186
+    _cse189 = _cse119*_cse163 - _cse119*_cse70 - 0.0439876856535455*_cse122*_cse13 - _cse122*_cse92 + 0.0309919044627574*_cse183 + 0.0309919044627574*_cse184 + 0.0181297165934418*_cse185 + 0.0181297165934418*_cse186 - 0.01718495619792*_cse187*_cse35 - 0.0050298*_cse187*_cse41 + _cse187*_cse74 - _cse187*_cse75 + _cse188*_cse54 - 0.0050298*_cse188*_cse56 + _cse188*_cse58 - _cse188*_cse60
+    _cse190 = -_cse151
+    _cse191 = _cse190*_cse23
+    _cse192 = -_cse153
+    _cse193 = _cse192*_cse25
+    _cse194 = 0.517383113*_cse14*_cse190 - _cse157 - 0.855753802*_cse191 + 0.517383113*_cse192*_cse21 - 0.855753802*_cse193
+    _cse195 = _cse14*_cse190
+    _cse196 = _cse192*_cse21
+    _cse197 = _cse159 + _cse160 - _cse190*_cse46 + 0.458851168*_cse191 + _cse192*_cse44 + 0.458851168*_cse193 + 0.758601438*_cse195 + 0.758601438*_cse196
+    _cse198 = -_cse194*_cse36 - _cse194*_cse40 + 0.0050298*_cse194*_cse42 + _cse194*_cse43 - _cse197*_cse54 + 0.0050298*_cse197*_cse56 - _cse197*_cse58 + _cse197*_cse60
+    _cse199 = _cse190*_cse64
+    _cse200 = _cse190*_cse20
+    _cse201 = _cse192*_cse23
+    _cse202 = _cse14*_cse192
+    _cse203 = 0.517383113*_cse14*_cse192 + 0.517383113*_cse190*_cse20 - 0.855753802*_cse199 - 0.855753802*_cse201
+    _cse204 = -_cse190*_cse44 - _cse192*_cse46 + 0.458851168*_cse199 + 0.758601438*_cse200 + 0.458851168*_cse201 + 0.758601438*_cse202
+    _cse205 = -_cse163*_cse192 - _cse164*_cse190 + _cse190*_cse71 + _cse192*_cse70 - 0.0181297165934418*_cse199 - 0.0309919044627574*_cse200 - 0.0181297165934418*_cse201 - 0.0309919044627574*_cse202 - _cse203*_cse54 + 0.0050298*_cse203*_cse56 - _cse203*_cse58 + _cse203*_cse60 + 0.01718495619792*_cse204*_cse35 + 0.0050298*_cse204*_cse41 - _cse204*_cse74 + _cse204*_cse75
+    _cse206 = -_cse97
+    _cse207 = -_cse120
+    _cse208 = _cse207*_cse64
+    _cse209 = -_cse123
+    _cse210 = _cse209*_cse23
+    _cse211 = 0.517383113*_cse14*_cse209 + 0.517383113*_cse20*_cse207 - 0.855753802*_cse208 - 0.855753802*_cse210
+    _cse212 = _cse20*_cse207
+    _cse213 = _cse14*_cse209
+    _cse214 = -_cse207*_cse44 + 0.458851168*_cse208 - _cse209*_cse46 + 0.458851168*_cse210 + 0.758601438*_cse212 + 0.758601438*_cse213
+    _cse215 = -_cse211*_cse36 - _cse211*_cse40 + 0.0050298*_cse211*_cse42 + _cse211*_cse43 - _cse214*_cse54 + 0.0050298*_cse214*_cse56 - _cse214*_cse58 + _cse214*_cse60
+    _cse216 = _cse209*_cse64
+    _cse217 = -_cse14
+    _cse218 = _cse207*_cse217
+    _cse219 = -_cse23
+    _cse220 = _cse207*_cse219
+    _cse221 = _cse20*_cse209
+    _cse222 = 0.517383113*_cse20*_cse209 + 0.517383113*_cse207*_cse217 - 0.855753802*_cse216 - 0.855753802*_cse220
+    _cse223 = _cse207*_cse46
+    _cse224 = _cse209*_cse44
+    _cse225 = 0.458851168*_cse216 + 0.758601438*_cse218 + 0.458851168*_cse220 + 0.758601438*_cse221 + _cse223 - _cse224
+    _cse226 = _cse209*_cse21
+    _cse227 = _cse207*_cse23
+    _cse228 = _cse14*_cse207
+    _cse229 = _cse209*_cse25
+    _cse230 = -_cse135 + _cse136 + 0.517383113*_cse226 - 0.855753802*_cse227 + 0.517383113*_cse228 - 0.855753802*_cse229
+    _cse231 = -0.0019534*_cse57
+    _cse232 = 0.0050298*_cse55
+    _cse233 = _cse178 - _cse223 + _cse224 + 0.758601438*_cse226 + 0.458851168*_cse227 + 0.758601438*_cse228 + 0.458851168*_cse229
+    _cse234 = 0.0050298*_cse42
+    _cse235 = -_cse132*_cse54 + 0.0050298*_cse132*_cse56 - _cse132*_cse58 + _cse132*_cse60 - _cse138*_cse36 - _cse138*_cse40 + 0.0050298*_cse138*_cse42 + _cse138*_cse43
+    _cse236 = _cse120*_cse64
+    _cse237 = _cse123*_cse23
+    _cse238 = _cse120*_cse20
+    _cse239 = _cse123*_cse14
+    _cse240 = 0.517383113*_cse120*_cse20 + 0.517383113*_cse123*_cse14 - 0.855753802*_cse236 - 0.855753802*_cse237
+    _cse241 = -_cse120*_cse44 - _cse123*_cse46 + 0.458851168*_cse236 + 0.458851168*_cse237 + 0.758601438*_cse238 + 0.758601438*_cse239
+    _cse242 = -_cse120*_cse164 + _cse120*_cse71 - _cse123*_cse163 + _cse123*_cse70 - 0.0181297165934418*_cse236 - 0.0181297165934418*_cse237 - 0.0309919044627574*_cse238 - 0.0309919044627574*_cse239 - _cse240*_cse54 + 0.0050298*_cse240*_cse56 - _cse240*_cse58 + _cse240*_cse60 + 0.01718495619792*_cse241*_cse35 + 0.0050298*_cse241*_cse41 - _cse241*_cse74 + _cse241*_cse75
+    _cse243 = -_cse0*_cse100 + _cse0*_cse98 + _cse0*_cse99 + 0.227539183449751*_cse141 + 0.227539183449751*_cse144
+    _cse244 = -_cse0*_cse96 + 0.0439876856535455*_cse13*_cse153 - _cse151*_cse163 + _cse151*_cse70 - 0.0309919044627574*_cse152 + _cse153*_cse92 - 0.0309919044627574*_cse154 - 0.0181297165934418*_cse155 - 0.0181297165934418*_cse156 - _cse158*_cse54 + 0.0050298*_cse158*_cse56 - _cse158*_cse58 + _cse158*_cse60 + 0.01718495619792*_cse161*_cse35 + 0.0050298*_cse161*_cse41 - _cse161*_cse74 + _cse161*_cse75 - _cse243
+    _cse245 = _cse0*_cse103 - _cse0*_cse117 + _cse114*_cse194 + _cse115*_cse197 - 0.20503*_cse139 - 1.098e-6*_cse143 - _cse163*_cse190 + _cse164*_cse192 + _cse190*_cse70 - 0.0181297165934418*_cse191 + _cse192*_cse92 - 0.0181297165934418*_cse193 - _cse194*_cse54 - _cse194*_cse58 + _cse194*_cse60 - 0.0309919044627574*_cse195 - 0.0309919044627574*_cse196 + _cse197*_cse36 - _cse197*_cse74 + _cse197*_cse75 + _cse243
+    _cse246 = -_cse11
+    _cse247 = _cse14*_cse246
+    _cse248 = -_cse19
+    _cse249 = _cse21*_cse248
+    _cse250 = _cse23*_cse246
+    _cse251 = _cse248*_cse25
+    _cse252 = -_cse49 + _cse51
+    _cse253 = -_cse246*_cse46 + 0.758601438*_cse247 + _cse248*_cse44 + 0.758601438*_cse249 + 0.458851168*_cse250 + 0.458851168*_cse251 + _cse252
+    _cse254 = 0.517383113*_cse247 + 0.517383113*_cse249 - 0.855753802*_cse250 - 0.855753802*_cse251 - _cse29 + _cse32
+    _cse255 = _cse80*_cse97
+    _cse256 = 0.0038906673398998*_cse81
+    _cse257 = 0.0038906673398998*_cse78
+    _cse258 = _cse2*_cse27
+    _cse259 = 0.227539183449751*_cse258
+    _cse260 = _cse2*_cse30
+    _cse261 = -0.227539183449751*_cse260
+    _cse262 = _cse116*_cse77 + _cse255 + _cse256 + _cse257 + _cse259 + _cse261 + 0.20503*_cse77 - 1.098e-6*_cse80
+    _cse263 = -_cse112*_cse54 + 0.0050298*_cse112*_cse56 - _cse112*_cse58 + _cse112*_cse60 - _cse113*_cse36 - _cse113*_cse40 + 0.0050298*_cse113*_cse42 + _cse113*_cse43
+    _cse264 = _cse104*_cse64
+    _cse265 = _cse104*_cse20
+    _cse266 = _cse106*_cse23
+    _cse267 = _cse106*_cse14
+    _cse268 = 0.517383113*_cse104*_cse20 + 0.517383113*_cse106*_cse14 - 0.855753802*_cse264 - 0.855753802*_cse266
+    _cse269 = -_cse104*_cse44 - _cse106*_cse46 + 0.458851168*_cse264 + 0.758601438*_cse265 + 0.458851168*_cse266 + 0.758601438*_cse267
+    _cse270 = -_cse104*_cse164 + _cse104*_cse71 - _cse106*_cse163 + _cse106*_cse70 - 0.0181297165934418*_cse264 - 0.0309919044627574*_cse265 - 0.0181297165934418*_cse266 - 0.0309919044627574*_cse267 - _cse268*_cse54 + 0.0050298*_cse268*_cse56 - _cse268*_cse58 + _cse268*_cse60 + 0.01718495619792*_cse269*_cse35 + 0.0050298*_cse269*_cse41 - _cse269*_cse74 + _cse269*_cse75
+    _cse271 = _cse10*_cse14
+    _cse272 = _cse18*_cse21
+    _cse273 = _cse10*_cse23
+    _cse274 = _cse18*_cse25
+    _cse275 = -_cse10*_cse46 + _cse18*_cse44 + 0.758601438*_cse271 + 0.758601438*_cse272 + 0.458851168*_cse273 + 0.458851168*_cse274 + _cse52
+    _cse276 = 0.517383113*_cse271 + 0.517383113*_cse272 - 0.855753802*_cse273 - 0.855753802*_cse274 + _cse33
+    _cse277 = _cse256 + _cse257 + _cse259 + _cse261 - _cse77*_cse95
+    _cse278 = -_cse10*_cse163 + _cse10*_cse70 + 0.0439876856535455*_cse13*_cse18 + _cse18*_cse92 - _cse255 - 0.0309919044627574*_cse271 - 0.0309919044627574*_cse272 - 0.0181297165934418*_cse273 - 0.0181297165934418*_cse274 + 0.01718495619792*_cse275*_cse35 + 0.0050298*_cse275*_cse41 - _cse275*_cse74 + _cse275*_cse75 - _cse276*_cse54 + 0.0050298*_cse276*_cse56 - _cse276*_cse58 + _cse276*_cse60 - _cse277
+    _cse279 = -_cse10
+    _cse280 = _cse14*_cse279
+    _cse281 = -_cse18
+    _cse282 = _cse21*_cse281
+    _cse283 = _cse23*_cse279
+    _cse284 = _cse25*_cse281
+    _cse285 = _cse252 - _cse279*_cse46 + 0.758601438*_cse280 + _cse281*_cse44 + 0.758601438*_cse282 + 0.458851168*_cse283 + 0.458851168*_cse284
+    _cse286 = 0.517383113*_cse14*_cse279 + 0.517383113*_cse21*_cse281 - 0.855753802*_cse283 - 0.855753802*_cse284 - _cse33
+    _cse287 = _cse114*_cse286 + _cse115*_cse285 - _cse163*_cse279 + _cse164*_cse281 + _cse279*_cse70 - 0.0309919044627574*_cse280 + _cse281*_cse92 - 0.0309919044627574*_cse282 - 0.0181297165934418*_cse283 - 0.0181297165934418*_cse284 + _cse285*_cse36 - _cse285*_cse74 + _cse285*_cse75 - _cse286*_cse54 - _cse286*_cse58 + _cse286*_cse60
+    _cse288 = -_cse36*_cse94 - _cse40*_cse94 + 0.0050298*_cse42*_cse94 + _cse43*_cse94 - _cse54*_cse91 + 0.0050298*_cse56*_cse91 - _cse58*_cse91 + _cse60*_cse91
+    _cse289 = _cse23*_cse83
+    _cse290 = _cse14*_cse83
+    _cse291 = _cse64*_cse85
+    _cse292 = _cse20*_cse85
+    _cse293 = 0.517383113*_cse14*_cse83 + 0.517383113*_cse20*_cse85 - 0.855753802*_cse289 - 0.855753802*_cse291
+    _cse294 = 0.458851168*_cse289 + 0.758601438*_cse290 + 0.458851168*_cse291 + 0.758601438*_cse292 - _cse44*_cse85 - _cse46*_cse83
+    _cse295 = -_cse163*_cse83 - _cse164*_cse85 - 0.0181297165934418*_cse289 - 0.0309919044627574*_cse290 - 0.0181297165934418*_cse291 - 0.0309919044627574*_cse292 - _cse293*_cse54 + 0.0050298*_cse293*_cse56 - _cse293*_cse58 + _cse293*_cse60 + 0.01718495619792*_cse294*_cse35 + 0.0050298*_cse294*_cse41 - _cse294*_cse74 + _cse294*_cse75 + _cse70*_cse83 + _cse71*_cse85
+    _cse296 = -_cse36*_cse72 - _cse40*_cse72 + 0.0050298*_cse42*_cse72 + _cse43*_cse72 - _cse54*_cse73 + 0.0050298*_cse56*_cse73 - _cse58*_cse73 + _cse60*_cse73
+    _cse297 = _cse19*_cse64
+    _cse298 = _cse11*_cse217
+    _cse299 = _cse11*_cse219
+    _cse300 = _cse19*_cse20
+    _cse301 = 0.517383113*_cse11*_cse217 + 0.517383113*_cse19*_cse20 - 0.855753802*_cse297 - 0.855753802*_cse299
+    _cse302 = 0.458851168*_cse297 + 0.758601438*_cse298 + 0.458851168*_cse299 + 0.758601438*_cse300 - _cse45 + _cse47
+    _cse303 = 0.999999998572139*_cse6 + 0.999999998572139*_cse9
+    _cse304 = -_cse303
+    _cse305 = _cse23*_cse304
+    _cse306 = 6.57617443000635e-7*_cse6 + 6.57617443000635e-7*_cse9
+    _cse307 = -_cse306
+    _cse308 = _cse25*_cse307
+    _cse309 = _cse28 - _cse31
+    _cse310 = 0.517383113*_cse14*_cse304 + 0.517383113*_cse21*_cse307 - 0.855753802*_cse305 - 0.855753802*_cse308 - _cse309
+    _cse311 = _cse14*_cse304
+    _cse312 = _cse21*_cse307
+    _cse313 = -_cse304*_cse46 + 0.458851168*_cse305 + _cse307*_cse44 + 0.458851168*_cse308 + 0.758601438*_cse311 + 0.758601438*_cse312 - _cse48 + _cse50
+    _cse314 = -_cse310*_cse36 - _cse310*_cse40 + 0.0050298*_cse310*_cse42 + _cse310*_cse43 - _cse313*_cse54 + 0.0050298*_cse313*_cse56 - _cse313*_cse58 + _cse313*_cse60
+    _cse315 = _cse304*_cse64
+    _cse316 = _cse20*_cse304
+    _cse317 = _cse23*_cse307
+    _cse318 = _cse14*_cse307
+    _cse319 = 0.517383113*_cse14*_cse307 + 0.517383113*_cse20*_cse304 - 0.855753802*_cse315 - 0.855753802*_cse317
+    _cse320 = -_cse304*_cse44 - _cse307*_cse46 + 0.458851168*_cse315 + 0.758601438*_cse316 + 0.458851168*_cse317 + 0.758601438*_cse318
+    _cse321 = -_cse163*_cse307 - _cse164*_cse304 + _cse304*_cse71 + _cse307*_cse70 - 0.0181297165934418*_cse315 - 0.0309919044627574*_cse316 - 0.0181297165934418*_cse317 - 0.0309919044627574*_cse318 - _cse319*_cse54 + 0.0050298*_cse319*_cse56 - _cse319*_cse58 + _cse319*_cse60 + 0.01718495619792*_cse320*_cse35 + 0.0050298*_cse320*_cse41 - _cse320*_cse74 + _cse320*_cse75
+    _cse322 = 0.818687841791724*_cse6
+    _cse323 = 0.818687841791724*_cse9
+    _cse324 = -0.999999998572139*_cse27 + 0.999999998572139*_cse30
+    _cse325 = -_cse324
+    _cse326 = _cse325*_cse46
+    _cse327 = -6.57617443000635e-7*_cse27 + 6.57617443000635e-7*_cse30
+    _cse328 = -_cse327
+    _cse329 = _cse328*_cse44
+    _cse330 = _cse23*_cse325
+    _cse331 = _cse14*_cse325
+    _cse332 = _cse21*_cse328
+    _cse333 = _cse25*_cse328
+    _cse334 = _cse322 + _cse323 - _cse326 + _cse329 + 0.458851168*_cse330 + 0.758601438*_cse331 + 0.758601438*_cse332 + 0.458851168*_cse333
+    _cse335 = 0.000346321299837637*_cse6 + 0.000346321299837637*_cse9
+    _cse336 = 0.517383113*_cse14*_cse325 + 0.517383113*_cse21*_cse328 - 0.855753802*_cse330 - 0.855753802*_cse333 - _cse335
+    _cse337 = _cse334*_cse36
+    _cse338 = _cse336*_cse54
+    _cse339 = -_cse163*_cse325 + _cse164*_cse328
+    _cse340 = 0.227539183449751*_cse9
+    _cse341 = 0.227539183449751*_cse6
+    _cse342 = -_cse100
+    _cse343 = _cse340 + _cse341 + _cse342 + _cse96 + _cse99
+    _cse344 = _cse114*_cse336 + _cse115*_cse334 + _cse325*_cse70 + _cse328*_cse92 - 0.0181297165934418*_cse330 - 0.0309919044627574*_cse331 - 0.0309919044627574*_cse332 - 0.0181297165934418*_cse333 - _cse334*_cse74 + _cse334*_cse75 - _cse336*_cse58 + _cse336*_cse60 + _cse337 - _cse338 + _cse339 + _cse343 + _cse98
+    _cse345 = _cse21*_cse327
+    _cse346 = _cse25*_cse327
+    _cse347 = _cse23*_cse324
+    _cse348 = _cse14*_cse324
+    _cse349 = -_cse322 - _cse323 - _cse324*_cse46 + _cse327*_cse44 + 0.758601438*_cse345 + 0.458851168*_cse346 + 0.458851168*_cse347 + 0.758601438*_cse348
+    _cse350 = _cse335 + 0.517383113*_cse345 - 0.855753802*_cse346 - 0.855753802*_cse347 + 0.517383113*_cse348
+    _cse351 = -0.0439876856535455*_cse13*_cse327 + _cse163*_cse324 - _cse324*_cse70 - _cse327*_cse92 + 0.0309919044627574*_cse345 + 0.0181297165934418*_cse346 + 0.0181297165934418*_cse347 + 0.0309919044627574*_cse348 - 0.01718495619792*_cse349*_cse35 - 0.0050298*_cse349*_cse41 + _cse349*_cse74 - _cse349*_cse75 + _cse350*_cse54 - 0.0050298*_cse350*_cse56 + _cse350*_cse58 - _cse350*_cse60
+    _cse352 = _cse14*_cse303
+    _cse353 = _cse21*_cse306
+    _cse354 = _cse23*_cse303
+    _cse355 = _cse25*_cse306
+    _cse356 = _cse309 + 0.517383113*_cse352 + 0.517383113*_cse353 - 0.855753802*_cse354 - 0.855753802*_cse355
+    _cse357 = -_cse303*_cse46 + _cse306*_cse44 + 0.758601438*_cse352 + 0.758601438*_cse353 + 0.458851168*_cse354 + 0.458851168*_cse355 + _cse48 - _cse50
+    _cse358 = -_cse356*_cse36 - _cse356*_cse40 + 0.0050298*_cse356*_cse42 + _cse356*_cse43 - _cse357*_cse54 + 0.0050298*_cse357*_cse56 - _cse357*_cse58 + _cse357*_cse60
+    _cse359 = _cse23*_cse306
+    _cse360 = _cse14*_cse306
+    _cse361 = _cse303*_cse64
+    _cse362 = _cse20*_cse303
+    _cse363 = 0.517383113*_cse14*_cse306 + 0.517383113*_cse20*_cse303 - 0.855753802*_cse359 - 0.855753802*_cse361
+    _cse364 = -_cse303*_cse44 - _cse306*_cse46 + 0.458851168*_cse359 + 0.758601438*_cse360 + 0.458851168*_cse361 + 0.758601438*_cse362
+    _cse365 = -_cse163*_cse306 - _cse164*_cse303 + _cse303*_cse71 + _cse306*_cse70 + 0.01718495619792*_cse35*_cse364 - 0.0181297165934418*_cse359 - 0.0309919044627574*_cse360 - 0.0181297165934418*_cse361 - 0.0309919044627574*_cse362 - _cse363*_cse54 + 0.0050298*_cse363*_cse56 - _cse363*_cse58 + _cse363*_cse60 + 0.0050298*_cse364*_cse41 - _cse364*_cse74 + _cse364*_cse75
+    _cse366 = _cse325*_cse64
+    _cse367 = _cse23*_cse328
+    _cse368 = 0.517383113*_cse14*_cse328 + 0.517383113*_cse20*_cse325 - 0.855753802*_cse366 - 0.855753802*_cse367
+    _cse369 = _cse20*_cse325
+    _cse370 = _cse14*_cse328
+    _cse371 = -_cse325*_cse44 - _cse328*_cse46 + 0.458851168*_cse366 + 0.458851168*_cse367 + 0.758601438*_cse369 + 0.758601438*_cse370
+    _cse372 = -_cse36*_cse368 - _cse368*_cse40 + 0.0050298*_cse368*_cse42 + _cse368*_cse43 - _cse371*_cse54 + 0.0050298*_cse371*_cse56 - _cse371*_cse58 + _cse371*_cse60
+    _cse373 = _cse217*_cse325
+    _cse374 = _cse219*_cse325
+    _cse375 = _cse328*_cse64
+    _cse376 = _cse20*_cse328
+    _cse377 = _cse326 - _cse329 + 0.758601438*_cse373 + 0.458851168*_cse374 + 0.458851168*_cse375 + 0.758601438*_cse376
+    _cse378 = 0.517383113*_cse373 - 0.855753802*_cse374 - 0.855753802*_cse375 + 0.517383113*_cse376
+    _cse379 = _cse0*dq0
+    _cse380 = _cse141 + _cse144
+    _cse381 = 0.574238819026787*_cse144
+    _cse382 = 0.574238819026787*_cse141
+    _cse383 = 0.408002994597976*_cse13
+    _cse384 = 0.408002994597976*_cse12
+    _cse385 = 0.410149995883665*_cse35
+    _cse386 = 0.209584432*_cse39
+    _cse387 = 0.410879747*_cse42
+    _cse388 = 0.410149995883665*_cse37
+    _cse389 = 0.410879747*_cse56
+    _cse390 = 0.209584432*_cse57
+    _cse391 = 0.329365488408814*_cse144
+    _cse392 = 0.329365488408814*_cse141
+    _cse393 = 0.234017800844203*_cse13
+    _cse394 = 0.234017800844203*_cse12
+    _cse395 = 0.410879747*_cse41
+    _cse396 = 0.209584432*_cse38
+    _cse397 = _cse2*dq0
+    _cse398 = _cse78 + _cse81
+    _cse399 = 0.574238819026787*_cse78
+    _cse400 = 0.574238819026787*_cse81
+    _cse401 = 0.329365488408814*_cse78
+    _cse402 = 0.329365488408814*_cse81
+    _cse403 = -_cse27 + _cse30
+    _cse404 = 0.574238819026787*_cse30
+    _cse405 = 0.574238819026787*_cse27
+    _cse406 = 0.329365488408814*_cse30
+    _cse407 = 0.329365488408814*_cse27
+    out = np.empty((6, 6))
+    out[0, 0] = _cse102*dq2 + _cse118*dq1 + _cse61*dq4 + _cse76*dq3 + dq0*(_cse0*_cse134 - 4.3259e-5*_cse0 + _cse120*_cse70 - 0.0309919044627574*_cse121 + 0.0439876856535455*_cse123*_cse13 + _cse123*_cse92 - 0.0309919044627574*_cse124 - 0.0181297165934418*_cse126 - 0.0181297165934418*_cse127 - 0.0439876856535455*_cse128 + 0.01718495619792*_cse132*_cse35 + 0.0050298*_cse132*_cse41 - _cse132*_cse74 + _cse132*_cse75 - _cse138*_cse54 + 0.0050298*_cse138*_cse56 - _cse138*_cse58 + _cse138*_cse60 - _cse150 + 0.0068032576553314*_cse2)
+    out[0, 1] = _cse118*dq0 + _cse162*dq4 + _cse171*dq3 + _cse182*dq2 + dq1*(-_cse0*_cse133 - _cse150 - _cse189)
+    out[0, 2] = _cse102*dq0 + _cse182*dq1 + _cse198*dq4 + _cse205*dq3 + dq2*(_cse0*_cse206*_cse7 - _cse181 - _cse189)
+    out[0, 3] = _cse171*dq1 + _cse205*dq2 + _cse215*dq4 + _cse76*dq0 + dq3*(0.0439876856535455*_cse12*_cse207 - _cse164*_cse209 + _cse207*_cse69 + _cse209*_cse71 - 0.0181297165934418*_cse216 - 0.0309919044627574*_cse218 - 0.0181297165934418*_cse220 - 0.0309919044627574*_cse221 - _cse222*_cse54 + 0.0050298*_cse222*_cse56 - _cse222*_cse58 + _cse222*_cse60 + 0.01718495619792*_cse225*_cse35 + 0.0050298*_cse225*_cse41 - _cse225*_cse74 + _cse225*_cse75)
+    out[0, 4] = _cse162*dq1 + _cse198*dq2 + _cse215*dq3 + _cse61*dq0 + dq4*(-_cse230*_cse231 + _cse230*_cse232 + _cse230*_cse54 + _cse230*_cse59 + _cse233*_cse234 - _cse233*_cse36 - _cse233*_cse40 + _cse233*_cse43)
+    out[0, 5] = 0
+    out[1, 0] = _cse235*dq4 + _cse242*dq3 + _cse244*dq2 + _cse245*dq1 + dq0*(0.0068032576553314*_cse0 + _cse114*_cse254 + _cse115*_cse253 - _cse134*_cse2 - _cse163*_cse246 + _cse164*_cse248 + 4.3259e-5*_cse2 + _cse246*_cse70 - 0.0309919044627574*_cse247 + _cse248*_cse92 - 0.0309919044627574*_cse249 - 0.0181297165934418*_cse250 - 0.0181297165934418*_cse251 + _cse253*_cse36 - _cse253*_cse74 + _cse253*_cse75 - _cse254*_cse54 - _cse254*_cse58 + _cse254*_cse60 + _cse262)
+    out[1, 1] = _cse245*dq0 + _cse263*dq4 + _cse270*dq3 + _cse278*dq2 + dq1*(_cse133*_cse2 + _cse262 + _cse287)
+    out[1, 2] = _cse244*dq0 + _cse278*dq1 + _cse288*dq4 + _cse295*dq3 + dq2*(-_cse206*_cse80 + _cse277 + _cse287)
+    out[1, 3] = _cse242*dq0 + _cse270*dq1 + _cse295*dq2 + _cse296*dq4 + dq3*(0.0439876856535455*_cse11*_cse12 + _cse11*_cse69 - _cse164*_cse19 + _cse19*_cse71 - 0.0181297165934418*_cse297 - 0.0309919044627574*_cse298 - 0.0181297165934418*_cse299 - 0.0309919044627574*_cse300 - _cse301*_cse54 + 0.0050298*_cse301*_cse56 - _cse301*_cse58 + _cse301*_cse60 + 0.01718495619792*_cse302*_cse35 + 0.0050298*_cse302*_cse41 - _cse302*_cse74 + _cse302*_cse75)
+    out[1, 4] = _cse235*dq0 + _cse263*dq1 + _cse288*dq2 + _cse296*dq3 + dq4*(-_cse231*_cse34 + _cse232*_cse34 + _cse234*_cse53 + _cse34*_cse54 + _cse34*_cse59 - _cse36*_cse53 - _cse40*_cse53 + _cse43*_cse53)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse314*dq4 + _cse321*dq3 + _cse344*dq2 + dq1*(_cse116*_cse7 - _cse340 - _cse341 - _cse342 - _cse351 - 0.001950802*_cse4 + 0.41405*_cse7 - _cse98 - _cse99)
+    out[2, 2] = _cse344*dq1 + _cse358*dq4 + _cse365*dq3 + dq2*(_cse206*_cse4 - _cse343 - _cse351)
+    out[2, 3] = _cse321*dq1 + _cse365*dq2 + _cse372*dq4 + dq3*(_cse325*_cse69 + _cse328*_cse71 - _cse339 + 0.01718495619792*_cse35*_cse377 - 0.0309919044627574*_cse373 - 0.0181297165934418*_cse374 - 0.0181297165934418*_cse375 - 0.0309919044627574*_cse376 + 0.0050298*_cse377*_cse41 - _cse377*_cse74 + _cse377*_cse75 - _cse378*_cse54 + 0.0050298*_cse378*_cse56 - _cse378*_cse58 + _cse378*_cse60)
+    out[2, 4] = _cse314*dq1 + _cse358*dq2 + _cse372*dq3 + dq4*(-_cse231*_cse336 + _cse232*_cse336 + _cse234*_cse334 - _cse334*_cse40 + _cse334*_cse43 + _cse336*_cse59 - _cse337 + _cse338)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse379
+    out[3, 2] = _cse379
+    out[3, 3] = _cse380*dq1 - _cse380*dq2 + dq0*(_cse2*_cse5*_cse7 - _cse260)
+    out[3, 4] = dq0*(_cse11*_cse384 + 0.3960285*_cse15 - _cse19*_cse383 + 0.3960285*_cse22 + 0.239041914*_cse24 + 0.574238819026787*_cse258 + 0.239041914*_cse26 - 0.574238819026787*_cse260) + dq1*(_cse151*_cse384 + 0.3960285*_cse152 - _cse153*_cse383 + 0.3960285*_cse154 + 0.239041914*_cse155 + 0.239041914*_cse156 + _cse381 + _cse382) + dq2*(_cse190*_cse384 + 0.239041914*_cse191 - _cse192*_cse383 + 0.239041914*_cse193 + 0.3960285*_cse195 + 0.3960285*_cse196 - _cse381 - _cse382) + dq3*(_cse207*_cse383 + 0.239041914*_cse208 + _cse209*_cse384 + 0.239041914*_cse210 + 0.3960285*_cse212 + 0.3960285*_cse213)
+    out[3, 5] = dq0*(_cse11*_cse394 + 0.227149603970304*_cse15 - _cse19*_cse393 + 0.227149603970304*_cse22 + 0.137106991283212*_cse24 + 0.329365488408814*_cse258 + 0.137106991283212*_cse26 - 0.329365488408814*_cse260 + _cse34*_cse388 - _cse34*_cse389 + _cse34*_cse390 - _cse385*_cse53 - _cse395*_cse53 + _cse396*_cse53) + dq1*(_cse151*_cse394 + 0.227149603970304*_cse152 - _cse153*_cse393 + 0.227149603970304*_cse154 + 0.137106991283212*_cse155 + 0.137106991283212*_cse156 + _cse158*_cse388 - _cse158*_cse389 + _cse158*_cse390 - _cse161*_cse385 - _cse161*_cse395 + _cse161*_cse396 + _cse391 + _cse392) + dq2*(_cse190*_cse394 + 0.137106991283212*_cse191 - _cse192*_cse393 + 0.137106991283212*_cse193 + _cse194*_cse388 - _cse194*_cse389 + _cse194*_cse390 + 0.227149603970304*_cse195 + 0.227149603970304*_cse196 - _cse197*_cse385 - _cse197*_cse395 + _cse197*_cse396 - _cse391 - _cse392) + dq3*(_cse207*_cse393 + 0.137106991283212*_cse208 + _cse209*_cse394 + 0.137106991283212*_cse210 + _cse211*_cse388 - _cse211*_cse389 + _cse211*_cse390 + 0.227149603970304*_cse212 + 0.227149603970304*_cse213 - _cse214*_cse385 - _cse214*_cse395 + _cse214*_cse396) + dq4*(_cse230*_cse385 + _cse230*_cse386 - _cse230*_cse387 + _cse233*_cse388 - _cse233*_cse389 + _cse233*_cse390)
+    out[4, 0] = 0
+    out[4, 1] = _cse397
+    out[4, 2] = -_cse397
+    out[4, 3] = -_cse398*dq1 + _cse398*dq2 + dq0*(_cse0*_cse5*_cse7 - _cse148)
+    out[4, 4] = dq0*(0.3960285*_cse121 + 0.3960285*_cse124 - 0.408002994597976*_cse125 + 0.239041914*_cse126 + 0.239041914*_cse127 + 0.408002994597976*_cse128 + 0.574238819026787*_cse146 - 0.574238819026787*_cse148) + dq1*(0.408002994597976*_cse105 - 0.408002994597976*_cse107 + 0.239041914*_cse108 + 0.3960285*_cse109 + 0.3960285*_cse110 + 0.239041914*_cse111 - _cse399 - _cse400) + dq2*(_cse399 + _cse400 - 0.408002994597976*_cse84 + 0.408002994597976*_cse86 + 0.3960285*_cse87 + 0.239041914*_cse88 + 0.239041914*_cse89 + 0.3960285*_cse90) + dq3*(0.408002994597976*_cse62 + 0.408002994597976*_cse63 + 0.239041914*_cse65 + 0.239041914*_cse66 + 0.3960285*_cse67 + 0.3960285*_cse68)
+    out[4, 5] = dq0*(0.227149603970304*_cse121 + 0.227149603970304*_cse124 - 0.234017800844203*_cse125 + 0.137106991283212*_cse126 + 0.137106991283212*_cse127 + 0.234017800844203*_cse128 - _cse132*_cse385 - _cse132*_cse395 + _cse132*_cse396 + _cse138*_cse388 - _cse138*_cse389 + _cse138*_cse390 + 0.329365488408814*_cse146 - 0.329365488408814*_cse148) + dq1*(0.234017800844203*_cse105 - 0.234017800844203*_cse107 + 0.137106991283212*_cse108 + 0.227149603970304*_cse109 + 0.227149603970304*_cse110 + 0.137106991283212*_cse111 - _cse112*_cse385 - _cse112*_cse395 + _cse112*_cse396 + _cse113*_cse388 - _cse113*_cse389 + _cse113*_cse390 - _cse401 - _cse402) + dq2*(-_cse385*_cse91 + _cse388*_cse94 - _cse389*_cse94 + _cse390*_cse94 - _cse395*_cse91 + _cse396*_cse91 + _cse401 + _cse402 - 0.234017800844203*_cse84 + 0.234017800844203*_cse86 + 0.227149603970304*_cse87 + 0.137106991283212*_cse88 + 0.137106991283212*_cse89 + 0.227149603970304*_cse90) + dq3*(-_cse385*_cse73 + _cse388*_cse72 - _cse389*_cse72 + _cse390*_cse72 - _cse395*_cse73 + _cse396*_cse73 + 0.234017800844203*_cse62 + 0.234017800844203*_cse63 + 0.137106991283212*_cse65 + 0.137106991283212*_cse66 + 0.227149603970304*_cse67 + 0.227149603970304*_cse68) + dq4*(_cse34*_cse385 + _cse34*_cse386 - _cse34*_cse387 + _cse388*_cse53 - _cse389*_cse53 + _cse390*_cse53)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse403*dq1 - _cse403*dq2
+    out[5, 4] = dq1*(_cse304*_cse384 + 0.239041914*_cse305 - _cse307*_cse383 + 0.239041914*_cse308 + 0.3960285*_cse311 + 0.3960285*_cse312 + _cse404 - _cse405) + dq2*(_cse303*_cse384 - _cse306*_cse383 + 0.3960285*_cse352 + 0.3960285*_cse353 + 0.239041914*_cse354 + 0.239041914*_cse355 - _cse404 + _cse405) + dq3*(_cse325*_cse383 + _cse328*_cse384 + 0.239041914*_cse366 + 0.239041914*_cse367 + 0.3960285*_cse369 + 0.3960285*_cse370)
+    out[5, 5] = dq1*(_cse304*_cse394 + 0.137106991283212*_cse305 - _cse307*_cse393 + 0.137106991283212*_cse308 + _cse310*_cse388 - _cse310*_cse389 + _cse310*_cse390 + 0.227149603970304*_cse311 + 0.227149603970304*_cse312 - _cse313*_cse385 - _cse313*_cse395 + _cse313*_cse396 + _cse406 - _cse407) + dq2*(_cse303*_cse394 - _cse306*_cse393 + 0.227149603970304*_cse352 + 0.227149603970304*_cse353 + 0.137106991283212*_cse354 + 0.137106991283212*_cse355 + _cse356*_cse388 - _cse356*_cse389 + _cse356*_cse390 - _cse357*_cse385 - _cse357*_cse395 + _cse357*_cse396 - _cse406 + _cse407) + dq3*(_cse325*_cse393 + _cse328*_cse394 + 0.137106991283212*_cse366 + 0.137106991283212*_cse367 + _cse368*_cse388 - _cse368*_cse389 + _cse368*_cse390 + 0.227149603970304*_cse369 + 0.227149603970304*_cse370 - _cse371*_cse385 - _cse371*_cse395 + _cse371*_cse396) + dq4*(_cse334*_cse388 - _cse334*_cse389 + _cse334*_cse390 + _cse336*_cse385 + _cse336*_cse386 - _cse336*_cse387)
+    return out
+
+
+# link0[0,0,0]_Tx
+def function21(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0.0783690000000000
+    out[3, 0] = 1
+    return out
+
+
+# link0[0,0,0]_J
+def function22(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link0[0,0,0]_dJ
+def function23(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link1[0,0,0]_Tx
+def function24(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((4, 1))
+    out[0, 0] = -4.8455e-5*_cse0 + 2.1217e-5*_cse1 - 3.2712e-5
+    out[1, 0] = -2.1217e-5*_cse0 - 4.8455e-5*_cse1 - 1.7324e-5
+    out[2, 0] = 0.236265000000000
+    out[3, 0] = 1
+    return out
+
+
+# link1[0,0,0]_J
+def function25(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = -2.1217e-5*_cse0 - 4.8455e-5*_cse1
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 4.8455e-5*_cse0 - 2.1217e-5*_cse1
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link1[0,0,0]_dJ
+def function26(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = dq0*(4.8455e-5*_cse0 - 2.1217e-5*_cse1)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = dq0*(2.1217e-5*_cse0 + 4.8455e-5*_cse1)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse1*dq0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse0*dq0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link2[0,0,0]_Tx
+def function27(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = -0.20902*_cse2 - 0.0019519*_cse3
+    out = np.empty((4, 1))
+    out[0, 0] = 0.028922995*_cse0 - _cse1*_cse4 + 4.3259e-5*_cse1 - 3.2712e-5
+    out[1, 0] = _cse0*_cse4 - 4.3259e-5*_cse0 + 0.028922995*_cse1 - 1.7324e-5
+    out[2, 0] = 0.0019519*_cse2 - 0.20902*_cse3 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# link2[0,0,0]_J
+def function28(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = 0.20902*_cse2 + 0.0019519*_cse3
+    _cse5 = -_cse4
+    _cse6 = 0.0019519*_cse2 - 0.20902*_cse3
+    out = np.empty((6, 6))
+    out[0, 0] = _cse0*_cse5 - 4.3259e-5*_cse0 + 0.028922995*_cse1
+    out[0, 1] = -_cse1*_cse6
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -0.028922995*_cse0 + _cse1*_cse5 - 4.3259e-5*_cse1
+    out[1, 1] = _cse0*_cse6
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse4
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link2[0,0,0]_dJ
+def function29(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = math.cos(q1)
+    _cse3 = 0.0019519*_cse1 - 0.20902*_cse2
+    _cse4 = _cse3*dq1
+    _cse5 = math.cos(q0)
+    _cse6 = 0.20902*_cse1 + 0.0019519*_cse2
+    _cse7 = -_cse6
+    _cse8 = _cse0*dq0
+    _cse9 = _cse6*dq1
+    _cse10 = _cse5*dq0
+    out = np.empty((6, 6))
+    out[0, 0] = _cse0*_cse4 + dq0*(-0.028922995*_cse0 + _cse5*_cse7 - 4.3259e-5*_cse5)
+    out[0, 1] = _cse3*_cse8 - _cse5*_cse9
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse4*_cse5 + dq0*(-_cse0*_cse7 + 4.3259e-5*_cse0 - 0.028922995*_cse5)
+    out[1, 1] = _cse0*_cse9 + _cse10*_cse3
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse3*dq1
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse10
+    out[3, 2] = _cse10
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse8
+    out[4, 2] = -_cse8
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link3[0,0,0]_Tx
+def function30(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = -0.20902*_cse2 - 0.0019519*_cse3
+    _cse5 = math.sin(q2)
+    _cse6 = math.cos(q2)
+    _cse7 = -0.00048786*_cse5 - 0.081945*_cse6
+    _cse8 = 0.081945*_cse5 - 0.00048786*_cse6
+    _cse9 = _cse0*_cse2
+    out = np.empty((4, 1))
+    out[0, 0] = -0.007102005*_cse0 + _cse1*_cse2*_cse7 + 0.20503*_cse1*_cse2 + _cse1*_cse3*_cse8 - 1.098e-6*_cse1*_cse3 - _cse1*_cse4 + 4.3259e-5*_cse1 - 3.2712e-5
+    out[1, 0] = -_cse0*_cse3*_cse8 + 1.098e-6*_cse0*_cse3 + _cse0*_cse4 - 4.3259e-5*_cse0 - 0.007102005*_cse1 - _cse7*_cse9 - 0.20503*_cse9 - 1.7324e-5
+    out[2, 0] = _cse2*_cse8 + 0.001950802*_cse2 - _cse3*_cse7 - 0.41405*_cse3 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# link3[0,0,0]_J
+def function31(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = math.cos(q2)
+    _cse8 = 0.00048786*_cse6 + 0.081945*_cse7
+    _cse9 = -_cse8
+    _cse10 = _cse2*_cse9
+    _cse11 = 0.081945*_cse6 - 0.00048786*_cse7
+    _cse12 = _cse11*_cse4
+    _cse13 = _cse1*_cse2
+    _cse14 = _cse1*_cse4
+    _cse15 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse16 = _cse11*_cse13
+    _cse17 = _cse0*_cse2
+    _cse18 = _cse0*_cse4
+    _cse19 = _cse11*_cse17
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse10 - _cse0*_cse12 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 + _cse0*_cse5 - 4.3259e-5*_cse0 - 0.007102005*_cse1
+    out[0, 1] = -_cse1*_cse15 + 1.098e-6*_cse13 + _cse14*_cse9 + 0.20503*_cse14 - _cse16
+    out[0, 2] = _cse14*_cse8 + _cse16
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0.007102005*_cse0 - _cse1*_cse10 - _cse1*_cse12 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 + _cse1*_cse5 - 4.3259e-5*_cse1
+    out[1, 1] = _cse0*_cse15 - 1.098e-6*_cse17 - _cse18*_cse9 - 0.20503*_cse18 + _cse19
+    out[1, 2] = -_cse18*_cse8 - _cse19
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse10 + _cse12 + 0.41405*_cse2 + 0.001950802*_cse4
+    out[2, 2] = -_cse12 + _cse2*_cse8
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse13*_cse7 - _cse14*_cse6
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse6 - _cse17*_cse7
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse2*_cse6 - _cse4*_cse7
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link3[0,0,0]_dJ
+def function32(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = math.sin(q2)
+    _cse3 = math.cos(q2)
+    _cse4 = 0.00048786*_cse2 + 0.081945*_cse3
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q1)
+    _cse7 = 0.081945*_cse2 - 0.00048786*_cse3
+    _cse8 = _cse6*_cse7
+    _cse9 = _cse0*_cse8
+    _cse10 = -_cse0*_cse5 - _cse9
+    _cse11 = _cse0*_cse6
+    _cse12 = _cse0*_cse1
+    _cse13 = -0.20902*_cse1 + 0.0019519*_cse6
+    _cse14 = -_cse4
+    _cse15 = _cse1*_cse14
+    _cse16 = _cse0*_cse13 - _cse0*_cse15 - 1.098e-6*_cse11 - 0.20503*_cse12 + _cse9
+    _cse17 = math.cos(q0)
+    _cse18 = 0.0019519*_cse1 + 0.20902*_cse6
+    _cse19 = -_cse18
+    _cse20 = _cse17*_cse6
+    _cse21 = _cse1*_cse17
+    _cse22 = _cse21*_cse7
+    _cse23 = -1.098e-6*_cse1*_cse17 + _cse14*_cse20 + 0.20503*_cse20 + _cse22
+    _cse24 = _cse20*_cse4
+    _cse25 = _cse22 - _cse24
+    _cse26 = -_cse7
+    _cse27 = _cse17*_cse8
+    _cse28 = -_cse17*_cse5 - _cse27
+    _cse29 = _cse13*_cse17 - _cse15*_cse17 - 1.098e-6*_cse20 - 0.20503*_cse21 + _cse27
+    _cse30 = _cse12*_cse7
+    _cse31 = _cse11*_cse14 + 0.20503*_cse11 - 1.098e-6*_cse12 + _cse30
+    _cse32 = _cse11*_cse4
+    _cse33 = -_cse30 + _cse32
+    _cse34 = _cse5 + _cse8
+    _cse35 = _cse17*dq0
+    _cse36 = _cse2*_cse20 + _cse21*_cse3
+    _cse37 = _cse3*_cse6
+    _cse38 = _cse0*dq0
+    _cse39 = _cse11*_cse2 + _cse12*_cse3
+    _cse40 = -_cse1*_cse2 + _cse37
+    out = np.empty((6, 6))
+    out[0, 0] = _cse10*dq2 + _cse16*dq1 + dq0*(0.007102005*_cse0 + _cse17*_cse19 - 4.3259e-5*_cse17 - _cse23)
+    out[0, 1] = _cse16*dq0 + _cse25*dq2 + dq1*(-_cse17*_cse18 - _cse23)
+    out[0, 2] = _cse10*dq0 + _cse25*dq1 + dq2*(_cse21*_cse26 + _cse24)
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse28*dq2 + _cse29*dq1 + dq0*(-_cse0*_cse19 + 4.3259e-5*_cse0 + 0.007102005*_cse17 + _cse31)
+    out[1, 1] = _cse29*dq0 + _cse33*dq2 + dq1*(_cse0*_cse18 + _cse31)
+    out[1, 2] = _cse28*dq0 + _cse33*dq1 + dq2*(-_cse12*_cse26 - _cse32)
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse34*dq2 + dq1*(0.41405*_cse1 + _cse15 - 0.001950802*_cse6 - _cse8)
+    out[2, 2] = _cse34*dq1 + dq2*(_cse26*_cse6 - _cse5)
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse35
+    out[3, 2] = _cse35
+    out[3, 3] = _cse36*dq1 - _cse36*dq2 + dq0*(_cse0*_cse1*_cse2 - _cse0*_cse37)
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse38
+    out[4, 2] = -_cse38
+    out[4, 3] = -_cse39*dq1 + _cse39*dq2 + dq0*(_cse1*_cse17*_cse2 - _cse17*_cse37)
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse40*dq1 - _cse40*dq2
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link4[0,0,0]_Tx
+def function33(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = 0.1592*_cse6
+    _cse10 = 0.0038906673398998*_cse8
+    _cse11 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse12 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse13 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse14 = math.sin(q3)
+    _cse15 = math.cos(q3)
+    _cse16 = -0.012581*_cse14 - 0.00040053*_cse15
+    _cse17 = 6.57617443000635e-7*_cse0
+    _cse18 = 0.999999998572139*_cse1
+    _cse19 = _cse2*_cse6
+    _cse20 = _cse4*_cse8
+    _cse21 = -0.00040053*_cse14 + 0.012581*_cse15
+    _cse22 = 6.57617443000635e-7*_cse1
+    _cse23 = _cse0*_cse2
+    _cse24 = _cse0*_cse4
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse2*_cse8
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse11 + 4.3259e-5*_cse1 + _cse10*_cse5 + _cse12*_cse3 + _cse13*_cse5 + _cse16*(-_cse17 - _cse18*_cse19 - _cse18*_cse20) + _cse21*(0.999999998572139*_cse0 - _cse19*_cse22 - _cse20*_cse22) + _cse3*_cse7 - 0.1592*_cse3*_cse8 + 0.20503*_cse3 + _cse5*_cse9 - 1.098e-6*_cse5 - 3.2712e-5
+    out[1, 0] = _cse0*_cse11 + 0.1592*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse10*_cse24 - _cse12*_cse23 - _cse13*_cse24 + _cse16*(_cse19*_cse25 + _cse20*_cse25 - _cse22) + _cse21*(_cse17*_cse19 + _cse17*_cse20 + _cse18) - _cse23*_cse7 - 0.20503*_cse23 - _cse24*_cse9 - 1.7324e-5
+    out[2, 0] = -_cse12*_cse4 + _cse13*_cse2 + _cse16*(-0.999999998572139*_cse26 + 0.999999998572139*_cse4*_cse6) + 0.1592*_cse19 + 0.001950802*_cse2 + 0.1592*_cse20 + _cse21*(-6.57617443000635e-7*_cse26 + 6.57617443000635e-7*_cse4*_cse6) + 0.0038906673398998*_cse26 - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# link4[0,0,0]_J
+def function34(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.sin(q3)
+    _cse20 = math.cos(q3)
+    _cse21 = -0.012581*_cse19 - 0.00040053*_cse20
+    _cse22 = 6.57617443000635e-7*_cse1
+    _cse23 = 0.999999998572139*_cse0
+    _cse24 = _cse11*_cse23 - _cse22 + _cse23*_cse6
+    _cse25 = 0.00040053*_cse19 - 0.012581*_cse20
+    _cse26 = -_cse25
+    _cse27 = 0.999999998572139*_cse1
+    _cse28 = 6.57617443000635e-7*_cse0
+    _cse29 = _cse11*_cse28 + _cse27 + _cse28*_cse6
+    _cse30 = _cse1*_cse2
+    _cse31 = _cse1*_cse4
+    _cse32 = 0.1592*_cse1
+    _cse33 = _cse32*_cse6
+    _cse34 = _cse30*_cse8
+    _cse35 = 0.0038906673398998*_cse34
+    _cse36 = _cse31*_cse5
+    _cse37 = 0.0038906673398998*_cse36
+    _cse38 = _cse11*_cse32
+    _cse39 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse40 = _cse17*_cse30
+    _cse41 = _cse2*_cse8
+    _cse42 = _cse4*_cse5
+    _cse43 = _cse22*_cse41 - _cse22*_cse42
+    _cse44 = _cse27*_cse41 - _cse27*_cse42
+    _cse45 = -0.999999998572139*_cse0 + _cse11*_cse22 + _cse22*_cse6
+    _cse46 = -_cse45
+    _cse47 = _cse11*_cse27 + _cse27*_cse6 + _cse28
+    _cse48 = -_cse47
+    _cse49 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse28*_cse41
+    _cse50 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse23*_cse41
+    _cse51 = _cse0*_cse2
+    _cse52 = 0.1592*_cse0
+    _cse53 = _cse51*_cse8
+    _cse54 = -0.0038906673398998*_cse10 + _cse11*_cse52 + _cse17*_cse51 + _cse52*_cse6 + 0.0038906673398998*_cse53
+    _cse55 = 0.1592*_cse41
+    _cse56 = 0.1592*_cse42
+    _cse57 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse58 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse59 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse41
+    _cse60 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse41
+    _cse61 = 0.408002994597976*_cse19
+    _cse62 = 0.408002994597976*_cse20
+    _cse63 = -0.205153451809215*_cse19 - 0.300746240858175*_cse20
+    _cse64 = 0.10993832124498*_cse19 + 0.204467912268013*_cse20
+    _cse65 = 0.300746240858175*_cse19 - 0.205153451809215*_cse20
+    _cse66 = 0.204467912268013*_cse19 - 0.10993832124498*_cse20
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.1592*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.1592*_cse10 + _cse21*_cse24 + _cse26*_cse29
+    out[0, 1] = -_cse1*_cse39 + _cse15*_cse31 + _cse21*_cse44 + _cse26*_cse43 + 1.098e-6*_cse30 + 0.20503*_cse31 - _cse33 - _cse35 + _cse37 - _cse38 - _cse40
+    out[0, 2] = _cse14*_cse31 - _cse21*_cse44 - _cse26*_cse43 + _cse33 + _cse35 - _cse37 + _cse38 + _cse40
+    out[0, 3] = _cse21*_cse46 + _cse25*_cse48
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.1592*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 + _cse21*_cse47 + _cse26*_cse45 - 0.1592*_cse36
+    out[1, 1] = _cse0*_cse39 - _cse15*_cse9 - _cse21*_cse50 - _cse26*_cse49 - 1.098e-6*_cse51 + _cse54 - 0.20503*_cse9
+    out[1, 2] = -_cse14*_cse9 + _cse21*_cse50 + _cse26*_cse49 - _cse54
+    out[1, 3] = _cse21*_cse29 + _cse24*_cse25
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse12 + _cse16 + _cse18 + 0.41405*_cse2 - _cse21*_cse57 - _cse26*_cse58 + 0.001950802*_cse4 - _cse55 + _cse56 + _cse7
+    out[2, 2] = -_cse12 + _cse14*_cse2 - _cse18 + _cse21*_cse57 + _cse26*_cse58 + _cse55 - _cse56 - _cse7
+    out[2, 3] = _cse21*_cse60 + _cse25*_cse59
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse34 - _cse36
+    out[3, 4] = 0.574238819026787*_cse34 - 0.574238819026787*_cse36 - _cse46*_cse62 + _cse46*_cse63 + _cse46*_cse66 + _cse48*_cse61 + _cse48*_cse64 + _cse48*_cse65
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse53
+    out[4, 4] = 0.574238819026787*_cse10 + _cse24*_cse61 + _cse24*_cse64 + _cse24*_cse65 - _cse29*_cse62 + _cse29*_cse63 + _cse29*_cse66 - 0.574238819026787*_cse53
+    out[4, 5] = 0
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + _cse59*_cse61 + _cse59*_cse64 + _cse59*_cse65 - 0.574238819026787*_cse6 - _cse60*_cse62 + _cse60*_cse63 + _cse60*_cse66
+    out[5, 5] = 0
+    return out
+
+
+# link4[0,0,0]_dJ
+def function35(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q3)
+    _cse1 = math.cos(q3)
+    _cse2 = 0.012581*_cse0 + 0.00040053*_cse1
+    _cse3 = -_cse2
+    _cse4 = math.cos(q0)
+    _cse5 = 0.999999998572139*_cse4
+    _cse6 = math.sin(q0)
+    _cse7 = 6.57617443000635e-7*_cse6
+    _cse8 = math.sin(q1)
+    _cse9 = math.sin(q2)
+    _cse10 = _cse8*_cse9
+    _cse11 = math.cos(q1)
+    _cse12 = math.cos(q2)
+    _cse13 = _cse11*_cse12
+    _cse14 = _cse10*_cse7 + _cse13*_cse7
+    _cse15 = _cse14 + _cse5
+    _cse16 = 0.00040053*_cse0 - 0.012581*_cse1
+    _cse17 = 6.57617443000635e-7*_cse4
+    _cse18 = 0.999999998572139*_cse6
+    _cse19 = _cse10*_cse18 + _cse13*_cse18
+    _cse20 = -_cse17 + _cse19
+    _cse21 = _cse15*_cse3 + _cse16*_cse20
+    _cse22 = -_cse16
+    _cse23 = _cse12*_cse8
+    _cse24 = -6.57617443000635e-7*_cse11*_cse6*_cse9 + _cse23*_cse7
+    _cse25 = -0.999999998572139*_cse11*_cse6*_cse9 + _cse18*_cse23
+    _cse26 = 0.081945*_cse12 + 0.00048786*_cse9
+    _cse27 = _cse11*_cse26
+    _cse28 = -0.00048786*_cse12 + 0.081945*_cse9
+    _cse29 = _cse28*_cse8
+    _cse30 = _cse11*_cse6
+    _cse31 = _cse12*_cse30
+    _cse32 = _cse6*_cse8
+    _cse33 = _cse32*_cse9
+    _cse34 = 0.0038906673398998*_cse23
+    _cse35 = _cse11*_cse9
+    _cse36 = 0.0038906673398998*_cse35
+    _cse37 = _cse29*_cse6 + 0.1592*_cse31 + 0.1592*_cse33 + _cse34*_cse6 - _cse36*_cse6
+    _cse38 = _cse22*_cse24 + _cse25*_cse3 - _cse27*_cse6 - _cse37
+    _cse39 = -0.20902*_cse11 + 0.0019519*_cse8
+    _cse40 = -_cse24
+    _cse41 = -_cse25
+    _cse42 = -_cse26
+    _cse43 = _cse11*_cse42
+    _cse44 = _cse22*_cse40 + _cse3*_cse41 - 0.20503*_cse30 - 1.098e-6*_cse32 + _cse37 + _cse39*_cse6 - _cse43*_cse6
+    _cse45 = _cse10*_cse17 + _cse13*_cse17
+    _cse46 = -_cse18 + _cse45
+    _cse47 = 0.0019519*_cse11 + 0.20902*_cse8
+    _cse48 = -_cse47
+    _cse49 = _cse10*_cse5 + _cse13*_cse5
+    _cse50 = _cse49 + _cse7
+    _cse51 = _cse4*_cse8
+    _cse52 = _cse11*_cse4
+    _cse53 = _cse35*_cse4
+    _cse54 = 0.1592*_cse53
+    _cse55 = _cse12*_cse52
+    _cse56 = 0.0038906673398998*_cse55
+    _cse57 = _cse51*_cse9
+    _cse58 = 0.0038906673398998*_cse57
+    _cse59 = _cse23*_cse4
+    _cse60 = 0.1592*_cse59
+    _cse61 = _cse28*_cse52 + _cse54 + _cse56 + _cse58 - _cse60
+    _cse62 = -1.098e-6*_cse11*_cse4 + _cse42*_cse51 + 0.20503*_cse51 + _cse61
+    _cse63 = _cse17*_cse23 - _cse17*_cse35
+    _cse64 = _cse23*_cse5 - _cse35*_cse5
+    _cse65 = _cse16*_cse64 + _cse3*_cse63
+    _cse66 = _cse26*_cse51
+    _cse67 = -_cse22*_cse45 - _cse3*_cse49 + _cse61 - _cse66
+    _cse68 = -_cse64
+    _cse69 = -_cse63
+    _cse70 = _cse16*_cse68 + _cse3*_cse69
+    _cse71 = -_cse28
+    _cse72 = -_cse46
+    _cse73 = -_cse50
+    _cse74 = _cse16*_cse50 + _cse3*_cse46
+    _cse75 = _cse29*_cse4 + _cse34*_cse4 - _cse36*_cse4 + 0.1592*_cse55 + 0.1592*_cse57
+    _cse76 = _cse22*_cse63 - _cse27*_cse4 + _cse3*_cse64 - _cse75
+    _cse77 = _cse22*_cse69 + _cse3*_cse68 + _cse39*_cse4 - _cse4*_cse43 - 1.098e-6*_cse51 - 0.20503*_cse52 + _cse75
+    _cse78 = _cse35*_cse6
+    _cse79 = 0.1592*_cse78
+    _cse80 = 0.0038906673398998*_cse31
+    _cse81 = 0.0038906673398998*_cse33
+    _cse82 = _cse23*_cse6
+    _cse83 = 0.1592*_cse82
+    _cse84 = _cse79 + _cse80 + _cse81 - _cse83
+    _cse85 = _cse28*_cse30
+    _cse86 = -1.098e-6*_cse30 + _cse32*_cse42 + 0.20503*_cse32 + _cse85
+    _cse87 = _cse16*_cse41 + _cse3*_cse40
+    _cse88 = _cse26*_cse32
+    _cse89 = _cse14*_cse22 + _cse19*_cse3 - _cse79 - _cse80 - _cse81 + _cse83 - _cse85 + _cse88
+    _cse90 = -_cse14*_cse22 - _cse19*_cse3 + _cse84
+    _cse91 = _cse16*_cse25 + _cse24*_cse3
+    _cse92 = 0.999999998572139*_cse10 + 0.999999998572139*_cse13
+    _cse93 = -_cse92
+    _cse94 = 6.57617443000635e-7*_cse10 + 6.57617443000635e-7*_cse13
+    _cse95 = -_cse94
+    _cse96 = _cse16*_cse93 + _cse3*_cse95
+    _cse97 = 0.1592*_cse10
+    _cse98 = 0.1592*_cse13
+    _cse99 = 0.999999998572139*_cse23 - 0.999999998572139*_cse35
+    _cse100 = -_cse99
+    _cse101 = 6.57617443000635e-7*_cse23 - 6.57617443000635e-7*_cse35
+    _cse102 = -_cse101
+    _cse103 = _cse100*_cse3 + _cse102*_cse22 + _cse27 + _cse29 + _cse34 - _cse36 + _cse97 + _cse98
+    _cse104 = _cse101*_cse22 + _cse3*_cse99 - _cse34 + _cse36 - _cse97 - _cse98
+    _cse105 = _cse16*_cse92 + _cse3*_cse94
+    _cse106 = _cse4*dq0
+    _cse107 = _cse55 + _cse57
+    _cse108 = 0.574238819026787*_cse57
+    _cse109 = 0.574238819026787*_cse55
+    _cse110 = 0.408002994597976*_cse1
+    _cse111 = 0.408002994597976*_cse0
+    _cse112 = 0.51802699*_cse0 + 0.75940555*_cse1
+    _cse113 = -0.3960285*_cse112
+    _cse114 = 0.85536427*_cse0 - 0.45991232*_cse1
+    _cse115 = 0.239041914*_cse114
+    _cse116 = 0.10993832124498*_cse0 + 0.204467912268013*_cse1
+    _cse117 = 0.300746240858175*_cse0 - 0.205153451809215*_cse1
+    _cse118 = -0.239041914*_cse114
+    _cse119 = 0.3960285*_cse112
+    _cse120 = _cse6*dq0
+    _cse121 = _cse31 + _cse33
+    _cse122 = 0.574238819026787*_cse33
+    _cse123 = 0.574238819026787*_cse31
+    _cse124 = _cse23 - _cse35
+    _cse125 = 0.574238819026787*_cse23
+    _cse126 = 0.574238819026787*_cse35
+    out = np.empty((6, 6))
+    out[0, 0] = _cse21*dq3 + _cse38*dq2 + _cse44*dq1 + dq0*(_cse22*_cse46 + _cse3*_cse50 + _cse4*_cse48 - 4.3259e-5*_cse4 + 0.0068032576553314*_cse6 - _cse62)
+    out[0, 1] = _cse44*dq0 + _cse65*dq3 + _cse67*dq2 + dq1*(_cse22*_cse45 + _cse3*_cse49 - _cse4*_cse47 - _cse62)
+    out[0, 2] = _cse38*dq0 + _cse67*dq1 + _cse70*dq3 + dq2*(_cse22*_cse45 + _cse3*_cse49 + _cse52*_cse71 - _cse54 - _cse56 - _cse58 + _cse60 + _cse66)
+    out[0, 3] = _cse21*dq0 + _cse65*dq1 + _cse70*dq2 + dq3*(_cse16*_cse72 + _cse2*_cse73)
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse74*dq3 + _cse76*dq2 + _cse77*dq1 + dq0*(-_cse15*_cse22 - _cse20*_cse3 + 0.0068032576553314*_cse4 - _cse48*_cse6 + 4.3259e-5*_cse6 + _cse84 + _cse86)
+    out[1, 1] = _cse77*dq0 + _cse87*dq3 + _cse89*dq2 + dq1*(_cse47*_cse6 + _cse86 + _cse90)
+    out[1, 2] = _cse76*dq0 + _cse89*dq1 + _cse91*dq3 + dq2*(-_cse30*_cse71 - _cse88 + _cse90)
+    out[1, 3] = _cse74*dq0 + _cse87*dq1 + _cse91*dq2 + dq3*(_cse15*_cse16 + _cse2*_cse20)
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse103*dq2 + _cse96*dq3 + dq1*(_cse104 + 0.41405*_cse11 - _cse29 + _cse43 - 0.001950802*_cse8)
+    out[2, 2] = _cse103*dq1 + _cse105*dq3 + dq2*(_cse104 - _cse27 + _cse71*_cse8)
+    out[2, 3] = _cse105*dq2 + _cse96*dq1 + dq3*(_cse100*_cse2 + _cse102*_cse16)
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse106
+    out[3, 2] = _cse106
+    out[3, 3] = _cse107*dq1 - _cse107*dq2 + dq0*(_cse11*_cse6*_cse9 - _cse82)
+    out[3, 4] = dq0*(-_cse110*_cse15 + _cse111*_cse20 + _cse113*_cse15 + _cse115*_cse15 + _cse116*_cse20 + _cse117*_cse20 + 0.574238819026787*_cse78 - 0.574238819026787*_cse82) + dq1*(_cse108 + _cse109 - _cse110*_cse63 + _cse111*_cse64 + _cse113*_cse63 + _cse115*_cse63 + _cse116*_cse64 + _cse117*_cse64) + dq2*(-_cse108 - _cse109 - _cse110*_cse69 + _cse111*_cse68 + _cse113*_cse69 + _cse115*_cse69 + _cse116*_cse68 + _cse117*_cse68) + dq3*(_cse110*_cse73 + _cse111*_cse72 + _cse116*_cse72 + _cse117*_cse72 + _cse118*_cse73 + _cse119*_cse73)
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse120
+    out[4, 2] = -_cse120
+    out[4, 3] = -_cse121*dq1 + _cse121*dq2 + dq0*(_cse11*_cse4*_cse9 - _cse59)
+    out[4, 4] = dq0*(-_cse110*_cse46 + _cse111*_cse50 + _cse113*_cse46 + _cse115*_cse46 + _cse116*_cse50 + _cse117*_cse50 + 0.574238819026787*_cse53 - 0.574238819026787*_cse59) + dq1*(-_cse110*_cse40 + _cse111*_cse41 + _cse113*_cse40 + _cse115*_cse40 + _cse116*_cse41 + _cse117*_cse41 - _cse122 - _cse123) + dq2*(-_cse110*_cse24 + _cse111*_cse25 + _cse113*_cse24 + _cse115*_cse24 + _cse116*_cse25 + _cse117*_cse25 + _cse122 + _cse123) + dq3*(_cse110*_cse20 + _cse111*_cse15 + _cse116*_cse15 + _cse117*_cse15 + _cse118*_cse20 + _cse119*_cse20)
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse124*dq1 - _cse124*dq2
+    out[5, 4] = dq1*(-_cse110*_cse95 + _cse111*_cse93 + _cse113*_cse95 + _cse115*_cse95 + _cse116*_cse93 + _cse117*_cse93 + _cse125 - _cse126) + dq2*(-_cse110*_cse94 + _cse111*_cse92 + _cse113*_cse94 + _cse115*_cse94 + _cse116*_cse92 + _cse117*_cse92 - _cse125 + _cse126) + dq3*(_cse100*_cse110 + _cse100*_cse118 + _cse100*_cse119 + _cse102*_cse111 + _cse102*_cse116 + _cse102*_cse117)
+    out[5, 5] = 0
+    return out
+
+
+# link5[0,0,0]_Tx
+def function36(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse3*_cse8
+    _cse10 = _cse5*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = math.sin(q3)
+    _cse16 = 6.57617443000635e-7*_cse0
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = _cse2*_cse6
+    _cse19 = _cse4*_cse8
+    _cse20 = -_cse16 - _cse17*_cse18 - _cse17*_cse19
+    _cse21 = _cse15*_cse20
+    _cse22 = math.cos(q3)
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0 - _cse18*_cse23 - _cse19*_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = -0.012581*_cse15 - 0.00040053*_cse22
+    _cse27 = -0.00040053*_cse15 + 0.012581*_cse22
+    _cse28 = -0.51802699*_cse15 - 0.75940555*_cse22
+    _cse29 = _cse24*_cse28
+    _cse30 = 0.45991232*_cse15 + 0.85536427*_cse22
+    _cse31 = _cse20*_cse30
+    _cse32 = 0.75940555*_cse15 - 0.51802699*_cse22
+    _cse33 = _cse20*_cse32
+    _cse34 = 0.85536427*_cse15 - 0.45991232*_cse22
+    _cse35 = _cse24*_cse34
+    _cse36 = math.sin(q4)
+    _cse37 = math.cos(q4)
+    _cse38 = -0.012272*_cse36 - 0.00052974*_cse37
+    _cse39 = -0.00052974*_cse36 + 0.012272*_cse37
+    _cse40 = _cse0*_cse2
+    _cse41 = _cse0*_cse4
+    _cse42 = _cse41*_cse6
+    _cse43 = _cse16*_cse18 + _cse16*_cse19 + _cse17
+    _cse44 = 0.999999998572139*_cse0
+    _cse45 = _cse18*_cse44 + _cse19*_cse44 - _cse23
+    _cse46 = _cse15*_cse45
+    _cse47 = _cse28*_cse43
+    _cse48 = _cse30*_cse45
+    _cse49 = _cse32*_cse45
+    _cse50 = _cse34*_cse43
+    _cse51 = _cse40*_cse8
+    _cse52 = _cse2*_cse8
+    _cse53 = 0.999999998572139*_cse4*_cse6 - 0.999999998572139*_cse52
+    _cse54 = _cse15*_cse53
+    _cse55 = 6.57617443000635e-7*_cse4*_cse6 - 6.57617443000635e-7*_cse52
+    _cse56 = _cse22*_cse55
+    _cse57 = _cse30*_cse53
+    _cse58 = _cse32*_cse53
+    _cse59 = _cse28*_cse55
+    _cse60 = _cse34*_cse55
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + 0.210033941789101*_cse10 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse20*_cse26 - 0.0315500189858492*_cse21 + _cse24*_cse27 + 0.0315500189858492*_cse25 - 0.0189192713225*_cse29 + _cse3*_cse7 + 0.20503*_cse3 - 0.01084270231829*_cse31 - 0.0189192713225*_cse33 - 0.01084270231829*_cse35 + _cse38*(-0.000346321299837637*_cse10 + 0.517383113*_cse29 - 0.855753802*_cse31 + 0.517383113*_cse33 - 0.855753802*_cse35 + 0.000346321299837637*_cse9) + _cse39*(0.818687841791724*_cse10 - 0.212878838804554*_cse21 + 0.212878838804554*_cse25 + 0.758601438*_cse29 + 0.458851168*_cse31 + 0.758601438*_cse33 + 0.458851168*_cse35 - 0.818687841791724*_cse9) - 1.098e-6*_cse5 - 0.210033941789101*_cse9 - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.210033941789101*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse11*_cse41 - _cse13*_cse40 - _cse14*_cse41 + 0.0315500189858492*_cse22*_cse43 + _cse26*_cse45 + _cse27*_cse43 + _cse38*(0.000346321299837637*_cse42 + 0.517383113*_cse47 - 0.855753802*_cse48 + 0.517383113*_cse49 - 0.855753802*_cse50 - 0.000346321299837637*_cse51) + _cse39*(0.212878838804554*_cse22*_cse43 - 0.818687841791724*_cse42 - 0.212878838804554*_cse46 + 0.758601438*_cse47 + 0.458851168*_cse48 + 0.758601438*_cse49 + 0.458851168*_cse50 + 0.818687841791724*_cse51) - _cse40*_cse7 - 0.20503*_cse40 - 0.210033941789101*_cse42 - 0.0315500189858492*_cse46 - 0.0189192713225*_cse47 - 0.01084270231829*_cse48 - 0.0189192713225*_cse49 - 0.01084270231829*_cse50 - 1.7324e-5
+    out[2, 0] = -_cse13*_cse4 + _cse14*_cse2 + 0.210033941789101*_cse18 + 0.210033941789101*_cse19 + 0.001950802*_cse2 + _cse26*_cse53 + _cse27*_cse55 + _cse38*(-0.000346321299837637*_cse18 - 0.000346321299837637*_cse19 + 0.517383113*_cse28*_cse55 + 0.517383113*_cse32*_cse53 - 0.855753802*_cse57 - 0.855753802*_cse60) + _cse39*(0.818687841791724*_cse18 + 0.818687841791724*_cse19 - 0.212878838804554*_cse54 + 0.212878838804554*_cse56 + 0.458851168*_cse57 + 0.758601438*_cse58 + 0.758601438*_cse59 + 0.458851168*_cse60) - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + 0.0038906673398998*_cse52 - 0.0315500189858492*_cse54 + 0.0315500189858492*_cse56 - 0.01084270231829*_cse57 - 0.0189192713225*_cse58 - 0.0189192713225*_cse59 - 0.01084270231829*_cse60 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# link5[0,0,0]_J
+def function37(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = math.sin(q3)
+    _cse24 = 6.57617443000635e-7*_cse1
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse11*_cse25 - _cse24 + _cse25*_cse6
+    _cse27 = _cse23*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse23
+    _cse29 = -_cse28
+    _cse30 = _cse22*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse23
+    _cse32 = _cse26*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse23
+    _cse34 = _cse26*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse23
+    _cse36 = _cse22*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse23
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse23
+    _cse39 = -_cse38
+    _cse40 = math.sin(q4)
+    _cse41 = math.cos(q4)
+    _cse42 = -0.012272*_cse40 - 0.00052974*_cse41
+    _cse43 = _cse0*_cse2
+    _cse44 = _cse43*_cse8
+    _cse45 = 0.000346321299837637*_cse10 + 0.517383113*_cse30 - 0.855753802*_cse32 + 0.517383113*_cse34 - 0.855753802*_cse36 - 0.000346321299837637*_cse44
+    _cse46 = 0.00052974*_cse40 - 0.012272*_cse41
+    _cse47 = -_cse46
+    _cse48 = _cse19*_cse22
+    _cse49 = -0.818687841791724*_cse10 - 0.212878838804554*_cse27 + 0.758601438*_cse30 + 0.458851168*_cse32 + 0.758601438*_cse34 + 0.458851168*_cse36 + 0.818687841791724*_cse44 + 0.212878838804554*_cse48
+    _cse50 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse51 = 0.818687841791724*_cse6
+    _cse52 = _cse1*_cse51
+    _cse53 = 0.818687841791724*_cse11
+    _cse54 = _cse1*_cse53
+    _cse55 = _cse2*_cse8
+    _cse56 = _cse4*_cse5
+    _cse57 = _cse24*_cse55 - _cse24*_cse56
+    _cse58 = _cse20*_cse55 - _cse20*_cse56
+    _cse59 = _cse23*_cse58
+    _cse60 = _cse29*_cse57
+    _cse61 = _cse35*_cse57
+    _cse62 = _cse31*_cse58
+    _cse63 = _cse33*_cse58
+    _cse64 = 0.000346321299837637*_cse11
+    _cse65 = 0.000346321299837637*_cse6
+    _cse66 = _cse1*_cse64 + _cse1*_cse65
+    _cse67 = _cse1*_cse2
+    _cse68 = _cse67*_cse8
+    _cse69 = 0.210033941789101*_cse1
+    _cse70 = _cse1*_cse4
+    _cse71 = _cse5*_cse70
+    _cse72 = _cse11*_cse69 + _cse17*_cse67 + _cse6*_cse69 + 0.0038906673398998*_cse68 - 0.0038906673398998*_cse71
+    _cse73 = -_cse58
+    _cse74 = _cse23*_cse73
+    _cse75 = -_cse57
+    _cse76 = _cse19*_cse75
+    _cse77 = _cse31*_cse73
+    _cse78 = _cse33*_cse73
+    _cse79 = _cse29*_cse75
+    _cse80 = _cse35*_cse75
+    _cse81 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse82 = -_cse81
+    _cse83 = _cse19*_cse82
+    _cse84 = -0.999999998572139*_cse0 + _cse11*_cse24 + _cse24*_cse6
+    _cse85 = -_cse84
+    _cse86 = _cse23*_cse85
+    _cse87 = -_cse35
+    _cse88 = _cse82*_cse87
+    _cse89 = _cse31*_cse85
+    _cse90 = _cse28*_cse82
+    _cse91 = _cse33*_cse85
+    _cse92 = 0.000346321299837637*_cse68
+    _cse93 = 0.000346321299837637*_cse71
+    _cse94 = _cse29*_cse85
+    _cse95 = _cse31*_cse82
+    _cse96 = _cse33*_cse82
+    _cse97 = _cse35*_cse85
+    _cse98 = _cse92 - _cse93 + 0.517383113*_cse94 - 0.855753802*_cse95 + 0.517383113*_cse96 - 0.855753802*_cse97
+    _cse99 = 0.818687841791724*_cse68
+    _cse100 = 0.818687841791724*_cse71
+    _cse101 = 0.212878838804554*_cse23
+    _cse102 = 0.212878838804554*_cse19
+    _cse103 = _cse100 - _cse101*_cse82 + _cse102*_cse85 + 0.758601438*_cse94 + 0.458851168*_cse95 + 0.758601438*_cse96 + 0.458851168*_cse97 - _cse99
+    _cse104 = 0.0315500189858492*_cse23
+    _cse105 = _cse29*_cse84
+    _cse106 = _cse31*_cse81
+    _cse107 = _cse33*_cse81
+    _cse108 = _cse35*_cse84
+    _cse109 = _cse0*_cse51
+    _cse110 = _cse0*_cse53
+    _cse111 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse25*_cse55
+    _cse112 = -_cse111
+    _cse113 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse55
+    _cse114 = -_cse113
+    _cse115 = _cse112*_cse31
+    _cse116 = _cse112*_cse33
+    _cse117 = _cse114*_cse29
+    _cse118 = _cse114*_cse35
+    _cse119 = _cse0*_cse64 + _cse0*_cse65
+    _cse120 = 0.0315500189858492*_cse19
+    _cse121 = 0.210033941789101*_cse0
+    _cse122 = -0.0038906673398998*_cse10 + _cse11*_cse121 + _cse121*_cse6 + _cse17*_cse43 + 0.0038906673398998*_cse44
+    _cse123 = _cse113*_cse29
+    _cse124 = _cse113*_cse35
+    _cse125 = _cse111*_cse31
+    _cse126 = _cse111*_cse33
+    _cse127 = _cse26*_cse87
+    _cse128 = _cse22*_cse31
+    _cse129 = _cse26*_cse28
+    _cse130 = _cse22*_cse33
+    _cse131 = 0.818687841791724*_cse55
+    _cse132 = 0.818687841791724*_cse56
+    _cse133 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse134 = -_cse133
+    _cse135 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse136 = -_cse135
+    _cse137 = _cse134*_cse31
+    _cse138 = _cse134*_cse33
+    _cse139 = _cse136*_cse29
+    _cse140 = _cse136*_cse35
+    _cse141 = -0.000346321299837637*_cse55 + 0.000346321299837637*_cse56
+    _cse142 = _cse12 + _cse18 - 0.210033941789101*_cse55 + 0.210033941789101*_cse56 + _cse7
+    _cse143 = _cse135*_cse29
+    _cse144 = _cse135*_cse35
+    _cse145 = _cse133*_cse31
+    _cse146 = _cse133*_cse33
+    _cse147 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse55
+    _cse148 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse55
+    _cse149 = _cse147*_cse87
+    _cse150 = _cse147*_cse28
+    _cse151 = _cse148*_cse31
+    _cse152 = _cse148*_cse33
+    _cse153 = _cse147*_cse31
+    _cse154 = _cse148*_cse35
+    _cse155 = 0.517383113*_cse147*_cse33 + 0.517383113*_cse148*_cse29 - 0.855753802*_cse153 - 0.855753802*_cse154 - _cse64 - _cse65
+    _cse156 = _cse147*_cse33
+    _cse157 = _cse148*_cse29
+    _cse158 = -_cse101*_cse147 + _cse102*_cse148 + 0.458851168*_cse153 + 0.458851168*_cse154 + 0.758601438*_cse156 + 0.758601438*_cse157 + _cse51 + _cse53
+    _cse159 = _cse23*_cse82
+    _cse160 = _cse19*_cse85
+    _cse161 = 0.410149995883665*_cse40
+    _cse162 = -0.324483922899196*_cse40 + 0.186867681620663*_cse41
+    _cse163 = 0.0845234292360949*_cse40 + 0.186654664878584*_cse41
+    _cse164 = 0.410149995883665*_cse41
+    _cse165 = 0.186867681620663*_cse40 + 0.324483922899196*_cse41
+    _cse166 = 0.186654664878584*_cse40 - 0.0845234292360949*_cse41
+    _cse167 = _cse147*_cse23
+    _cse168 = _cse148*_cse19
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.210033941789101*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.210033941789101*_cse10 + 0.0315500189858492*_cse19*_cse22 + _cse22*_cse39 + _cse26*_cse37 - 0.0315500189858492*_cse27 - 0.0189192713225*_cse30 - 0.01084270231829*_cse32 - 0.0189192713225*_cse34 - 0.01084270231829*_cse36 + _cse42*_cse45 + _cse47*_cse49
+    out[0, 1] = _cse1*_cse15*_cse4 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse1*_cse50 + 0.0315500189858492*_cse19*_cse57 + _cse37*_cse58 + _cse39*_cse57 + _cse42*(0.517383113*_cse60 - 0.855753802*_cse61 - 0.855753802*_cse62 + 0.517383113*_cse63 + _cse66) + _cse47*(0.212878838804554*_cse19*_cse57 - _cse52 - _cse54 - 0.212878838804554*_cse59 + 0.758601438*_cse60 + 0.458851168*_cse61 + 0.458851168*_cse62 + 0.758601438*_cse63) - 0.0315500189858492*_cse59 - 0.0189192713225*_cse60 - 0.01084270231829*_cse61 - 0.01084270231829*_cse62 - 0.0189192713225*_cse63 - _cse72
+    out[0, 2] = _cse14*_cse70 + _cse37*_cse73 + _cse39*_cse75 + _cse42*(0.517383113*_cse29*_cse75 + 0.517383113*_cse33*_cse73 - _cse66 - 0.855753802*_cse77 - 0.855753802*_cse80) + _cse47*(_cse52 + _cse54 - 0.212878838804554*_cse74 + 0.212878838804554*_cse76 + 0.458851168*_cse77 + 0.758601438*_cse78 + 0.758601438*_cse79 + 0.458851168*_cse80) + _cse72 - 0.0315500189858492*_cse74 + 0.0315500189858492*_cse76 - 0.01084270231829*_cse77 - 0.0189192713225*_cse78 - 0.0189192713225*_cse79 - 0.01084270231829*_cse80
+    out[0, 3] = _cse37*_cse85 + _cse38*_cse82 + _cse42*(0.517383113*_cse28*_cse82 + 0.517383113*_cse33*_cse85 - 0.855753802*_cse88 - 0.855753802*_cse89) + _cse47*(-0.212878838804554*_cse83 - 0.212878838804554*_cse86 + 0.458851168*_cse88 + 0.458851168*_cse89 + 0.758601438*_cse90 + 0.758601438*_cse91) - 0.0315500189858492*_cse83 - 0.0315500189858492*_cse86 - 0.01084270231829*_cse88 - 0.01084270231829*_cse89 - 0.0189192713225*_cse90 - 0.0189192713225*_cse91
+    out[0, 4] = _cse103*_cse42 + _cse46*_cse98
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.210033941789101*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 - _cse104*_cse81 - 0.0189192713225*_cse105 - 0.01084270231829*_cse106 - 0.0189192713225*_cse107 - 0.01084270231829*_cse108 + 0.0315500189858492*_cse19*_cse84 + _cse37*_cse81 + _cse39*_cse84 + _cse42*(0.517383113*_cse105 - 0.855753802*_cse106 + 0.517383113*_cse107 - 0.855753802*_cse108 - _cse92 + _cse93) + _cse47*(-_cse100 - _cse101*_cse81 + _cse102*_cse84 + 0.758601438*_cse105 + 0.458851168*_cse106 + 0.758601438*_cse107 + 0.458851168*_cse108 + _cse99) - 0.210033941789101*_cse71
+    out[1, 1] = _cse0*_cse50 - _cse104*_cse112 + _cse112*_cse37 + _cse114*_cse120 + _cse114*_cse39 - 0.01084270231829*_cse115 - 0.0189192713225*_cse116 - 0.0189192713225*_cse117 - 0.01084270231829*_cse118 + _cse122 - _cse15*_cse9 + _cse42*(0.517383113*_cse112*_cse33 + 0.517383113*_cse114*_cse29 - 0.855753802*_cse115 - 0.855753802*_cse118 - _cse119) - 1.098e-6*_cse43 + _cse47*(-_cse101*_cse112 + _cse102*_cse114 + _cse109 + _cse110 + 0.458851168*_cse115 + 0.758601438*_cse116 + 0.758601438*_cse117 + 0.458851168*_cse118) - 0.20503*_cse9
+    out[1, 2] = -_cse104*_cse111 + _cse111*_cse37 + 0.0315500189858492*_cse113*_cse19 + _cse113*_cse39 - _cse122 - 0.0189192713225*_cse123 - 0.01084270231829*_cse124 - 0.01084270231829*_cse125 - 0.0189192713225*_cse126 - _cse14*_cse9 + _cse42*(_cse119 + 0.517383113*_cse123 - 0.855753802*_cse124 - 0.855753802*_cse125 + 0.517383113*_cse126) + _cse47*(-_cse101*_cse111 + _cse102*_cse113 - _cse109 - _cse110 + 0.758601438*_cse123 + 0.458851168*_cse124 + 0.458851168*_cse125 + 0.758601438*_cse126)
+    out[1, 3] = -_cse104*_cse22 - _cse120*_cse26 - 0.01084270231829*_cse127 - 0.01084270231829*_cse128 - 0.0189192713225*_cse129 - 0.0189192713225*_cse130 + _cse22*_cse37 + _cse26*_cse38 + _cse42*(-0.855753802*_cse127 - 0.855753802*_cse128 + 0.517383113*_cse22*_cse33 + 0.517383113*_cse26*_cse28) + _cse47*(-_cse101*_cse22 - _cse102*_cse26 + 0.458851168*_cse127 + 0.458851168*_cse128 + 0.758601438*_cse129 + 0.758601438*_cse130)
+    out[1, 4] = _cse42*_cse49 + _cse45*_cse46
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse104*_cse134 + _cse120*_cse136 + _cse134*_cse37 + _cse136*_cse39 - 0.01084270231829*_cse137 - 0.0189192713225*_cse138 - 0.0189192713225*_cse139 - 0.01084270231829*_cse140 + _cse142 + _cse16 + 0.41405*_cse2 + 0.001950802*_cse4 + _cse42*(0.517383113*_cse134*_cse33 + 0.517383113*_cse136*_cse29 - 0.855753802*_cse137 - 0.855753802*_cse140 - _cse141) + _cse47*(-_cse101*_cse134 + _cse102*_cse136 - _cse131 + _cse132 + 0.458851168*_cse137 + 0.758601438*_cse138 + 0.758601438*_cse139 + 0.458851168*_cse140)
+    out[2, 2] = -_cse104*_cse133 + _cse133*_cse37 + 0.0315500189858492*_cse135*_cse19 + _cse135*_cse39 + _cse14*_cse2 - _cse142 - 0.0189192713225*_cse143 - 0.01084270231829*_cse144 - 0.01084270231829*_cse145 - 0.0189192713225*_cse146 + _cse42*(_cse141 + 0.517383113*_cse143 - 0.855753802*_cse144 - 0.855753802*_cse145 + 0.517383113*_cse146) + _cse47*(-_cse101*_cse133 + _cse102*_cse135 + _cse131 - _cse132 + 0.758601438*_cse143 + 0.458851168*_cse144 + 0.458851168*_cse145 + 0.758601438*_cse146)
+    out[2, 3] = -_cse104*_cse148 - _cse120*_cse147 + _cse147*_cse38 + _cse148*_cse37 - 0.01084270231829*_cse149 - 0.0189192713225*_cse150 - 0.01084270231829*_cse151 - 0.0189192713225*_cse152 + _cse42*(0.517383113*_cse147*_cse28 + 0.517383113*_cse148*_cse33 - 0.855753802*_cse149 - 0.855753802*_cse151) + _cse47*(-_cse101*_cse148 - _cse102*_cse147 + 0.458851168*_cse149 + 0.758601438*_cse150 + 0.458851168*_cse151 + 0.758601438*_cse152)
+    out[2, 4] = _cse155*_cse46 + _cse158*_cse42
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse68 - _cse71
+    out[3, 4] = 0.408002994597976*_cse159 - 0.408002994597976*_cse160 + 0.574238819026787*_cse68 - 0.574238819026787*_cse71 + 0.3960285*_cse94 + 0.239041914*_cse95 + 0.3960285*_cse96 + 0.239041914*_cse97
+    out[3, 5] = -_cse103*_cse164 - _cse103*_cse165 + _cse103*_cse166 + 0.234017800844203*_cse159 - 0.234017800844203*_cse160 + _cse161*_cse98 - _cse162*_cse98 + _cse163*_cse98 + 0.329365488408814*_cse68 - 0.329365488408814*_cse71 + 0.227149603970304*_cse94 + 0.137106991283212*_cse95 + 0.227149603970304*_cse96 + 0.137106991283212*_cse97
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse44
+    out[4, 4] = 0.574238819026787*_cse10 + 0.408002994597976*_cse27 + 0.3960285*_cse30 + 0.239041914*_cse32 + 0.3960285*_cse34 + 0.239041914*_cse36 - 0.574238819026787*_cse44 - 0.408002994597976*_cse48
+    out[4, 5] = 0.329365488408814*_cse10 + _cse161*_cse45 - _cse162*_cse45 + _cse163*_cse45 - _cse164*_cse49 - _cse165*_cse49 + _cse166*_cse49 + 0.234017800844203*_cse27 + 0.227149603970304*_cse30 + 0.137106991283212*_cse32 + 0.227149603970304*_cse34 + 0.137106991283212*_cse36 - 0.329365488408814*_cse44 - 0.234017800844203*_cse48
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + 0.239041914*_cse153 + 0.239041914*_cse154 + 0.3960285*_cse156 + 0.3960285*_cse157 + 0.408002994597976*_cse167 - 0.408002994597976*_cse168 - 0.574238819026787*_cse6
+    out[5, 5] = -0.329365488408814*_cse11 + 0.137106991283212*_cse153 + 0.137106991283212*_cse154 + _cse155*_cse161 - _cse155*_cse162 + _cse155*_cse163 + 0.227149603970304*_cse156 + 0.227149603970304*_cse157 - _cse158*_cse164 - _cse158*_cse165 + _cse158*_cse166 + 0.234017800844203*_cse167 - 0.234017800844203*_cse168 - 0.329365488408814*_cse6
+    return out
+
+
+# link5[0,0,0]_dJ
+def function38(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q4)
+    _cse1 = math.cos(q4)
+    _cse2 = 0.00052974*_cse0 - 0.012272*_cse1
+    _cse3 = math.cos(q0)
+    _cse4 = 6.57617443000635e-7*_cse3
+    _cse5 = math.sin(q0)
+    _cse6 = 0.999999998572139*_cse5
+    _cse7 = math.sin(q1)
+    _cse8 = math.sin(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = math.cos(q1)
+    _cse11 = math.cos(q2)
+    _cse12 = _cse10*_cse11
+    _cse13 = _cse12*_cse6 + _cse6*_cse9
+    _cse14 = _cse13 - _cse4
+    _cse15 = math.sin(q3)
+    _cse16 = math.cos(q3)
+    _cse17 = 0.75940555*_cse15 - 0.51802699*_cse16
+    _cse18 = _cse14*_cse17
+    _cse19 = 0.999999998572139*_cse3
+    _cse20 = 6.57617443000635e-7*_cse5
+    _cse21 = _cse12*_cse20 + _cse20*_cse9
+    _cse22 = _cse19 + _cse21
+    _cse23 = 0.51802699*_cse15 + 0.75940555*_cse16
+    _cse24 = -_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = 0.45991232*_cse15 + 0.85536427*_cse16
+    _cse27 = _cse14*_cse26
+    _cse28 = 0.85536427*_cse15 - 0.45991232*_cse16
+    _cse29 = _cse22*_cse28
+    _cse30 = _cse10*_cse8
+    _cse31 = 0.000346321299837637*_cse30
+    _cse32 = _cse31*_cse5
+    _cse33 = _cse11*_cse7
+    _cse34 = 0.000346321299837637*_cse33
+    _cse35 = _cse34*_cse5
+    _cse36 = _cse32 - _cse35
+    _cse37 = 0.517383113*_cse18 + 0.517383113*_cse25 - 0.855753802*_cse27 - 0.855753802*_cse29 + _cse36
+    _cse38 = 0.012272*_cse0 + 0.00052974*_cse1
+    _cse39 = -_cse38
+    _cse40 = 0.212878838804554*_cse16
+    _cse41 = _cse22*_cse40
+    _cse42 = 0.212878838804554*_cse15
+    _cse43 = _cse14*_cse42
+    _cse44 = 0.818687841791724*_cse33
+    _cse45 = _cse44*_cse5
+    _cse46 = 0.818687841791724*_cse30
+    _cse47 = _cse46*_cse5
+    _cse48 = _cse45 - _cse47
+    _cse49 = 0.758601438*_cse18 + 0.758601438*_cse25 + 0.458851168*_cse27 + 0.458851168*_cse29 + _cse41 - _cse43 + _cse48
+    _cse50 = _cse2*_cse37 + _cse39*_cse49
+    _cse51 = _cse15*_cse22
+    _cse52 = _cse14*_cse16
+    _cse53 = -_cse28
+    _cse54 = _cse14*_cse53
+    _cse55 = _cse22*_cse26
+    _cse56 = _cse14*_cse23
+    _cse57 = _cse17*_cse22
+    _cse58 = 0.012581*_cse15 + 0.00040053*_cse16
+    _cse59 = -_cse58
+    _cse60 = 0.00040053*_cse15 - 0.012581*_cse16
+    _cse61 = 0.517383113*_cse14*_cse23 + 0.517383113*_cse17*_cse22 - 0.855753802*_cse54 - 0.855753802*_cse55
+    _cse62 = -_cse2
+    _cse63 = -0.212878838804554*_cse51 - 0.212878838804554*_cse52 + 0.458851168*_cse54 + 0.458851168*_cse55 + 0.758601438*_cse56 + 0.758601438*_cse57
+    _cse64 = _cse14*_cse60 + _cse22*_cse59 + _cse39*_cse61 - 0.0315500189858492*_cse51 - 0.0315500189858492*_cse52 - 0.01084270231829*_cse54 - 0.01084270231829*_cse55 - 0.0189192713225*_cse56 - 0.0189192713225*_cse57 + _cse62*_cse63
+    _cse65 = _cse5*_cse7
+    _cse66 = _cse65*_cse8
+    _cse67 = 0.818687841791724*_cse66
+    _cse68 = _cse10*_cse5
+    _cse69 = _cse11*_cse68
+    _cse70 = 0.818687841791724*_cse69
+    _cse71 = -6.57617443000635e-7*_cse10*_cse5*_cse8 + _cse20*_cse33
+    _cse72 = _cse16*_cse71
+    _cse73 = -0.999999998572139*_cse10*_cse5*_cse8 + _cse33*_cse6
+    _cse74 = _cse15*_cse73
+    _cse75 = _cse24*_cse71
+    _cse76 = _cse28*_cse71
+    _cse77 = _cse26*_cse73
+    _cse78 = _cse17*_cse73
+    _cse79 = -_cse67 - _cse70 + 0.212878838804554*_cse72 - 0.212878838804554*_cse74 + 0.758601438*_cse75 + 0.458851168*_cse76 + 0.458851168*_cse77 + 0.758601438*_cse78
+    _cse80 = -_cse60
+    _cse81 = 0.000346321299837637*_cse66 + 0.000346321299837637*_cse69
+    _cse82 = 0.517383113*_cse75 - 0.855753802*_cse76 - 0.855753802*_cse77 + 0.517383113*_cse78 + _cse81
+    _cse83 = 0.081945*_cse11 + 0.00048786*_cse8
+    _cse84 = _cse10*_cse83
+    _cse85 = -0.00048786*_cse11 + 0.081945*_cse8
+    _cse86 = _cse7*_cse85
+    _cse87 = 0.0038906673398998*_cse33
+    _cse88 = 0.0038906673398998*_cse30
+    _cse89 = _cse5*_cse86 + _cse5*_cse87 - _cse5*_cse88 + 0.210033941789101*_cse66 + 0.210033941789101*_cse69
+    _cse90 = 0.0315500189858492*_cse16*_cse71 + _cse39*_cse82 - _cse5*_cse84 + _cse59*_cse73 + _cse62*_cse79 + _cse71*_cse80 - 0.0315500189858492*_cse74 - 0.0189192713225*_cse75 - 0.01084270231829*_cse76 - 0.01084270231829*_cse77 - 0.0189192713225*_cse78 - _cse89
+    _cse91 = -0.20902*_cse10 + 0.0019519*_cse7
+    _cse92 = -_cse73
+    _cse93 = _cse15*_cse92
+    _cse94 = -_cse71
+    _cse95 = _cse16*_cse94
+    _cse96 = _cse26*_cse92
+    _cse97 = _cse17*_cse92
+    _cse98 = _cse24*_cse94
+    _cse99 = _cse28*_cse94
+    _cse100 = _cse67 + _cse70 - 0.212878838804554*_cse93 + 0.212878838804554*_cse95 + 0.458851168*_cse96 + 0.758601438*_cse97 + 0.758601438*_cse98 + 0.458851168*_cse99
+    _cse101 = 0.517383113*_cse17*_cse92 + 0.517383113*_cse24*_cse94 - _cse81 - 0.855753802*_cse96 - 0.855753802*_cse99
+    _cse102 = -_cse83
+    _cse103 = _cse10*_cse102
+    _cse104 = _cse100*_cse62 + _cse101*_cse39 - _cse103*_cse5 + _cse5*_cse91 + _cse59*_cse92 - 1.098e-6*_cse65 - 0.20503*_cse68 + _cse80*_cse94 + _cse89 - 0.0315500189858492*_cse93 + 0.0315500189858492*_cse95 - 0.01084270231829*_cse96 - 0.0189192713225*_cse97 - 0.0189192713225*_cse98 - 0.01084270231829*_cse99
+    _cse105 = _cse12*_cse19 + _cse19*_cse9
+    _cse106 = _cse105 + _cse20
+    _cse107 = _cse106*_cse17
+    _cse108 = _cse12*_cse4 + _cse4*_cse9
+    _cse109 = _cse108 - _cse6
+    _cse110 = _cse109*_cse24
+    _cse111 = _cse109*_cse16
+    _cse112 = _cse106*_cse26
+    _cse113 = _cse109*_cse28
+    _cse114 = _cse106*_cse15
+    _cse115 = _cse3*_cse44
+    _cse116 = _cse3*_cse46
+    _cse117 = _cse115 - _cse116
+    _cse118 = 0.758601438*_cse107 + 0.758601438*_cse110 + 0.212878838804554*_cse111 + 0.458851168*_cse112 + 0.458851168*_cse113 - 0.212878838804554*_cse114 + _cse117
+    _cse119 = 0.0019519*_cse10 + 0.20902*_cse7
+    _cse120 = -_cse119
+    _cse121 = _cse3*_cse31
+    _cse122 = _cse3*_cse34
+    _cse123 = _cse121 - _cse122
+    _cse124 = 0.517383113*_cse107 + 0.517383113*_cse110 - 0.855753802*_cse112 - 0.855753802*_cse113 + _cse123
+    _cse125 = _cse10*_cse3
+    _cse126 = _cse125*_cse85
+    _cse127 = _cse11*_cse125
+    _cse128 = 0.0038906673398998*_cse127
+    _cse129 = _cse3*_cse7
+    _cse130 = _cse129*_cse8
+    _cse131 = 0.0038906673398998*_cse130
+    _cse132 = _cse3*_cse30
+    _cse133 = 0.210033941789101*_cse132
+    _cse134 = _cse3*_cse33
+    _cse135 = -0.210033941789101*_cse134
+    _cse136 = -1.098e-6*_cse10*_cse3 + _cse102*_cse129 + _cse126 + _cse128 + 0.20503*_cse129 + _cse131 + _cse133 + _cse135
+    _cse137 = -_cse19*_cse30 + _cse19*_cse33
+    _cse138 = _cse137*_cse17
+    _cse139 = -_cse30*_cse4 + _cse33*_cse4
+    _cse140 = _cse139*_cse24
+    _cse141 = _cse137*_cse26
+    _cse142 = _cse139*_cse28
+    _cse143 = 0.000346321299837637*_cse127 + 0.000346321299837637*_cse130
+    _cse144 = 0.517383113*_cse138 + 0.517383113*_cse140 - 0.855753802*_cse141 - 0.855753802*_cse142 + _cse143
+    _cse145 = 0.818687841791724*_cse130
+    _cse146 = 0.818687841791724*_cse127
+    _cse147 = -_cse137*_cse42 + 0.758601438*_cse138 + _cse139*_cse40 + 0.758601438*_cse140 + 0.458851168*_cse141 + 0.458851168*_cse142 - _cse145 - _cse146
+    _cse148 = _cse144*_cse2 + _cse147*_cse39
+    _cse149 = 0.0315500189858492*_cse15
+    _cse150 = 0.0315500189858492*_cse16
+    _cse151 = _cse139*_cse26
+    _cse152 = _cse139*_cse17
+    _cse153 = _cse137*_cse53
+    _cse154 = _cse137*_cse23
+    _cse155 = -_cse137*_cse150 + _cse137*_cse60 - _cse139*_cse149 + _cse139*_cse59 - 0.01084270231829*_cse151 - 0.0189192713225*_cse152 - 0.01084270231829*_cse153 - 0.0189192713225*_cse154 + _cse39*(0.517383113*_cse137*_cse23 + 0.517383113*_cse139*_cse17 - 0.855753802*_cse151 - 0.855753802*_cse153) + _cse62*(-_cse137*_cse40 - _cse139*_cse42 + 0.458851168*_cse151 + 0.758601438*_cse152 + 0.458851168*_cse153 + 0.758601438*_cse154)
+    _cse156 = -_cse105
+    _cse157 = _cse156*_cse17
+    _cse158 = -_cse108
+    _cse159 = _cse158*_cse24
+    _cse160 = _cse156*_cse26
+    _cse161 = _cse158*_cse28
+    _cse162 = -_cse115 + _cse116
+    _cse163 = _cse128 - _cse129*_cse83 + _cse131 + _cse133 + _cse135
+    _cse164 = _cse126 - _cse149*_cse156 + _cse150*_cse158 + _cse156*_cse59 - 0.0189192713225*_cse157 + _cse158*_cse80 - 0.0189192713225*_cse159 - 0.01084270231829*_cse160 - 0.01084270231829*_cse161 + _cse163 + _cse39*(-_cse123 + 0.517383113*_cse156*_cse17 + 0.517383113*_cse158*_cse24 - 0.855753802*_cse160 - 0.855753802*_cse161) + _cse62*(-_cse156*_cse42 + 0.758601438*_cse157 + _cse158*_cse40 + 0.758601438*_cse159 + 0.458851168*_cse160 + 0.458851168*_cse161 + _cse162)
+    _cse165 = _cse105*_cse17
+    _cse166 = _cse108*_cse24
+    _cse167 = _cse105*_cse26
+    _cse168 = _cse108*_cse28
+    _cse169 = _cse105*_cse149 - _cse105*_cse59 - 0.0315500189858492*_cse108*_cse16 - _cse108*_cse80 + 0.0189192713225*_cse165 + 0.0189192713225*_cse166 + 0.01084270231829*_cse167 + 0.01084270231829*_cse168 - _cse39*(_cse123 + 0.517383113*_cse165 + 0.517383113*_cse166 - 0.855753802*_cse167 - 0.855753802*_cse168) - _cse62*(-_cse105*_cse42 + _cse108*_cse40 + _cse117 + 0.758601438*_cse165 + 0.758601438*_cse166 + 0.458851168*_cse167 + 0.458851168*_cse168)
+    _cse170 = -_cse137
+    _cse171 = _cse170*_cse26
+    _cse172 = -_cse139
+    _cse173 = _cse172*_cse28
+    _cse174 = -_cse143 + 0.517383113*_cse17*_cse170 - 0.855753802*_cse171 + 0.517383113*_cse172*_cse24 - 0.855753802*_cse173
+    _cse175 = _cse17*_cse170
+    _cse176 = _cse172*_cse24
+    _cse177 = _cse145 + _cse146 - _cse170*_cse42 + 0.458851168*_cse171 + _cse172*_cse40 + 0.458851168*_cse173 + 0.758601438*_cse175 + 0.758601438*_cse176
+    _cse178 = _cse174*_cse2 + _cse177*_cse39
+    _cse179 = _cse170*_cse53
+    _cse180 = _cse170*_cse23
+    _cse181 = _cse172*_cse26
+    _cse182 = _cse17*_cse172
+    _cse183 = -_cse149*_cse172 - _cse150*_cse170 + _cse170*_cse60 + _cse172*_cse59 - 0.01084270231829*_cse179 - 0.0189192713225*_cse180 - 0.01084270231829*_cse181 - 0.0189192713225*_cse182 + _cse39*(0.517383113*_cse17*_cse172 + 0.517383113*_cse170*_cse23 - 0.855753802*_cse179 - 0.855753802*_cse181) + _cse62*(-_cse170*_cse40 - _cse172*_cse42 + 0.458851168*_cse179 + 0.758601438*_cse180 + 0.458851168*_cse181 + 0.758601438*_cse182)
+    _cse184 = -_cse85
+    _cse185 = -_cse106
+    _cse186 = _cse185*_cse53
+    _cse187 = -_cse109
+    _cse188 = _cse187*_cse26
+    _cse189 = 0.517383113*_cse17*_cse187 + 0.517383113*_cse185*_cse23 - 0.855753802*_cse186 - 0.855753802*_cse188
+    _cse190 = _cse185*_cse23
+    _cse191 = _cse17*_cse187
+    _cse192 = -_cse185*_cse40 + 0.458851168*_cse186 - _cse187*_cse42 + 0.458851168*_cse188 + 0.758601438*_cse190 + 0.758601438*_cse191
+    _cse193 = _cse189*_cse2 + _cse192*_cse39
+    _cse194 = _cse187*_cse53
+    _cse195 = -_cse17
+    _cse196 = _cse185*_cse195
+    _cse197 = -_cse26
+    _cse198 = _cse185*_cse197
+    _cse199 = _cse187*_cse23
+    _cse200 = _cse185*_cse42
+    _cse201 = _cse187*_cse40
+    _cse202 = _cse187*_cse24
+    _cse203 = _cse185*_cse26
+    _cse204 = _cse17*_cse185
+    _cse205 = _cse187*_cse28
+    _cse206 = -_cse121 + _cse122 + 0.517383113*_cse202 - 0.855753802*_cse203 + 0.517383113*_cse204 - 0.855753802*_cse205
+    _cse207 = _cse162 - _cse200 + _cse201 + 0.758601438*_cse202 + 0.458851168*_cse203 + 0.758601438*_cse204 + 0.458851168*_cse205
+    _cse208 = _cse118*_cse39 + _cse124*_cse2
+    _cse209 = _cse106*_cse53
+    _cse210 = _cse109*_cse26
+    _cse211 = _cse106*_cse23
+    _cse212 = _cse109*_cse17
+    _cse213 = -_cse106*_cse150 + _cse106*_cse60 - _cse109*_cse149 + _cse109*_cse59 - 0.01084270231829*_cse209 - 0.01084270231829*_cse210 - 0.0189192713225*_cse211 - 0.0189192713225*_cse212 + _cse39*(0.517383113*_cse106*_cse23 + 0.517383113*_cse109*_cse17 - 0.855753802*_cse209 - 0.855753802*_cse210) + _cse62*(-_cse106*_cse40 - _cse109*_cse42 + 0.458851168*_cse209 + 0.458851168*_cse210 + 0.758601438*_cse211 + 0.758601438*_cse212)
+    _cse214 = 0.210033941789101*_cse127 + 0.210033941789101*_cse130 + _cse3*_cse86 + _cse3*_cse87 - _cse3*_cse88
+    _cse215 = -_cse137*_cse149 + _cse137*_cse59 - 0.0189192713225*_cse138 + 0.0315500189858492*_cse139*_cse16 + _cse139*_cse80 - 0.0189192713225*_cse140 - 0.01084270231829*_cse141 - 0.01084270231829*_cse142 + _cse144*_cse39 + _cse147*_cse62 - _cse214 - _cse3*_cse84
+    _cse216 = -_cse103*_cse3 - 0.20503*_cse125 - 1.098e-6*_cse129 - _cse149*_cse170 + _cse150*_cse172 + _cse170*_cse59 - 0.01084270231829*_cse171 + _cse172*_cse80 - 0.01084270231829*_cse173 + _cse174*_cse39 - 0.0189192713225*_cse175 - 0.0189192713225*_cse176 + _cse177*_cse62 + _cse214 + _cse3*_cse91
+    _cse217 = -_cse14
+    _cse218 = _cse17*_cse217
+    _cse219 = -_cse22
+    _cse220 = _cse219*_cse24
+    _cse221 = _cse217*_cse26
+    _cse222 = _cse219*_cse28
+    _cse223 = -_cse45 + _cse47
+    _cse224 = _cse68*_cse85
+    _cse225 = 0.0038906673398998*_cse69
+    _cse226 = 0.0038906673398998*_cse66
+    _cse227 = _cse30*_cse5
+    _cse228 = 0.210033941789101*_cse227
+    _cse229 = _cse33*_cse5
+    _cse230 = -0.210033941789101*_cse229
+    _cse231 = _cse102*_cse65 + _cse224 + _cse225 + _cse226 + _cse228 + _cse230 + 0.20503*_cse65 - 1.098e-6*_cse68
+    _cse232 = _cse100*_cse39 + _cse101*_cse2
+    _cse233 = _cse53*_cse92
+    _cse234 = _cse23*_cse92
+    _cse235 = _cse26*_cse94
+    _cse236 = _cse17*_cse94
+    _cse237 = -_cse149*_cse94 - _cse150*_cse92 - 0.01084270231829*_cse233 - 0.0189192713225*_cse234 - 0.01084270231829*_cse235 - 0.0189192713225*_cse236 + _cse39*(0.517383113*_cse17*_cse94 + 0.517383113*_cse23*_cse92 - 0.855753802*_cse233 - 0.855753802*_cse235) + _cse59*_cse94 + _cse60*_cse92 + _cse62*(0.458851168*_cse233 + 0.758601438*_cse234 + 0.458851168*_cse235 + 0.758601438*_cse236 - _cse40*_cse92 - _cse42*_cse94)
+    _cse238 = _cse13*_cse17
+    _cse239 = _cse21*_cse24
+    _cse240 = _cse13*_cse26
+    _cse241 = _cse21*_cse28
+    _cse242 = _cse225 + _cse226 + _cse228 + _cse230 - _cse65*_cse83
+    _cse243 = -_cse13*_cse149 + _cse13*_cse59 + 0.0315500189858492*_cse16*_cse21 + _cse21*_cse80 - _cse224 - 0.0189192713225*_cse238 - 0.0189192713225*_cse239 - 0.01084270231829*_cse240 - 0.01084270231829*_cse241 - _cse242 + _cse39*(0.517383113*_cse238 + 0.517383113*_cse239 - 0.855753802*_cse240 - 0.855753802*_cse241 + _cse36) + _cse62*(-_cse13*_cse42 + _cse21*_cse40 + 0.758601438*_cse238 + 0.758601438*_cse239 + 0.458851168*_cse240 + 0.458851168*_cse241 + _cse48)
+    _cse244 = -_cse13
+    _cse245 = _cse17*_cse244
+    _cse246 = -_cse21
+    _cse247 = _cse24*_cse246
+    _cse248 = _cse244*_cse26
+    _cse249 = _cse246*_cse28
+    _cse250 = -_cse149*_cse244 + _cse150*_cse246 + _cse244*_cse59 - 0.0189192713225*_cse245 + _cse246*_cse80 - 0.0189192713225*_cse247 - 0.01084270231829*_cse248 - 0.01084270231829*_cse249 + _cse39*(0.517383113*_cse17*_cse244 + 0.517383113*_cse24*_cse246 - 0.855753802*_cse248 - 0.855753802*_cse249 - _cse36) + _cse62*(_cse223 - _cse244*_cse42 + 0.758601438*_cse245 + _cse246*_cse40 + 0.758601438*_cse247 + 0.458851168*_cse248 + 0.458851168*_cse249)
+    _cse251 = _cse2*_cse82 + _cse39*_cse79
+    _cse252 = _cse26*_cse71
+    _cse253 = _cse17*_cse71
+    _cse254 = _cse53*_cse73
+    _cse255 = _cse23*_cse73
+    _cse256 = -_cse149*_cse71 - _cse150*_cse73 - 0.01084270231829*_cse252 - 0.0189192713225*_cse253 - 0.01084270231829*_cse254 - 0.0189192713225*_cse255 + _cse39*(0.517383113*_cse17*_cse71 + 0.517383113*_cse23*_cse73 - 0.855753802*_cse252 - 0.855753802*_cse254) + _cse59*_cse71 + _cse60*_cse73 + _cse62*(0.458851168*_cse252 + 0.758601438*_cse253 + 0.458851168*_cse254 + 0.758601438*_cse255 - _cse40*_cse73 - _cse42*_cse71)
+    _cse257 = _cse2*_cse61 + _cse39*_cse63
+    _cse258 = _cse22*_cse53
+    _cse259 = _cse14*_cse195
+    _cse260 = _cse14*_cse197
+    _cse261 = _cse22*_cse23
+    _cse262 = 0.999999998572139*_cse12 + 0.999999998572139*_cse9
+    _cse263 = -_cse262
+    _cse264 = _cse26*_cse263
+    _cse265 = 6.57617443000635e-7*_cse12 + 6.57617443000635e-7*_cse9
+    _cse266 = -_cse265
+    _cse267 = _cse266*_cse28
+    _cse268 = _cse31 - _cse34
+    _cse269 = 0.517383113*_cse17*_cse263 + 0.517383113*_cse24*_cse266 - 0.855753802*_cse264 - 0.855753802*_cse267 - _cse268
+    _cse270 = _cse17*_cse263
+    _cse271 = _cse24*_cse266
+    _cse272 = -_cse263*_cse42 + 0.458851168*_cse264 + _cse266*_cse40 + 0.458851168*_cse267 + 0.758601438*_cse270 + 0.758601438*_cse271 - _cse44 + _cse46
+    _cse273 = _cse2*_cse269 + _cse272*_cse39
+    _cse274 = _cse263*_cse53
+    _cse275 = _cse23*_cse263
+    _cse276 = _cse26*_cse266
+    _cse277 = _cse17*_cse266
+    _cse278 = -_cse149*_cse266 - _cse150*_cse263 + _cse263*_cse60 + _cse266*_cse59 - 0.01084270231829*_cse274 - 0.0189192713225*_cse275 - 0.01084270231829*_cse276 - 0.0189192713225*_cse277 + _cse39*(0.517383113*_cse17*_cse266 + 0.517383113*_cse23*_cse263 - 0.855753802*_cse274 - 0.855753802*_cse276) + _cse62*(-_cse263*_cse40 - _cse266*_cse42 + 0.458851168*_cse274 + 0.758601438*_cse275 + 0.458851168*_cse276 + 0.758601438*_cse277)
+    _cse279 = 0.818687841791724*_cse9
+    _cse280 = 0.818687841791724*_cse12
+    _cse281 = -0.999999998572139*_cse30 + 0.999999998572139*_cse33
+    _cse282 = -_cse281
+    _cse283 = _cse282*_cse42
+    _cse284 = -6.57617443000635e-7*_cse30 + 6.57617443000635e-7*_cse33
+    _cse285 = -_cse284
+    _cse286 = _cse285*_cse40
+    _cse287 = _cse26*_cse282
+    _cse288 = _cse17*_cse282
+    _cse289 = _cse24*_cse285
+    _cse290 = _cse28*_cse285
+    _cse291 = _cse279 + _cse280 - _cse283 + _cse286 + 0.458851168*_cse287 + 0.758601438*_cse288 + 0.758601438*_cse289 + 0.458851168*_cse290
+    _cse292 = 0.000346321299837637*_cse12 + 0.000346321299837637*_cse9
+    _cse293 = 0.517383113*_cse17*_cse282 + 0.517383113*_cse24*_cse285 - 0.855753802*_cse287 - 0.855753802*_cse290 - _cse292
+    _cse294 = -_cse149*_cse282 + _cse150*_cse285
+    _cse295 = 0.210033941789101*_cse12
+    _cse296 = 0.210033941789101*_cse9
+    _cse297 = -_cse88
+    _cse298 = _cse295 + _cse296 + _cse297 + _cse84 + _cse87
+    _cse299 = _cse282*_cse59 + _cse285*_cse80 - 0.01084270231829*_cse287 - 0.0189192713225*_cse288 - 0.0189192713225*_cse289 - 0.01084270231829*_cse290 + _cse291*_cse62 + _cse293*_cse39 + _cse294 + _cse298 + _cse86
+    _cse300 = _cse24*_cse284
+    _cse301 = _cse28*_cse284
+    _cse302 = _cse26*_cse281
+    _cse303 = _cse17*_cse281
+    _cse304 = _cse149*_cse281 - 0.0315500189858492*_cse16*_cse284 - _cse281*_cse59 - _cse284*_cse80 + 0.0189192713225*_cse300 + 0.01084270231829*_cse301 + 0.01084270231829*_cse302 + 0.0189192713225*_cse303 - _cse39*(_cse292 + 0.517383113*_cse300 - 0.855753802*_cse301 - 0.855753802*_cse302 + 0.517383113*_cse303) - _cse62*(-_cse279 - _cse280 - _cse281*_cse42 + _cse284*_cse40 + 0.758601438*_cse300 + 0.458851168*_cse301 + 0.458851168*_cse302 + 0.758601438*_cse303)
+    _cse305 = _cse17*_cse262
+    _cse306 = _cse24*_cse265
+    _cse307 = _cse26*_cse262
+    _cse308 = _cse265*_cse28
+    _cse309 = _cse268 + 0.517383113*_cse305 + 0.517383113*_cse306 - 0.855753802*_cse307 - 0.855753802*_cse308
+    _cse310 = -_cse262*_cse42 + _cse265*_cse40 + 0.758601438*_cse305 + 0.758601438*_cse306 + 0.458851168*_cse307 + 0.458851168*_cse308 + _cse44 - _cse46
+    _cse311 = _cse2*_cse309 + _cse310*_cse39
+    _cse312 = _cse26*_cse265
+    _cse313 = _cse17*_cse265
+    _cse314 = _cse262*_cse53
+    _cse315 = _cse23*_cse262
+    _cse316 = -_cse149*_cse265 - _cse150*_cse262 + _cse262*_cse60 + _cse265*_cse59 - 0.01084270231829*_cse312 - 0.0189192713225*_cse313 - 0.01084270231829*_cse314 - 0.0189192713225*_cse315 + _cse39*(0.517383113*_cse17*_cse265 + 0.517383113*_cse23*_cse262 - 0.855753802*_cse312 - 0.855753802*_cse314) + _cse62*(-_cse262*_cse40 - _cse265*_cse42 + 0.458851168*_cse312 + 0.758601438*_cse313 + 0.458851168*_cse314 + 0.758601438*_cse315)
+    _cse317 = _cse282*_cse53
+    _cse318 = _cse26*_cse285
+    _cse319 = 0.517383113*_cse17*_cse285 + 0.517383113*_cse23*_cse282 - 0.855753802*_cse317 - 0.855753802*_cse318
+    _cse320 = _cse23*_cse282
+    _cse321 = _cse17*_cse285
+    _cse322 = -_cse282*_cse40 - _cse285*_cse42 + 0.458851168*_cse317 + 0.458851168*_cse318 + 0.758601438*_cse320 + 0.758601438*_cse321
+    _cse323 = _cse2*_cse319 + _cse322*_cse39
+    _cse324 = _cse195*_cse282
+    _cse325 = _cse197*_cse282
+    _cse326 = _cse285*_cse53
+    _cse327 = _cse23*_cse285
+    _cse328 = _cse3*dq0
+    _cse329 = _cse127 + _cse130
+    _cse330 = 0.574238819026787*_cse130
+    _cse331 = 0.574238819026787*_cse127
+    _cse332 = 0.408002994597976*_cse16
+    _cse333 = 0.408002994597976*_cse15
+    _cse334 = 0.410149995883665*_cse1
+    _cse335 = 0.89059413*_cse0 - 0.40329059*_cse1
+    _cse336 = -0.209584432*_cse335
+    _cse337 = 0.45479896*_cse0 + 0.78972966*_cse1
+    _cse338 = -0.410879747*_cse337
+    _cse339 = 0.410149995883665*_cse0
+    _cse340 = -0.324483922899196*_cse0 + 0.186867681620663*_cse1
+    _cse341 = 0.0845234292360949*_cse0 + 0.186654664878584*_cse1
+    _cse342 = 0.329365488408814*_cse130
+    _cse343 = 0.329365488408814*_cse127
+    _cse344 = 0.234017800844203*_cse16
+    _cse345 = 0.234017800844203*_cse15
+    _cse346 = 0.410879747*_cse337
+    _cse347 = 0.209584432*_cse335
+    _cse348 = _cse5*dq0
+    _cse349 = _cse66 + _cse69
+    _cse350 = 0.574238819026787*_cse66
+    _cse351 = 0.574238819026787*_cse69
+    _cse352 = 0.329365488408814*_cse66
+    _cse353 = 0.329365488408814*_cse69
+    _cse354 = -_cse30 + _cse33
+    _cse355 = 0.574238819026787*_cse33
+    _cse356 = 0.574238819026787*_cse30
+    _cse357 = 0.329365488408814*_cse33
+    _cse358 = 0.329365488408814*_cse30
+    out = np.empty((6, 6))
+    out[0, 0] = _cse104*dq1 + _cse50*dq4 + _cse64*dq3 + _cse90*dq2 + dq0*(_cse106*_cse59 - 0.0189192713225*_cse107 + 0.0315500189858492*_cse109*_cse16 + _cse109*_cse80 - 0.0189192713225*_cse110 - 0.01084270231829*_cse112 - 0.01084270231829*_cse113 - 0.0315500189858492*_cse114 + _cse118*_cse62 + _cse120*_cse3 + _cse124*_cse39 - _cse136 - 4.3259e-5*_cse3 + 0.0068032576553314*_cse5)
+    out[0, 1] = _cse104*dq0 + _cse148*dq4 + _cse155*dq3 + _cse164*dq2 + dq1*(-_cse119*_cse3 - _cse136 - _cse169)
+    out[0, 2] = _cse164*dq1 + _cse178*dq4 + _cse183*dq3 + _cse90*dq0 + dq2*(_cse10*_cse184*_cse3 - _cse163 - _cse169)
+    out[0, 3] = _cse155*dq1 + _cse183*dq2 + _cse193*dq4 + _cse64*dq0 + dq3*(0.0315500189858492*_cse15*_cse185 - _cse150*_cse187 + _cse185*_cse58 + _cse187*_cse60 - 0.01084270231829*_cse194 - 0.0189192713225*_cse196 - 0.01084270231829*_cse198 - 0.0189192713225*_cse199 + _cse39*(0.517383113*_cse185*_cse195 + 0.517383113*_cse187*_cse23 - 0.855753802*_cse194 - 0.855753802*_cse198) + _cse62*(0.458851168*_cse194 + 0.758601438*_cse196 + 0.458851168*_cse198 + 0.758601438*_cse199 + _cse200 - _cse201))
+    out[0, 4] = _cse148*dq1 + _cse178*dq2 + _cse193*dq3 + _cse50*dq0 + dq4*(_cse2*_cse207 + _cse206*_cse38)
+    out[0, 5] = 0
+    out[1, 0] = _cse208*dq4 + _cse213*dq3 + _cse215*dq2 + _cse216*dq1 + dq0*(-_cse120*_cse5 - _cse149*_cse217 + _cse150*_cse219 + _cse217*_cse59 - 0.0189192713225*_cse218 + _cse219*_cse80 - 0.0189192713225*_cse220 - 0.01084270231829*_cse221 - 0.01084270231829*_cse222 + _cse231 + 0.0068032576553314*_cse3 + _cse39*(0.517383113*_cse218 + 0.517383113*_cse220 - 0.855753802*_cse221 - 0.855753802*_cse222 - _cse32 + _cse35) + 4.3259e-5*_cse5 + _cse62*(-_cse217*_cse42 + 0.758601438*_cse218 + _cse219*_cse40 + 0.758601438*_cse220 + 0.458851168*_cse221 + 0.458851168*_cse222 + _cse223))
+    out[1, 1] = _cse216*dq0 + _cse232*dq4 + _cse237*dq3 + _cse243*dq2 + dq1*(_cse119*_cse5 + _cse231 + _cse250)
+    out[1, 2] = _cse215*dq0 + _cse243*dq1 + _cse251*dq4 + _cse256*dq3 + dq2*(-_cse184*_cse68 + _cse242 + _cse250)
+    out[1, 3] = _cse213*dq0 + _cse237*dq1 + _cse256*dq2 + _cse257*dq4 + dq3*(0.0315500189858492*_cse14*_cse15 + _cse14*_cse58 - _cse150*_cse22 + _cse22*_cse60 - 0.01084270231829*_cse258 - 0.0189192713225*_cse259 - 0.01084270231829*_cse260 - 0.0189192713225*_cse261 + _cse39*(0.517383113*_cse14*_cse195 + 0.517383113*_cse22*_cse23 - 0.855753802*_cse258 - 0.855753802*_cse260) + _cse62*(0.458851168*_cse258 + 0.758601438*_cse259 + 0.458851168*_cse260 + 0.758601438*_cse261 - _cse41 + _cse43))
+    out[1, 4] = _cse208*dq0 + _cse232*dq1 + _cse251*dq2 + _cse257*dq3 + dq4*(_cse2*_cse49 + _cse37*_cse38)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse273*dq4 + _cse278*dq3 + _cse299*dq2 + dq1*(_cse10*_cse102 + 0.41405*_cse10 - _cse295 - _cse296 - _cse297 - _cse304 - 0.001950802*_cse7 - _cse86 - _cse87)
+    out[2, 2] = _cse299*dq1 + _cse311*dq4 + _cse316*dq3 + dq2*(_cse184*_cse7 - _cse298 - _cse304)
+    out[2, 3] = _cse278*dq1 + _cse316*dq2 + _cse323*dq4 + dq3*(_cse282*_cse58 + _cse285*_cse60 - _cse294 - 0.0189192713225*_cse324 - 0.01084270231829*_cse325 - 0.01084270231829*_cse326 - 0.0189192713225*_cse327 + _cse39*(0.517383113*_cse324 - 0.855753802*_cse325 - 0.855753802*_cse326 + 0.517383113*_cse327) + _cse62*(_cse283 - _cse286 + 0.758601438*_cse324 + 0.458851168*_cse325 + 0.458851168*_cse326 + 0.758601438*_cse327))
+    out[2, 4] = _cse273*dq1 + _cse311*dq2 + _cse323*dq3 + dq4*(_cse2*_cse291 + _cse293*_cse38)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse328
+    out[3, 2] = _cse328
+    out[3, 3] = _cse329*dq1 - _cse329*dq2 + dq0*(_cse10*_cse5*_cse8 - _cse229)
+    out[3, 4] = dq0*(_cse14*_cse333 + 0.3960285*_cse18 - _cse22*_cse332 + 0.574238819026787*_cse227 - 0.574238819026787*_cse229 + 0.3960285*_cse25 + 0.239041914*_cse27 + 0.239041914*_cse29) + dq1*(_cse137*_cse333 + 0.3960285*_cse138 - _cse139*_cse332 + 0.3960285*_cse140 + 0.239041914*_cse141 + 0.239041914*_cse142 + _cse330 + _cse331) + dq2*(_cse170*_cse333 + 0.239041914*_cse171 - _cse172*_cse332 + 0.239041914*_cse173 + 0.3960285*_cse175 + 0.3960285*_cse176 - _cse330 - _cse331) + dq3*(_cse185*_cse332 + 0.239041914*_cse186 + _cse187*_cse333 + 0.239041914*_cse188 + 0.3960285*_cse190 + 0.3960285*_cse191)
+    out[3, 5] = dq0*(_cse14*_cse345 + 0.227149603970304*_cse18 - _cse22*_cse344 + 0.329365488408814*_cse227 - 0.329365488408814*_cse229 + 0.227149603970304*_cse25 + 0.137106991283212*_cse27 + 0.137106991283212*_cse29 - _cse334*_cse49 + _cse339*_cse37 - _cse340*_cse37 + _cse341*_cse37 - _cse346*_cse49 + _cse347*_cse49) + dq1*(_cse137*_cse345 + 0.227149603970304*_cse138 - _cse139*_cse344 + 0.227149603970304*_cse140 + 0.137106991283212*_cse141 + 0.137106991283212*_cse142 + _cse144*_cse339 - _cse144*_cse340 + _cse144*_cse341 - _cse147*_cse334 - _cse147*_cse346 + _cse147*_cse347 + _cse342 + _cse343) + dq2*(_cse170*_cse345 + 0.137106991283212*_cse171 - _cse172*_cse344 + 0.137106991283212*_cse173 + _cse174*_cse339 - _cse174*_cse340 + _cse174*_cse341 + 0.227149603970304*_cse175 + 0.227149603970304*_cse176 - _cse177*_cse334 - _cse177*_cse346 + _cse177*_cse347 - _cse342 - _cse343) + dq3*(_cse185*_cse344 + 0.137106991283212*_cse186 + _cse187*_cse345 + 0.137106991283212*_cse188 + _cse189*_cse339 - _cse189*_cse340 + _cse189*_cse341 + 0.227149603970304*_cse190 + 0.227149603970304*_cse191 - _cse192*_cse334 - _cse192*_cse346 + _cse192*_cse347) + dq4*(_cse206*_cse334 + _cse206*_cse336 - _cse206*_cse338 + _cse207*_cse339 - _cse207*_cse340 + _cse207*_cse341)
+    out[4, 0] = 0
+    out[4, 1] = _cse348
+    out[4, 2] = -_cse348
+    out[4, 3] = -_cse349*dq1 + _cse349*dq2 + dq0*(_cse10*_cse3*_cse8 - _cse134)
+    out[4, 4] = dq0*(0.3960285*_cse107 + 0.3960285*_cse110 - 0.408002994597976*_cse111 + 0.239041914*_cse112 + 0.239041914*_cse113 + 0.408002994597976*_cse114 + 0.574238819026787*_cse132 - 0.574238819026787*_cse134) + dq1*(-_cse350 - _cse351 + 0.408002994597976*_cse93 - 0.408002994597976*_cse95 + 0.239041914*_cse96 + 0.3960285*_cse97 + 0.3960285*_cse98 + 0.239041914*_cse99) + dq2*(_cse350 + _cse351 - 0.408002994597976*_cse72 + 0.408002994597976*_cse74 + 0.3960285*_cse75 + 0.239041914*_cse76 + 0.239041914*_cse77 + 0.3960285*_cse78) + dq3*(0.408002994597976*_cse51 + 0.408002994597976*_cse52 + 0.239041914*_cse54 + 0.239041914*_cse55 + 0.3960285*_cse56 + 0.3960285*_cse57)
+    out[4, 5] = dq0*(0.227149603970304*_cse107 + 0.227149603970304*_cse110 - 0.234017800844203*_cse111 + 0.137106991283212*_cse112 + 0.137106991283212*_cse113 + 0.234017800844203*_cse114 - _cse118*_cse334 - _cse118*_cse346 + _cse118*_cse347 + _cse124*_cse339 - _cse124*_cse340 + _cse124*_cse341 + 0.329365488408814*_cse132 - 0.329365488408814*_cse134) + dq1*(-_cse100*_cse334 - _cse100*_cse346 + _cse100*_cse347 + _cse101*_cse339 - _cse101*_cse340 + _cse101*_cse341 - _cse352 - _cse353 + 0.234017800844203*_cse93 - 0.234017800844203*_cse95 + 0.137106991283212*_cse96 + 0.227149603970304*_cse97 + 0.227149603970304*_cse98 + 0.137106991283212*_cse99) + dq2*(-_cse334*_cse79 + _cse339*_cse82 - _cse340*_cse82 + _cse341*_cse82 - _cse346*_cse79 + _cse347*_cse79 + _cse352 + _cse353 - 0.234017800844203*_cse72 + 0.234017800844203*_cse74 + 0.227149603970304*_cse75 + 0.137106991283212*_cse76 + 0.137106991283212*_cse77 + 0.227149603970304*_cse78) + dq3*(-_cse334*_cse63 + _cse339*_cse61 - _cse340*_cse61 + _cse341*_cse61 - _cse346*_cse63 + _cse347*_cse63 + 0.234017800844203*_cse51 + 0.234017800844203*_cse52 + 0.137106991283212*_cse54 + 0.137106991283212*_cse55 + 0.227149603970304*_cse56 + 0.227149603970304*_cse57) + dq4*(_cse334*_cse37 + _cse336*_cse37 - _cse338*_cse37 + _cse339*_cse49 - _cse340*_cse49 + _cse341*_cse49)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse354*dq1 - _cse354*dq2
+    out[5, 4] = dq1*(_cse263*_cse333 + 0.239041914*_cse264 - _cse266*_cse332 + 0.239041914*_cse267 + 0.3960285*_cse270 + 0.3960285*_cse271 + _cse355 - _cse356) + dq2*(_cse262*_cse333 - _cse265*_cse332 + 0.3960285*_cse305 + 0.3960285*_cse306 + 0.239041914*_cse307 + 0.239041914*_cse308 - _cse355 + _cse356) + dq3*(_cse282*_cse332 + _cse285*_cse333 + 0.239041914*_cse317 + 0.239041914*_cse318 + 0.3960285*_cse320 + 0.3960285*_cse321)
+    out[5, 5] = dq1*(_cse263*_cse345 + 0.137106991283212*_cse264 - _cse266*_cse344 + 0.137106991283212*_cse267 + _cse269*_cse339 - _cse269*_cse340 + _cse269*_cse341 + 0.227149603970304*_cse270 + 0.227149603970304*_cse271 - _cse272*_cse334 - _cse272*_cse346 + _cse272*_cse347 + _cse357 - _cse358) + dq2*(_cse262*_cse345 - _cse265*_cse344 + 0.227149603970304*_cse305 + 0.227149603970304*_cse306 + 0.137106991283212*_cse307 + 0.137106991283212*_cse308 + _cse309*_cse339 - _cse309*_cse340 + _cse309*_cse341 - _cse310*_cse334 - _cse310*_cse346 + _cse310*_cse347 - _cse357 + _cse358) + dq3*(_cse282*_cse344 + _cse285*_cse345 + 0.137106991283212*_cse317 + 0.137106991283212*_cse318 + _cse319*_cse339 - _cse319*_cse340 + _cse319*_cse341 + 0.227149603970304*_cse320 + 0.227149603970304*_cse321 - _cse322*_cse334 - _cse322*_cse346 + _cse322*_cse347) + dq4*(_cse291*_cse339 - _cse291*_cse340 + _cse291*_cse341 + _cse293*_cse334 + _cse293*_cse336 - _cse293*_cse338)
+    return out
+
+
+# link6[0,0,0]_Tx
+def function39(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse3*_cse8
+    _cse10 = _cse5*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = math.sin(q3)
+    _cse16 = 6.57617443000635e-7*_cse0
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = _cse2*_cse6
+    _cse19 = _cse4*_cse8
+    _cse20 = -_cse16 - _cse17*_cse18 - _cse17*_cse19
+    _cse21 = _cse15*_cse20
+    _cse22 = math.cos(q3)
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0 - _cse18*_cse23 - _cse19*_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = -0.012581*_cse15 - 0.00040053*_cse22
+    _cse27 = -0.00040053*_cse15 + 0.012581*_cse22
+    _cse28 = -0.51802699*_cse15 - 0.75940555*_cse22
+    _cse29 = _cse24*_cse28
+    _cse30 = 0.45991232*_cse15 + 0.85536427*_cse22
+    _cse31 = _cse20*_cse30
+    _cse32 = 0.75940555*_cse15 - 0.51802699*_cse22
+    _cse33 = _cse20*_cse32
+    _cse34 = 0.85536427*_cse15 - 0.45991232*_cse22
+    _cse35 = _cse24*_cse34
+    _cse36 = -0.000346321299837637*_cse10 + 0.517383113*_cse29 - 0.855753802*_cse31 + 0.517383113*_cse33 - 0.855753802*_cse35 + 0.000346321299837637*_cse9
+    _cse37 = math.sin(q4)
+    _cse38 = 0.0499969558686132*_cse37
+    _cse39 = math.cos(q4)
+    _cse40 = -0.012272*_cse37 - 0.00052974*_cse39
+    _cse41 = -0.78972966*_cse37 + 0.45479896*_cse39
+    _cse42 = 0.03790017976*_cse41
+    _cse43 = 0.00754966217739359*_cse37 + 0.0166720597638287*_cse39
+    _cse44 = 0.818687841791724*_cse10 - 0.212878838804554*_cse21 + 0.212878838804554*_cse25 + 0.758601438*_cse29 + 0.458851168*_cse31 + 0.758601438*_cse33 + 0.458851168*_cse35 - 0.818687841791724*_cse9
+    _cse45 = 0.0499969558686132*_cse39
+    _cse46 = -0.00052974*_cse37 + 0.012272*_cse39
+    _cse47 = 0.45479896*_cse37 + 0.78972966*_cse39
+    _cse48 = 0.03790017976*_cse47
+    _cse49 = 0.0166720597638287*_cse37 - 0.00754966217739359*_cse39
+    _cse50 = _cse0*_cse2
+    _cse51 = _cse0*_cse4
+    _cse52 = _cse51*_cse6
+    _cse53 = _cse16*_cse18 + _cse16*_cse19 + _cse17
+    _cse54 = 0.999999998572139*_cse0
+    _cse55 = _cse18*_cse54 + _cse19*_cse54 - _cse23
+    _cse56 = _cse15*_cse55
+    _cse57 = _cse28*_cse53
+    _cse58 = _cse30*_cse55
+    _cse59 = _cse32*_cse55
+    _cse60 = _cse34*_cse53
+    _cse61 = _cse50*_cse8
+    _cse62 = 0.000346321299837637*_cse52 + 0.517383113*_cse57 - 0.855753802*_cse58 + 0.517383113*_cse59 - 0.855753802*_cse60 - 0.000346321299837637*_cse61
+    _cse63 = 0.212878838804554*_cse22*_cse53 - 0.818687841791724*_cse52 - 0.212878838804554*_cse56 + 0.758601438*_cse57 + 0.458851168*_cse58 + 0.758601438*_cse59 + 0.458851168*_cse60 + 0.818687841791724*_cse61
+    _cse64 = _cse2*_cse8
+    _cse65 = 0.999999998572139*_cse4*_cse6 - 0.999999998572139*_cse64
+    _cse66 = _cse15*_cse65
+    _cse67 = 6.57617443000635e-7*_cse4*_cse6 - 6.57617443000635e-7*_cse64
+    _cse68 = _cse22*_cse67
+    _cse69 = _cse30*_cse65
+    _cse70 = _cse32*_cse65
+    _cse71 = _cse28*_cse67
+    _cse72 = _cse34*_cse67
+    _cse73 = -0.000346321299837637*_cse18 - 0.000346321299837637*_cse19 + 0.517383113*_cse28*_cse67 + 0.517383113*_cse32*_cse65 - 0.855753802*_cse69 - 0.855753802*_cse72
+    _cse74 = 0.818687841791724*_cse18 + 0.818687841791724*_cse19 - 0.212878838804554*_cse66 + 0.212878838804554*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70 + 0.758601438*_cse71 + 0.458851168*_cse72
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + 0.253888422522456*_cse10 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse20*_cse26 - 0.0627091097210817*_cse21 + _cse24*_cse27 + 0.0627091097210817*_cse25 - 0.0491638727803817*_cse29 + _cse3*_cse7 + 0.20503*_cse3 - 0.0290982758960988*_cse31 - 0.0491638727803817*_cse33 - 0.0290982758960988*_cse35 - _cse36*_cse38 + _cse36*_cse40 + _cse36*_cse42 - _cse36*_cse43 + _cse44*_cse45 + _cse44*_cse46 + _cse44*_cse48 - _cse44*_cse49 - 1.098e-6*_cse5 - 0.253888422522456*_cse9 - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.253888422522456*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse11*_cse51 - _cse13*_cse50 - _cse14*_cse51 + 0.0627091097210817*_cse22*_cse53 + _cse26*_cse55 + _cse27*_cse53 - _cse38*_cse62 + 0.0499969558686132*_cse39*_cse63 + _cse40*_cse62 + 0.03790017976*_cse41*_cse62 - _cse43*_cse62 + _cse46*_cse63 + 0.03790017976*_cse47*_cse63 - _cse49*_cse63 - _cse50*_cse7 - 0.20503*_cse50 - 0.253888422522456*_cse52 - 0.0627091097210817*_cse56 - 0.0491638727803817*_cse57 - 0.0290982758960988*_cse58 - 0.0491638727803817*_cse59 - 0.0290982758960988*_cse60 - 1.7324e-5
+    out[2, 0] = -_cse13*_cse4 + _cse14*_cse2 + 0.253888422522456*_cse18 + 0.253888422522456*_cse19 + 0.001950802*_cse2 + _cse26*_cse65 + _cse27*_cse67 - _cse38*_cse73 - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + _cse40*_cse73 + _cse42*_cse73 - _cse43*_cse73 + _cse45*_cse74 + _cse46*_cse74 + _cse48*_cse74 - _cse49*_cse74 + 0.0038906673398998*_cse64 - 0.0627091097210817*_cse66 + 0.0627091097210817*_cse68 - 0.0290982758960988*_cse69 - 0.0491638727803817*_cse70 - 0.0491638727803817*_cse71 - 0.0290982758960988*_cse72 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# link6[0,0,0]_J
+def function40(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = math.sin(q3)
+    _cse24 = 6.57617443000635e-7*_cse1
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse11*_cse25 - _cse24 + _cse25*_cse6
+    _cse27 = _cse23*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse23
+    _cse29 = -_cse28
+    _cse30 = _cse22*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse23
+    _cse32 = _cse26*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse23
+    _cse34 = _cse26*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse23
+    _cse36 = _cse22*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse23
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse23
+    _cse39 = -_cse38
+    _cse40 = _cse0*_cse2
+    _cse41 = _cse40*_cse8
+    _cse42 = 0.000346321299837637*_cse10 + 0.517383113*_cse30 - 0.855753802*_cse32 + 0.517383113*_cse34 - 0.855753802*_cse36 - 0.000346321299837637*_cse41
+    _cse43 = math.sin(q4)
+    _cse44 = 0.0499969558686132*_cse43
+    _cse45 = math.cos(q4)
+    _cse46 = -0.78972966*_cse43 + 0.45479896*_cse45
+    _cse47 = 0.40329059*_cse43 + 0.89059413*_cse45
+    _cse48 = 0.01872015456*_cse47
+    _cse49 = -0.012272*_cse43 - 0.00052974*_cse45
+    _cse50 = _cse19*_cse22
+    _cse51 = -0.818687841791724*_cse10 - 0.212878838804554*_cse27 + 0.758601438*_cse30 + 0.458851168*_cse32 + 0.758601438*_cse34 + 0.458851168*_cse36 + 0.818687841791724*_cse41 + 0.212878838804554*_cse50
+    _cse52 = 0.45479896*_cse43 + 0.78972966*_cse45
+    _cse53 = 0.89059413*_cse43 - 0.40329059*_cse45
+    _cse54 = 0.01872015456*_cse53
+    _cse55 = 0.00052974*_cse43 - 0.012272*_cse45
+    _cse56 = -_cse55
+    _cse57 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse58 = 0.818687841791724*_cse6
+    _cse59 = _cse1*_cse58
+    _cse60 = 0.818687841791724*_cse11
+    _cse61 = _cse1*_cse60
+    _cse62 = _cse2*_cse8
+    _cse63 = _cse4*_cse5
+    _cse64 = _cse24*_cse62 - _cse24*_cse63
+    _cse65 = _cse20*_cse62 - _cse20*_cse63
+    _cse66 = _cse23*_cse65
+    _cse67 = _cse29*_cse64
+    _cse68 = _cse35*_cse64
+    _cse69 = _cse31*_cse65
+    _cse70 = _cse33*_cse65
+    _cse71 = 0.212878838804554*_cse19*_cse64 - _cse59 - _cse61 - 0.212878838804554*_cse66 + 0.758601438*_cse67 + 0.458851168*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70
+    _cse72 = 0.000346321299837637*_cse11
+    _cse73 = 0.000346321299837637*_cse6
+    _cse74 = _cse1*_cse72 + _cse1*_cse73
+    _cse75 = 0.517383113*_cse67 - 0.855753802*_cse68 - 0.855753802*_cse69 + 0.517383113*_cse70 + _cse74
+    _cse76 = _cse1*_cse2
+    _cse77 = _cse76*_cse8
+    _cse78 = 0.253888422522456*_cse1
+    _cse79 = _cse1*_cse4
+    _cse80 = _cse5*_cse79
+    _cse81 = _cse11*_cse78 + _cse17*_cse76 + _cse6*_cse78 + 0.0038906673398998*_cse77 - 0.0038906673398998*_cse80
+    _cse82 = -_cse65
+    _cse83 = _cse23*_cse82
+    _cse84 = -_cse64
+    _cse85 = _cse19*_cse84
+    _cse86 = _cse31*_cse82
+    _cse87 = _cse33*_cse82
+    _cse88 = _cse29*_cse84
+    _cse89 = _cse35*_cse84
+    _cse90 = _cse59 + _cse61 - 0.212878838804554*_cse83 + 0.212878838804554*_cse85 + 0.458851168*_cse86 + 0.758601438*_cse87 + 0.758601438*_cse88 + 0.458851168*_cse89
+    _cse91 = 0.517383113*_cse29*_cse84 + 0.517383113*_cse33*_cse82 - _cse74 - 0.855753802*_cse86 - 0.855753802*_cse89
+    _cse92 = 0.0499969558686132*_cse45
+    _cse93 = 0.03790017976*_cse46
+    _cse94 = 0.03790017976*_cse52
+    _cse95 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse96 = -_cse95
+    _cse97 = _cse19*_cse96
+    _cse98 = -0.999999998572139*_cse0 + _cse11*_cse24 + _cse24*_cse6
+    _cse99 = -_cse98
+    _cse100 = _cse23*_cse99
+    _cse101 = -_cse35
+    _cse102 = _cse101*_cse96
+    _cse103 = _cse31*_cse99
+    _cse104 = _cse28*_cse96
+    _cse105 = _cse33*_cse99
+    _cse106 = -0.855753802*_cse102 - 0.855753802*_cse103 + 0.517383113*_cse28*_cse96 + 0.517383113*_cse33*_cse99
+    _cse107 = -0.212878838804554*_cse100 + 0.458851168*_cse102 + 0.458851168*_cse103 + 0.758601438*_cse104 + 0.758601438*_cse105 - 0.212878838804554*_cse97
+    _cse108 = 0.000346321299837637*_cse77
+    _cse109 = 0.000346321299837637*_cse80
+    _cse110 = _cse29*_cse99
+    _cse111 = _cse31*_cse96
+    _cse112 = _cse33*_cse96
+    _cse113 = _cse35*_cse99
+    _cse114 = _cse108 - _cse109 + 0.517383113*_cse110 - 0.855753802*_cse111 + 0.517383113*_cse112 - 0.855753802*_cse113
+    _cse115 = -0.01872015456*_cse53
+    _cse116 = -_cse52
+    _cse117 = 0.818687841791724*_cse77
+    _cse118 = 0.818687841791724*_cse80
+    _cse119 = 0.212878838804554*_cse23
+    _cse120 = 0.212878838804554*_cse19
+    _cse121 = 0.758601438*_cse110 + 0.458851168*_cse111 + 0.758601438*_cse112 + 0.458851168*_cse113 - _cse117 + _cse118 - _cse119*_cse96 + _cse120*_cse99
+    _cse122 = 0.0627091097210817*_cse23
+    _cse123 = _cse29*_cse98
+    _cse124 = _cse31*_cse95
+    _cse125 = _cse33*_cse95
+    _cse126 = _cse35*_cse98
+    _cse127 = -_cse108 + _cse109 + 0.517383113*_cse123 - 0.855753802*_cse124 + 0.517383113*_cse125 - 0.855753802*_cse126
+    _cse128 = _cse117 - _cse118 - _cse119*_cse95 + _cse120*_cse98 + 0.758601438*_cse123 + 0.458851168*_cse124 + 0.758601438*_cse125 + 0.458851168*_cse126
+    _cse129 = _cse0*_cse58
+    _cse130 = _cse0*_cse60
+    _cse131 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse25*_cse62
+    _cse132 = -_cse131
+    _cse133 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse62
+    _cse134 = -_cse133
+    _cse135 = _cse132*_cse31
+    _cse136 = _cse132*_cse33
+    _cse137 = _cse134*_cse29
+    _cse138 = _cse134*_cse35
+    _cse139 = -_cse119*_cse132 + _cse120*_cse134 + _cse129 + _cse130 + 0.458851168*_cse135 + 0.758601438*_cse136 + 0.758601438*_cse137 + 0.458851168*_cse138
+    _cse140 = _cse0*_cse72 + _cse0*_cse73
+    _cse141 = 0.517383113*_cse132*_cse33 + 0.517383113*_cse134*_cse29 - 0.855753802*_cse135 - 0.855753802*_cse138 - _cse140
+    _cse142 = 0.0627091097210817*_cse19
+    _cse143 = 0.253888422522456*_cse0
+    _cse144 = -0.0038906673398998*_cse10 + _cse11*_cse143 + _cse143*_cse6 + _cse17*_cse40 + 0.0038906673398998*_cse41
+    _cse145 = _cse133*_cse29
+    _cse146 = _cse133*_cse35
+    _cse147 = _cse131*_cse31
+    _cse148 = _cse131*_cse33
+    _cse149 = -_cse119*_cse131 + _cse120*_cse133 - _cse129 - _cse130 + 0.758601438*_cse145 + 0.458851168*_cse146 + 0.458851168*_cse147 + 0.758601438*_cse148
+    _cse150 = _cse140 + 0.517383113*_cse145 - 0.855753802*_cse146 - 0.855753802*_cse147 + 0.517383113*_cse148
+    _cse151 = _cse101*_cse26
+    _cse152 = _cse22*_cse31
+    _cse153 = _cse26*_cse28
+    _cse154 = _cse22*_cse33
+    _cse155 = -0.855753802*_cse151 - 0.855753802*_cse152 + 0.517383113*_cse22*_cse33 + 0.517383113*_cse26*_cse28
+    _cse156 = -_cse119*_cse22 - _cse120*_cse26 + 0.458851168*_cse151 + 0.458851168*_cse152 + 0.758601438*_cse153 + 0.758601438*_cse154
+    _cse157 = 0.818687841791724*_cse62
+    _cse158 = 0.818687841791724*_cse63
+    _cse159 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse160 = -_cse159
+    _cse161 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse162 = -_cse161
+    _cse163 = _cse160*_cse31
+    _cse164 = _cse160*_cse33
+    _cse165 = _cse162*_cse29
+    _cse166 = _cse162*_cse35
+    _cse167 = -_cse119*_cse160 + _cse120*_cse162 - _cse157 + _cse158 + 0.458851168*_cse163 + 0.758601438*_cse164 + 0.758601438*_cse165 + 0.458851168*_cse166
+    _cse168 = -0.000346321299837637*_cse62 + 0.000346321299837637*_cse63
+    _cse169 = 0.517383113*_cse160*_cse33 + 0.517383113*_cse162*_cse29 - 0.855753802*_cse163 - 0.855753802*_cse166 - _cse168
+    _cse170 = _cse12 + _cse18 - 0.253888422522456*_cse62 + 0.253888422522456*_cse63 + _cse7
+    _cse171 = _cse161*_cse29
+    _cse172 = _cse161*_cse35
+    _cse173 = _cse159*_cse31
+    _cse174 = _cse159*_cse33
+    _cse175 = -_cse119*_cse159 + _cse120*_cse161 + _cse157 - _cse158 + 0.758601438*_cse171 + 0.458851168*_cse172 + 0.458851168*_cse173 + 0.758601438*_cse174
+    _cse176 = _cse168 + 0.517383113*_cse171 - 0.855753802*_cse172 - 0.855753802*_cse173 + 0.517383113*_cse174
+    _cse177 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse62
+    _cse178 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse62
+    _cse179 = _cse101*_cse177
+    _cse180 = _cse177*_cse28
+    _cse181 = _cse178*_cse31
+    _cse182 = _cse178*_cse33
+    _cse183 = 0.517383113*_cse177*_cse28 + 0.517383113*_cse178*_cse33 - 0.855753802*_cse179 - 0.855753802*_cse181
+    _cse184 = -_cse119*_cse178 - _cse120*_cse177 + 0.458851168*_cse179 + 0.758601438*_cse180 + 0.458851168*_cse181 + 0.758601438*_cse182
+    _cse185 = _cse177*_cse31
+    _cse186 = _cse178*_cse35
+    _cse187 = 0.517383113*_cse177*_cse33 + 0.517383113*_cse178*_cse29 - 0.855753802*_cse185 - 0.855753802*_cse186 - _cse72 - _cse73
+    _cse188 = _cse177*_cse33
+    _cse189 = _cse178*_cse29
+    _cse190 = -_cse119*_cse177 + _cse120*_cse178 + 0.458851168*_cse185 + 0.458851168*_cse186 + 0.758601438*_cse188 + 0.758601438*_cse189 + _cse58 + _cse60
+    _cse191 = _cse23*_cse96
+    _cse192 = _cse19*_cse99
+    _cse193 = 0.410149995883665*_cse43
+    _cse194 = 0.410879747*_cse46
+    _cse195 = 0.209584432*_cse47
+    _cse196 = 0.410149995883665*_cse45
+    _cse197 = 0.410879747*_cse52
+    _cse198 = 0.209584432*_cse53
+    _cse199 = _cse177*_cse23
+    _cse200 = _cse178*_cse19
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.253888422522456*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.253888422522456*_cse10 + 0.0627091097210817*_cse19*_cse22 + _cse22*_cse39 + _cse26*_cse37 - 0.0627091097210817*_cse27 - 0.0491638727803817*_cse30 - 0.0290982758960988*_cse32 - 0.0491638727803817*_cse34 - 0.0290982758960988*_cse36 - _cse42*_cse44 + 0.03790017976*_cse42*_cse46 - _cse42*_cse48 + _cse42*_cse49 + 0.0499969558686132*_cse45*_cse51 + 0.03790017976*_cse51*_cse52 - _cse51*_cse54 + _cse51*_cse56
+    out[0, 1] = _cse1*_cse15*_cse4 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse1*_cse57 + 0.0627091097210817*_cse19*_cse64 + _cse37*_cse65 + _cse39*_cse64 - _cse44*_cse75 + 0.0499969558686132*_cse45*_cse71 + 0.03790017976*_cse46*_cse75 - _cse48*_cse75 + _cse49*_cse75 + 0.03790017976*_cse52*_cse71 - _cse54*_cse71 + _cse56*_cse71 - 0.0627091097210817*_cse66 - 0.0491638727803817*_cse67 - 0.0290982758960988*_cse68 - 0.0290982758960988*_cse69 - 0.0491638727803817*_cse70 - _cse81
+    out[0, 2] = _cse14*_cse79 + _cse37*_cse82 + _cse39*_cse84 - _cse44*_cse91 - _cse48*_cse91 + _cse49*_cse91 - _cse54*_cse90 + _cse56*_cse90 + _cse81 - 0.0627091097210817*_cse83 + 0.0627091097210817*_cse85 - 0.0290982758960988*_cse86 - 0.0491638727803817*_cse87 - 0.0491638727803817*_cse88 - 0.0290982758960988*_cse89 + _cse90*_cse92 + _cse90*_cse94 + _cse91*_cse93
+    out[0, 3] = -0.0627091097210817*_cse100 - 0.0290982758960988*_cse102 - 0.0290982758960988*_cse103 - 0.0491638727803817*_cse104 - 0.0491638727803817*_cse105 - _cse106*_cse44 + 0.03790017976*_cse106*_cse46 - _cse106*_cse48 + _cse106*_cse49 + 0.0499969558686132*_cse107*_cse45 + 0.03790017976*_cse107*_cse52 - _cse107*_cse54 + _cse107*_cse56 + _cse37*_cse99 + _cse38*_cse96 - 0.0627091097210817*_cse97
+    out[0, 4] = -_cse114*_cse115 + 0.03790017976*_cse114*_cse116 + _cse114*_cse55 - _cse114*_cse92 - _cse121*_cse44 + 0.03790017976*_cse121*_cse46 - _cse121*_cse48 + _cse121*_cse49
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.253888422522456*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 - _cse122*_cse95 - 0.0491638727803817*_cse123 - 0.0290982758960988*_cse124 - 0.0491638727803817*_cse125 - 0.0290982758960988*_cse126 - _cse127*_cse44 + 0.03790017976*_cse127*_cse46 - _cse127*_cse48 + _cse127*_cse49 + 0.0499969558686132*_cse128*_cse45 + 0.03790017976*_cse128*_cse52 - _cse128*_cse54 + _cse128*_cse56 + 0.0627091097210817*_cse19*_cse98 + _cse37*_cse95 + _cse39*_cse98 - 0.253888422522456*_cse80
+    out[1, 1] = _cse0*_cse57 - _cse122*_cse132 + _cse132*_cse37 + _cse134*_cse142 + _cse134*_cse39 - 0.0290982758960988*_cse135 - 0.0491638727803817*_cse136 - 0.0491638727803817*_cse137 - 0.0290982758960988*_cse138 - _cse139*_cse54 + _cse139*_cse56 + _cse139*_cse92 + _cse139*_cse94 - _cse141*_cse44 - _cse141*_cse48 + _cse141*_cse49 + _cse141*_cse93 + _cse144 - _cse15*_cse9 - 1.098e-6*_cse40 - 0.20503*_cse9
+    out[1, 2] = -_cse122*_cse131 + _cse131*_cse37 + 0.0627091097210817*_cse133*_cse19 + _cse133*_cse39 - _cse14*_cse9 - _cse144 - 0.0491638727803817*_cse145 - 0.0290982758960988*_cse146 - 0.0290982758960988*_cse147 - 0.0491638727803817*_cse148 + 0.0499969558686132*_cse149*_cse45 + 0.03790017976*_cse149*_cse52 - _cse149*_cse54 + _cse149*_cse56 - _cse150*_cse44 + 0.03790017976*_cse150*_cse46 - _cse150*_cse48 + _cse150*_cse49
+    out[1, 3] = -_cse122*_cse22 - _cse142*_cse26 - 0.0290982758960988*_cse151 - 0.0290982758960988*_cse152 - 0.0491638727803817*_cse153 - 0.0491638727803817*_cse154 - _cse155*_cse44 + 0.03790017976*_cse155*_cse46 - _cse155*_cse48 + _cse155*_cse49 + 0.0499969558686132*_cse156*_cse45 + 0.03790017976*_cse156*_cse52 - _cse156*_cse54 + _cse156*_cse56 + _cse22*_cse37 + _cse26*_cse38
+    out[1, 4] = -_cse115*_cse42 + 0.03790017976*_cse116*_cse42 + _cse42*_cse55 - _cse42*_cse92 - _cse44*_cse51 + 0.03790017976*_cse46*_cse51 - _cse48*_cse51 + _cse49*_cse51
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse122*_cse160 + _cse142*_cse162 + _cse16 + _cse160*_cse37 + _cse162*_cse39 - 0.0290982758960988*_cse163 - 0.0491638727803817*_cse164 - 0.0491638727803817*_cse165 - 0.0290982758960988*_cse166 - _cse167*_cse54 + _cse167*_cse56 + _cse167*_cse92 + _cse167*_cse94 - _cse169*_cse44 - _cse169*_cse48 + _cse169*_cse49 + _cse169*_cse93 + _cse170 + 0.41405*_cse2 + 0.001950802*_cse4
+    out[2, 2] = -_cse122*_cse159 + _cse14*_cse2 + _cse159*_cse37 + 0.0627091097210817*_cse161*_cse19 + _cse161*_cse39 - _cse170 - 0.0491638727803817*_cse171 - 0.0290982758960988*_cse172 - 0.0290982758960988*_cse173 - 0.0491638727803817*_cse174 + 0.0499969558686132*_cse175*_cse45 + 0.03790017976*_cse175*_cse52 - _cse175*_cse54 + _cse175*_cse56 - _cse176*_cse44 + 0.03790017976*_cse176*_cse46 - _cse176*_cse48 + _cse176*_cse49
+    out[2, 3] = -_cse122*_cse178 - _cse142*_cse177 + _cse177*_cse38 + _cse178*_cse37 - 0.0290982758960988*_cse179 - 0.0491638727803817*_cse180 - 0.0290982758960988*_cse181 - 0.0491638727803817*_cse182 - _cse183*_cse44 + 0.03790017976*_cse183*_cse46 - _cse183*_cse48 + _cse183*_cse49 + 0.0499969558686132*_cse184*_cse45 + 0.03790017976*_cse184*_cse52 - _cse184*_cse54 + _cse184*_cse56
+    out[2, 4] = -_cse115*_cse187 + 0.03790017976*_cse116*_cse187 + _cse187*_cse55 - _cse187*_cse92 - _cse190*_cse44 + 0.03790017976*_cse190*_cse46 - _cse190*_cse48 + _cse190*_cse49
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse77 - _cse80
+    out[3, 4] = 0.3960285*_cse110 + 0.239041914*_cse111 + 0.3960285*_cse112 + 0.239041914*_cse113 + 0.408002994597976*_cse191 - 0.408002994597976*_cse192 + 0.574238819026787*_cse77 - 0.574238819026787*_cse80
+    out[3, 5] = 0.227149603970304*_cse110 + 0.137106991283212*_cse111 + 0.227149603970304*_cse112 + 0.137106991283212*_cse113 + _cse114*_cse193 - _cse114*_cse194 + _cse114*_cse195 - _cse121*_cse196 - _cse121*_cse197 + _cse121*_cse198 + 0.234017800844203*_cse191 - 0.234017800844203*_cse192 + 0.329365488408814*_cse77 - 0.329365488408814*_cse80
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse41
+    out[4, 4] = 0.574238819026787*_cse10 + 0.408002994597976*_cse27 + 0.3960285*_cse30 + 0.239041914*_cse32 + 0.3960285*_cse34 + 0.239041914*_cse36 - 0.574238819026787*_cse41 - 0.408002994597976*_cse50
+    out[4, 5] = 0.329365488408814*_cse10 + _cse193*_cse42 - _cse194*_cse42 + _cse195*_cse42 - _cse196*_cse51 - _cse197*_cse51 + _cse198*_cse51 + 0.234017800844203*_cse27 + 0.227149603970304*_cse30 + 0.137106991283212*_cse32 + 0.227149603970304*_cse34 + 0.137106991283212*_cse36 - 0.329365488408814*_cse41 - 0.234017800844203*_cse50
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + 0.239041914*_cse185 + 0.239041914*_cse186 + 0.3960285*_cse188 + 0.3960285*_cse189 + 0.408002994597976*_cse199 - 0.408002994597976*_cse200 - 0.574238819026787*_cse6
+    out[5, 5] = -0.329365488408814*_cse11 + 0.137106991283212*_cse185 + 0.137106991283212*_cse186 + _cse187*_cse193 - _cse187*_cse194 + _cse187*_cse195 + 0.227149603970304*_cse188 + 0.227149603970304*_cse189 - _cse190*_cse196 - _cse190*_cse197 + _cse190*_cse198 + 0.234017800844203*_cse199 - 0.234017800844203*_cse200 - 0.329365488408814*_cse6
+    return out
+
+
+# link6[0,0,0]_dJ
+def function41(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = 6.57617443000635e-7*_cse0
+    _cse2 = math.sin(q0)
+    _cse3 = 0.999999998572139*_cse2
+    _cse4 = math.sin(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse4*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = math.cos(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = _cse3*_cse6 + _cse3*_cse9
+    _cse11 = -_cse1 + _cse10
+    _cse12 = math.sin(q3)
+    _cse13 = math.cos(q3)
+    _cse14 = 0.75940555*_cse12 - 0.51802699*_cse13
+    _cse15 = _cse11*_cse14
+    _cse16 = 0.999999998572139*_cse0
+    _cse17 = 6.57617443000635e-7*_cse2
+    _cse18 = _cse17*_cse6 + _cse17*_cse9
+    _cse19 = _cse16 + _cse18
+    _cse20 = 0.51802699*_cse12 + 0.75940555*_cse13
+    _cse21 = -_cse20
+    _cse22 = _cse19*_cse21
+    _cse23 = 0.45991232*_cse12 + 0.85536427*_cse13
+    _cse24 = _cse11*_cse23
+    _cse25 = 0.85536427*_cse12 - 0.45991232*_cse13
+    _cse26 = _cse19*_cse25
+    _cse27 = _cse5*_cse7
+    _cse28 = 0.000346321299837637*_cse27
+    _cse29 = _cse2*_cse28
+    _cse30 = _cse4*_cse8
+    _cse31 = 0.000346321299837637*_cse30
+    _cse32 = _cse2*_cse31
+    _cse33 = _cse29 - _cse32
+    _cse34 = 0.517383113*_cse15 + 0.517383113*_cse22 - 0.855753802*_cse24 - 0.855753802*_cse26 + _cse33
+    _cse35 = math.cos(q4)
+    _cse36 = 0.0499969558686132*_cse35
+    _cse37 = math.sin(q4)
+    _cse38 = -0.40329059*_cse35 + 0.89059413*_cse37
+    _cse39 = -_cse38
+    _cse40 = 0.01872015456*_cse39
+    _cse41 = 0.78972966*_cse35 + 0.45479896*_cse37
+    _cse42 = -_cse41
+    _cse43 = -0.012272*_cse35 + 0.00052974*_cse37
+    _cse44 = 0.212878838804554*_cse13
+    _cse45 = _cse19*_cse44
+    _cse46 = 0.212878838804554*_cse12
+    _cse47 = _cse11*_cse46
+    _cse48 = 0.818687841791724*_cse30
+    _cse49 = _cse2*_cse48
+    _cse50 = 0.818687841791724*_cse27
+    _cse51 = _cse2*_cse50
+    _cse52 = _cse49 - _cse51
+    _cse53 = 0.758601438*_cse15 + 0.758601438*_cse22 + 0.458851168*_cse24 + 0.458851168*_cse26 + _cse45 - _cse47 + _cse52
+    _cse54 = 0.0499969558686132*_cse37
+    _cse55 = -0.45479896*_cse35 + 0.78972966*_cse37
+    _cse56 = -_cse55
+    _cse57 = 0.89059413*_cse35 + 0.40329059*_cse37
+    _cse58 = 0.01872015456*_cse57
+    _cse59 = 0.00052974*_cse35 + 0.012272*_cse37
+    _cse60 = -_cse59
+    _cse61 = -_cse34*_cse36 - _cse34*_cse40 + 0.03790017976*_cse34*_cse42 + _cse34*_cse43 - _cse53*_cse54 + 0.03790017976*_cse53*_cse56 - _cse53*_cse58 + _cse53*_cse60
+    _cse62 = _cse12*_cse19
+    _cse63 = _cse11*_cse13
+    _cse64 = -_cse25
+    _cse65 = _cse11*_cse64
+    _cse66 = _cse19*_cse23
+    _cse67 = _cse11*_cse20
+    _cse68 = _cse14*_cse19
+    _cse69 = 0.012581*_cse12 + 0.00040053*_cse13
+    _cse70 = -_cse69
+    _cse71 = 0.00040053*_cse12 - 0.012581*_cse13
+    _cse72 = 0.517383113*_cse11*_cse20 + 0.517383113*_cse14*_cse19 - 0.855753802*_cse65 - 0.855753802*_cse66
+    _cse73 = -0.212878838804554*_cse62 - 0.212878838804554*_cse63 + 0.458851168*_cse65 + 0.458851168*_cse66 + 0.758601438*_cse67 + 0.758601438*_cse68
+    _cse74 = 0.01872015456*_cse38
+    _cse75 = -_cse43
+    _cse76 = _cse11*_cse71 + _cse19*_cse70 + 0.0499969558686132*_cse35*_cse73 + 0.03790017976*_cse41*_cse73 - _cse54*_cse72 + 0.03790017976*_cse56*_cse72 - _cse58*_cse72 + _cse60*_cse72 - 0.0627091097210817*_cse62 - 0.0627091097210817*_cse63 - 0.0290982758960988*_cse65 - 0.0290982758960988*_cse66 - 0.0491638727803817*_cse67 - 0.0491638727803817*_cse68 - _cse73*_cse74 + _cse73*_cse75
+    _cse77 = _cse2*_cse4
+    _cse78 = _cse5*_cse77
+    _cse79 = 0.818687841791724*_cse78
+    _cse80 = _cse2*_cse7
+    _cse81 = _cse8*_cse80
+    _cse82 = 0.818687841791724*_cse81
+    _cse83 = _cse17*_cse30 - 6.57617443000635e-7*_cse2*_cse5*_cse7
+    _cse84 = _cse13*_cse83
+    _cse85 = -0.999999998572139*_cse2*_cse5*_cse7 + _cse3*_cse30
+    _cse86 = _cse12*_cse85
+    _cse87 = _cse21*_cse83
+    _cse88 = _cse25*_cse83
+    _cse89 = _cse23*_cse85
+    _cse90 = _cse14*_cse85
+    _cse91 = -_cse79 - _cse82 + 0.212878838804554*_cse84 - 0.212878838804554*_cse86 + 0.758601438*_cse87 + 0.458851168*_cse88 + 0.458851168*_cse89 + 0.758601438*_cse90
+    _cse92 = -_cse71
+    _cse93 = 0.000346321299837637*_cse78 + 0.000346321299837637*_cse81
+    _cse94 = 0.517383113*_cse87 - 0.855753802*_cse88 - 0.855753802*_cse89 + 0.517383113*_cse90 + _cse93
+    _cse95 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse96 = _cse7*_cse95
+    _cse97 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse98 = _cse4*_cse97
+    _cse99 = 0.0038906673398998*_cse30
+    _cse100 = 0.0038906673398998*_cse27
+    _cse101 = -_cse100*_cse2 + _cse2*_cse98 + _cse2*_cse99 + 0.253888422522456*_cse78 + 0.253888422522456*_cse81
+    _cse102 = -_cse101 + 0.0627091097210817*_cse13*_cse83 - _cse2*_cse96 + 0.0499969558686132*_cse35*_cse91 + 0.03790017976*_cse41*_cse91 - _cse54*_cse94 + 0.03790017976*_cse56*_cse94 - _cse58*_cse94 + _cse60*_cse94 + _cse70*_cse85 - _cse74*_cse91 + _cse75*_cse91 + _cse83*_cse92 - 0.0627091097210817*_cse86 - 0.0491638727803817*_cse87 - 0.0290982758960988*_cse88 - 0.0290982758960988*_cse89 - 0.0491638727803817*_cse90
+    _cse103 = 0.0019519*_cse4 - 0.20902*_cse7
+    _cse104 = -_cse85
+    _cse105 = _cse104*_cse12
+    _cse106 = -_cse83
+    _cse107 = _cse106*_cse13
+    _cse108 = _cse104*_cse23
+    _cse109 = _cse104*_cse14
+    _cse110 = _cse106*_cse21
+    _cse111 = _cse106*_cse25
+    _cse112 = -0.212878838804554*_cse105 + 0.212878838804554*_cse107 + 0.458851168*_cse108 + 0.758601438*_cse109 + 0.758601438*_cse110 + 0.458851168*_cse111 + _cse79 + _cse82
+    _cse113 = 0.517383113*_cse104*_cse14 + 0.517383113*_cse106*_cse21 - 0.855753802*_cse108 - 0.855753802*_cse111 - _cse93
+    _cse114 = 0.03790017976*_cse56
+    _cse115 = 0.03790017976*_cse41
+    _cse116 = -_cse95
+    _cse117 = _cse116*_cse7
+    _cse118 = _cse101 + _cse103*_cse2 + _cse104*_cse70 - 0.0627091097210817*_cse105 + _cse106*_cse92 + 0.0627091097210817*_cse107 - 0.0290982758960988*_cse108 - 0.0491638727803817*_cse109 - 0.0491638727803817*_cse110 - 0.0290982758960988*_cse111 + _cse112*_cse115 + _cse112*_cse36 - _cse112*_cse74 + _cse112*_cse75 + _cse113*_cse114 - _cse113*_cse54 - _cse113*_cse58 + _cse113*_cse60 - _cse117*_cse2 - 1.098e-6*_cse77 - 0.20503*_cse80
+    _cse119 = _cse16*_cse6 + _cse16*_cse9
+    _cse120 = _cse119 + _cse17
+    _cse121 = _cse120*_cse14
+    _cse122 = _cse1*_cse6 + _cse1*_cse9
+    _cse123 = _cse122 - _cse3
+    _cse124 = _cse123*_cse21
+    _cse125 = _cse123*_cse13
+    _cse126 = _cse120*_cse23
+    _cse127 = _cse123*_cse25
+    _cse128 = _cse12*_cse120
+    _cse129 = _cse0*_cse48
+    _cse130 = _cse0*_cse50
+    _cse131 = _cse129 - _cse130
+    _cse132 = 0.758601438*_cse121 + 0.758601438*_cse124 + 0.212878838804554*_cse125 + 0.458851168*_cse126 + 0.458851168*_cse127 - 0.212878838804554*_cse128 + _cse131
+    _cse133 = 0.20902*_cse4 + 0.0019519*_cse7
+    _cse134 = -_cse133
+    _cse135 = _cse0*_cse28
+    _cse136 = _cse0*_cse31
+    _cse137 = _cse135 - _cse136
+    _cse138 = 0.517383113*_cse121 + 0.517383113*_cse124 - 0.855753802*_cse126 - 0.855753802*_cse127 + _cse137
+    _cse139 = _cse0*_cse7
+    _cse140 = _cse139*_cse97
+    _cse141 = _cse139*_cse8
+    _cse142 = 0.0038906673398998*_cse141
+    _cse143 = _cse0*_cse4
+    _cse144 = _cse143*_cse5
+    _cse145 = 0.0038906673398998*_cse144
+    _cse146 = _cse0*_cse27
+    _cse147 = 0.253888422522456*_cse146
+    _cse148 = _cse0*_cse30
+    _cse149 = -0.253888422522456*_cse148
+    _cse150 = -1.098e-6*_cse0*_cse7 + _cse116*_cse143 + _cse140 + _cse142 + 0.20503*_cse143 + _cse145 + _cse147 + _cse149
+    _cse151 = -_cse16*_cse27 + _cse16*_cse30
+    _cse152 = _cse14*_cse151
+    _cse153 = -_cse1*_cse27 + _cse1*_cse30
+    _cse154 = _cse153*_cse21
+    _cse155 = _cse151*_cse23
+    _cse156 = _cse153*_cse25
+    _cse157 = 0.000346321299837637*_cse141 + 0.000346321299837637*_cse144
+    _cse158 = 0.517383113*_cse152 + 0.517383113*_cse154 - 0.855753802*_cse155 - 0.855753802*_cse156 + _cse157
+    _cse159 = 0.818687841791724*_cse144
+    _cse160 = 0.818687841791724*_cse141
+    _cse161 = -_cse151*_cse46 + 0.758601438*_cse152 + _cse153*_cse44 + 0.758601438*_cse154 + 0.458851168*_cse155 + 0.458851168*_cse156 - _cse159 - _cse160
+    _cse162 = -_cse158*_cse36 - _cse158*_cse40 + 0.03790017976*_cse158*_cse42 + _cse158*_cse43 - _cse161*_cse54 + 0.03790017976*_cse161*_cse56 - _cse161*_cse58 + _cse161*_cse60
+    _cse163 = 0.0627091097210817*_cse12
+    _cse164 = 0.0627091097210817*_cse13
+    _cse165 = _cse153*_cse23
+    _cse166 = _cse14*_cse153
+    _cse167 = _cse151*_cse64
+    _cse168 = _cse151*_cse20
+    _cse169 = 0.517383113*_cse14*_cse153 + 0.517383113*_cse151*_cse20 - 0.855753802*_cse165 - 0.855753802*_cse167
+    _cse170 = -_cse151*_cse44 - _cse153*_cse46 + 0.458851168*_cse165 + 0.758601438*_cse166 + 0.458851168*_cse167 + 0.758601438*_cse168
+    _cse171 = -_cse151*_cse164 + _cse151*_cse71 - _cse153*_cse163 + _cse153*_cse70 - 0.0290982758960988*_cse165 - 0.0491638727803817*_cse166 - 0.0290982758960988*_cse167 - 0.0491638727803817*_cse168 - _cse169*_cse54 + 0.03790017976*_cse169*_cse56 - _cse169*_cse58 + _cse169*_cse60 + 0.0499969558686132*_cse170*_cse35 + 0.03790017976*_cse170*_cse41 - _cse170*_cse74 + _cse170*_cse75
+    _cse172 = -_cse119
+    _cse173 = _cse14*_cse172
+    _cse174 = -_cse122
+    _cse175 = _cse174*_cse21
+    _cse176 = _cse172*_cse23
+    _cse177 = _cse174*_cse25
+    _cse178 = -_cse129 + _cse130
+    _cse179 = -_cse172*_cse46 + 0.758601438*_cse173 + _cse174*_cse44 + 0.758601438*_cse175 + 0.458851168*_cse176 + 0.458851168*_cse177 + _cse178
+    _cse180 = -_cse137 + 0.517383113*_cse14*_cse172 + 0.517383113*_cse174*_cse21 - 0.855753802*_cse176 - 0.855753802*_cse177
+    _cse181 = _cse142 - _cse143*_cse95 + _cse145 + _cse147 + _cse149
+    _cse182 = _cse114*_cse180 + _cse115*_cse179 + _cse140 - _cse163*_cse172 + _cse164*_cse174 + _cse172*_cse70 - 0.0491638727803817*_cse173 + _cse174*_cse92 - 0.0491638727803817*_cse175 - 0.0290982758960988*_cse176 - 0.0290982758960988*_cse177 + _cse179*_cse36 - _cse179*_cse74 + _cse179*_cse75 - _cse180*_cse54 - _cse180*_cse58 + _cse180*_cse60 + _cse181
+    _cse183 = _cse119*_cse14
+    _cse184 = _cse122*_cse21
+    _cse185 = _cse119*_cse23
+    _cse186 = _cse122*_cse25
+    _cse187 = -_cse119*_cse46 + _cse122*_cse44 + _cse131 + 0.758601438*_cse183 + 0.758601438*_cse184 + 0.458851168*_cse185 + 0.458851168*_cse186
+    _cse188 = _cse137 + 0.517383113*_cse183 + 0.517383113*_cse184 - 0.855753802*_cse185 - 0.855753802*_cse186
+    _cse189 = _cse119*_cse163 - _cse119*_cse70 - 0.0627091097210817*_cse122*_cse13 - _cse122*_cse92 + 0.0491638727803817*_cse183 + 0.0491638727803817*_cse184 + 0.0290982758960988*_cse185 + 0.0290982758960988*_cse186 - 0.0499969558686132*_cse187*_cse35 - 0.03790017976*_cse187*_cse41 + _cse187*_cse74 - _cse187*_cse75 + _cse188*_cse54 - 0.03790017976*_cse188*_cse56 + _cse188*_cse58 - _cse188*_cse60
+    _cse190 = -_cse151
+    _cse191 = _cse190*_cse23
+    _cse192 = -_cse153
+    _cse193 = _cse192*_cse25
+    _cse194 = 0.517383113*_cse14*_cse190 - _cse157 - 0.855753802*_cse191 + 0.517383113*_cse192*_cse21 - 0.855753802*_cse193
+    _cse195 = _cse14*_cse190
+    _cse196 = _cse192*_cse21
+    _cse197 = _cse159 + _cse160 - _cse190*_cse46 + 0.458851168*_cse191 + _cse192*_cse44 + 0.458851168*_cse193 + 0.758601438*_cse195 + 0.758601438*_cse196
+    _cse198 = -_cse194*_cse36 - _cse194*_cse40 + 0.03790017976*_cse194*_cse42 + _cse194*_cse43 - _cse197*_cse54 + 0.03790017976*_cse197*_cse56 - _cse197*_cse58 + _cse197*_cse60
+    _cse199 = _cse190*_cse64
+    _cse200 = _cse190*_cse20
+    _cse201 = _cse192*_cse23
+    _cse202 = _cse14*_cse192
+    _cse203 = 0.517383113*_cse14*_cse192 + 0.517383113*_cse190*_cse20 - 0.855753802*_cse199 - 0.855753802*_cse201
+    _cse204 = -_cse190*_cse44 - _cse192*_cse46 + 0.458851168*_cse199 + 0.758601438*_cse200 + 0.458851168*_cse201 + 0.758601438*_cse202
+    _cse205 = -_cse163*_cse192 - _cse164*_cse190 + _cse190*_cse71 + _cse192*_cse70 - 0.0290982758960988*_cse199 - 0.0491638727803817*_cse200 - 0.0290982758960988*_cse201 - 0.0491638727803817*_cse202 - _cse203*_cse54 + 0.03790017976*_cse203*_cse56 - _cse203*_cse58 + _cse203*_cse60 + 0.0499969558686132*_cse204*_cse35 + 0.03790017976*_cse204*_cse41 - _cse204*_cse74 + _cse204*_cse75
+    _cse206 = -_cse97
+    _cse207 = -_cse120
+    _cse208 = _cse207*_cse64
+    _cse209 = -_cse123
+    _cse210 = _cse209*_cse23
+    _cse211 = 0.517383113*_cse14*_cse209 + 0.517383113*_cse20*_cse207 - 0.855753802*_cse208 - 0.855753802*_cse210
+    _cse212 = _cse20*_cse207
+    _cse213 = _cse14*_cse209
+    _cse214 = -_cse207*_cse44 + 0.458851168*_cse208 - _cse209*_cse46 + 0.458851168*_cse210 + 0.758601438*_cse212 + 0.758601438*_cse213
+    _cse215 = -_cse211*_cse36 - _cse211*_cse40 + 0.03790017976*_cse211*_cse42 + _cse211*_cse43 - _cse214*_cse54 + 0.03790017976*_cse214*_cse56 - _cse214*_cse58 + _cse214*_cse60
+    _cse216 = _cse209*_cse64
+    _cse217 = -_cse14
+    _cse218 = _cse207*_cse217
+    _cse219 = -_cse23
+    _cse220 = _cse207*_cse219
+    _cse221 = _cse20*_cse209
+    _cse222 = 0.517383113*_cse20*_cse209 + 0.517383113*_cse207*_cse217 - 0.855753802*_cse216 - 0.855753802*_cse220
+    _cse223 = _cse207*_cse46
+    _cse224 = _cse209*_cse44
+    _cse225 = 0.458851168*_cse216 + 0.758601438*_cse218 + 0.458851168*_cse220 + 0.758601438*_cse221 + _cse223 - _cse224
+    _cse226 = _cse209*_cse21
+    _cse227 = _cse207*_cse23
+    _cse228 = _cse14*_cse207
+    _cse229 = _cse209*_cse25
+    _cse230 = -_cse135 + _cse136 + 0.517383113*_cse226 - 0.855753802*_cse227 + 0.517383113*_cse228 - 0.855753802*_cse229
+    _cse231 = -0.01872015456*_cse57
+    _cse232 = 0.03790017976*_cse55
+    _cse233 = _cse178 - _cse223 + _cse224 + 0.758601438*_cse226 + 0.458851168*_cse227 + 0.758601438*_cse228 + 0.458851168*_cse229
+    _cse234 = 0.03790017976*_cse42
+    _cse235 = -_cse132*_cse54 + 0.03790017976*_cse132*_cse56 - _cse132*_cse58 + _cse132*_cse60 - _cse138*_cse36 - _cse138*_cse40 + 0.03790017976*_cse138*_cse42 + _cse138*_cse43
+    _cse236 = _cse120*_cse64
+    _cse237 = _cse123*_cse23
+    _cse238 = _cse120*_cse20
+    _cse239 = _cse123*_cse14
+    _cse240 = 0.517383113*_cse120*_cse20 + 0.517383113*_cse123*_cse14 - 0.855753802*_cse236 - 0.855753802*_cse237
+    _cse241 = -_cse120*_cse44 - _cse123*_cse46 + 0.458851168*_cse236 + 0.458851168*_cse237 + 0.758601438*_cse238 + 0.758601438*_cse239
+    _cse242 = -_cse120*_cse164 + _cse120*_cse71 - _cse123*_cse163 + _cse123*_cse70 - 0.0290982758960988*_cse236 - 0.0290982758960988*_cse237 - 0.0491638727803817*_cse238 - 0.0491638727803817*_cse239 - _cse240*_cse54 + 0.03790017976*_cse240*_cse56 - _cse240*_cse58 + _cse240*_cse60 + 0.0499969558686132*_cse241*_cse35 + 0.03790017976*_cse241*_cse41 - _cse241*_cse74 + _cse241*_cse75
+    _cse243 = -_cse0*_cse100 + _cse0*_cse98 + _cse0*_cse99 + 0.253888422522456*_cse141 + 0.253888422522456*_cse144
+    _cse244 = -_cse0*_cse96 + 0.0627091097210817*_cse13*_cse153 - _cse151*_cse163 + _cse151*_cse70 - 0.0491638727803817*_cse152 + _cse153*_cse92 - 0.0491638727803817*_cse154 - 0.0290982758960988*_cse155 - 0.0290982758960988*_cse156 - _cse158*_cse54 + 0.03790017976*_cse158*_cse56 - _cse158*_cse58 + _cse158*_cse60 + 0.0499969558686132*_cse161*_cse35 + 0.03790017976*_cse161*_cse41 - _cse161*_cse74 + _cse161*_cse75 - _cse243
+    _cse245 = _cse0*_cse103 - _cse0*_cse117 + _cse114*_cse194 + _cse115*_cse197 - 0.20503*_cse139 - 1.098e-6*_cse143 - _cse163*_cse190 + _cse164*_cse192 + _cse190*_cse70 - 0.0290982758960988*_cse191 + _cse192*_cse92 - 0.0290982758960988*_cse193 - _cse194*_cse54 - _cse194*_cse58 + _cse194*_cse60 - 0.0491638727803817*_cse195 - 0.0491638727803817*_cse196 + _cse197*_cse36 - _cse197*_cse74 + _cse197*_cse75 + _cse243
+    _cse246 = -_cse11
+    _cse247 = _cse14*_cse246
+    _cse248 = -_cse19
+    _cse249 = _cse21*_cse248
+    _cse250 = _cse23*_cse246
+    _cse251 = _cse248*_cse25
+    _cse252 = -_cse49 + _cse51
+    _cse253 = -_cse246*_cse46 + 0.758601438*_cse247 + _cse248*_cse44 + 0.758601438*_cse249 + 0.458851168*_cse250 + 0.458851168*_cse251 + _cse252
+    _cse254 = 0.517383113*_cse247 + 0.517383113*_cse249 - 0.855753802*_cse250 - 0.855753802*_cse251 - _cse29 + _cse32
+    _cse255 = _cse80*_cse97
+    _cse256 = 0.0038906673398998*_cse81
+    _cse257 = 0.0038906673398998*_cse78
+    _cse258 = _cse2*_cse27
+    _cse259 = 0.253888422522456*_cse258
+    _cse260 = _cse2*_cse30
+    _cse261 = -0.253888422522456*_cse260
+    _cse262 = _cse116*_cse77 + _cse255 + _cse256 + _cse257 + _cse259 + _cse261 + 0.20503*_cse77 - 1.098e-6*_cse80
+    _cse263 = -_cse112*_cse54 + 0.03790017976*_cse112*_cse56 - _cse112*_cse58 + _cse112*_cse60 - _cse113*_cse36 - _cse113*_cse40 + 0.03790017976*_cse113*_cse42 + _cse113*_cse43
+    _cse264 = _cse104*_cse64
+    _cse265 = _cse104*_cse20
+    _cse266 = _cse106*_cse23
+    _cse267 = _cse106*_cse14
+    _cse268 = 0.517383113*_cse104*_cse20 + 0.517383113*_cse106*_cse14 - 0.855753802*_cse264 - 0.855753802*_cse266
+    _cse269 = -_cse104*_cse44 - _cse106*_cse46 + 0.458851168*_cse264 + 0.758601438*_cse265 + 0.458851168*_cse266 + 0.758601438*_cse267
+    _cse270 = -_cse104*_cse164 + _cse104*_cse71 - _cse106*_cse163 + _cse106*_cse70 - 0.0290982758960988*_cse264 - 0.0491638727803817*_cse265 - 0.0290982758960988*_cse266 - 0.0491638727803817*_cse267 - _cse268*_cse54 + 0.03790017976*_cse268*_cse56 - _cse268*_cse58 + _cse268*_cse60 + 0.0499969558686132*_cse269*_cse35 + 0.03790017976*_cse269*_cse41 - _cse269*_cse74 + _cse269*_cse75
+    _cse271 = _cse10*_cse14
+    _cse272 = _cse18*_cse21
+    _cse273 = _cse10*_cse23
+    _cse274 = _cse18*_cse25
+    _cse275 = -_cse10*_cse46 + _cse18*_cse44 + 0.758601438*_cse271 + 0.758601438*_cse272 + 0.458851168*_cse273 + 0.458851168*_cse274 + _cse52
+    _cse276 = 0.517383113*_cse271 + 0.517383113*_cse272 - 0.855753802*_cse273 - 0.855753802*_cse274 + _cse33
+    _cse277 = _cse256 + _cse257 + _cse259 + _cse261 - _cse77*_cse95
+    _cse278 = -_cse10*_cse163 + _cse10*_cse70 + 0.0627091097210817*_cse13*_cse18 + _cse18*_cse92 - _cse255 - 0.0491638727803817*_cse271 - 0.0491638727803817*_cse272 - 0.0290982758960988*_cse273 - 0.0290982758960988*_cse274 + 0.0499969558686132*_cse275*_cse35 + 0.03790017976*_cse275*_cse41 - _cse275*_cse74 + _cse275*_cse75 - _cse276*_cse54 + 0.03790017976*_cse276*_cse56 - _cse276*_cse58 + _cse276*_cse60 - _cse277
+    _cse279 = -_cse10
+    _cse280 = _cse14*_cse279
+    _cse281 = -_cse18
+    _cse282 = _cse21*_cse281
+    _cse283 = _cse23*_cse279
+    _cse284 = _cse25*_cse281
+    _cse285 = _cse252 - _cse279*_cse46 + 0.758601438*_cse280 + _cse281*_cse44 + 0.758601438*_cse282 + 0.458851168*_cse283 + 0.458851168*_cse284
+    _cse286 = 0.517383113*_cse14*_cse279 + 0.517383113*_cse21*_cse281 - 0.855753802*_cse283 - 0.855753802*_cse284 - _cse33
+    _cse287 = _cse114*_cse286 + _cse115*_cse285 - _cse163*_cse279 + _cse164*_cse281 + _cse279*_cse70 - 0.0491638727803817*_cse280 + _cse281*_cse92 - 0.0491638727803817*_cse282 - 0.0290982758960988*_cse283 - 0.0290982758960988*_cse284 + _cse285*_cse36 - _cse285*_cse74 + _cse285*_cse75 - _cse286*_cse54 - _cse286*_cse58 + _cse286*_cse60
+    _cse288 = -_cse36*_cse94 - _cse40*_cse94 + 0.03790017976*_cse42*_cse94 + _cse43*_cse94 - _cse54*_cse91 + 0.03790017976*_cse56*_cse91 - _cse58*_cse91 + _cse60*_cse91
+    _cse289 = _cse23*_cse83
+    _cse290 = _cse14*_cse83
+    _cse291 = _cse64*_cse85
+    _cse292 = _cse20*_cse85
+    _cse293 = 0.517383113*_cse14*_cse83 + 0.517383113*_cse20*_cse85 - 0.855753802*_cse289 - 0.855753802*_cse291
+    _cse294 = 0.458851168*_cse289 + 0.758601438*_cse290 + 0.458851168*_cse291 + 0.758601438*_cse292 - _cse44*_cse85 - _cse46*_cse83
+    _cse295 = -_cse163*_cse83 - _cse164*_cse85 - 0.0290982758960988*_cse289 - 0.0491638727803817*_cse290 - 0.0290982758960988*_cse291 - 0.0491638727803817*_cse292 - _cse293*_cse54 + 0.03790017976*_cse293*_cse56 - _cse293*_cse58 + _cse293*_cse60 + 0.0499969558686132*_cse294*_cse35 + 0.03790017976*_cse294*_cse41 - _cse294*_cse74 + _cse294*_cse75 + _cse70*_cse83 + _cse71*_cse85
+    _cse296 = -_cse36*_cse72 - _cse40*_cse72 + 0.03790017976*_cse42*_cse72 + _cse43*_cse72 - _cse54*_cse73 + 0.03790017976*_cse56*_cse73 - _cse58*_cse73 + _cse60*_cse73
+    _cse297 = _cse19*_cse64
+    _cse298 = _cse11*_cse217
+    _cse299 = _cse11*_cse219
+    _cse300 = _cse19*_cse20
+    _cse301 = 0.517383113*_cse11*_cse217 + 0.517383113*_cse19*_cse20 - 0.855753802*_cse297 - 0.855753802*_cse299
+    _cse302 = 0.458851168*_cse297 + 0.758601438*_cse298 + 0.458851168*_cse299 + 0.758601438*_cse300 - _cse45 + _cse47
+    _cse303 = 0.999999998572139*_cse6 + 0.999999998572139*_cse9
+    _cse304 = -_cse303
+    _cse305 = _cse23*_cse304
+    _cse306 = 6.57617443000635e-7*_cse6 + 6.57617443000635e-7*_cse9
+    _cse307 = -_cse306
+    _cse308 = _cse25*_cse307
+    _cse309 = _cse28 - _cse31
+    _cse310 = 0.517383113*_cse14*_cse304 + 0.517383113*_cse21*_cse307 - 0.855753802*_cse305 - 0.855753802*_cse308 - _cse309
+    _cse311 = _cse14*_cse304
+    _cse312 = _cse21*_cse307
+    _cse313 = -_cse304*_cse46 + 0.458851168*_cse305 + _cse307*_cse44 + 0.458851168*_cse308 + 0.758601438*_cse311 + 0.758601438*_cse312 - _cse48 + _cse50
+    _cse314 = -_cse310*_cse36 - _cse310*_cse40 + 0.03790017976*_cse310*_cse42 + _cse310*_cse43 - _cse313*_cse54 + 0.03790017976*_cse313*_cse56 - _cse313*_cse58 + _cse313*_cse60
+    _cse315 = _cse304*_cse64
+    _cse316 = _cse20*_cse304
+    _cse317 = _cse23*_cse307
+    _cse318 = _cse14*_cse307
+    _cse319 = 0.517383113*_cse14*_cse307 + 0.517383113*_cse20*_cse304 - 0.855753802*_cse315 - 0.855753802*_cse317
+    _cse320 = -_cse304*_cse44 - _cse307*_cse46 + 0.458851168*_cse315 + 0.758601438*_cse316 + 0.458851168*_cse317 + 0.758601438*_cse318
+    _cse321 = -_cse163*_cse307 - _cse164*_cse304 + _cse304*_cse71 + _cse307*_cse70 - 0.0290982758960988*_cse315 - 0.0491638727803817*_cse316 - 0.0290982758960988*_cse317 - 0.0491638727803817*_cse318 - _cse319*_cse54 + 0.03790017976*_cse319*_cse56 - _cse319*_cse58 + _cse319*_cse60 + 0.0499969558686132*_cse320*_cse35 + 0.03790017976*_cse320*_cse41 - _cse320*_cse74 + _cse320*_cse75
+    _cse322 = 0.818687841791724*_cse6
+    _cse323 = 0.818687841791724*_cse9
+    _cse324 = -0.999999998572139*_cse27 + 0.999999998572139*_cse30
+    _cse325 = -_cse324
+    _cse326 = _cse325*_cse46
+    _cse327 = -6.57617443000635e-7*_cse27 + 6.57617443000635e-7*_cse30
+    _cse328 = -_cse327
+    _cse329 = _cse328*_cse44
+    _cse330 = _cse23*_cse325
+    _cse331 = _cse14*_cse325
+    _cse332 = _cse21*_cse328
+    _cse333 = _cse25*_cse328
+    _cse334 = _cse322 + _cse323 - _cse326 + _cse329 + 0.458851168*_cse330 + 0.758601438*_cse331 + 0.758601438*_cse332 + 0.458851168*_cse333
+    _cse335 = 0.000346321299837637*_cse6 + 0.000346321299837637*_cse9
+    _cse336 = 0.517383113*_cse14*_cse325 + 0.517383113*_cse21*_cse328 - 0.855753802*_cse330 - 0.855753802*_cse333 - _cse335
+    _cse337 = _cse334*_cse36
+    _cse338 = _cse336*_cse54
+    _cse339 = -_cse163*_cse325 + _cse164*_cse328
+    _cse340 = 0.253888422522456*_cse9
+    _cse341 = 0.253888422522456*_cse6
+    _cse342 = -_cse100
+    _cse343 = _cse340 + _cse341 + _cse342 + _cse96 + _cse99
+    _cse344 = _cse114*_cse336 + _cse115*_cse334 + _cse325*_cse70 + _cse328*_cse92 - 0.0290982758960988*_cse330 - 0.0491638727803817*_cse331 - 0.0491638727803817*_cse332 - 0.0290982758960988*_cse333 - _cse334*_cse74 + _cse334*_cse75 - _cse336*_cse58 + _cse336*_cse60 + _cse337 - _cse338 + _cse339 + _cse343 + _cse98
+    _cse345 = _cse21*_cse327
+    _cse346 = _cse25*_cse327
+    _cse347 = _cse23*_cse324
+    _cse348 = _cse14*_cse324
+    _cse349 = -_cse322 - _cse323 - _cse324*_cse46 + _cse327*_cse44 + 0.758601438*_cse345 + 0.458851168*_cse346 + 0.458851168*_cse347 + 0.758601438*_cse348
+    _cse350 = _cse335 + 0.517383113*_cse345 - 0.855753802*_cse346 - 0.855753802*_cse347 + 0.517383113*_cse348
+    _cse351 = -0.0627091097210817*_cse13*_cse327 + _cse163*_cse324 - _cse324*_cse70 - _cse327*_cse92 + 0.0491638727803817*_cse345 + 0.0290982758960988*_cse346 + 0.0290982758960988*_cse347 + 0.0491638727803817*_cse348 - 0.0499969558686132*_cse349*_cse35 - 0.03790017976*_cse349*_cse41 + _cse349*_cse74 - _cse349*_cse75 + _cse350*_cse54 - 0.03790017976*_cse350*_cse56 + _cse350*_cse58 - _cse350*_cse60
+    _cse352 = _cse14*_cse303
+    _cse353 = _cse21*_cse306
+    _cse354 = _cse23*_cse303
+    _cse355 = _cse25*_cse306
+    _cse356 = _cse309 + 0.517383113*_cse352 + 0.517383113*_cse353 - 0.855753802*_cse354 - 0.855753802*_cse355
+    _cse357 = -_cse303*_cse46 + _cse306*_cse44 + 0.758601438*_cse352 + 0.758601438*_cse353 + 0.458851168*_cse354 + 0.458851168*_cse355 + _cse48 - _cse50
+    _cse358 = -_cse356*_cse36 - _cse356*_cse40 + 0.03790017976*_cse356*_cse42 + _cse356*_cse43 - _cse357*_cse54 + 0.03790017976*_cse357*_cse56 - _cse357*_cse58 + _cse357*_cse60
+    _cse359 = _cse23*_cse306
+    _cse360 = _cse14*_cse306
+    _cse361 = _cse303*_cse64
+    _cse362 = _cse20*_cse303
+    _cse363 = 0.517383113*_cse14*_cse306 + 0.517383113*_cse20*_cse303 - 0.855753802*_cse359 - 0.855753802*_cse361
+    _cse364 = -_cse303*_cse44 - _cse306*_cse46 + 0.458851168*_cse359 + 0.758601438*_cse360 + 0.458851168*_cse361 + 0.758601438*_cse362
+    _cse365 = -_cse163*_cse306 - _cse164*_cse303 + _cse303*_cse71 + _cse306*_cse70 + 0.0499969558686132*_cse35*_cse364 - 0.0290982758960988*_cse359 - 0.0491638727803817*_cse360 - 0.0290982758960988*_cse361 - 0.0491638727803817*_cse362 - _cse363*_cse54 + 0.03790017976*_cse363*_cse56 - _cse363*_cse58 + _cse363*_cse60 + 0.03790017976*_cse364*_cse41 - _cse364*_cse74 + _cse364*_cse75
+    _cse366 = _cse325*_cse64
+    _cse367 = _cse23*_cse328
+    _cse368 = 0.517383113*_cse14*_cse328 + 0.517383113*_cse20*_cse325 - 0.855753802*_cse366 - 0.855753802*_cse367
+    _cse369 = _cse20*_cse325
+    _cse370 = _cse14*_cse328
+    _cse371 = -_cse325*_cse44 - _cse328*_cse46 + 0.458851168*_cse366 + 0.458851168*_cse367 + 0.758601438*_cse369 + 0.758601438*_cse370
+    _cse372 = -_cse36*_cse368 - _cse368*_cse40 + 0.03790017976*_cse368*_cse42 + _cse368*_cse43 - _cse371*_cse54 + 0.03790017976*_cse371*_cse56 - _cse371*_cse58 + _cse371*_cse60
+    _cse373 = _cse217*_cse325
+    _cse374 = _cse219*_cse325
+    _cse375 = _cse328*_cse64
+    _cse376 = _cse20*_cse328
+    _cse377 = _cse326 - _cse329 + 0.758601438*_cse373 + 0.458851168*_cse374 + 0.458851168*_cse375 + 0.758601438*_cse376
+    _cse378 = 0.517383113*_cse373 - 0.855753802*_cse374 - 0.855753802*_cse375 + 0.517383113*_cse376
+    _cse379 = _cse0*dq0
+    _cse380 = _cse141 + _cse144
+    _cse381 = 0.574238819026787*_cse144
+    _cse382 = 0.574238819026787*_cse141
+    _cse383 = 0.408002994597976*_cse13
+    _cse384 = 0.408002994597976*_cse12
+    _cse385 = 0.410149995883665*_cse35
+    _cse386 = 0.209584432*_cse39
+    _cse387 = 0.410879747*_cse42
+    _cse388 = 0.410149995883665*_cse37
+    _cse389 = 0.410879747*_cse56
+    _cse390 = 0.209584432*_cse57
+    _cse391 = 0.329365488408814*_cse144
+    _cse392 = 0.329365488408814*_cse141
+    _cse393 = 0.234017800844203*_cse13
+    _cse394 = 0.234017800844203*_cse12
+    _cse395 = 0.410879747*_cse41
+    _cse396 = 0.209584432*_cse38
+    _cse397 = _cse2*dq0
+    _cse398 = _cse78 + _cse81
+    _cse399 = 0.574238819026787*_cse78
+    _cse400 = 0.574238819026787*_cse81
+    _cse401 = 0.329365488408814*_cse78
+    _cse402 = 0.329365488408814*_cse81
+    _cse403 = -_cse27 + _cse30
+    _cse404 = 0.574238819026787*_cse30
+    _cse405 = 0.574238819026787*_cse27
+    _cse406 = 0.329365488408814*_cse30
+    _cse407 = 0.329365488408814*_cse27
+    out = np.empty((6, 6))
+    out[0, 0] = _cse102*dq2 + _cse118*dq1 + _cse61*dq4 + _cse76*dq3 + dq0*(_cse0*_cse134 - 4.3259e-5*_cse0 + _cse120*_cse70 - 0.0491638727803817*_cse121 + 0.0627091097210817*_cse123*_cse13 + _cse123*_cse92 - 0.0491638727803817*_cse124 - 0.0290982758960988*_cse126 - 0.0290982758960988*_cse127 - 0.0627091097210817*_cse128 + 0.0499969558686132*_cse132*_cse35 + 0.03790017976*_cse132*_cse41 - _cse132*_cse74 + _cse132*_cse75 - _cse138*_cse54 + 0.03790017976*_cse138*_cse56 - _cse138*_cse58 + _cse138*_cse60 - _cse150 + 0.0068032576553314*_cse2)
+    out[0, 1] = _cse118*dq0 + _cse162*dq4 + _cse171*dq3 + _cse182*dq2 + dq1*(-_cse0*_cse133 - _cse150 - _cse189)
+    out[0, 2] = _cse102*dq0 + _cse182*dq1 + _cse198*dq4 + _cse205*dq3 + dq2*(_cse0*_cse206*_cse7 - _cse181 - _cse189)
+    out[0, 3] = _cse171*dq1 + _cse205*dq2 + _cse215*dq4 + _cse76*dq0 + dq3*(0.0627091097210817*_cse12*_cse207 - _cse164*_cse209 + _cse207*_cse69 + _cse209*_cse71 - 0.0290982758960988*_cse216 - 0.0491638727803817*_cse218 - 0.0290982758960988*_cse220 - 0.0491638727803817*_cse221 - _cse222*_cse54 + 0.03790017976*_cse222*_cse56 - _cse222*_cse58 + _cse222*_cse60 + 0.0499969558686132*_cse225*_cse35 + 0.03790017976*_cse225*_cse41 - _cse225*_cse74 + _cse225*_cse75)
+    out[0, 4] = _cse162*dq1 + _cse198*dq2 + _cse215*dq3 + _cse61*dq0 + dq4*(-_cse230*_cse231 + _cse230*_cse232 + _cse230*_cse54 + _cse230*_cse59 + _cse233*_cse234 - _cse233*_cse36 - _cse233*_cse40 + _cse233*_cse43)
+    out[0, 5] = 0
+    out[1, 0] = _cse235*dq4 + _cse242*dq3 + _cse244*dq2 + _cse245*dq1 + dq0*(0.0068032576553314*_cse0 + _cse114*_cse254 + _cse115*_cse253 - _cse134*_cse2 - _cse163*_cse246 + _cse164*_cse248 + 4.3259e-5*_cse2 + _cse246*_cse70 - 0.0491638727803817*_cse247 + _cse248*_cse92 - 0.0491638727803817*_cse249 - 0.0290982758960988*_cse250 - 0.0290982758960988*_cse251 + _cse253*_cse36 - _cse253*_cse74 + _cse253*_cse75 - _cse254*_cse54 - _cse254*_cse58 + _cse254*_cse60 + _cse262)
+    out[1, 1] = _cse245*dq0 + _cse263*dq4 + _cse270*dq3 + _cse278*dq2 + dq1*(_cse133*_cse2 + _cse262 + _cse287)
+    out[1, 2] = _cse244*dq0 + _cse278*dq1 + _cse288*dq4 + _cse295*dq3 + dq2*(-_cse206*_cse80 + _cse277 + _cse287)
+    out[1, 3] = _cse242*dq0 + _cse270*dq1 + _cse295*dq2 + _cse296*dq4 + dq3*(0.0627091097210817*_cse11*_cse12 + _cse11*_cse69 - _cse164*_cse19 + _cse19*_cse71 - 0.0290982758960988*_cse297 - 0.0491638727803817*_cse298 - 0.0290982758960988*_cse299 - 0.0491638727803817*_cse300 - _cse301*_cse54 + 0.03790017976*_cse301*_cse56 - _cse301*_cse58 + _cse301*_cse60 + 0.0499969558686132*_cse302*_cse35 + 0.03790017976*_cse302*_cse41 - _cse302*_cse74 + _cse302*_cse75)
+    out[1, 4] = _cse235*dq0 + _cse263*dq1 + _cse288*dq2 + _cse296*dq3 + dq4*(-_cse231*_cse34 + _cse232*_cse34 + _cse234*_cse53 + _cse34*_cse54 + _cse34*_cse59 - _cse36*_cse53 - _cse40*_cse53 + _cse43*_cse53)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse314*dq4 + _cse321*dq3 + _cse344*dq2 + dq1*(_cse116*_cse7 - _cse340 - _cse341 - _cse342 - _cse351 - 0.001950802*_cse4 + 0.41405*_cse7 - _cse98 - _cse99)
+    out[2, 2] = _cse344*dq1 + _cse358*dq4 + _cse365*dq3 + dq2*(_cse206*_cse4 - _cse343 - _cse351)
+    out[2, 3] = _cse321*dq1 + _cse365*dq2 + _cse372*dq4 + dq3*(_cse325*_cse69 + _cse328*_cse71 - _cse339 + 0.0499969558686132*_cse35*_cse377 - 0.0491638727803817*_cse373 - 0.0290982758960988*_cse374 - 0.0290982758960988*_cse375 - 0.0491638727803817*_cse376 + 0.03790017976*_cse377*_cse41 - _cse377*_cse74 + _cse377*_cse75 - _cse378*_cse54 + 0.03790017976*_cse378*_cse56 - _cse378*_cse58 + _cse378*_cse60)
+    out[2, 4] = _cse314*dq1 + _cse358*dq2 + _cse372*dq3 + dq4*(-_cse231*_cse336 + _cse232*_cse336 + _cse234*_cse334 - _cse334*_cse40 + _cse334*_cse43 + _cse336*_cse59 - _cse337 + _cse338)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse379
+    out[3, 2] = _cse379
+    out[3, 3] = _cse380*dq1 - _cse380*dq2 + dq0*(_cse2*_cse5*_cse7 - _cse260)
+    out[3, 4] = dq0*(_cse11*_cse384 + 0.3960285*_cse15 - _cse19*_cse383 + 0.3960285*_cse22 + 0.239041914*_cse24 + 0.574238819026787*_cse258 + 0.239041914*_cse26 - 0.574238819026787*_cse260) + dq1*(_cse151*_cse384 + 0.3960285*_cse152 - _cse153*_cse383 + 0.3960285*_cse154 + 0.239041914*_cse155 + 0.239041914*_cse156 + _cse381 + _cse382) + dq2*(_cse190*_cse384 + 0.239041914*_cse191 - _cse192*_cse383 + 0.239041914*_cse193 + 0.3960285*_cse195 + 0.3960285*_cse196 - _cse381 - _cse382) + dq3*(_cse207*_cse383 + 0.239041914*_cse208 + _cse209*_cse384 + 0.239041914*_cse210 + 0.3960285*_cse212 + 0.3960285*_cse213)
+    out[3, 5] = dq0*(_cse11*_cse394 + 0.227149603970304*_cse15 - _cse19*_cse393 + 0.227149603970304*_cse22 + 0.137106991283212*_cse24 + 0.329365488408814*_cse258 + 0.137106991283212*_cse26 - 0.329365488408814*_cse260 + _cse34*_cse388 - _cse34*_cse389 + _cse34*_cse390 - _cse385*_cse53 - _cse395*_cse53 + _cse396*_cse53) + dq1*(_cse151*_cse394 + 0.227149603970304*_cse152 - _cse153*_cse393 + 0.227149603970304*_cse154 + 0.137106991283212*_cse155 + 0.137106991283212*_cse156 + _cse158*_cse388 - _cse158*_cse389 + _cse158*_cse390 - _cse161*_cse385 - _cse161*_cse395 + _cse161*_cse396 + _cse391 + _cse392) + dq2*(_cse190*_cse394 + 0.137106991283212*_cse191 - _cse192*_cse393 + 0.137106991283212*_cse193 + _cse194*_cse388 - _cse194*_cse389 + _cse194*_cse390 + 0.227149603970304*_cse195 + 0.227149603970304*_cse196 - _cse197*_cse385 - _cse197*_cse395 + _cse197*_cse396 - _cse391 - _cse392) + dq3*(_cse207*_cse393 + 0.137106991283212*_cse208 + _cse209*_cse394 + 0.137106991283212*_cse210 + _cse211*_cse388 - _cse211*_cse389 + _cse211*_cse390 + 0.227149603970304*_cse212 + 0.227149603970304*_cse213 - _cse214*_cse385 - _cse214*_cse395 + _cse214*_cse396) + dq4*(_cse230*_cse385 + _cse230*_cse386 - _cse230*_cse387 + _cse233*_cse388 - _cse233*_cse389 + _cse233*_cse390)
+    out[4, 0] = 0
+    out[4, 1] = _cse397
+    out[4, 2] = -_cse397
+    out[4, 3] = -_cse398*dq1 + _cse398*dq2 + dq0*(_cse0*_cse5*_cse7 - _cse148)
+    out[4, 4] = dq0*(0.3960285*_cse121 + 0.3960285*_cse124 - 0.408002994597976*_cse125 + 0.239041914*_cse126 + 0.239041914*_cse127 + 0.408002994597976*_cse128 + 0.574238819026787*_cse146 - 0.574238819026787*_cse148) + dq1*(0.408002994597976*_cse105 - 0.408002994597976*_cse107 + 0.239041914*_cse108 + 0.3960285*_cse109 + 0.3960285*_cse110 + 0.239041914*_cse111 - _cse399 - _cse400) + dq2*(_cse399 + _cse400 - 0.408002994597976*_cse84 + 0.408002994597976*_cse86 + 0.3960285*_cse87 + 0.239041914*_cse88 + 0.239041914*_cse89 + 0.3960285*_cse90) + dq3*(0.408002994597976*_cse62 + 0.408002994597976*_cse63 + 0.239041914*_cse65 + 0.239041914*_cse66 + 0.3960285*_cse67 + 0.3960285*_cse68)
+    out[4, 5] = dq0*(0.227149603970304*_cse121 + 0.227149603970304*_cse124 - 0.234017800844203*_cse125 + 0.137106991283212*_cse126 + 0.137106991283212*_cse127 + 0.234017800844203*_cse128 - _cse132*_cse385 - _cse132*_cse395 + _cse132*_cse396 + _cse138*_cse388 - _cse138*_cse389 + _cse138*_cse390 + 0.329365488408814*_cse146 - 0.329365488408814*_cse148) + dq1*(0.234017800844203*_cse105 - 0.234017800844203*_cse107 + 0.137106991283212*_cse108 + 0.227149603970304*_cse109 + 0.227149603970304*_cse110 + 0.137106991283212*_cse111 - _cse112*_cse385 - _cse112*_cse395 + _cse112*_cse396 + _cse113*_cse388 - _cse113*_cse389 + _cse113*_cse390 - _cse401 - _cse402) + dq2*(-_cse385*_cse91 + _cse388*_cse94 - _cse389*_cse94 + _cse390*_cse94 - _cse395*_cse91 + _cse396*_cse91 + _cse401 + _cse402 - 0.234017800844203*_cse84 + 0.234017800844203*_cse86 + 0.227149603970304*_cse87 + 0.137106991283212*_cse88 + 0.137106991283212*_cse89 + 0.227149603970304*_cse90) + dq3*(-_cse385*_cse73 + _cse388*_cse72 - _cse389*_cse72 + _cse390*_cse72 - _cse395*_cse73 + _cse396*_cse73 + 0.234017800844203*_cse62 + 0.234017800844203*_cse63 + 0.137106991283212*_cse65 + 0.137106991283212*_cse66 + 0.227149603970304*_cse67 + 0.227149603970304*_cse68) + dq4*(_cse34*_cse385 + _cse34*_cse386 - _cse34*_cse387 + _cse388*_cse53 - _cse389*_cse53 + _cse390*_cse53)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse403*dq1 - _cse403*dq2
+    out[5, 4] = dq1*(_cse304*_cse384 + 0.239041914*_cse305 - _cse307*_cse383 + 0.239041914*_cse308 + 0.3960285*_cse311 + 0.3960285*_cse312 + _cse404 - _cse405) + dq2*(_cse303*_cse384 - _cse306*_cse383 + 0.3960285*_cse352 + 0.3960285*_cse353 + 0.239041914*_cse354 + 0.239041914*_cse355 - _cse404 + _cse405) + dq3*(_cse325*_cse383 + _cse328*_cse384 + 0.239041914*_cse366 + 0.239041914*_cse367 + 0.3960285*_cse369 + 0.3960285*_cse370)
+    out[5, 5] = dq1*(_cse304*_cse394 + 0.137106991283212*_cse305 - _cse307*_cse393 + 0.137106991283212*_cse308 + _cse310*_cse388 - _cse310*_cse389 + _cse310*_cse390 + 0.227149603970304*_cse311 + 0.227149603970304*_cse312 - _cse313*_cse385 - _cse313*_cse395 + _cse313*_cse396 + _cse406 - _cse407) + dq2*(_cse303*_cse394 - _cse306*_cse393 + 0.227149603970304*_cse352 + 0.227149603970304*_cse353 + 0.137106991283212*_cse354 + 0.137106991283212*_cse355 + _cse356*_cse388 - _cse356*_cse389 + _cse356*_cse390 - _cse357*_cse385 - _cse357*_cse395 + _cse357*_cse396 - _cse406 + _cse407) + dq3*(_cse325*_cse393 + _cse328*_cse394 + 0.137106991283212*_cse366 + 0.137106991283212*_cse367 + _cse368*_cse388 - _cse368*_cse389 + _cse368*_cse390 + 0.227149603970304*_cse369 + 0.227149603970304*_cse370 - _cse371*_cse385 - _cse371*_cse395 + _cse371*_cse396) + dq4*(_cse334*_cse388 - _cse334*_cse389 + _cse334*_cse390 + _cse336*_cse385 + _cse336*_cse386 - _cse336*_cse387)
+    return out
+
+
+# EE[0,0,0]_Tx
+def function42(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse3*_cse8
+    _cse10 = _cse5*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = math.sin(q3)
+    _cse16 = 6.57617443000635e-7*_cse0
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = _cse2*_cse6
+    _cse19 = _cse4*_cse8
+    _cse20 = -_cse16 - _cse17*_cse18 - _cse17*_cse19
+    _cse21 = _cse15*_cse20
+    _cse22 = math.cos(q3)
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0 - _cse18*_cse23 - _cse19*_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = -0.012581*_cse15 - 0.00040053*_cse22
+    _cse27 = -0.00040053*_cse15 + 0.012581*_cse22
+    _cse28 = -0.51802699*_cse15 - 0.75940555*_cse22
+    _cse29 = _cse24*_cse28
+    _cse30 = 0.45991232*_cse15 + 0.85536427*_cse22
+    _cse31 = _cse20*_cse30
+    _cse32 = 0.75940555*_cse15 - 0.51802699*_cse22
+    _cse33 = _cse20*_cse32
+    _cse34 = 0.85536427*_cse15 - 0.45991232*_cse22
+    _cse35 = _cse24*_cse34
+    _cse36 = -0.000346321299837637*_cse10 + 0.517383113*_cse29 - 0.855753802*_cse31 + 0.517383113*_cse33 - 0.855753802*_cse35 + 0.000346321299837637*_cse9
+    _cse37 = math.sin(q4)
+    _cse38 = 0.0499969558686132*_cse37
+    _cse39 = math.cos(q4)
+    _cse40 = -0.012272*_cse37 - 0.00052974*_cse39
+    _cse41 = -0.78972966*_cse37 + 0.45479896*_cse39
+    _cse42 = 0.03790017976*_cse41
+    _cse43 = 0.00754966217739359*_cse37 + 0.0166720597638287*_cse39
+    _cse44 = 0.818687841791724*_cse10 - 0.212878838804554*_cse21 + 0.212878838804554*_cse25 + 0.758601438*_cse29 + 0.458851168*_cse31 + 0.758601438*_cse33 + 0.458851168*_cse35 - 0.818687841791724*_cse9
+    _cse45 = 0.0499969558686132*_cse39
+    _cse46 = -0.00052974*_cse37 + 0.012272*_cse39
+    _cse47 = 0.45479896*_cse37 + 0.78972966*_cse39
+    _cse48 = 0.03790017976*_cse47
+    _cse49 = 0.0166720597638287*_cse37 - 0.00754966217739359*_cse39
+    _cse50 = _cse0*_cse2
+    _cse51 = _cse0*_cse4
+    _cse52 = _cse51*_cse6
+    _cse53 = _cse16*_cse18 + _cse16*_cse19 + _cse17
+    _cse54 = 0.999999998572139*_cse0
+    _cse55 = _cse18*_cse54 + _cse19*_cse54 - _cse23
+    _cse56 = _cse15*_cse55
+    _cse57 = _cse28*_cse53
+    _cse58 = _cse30*_cse55
+    _cse59 = _cse32*_cse55
+    _cse60 = _cse34*_cse53
+    _cse61 = _cse50*_cse8
+    _cse62 = 0.000346321299837637*_cse52 + 0.517383113*_cse57 - 0.855753802*_cse58 + 0.517383113*_cse59 - 0.855753802*_cse60 - 0.000346321299837637*_cse61
+    _cse63 = 0.212878838804554*_cse22*_cse53 - 0.818687841791724*_cse52 - 0.212878838804554*_cse56 + 0.758601438*_cse57 + 0.458851168*_cse58 + 0.758601438*_cse59 + 0.458851168*_cse60 + 0.818687841791724*_cse61
+    _cse64 = _cse2*_cse8
+    _cse65 = 0.999999998572139*_cse4*_cse6 - 0.999999998572139*_cse64
+    _cse66 = _cse15*_cse65
+    _cse67 = 6.57617443000635e-7*_cse4*_cse6 - 6.57617443000635e-7*_cse64
+    _cse68 = _cse22*_cse67
+    _cse69 = _cse30*_cse65
+    _cse70 = _cse32*_cse65
+    _cse71 = _cse28*_cse67
+    _cse72 = _cse34*_cse67
+    _cse73 = -0.000346321299837637*_cse18 - 0.000346321299837637*_cse19 + 0.517383113*_cse28*_cse67 + 0.517383113*_cse32*_cse65 - 0.855753802*_cse69 - 0.855753802*_cse72
+    _cse74 = 0.818687841791724*_cse18 + 0.818687841791724*_cse19 - 0.212878838804554*_cse66 + 0.212878838804554*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70 + 0.758601438*_cse71 + 0.458851168*_cse72
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + 0.253888422522456*_cse10 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse20*_cse26 - 0.0627091097210817*_cse21 + _cse24*_cse27 + 0.0627091097210817*_cse25 - 0.0491638727803817*_cse29 + _cse3*_cse7 + 0.20503*_cse3 - 0.0290982758960988*_cse31 - 0.0491638727803817*_cse33 - 0.0290982758960988*_cse35 - _cse36*_cse38 + _cse36*_cse40 + _cse36*_cse42 - _cse36*_cse43 + _cse44*_cse45 + _cse44*_cse46 + _cse44*_cse48 - _cse44*_cse49 - 1.098e-6*_cse5 - 0.253888422522456*_cse9 - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.253888422522456*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse11*_cse51 - _cse13*_cse50 - _cse14*_cse51 + 0.0627091097210817*_cse22*_cse53 + _cse26*_cse55 + _cse27*_cse53 - _cse38*_cse62 + 0.0499969558686132*_cse39*_cse63 + _cse40*_cse62 + 0.03790017976*_cse41*_cse62 - _cse43*_cse62 + _cse46*_cse63 + 0.03790017976*_cse47*_cse63 - _cse49*_cse63 - _cse50*_cse7 - 0.20503*_cse50 - 0.253888422522456*_cse52 - 0.0627091097210817*_cse56 - 0.0491638727803817*_cse57 - 0.0290982758960988*_cse58 - 0.0491638727803817*_cse59 - 0.0290982758960988*_cse60 - 1.7324e-5
+    out[2, 0] = -_cse13*_cse4 + _cse14*_cse2 + 0.253888422522456*_cse18 + 0.253888422522456*_cse19 + 0.001950802*_cse2 + _cse26*_cse65 + _cse27*_cse67 - _cse38*_cse73 - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + _cse40*_cse73 + _cse42*_cse73 - _cse43*_cse73 + _cse45*_cse74 + _cse46*_cse74 + _cse48*_cse74 - _cse49*_cse74 + 0.0038906673398998*_cse64 - 0.0627091097210817*_cse66 + 0.0627091097210817*_cse68 - 0.0290982758960988*_cse69 - 0.0491638727803817*_cse70 - 0.0491638727803817*_cse71 - 0.0290982758960988*_cse72 + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# EE[0,0,0]_J
+def function43(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = math.sin(q3)
+    _cse24 = 6.57617443000635e-7*_cse1
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse11*_cse25 - _cse24 + _cse25*_cse6
+    _cse27 = _cse23*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse23
+    _cse29 = -_cse28
+    _cse30 = _cse22*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse23
+    _cse32 = _cse26*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse23
+    _cse34 = _cse26*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse23
+    _cse36 = _cse22*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse23
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse23
+    _cse39 = -_cse38
+    _cse40 = _cse0*_cse2
+    _cse41 = _cse40*_cse8
+    _cse42 = 0.000346321299837637*_cse10 + 0.517383113*_cse30 - 0.855753802*_cse32 + 0.517383113*_cse34 - 0.855753802*_cse36 - 0.000346321299837637*_cse41
+    _cse43 = math.sin(q4)
+    _cse44 = 0.0499969558686132*_cse43
+    _cse45 = math.cos(q4)
+    _cse46 = -0.78972966*_cse43 + 0.45479896*_cse45
+    _cse47 = 0.40329059*_cse43 + 0.89059413*_cse45
+    _cse48 = 0.01872015456*_cse47
+    _cse49 = -0.012272*_cse43 - 0.00052974*_cse45
+    _cse50 = _cse19*_cse22
+    _cse51 = -0.818687841791724*_cse10 - 0.212878838804554*_cse27 + 0.758601438*_cse30 + 0.458851168*_cse32 + 0.758601438*_cse34 + 0.458851168*_cse36 + 0.818687841791724*_cse41 + 0.212878838804554*_cse50
+    _cse52 = 0.45479896*_cse43 + 0.78972966*_cse45
+    _cse53 = 0.89059413*_cse43 - 0.40329059*_cse45
+    _cse54 = 0.01872015456*_cse53
+    _cse55 = 0.00052974*_cse43 - 0.012272*_cse45
+    _cse56 = -_cse55
+    _cse57 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse58 = 0.818687841791724*_cse6
+    _cse59 = _cse1*_cse58
+    _cse60 = 0.818687841791724*_cse11
+    _cse61 = _cse1*_cse60
+    _cse62 = _cse2*_cse8
+    _cse63 = _cse4*_cse5
+    _cse64 = _cse24*_cse62 - _cse24*_cse63
+    _cse65 = _cse20*_cse62 - _cse20*_cse63
+    _cse66 = _cse23*_cse65
+    _cse67 = _cse29*_cse64
+    _cse68 = _cse35*_cse64
+    _cse69 = _cse31*_cse65
+    _cse70 = _cse33*_cse65
+    _cse71 = 0.212878838804554*_cse19*_cse64 - _cse59 - _cse61 - 0.212878838804554*_cse66 + 0.758601438*_cse67 + 0.458851168*_cse68 + 0.458851168*_cse69 + 0.758601438*_cse70
+    _cse72 = 0.000346321299837637*_cse11
+    _cse73 = 0.000346321299837637*_cse6
+    _cse74 = _cse1*_cse72 + _cse1*_cse73
+    _cse75 = 0.517383113*_cse67 - 0.855753802*_cse68 - 0.855753802*_cse69 + 0.517383113*_cse70 + _cse74
+    _cse76 = _cse1*_cse2
+    _cse77 = _cse76*_cse8
+    _cse78 = 0.253888422522456*_cse1
+    _cse79 = _cse1*_cse4
+    _cse80 = _cse5*_cse79
+    _cse81 = _cse11*_cse78 + _cse17*_cse76 + _cse6*_cse78 + 0.0038906673398998*_cse77 - 0.0038906673398998*_cse80
+    _cse82 = -_cse65
+    _cse83 = _cse23*_cse82
+    _cse84 = -_cse64
+    _cse85 = _cse19*_cse84
+    _cse86 = _cse31*_cse82
+    _cse87 = _cse33*_cse82
+    _cse88 = _cse29*_cse84
+    _cse89 = _cse35*_cse84
+    _cse90 = _cse59 + _cse61 - 0.212878838804554*_cse83 + 0.212878838804554*_cse85 + 0.458851168*_cse86 + 0.758601438*_cse87 + 0.758601438*_cse88 + 0.458851168*_cse89
+    _cse91 = 0.517383113*_cse29*_cse84 + 0.517383113*_cse33*_cse82 - _cse74 - 0.855753802*_cse86 - 0.855753802*_cse89
+    _cse92 = 0.0499969558686132*_cse45
+    _cse93 = 0.03790017976*_cse46
+    _cse94 = 0.03790017976*_cse52
+    _cse95 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse96 = -_cse95
+    _cse97 = _cse19*_cse96
+    _cse98 = -0.999999998572139*_cse0 + _cse11*_cse24 + _cse24*_cse6
+    _cse99 = -_cse98
+    _cse100 = _cse23*_cse99
+    _cse101 = -_cse35
+    _cse102 = _cse101*_cse96
+    _cse103 = _cse31*_cse99
+    _cse104 = _cse28*_cse96
+    _cse105 = _cse33*_cse99
+    _cse106 = -0.855753802*_cse102 - 0.855753802*_cse103 + 0.517383113*_cse28*_cse96 + 0.517383113*_cse33*_cse99
+    _cse107 = -0.212878838804554*_cse100 + 0.458851168*_cse102 + 0.458851168*_cse103 + 0.758601438*_cse104 + 0.758601438*_cse105 - 0.212878838804554*_cse97
+    _cse108 = 0.000346321299837637*_cse77
+    _cse109 = 0.000346321299837637*_cse80
+    _cse110 = _cse29*_cse99
+    _cse111 = _cse31*_cse96
+    _cse112 = _cse33*_cse96
+    _cse113 = _cse35*_cse99
+    _cse114 = _cse108 - _cse109 + 0.517383113*_cse110 - 0.855753802*_cse111 + 0.517383113*_cse112 - 0.855753802*_cse113
+    _cse115 = -0.01872015456*_cse53
+    _cse116 = -_cse52
+    _cse117 = 0.818687841791724*_cse77
+    _cse118 = 0.818687841791724*_cse80
+    _cse119 = 0.212878838804554*_cse23
+    _cse120 = 0.212878838804554*_cse19
+    _cse121 = 0.758601438*_cse110 + 0.458851168*_cse111 + 0.758601438*_cse112 + 0.458851168*_cse113 - _cse117 + _cse118 - _cse119*_cse96 + _cse120*_cse99
+    _cse122 = 0.0627091097210817*_cse23
+    _cse123 = _cse29*_cse98
+    _cse124 = _cse31*_cse95
+    _cse125 = _cse33*_cse95
+    _cse126 = _cse35*_cse98
+    _cse127 = -_cse108 + _cse109 + 0.517383113*_cse123 - 0.855753802*_cse124 + 0.517383113*_cse125 - 0.855753802*_cse126
+    _cse128 = _cse117 - _cse118 - _cse119*_cse95 + _cse120*_cse98 + 0.758601438*_cse123 + 0.458851168*_cse124 + 0.758601438*_cse125 + 0.458851168*_cse126
+    _cse129 = _cse0*_cse58
+    _cse130 = _cse0*_cse60
+    _cse131 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse25*_cse62
+    _cse132 = -_cse131
+    _cse133 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse62
+    _cse134 = -_cse133
+    _cse135 = _cse132*_cse31
+    _cse136 = _cse132*_cse33
+    _cse137 = _cse134*_cse29
+    _cse138 = _cse134*_cse35
+    _cse139 = -_cse119*_cse132 + _cse120*_cse134 + _cse129 + _cse130 + 0.458851168*_cse135 + 0.758601438*_cse136 + 0.758601438*_cse137 + 0.458851168*_cse138
+    _cse140 = _cse0*_cse72 + _cse0*_cse73
+    _cse141 = 0.517383113*_cse132*_cse33 + 0.517383113*_cse134*_cse29 - 0.855753802*_cse135 - 0.855753802*_cse138 - _cse140
+    _cse142 = 0.0627091097210817*_cse19
+    _cse143 = 0.253888422522456*_cse0
+    _cse144 = -0.0038906673398998*_cse10 + _cse11*_cse143 + _cse143*_cse6 + _cse17*_cse40 + 0.0038906673398998*_cse41
+    _cse145 = _cse133*_cse29
+    _cse146 = _cse133*_cse35
+    _cse147 = _cse131*_cse31
+    _cse148 = _cse131*_cse33
+    _cse149 = -_cse119*_cse131 + _cse120*_cse133 - _cse129 - _cse130 + 0.758601438*_cse145 + 0.458851168*_cse146 + 0.458851168*_cse147 + 0.758601438*_cse148
+    _cse150 = _cse140 + 0.517383113*_cse145 - 0.855753802*_cse146 - 0.855753802*_cse147 + 0.517383113*_cse148
+    _cse151 = _cse101*_cse26
+    _cse152 = _cse22*_cse31
+    _cse153 = _cse26*_cse28
+    _cse154 = _cse22*_cse33
+    _cse155 = -0.855753802*_cse151 - 0.855753802*_cse152 + 0.517383113*_cse22*_cse33 + 0.517383113*_cse26*_cse28
+    _cse156 = -_cse119*_cse22 - _cse120*_cse26 + 0.458851168*_cse151 + 0.458851168*_cse152 + 0.758601438*_cse153 + 0.758601438*_cse154
+    _cse157 = 0.818687841791724*_cse62
+    _cse158 = 0.818687841791724*_cse63
+    _cse159 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse160 = -_cse159
+    _cse161 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse162 = -_cse161
+    _cse163 = _cse160*_cse31
+    _cse164 = _cse160*_cse33
+    _cse165 = _cse162*_cse29
+    _cse166 = _cse162*_cse35
+    _cse167 = -_cse119*_cse160 + _cse120*_cse162 - _cse157 + _cse158 + 0.458851168*_cse163 + 0.758601438*_cse164 + 0.758601438*_cse165 + 0.458851168*_cse166
+    _cse168 = -0.000346321299837637*_cse62 + 0.000346321299837637*_cse63
+    _cse169 = 0.517383113*_cse160*_cse33 + 0.517383113*_cse162*_cse29 - 0.855753802*_cse163 - 0.855753802*_cse166 - _cse168
+    _cse170 = _cse12 + _cse18 - 0.253888422522456*_cse62 + 0.253888422522456*_cse63 + _cse7
+    _cse171 = _cse161*_cse29
+    _cse172 = _cse161*_cse35
+    _cse173 = _cse159*_cse31
+    _cse174 = _cse159*_cse33
+    _cse175 = -_cse119*_cse159 + _cse120*_cse161 + _cse157 - _cse158 + 0.758601438*_cse171 + 0.458851168*_cse172 + 0.458851168*_cse173 + 0.758601438*_cse174
+    _cse176 = _cse168 + 0.517383113*_cse171 - 0.855753802*_cse172 - 0.855753802*_cse173 + 0.517383113*_cse174
+    _cse177 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse62
+    _cse178 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse62
+    _cse179 = _cse101*_cse177
+    _cse180 = _cse177*_cse28
+    _cse181 = _cse178*_cse31
+    _cse182 = _cse178*_cse33
+    _cse183 = 0.517383113*_cse177*_cse28 + 0.517383113*_cse178*_cse33 - 0.855753802*_cse179 - 0.855753802*_cse181
+    _cse184 = -_cse119*_cse178 - _cse120*_cse177 + 0.458851168*_cse179 + 0.758601438*_cse180 + 0.458851168*_cse181 + 0.758601438*_cse182
+    _cse185 = _cse177*_cse31
+    _cse186 = _cse178*_cse35
+    _cse187 = 0.517383113*_cse177*_cse33 + 0.517383113*_cse178*_cse29 - 0.855753802*_cse185 - 0.855753802*_cse186 - _cse72 - _cse73
+    _cse188 = _cse177*_cse33
+    _cse189 = _cse178*_cse29
+    _cse190 = -_cse119*_cse177 + _cse120*_cse178 + 0.458851168*_cse185 + 0.458851168*_cse186 + 0.758601438*_cse188 + 0.758601438*_cse189 + _cse58 + _cse60
+    _cse191 = _cse23*_cse96
+    _cse192 = _cse19*_cse99
+    _cse193 = 0.410149995883665*_cse43
+    _cse194 = 0.410879747*_cse46
+    _cse195 = 0.209584432*_cse47
+    _cse196 = 0.410149995883665*_cse45
+    _cse197 = 0.410879747*_cse52
+    _cse198 = 0.209584432*_cse53
+    _cse199 = _cse177*_cse23
+    _cse200 = _cse178*_cse19
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.253888422522456*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.253888422522456*_cse10 + 0.0627091097210817*_cse19*_cse22 + _cse22*_cse39 + _cse26*_cse37 - 0.0627091097210817*_cse27 - 0.0491638727803817*_cse30 - 0.0290982758960988*_cse32 - 0.0491638727803817*_cse34 - 0.0290982758960988*_cse36 - _cse42*_cse44 + 0.03790017976*_cse42*_cse46 - _cse42*_cse48 + _cse42*_cse49 + 0.0499969558686132*_cse45*_cse51 + 0.03790017976*_cse51*_cse52 - _cse51*_cse54 + _cse51*_cse56
+    out[0, 1] = _cse1*_cse15*_cse4 + 1.098e-6*_cse1*_cse2 + 0.20503*_cse1*_cse4 - _cse1*_cse57 + 0.0627091097210817*_cse19*_cse64 + _cse37*_cse65 + _cse39*_cse64 - _cse44*_cse75 + 0.0499969558686132*_cse45*_cse71 + 0.03790017976*_cse46*_cse75 - _cse48*_cse75 + _cse49*_cse75 + 0.03790017976*_cse52*_cse71 - _cse54*_cse71 + _cse56*_cse71 - 0.0627091097210817*_cse66 - 0.0491638727803817*_cse67 - 0.0290982758960988*_cse68 - 0.0290982758960988*_cse69 - 0.0491638727803817*_cse70 - _cse81
+    out[0, 2] = _cse14*_cse79 + _cse37*_cse82 + _cse39*_cse84 - _cse44*_cse91 - _cse48*_cse91 + _cse49*_cse91 - _cse54*_cse90 + _cse56*_cse90 + _cse81 - 0.0627091097210817*_cse83 + 0.0627091097210817*_cse85 - 0.0290982758960988*_cse86 - 0.0491638727803817*_cse87 - 0.0491638727803817*_cse88 - 0.0290982758960988*_cse89 + _cse90*_cse92 + _cse90*_cse94 + _cse91*_cse93
+    out[0, 3] = -0.0627091097210817*_cse100 - 0.0290982758960988*_cse102 - 0.0290982758960988*_cse103 - 0.0491638727803817*_cse104 - 0.0491638727803817*_cse105 - _cse106*_cse44 + 0.03790017976*_cse106*_cse46 - _cse106*_cse48 + _cse106*_cse49 + 0.0499969558686132*_cse107*_cse45 + 0.03790017976*_cse107*_cse52 - _cse107*_cse54 + _cse107*_cse56 + _cse37*_cse99 + _cse38*_cse96 - 0.0627091097210817*_cse97
+    out[0, 4] = -_cse114*_cse115 + 0.03790017976*_cse114*_cse116 + _cse114*_cse55 - _cse114*_cse92 - _cse121*_cse44 + 0.03790017976*_cse121*_cse46 - _cse121*_cse48 + _cse121*_cse49
+    out[0, 5] = 0
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 + 0.253888422522456*_cse1*_cse2*_cse8 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 - _cse122*_cse95 - 0.0491638727803817*_cse123 - 0.0290982758960988*_cse124 - 0.0491638727803817*_cse125 - 0.0290982758960988*_cse126 - _cse127*_cse44 + 0.03790017976*_cse127*_cse46 - _cse127*_cse48 + _cse127*_cse49 + 0.0499969558686132*_cse128*_cse45 + 0.03790017976*_cse128*_cse52 - _cse128*_cse54 + _cse128*_cse56 + 0.0627091097210817*_cse19*_cse98 + _cse37*_cse95 + _cse39*_cse98 - 0.253888422522456*_cse80
+    out[1, 1] = _cse0*_cse57 - _cse122*_cse132 + _cse132*_cse37 + _cse134*_cse142 + _cse134*_cse39 - 0.0290982758960988*_cse135 - 0.0491638727803817*_cse136 - 0.0491638727803817*_cse137 - 0.0290982758960988*_cse138 - _cse139*_cse54 + _cse139*_cse56 + _cse139*_cse92 + _cse139*_cse94 - _cse141*_cse44 - _cse141*_cse48 + _cse141*_cse49 + _cse141*_cse93 + _cse144 - _cse15*_cse9 - 1.098e-6*_cse40 - 0.20503*_cse9
+    out[1, 2] = -_cse122*_cse131 + _cse131*_cse37 + 0.0627091097210817*_cse133*_cse19 + _cse133*_cse39 - _cse14*_cse9 - _cse144 - 0.0491638727803817*_cse145 - 0.0290982758960988*_cse146 - 0.0290982758960988*_cse147 - 0.0491638727803817*_cse148 + 0.0499969558686132*_cse149*_cse45 + 0.03790017976*_cse149*_cse52 - _cse149*_cse54 + _cse149*_cse56 - _cse150*_cse44 + 0.03790017976*_cse150*_cse46 - _cse150*_cse48 + _cse150*_cse49
+    out[1, 3] = -_cse122*_cse22 - _cse142*_cse26 - 0.0290982758960988*_cse151 - 0.0290982758960988*_cse152 - 0.0491638727803817*_cse153 - 0.0491638727803817*_cse154 - _cse155*_cse44 + 0.03790017976*_cse155*_cse46 - _cse155*_cse48 + _cse155*_cse49 + 0.0499969558686132*_cse156*_cse45 + 0.03790017976*_cse156*_cse52 - _cse156*_cse54 + _cse156*_cse56 + _cse22*_cse37 + _cse26*_cse38
+    out[1, 4] = -_cse115*_cse42 + 0.03790017976*_cse116*_cse42 + _cse42*_cse55 - _cse42*_cse92 - _cse44*_cse51 + 0.03790017976*_cse46*_cse51 - _cse48*_cse51 + _cse49*_cse51
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse122*_cse160 + _cse142*_cse162 + _cse16 + _cse160*_cse37 + _cse162*_cse39 - 0.0290982758960988*_cse163 - 0.0491638727803817*_cse164 - 0.0491638727803817*_cse165 - 0.0290982758960988*_cse166 - _cse167*_cse54 + _cse167*_cse56 + _cse167*_cse92 + _cse167*_cse94 - _cse169*_cse44 - _cse169*_cse48 + _cse169*_cse49 + _cse169*_cse93 + _cse170 + 0.41405*_cse2 + 0.001950802*_cse4
+    out[2, 2] = -_cse122*_cse159 + _cse14*_cse2 + _cse159*_cse37 + 0.0627091097210817*_cse161*_cse19 + _cse161*_cse39 - _cse170 - 0.0491638727803817*_cse171 - 0.0290982758960988*_cse172 - 0.0290982758960988*_cse173 - 0.0491638727803817*_cse174 + 0.0499969558686132*_cse175*_cse45 + 0.03790017976*_cse175*_cse52 - _cse175*_cse54 + _cse175*_cse56 - _cse176*_cse44 + 0.03790017976*_cse176*_cse46 - _cse176*_cse48 + _cse176*_cse49
+    out[2, 3] = -_cse122*_cse178 - _cse142*_cse177 + _cse177*_cse38 + _cse178*_cse37 - 0.0290982758960988*_cse179 - 0.0491638727803817*_cse180 - 0.0290982758960988*_cse181 - 0.0491638727803817*_cse182 - _cse183*_cse44 + 0.03790017976*_cse183*_cse46 - _cse183*_cse48 + _cse183*_cse49 + 0.0499969558686132*_cse184*_cse45 + 0.03790017976*_cse184*_cse52 - _cse184*_cse54 + _cse184*_cse56
+    out[2, 4] = -_cse115*_cse187 + 0.03790017976*_cse116*_cse187 + _cse187*_cse55 - _cse187*_cse92 - _cse190*_cse44 + 0.03790017976*_cse190*_cse46 - _cse190*_cse48 + _cse190*_cse49
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse77 - _cse80
+    out[3, 4] = 0.3960285*_cse110 + 0.239041914*_cse111 + 0.3960285*_cse112 + 0.239041914*_cse113 + 0.408002994597976*_cse191 - 0.408002994597976*_cse192 + 0.574238819026787*_cse77 - 0.574238819026787*_cse80
+    out[3, 5] = 0.227149603970304*_cse110 + 0.137106991283212*_cse111 + 0.227149603970304*_cse112 + 0.137106991283212*_cse113 + _cse114*_cse193 - _cse114*_cse194 + _cse114*_cse195 - _cse121*_cse196 - _cse121*_cse197 + _cse121*_cse198 + 0.234017800844203*_cse191 - 0.234017800844203*_cse192 + 0.329365488408814*_cse77 - 0.329365488408814*_cse80
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse41
+    out[4, 4] = 0.574238819026787*_cse10 + 0.408002994597976*_cse27 + 0.3960285*_cse30 + 0.239041914*_cse32 + 0.3960285*_cse34 + 0.239041914*_cse36 - 0.574238819026787*_cse41 - 0.408002994597976*_cse50
+    out[4, 5] = 0.329365488408814*_cse10 + _cse193*_cse42 - _cse194*_cse42 + _cse195*_cse42 - _cse196*_cse51 - _cse197*_cse51 + _cse198*_cse51 + 0.234017800844203*_cse27 + 0.227149603970304*_cse30 + 0.137106991283212*_cse32 + 0.227149603970304*_cse34 + 0.137106991283212*_cse36 - 0.329365488408814*_cse41 - 0.234017800844203*_cse50
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + 0.239041914*_cse185 + 0.239041914*_cse186 + 0.3960285*_cse188 + 0.3960285*_cse189 + 0.408002994597976*_cse199 - 0.408002994597976*_cse200 - 0.574238819026787*_cse6
+    out[5, 5] = -0.329365488408814*_cse11 + 0.137106991283212*_cse185 + 0.137106991283212*_cse186 + _cse187*_cse193 - _cse187*_cse194 + _cse187*_cse195 + 0.227149603970304*_cse188 + 0.227149603970304*_cse189 - _cse190*_cse196 - _cse190*_cse197 + _cse190*_cse198 + 0.234017800844203*_cse199 - 0.234017800844203*_cse200 - 0.329365488408814*_cse6
+    return out
+
+
+# EE[0,0,0]_dJ
+def function44(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = 6.57617443000635e-7*_cse0
+    _cse2 = math.sin(q0)
+    _cse3 = 0.999999998572139*_cse2
+    _cse4 = math.sin(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse4*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = math.cos(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = _cse3*_cse6 + _cse3*_cse9
+    _cse11 = -_cse1 + _cse10
+    _cse12 = math.sin(q3)
+    _cse13 = math.cos(q3)
+    _cse14 = 0.75940555*_cse12 - 0.51802699*_cse13
+    _cse15 = _cse11*_cse14
+    _cse16 = 0.999999998572139*_cse0
+    _cse17 = 6.57617443000635e-7*_cse2
+    _cse18 = _cse17*_cse6 + _cse17*_cse9
+    _cse19 = _cse16 + _cse18
+    _cse20 = 0.51802699*_cse12 + 0.75940555*_cse13
+    _cse21 = -_cse20
+    _cse22 = _cse19*_cse21
+    _cse23 = 0.45991232*_cse12 + 0.85536427*_cse13
+    _cse24 = _cse11*_cse23
+    _cse25 = 0.85536427*_cse12 - 0.45991232*_cse13
+    _cse26 = _cse19*_cse25
+    _cse27 = _cse5*_cse7
+    _cse28 = 0.000346321299837637*_cse27
+    _cse29 = _cse2*_cse28
+    _cse30 = _cse4*_cse8
+    _cse31 = 0.000346321299837637*_cse30
+    _cse32 = _cse2*_cse31
+    _cse33 = _cse29 - _cse32
+    _cse34 = 0.517383113*_cse15 + 0.517383113*_cse22 - 0.855753802*_cse24 - 0.855753802*_cse26 + _cse33
+    _cse35 = math.cos(q4)
+    _cse36 = 0.0499969558686132*_cse35
+    _cse37 = math.sin(q4)
+    _cse38 = -0.40329059*_cse35 + 0.89059413*_cse37
+    _cse39 = -_cse38
+    _cse40 = 0.01872015456*_cse39
+    _cse41 = 0.78972966*_cse35 + 0.45479896*_cse37
+    _cse42 = -_cse41
+    _cse43 = -0.012272*_cse35 + 0.00052974*_cse37
+    _cse44 = 0.212878838804554*_cse13
+    _cse45 = _cse19*_cse44
+    _cse46 = 0.212878838804554*_cse12
+    _cse47 = _cse11*_cse46
+    _cse48 = 0.818687841791724*_cse30
+    _cse49 = _cse2*_cse48
+    _cse50 = 0.818687841791724*_cse27
+    _cse51 = _cse2*_cse50
+    _cse52 = _cse49 - _cse51
+    _cse53 = 0.758601438*_cse15 + 0.758601438*_cse22 + 0.458851168*_cse24 + 0.458851168*_cse26 + _cse45 - _cse47 + _cse52
+    _cse54 = 0.0499969558686132*_cse37
+    _cse55 = -0.45479896*_cse35 + 0.78972966*_cse37
+    _cse56 = -_cse55
+    _cse57 = 0.89059413*_cse35 + 0.40329059*_cse37
+    _cse58 = 0.01872015456*_cse57
+    _cse59 = 0.00052974*_cse35 + 0.012272*_cse37
+    _cse60 = -_cse59
+    _cse61 = -_cse34*_cse36 - _cse34*_cse40 + 0.03790017976*_cse34*_cse42 + _cse34*_cse43 - _cse53*_cse54 + 0.03790017976*_cse53*_cse56 - _cse53*_cse58 + _cse53*_cse60
+    _cse62 = _cse12*_cse19
+    _cse63 = _cse11*_cse13
+    _cse64 = -_cse25
+    _cse65 = _cse11*_cse64
+    _cse66 = _cse19*_cse23
+    _cse67 = _cse11*_cse20
+    _cse68 = _cse14*_cse19
+    _cse69 = 0.012581*_cse12 + 0.00040053*_cse13
+    _cse70 = -_cse69
+    _cse71 = 0.00040053*_cse12 - 0.012581*_cse13
+    _cse72 = 0.517383113*_cse11*_cse20 + 0.517383113*_cse14*_cse19 - 0.855753802*_cse65 - 0.855753802*_cse66
+    _cse73 = -0.212878838804554*_cse62 - 0.212878838804554*_cse63 + 0.458851168*_cse65 + 0.458851168*_cse66 + 0.758601438*_cse67 + 0.758601438*_cse68
+    _cse74 = 0.01872015456*_cse38
+    _cse75 = -_cse43
+    _cse76 = _cse11*_cse71 + _cse19*_cse70 + 0.0499969558686132*_cse35*_cse73 + 0.03790017976*_cse41*_cse73 - _cse54*_cse72 + 0.03790017976*_cse56*_cse72 - _cse58*_cse72 + _cse60*_cse72 - 0.0627091097210817*_cse62 - 0.0627091097210817*_cse63 - 0.0290982758960988*_cse65 - 0.0290982758960988*_cse66 - 0.0491638727803817*_cse67 - 0.0491638727803817*_cse68 - _cse73*_cse74 + _cse73*_cse75
+    _cse77 = _cse2*_cse4
+    _cse78 = _cse5*_cse77
+    _cse79 = 0.818687841791724*_cse78
+    _cse80 = _cse2*_cse7
+    _cse81 = _cse8*_cse80
+    _cse82 = 0.818687841791724*_cse81
+    _cse83 = _cse17*_cse30 - 6.57617443000635e-7*_cse2*_cse5*_cse7
+    _cse84 = _cse13*_cse83
+    _cse85 = -0.999999998572139*_cse2*_cse5*_cse7 + _cse3*_cse30
+    _cse86 = _cse12*_cse85
+    _cse87 = _cse21*_cse83
+    _cse88 = _cse25*_cse83
+    _cse89 = _cse23*_cse85
+    _cse90 = _cse14*_cse85
+    _cse91 = -_cse79 - _cse82 + 0.212878838804554*_cse84 - 0.212878838804554*_cse86 + 0.758601438*_cse87 + 0.458851168*_cse88 + 0.458851168*_cse89 + 0.758601438*_cse90
+    _cse92 = -_cse71
+    _cse93 = 0.000346321299837637*_cse78 + 0.000346321299837637*_cse81
+    _cse94 = 0.517383113*_cse87 - 0.855753802*_cse88 - 0.855753802*_cse89 + 0.517383113*_cse90 + _cse93
+    _cse95 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse96 = _cse7*_cse95
+    _cse97 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse98 = _cse4*_cse97
+    _cse99 = 0.0038906673398998*_cse30
+    _cse100 = 0.0038906673398998*_cse27
+    _cse101 = -_cse100*_cse2 + _cse2*_cse98 + _cse2*_cse99 + 0.253888422522456*_cse78 + 0.253888422522456*_cse81
+    _cse102 = -_cse101 + 0.0627091097210817*_cse13*_cse83 - _cse2*_cse96 + 0.0499969558686132*_cse35*_cse91 + 0.03790017976*_cse41*_cse91 - _cse54*_cse94 + 0.03790017976*_cse56*_cse94 - _cse58*_cse94 + _cse60*_cse94 + _cse70*_cse85 - _cse74*_cse91 + _cse75*_cse91 + _cse83*_cse92 - 0.0627091097210817*_cse86 - 0.0491638727803817*_cse87 - 0.0290982758960988*_cse88 - 0.0290982758960988*_cse89 - 0.0491638727803817*_cse90
+    _cse103 = 0.0019519*_cse4 - 0.20902*_cse7
+    _cse104 = -_cse85
+    _cse105 = _cse104*_cse12
+    _cse106 = -_cse83
+    _cse107 = _cse106*_cse13
+    _cse108 = _cse104*_cse23
+    _cse109 = _cse104*_cse14
+    _cse110 = _cse106*_cse21
+    _cse111 = _cse106*_cse25
+    _cse112 = -0.212878838804554*_cse105 + 0.212878838804554*_cse107 + 0.458851168*_cse108 + 0.758601438*_cse109 + 0.758601438*_cse110 + 0.458851168*_cse111 + _cse79 + _cse82
+    _cse113 = 0.517383113*_cse104*_cse14 + 0.517383113*_cse106*_cse21 - 0.855753802*_cse108 - 0.855753802*_cse111 - _cse93
+    _cse114 = 0.03790017976*_cse56
+    _cse115 = 0.03790017976*_cse41
+    _cse116 = -_cse95
+    _cse117 = _cse116*_cse7
+    _cse118 = _cse101 + _cse103*_cse2 + _cse104*_cse70 - 0.0627091097210817*_cse105 + _cse106*_cse92 + 0.0627091097210817*_cse107 - 0.0290982758960988*_cse108 - 0.0491638727803817*_cse109 - 0.0491638727803817*_cse110 - 0.0290982758960988*_cse111 + _cse112*_cse115 + _cse112*_cse36 - _cse112*_cse74 + _cse112*_cse75 + _cse113*_cse114 - _cse113*_cse54 - _cse113*_cse58 + _cse113*_cse60 - _cse117*_cse2 - 1.098e-6*_cse77 - 0.20503*_cse80
+    _cse119 = _cse16*_cse6 + _cse16*_cse9
+    _cse120 = _cse119 + _cse17
+    _cse121 = _cse120*_cse14
+    _cse122 = _cse1*_cse6 + _cse1*_cse9
+    _cse123 = _cse122 - _cse3
+    _cse124 = _cse123*_cse21
+    _cse125 = _cse123*_cse13
+    _cse126 = _cse120*_cse23
+    _cse127 = _cse123*_cse25
+    _cse128 = _cse12*_cse120
+    _cse129 = _cse0*_cse48
+    _cse130 = _cse0*_cse50
+    _cse131 = _cse129 - _cse130
+    _cse132 = 0.758601438*_cse121 + 0.758601438*_cse124 + 0.212878838804554*_cse125 + 0.458851168*_cse126 + 0.458851168*_cse127 - 0.212878838804554*_cse128 + _cse131
+    _cse133 = 0.20902*_cse4 + 0.0019519*_cse7
+    _cse134 = -_cse133
+    _cse135 = _cse0*_cse28
+    _cse136 = _cse0*_cse31
+    _cse137 = _cse135 - _cse136
+    _cse138 = 0.517383113*_cse121 + 0.517383113*_cse124 - 0.855753802*_cse126 - 0.855753802*_cse127 + _cse137
+    _cse139 = _cse0*_cse7
+    _cse140 = _cse139*_cse97
+    _cse141 = _cse139*_cse8
+    _cse142 = 0.0038906673398998*_cse141
+    _cse143 = _cse0*_cse4
+    _cse144 = _cse143*_cse5
+    _cse145 = 0.0038906673398998*_cse144
+    _cse146 = _cse0*_cse27
+    _cse147 = 0.253888422522456*_cse146
+    _cse148 = _cse0*_cse30
+    _cse149 = -0.253888422522456*_cse148
+    _cse150 = -1.098e-6*_cse0*_cse7 + _cse116*_cse143 + _cse140 + _cse142 + 0.20503*_cse143 + _cse145 + _cse147 + _cse149
+    _cse151 = -_cse16*_cse27 + _cse16*_cse30
+    _cse152 = _cse14*_cse151
+    _cse153 = -_cse1*_cse27 + _cse1*_cse30
+    _cse154 = _cse153*_cse21
+    _cse155 = _cse151*_cse23
+    _cse156 = _cse153*_cse25
+    _cse157 = 0.000346321299837637*_cse141 + 0.000346321299837637*_cse144
+    _cse158 = 0.517383113*_cse152 + 0.517383113*_cse154 - 0.855753802*_cse155 - 0.855753802*_cse156 + _cse157
+    _cse159 = 0.818687841791724*_cse144
+    _cse160 = 0.818687841791724*_cse141
+    _cse161 = -_cse151*_cse46 + 0.758601438*_cse152 + _cse153*_cse44 + 0.758601438*_cse154 + 0.458851168*_cse155 + 0.458851168*_cse156 - _cse159 - _cse160
+    _cse162 = -_cse158*_cse36 - _cse158*_cse40 + 0.03790017976*_cse158*_cse42 + _cse158*_cse43 - _cse161*_cse54 + 0.03790017976*_cse161*_cse56 - _cse161*_cse58 + _cse161*_cse60
+    _cse163 = 0.0627091097210817*_cse12
+    _cse164 = 0.0627091097210817*_cse13
+    _cse165 = _cse153*_cse23
+    _cse166 = _cse14*_cse153
+    _cse167 = _cse151*_cse64
+    _cse168 = _cse151*_cse20
+    _cse169 = 0.517383113*_cse14*_cse153 + 0.517383113*_cse151*_cse20 - 0.855753802*_cse165 - 0.855753802*_cse167
+    _cse170 = -_cse151*_cse44 - _cse153*_cse46 + 0.458851168*_cse165 + 0.758601438*_cse166 + 0.458851168*_cse167 + 0.758601438*_cse168
+    _cse171 = -_cse151*_cse164 + _cse151*_cse71 - _cse153*_cse163 + _cse153*_cse70 - 0.0290982758960988*_cse165 - 0.0491638727803817*_cse166 - 0.0290982758960988*_cse167 - 0.0491638727803817*_cse168 - _cse169*_cse54 + 0.03790017976*_cse169*_cse56 - _cse169*_cse58 + _cse169*_cse60 + 0.0499969558686132*_cse170*_cse35 + 0.03790017976*_cse170*_cse41 - _cse170*_cse74 + _cse170*_cse75
+    _cse172 = -_cse119
+    _cse173 = _cse14*_cse172
+    _cse174 = -_cse122
+    _cse175 = _cse174*_cse21
+    _cse176 = _cse172*_cse23
+    _cse177 = _cse174*_cse25
+    _cse178 = -_cse129 + _cse130
+    _cse179 = -_cse172*_cse46 + 0.758601438*_cse173 + _cse174*_cse44 + 0.758601438*_cse175 + 0.458851168*_cse176 + 0.458851168*_cse177 + _cse178
+    _cse180 = -_cse137 + 0.517383113*_cse14*_cse172 + 0.517383113*_cse174*_cse21 - 0.855753802*_cse176 - 0.855753802*_cse177
+    _cse181 = _cse142 - _cse143*_cse95 + _cse145 + _cse147 + _cse149
+    _cse182 = _cse114*_cse180 + _cse115*_cse179 + _cse140 - _cse163*_cse172 + _cse164*_cse174 + _cse172*_cse70 - 0.0491638727803817*_cse173 + _cse174*_cse92 - 0.0491638727803817*_cse175 - 0.0290982758960988*_cse176 - 0.0290982758960988*_cse177 + _cse179*_cse36 - _cse179*_cse74 + _cse179*_cse75 - _cse180*_cse54 - _cse180*_cse58 + _cse180*_cse60 + _cse181
+    _cse183 = _cse119*_cse14
+    _cse184 = _cse122*_cse21
+    _cse185 = _cse119*_cse23
+    _cse186 = _cse122*_cse25
+    _cse187 = -_cse119*_cse46 + _cse122*_cse44 + _cse131 + 0.758601438*_cse183 + 0.758601438*_cse184 + 0.458851168*_cse185 + 0.458851168*_cse186
+    _cse188 = _cse137 + 0.517383113*_cse183 + 0.517383113*_cse184 - 0.855753802*_cse185 - 0.855753802*_cse186
+    _cse189 = _cse119*_cse163 - _cse119*_cse70 - 0.0627091097210817*_cse122*_cse13 - _cse122*_cse92 + 0.0491638727803817*_cse183 + 0.0491638727803817*_cse184 + 0.0290982758960988*_cse185 + 0.0290982758960988*_cse186 - 0.0499969558686132*_cse187*_cse35 - 0.03790017976*_cse187*_cse41 + _cse187*_cse74 - _cse187*_cse75 + _cse188*_cse54 - 0.03790017976*_cse188*_cse56 + _cse188*_cse58 - _cse188*_cse60
+    _cse190 = -_cse151
+    _cse191 = _cse190*_cse23
+    _cse192 = -_cse153
+    _cse193 = _cse192*_cse25
+    _cse194 = 0.517383113*_cse14*_cse190 - _cse157 - 0.855753802*_cse191 + 0.517383113*_cse192*_cse21 - 0.855753802*_cse193
+    _cse195 = _cse14*_cse190
+    _cse196 = _cse192*_cse21
+    _cse197 = _cse159 + _cse160 - _cse190*_cse46 + 0.458851168*_cse191 + _cse192*_cse44 + 0.458851168*_cse193 + 0.758601438*_cse195 + 0.758601438*_cse196
+    _cse198 = -_cse194*_cse36 - _cse194*_cse40 + 0.03790017976*_cse194*_cse42 + _cse194*_cse43 - _cse197*_cse54 + 0.03790017976*_cse197*_cse56 - _cse197*_cse58 + _cse197*_cse60
+    _cse199 = _cse190*_cse64
+    _cse200 = _cse190*_cse20
+    _cse201 = _cse192*_cse23
+    _cse202 = _cse14*_cse192
+    _cse203 = 0.517383113*_cse14*_cse192 + 0.517383113*_cse190*_cse20 - 0.855753802*_cse199 - 0.855753802*_cse201
+    _cse204 = -_cse190*_cse44 - _cse192*_cse46 + 0.458851168*_cse199 + 0.758601438*_cse200 + 0.458851168*_cse201 + 0.758601438*_cse202
+    _cse205 = -_cse163*_cse192 - _cse164*_cse190 + _cse190*_cse71 + _cse192*_cse70 - 0.0290982758960988*_cse199 - 0.0491638727803817*_cse200 - 0.0290982758960988*_cse201 - 0.0491638727803817*_cse202 - _cse203*_cse54 + 0.03790017976*_cse203*_cse56 - _cse203*_cse58 + _cse203*_cse60 + 0.0499969558686132*_cse204*_cse35 + 0.03790017976*_cse204*_cse41 - _cse204*_cse74 + _cse204*_cse75
+    _cse206 = -_cse97
+    _cse207 = -_cse120
+    _cse208 = _cse207*_cse64
+    _cse209 = -_cse123
+    _cse210 = _cse209*_cse23
+    _cse211 = 0.517383113*_cse14*_cse209 + 0.517383113*_cse20*_cse207 - 0.855753802*_cse208 - 0.855753802*_cse210
+    _cse212 = _cse20*_cse207
+    _cse213 = _cse14*_cse209
+    _cse214 = -_cse207*_cse44 + 0.458851168*_cse208 - _cse209*_cse46 + 0.458851168*_cse210 + 0.758601438*_cse212 + 0.758601438*_cse213
+    _cse215 = -_cse211*_cse36 - _cse211*_cse40 + 0.03790017976*_cse211*_cse42 + _cse211*_cse43 - _cse214*_cse54 + 0.03790017976*_cse214*_cse56 - _cse214*_cse58 + _cse214*_cse60
+    _cse216 = _cse209*_cse64
+    _cse217 = -_cse14
+    _cse218 = _cse207*_cse217
+    _cse219 = -_cse23
+    _cse220 = _cse207*_cse219
+    _cse221 = _cse20*_cse209
+    _cse222 = 0.517383113*_cse20*_cse209 + 0.517383113*_cse207*_cse217 - 0.855753802*_cse216 - 0.855753802*_cse220
+    _cse223 = _cse207*_cse46
+    _cse224 = _cse209*_cse44
+    _cse225 = 0.458851168*_cse216 + 0.758601438*_cse218 + 0.458851168*_cse220 + 0.758601438*_cse221 + _cse223 - _cse224
+    _cse226 = _cse209*_cse21
+    _cse227 = _cse207*_cse23
+    _cse228 = _cse14*_cse207
+    _cse229 = _cse209*_cse25
+    _cse230 = -_cse135 + _cse136 + 0.517383113*_cse226 - 0.855753802*_cse227 + 0.517383113*_cse228 - 0.855753802*_cse229
+    _cse231 = -0.01872015456*_cse57
+    _cse232 = 0.03790017976*_cse55
+    _cse233 = _cse178 - _cse223 + _cse224 + 0.758601438*_cse226 + 0.458851168*_cse227 + 0.758601438*_cse228 + 0.458851168*_cse229
+    _cse234 = 0.03790017976*_cse42
+    _cse235 = -_cse132*_cse54 + 0.03790017976*_cse132*_cse56 - _cse132*_cse58 + _cse132*_cse60 - _cse138*_cse36 - _cse138*_cse40 + 0.03790017976*_cse138*_cse42 + _cse138*_cse43
+    _cse236 = _cse120*_cse64
+    _cse237 = _cse123*_cse23
+    _cse238 = _cse120*_cse20
+    _cse239 = _cse123*_cse14
+    _cse240 = 0.517383113*_cse120*_cse20 + 0.517383113*_cse123*_cse14 - 0.855753802*_cse236 - 0.855753802*_cse237
+    _cse241 = -_cse120*_cse44 - _cse123*_cse46 + 0.458851168*_cse236 + 0.458851168*_cse237 + 0.758601438*_cse238 + 0.758601438*_cse239
+    _cse242 = -_cse120*_cse164 + _cse120*_cse71 - _cse123*_cse163 + _cse123*_cse70 - 0.0290982758960988*_cse236 - 0.0290982758960988*_cse237 - 0.0491638727803817*_cse238 - 0.0491638727803817*_cse239 - _cse240*_cse54 + 0.03790017976*_cse240*_cse56 - _cse240*_cse58 + _cse240*_cse60 + 0.0499969558686132*_cse241*_cse35 + 0.03790017976*_cse241*_cse41 - _cse241*_cse74 + _cse241*_cse75
+    _cse243 = -_cse0*_cse100 + _cse0*_cse98 + _cse0*_cse99 + 0.253888422522456*_cse141 + 0.253888422522456*_cse144
+    _cse244 = -_cse0*_cse96 + 0.0627091097210817*_cse13*_cse153 - _cse151*_cse163 + _cse151*_cse70 - 0.0491638727803817*_cse152 + _cse153*_cse92 - 0.0491638727803817*_cse154 - 0.0290982758960988*_cse155 - 0.0290982758960988*_cse156 - _cse158*_cse54 + 0.03790017976*_cse158*_cse56 - _cse158*_cse58 + _cse158*_cse60 + 0.0499969558686132*_cse161*_cse35 + 0.03790017976*_cse161*_cse41 - _cse161*_cse74 + _cse161*_cse75 - _cse243
+    _cse245 = _cse0*_cse103 - _cse0*_cse117 + _cse114*_cse194 + _cse115*_cse197 - 0.20503*_cse139 - 1.098e-6*_cse143 - _cse163*_cse190 + _cse164*_cse192 + _cse190*_cse70 - 0.0290982758960988*_cse191 + _cse192*_cse92 - 0.0290982758960988*_cse193 - _cse194*_cse54 - _cse194*_cse58 + _cse194*_cse60 - 0.0491638727803817*_cse195 - 0.0491638727803817*_cse196 + _cse197*_cse36 - _cse197*_cse74 + _cse197*_cse75 + _cse243
+    _cse246 = -_cse11
+    _cse247 = _cse14*_cse246
+    _cse248 = -_cse19
+    _cse249 = _cse21*_cse248
+    _cse250 = _cse23*_cse246
+    _cse251 = _cse248*_cse25
+    _cse252 = -_cse49 + _cse51
+    _cse253 = -_cse246*_cse46 + 0.758601438*_cse247 + _cse248*_cse44 + 0.758601438*_cse249 + 0.458851168*_cse250 + 0.458851168*_cse251 + _cse252
+    _cse254 = 0.517383113*_cse247 + 0.517383113*_cse249 - 0.855753802*_cse250 - 0.855753802*_cse251 - _cse29 + _cse32
+    _cse255 = _cse80*_cse97
+    _cse256 = 0.0038906673398998*_cse81
+    _cse257 = 0.0038906673398998*_cse78
+    _cse258 = _cse2*_cse27
+    _cse259 = 0.253888422522456*_cse258
+    _cse260 = _cse2*_cse30
+    _cse261 = -0.253888422522456*_cse260
+    _cse262 = _cse116*_cse77 + _cse255 + _cse256 + _cse257 + _cse259 + _cse261 + 0.20503*_cse77 - 1.098e-6*_cse80
+    _cse263 = -_cse112*_cse54 + 0.03790017976*_cse112*_cse56 - _cse112*_cse58 + _cse112*_cse60 - _cse113*_cse36 - _cse113*_cse40 + 0.03790017976*_cse113*_cse42 + _cse113*_cse43
+    _cse264 = _cse104*_cse64
+    _cse265 = _cse104*_cse20
+    _cse266 = _cse106*_cse23
+    _cse267 = _cse106*_cse14
+    _cse268 = 0.517383113*_cse104*_cse20 + 0.517383113*_cse106*_cse14 - 0.855753802*_cse264 - 0.855753802*_cse266
+    _cse269 = -_cse104*_cse44 - _cse106*_cse46 + 0.458851168*_cse264 + 0.758601438*_cse265 + 0.458851168*_cse266 + 0.758601438*_cse267
+    _cse270 = -_cse104*_cse164 + _cse104*_cse71 - _cse106*_cse163 + _cse106*_cse70 - 0.0290982758960988*_cse264 - 0.0491638727803817*_cse265 - 0.0290982758960988*_cse266 - 0.0491638727803817*_cse267 - _cse268*_cse54 + 0.03790017976*_cse268*_cse56 - _cse268*_cse58 + _cse268*_cse60 + 0.0499969558686132*_cse269*_cse35 + 0.03790017976*_cse269*_cse41 - _cse269*_cse74 + _cse269*_cse75
+    _cse271 = _cse10*_cse14
+    _cse272 = _cse18*_cse21
+    _cse273 = _cse10*_cse23
+    _cse274 = _cse18*_cse25
+    _cse275 = -_cse10*_cse46 + _cse18*_cse44 + 0.758601438*_cse271 + 0.758601438*_cse272 + 0.458851168*_cse273 + 0.458851168*_cse274 + _cse52
+    _cse276 = 0.517383113*_cse271 + 0.517383113*_cse272 - 0.855753802*_cse273 - 0.855753802*_cse274 + _cse33
+    _cse277 = _cse256 + _cse257 + _cse259 + _cse261 - _cse77*_cse95
+    _cse278 = -_cse10*_cse163 + _cse10*_cse70 + 0.0627091097210817*_cse13*_cse18 + _cse18*_cse92 - _cse255 - 0.0491638727803817*_cse271 - 0.0491638727803817*_cse272 - 0.0290982758960988*_cse273 - 0.0290982758960988*_cse274 + 0.0499969558686132*_cse275*_cse35 + 0.03790017976*_cse275*_cse41 - _cse275*_cse74 + _cse275*_cse75 - _cse276*_cse54 + 0.03790017976*_cse276*_cse56 - _cse276*_cse58 + _cse276*_cse60 - _cse277
+    _cse279 = -_cse10
+    _cse280 = _cse14*_cse279
+    _cse281 = -_cse18
+    _cse282 = _cse21*_cse281
+    _cse283 = _cse23*_cse279
+    _cse284 = _cse25*_cse281
+    _cse285 = _cse252 - _cse279*_cse46 + 0.758601438*_cse280 + _cse281*_cse44 + 0.758601438*_cse282 + 0.458851168*_cse283 + 0.458851168*_cse284
+    _cse286 = 0.517383113*_cse14*_cse279 + 0.517383113*_cse21*_cse281 - 0.855753802*_cse283 - 0.855753802*_cse284 - _cse33
+    _cse287 = _cse114*_cse286 + _cse115*_cse285 - _cse163*_cse279 + _cse164*_cse281 + _cse279*_cse70 - 0.0491638727803817*_cse280 + _cse281*_cse92 - 0.0491638727803817*_cse282 - 0.0290982758960988*_cse283 - 0.0290982758960988*_cse284 + _cse285*_cse36 - _cse285*_cse74 + _cse285*_cse75 - _cse286*_cse54 - _cse286*_cse58 + _cse286*_cse60
+    _cse288 = -_cse36*_cse94 - _cse40*_cse94 + 0.03790017976*_cse42*_cse94 + _cse43*_cse94 - _cse54*_cse91 + 0.03790017976*_cse56*_cse91 - _cse58*_cse91 + _cse60*_cse91
+    _cse289 = _cse23*_cse83
+    _cse290 = _cse14*_cse83
+    _cse291 = _cse64*_cse85
+    _cse292 = _cse20*_cse85
+    _cse293 = 0.517383113*_cse14*_cse83 + 0.517383113*_cse20*_cse85 - 0.855753802*_cse289 - 0.855753802*_cse291
+    _cse294 = 0.458851168*_cse289 + 0.758601438*_cse290 + 0.458851168*_cse291 + 0.758601438*_cse292 - _cse44*_cse85 - _cse46*_cse83
+    _cse295 = -_cse163*_cse83 - _cse164*_cse85 - 0.0290982758960988*_cse289 - 0.0491638727803817*_cse290 - 0.0290982758960988*_cse291 - 0.0491638727803817*_cse292 - _cse293*_cse54 + 0.03790017976*_cse293*_cse56 - _cse293*_cse58 + _cse293*_cse60 + 0.0499969558686132*_cse294*_cse35 + 0.03790017976*_cse294*_cse41 - _cse294*_cse74 + _cse294*_cse75 + _cse70*_cse83 + _cse71*_cse85
+    _cse296 = -_cse36*_cse72 - _cse40*_cse72 + 0.03790017976*_cse42*_cse72 + _cse43*_cse72 - _cse54*_cse73 + 0.03790017976*_cse56*_cse73 - _cse58*_cse73 + _cse60*_cse73
+    _cse297 = _cse19*_cse64
+    _cse298 = _cse11*_cse217
+    _cse299 = _cse11*_cse219
+    _cse300 = _cse19*_cse20
+    _cse301 = 0.517383113*_cse11*_cse217 + 0.517383113*_cse19*_cse20 - 0.855753802*_cse297 - 0.855753802*_cse299
+    _cse302 = 0.458851168*_cse297 + 0.758601438*_cse298 + 0.458851168*_cse299 + 0.758601438*_cse300 - _cse45 + _cse47
+    _cse303 = 0.999999998572139*_cse6 + 0.999999998572139*_cse9
+    _cse304 = -_cse303
+    _cse305 = _cse23*_cse304
+    _cse306 = 6.57617443000635e-7*_cse6 + 6.57617443000635e-7*_cse9
+    _cse307 = -_cse306
+    _cse308 = _cse25*_cse307
+    _cse309 = _cse28 - _cse31
+    _cse310 = 0.517383113*_cse14*_cse304 + 0.517383113*_cse21*_cse307 - 0.855753802*_cse305 - 0.855753802*_cse308 - _cse309
+    _cse311 = _cse14*_cse304
+    _cse312 = _cse21*_cse307
+    _cse313 = -_cse304*_cse46 + 0.458851168*_cse305 + _cse307*_cse44 + 0.458851168*_cse308 + 0.758601438*_cse311 + 0.758601438*_cse312 - _cse48 + _cse50
+    _cse314 = -_cse310*_cse36 - _cse310*_cse40 + 0.03790017976*_cse310*_cse42 + _cse310*_cse43 - _cse313*_cse54 + 0.03790017976*_cse313*_cse56 - _cse313*_cse58 + _cse313*_cse60
+    _cse315 = _cse304*_cse64
+    _cse316 = _cse20*_cse304
+    _cse317 = _cse23*_cse307
+    _cse318 = _cse14*_cse307
+    _cse319 = 0.517383113*_cse14*_cse307 + 0.517383113*_cse20*_cse304 - 0.855753802*_cse315 - 0.855753802*_cse317
+    _cse320 = -_cse304*_cse44 - _cse307*_cse46 + 0.458851168*_cse315 + 0.758601438*_cse316 + 0.458851168*_cse317 + 0.758601438*_cse318
+    _cse321 = -_cse163*_cse307 - _cse164*_cse304 + _cse304*_cse71 + _cse307*_cse70 - 0.0290982758960988*_cse315 - 0.0491638727803817*_cse316 - 0.0290982758960988*_cse317 - 0.0491638727803817*_cse318 - _cse319*_cse54 + 0.03790017976*_cse319*_cse56 - _cse319*_cse58 + _cse319*_cse60 + 0.0499969558686132*_cse320*_cse35 + 0.03790017976*_cse320*_cse41 - _cse320*_cse74 + _cse320*_cse75
+    _cse322 = 0.818687841791724*_cse6
+    _cse323 = 0.818687841791724*_cse9
+    _cse324 = -0.999999998572139*_cse27 + 0.999999998572139*_cse30
+    _cse325 = -_cse324
+    _cse326 = _cse325*_cse46
+    _cse327 = -6.57617443000635e-7*_cse27 + 6.57617443000635e-7*_cse30
+    _cse328 = -_cse327
+    _cse329 = _cse328*_cse44
+    _cse330 = _cse23*_cse325
+    _cse331 = _cse14*_cse325
+    _cse332 = _cse21*_cse328
+    _cse333 = _cse25*_cse328
+    _cse334 = _cse322 + _cse323 - _cse326 + _cse329 + 0.458851168*_cse330 + 0.758601438*_cse331 + 0.758601438*_cse332 + 0.458851168*_cse333
+    _cse335 = 0.000346321299837637*_cse6 + 0.000346321299837637*_cse9
+    _cse336 = 0.517383113*_cse14*_cse325 + 0.517383113*_cse21*_cse328 - 0.855753802*_cse330 - 0.855753802*_cse333 - _cse335
+    _cse337 = _cse334*_cse36
+    _cse338 = _cse336*_cse54
+    _cse339 = -_cse163*_cse325 + _cse164*_cse328
+    _cse340 = 0.253888422522456*_cse9
+    _cse341 = 0.253888422522456*_cse6
+    _cse342 = -_cse100
+    _cse343 = _cse340 + _cse341 + _cse342 + _cse96 + _cse99
+    _cse344 = _cse114*_cse336 + _cse115*_cse334 + _cse325*_cse70 + _cse328*_cse92 - 0.0290982758960988*_cse330 - 0.0491638727803817*_cse331 - 0.0491638727803817*_cse332 - 0.0290982758960988*_cse333 - _cse334*_cse74 + _cse334*_cse75 - _cse336*_cse58 + _cse336*_cse60 + _cse337 - _cse338 + _cse339 + _cse343 + _cse98
+    _cse345 = _cse21*_cse327
+    _cse346 = _cse25*_cse327
+    _cse347 = _cse23*_cse324
+    _cse348 = _cse14*_cse324
+    _cse349 = -_cse322 - _cse323 - _cse324*_cse46 + _cse327*_cse44 + 0.758601438*_cse345 + 0.458851168*_cse346 + 0.458851168*_cse347 + 0.758601438*_cse348
+    _cse350 = _cse335 + 0.517383113*_cse345 - 0.855753802*_cse346 - 0.855753802*_cse347 + 0.517383113*_cse348
+    _cse351 = -0.0627091097210817*_cse13*_cse327 + _cse163*_cse324 - _cse324*_cse70 - _cse327*_cse92 + 0.0491638727803817*_cse345 + 0.0290982758960988*_cse346 + 0.0290982758960988*_cse347 + 0.0491638727803817*_cse348 - 0.0499969558686132*_cse349*_cse35 - 0.03790017976*_cse349*_cse41 + _cse349*_cse74 - _cse349*_cse75 + _cse350*_cse54 - 0.03790017976*_cse350*_cse56 + _cse350*_cse58 - _cse350*_cse60
+    _cse352 = _cse14*_cse303
+    _cse353 = _cse21*_cse306
+    _cse354 = _cse23*_cse303
+    _cse355 = _cse25*_cse306
+    _cse356 = _cse309 + 0.517383113*_cse352 + 0.517383113*_cse353 - 0.855753802*_cse354 - 0.855753802*_cse355
+    _cse357 = -_cse303*_cse46 + _cse306*_cse44 + 0.758601438*_cse352 + 0.758601438*_cse353 + 0.458851168*_cse354 + 0.458851168*_cse355 + _cse48 - _cse50
+    _cse358 = -_cse356*_cse36 - _cse356*_cse40 + 0.03790017976*_cse356*_cse42 + _cse356*_cse43 - _cse357*_cse54 + 0.03790017976*_cse357*_cse56 - _cse357*_cse58 + _cse357*_cse60
+    _cse359 = _cse23*_cse306
+    _cse360 = _cse14*_cse306
+    _cse361 = _cse303*_cse64
+    _cse362 = _cse20*_cse303
+    _cse363 = 0.517383113*_cse14*_cse306 + 0.517383113*_cse20*_cse303 - 0.855753802*_cse359 - 0.855753802*_cse361
+    _cse364 = -_cse303*_cse44 - _cse306*_cse46 + 0.458851168*_cse359 + 0.758601438*_cse360 + 0.458851168*_cse361 + 0.758601438*_cse362
+    _cse365 = -_cse163*_cse306 - _cse164*_cse303 + _cse303*_cse71 + _cse306*_cse70 + 0.0499969558686132*_cse35*_cse364 - 0.0290982758960988*_cse359 - 0.0491638727803817*_cse360 - 0.0290982758960988*_cse361 - 0.0491638727803817*_cse362 - _cse363*_cse54 + 0.03790017976*_cse363*_cse56 - _cse363*_cse58 + _cse363*_cse60 + 0.03790017976*_cse364*_cse41 - _cse364*_cse74 + _cse364*_cse75
+    _cse366 = _cse325*_cse64
+    _cse367 = _cse23*_cse328
+    _cse368 = 0.517383113*_cse14*_cse328 + 0.517383113*_cse20*_cse325 - 0.855753802*_cse366 - 0.855753802*_cse367
+    _cse369 = _cse20*_cse325
+    _cse370 = _cse14*_cse328
+    _cse371 = -_cse325*_cse44 - _cse328*_cse46 + 0.458851168*_cse366 + 0.458851168*_cse367 + 0.758601438*_cse369 + 0.758601438*_cse370
+    _cse372 = -_cse36*_cse368 - _cse368*_cse40 + 0.03790017976*_cse368*_cse42 + _cse368*_cse43 - _cse371*_cse54 + 0.03790017976*_cse371*_cse56 - _cse371*_cse58 + _cse371*_cse60
+    _cse373 = _cse217*_cse325
+    _cse374 = _cse219*_cse325
+    _cse375 = _cse328*_cse64
+    _cse376 = _cse20*_cse328
+    _cse377 = _cse326 - _cse329 + 0.758601438*_cse373 + 0.458851168*_cse374 + 0.458851168*_cse375 + 0.758601438*_cse376
+    _cse378 = 0.517383113*_cse373 - 0.855753802*_cse374 - 0.855753802*_cse375 + 0.517383113*_cse376
+    _cse379 = _cse0*dq0
+    _cse380 = _cse141 + _cse144
+    _cse381 = 0.574238819026787*_cse144
+    _cse382 = 0.574238819026787*_cse141
+    _cse383 = 0.408002994597976*_cse13
+    _cse384 = 0.408002994597976*_cse12
+    _cse385 = 0.410149995883665*_cse35
+    _cse386 = 0.209584432*_cse39
+    _cse387 = 0.410879747*_cse42
+    _cse388 = 0.410149995883665*_cse37
+    _cse389 = 0.410879747*_cse56
+    _cse390 = 0.209584432*_cse57
+    _cse391 = 0.329365488408814*_cse144
+    _cse392 = 0.329365488408814*_cse141
+    _cse393 = 0.234017800844203*_cse13
+    _cse394 = 0.234017800844203*_cse12
+    _cse395 = 0.410879747*_cse41
+    _cse396 = 0.209584432*_cse38
+    _cse397 = _cse2*dq0
+    _cse398 = _cse78 + _cse81
+    _cse399 = 0.574238819026787*_cse78
+    _cse400 = 0.574238819026787*_cse81
+    _cse401 = 0.329365488408814*_cse78
+    _cse402 = 0.329365488408814*_cse81
+    _cse403 = -_cse27 + _cse30
+    _cse404 = 0.574238819026787*_cse30
+    _cse405 = 0.574238819026787*_cse27
+    _cse406 = 0.329365488408814*_cse30
+    _cse407 = 0.329365488408814*_cse27
+    out = np.empty((6, 6))
+    out[0, 0] = _cse102*dq2 + _cse118*dq1 + _cse61*dq4 + _cse76*dq3 + dq0*(_cse0*_cse134 - 4.3259e-5*_cse0 + _cse120*_cse70 - 0.0491638727803817*_cse121 + 0.0627091097210817*_cse123*_cse13 + _cse123*_cse92 - 0.0491638727803817*_cse124 - 0.0290982758960988*_cse126 - 0.0290982758960988*_cse127 - 0.0627091097210817*_cse128 + 0.0499969558686132*_cse132*_cse35 + 0.03790017976*_cse132*_cse41 - _cse132*_cse74 + _cse132*_cse75 - _cse138*_cse54 + 0.03790017976*_cse138*_cse56 - _cse138*_cse58 + _cse138*_cse60 - _cse150 + 0.0068032576553314*_cse2)
+    out[0, 1] = _cse118*dq0 + _cse162*dq4 + _cse171*dq3 + _cse182*dq2 + dq1*(-_cse0*_cse133 - _cse150 - _cse189)
+    out[0, 2] = _cse102*dq0 + _cse182*dq1 + _cse198*dq4 + _cse205*dq3 + dq2*(_cse0*_cse206*_cse7 - _cse181 - _cse189)
+    out[0, 3] = _cse171*dq1 + _cse205*dq2 + _cse215*dq4 + _cse76*dq0 + dq3*(0.0627091097210817*_cse12*_cse207 - _cse164*_cse209 + _cse207*_cse69 + _cse209*_cse71 - 0.0290982758960988*_cse216 - 0.0491638727803817*_cse218 - 0.0290982758960988*_cse220 - 0.0491638727803817*_cse221 - _cse222*_cse54 + 0.03790017976*_cse222*_cse56 - _cse222*_cse58 + _cse222*_cse60 + 0.0499969558686132*_cse225*_cse35 + 0.03790017976*_cse225*_cse41 - _cse225*_cse74 + _cse225*_cse75)
+    out[0, 4] = _cse162*dq1 + _cse198*dq2 + _cse215*dq3 + _cse61*dq0 + dq4*(-_cse230*_cse231 + _cse230*_cse232 + _cse230*_cse54 + _cse230*_cse59 + _cse233*_cse234 - _cse233*_cse36 - _cse233*_cse40 + _cse233*_cse43)
+    out[0, 5] = 0
+    out[1, 0] = _cse235*dq4 + _cse242*dq3 + _cse244*dq2 + _cse245*dq1 + dq0*(0.0068032576553314*_cse0 + _cse114*_cse254 + _cse115*_cse253 - _cse134*_cse2 - _cse163*_cse246 + _cse164*_cse248 + 4.3259e-5*_cse2 + _cse246*_cse70 - 0.0491638727803817*_cse247 + _cse248*_cse92 - 0.0491638727803817*_cse249 - 0.0290982758960988*_cse250 - 0.0290982758960988*_cse251 + _cse253*_cse36 - _cse253*_cse74 + _cse253*_cse75 - _cse254*_cse54 - _cse254*_cse58 + _cse254*_cse60 + _cse262)
+    out[1, 1] = _cse245*dq0 + _cse263*dq4 + _cse270*dq3 + _cse278*dq2 + dq1*(_cse133*_cse2 + _cse262 + _cse287)
+    out[1, 2] = _cse244*dq0 + _cse278*dq1 + _cse288*dq4 + _cse295*dq3 + dq2*(-_cse206*_cse80 + _cse277 + _cse287)
+    out[1, 3] = _cse242*dq0 + _cse270*dq1 + _cse295*dq2 + _cse296*dq4 + dq3*(0.0627091097210817*_cse11*_cse12 + _cse11*_cse69 - _cse164*_cse19 + _cse19*_cse71 - 0.0290982758960988*_cse297 - 0.0491638727803817*_cse298 - 0.0290982758960988*_cse299 - 0.0491638727803817*_cse300 - _cse301*_cse54 + 0.03790017976*_cse301*_cse56 - _cse301*_cse58 + _cse301*_cse60 + 0.0499969558686132*_cse302*_cse35 + 0.03790017976*_cse302*_cse41 - _cse302*_cse74 + _cse302*_cse75)
+    out[1, 4] = _cse235*dq0 + _cse263*dq1 + _cse288*dq2 + _cse296*dq3 + dq4*(-_cse231*_cse34 + _cse232*_cse34 + _cse234*_cse53 + _cse34*_cse54 + _cse34*_cse59 - _cse36*_cse53 - _cse40*_cse53 + _cse43*_cse53)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse314*dq4 + _cse321*dq3 + _cse344*dq2 + dq1*(_cse116*_cse7 - _cse340 - _cse341 - _cse342 - _cse351 - 0.001950802*_cse4 + 0.41405*_cse7 - _cse98 - _cse99)
+    out[2, 2] = _cse344*dq1 + _cse358*dq4 + _cse365*dq3 + dq2*(_cse206*_cse4 - _cse343 - _cse351)
+    out[2, 3] = _cse321*dq1 + _cse365*dq2 + _cse372*dq4 + dq3*(_cse325*_cse69 + _cse328*_cse71 - _cse339 + 0.0499969558686132*_cse35*_cse377 - 0.0491638727803817*_cse373 - 0.0290982758960988*_cse374 - 0.0290982758960988*_cse375 - 0.0491638727803817*_cse376 + 0.03790017976*_cse377*_cse41 - _cse377*_cse74 + _cse377*_cse75 - _cse378*_cse54 + 0.03790017976*_cse378*_cse56 - _cse378*_cse58 + _cse378*_cse60)
+    out[2, 4] = _cse314*dq1 + _cse358*dq2 + _cse372*dq3 + dq4*(-_cse231*_cse336 + _cse232*_cse336 + _cse234*_cse334 - _cse334*_cse40 + _cse334*_cse43 + _cse336*_cse59 - _cse337 + _cse338)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse379
+    out[3, 2] = _cse379
+    out[3, 3] = _cse380*dq1 - _cse380*dq2 + dq0*(_cse2*_cse5*_cse7 - _cse260)
+    out[3, 4] = dq0*(_cse11*_cse384 + 0.3960285*_cse15 - _cse19*_cse383 + 0.3960285*_cse22 + 0.239041914*_cse24 + 0.574238819026787*_cse258 + 0.239041914*_cse26 - 0.574238819026787*_cse260) + dq1*(_cse151*_cse384 + 0.3960285*_cse152 - _cse153*_cse383 + 0.3960285*_cse154 + 0.239041914*_cse155 + 0.239041914*_cse156 + _cse381 + _cse382) + dq2*(_cse190*_cse384 + 0.239041914*_cse191 - _cse192*_cse383 + 0.239041914*_cse193 + 0.3960285*_cse195 + 0.3960285*_cse196 - _cse381 - _cse382) + dq3*(_cse207*_cse383 + 0.239041914*_cse208 + _cse209*_cse384 + 0.239041914*_cse210 + 0.3960285*_cse212 + 0.3960285*_cse213)
+    out[3, 5] = dq0*(_cse11*_cse394 + 0.227149603970304*_cse15 - _cse19*_cse393 + 0.227149603970304*_cse22 + 0.137106991283212*_cse24 + 0.329365488408814*_cse258 + 0.137106991283212*_cse26 - 0.329365488408814*_cse260 + _cse34*_cse388 - _cse34*_cse389 + _cse34*_cse390 - _cse385*_cse53 - _cse395*_cse53 + _cse396*_cse53) + dq1*(_cse151*_cse394 + 0.227149603970304*_cse152 - _cse153*_cse393 + 0.227149603970304*_cse154 + 0.137106991283212*_cse155 + 0.137106991283212*_cse156 + _cse158*_cse388 - _cse158*_cse389 + _cse158*_cse390 - _cse161*_cse385 - _cse161*_cse395 + _cse161*_cse396 + _cse391 + _cse392) + dq2*(_cse190*_cse394 + 0.137106991283212*_cse191 - _cse192*_cse393 + 0.137106991283212*_cse193 + _cse194*_cse388 - _cse194*_cse389 + _cse194*_cse390 + 0.227149603970304*_cse195 + 0.227149603970304*_cse196 - _cse197*_cse385 - _cse197*_cse395 + _cse197*_cse396 - _cse391 - _cse392) + dq3*(_cse207*_cse393 + 0.137106991283212*_cse208 + _cse209*_cse394 + 0.137106991283212*_cse210 + _cse211*_cse388 - _cse211*_cse389 + _cse211*_cse390 + 0.227149603970304*_cse212 + 0.227149603970304*_cse213 - _cse214*_cse385 - _cse214*_cse395 + _cse214*_cse396) + dq4*(_cse230*_cse385 + _cse230*_cse386 - _cse230*_cse387 + _cse233*_cse388 - _cse233*_cse389 + _cse233*_cse390)
+    out[4, 0] = 0
+    out[4, 1] = _cse397
+    out[4, 2] = -_cse397
+    out[4, 3] = -_cse398*dq1 + _cse398*dq2 + dq0*(_cse0*_cse5*_cse7 - _cse148)
+    out[4, 4] = dq0*(0.3960285*_cse121 + 0.3960285*_cse124 - 0.408002994597976*_cse125 + 0.239041914*_cse126 + 0.239041914*_cse127 + 0.408002994597976*_cse128 + 0.574238819026787*_cse146 - 0.574238819026787*_cse148) + dq1*(0.408002994597976*_cse105 - 0.408002994597976*_cse107 + 0.239041914*_cse108 + 0.3960285*_cse109 + 0.3960285*_cse110 + 0.239041914*_cse111 - _cse399 - _cse400) + dq2*(_cse399 + _cse400 - 0.408002994597976*_cse84 + 0.408002994597976*_cse86 + 0.3960285*_cse87 + 0.239041914*_cse88 + 0.239041914*_cse89 + 0.3960285*_cse90) + dq3*(0.408002994597976*_cse62 + 0.408002994597976*_cse63 + 0.239041914*_cse65 + 0.239041914*_cse66 + 0.3960285*_cse67 + 0.3960285*_cse68)
+    out[4, 5] = dq0*(0.227149603970304*_cse121 + 0.227149603970304*_cse124 - 0.234017800844203*_cse125 + 0.137106991283212*_cse126 + 0.137106991283212*_cse127 + 0.234017800844203*_cse128 - _cse132*_cse385 - _cse132*_cse395 + _cse132*_cse396 + _cse138*_cse388 - _cse138*_cse389 + _cse138*_cse390 + 0.329365488408814*_cse146 - 0.329365488408814*_cse148) + dq1*(0.234017800844203*_cse105 - 0.234017800844203*_cse107 + 0.137106991283212*_cse108 + 0.227149603970304*_cse109 + 0.227149603970304*_cse110 + 0.137106991283212*_cse111 - _cse112*_cse385 - _cse112*_cse395 + _cse112*_cse396 + _cse113*_cse388 - _cse113*_cse389 + _cse113*_cse390 - _cse401 - _cse402) + dq2*(-_cse385*_cse91 + _cse388*_cse94 - _cse389*_cse94 + _cse390*_cse94 - _cse395*_cse91 + _cse396*_cse91 + _cse401 + _cse402 - 0.234017800844203*_cse84 + 0.234017800844203*_cse86 + 0.227149603970304*_cse87 + 0.137106991283212*_cse88 + 0.137106991283212*_cse89 + 0.227149603970304*_cse90) + dq3*(-_cse385*_cse73 + _cse388*_cse72 - _cse389*_cse72 + _cse390*_cse72 - _cse395*_cse73 + _cse396*_cse73 + 0.234017800844203*_cse62 + 0.234017800844203*_cse63 + 0.137106991283212*_cse65 + 0.137106991283212*_cse66 + 0.227149603970304*_cse67 + 0.227149603970304*_cse68) + dq4*(_cse34*_cse385 + _cse34*_cse386 - _cse34*_cse387 + _cse388*_cse53 - _cse389*_cse53 + _cse390*_cse53)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse403*dq1 - _cse403*dq2
+    out[5, 4] = dq1*(_cse304*_cse384 + 0.239041914*_cse305 - _cse307*_cse383 + 0.239041914*_cse308 + 0.3960285*_cse311 + 0.3960285*_cse312 + _cse404 - _cse405) + dq2*(_cse303*_cse384 - _cse306*_cse383 + 0.3960285*_cse352 + 0.3960285*_cse353 + 0.239041914*_cse354 + 0.239041914*_cse355 - _cse404 + _cse405) + dq3*(_cse325*_cse383 + _cse328*_cse384 + 0.239041914*_cse366 + 0.239041914*_cse367 + 0.3960285*_cse369 + 0.3960285*_cse370)
+    out[5, 5] = dq1*(_cse304*_cse394 + 0.137106991283212*_cse305 - _cse307*_cse393 + 0.137106991283212*_cse308 + _cse310*_cse388 - _cse310*_cse389 + _cse310*_cse390 + 0.227149603970304*_cse311 + 0.227149603970304*_cse312 - _cse313*_cse385 - _cse313*_cse395 + _cse313*_cse396 + _cse406 - _cse407) + dq2*(_cse303*_cse394 - _cse306*_cse393 + 0.227149603970304*_cse352 + 0.227149603970304*_cse353 + 0.137106991283212*_cse354 + 0.137106991283212*_cse355 + _cse356*_cse388 - _cse356*_cse389 + _cse356*_cse390 - _cse357*_cse385 - _cse357*_cse395 + _cse357*_cse396 - _cse406 + _cse407) + dq3*(_cse325*_cse393 + _cse328*_cse394 + 0.137106991283212*_cse366 + 0.137106991283212*_cse367 + _cse368*_cse388 - _cse368*_cse389 + _cse368*_cse390 + 0.227149603970304*_cse369 + 0.227149603970304*_cse370 - _cse371*_cse385 - _cse371*_cse395 + _cse371*_cse396) + dq4*(_cse334*_cse388 - _cse334*_cse389 + _cse334*_cse390 + _cse336*_cse385 + _cse336*_cse386 - _cse336*_cse387)
+    return out
+
+
+# EE_Tx
+def function45(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse1*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse3*_cse8
+    _cse10 = _cse5*_cse6
+    _cse11 = 0.0038906673398998*_cse8
+    _cse12 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse13 = -0.00048786*_cse6 - 0.081945*_cse8
+    _cse14 = 0.081945*_cse6 - 0.00048786*_cse8
+    _cse15 = math.sin(q3)
+    _cse16 = 6.57617443000635e-7*_cse0
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = _cse2*_cse6
+    _cse19 = _cse4*_cse8
+    _cse20 = -_cse16 - _cse17*_cse18 - _cse17*_cse19
+    _cse21 = _cse15*_cse20
+    _cse22 = math.cos(q3)
+    _cse23 = 6.57617443000635e-7*_cse1
+    _cse24 = 0.999999998572139*_cse0 - _cse18*_cse23 - _cse19*_cse23
+    _cse25 = _cse22*_cse24
+    _cse26 = -0.012581*_cse15 - 0.00040053*_cse22
+    _cse27 = -0.00040053*_cse15 + 0.012581*_cse22
+    _cse28 = -0.51802699*_cse15 - 0.75940555*_cse22
+    _cse29 = _cse24*_cse28
+    _cse30 = 0.45991232*_cse15 + 0.85536427*_cse22
+    _cse31 = _cse20*_cse30
+    _cse32 = 0.75940555*_cse15 - 0.51802699*_cse22
+    _cse33 = _cse20*_cse32
+    _cse34 = 0.85536427*_cse15 - 0.45991232*_cse22
+    _cse35 = _cse24*_cse34
+    _cse36 = math.sin(q4)
+    _cse37 = -0.000346321299837637*_cse10 + 0.517383113*_cse29 - 0.855753802*_cse31 + 0.517383113*_cse33 - 0.855753802*_cse35 + 0.000346321299837637*_cse9
+    _cse38 = _cse36*_cse37
+    _cse39 = math.cos(q4)
+    _cse40 = -0.012272*_cse36 - 0.00052974*_cse39
+    _cse41 = -0.78972966*_cse36 + 0.45479896*_cse39
+    _cse42 = _cse37*_cse41
+    _cse43 = 0.40329059*_cse36 + 0.89059413*_cse39
+    _cse44 = _cse37*_cse43
+    _cse45 = 0.818687841791724*_cse10 - 0.212878838804554*_cse21 + 0.212878838804554*_cse25 + 0.758601438*_cse29 + 0.458851168*_cse31 + 0.758601438*_cse33 + 0.458851168*_cse35 - 0.818687841791724*_cse9
+    _cse46 = -0.00052974*_cse36 + 0.012272*_cse39
+    _cse47 = 0.45479896*_cse36 + 0.78972966*_cse39
+    _cse48 = _cse45*_cse47
+    _cse49 = 0.89059413*_cse36 - 0.40329059*_cse39
+    _cse50 = _cse45*_cse49
+    _cse51 = math.sin(q5)
+    _cse52 = -2.75322908921405e-6*_cse10 + 1.9561995392714e-6*_cse21 - 1.9561995392714e-6*_cse25 + 1.8987869684628e-6*_cse29 + 1.14610355371469e-6*_cse31 + 1.8987869684628e-6*_cse33 + 1.14610355371469e-6*_cse35 - 0.45478971*_cse42 - 0.890598824*_cse44 - 0.45478971*_cse48 - 0.890598824*_cse50 + 2.75322908921405e-6*_cse9
+    _cse53 = math.cos(q5)
+    _cse54 = 0.470391945795628*_cse1*_cse4*_cse6 - 0.334218649384678*_cse21 + 0.334218649384678*_cse22*_cse24 - 0.324409654194476*_cse29 - 0.19581293936857*_cse31 - 0.324409654194476*_cse33 - 0.19581293936857*_cse35 + 0.403618758*_cse37*_cse43 - 0.213215245107779*_cse38 + 0.213215245107779*_cse39*_cse45 - 0.790154512*_cse42 + 0.403618758*_cse45*_cse49 - 0.790154512*_cse48 - 0.470391945795628*_cse9
+    _cse55 = _cse0*_cse2
+    _cse56 = _cse0*_cse4
+    _cse57 = _cse56*_cse6
+    _cse58 = _cse16*_cse18 + _cse16*_cse19 + _cse17
+    _cse59 = 0.999999998572139*_cse0
+    _cse60 = _cse18*_cse59 + _cse19*_cse59 - _cse23
+    _cse61 = _cse15*_cse60
+    _cse62 = _cse28*_cse58
+    _cse63 = _cse30*_cse60
+    _cse64 = _cse32*_cse60
+    _cse65 = _cse34*_cse58
+    _cse66 = _cse55*_cse8
+    _cse67 = 0.000346321299837637*_cse57 + 0.517383113*_cse62 - 0.855753802*_cse63 + 0.517383113*_cse64 - 0.855753802*_cse65 - 0.000346321299837637*_cse66
+    _cse68 = _cse36*_cse67
+    _cse69 = _cse43*_cse67
+    _cse70 = _cse22*_cse58
+    _cse71 = -0.818687841791724*_cse57 - 0.212878838804554*_cse61 + 0.758601438*_cse62 + 0.458851168*_cse63 + 0.758601438*_cse64 + 0.458851168*_cse65 + 0.818687841791724*_cse66 + 0.212878838804554*_cse70
+    _cse72 = _cse49*_cse71
+    _cse73 = _cse41*_cse67
+    _cse74 = _cse47*_cse71
+    _cse75 = 2.75322908921405e-6*_cse57 + 1.9561995392714e-6*_cse61 + 1.8987869684628e-6*_cse62 + 1.14610355371469e-6*_cse63 + 1.8987869684628e-6*_cse64 + 1.14610355371469e-6*_cse65 - 2.75322908921405e-6*_cse66 - 0.890598824*_cse69 - 1.9561995392714e-6*_cse70 - 0.890598824*_cse72 - 0.45478971*_cse73 - 0.45478971*_cse74
+    _cse76 = 0.470391945795628*_cse0*_cse2*_cse8 + 0.334218649384678*_cse22*_cse58 + 0.213215245107779*_cse39*_cse71 + 0.403618758*_cse43*_cse67 + 0.403618758*_cse49*_cse71 - 0.470391945795628*_cse57 - 0.334218649384678*_cse61 - 0.324409654194476*_cse62 - 0.19581293936857*_cse63 - 0.324409654194476*_cse64 - 0.19581293936857*_cse65 - 0.213215245107779*_cse68 - 0.790154512*_cse73 - 0.790154512*_cse74
+    _cse77 = _cse2*_cse8
+    _cse78 = 0.999999998572139*_cse4*_cse6 - 0.999999998572139*_cse77
+    _cse79 = _cse15*_cse78
+    _cse80 = 6.57617443000635e-7*_cse4*_cse6 - 6.57617443000635e-7*_cse77
+    _cse81 = _cse22*_cse80
+    _cse82 = _cse30*_cse78
+    _cse83 = _cse32*_cse78
+    _cse84 = _cse28*_cse80
+    _cse85 = _cse34*_cse80
+    _cse86 = -0.000346321299837637*_cse18 - 0.000346321299837637*_cse19 + 0.517383113*_cse28*_cse80 + 0.517383113*_cse32*_cse78 - 0.855753802*_cse82 - 0.855753802*_cse85
+    _cse87 = _cse36*_cse86
+    _cse88 = _cse41*_cse86
+    _cse89 = _cse43*_cse86
+    _cse90 = 0.818687841791724*_cse18 + 0.818687841791724*_cse19 - 0.212878838804554*_cse79 + 0.212878838804554*_cse81 + 0.458851168*_cse82 + 0.758601438*_cse83 + 0.758601438*_cse84 + 0.458851168*_cse85
+    _cse91 = _cse47*_cse90
+    _cse92 = _cse49*_cse90
+    _cse93 = 1.9561995392714e-6*_cse15*_cse78 - 2.75322908921405e-6*_cse18 - 2.75322908921405e-6*_cse19 + 1.8987869684628e-6*_cse28*_cse80 + 1.14610355371469e-6*_cse30*_cse78 + 1.8987869684628e-6*_cse32*_cse78 + 1.14610355371469e-6*_cse34*_cse80 - 1.9561995392714e-6*_cse81 - 0.45478971*_cse88 - 0.890598824*_cse89 - 0.45478971*_cse91 - 0.890598824*_cse92
+    _cse94 = 0.470391945795628*_cse2*_cse6 + 0.334218649384678*_cse22*_cse80 + 0.213215245107779*_cse39*_cse90 + 0.470391945795628*_cse4*_cse8 + 0.403618758*_cse43*_cse86 + 0.403618758*_cse49*_cse90 - 0.334218649384678*_cse79 - 0.19581293936857*_cse82 - 0.324409654194476*_cse83 - 0.324409654194476*_cse84 - 0.19581293936857*_cse85 - 0.213215245107779*_cse87 - 0.790154512*_cse88 - 0.790154512*_cse91
+    out = np.empty((4, 1))
+    out[0, 0] = -0.0068032576553314*_cse0 - _cse1*_cse12 + 4.3259e-5*_cse1 + 0.253888422522456*_cse10 + _cse11*_cse5 + _cse13*_cse3 + _cse14*_cse5 + _cse20*_cse26 - 0.0627091097210817*_cse21 + _cse24*_cse27 + 0.0627091097210817*_cse25 - 0.0491638727803817*_cse29 + _cse3*_cse7 + 0.20503*_cse3 - 0.0290982758960988*_cse31 - 0.0491638727803817*_cse33 - 0.0290982758960988*_cse35 + _cse37*_cse40 - 0.0499969558686132*_cse38 + 0.0499969558686132*_cse39*_cse45 + 0.03790017976*_cse42 - 0.01872015456*_cse44 + _cse45*_cse46 + 0.03790017976*_cse48 - 1.098e-6*_cse5 - 0.01872015456*_cse50 - 0.253888422522456*_cse9 + x*(-_cse51*_cse54 - _cse52*_cse53) + y*(-_cse51*_cse52 + _cse53*_cse54) + z*(0.329365488408814*_cse1*_cse4*_cse6 - 0.234017800844203*_cse21 + 0.234017800844203*_cse22*_cse24 - 0.227149603970304*_cse29 - 0.137106991283212*_cse31 - 0.227149603970304*_cse33 - 0.137106991283212*_cse35 + 0.410879747*_cse37*_cse41 - 0.410149995883665*_cse38 + 0.410149995883665*_cse39*_cse45 - 0.209584432*_cse44 + 0.410879747*_cse45*_cse47 - 0.209584432*_cse50 - 0.329365488408814*_cse9) - 3.2712e-5
+    out[1, 0] = _cse0*_cse12 + 0.253888422522456*_cse0*_cse2*_cse8 + 1.098e-6*_cse0*_cse4 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - _cse11*_cse56 - _cse13*_cse55 - _cse14*_cse56 + 0.0627091097210817*_cse22*_cse58 + _cse26*_cse60 + _cse27*_cse58 + 0.0499969558686132*_cse39*_cse71 + _cse40*_cse67 + 0.03790017976*_cse41*_cse67 + _cse46*_cse71 + 0.03790017976*_cse47*_cse71 - _cse55*_cse7 - 0.20503*_cse55 - 0.253888422522456*_cse57 - 0.0627091097210817*_cse61 - 0.0491638727803817*_cse62 - 0.0290982758960988*_cse63 - 0.0491638727803817*_cse64 - 0.0290982758960988*_cse65 - 0.0499969558686132*_cse68 - 0.01872015456*_cse69 - 0.01872015456*_cse72 + x*(-_cse51*_cse76 - _cse53*_cse75) + y*(-_cse51*_cse75 + _cse53*_cse76) + z*(0.329365488408814*_cse0*_cse2*_cse8 + 0.234017800844203*_cse22*_cse58 + 0.410149995883665*_cse39*_cse71 + 0.410879747*_cse41*_cse67 + 0.410879747*_cse47*_cse71 - 0.329365488408814*_cse57 - 0.234017800844203*_cse61 - 0.227149603970304*_cse62 - 0.137106991283212*_cse63 - 0.227149603970304*_cse64 - 0.137106991283212*_cse65 - 0.410149995883665*_cse68 - 0.209584432*_cse69 - 0.209584432*_cse72) - 1.7324e-5
+    out[2, 0] = -_cse13*_cse4 + _cse14*_cse2 + 0.253888422522456*_cse18 + 0.253888422522456*_cse19 + 0.001950802*_cse2 + _cse26*_cse78 + _cse27*_cse80 + 0.0499969558686132*_cse39*_cse90 - 0.0038906673398998*_cse4*_cse6 - 0.41405*_cse4 + _cse40*_cse86 + _cse46*_cse90 + 0.0038906673398998*_cse77 - 0.0627091097210817*_cse79 + 0.0627091097210817*_cse81 - 0.0290982758960988*_cse82 - 0.0491638727803817*_cse83 - 0.0491638727803817*_cse84 - 0.0290982758960988*_cse85 - 0.0499969558686132*_cse87 + 0.03790017976*_cse88 - 0.01872015456*_cse89 + 0.03790017976*_cse91 - 0.01872015456*_cse92 + x*(-_cse51*_cse94 - _cse53*_cse93) + y*(-_cse51*_cse93 + _cse53*_cse94) + z*(0.329365488408814*_cse2*_cse6 + 0.234017800844203*_cse22*_cse80 + 0.410149995883665*_cse39*_cse90 + 0.329365488408814*_cse4*_cse8 + 0.410879747*_cse41*_cse86 + 0.410879747*_cse47*_cse90 - 0.234017800844203*_cse79 - 0.137106991283212*_cse82 - 0.227149603970304*_cse83 - 0.227149603970304*_cse84 - 0.137106991283212*_cse85 - 0.410149995883665*_cse87 - 0.209584432*_cse89 - 0.209584432*_cse92) + 0.275128
+    out[3, 0] = 1
+    return out
+
+
+# EE_J
+def function46(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.20503*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse2*_cse5
+    _cse7 = 0.0038906673398998*_cse6
+    _cse8 = math.cos(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse4*_cse8
+    _cse12 = 0.0038906673398998*_cse11
+    _cse13 = -0.20902*_cse2 - 0.0019519*_cse4
+    _cse14 = 0.00048786*_cse5 + 0.081945*_cse8
+    _cse15 = -_cse14
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.081945*_cse5 - 0.00048786*_cse8
+    _cse18 = _cse17*_cse4
+    _cse19 = math.cos(q3)
+    _cse20 = 0.999999998572139*_cse1
+    _cse21 = 6.57617443000635e-7*_cse0
+    _cse22 = _cse11*_cse21 + _cse20 + _cse21*_cse6
+    _cse23 = math.sin(q3)
+    _cse24 = 6.57617443000635e-7*_cse1
+    _cse25 = 0.999999998572139*_cse0
+    _cse26 = _cse11*_cse25 - _cse24 + _cse25*_cse6
+    _cse27 = _cse23*_cse26
+    _cse28 = 0.75940555*_cse19 + 0.51802699*_cse23
+    _cse29 = -_cse28
+    _cse30 = _cse22*_cse29
+    _cse31 = 0.85536427*_cse19 + 0.45991232*_cse23
+    _cse32 = _cse26*_cse31
+    _cse33 = -0.51802699*_cse19 + 0.75940555*_cse23
+    _cse34 = _cse26*_cse33
+    _cse35 = -0.45991232*_cse19 + 0.85536427*_cse23
+    _cse36 = _cse22*_cse35
+    _cse37 = -0.00040053*_cse19 - 0.012581*_cse23
+    _cse38 = -0.012581*_cse19 + 0.00040053*_cse23
+    _cse39 = -_cse38
+    _cse40 = math.sin(q4)
+    _cse41 = _cse0*_cse2
+    _cse42 = _cse41*_cse8
+    _cse43 = 0.000346321299837637*_cse10 + 0.517383113*_cse30 - 0.855753802*_cse32 + 0.517383113*_cse34 - 0.855753802*_cse36 - 0.000346321299837637*_cse42
+    _cse44 = _cse40*_cse43
+    _cse45 = math.cos(q4)
+    _cse46 = -0.78972966*_cse40 + 0.45479896*_cse45
+    _cse47 = 0.40329059*_cse40 + 0.89059413*_cse45
+    _cse48 = _cse43*_cse47
+    _cse49 = -0.012272*_cse40 - 0.00052974*_cse45
+    _cse50 = _cse19*_cse22
+    _cse51 = -0.818687841791724*_cse10 - 0.212878838804554*_cse27 + 0.758601438*_cse30 + 0.458851168*_cse32 + 0.758601438*_cse34 + 0.458851168*_cse36 + 0.818687841791724*_cse42 + 0.212878838804554*_cse50
+    _cse52 = 0.45479896*_cse40 + 0.78972966*_cse45
+    _cse53 = 0.89059413*_cse40 - 0.40329059*_cse45
+    _cse54 = _cse51*_cse53
+    _cse55 = 0.00052974*_cse40 - 0.012272*_cse45
+    _cse56 = -_cse55
+    _cse57 = -0.329365488408814*_cse0*_cse2*_cse8 + 0.329365488408814*_cse10 - 0.234017800844203*_cse19*_cse22 + 0.234017800844203*_cse27 + 0.227149603970304*_cse30 + 0.137106991283212*_cse32 + 0.227149603970304*_cse34 + 0.137106991283212*_cse36 - 0.410879747*_cse43*_cse46 + 0.410149995883665*_cse44 - 0.410149995883665*_cse45*_cse51 + 0.209584432*_cse48 - 0.410879747*_cse51*_cse52 + 0.209584432*_cse54
+    _cse58 = math.sin(q5)
+    _cse59 = _cse43*_cse46
+    _cse60 = _cse51*_cse52
+    _cse61 = 2.75322908921405e-6*_cse10 + 1.9561995392714e-6*_cse27 + 1.8987869684628e-6*_cse30 + 1.14610355371469e-6*_cse32 + 1.8987869684628e-6*_cse34 + 1.14610355371469e-6*_cse36 - 2.75322908921405e-6*_cse42 - 0.890598824*_cse48 - 1.9561995392714e-6*_cse50 - 0.890598824*_cse54 - 0.45478971*_cse59 - 0.45478971*_cse60
+    _cse62 = math.cos(q5)
+    _cse63 = 0.470391945795628*_cse0*_cse2*_cse8 - 0.470391945795628*_cse10 + 0.334218649384678*_cse19*_cse22 - 0.334218649384678*_cse27 - 0.324409654194476*_cse30 - 0.19581293936857*_cse32 - 0.324409654194476*_cse34 - 0.19581293936857*_cse36 + 0.403618758*_cse43*_cse47 - 0.213215245107779*_cse44 + 0.213215245107779*_cse45*_cse51 + 0.403618758*_cse51*_cse53 - 0.790154512*_cse59 - 0.790154512*_cse60
+    _cse64 = _cse58*_cse61 - _cse62*_cse63
+    _cse65 = -_cse58*_cse63 - _cse61*_cse62
+    _cse66 = _cse1*_cse2
+    _cse67 = _cse1*_cse4
+    _cse68 = 0.253888422522456*_cse1
+    _cse69 = _cse6*_cse68
+    _cse70 = _cse66*_cse8
+    _cse71 = 0.0038906673398998*_cse70
+    _cse72 = _cse5*_cse67
+    _cse73 = 0.0038906673398998*_cse72
+    _cse74 = _cse11*_cse68
+    _cse75 = 0.0019519*_cse2 - 0.20902*_cse4
+    _cse76 = _cse17*_cse66
+    _cse77 = _cse2*_cse8
+    _cse78 = _cse4*_cse5
+    _cse79 = _cse24*_cse77 - _cse24*_cse78
+    _cse80 = _cse19*_cse79
+    _cse81 = _cse20*_cse77 - _cse20*_cse78
+    _cse82 = _cse23*_cse81
+    _cse83 = _cse29*_cse79
+    _cse84 = _cse35*_cse79
+    _cse85 = _cse31*_cse81
+    _cse86 = _cse33*_cse81
+    _cse87 = 0.000346321299837637*_cse11
+    _cse88 = 0.000346321299837637*_cse6
+    _cse89 = _cse1*_cse87 + _cse1*_cse88
+    _cse90 = 0.517383113*_cse83 - 0.855753802*_cse84 - 0.855753802*_cse85 + 0.517383113*_cse86 + _cse89
+    _cse91 = _cse40*_cse90
+    _cse92 = _cse46*_cse90
+    _cse93 = _cse47*_cse90
+    _cse94 = 0.818687841791724*_cse6
+    _cse95 = _cse1*_cse94
+    _cse96 = 0.818687841791724*_cse11
+    _cse97 = _cse1*_cse96
+    _cse98 = 0.212878838804554*_cse80 - 0.212878838804554*_cse82 + 0.758601438*_cse83 + 0.458851168*_cse84 + 0.458851168*_cse85 + 0.758601438*_cse86 - _cse95 - _cse97
+    _cse99 = _cse52*_cse98
+    _cse100 = _cse53*_cse98
+    _cse101 = 0.329365488408814*_cse6
+    _cse102 = _cse1*_cse101
+    _cse103 = 0.329365488408814*_cse11
+    _cse104 = _cse1*_cse103
+    _cse105 = 2.75322908921405e-6*_cse11
+    _cse106 = 2.75322908921405e-6*_cse6
+    _cse107 = _cse1*_cse105 + _cse1*_cse106
+    _cse108 = -0.890598824*_cse100 + _cse107 - 1.9561995392714e-6*_cse80 + 1.9561995392714e-6*_cse82 + 1.8987869684628e-6*_cse83 + 1.14610355371469e-6*_cse84 + 1.14610355371469e-6*_cse85 + 1.8987869684628e-6*_cse86 - 0.45478971*_cse92 - 0.890598824*_cse93 - 0.45478971*_cse99
+    _cse109 = 0.470391945795628*_cse6
+    _cse110 = _cse1*_cse109
+    _cse111 = 0.470391945795628*_cse11
+    _cse112 = _cse1*_cse111
+    _cse113 = -_cse110 - _cse112 + 0.334218649384678*_cse19*_cse79 + 0.213215245107779*_cse45*_cse98 + 0.403618758*_cse47*_cse90 + 0.403618758*_cse53*_cse98 - 0.334218649384678*_cse82 - 0.324409654194476*_cse83 - 0.19581293936857*_cse84 - 0.19581293936857*_cse85 - 0.324409654194476*_cse86 - 0.213215245107779*_cse91 - 0.790154512*_cse92 - 0.790154512*_cse99
+    _cse114 = -_cse81
+    _cse115 = _cse114*_cse23
+    _cse116 = -_cse79
+    _cse117 = _cse116*_cse19
+    _cse118 = _cse114*_cse31
+    _cse119 = _cse114*_cse33
+    _cse120 = _cse116*_cse29
+    _cse121 = _cse116*_cse35
+    _cse122 = 0.517383113*_cse114*_cse33 + 0.517383113*_cse116*_cse29 - 0.855753802*_cse118 - 0.855753802*_cse121 - _cse89
+    _cse123 = _cse122*_cse40
+    _cse124 = _cse122*_cse46
+    _cse125 = _cse122*_cse47
+    _cse126 = -0.212878838804554*_cse115 + 0.212878838804554*_cse117 + 0.458851168*_cse118 + 0.758601438*_cse119 + 0.758601438*_cse120 + 0.458851168*_cse121 + _cse95 + _cse97
+    _cse127 = _cse126*_cse52
+    _cse128 = _cse126*_cse53
+    _cse129 = -_cse107 + 1.9561995392714e-6*_cse114*_cse23 + 1.14610355371469e-6*_cse114*_cse31 + 1.8987869684628e-6*_cse114*_cse33 + 1.8987869684628e-6*_cse116*_cse29 + 1.14610355371469e-6*_cse116*_cse35 - 1.9561995392714e-6*_cse117 - 0.45478971*_cse124 - 0.890598824*_cse125 - 0.45478971*_cse127 - 0.890598824*_cse128
+    _cse130 = _cse110 + _cse112 - 0.334218649384678*_cse115 + 0.334218649384678*_cse116*_cse19 - 0.19581293936857*_cse118 - 0.324409654194476*_cse119 - 0.324409654194476*_cse120 - 0.19581293936857*_cse121 + 0.403618758*_cse122*_cse47 - 0.213215245107779*_cse123 - 0.790154512*_cse124 + 0.213215245107779*_cse126*_cse45 + 0.403618758*_cse126*_cse53 - 0.790154512*_cse127
+    _cse131 = _cse11*_cse20 + _cse20*_cse6 + _cse21
+    _cse132 = -_cse131
+    _cse133 = _cse132*_cse19
+    _cse134 = -0.999999998572139*_cse0 + _cse11*_cse24 + _cse24*_cse6
+    _cse135 = -_cse134
+    _cse136 = _cse135*_cse23
+    _cse137 = -_cse35
+    _cse138 = _cse132*_cse137
+    _cse139 = _cse135*_cse31
+    _cse140 = _cse132*_cse28
+    _cse141 = _cse135*_cse33
+    _cse142 = 0.517383113*_cse132*_cse28 + 0.517383113*_cse135*_cse33 - 0.855753802*_cse138 - 0.855753802*_cse139
+    _cse143 = _cse142*_cse40
+    _cse144 = _cse142*_cse46
+    _cse145 = _cse142*_cse47
+    _cse146 = -0.212878838804554*_cse133 - 0.212878838804554*_cse136 + 0.458851168*_cse138 + 0.458851168*_cse139 + 0.758601438*_cse140 + 0.758601438*_cse141
+    _cse147 = _cse146*_cse52
+    _cse148 = _cse146*_cse53
+    _cse149 = 1.9561995392714e-6*_cse133 + 1.9561995392714e-6*_cse136 + 1.14610355371469e-6*_cse138 + 1.14610355371469e-6*_cse139 + 1.8987869684628e-6*_cse140 + 1.8987869684628e-6*_cse141 - 0.45478971*_cse144 - 0.890598824*_cse145 - 0.45478971*_cse147 - 0.890598824*_cse148
+    _cse150 = -0.334218649384678*_cse133 - 0.334218649384678*_cse136 - 0.19581293936857*_cse138 - 0.19581293936857*_cse139 - 0.324409654194476*_cse140 - 0.324409654194476*_cse141 + 0.403618758*_cse142*_cse47 - 0.213215245107779*_cse143 - 0.790154512*_cse144 + 0.213215245107779*_cse146*_cse45 + 0.403618758*_cse146*_cse53 - 0.790154512*_cse147
+    _cse151 = 0.000346321299837637*_cse70
+    _cse152 = 0.000346321299837637*_cse72
+    _cse153 = _cse135*_cse29
+    _cse154 = _cse132*_cse31
+    _cse155 = _cse132*_cse33
+    _cse156 = _cse135*_cse35
+    _cse157 = _cse151 - _cse152 + 0.517383113*_cse153 - 0.855753802*_cse154 + 0.517383113*_cse155 - 0.855753802*_cse156
+    _cse158 = _cse157*_cse45
+    _cse159 = -_cse53
+    _cse160 = _cse157*_cse159
+    _cse161 = -_cse52
+    _cse162 = _cse157*_cse161
+    _cse163 = 0.818687841791724*_cse70
+    _cse164 = 0.818687841791724*_cse72
+    _cse165 = _cse132*_cse23
+    _cse166 = _cse135*_cse19
+    _cse167 = 0.758601438*_cse153 + 0.458851168*_cse154 + 0.758601438*_cse155 + 0.458851168*_cse156 - _cse163 + _cse164 - 0.212878838804554*_cse165 + 0.212878838804554*_cse166
+    _cse168 = _cse167*_cse40
+    _cse169 = _cse167*_cse46
+    _cse170 = _cse167*_cse47
+    _cse171 = -0.890598824*_cse160 - 0.45478971*_cse162 - 0.45478971*_cse169 - 0.890598824*_cse170
+    _cse172 = 0.403618758*_cse157*_cse159 - 0.213215245107779*_cse158 - 0.790154512*_cse162 + 0.403618758*_cse167*_cse47 - 0.213215245107779*_cse168 - 0.790154512*_cse169
+    _cse173 = 2.75322908921405e-6*_cse70
+    _cse174 = 2.75322908921405e-6*_cse72
+    _cse175 = _cse157*_cse46
+    _cse176 = _cse157*_cse47
+    _cse177 = _cse167*_cse52
+    _cse178 = _cse167*_cse53
+    _cse179 = 1.8987869684628e-6*_cse153 + 1.14610355371469e-6*_cse154 + 1.8987869684628e-6*_cse155 + 1.14610355371469e-6*_cse156 + 1.9561995392714e-6*_cse165 - 1.9561995392714e-6*_cse166 + _cse173 - _cse174 - 0.45478971*_cse175 - 0.890598824*_cse176 - 0.45478971*_cse177 - 0.890598824*_cse178
+    _cse180 = 0.470391945795628*_cse70
+    _cse181 = 0.470391945795628*_cse72
+    _cse182 = 0.213215245107779*_cse40
+    _cse183 = 0.334218649384678*_cse135*_cse19 - 0.324409654194476*_cse153 - 0.19581293936857*_cse154 - 0.324409654194476*_cse155 - 0.19581293936857*_cse156 - _cse157*_cse182 + 0.403618758*_cse157*_cse47 - 0.334218649384678*_cse165 + 0.213215245107779*_cse167*_cse45 + 0.403618758*_cse167*_cse53 - 0.790154512*_cse175 - 0.790154512*_cse177 - _cse180 + _cse181
+    _cse184 = _cse134*_cse19
+    _cse185 = _cse131*_cse23
+    _cse186 = _cse134*_cse29
+    _cse187 = _cse131*_cse31
+    _cse188 = _cse131*_cse33
+    _cse189 = _cse134*_cse35
+    _cse190 = -_cse151 + _cse152 + 0.517383113*_cse186 - 0.855753802*_cse187 + 0.517383113*_cse188 - 0.855753802*_cse189
+    _cse191 = _cse190*_cse40
+    _cse192 = _cse190*_cse46
+    _cse193 = _cse190*_cse47
+    _cse194 = _cse163 - _cse164 + 0.212878838804554*_cse184 - 0.212878838804554*_cse185 + 0.758601438*_cse186 + 0.458851168*_cse187 + 0.758601438*_cse188 + 0.458851168*_cse189
+    _cse195 = _cse194*_cse52
+    _cse196 = _cse194*_cse53
+    _cse197 = 0.329365488408814*_cse72
+    _cse198 = -_cse173 + _cse174 - 1.9561995392714e-6*_cse184 + 1.9561995392714e-6*_cse185 + 1.8987869684628e-6*_cse186 + 1.14610355371469e-6*_cse187 + 1.8987869684628e-6*_cse188 + 1.14610355371469e-6*_cse189 - 0.45478971*_cse192 - 0.890598824*_cse193 - 0.45478971*_cse195 - 0.890598824*_cse196
+    _cse199 = 0.334218649384678*_cse134*_cse19 + _cse180 - _cse181 - _cse182*_cse190 - 0.334218649384678*_cse185 - 0.324409654194476*_cse186 - 0.19581293936857*_cse187 - 0.324409654194476*_cse188 - 0.19581293936857*_cse189 + 0.403618758*_cse190*_cse47 - 0.790154512*_cse192 + 0.213215245107779*_cse194*_cse45 + 0.403618758*_cse194*_cse53 - 0.790154512*_cse195
+    _cse200 = -6.57617443000635e-7*_cse0*_cse4*_cse5 + _cse21*_cse77
+    _cse201 = -_cse200
+    _cse202 = _cse19*_cse201
+    _cse203 = -0.999999998572139*_cse0*_cse4*_cse5 + _cse25*_cse77
+    _cse204 = -_cse203
+    _cse205 = _cse204*_cse31
+    _cse206 = _cse201*_cse35
+    _cse207 = _cse0*_cse87 + _cse0*_cse88
+    _cse208 = 0.517383113*_cse201*_cse29 + 0.517383113*_cse204*_cse33 - 0.855753802*_cse205 - 0.855753802*_cse206 - _cse207
+    _cse209 = _cse208*_cse46
+    _cse210 = _cse0*_cse94
+    _cse211 = _cse0*_cse96
+    _cse212 = _cse204*_cse23
+    _cse213 = _cse204*_cse33
+    _cse214 = _cse201*_cse29
+    _cse215 = 0.212878838804554*_cse202 + 0.458851168*_cse205 + 0.458851168*_cse206 + _cse210 + _cse211 - 0.212878838804554*_cse212 + 0.758601438*_cse213 + 0.758601438*_cse214
+    _cse216 = _cse215*_cse52
+    _cse217 = _cse208*_cse47
+    _cse218 = _cse215*_cse53
+    _cse219 = _cse0*_cse105 + _cse0*_cse106
+    _cse220 = 1.8987869684628e-6*_cse201*_cse29 + 1.14610355371469e-6*_cse201*_cse35 - 1.9561995392714e-6*_cse202 + 1.9561995392714e-6*_cse204*_cse23 + 1.14610355371469e-6*_cse204*_cse31 + 1.8987869684628e-6*_cse204*_cse33 - 0.45478971*_cse209 - 0.45478971*_cse216 - 0.890598824*_cse217 - 0.890598824*_cse218 - _cse219
+    _cse221 = _cse0*_cse109
+    _cse222 = _cse0*_cse111
+    _cse223 = -_cse182*_cse208 + 0.334218649384678*_cse19*_cse201 - 0.19581293936857*_cse205 - 0.19581293936857*_cse206 + 0.403618758*_cse208*_cse47 - 0.790154512*_cse209 - 0.334218649384678*_cse212 - 0.324409654194476*_cse213 - 0.324409654194476*_cse214 + 0.213215245107779*_cse215*_cse45 + 0.403618758*_cse215*_cse53 - 0.790154512*_cse216 + _cse221 + _cse222
+    _cse224 = _cse0*_cse101
+    _cse225 = _cse0*_cse103
+    _cse226 = _cse208*_cse40
+    _cse227 = 0.253888422522456*_cse0
+    _cse228 = -0.0038906673398998*_cse10 + _cse11*_cse227 + _cse17*_cse41 + _cse227*_cse6 + 0.0038906673398998*_cse42
+    _cse229 = _cse203*_cse33
+    _cse230 = _cse200*_cse29
+    _cse231 = _cse203*_cse23
+    _cse232 = _cse203*_cse31
+    _cse233 = _cse200*_cse35
+    _cse234 = _cse19*_cse200
+    _cse235 = _cse207 + 0.517383113*_cse229 + 0.517383113*_cse230 - 0.855753802*_cse232 - 0.855753802*_cse233
+    _cse236 = _cse235*_cse46
+    _cse237 = -_cse210 - _cse211 + 0.758601438*_cse229 + 0.758601438*_cse230 - 0.212878838804554*_cse231 + 0.458851168*_cse232 + 0.458851168*_cse233 + 0.212878838804554*_cse234
+    _cse238 = _cse237*_cse52
+    _cse239 = _cse235*_cse47
+    _cse240 = _cse237*_cse53
+    _cse241 = _cse219 + 1.8987869684628e-6*_cse229 + 1.8987869684628e-6*_cse230 + 1.9561995392714e-6*_cse231 + 1.14610355371469e-6*_cse232 + 1.14610355371469e-6*_cse233 - 1.9561995392714e-6*_cse234 - 0.45478971*_cse236 - 0.45478971*_cse238 - 0.890598824*_cse239 - 0.890598824*_cse240
+    _cse242 = -_cse182*_cse235 + 0.334218649384678*_cse19*_cse200 - _cse221 - _cse222 - 0.324409654194476*_cse229 - 0.324409654194476*_cse230 - 0.334218649384678*_cse231 - 0.19581293936857*_cse232 - 0.19581293936857*_cse233 + 0.403618758*_cse235*_cse47 - 0.790154512*_cse236 + 0.213215245107779*_cse237*_cse45 + 0.403618758*_cse237*_cse53 - 0.790154512*_cse238
+    _cse243 = _cse235*_cse40
+    _cse244 = _cse22*_cse23
+    _cse245 = _cse19*_cse26
+    _cse246 = _cse137*_cse26
+    _cse247 = _cse22*_cse31
+    _cse248 = _cse26*_cse28
+    _cse249 = _cse22*_cse33
+    _cse250 = 0.517383113*_cse22*_cse33 - 0.855753802*_cse246 - 0.855753802*_cse247 + 0.517383113*_cse26*_cse28
+    _cse251 = _cse250*_cse40
+    _cse252 = _cse250*_cse46
+    _cse253 = _cse250*_cse47
+    _cse254 = -0.212878838804554*_cse244 - 0.212878838804554*_cse245 + 0.458851168*_cse246 + 0.458851168*_cse247 + 0.758601438*_cse248 + 0.758601438*_cse249
+    _cse255 = _cse254*_cse52
+    _cse256 = _cse254*_cse53
+    _cse257 = 1.9561995392714e-6*_cse244 + 1.9561995392714e-6*_cse245 + 1.14610355371469e-6*_cse246 + 1.14610355371469e-6*_cse247 + 1.8987869684628e-6*_cse248 + 1.8987869684628e-6*_cse249 - 0.45478971*_cse252 - 0.890598824*_cse253 - 0.45478971*_cse255 - 0.890598824*_cse256
+    _cse258 = -_cse182*_cse250 - 0.334218649384678*_cse244 - 0.334218649384678*_cse245 - 0.19581293936857*_cse246 - 0.19581293936857*_cse247 - 0.324409654194476*_cse248 - 0.324409654194476*_cse249 + 0.403618758*_cse250*_cse47 - 0.790154512*_cse252 + 0.213215245107779*_cse254*_cse45 + 0.403618758*_cse254*_cse53 - 0.790154512*_cse255
+    _cse259 = _cse43*_cse45
+    _cse260 = _cse159*_cse43
+    _cse261 = _cse161*_cse43
+    _cse262 = _cse40*_cse51
+    _cse263 = _cse46*_cse51
+    _cse264 = _cse47*_cse51
+    _cse265 = -0.890598824*_cse260 - 0.45478971*_cse261 - 0.45478971*_cse263 - 0.890598824*_cse264
+    _cse266 = 0.213215245107779*_cse45
+    _cse267 = 0.403618758*_cse159*_cse43 - _cse182*_cse51 - 0.790154512*_cse261 - 0.790154512*_cse263 - _cse266*_cse43 + 0.403618758*_cse47*_cse51
+    _cse268 = 0.253888422522456*_cse77
+    _cse269 = 0.253888422522456*_cse78
+    _cse270 = 0.999999998572139*_cse11 + 0.999999998572139*_cse6
+    _cse271 = -_cse270
+    _cse272 = _cse23*_cse271
+    _cse273 = 6.57617443000635e-7*_cse11 + 6.57617443000635e-7*_cse6
+    _cse274 = -_cse273
+    _cse275 = _cse19*_cse274
+    _cse276 = _cse271*_cse31
+    _cse277 = _cse271*_cse33
+    _cse278 = _cse274*_cse29
+    _cse279 = _cse274*_cse35
+    _cse280 = -0.000346321299837637*_cse77 + 0.000346321299837637*_cse78
+    _cse281 = 0.517383113*_cse271*_cse33 + 0.517383113*_cse274*_cse29 - 0.855753802*_cse276 - 0.855753802*_cse279 - _cse280
+    _cse282 = _cse281*_cse40
+    _cse283 = _cse281*_cse46
+    _cse284 = _cse281*_cse47
+    _cse285 = 0.818687841791724*_cse77
+    _cse286 = 0.818687841791724*_cse78
+    _cse287 = -0.212878838804554*_cse272 + 0.212878838804554*_cse275 + 0.458851168*_cse276 + 0.758601438*_cse277 + 0.758601438*_cse278 + 0.458851168*_cse279 - _cse285 + _cse286
+    _cse288 = _cse287*_cse52
+    _cse289 = _cse287*_cse53
+    _cse290 = 0.329365488408814*_cse77
+    _cse291 = 0.329365488408814*_cse78
+    _cse292 = 2.75322908921405e-6*_cse77
+    _cse293 = 2.75322908921405e-6*_cse78
+    _cse294 = 1.9561995392714e-6*_cse272 - 1.9561995392714e-6*_cse275 + 1.14610355371469e-6*_cse276 + 1.8987869684628e-6*_cse277 + 1.8987869684628e-6*_cse278 + 1.14610355371469e-6*_cse279 - 0.45478971*_cse283 - 0.890598824*_cse284 - 0.45478971*_cse288 - 0.890598824*_cse289 + _cse292 - _cse293
+    _cse295 = 0.470391945795628*_cse77
+    _cse296 = 0.470391945795628*_cse78
+    _cse297 = -_cse182*_cse281 + 0.334218649384678*_cse19*_cse274 - 0.334218649384678*_cse272 - 0.19581293936857*_cse276 - 0.324409654194476*_cse277 - 0.324409654194476*_cse278 - 0.19581293936857*_cse279 + 0.403618758*_cse281*_cse47 - 0.790154512*_cse283 + 0.213215245107779*_cse287*_cse45 + 0.403618758*_cse287*_cse53 - 0.790154512*_cse288 - _cse295 + _cse296
+    _cse298 = _cse19*_cse273
+    _cse299 = _cse23*_cse270
+    _cse300 = _cse273*_cse29
+    _cse301 = _cse273*_cse35
+    _cse302 = _cse270*_cse31
+    _cse303 = _cse270*_cse33
+    _cse304 = _cse280 + 0.517383113*_cse300 - 0.855753802*_cse301 - 0.855753802*_cse302 + 0.517383113*_cse303
+    _cse305 = _cse304*_cse40
+    _cse306 = _cse304*_cse46
+    _cse307 = _cse304*_cse47
+    _cse308 = _cse285 - _cse286 + 0.212878838804554*_cse298 - 0.212878838804554*_cse299 + 0.758601438*_cse300 + 0.458851168*_cse301 + 0.458851168*_cse302 + 0.758601438*_cse303
+    _cse309 = _cse308*_cse52
+    _cse310 = _cse308*_cse53
+    _cse311 = -_cse292 + _cse293 - 1.9561995392714e-6*_cse298 + 1.9561995392714e-6*_cse299 + 1.8987869684628e-6*_cse300 + 1.14610355371469e-6*_cse301 + 1.14610355371469e-6*_cse302 + 1.8987869684628e-6*_cse303 - 0.45478971*_cse306 - 0.890598824*_cse307 - 0.45478971*_cse309 - 0.890598824*_cse310
+    _cse312 = -_cse182*_cse304 + 0.334218649384678*_cse19*_cse273 + _cse295 - _cse296 - 0.334218649384678*_cse299 - 0.324409654194476*_cse300 - 0.19581293936857*_cse301 - 0.19581293936857*_cse302 - 0.324409654194476*_cse303 + 0.403618758*_cse304*_cse47 - 0.790154512*_cse306 + 0.213215245107779*_cse308*_cse45 + 0.403618758*_cse308*_cse53 - 0.790154512*_cse309
+    _cse313 = 0.999999998572139*_cse4*_cse5 - 0.999999998572139*_cse77
+    _cse314 = _cse19*_cse313
+    _cse315 = 6.57617443000635e-7*_cse4*_cse5 - 6.57617443000635e-7*_cse77
+    _cse316 = _cse23*_cse315
+    _cse317 = _cse137*_cse313
+    _cse318 = _cse28*_cse313
+    _cse319 = _cse31*_cse315
+    _cse320 = _cse315*_cse33
+    _cse321 = 0.517383113*_cse28*_cse313 + 0.517383113*_cse315*_cse33 - 0.855753802*_cse317 - 0.855753802*_cse319
+    _cse322 = _cse321*_cse40
+    _cse323 = _cse321*_cse46
+    _cse324 = _cse321*_cse47
+    _cse325 = -0.212878838804554*_cse314 - 0.212878838804554*_cse316 + 0.458851168*_cse317 + 0.758601438*_cse318 + 0.458851168*_cse319 + 0.758601438*_cse320
+    _cse326 = _cse325*_cse52
+    _cse327 = _cse325*_cse53
+    _cse328 = 1.9561995392714e-6*_cse314 + 1.9561995392714e-6*_cse316 + 1.14610355371469e-6*_cse317 + 1.8987869684628e-6*_cse318 + 1.14610355371469e-6*_cse319 + 1.8987869684628e-6*_cse320 - 0.45478971*_cse323 - 0.890598824*_cse324 - 0.45478971*_cse326 - 0.890598824*_cse327
+    _cse329 = -_cse182*_cse321 - 0.334218649384678*_cse314 - 0.334218649384678*_cse316 - 0.19581293936857*_cse317 - 0.324409654194476*_cse318 - 0.19581293936857*_cse319 - 0.324409654194476*_cse320 + 0.403618758*_cse321*_cse47 - 0.790154512*_cse323 + 0.213215245107779*_cse325*_cse45 + 0.403618758*_cse325*_cse53 - 0.790154512*_cse326
+    _cse330 = _cse31*_cse313
+    _cse331 = _cse315*_cse35
+    _cse332 = 0.517383113*_cse29*_cse315 + 0.517383113*_cse313*_cse33 - 0.855753802*_cse330 - 0.855753802*_cse331 - _cse87 - _cse88
+    _cse333 = _cse332*_cse45
+    _cse334 = _cse159*_cse332
+    _cse335 = _cse161*_cse332
+    _cse336 = _cse23*_cse313
+    _cse337 = _cse19*_cse315
+    _cse338 = _cse313*_cse33
+    _cse339 = _cse29*_cse315
+    _cse340 = 0.458851168*_cse330 + 0.458851168*_cse331 - 0.212878838804554*_cse336 + 0.212878838804554*_cse337 + 0.758601438*_cse338 + 0.758601438*_cse339 + _cse94 + _cse96
+    _cse341 = _cse340*_cse40
+    _cse342 = _cse340*_cse46
+    _cse343 = _cse340*_cse47
+    _cse344 = -0.890598824*_cse334 - 0.45478971*_cse335 - 0.45478971*_cse342 - 0.890598824*_cse343
+    _cse345 = 0.403618758*_cse159*_cse332 - _cse182*_cse340 - _cse266*_cse332 - 0.790154512*_cse335 + 0.403618758*_cse340*_cse47 - 0.790154512*_cse342
+    _cse346 = _cse332*_cse46
+    _cse347 = _cse332*_cse47
+    _cse348 = _cse340*_cse52
+    _cse349 = _cse340*_cse53
+    _cse350 = -_cse105 - _cse106 + 1.9561995392714e-6*_cse23*_cse313 + 1.8987869684628e-6*_cse29*_cse315 + 1.14610355371469e-6*_cse31*_cse313 + 1.8987869684628e-6*_cse313*_cse33 + 1.14610355371469e-6*_cse315*_cse35 - 1.9561995392714e-6*_cse337 - 0.45478971*_cse346 - 0.890598824*_cse347 - 0.45478971*_cse348 - 0.890598824*_cse349
+    _cse351 = -_cse182*_cse332 + 0.334218649384678*_cse19*_cse315 + 0.470391945795628*_cse2*_cse5 - 0.19581293936857*_cse330 - 0.19581293936857*_cse331 + 0.403618758*_cse332*_cse47 - 0.334218649384678*_cse336 - 0.324409654194476*_cse338 - 0.324409654194476*_cse339 + 0.213215245107779*_cse340*_cse45 + 0.403618758*_cse340*_cse53 - 0.790154512*_cse346 - 0.790154512*_cse348 + 0.470391945795628*_cse4*_cse8
+    _cse352 = 0.410149995883665*_cse40
+    _cse353 = 0.410149995883665*_cse45
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse12 + _cse0*_cse13 - _cse0*_cse16 - _cse0*_cse18 + 0.253888422522456*_cse0*_cse2*_cse8 - _cse0*_cse3 + 1.098e-6*_cse0*_cse4 - _cse0*_cse7 - 4.3259e-5*_cse0 - 0.0068032576553314*_cse1 - 0.253888422522456*_cse10 + 0.0627091097210817*_cse19*_cse22 + _cse22*_cse39 + _cse26*_cse37 - 0.0627091097210817*_cse27 - 0.0491638727803817*_cse30 - 0.0290982758960988*_cse32 - 0.0491638727803817*_cse34 - 0.0290982758960988*_cse36 + 0.03790017976*_cse43*_cse46 + _cse43*_cse49 - 0.0499969558686132*_cse44 + 0.0499969558686132*_cse45*_cse51 - 0.01872015456*_cse48 + 0.03790017976*_cse51*_cse52 + _cse51*_cse56 - 0.01872015456*_cse54 - _cse57*z - _cse64*y + _cse65*x
+    out[0, 1] = -_cse1*_cse75 - 0.01872015456*_cse100 + _cse15*_cse67 + _cse37*_cse81 + _cse39*_cse79 + 0.0499969558686132*_cse45*_cse98 + _cse49*_cse90 + _cse56*_cse98 + 1.098e-6*_cse66 + 0.20503*_cse67 - _cse69 - _cse71 + _cse73 - _cse74 - _cse76 + 0.0627091097210817*_cse80 - 0.0627091097210817*_cse82 - 0.0491638727803817*_cse83 - 0.0290982758960988*_cse84 - 0.0290982758960988*_cse85 - 0.0491638727803817*_cse86 - 0.0499969558686132*_cse91 + 0.03790017976*_cse92 - 0.01872015456*_cse93 + 0.03790017976*_cse99 + x*(-_cse108*_cse62 - _cse113*_cse58) + y*(-_cse108*_cse58 + _cse113*_cse62) + z*(-0.209584432*_cse100 - _cse102 - _cse104 + 0.234017800844203*_cse19*_cse79 + 0.410149995883665*_cse45*_cse98 + 0.410879747*_cse46*_cse90 + 0.410879747*_cse52*_cse98 - 0.234017800844203*_cse82 - 0.227149603970304*_cse83 - 0.137106991283212*_cse84 - 0.137106991283212*_cse85 - 0.227149603970304*_cse86 - 0.410149995883665*_cse91 - 0.209584432*_cse93)
+    out[0, 2] = _cse114*_cse37 - 0.0627091097210817*_cse115 + _cse116*_cse39 + 0.0627091097210817*_cse117 - 0.0290982758960988*_cse118 - 0.0491638727803817*_cse119 - 0.0491638727803817*_cse120 - 0.0290982758960988*_cse121 + _cse122*_cse49 - 0.0499969558686132*_cse123 + 0.03790017976*_cse124 - 0.01872015456*_cse125 + 0.0499969558686132*_cse126*_cse45 + _cse126*_cse56 + 0.03790017976*_cse127 - 0.01872015456*_cse128 + _cse14*_cse67 + _cse69 + _cse71 - _cse73 + _cse74 + _cse76 + x*(-_cse129*_cse62 - _cse130*_cse58) + y*(-_cse129*_cse58 + _cse130*_cse62) + z*(_cse102 + _cse104 - 0.234017800844203*_cse115 + 0.234017800844203*_cse116*_cse19 - 0.137106991283212*_cse118 - 0.227149603970304*_cse119 - 0.227149603970304*_cse120 - 0.137106991283212*_cse121 + 0.410879747*_cse122*_cse46 - 0.410149995883665*_cse123 - 0.209584432*_cse125 + 0.410149995883665*_cse126*_cse45 + 0.410879747*_cse126*_cse52 - 0.209584432*_cse128)
+    out[0, 3] = _cse132*_cse38 - 0.0627091097210817*_cse133 + _cse135*_cse37 - 0.0627091097210817*_cse136 - 0.0290982758960988*_cse138 - 0.0290982758960988*_cse139 - 0.0491638727803817*_cse140 - 0.0491638727803817*_cse141 + _cse142*_cse49 - 0.0499969558686132*_cse143 + 0.03790017976*_cse144 - 0.01872015456*_cse145 + 0.0499969558686132*_cse146*_cse45 + _cse146*_cse56 + 0.03790017976*_cse147 - 0.01872015456*_cse148 + x*(-_cse149*_cse62 - _cse150*_cse58) + y*(-_cse149*_cse58 + _cse150*_cse62) + z*(-0.234017800844203*_cse133 - 0.234017800844203*_cse136 - 0.137106991283212*_cse138 - 0.137106991283212*_cse139 - 0.227149603970304*_cse140 - 0.227149603970304*_cse141 + 0.410879747*_cse142*_cse46 - 0.410149995883665*_cse143 - 0.209584432*_cse145 + 0.410149995883665*_cse146*_cse45 + 0.410879747*_cse146*_cse52 - 0.209584432*_cse148)
+    out[0, 4] = _cse157*_cse55 - 0.0499969558686132*_cse158 - 0.01872015456*_cse160 + 0.03790017976*_cse162 + _cse167*_cse49 - 0.0499969558686132*_cse168 + 0.03790017976*_cse169 - 0.01872015456*_cse170 + x*(-_cse171*_cse62 - _cse172*_cse58) + y*(-_cse171*_cse58 + _cse172*_cse62) + z*(0.410879747*_cse157*_cse161 - 0.410149995883665*_cse158 - 0.209584432*_cse160 + 0.410879747*_cse167*_cse46 - 0.410149995883665*_cse168 - 0.209584432*_cse170)
+    out[0, 5] = x*(_cse179*_cse58 - _cse183*_cse62) + y*(-_cse179*_cse62 - _cse183*_cse58)
+    out[1, 0] = 0.0068032576553314*_cse0 - _cse1*_cse12 + _cse1*_cse13 - _cse1*_cse16 - _cse1*_cse18 - _cse1*_cse3 + 1.098e-6*_cse1*_cse4 - _cse1*_cse7 - 4.3259e-5*_cse1 + _cse131*_cse37 + _cse134*_cse39 + 0.0627091097210817*_cse184 - 0.0627091097210817*_cse185 - 0.0491638727803817*_cse186 - 0.0290982758960988*_cse187 - 0.0491638727803817*_cse188 - 0.0290982758960988*_cse189 + _cse190*_cse49 - 0.0499969558686132*_cse191 + 0.03790017976*_cse192 - 0.01872015456*_cse193 + 0.0499969558686132*_cse194*_cse45 + _cse194*_cse56 + 0.03790017976*_cse195 - 0.01872015456*_cse196 + 0.253888422522456*_cse70 - 0.253888422522456*_cse72 + x*(-_cse198*_cse62 - _cse199*_cse58) + y*(-_cse198*_cse58 + _cse199*_cse62) + z*(0.329365488408814*_cse1*_cse2*_cse8 + 0.234017800844203*_cse134*_cse19 - 0.234017800844203*_cse185 - 0.227149603970304*_cse186 - 0.137106991283212*_cse187 - 0.227149603970304*_cse188 - 0.137106991283212*_cse189 + 0.410879747*_cse190*_cse46 - 0.410149995883665*_cse191 - 0.209584432*_cse193 + 0.410149995883665*_cse194*_cse45 + 0.410879747*_cse194*_cse52 - 0.209584432*_cse196 - _cse197)
+    out[1, 1] = _cse0*_cse75 - _cse15*_cse9 + _cse201*_cse39 + 0.0627091097210817*_cse202 + _cse204*_cse37 - 0.0290982758960988*_cse205 - 0.0290982758960988*_cse206 + _cse208*_cse49 + 0.03790017976*_cse209 - 0.0627091097210817*_cse212 - 0.0491638727803817*_cse213 - 0.0491638727803817*_cse214 + 0.0499969558686132*_cse215*_cse45 + _cse215*_cse56 + 0.03790017976*_cse216 - 0.01872015456*_cse217 - 0.01872015456*_cse218 - 0.0499969558686132*_cse226 + _cse228 - 1.098e-6*_cse41 - 0.20503*_cse9 + x*(-_cse220*_cse62 - _cse223*_cse58) + y*(-_cse220*_cse58 + _cse223*_cse62) + z*(0.234017800844203*_cse19*_cse201 - 0.137106991283212*_cse205 - 0.137106991283212*_cse206 + 0.410879747*_cse208*_cse46 - 0.234017800844203*_cse212 - 0.227149603970304*_cse213 - 0.227149603970304*_cse214 + 0.410149995883665*_cse215*_cse45 + 0.410879747*_cse215*_cse52 - 0.209584432*_cse217 - 0.209584432*_cse218 + _cse224 + _cse225 - 0.410149995883665*_cse226)
+    out[1, 2] = -_cse14*_cse9 + 0.0627091097210817*_cse19*_cse200 + _cse200*_cse39 + _cse203*_cse37 - _cse228 - 0.0491638727803817*_cse229 - 0.0491638727803817*_cse230 - 0.0627091097210817*_cse231 - 0.0290982758960988*_cse232 - 0.0290982758960988*_cse233 + 0.03790017976*_cse235*_cse46 + _cse235*_cse49 + 0.0499969558686132*_cse237*_cse45 + 0.03790017976*_cse237*_cse52 + _cse237*_cse56 - 0.01872015456*_cse239 - 0.01872015456*_cse240 - 0.0499969558686132*_cse243 + x*(-_cse241*_cse62 - _cse242*_cse58) + y*(-_cse241*_cse58 + _cse242*_cse62) + z*(0.234017800844203*_cse19*_cse200 - _cse224 - _cse225 - 0.227149603970304*_cse229 - 0.227149603970304*_cse230 - 0.234017800844203*_cse231 - 0.137106991283212*_cse232 - 0.137106991283212*_cse233 + 0.410879747*_cse235*_cse46 + 0.410149995883665*_cse237*_cse45 + 0.410879747*_cse237*_cse52 - 0.209584432*_cse239 - 0.209584432*_cse240 - 0.410149995883665*_cse243)
+    out[1, 3] = _cse22*_cse37 - 0.0627091097210817*_cse244 - 0.0627091097210817*_cse245 - 0.0290982758960988*_cse246 - 0.0290982758960988*_cse247 - 0.0491638727803817*_cse248 - 0.0491638727803817*_cse249 + _cse250*_cse49 - 0.0499969558686132*_cse251 + 0.03790017976*_cse252 - 0.01872015456*_cse253 + 0.0499969558686132*_cse254*_cse45 + _cse254*_cse56 + 0.03790017976*_cse255 - 0.01872015456*_cse256 + _cse26*_cse38 + x*(-_cse257*_cse62 - _cse258*_cse58) + y*(-_cse257*_cse58 + _cse258*_cse62) + z*(-0.234017800844203*_cse244 - 0.234017800844203*_cse245 - 0.137106991283212*_cse246 - 0.137106991283212*_cse247 - 0.227149603970304*_cse248 - 0.227149603970304*_cse249 + 0.410879747*_cse250*_cse46 - 0.410149995883665*_cse251 - 0.209584432*_cse253 + 0.410149995883665*_cse254*_cse45 + 0.410879747*_cse254*_cse52 - 0.209584432*_cse256)
+    out[1, 4] = -0.0499969558686132*_cse259 - 0.01872015456*_cse260 + 0.03790017976*_cse261 - 0.0499969558686132*_cse262 + 0.03790017976*_cse263 - 0.01872015456*_cse264 + _cse43*_cse55 + _cse49*_cse51 + x*(-_cse265*_cse62 - _cse267*_cse58) + y*(-_cse265*_cse58 + _cse267*_cse62) + z*(0.410879747*_cse161*_cse43 - 0.410149995883665*_cse259 - 0.209584432*_cse260 - 0.410149995883665*_cse262 - 0.209584432*_cse264 + 0.410879747*_cse46*_cse51)
+    out[1, 5] = _cse64*x + _cse65*y
+    out[2, 0] = 0
+    out[2, 1] = _cse12 + _cse16 + _cse18 + 0.41405*_cse2 - _cse268 + _cse269 + _cse271*_cse37 - 0.0627091097210817*_cse272 + _cse274*_cse39 + 0.0627091097210817*_cse275 - 0.0290982758960988*_cse276 - 0.0491638727803817*_cse277 - 0.0491638727803817*_cse278 - 0.0290982758960988*_cse279 + _cse281*_cse49 - 0.0499969558686132*_cse282 + 0.03790017976*_cse283 - 0.01872015456*_cse284 + 0.0499969558686132*_cse287*_cse45 + _cse287*_cse56 + 0.03790017976*_cse288 - 0.01872015456*_cse289 + 0.001950802*_cse4 + _cse7 + x*(-_cse294*_cse62 - _cse297*_cse58) + y*(-_cse294*_cse58 + _cse297*_cse62) + z*(0.234017800844203*_cse19*_cse274 - 0.234017800844203*_cse272 - 0.137106991283212*_cse276 - 0.227149603970304*_cse277 - 0.227149603970304*_cse278 - 0.137106991283212*_cse279 + 0.410879747*_cse281*_cse46 - 0.410149995883665*_cse282 - 0.209584432*_cse284 + 0.410149995883665*_cse287*_cse45 + 0.410879747*_cse287*_cse52 - 0.209584432*_cse289 - _cse290 + _cse291)
+    out[2, 2] = -_cse12 + _cse14*_cse2 - _cse18 + _cse268 - _cse269 + _cse270*_cse37 + _cse273*_cse39 + 0.0627091097210817*_cse298 - 0.0627091097210817*_cse299 - 0.0491638727803817*_cse300 - 0.0290982758960988*_cse301 - 0.0290982758960988*_cse302 - 0.0491638727803817*_cse303 + _cse304*_cse49 - 0.0499969558686132*_cse305 + 0.03790017976*_cse306 - 0.01872015456*_cse307 + 0.0499969558686132*_cse308*_cse45 + _cse308*_cse56 + 0.03790017976*_cse309 - 0.01872015456*_cse310 - _cse7 + x*(-_cse311*_cse62 - _cse312*_cse58) + y*(-_cse311*_cse58 + _cse312*_cse62) + z*(0.234017800844203*_cse19*_cse273 + _cse290 - _cse291 - 0.234017800844203*_cse299 - 0.227149603970304*_cse300 - 0.137106991283212*_cse301 - 0.137106991283212*_cse302 - 0.227149603970304*_cse303 + 0.410879747*_cse304*_cse46 - 0.410149995883665*_cse305 - 0.209584432*_cse307 + 0.410149995883665*_cse308*_cse45 + 0.410879747*_cse308*_cse52 - 0.209584432*_cse310)
+    out[2, 3] = _cse313*_cse38 - 0.0627091097210817*_cse314 + _cse315*_cse37 - 0.0627091097210817*_cse316 - 0.0290982758960988*_cse317 - 0.0491638727803817*_cse318 - 0.0290982758960988*_cse319 - 0.0491638727803817*_cse320 + _cse321*_cse49 - 0.0499969558686132*_cse322 + 0.03790017976*_cse323 - 0.01872015456*_cse324 + 0.0499969558686132*_cse325*_cse45 + _cse325*_cse56 + 0.03790017976*_cse326 - 0.01872015456*_cse327 + x*(-_cse328*_cse62 - _cse329*_cse58) + y*(-_cse328*_cse58 + _cse329*_cse62) + z*(-0.234017800844203*_cse314 - 0.234017800844203*_cse316 - 0.137106991283212*_cse317 - 0.227149603970304*_cse318 - 0.137106991283212*_cse319 - 0.227149603970304*_cse320 + 0.410879747*_cse321*_cse46 - 0.410149995883665*_cse322 - 0.209584432*_cse324 + 0.410149995883665*_cse325*_cse45 + 0.410879747*_cse325*_cse52 - 0.209584432*_cse327)
+    out[2, 4] = _cse332*_cse55 - 0.0499969558686132*_cse333 - 0.01872015456*_cse334 + 0.03790017976*_cse335 + _cse340*_cse49 - 0.0499969558686132*_cse341 + 0.03790017976*_cse342 - 0.01872015456*_cse343 + x*(-_cse344*_cse62 - _cse345*_cse58) + y*(-_cse344*_cse58 + _cse345*_cse62) + z*(0.410879747*_cse161*_cse332 - 0.410149995883665*_cse333 - 0.209584432*_cse334 + 0.410879747*_cse340*_cse46 - 0.410149995883665*_cse341 - 0.209584432*_cse343)
+    out[2, 5] = x*(_cse350*_cse58 - _cse351*_cse62) + y*(-_cse350*_cse62 - _cse351*_cse58)
+    out[3, 0] = 0
+    out[3, 1] = -_cse0
+    out[3, 2] = _cse0
+    out[3, 3] = _cse70 - _cse72
+    out[3, 4] = 0.3960285*_cse153 + 0.239041914*_cse154 + 0.3960285*_cse155 + 0.239041914*_cse156 + 0.408002994597976*_cse165 - 0.408002994597976*_cse166 + 0.574238819026787*_cse70 - 0.574238819026787*_cse72
+    out[3, 5] = 0.227149603970304*_cse153 + 0.137106991283212*_cse154 + 0.227149603970304*_cse155 + 0.137106991283212*_cse156 + _cse157*_cse352 + 0.234017800844203*_cse165 - 0.234017800844203*_cse166 - _cse167*_cse353 - 0.410879747*_cse175 + 0.209584432*_cse176 - 0.410879747*_cse177 + 0.209584432*_cse178 - _cse197 + 0.329365488408814*_cse70
+    out[4, 0] = 0
+    out[4, 1] = -_cse1
+    out[4, 2] = _cse1
+    out[4, 3] = _cse0*_cse4*_cse5 - _cse42
+    out[4, 4] = 0.574238819026787*_cse10 + 0.408002994597976*_cse27 + 0.3960285*_cse30 + 0.239041914*_cse32 + 0.3960285*_cse34 + 0.239041914*_cse36 - 0.574238819026787*_cse42 - 0.408002994597976*_cse50
+    out[4, 5] = _cse57
+    out[5, 0] = -1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = -_cse11 - _cse6
+    out[5, 4] = -0.574238819026787*_cse11 + 0.239041914*_cse330 + 0.239041914*_cse331 + 0.408002994597976*_cse336 - 0.408002994597976*_cse337 + 0.3960285*_cse338 + 0.3960285*_cse339 - 0.574238819026787*_cse6
+    out[5, 5] = -_cse101 - _cse103 + 0.137106991283212*_cse330 + 0.137106991283212*_cse331 + _cse332*_cse352 + 0.234017800844203*_cse336 - 0.234017800844203*_cse337 + 0.227149603970304*_cse338 + 0.227149603970304*_cse339 - _cse340*_cse353 - 0.410879747*_cse346 + 0.209584432*_cse347 - 0.410879747*_cse348 + 0.209584432*_cse349
+    return out
+
+
+# EE_dJ
+def function47(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q5)
+    _cse1 = math.cos(q0)
+    _cse2 = 6.57617443000635e-7*_cse1
+    _cse3 = math.sin(q0)
+    _cse4 = 0.999999998572139*_cse3
+    _cse5 = math.sin(q1)
+    _cse6 = math.sin(q2)
+    _cse7 = _cse5*_cse6
+    _cse8 = math.cos(q1)
+    _cse9 = math.cos(q2)
+    _cse10 = _cse8*_cse9
+    _cse11 = _cse10*_cse4 + _cse4*_cse7
+    _cse12 = _cse11 - _cse2
+    _cse13 = math.sin(q3)
+    _cse14 = math.cos(q3)
+    _cse15 = 0.75940555*_cse13 - 0.51802699*_cse14
+    _cse16 = _cse12*_cse15
+    _cse17 = 0.999999998572139*_cse1
+    _cse18 = 6.57617443000635e-7*_cse3
+    _cse19 = _cse10*_cse18 + _cse18*_cse7
+    _cse20 = _cse17 + _cse19
+    _cse21 = 0.51802699*_cse13 + 0.75940555*_cse14
+    _cse22 = -_cse21
+    _cse23 = _cse20*_cse22
+    _cse24 = _cse12*_cse13
+    _cse25 = 1.9561995392714e-6*_cse24
+    _cse26 = 0.45991232*_cse13 + 0.85536427*_cse14
+    _cse27 = _cse12*_cse26
+    _cse28 = 0.85536427*_cse13 - 0.45991232*_cse14
+    _cse29 = _cse20*_cse28
+    _cse30 = _cse14*_cse20
+    _cse31 = 1.9561995392714e-6*_cse30
+    _cse32 = _cse6*_cse8
+    _cse33 = 0.000346321299837637*_cse32
+    _cse34 = _cse3*_cse33
+    _cse35 = _cse5*_cse9
+    _cse36 = 0.000346321299837637*_cse35
+    _cse37 = _cse3*_cse36
+    _cse38 = _cse34 - _cse37
+    _cse39 = 0.517383113*_cse16 + 0.517383113*_cse23 - 0.855753802*_cse27 - 0.855753802*_cse29 + _cse38
+    _cse40 = math.sin(q4)
+    _cse41 = math.cos(q4)
+    _cse42 = 0.78972966*_cse40 - 0.45479896*_cse41
+    _cse43 = -_cse42
+    _cse44 = _cse39*_cse43
+    _cse45 = 0.212878838804554*_cse30
+    _cse46 = 0.212878838804554*_cse24
+    _cse47 = 0.818687841791724*_cse35
+    _cse48 = _cse3*_cse47
+    _cse49 = 0.818687841791724*_cse32
+    _cse50 = _cse3*_cse49
+    _cse51 = _cse48 - _cse50
+    _cse52 = 0.758601438*_cse16 + 0.758601438*_cse23 + 0.458851168*_cse27 + 0.458851168*_cse29 + _cse45 - _cse46 + _cse51
+    _cse53 = 0.45479896*_cse40 + 0.78972966*_cse41
+    _cse54 = _cse52*_cse53
+    _cse55 = 0.40329059*_cse40 + 0.89059413*_cse41
+    _cse56 = _cse39*_cse55
+    _cse57 = 0.89059413*_cse40 - 0.40329059*_cse41
+    _cse58 = _cse52*_cse57
+    _cse59 = 2.75322908921405e-6*_cse32
+    _cse60 = _cse3*_cse59
+    _cse61 = 2.75322908921405e-6*_cse35
+    _cse62 = _cse3*_cse61
+    _cse63 = _cse60 - _cse62
+    _cse64 = 1.8987869684628e-6*_cse16 + 1.8987869684628e-6*_cse23 + _cse25 + 1.14610355371469e-6*_cse27 + 1.14610355371469e-6*_cse29 - _cse31 - 0.45478971*_cse44 - 0.45478971*_cse54 - 0.890598824*_cse56 - 0.890598824*_cse58 + _cse63
+    _cse65 = math.cos(q5)
+    _cse66 = 0.334218649384678*_cse24
+    _cse67 = 0.334218649384678*_cse30
+    _cse68 = 0.213215245107779*_cse40
+    _cse69 = 0.213215245107779*_cse41
+    _cse70 = _cse39*_cse68 - _cse52*_cse69
+    _cse71 = 0.470391945795628*_cse32
+    _cse72 = _cse3*_cse71
+    _cse73 = 0.470391945795628*_cse35
+    _cse74 = _cse3*_cse73
+    _cse75 = _cse72 - _cse74
+    _cse76 = -0.324409654194476*_cse16 - 0.324409654194476*_cse23 - 0.19581293936857*_cse27 - 0.19581293936857*_cse29 + 0.403618758*_cse39*_cse55 - 0.790154512*_cse44 + 0.403618758*_cse52*_cse57 - 0.790154512*_cse54 - _cse66 + _cse67 - _cse70 - _cse75
+    _cse77 = _cse0*_cse64 - _cse65*_cse76
+    _cse78 = _cse0*_cse76 + _cse64*_cse65
+    _cse79 = _cse77*x - _cse78*y
+    _cse80 = _cse39*_cse41
+    _cse81 = 0.00052974*_cse40 - 0.012272*_cse41
+    _cse82 = -_cse57
+    _cse83 = _cse39*_cse82
+    _cse84 = -_cse53
+    _cse85 = _cse39*_cse84
+    _cse86 = _cse40*_cse52
+    _cse87 = 0.012272*_cse40 + 0.00052974*_cse41
+    _cse88 = -_cse87
+    _cse89 = _cse43*_cse52
+    _cse90 = _cse52*_cse55
+    _cse91 = -0.410879747*_cse39*_cse84 - 0.410879747*_cse43*_cse52 + 0.410149995883665*_cse80 + 0.209584432*_cse83 + 0.410149995883665*_cse86 + 0.209584432*_cse90
+    _cse92 = -0.890598824*_cse83 - 0.45478971*_cse85 - 0.45478971*_cse89 - 0.890598824*_cse90
+    _cse93 = 0.403618758*_cse39*_cse82 + 0.403618758*_cse52*_cse55 - 0.213215245107779*_cse80 - 0.790154512*_cse85 - 0.213215245107779*_cse86 - 0.790154512*_cse89
+    _cse94 = _cse0*_cse92 - _cse65*_cse93
+    _cse95 = -_cse0*_cse93 - _cse65*_cse92
+    _cse96 = _cse39*_cse81 + _cse52*_cse88 - 0.0499969558686132*_cse80 - 0.01872015456*_cse83 + 0.03790017976*_cse85 - 0.0499969558686132*_cse86 + 0.03790017976*_cse89 - 0.01872015456*_cse90 - _cse91*z - _cse94*y + _cse95*x
+    _cse97 = -0.999999998572139*_cse3*_cse6*_cse8 + _cse35*_cse4
+    _cse98 = _cse15*_cse97
+    _cse99 = _cse18*_cse35 - 6.57617443000635e-7*_cse3*_cse6*_cse8
+    _cse100 = _cse22*_cse99
+    _cse101 = _cse13*_cse97
+    _cse102 = _cse26*_cse97
+    _cse103 = _cse28*_cse99
+    _cse104 = _cse14*_cse99
+    _cse105 = _cse3*_cse8
+    _cse106 = _cse105*_cse9
+    _cse107 = _cse3*_cse5
+    _cse108 = _cse107*_cse6
+    _cse109 = 0.000346321299837637*_cse106 + 0.000346321299837637*_cse108
+    _cse110 = 0.517383113*_cse100 - 0.855753802*_cse102 - 0.855753802*_cse103 + _cse109 + 0.517383113*_cse98
+    _cse111 = _cse110*_cse43
+    _cse112 = 0.818687841791724*_cse108
+    _cse113 = 0.818687841791724*_cse106
+    _cse114 = 0.758601438*_cse100 - 0.212878838804554*_cse101 + 0.458851168*_cse102 + 0.458851168*_cse103 + 0.212878838804554*_cse104 - _cse112 - _cse113 + 0.758601438*_cse98
+    _cse115 = _cse114*_cse53
+    _cse116 = _cse110*_cse55
+    _cse117 = _cse114*_cse57
+    _cse118 = 2.75322908921405e-6*_cse106 + 2.75322908921405e-6*_cse108
+    _cse119 = 1.8987869684628e-6*_cse100 + 1.9561995392714e-6*_cse101 + 1.14610355371469e-6*_cse102 + 1.14610355371469e-6*_cse103 - 1.9561995392714e-6*_cse104 - 0.45478971*_cse111 - 0.45478971*_cse115 - 0.890598824*_cse116 - 0.890598824*_cse117 + _cse118 + 1.8987869684628e-6*_cse98
+    _cse120 = 0.470391945795628*_cse108
+    _cse121 = 0.470391945795628*_cse106
+    _cse122 = _cse110*_cse40
+    _cse123 = -0.324409654194476*_cse100 - 0.334218649384678*_cse101 - 0.19581293936857*_cse102 - 0.19581293936857*_cse103 + 0.403618758*_cse110*_cse55 - 0.790154512*_cse111 + 0.213215245107779*_cse114*_cse41 + 0.403618758*_cse114*_cse57 - 0.790154512*_cse115 - _cse120 - _cse121 - 0.213215245107779*_cse122 + 0.334218649384678*_cse14*_cse99 - 0.324409654194476*_cse98
+    _cse124 = -_cse0*_cse123 - _cse119*_cse65
+    _cse125 = _cse0*_cse119 - _cse123*_cse65
+    _cse126 = 0.329365488408814*_cse108
+    _cse127 = 0.329365488408814*_cse106
+    _cse128 = 0.227149603970304*_cse100 + 0.234017800844203*_cse101 + 0.137106991283212*_cse102 + 0.137106991283212*_cse103 - 0.410879747*_cse110*_cse43 - 0.410149995883665*_cse114*_cse41 - 0.410879747*_cse114*_cse53 + 0.209584432*_cse116 + 0.209584432*_cse117 + 0.410149995883665*_cse122 + _cse126 + _cse127 - 0.234017800844203*_cse14*_cse99 + 0.227149603970304*_cse98
+    _cse129 = -_cse81
+    _cse130 = 0.00040053*_cse13 - 0.012581*_cse14
+    _cse131 = -_cse130
+    _cse132 = 0.012581*_cse13 + 0.00040053*_cse14
+    _cse133 = -_cse132
+    _cse134 = 0.00048786*_cse6 + 0.081945*_cse9
+    _cse135 = _cse134*_cse8
+    _cse136 = 0.081945*_cse6 - 0.00048786*_cse9
+    _cse137 = _cse136*_cse5
+    _cse138 = 0.0038906673398998*_cse35
+    _cse139 = 0.0038906673398998*_cse32
+    _cse140 = 0.253888422522456*_cse106 + 0.253888422522456*_cse108 + _cse137*_cse3 + _cse138*_cse3 - _cse139*_cse3
+    _cse141 = -0.0491638727803817*_cse100 - 0.0627091097210817*_cse101 - 0.0290982758960988*_cse102 - 0.0290982758960988*_cse103 + 0.03790017976*_cse110*_cse43 + _cse110*_cse88 + _cse114*_cse129 + 0.0499969558686132*_cse114*_cse41 + 0.03790017976*_cse114*_cse53 - 0.01872015456*_cse116 - 0.01872015456*_cse117 - 0.0499969558686132*_cse122 + _cse124*x - _cse125*y - _cse128*z + _cse131*_cse99 + _cse133*_cse97 - _cse135*_cse3 + 0.0627091097210817*_cse14*_cse99 - _cse140 - 0.0491638727803817*_cse98
+    _cse142 = -_cse99
+    _cse143 = _cse14*_cse142
+    _cse144 = -_cse97
+    _cse145 = _cse144*_cse26
+    _cse146 = _cse142*_cse28
+    _cse147 = -_cse109 + 0.517383113*_cse142*_cse22 + 0.517383113*_cse144*_cse15 - 0.855753802*_cse145 - 0.855753802*_cse146
+    _cse148 = _cse147*_cse43
+    _cse149 = _cse13*_cse144
+    _cse150 = _cse144*_cse15
+    _cse151 = _cse142*_cse22
+    _cse152 = _cse112 + _cse113 + 0.212878838804554*_cse143 + 0.458851168*_cse145 + 0.458851168*_cse146 - 0.212878838804554*_cse149 + 0.758601438*_cse150 + 0.758601438*_cse151
+    _cse153 = _cse152*_cse53
+    _cse154 = _cse147*_cse55
+    _cse155 = _cse152*_cse57
+    _cse156 = -_cse118 + 1.9561995392714e-6*_cse13*_cse144 + 1.8987869684628e-6*_cse142*_cse22 + 1.14610355371469e-6*_cse142*_cse28 - 1.9561995392714e-6*_cse143 + 1.8987869684628e-6*_cse144*_cse15 + 1.14610355371469e-6*_cse144*_cse26 - 0.45478971*_cse148 - 0.45478971*_cse153 - 0.890598824*_cse154 - 0.890598824*_cse155
+    _cse157 = _cse147*_cse40
+    _cse158 = _cse120 + _cse121 + 0.334218649384678*_cse14*_cse142 - 0.19581293936857*_cse145 - 0.19581293936857*_cse146 + 0.403618758*_cse147*_cse55 - 0.790154512*_cse148 - 0.334218649384678*_cse149 - 0.324409654194476*_cse150 - 0.324409654194476*_cse151 + 0.213215245107779*_cse152*_cse41 + 0.403618758*_cse152*_cse57 - 0.790154512*_cse153 - 0.213215245107779*_cse157
+    _cse159 = -_cse0*_cse158 - _cse156*_cse65
+    _cse160 = _cse0*_cse156 - _cse158*_cse65
+    _cse161 = -_cse126 - _cse127 - 0.234017800844203*_cse14*_cse142 + 0.137106991283212*_cse145 + 0.137106991283212*_cse146 - 0.410879747*_cse147*_cse43 + 0.234017800844203*_cse149 + 0.227149603970304*_cse150 + 0.227149603970304*_cse151 - 0.410149995883665*_cse152*_cse41 - 0.410879747*_cse152*_cse53 + 0.209584432*_cse154 + 0.209584432*_cse155 + 0.410149995883665*_cse157
+    _cse162 = 0.0019519*_cse5 - 0.20902*_cse8
+    _cse163 = -_cse134
+    _cse164 = _cse163*_cse8
+    _cse165 = -0.20503*_cse105 - 1.098e-6*_cse107 + _cse129*_cse152 + _cse131*_cse142 + _cse133*_cse144 + _cse140 + 0.0627091097210817*_cse143 - 0.0290982758960988*_cse145 - 0.0290982758960988*_cse146 + _cse147*_cse88 + 0.03790017976*_cse148 - 0.0627091097210817*_cse149 - 0.0491638727803817*_cse150 - 0.0491638727803817*_cse151 + 0.0499969558686132*_cse152*_cse41 + 0.03790017976*_cse153 - 0.01872015456*_cse154 - 0.01872015456*_cse155 - 0.0499969558686132*_cse157 + _cse159*x - _cse160*y - _cse161*z + _cse162*_cse3 - _cse164*_cse3
+    _cse166 = _cse13*_cse20
+    _cse167 = _cse12*_cse14
+    _cse168 = -_cse28
+    _cse169 = _cse12*_cse168
+    _cse170 = _cse20*_cse26
+    _cse171 = _cse12*_cse21
+    _cse172 = _cse15*_cse20
+    _cse173 = 0.517383113*_cse12*_cse21 + 0.517383113*_cse15*_cse20 - 0.855753802*_cse169 - 0.855753802*_cse170
+    _cse174 = _cse173*_cse40
+    _cse175 = _cse173*_cse43
+    _cse176 = _cse173*_cse55
+    _cse177 = -0.212878838804554*_cse166 - 0.212878838804554*_cse167 + 0.458851168*_cse169 + 0.458851168*_cse170 + 0.758601438*_cse171 + 0.758601438*_cse172
+    _cse178 = _cse177*_cse53
+    _cse179 = _cse177*_cse57
+    _cse180 = 0.234017800844203*_cse166 + 0.234017800844203*_cse167 + 0.137106991283212*_cse169 + 0.137106991283212*_cse170 + 0.227149603970304*_cse171 + 0.227149603970304*_cse172 - 0.410879747*_cse173*_cse43 + 0.410149995883665*_cse174 + 0.209584432*_cse176 - 0.410149995883665*_cse177*_cse41 - 0.410879747*_cse177*_cse53 + 0.209584432*_cse179
+    _cse181 = 1.9561995392714e-6*_cse166 + 1.9561995392714e-6*_cse167 + 1.14610355371469e-6*_cse169 + 1.14610355371469e-6*_cse170 + 1.8987869684628e-6*_cse171 + 1.8987869684628e-6*_cse172 - 0.45478971*_cse175 - 0.890598824*_cse176 - 0.45478971*_cse178 - 0.890598824*_cse179
+    _cse182 = -0.334218649384678*_cse166 - 0.334218649384678*_cse167 - 0.19581293936857*_cse169 - 0.19581293936857*_cse170 - 0.324409654194476*_cse171 - 0.324409654194476*_cse172 + 0.403618758*_cse173*_cse55 - 0.213215245107779*_cse174 - 0.790154512*_cse175 + 0.213215245107779*_cse177*_cse41 + 0.403618758*_cse177*_cse57 - 0.790154512*_cse178
+    _cse183 = _cse0*_cse181 - _cse182*_cse65
+    _cse184 = -_cse0*_cse182 - _cse181*_cse65
+    _cse185 = _cse12*_cse130 + _cse129*_cse177 + _cse133*_cse20 - 0.0627091097210817*_cse166 - 0.0627091097210817*_cse167 - 0.0290982758960988*_cse169 - 0.0290982758960988*_cse170 - 0.0491638727803817*_cse171 - 0.0491638727803817*_cse172 + _cse173*_cse88 - 0.0499969558686132*_cse174 + 0.03790017976*_cse175 - 0.01872015456*_cse176 + 0.0499969558686132*_cse177*_cse41 + 0.03790017976*_cse178 - 0.01872015456*_cse179 - _cse180*z - _cse183*y + _cse184*x
+    _cse186 = _cse10*_cse17 + _cse17*_cse7
+    _cse187 = _cse18 + _cse186
+    _cse188 = _cse15*_cse187
+    _cse189 = _cse10*_cse2 + _cse2*_cse7
+    _cse190 = _cse189 - _cse4
+    _cse191 = _cse190*_cse22
+    _cse192 = _cse13*_cse187
+    _cse193 = _cse187*_cse26
+    _cse194 = _cse190*_cse28
+    _cse195 = _cse14*_cse190
+    _cse196 = _cse1*_cse33
+    _cse197 = _cse1*_cse36
+    _cse198 = _cse196 - _cse197
+    _cse199 = 0.517383113*_cse188 + 0.517383113*_cse191 - 0.855753802*_cse193 - 0.855753802*_cse194 + _cse198
+    _cse200 = _cse199*_cse43
+    _cse201 = _cse1*_cse47
+    _cse202 = _cse1*_cse49
+    _cse203 = _cse201 - _cse202
+    _cse204 = 0.758601438*_cse188 + 0.758601438*_cse191 - 0.212878838804554*_cse192 + 0.458851168*_cse193 + 0.458851168*_cse194 + 0.212878838804554*_cse195 + _cse203
+    _cse205 = _cse204*_cse53
+    _cse206 = _cse199*_cse55
+    _cse207 = _cse204*_cse57
+    _cse208 = _cse1*_cse59
+    _cse209 = _cse1*_cse61
+    _cse210 = _cse208 - _cse209
+    _cse211 = 1.8987869684628e-6*_cse188 + 1.8987869684628e-6*_cse191 + 1.9561995392714e-6*_cse192 + 1.14610355371469e-6*_cse193 + 1.14610355371469e-6*_cse194 - 1.9561995392714e-6*_cse195 - 0.45478971*_cse200 - 0.45478971*_cse205 - 0.890598824*_cse206 - 0.890598824*_cse207 + _cse210
+    _cse212 = _cse199*_cse40
+    _cse213 = _cse1*_cse71
+    _cse214 = _cse1*_cse73
+    _cse215 = _cse213 - _cse214
+    _cse216 = 0.334218649384678*_cse14*_cse190 - 0.324409654194476*_cse188 - 0.324409654194476*_cse191 - 0.334218649384678*_cse192 - 0.19581293936857*_cse193 - 0.19581293936857*_cse194 + 0.403618758*_cse199*_cse55 - 0.790154512*_cse200 + 0.213215245107779*_cse204*_cse41 + 0.403618758*_cse204*_cse57 - 0.790154512*_cse205 - 0.213215245107779*_cse212 - _cse215
+    _cse217 = -_cse0*_cse216 - _cse211*_cse65
+    _cse218 = _cse0*_cse211 - _cse216*_cse65
+    _cse219 = _cse1*_cse32
+    _cse220 = 0.329365488408814*_cse219
+    _cse221 = _cse1*_cse35
+    _cse222 = 0.329365488408814*_cse221
+    _cse223 = _cse220 - _cse222
+    _cse224 = -0.234017800844203*_cse14*_cse190 + 0.227149603970304*_cse188 + 0.227149603970304*_cse191 + 0.234017800844203*_cse192 + 0.137106991283212*_cse193 + 0.137106991283212*_cse194 - 0.410879747*_cse199*_cse43 - 0.410149995883665*_cse204*_cse41 - 0.410879747*_cse204*_cse53 + 0.209584432*_cse206 + 0.209584432*_cse207 + 0.410149995883665*_cse212 + _cse223
+    _cse225 = 0.20902*_cse5 + 0.0019519*_cse8
+    _cse226 = -_cse225
+    _cse227 = _cse1*_cse8
+    _cse228 = _cse1*_cse5
+    _cse229 = 0.20503*_cse228
+    _cse230 = _cse136*_cse227
+    _cse231 = _cse163*_cse228
+    _cse232 = 0.253888422522456*_cse221
+    _cse233 = _cse227*_cse9
+    _cse234 = 0.0038906673398998*_cse233
+    _cse235 = _cse228*_cse6
+    _cse236 = 0.0038906673398998*_cse235
+    _cse237 = 0.253888422522456*_cse219
+    _cse238 = _cse232 - _cse234 - _cse236 - _cse237
+    _cse239 = -_cse17*_cse32 + _cse17*_cse35
+    _cse240 = _cse15*_cse239
+    _cse241 = -_cse2*_cse32 + _cse2*_cse35
+    _cse242 = _cse22*_cse241
+    _cse243 = _cse13*_cse239
+    _cse244 = _cse239*_cse26
+    _cse245 = _cse241*_cse28
+    _cse246 = _cse14*_cse241
+    _cse247 = 0.000346321299837637*_cse233 + 0.000346321299837637*_cse235
+    _cse248 = 0.517383113*_cse240 + 0.517383113*_cse242 - 0.855753802*_cse244 - 0.855753802*_cse245 + _cse247
+    _cse249 = _cse248*_cse43
+    _cse250 = 0.818687841791724*_cse235
+    _cse251 = 0.818687841791724*_cse233
+    _cse252 = 0.758601438*_cse240 + 0.758601438*_cse242 - 0.212878838804554*_cse243 + 0.458851168*_cse244 + 0.458851168*_cse245 + 0.212878838804554*_cse246 - _cse250 - _cse251
+    _cse253 = _cse252*_cse53
+    _cse254 = _cse248*_cse55
+    _cse255 = _cse252*_cse57
+    _cse256 = 2.75322908921405e-6*_cse233 + 2.75322908921405e-6*_cse235
+    _cse257 = 1.8987869684628e-6*_cse240 + 1.8987869684628e-6*_cse242 + 1.9561995392714e-6*_cse243 + 1.14610355371469e-6*_cse244 + 1.14610355371469e-6*_cse245 - 1.9561995392714e-6*_cse246 - 0.45478971*_cse249 - 0.45478971*_cse253 - 0.890598824*_cse254 - 0.890598824*_cse255 + _cse256
+    _cse258 = 0.470391945795628*_cse235
+    _cse259 = 0.470391945795628*_cse233
+    _cse260 = 0.334218649384678*_cse14*_cse241 - 0.324409654194476*_cse240 - 0.324409654194476*_cse242 - 0.334218649384678*_cse243 - 0.19581293936857*_cse244 - 0.19581293936857*_cse245 + 0.403618758*_cse248*_cse55 - _cse248*_cse68 - 0.790154512*_cse249 + 0.213215245107779*_cse252*_cse41 + 0.403618758*_cse252*_cse57 - 0.790154512*_cse253 - _cse258 - _cse259
+    _cse261 = _cse0*_cse257 - _cse260*_cse65
+    _cse262 = -_cse0*_cse260 - _cse257*_cse65
+    _cse263 = _cse261*x + _cse262*y
+    _cse264 = _cse248*_cse41
+    _cse265 = _cse248*_cse82
+    _cse266 = _cse248*_cse84
+    _cse267 = _cse252*_cse40
+    _cse268 = _cse252*_cse43
+    _cse269 = _cse252*_cse55
+    _cse270 = -0.890598824*_cse265 - 0.45478971*_cse266 - 0.45478971*_cse268 - 0.890598824*_cse269
+    _cse271 = -_cse248*_cse69 + 0.403618758*_cse248*_cse82 + 0.403618758*_cse252*_cse55 - _cse252*_cse68 - 0.790154512*_cse266 - 0.790154512*_cse268
+    _cse272 = _cse248*_cse81 + _cse252*_cse88 - 0.0499969558686132*_cse264 - 0.01872015456*_cse265 + 0.03790017976*_cse266 - 0.0499969558686132*_cse267 + 0.03790017976*_cse268 - 0.01872015456*_cse269 + x*(-_cse0*_cse271 - _cse270*_cse65) + y*(-_cse0*_cse270 + _cse271*_cse65) + z*(0.410879747*_cse248*_cse84 + 0.410879747*_cse252*_cse43 - 0.410149995883665*_cse264 - 0.209584432*_cse265 - 0.410149995883665*_cse267 - 0.209584432*_cse269)
+    _cse273 = _cse13*_cse241
+    _cse274 = _cse14*_cse239
+    _cse275 = _cse241*_cse26
+    _cse276 = _cse15*_cse241
+    _cse277 = _cse168*_cse239
+    _cse278 = _cse21*_cse239
+    _cse279 = 0.517383113*_cse15*_cse241 + 0.517383113*_cse21*_cse239 - 0.855753802*_cse275 - 0.855753802*_cse277
+    _cse280 = _cse279*_cse40
+    _cse281 = _cse279*_cse43
+    _cse282 = _cse279*_cse55
+    _cse283 = -0.212878838804554*_cse273 - 0.212878838804554*_cse274 + 0.458851168*_cse275 + 0.758601438*_cse276 + 0.458851168*_cse277 + 0.758601438*_cse278
+    _cse284 = _cse283*_cse53
+    _cse285 = _cse283*_cse57
+    _cse286 = 1.9561995392714e-6*_cse273 + 1.9561995392714e-6*_cse274 + 1.14610355371469e-6*_cse275 + 1.8987869684628e-6*_cse276 + 1.14610355371469e-6*_cse277 + 1.8987869684628e-6*_cse278 - 0.45478971*_cse281 - 0.890598824*_cse282 - 0.45478971*_cse284 - 0.890598824*_cse285
+    _cse287 = -0.334218649384678*_cse273 - 0.334218649384678*_cse274 - 0.19581293936857*_cse275 - 0.324409654194476*_cse276 - 0.19581293936857*_cse277 - 0.324409654194476*_cse278 + 0.403618758*_cse279*_cse55 - _cse279*_cse68 - 0.790154512*_cse281 + 0.213215245107779*_cse283*_cse41 + 0.403618758*_cse283*_cse57 - 0.790154512*_cse284
+    _cse288 = _cse129*_cse283 + _cse130*_cse239 + _cse133*_cse241 - 0.0627091097210817*_cse273 - 0.0627091097210817*_cse274 - 0.0290982758960988*_cse275 - 0.0491638727803817*_cse276 - 0.0290982758960988*_cse277 - 0.0491638727803817*_cse278 + _cse279*_cse88 - 0.0499969558686132*_cse280 + 0.03790017976*_cse281 - 0.01872015456*_cse282 + 0.0499969558686132*_cse283*_cse41 + 0.03790017976*_cse284 - 0.01872015456*_cse285 + x*(-_cse0*_cse287 - _cse286*_cse65) + y*(-_cse0*_cse286 + _cse287*_cse65) + z*(-0.234017800844203*_cse273 - 0.234017800844203*_cse274 - 0.137106991283212*_cse275 - 0.227149603970304*_cse276 - 0.137106991283212*_cse277 - 0.227149603970304*_cse278 + 0.410879747*_cse279*_cse43 - 0.410149995883665*_cse280 - 0.209584432*_cse282 + 0.410149995883665*_cse283*_cse41 + 0.410879747*_cse283*_cse53 - 0.209584432*_cse285)
+    _cse289 = -_cse186
+    _cse290 = _cse15*_cse289
+    _cse291 = -_cse189
+    _cse292 = _cse22*_cse291
+    _cse293 = _cse13*_cse289
+    _cse294 = _cse26*_cse289
+    _cse295 = _cse28*_cse291
+    _cse296 = _cse14*_cse291
+    _cse297 = 0.517383113*_cse15*_cse289 - _cse198 + 0.517383113*_cse22*_cse291 - 0.855753802*_cse294 - 0.855753802*_cse295
+    _cse298 = _cse297*_cse43
+    _cse299 = -_cse201 + _cse202
+    _cse300 = 0.758601438*_cse290 + 0.758601438*_cse292 - 0.212878838804554*_cse293 + 0.458851168*_cse294 + 0.458851168*_cse295 + 0.212878838804554*_cse296 + _cse299
+    _cse301 = _cse300*_cse53
+    _cse302 = _cse297*_cse55
+    _cse303 = _cse300*_cse57
+    _cse304 = -_cse208 + _cse209
+    _cse305 = 1.8987869684628e-6*_cse290 + 1.8987869684628e-6*_cse292 + 1.9561995392714e-6*_cse293 + 1.14610355371469e-6*_cse294 + 1.14610355371469e-6*_cse295 - 1.9561995392714e-6*_cse296 - 0.45478971*_cse298 - 0.45478971*_cse301 - 0.890598824*_cse302 - 0.890598824*_cse303 + _cse304
+    _cse306 = -_cse213 + _cse214
+    _cse307 = 0.334218649384678*_cse14*_cse291 - 0.324409654194476*_cse290 - 0.324409654194476*_cse292 - 0.334218649384678*_cse293 - 0.19581293936857*_cse294 - 0.19581293936857*_cse295 + 0.403618758*_cse297*_cse55 - _cse297*_cse68 - 0.790154512*_cse298 + 0.213215245107779*_cse300*_cse41 + 0.403618758*_cse300*_cse57 - 0.790154512*_cse301 - _cse306
+    _cse308 = _cse297*_cse40
+    _cse309 = _cse134*_cse228
+    _cse310 = _cse230 - _cse232 + _cse234 + _cse236 + _cse237
+    _cse311 = _cse129*_cse300 + _cse131*_cse291 + _cse133*_cse289 - 0.0491638727803817*_cse290 - 0.0491638727803817*_cse292 - 0.0627091097210817*_cse293 - 0.0290982758960988*_cse294 - 0.0290982758960988*_cse295 + 0.0627091097210817*_cse296 + _cse297*_cse88 + 0.03790017976*_cse298 + 0.0499969558686132*_cse300*_cse41 + 0.03790017976*_cse301 - 0.01872015456*_cse302 - 0.01872015456*_cse303 - 0.0499969558686132*_cse308 - _cse309 + _cse310 + x*(-_cse0*_cse307 - _cse305*_cse65) + y*(-_cse0*_cse305 + _cse307*_cse65) + z*(0.234017800844203*_cse14*_cse291 + _cse220 - _cse222 - 0.227149603970304*_cse290 - 0.227149603970304*_cse292 - 0.234017800844203*_cse293 - 0.137106991283212*_cse294 - 0.137106991283212*_cse295 + 0.410879747*_cse297*_cse43 + 0.410149995883665*_cse300*_cse41 + 0.410879747*_cse300*_cse53 - 0.209584432*_cse302 - 0.209584432*_cse303 - 0.410149995883665*_cse308)
+    _cse312 = _cse15*_cse186
+    _cse313 = _cse189*_cse22
+    _cse314 = _cse13*_cse186
+    _cse315 = _cse186*_cse26
+    _cse316 = _cse189*_cse28
+    _cse317 = _cse14*_cse189
+    _cse318 = _cse198 + 0.517383113*_cse312 + 0.517383113*_cse313 - 0.855753802*_cse315 - 0.855753802*_cse316
+    _cse319 = _cse318*_cse43
+    _cse320 = _cse203 + 0.758601438*_cse312 + 0.758601438*_cse313 - 0.212878838804554*_cse314 + 0.458851168*_cse315 + 0.458851168*_cse316 + 0.212878838804554*_cse317
+    _cse321 = _cse320*_cse53
+    _cse322 = _cse318*_cse55
+    _cse323 = _cse320*_cse57
+    _cse324 = _cse210 + 1.8987869684628e-6*_cse312 + 1.8987869684628e-6*_cse313 + 1.9561995392714e-6*_cse314 + 1.14610355371469e-6*_cse315 + 1.14610355371469e-6*_cse316 - 1.9561995392714e-6*_cse317 - 0.45478971*_cse319 - 0.45478971*_cse321 - 0.890598824*_cse322 - 0.890598824*_cse323
+    _cse325 = 0.334218649384678*_cse14*_cse189 - _cse215 - 0.324409654194476*_cse312 - 0.324409654194476*_cse313 - 0.334218649384678*_cse314 - 0.19581293936857*_cse315 - 0.19581293936857*_cse316 + 0.403618758*_cse318*_cse55 - _cse318*_cse68 - 0.790154512*_cse319 + 0.213215245107779*_cse320*_cse41 + 0.403618758*_cse320*_cse57 - 0.790154512*_cse321
+    _cse326 = -_cse0*_cse325 - _cse324*_cse65
+    _cse327 = -_cse0*_cse324 + _cse325*_cse65
+    _cse328 = _cse318*_cse40
+    _cse329 = 0.234017800844203*_cse14*_cse189 - _cse223 - 0.227149603970304*_cse312 - 0.227149603970304*_cse313 - 0.234017800844203*_cse314 - 0.137106991283212*_cse315 - 0.137106991283212*_cse316 + 0.410879747*_cse318*_cse43 + 0.410149995883665*_cse320*_cse41 + 0.410879747*_cse320*_cse53 - 0.209584432*_cse322 - 0.209584432*_cse323 - 0.410149995883665*_cse328
+    _cse330 = 0.0499969558686132*_cse328
+    _cse331 = 0.01872015456*_cse322
+    _cse332 = 0.01872015456*_cse323
+    _cse333 = 0.0627091097210817*_cse314
+    _cse334 = 0.0491638727803817*_cse312
+    _cse335 = 0.0491638727803817*_cse313
+    _cse336 = 0.0290982758960988*_cse315
+    _cse337 = 0.0290982758960988*_cse316
+    _cse338 = -_cse241
+    _cse339 = _cse14*_cse338
+    _cse340 = -_cse239
+    _cse341 = _cse26*_cse340
+    _cse342 = _cse28*_cse338
+    _cse343 = 0.517383113*_cse15*_cse340 + 0.517383113*_cse22*_cse338 - _cse247 - 0.855753802*_cse341 - 0.855753802*_cse342
+    _cse344 = _cse343*_cse43
+    _cse345 = _cse13*_cse340
+    _cse346 = _cse15*_cse340
+    _cse347 = _cse22*_cse338
+    _cse348 = _cse250 + _cse251 + 0.212878838804554*_cse339 + 0.458851168*_cse341 + 0.458851168*_cse342 - 0.212878838804554*_cse345 + 0.758601438*_cse346 + 0.758601438*_cse347
+    _cse349 = _cse348*_cse53
+    _cse350 = _cse343*_cse55
+    _cse351 = _cse348*_cse57
+    _cse352 = 1.9561995392714e-6*_cse13*_cse340 + 1.8987869684628e-6*_cse15*_cse340 + 1.8987869684628e-6*_cse22*_cse338 - _cse256 + 1.14610355371469e-6*_cse26*_cse340 + 1.14610355371469e-6*_cse28*_cse338 - 1.9561995392714e-6*_cse339 - 0.45478971*_cse344 - 0.45478971*_cse349 - 0.890598824*_cse350 - 0.890598824*_cse351
+    _cse353 = 0.334218649384678*_cse14*_cse338 + _cse258 + _cse259 - 0.19581293936857*_cse341 - 0.19581293936857*_cse342 + 0.403618758*_cse343*_cse55 - _cse343*_cse68 - 0.790154512*_cse344 - 0.334218649384678*_cse345 - 0.324409654194476*_cse346 - 0.324409654194476*_cse347 + 0.213215245107779*_cse348*_cse41 + 0.403618758*_cse348*_cse57 - 0.790154512*_cse349
+    _cse354 = _cse0*_cse352 - _cse353*_cse65
+    _cse355 = -_cse0*_cse353 - _cse352*_cse65
+    _cse356 = _cse354*x + _cse355*y
+    _cse357 = _cse343*_cse41
+    _cse358 = _cse343*_cse82
+    _cse359 = _cse343*_cse84
+    _cse360 = _cse348*_cse40
+    _cse361 = _cse348*_cse43
+    _cse362 = _cse348*_cse55
+    _cse363 = -0.890598824*_cse358 - 0.45478971*_cse359 - 0.45478971*_cse361 - 0.890598824*_cse362
+    _cse364 = -_cse343*_cse69 + 0.403618758*_cse343*_cse82 + 0.403618758*_cse348*_cse55 - _cse348*_cse68 - 0.790154512*_cse359 - 0.790154512*_cse361
+    _cse365 = _cse343*_cse81 + _cse348*_cse88 - 0.0499969558686132*_cse357 - 0.01872015456*_cse358 + 0.03790017976*_cse359 - 0.0499969558686132*_cse360 + 0.03790017976*_cse361 - 0.01872015456*_cse362 + x*(-_cse0*_cse364 - _cse363*_cse65) + y*(-_cse0*_cse363 + _cse364*_cse65) + z*(0.410879747*_cse343*_cse84 + 0.410879747*_cse348*_cse43 - 0.410149995883665*_cse357 - 0.209584432*_cse358 - 0.410149995883665*_cse360 - 0.209584432*_cse362)
+    _cse366 = _cse14*_cse340
+    _cse367 = _cse13*_cse338
+    _cse368 = _cse168*_cse340
+    _cse369 = _cse21*_cse340
+    _cse370 = _cse26*_cse338
+    _cse371 = _cse15*_cse338
+    _cse372 = 0.517383113*_cse15*_cse338 + 0.517383113*_cse21*_cse340 - 0.855753802*_cse368 - 0.855753802*_cse370
+    _cse373 = _cse372*_cse40
+    _cse374 = _cse372*_cse43
+    _cse375 = _cse372*_cse55
+    _cse376 = -0.212878838804554*_cse366 - 0.212878838804554*_cse367 + 0.458851168*_cse368 + 0.758601438*_cse369 + 0.458851168*_cse370 + 0.758601438*_cse371
+    _cse377 = _cse376*_cse53
+    _cse378 = _cse376*_cse57
+    _cse379 = 1.9561995392714e-6*_cse366 + 1.9561995392714e-6*_cse367 + 1.14610355371469e-6*_cse368 + 1.8987869684628e-6*_cse369 + 1.14610355371469e-6*_cse370 + 1.8987869684628e-6*_cse371 - 0.45478971*_cse374 - 0.890598824*_cse375 - 0.45478971*_cse377 - 0.890598824*_cse378
+    _cse380 = -0.334218649384678*_cse366 - 0.334218649384678*_cse367 - 0.19581293936857*_cse368 - 0.324409654194476*_cse369 - 0.19581293936857*_cse370 - 0.324409654194476*_cse371 + 0.403618758*_cse372*_cse55 - _cse372*_cse68 - 0.790154512*_cse374 + 0.213215245107779*_cse376*_cse41 + 0.403618758*_cse376*_cse57 - 0.790154512*_cse377
+    _cse381 = _cse129*_cse376 + _cse130*_cse340 + _cse133*_cse338 - 0.0627091097210817*_cse366 - 0.0627091097210817*_cse367 - 0.0290982758960988*_cse368 - 0.0491638727803817*_cse369 - 0.0290982758960988*_cse370 - 0.0491638727803817*_cse371 + _cse372*_cse88 - 0.0499969558686132*_cse373 + 0.03790017976*_cse374 - 0.01872015456*_cse375 + 0.0499969558686132*_cse376*_cse41 + 0.03790017976*_cse377 - 0.01872015456*_cse378 + x*(-_cse0*_cse380 - _cse379*_cse65) + y*(-_cse0*_cse379 + _cse380*_cse65) + z*(-0.234017800844203*_cse366 - 0.234017800844203*_cse367 - 0.137106991283212*_cse368 - 0.227149603970304*_cse369 - 0.137106991283212*_cse370 - 0.227149603970304*_cse371 + 0.410879747*_cse372*_cse43 - 0.410149995883665*_cse373 - 0.209584432*_cse375 + 0.410149995883665*_cse376*_cse41 + 0.410879747*_cse376*_cse53 - 0.209584432*_cse378)
+    _cse382 = -_cse136
+    _cse383 = -_cse187
+    _cse384 = _cse14*_cse383
+    _cse385 = -_cse190
+    _cse386 = _cse13*_cse385
+    _cse387 = _cse168*_cse383
+    _cse388 = _cse26*_cse385
+    _cse389 = _cse21*_cse383
+    _cse390 = _cse15*_cse385
+    _cse391 = 0.517383113*_cse15*_cse385 + 0.517383113*_cse21*_cse383 - 0.855753802*_cse387 - 0.855753802*_cse388
+    _cse392 = _cse391*_cse43
+    _cse393 = _cse391*_cse55
+    _cse394 = -0.212878838804554*_cse384 - 0.212878838804554*_cse386 + 0.458851168*_cse387 + 0.458851168*_cse388 + 0.758601438*_cse389 + 0.758601438*_cse390
+    _cse395 = _cse394*_cse53
+    _cse396 = _cse394*_cse57
+    _cse397 = 1.9561995392714e-6*_cse384 + 1.9561995392714e-6*_cse386 + 1.14610355371469e-6*_cse387 + 1.14610355371469e-6*_cse388 + 1.8987869684628e-6*_cse389 + 1.8987869684628e-6*_cse390 - 0.45478971*_cse392 - 0.890598824*_cse393 - 0.45478971*_cse395 - 0.890598824*_cse396
+    _cse398 = -0.334218649384678*_cse384 - 0.334218649384678*_cse386 - 0.19581293936857*_cse387 - 0.19581293936857*_cse388 - 0.324409654194476*_cse389 - 0.324409654194476*_cse390 + 0.403618758*_cse391*_cse55 - _cse391*_cse68 - 0.790154512*_cse392 + 0.213215245107779*_cse394*_cse41 + 0.403618758*_cse394*_cse57 - 0.790154512*_cse395
+    _cse399 = x*(_cse0*_cse397 - _cse398*_cse65) + y*(-_cse0*_cse398 - _cse397*_cse65)
+    _cse400 = _cse391*_cse41
+    _cse401 = _cse391*_cse82
+    _cse402 = _cse391*_cse84
+    _cse403 = _cse394*_cse40
+    _cse404 = _cse394*_cse43
+    _cse405 = _cse394*_cse55
+    _cse406 = -0.890598824*_cse401 - 0.45478971*_cse402 - 0.45478971*_cse404 - 0.890598824*_cse405
+    _cse407 = -_cse391*_cse69 + 0.403618758*_cse391*_cse82 + 0.403618758*_cse394*_cse55 - _cse394*_cse68 - 0.790154512*_cse402 - 0.790154512*_cse404
+    _cse408 = _cse391*_cse81 + _cse394*_cse88 - 0.0499969558686132*_cse400 - 0.01872015456*_cse401 + 0.03790017976*_cse402 - 0.0499969558686132*_cse403 + 0.03790017976*_cse404 - 0.01872015456*_cse405 + x*(-_cse0*_cse407 - _cse406*_cse65) + y*(-_cse0*_cse406 + _cse407*_cse65) + z*(0.410879747*_cse391*_cse84 + 0.410879747*_cse394*_cse43 - 0.410149995883665*_cse400 - 0.209584432*_cse401 - 0.410149995883665*_cse403 - 0.209584432*_cse405)
+    _cse409 = _cse13*_cse383
+    _cse410 = _cse14*_cse385
+    _cse411 = _cse168*_cse385
+    _cse412 = -_cse15
+    _cse413 = _cse383*_cse412
+    _cse414 = -_cse26
+    _cse415 = _cse383*_cse414
+    _cse416 = _cse21*_cse385
+    _cse417 = 0.517383113*_cse21*_cse385 + 0.517383113*_cse383*_cse412 - 0.855753802*_cse411 - 0.855753802*_cse415
+    _cse418 = _cse40*_cse417
+    _cse419 = _cse417*_cse43
+    _cse420 = _cse417*_cse55
+    _cse421 = 0.212878838804554*_cse409
+    _cse422 = 0.212878838804554*_cse410
+    _cse423 = 0.458851168*_cse411 + 0.758601438*_cse413 + 0.458851168*_cse415 + 0.758601438*_cse416 + _cse421 - _cse422
+    _cse424 = _cse423*_cse53
+    _cse425 = _cse423*_cse57
+    _cse426 = 1.9561995392714e-6*_cse409
+    _cse427 = 1.9561995392714e-6*_cse410
+    _cse428 = 1.14610355371469e-6*_cse411 + 1.8987869684628e-6*_cse413 + 1.14610355371469e-6*_cse415 + 1.8987869684628e-6*_cse416 - 0.45478971*_cse419 - 0.890598824*_cse420 - 0.45478971*_cse424 - 0.890598824*_cse425 - _cse426 + _cse427
+    _cse429 = 0.334218649384678*_cse409
+    _cse430 = 0.334218649384678*_cse410
+    _cse431 = 0.213215245107779*_cse41*_cse423 - 0.19581293936857*_cse411 - 0.324409654194476*_cse413 - 0.19581293936857*_cse415 - 0.324409654194476*_cse416 + 0.403618758*_cse417*_cse55 - _cse417*_cse68 - 0.790154512*_cse419 + 0.403618758*_cse423*_cse57 - 0.790154512*_cse424 + _cse429 - _cse430
+    _cse432 = _cse22*_cse385
+    _cse433 = _cse26*_cse383
+    _cse434 = _cse15*_cse383
+    _cse435 = _cse28*_cse385
+    _cse436 = -_cse196 + _cse197 + 0.517383113*_cse432 - 0.855753802*_cse433 + 0.517383113*_cse434 - 0.855753802*_cse435
+    _cse437 = _cse436*_cse82
+    _cse438 = _cse436*_cse84
+    _cse439 = _cse299 - _cse421 + _cse422 + 0.758601438*_cse432 + 0.458851168*_cse433 + 0.758601438*_cse434 + 0.458851168*_cse435
+    _cse440 = _cse43*_cse439
+    _cse441 = _cse439*_cse55
+    _cse442 = -0.890598824*_cse437 - 0.45478971*_cse438 - 0.45478971*_cse440 - 0.890598824*_cse441
+    _cse443 = -_cse436*_cse69 + 0.403618758*_cse436*_cse82 - 0.790154512*_cse438 + 0.403618758*_cse439*_cse55 - _cse439*_cse68 - 0.790154512*_cse440
+    _cse444 = x*(_cse0*_cse442 - _cse443*_cse65) + y*(-_cse0*_cse443 - _cse442*_cse65)
+    _cse445 = -_cse55
+    _cse446 = _cse436*_cse445
+    _cse447 = _cse42*_cse436
+    _cse448 = _cse41*_cse439
+    _cse449 = _cse439*_cse82
+    _cse450 = _cse439*_cse84
+    _cse451 = -0.890598824*_cse446 - 0.45478971*_cse447 - 0.890598824*_cse449 - 0.45478971*_cse450
+    _cse452 = _cse436*_cse68 - _cse439*_cse69
+    _cse453 = 0.403618758*_cse446 - 0.790154512*_cse447 + 0.403618758*_cse449 - 0.790154512*_cse450 + _cse452
+    _cse454 = _cse43*_cse436
+    _cse455 = _cse439*_cse53
+    _cse456 = _cse304 + _cse426 - _cse427 + 1.8987869684628e-6*_cse432 + 1.14610355371469e-6*_cse433 + 1.8987869684628e-6*_cse434 + 1.14610355371469e-6*_cse435 - 0.890598824*_cse436*_cse55 - 0.890598824*_cse439*_cse57 - 0.45478971*_cse454 - 0.45478971*_cse455
+    _cse457 = -_cse306 - _cse429 + _cse430 - 0.324409654194476*_cse432 - 0.19581293936857*_cse433 - 0.324409654194476*_cse434 - 0.19581293936857*_cse435 + 0.403618758*_cse436*_cse55 + 0.403618758*_cse439*_cse57 - _cse452 - 0.790154512*_cse454 - 0.790154512*_cse455
+    _cse458 = _cse217*y + _cse218*x
+    _cse459 = _cse199*_cse41
+    _cse460 = _cse199*_cse82
+    _cse461 = _cse199*_cse84
+    _cse462 = _cse204*_cse40
+    _cse463 = _cse204*_cse43
+    _cse464 = _cse204*_cse55
+    _cse465 = -0.890598824*_cse460 - 0.45478971*_cse461 - 0.45478971*_cse463 - 0.890598824*_cse464
+    _cse466 = -_cse199*_cse69 + 0.403618758*_cse199*_cse82 + 0.403618758*_cse204*_cse55 - _cse204*_cse68 - 0.790154512*_cse461 - 0.790154512*_cse463
+    _cse467 = _cse199*_cse81 + _cse204*_cse88 - 0.0499969558686132*_cse459 - 0.01872015456*_cse460 + 0.03790017976*_cse461 - 0.0499969558686132*_cse462 + 0.03790017976*_cse463 - 0.01872015456*_cse464 + x*(-_cse0*_cse466 - _cse465*_cse65) + y*(-_cse0*_cse465 + _cse466*_cse65) + z*(0.410879747*_cse199*_cse84 + 0.410879747*_cse204*_cse43 - 0.410149995883665*_cse459 - 0.209584432*_cse460 - 0.410149995883665*_cse462 - 0.209584432*_cse464)
+    _cse468 = 0.329365488408814*_cse235
+    _cse469 = 0.329365488408814*_cse233
+    _cse470 = _cse248*_cse40
+    _cse471 = -0.234017800844203*_cse14*_cse241 + 0.227149603970304*_cse240 + 0.227149603970304*_cse242 + 0.234017800844203*_cse243 + 0.137106991283212*_cse244 + 0.137106991283212*_cse245 - 0.410879747*_cse248*_cse43 - 0.410149995883665*_cse252*_cse41 - 0.410879747*_cse252*_cse53 + 0.209584432*_cse254 + 0.209584432*_cse255 + _cse468 + _cse469 + 0.410149995883665*_cse470
+    _cse472 = _cse1*_cse137 + _cse1*_cse138 - _cse1*_cse139 + 0.253888422522456*_cse233 + 0.253888422522456*_cse235
+    _cse473 = -_cse1*_cse135 + _cse129*_cse252 + _cse131*_cse241 + _cse133*_cse239 + 0.0627091097210817*_cse14*_cse241 - 0.0491638727803817*_cse240 - 0.0491638727803817*_cse242 - 0.0627091097210817*_cse243 - 0.0290982758960988*_cse244 - 0.0290982758960988*_cse245 + 0.03790017976*_cse248*_cse43 + _cse248*_cse88 + 0.0499969558686132*_cse252*_cse41 + 0.03790017976*_cse252*_cse53 - 0.01872015456*_cse254 - 0.01872015456*_cse255 - _cse261*y + _cse262*x - 0.0499969558686132*_cse470 - _cse471*z - _cse472
+    _cse474 = _cse343*_cse40
+    _cse475 = -0.234017800844203*_cse14*_cse338 + 0.137106991283212*_cse341 + 0.137106991283212*_cse342 - 0.410879747*_cse343*_cse43 + 0.234017800844203*_cse345 + 0.227149603970304*_cse346 + 0.227149603970304*_cse347 - 0.410149995883665*_cse348*_cse41 - 0.410879747*_cse348*_cse53 + 0.209584432*_cse350 + 0.209584432*_cse351 - _cse468 - _cse469 + 0.410149995883665*_cse474
+    _cse476 = _cse1*_cse162 - _cse1*_cse164 + _cse129*_cse348 + _cse131*_cse338 + _cse133*_cse340 - 0.20503*_cse227 - 1.098e-6*_cse228 + 0.0627091097210817*_cse339 - 0.0290982758960988*_cse341 - 0.0290982758960988*_cse342 + _cse343*_cse88 + 0.03790017976*_cse344 - 0.0627091097210817*_cse345 - 0.0491638727803817*_cse346 - 0.0491638727803817*_cse347 + 0.0499969558686132*_cse348*_cse41 + 0.03790017976*_cse349 - 0.01872015456*_cse350 - 0.01872015456*_cse351 - _cse354*y + _cse355*x + _cse472 - 0.0499969558686132*_cse474 - _cse475*z
+    _cse477 = _cse13*_cse190
+    _cse478 = _cse14*_cse187
+    _cse479 = _cse168*_cse187
+    _cse480 = _cse190*_cse26
+    _cse481 = _cse187*_cse21
+    _cse482 = _cse15*_cse190
+    _cse483 = 0.517383113*_cse15*_cse190 + 0.517383113*_cse187*_cse21 - 0.855753802*_cse479 - 0.855753802*_cse480
+    _cse484 = _cse40*_cse483
+    _cse485 = _cse43*_cse483
+    _cse486 = _cse483*_cse55
+    _cse487 = -0.212878838804554*_cse477 - 0.212878838804554*_cse478 + 0.458851168*_cse479 + 0.458851168*_cse480 + 0.758601438*_cse481 + 0.758601438*_cse482
+    _cse488 = _cse487*_cse53
+    _cse489 = _cse487*_cse57
+    _cse490 = 1.9561995392714e-6*_cse477 + 1.9561995392714e-6*_cse478 + 1.14610355371469e-6*_cse479 + 1.14610355371469e-6*_cse480 + 1.8987869684628e-6*_cse481 + 1.8987869684628e-6*_cse482 - 0.45478971*_cse485 - 0.890598824*_cse486 - 0.45478971*_cse488 - 0.890598824*_cse489
+    _cse491 = 0.213215245107779*_cse41*_cse487 - 0.334218649384678*_cse477 - 0.334218649384678*_cse478 - 0.19581293936857*_cse479 - 0.19581293936857*_cse480 - 0.324409654194476*_cse481 - 0.324409654194476*_cse482 + 0.403618758*_cse483*_cse55 - _cse483*_cse68 - 0.790154512*_cse485 + 0.403618758*_cse487*_cse57 - 0.790154512*_cse488
+    _cse492 = _cse129*_cse487 + _cse130*_cse187 + _cse133*_cse190 + 0.0499969558686132*_cse41*_cse487 - 0.0627091097210817*_cse477 - 0.0627091097210817*_cse478 - 0.0290982758960988*_cse479 - 0.0290982758960988*_cse480 - 0.0491638727803817*_cse481 - 0.0491638727803817*_cse482 + _cse483*_cse88 - 0.0499969558686132*_cse484 + 0.03790017976*_cse485 - 0.01872015456*_cse486 + 0.03790017976*_cse488 - 0.01872015456*_cse489 + x*(-_cse0*_cse491 - _cse490*_cse65) + y*(-_cse0*_cse490 + _cse491*_cse65) + z*(0.410149995883665*_cse41*_cse487 + 0.410879747*_cse43*_cse483 - 0.234017800844203*_cse477 - 0.234017800844203*_cse478 - 0.137106991283212*_cse479 - 0.137106991283212*_cse480 - 0.227149603970304*_cse481 - 0.227149603970304*_cse482 - 0.410149995883665*_cse484 - 0.209584432*_cse486 + 0.410879747*_cse487*_cse53 - 0.209584432*_cse489)
+    _cse493 = -_cse12
+    _cse494 = _cse15*_cse493
+    _cse495 = -_cse20
+    _cse496 = _cse22*_cse495
+    _cse497 = _cse13*_cse493
+    _cse498 = _cse26*_cse493
+    _cse499 = _cse28*_cse495
+    _cse500 = _cse14*_cse495
+    _cse501 = -_cse34 + _cse37 + 0.517383113*_cse494 + 0.517383113*_cse496 - 0.855753802*_cse498 - 0.855753802*_cse499
+    _cse502 = _cse43*_cse501
+    _cse503 = -_cse48 + _cse50
+    _cse504 = 0.758601438*_cse494 + 0.758601438*_cse496 - 0.212878838804554*_cse497 + 0.458851168*_cse498 + 0.458851168*_cse499 + 0.212878838804554*_cse500 + _cse503
+    _cse505 = _cse504*_cse53
+    _cse506 = _cse501*_cse55
+    _cse507 = _cse504*_cse57
+    _cse508 = -_cse60 + _cse62
+    _cse509 = 1.8987869684628e-6*_cse494 + 1.8987869684628e-6*_cse496 + 1.9561995392714e-6*_cse497 + 1.14610355371469e-6*_cse498 + 1.14610355371469e-6*_cse499 - 1.9561995392714e-6*_cse500 - 0.45478971*_cse502 - 0.45478971*_cse505 - 0.890598824*_cse506 - 0.890598824*_cse507 + _cse508
+    _cse510 = -_cse72 + _cse74
+    _cse511 = 0.334218649384678*_cse14*_cse495 + 0.213215245107779*_cse41*_cse504 - 0.324409654194476*_cse494 - 0.324409654194476*_cse496 - 0.334218649384678*_cse497 - 0.19581293936857*_cse498 - 0.19581293936857*_cse499 + 0.403618758*_cse501*_cse55 - _cse501*_cse68 - 0.790154512*_cse502 + 0.403618758*_cse504*_cse57 - 0.790154512*_cse505 - _cse510
+    _cse512 = _cse40*_cse501
+    _cse513 = _cse3*_cse35
+    _cse514 = 0.329365488408814*_cse513
+    _cse515 = _cse3*_cse32
+    _cse516 = 0.329365488408814*_cse515
+    _cse517 = _cse514 - _cse516
+    _cse518 = 0.0038906673398998*_cse106
+    _cse519 = 0.0038906673398998*_cse108
+    _cse520 = 0.253888422522456*_cse515
+    _cse521 = 0.253888422522456*_cse513
+    _cse522 = _cse518 + _cse519 + _cse520 - _cse521
+    _cse523 = _cse105*_cse136
+    _cse524 = -1.098e-6*_cse105 + _cse107*_cse163 + 0.20503*_cse107 + _cse523
+    _cse525 = _cse159*y + _cse160*x
+    _cse526 = _cse147*_cse41
+    _cse527 = _cse147*_cse82
+    _cse528 = _cse147*_cse84
+    _cse529 = _cse152*_cse40
+    _cse530 = _cse152*_cse43
+    _cse531 = _cse152*_cse55
+    _cse532 = -0.890598824*_cse527 - 0.45478971*_cse528 - 0.45478971*_cse530 - 0.890598824*_cse531
+    _cse533 = -_cse147*_cse69 + 0.403618758*_cse147*_cse82 + 0.403618758*_cse152*_cse55 - _cse152*_cse68 - 0.790154512*_cse528 - 0.790154512*_cse530
+    _cse534 = _cse147*_cse81 + _cse152*_cse88 - 0.0499969558686132*_cse526 - 0.01872015456*_cse527 + 0.03790017976*_cse528 - 0.0499969558686132*_cse529 + 0.03790017976*_cse530 - 0.01872015456*_cse531 + x*(-_cse0*_cse533 - _cse532*_cse65) + y*(-_cse0*_cse532 + _cse533*_cse65) + z*(0.410879747*_cse147*_cse84 + 0.410879747*_cse152*_cse43 - 0.410149995883665*_cse526 - 0.209584432*_cse527 - 0.410149995883665*_cse529 - 0.209584432*_cse531)
+    _cse535 = _cse14*_cse144
+    _cse536 = _cse13*_cse142
+    _cse537 = _cse144*_cse168
+    _cse538 = _cse144*_cse21
+    _cse539 = _cse142*_cse26
+    _cse540 = _cse142*_cse15
+    _cse541 = 0.517383113*_cse142*_cse15 + 0.517383113*_cse144*_cse21 - 0.855753802*_cse537 - 0.855753802*_cse539
+    _cse542 = _cse40*_cse541
+    _cse543 = _cse43*_cse541
+    _cse544 = _cse541*_cse55
+    _cse545 = -0.212878838804554*_cse535 - 0.212878838804554*_cse536 + 0.458851168*_cse537 + 0.758601438*_cse538 + 0.458851168*_cse539 + 0.758601438*_cse540
+    _cse546 = _cse53*_cse545
+    _cse547 = _cse545*_cse57
+    _cse548 = 1.9561995392714e-6*_cse535 + 1.9561995392714e-6*_cse536 + 1.14610355371469e-6*_cse537 + 1.8987869684628e-6*_cse538 + 1.14610355371469e-6*_cse539 + 1.8987869684628e-6*_cse540 - 0.45478971*_cse543 - 0.890598824*_cse544 - 0.45478971*_cse546 - 0.890598824*_cse547
+    _cse549 = 0.213215245107779*_cse41*_cse545 - 0.334218649384678*_cse535 - 0.334218649384678*_cse536 - 0.19581293936857*_cse537 - 0.324409654194476*_cse538 - 0.19581293936857*_cse539 - 0.324409654194476*_cse540 + 0.403618758*_cse541*_cse55 - _cse541*_cse68 - 0.790154512*_cse543 + 0.403618758*_cse545*_cse57 - 0.790154512*_cse546
+    _cse550 = _cse129*_cse545 + _cse130*_cse144 + _cse133*_cse142 + 0.0499969558686132*_cse41*_cse545 - 0.0627091097210817*_cse535 - 0.0627091097210817*_cse536 - 0.0290982758960988*_cse537 - 0.0491638727803817*_cse538 - 0.0290982758960988*_cse539 - 0.0491638727803817*_cse540 + _cse541*_cse88 - 0.0499969558686132*_cse542 + 0.03790017976*_cse543 - 0.01872015456*_cse544 + 0.03790017976*_cse546 - 0.01872015456*_cse547 + x*(-_cse0*_cse549 - _cse548*_cse65) + y*(-_cse0*_cse548 + _cse549*_cse65) + z*(0.410149995883665*_cse41*_cse545 + 0.410879747*_cse43*_cse541 + 0.410879747*_cse53*_cse545 - 0.234017800844203*_cse535 - 0.234017800844203*_cse536 - 0.137106991283212*_cse537 - 0.227149603970304*_cse538 - 0.137106991283212*_cse539 - 0.227149603970304*_cse540 - 0.410149995883665*_cse542 - 0.209584432*_cse544 - 0.209584432*_cse547)
+    _cse551 = _cse107*_cse134
+    _cse552 = _cse14*_cse19
+    _cse553 = _cse11*_cse13
+    _cse554 = _cse19*_cse22
+    _cse555 = _cse19*_cse28
+    _cse556 = _cse11*_cse26
+    _cse557 = _cse11*_cse15
+    _cse558 = _cse38 + 0.517383113*_cse554 - 0.855753802*_cse555 - 0.855753802*_cse556 + 0.517383113*_cse557
+    _cse559 = _cse40*_cse558
+    _cse560 = _cse43*_cse558
+    _cse561 = _cse55*_cse558
+    _cse562 = _cse51 + 0.212878838804554*_cse552 - 0.212878838804554*_cse553 + 0.758601438*_cse554 + 0.458851168*_cse555 + 0.458851168*_cse556 + 0.758601438*_cse557
+    _cse563 = _cse53*_cse562
+    _cse564 = _cse562*_cse57
+    _cse565 = -_cse514 + _cse516
+    _cse566 = -1.9561995392714e-6*_cse552 + 1.9561995392714e-6*_cse553 + 1.8987869684628e-6*_cse554 + 1.14610355371469e-6*_cse555 + 1.14610355371469e-6*_cse556 + 1.8987869684628e-6*_cse557 - 0.45478971*_cse560 - 0.890598824*_cse561 - 0.45478971*_cse563 - 0.890598824*_cse564 + _cse63
+    _cse567 = 0.334218649384678*_cse14*_cse19 + 0.213215245107779*_cse41*_cse562 + 0.403618758*_cse55*_cse558 - 0.334218649384678*_cse553 - 0.324409654194476*_cse554 - 0.19581293936857*_cse555 - 0.19581293936857*_cse556 - 0.324409654194476*_cse557 - _cse558*_cse68 - 0.790154512*_cse560 + 0.403618758*_cse562*_cse57 - 0.790154512*_cse563 - _cse75
+    _cse568 = _cse11*_cse133 + _cse129*_cse562 + _cse131*_cse19 + 0.0499969558686132*_cse41*_cse562 - _cse518 - _cse519 - _cse520 + _cse521 - _cse523 + _cse551 + 0.0627091097210817*_cse552 - 0.0627091097210817*_cse553 - 0.0491638727803817*_cse554 - 0.0290982758960988*_cse555 - 0.0290982758960988*_cse556 - 0.0491638727803817*_cse557 + _cse558*_cse88 - 0.0499969558686132*_cse559 + 0.03790017976*_cse560 - 0.01872015456*_cse561 + 0.03790017976*_cse563 - 0.01872015456*_cse564 + x*(-_cse0*_cse567 - _cse566*_cse65) + y*(-_cse0*_cse566 + _cse567*_cse65) + z*(0.234017800844203*_cse14*_cse19 + 0.410149995883665*_cse41*_cse562 + 0.410879747*_cse43*_cse558 + 0.410879747*_cse53*_cse562 - 0.234017800844203*_cse553 - 0.227149603970304*_cse554 - 0.137106991283212*_cse555 - 0.137106991283212*_cse556 - 0.227149603970304*_cse557 - 0.410149995883665*_cse559 - 0.209584432*_cse561 - 0.209584432*_cse564 - _cse565)
+    _cse569 = -_cse11
+    _cse570 = _cse15*_cse569
+    _cse571 = -_cse19
+    _cse572 = _cse22*_cse571
+    _cse573 = _cse13*_cse569
+    _cse574 = _cse26*_cse569
+    _cse575 = _cse28*_cse571
+    _cse576 = _cse14*_cse571
+    _cse577 = 0.517383113*_cse15*_cse569 + 0.517383113*_cse22*_cse571 - _cse38 - 0.855753802*_cse574 - 0.855753802*_cse575
+    _cse578 = _cse43*_cse577
+    _cse579 = _cse503 + 0.758601438*_cse570 + 0.758601438*_cse572 - 0.212878838804554*_cse573 + 0.458851168*_cse574 + 0.458851168*_cse575 + 0.212878838804554*_cse576
+    _cse580 = _cse53*_cse579
+    _cse581 = _cse55*_cse577
+    _cse582 = _cse57*_cse579
+    _cse583 = _cse508 + 1.8987869684628e-6*_cse570 + 1.8987869684628e-6*_cse572 + 1.9561995392714e-6*_cse573 + 1.14610355371469e-6*_cse574 + 1.14610355371469e-6*_cse575 - 1.9561995392714e-6*_cse576 - 0.45478971*_cse578 - 0.45478971*_cse580 - 0.890598824*_cse581 - 0.890598824*_cse582
+    _cse584 = 0.334218649384678*_cse14*_cse571 + 0.213215245107779*_cse41*_cse579 - _cse510 + 0.403618758*_cse55*_cse577 + 0.403618758*_cse57*_cse579 - 0.324409654194476*_cse570 - 0.324409654194476*_cse572 - 0.334218649384678*_cse573 - 0.19581293936857*_cse574 - 0.19581293936857*_cse575 - _cse577*_cse68 - 0.790154512*_cse578 - 0.790154512*_cse580
+    _cse585 = _cse40*_cse577
+    _cse586 = _cse129*_cse579 + _cse131*_cse571 + _cse133*_cse569 + 0.0499969558686132*_cse41*_cse579 + _cse522 - 0.0491638727803817*_cse570 - 0.0491638727803817*_cse572 - 0.0627091097210817*_cse573 - 0.0290982758960988*_cse574 - 0.0290982758960988*_cse575 + 0.0627091097210817*_cse576 + _cse577*_cse88 + 0.03790017976*_cse578 + 0.03790017976*_cse580 - 0.01872015456*_cse581 - 0.01872015456*_cse582 - 0.0499969558686132*_cse585 + x*(-_cse0*_cse584 - _cse583*_cse65) + y*(-_cse0*_cse583 + _cse584*_cse65) + z*(0.234017800844203*_cse14*_cse571 + 0.410149995883665*_cse41*_cse579 + 0.410879747*_cse43*_cse577 - _cse517 + 0.410879747*_cse53*_cse579 - 0.227149603970304*_cse570 - 0.227149603970304*_cse572 - 0.234017800844203*_cse573 - 0.137106991283212*_cse574 - 0.137106991283212*_cse575 - 0.209584432*_cse581 - 0.209584432*_cse582 - 0.410149995883665*_cse585)
+    _cse587 = _cse124*y + _cse125*x
+    _cse588 = _cse110*_cse41
+    _cse589 = _cse110*_cse82
+    _cse590 = _cse110*_cse84
+    _cse591 = _cse114*_cse40
+    _cse592 = _cse114*_cse43
+    _cse593 = _cse114*_cse55
+    _cse594 = -0.890598824*_cse589 - 0.45478971*_cse590 - 0.45478971*_cse592 - 0.890598824*_cse593
+    _cse595 = -_cse110*_cse69 + 0.403618758*_cse110*_cse82 + 0.403618758*_cse114*_cse55 - _cse114*_cse68 - 0.790154512*_cse590 - 0.790154512*_cse592
+    _cse596 = _cse110*_cse81 + _cse114*_cse88 - 0.0499969558686132*_cse588 - 0.01872015456*_cse589 + 0.03790017976*_cse590 - 0.0499969558686132*_cse591 + 0.03790017976*_cse592 - 0.01872015456*_cse593 + x*(-_cse0*_cse595 - _cse594*_cse65) + y*(-_cse0*_cse594 + _cse595*_cse65) + z*(0.410879747*_cse110*_cse84 + 0.410879747*_cse114*_cse43 - 0.410149995883665*_cse588 - 0.209584432*_cse589 - 0.410149995883665*_cse591 - 0.209584432*_cse593)
+    _cse597 = _cse13*_cse99
+    _cse598 = _cse14*_cse97
+    _cse599 = _cse26*_cse99
+    _cse600 = _cse15*_cse99
+    _cse601 = _cse168*_cse97
+    _cse602 = _cse21*_cse97
+    _cse603 = 0.517383113*_cse15*_cse99 + 0.517383113*_cse21*_cse97 - 0.855753802*_cse599 - 0.855753802*_cse601
+    _cse604 = _cse40*_cse603
+    _cse605 = _cse43*_cse603
+    _cse606 = _cse55*_cse603
+    _cse607 = -0.212878838804554*_cse597 - 0.212878838804554*_cse598 + 0.458851168*_cse599 + 0.758601438*_cse600 + 0.458851168*_cse601 + 0.758601438*_cse602
+    _cse608 = _cse53*_cse607
+    _cse609 = _cse57*_cse607
+    _cse610 = 1.9561995392714e-6*_cse597 + 1.9561995392714e-6*_cse598 + 1.14610355371469e-6*_cse599 + 1.8987869684628e-6*_cse600 + 1.14610355371469e-6*_cse601 + 1.8987869684628e-6*_cse602 - 0.45478971*_cse605 - 0.890598824*_cse606 - 0.45478971*_cse608 - 0.890598824*_cse609
+    _cse611 = 0.213215245107779*_cse41*_cse607 + 0.403618758*_cse55*_cse603 + 0.403618758*_cse57*_cse607 - 0.334218649384678*_cse597 - 0.334218649384678*_cse598 - 0.19581293936857*_cse599 - 0.324409654194476*_cse600 - 0.19581293936857*_cse601 - 0.324409654194476*_cse602 - _cse603*_cse68 - 0.790154512*_cse605 - 0.790154512*_cse608
+    _cse612 = _cse129*_cse607 + _cse130*_cse97 + _cse133*_cse99 + 0.0499969558686132*_cse41*_cse607 - 0.0627091097210817*_cse597 - 0.0627091097210817*_cse598 - 0.0290982758960988*_cse599 - 0.0491638727803817*_cse600 - 0.0290982758960988*_cse601 - 0.0491638727803817*_cse602 + _cse603*_cse88 - 0.0499969558686132*_cse604 + 0.03790017976*_cse605 - 0.01872015456*_cse606 + 0.03790017976*_cse608 - 0.01872015456*_cse609 + x*(-_cse0*_cse611 - _cse610*_cse65) + y*(-_cse0*_cse610 + _cse611*_cse65) + z*(0.410149995883665*_cse41*_cse607 + 0.410879747*_cse43*_cse603 + 0.410879747*_cse53*_cse607 - 0.234017800844203*_cse597 - 0.234017800844203*_cse598 - 0.137106991283212*_cse599 - 0.227149603970304*_cse600 - 0.137106991283212*_cse601 - 0.227149603970304*_cse602 - 0.410149995883665*_cse604 - 0.209584432*_cse606 - 0.209584432*_cse609)
+    _cse613 = _cse183*x + _cse184*y
+    _cse614 = _cse173*_cse41
+    _cse615 = _cse173*_cse82
+    _cse616 = _cse173*_cse84
+    _cse617 = _cse177*_cse40
+    _cse618 = _cse177*_cse43
+    _cse619 = _cse177*_cse55
+    _cse620 = -0.890598824*_cse615 - 0.45478971*_cse616 - 0.45478971*_cse618 - 0.890598824*_cse619
+    _cse621 = -_cse173*_cse69 + 0.403618758*_cse173*_cse82 + 0.403618758*_cse177*_cse55 - _cse177*_cse68 - 0.790154512*_cse616 - 0.790154512*_cse618
+    _cse622 = _cse173*_cse81 + _cse177*_cse88 - 0.0499969558686132*_cse614 - 0.01872015456*_cse615 + 0.03790017976*_cse616 - 0.0499969558686132*_cse617 + 0.03790017976*_cse618 - 0.01872015456*_cse619 + x*(-_cse0*_cse621 - _cse620*_cse65) + y*(-_cse0*_cse620 + _cse621*_cse65) + z*(0.410879747*_cse173*_cse84 + 0.410879747*_cse177*_cse43 - 0.410149995883665*_cse614 - 0.209584432*_cse615 - 0.410149995883665*_cse617 - 0.209584432*_cse619)
+    _cse623 = _cse168*_cse20
+    _cse624 = _cse12*_cse412
+    _cse625 = _cse12*_cse414
+    _cse626 = _cse20*_cse21
+    _cse627 = 0.517383113*_cse12*_cse412 + 0.517383113*_cse20*_cse21 - 0.855753802*_cse623 - 0.855753802*_cse625
+    _cse628 = _cse40*_cse627
+    _cse629 = _cse43*_cse627
+    _cse630 = _cse55*_cse627
+    _cse631 = -_cse45 + _cse46 + 0.458851168*_cse623 + 0.758601438*_cse624 + 0.458851168*_cse625 + 0.758601438*_cse626
+    _cse632 = _cse53*_cse631
+    _cse633 = _cse57*_cse631
+    _cse634 = 0.234017800844203*_cse30
+    _cse635 = -_cse25 + _cse31 + 1.14610355371469e-6*_cse623 + 1.8987869684628e-6*_cse624 + 1.14610355371469e-6*_cse625 + 1.8987869684628e-6*_cse626 - 0.45478971*_cse629 - 0.890598824*_cse630 - 0.45478971*_cse632 - 0.890598824*_cse633
+    _cse636 = 0.213215245107779*_cse41*_cse631 + 0.403618758*_cse55*_cse627 + 0.403618758*_cse57*_cse631 - 0.19581293936857*_cse623 - 0.324409654194476*_cse624 - 0.19581293936857*_cse625 - 0.324409654194476*_cse626 - _cse627*_cse68 - 0.790154512*_cse629 - 0.790154512*_cse632 + _cse66 - _cse67
+    _cse637 = _cse94*x + _cse95*y
+    _cse638 = _cse39*_cse40
+    _cse639 = _cse39*_cse445
+    _cse640 = _cse39*_cse42
+    _cse641 = _cse41*_cse52
+    _cse642 = _cse52*_cse82
+    _cse643 = _cse52*_cse84
+    _cse644 = 0.410149995883665*_cse641
+    _cse645 = -0.890598824*_cse639 - 0.45478971*_cse640 - 0.890598824*_cse642 - 0.45478971*_cse643
+    _cse646 = 0.403618758*_cse639 - 0.790154512*_cse640 + 0.403618758*_cse642 - 0.790154512*_cse643 + _cse70
+    _cse647 = 0.999999998572139*_cse10 + 0.999999998572139*_cse7
+    _cse648 = -_cse647
+    _cse649 = _cse13*_cse648
+    _cse650 = 6.57617443000635e-7*_cse10 + 6.57617443000635e-7*_cse7
+    _cse651 = -_cse650
+    _cse652 = _cse14*_cse651
+    _cse653 = _cse26*_cse648
+    _cse654 = _cse15*_cse648
+    _cse655 = _cse22*_cse651
+    _cse656 = _cse28*_cse651
+    _cse657 = _cse33 - _cse36
+    _cse658 = 0.517383113*_cse15*_cse648 + 0.517383113*_cse22*_cse651 - 0.855753802*_cse653 - 0.855753802*_cse656 - _cse657
+    _cse659 = _cse43*_cse658
+    _cse660 = _cse55*_cse658
+    _cse661 = -_cse47 + _cse49 - 0.212878838804554*_cse649 + 0.212878838804554*_cse652 + 0.458851168*_cse653 + 0.758601438*_cse654 + 0.758601438*_cse655 + 0.458851168*_cse656
+    _cse662 = _cse53*_cse661
+    _cse663 = _cse57*_cse661
+    _cse664 = -_cse59 + _cse61 + 1.9561995392714e-6*_cse649 - 1.9561995392714e-6*_cse652 + 1.14610355371469e-6*_cse653 + 1.8987869684628e-6*_cse654 + 1.8987869684628e-6*_cse655 + 1.14610355371469e-6*_cse656 - 0.45478971*_cse659 - 0.890598824*_cse660 - 0.45478971*_cse662 - 0.890598824*_cse663
+    _cse665 = 0.334218649384678*_cse14*_cse651 + 0.213215245107779*_cse41*_cse661 + 0.403618758*_cse55*_cse658 + 0.403618758*_cse57*_cse661 - 0.334218649384678*_cse649 - 0.19581293936857*_cse653 - 0.324409654194476*_cse654 - 0.324409654194476*_cse655 - 0.19581293936857*_cse656 - _cse658*_cse68 - 0.790154512*_cse659 - 0.790154512*_cse662 + _cse71 - _cse73
+    _cse666 = x*(_cse0*_cse664 - _cse65*_cse665) + y*(-_cse0*_cse665 - _cse65*_cse664)
+    _cse667 = _cse41*_cse658
+    _cse668 = _cse658*_cse82
+    _cse669 = _cse658*_cse84
+    _cse670 = _cse40*_cse661
+    _cse671 = _cse43*_cse661
+    _cse672 = _cse55*_cse661
+    _cse673 = -0.890598824*_cse668 - 0.45478971*_cse669 - 0.45478971*_cse671 - 0.890598824*_cse672
+    _cse674 = 0.403618758*_cse55*_cse661 - _cse658*_cse69 + 0.403618758*_cse658*_cse82 - _cse661*_cse68 - 0.790154512*_cse669 - 0.790154512*_cse671
+    _cse675 = _cse658*_cse81 + _cse661*_cse88 - 0.0499969558686132*_cse667 - 0.01872015456*_cse668 + 0.03790017976*_cse669 - 0.0499969558686132*_cse670 + 0.03790017976*_cse671 - 0.01872015456*_cse672 + x*(-_cse0*_cse674 - _cse65*_cse673) + y*(-_cse0*_cse673 + _cse65*_cse674) + z*(0.410879747*_cse43*_cse661 + 0.410879747*_cse658*_cse84 - 0.410149995883665*_cse667 - 0.209584432*_cse668 - 0.410149995883665*_cse670 - 0.209584432*_cse672)
+    _cse676 = _cse14*_cse648
+    _cse677 = _cse13*_cse651
+    _cse678 = _cse168*_cse648
+    _cse679 = _cse21*_cse648
+    _cse680 = _cse26*_cse651
+    _cse681 = _cse15*_cse651
+    _cse682 = 0.517383113*_cse15*_cse651 + 0.517383113*_cse21*_cse648 - 0.855753802*_cse678 - 0.855753802*_cse680
+    _cse683 = _cse40*_cse682
+    _cse684 = _cse43*_cse682
+    _cse685 = _cse55*_cse682
+    _cse686 = -0.212878838804554*_cse676 - 0.212878838804554*_cse677 + 0.458851168*_cse678 + 0.758601438*_cse679 + 0.458851168*_cse680 + 0.758601438*_cse681
+    _cse687 = _cse53*_cse686
+    _cse688 = _cse57*_cse686
+    _cse689 = 1.9561995392714e-6*_cse676 + 1.9561995392714e-6*_cse677 + 1.14610355371469e-6*_cse678 + 1.8987869684628e-6*_cse679 + 1.14610355371469e-6*_cse680 + 1.8987869684628e-6*_cse681 - 0.45478971*_cse684 - 0.890598824*_cse685 - 0.45478971*_cse687 - 0.890598824*_cse688
+    _cse690 = 0.213215245107779*_cse41*_cse686 + 0.403618758*_cse55*_cse682 + 0.403618758*_cse57*_cse686 - 0.334218649384678*_cse676 - 0.334218649384678*_cse677 - 0.19581293936857*_cse678 - 0.324409654194476*_cse679 - _cse68*_cse682 - 0.19581293936857*_cse680 - 0.324409654194476*_cse681 - 0.790154512*_cse684 - 0.790154512*_cse687
+    _cse691 = _cse129*_cse686 + _cse130*_cse648 + _cse133*_cse651 + 0.0499969558686132*_cse41*_cse686 - 0.0627091097210817*_cse676 - 0.0627091097210817*_cse677 - 0.0290982758960988*_cse678 - 0.0491638727803817*_cse679 - 0.0290982758960988*_cse680 - 0.0491638727803817*_cse681 + _cse682*_cse88 - 0.0499969558686132*_cse683 + 0.03790017976*_cse684 - 0.01872015456*_cse685 + 0.03790017976*_cse687 - 0.01872015456*_cse688 + x*(-_cse0*_cse690 - _cse65*_cse689) + y*(-_cse0*_cse689 + _cse65*_cse690) + z*(0.410149995883665*_cse41*_cse686 + 0.410879747*_cse43*_cse682 + 0.410879747*_cse53*_cse686 - 0.234017800844203*_cse676 - 0.234017800844203*_cse677 - 0.137106991283212*_cse678 - 0.227149603970304*_cse679 - 0.137106991283212*_cse680 - 0.227149603970304*_cse681 - 0.410149995883665*_cse683 - 0.209584432*_cse685 - 0.209584432*_cse688)
+    _cse692 = 0.253888422522456*_cse7
+    _cse693 = 0.253888422522456*_cse10
+    _cse694 = -0.999999998572139*_cse32 + 0.999999998572139*_cse35
+    _cse695 = -_cse694
+    _cse696 = _cse13*_cse695
+    _cse697 = 0.0627091097210817*_cse696
+    _cse698 = -6.57617443000635e-7*_cse32 + 6.57617443000635e-7*_cse35
+    _cse699 = -_cse698
+    _cse700 = _cse14*_cse699
+    _cse701 = 0.0627091097210817*_cse700
+    _cse702 = _cse26*_cse695
+    _cse703 = _cse15*_cse695
+    _cse704 = _cse22*_cse699
+    _cse705 = _cse28*_cse699
+    _cse706 = 0.000346321299837637*_cse10 + 0.000346321299837637*_cse7
+    _cse707 = 0.517383113*_cse15*_cse695 + 0.517383113*_cse22*_cse699 - 0.855753802*_cse702 - 0.855753802*_cse705 - _cse706
+    _cse708 = _cse40*_cse707
+    _cse709 = 0.0499969558686132*_cse708
+    _cse710 = _cse43*_cse707
+    _cse711 = _cse55*_cse707
+    _cse712 = 0.818687841791724*_cse7
+    _cse713 = 0.818687841791724*_cse10
+    _cse714 = 0.212878838804554*_cse696
+    _cse715 = 0.212878838804554*_cse700
+    _cse716 = 0.458851168*_cse702 + 0.758601438*_cse703 + 0.758601438*_cse704 + 0.458851168*_cse705 + _cse712 + _cse713 - _cse714 + _cse715
+    _cse717 = _cse41*_cse716
+    _cse718 = 0.0499969558686132*_cse717
+    _cse719 = _cse53*_cse716
+    _cse720 = _cse57*_cse716
+    _cse721 = 0.329365488408814*_cse7
+    _cse722 = 0.329365488408814*_cse10
+    _cse723 = 0.234017800844203*_cse696
+    _cse724 = 0.234017800844203*_cse700
+    _cse725 = 0.410149995883665*_cse708
+    _cse726 = 0.410149995883665*_cse717
+    _cse727 = -1.9561995392714e-6*_cse696 + 1.9561995392714e-6*_cse700
+    _cse728 = 2.75322908921405e-6*_cse10 + 2.75322908921405e-6*_cse7
+    _cse729 = 1.8987869684628e-6*_cse15*_cse695 + 1.8987869684628e-6*_cse22*_cse699 + 1.14610355371469e-6*_cse26*_cse695 + 1.14610355371469e-6*_cse28*_cse699 - 0.45478971*_cse710 - 0.890598824*_cse711 - 0.45478971*_cse719 - 0.890598824*_cse720 - _cse727 - _cse728
+    _cse730 = 0.334218649384678*_cse696
+    _cse731 = 0.334218649384678*_cse700
+    _cse732 = 0.470391945795628*_cse10
+    _cse733 = 0.470391945795628*_cse7
+    _cse734 = _cse68*_cse707 - _cse69*_cse716
+    _cse735 = 0.403618758*_cse55*_cse707 + 0.403618758*_cse57*_cse716 - 0.19581293936857*_cse702 - 0.324409654194476*_cse703 - 0.324409654194476*_cse704 - 0.19581293936857*_cse705 - 0.790154512*_cse710 - 0.790154512*_cse719 - _cse730 + _cse731 + _cse732 + _cse733 - _cse734
+    _cse736 = _cse0*_cse729 - _cse65*_cse735
+    _cse737 = _cse0*_cse735 + _cse65*_cse729
+    _cse738 = _cse129*_cse716 + _cse131*_cse699 + _cse133*_cse695 + _cse135 + _cse137 + _cse138 - _cse139 + _cse692 + _cse693 - _cse697 + _cse701 - 0.0290982758960988*_cse702 - 0.0491638727803817*_cse703 - 0.0491638727803817*_cse704 - 0.0290982758960988*_cse705 + _cse707*_cse88 - _cse709 + 0.03790017976*_cse710 - 0.01872015456*_cse711 + _cse718 + 0.03790017976*_cse719 - 0.01872015456*_cse720 - _cse736*y - _cse737*x + z*(0.410879747*_cse43*_cse707 + 0.410879747*_cse53*_cse716 - 0.137106991283212*_cse702 - 0.227149603970304*_cse703 - 0.227149603970304*_cse704 - 0.137106991283212*_cse705 - 0.209584432*_cse711 - 0.209584432*_cse720 + _cse721 + _cse722 - _cse723 + _cse724 - _cse725 + _cse726)
+    _cse739 = _cse15*_cse694
+    _cse740 = _cse22*_cse698
+    _cse741 = _cse13*_cse694
+    _cse742 = _cse26*_cse694
+    _cse743 = _cse28*_cse698
+    _cse744 = _cse14*_cse698
+    _cse745 = _cse706 + 0.517383113*_cse739 + 0.517383113*_cse740 - 0.855753802*_cse742 - 0.855753802*_cse743
+    _cse746 = _cse43*_cse745
+    _cse747 = -_cse712 - _cse713 + 0.758601438*_cse739 + 0.758601438*_cse740 - 0.212878838804554*_cse741 + 0.458851168*_cse742 + 0.458851168*_cse743 + 0.212878838804554*_cse744
+    _cse748 = _cse53*_cse747
+    _cse749 = _cse55*_cse745
+    _cse750 = _cse57*_cse747
+    _cse751 = _cse728 + 1.8987869684628e-6*_cse739 + 1.8987869684628e-6*_cse740 + 1.9561995392714e-6*_cse741 + 1.14610355371469e-6*_cse742 + 1.14610355371469e-6*_cse743 - 1.9561995392714e-6*_cse744 - 0.45478971*_cse746 - 0.45478971*_cse748 - 0.890598824*_cse749 - 0.890598824*_cse750
+    _cse752 = 0.334218649384678*_cse14*_cse698 + 0.213215245107779*_cse41*_cse747 + 0.403618758*_cse55*_cse745 + 0.403618758*_cse57*_cse747 - _cse68*_cse745 - _cse732 - _cse733 - 0.324409654194476*_cse739 - 0.324409654194476*_cse740 - 0.334218649384678*_cse741 - 0.19581293936857*_cse742 - 0.19581293936857*_cse743 - 0.790154512*_cse746 - 0.790154512*_cse748
+    _cse753 = _cse40*_cse745
+    _cse754 = _cse129*_cse747 + _cse131*_cse698 + _cse133*_cse694 - _cse138 + _cse139 + 0.0499969558686132*_cse41*_cse747 - _cse692 - _cse693 - 0.0491638727803817*_cse739 - 0.0491638727803817*_cse740 - 0.0627091097210817*_cse741 - 0.0290982758960988*_cse742 - 0.0290982758960988*_cse743 + 0.0627091097210817*_cse744 + _cse745*_cse88 + 0.03790017976*_cse746 + 0.03790017976*_cse748 - 0.01872015456*_cse749 - 0.01872015456*_cse750 - 0.0499969558686132*_cse753 + x*(-_cse0*_cse752 - _cse65*_cse751) + y*(-_cse0*_cse751 + _cse65*_cse752) + z*(0.234017800844203*_cse14*_cse698 + 0.410149995883665*_cse41*_cse747 + 0.410879747*_cse43*_cse745 + 0.410879747*_cse53*_cse747 - _cse721 - _cse722 - 0.227149603970304*_cse739 - 0.227149603970304*_cse740 - 0.234017800844203*_cse741 - 0.137106991283212*_cse742 - 0.137106991283212*_cse743 - 0.209584432*_cse749 - 0.209584432*_cse750 - 0.410149995883665*_cse753)
+    _cse755 = _cse14*_cse650
+    _cse756 = _cse13*_cse647
+    _cse757 = _cse22*_cse650
+    _cse758 = _cse28*_cse650
+    _cse759 = _cse26*_cse647
+    _cse760 = _cse15*_cse647
+    _cse761 = _cse657 + 0.517383113*_cse757 - 0.855753802*_cse758 - 0.855753802*_cse759 + 0.517383113*_cse760
+    _cse762 = _cse43*_cse761
+    _cse763 = _cse55*_cse761
+    _cse764 = _cse47 - _cse49 + 0.212878838804554*_cse755 - 0.212878838804554*_cse756 + 0.758601438*_cse757 + 0.458851168*_cse758 + 0.458851168*_cse759 + 0.758601438*_cse760
+    _cse765 = _cse53*_cse764
+    _cse766 = _cse57*_cse764
+    _cse767 = _cse59 - _cse61 - 1.9561995392714e-6*_cse755 + 1.9561995392714e-6*_cse756 + 1.8987869684628e-6*_cse757 + 1.14610355371469e-6*_cse758 + 1.14610355371469e-6*_cse759 + 1.8987869684628e-6*_cse760 - 0.45478971*_cse762 - 0.890598824*_cse763 - 0.45478971*_cse765 - 0.890598824*_cse766
+    _cse768 = 0.334218649384678*_cse14*_cse650 + 0.213215245107779*_cse41*_cse764 + 0.403618758*_cse55*_cse761 + 0.403618758*_cse57*_cse764 - _cse68*_cse761 - _cse71 + _cse73 - 0.334218649384678*_cse756 - 0.324409654194476*_cse757 - 0.19581293936857*_cse758 - 0.19581293936857*_cse759 - 0.324409654194476*_cse760 - 0.790154512*_cse762 - 0.790154512*_cse765
+    _cse769 = x*(_cse0*_cse767 - _cse65*_cse768) + y*(-_cse0*_cse768 - _cse65*_cse767)
+    _cse770 = _cse41*_cse761
+    _cse771 = _cse761*_cse82
+    _cse772 = _cse761*_cse84
+    _cse773 = _cse40*_cse764
+    _cse774 = _cse43*_cse764
+    _cse775 = _cse55*_cse764
+    _cse776 = -0.890598824*_cse771 - 0.45478971*_cse772 - 0.45478971*_cse774 - 0.890598824*_cse775
+    _cse777 = 0.403618758*_cse55*_cse764 - _cse68*_cse764 - _cse69*_cse761 + 0.403618758*_cse761*_cse82 - 0.790154512*_cse772 - 0.790154512*_cse774
+    _cse778 = _cse761*_cse81 + _cse764*_cse88 - 0.0499969558686132*_cse770 - 0.01872015456*_cse771 + 0.03790017976*_cse772 - 0.0499969558686132*_cse773 + 0.03790017976*_cse774 - 0.01872015456*_cse775 + x*(-_cse0*_cse777 - _cse65*_cse776) + y*(-_cse0*_cse776 + _cse65*_cse777) + z*(0.410879747*_cse43*_cse764 + 0.410879747*_cse761*_cse84 - 0.410149995883665*_cse770 - 0.209584432*_cse771 - 0.410149995883665*_cse773 - 0.209584432*_cse775)
+    _cse779 = _cse13*_cse650
+    _cse780 = _cse14*_cse647
+    _cse781 = _cse26*_cse650
+    _cse782 = _cse15*_cse650
+    _cse783 = _cse168*_cse647
+    _cse784 = _cse21*_cse647
+    _cse785 = 0.517383113*_cse15*_cse650 + 0.517383113*_cse21*_cse647 - 0.855753802*_cse781 - 0.855753802*_cse783
+    _cse786 = _cse40*_cse785
+    _cse787 = _cse43*_cse785
+    _cse788 = _cse55*_cse785
+    _cse789 = -0.212878838804554*_cse779 - 0.212878838804554*_cse780 + 0.458851168*_cse781 + 0.758601438*_cse782 + 0.458851168*_cse783 + 0.758601438*_cse784
+    _cse790 = _cse53*_cse789
+    _cse791 = _cse57*_cse789
+    _cse792 = 1.9561995392714e-6*_cse779 + 1.9561995392714e-6*_cse780 + 1.14610355371469e-6*_cse781 + 1.8987869684628e-6*_cse782 + 1.14610355371469e-6*_cse783 + 1.8987869684628e-6*_cse784 - 0.45478971*_cse787 - 0.890598824*_cse788 - 0.45478971*_cse790 - 0.890598824*_cse791
+    _cse793 = 0.213215245107779*_cse41*_cse789 + 0.403618758*_cse55*_cse785 + 0.403618758*_cse57*_cse789 - _cse68*_cse785 - 0.334218649384678*_cse779 - 0.334218649384678*_cse780 - 0.19581293936857*_cse781 - 0.324409654194476*_cse782 - 0.19581293936857*_cse783 - 0.324409654194476*_cse784 - 0.790154512*_cse787 - 0.790154512*_cse790
+    _cse794 = _cse129*_cse789 + _cse130*_cse647 + _cse133*_cse650 + 0.0499969558686132*_cse41*_cse789 - 0.0627091097210817*_cse779 - 0.0627091097210817*_cse780 - 0.0290982758960988*_cse781 - 0.0491638727803817*_cse782 - 0.0290982758960988*_cse783 - 0.0491638727803817*_cse784 + _cse785*_cse88 - 0.0499969558686132*_cse786 + 0.03790017976*_cse787 - 0.01872015456*_cse788 + 0.03790017976*_cse790 - 0.01872015456*_cse791 + x*(-_cse0*_cse793 - _cse65*_cse792) + y*(-_cse0*_cse792 + _cse65*_cse793) + z*(0.410149995883665*_cse41*_cse789 + 0.410879747*_cse43*_cse785 + 0.410879747*_cse53*_cse789 - 0.234017800844203*_cse779 - 0.234017800844203*_cse780 - 0.137106991283212*_cse781 - 0.227149603970304*_cse782 - 0.137106991283212*_cse783 - 0.227149603970304*_cse784 - 0.410149995883665*_cse786 - 0.209584432*_cse788 - 0.209584432*_cse791)
+    _cse795 = _cse14*_cse695
+    _cse796 = _cse13*_cse699
+    _cse797 = _cse168*_cse695
+    _cse798 = _cse21*_cse695
+    _cse799 = _cse26*_cse699
+    _cse800 = _cse15*_cse699
+    _cse801 = 0.517383113*_cse15*_cse699 + 0.517383113*_cse21*_cse695 - 0.855753802*_cse797 - 0.855753802*_cse799
+    _cse802 = _cse43*_cse801
+    _cse803 = _cse55*_cse801
+    _cse804 = -0.212878838804554*_cse795 - 0.212878838804554*_cse796 + 0.458851168*_cse797 + 0.758601438*_cse798 + 0.458851168*_cse799 + 0.758601438*_cse800
+    _cse805 = _cse53*_cse804
+    _cse806 = _cse57*_cse804
+    _cse807 = 1.9561995392714e-6*_cse795 + 1.9561995392714e-6*_cse796 + 1.14610355371469e-6*_cse797 + 1.8987869684628e-6*_cse798 + 1.14610355371469e-6*_cse799 + 1.8987869684628e-6*_cse800 - 0.45478971*_cse802 - 0.890598824*_cse803 - 0.45478971*_cse805 - 0.890598824*_cse806
+    _cse808 = 0.213215245107779*_cse41*_cse804 + 0.403618758*_cse55*_cse801 + 0.403618758*_cse57*_cse804 - _cse68*_cse801 - 0.334218649384678*_cse795 - 0.334218649384678*_cse796 - 0.19581293936857*_cse797 - 0.324409654194476*_cse798 - 0.19581293936857*_cse799 - 0.324409654194476*_cse800 - 0.790154512*_cse802 - 0.790154512*_cse805
+    _cse809 = x*(_cse0*_cse807 - _cse65*_cse808) + y*(-_cse0*_cse808 - _cse65*_cse807)
+    _cse810 = _cse41*_cse801
+    _cse811 = _cse801*_cse82
+    _cse812 = _cse801*_cse84
+    _cse813 = _cse40*_cse804
+    _cse814 = _cse43*_cse804
+    _cse815 = _cse55*_cse804
+    _cse816 = -0.890598824*_cse811 - 0.45478971*_cse812 - 0.45478971*_cse814 - 0.890598824*_cse815
+    _cse817 = 0.403618758*_cse55*_cse804 - _cse68*_cse804 - _cse69*_cse801 + 0.403618758*_cse801*_cse82 - 0.790154512*_cse812 - 0.790154512*_cse814
+    _cse818 = _cse801*_cse81 + _cse804*_cse88 - 0.0499969558686132*_cse810 - 0.01872015456*_cse811 + 0.03790017976*_cse812 - 0.0499969558686132*_cse813 + 0.03790017976*_cse814 - 0.01872015456*_cse815 + x*(-_cse0*_cse817 - _cse65*_cse816) + y*(-_cse0*_cse816 + _cse65*_cse817) + z*(0.410879747*_cse43*_cse804 + 0.410879747*_cse801*_cse84 - 0.410149995883665*_cse810 - 0.209584432*_cse811 - 0.410149995883665*_cse813 - 0.209584432*_cse815)
+    _cse819 = _cse412*_cse695
+    _cse820 = _cse414*_cse695
+    _cse821 = _cse168*_cse699
+    _cse822 = _cse21*_cse699
+    _cse823 = 0.517383113*_cse819 - 0.855753802*_cse820 - 0.855753802*_cse821 + 0.517383113*_cse822
+    _cse824 = _cse40*_cse823
+    _cse825 = _cse43*_cse823
+    _cse826 = _cse55*_cse823
+    _cse827 = _cse714 - _cse715 + 0.758601438*_cse819 + 0.458851168*_cse820 + 0.458851168*_cse821 + 0.758601438*_cse822
+    _cse828 = _cse53*_cse827
+    _cse829 = _cse57*_cse827
+    _cse830 = _cse727 + 1.8987869684628e-6*_cse819 + 1.14610355371469e-6*_cse820 + 1.14610355371469e-6*_cse821 + 1.8987869684628e-6*_cse822 - 0.45478971*_cse825 - 0.890598824*_cse826 - 0.45478971*_cse828 - 0.890598824*_cse829
+    _cse831 = 0.213215245107779*_cse41*_cse827 + 0.403618758*_cse55*_cse823 + 0.403618758*_cse57*_cse827 - _cse68*_cse823 + _cse730 - _cse731 - 0.324409654194476*_cse819 - 0.19581293936857*_cse820 - 0.19581293936857*_cse821 - 0.324409654194476*_cse822 - 0.790154512*_cse825 - 0.790154512*_cse828
+    _cse832 = _cse707*_cse82
+    _cse833 = _cse707*_cse84
+    _cse834 = _cse43*_cse716
+    _cse835 = _cse55*_cse716
+    _cse836 = -0.890598824*_cse832 - 0.45478971*_cse833 - 0.45478971*_cse834 - 0.890598824*_cse835
+    _cse837 = 0.403618758*_cse55*_cse716 - _cse68*_cse716 - _cse69*_cse707 + 0.403618758*_cse707*_cse82 - 0.790154512*_cse833 - 0.790154512*_cse834
+    _cse838 = x*(_cse0*_cse836 - _cse65*_cse837) + y*(-_cse0*_cse837 - _cse65*_cse836)
+    _cse839 = _cse445*_cse707
+    _cse840 = _cse42*_cse707
+    _cse841 = _cse716*_cse82
+    _cse842 = _cse716*_cse84
+    _cse843 = -0.890598824*_cse839 - 0.45478971*_cse840 - 0.890598824*_cse841 - 0.45478971*_cse842
+    _cse844 = _cse734 + 0.403618758*_cse839 - 0.790154512*_cse840 + 0.403618758*_cse841 - 0.790154512*_cse842
+    _cse845 = _cse1*dq0
+    _cse846 = _cse233 + _cse235
+    _cse847 = 0.574238819026787*_cse235
+    _cse848 = 0.574238819026787*_cse233
+    _cse849 = 0.410149995883665*_cse41
+    _cse850 = 0.410149995883665*_cse40
+    _cse851 = _cse3*dq0
+    _cse852 = _cse106 + _cse108
+    _cse853 = 0.574238819026787*_cse108
+    _cse854 = 0.574238819026787*_cse106
+    _cse855 = -_cse32 + _cse35
+    _cse856 = 0.574238819026787*_cse35
+    _cse857 = 0.574238819026787*_cse32
+    _cse858 = 0.329365488408814*_cse35
+    _cse859 = 0.329365488408814*_cse32
+    out = np.empty((6, 6))
+    out[0, 0] = _cse141*dq2 + _cse165*dq1 + _cse185*dq3 + _cse79*dq5 + _cse96*dq4 + dq0*(_cse1*_cse226 - 4.3259e-5*_cse1 + _cse129*_cse204 + _cse131*_cse190 + _cse133*_cse187 - 0.0491638727803817*_cse188 - 0.0491638727803817*_cse191 - 0.0627091097210817*_cse192 - 0.0290982758960988*_cse193 - 0.0290982758960988*_cse194 + 0.0627091097210817*_cse195 + _cse199*_cse88 + 0.03790017976*_cse200 + 0.0499969558686132*_cse204*_cse41 + 0.03790017976*_cse205 - 0.01872015456*_cse206 - 0.01872015456*_cse207 - 0.0499969558686132*_cse212 + _cse217*x - _cse218*y - _cse224*z + 1.098e-6*_cse227 - _cse229 - _cse230 - _cse231 + _cse238 + 0.0068032576553314*_cse3)
+    out[0, 1] = _cse165*dq0 + _cse263*dq5 + _cse272*dq4 + _cse288*dq3 + _cse311*dq2 + dq1*(-_cse1*_cse225 + 1.098e-6*_cse1*_cse8 + _cse129*_cse320 + _cse131*_cse189 + _cse133*_cse186 + 0.0627091097210817*_cse14*_cse189 - _cse229 - _cse231 - _cse310 + 0.03790017976*_cse318*_cse43 + _cse318*_cse88 + 0.0499969558686132*_cse320*_cse41 + 0.03790017976*_cse320*_cse53 + _cse326*x + _cse327*y + _cse329*z - _cse330 - _cse331 - _cse332 - _cse333 - _cse334 - _cse335 - _cse336 - _cse337)
+    out[0, 2] = _cse141*dq0 + _cse311*dq1 + _cse356*dq5 + _cse365*dq4 + _cse381*dq3 + dq2*(_cse129*_cse320 + _cse131*_cse189 + _cse133*_cse186 + _cse227*_cse382 + _cse238 + _cse309 + 0.0627091097210817*_cse317 + _cse318*_cse88 + 0.03790017976*_cse319 + 0.0499969558686132*_cse320*_cse41 + 0.03790017976*_cse321 + _cse326*x + _cse327*y + _cse329*z - _cse330 - _cse331 - _cse332 - _cse333 - _cse334 - _cse335 - _cse336 - _cse337)
+    out[0, 3] = _cse185*dq0 + _cse288*dq1 + _cse381*dq2 + _cse399*dq5 + _cse408*dq4 + dq3*(_cse129*_cse423 + _cse130*_cse385 + _cse132*_cse383 + 0.0627091097210817*_cse409 + 0.0499969558686132*_cse41*_cse423 - 0.0627091097210817*_cse410 - 0.0290982758960988*_cse411 - 0.0491638727803817*_cse413 - 0.0290982758960988*_cse415 - 0.0491638727803817*_cse416 + _cse417*_cse88 - 0.0499969558686132*_cse418 + 0.03790017976*_cse419 - 0.01872015456*_cse420 + 0.03790017976*_cse424 - 0.01872015456*_cse425 + x*(-_cse0*_cse431 - _cse428*_cse65) + y*(-_cse0*_cse428 + _cse431*_cse65) + z*(0.234017800844203*_cse13*_cse383 + 0.410149995883665*_cse41*_cse423 - 0.234017800844203*_cse410 - 0.137106991283212*_cse411 - 0.227149603970304*_cse413 - 0.137106991283212*_cse415 - 0.227149603970304*_cse416 + 0.410879747*_cse417*_cse43 - 0.410149995883665*_cse418 - 0.209584432*_cse420 + 0.410879747*_cse423*_cse53 - 0.209584432*_cse425))
+    out[0, 4] = _cse272*dq1 + _cse365*dq2 + _cse408*dq3 + _cse444*dq5 + _cse96*dq0 + dq4*(0.0499969558686132*_cse40*_cse436 + _cse436*_cse87 + _cse439*_cse81 - 0.01872015456*_cse446 + 0.03790017976*_cse447 - 0.0499969558686132*_cse448 - 0.01872015456*_cse449 + 0.03790017976*_cse450 + x*(-_cse0*_cse453 - _cse451*_cse65) + y*(-_cse0*_cse451 + _cse453*_cse65) + z*(0.410149995883665*_cse40*_cse436 + 0.410879747*_cse42*_cse436 + 0.410879747*_cse439*_cse84 - 0.209584432*_cse446 - 0.410149995883665*_cse448 - 0.209584432*_cse449))
+    out[0, 5] = _cse263*dq1 + _cse356*dq2 + _cse399*dq3 + _cse444*dq4 + _cse79*dq0 + dq5*(x*(_cse0*_cse457 + _cse456*_cse65) + y*(_cse0*_cse456 - _cse457*_cse65))
+    out[1, 0] = _cse458*dq5 + _cse467*dq4 + _cse473*dq2 + _cse476*dq1 + _cse492*dq3 + dq0*(0.0068032576553314*_cse1 + _cse129*_cse504 + _cse131*_cse495 + _cse133*_cse493 - _cse226*_cse3 + 4.3259e-5*_cse3 + 0.0499969558686132*_cse41*_cse504 - 0.0491638727803817*_cse494 - 0.0491638727803817*_cse496 - 0.0627091097210817*_cse497 - 0.0290982758960988*_cse498 - 0.0290982758960988*_cse499 + 0.0627091097210817*_cse500 + _cse501*_cse88 + 0.03790017976*_cse502 + 0.03790017976*_cse505 - 0.01872015456*_cse506 - 0.01872015456*_cse507 - 0.0499969558686132*_cse512 + _cse522 + _cse524 + x*(-_cse0*_cse511 - _cse509*_cse65) + y*(-_cse0*_cse509 + _cse511*_cse65) + z*(0.234017800844203*_cse14*_cse495 + 0.410149995883665*_cse41*_cse504 + 0.410879747*_cse43*_cse501 - 0.227149603970304*_cse494 - 0.227149603970304*_cse496 - 0.234017800844203*_cse497 - 0.137106991283212*_cse498 - 0.137106991283212*_cse499 + 0.410879747*_cse504*_cse53 - 0.209584432*_cse506 - 0.209584432*_cse507 - 0.410149995883665*_cse512 - _cse517))
+    out[1, 1] = _cse476*dq0 + _cse525*dq5 + _cse534*dq4 + _cse550*dq3 + _cse568*dq2 + dq1*(_cse225*_cse3 + _cse524 + _cse586)
+    out[1, 2] = _cse473*dq0 + _cse568*dq1 + _cse587*dq5 + _cse596*dq4 + _cse612*dq3 + dq2*(-_cse105*_cse382 - _cse551 + _cse586)
+    out[1, 3] = _cse492*dq0 + _cse550*dq1 + _cse612*dq2 + _cse613*dq5 + _cse622*dq4 + dq3*(_cse12*_cse132 + _cse129*_cse631 + _cse130*_cse20 + 0.0627091097210817*_cse24 - 0.0627091097210817*_cse30 + 0.0499969558686132*_cse41*_cse631 - 0.0290982758960988*_cse623 - 0.0491638727803817*_cse624 - 0.0290982758960988*_cse625 - 0.0491638727803817*_cse626 + _cse627*_cse88 - 0.0499969558686132*_cse628 + 0.03790017976*_cse629 - 0.01872015456*_cse630 + 0.03790017976*_cse632 - 0.01872015456*_cse633 + x*(-_cse0*_cse636 - _cse635*_cse65) + y*(-_cse0*_cse635 + _cse636*_cse65) + z*(0.234017800844203*_cse12*_cse13 + 0.410149995883665*_cse41*_cse631 + 0.410879747*_cse43*_cse627 + 0.410879747*_cse53*_cse631 - 0.137106991283212*_cse623 - 0.227149603970304*_cse624 - 0.137106991283212*_cse625 - 0.227149603970304*_cse626 - 0.410149995883665*_cse628 - 0.209584432*_cse630 - 0.209584432*_cse633 - _cse634))
+    out[1, 4] = _cse467*dq0 + _cse534*dq1 + _cse596*dq2 + _cse622*dq3 + _cse637*dq5 + dq4*(_cse39*_cse87 + _cse52*_cse81 + 0.0499969558686132*_cse638 - 0.01872015456*_cse639 + 0.03790017976*_cse640 - 0.0499969558686132*_cse641 - 0.01872015456*_cse642 + 0.03790017976*_cse643 + x*(-_cse0*_cse646 - _cse645*_cse65) + y*(-_cse0*_cse645 + _cse646*_cse65) + z*(0.410149995883665*_cse39*_cse40 + 0.410879747*_cse39*_cse42 + 0.410879747*_cse52*_cse84 - 0.209584432*_cse639 - 0.209584432*_cse642 - _cse644))
+    out[1, 5] = _cse458*dq0 + _cse525*dq1 + _cse587*dq2 + _cse613*dq3 + _cse637*dq4 + dq5*(_cse77*y + _cse78*x)
+    out[2, 0] = 0
+    out[2, 1] = _cse666*dq5 + _cse675*dq4 + _cse691*dq3 + _cse738*dq2 + dq1*(-_cse137 + _cse164 - 0.001950802*_cse5 + _cse754 + 0.41405*_cse8)
+    out[2, 2] = _cse738*dq1 + _cse769*dq5 + _cse778*dq4 + _cse794*dq3 + dq2*(-_cse135 + _cse382*_cse5 + _cse754)
+    out[2, 3] = _cse691*dq1 + _cse794*dq2 + _cse809*dq5 + _cse818*dq4 + dq3*(_cse129*_cse827 + _cse130*_cse699 + _cse132*_cse695 + 0.0499969558686132*_cse41*_cse827 + _cse697 - _cse701 - 0.0491638727803817*_cse819 - 0.0290982758960988*_cse820 - 0.0290982758960988*_cse821 - 0.0491638727803817*_cse822 + _cse823*_cse88 - 0.0499969558686132*_cse824 + 0.03790017976*_cse825 - 0.01872015456*_cse826 + 0.03790017976*_cse828 - 0.01872015456*_cse829 + x*(-_cse0*_cse831 - _cse65*_cse830) + y*(-_cse0*_cse830 + _cse65*_cse831) + z*(0.410149995883665*_cse41*_cse827 + 0.410879747*_cse43*_cse823 + 0.410879747*_cse53*_cse827 + _cse723 - _cse724 - 0.227149603970304*_cse819 - 0.137106991283212*_cse820 - 0.137106991283212*_cse821 - 0.227149603970304*_cse822 - 0.410149995883665*_cse824 - 0.209584432*_cse826 - 0.209584432*_cse829))
+    out[2, 4] = _cse675*dq1 + _cse778*dq2 + _cse818*dq3 + _cse838*dq5 + dq4*(_cse707*_cse87 + _cse709 + _cse716*_cse81 - _cse718 - 0.01872015456*_cse839 + 0.03790017976*_cse840 - 0.01872015456*_cse841 + 0.03790017976*_cse842 + x*(-_cse0*_cse844 - _cse65*_cse843) + y*(-_cse0*_cse843 + _cse65*_cse844) + z*(0.410879747*_cse42*_cse707 + 0.410879747*_cse716*_cse84 + _cse725 - _cse726 - 0.209584432*_cse839 - 0.209584432*_cse841))
+    out[2, 5] = _cse666*dq1 + _cse769*dq2 + _cse809*dq3 + _cse838*dq4 + dq5*(_cse736*y + _cse737*x)
+    out[3, 0] = 0
+    out[3, 1] = -_cse845
+    out[3, 2] = _cse845
+    out[3, 3] = _cse846*dq1 - _cse846*dq2 + dq0*(_cse3*_cse6*_cse8 - _cse513)
+    out[3, 4] = dq0*(0.3960285*_cse16 + 0.3960285*_cse23 + 0.408002994597976*_cse24 + 0.239041914*_cse27 + 0.239041914*_cse29 - 0.408002994597976*_cse30 - 0.574238819026787*_cse513 + 0.574238819026787*_cse515) + dq1*(0.3960285*_cse240 + 0.3960285*_cse242 + 0.408002994597976*_cse243 + 0.239041914*_cse244 + 0.239041914*_cse245 - 0.408002994597976*_cse246 + _cse847 + _cse848) + dq2*(-0.408002994597976*_cse339 + 0.239041914*_cse341 + 0.239041914*_cse342 + 0.408002994597976*_cse345 + 0.3960285*_cse346 + 0.3960285*_cse347 - _cse847 - _cse848) + dq3*(0.408002994597976*_cse384 + 0.408002994597976*_cse386 + 0.239041914*_cse387 + 0.239041914*_cse388 + 0.3960285*_cse389 + 0.3960285*_cse390)
+    out[3, 5] = _cse471*dq1 + _cse475*dq2 + dq0*(0.227149603970304*_cse16 + 0.227149603970304*_cse23 + 0.234017800844203*_cse24 + 0.137106991283212*_cse27 + 0.137106991283212*_cse29 - 0.410879747*_cse44 - 0.410879747*_cse54 + 0.209584432*_cse56 + _cse565 + 0.209584432*_cse58 - _cse634 + 0.410149995883665*_cse638 - _cse644) + dq3*(0.234017800844203*_cse384 + 0.234017800844203*_cse386 + 0.137106991283212*_cse387 + 0.137106991283212*_cse388 + 0.227149603970304*_cse389 + 0.227149603970304*_cse390 + _cse391*_cse850 - 0.410879747*_cse392 + 0.209584432*_cse393 - _cse394*_cse849 - 0.410879747*_cse395 + 0.209584432*_cse396) + dq4*(_cse436*_cse849 + 0.209584432*_cse437 - 0.410879747*_cse438 + _cse439*_cse850 - 0.410879747*_cse440 + 0.209584432*_cse441)
+    out[4, 0] = 0
+    out[4, 1] = _cse851
+    out[4, 2] = -_cse851
+    out[4, 3] = -_cse852*dq1 + _cse852*dq2 + dq0*(_cse1*_cse6*_cse8 - _cse221)
+    out[4, 4] = dq0*(0.3960285*_cse188 + 0.3960285*_cse191 + 0.408002994597976*_cse192 + 0.239041914*_cse193 + 0.239041914*_cse194 - 0.408002994597976*_cse195 + 0.574238819026787*_cse219 - 0.574238819026787*_cse221) + dq1*(-0.408002994597976*_cse143 + 0.239041914*_cse145 + 0.239041914*_cse146 + 0.408002994597976*_cse149 + 0.3960285*_cse150 + 0.3960285*_cse151 - _cse853 - _cse854) + dq2*(0.3960285*_cse100 + 0.408002994597976*_cse101 + 0.239041914*_cse102 + 0.239041914*_cse103 - 0.408002994597976*_cse104 + _cse853 + _cse854 + 0.3960285*_cse98) + dq3*(0.408002994597976*_cse166 + 0.408002994597976*_cse167 + 0.239041914*_cse169 + 0.239041914*_cse170 + 0.3960285*_cse171 + 0.3960285*_cse172)
+    out[4, 5] = _cse128*dq2 + _cse161*dq1 + _cse180*dq3 + _cse224*dq0 + _cse91*dq4
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = _cse855*dq1 - _cse855*dq2
+    out[5, 4] = dq1*(0.408002994597976*_cse649 - 0.408002994597976*_cse652 + 0.239041914*_cse653 + 0.3960285*_cse654 + 0.3960285*_cse655 + 0.239041914*_cse656 + _cse856 - _cse857) + dq2*(-0.408002994597976*_cse755 + 0.408002994597976*_cse756 + 0.3960285*_cse757 + 0.239041914*_cse758 + 0.239041914*_cse759 + 0.3960285*_cse760 - _cse856 + _cse857) + dq3*(0.408002994597976*_cse795 + 0.408002994597976*_cse796 + 0.239041914*_cse797 + 0.3960285*_cse798 + 0.239041914*_cse799 + 0.3960285*_cse800)
+    out[5, 5] = dq1*(0.234017800844203*_cse649 - 0.234017800844203*_cse652 + 0.137106991283212*_cse653 + 0.227149603970304*_cse654 + 0.227149603970304*_cse655 + 0.137106991283212*_cse656 + _cse658*_cse850 - 0.410879747*_cse659 + 0.209584432*_cse660 - _cse661*_cse849 - 0.410879747*_cse662 + 0.209584432*_cse663 + _cse858 - _cse859) + dq2*(-0.234017800844203*_cse755 + 0.234017800844203*_cse756 + 0.227149603970304*_cse757 + 0.137106991283212*_cse758 + 0.137106991283212*_cse759 + 0.227149603970304*_cse760 + _cse761*_cse850 - 0.410879747*_cse762 + 0.209584432*_cse763 - _cse764*_cse849 - 0.410879747*_cse765 + 0.209584432*_cse766 - _cse858 + _cse859) + dq3*(0.234017800844203*_cse795 + 0.234017800844203*_cse796 + 0.137106991283212*_cse797 + 0.227149603970304*_cse798 + 0.137106991283212*_cse799 + 0.227149603970304*_cse800 + _cse801*_cse850 - 0.410879747*_cse802 + 0.209584432*_cse803 - _cse804*_cse849 - 0.410879747*_cse805 + 0.209584432*_cse806) + dq4*(_cse707*_cse849 + _cse716*_cse850 + 0.209584432*_cse832 - 0.410879747*_cse833 - 0.410879747*_cse834 + 0.209584432*_cse835)
+    return out
+
+
+FUNCTIONS = {
+    'M': function0,
+    'g': function1,
+    'Gamma': function2,
+    'joint0[0,0,0]_Tx': function3,
+    'joint0[0,0,0]_J': function4,
+    'joint0[0,0,0]_dJ': function5,
+    'joint1[0,0,0]_Tx': function6,
+    'joint1[0,0,0]_J': function7,
+    'joint1[0,0,0]_dJ': function8,
+    'joint2[0,0,0]_Tx': function9,
+    'joint2[0,0,0]_J': function10,
+    'joint2[0,0,0]_dJ': function11,
+    'joint3[0,0,0]_Tx': function12,
+    'joint3[0,0,0]_J': function13,
+    'joint3[0,0,0]_dJ': function14,
+    'joint4[0,0,0]_Tx': function15,
+    'joint4[0,0,0]_J': function16,
+    'joint4[0,0,0]_dJ': function17,
+    'joint5[0,0,0]_Tx': function18,
+    'joint5[0,0,0]_J': function19,
+    'joint5[0,0,0]_dJ': function20,
+    'link0[0,0,0]_Tx': function21,
+    'link0[0,0,0]_J': function22,
+    'link0[0,0,0]_dJ': function23,
+    'link1[0,0,0]_Tx': function24,
+    'link1[0,0,0]_J': function25,
+    'link1[0,0,0]_dJ': function26,
+    'link2[0,0,0]_Tx': function27,
+    'link2[0,0,0]_J': function28,
+    'link2[0,0,0]_dJ': function29,
+    'link3[0,0,0]_Tx': function30,
+    'link3[0,0,0]_J': function31,
+    'link3[0,0,0]_dJ': function32,
+    'link4[0,0,0]_Tx': function33,
+    'link4[0,0,0]_J': function34,
+    'link4[0,0,0]_dJ': function35,
+    'link5[0,0,0]_Tx': function36,
+    'link5[0,0,0]_J': function37,
+    'link5[0,0,0]_dJ': function38,
+    'link6[0,0,0]_Tx': function39,
+    'link6[0,0,0]_J': function40,
+    'link6[0,0,0]_dJ': function41,
+    'EE[0,0,0]_Tx': function42,
+    'EE[0,0,0]_J': function43,
+    'EE[0,0,0]_dJ': function44,
+    'EE_Tx': function45,
+    'EE_J': function46,
+    'EE_dJ': function47,
+}
@@ -0,0 +1,571 @@
+"""
+Robot configs for serial arms described by Denavit-Hartenberg (DH) or
+product of exponentials (POE) parameters
+
+The kinematics and the inertia and gravity terms are calculated directly
+with numpy, so there is no generation time, and every accessor also takes
+joint angles of shape (K, N_JOINTS) to evaluate a batch. The same chain is
+built in SymPy for the terms that are generated by BaseConfig, such as the
+centripetal and Coriolis forces, so these stay consistent.
+
+Frames are named as in the other configs: 'link0' is the base, 'joint%i'
+is the frame that joint i rotates about, 'link%i' is the center of mass of
+the link moved by joint i-1, and 'EE' is the end-effector.
+
+Example usage:
+
+    from abr_control.arms.numeric_config import DHConfig
+
+    robot_config = DHConfig(
+        DH=[[0, 0.089, 0, np.pi/2],
+            [0, 0, -0.425, 0],
+            [0, 0, -0.392, 0]],
+        M_LINKS=[np.diag([1, 1, 1, .02, .02, .02])] * 4,
+        ROBOT_NAME='dh_arm')
+    J = robot_config.J('EE', q)
+"""
+import hashlib
+
+import numpy as np
+import sympy as sp
+
+from .base_config import BaseConfig
+
+
+def _skew(w):
+    """ Returns the cross product matrices of an array of 3D vectors """
+
+    w = np.asarray(w)
+    skew = np.zeros(w.shape[:-1] + (3, 3))
+    skew[..., 0, 1] = -w[..., 2]
+    skew[..., 0, 2] = w[..., 1]
+    skew[..., 1, 0] = w[..., 2]
+    skew[..., 1, 2] = -w[..., 0]
+    skew[..., 2, 0] = -w[..., 1]
+    skew[..., 2, 1] = w[..., 0]
+    return skew
+
+
+def _translation(x):
+    """ Returns the homogeneous transform for an [x, y, z] translation """
+
+    T = np.eye(4)
+    T[:3, 3] = x
+    return T
+
+
+class NumericConfig(BaseConfig):
+    """ Base class for robot configs with numeric kinematics
+
+    Subclasses provide the transforms and joint twists of the chain, both
+    numerically for a batch of joint angles, and symbolically for the
+    terms that are generated by BaseConfig.
+
+    The orientation rows of the Jacobians follow BaseConfig._calc_J,
+    including the axis of joint i for 'joint%i' and 'link%i', so that
+    the numeric inertia matrix matches the generated one.
+
+    Parameters
+    ----------
+    N_JOINTS : int
+        number of joints in robot
+    M_LINKS : list of numpy.array
+        6x6 inertia matrix of each of the N_JOINTS+1 links, link0 is the base
+    M_JOINTS : list of numpy.array, optional (Default: None)
+        6x6 inertia matrix of each joint, if None the joints are massless
+    REST_ANGLES : numpy.array, optional (Default: None)
+        the joint angles the arm tries to push towards with the
+        null controller, if None all zeros
+    parameters : numpy.array
+        the kinematic parameters, used to save generated functions in
+        a folder unique to the robot
+    """
+
+    def __init__(self, N_JOINTS, M_LINKS, M_JOINTS=None, REST_ANGLES=None,
+                 parameters=None, **kwargs):
+
+        super(NumericConfig, self).__init__(
+            N_JOINTS=N_JOINTS, N_LINKS=N_JOINTS+1, **kwargs)
+
+        if len(M_LINKS) != self.N_LINKS:
+            raise Exception('M_LINKS must have N_JOINTS+1 inertia matrices')
+        if M_JOINTS is None:
+            M_JOINTS = [np.zeros((6, 6)) for ii in range(self.N_JOINTS)]
+        self._M_LINKS = [sp.Matrix(np.asarray(M, dtype='float64'))
+                         for M in M_LINKS]
+        self._M_JOINTS = [sp.Matrix(np.asarray(M, dtype='float64'))
+                          for M in M_JOINTS]
+        self._M_bodies = None
+
+        self.REST_ANGLES = (np.zeros(self.N_JOINTS) if REST_ANGLES is None
+                            else np.asarray(REST_ANGLES))
+
+        self._T = {}  # dictionary for storing calculated transforms
+        self._J_orientation = None
+        self._chain_last = None
+        self._gravity = np.array(self.gravity, dtype='float64').flatten()
+
+        # the config file is shared by all robots of this type, so key
+        # the saved functions on the kinematic parameters as well
+        hasher = hashlib.md5()
+        hasher.update(np.asarray(parameters, dtype='float64').tobytes())
+        self._set_config_variant('chain', hasher.hexdigest())
+
+    @property
+    def J_orientation(self):
+        """ The symbolic axis of each joint, used by BaseConfig._calc_J """
+
+        if self._J_orientation is None:
+            self._J_orientation = [self._axis_symbolic(ii)
+                                   for ii in range(self.N_JOINTS)]
+        return self._J_orientation
+
+    def _frame(self, name):
+        """ Returns the number of joints moving a frame and its offset
+
+        The transform of the frame is the transform of the first k joints
+        of the chain, multiplied by the offset
+
+        Parameters
+        ----------
+        name : string
+            name of the joint, link, or end-effector
+        """
+        raise NotImplementedError
+
+    def _chain(self, q):
+        """ Returns the transforms and joint twists of the chain
+
+        Returns the transforms of the first k joints of the chain for
+        k in 0...N_JOINTS, shape (K, N_JOINTS+1, 4, 4), and the twist
+        [omega, v] of each joint in world coordinates, shape (K, N_JOINTS, 6)
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians], shape (K, N_JOINTS)
+        """
+        raise NotImplementedError
+
+    def _chain_symbolic(self, k):
+        """ Returns the SymPy transform of the first k joints of the chain
+        """
+        raise NotImplementedError
+
+    def _axis_symbolic(self, ii):
+        """ Returns the SymPy axis of joint ii in world coordinates """
+        raise NotImplementedError
+
+    def _calc_T(self, name):
+        """ Uses Sympy to generate the transform for a joint or link
+
+        Parameters
+        ----------
+        name : string
+            name of the joint, link, or end-effector
+        """
+
+        if self._T.get(name, None) is None:
+            k, offset = self._frame(name)
+            self._T[name] = self._chain_symbolic(k) * sp.Matrix(offset)
+        return self._T[name]
+
+    def _evaluate_chain(self, q):
+        """ Evaluates the chain for q, reusing the result for the last q """
+
+        q = np.atleast_2d(np.asarray(q, dtype='float64'))
+        if (self._chain_last is None or
+                self._chain_last[0].shape != q.shape or
+                not np.array_equal(self._chain_last[0], q)):
+            self._chain_last = (np.copy(q),) + self._chain(q)
+        return self._chain_last[1], self._chain_last[2]
+
+    def _jacobian(self, name, q, x):
+        """ Returns the Jacobians and points for a batch of joint angles """
+
+        k, offset = self._frame(name)
+        transforms, twists = self._evaluate_chain(q)
+        T = np.dot(transforms[:, k], offset)
+        point = np.einsum('kij,j->ki', T, np.hstack([x, 1]))[:, :3]
+
+        J = np.zeros((transforms.shape[0], 6, self.N_JOINTS))
+        omega = twists[:, :k, :3]
+        v = twists[:, :k, 3:]
+        J[:, :3, :k] = np.swapaxes(
+            v + np.cross(omega, point[:, None, :]), 1, 2)
+        end_point = min(k + 1, self.N_JOINTS)
+        J[:, 3:, :end_point] = np.swapaxes(twists[:, :end_point, :3], 1, 2)
+        return J, point
+
+    def _output(self, q, value, dtype=None):
+        """ Removes the batch dimension if a single q was passed in """
+
+        if dtype is not None:
+            value = np.asarray(value, dtype=dtype)
+        return value if np.ndim(q) > 1 else value[0]
+
+    def _bodies(self):
+        """ Returns the names and numeric inertia matrices of all bodies """
+
+        if self._M_bodies is None:
+            self._M_bodies = [
+                (name, np.array(M, dtype='float64'))
+                for name, M in
+                zip(['link%i' % ii for ii in range(self.N_LINKS)] +
+                    ['joint%i' % ii for ii in range(self.N_JOINTS)],
+                    self._M_LINKS + self._M_JOINTS)
+                if np.any(np.array(M, dtype='float64'))]
+        return self._M_bodies
+
+    def dJ(self, name, q, dq, x=[0, 0, 0]):
+        """ Calculates the derivative of a Jacobian with respect to time
+
+        Parameters
+        ----------
+        name : string
+            name of the joint, link, or end-effector
+        q : numpy.array
+            joint angles [radians]
+        dq : numpy.array
+            joint velocities [radians/second]
+        x : list, optional (Default: [0, 0, 0])
+            the [x,y,z] offset inside the reference frame of 'name' [meters]
+
+        q and dq can also be of shape (K, N_JOINTS) to evaluate a batch
+        """
+
+        k, _ = self._frame(name)
+        J, point = self._jacobian(name, q, x)
+        _, twists = self._evaluate_chain(q)
+        dq = np.atleast_2d(dq)
+
+        # the twist of each joint changes with the velocity of the joints
+        # before it, d(xi_i)/dt = sum_j<i dq_j * ad(xi_j) xi_i
+        velocities = twists * dq[:, :, None]
+        W = np.cumsum(velocities[:, :, :3], axis=1) - velocities[:, :, :3]
+        V = np.cumsum(velocities[:, :, 3:], axis=1) - velocities[:, :, 3:]
+        omega = twists[:, :, :3]
+        v = twists[:, :, 3:]
+        domega = np.cross(W, omega)
+        dv = np.cross(W, v) + np.cross(V, omega)
+        dpoint = np.einsum('kij,kj->ki', J[:, :3], dq)
+
+        dJ = np.zeros(J.shape)
+        dJ[:, :3, :k] = np.swapaxes(
+            dv[:, :k] + np.cross(domega[:, :k], point[:, None, :]) +
+            np.cross(omega[:, :k], dpoint[:, None, :]), 1, 2)
+        end_point = min(k + 1, self.N_JOINTS)
+        dJ[:, 3:, :end_point] = np.swapaxes(domega[:, :end_point], 1, 2)
+        return self._output(q, dJ, dtype='float32')
+
+    def g(self, q):
+        """ Calculates the force of gravity in joint space
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians]
+
+        If q is of shape (K, N_JOINTS), g is evaluated for the batch
+        """
+
+        g = np.zeros((np.atleast_2d(q).shape[0], self.N_JOINTS))
+        for name, M_body in self._bodies():
+            J, _ = self._jacobian(name, q, [0, 0, 0])
+            g += np.einsum('kji,j->ki', J, np.dot(M_body, self._gravity))
+        return self._output(q, g, dtype='float32')
+
+    def J(self, name, q, x=[0, 0, 0]):
+        """ Calculates the Jacobian for a joint or link
+
+        Parameters
+        ----------
+        name : string
+            name of the joint, link, or end-effector
+        q : numpy.array
+            joint angles [radians]
+        x : list, optional (Default: [0, 0, 0])
+            the [x,y,z] offset inside the reference frame of 'name' [meters]
+
+        If q is of shape (K, N_JOINTS), J is evaluated for the batch
+        """
+
+        J, _ = self._jacobian(name, q, x)
+        return self._output(q, J, dtype='float32')
+
+    def M(self, q):
+        """ Calculates the joint space inertia matrix
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians]
+
+        If q is of shape (K, N_JOINTS), M is evaluated for the batch
+        """
+
+        M = np.zeros((np.atleast_2d(q).shape[0],
+                      self.N_JOINTS, self.N_JOINTS))
+        for name, M_body in self._bodies():
+            J, _ = self._jacobian(name, q, [0, 0, 0])
+            M += np.einsum('kji,jl,klm->kim', J, M_body, J)
+        return self._output(q, M, dtype='float32')
+
+    def R(self, name, q):
+        """ Calculates the rotation matrix of a joint or link
+
+        Parameters
+        ----------
+        name : string
+            name of the joint, link, or end-effector
+        q : numpy.array
+            joint angles [radians]
+
+        If q is of shape (K, N_JOINTS), R is evaluated for the batch
+        """
+
+        k, offset = self._frame(name)
+        transforms, _ = self._evaluate_chain(q)
+        return self._output(q, np.dot(transforms[:, k], offset)[:, :3, :3],
+                            dtype='float32')
+
+    def set_dynamics_parameters(self, theta):
+        """ Sets the inertial parameters of the links and joints
+
+        Parameters
+        ----------
+        theta : numpy.array
+            the parameters, ordered as in get_dynamics_parameters
+        """
+
+        super(NumericConfig, self).set_dynamics_parameters(theta)
+        self._M_bodies = None
+
+    def T(self, name, q):
+        """ Calculates the transform matrix of a joint or link
+
+        Parameters
+        ----------
+        name : string
+            name of the joint, link, or end-effector
+        q : numpy.array
+            joint angles [radians]
+
+        If q is of shape (K, N_JOINTS), T is evaluated for the batch
+        """
+
+        k, offset = self._frame(name)
+        transforms, _ = self._evaluate_chain(q)
+        return self._output(q, np.dot(transforms[:, k], offset))
+
+    def Tx(self, name, q, x=[0, 0, 0]):
+        """ Calculates the transform for a joint or link
+
+        Parameters
+        ----------
+        name : string
+            name of the joint, link, or end-effector
+        q : numpy.array
+            joint angles [radians]
+        x : list, optional (Default: [0, 0, 0])
+            the [x,y,z] offset inside the reference frame of 'name' [meters]
+
+        If q is of shape (K, N_JOINTS), Tx is evaluated for the batch
+        """
+
+        T = self.T(name, q)
+        return np.dot(T, np.hstack([x, 1]))[..., :3]
+
+
+class DHConfig(NumericConfig):
+    """ Robot config for a serial arm with revolute joints described by
+    standard Denavit-Hartenberg parameters
+
+    The transform from the frame of joint i to the frame of joint i+1 is
+    Rot_z(q_i + theta_i) * Trans_z(d_i) * Trans_x(a_i) * Rot_x(alpha_i)
+
+    Parameters
+    ----------
+    DH : numpy.array
+        the [theta, d, a, alpha] parameters of each joint, shape (N_JOINTS, 4)
+    M_LINKS : list of numpy.array
+        6x6 inertia matrix of each of the N_JOINTS+1 links, link0 is the base
+    COM : numpy.array, optional (Default: None)
+        the [x, y, z] offset of the center of mass of each link, in the
+        frame of the joint before it (the base frame for link0), shape
+        (N_JOINTS+1, 3), if None the links are centered on the frames
+    BASE : numpy.array, optional (Default: None)
+        4x4 transform from the origin to the base frame, if None identity
+    TOOL : numpy.array, optional (Default: None)
+        4x4 transform from the last frame to the end-effector,
+        if None identity
+    """
+
+    def __init__(self, DH, M_LINKS, COM=None, BASE=None, TOOL=None,
+                 **kwargs):
+
+        self.DH = np.asarray(DH, dtype='float64')
+        N_JOINTS = self.DH.shape[0]
+        self.COM = (np.zeros((N_JOINTS+1, 3)) if COM is None
+                    else np.asarray(COM, dtype='float64'))
+        self.BASE = np.eye(4) if BASE is None else np.asarray(BASE)
+        self.TOOL = np.eye(4) if TOOL is None else np.asarray(TOOL)
+
+        super(DHConfig, self).__init__(
+            N_JOINTS=N_JOINTS, M_LINKS=M_LINKS,
+            parameters=np.hstack([self.DH.flatten(), self.COM.flatten(),
+                                  self.BASE.flatten(), self.TOOL.flatten()]),
+            **kwargs)
+
+    def _frame(self, name):
+        if name == 'EE':
+            return self.N_JOINTS, self.TOOL
+        if name.startswith('joint'):
+            return int(name[5:]), np.eye(4)
+        if name.startswith('link'):
+            ii = int(name[4:])
+            return ii, _translation(self.COM[ii])
+        raise Exception('Invalid name: %s' % name)
+
+    def _chain(self, q):
+        theta, d, a, alpha = self.DH.T
+        angles = q + theta
+        ct, st = np.cos(angles), np.sin(angles)
+        ca, sa = np.cos(alpha), np.sin(alpha)
+
+        # the transform for each joint, shape (K, N_JOINTS, 4, 4)
+        A = np.zeros(q.shape + (4, 4))
+        A[..., 0, 0] = ct
+        A[..., 0, 1] = -st * ca
+        A[..., 0, 2] = st * sa
+        A[..., 0, 3] = a * ct
+        A[..., 1, 0] = st
+        A[..., 1, 1] = ct * ca
+        A[..., 1, 2] = -ct * sa
+        A[..., 1, 3] = a * st
+        A[..., 2, 1] = sa
+        A[..., 2, 2] = ca
+        A[..., 2, 3] = d
+        A[..., 3, 3] = 1
+
+        transforms = np.zeros((q.shape[0], self.N_JOINTS+1, 4, 4))
+        transforms[:, 0] = self.BASE
+        for ii in range(self.N_JOINTS):
+            transforms[:, ii+1] = np.matmul(transforms[:, ii], A[:, ii])
+
+        # each joint rotates about the z axis of its frame
+        omega = transforms[:, :-1, :3, 2]
+        v = -np.cross(omega, transforms[:, :-1, :3, 3])
+        return transforms, np.concatenate([omega, v], axis=2)
+
+    def _chain_symbolic(self, k):
+        T = sp.Matrix(self.BASE)
+        for ii in range(k):
+            theta, d, a, alpha = self.DH[ii]
+            angle = self.q[ii] + theta
+            # drop round off from alpha = pi / 2 and the like
+            ca, sa = [0 if abs(value) < 1e-12 else value
+                      for value in (np.cos(alpha), np.sin(alpha))]
+            T = T * sp.Matrix([
+                [sp.cos(angle), -sp.sin(angle) * ca,
+                 sp.sin(angle) * sa, a * sp.cos(angle)],
+                [sp.sin(angle), sp.cos(angle) * ca,
+                 -sp.cos(angle) * sa, a * sp.sin(angle)],
+                [0, sa, ca, d],
+                [0, 0, 0, 1]])
+        return T
+
+    def _axis_symbolic(self, ii):
+        return self._chain_symbolic(ii)[:3, :3] * self._KZ
+
+
+class POEConfig(NumericConfig):
+    """ Robot config for a serial arm described by the product of
+    exponentials formula
+
+    The transform of a frame moved by the first k joints is
+    exp([S_0] q_0) * ... * exp([S_k-1] q_k-1) * HOME[name]
+
+    Parameters
+    ----------
+    SCREWS : numpy.array
+        the [omega, v] screw axis of each joint in the base frame at
+        q = 0, shape (N_JOINTS, 6), omega is a unit vector for a revolute
+        joint and zero for a prismatic joint
+    HOME : dictionary
+        the 4x4 transform of 'EE' and each 'link%i' center of mass at
+        q = 0, 'joint%i' transforms default to a translation onto the axis
+    M_LINKS : list of numpy.array
+        6x6 inertia matrix of each of the N_JOINTS+1 links, link0 is the base
+    """
+
+    def __init__(self, SCREWS, HOME, M_LINKS, **kwargs):
+
+        self.SCREWS = np.asarray(SCREWS, dtype='float64')
+        N_JOINTS = self.SCREWS.shape[0]
+        self.HOME = dict([(name, np.asarray(T, dtype='float64'))
+                          for name, T in HOME.items()])
+        for ii in range(N_JOINTS):
+            omega, v = self.SCREWS[ii, :3], self.SCREWS[ii, 3:]
+            self.HOME.setdefault('joint%i' % ii,
+                                 _translation(np.cross(omega, v)))
+
+        super(POEConfig, self).__init__(
+            N_JOINTS=N_JOINTS, M_LINKS=M_LINKS,
+            parameters=np.hstack([self.SCREWS.flatten()] + [
+                self.HOME[name].flatten() for name in sorted(self.HOME)]),
+            **kwargs)
+
+    def _frame(self, name):
+        if name not in self.HOME:
+            raise Exception('Invalid name: %s' % name)
+        if name == 'EE':
+            return self.N_JOINTS, self.HOME[name]
+        return int(name.strip('link').strip('joint')), self.HOME[name]
+
+    def _chain(self, q):
+        omega, v = self.SCREWS[:, :3], self.SCREWS[:, 3:]
+        W = _skew(omega)
+        WW = np.matmul(W, W)
+        sin = np.sin(q)[..., None, None]
+        cos = np.cos(q)[..., None, None]
+        q_ = q[..., None, None]
+
+        # the exponential of each joint's screw, shape (K, N_JOINTS, 4, 4)
+        exp = np.zeros(q.shape + (4, 4))
+        exp[..., :3, :3] = np.eye(3) + sin * W + (1 - cos) * WW
+        exp[..., :3, 3] = np.einsum(
+            'knij,nj->kni',
+            np.eye(3) * q_ + (1 - cos) * W + (q_ - sin) * WW, v)
+        exp[..., 3, 3] = 1
+
+        transforms = np.zeros((q.shape[0], self.N_JOINTS+1, 4, 4))
+        transforms[:, 0] = np.eye(4)
+        for ii in range(self.N_JOINTS):
+            transforms[:, ii+1] = np.matmul(transforms[:, ii], exp[:, ii])
+
+        # move each screw by the joints before it, the adjoint of T
+        R = transforms[:, :-1, :3, :3]
+        p = transforms[:, :-1, :3, 3]
+        omega = np.einsum('knij,nj->kni', R, omega)
+        v = np.einsum('knij,nj->kni', R, v) + np.cross(p, omega)
+        return transforms, np.concatenate([omega, v], axis=2)
+
+    def _chain_symbolic(self, k):
+        T = sp.eye(4)
+        for ii in range(k):
+            omega = sp.Matrix(self.SCREWS[ii, :3])
+            v = sp.Matrix(self.SCREWS[ii, 3:])
+            W = sp.Matrix([[0, -omega[2], omega[1]],
+                           [omega[2], 0, -omega[0]],
+                           [-omega[1], omega[0], 0]])
+            q = self.q[ii]
+            R = sp.eye(3) + sp.sin(q) * W + (1 - sp.cos(q)) * W * W
+            p = (sp.eye(3) * q + (1 - sp.cos(q)) * W +
+                 (q - sp.sin(q)) * W * W) * v
+            T = T * R.row_join(p).col_join(sp.Matrix([[0, 0, 0, 1]]))
+        return T
+
+    def _axis_symbolic(self, ii):
+        return (self._chain_symbolic(ii)[:3, :3] *
+                sp.Matrix(self.SCREWS[ii, :3]))
@@ -0,0 +1,190 @@
+# generated by abr_control.utils.export, do not edit
+import math
+
+import numpy as np
+
+VERSION = '0.1.0'
+CONFIG_HASH = '9521146154b45e3692d5948cb2d5b264'
+
+
+# M
+def function0(q0):
+    out = np.empty((1, 1))
+    out[0, 0] = 0.0200000000000000
+    return out
+
+
+# g
+def function1(q0):
+    out = np.empty((1, 1))
+    out[0, 0] = 0
+    return out
+
+
+# Gamma
+def function2(q0):
+    out = np.empty((1, 1))
+    out[0, 0] = 0
+    return out
+
+
+# joint0[0,0,0]_Tx
+def function3(q0, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0.100000000000000
+    out[3, 0] = 1
+    return out
+
+
+# joint0[0,0,0]_J
+def function4(q0, x, y, z):
+    out = np.empty((6, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0
+    out[3, 0] = 0
+    out[4, 0] = -1
+    out[5, 0] = 0
+    return out
+
+
+# joint0[0,0,0]_dJ
+def function5(q0, dq0, x, y, z):
+    out = np.empty((6, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0
+    out[3, 0] = 0
+    out[4, 0] = 0
+    out[5, 0] = 0
+    return out
+
+
+# link0[0,0,0]_Tx
+def function6(q0, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0.0500000000000000
+    out[3, 0] = 1
+    return out
+
+
+# link0[0,0,0]_J
+def function7(q0, x, y, z):
+    out = np.empty((6, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0
+    out[3, 0] = 0
+    out[4, 0] = -1
+    out[5, 0] = 0
+    return out
+
+
+# link0[0,0,0]_dJ
+def function8(q0, dq0, x, y, z):
+    out = np.empty((6, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0
+    out[3, 0] = 0
+    out[4, 0] = 0
+    out[5, 0] = 0
+    return out
+
+
+# EE[0,0,0]_Tx
+def function9(q0, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0.37*math.cos(q0)
+    out[1, 0] = 0
+    out[2, 0] = 0.37*math.sin(q0) + 0.1
+    out[3, 0] = 1
+    return out
+
+
+# EE[0,0,0]_J
+def function10(q0, x, y, z):
+    out = np.empty((6, 1))
+    out[0, 0] = -0.37*math.sin(q0)
+    out[1, 0] = 0
+    out[2, 0] = 0.37*math.cos(q0)
+    out[3, 0] = 0
+    out[4, 0] = -1
+    out[5, 0] = 0
+    return out
+
+
+# EE[0,0,0]_dJ
+def function11(q0, dq0, x, y, z):
+    _cse0 = 0.37*dq0
+    out = np.empty((6, 1))
+    out[0, 0] = -_cse0*math.cos(q0)
+    out[1, 0] = 0
+    out[2, 0] = -_cse0*math.sin(q0)
+    out[3, 0] = 0
+    out[4, 0] = 0
+    out[5, 0] = 0
+    return out
+
+
+# EE_Tx
+def function12(q0, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q0)
+    out = np.empty((4, 1))
+    out[0, 0] = _cse0*z + 0.37*_cse0 - _cse1*y
+    out[1, 0] = x
+    out[2, 0] = _cse0*y + _cse1*z + 0.37*_cse1 + 0.1
+    out[3, 0] = 1
+    return out
+
+
+# EE_J
+def function13(q0, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 1))
+    out[0, 0] = -_cse0*z - 0.37*_cse0 - _cse1*y
+    out[1, 0] = 0
+    out[2, 0] = -_cse0*y + _cse1*z + 0.37*_cse1
+    out[3, 0] = 0
+    out[4, 0] = -1
+    out[5, 0] = 0
+    return out
+
+
+# EE_dJ
+def function14(q0, dq0, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q0)
+    out = np.empty((6, 1))
+    out[0, 0] = dq0*(-_cse0*z - 0.37*_cse0 + _cse1*y)
+    out[1, 0] = 0
+    out[2, 0] = dq0*(-_cse0*y - _cse1*z - 0.37*_cse1)
+    out[3, 0] = 0
+    out[4, 0] = 0
+    out[5, 0] = 0
+    return out
+
+
+FUNCTIONS = {
+    'M': function0,
+    'g': function1,
+    'Gamma': function2,
+    'joint0[0,0,0]_Tx': function3,
+    'joint0[0,0,0]_J': function4,
+    'joint0[0,0,0]_dJ': function5,
+    'link0[0,0,0]_Tx': function6,
+    'link0[0,0,0]_J': function7,
+    'link0[0,0,0]_dJ': function8,
+    'EE[0,0,0]_Tx': function9,
+    'EE[0,0,0]_J': function10,
+    'EE[0,0,0]_dJ': function11,
+    'EE_Tx': function12,
+    'EE_J': function13,
+    'EE_dJ': function14,
+}
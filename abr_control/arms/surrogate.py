@@ -0,0 +1,230 @@
+"""
+Chebyshev surrogate models for functions of the joint angles
+
+The function is interpolated at the tensor product of Chebyshev points
+over the joints it depends on, and evaluated as a sum of Chebyshev
+polynomials. Outside of the fitted domain the exact function is called.
+Used by BaseConfig.fit_surrogates for M and g on low DOF arms.
+"""
+import math
+import timeit
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+
+class ChebyshevSurrogate():
+    """ Tensor product Chebyshev interpolation of a function
+
+    Called like the function it approximates, with one scalar for each
+    parameter, or one array of shape (K,) for each parameter to evaluate
+    a batch.
+
+    Parameters
+    ----------
+    function : callable
+        the exact function, called with one scalar for each parameter
+    n_parameters : int
+        the number of parameters of the function
+    dims : list of ints
+        the parameters the function depends on, the rest are ignored
+    domain : numpy.array
+        the [low, high] range of each parameter, shape (n_parameters, 2)
+    degree : int
+        the degree of the Chebyshev polynomials along each dimension
+
+    Attributes
+    ----------
+    coefficients : numpy.array
+        the Chebyshev coefficients, shape (degree+1,) * len(dims) + (-1,)
+    n_fallback : int
+        the number of evaluations outside of the domain, which called
+        the exact function
+    """
+
+    def __init__(self, function, n_parameters, dims, domain, degree):
+
+        self.function = function
+        self.n_parameters = n_parameters
+        self.dims = list(dims)
+        self.domain = np.asarray(domain, dtype='float64')
+        self.degree = degree
+        self.n_fallback = 0
+        self._orders = np.arange(degree + 1)
+
+        low, high = self.domain[self.dims].T
+        self._center = (high + low) / 2.0
+        self._half_width = (high - low) / 2.0
+
+        # evaluate the function on the grid of Chebyshev points
+        nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))
+        n_dims = len(self.dims)
+        grid = np.meshgrid(*[nodes] * n_dims, indexing='ij')
+        q = np.tile(self.domain.mean(axis=1), (nodes.size**n_dims, 1))
+        if n_dims > 0:
+            q[:, self.dims] = (
+                np.stack([axis.flatten() for axis in grid], axis=1) *
+                self._half_width + self._center)
+        values = np.array([function(*q_grid) for q_grid in q],
+                          dtype='float64')
+        self.shape = values.shape[1:]
+
+        # transform the values along each axis into coefficients
+        coefficients = values.reshape((degree + 1,) * n_dims + (-1,))
+        V_inv = np.linalg.inv(chebyshev.chebvander(nodes, degree))
+        for axis in range(n_dims):
+            coefficients = np.moveaxis(np.tensordot(
+                V_inv, coefficients, axes=([1], [axis])), 0, axis)
+        self.coefficients = coefficients
+
+    def __call__(self, *q):
+
+        if np.ndim(q[0]) == 0:
+            return self._evaluate_single(q)
+
+        q = np.asarray(q, dtype='float64')
+        batch = q.ndim > 1
+        q = q.T if batch else q[None]
+
+        low, high = self.domain[self.dims].T
+        inside = np.all((q[:, self.dims] >= low) &
+                        (q[:, self.dims] <= high), axis=1)
+        out = np.empty((q.shape[0],) + self.shape)
+        if np.any(inside):
+            out[inside] = self.evaluate(q[inside])
+        for ii in np.where(~inside)[0]:
+            out[ii] = self.function(*q[ii])
+        self.n_fallback += int(np.sum(~inside))
+
+        return out if batch else out[0]
+
+    def _evaluate_single(self, q):
+        """ Evaluates the approximation for a single set of parameters
+
+        Avoids the overhead of numpy calls on small arrays, only one
+        matrix-vector product is needed for each dimension.
+        """
+
+        out = self.coefficients
+        for dim, center, half_width in zip(
+                self.dims, self._center, self._half_width):
+            x = (float(q[dim]) - center) / half_width
+            if x < -1 or x > 1:
+                self.n_fallback += 1
+                return np.asarray(self.function(*q), dtype='float64')
+            T = np.cos(self._orders * math.acos(x))
+            out = np.dot(T, out.reshape(self.degree + 1, -1))
+        return out.reshape(self.shape)
+
+    @property
+    def tail(self):
+        """ Estimates the truncation error from the highest order terms
+
+        Sums the magnitude of the coefficients with the highest degree
+        along any dimension, for each output.
+        """
+
+        n_dims = len(self.dims)
+        if n_dims == 0:
+            return np.zeros(self.coefficients.shape[-1])
+        highest = np.zeros(self.coefficients.shape[:-1], dtype=bool)
+        for axis in range(n_dims):
+            index = [slice(None)] * n_dims
+            index[axis] = -1
+            highest[tuple(index)] = True
+        return np.sum(np.abs(self.coefficients[highest]), axis=0)
+
+    def evaluate(self, q):
+        """ Evaluates the approximation, without checking the domain
+
+        Parameters
+        ----------
+        q : numpy.array
+            the parameters, shape (K, n_parameters)
+        """
+
+        x = (q[:, self.dims] - self._center) / self._half_width
+        out = self.coefficients
+        if len(self.dims) == 0:
+            out = np.tile(out, (q.shape[0], 1))
+        for axis in range(len(self.dims)):
+            T = chebyshev.chebvander(x[:, axis], self.degree)
+            if axis == 0:
+                out = np.tensordot(T, out, axes=([1], [0]))
+            else:
+                out = np.einsum('ki,ki...->k...', T, out)
+        return out.reshape((q.shape[0],) + self.shape)
+
+
+def fit_chebyshev(function, n_parameters, dims, domain, tolerance=1e-4,
+                  max_degree=32, max_points=1e5, n_validation=1000):
+    """ Fits a Chebyshev surrogate to within an error tolerance
+
+    The degree is raised in steps of 2 until the error estimate is below
+    the tolerance, or max_degree or max_points function evaluations would
+    be exceeded. The error estimate is the larger of the maximum error on
+    n_validation random points inside the domain, and the truncation
+    error estimated from the highest order coefficients. It is not a
+    guaranteed bound, the error can be larger between the sampled points.
+
+    Returns the surrogate, or None if the tolerance could not be met,
+    and a dictionary reporting the fit.
+
+    Parameters
+    ----------
+    function : callable
+        the exact function, called with one scalar for each parameter
+    n_parameters : int
+        the number of parameters of the function
+    dims : list of ints
+        the parameters the function depends on
+    domain : numpy.array
+        the [low, high] range of each parameter, shape (n_parameters, 2)
+    tolerance : float, optional (Default: 1e-4)
+        the largest absolute error allowed in any output
+    max_degree : int, optional (Default: 32)
+        the highest degree to try along each dimension
+    max_points : int, optional (Default: 1e5)
+        the most function evaluations allowed to fit the surrogate
+    n_validation : int, optional (Default: 1000)
+        the number of random points to measure the error on
+    """
+
+    domain = np.asarray(domain, dtype='float64')
+    q_validation = np.random.uniform(
+        domain[:, 0], domain[:, 1], size=(n_validation, n_parameters))
+    exact = np.array([function(*q) for q in q_validation], dtype='float64')
+
+    surrogate = None
+    report = {'dims': list(dims), 'tolerance': tolerance, 'accepted': False}
+    degree = 2 if len(dims) > 0 else 0
+    while degree <= max_degree and (degree + 1)**len(dims) <= max_points:
+        surrogate = ChebyshevSurrogate(
+            function, n_parameters, dims, domain, degree)
+        approximate = surrogate.evaluate(q_validation)
+        max_error = np.max(np.abs(approximate - exact))
+        tail = np.max(surrogate.tail)
+        report.update({
+            'degree': degree,
+            'n_coefficients': surrogate.coefficients.size,
+            'max_error': max_error,
+            'tail': tail,
+            'error_estimate': max(max_error, tail)})
+        if report['error_estimate'] <= tolerance:
+            report['accepted'] = True
+            break
+        if degree == 0:
+            break
+        degree += 2
+
+    if not report['accepted']:
+        return None, report
+
+    # compare the evaluation times
+    q = tuple(q_validation[0])
+    for key, call in [('exact_time', function), ('surrogate_time', surrogate)]:
+        n_trials = 1000
+        report[key] = timeit.timeit(lambda: call(*q),
+                                    number=n_trials) / n_trials
+
+    return surrogate, report
@@ -0,0 +1,810 @@
+# generated by abr_control.utils.export, do not edit
+import math
+
+import numpy as np
+
+VERSION = '0.1.0'
+CONFIG_HASH = 'ed842b6bc2d8b5cc44a75fc84c004ef0'
+
+
+# M
+def function0(q0, q1, q2):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse0*_cse2
+    _cse4 = 6.00000023841858*_cse3
+    _cse5 = math.cos(q1)
+    _cse6 = _cse1*_cse5
+    _cse7 = 20.0*_cse1 - _cse4 + 6.00000023841858*_cse6
+    _cse8 = 0.6*_cse3
+    _cse9 = 2.0*_cse1 + 0.6*_cse6 - _cse8
+    _cse10 = _cse0*_cse5
+    _cse11 = _cse1*_cse2
+    _cse12 = 6.00000023841858*_cse10 + 6.00000023841858*_cse11
+    _cse13 = -20.0*_cse0 - _cse12
+    _cse14 = 0.6*_cse10 + 0.6*_cse11
+    _cse15 = -2.0*_cse0 - _cse14
+    _cse16 = 0.6*_cse1*_cse5 - _cse8
+    _cse17 = -_cse14
+    _cse18 = 6.00000023841858*_cse1*_cse5 - _cse4
+    _cse19 = -_cse12
+    out = np.empty((3, 3))
+    out[0, 0] = 10.0*_cse0**2 + 10.0*_cse1**2 + _cse13*_cse15 + _cse7*_cse9 + 30.0
+    out[0, 1] = _cse13*_cse17 + _cse16*_cse7 + 20.0
+    out[0, 2] = 10.0000000000000
+    out[1, 0] = _cse15*_cse19 + _cse18*_cse9 + 20.0
+    out[1, 1] = _cse16*_cse18 + _cse17*_cse19 + 20.0
+    out[1, 2] = 10.0000000000000
+    out[2, 0] = 10.0000000000000
+    out[2, 1] = 10.0000000000000
+    out[2, 2] = 10.0000000000000
+    return out
+
+
+# g
+def function1(q0, q1, q2):
+    out = np.empty((3, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0
+    return out
+
+
+# Gamma
+def function2(q0, q1, q2):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = 6.00000023841858*_cse3
+    _cse5 = math.cos(q1)
+    _cse6 = _cse0*_cse5
+    _cse7 = 6.00000023841858*_cse6
+    _cse8 = 20.0*_cse0 - _cse4 + _cse7
+    _cse9 = _cse1*_cse5
+    _cse10 = _cse0*_cse2
+    _cse11 = 0.6*_cse10 + 0.6*_cse9
+    _cse12 = -2.0*_cse1 - _cse11
+    _cse13 = 0.5*_cse12
+    _cse14 = 0.6*_cse3
+    _cse15 = 0.6*_cse6
+    _cse16 = 2.0*_cse0 - _cse14 + _cse15
+    _cse17 = 6.00000023841858*_cse10 + 6.00000023841858*_cse9
+    _cse18 = -20.0*_cse1 - _cse17
+    _cse19 = 0.5*_cse18
+    _cse20 = -_cse16
+    _cse21 = -_cse8
+    _cse22 = _cse4 - _cse7
+    _cse23 = -_cse22
+    _cse24 = -_cse17
+    _cse25 = 0.5*_cse24
+    _cse26 = _cse14 - _cse15
+    _cse27 = -_cse26
+    _cse28 = -_cse11
+    _cse29 = 0.5*_cse28
+    _cse30 = 1.0*_cse22
+    _cse31 = 1.0*_cse24
+    _cse32 = _cse12*_cse30 + _cse16*_cse31
+    _cse33 = _cse13*_cse22
+    _cse34 = _cse16*_cse25
+    _cse35 = _cse19*_cse26 + _cse29*_cse8
+    _cse36 = _cse25*_cse27
+    _cse37 = _cse22*_cse29
+    _cse38 = _cse23*_cse29 + _cse25*_cse26
+    _cse39 = -_cse33 - _cse34 + _cse35
+    _cse40 = _cse36 + _cse37 + _cse38
+    out = np.empty((3, 9))
+    out[0, 0] = _cse13*_cse21 + _cse13*_cse8 + _cse16*_cse19 + _cse19*_cse20
+    out[0, 1] = _cse13*_cse23 - _cse19*_cse27 + _cse20*_cse25 - _cse21*_cse29 + _cse32
+    out[0, 2] = 0
+    out[0, 3] = _cse33 + _cse34 + _cse35
+    out[0, 4] = _cse32 - _cse36 - _cse37 + _cse38
+    out[0, 5] = 0
+    out[0, 6] = 0
+    out[0, 7] = 0
+    out[0, 8] = 0
+    out[1, 0] = 1.0*_cse18*_cse27 + 1.0*_cse21*_cse28 + _cse39
+    out[1, 1] = _cse40
+    out[1, 2] = 0
+    out[1, 3] = _cse27*_cse31 + _cse28*_cse30 + _cse39
+    out[1, 4] = _cse40
+    out[1, 5] = 0
+    out[1, 6] = 0
+    out[1, 7] = 0
+    out[1, 8] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[2, 6] = 0
+    out[2, 7] = 0
+    out[2, 8] = 0
+    return out
+
+
+# joint0[0,0,0]_Tx
+def function3(q0, q1, q2, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# joint0[0,0,0]_J
+def function4(q0, q1, q2, x, y, z):
+    out = np.empty((6, 3))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+# joint0[0,0,0]_dJ
+def function5(q0, q1, q2, dq0, dq1, dq2, x, y, z):
+    out = np.empty((6, 3))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+# joint1[0,0,0]_Tx
+def function6(q0, q1, q2, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 2.0*math.cos(q0)
+    out[1, 0] = 2.0*math.sin(q0)
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# joint1[0,0,0]_J
+def function7(q0, q1, q2, x, y, z):
+    out = np.empty((6, 3))
+    out[0, 0] = -2.0*math.sin(q0)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[1, 0] = 2.0*math.cos(q0)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    out[5, 2] = 0
+    return out
+
+
+# joint1[0,0,0]_dJ
+def function8(q0, q1, q2, dq0, dq1, dq2, x, y, z):
+    _cse0 = 2.0*dq0
+    out = np.empty((6, 3))
+    out[0, 0] = -_cse0*math.cos(q0)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[1, 0] = -_cse0*math.sin(q0)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+# joint2[0,0,0]_Tx
+def function9(q0, q1, q2, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = math.sin(q0)
+    _cse3 = 1.2*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 1.2*_cse0
+    out = np.empty((4, 1))
+    out[0, 0] = 2.0*_cse0 - _cse1*_cse3 + _cse4*_cse5
+    out[1, 0] = _cse1*_cse5 + 2.0*_cse2 + _cse3*_cse4
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# joint2[0,0,0]_J
+def function10(q0, q1, q2, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = 1.2*_cse0
+    _cse3 = math.sin(q1)
+    _cse4 = math.cos(q0)
+    _cse5 = 1.2*_cse4
+    _cse6 = _cse1*_cse2 + _cse3*_cse5
+    _cse7 = _cse2*_cse3
+    out = np.empty((6, 3))
+    out[0, 0] = -2.0*_cse0 - _cse6
+    out[0, 1] = -_cse6
+    out[0, 2] = 0
+    out[1, 0] = _cse1*_cse5 + 2.0*_cse4 - _cse7
+    out[1, 1] = 1.2*_cse1*_cse4 - _cse7
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    out[5, 2] = 1
+    return out
+
+
+# joint2[0,0,0]_dJ
+def function11(q0, q1, q2, dq0, dq1, dq2, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = 1.2*_cse1
+    _cse3 = math.cos(q0)
+    _cse4 = 1.2*math.cos(q1)
+    _cse5 = _cse3*_cse4
+    _cse6 = _cse0*_cse2 - _cse5
+    _cse7 = _cse6*dq1
+    _cse8 = _cse0*_cse4 + _cse2*_cse3
+    _cse9 = -_cse8
+    _cse10 = _cse9*dq1
+    out = np.empty((6, 3))
+    out[0, 0] = _cse7 + dq0*(1.2*_cse0*_cse1 - 2.0*_cse3 - _cse5)
+    out[0, 1] = _cse6*dq0 + _cse7
+    out[0, 2] = 0
+    out[1, 0] = _cse10 + dq0*(-2.0*_cse0 - _cse8)
+    out[1, 1] = _cse10 + _cse9*dq0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+# link0[0,0,0]_Tx
+def function12(q0, q1, q2, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# link0[0,0,0]_J
+def function13(q0, q1, q2, x, y, z):
+    out = np.empty((6, 3))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+# link0[0,0,0]_dJ
+def function14(q0, q1, q2, dq0, dq1, dq2, x, y, z):
+    out = np.empty((6, 3))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+# link1[0,0,0]_Tx
+def function15(q0, q1, q2, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 1.0*math.cos(q0)
+    out[1, 0] = 1.0*math.sin(q0)
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# link1[0,0,0]_J
+def function16(q0, q1, q2, x, y, z):
+    out = np.empty((6, 3))
+    out[0, 0] = -1.0*math.sin(q0)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[1, 0] = 1.0*math.cos(q0)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    out[5, 2] = 0
+    return out
+
+
+# link1[0,0,0]_dJ
+def function17(q0, q1, q2, dq0, dq1, dq2, x, y, z):
+    _cse0 = 1.0*dq0
+    out = np.empty((6, 3))
+    out[0, 0] = -_cse0*math.cos(q0)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[1, 0] = -_cse0*math.sin(q0)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+# link2[0,0,0]_Tx
+def function18(q0, q1, q2, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = math.sin(q0)
+    _cse3 = 0.6*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 0.6*_cse0
+    out = np.empty((4, 1))
+    out[0, 0] = 2.0*_cse0 - _cse1*_cse3 + _cse4*_cse5
+    out[1, 0] = _cse1*_cse5 + 2.0*_cse2 + _cse3*_cse4
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# link2[0,0,0]_J
+def function19(q0, q1, q2, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = 0.6*_cse0
+    _cse3 = math.sin(q1)
+    _cse4 = math.cos(q0)
+    _cse5 = 0.6*_cse4
+    _cse6 = _cse1*_cse2 + _cse3*_cse5
+    _cse7 = _cse2*_cse3
+    out = np.empty((6, 3))
+    out[0, 0] = -2.0*_cse0 - _cse6
+    out[0, 1] = -_cse6
+    out[0, 2] = 0
+    out[1, 0] = _cse1*_cse5 + 2.0*_cse4 - _cse7
+    out[1, 1] = 0.6*_cse1*_cse4 - _cse7
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    out[5, 2] = 1
+    return out
+
+
+# link2[0,0,0]_dJ
+def function20(q0, q1, q2, dq0, dq1, dq2, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = 0.6*_cse1
+    _cse3 = math.cos(q0)
+    _cse4 = 0.6*math.cos(q1)
+    _cse5 = _cse3*_cse4
+    _cse6 = _cse0*_cse2 - _cse5
+    _cse7 = _cse6*dq1
+    _cse8 = _cse0*_cse4 + _cse2*_cse3
+    _cse9 = -_cse8
+    _cse10 = _cse9*dq1
+    out = np.empty((6, 3))
+    out[0, 0] = _cse7 + dq0*(0.6*_cse0*_cse1 - 2.0*_cse3 - _cse5)
+    out[0, 1] = _cse6*dq0 + _cse7
+    out[0, 2] = 0
+    out[1, 0] = _cse10 + dq0*(-2.0*_cse0 - _cse8)
+    out[1, 1] = _cse10 + _cse9*dq0
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+# EE[0,0,0]_Tx
+def function21(q0, q1, q2, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.cos(q2)
+    _cse6 = 0.7*_cse0*_cse4 - 0.7*_cse3
+    _cse7 = math.sin(q2)
+    _cse8 = _cse1*_cse4
+    _cse9 = _cse0*_cse2
+    _cse10 = _cse8 + _cse9
+    out = np.empty((4, 1))
+    out[0, 0] = 1.2*_cse0*_cse4 + 2.0*_cse0 - 0.7*_cse10*_cse7 - 1.2*_cse3 + _cse5*_cse6
+    out[1, 0] = 2.0*_cse1 + 0.7*_cse10*_cse5 + _cse6*_cse7 + 1.2*_cse8 + 1.2*_cse9
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# EE[0,0,0]_J
+def function22(q0, q1, q2, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = _cse0*_cse1
+    _cse3 = 1.2*_cse2
+    _cse4 = math.sin(q1)
+    _cse5 = math.cos(q0)
+    _cse6 = _cse4*_cse5
+    _cse7 = 1.2*_cse6
+    _cse8 = math.sin(q2)
+    _cse9 = _cse0*_cse4
+    _cse10 = _cse1*_cse5
+    _cse11 = -_cse10 + _cse9
+    _cse12 = math.cos(q2)
+    _cse13 = _cse2 + _cse6
+    _cse14 = -_cse13
+    _cse15 = -0.7*_cse12*_cse14
+    _cse16 = 0.7*_cse8
+    _cse17 = 0.7*_cse12
+    _cse18 = -_cse11
+    _cse19 = _cse17*_cse18
+    _cse20 = 1.2*_cse10 + _cse14*_cse16 + _cse19 - 1.2*_cse9
+    out = np.empty((6, 3))
+    out[0, 0] = -2.0*_cse0 + 0.7*_cse11*_cse8 - _cse15 - _cse3 - _cse7
+    out[0, 1] = _cse11*_cse16 + _cse14*_cse17 - _cse3 - _cse7
+    out[0, 2] = -_cse15 - _cse16*_cse18
+    out[1, 0] = _cse20 + 2.0*_cse5
+    out[1, 1] = _cse20
+    out[1, 2] = -_cse13*_cse16 + _cse19
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    out[5, 2] = 1
+    return out
+
+
+# EE[0,0,0]_dJ
+def function23(q0, q1, q2, dq0, dq1, dq2, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = _cse1*_cse4
+    _cse7 = _cse0*_cse2
+    _cse8 = _cse6 + _cse7
+    _cse9 = math.sin(q2)
+    _cse10 = 0.7*_cse9
+    _cse11 = _cse3 - _cse5
+    _cse12 = math.cos(q2)
+    _cse13 = 0.7*_cse12
+    _cse14 = _cse11*_cse13
+    _cse15 = _cse10*_cse8 + _cse14 + 1.2*_cse3 - 1.2*_cse5
+    _cse16 = -_cse8
+    _cse17 = _cse10*_cse16
+    _cse18 = _cse14 - _cse17
+    _cse19 = _cse15*dq1 + _cse18*dq2
+    _cse20 = -_cse11
+    _cse21 = 1.2*_cse6
+    _cse22 = 1.2*_cse7
+    _cse23 = -0.7*_cse12*_cse16
+    _cse24 = _cse10*_cse11 + _cse13*_cse16 - _cse21 - _cse22
+    _cse25 = _cse10*_cse20
+    _cse26 = -_cse23 - _cse25
+    _cse27 = _cse24*dq1 + _cse26*dq2
+    out = np.empty((6, 3))
+    out[0, 0] = _cse19 + dq0*(-2.0*_cse0 + _cse15)
+    out[0, 1] = _cse15*dq0 + _cse19
+    out[0, 2] = _cse18*dq0 + _cse18*dq1 + dq2*(-_cse13*_cse20 - _cse17)
+    out[1, 0] = _cse27 + dq0*(-2.0*_cse1 + 0.7*_cse11*_cse9 - _cse21 - _cse22 - _cse23)
+    out[1, 1] = _cse24*dq0 + _cse27
+    out[1, 2] = _cse26*dq0 + _cse26*dq1 + dq2*(-_cse13*_cse8 - _cse25)
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+# EE_Tx
+def function24(q0, q1, q2, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = math.cos(q2)
+    _cse6 = _cse0*_cse4 - _cse3
+    _cse7 = _cse5*_cse6
+    _cse8 = math.sin(q2)
+    _cse9 = _cse1*_cse4
+    _cse10 = _cse0*_cse2
+    _cse11 = _cse10 + _cse9
+    _cse12 = -_cse11
+    _cse13 = _cse12*_cse8
+    _cse14 = _cse6*_cse8
+    _cse15 = _cse11*_cse5
+    out = np.empty((4, 1))
+    out[0, 0] = 1.2*_cse0*_cse4 + 2.0*_cse0 + 0.7*_cse13 - 1.2*_cse3 + 0.7*_cse7 + x*(_cse13 + _cse7) + y*(_cse12*_cse5 - _cse14)
+    out[1, 0] = 2.0*_cse1 + 1.2*_cse10 + 0.7*_cse14 + 0.7*_cse15 + 1.2*_cse9 + x*(_cse14 + _cse15) + y*(-_cse11*_cse8 + _cse7)
+    out[2, 0] = z
+    out[3, 0] = 1
+    return out
+
+
+# EE_J
+def function25(q0, q1, q2, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = _cse0*_cse1
+    _cse3 = math.sin(q1)
+    _cse4 = math.cos(q0)
+    _cse5 = _cse3*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = _cse0*_cse3
+    _cse8 = _cse1*_cse4
+    _cse9 = _cse7 - _cse8
+    _cse10 = _cse6*_cse9
+    _cse11 = math.cos(q2)
+    _cse12 = _cse2 + _cse5
+    _cse13 = -_cse12
+    _cse14 = _cse11*_cse13
+    _cse15 = 0.7*_cse14
+    _cse16 = _cse13*_cse6
+    _cse17 = 0.7*_cse10 + _cse15 - 1.2*_cse2 - 1.2*_cse5 + x*(_cse10 + _cse14) + y*(_cse11*_cse9 - _cse16)
+    _cse18 = -_cse9
+    _cse19 = _cse18*_cse6
+    _cse20 = _cse11*_cse13 - _cse19
+    _cse21 = _cse11*_cse18
+    _cse22 = _cse16 + _cse21
+    _cse23 = 0.7*_cse21
+    _cse24 = 0.7*_cse16 + _cse20*y + _cse22*x + _cse23 - 1.2*_cse7 + 1.2*_cse8
+    _cse25 = _cse12*_cse6
+    out = np.empty((6, 3))
+    out[0, 0] = -2.0*_cse0 + _cse17
+    out[0, 1] = _cse17
+    out[0, 2] = _cse15 - 0.7*_cse19 + _cse20*x - _cse22*y
+    out[1, 0] = _cse24 + 2.0*_cse4
+    out[1, 1] = _cse24
+    out[1, 2] = _cse23 - 0.7*_cse25 + x*(_cse21 - _cse25) + y*(-_cse11*_cse12 - _cse19)
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    out[5, 2] = 1
+    return out
+
+
+# EE_dJ
+def function26(q0, q1, q2, dq0, dq1, dq2, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = _cse1*_cse4
+    _cse8 = _cse0*_cse2
+    _cse9 = _cse7 + _cse8
+    _cse10 = _cse6*_cse9
+    _cse11 = math.cos(q2)
+    _cse12 = _cse3 - _cse5
+    _cse13 = _cse11*_cse12
+    _cse14 = 0.7*_cse13
+    _cse15 = _cse12*_cse6
+    _cse16 = _cse11*_cse9
+    _cse17 = 0.7*_cse10 + _cse14 + 1.2*_cse3 - 1.2*_cse5 + x*(_cse10 + _cse13) + y*(-_cse15 + _cse16)
+    _cse18 = -_cse9
+    _cse19 = _cse18*_cse6
+    _cse20 = -0.7*_cse19
+    _cse21 = _cse13 - _cse19
+    _cse22 = _cse11*_cse18
+    _cse23 = _cse15 + _cse22
+    _cse24 = _cse14 + _cse20 + _cse21*x - _cse23*y
+    _cse25 = _cse17*dq1 + _cse24*dq2
+    _cse26 = -_cse12
+    _cse27 = _cse11*_cse26
+    _cse28 = _cse26*_cse6
+    _cse29 = -_cse22 + _cse28
+    _cse30 = -_cse19 - _cse27
+    _cse31 = 0.7*_cse22
+    _cse32 = 0.7*_cse15 + _cse21*y + _cse23*x + _cse31 - 1.2*_cse7 - 1.2*_cse8
+    _cse33 = -0.7*_cse28
+    _cse34 = -_cse29*x + _cse30*y + _cse31 + _cse33
+    _cse35 = _cse32*dq1 + _cse34*dq2
+    out = np.empty((6, 3))
+    out[0, 0] = _cse25 + dq0*(-2.0*_cse0 + _cse17)
+    out[0, 1] = _cse17*dq0 + _cse25
+    out[0, 2] = _cse24*dq0 + _cse24*dq1 + dq2*(_cse20 - 0.7*_cse27 + _cse29*y + _cse30*x)
+    out[1, 0] = _cse35 + dq0*(-2.0*_cse1 + _cse32)
+    out[1, 1] = _cse32*dq0 + _cse35
+    out[1, 2] = _cse34*dq0 + _cse34*dq1 + dq2*(-0.7*_cse16 + _cse33 + x*(-_cse16 - _cse28) + y*(-_cse27 + _cse6*_cse9))
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    return out
+
+
+FUNCTIONS = {
+    'M': function0,
+    'g': function1,
+    'Gamma': function2,
+    'joint0[0,0,0]_Tx': function3,
+    'joint0[0,0,0]_J': function4,
+    'joint0[0,0,0]_dJ': function5,
+    'joint1[0,0,0]_Tx': function6,
+    'joint1[0,0,0]_J': function7,
+    'joint1[0,0,0]_dJ': function8,
+    'joint2[0,0,0]_Tx': function9,
+    'joint2[0,0,0]_J': function10,
+    'joint2[0,0,0]_dJ': function11,
+    'link0[0,0,0]_Tx': function12,
+    'link0[0,0,0]_J': function13,
+    'link0[0,0,0]_dJ': function14,
+    'link1[0,0,0]_Tx': function15,
+    'link1[0,0,0]_J': function16,
+    'link1[0,0,0]_dJ': function17,
+    'link2[0,0,0]_Tx': function18,
+    'link2[0,0,0]_J': function19,
+    'link2[0,0,0]_dJ': function20,
+    'EE[0,0,0]_Tx': function21,
+    'EE[0,0,0]_J': function22,
+    'EE[0,0,0]_dJ': function23,
+    'EE_Tx': function24,
+    'EE_J': function25,
+    'EE_dJ': function26,
+}
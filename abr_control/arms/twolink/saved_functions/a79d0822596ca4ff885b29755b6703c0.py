@@ -0,0 +1,406 @@
+# generated by abr_control.utils.export, do not edit
+import math
+
+import numpy as np
+
+VERSION = '0.1.0'
+CONFIG_HASH = 'a79d0822596ca4ff885b29755b6703c0'
+
+
+# M
+def function0(q0, q1):
+    out = np.empty((2, 2))
+    out[0, 0] = 1.32*math.sin(q0)**2 + 1.32*math.cos(q0)**2 + 23.0
+    out[0, 1] = 8.00000000000000
+    out[1, 0] = 8.00000000000000
+    out[1, 1] = 8.00000000000000
+    return out
+
+
+# g
+def function1(q0, q1):
+    out = np.empty((2, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    return out
+
+
+# Gamma
+def function2(q0, q1):
+    out = np.empty((2, 4))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    return out
+
+
+# joint0[0,0,0]_Tx
+def function3(q0, q1, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# joint0[0,0,0]_J
+def function4(q0, q1, x, y, z):
+    out = np.empty((6, 2))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    return out
+
+
+# joint0[0,0,0]_dJ
+def function5(q0, q1, dq0, dq1, x, y, z):
+    out = np.empty((6, 2))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    return out
+
+
+# joint1[0,0,0]_Tx
+def function6(q0, q1, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 2.0*math.cos(q0)
+    out[1, 0] = 2.0*math.sin(q0)
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# joint1[0,0,0]_J
+def function7(q0, q1, x, y, z):
+    out = np.empty((6, 2))
+    out[0, 0] = -2.0*math.sin(q0)
+    out[0, 1] = 0
+    out[1, 0] = 2.0*math.cos(q0)
+    out[1, 1] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    return out
+
+
+# joint1[0,0,0]_dJ
+def function8(q0, q1, dq0, dq1, x, y, z):
+    _cse0 = 2.0*dq0
+    out = np.empty((6, 2))
+    out[0, 0] = -_cse0*math.cos(q0)
+    out[0, 1] = 0
+    out[1, 0] = -_cse0*math.sin(q0)
+    out[1, 1] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    return out
+
+
+# link0[0,0,0]_Tx
+def function9(q0, q1, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# link0[0,0,0]_J
+def function10(q0, q1, x, y, z):
+    out = np.empty((6, 2))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    return out
+
+
+# link0[0,0,0]_dJ
+def function11(q0, q1, dq0, dq1, x, y, z):
+    out = np.empty((6, 2))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    return out
+
+
+# link1[0,0,0]_Tx
+def function12(q0, q1, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 1.0*math.cos(q0)
+    out[1, 0] = 1.0*math.sin(q0)
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# link1[0,0,0]_J
+def function13(q0, q1, x, y, z):
+    out = np.empty((6, 2))
+    out[0, 0] = -1.0*math.sin(q0)
+    out[0, 1] = 0
+    out[1, 0] = 1.0*math.cos(q0)
+    out[1, 1] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    return out
+
+
+# link1[0,0,0]_dJ
+def function14(q0, q1, dq0, dq1, x, y, z):
+    _cse0 = 1.0*dq0
+    out = np.empty((6, 2))
+    out[0, 0] = -_cse0*math.cos(q0)
+    out[0, 1] = 0
+    out[1, 0] = -_cse0*math.sin(q0)
+    out[1, 1] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    return out
+
+
+# EE[0,0,0]_Tx
+def function15(q0, q1, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = math.sin(q0)
+    _cse3 = 1.2*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 1.2*_cse0
+    out = np.empty((4, 1))
+    out[0, 0] = 2.0*_cse0 - _cse1*_cse3 + _cse4*_cse5
+    out[1, 0] = _cse1*_cse5 + 2.0*_cse2 + _cse3*_cse4
+    out[2, 0] = 0
+    out[3, 0] = 1
+    return out
+
+
+# EE[0,0,0]_J
+def function16(q0, q1, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = 1.2*_cse0
+    _cse3 = math.sin(q1)
+    _cse4 = math.cos(q0)
+    _cse5 = 1.2*_cse4
+    _cse6 = _cse1*_cse2 + _cse3*_cse5
+    _cse7 = _cse2*_cse3
+    out = np.empty((6, 2))
+    out[0, 0] = -2.0*_cse0 - _cse6
+    out[0, 1] = -_cse6
+    out[1, 0] = _cse1*_cse5 + 2.0*_cse4 - _cse7
+    out[1, 1] = 1.2*_cse1*_cse4 - _cse7
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    return out
+
+
+# EE[0,0,0]_dJ
+def function17(q0, q1, dq0, dq1, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = 1.2*_cse1
+    _cse3 = math.cos(q0)
+    _cse4 = 1.2*math.cos(q1)
+    _cse5 = _cse3*_cse4
+    _cse6 = _cse0*_cse2 - _cse5
+    _cse7 = _cse6*dq1
+    _cse8 = _cse0*_cse4 + _cse2*_cse3
+    _cse9 = -_cse8
+    _cse10 = _cse9*dq1
+    out = np.empty((6, 2))
+    out[0, 0] = _cse7 + dq0*(1.2*_cse0*_cse1 - 2.0*_cse3 - _cse5)
+    out[0, 1] = _cse6*dq0 + _cse7
+    out[1, 0] = _cse10 + dq0*(-2.0*_cse0 - _cse8)
+    out[1, 1] = _cse10 + _cse9*dq0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    return out
+
+
+# EE_Tx
+def function18(q0, q1, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = _cse1*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4 - _cse3
+    _cse6 = _cse1*_cse4
+    _cse7 = _cse0*_cse2
+    _cse8 = _cse6 + _cse7
+    out = np.empty((4, 1))
+    out[0, 0] = 1.2*_cse0*_cse4 + 2.0*_cse0 - 1.2*_cse3 + _cse5*x - _cse8*y
+    out[1, 0] = 2.0*_cse1 + _cse5*y + 1.2*_cse6 + 1.2*_cse7 + _cse8*x
+    out[2, 0] = z
+    out[3, 0] = 1
+    return out
+
+
+# EE_J
+def function19(q0, q1, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q1)
+    _cse2 = _cse0*_cse1
+    _cse3 = 1.2*_cse2
+    _cse4 = math.sin(q1)
+    _cse5 = math.cos(q0)
+    _cse6 = _cse4*_cse5
+    _cse7 = 1.2*_cse6
+    _cse8 = _cse0*_cse4
+    _cse9 = _cse1*_cse5
+    _cse10 = _cse8 - _cse9
+    _cse11 = -_cse2 - _cse6
+    _cse12 = -_cse10*x + _cse11*y - 1.2*_cse8 + 1.2*_cse9
+    out = np.empty((6, 2))
+    out[0, 0] = -2.0*_cse0 + _cse10*y + _cse11*x - _cse3 - _cse7
+    out[0, 1] = _cse10*y + _cse11*x - _cse3 - _cse7
+    out[1, 0] = _cse12 + 2.0*_cse5
+    out[1, 1] = _cse12
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 1
+    out[5, 1] = 1
+    return out
+
+
+# EE_dJ
+def function20(q0, q1, dq0, dq1, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = _cse0*_cse1
+    _cse3 = math.cos(q0)
+    _cse4 = math.cos(q1)
+    _cse5 = _cse3*_cse4
+    _cse6 = _cse0*_cse4
+    _cse7 = _cse1*_cse3
+    _cse8 = _cse6 + _cse7
+    _cse9 = _cse2 - _cse5
+    _cse10 = 1.2*_cse2 - 1.2*_cse5 + _cse8*y + _cse9*x
+    _cse11 = _cse10*dq1
+    _cse12 = 1.2*_cse6
+    _cse13 = 1.2*_cse7
+    _cse14 = -_cse8
+    _cse15 = -_cse12 - _cse13 + _cse14*x + _cse9*y
+    _cse16 = _cse15*dq1
+    out = np.empty((6, 2))
+    out[0, 0] = _cse11 + dq0*(_cse10 - 2.0*_cse3)
+    out[0, 1] = _cse10*dq0 + _cse11
+    out[1, 0] = _cse16 + dq0*(-2.0*_cse0 - _cse12 - _cse13 + _cse14*x + _cse9*y)
+    out[1, 1] = _cse15*dq0 + _cse16
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    return out
+
+
+FUNCTIONS = {
+    'M': function0,
+    'g': function1,
+    'Gamma': function2,
+    'joint0[0,0,0]_Tx': function3,
+    'joint0[0,0,0]_J': function4,
+    'joint0[0,0,0]_dJ': function5,
+    'joint1[0,0,0]_Tx': function6,
+    'joint1[0,0,0]_J': function7,
+    'joint1[0,0,0]_dJ': function8,
+    'link0[0,0,0]_Tx': function9,
+    'link0[0,0,0]_J': function10,
+    'link0[0,0,0]_dJ': function11,
+    'link1[0,0,0]_Tx': function12,
+    'link1[0,0,0]_J': function13,
+    'link1[0,0,0]_dJ': function14,
+    'EE[0,0,0]_Tx': function15,
+    'EE[0,0,0]_J': function16,
+    'EE[0,0,0]_dJ': function17,
+    'EE_Tx': function18,
+    'EE_J': function19,
+    'EE_dJ': function20,
+}
@@ -0,0 +1,6106 @@
+# generated by abr_control.utils.export, do not edit
+import math
+
+import numpy as np
+
+VERSION = '0.1.0'
+CONFIG_HASH = '42b3394af966fa97a5a207c12c4e27da'
+
+
+# M
+def function0(q0, q1, q2, q3, q4, q5):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse3 - 0.00099446*_cse4
+    _cse6 = _cse0*_cse5
+    _cse7 = -9.39986999999999e-5*_cse0 - 0.76683867*_cse1 - 5.7*_cse6
+    _cse8 = 1.6491e-5*_cse0 + _cse6
+    _cse9 = -0.1345331*_cse1 - _cse8
+    _cse10 = _cse1*_cse5
+    _cse11 = 0.76683867*_cse0 - 9.39986999999999e-5*_cse1 - 5.7*_cse10
+    _cse12 = 1.6491e-5*_cse1 + _cse10
+    _cse13 = 0.1345331*_cse0 - _cse12
+    _cse14 = 0.828945*_cse2
+    _cse15 = _cse0*_cse4
+    _cse16 = math.sin(q2)
+    _cse17 = math.cos(q2)
+    _cse18 = -0.00067934*_cse16 + 0.18677*_cse17
+    _cse19 = _cse18*_cse2
+    _cse20 = _cse0*_cse19
+    _cse21 = 0.18677*_cse16 + 0.00067934*_cse17
+    _cse22 = _cse21*_cse4
+    _cse23 = _cse0*_cse22
+    _cse24 = -_cse0*_cse14 - 6.43148999999999e-5*_cse0 - 0.0485592900000001*_cse1 - 0.000448578*_cse15 - 3.9*_cse20 - 3.9*_cse23 - 3.9*_cse6
+    _cse25 = _cse0*_cse3 + 0.00011502*_cse15 + _cse20 + _cse23 + _cse8
+    _cse26 = -0.0124511*_cse1 - _cse25
+    _cse27 = _cse1*_cse4
+    _cse28 = _cse1*_cse19
+    _cse29 = _cse1*_cse22
+    _cse30 = 0.0485592900000001*_cse0 - _cse1*_cse14 - 6.43148999999999e-5*_cse1 - 3.9*_cse10 - 0.000448578*_cse27 - 3.9*_cse28 - 3.9*_cse29
+    _cse31 = _cse1*_cse3 + _cse12 + 0.00011502*_cse27 + _cse28 + _cse29
+    _cse32 = 0.0124511*_cse0 - _cse31
+    _cse33 = 0.531375*_cse2
+    _cse34 = math.sin(q3)
+    _cse35 = math.cos(q3)
+    _cse36 = 5.5328e-5*_cse34 - 0.0075028*_cse35
+    _cse37 = _cse17*_cse2
+    _cse38 = _cse0*_cse37
+    _cse39 = _cse16*_cse4
+    _cse40 = _cse0*_cse39
+    _cse41 = _cse38 + _cse40
+    _cse42 = -_cse41
+    _cse43 = 0.0075028*_cse34 + 5.5328e-5*_cse35
+    _cse44 = -_cse43
+    _cse45 = _cse16*_cse2
+    _cse46 = _cse0*_cse45
+    _cse47 = _cse17*_cse4
+    _cse48 = _cse0*_cse47
+    _cse49 = _cse46 - _cse48
+    _cse50 = -4.03825e-5*_cse0*_cse17*_cse4 + _cse0*_cse33 + 4.12275e-5*_cse0 + 0.00028755*_cse15 + 2.5*_cse20 + 2.5*_cse23 - 2.5*_cse36*_cse42 + 0.51345*_cse38 + 0.51345*_cse40 - 2.5*_cse44*_cse49 + 4.03825e-5*_cse46 + 2.5*_cse6
+    _cse51 = -0.25782025*_cse1 - _cse50
+    _cse52 = -1.6153e-5*_cse0*_cse17*_cse4 + _cse25 - _cse36*_cse42 + 0.20538*_cse38 + 0.20538*_cse40 - _cse44*_cse49 + 1.6153e-5*_cse46
+    _cse53 = -0.1031281*_cse1 - _cse52
+    _cse54 = _cse1*_cse37
+    _cse55 = _cse1*_cse39
+    _cse56 = _cse54 + _cse55
+    _cse57 = -_cse56
+    _cse58 = _cse1*_cse45
+    _cse59 = _cse1*_cse47
+    _cse60 = _cse58 - _cse59
+    _cse61 = -4.03825e-5*_cse1*_cse17*_cse4 + _cse1*_cse33 + 4.12275e-5*_cse1 + 2.5*_cse10 + 0.00028755*_cse27 + 2.5*_cse28 + 2.5*_cse29 - 2.5*_cse36*_cse57 - 2.5*_cse44*_cse60 + 0.51345*_cse54 + 0.51345*_cse55 + 4.03825e-5*_cse58
+    _cse62 = 0.25782025*_cse0 - _cse61
+    _cse63 = -1.6153e-5*_cse1*_cse17*_cse4 + _cse31 - _cse36*_cse57 - _cse44*_cse60 + 0.20538*_cse54 + 0.20538*_cse55 + 1.6153e-5*_cse58
+    _cse64 = 0.1031281*_cse0 - _cse63
+    _cse65 = math.sin(q4)
+    _cse66 = math.cos(q4)
+    _cse67 = 0.0036091*_cse65 + 5.009e-5*_cse66
+    _cse68 = _cse35*_cse49
+    _cse69 = _cse34*_cse42
+    _cse70 = _cse68 - _cse69
+    _cse71 = -5.009e-5*_cse65 + 0.0036091*_cse66
+    _cse72 = -_cse1*_cse71 + 0.1099981*_cse1 - 4.5318e-5*_cse35*_cse49 + _cse52 - _cse67*_cse70 + 4.5318e-5*_cse69
+    _cse73 = 0.095416*_cse34*_cse49 + 0.095416*_cse35*_cse42 - _cse72
+    _cse74 = 2.5*_cse1*_cse71 - 0.27499525*_cse1 + 0.23854*_cse34*_cse49 + 0.23854*_cse35*_cse42 + 0.000113295*_cse35*_cse49 - _cse50 + 2.5*_cse67*_cse70 - 0.000113295*_cse69
+    _cse75 = _cse0*_cse71
+    _cse76 = _cse34*_cse57
+    _cse77 = _cse35*_cse60 - _cse76
+    _cse78 = 0.27499525*_cse0 + 0.23854*_cse34*_cse60 + 0.23854*_cse35*_cse57 + 0.000113295*_cse35*_cse60 - _cse61 + 2.5*_cse67*_cse77 - 2.5*_cse75 - 0.000113295*_cse76
+    _cse79 = -0.1099981*_cse0 - 4.5318e-5*_cse35*_cse60 + _cse63 - _cse67*_cse77 + _cse75 + 4.5318e-5*_cse76
+    _cse80 = 0.095416*_cse34*_cse60 + 0.095416*_cse35*_cse57 - _cse79
+    _cse81 = _cse66*_cse70
+    _cse82 = _cse65*_cse70
+    _cse83 = _cse1*_cse66
+    _cse84 = 4.5293e-5*_cse1*_cse65 + 0.102286*_cse34*_cse49 + 0.102286*_cse35*_cse42 - _cse72 - 4.5293e-5*_cse81 - 0.065821*_cse82 - 0.065821*_cse83
+    _cse85 = 0.148785*_cse2
+    _cse86 = 1.13071e-5*_cse0*_cse17*_cse4 - _cse0*_cse85 - 1.15437e-5*_cse0 + 3.17051e-5*_cse1*_cse65 + 0.7*_cse1*_cse71 - 0.07699867*_cse1 - 8.0514e-5*_cse15 - 0.7*_cse20 - 0.7*_cse23 + 0.0716002*_cse34*_cse49 + 0.0716002*_cse35*_cse42 + 3.17226e-5*_cse35*_cse49 + 0.7*_cse36*_cse42 - 0.143766*_cse38 - 0.143766*_cse40 + 0.7*_cse44*_cse49 - 1.13071e-5*_cse46 - 0.7*_cse6 + 0.7*_cse67*_cse70 - 3.17226e-5*_cse69 - 3.17051e-5*_cse81 - 0.0460747*_cse82 - 0.0460747*_cse83
+    _cse87 = _cse0*_cse65
+    _cse88 = _cse65*_cse77
+    _cse89 = _cse66*_cse77
+    _cse90 = 0.0460747*_cse0*_cse66 + 0.07699867*_cse0 + 1.13071e-5*_cse1*_cse17*_cse4 - _cse1*_cse85 - 1.15437e-5*_cse1 - 0.7*_cse10 - 8.0514e-5*_cse27 - 0.7*_cse28 - 0.7*_cse29 + 0.0716002*_cse34*_cse60 + 0.0716002*_cse35*_cse57 + 3.17226e-5*_cse35*_cse60 + 0.7*_cse36*_cse57 + 0.7*_cse44*_cse60 - 0.143766*_cse54 - 0.143766*_cse55 - 1.13071e-5*_cse58 + 0.7*_cse67*_cse77 - 0.7*_cse75 - 3.17226e-5*_cse76 - 3.17051e-5*_cse87 - 0.0460747*_cse88 - 3.17051e-5*_cse89
+    _cse91 = 0.065821*_cse0*_cse66 + 0.102286*_cse34*_cse60 + 0.102286*_cse35*_cse57 - _cse79 - 4.5293e-5*_cse87 - 0.065821*_cse88 - 4.5293e-5*_cse89
+    _cse92 = 0.21255*_cse4
+    _cse93 = 0.00099446*_cse2 + _cse92
+    _cse94 = _cse1*_cse93
+    _cse95 = _cse0*_cse93
+    _cse96 = _cse1*_cse2
+    _cse97 = _cse18*_cse27
+    _cse98 = _cse21*_cse96
+    _cse99 = _cse1*_cse92 + _cse94 - 0.00011502*_cse96 + _cse97 - _cse98
+    _cse100 = _cse0*_cse92
+    _cse101 = _cse15*_cse18
+    _cse102 = -_cse0*_cse2*_cse21 - 0.00011502*_cse0*_cse2 + _cse100 + _cse101 + _cse95
+    _cse103 = -_cse102
+    _cse104 = -_cse36*_cse49
+    _cse105 = 0.20538*_cse48
+    _cse106 = 1.6153e-5*_cse40
+    _cse107 = 1.6153e-5*_cse38
+    _cse108 = -0.20538*_cse0*_cse16*_cse2 + _cse104 + _cse105 + _cse106 + _cse107 - _cse41*_cse44
+    _cse109 = -_cse102 - _cse108
+    _cse110 = -_cse60
+    _cse111 = _cse110*_cse36
+    _cse112 = _cse44*_cse57
+    _cse113 = _cse111 + _cse112 + 1.6153e-5*_cse54 + 1.6153e-5*_cse55 - 0.20538*_cse58 + 0.20538*_cse59
+    _cse114 = _cse113 + _cse99
+    _cse115 = _cse34*_cse41
+    _cse116 = _cse34*_cse49
+    _cse117 = 4.5318e-5*_cse116
+    _cse118 = -_cse117
+    _cse119 = _cse118 + 0.095416*_cse68
+    _cse120 = _cse36*_cse49
+    _cse121 = -_cse116 + _cse35*_cse41
+    _cse122 = _cse121*_cse67
+    _cse123 = _cse41*_cse44
+    _cse124 = _cse35*_cse41
+    _cse125 = -_cse101 - _cse105 - _cse106 - _cse107 + _cse120 + _cse122 + _cse123 + 4.5318e-5*_cse124 + 0.20538*_cse46
+    _cse126 = 0.095416*_cse115 + _cse119 + _cse125
+    _cse127 = _cse0*_cse2
+    _cse128 = _cse127*_cse21
+    _cse129 = -_cse100 + 0.00011502*_cse127 + _cse128 - _cse95
+    _cse130 = _cse126 + _cse129
+    _cse131 = _cse110*_cse35
+    _cse132 = _cse110*_cse34
+    _cse133 = 4.5318e-5*_cse132
+    _cse134 = -_cse133
+    _cse135 = 0.095416*_cse131 + _cse134
+    _cse136 = _cse135 + 0.095416*_cse76
+    _cse137 = -_cse132 + _cse35*_cse57
+    _cse138 = _cse137*_cse67
+    _cse139 = _cse35*_cse57
+    _cse140 = _cse138 + 4.5318e-5*_cse139
+    _cse141 = _cse114 + _cse140
+    _cse142 = _cse136 + _cse141
+    _cse143 = 4.5293e-5*_cse66
+    _cse144 = _cse121*_cse143
+    _cse145 = 0.065821*_cse65
+    _cse146 = _cse121*_cse145
+    _cse147 = 0.102286*_cse115 + _cse118 + _cse125 + _cse129 - _cse144 - _cse146 + 0.102286*_cse68
+    _cse148 = 0.102286*_cse131 + _cse134 - _cse137*_cse143 - _cse137*_cse145 + 0.102286*_cse76
+    _cse149 = _cse141 + _cse148
+    _cse150 = -_cse21
+    _cse151 = _cse150*_cse96
+    _cse152 = _cse151 + _cse97
+    _cse153 = _cse127*_cse150
+    _cse154 = _cse101 + _cse153
+    _cse155 = -_cse154
+    _cse156 = _cse108 + _cse154
+    _cse157 = -_cse156
+    _cse158 = _cse113 + _cse152
+    _cse159 = _cse126 - _cse153
+    _cse160 = _cse140 + _cse158
+    _cse161 = _cse136 + _cse160
+    _cse162 = _cse117 - 0.102286*_cse35*_cse49
+    _cse163 = _cse121*_cse67 - _cse144 - _cse146 - _cse156 - _cse162 + 0.102286*_cse34*_cse41 + 4.5318e-5*_cse35*_cse41
+    _cse164 = _cse148 + _cse160
+    _cse165 = _cse43*_cse56
+    _cse166 = _cse111 + _cse165
+    _cse167 = _cse42*_cse43
+    _cse168 = _cse120 + _cse167
+    _cse169 = _cse35*_cse56
+    _cse170 = _cse132 + _cse169
+    _cse171 = -_cse170
+    _cse172 = _cse171*_cse67
+    _cse173 = 4.5318e-5*_cse169
+    _cse174 = _cse34*_cse56
+    _cse175 = _cse135 + _cse166 + _cse172 - _cse173 - 0.095416*_cse174
+    _cse176 = _cse35*_cse42
+    _cse177 = _cse116 + _cse176
+    _cse178 = -_cse177
+    _cse179 = _cse178*_cse67
+    _cse180 = 4.5318e-5*_cse176
+    _cse181 = _cse119 + _cse168 + _cse179 - _cse180 - 0.095416*_cse69
+    _cse182 = 0.102286*_cse110*_cse35 + _cse110*_cse36 - _cse133 - _cse143*_cse171 - _cse145*_cse171 + _cse171*_cse67 - _cse173 - 0.102286*_cse174 + _cse43*_cse56
+    _cse183 = -_cse104 - _cse143*_cse178 - _cse145*_cse178 - _cse162 + _cse178*_cse67 - _cse180 + _cse42*_cse43 - 0.102286*_cse69
+    _cse184 = -_cse67
+    _cse185 = _cse0*_cse184
+    _cse186 = _cse131 - _cse174
+    _cse187 = _cse186*_cse71
+    _cse188 = _cse185 + _cse187
+    _cse189 = _cse1*_cse184
+    _cse190 = _cse70*_cse71
+    _cse191 = _cse189 + _cse190
+    _cse192 = _cse186*_cse65
+    _cse193 = _cse0*_cse66
+    _cse194 = 0.065821*_cse66
+    _cse195 = -_cse186*_cse194 + _cse188 + 4.5293e-5*_cse192 + 4.5293e-5*_cse193 + 0.065821*_cse87
+    _cse196 = _cse1*_cse65
+    _cse197 = _cse191 + 0.065821*_cse196 - 0.065821*_cse81 + 4.5293e-5*_cse82 + 4.5293e-5*_cse83
+    _cse198 = -_cse17*_cse4 + _cse45
+    _cse199 = -_cse198
+    _cse200 = _cse199*_cse35
+    _cse201 = -_cse37 - _cse39
+    _cse202 = _cse201*_cse34
+    _cse203 = 0.09*_cse200 + 0.09*_cse202
+    _cse204 = _cse199*_cse34
+    _cse205 = _cse201*_cse35 - _cse204
+    _cse206 = _cse205*_cse65
+    _cse207 = 0.05*_cse206
+    _cse208 = -_cse207
+    _cse209 = 3.9*_cse101
+    _cse210 = 3.9*_cse0*_cse2*_cse21 + 0.000448578*_cse0*_cse2 - 0.828945*_cse15 - _cse209 - 3.9*_cse95
+    _cse211 = 3.9*_cse97
+    _cse212 = _cse211 + 0.828945*_cse27 + 3.9*_cse94 - 0.000448578*_cse96 - 3.9*_cse98
+    _cse213 = 2.5*_cse95
+    _cse214 = 0.531375*_cse15
+    _cse215 = 2.5*_cse101
+    _cse216 = 4.03825e-5*_cse40
+    _cse217 = 4.03825e-5*_cse38
+    _cse218 = 0.51345*_cse48
+    _cse219 = -0.51345*_cse0*_cse16*_cse2 + _cse215 + _cse216 + _cse217 + _cse218 - 2.5*_cse36*_cse49 - 2.5*_cse41*_cse44
+    _cse220 = 2.5*_cse0*_cse2*_cse21 + 0.00028755*_cse0*_cse2 - _cse213 - _cse214 - _cse219
+    _cse221 = 2.5*_cse111
+    _cse222 = 2.5*_cse112 + _cse221 + 4.03825e-5*_cse54 + 4.03825e-5*_cse55 - 0.51345*_cse58 + 0.51345*_cse59 + 2.5*_cse97
+    _cse223 = _cse222 + 0.531375*_cse27 + 2.5*_cse94 - 0.00028755*_cse96 - 2.5*_cse98
+    _cse224 = 2.5*_cse120
+    _cse225 = -0.000113295*_cse116 + 0.23854*_cse68
+    _cse226 = 0.23854*_cse115 + 2.5*_cse122 + 2.5*_cse123 + 0.000113295*_cse124 - _cse215 - _cse216 - _cse217 - _cse218 + _cse224 + _cse225 + 0.51345*_cse46
+    _cse227 = 0.00028755*_cse127 + 2.5*_cse128 - _cse213 - _cse214 + _cse226
+    _cse228 = 0.23854*_cse131 - 0.000113295*_cse132
+    _cse229 = 2.5*_cse138 + 0.000113295*_cse139 + _cse228 + 0.23854*_cse76
+    _cse230 = _cse223 + _cse229
+    _cse231 = 1.13071e-5*_cse38
+    _cse232 = 1.13071e-5*_cse40
+    _cse233 = 0.143766*_cse48
+    _cse234 = 0.7*_cse101
+    _cse235 = 3.17226e-5*_cse116
+    _cse236 = 0.0460747*_cse65
+    _cse237 = _cse121*_cse236
+    _cse238 = 3.17051e-5*_cse66
+    _cse239 = _cse121*_cse238
+    _cse240 = 0.0716002*_cse115 + 0.7*_cse120 + 0.7*_cse122 + 0.7*_cse123 + 3.17226e-5*_cse124 + 8.0514e-5*_cse127 + 0.7*_cse128 - 0.148785*_cse15 - _cse231 - _cse232 - _cse233 - _cse234 - _cse235 - _cse237 - _cse239 + 0.143766*_cse46 + 0.0716002*_cse68 - 0.7*_cse95
+    _cse241 = 3.17226e-5*_cse132
+    _cse242 = 0.7*_cse111 + 0.7*_cse112 + 0.0716002*_cse131 - _cse137*_cse236 - _cse137*_cse238 + 0.7*_cse138 + 3.17226e-5*_cse139 - _cse241 + 1.13071e-5*_cse54 + 1.13071e-5*_cse55 - 0.143766*_cse58 + 0.143766*_cse59 + 0.0716002*_cse76 + 0.7*_cse97
+    _cse243 = _cse242 + 0.148785*_cse27 + 0.7*_cse94 - 8.0514e-5*_cse96 - 0.7*_cse98
+    _cse244 = _cse0**2
+    _cse245 = _cse1**2
+    _cse246 = 5.7*_cse93**2
+    _cse247 = 3.9*_cse19
+    _cse248 = -1.65789*_cse2 - 3.9*_cse22 - _cse247 + 0.003429816*_cse4
+    _cse249 = 0.4251*_cse2
+    _cse250 = _cse19 + _cse22 + _cse249 - 0.00087944*_cse4
+    _cse251 = -_cse250
+    _cse252 = -_cse201*_cse36
+    _cse253 = 0.20538*_cse39
+    _cse254 = 0.20538*_cse37
+    _cse255 = 1.6153e-5*_cse45
+    _cse256 = -1.6153e-5*_cse17*_cse4 - _cse198*_cse44 + _cse250 + _cse253 + _cse254 + _cse255
+    _cse257 = -_cse252 - _cse256
+    _cse258 = 1.06275*_cse2
+    _cse259 = 4.03825e-5*_cse45
+    _cse260 = 0.51345*_cse37
+    _cse261 = 0.51345*_cse39
+    _cse262 = 2.5*_cse19
+    _cse263 = 2.5*_cse22
+    _cse264 = 4.03825e-5*_cse17*_cse4 + 2.5*_cse198*_cse44 + 2.5*_cse201*_cse36 - _cse258 - _cse259 - _cse260 - _cse261 - _cse262 - _cse263 + 0.0021986*_cse4
+    _cse265 = -_cse19
+    _cse266 = _cse198*_cse35
+    _cse267 = -_cse202 + _cse266
+    _cse268 = _cse267*_cse67
+    _cse269 = 4.5318e-5*_cse266
+    _cse270 = _cse201*_cse36
+    _cse271 = _cse198*_cse44
+    _cse272 = -_cse253 - _cse254 - _cse255 + _cse270 + _cse271 + 1.6153e-5*_cse47
+    _cse273 = _cse198*_cse34
+    _cse274 = _cse201*_cse35
+    _cse275 = 4.5318e-5*_cse202
+    _cse276 = -_cse275
+    _cse277 = 0.095416*_cse274 + _cse276
+    _cse278 = 0.095416*_cse273 + _cse277
+    _cse279 = -_cse22 - _cse249 + _cse265 + _cse268 + _cse269 + _cse272 + _cse278 + 0.00087944*_cse4
+    _cse280 = 2.5*_cse270
+    _cse281 = -_cse259 - _cse260 - _cse261 - _cse262 + 2.5*_cse271 + _cse280 + 4.03825e-5*_cse47
+    _cse282 = -0.000113295*_cse202 + 0.23854*_cse274
+    _cse283 = 0.000113295*_cse266 + 2.5*_cse268 + 0.23854*_cse273 + _cse282
+    _cse284 = -_cse258 - _cse263 + _cse281 + _cse283 + 0.0021986*_cse4
+    _cse285 = _cse143*_cse267
+    _cse286 = _cse145*_cse267
+    _cse287 = -0.102286*_cse201*_cse35 + _cse252 + _cse275
+    _cse288 = 0.102286*_cse198*_cse34 + 4.5318e-5*_cse198*_cse35 - _cse256 + _cse267*_cse67 - _cse285 - _cse286 - _cse287
+    _cse289 = 1.13071e-5*_cse45
+    _cse290 = _cse238*_cse267
+    _cse291 = 0.143766*_cse39
+    _cse292 = 0.143766*_cse37
+    _cse293 = 0.7*_cse19
+    _cse294 = _cse236*_cse267
+    _cse295 = 3.17226e-5*_cse202
+    _cse296 = -0.0716002*_cse201*_cse35 - 0.7*_cse201*_cse36 + _cse295
+    _cse297 = 1.13071e-5*_cse17*_cse4 + 0.0716002*_cse198*_cse34 + 3.17226e-5*_cse198*_cse35 + 0.7*_cse198*_cse44 - 0.29757*_cse2 - 0.7*_cse22 + 0.7*_cse267*_cse67 - _cse289 - _cse290 - _cse291 - _cse292 - _cse293 - _cse294 - _cse296 + 0.000615608*_cse4
+    _cse298 = _cse150*_cse4
+    _cse299 = _cse265 + _cse298
+    _cse300 = _cse272 + _cse299
+    _cse301 = _cse268 + _cse269 + _cse300
+    _cse302 = _cse278 + _cse301
+    _cse303 = 0.102286*_cse273 + 0.102286*_cse274 + _cse276 - _cse285 - _cse286 + _cse301
+    _cse304 = 0.205*_cse244 + 0.205*_cse245
+    _cse305 = _cse199*_cse43
+    _cse306 = _cse270 + _cse305
+    _cse307 = _cse200 + _cse202
+    _cse308 = -_cse307
+    _cse309 = _cse308*_cse67
+    _cse310 = 4.5318e-5*_cse200
+    _cse311 = -0.095416*_cse204 + _cse277 + _cse306 + _cse309 - _cse310
+    _cse312 = -_cse143*_cse308 - _cse145*_cse308 + _cse199*_cse43 - 0.102286*_cse204 - _cse287 + _cse308*_cse67 - _cse310
+    _cse313 = 0.145*_cse244 + 0.145*_cse245
+    _cse314 = _cse205*_cse71
+    _cse315 = -_cse194*_cse205 + 4.5293e-5*_cse206 + _cse314
+    _cse316 = -0.09*_cse0*_cse170 - 0.09*_cse1*_cse177
+    _cse317 = -_cse192 - _cse193
+    _cse318 = -_cse82 - _cse83
+    _cse319 = -0.05*_cse0*_cse317 - 0.05*_cse1*_cse318
+    _cse320 = -3.9*_cse153 - _cse209
+    _cse321 = 3.9*_cse151 + _cse211
+    _cse322 = 2.5*_cse153
+    _cse323 = -_cse219 - _cse322
+    _cse324 = 2.5*_cse151 + _cse222
+    _cse325 = _cse226 - _cse322
+    _cse326 = _cse229 + _cse324
+    _cse327 = _cse235 - 0.0716002*_cse35*_cse49 - 0.7*_cse36*_cse49
+    _cse328 = 0.143766*_cse0*_cse16*_cse2 + 0.7*_cse121*_cse67 - 0.7*_cse153 - _cse231 - _cse232 - _cse233 - _cse234 - _cse237 - _cse239 - _cse327 + 0.0716002*_cse34*_cse41 + 3.17226e-5*_cse35*_cse41 + 0.7*_cse41*_cse44
+    _cse329 = 0.7*_cse151 + _cse242
+    _cse330 = -_cse247 + 3.9*_cse298
+    _cse331 = _cse281 + 2.5*_cse298
+    _cse332 = _cse283 + _cse331
+    _cse333 = 3.17226e-5*_cse266 + 0.7*_cse268 + 0.7*_cse270 + 0.7*_cse271 + 0.0716002*_cse273 + 0.0716002*_cse274 - _cse289 - _cse290 - _cse291 - _cse292 - _cse293 - _cse294 - _cse295 + 0.7*_cse298 + 1.13071e-5*_cse47
+    _cse334 = 2.5*_cse165 + _cse221
+    _cse335 = 2.5*_cse167 + _cse224
+    _cse336 = -0.000113295*_cse169 + 2.5*_cse172 - 0.23854*_cse174 + _cse228 + _cse334
+    _cse337 = -0.000113295*_cse176 + 2.5*_cse179 + _cse225 + _cse335 - 0.23854*_cse69
+    _cse338 = 0.0716002*_cse110*_cse35 + 0.7*_cse110*_cse36 - 3.17226e-5*_cse169 - _cse171*_cse236 - _cse171*_cse238 + 0.7*_cse171*_cse67 - 0.0716002*_cse174 - _cse241 + 0.7*_cse43*_cse56
+    _cse339 = -3.17226e-5*_cse176 - _cse178*_cse236 - _cse178*_cse238 + 0.7*_cse178*_cse67 - _cse327 + 0.7*_cse42*_cse43 - 0.0716002*_cse69
+    _cse340 = _cse280 + 2.5*_cse305
+    _cse341 = -0.000113295*_cse200 - 0.23854*_cse204 + _cse282 + 2.5*_cse309 + _cse340
+    _cse342 = 0.7*_cse199*_cse43 - 3.17226e-5*_cse200 - 0.0716002*_cse204 - _cse236*_cse308 - _cse238*_cse308 - _cse296 + 0.7*_cse308*_cse67
+    _cse343 = 2.5*_cse185 + 2.5*_cse187
+    _cse344 = 2.5*_cse189 + 2.5*_cse190
+    _cse345 = 0.0460747*_cse66
+    _cse346 = 0.7*_cse185 - _cse186*_cse345 + 0.7*_cse187 + 3.17051e-5*_cse192 + 3.17051e-5*_cse193 + 0.0460747*_cse87
+    _cse347 = 0.7*_cse189 + 0.7*_cse190 + 0.0460747*_cse196 - 0.0460747*_cse81 + 3.17051e-5*_cse82 + 3.17051e-5*_cse83
+    _cse348 = -_cse205*_cse345 + 3.17051e-5*_cse206 + 0.7*_cse314
+    _cse349 = 2.5*_cse314
+    _cse350 = 0.01*_cse132 + 0.01*_cse169
+    _cse351 = 0.01*_cse116 + 0.01*_cse176
+    _cse352 = 0.04*_cse132 + 0.04*_cse169
+    _cse353 = 2*_cse352
+    _cse354 = 0.04*_cse116 + 0.04*_cse176
+    _cse355 = 2*_cse354
+    _cse356 = -_cse0*_cse350 - _cse0*_cse353 - _cse1*_cse351 - _cse1*_cse355
+    _cse357 = _cse205**2
+    _cse358 = 0.01*_cse200 + 0.01*_cse202
+    _cse359 = 0.04*_cse200 + 0.04*_cse202
+    _cse360 = -0.04*_cse192 - 0.04*_cse193
+    _cse361 = -0.01*_cse192 - 0.01*_cse193
+    _cse362 = -0.04*_cse82 - 0.04*_cse83
+    _cse363 = -0.01*_cse82 - 0.01*_cse83
+    _cse364 = -_cse0*_cse360 - _cse0*_cse361 - _cse1*_cse362 - _cse1*_cse363
+    out = np.empty((6, 6))
+    out[0, 0] = _cse11*_cse13 + _cse24*_cse26 + _cse30*_cse32 + _cse51*_cse53 + _cse62*_cse64 + _cse7*_cse9 + _cse73*_cse74 + _cse78*_cse80 + _cse84*_cse86 + _cse90*_cse91 + (-0.000278975*_cse0 - 0.01794275*_cse1)*(-0.00011159*_cse0 - 0.0071771*_cse1) + (0.0071771*_cse0 - 0.00011159*_cse1)*(0.01794275*_cse0 - 0.000278975*_cse1) + 0.23
+    out[0, 1] = _cse103*_cse30 + _cse109*_cse62 - _cse11*_cse95 + _cse114*_cse51 + _cse130*_cse78 + _cse142*_cse74 + _cse147*_cse90 + _cse149*_cse86 + _cse24*_cse99 + _cse7*_cse94
+    out[0, 2] = _cse152*_cse24 + _cse155*_cse30 + _cse157*_cse62 + _cse158*_cse51 + _cse159*_cse78 + _cse161*_cse74 + _cse163*_cse90 + _cse164*_cse86
+    out[0, 3] = _cse166*_cse51 + _cse168*_cse62 + _cse175*_cse74 + _cse181*_cse78 + _cse182*_cse86 + _cse183*_cse90
+    out[0, 4] = _cse188*_cse74 + _cse191*_cse78 + _cse195*_cse86 + _cse197*_cse90 + _cse203
+    out[0, 5] = _cse208
+    out[1, 0] = -5.7*_cse13*_cse95 + _cse210*_cse32 + _cse212*_cse26 + _cse220*_cse64 + _cse223*_cse53 + _cse227*_cse80 + _cse230*_cse73 + _cse240*_cse91 + _cse243*_cse84 + 5.7*_cse9*_cse94
+    out[1, 1] = _cse103*_cse210 + _cse109*_cse220 + _cse114*_cse223 + _cse130*_cse227 + _cse142*_cse230 + _cse147*_cse240 + _cse149*_cse243 + _cse212*_cse99 + _cse244*_cse246 + 0.245*_cse244 + _cse245*_cse246 + 0.245*_cse245 + _cse248*_cse251 + _cse257*_cse264 + _cse279*_cse284 + _cse288*_cse297 - _cse5*(-1.211535*_cse2 + 0.005668422*_cse4)
+    out[1, 2] = _cse152*_cse212 + _cse155*_cse210 + _cse157*_cse220 + _cse158*_cse223 + _cse159*_cse227 + _cse161*_cse230 + _cse163*_cse240 + _cse164*_cse243 + _cse248*_cse299 + _cse264*_cse300 + _cse284*_cse302 + _cse297*_cse303 + _cse304
+    out[1, 3] = _cse166*_cse223 + _cse168*_cse220 + _cse175*_cse230 + _cse181*_cse227 + _cse182*_cse243 + _cse183*_cse240 + _cse264*_cse306 + _cse284*_cse311 + _cse297*_cse312 + _cse313
+    out[1, 4] = _cse188*_cse230 + _cse191*_cse227 + _cse195*_cse243 + _cse197*_cse240 + _cse284*_cse314 + _cse297*_cse315 + _cse316
+    out[1, 5] = _cse319
+    out[2, 0] = _cse26*_cse321 + _cse32*_cse320 + _cse323*_cse64 + _cse324*_cse53 + _cse325*_cse80 + _cse326*_cse73 + _cse328*_cse91 + _cse329*_cse84
+    out[2, 1] = _cse103*_cse320 + _cse109*_cse323 + _cse114*_cse324 + _cse130*_cse325 + _cse142*_cse326 + _cse147*_cse328 + _cse149*_cse329 + _cse251*_cse330 + _cse257*_cse331 + _cse279*_cse332 + _cse288*_cse333 + _cse304 + _cse321*_cse99
+    out[2, 2] = _cse152*_cse321 + _cse155*_cse320 + _cse157*_cse323 + _cse158*_cse324 + _cse159*_cse325 + _cse161*_cse326 + _cse163*_cse328 + _cse164*_cse329 + _cse299*_cse330 + _cse300*_cse331 + _cse302*_cse332 + _cse303*_cse333 + _cse304
+    out[2, 3] = _cse166*_cse324 + _cse168*_cse323 + _cse175*_cse326 + _cse181*_cse325 + _cse182*_cse329 + _cse183*_cse328 + _cse306*_cse331 + _cse311*_cse332 + _cse312*_cse333 + _cse313
+    out[2, 4] = _cse188*_cse326 + _cse191*_cse325 + _cse195*_cse329 + _cse197*_cse328 + _cse314*_cse332 + _cse315*_cse333 + _cse316
+    out[2, 5] = _cse319
+    out[3, 0] = _cse334*_cse53 + _cse335*_cse64 + _cse336*_cse73 + _cse337*_cse80 + _cse338*_cse84 + _cse339*_cse91
+    out[3, 1] = _cse109*_cse335 + _cse114*_cse334 + _cse130*_cse337 + _cse142*_cse336 + _cse147*_cse339 + _cse149*_cse338 + _cse257*_cse340 + _cse279*_cse341 + _cse288*_cse342 + _cse313
+    out[3, 2] = _cse157*_cse335 + _cse158*_cse334 + _cse159*_cse337 + _cse161*_cse336 + _cse163*_cse339 + _cse164*_cse338 + _cse300*_cse340 + _cse302*_cse341 + _cse303*_cse342 + _cse313
+    out[3, 3] = _cse166*_cse334 + _cse168*_cse335 + _cse175*_cse336 + _cse181*_cse337 + _cse182*_cse338 + _cse183*_cse339 + _cse306*_cse340 + _cse311*_cse341 + _cse312*_cse342 + _cse313
+    out[3, 4] = _cse188*_cse336 + _cse191*_cse337 + _cse195*_cse338 + _cse197*_cse339 + _cse314*_cse341 + _cse315*_cse342 + _cse316
+    out[3, 5] = _cse319
+    out[4, 0] = _cse203 + _cse343*_cse73 + _cse344*_cse80 + _cse346*_cse84 + _cse347*_cse91
+    out[4, 1] = _cse130*_cse344 + _cse142*_cse343 + _cse147*_cse347 + _cse149*_cse346 + _cse279*_cse349 + _cse288*_cse348 + _cse356
+    out[4, 2] = _cse159*_cse344 + _cse161*_cse343 + _cse163*_cse347 + _cse164*_cse346 + _cse302*_cse349 + _cse303*_cse348 + _cse356
+    out[4, 3] = _cse175*_cse343 + _cse181*_cse344 + _cse182*_cse346 + _cse183*_cse347 + _cse311*_cse349 + _cse312*_cse348 + _cse356
+    out[4, 4] = _cse170*_cse350 + _cse170*_cse353 + _cse177*_cse351 + _cse177*_cse355 + _cse188*_cse343 + _cse191*_cse344 + _cse195*_cse346 + _cse197*_cse347 + _cse307*_cse358 + 2*_cse307*_cse359 + _cse315*_cse348 + 2.5*_cse357*_cse71**2
+    out[4, 5] = -_cse206*_cse358 - _cse206*_cse359 + _cse317*_cse350 + _cse317*_cse352 + _cse318*_cse351 + _cse318*_cse354
+    out[5, 0] = _cse208
+    out[5, 1] = _cse364
+    out[5, 2] = _cse364
+    out[5, 3] = _cse364
+    out[5, 4] = _cse170*_cse360 + _cse170*_cse361 + _cse177*_cse362 + _cse177*_cse363 - _cse207*_cse307
+    out[5, 5] = _cse317*_cse360 + _cse317*_cse361 + _cse318*_cse362 + _cse318*_cse363 + 0.05*_cse357*_cse65**2
+    return out
+
+
+# g
+def function1(q0, q1, q2, q3, q4, q5):
+    _cse0 = math.sin(q1)
+    _cse1 = math.cos(q1)
+    _cse2 = math.cos(q3)
+    _cse3 = math.sin(q2)
+    _cse4 = _cse0*_cse3
+    _cse5 = math.cos(q2)
+    _cse6 = _cse1*_cse5
+    _cse7 = _cse4 - _cse6
+    _cse8 = _cse2*_cse7
+    _cse9 = math.sin(q3)
+    _cse10 = _cse0*_cse5
+    _cse11 = _cse1*_cse3
+    _cse12 = -_cse10 - _cse11
+    _cse13 = _cse12*_cse9
+    _cse14 = -_cse13 + _cse8
+    _cse15 = math.cos(q4)
+    _cse16 = 0.000311027031*_cse15
+    _cse17 = -0.00067934*_cse3 + 0.18677*_cse5
+    _cse18 = 0.18677*_cse3 + 0.00067934*_cse5
+    _cse19 = 94.176*_cse1
+    _cse20 = math.sin(q4)
+    _cse21 = 0.451992807*_cse20
+    _cse22 = 0.001422622656*_cse8
+    _cse23 = 5.5328e-5*_cse2 + 0.0075028*_cse9
+    _cse24 = -55.917*_cse23*_cse7
+    _cse25 = 0.000903227301*_cse6
+    _cse26 = 3.042475362*_cse7*_cse9
+    _cse27 = 0.00157242528*_cse15 + 0.1132968672*_cse20
+    _cse28 = _cse14*_cse27
+    _cse29 = 55.917*_cse12*(-0.0075028*_cse2 + 5.5328e-5*_cse9)
+    _cse30 = 3.042475362*_cse12*_cse2
+    _cse31 = 0.001422622656*_cse13 - _cse29 - _cse30
+    _cse32 = -_cse7
+    _cse33 = _cse2*_cse32
+    _cse34 = -_cse13 - _cse33
+    _cse35 = _cse32*_cse9
+    _cse36 = _cse12*_cse2 - _cse35
+    out = np.empty((6, 1))
+    out[0, 0] = 0
+    out[1, 0] = 94.176*_cse0*_cse17 + 51.91937595*_cse0 - 0.13842936126*_cse1 + 11.48423346*_cse10 + 11.48423346*_cse11 + _cse14*_cse16 + _cse14*_cse21 + _cse18*_cse19 - _cse22 - _cse24 - _cse25 - _cse26 - _cse28 + _cse31 + 0.000903227301*_cse4
+    out[2, 0] = 94.176*_cse0*_cse17 + 0.000903227301*_cse0*_cse3 + 11.48423346*_cse0*_cse5 + 11.48423346*_cse1*_cse3 + 0.001422622656*_cse12*_cse9 + 0.000311027031*_cse14*_cse15 + 0.451992807*_cse14*_cse20 + _cse18*_cse19 - _cse22 - _cse24 - _cse25 - _cse26 - _cse28 - _cse29 - _cse30
+    out[3, 0] = _cse16*_cse34 + _cse21*_cse34 - 55.917*_cse23*_cse32 - _cse27*_cse34 + _cse31 + 0.001422622656*_cse33 + 3.042475362*_cse35
+    out[4, 0] = 0.451992807*_cse15*_cse36 - 0.000311027031*_cse20*_cse36 - 31.392*_cse36*(0.0036091*_cse15 - 5.009e-5*_cse20)
+    out[5, 0] = 0
+    return out
+
+
+# Gamma
+def function2(q0, q1, q2, q3, q4, q5):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = 0.000278975*_cse0 + 0.01794275*_cse1
+    _cse3 = 0.00358855*_cse0 - 5.5795e-5*_cse1
+    _cse4 = 0.00011159*_cse0 + 0.0071771*_cse1
+    _cse5 = 0.008971375*_cse0 - 0.0001394875*_cse1
+    _cse6 = math.sin(q1)
+    _cse7 = 0.21255*_cse6
+    _cse8 = math.cos(q1)
+    _cse9 = _cse7 - 0.00099446*_cse8
+    _cse10 = _cse0*_cse9
+    _cse11 = 1.6491e-5*_cse0 + _cse10
+    _cse12 = 0.1345331*_cse1 + _cse11
+    _cse13 = _cse1*_cse9
+    _cse14 = 0.383419335*_cse0 - 4.699935e-5*_cse1 - 2.85*_cse13
+    _cse15 = 9.39986999999999e-5*_cse0 + 0.76683867*_cse1 + 5.7*_cse10
+    _cse16 = -_cse15
+    _cse17 = 1.6491e-5*_cse1 + _cse13
+    _cse18 = 0.1345331*_cse0 - _cse17
+    _cse19 = 0.5*_cse18
+    _cse20 = -_cse12
+    _cse21 = 0.00011502*_cse8
+    _cse22 = math.sin(q2)
+    _cse23 = math.cos(q2)
+    _cse24 = 0.00067934*_cse22 - 0.18677*_cse23
+    _cse25 = -_cse24
+    _cse26 = _cse25*_cse6
+    _cse27 = _cse0*_cse26
+    _cse28 = 0.18677*_cse22 + 0.00067934*_cse23
+    _cse29 = _cse28*_cse8
+    _cse30 = _cse0*_cse29
+    _cse31 = _cse0*_cse21 + _cse0*_cse7 + _cse27 + _cse30
+    _cse32 = _cse11 + _cse31
+    _cse33 = 0.0124511*_cse1 + _cse32
+    _cse34 = 0.000448578*_cse8
+    _cse35 = 0.828945*_cse6
+    _cse36 = _cse1*_cse26
+    _cse37 = 3.9*_cse36
+    _cse38 = _cse1*_cse29
+    _cse39 = _cse1*_cse34 + _cse1*_cse35 + _cse37 + 3.9*_cse38
+    _cse40 = 0.0485592900000001*_cse0 - 6.43148999999999e-5*_cse1 - 3.9*_cse13 - _cse39
+    _cse41 = 0.5*_cse40
+    _cse42 = 3.9*_cse27
+    _cse43 = _cse0*_cse34 + _cse0*_cse35 + 3.9*_cse30 + _cse42
+    _cse44 = 6.43148999999999e-5*_cse0 + 0.0485592900000001*_cse1 + 3.9*_cse10 + _cse43
+    _cse45 = -_cse44
+    _cse46 = _cse1*_cse7
+    _cse47 = _cse1*_cse21
+    _cse48 = _cse36 + _cse38 + _cse46 + _cse47
+    _cse49 = _cse17 + _cse48
+    _cse50 = 0.0124511*_cse0 - _cse49
+    _cse51 = 0.5*_cse50
+    _cse52 = -_cse33
+    _cse53 = math.sin(q3)
+    _cse54 = math.cos(q3)
+    _cse55 = 5.5328e-5*_cse53 - 0.0075028*_cse54
+    _cse56 = _cse23*_cse6
+    _cse57 = _cse0*_cse56
+    _cse58 = _cse22*_cse8
+    _cse59 = _cse0*_cse58
+    _cse60 = _cse57 + _cse59
+    _cse61 = _cse55*_cse60
+    _cse62 = 0.0075028*_cse53 + 5.5328e-5*_cse54
+    _cse63 = -_cse62
+    _cse64 = _cse22*_cse6
+    _cse65 = _cse0*_cse64
+    _cse66 = -_cse0*_cse23*_cse8 + _cse65
+    _cse67 = -_cse66
+    _cse68 = _cse63*_cse67
+    _cse69 = _cse23*_cse8
+    _cse70 = _cse0*_cse69
+    _cse71 = 0.20538*_cse57 + 0.20538*_cse59 + 1.6153e-5*_cse65 - 1.6153e-5*_cse70
+    _cse72 = _cse61 + _cse68 + _cse71
+    _cse73 = 0.1031281*_cse1 + _cse32
+    _cse74 = _cse72 + _cse73
+    _cse75 = 0.531375*_cse6
+    _cse76 = _cse1*_cse75
+    _cse77 = 0.00028755*_cse8
+    _cse78 = _cse1*_cse77
+    _cse79 = _cse1*_cse56
+    _cse80 = _cse1*_cse58
+    _cse81 = _cse79 + _cse80
+    _cse82 = -_cse81
+    _cse83 = _cse1*_cse64
+    _cse84 = _cse1*_cse69
+    _cse85 = _cse83 - _cse84
+    _cse86 = 2.5*_cse36
+    _cse87 = 2.5*_cse38
+    _cse88 = 4.03825e-5*_cse83
+    _cse89 = 0.51345*_cse80
+    _cse90 = 0.51345*_cse79
+    _cse91 = -4.03825e-5*_cse1*_cse23*_cse8 - 2.5*_cse55*_cse82 - 2.5*_cse63*_cse85 + _cse76 + _cse78 + _cse86 + _cse87 + _cse88 + _cse89 + _cse90
+    _cse92 = 4.12275e-5*_cse1 + 2.5*_cse13 + _cse91
+    _cse93 = 0.25782025*_cse0 - _cse92
+    _cse94 = 0.5*_cse93
+    _cse95 = 2.5*_cse61
+    _cse96 = 2.5*_cse68
+    _cse97 = 4.03825e-5*_cse65
+    _cse98 = 0.51345*_cse59
+    _cse99 = 0.51345*_cse57
+    _cse100 = -4.03825e-5*_cse70
+    _cse101 = _cse100 + 2.5*_cse27 + _cse97 + _cse98 + _cse99
+    _cse102 = _cse0*_cse75 + _cse0*_cse77 + _cse101 + 2.5*_cse30
+    _cse103 = _cse102 + _cse95 + _cse96
+    _cse104 = 4.12275e-5*_cse0 + 2.5*_cse10
+    _cse105 = 0.25782025*_cse1 + _cse104
+    _cse106 = _cse103 + _cse105
+    _cse107 = -_cse55*_cse82
+    _cse108 = 0.20538*_cse80
+    _cse109 = 0.20538*_cse79
+    _cse110 = 1.6153e-5*_cse83
+    _cse111 = -1.6153e-5*_cse1*_cse23*_cse8 + _cse108 + _cse109 + _cse110 - _cse63*_cse85
+    _cse112 = _cse107 + _cse111
+    _cse113 = 0.1031281*_cse0 - _cse112 - _cse49
+    _cse114 = 0.5*_cse113
+    _cse115 = -_cse60
+    _cse116 = -_cse115*_cse55 - _cse63*_cse66 + _cse71
+    _cse117 = -_cse116 - _cse73
+    _cse118 = _cse102 - 2.5*_cse115*_cse55 - 2.5*_cse63*_cse66
+    _cse119 = -_cse105 - _cse118
+    _cse120 = _cse53*_cse67
+    _cse121 = _cse54*_cse60
+    _cse122 = _cse53*_cse60
+    _cse123 = 4.5318e-5*_cse122
+    _cse124 = -_cse123
+    _cse125 = 0.095416*_cse121 + _cse124
+    _cse126 = 0.095416*_cse120 + _cse125
+    _cse127 = math.sin(q4)
+    _cse128 = math.cos(q4)
+    _cse129 = 0.0036091*_cse127 + 5.009e-5*_cse128
+    _cse130 = _cse54*_cse67
+    _cse131 = -_cse122 + _cse130
+    _cse132 = _cse129*_cse131
+    _cse133 = 4.5318e-5*_cse130 + _cse132
+    _cse134 = 5.009e-5*_cse127 - 0.0036091*_cse128
+    _cse135 = -_cse134
+    _cse136 = _cse1*_cse135
+    _cse137 = 0.1099981*_cse1 - _cse136 + _cse32
+    _cse138 = _cse133 + _cse137 + _cse72
+    _cse139 = _cse126 + _cse138
+    _cse140 = _cse0*_cse135
+    _cse141 = _cse53*_cse82
+    _cse142 = 0.000113295*_cse141
+    _cse143 = _cse54*_cse85
+    _cse144 = -_cse141 + _cse143
+    _cse145 = 0.27499525*_cse0 + 2.5*_cse129*_cse144 - 2.5*_cse140 - _cse142 + 0.23854*_cse53*_cse85 + 0.23854*_cse54*_cse82 + 0.000113295*_cse54*_cse85 - _cse92
+    _cse146 = 0.5*_cse145
+    _cse147 = 0.23854*_cse121 - 0.000113295*_cse122
+    _cse148 = 0.23854*_cse120 + 0.000113295*_cse130 + 2.5*_cse132 + _cse147
+    _cse149 = 0.27499525*_cse1 + _cse104 - 2.5*_cse136
+    _cse150 = _cse103 + _cse148 + _cse149
+    _cse151 = 4.5318e-5*_cse141
+    _cse152 = _cse107 + _cse151
+    _cse153 = _cse111 - _cse129*_cse144 - 4.5318e-5*_cse54*_cse85
+    _cse154 = -0.1099981*_cse0 + _cse140 + _cse49
+    _cse155 = -_cse152 - _cse153 - _cse154 + 0.095416*_cse53*_cse85 + 0.095416*_cse54*_cse82
+    _cse156 = 0.5*_cse155
+    _cse157 = _cse115*_cse53
+    _cse158 = 4.5318e-5*_cse157
+    _cse159 = _cse115*_cse54
+    _cse160 = _cse54*_cse66
+    _cse161 = 4.5318e-5*_cse160
+    _cse162 = -_cse161
+    _cse163 = _cse53*_cse66
+    _cse164 = _cse162 - 0.095416*_cse163
+    _cse165 = _cse158 - 0.095416*_cse159 + _cse164
+    _cse166 = -_cse157 + _cse160
+    _cse167 = _cse116 - _cse129*_cse166 + _cse137
+    _cse168 = -_cse165 - _cse167
+    _cse169 = -0.000113295*_cse160 - 0.23854*_cse163
+    _cse170 = 0.000113295*_cse157 - 0.23854*_cse159 + _cse169
+    _cse171 = -_cse118 + 2.5*_cse129*_cse166 - _cse149 - _cse170
+    _cse172 = _cse1*_cse128
+    _cse173 = _cse1*_cse127
+    _cse174 = 0.065821*_cse172 - 4.5293e-5*_cse173
+    _cse175 = 4.5293e-5*_cse128
+    _cse176 = _cse127*_cse131
+    _cse177 = 0.102286*_cse120 + 0.102286*_cse121 + _cse124 - _cse131*_cse175 - 0.065821*_cse176
+    _cse178 = _cse138 + _cse174 + _cse177
+    _cse179 = _cse0*_cse127
+    _cse180 = 3.17051e-5*_cse179
+    _cse181 = 3.17051e-5*_cse128
+    _cse182 = _cse144*_cse181
+    _cse183 = 0.148785*_cse6
+    _cse184 = 8.0514e-5*_cse8
+    _cse185 = _cse127*_cse144
+    _cse186 = 0.0460747*_cse185
+    _cse187 = 1.13071e-5*_cse83
+    _cse188 = 0.143766*_cse80
+    _cse189 = 0.143766*_cse79
+    _cse190 = 0.7*_cse36
+    _cse191 = 3.17226e-5*_cse141
+    _cse192 = _cse191 - 0.0716002*_cse54*_cse82 - 0.7*_cse55*_cse82
+    _cse193 = _cse1*_cse183 + _cse1*_cse184 - 1.13071e-5*_cse1*_cse23*_cse8 - 0.7*_cse129*_cse144 + _cse182 + _cse186 + _cse187 + _cse188 + _cse189 + _cse190 + _cse192 + 0.7*_cse38 - 0.0716002*_cse53*_cse85 - 3.17226e-5*_cse54*_cse85 - 0.7*_cse63*_cse85
+    _cse194 = 0.0460747*_cse0*_cse128 + 0.07699867*_cse0 - 1.15437e-5*_cse1 - 0.7*_cse13 - 0.7*_cse140 - _cse180 - _cse193
+    _cse195 = 0.5*_cse194
+    _cse196 = 0.0460747*_cse172 - 3.17051e-5*_cse173
+    _cse197 = 0.0716002*_cse120
+    _cse198 = 0.0716002*_cse121
+    _cse199 = 0.7*_cse132
+    _cse200 = 0.7*_cse61
+    _cse201 = 0.7*_cse68
+    _cse202 = 3.17226e-5*_cse130
+    _cse203 = -_cse131*_cse181
+    _cse204 = 3.17226e-5*_cse122
+    _cse205 = -_cse204
+    _cse206 = -0.0460747*_cse176
+    _cse207 = 1.13071e-5*_cse65
+    _cse208 = 0.143766*_cse59
+    _cse209 = 0.143766*_cse57
+    _cse210 = -1.13071e-5*_cse70
+    _cse211 = _cse207 + _cse208 + _cse209 + _cse210 + 0.7*_cse27
+    _cse212 = _cse0*_cse183 + _cse0*_cse184 + _cse211 + 0.7*_cse30
+    _cse213 = _cse197 + _cse198 + _cse199 + _cse200 + _cse201 + _cse202 + _cse203 + _cse205 + _cse206 + _cse212
+    _cse214 = 1.15437e-5*_cse0 + 0.07699867*_cse1 + 0.7*_cse10 - 0.7*_cse136
+    _cse215 = _cse196 + _cse213 + _cse214
+    _cse216 = 4.5293e-5*_cse179
+    _cse217 = _cse144*_cse175
+    _cse218 = 0.065821*_cse185
+    _cse219 = _cse152 - 0.102286*_cse54*_cse82
+    _cse220 = _cse153 + _cse217 + _cse218 + _cse219 - 0.102286*_cse53*_cse85
+    _cse221 = 0.065821*_cse0*_cse128 - _cse154 - _cse216 - _cse220
+    _cse222 = 0.5*_cse221
+    _cse223 = 0.102286*_cse163
+    _cse224 = 0.102286*_cse159
+    _cse225 = _cse128*_cse166
+    _cse226 = _cse127*_cse166
+    _cse227 = _cse174 + 4.5293e-5*_cse225 + 0.065821*_cse226
+    _cse228 = -_cse158 - _cse162 - _cse167 + _cse223 + _cse224 - _cse227
+    _cse229 = 3.17226e-5*_cse157
+    _cse230 = 0.0716002*_cse163
+    _cse231 = 0.0716002*_cse159
+    _cse232 = 3.17226e-5*_cse160
+    _cse233 = _cse196 + 3.17051e-5*_cse225 + 0.0460747*_cse226
+    _cse234 = 0.7*_cse115*_cse55 + 0.7*_cse129*_cse166 - _cse212 - _cse214 - _cse229 + _cse230 + _cse231 + _cse232 - _cse233 + 0.7*_cse63*_cse66
+    _cse235 = 0.828945*_cse8
+    _cse236 = 0.21255*_cse8
+    _cse237 = _cse236 + 0.00099446*_cse6
+    _cse238 = _cse0*_cse237
+    _cse239 = _cse25*_cse8
+    _cse240 = _cse0*_cse239
+    _cse241 = 3.9*_cse240
+    _cse242 = -_cse0*_cse235 + 3.9*_cse0*_cse28*_cse6 + 0.000448578*_cse0*_cse6 - 3.9*_cse238 - _cse241
+    _cse243 = 0.5*_cse33
+    _cse244 = _cse1*_cse237
+    _cse245 = _cse1*_cse239
+    _cse246 = 3.9*_cse245
+    _cse247 = _cse28*_cse6
+    _cse248 = _cse1*_cse247
+    _cse249 = _cse1*_cse235 - 0.000448578*_cse1*_cse6 + 3.9*_cse244 + _cse246 - 3.9*_cse248
+    _cse250 = -_cse85
+    _cse251 = _cse250*_cse55
+    _cse252 = 2.5*_cse251
+    _cse253 = _cse63*_cse82
+    _cse254 = _cse252 + 2.5*_cse253
+    _cse255 = 2.5*_cse244
+    _cse256 = 0.531375*_cse8
+    _cse257 = _cse1*_cse256
+    _cse258 = 0.00028755*_cse6
+    _cse259 = _cse1*_cse258
+    _cse260 = 2.5*_cse248
+    _cse261 = 2.5*_cse245
+    _cse262 = 4.03825e-5*_cse80
+    _cse263 = 4.03825e-5*_cse79
+    _cse264 = 0.51345*_cse84
+    _cse265 = 0.51345*_cse83
+    _cse266 = _cse261 + _cse262 + _cse263 + _cse264 - _cse265
+    _cse267 = _cse255 + _cse257 - _cse259 - _cse260 + _cse266
+    _cse268 = _cse254 + _cse267
+    _cse269 = 2.5*_cse238
+    _cse270 = _cse0*_cse256
+    _cse271 = 2.5*_cse240
+    _cse272 = 4.03825e-5*_cse59
+    _cse273 = 4.03825e-5*_cse57
+    _cse274 = 0.51345*_cse70
+    _cse275 = -0.51345*_cse0*_cse22*_cse6 + _cse271 + _cse272 + _cse273 + _cse274 - 2.5*_cse55*_cse66 - 2.5*_cse60*_cse63
+    _cse276 = 2.5*_cse0*_cse28*_cse6 + 0.00028755*_cse0*_cse6 - _cse269 - _cse270 - _cse275
+    _cse277 = 0.5*_cse74
+    _cse278 = _cse250*_cse53
+    _cse279 = _cse54*_cse82
+    _cse280 = -_cse278 + _cse279
+    _cse281 = _cse129*_cse280
+    _cse282 = 0.000113295*_cse279
+    _cse283 = 0.23854*_cse141
+    _cse284 = _cse250*_cse54
+    _cse285 = -0.000113295*_cse278 + 0.23854*_cse284
+    _cse286 = 2.5*_cse281 + _cse282 + _cse283 + _cse285
+    _cse287 = _cse268 + _cse286
+    _cse288 = _cse0*_cse247
+    _cse289 = _cse55*_cse66
+    _cse290 = 2.5*_cse289
+    _cse291 = -_cse163 + _cse54*_cse60
+    _cse292 = _cse129*_cse291
+    _cse293 = _cse60*_cse63
+    _cse294 = 0.23854*_cse160 - 0.000113295*_cse163
+    _cse295 = 0.000113295*_cse121 + 0.23854*_cse122 - _cse271 - _cse272 - _cse273 - _cse274 + _cse290 + 2.5*_cse292 + 2.5*_cse293 + _cse294 + 0.51345*_cse65
+    _cse296 = _cse0*_cse258 - _cse269 - _cse270 + 2.5*_cse288 + _cse295
+    _cse297 = 0.5*_cse139
+    _cse298 = 1.13071e-5*_cse80
+    _cse299 = 1.13071e-5*_cse79
+    _cse300 = 0.143766*_cse84
+    _cse301 = 0.7*_cse245
+    _cse302 = 0.143766*_cse83
+    _cse303 = -_cse302
+    _cse304 = 0.7*_cse244
+    _cse305 = 0.148785*_cse8
+    _cse306 = _cse1*_cse305
+    _cse307 = 8.0514e-5*_cse6
+    _cse308 = _cse1*_cse307
+    _cse309 = 0.7*_cse248
+    _cse310 = 3.17226e-5*_cse278
+    _cse311 = 0.0460747*_cse127
+    _cse312 = 0.0716002*_cse141 + 3.17226e-5*_cse279
+    _cse313 = -_cse181*_cse280 + 0.7*_cse251 + 0.7*_cse253 - _cse280*_cse311 + 0.7*_cse281 + 0.0716002*_cse284 - _cse310 + _cse312
+    _cse314 = _cse298 + _cse299 + _cse300 + _cse301 + _cse303 + _cse304 + _cse306 - _cse308 - _cse309 + _cse313
+    _cse315 = 1.13071e-5*_cse57
+    _cse316 = 1.13071e-5*_cse59
+    _cse317 = 0.143766*_cse70
+    _cse318 = 0.7*_cse240
+    _cse319 = 3.17226e-5*_cse163
+    _cse320 = _cse291*_cse311
+    _cse321 = _cse181*_cse291
+    _cse322 = -_cse0*_cse305 + _cse0*_cse307 + 3.17226e-5*_cse121 + 0.0716002*_cse122 + 0.0716002*_cse160 - 0.7*_cse238 + 0.7*_cse288 + 0.7*_cse289 + 0.7*_cse292 + 0.7*_cse293 - _cse315 - _cse316 - _cse317 - _cse318 - _cse319 - _cse320 - _cse321 + 0.143766*_cse65
+    _cse323 = 0.5*_cse178
+    _cse324 = -_cse249
+    _cse325 = 1.0*_cse50
+    _cse326 = 1.0*_cse52
+    _cse327 = -2.5*_cse55*_cse85 - 2.5*_cse63*_cse81
+    _cse328 = -_cse267 - _cse327
+    _cse329 = 1.0*_cse113
+    _cse330 = 1.0*_cse117
+    _cse331 = _cse55*_cse85
+    _cse332 = 2.5*_cse331
+    _cse333 = _cse53*_cse85
+    _cse334 = _cse54*_cse81
+    _cse335 = -_cse333 + _cse334
+    _cse336 = _cse129*_cse335
+    _cse337 = _cse63*_cse81
+    _cse338 = 0.000113295*_cse334
+    _cse339 = _cse53*_cse81
+    _cse340 = 0.23854*_cse339
+    _cse341 = 0.23854*_cse143 - 0.000113295*_cse333
+    _cse342 = -_cse261 - _cse262 - _cse263 - _cse264 + _cse265 + _cse332 + 2.5*_cse336 + 2.5*_cse337 + _cse338 + _cse340 + _cse341
+    _cse343 = -_cse255 - _cse257 + _cse259 + _cse260 + _cse342
+    _cse344 = 1.0*_cse155
+    _cse345 = 1.0*_cse168
+    _cse346 = _cse181*_cse335
+    _cse347 = 3.17226e-5*_cse333
+    _cse348 = _cse311*_cse335
+    _cse349 = 0.0716002*_cse339
+    _cse350 = 3.17226e-5*_cse334
+    _cse351 = _cse349 + _cse350
+    _cse352 = 0.0716002*_cse143 - _cse298 - _cse299 - _cse300 - _cse301 + _cse302 - _cse304 - _cse306 + _cse308 + _cse309 + 0.7*_cse331 + 0.7*_cse336 + 0.7*_cse337 - _cse346 - _cse347 - _cse348 + _cse351
+    _cse353 = 1.0*_cse221
+    _cse354 = 1.0*_cse228
+    _cse355 = 0.00011502*_cse6
+    _cse356 = _cse1*_cse355
+    _cse357 = _cse1*_cse236
+    _cse358 = _cse244 + _cse245 - _cse248 - _cse356 + _cse357
+    _cse359 = _cse0*_cse236
+    _cse360 = -_cse0*_cse28*_cse6 - 0.00011502*_cse0*_cse6 + _cse238 + _cse240 + _cse359
+    _cse361 = -_cse360
+    _cse362 = 0.5*_cse44
+    _cse363 = _cse251 + _cse253
+    _cse364 = 0.20538*_cse84
+    _cse365 = 1.6153e-5*_cse80
+    _cse366 = 1.6153e-5*_cse79
+    _cse367 = 0.20538*_cse83
+    _cse368 = _cse364 + _cse365 + _cse366 - _cse367
+    _cse369 = _cse358 + _cse368
+    _cse370 = _cse363 + _cse369
+    _cse371 = -_cse55*_cse66
+    _cse372 = 0.20538*_cse70
+    _cse373 = 1.6153e-5*_cse59
+    _cse374 = 1.6153e-5*_cse57
+    _cse375 = -0.20538*_cse0*_cse22*_cse6 + _cse371 + _cse372 + _cse373 + _cse374 - _cse60*_cse63
+    _cse376 = -_cse360 - _cse375
+    _cse377 = 0.5*_cse106
+    _cse378 = 4.5318e-5*_cse279
+    _cse379 = 0.095416*_cse141
+    _cse380 = 4.5318e-5*_cse278
+    _cse381 = -_cse380
+    _cse382 = 0.095416*_cse284 + _cse381
+    _cse383 = _cse378 + _cse379 + _cse382
+    _cse384 = _cse281 + _cse370
+    _cse385 = _cse383 + _cse384
+    _cse386 = 4.5318e-5*_cse163
+    _cse387 = -_cse386
+    _cse388 = 0.095416*_cse160 + _cse387
+    _cse389 = 4.5318e-5*_cse121 - _cse240 + _cse289 + _cse292 + _cse293 - _cse372 - _cse373 - _cse374 + 0.20538*_cse65
+    _cse390 = 0.095416*_cse122 + _cse388 + _cse389
+    _cse391 = _cse0*_cse355 - _cse238 + _cse288 - _cse359
+    _cse392 = _cse390 + _cse391
+    _cse393 = 0.5*_cse150
+    _cse394 = 0.065821*_cse127
+    _cse395 = 0.102286*_cse141 + _cse378
+    _cse396 = -_cse175*_cse280 - _cse280*_cse394 + 0.102286*_cse284 + _cse381 + _cse395
+    _cse397 = _cse384 + _cse396
+    _cse398 = _cse175*_cse291
+    _cse399 = _cse291*_cse394
+    _cse400 = 0.102286*_cse122 + 0.102286*_cse160 + _cse387 + _cse389 + _cse391 - _cse398 - _cse399
+    _cse401 = 0.5*_cse215
+    _cse402 = 0.5*_cse238
+    _cse403 = 2.85*_cse238
+    _cse404 = 5.7*_cse20
+    _cse405 = _cse14*_cse244
+    _cse406 = 2.85*_cse18
+    _cse407 = _cse244*_cse406
+    _cse408 = -_cse405 - _cse407
+    _cse409 = -_cse28
+    _cse410 = _cse409*_cse6
+    _cse411 = _cse0*_cse410
+    _cse412 = -_cse241 - 3.9*_cse411
+    _cse413 = _cse1*_cse410
+    _cse414 = _cse245 + _cse413
+    _cse415 = _cse240 + _cse411
+    _cse416 = -_cse415
+    _cse417 = _cse246 + 3.9*_cse413
+    _cse418 = -_cse417
+    _cse419 = 2.5*_cse411
+    _cse420 = -_cse275 - _cse419
+    _cse421 = _cse375 + _cse415
+    _cse422 = -_cse421
+    _cse423 = _cse368 + _cse414
+    _cse424 = _cse363 + _cse423
+    _cse425 = 2.5*_cse413
+    _cse426 = _cse266 + _cse425
+    _cse427 = -_cse327 - _cse426
+    _cse428 = _cse254 + _cse426
+    _cse429 = _cse295 - _cse419
+    _cse430 = _cse390 - _cse411
+    _cse431 = _cse342 - _cse425
+    _cse432 = _cse281 + _cse424
+    _cse433 = _cse383 + _cse432
+    _cse434 = _cse286 + _cse428
+    _cse435 = _cse319 - 0.0716002*_cse54*_cse66 - 0.7*_cse55*_cse66
+    _cse436 = 0.143766*_cse0*_cse22*_cse6 + 0.7*_cse129*_cse291 - _cse315 - _cse316 - _cse317 - _cse318 - _cse320 - _cse321 - 0.7*_cse411 - _cse435 + 0.0716002*_cse53*_cse60 + 3.17226e-5*_cse54*_cse60 + 0.7*_cse60*_cse63
+    _cse437 = _cse386 - 0.102286*_cse54*_cse66
+    _cse438 = _cse129*_cse291 - _cse398 - _cse399 - _cse421 - _cse437 + 0.102286*_cse53*_cse60 + 4.5318e-5*_cse54*_cse60
+    _cse439 = _cse347 - 0.0716002*_cse54*_cse85 - 0.7*_cse55*_cse85
+    _cse440 = _cse298 + _cse299 + _cse300 + _cse301 + _cse303 + 0.7*_cse413
+    _cse441 = 0.7*_cse129*_cse335 - _cse346 - _cse348 + _cse349 + _cse350 - _cse439 - _cse440 + 0.7*_cse63*_cse81
+    _cse442 = _cse396 + _cse432
+    _cse443 = _cse313 + _cse440
+    _cse444 = _cse115*_cse62
+    _cse445 = _cse290 + 2.5*_cse444
+    _cse446 = _cse289 + _cse444
+    _cse447 = _cse62*_cse81
+    _cse448 = _cse251 + _cse447
+    _cse449 = _cse252 + 2.5*_cse447
+    _cse450 = _cse62*_cse82
+    _cse451 = _cse332 + 2.5*_cse450
+    _cse452 = _cse159 + _cse163
+    _cse453 = -_cse452
+    _cse454 = _cse129*_cse453
+    _cse455 = -0.23854*_cse157 - 0.000113295*_cse159 + _cse294 + _cse445 + 2.5*_cse454
+    _cse456 = 4.5318e-5*_cse159
+    _cse457 = -0.095416*_cse157 + _cse388 + _cse446 + _cse454 - _cse456
+    _cse458 = _cse278 + _cse334
+    _cse459 = -_cse458
+    _cse460 = _cse129*_cse459
+    _cse461 = 4.5318e-5*_cse334
+    _cse462 = -_cse461
+    _cse463 = 0.095416*_cse339
+    _cse464 = _cse382 + _cse448 + _cse460 + _cse462 - _cse463
+    _cse465 = _cse285 - _cse338 - _cse340 + _cse449 + 2.5*_cse460
+    _cse466 = _cse279 + _cse333
+    _cse467 = -_cse466
+    _cse468 = _cse129*_cse467
+    _cse469 = -_cse282 - _cse283 + _cse341 + _cse451 + 2.5*_cse468
+    _cse470 = 0.7*_cse115*_cse62 + 0.7*_cse129*_cse453 - 0.0716002*_cse157 - 3.17226e-5*_cse159 - _cse181*_cse453 - _cse311*_cse453 - _cse435
+    _cse471 = _cse115*_cse62 + _cse129*_cse453 - 0.102286*_cse157 - _cse175*_cse453 - _cse371 - _cse394*_cse453 - _cse437 - _cse456
+    _cse472 = 0.102286*_cse339
+    _cse473 = _cse461 + _cse472
+    _cse474 = _cse129*_cse459 - _cse175*_cse459 + 0.102286*_cse250*_cse54 + _cse250*_cse55 - _cse380 - _cse394*_cse459 - _cse473 + _cse62*_cse81
+    _cse475 = 0.7*_cse129*_cse459 - _cse181*_cse459 + 0.0716002*_cse250*_cse54 + 0.7*_cse250*_cse55 - _cse310 - _cse311*_cse459 - _cse351 + 0.7*_cse62*_cse81
+    _cse476 = 0.7*_cse129*_cse467 - _cse181*_cse467 - _cse311*_cse467 - _cse312 - _cse439 + 0.7*_cse62*_cse82
+    _cse477 = -_cse129
+    _cse478 = _cse1*_cse477
+    _cse479 = _cse135*_cse166
+    _cse480 = 2.5*_cse478 + 2.5*_cse479
+    _cse481 = _cse478 + _cse479
+    _cse482 = _cse0*_cse477
+    _cse483 = _cse284 - _cse339
+    _cse484 = _cse135*_cse483
+    _cse485 = _cse482 + _cse484
+    _cse486 = 2.5*_cse482
+    _cse487 = 2.5*_cse484 + _cse486
+    _cse488 = _cse135*_cse144
+    _cse489 = -_cse486 + 2.5*_cse488
+    _cse490 = 3.17051e-5*_cse172 + 0.0460747*_cse173 - 0.0460747*_cse225 + 3.17051e-5*_cse226 + 0.7*_cse478 + 0.7*_cse479
+    _cse491 = 4.5293e-5*_cse172 + 0.065821*_cse173 - 0.065821*_cse225 + 4.5293e-5*_cse226 + _cse481
+    _cse492 = _cse127*_cse483
+    _cse493 = _cse128*_cse483
+    _cse494 = _cse0*_cse128
+    _cse495 = 0.065821*_cse179 + 4.5293e-5*_cse494
+    _cse496 = _cse485 + 4.5293e-5*_cse492 - 0.065821*_cse493 + _cse495
+    _cse497 = 0.0460747*_cse179 + 0.7*_cse482 + 3.17051e-5*_cse494
+    _cse498 = 0.7*_cse484 + 3.17051e-5*_cse492 - 0.0460747*_cse493 + _cse497
+    _cse499 = 0.0460747*_cse128
+    _cse500 = 3.17051e-5*_cse127*_cse144 + 0.7*_cse135*_cse144 - _cse144*_cse499 - _cse497
+    _cse501 = _cse324*_cse51
+    _cse502 = 0.5*_cse242
+    _cse503 = _cse502*_cse52
+    _cse504 = _cse114*_cse328
+    _cse505 = 0.5*_cse276
+    _cse506 = _cse117*_cse505
+    _cse507 = _cse156*_cse343
+    _cse508 = 0.5*_cse296
+    _cse509 = _cse168*_cse508
+    _cse510 = _cse222*_cse352
+    _cse511 = 0.5*_cse322
+    _cse512 = _cse228*_cse511
+    _cse513 = _cse20*_cse403
+    _cse514 = -_cse358
+    _cse515 = 0.5*_cse361
+    _cse516 = -_cse55*_cse85
+    _cse517 = _cse516 - _cse63*_cse81
+    _cse518 = -_cse369 - _cse517
+    _cse519 = 0.5*_cse376
+    _cse520 = 4.5318e-5*_cse333
+    _cse521 = -_cse520
+    _cse522 = 0.095416*_cse143 + _cse521
+    _cse523 = -_cse245 + _cse331 + _cse336 + _cse337 - _cse364 - _cse365 - _cse366 + _cse367
+    _cse524 = _cse461 + _cse463 + _cse522 + _cse523
+    _cse525 = -_cse244 + _cse248 + _cse356 - _cse357
+    _cse526 = _cse524 + _cse525
+    _cse527 = 0.5*_cse392
+    _cse528 = _cse175*_cse335
+    _cse529 = _cse335*_cse394
+    _cse530 = 0.102286*_cse143 + _cse473 + _cse521 + _cse523 + _cse525 - _cse528 - _cse529
+    _cse531 = 0.5*_cse400
+    _cse532 = _cse119*_cse519 + _cse146*_cse526 - _cse16*_cse402 + _cse171*_cse527 + _cse195*_cse530 + _cse234*_cse531 + _cse41*_cse514 + _cse45*_cse515 + _cse518*_cse94
+    _cse533 = -_cse9
+    _cse534 = _cse0*_cse533
+    _cse535 = _cse43 - 3.9*_cse534
+    _cse536 = 3.9*_cse1*_cse533 - _cse39
+    _cse537 = 2.5*_cse1*_cse533 - _cse91
+    _cse538 = _cse103 - 2.5*_cse534
+    _cse539 = _cse55*_cse82
+    _cse540 = 2.5*_cse539
+    _cse541 = _cse63*_cse85
+    _cse542 = 2.5*_cse541
+    _cse543 = 4.03825e-5*_cse84
+    _cse544 = -_cse86
+    _cse545 = -_cse88
+    _cse546 = -_cse89
+    _cse547 = -_cse90
+    _cse548 = _cse1*_cse533
+    _cse549 = _cse129*_cse144
+    _cse550 = -_cse142 + 0.23854*_cse279
+    _cse551 = 0.000113295*_cse143 + 0.23854*_cse333 + 2.5*_cse549 + _cse550
+    _cse552 = _cse540 + _cse542 + _cse543 + _cse544 + _cse545 + _cse546 + _cse547 + 2.5*_cse548 + _cse551 - _cse76 - _cse78 - _cse87
+    _cse553 = _cse148 + _cse538
+    _cse554 = 0.7*_cse1*_cse533 - _cse193
+    _cse555 = _cse213 - 0.7*_cse534
+    _cse556 = _cse358*_cse502
+    _cse557 = _cse324*_cse515
+    _cse558 = _cse370*_cse505
+    _cse559 = _cse328*_cse519
+    _cse560 = _cse385*_cse508
+    _cse561 = _cse343*_cse527
+    _cse562 = _cse397*_cse511
+    _cse563 = _cse352*_cse531
+    _cse564 = _cse249*_cse515 + _cse268*_cse519 + _cse287*_cse527 + _cse314*_cse531 + _cse502*_cse514 + _cse505*_cse518 + _cse508*_cse526 + _cse511*_cse530
+    _cse565 = _cse409*_cse8
+    _cse566 = 3.9*_cse565
+    _cse567 = _cse0*_cse566
+    _cse568 = _cse42 - _cse567
+    _cse569 = _cse1*_cse566
+    _cse570 = -_cse37 + _cse569
+    _cse571 = 2.5*_cse565
+    _cse572 = -_cse0*_cse571 + _cse95 + _cse96
+    _cse573 = _cse101 + _cse572
+    _cse574 = _cse1*_cse571 + _cse540 + _cse542 + _cse543 + _cse545 + _cse546 + _cse547
+    _cse575 = _cse544 + _cse574
+    _cse576 = _cse551 + _cse575
+    _cse577 = _cse148 + _cse573
+    _cse578 = 0.7*_cse565
+    _cse579 = _cse1*_cse578 + 3.17226e-5*_cse143 - _cse182 - _cse186 - _cse187 - _cse188 - _cse189 - _cse191 + 0.0716002*_cse279 + 0.0716002*_cse333 + 0.7*_cse539 + 0.7*_cse541 + 0.7*_cse549 + 1.13071e-5*_cse84
+    _cse580 = -_cse190 + _cse579
+    _cse581 = -_cse0*_cse578 + _cse197 + _cse198 + _cse199 + _cse200 + _cse201 + _cse202 + _cse203 + _cse205 + _cse206
+    _cse582 = _cse211 + _cse581
+    _cse583 = _cse325*_cse568 + _cse326*_cse570 + _cse329*_cse573 + _cse330*_cse575 + _cse344*_cse577 + _cse345*_cse576 + _cse353*_cse582 + _cse354*_cse580
+    _cse584 = 0.5*_cse412
+    _cse585 = 0.5*_cse518
+    _cse586 = 0.5*_cse526
+    _cse587 = 0.5*_cse530
+    _cse588 = 0.5*_cse416
+    _cse589 = 0.5*_cse328
+    _cse590 = 0.5*_cse343
+    _cse591 = 0.5*_cse352
+    _cse592 = -_cse324*_cse588 - _cse414*_cse502 + _cse417*_cse515 + _cse420*_cse585 - _cse422*_cse589 - _cse424*_cse505 + _cse428*_cse519 + _cse429*_cse586 - _cse430*_cse590 - _cse433*_cse508 + _cse434*_cse527 + _cse436*_cse587 - _cse438*_cse591 - _cse442*_cse511 + _cse443*_cse531 + _cse514*_cse584
+    _cse593 = _cse250*_cse62
+    _cse594 = 2.5*_cse593
+    _cse595 = _cse540 + _cse594
+    _cse596 = _cse62*_cse66
+    _cse597 = 2.5*_cse596
+    _cse598 = _cse597 + _cse95
+    _cse599 = _cse141 + _cse284
+    _cse600 = -_cse599
+    _cse601 = _cse129*_cse600
+    _cse602 = -0.23854*_cse278 - 0.000113295*_cse284
+    _cse603 = _cse550 + _cse595 + 2.5*_cse601 + _cse602
+    _cse604 = _cse122 + _cse160
+    _cse605 = -_cse604
+    _cse606 = _cse129*_cse605
+    _cse607 = _cse147 + _cse169 + _cse598 + 2.5*_cse606
+    _cse608 = _cse230 + _cse232 - 0.7*_cse62*_cse66
+    _cse609 = 0.7*_cse129*_cse605 - _cse181*_cse605 - _cse204 - _cse311*_cse605 + 0.0716002*_cse54*_cse60 + 0.7*_cse55*_cse60 - _cse608
+    _cse610 = -0.7*_cse250*_cse62 + 0.0716002*_cse278 + 3.17226e-5*_cse284
+    _cse611 = 0.7*_cse129*_cse600 - _cse181*_cse600 - _cse192 - _cse311*_cse600 - _cse610
+    _cse612 = _cse329*_cse598 + _cse330*_cse595 + _cse344*_cse607 + _cse345*_cse603 + _cse353*_cse609 + _cse354*_cse611
+    _cse613 = _cse445*_cse585 - _cse446*_cse589 - _cse448*_cse505 + _cse449*_cse519 + _cse455*_cse586 - _cse457*_cse590 - _cse464*_cse508 + _cse465*_cse527 + _cse470*_cse587 - _cse471*_cse591 - _cse474*_cse511 + _cse475*_cse531
+    _cse614 = _cse485*_cse508
+    _cse615 = _cse481*_cse590
+    _cse616 = _cse496*_cse511
+    _cse617 = _cse491*_cse591
+    _cse618 = 0.045*_cse1
+    _cse619 = _cse458*_cse618
+    _cse620 = _cse466*_cse618
+    _cse621 = _cse619 + _cse620
+    _cse622 = 3.17051e-5*_cse127
+    _cse623 = _cse135*_cse291
+    _cse624 = -_cse291*_cse499 + _cse291*_cse622 + 0.7*_cse623
+    _cse625 = _cse135*_cse280
+    _cse626 = -_cse280*_cse499 + _cse280*_cse622 + 0.7*_cse625
+    _cse627 = 2.5*_cse155
+    _cse628 = 2.5*_cse168
+    _cse629 = _cse64 - _cse69
+    _cse630 = _cse53*_cse629
+    _cse631 = _cse56 + _cse58
+    _cse632 = -_cse631
+    _cse633 = _cse54*_cse632
+    _cse634 = 0.045*_cse633
+    _cse635 = 0.045*_cse630 + _cse634
+    _cse636 = _cse353*_cse624 + _cse354*_cse626 + _cse623*_cse627 + _cse625*_cse628 + _cse635
+    _cse637 = _cse621 + _cse636
+    _cse638 = _cse54*_cse629
+    _cse639 = _cse53*_cse632
+    _cse640 = _cse638 - _cse639
+    _cse641 = 0.025*_cse127
+    _cse642 = _cse640*_cse641
+    _cse643 = -_cse642
+    _cse644 = -_cse185 + _cse494
+    _cse645 = 0.025*_cse1
+    _cse646 = -_cse492 - _cse494
+    _cse647 = _cse644*_cse645 + _cse645*_cse646
+    _cse648 = _cse643 + _cse647
+    _cse649 = _cse418*_cse51
+    _cse650 = _cse52*_cse584
+    _cse651 = _cse114*_cse427
+    _cse652 = 0.5*_cse420
+    _cse653 = _cse117*_cse652
+    _cse654 = _cse156*_cse431
+    _cse655 = 0.5*_cse429
+    _cse656 = _cse168*_cse655
+    _cse657 = _cse222*_cse441
+    _cse658 = 0.5*_cse436
+    _cse659 = _cse228*_cse658
+    _cse660 = -_cse414
+    _cse661 = _cse423 + _cse517
+    _cse662 = -_cse661
+    _cse663 = 0.5*_cse422
+    _cse664 = -_cse413 + _cse524
+    _cse665 = 0.5*_cse430
+    _cse666 = _cse520 - 0.102286*_cse54*_cse85
+    _cse667 = _cse129*_cse335 - _cse462 + _cse472 - _cse528 - _cse529 - _cse661 - _cse666
+    _cse668 = 0.5*_cse438
+    _cse669 = _cse119*_cse663 + _cse146*_cse664 + _cse171*_cse665 + _cse195*_cse667 + _cse234*_cse668 + _cse41*_cse660 + _cse45*_cse588 + _cse662*_cse94
+    _cse670 = _cse249*_cse588 + _cse268*_cse663 + _cse287*_cse665 + _cse314*_cse668 - _cse358*_cse584 - _cse370*_cse652 - _cse385*_cse655 - _cse397*_cse658 - _cse418*_cse515 - _cse427*_cse519 - _cse431*_cse527 - _cse441*_cse531 + _cse502*_cse660 + _cse505*_cse662 + _cse508*_cse664 + _cse511*_cse667
+    _cse671 = _cse24*_cse6
+    _cse672 = _cse1*_cse671
+    _cse673 = _cse569 + 3.9*_cse672
+    _cse674 = _cse0*_cse671
+    _cse675 = -_cse567 - 3.9*_cse674
+    _cse676 = _cse100 + _cse572 - 2.5*_cse674 + _cse97 + _cse98 + _cse99
+    _cse677 = _cse574 + 2.5*_cse672
+    _cse678 = _cse551 + _cse677
+    _cse679 = _cse148 + _cse676
+    _cse680 = _cse579 + 0.7*_cse672
+    _cse681 = _cse207 + _cse208 + _cse209 + _cse210 + _cse581 - 0.7*_cse674
+    _cse682 = _cse414*_cse584
+    _cse683 = _cse418*_cse588
+    _cse684 = _cse424*_cse652
+    _cse685 = _cse427*_cse663
+    _cse686 = _cse431*_cse665
+    _cse687 = _cse433*_cse655
+    _cse688 = _cse441*_cse668
+    _cse689 = _cse442*_cse658
+    _cse690 = _cse417*_cse588 + _cse428*_cse663 + _cse434*_cse665 + _cse443*_cse668 + _cse584*_cse660 + _cse652*_cse662 + _cse655*_cse664 + _cse658*_cse667
+    _cse691 = 0.5*_cse445
+    _cse692 = 0.5*_cse664
+    _cse693 = 0.5*_cse667
+    _cse694 = 0.5*_cse446
+    _cse695 = 0.5*_cse431
+    _cse696 = 0.5*_cse441
+    _cse697 = -_cse427*_cse694 - _cse448*_cse652 + _cse449*_cse663 + _cse455*_cse692 - _cse457*_cse695 - _cse464*_cse655 + _cse465*_cse665 + _cse470*_cse693 - _cse471*_cse696 - _cse474*_cse658 + _cse475*_cse668 + _cse662*_cse691
+    _cse698 = _cse485*_cse655
+    _cse699 = _cse481*_cse695
+    _cse700 = _cse496*_cse658
+    _cse701 = _cse491*_cse696
+    _cse702 = _cse114*_cse451
+    _cse703 = _cse117*_cse691
+    _cse704 = _cse156*_cse469
+    _cse705 = 0.5*_cse455
+    _cse706 = _cse168*_cse705
+    _cse707 = _cse222*_cse476
+    _cse708 = 0.5*_cse470
+    _cse709 = _cse228*_cse708
+    _cse710 = _cse331 + _cse450
+    _cse711 = -_cse378 - _cse379 + _cse468 + _cse522 + _cse710
+    _cse712 = 0.5*_cse457
+    _cse713 = _cse129*_cse467 - _cse175*_cse467 - _cse394*_cse467 - _cse395 - _cse516 + _cse62*_cse82 - _cse666
+    _cse714 = 0.5*_cse471
+    _cse715 = _cse119*_cse694 + _cse146*_cse711 + _cse171*_cse712 + _cse195*_cse713 + _cse234*_cse714 + _cse710*_cse94
+    _cse716 = _cse268*_cse694 + _cse287*_cse712 + _cse314*_cse714 - _cse370*_cse691 - _cse385*_cse705 - _cse397*_cse708 - _cse451*_cse519 - _cse469*_cse527 - _cse476*_cse531 + _cse505*_cse710 + _cse508*_cse711 + _cse511*_cse713
+    _cse717 = -_cse424*_cse691 + _cse428*_cse694 - _cse433*_cse705 + _cse434*_cse712 - _cse442*_cse708 + _cse443*_cse714 - _cse451*_cse663 - _cse469*_cse665 - _cse476*_cse668 + _cse652*_cse710 + _cse655*_cse711 + _cse658*_cse713
+    _cse718 = -_cse55
+    _cse719 = _cse718*_cse81
+    _cse720 = _cse594 + 2.5*_cse719
+    _cse721 = _cse115*_cse718
+    _cse722 = _cse597 + 2.5*_cse721
+    _cse723 = -_cse483
+    _cse724 = _cse129*_cse723
+    _cse725 = -0.23854*_cse334 + 0.000113295*_cse339 + _cse602 + _cse720 + 2.5*_cse724
+    _cse726 = -_cse166
+    _cse727 = _cse129*_cse726
+    _cse728 = _cse170 + _cse722 + 2.5*_cse727
+    _cse729 = 0.7*_cse129*_cse723 - _cse181*_cse723 - _cse311*_cse723 - 0.0716002*_cse334 + 3.17226e-5*_cse53*_cse81 - _cse610 + 0.7*_cse718*_cse81
+    _cse730 = 0.7*_cse115*_cse718 + 0.7*_cse129*_cse726 - _cse181*_cse726 + _cse229 - _cse231 - _cse311*_cse726 - _cse608
+    _cse731 = _cse448*_cse691
+    _cse732 = _cse451*_cse694
+    _cse733 = _cse464*_cse705
+    _cse734 = _cse469*_cse712
+    _cse735 = _cse474*_cse708
+    _cse736 = _cse476*_cse714
+    _cse737 = _cse449*_cse694 + _cse465*_cse712 + _cse475*_cse714 + _cse691*_cse710 + _cse705*_cse711 + _cse708*_cse713
+    _cse738 = 0.5*_cse480
+    _cse739 = 0.5*_cse490
+    _cse740 = _cse485*_cse705
+    _cse741 = 0.5*_cse481
+    _cse742 = _cse469*_cse741
+    _cse743 = _cse496*_cse708
+    _cse744 = 0.5*_cse491
+    _cse745 = _cse476*_cse744
+    _cse746 = _cse135*_cse459
+    _cse747 = -_cse459*_cse499 + _cse459*_cse622 + 0.7*_cse746
+    _cse748 = _cse135*_cse453
+    _cse749 = -_cse453*_cse499 + _cse453*_cse622 + 0.7*_cse748
+    _cse750 = -_cse629
+    _cse751 = _cse53*_cse750
+    _cse752 = 0.045*_cse751
+    _cse753 = _cse634 - _cse752
+    _cse754 = _cse353*_cse749 + _cse354*_cse747 + _cse627*_cse748 + _cse628*_cse746 + _cse753
+    _cse755 = _cse54*_cse750
+    _cse756 = _cse639 + _cse755
+    _cse757 = -_cse756
+    _cse758 = _cse641*_cse757
+    _cse759 = -_cse758
+    _cse760 = _cse156*_cse489
+    _cse761 = _cse168*_cse738
+    _cse762 = _cse222*_cse500
+    _cse763 = _cse228*_cse739
+    _cse764 = -_cse482 + _cse488
+    _cse765 = 0.065821*_cse128
+    _cse766 = 4.5293e-5*_cse127*_cse144 + _cse135*_cse144 - _cse144*_cse765 - _cse482 - _cse495
+    _cse767 = _cse146*_cse764 + _cse171*_cse741 + _cse195*_cse766 + _cse234*_cse744
+    _cse768 = _cse287*_cse741 + _cse314*_cse744 - _cse385*_cse738 - _cse397*_cse739 - _cse489*_cse527 - _cse500*_cse531 + _cse508*_cse764 + _cse511*_cse766
+    _cse769 = 0.01*_cse278 + 0.01*_cse334
+    _cse770 = 0.5*_cse1
+    _cse771 = _cse769*_cse770
+    _cse772 = 0.01*_cse279 + 0.01*_cse333
+    _cse773 = _cse770*_cse772
+    _cse774 = 0.04*_cse278 + 0.04*_cse334
+    _cse775 = 1.0*_cse1
+    _cse776 = _cse774*_cse775
+    _cse777 = 0.04*_cse279 + 0.04*_cse333
+    _cse778 = _cse775*_cse777
+    _cse779 = _cse771 + _cse773 + _cse776 + _cse778
+    _cse780 = _cse636 + _cse779
+    _cse781 = -_cse433*_cse738 + _cse434*_cse741 - _cse442*_cse739 + _cse443*_cse744 - _cse489*_cse665 - _cse500*_cse668 + _cse655*_cse764 + _cse658*_cse766
+    _cse782 = -_cse464*_cse738 + _cse465*_cse741 - _cse474*_cse739 + _cse475*_cse744 - _cse489*_cse712 - _cse500*_cse714 + _cse705*_cse764 + _cse708*_cse766
+    _cse783 = _cse1*_cse134
+    _cse784 = _cse166*_cse477
+    _cse785 = 2.5*_cse783 + 2.5*_cse784
+    _cse786 = _cse0*_cse134
+    _cse787 = _cse477*_cse483
+    _cse788 = 2.5*_cse786 + 2.5*_cse787
+    _cse789 = -_cse180 + 0.0460747*_cse492 + 3.17051e-5*_cse493 + 0.0460747*_cse494 + 0.7*_cse786 + 0.7*_cse787
+    _cse790 = _cse233 + 0.7*_cse783 + 0.7*_cse784
+    _cse791 = 0.01*_cse159 + 0.01*_cse163
+    _cse792 = 0.5*_cse791
+    _cse793 = 0.5*_cse452
+    _cse794 = 0.04*_cse159 + 0.04*_cse163
+    _cse795 = 1.0*_cse794
+    _cse796 = 1.0*_cse452
+    _cse797 = _cse458*_cse792 + _cse458*_cse795 + _cse466*_cse792 + _cse466*_cse795 + _cse769*_cse793 + _cse772*_cse793 + _cse774*_cse796 + _cse777*_cse796
+    _cse798 = _cse485*_cse738 + _cse489*_cse741 + _cse496*_cse739 + _cse500*_cse744 + _cse797
+    _cse799 = -_cse633 + _cse751
+    _cse800 = -_cse799
+    _cse801 = 0.025*_cse800
+    _cse802 = _cse128*_cse801
+    _cse803 = 0.5*_cse794
+    _cse804 = -_cse172 - _cse226
+    _cse805 = 0.5*_cse804
+    _cse806 = _cse644*_cse792 + _cse644*_cse803 + _cse646*_cse792 + _cse646*_cse803 + _cse769*_cse805 + _cse772*_cse805 + _cse774*_cse805 + _cse777*_cse805
+    _cse807 = 0.01*_cse494
+    _cse808 = -0.01*_cse185 + _cse807
+    _cse809 = 0.04*_cse494
+    _cse810 = -0.04*_cse185 + _cse809
+    _cse811 = -0.01*_cse492 - _cse807
+    _cse812 = -0.04*_cse492 - _cse809
+    _cse813 = _cse770*_cse808 + _cse770*_cse810 + _cse770*_cse811 + _cse770*_cse812
+    _cse814 = _cse643 + _cse813
+    _cse815 = _cse759 + _cse813
+    _cse816 = -0.04*_cse172 - 0.04*_cse226
+    _cse817 = 0.5*_cse458
+    _cse818 = -0.01*_cse172 - 0.01*_cse226
+    _cse819 = 0.5*_cse466
+    _cse820 = _cse793*_cse808 + _cse793*_cse810 + _cse793*_cse811 + _cse793*_cse812 + _cse802 + _cse816*_cse817 + _cse816*_cse819 + _cse817*_cse818 + _cse818*_cse819
+    _cse821 = 0.5*_cse646
+    _cse822 = 0.5*_cse644
+    _cse823 = _cse805*_cse808 + _cse805*_cse810 + _cse805*_cse811 + _cse805*_cse812 + _cse816*_cse821 + _cse816*_cse822 + _cse818*_cse821 + _cse818*_cse822
+    _cse824 = 1.0*_cse358
+    _cse825 = 1.0*_cse361
+    _cse826 = 1.0*_cse370
+    _cse827 = 1.0*_cse376
+    _cse828 = 1.0*_cse385
+    _cse829 = 1.0*_cse392
+    _cse830 = 1.0*_cse397
+    _cse831 = 1.0*_cse400
+    _cse832 = _cse412*_cse824 + _cse418*_cse825 + _cse420*_cse826 + _cse427*_cse827 + _cse429*_cse828 + _cse431*_cse829 + _cse436*_cse830 + _cse441*_cse831
+    _cse833 = _cse445*_cse826 + _cse451*_cse827 + _cse455*_cse828 + _cse469*_cse829 + _cse470*_cse830 + _cse476*_cse831
+    _cse834 = _cse635 + _cse779
+    _cse835 = -1.0*_cse385*_cse480 - 1.0*_cse392*_cse489 - 1.0*_cse397*_cse490 - 1.0*_cse400*_cse500 + _cse834
+    _cse836 = -_cse814
+    _cse837 = _cse31 - _cse534
+    _cse838 = -_cse1*_cse533 + _cse48
+    _cse839 = -0.5*_cse838
+    _cse840 = 0.5*_cse536
+    _cse841 = _cse72 + _cse837
+    _cse842 = -0.5*_cse112 - 0.5*_cse838
+    _cse843 = 0.5*_cse537
+    _cse844 = _cse133 + _cse841
+    _cse845 = _cse126 + _cse844
+    _cse846 = -_cse36
+    _cse847 = -_cse108 - _cse109 - _cse110 + _cse539 + _cse541 + 1.6153e-5*_cse84
+    _cse848 = 4.5318e-5*_cse143 + _cse549
+    _cse849 = -_cse151
+    _cse850 = 0.095416*_cse279 + _cse849
+    _cse851 = 0.095416*_cse333 + _cse850
+    _cse852 = -0.5*_cse38 - 0.5*_cse46 - 0.5*_cse47 + 0.5*_cse548 + 0.5*_cse846 + 0.5*_cse847 + 0.5*_cse848 + 0.5*_cse851
+    _cse853 = 0.5*_cse552
+    _cse854 = _cse177 + _cse844
+    _cse855 = -0.5*_cse220 - 0.5*_cse838
+    _cse856 = 0.5*_cse554
+    _cse857 = 0.4251*_cse6
+    _cse858 = 2.85*_cse237*(0.00198892*_cse8 - _cse857)
+    _cse859 = 3.9*_cse26
+    _cse860 = -3.9*_cse29 - 1.65789*_cse6 + 0.003429816*_cse8 - _cse859
+    _cse861 = 0.00087944*_cse6
+    _cse862 = 0.4251*_cse8
+    _cse863 = _cse239 - _cse28*_cse6 + _cse861 + _cse862
+    _cse864 = -0.5*_cse863
+    _cse865 = _cse26 + _cse29 - 0.00087944*_cse8 + _cse857
+    _cse866 = -_cse865
+    _cse867 = 3.9*_cse239
+    _cse868 = 3.9*_cse28*_cse6 - 0.003429816*_cse6 - 1.65789*_cse8 - _cse867
+    _cse869 = 0.5*_cse868
+    _cse870 = 1.06275*_cse6
+    _cse871 = 4.03825e-5*_cse64
+    _cse872 = 0.51345*_cse56
+    _cse873 = 0.51345*_cse58
+    _cse874 = 2.5*_cse26
+    _cse875 = 2.5*_cse29
+    _cse876 = 4.03825e-5*_cse23*_cse8 + 2.5*_cse55*_cse632 + 2.5*_cse629*_cse63 + 0.0021986*_cse8 - _cse870 - _cse871 - _cse872 - _cse873 - _cse874 - _cse875
+    _cse877 = -_cse55*_cse629
+    _cse878 = 0.20538*_cse69
+    _cse879 = 1.6153e-5*_cse58
+    _cse880 = 1.6153e-5*_cse56
+    _cse881 = -0.20538*_cse22*_cse6 - _cse63*_cse631 + _cse877 + _cse878 + _cse879 + _cse880
+    _cse882 = _cse863 + _cse881
+    _cse883 = -0.5*_cse882
+    _cse884 = -_cse55*_cse632
+    _cse885 = 0.20538*_cse58
+    _cse886 = 0.20538*_cse56
+    _cse887 = 1.6153e-5*_cse64
+    _cse888 = -1.6153e-5*_cse23*_cse8 - _cse629*_cse63 + _cse865 + _cse885 + _cse886 + _cse887
+    _cse889 = -_cse884 - _cse888
+    _cse890 = 0.0021986*_cse6
+    _cse891 = 1.06275*_cse8
+    _cse892 = 2.5*_cse239
+    _cse893 = 4.03825e-5*_cse58
+    _cse894 = 4.03825e-5*_cse56
+    _cse895 = 0.51345*_cse69
+    _cse896 = -0.51345*_cse22*_cse6 - 2.5*_cse55*_cse629 - 2.5*_cse63*_cse631 + _cse892 + _cse893 + _cse894 + _cse895
+    _cse897 = 2.5*_cse28*_cse6 - _cse890 - _cse891 - _cse896
+    _cse898 = 0.5*_cse897
+    _cse899 = _cse55*_cse632
+    _cse900 = 2.5*_cse899
+    _cse901 = _cse629*_cse63
+    _cse902 = 4.03825e-5*_cse69 - _cse871 - _cse872 - _cse873 - _cse874 + _cse900 + 2.5*_cse901
+    _cse903 = _cse129*_cse640
+    _cse904 = 0.23854*_cse633 - 0.000113295*_cse639
+    _cse905 = 0.23854*_cse630 + 0.000113295*_cse638 + 2.5*_cse903 + _cse904
+    _cse906 = 0.0021986*_cse8 - _cse870 - _cse875 + _cse902 + _cse905
+    _cse907 = _cse55*_cse629
+    _cse908 = _cse63*_cse631
+    _cse909 = 0.20538*_cse64 - _cse878 - _cse879 - _cse880 + _cse907 + _cse908
+    _cse910 = _cse53*_cse631
+    _cse911 = 4.5318e-5*_cse630
+    _cse912 = -_cse911
+    _cse913 = 0.095416*_cse638 + _cse912
+    _cse914 = _cse54*_cse631 - _cse630
+    _cse915 = _cse129*_cse914
+    _cse916 = _cse54*_cse631
+    _cse917 = _cse915 + 4.5318e-5*_cse916
+    _cse918 = 0.095416*_cse910 + _cse913 + _cse917
+    _cse919 = -_cse239 + _cse918
+    _cse920 = _cse247 - _cse861 - _cse862 + _cse909 + _cse919
+    _cse921 = 0.5*_cse920
+    _cse922 = -_cse26
+    _cse923 = 4.5318e-5*_cse638
+    _cse924 = 1.6153e-5*_cse69 - _cse885 - _cse886 - _cse887 + _cse899 + _cse901
+    _cse925 = 4.5318e-5*_cse639
+    _cse926 = -_cse925
+    _cse927 = 0.095416*_cse633 + _cse926
+    _cse928 = 0.095416*_cse630 + _cse927
+    _cse929 = -_cse29 + 0.00087944*_cse8 - _cse857 + _cse903 + _cse922 + _cse923 + _cse924 + _cse928
+    _cse930 = 2.5*_cse907
+    _cse931 = 0.51345*_cse64 - _cse893 - _cse894 - _cse895 + 2.5*_cse908 + _cse930
+    _cse932 = -0.000113295*_cse630 + 0.23854*_cse638
+    _cse933 = 0.23854*_cse910 + 2.5*_cse915 + 0.000113295*_cse916 + _cse932
+    _cse934 = -_cse892 + _cse933
+    _cse935 = 2.5*_cse247 - _cse890 - _cse891 + _cse931 + _cse934
+    _cse936 = 0.5*_cse935
+    _cse937 = 1.13071e-5*_cse64
+    _cse938 = _cse181*_cse640
+    _cse939 = 0.143766*_cse58
+    _cse940 = 0.143766*_cse56
+    _cse941 = 0.7*_cse26
+    _cse942 = _cse311*_cse640
+    _cse943 = 3.17226e-5*_cse639
+    _cse944 = -0.0716002*_cse54*_cse632 - 0.7*_cse55*_cse632 + _cse943
+    _cse945 = 0.7*_cse129*_cse640 + 1.13071e-5*_cse23*_cse8 - 0.7*_cse29 + 0.0716002*_cse53*_cse629 + 3.17226e-5*_cse54*_cse629 - 0.29757*_cse6 + 0.7*_cse629*_cse63 + 0.000615608*_cse8 - _cse937 - _cse938 - _cse939 - _cse940 - _cse941 - _cse942 - _cse944
+    _cse946 = _cse175*_cse914
+    _cse947 = _cse394*_cse914
+    _cse948 = -0.102286*_cse54*_cse629 + _cse911
+    _cse949 = -_cse129*_cse914 - 0.102286*_cse53*_cse631 - 4.5318e-5*_cse54*_cse631 + _cse946 + _cse947 + _cse948
+    _cse950 = -0.5*_cse882 - 0.5*_cse949
+    _cse951 = _cse175*_cse640
+    _cse952 = _cse394*_cse640
+    _cse953 = -0.102286*_cse54*_cse632 + _cse884 + _cse925
+    _cse954 = _cse129*_cse640 + 0.102286*_cse53*_cse629 + 4.5318e-5*_cse54*_cse629 - _cse888 - _cse951 - _cse952 - _cse953
+    _cse955 = 1.13071e-5*_cse58
+    _cse956 = 1.13071e-5*_cse56
+    _cse957 = _cse181*_cse914
+    _cse958 = 0.143766*_cse69
+    _cse959 = _cse311*_cse914
+    _cse960 = 3.17226e-5*_cse630
+    _cse961 = -0.0716002*_cse54*_cse629 - 0.7*_cse55*_cse629 + _cse960
+    _cse962 = -0.7*_cse129*_cse914 - 0.143766*_cse22*_cse6 + 0.7*_cse239 - 0.0716002*_cse53*_cse631 - 3.17226e-5*_cse54*_cse631 - 0.7*_cse63*_cse631 + _cse955 + _cse956 + _cse957 + _cse958 + _cse959 + _cse961
+    _cse963 = 0.7*_cse28*_cse6 - 0.000615608*_cse6 - 0.29757*_cse8 - _cse962
+    _cse964 = 0.5*_cse963
+    _cse965 = _cse565 + _cse922
+    _cse966 = _cse566 - _cse859
+    _cse967 = 3.9*_cse410
+    _cse968 = -_cse867 - _cse967
+    _cse969 = _cse866*_cse968
+    _cse970 = _cse924 + _cse965
+    _cse971 = _cse571 + _cse902
+    _cse972 = 2.5*_cse410
+    _cse973 = -_cse896 - _cse972
+    _cse974 = 1.0*_cse889
+    _cse975 = _cse903 + _cse923 + _cse970
+    _cse976 = _cse928 + _cse975
+    _cse977 = _cse905 + _cse971
+    _cse978 = _cse931 - _cse972
+    _cse979 = _cse934 + _cse978
+    _cse980 = 1.0*_cse929
+    _cse981 = _cse578 + 0.0716002*_cse630 + 0.0716002*_cse633 + 3.17226e-5*_cse638 + 1.13071e-5*_cse69 + 0.7*_cse899 + 0.7*_cse901 + 0.7*_cse903 - _cse937 - _cse938 - _cse939 - _cse940 - _cse941 - _cse942 - _cse943
+    _cse982 = 0.102286*_cse630 + 0.102286*_cse633 + _cse926 - _cse951 - _cse952 + _cse975
+    _cse983 = 0.7*_cse410
+    _cse984 = -_cse962 - _cse983
+    _cse985 = 1.0*_cse954
+    _cse986 = _cse62*_cse750
+    _cse987 = _cse900 + 2.5*_cse986
+    _cse988 = _cse129*_cse757
+    _cse989 = -0.23854*_cse751 - 0.000113295*_cse755 + _cse904 + _cse987 + 2.5*_cse988
+    _cse990 = 0.7*_cse129*_cse757 - _cse181*_cse757 - _cse311*_cse757 + 0.7*_cse62*_cse750 - 0.0716002*_cse751 - 3.17226e-5*_cse755 - _cse944
+    _cse991 = _cse899 + _cse986
+    _cse992 = 4.5318e-5*_cse755
+    _cse993 = -0.095416*_cse751 + _cse927 + _cse988 + _cse991 - _cse992
+    _cse994 = _cse129*_cse757 - _cse175*_cse757 - _cse394*_cse757 + _cse62*_cse750 - 0.102286*_cse751 - _cse953 - _cse992
+    _cse995 = _cse62*_cse632
+    _cse996 = 2.5*_cse995
+    _cse997 = _cse930 + _cse996
+    _cse998 = _cse630 + _cse633
+    _cse999 = -_cse998
+    _cse1000 = _cse129*_cse999
+    _cse1001 = -0.000113295*_cse633 - 0.23854*_cse639
+    _cse1002 = 2.5*_cse1000 + _cse1001 + _cse932 + _cse997
+    _cse1003 = -0.7*_cse62*_cse632 + 3.17226e-5*_cse633 + 0.0716002*_cse639
+    _cse1004 = -_cse1003 + 0.7*_cse129*_cse999 - _cse181*_cse999 - _cse311*_cse999 - _cse961
+    _cse1005 = _cse1002*_cse980 + _cse1004*_cse985 + _cse595*_cse826 + _cse598*_cse827 + _cse603*_cse828 + _cse607*_cse829 + _cse609*_cse831 + _cse611*_cse830 + _cse974*_cse997
+    _cse1006 = _cse135*_cse800
+    _cse1007 = 0.7*_cse1006 - _cse499*_cse800 + _cse622*_cse800
+    _cse1008 = 4.5293e-5*_cse127
+    _cse1009 = _cse1006 + _cse1008*_cse800 - _cse765*_cse800
+    _cse1010 = 1.25*_cse1006
+    _cse1011 = _cse135*_cse640
+    _cse1012 = 0.7*_cse1011 - _cse499*_cse640 + _cse622*_cse640
+    _cse1013 = 2.5*_cse929
+    _cse1014 = 2.5*_cse392
+    _cse1015 = 2.5*_cse385
+    _cse1016 = _cse1011*_cse1013 + _cse1012*_cse985 + _cse1014*_cse623 + _cse1015*_cse625 + _cse624*_cse831 + _cse626*_cse830
+    _cse1017 = 0.045*_cse0
+    _cse1018 = _cse1017*_cse599
+    _cse1019 = _cse604*_cse618
+    _cse1020 = _cse1018 + _cse1019
+    _cse1021 = 0.01*_cse284
+    _cse1022 = _cse1021 + 0.01*_cse141
+    _cse1023 = 0.5*_cse0
+    _cse1024 = _cse1022*_cse1023
+    _cse1025 = 0.01*_cse160
+    _cse1026 = _cse1025 + 0.01*_cse122
+    _cse1027 = _cse1026*_cse770
+    _cse1028 = 0.04*_cse284
+    _cse1029 = _cse1028 + 0.04*_cse141
+    _cse1030 = 1.0*_cse0
+    _cse1031 = _cse1029*_cse1030
+    _cse1032 = 0.04*_cse160
+    _cse1033 = _cse1032 + 0.04*_cse122
+    _cse1034 = _cse1033*_cse775
+    _cse1035 = -_cse1024 - _cse1027 - _cse1031 - _cse1034
+    _cse1036 = _cse1020 + _cse1035
+    _cse1037 = _cse1016 + _cse1036
+    _cse1038 = _cse0*_cse565
+    _cse1039 = -_cse1038 + _cse27
+    _cse1040 = _cse1*_cse565
+    _cse1041 = _cse1040 + _cse846
+    _cse1042 = 0.5*_cse1041
+    _cse1043 = -_cse1038 + _cse72
+    _cse1044 = _cse1043 + _cse27
+    _cse1045 = _cse1041 + _cse847
+    _cse1046 = 0.5*_cse1045
+    _cse1047 = _cse1045 + _cse848
+    _cse1048 = 0.5*_cse1047 + 0.5*_cse851
+    _cse1049 = _cse1044 + _cse133
+    _cse1050 = _cse1049 + _cse126
+    _cse1051 = -_cse217 - _cse218 + 0.102286*_cse279 + 0.102286*_cse333 + _cse849
+    _cse1052 = 0.5*_cse1047 + 0.5*_cse1051
+    _cse1053 = _cse1049 + _cse177
+    _cse1054 = 0.5*_cse570
+    _cse1055 = 0.5*_cse575
+    _cse1056 = 0.5*_cse576
+    _cse1057 = 0.5*_cse580
+    _cse1058 = _cse1039*_cse41 + _cse1042*_cse45 + _cse1044*_cse94 + _cse1046*_cse119 + _cse1048*_cse171 + _cse1050*_cse146 + _cse1052*_cse234 + _cse1053*_cse195 - _cse1054*_cse52 - _cse1055*_cse117 - _cse1056*_cse168 - _cse1057*_cse228 - _cse114*_cse573 - _cse156*_cse577 - _cse222*_cse582 - _cse51*_cse568
+    _cse1059 = 0.5*_cse969
+    _cse1060 = _cse515*_cse568
+    _cse1061 = _cse1054*_cse358
+    _cse1062 = 0.5*_cse973
+    _cse1063 = _cse1062*_cse889
+    _cse1064 = _cse519*_cse573
+    _cse1065 = _cse1055*_cse370
+    _cse1066 = 0.5*_cse979
+    _cse1067 = _cse1066*_cse929
+    _cse1068 = _cse1056*_cse385
+    _cse1069 = _cse527*_cse577
+    _cse1070 = 0.5*_cse984
+    _cse1071 = _cse1070*_cse954
+    _cse1072 = _cse1057*_cse397
+    _cse1073 = _cse531*_cse582
+    _cse1074 = _cse239 + _cse410
+    _cse1075 = -0.5*_cse1074
+    _cse1076 = _cse1074 + _cse881
+    _cse1077 = -0.5*_cse1076
+    _cse1078 = -_cse410 + _cse909
+    _cse1079 = _cse1078 + _cse919
+    _cse1080 = 0.5*_cse1079
+    _cse1081 = -0.5*_cse1076 - 0.5*_cse949
+    _cse1082 = _cse1039*_cse502 + _cse1042*_cse249 + _cse1044*_cse505 + _cse1046*_cse268 + _cse1048*_cse287 + _cse1050*_cse508 + _cse1052*_cse314 + _cse1053*_cse511 + _cse1075*_cse860 + _cse1077*_cse876 + _cse1080*_cse906 + _cse1081*_cse945
+    _cse1083 = 3.9*_cse24*_cse8 - _cse967
+    _cse1084 = _cse1083*_cse866
+    _cse1085 = _cse24*_cse8
+    _cse1086 = 2.5*_cse1085 + _cse978
+    _cse1087 = _cse1086 + _cse933
+    _cse1088 = 0.7*_cse1085 + 0.0716002*_cse638 + 0.143766*_cse64 + 0.7*_cse907 + 0.7*_cse908 + 0.0716002*_cse910 + 0.7*_cse915 + 3.17226e-5*_cse916 - _cse955 - _cse956 - _cse957 - _cse958 - _cse959 - _cse960 - _cse983
+    _cse1089 = _cse965*_cse968
+    _cse1090 = 0.5*_cse1089
+    _cse1091 = _cse1054*_cse414
+    _cse1092 = _cse568*_cse588
+    _cse1093 = _cse1062*_cse970
+    _cse1094 = _cse1055*_cse424
+    _cse1095 = _cse573*_cse663
+    _cse1096 = _cse1066*_cse976
+    _cse1097 = _cse577*_cse665
+    _cse1098 = _cse1056*_cse433
+    _cse1099 = _cse1070*_cse982
+    _cse1100 = _cse582*_cse668
+    _cse1101 = _cse1057*_cse442
+    _cse1102 = _cse1039*_cse584 + _cse1042*_cse417 + _cse1044*_cse652 + _cse1046*_cse428 + _cse1048*_cse434 + _cse1050*_cse655 + _cse1052*_cse443 + _cse1053*_cse658 + _cse1075*_cse966 + _cse1077*_cse971 + _cse1080*_cse977 + _cse1081*_cse981
+    _cse1103 = _cse1044*_cse691 + _cse1046*_cse449 + _cse1048*_cse465 + _cse1050*_cse705 + _cse1052*_cse475 + _cse1053*_cse708 - _cse1055*_cse448 - _cse1056*_cse464 - _cse1057*_cse474 - _cse1062*_cse991 - _cse1066*_cse993 - _cse1070*_cse994 + _cse1077*_cse987 + _cse1080*_cse989 + _cse1081*_cse990 - _cse573*_cse694 - _cse577*_cse712 - _cse582*_cse714
+    _cse1104 = -_cse1006*_cse1066 + _cse1007*_cse1081 - _cse1009*_cse1070 + _cse1010*_cse1079 + _cse1048*_cse487 + _cse1050*_cse738 + _cse1052*_cse498 + _cse1053*_cse739 - _cse1056*_cse485 - _cse1057*_cse496 - _cse577*_cse741 - _cse582*_cse744
+    _cse1105 = _cse539 + _cse593
+    _cse1106 = 0.5*_cse1105
+    _cse1107 = _cse596 + _cse61
+    _cse1108 = 4.5318e-5*_cse284
+    _cse1109 = -_cse1108 - 0.095416*_cse278
+    _cse1110 = 0.5*_cse1105 + 0.5*_cse1109 + 0.5*_cse601 + 0.5*_cse850
+    _cse1111 = _cse1107 + _cse125 + _cse164 + _cse606
+    _cse1112 = _cse1108 - _cse250*_cse62 + 0.102286*_cse278
+    _cse1113 = -0.5*_cse1112 + 0.5*_cse129*_cse600 - 0.5*_cse175*_cse600 - 0.5*_cse219 - 0.5*_cse394*_cse600
+    _cse1114 = _cse161 + _cse223 - _cse62*_cse66
+    _cse1115 = -_cse1114 - _cse123 + _cse129*_cse605 - _cse175*_cse605 - _cse394*_cse605 + 0.102286*_cse54*_cse60 + _cse55*_cse60
+    _cse1116 = 0.5*_cse595
+    _cse1117 = 0.5*_cse603
+    _cse1118 = 0.5*_cse611
+    _cse1119 = _cse1106*_cse119 + _cse1107*_cse94 + _cse1110*_cse171 + _cse1111*_cse146 + _cse1113*_cse234 + _cse1115*_cse195 - _cse1116*_cse117 - _cse1117*_cse168 - _cse1118*_cse228 - _cse114*_cse598 - _cse156*_cse607 - _cse222*_cse609
+    _cse1120 = 0.5*_cse997
+    _cse1121 = _cse1120*_cse889
+    _cse1122 = _cse1116*_cse370
+    _cse1123 = _cse519*_cse598
+    _cse1124 = 0.5*_cse1002
+    _cse1125 = _cse1124*_cse929
+    _cse1126 = _cse1117*_cse385
+    _cse1127 = _cse527*_cse607
+    _cse1128 = 0.5*_cse1004
+    _cse1129 = _cse1128*_cse954
+    _cse1130 = _cse531*_cse609
+    _cse1131 = _cse1118*_cse397
+    _cse1132 = _cse907 + _cse995
+    _cse1133 = 0.5*_cse1132
+    _cse1134 = 4.5318e-5*_cse633
+    _cse1135 = -_cse1134 - 0.095416*_cse639
+    _cse1136 = _cse1000 + _cse1132 + _cse1135 + _cse913
+    _cse1137 = 0.5*_cse1136
+    _cse1138 = _cse1134 - _cse62*_cse632 + 0.102286*_cse639
+    _cse1139 = -0.5*_cse1138 + 0.5*_cse129*_cse999 - 0.5*_cse175*_cse999 - 0.5*_cse394*_cse999 - 0.5*_cse877 - 0.5*_cse948
+    _cse1140 = _cse1106*_cse268 + _cse1107*_cse505 + _cse1110*_cse287 + _cse1111*_cse508 + _cse1113*_cse314 + _cse1115*_cse511 + _cse1133*_cse876 + _cse1137*_cse906 + _cse1139*_cse945
+    _cse1141 = _cse1120*_cse970
+    _cse1142 = _cse1116*_cse424
+    _cse1143 = _cse598*_cse663
+    _cse1144 = _cse1124*_cse976
+    _cse1145 = _cse1117*_cse433
+    _cse1146 = _cse607*_cse665
+    _cse1147 = _cse1128*_cse982
+    _cse1148 = _cse609*_cse668
+    _cse1149 = _cse1118*_cse442
+    _cse1150 = _cse1106*_cse428 + _cse1107*_cse652 + _cse1110*_cse434 + _cse1111*_cse655 + _cse1113*_cse443 + _cse1115*_cse658 + _cse1133*_cse971 + _cse1137*_cse977 + _cse1139*_cse981
+    _cse1151 = -_cse1141 - _cse1142 - _cse1143 - _cse1144 - _cse1145 - _cse1146 - _cse1147 - _cse1148 - _cse1149 + _cse1150
+    _cse1152 = _cse718*_cse750
+    _cse1153 = 2.5*_cse1152 + _cse996
+    _cse1154 = _cse129*_cse799
+    _cse1155 = _cse1001 + _cse1153 + 2.5*_cse1154 + 0.000113295*_cse751 - 0.23854*_cse755
+    _cse1156 = -_cse1003 + 0.7*_cse129*_cse799 - _cse181*_cse799 - _cse311*_cse799 + 3.17226e-5*_cse53*_cse750 + 0.7*_cse718*_cse750 - 0.0716002*_cse755
+    _cse1157 = _cse1120*_cse991
+    _cse1158 = _cse1116*_cse448
+    _cse1159 = _cse598*_cse694
+    _cse1160 = _cse1124*_cse993
+    _cse1161 = _cse1117*_cse464
+    _cse1162 = _cse607*_cse712
+    _cse1163 = _cse1128*_cse994
+    _cse1164 = _cse1118*_cse474
+    _cse1165 = _cse609*_cse714
+    _cse1166 = _cse1106*_cse449 + _cse1107*_cse691 + _cse1110*_cse465 + _cse1111*_cse705 + _cse1113*_cse475 + _cse1115*_cse708 + _cse1133*_cse987 + _cse1137*_cse989 + _cse1139*_cse990
+    _cse1167 = -_cse1157 - _cse1158 - _cse1159 - _cse1160 - _cse1161 - _cse1162 - _cse1163 - _cse1164 - _cse1165 + _cse1166
+    _cse1168 = _cse135*_cse757
+    _cse1169 = 0.7*_cse1168 - _cse499*_cse757 + _cse622*_cse757
+    _cse1170 = _cse1021 - 0.01*_cse339
+    _cse1171 = _cse1023*_cse1170
+    _cse1172 = _cse1025 - 0.01*_cse157
+    _cse1173 = _cse1172*_cse770
+    _cse1174 = _cse1028 - 0.04*_cse339
+    _cse1175 = _cse1030*_cse1174
+    _cse1176 = _cse1032 - 0.04*_cse157
+    _cse1177 = _cse1176*_cse775
+    _cse1178 = -_cse1171 - _cse1173 - _cse1175 - _cse1177
+    _cse1179 = _cse1013*_cse1168 + _cse1014*_cse748 + _cse1015*_cse746 + _cse1169*_cse985 + _cse1178 + _cse747*_cse830 + _cse749*_cse831
+    _cse1180 = -_cse1006*_cse1124 + _cse1007*_cse1139 - _cse1009*_cse1128 + _cse1010*_cse1136 + _cse1110*_cse487 + _cse1111*_cse738 + _cse1113*_cse498 + _cse1115*_cse739 - _cse1117*_cse485 - _cse1118*_cse496 - _cse607*_cse741 - _cse609*_cse744
+    _cse1181 = _cse1020 + _cse1180
+    _cse1182 = 0.025*_cse173
+    _cse1183 = _cse1182*_cse291
+    _cse1184 = 0.025*_cse179
+    _cse1185 = _cse1184*_cse280
+    _cse1186 = _cse1182*_cse453 + _cse1184*_cse459
+    _cse1187 = -_cse1183 - _cse1185 + _cse1186
+    _cse1188 = _cse222*_cse624
+    _cse1189 = 0.5*_cse626
+    _cse1190 = _cse1189*_cse228
+    _cse1191 = _cse1008*_cse291 - _cse291*_cse765 + _cse623
+    _cse1192 = _cse1008*_cse280 - _cse280*_cse765 + _cse625
+    _cse1193 = 1.25*_cse623
+    _cse1194 = _cse1193*_cse155
+    _cse1195 = 1.25*_cse625
+    _cse1196 = _cse1195*_cse168
+    _cse1197 = _cse1188 + _cse1190 - 0.5*_cse1191*_cse194 - 0.5*_cse1192*_cse234 + _cse1194 + _cse1196 - 0.5*_cse135*_cse145*_cse291 - 0.5*_cse135*_cse171*_cse280
+    _cse1198 = 0.5*_cse1012
+    _cse1199 = _cse1198*_cse954
+    _cse1200 = _cse531*_cse624
+    _cse1201 = _cse1189*_cse397
+    _cse1202 = 1.25*_cse1011
+    _cse1203 = _cse1202*_cse929
+    _cse1204 = _cse1193*_cse392
+    _cse1205 = _cse1195*_cse385
+    _cse1206 = _cse1008*_cse640 + _cse1011 - _cse640*_cse765
+    _cse1207 = 0.5*_cse1206
+    _cse1208 = 0.5*_cse1192
+    _cse1209 = 0.5*_cse1011
+    _cse1210 = 0.5*_cse625
+    _cse1211 = _cse1191*_cse511 + _cse1207*_cse945 + _cse1208*_cse314 + _cse1209*_cse906 + _cse1210*_cse287 + _cse508*_cse623
+    _cse1212 = _cse1198*_cse982
+    _cse1213 = _cse624*_cse668
+    _cse1214 = _cse1189*_cse442
+    _cse1215 = _cse1202*_cse976
+    _cse1216 = _cse1193*_cse430
+    _cse1217 = _cse1195*_cse433
+    _cse1218 = _cse1191*_cse658 + _cse1207*_cse981 + _cse1208*_cse443 + _cse1209*_cse977 + _cse1210*_cse434 + _cse623*_cse655
+    _cse1219 = -_cse1212 - _cse1213 - _cse1214 - _cse1215 - _cse1216 - _cse1217 + _cse1218
+    _cse1220 = -_cse1189*_cse474 + _cse1191*_cse708 - _cse1193*_cse457 - _cse1195*_cse464 - _cse1198*_cse994 - _cse1202*_cse993 + _cse1207*_cse990 + _cse1208*_cse475 + _cse1209*_cse989 + _cse1210*_cse465 + _cse623*_cse705 - _cse624*_cse714
+    _cse1221 = _cse1024 + _cse1027 + _cse1031 + _cse1034 + _cse1220
+    _cse1222 = _cse477*_cse800
+    _cse1223 = 0.7*_cse1222 + _cse181*_cse800 + _cse311*_cse800
+    _cse1224 = _cse135**2
+    _cse1225 = 0.01*_cse630 + 0.01*_cse633
+    _cse1226 = 0.5*_cse756
+    _cse1227 = 0.01*_cse639 + 0.01*_cse755
+    _cse1228 = 0.5*_cse1227
+    _cse1229 = 0.5*_cse599
+    _cse1230 = 0.04*_cse630 + 0.04*_cse633
+    _cse1231 = 1.0*_cse756
+    _cse1232 = 0.04*_cse639 + 0.04*_cse755
+    _cse1233 = 1.0*_cse1232
+    _cse1234 = 1.0*_cse774
+    _cse1235 = 1.0*_cse458
+    _cse1236 = 2*_cse639
+    _cse1237 = -_cse1236 + 2*_cse638
+    _cse1238 = 1.25*_cse1224*_cse800
+    _cse1239 = _cse1022*_cse817 + _cse1026*_cse793 + _cse1029*_cse1235 + _cse1033*_cse796 + _cse1225*_cse1226 + _cse1228*_cse998 + _cse1229*_cse769 + _cse1230*_cse1231 + _cse1233*_cse998 + _cse1234*_cse599 + _cse1237*_cse1238 + _cse604*_cse792 + _cse604*_cse795
+    _cse1240 = _cse1009*_cse1198 + _cse1189*_cse496 + _cse1193*_cse481 + _cse1195*_cse485 + _cse1239 + _cse624*_cse744
+    _cse1241 = -0.5*_cse1007*_cse1206 - 0.5*_cse1191*_cse490 - 0.5*_cse1192*_cse498 - 2.5*_cse1224*_cse640*_cse800 + _cse1240 - 0.5*_cse135*_cse280*_cse487 - 0.5*_cse135*_cse291*_cse480
+    _cse1242 = _cse1022*_cse821
+    _cse1243 = _cse1029*_cse821
+    _cse1244 = _cse1026*_cse805
+    _cse1245 = _cse1033*_cse805
+    _cse1246 = _cse127*_cse640
+    _cse1247 = _cse1228*_cse1246
+    _cse1248 = 0.5*_cse1232
+    _cse1249 = _cse1246*_cse1248
+    _cse1250 = 0.5*_cse127
+    _cse1251 = _cse1250*_cse800
+    _cse1252 = _cse1225*_cse1251
+    _cse1253 = _cse1230*_cse1251
+    _cse1254 = _cse127*_cse291
+    _cse1255 = _cse1254*_cse792
+    _cse1256 = _cse1254*_cse803
+    _cse1257 = _cse1250*_cse280
+    _cse1258 = _cse1257*_cse769
+    _cse1259 = _cse1257*_cse774
+    _cse1260 = 0.01*_cse1*_cse127 - 0.01*_cse225
+    _cse1261 = 0.01*_cse0*_cse127 - 0.01*_cse493
+    _cse1262 = 0.04*_cse1*_cse127 - 0.04*_cse225
+    _cse1263 = 0.04*_cse0*_cse127 - 0.04*_cse493
+    _cse1264 = _cse1023*_cse1261 + _cse1023*_cse1263 + _cse1260*_cse770 + _cse1262*_cse770
+    _cse1265 = -_cse1242 - _cse1243 - _cse1244 - _cse1245 + _cse1247 + _cse1249 + _cse1252 + _cse1253 + _cse1255 + _cse1256 + _cse1258 + _cse1259 - _cse1264
+    _cse1266 = 0.5*_cse604
+    _cse1267 = _cse280*_cse641
+    _cse1268 = _cse291*_cse641
+    _cse1269 = _cse1229*_cse811 + _cse1229*_cse812 + _cse1266*_cse816 + _cse1266*_cse818 - _cse1267*_cse458 - _cse1268*_cse452 - _cse641*_cse800*_cse998 - _cse642*_cse756
+    _cse1270 = _cse1264 + _cse1269
+    _cse1271 = -_cse1270
+    _cse1272 = _cse127**2*_cse801
+    _cse1273 = _cse1250*_cse291
+    _cse1274 = -_cse1237*_cse1272 + _cse1257*_cse811 + _cse1257*_cse812 + _cse1267*_cse646 + _cse1268*_cse804 + _cse1273*_cse816 + _cse1273*_cse818
+    _cse1275 = 1.0*_cse414
+    _cse1276 = 1.0*_cse416
+    _cse1277 = 1.0*_cse424
+    _cse1278 = 1.0*_cse422
+    _cse1279 = 1.0*_cse430
+    _cse1280 = 1.0*_cse433
+    _cse1281 = 1.0*_cse438
+    _cse1282 = 1.0*_cse442
+    _cse1283 = _cse1275*_cse242 + _cse1276*_cse324 + _cse1277*_cse276 + _cse1278*_cse328 + _cse1279*_cse343 + _cse1280*_cse296 + _cse1281*_cse352 + _cse1282*_cse322
+    _cse1284 = _cse1277*_cse445 + _cse1278*_cse451 + _cse1279*_cse469 + _cse1280*_cse455 + _cse1281*_cse476 + _cse1282*_cse470
+    _cse1285 = -1.0*_cse430*_cse489 - 1.0*_cse433*_cse480 - 1.0*_cse438*_cse500 - 1.0*_cse442*_cse490 + _cse834
+    _cse1286 = 1.0*_cse970
+    _cse1287 = 1.0*_cse976
+    _cse1288 = 1.0*_cse982
+    _cse1289 = _cse1002*_cse1287 + _cse1004*_cse1288 + _cse1277*_cse595 + _cse1278*_cse598 + _cse1279*_cse607 + _cse1280*_cse603 + _cse1281*_cse609 + _cse1282*_cse611 + _cse1286*_cse997
+    _cse1290 = 2.5*_cse976
+    _cse1291 = 2.5*_cse430
+    _cse1292 = 2.5*_cse433
+    _cse1293 = _cse1011*_cse1290 + _cse1012*_cse1288 + _cse1281*_cse624 + _cse1282*_cse626 + _cse1291*_cse623 + _cse1292*_cse625
+    _cse1294 = _cse1036 + _cse1293
+    _cse1295 = _cse1040 + _cse672
+    _cse1296 = 0.5*_cse1295
+    _cse1297 = -_cse1038 - _cse674
+    _cse1298 = 0.5*_cse673
+    _cse1299 = _cse1043 - _cse674
+    _cse1300 = _cse1295 + _cse847
+    _cse1301 = 0.5*_cse1300
+    _cse1302 = 0.5*_cse677
+    _cse1303 = _cse1299 + _cse133
+    _cse1304 = _cse126 + _cse1303
+    _cse1305 = _cse1300 + _cse848
+    _cse1306 = 0.5*_cse1305 + 0.5*_cse851
+    _cse1307 = 0.5*_cse678
+    _cse1308 = _cse1303 + _cse177
+    _cse1309 = 0.5*_cse1051 + 0.5*_cse1305
+    _cse1310 = 0.5*_cse680
+    _cse1311 = 0.5*_cse24*_cse8 - 0.5*_cse410
+    _cse1312 = _cse1078 + _cse1085
+    _cse1313 = 0.5*_cse1312
+    _cse1314 = 0.5*_cse1086
+    _cse1315 = _cse1312 + _cse918
+    _cse1316 = 0.5*_cse1315
+    _cse1317 = 0.5*_cse1087
+    _cse1318 = 0.5*_cse1312 + 0.051143*_cse638 + 0.051143*_cse910 + 0.5*_cse912 + 0.5*_cse917 - 0.5*_cse946 - 0.5*_cse947
+    _cse1319 = 0.5*_cse1088
+    _cse1320 = -_cse1121 - _cse1122 - _cse1123 - _cse1125 - _cse1126 - _cse1127 - _cse1129 - _cse1130 - _cse1131 + _cse1140
+    _cse1321 = _cse1168*_cse1290 + _cse1169*_cse1288 + _cse1178 + _cse1281*_cse749 + _cse1282*_cse747 + _cse1291*_cse748 + _cse1292*_cse746
+    _cse1322 = -_cse1199 - _cse1200 - _cse1201 - _cse1203 - _cse1204 - _cse1205 + _cse1211
+    _cse1323 = 1.0*_cse448
+    _cse1324 = 1.0*_cse446
+    _cse1325 = 1.0*_cse464
+    _cse1326 = 1.0*_cse457
+    _cse1327 = 1.0*_cse474
+    _cse1328 = 1.0*_cse471
+    _cse1329 = _cse1323*_cse276 + _cse1324*_cse328 + _cse1325*_cse296 + _cse1326*_cse343 + _cse1327*_cse322 + _cse1328*_cse352
+    _cse1330 = _cse1323*_cse420 + _cse1324*_cse427 + _cse1325*_cse429 + _cse1326*_cse431 + _cse1327*_cse436 + _cse1328*_cse441
+    _cse1331 = -_cse815
+    _cse1332 = 1.0*_cse991
+    _cse1333 = 1.0*_cse993
+    _cse1334 = 1.0*_cse994
+    _cse1335 = _cse1323*_cse575 + _cse1324*_cse573 + _cse1325*_cse576 + _cse1326*_cse577 + _cse1327*_cse580 + _cse1328*_cse582 + _cse1332*_cse973 + _cse1333*_cse979 + _cse1334*_cse984
+    _cse1336 = _cse1157 + _cse1158 + _cse1159 + _cse1160 + _cse1161 + _cse1162 + _cse1163 + _cse1164 + _cse1165 + _cse1166
+    _cse1337 = _cse1017*_cse483
+    _cse1338 = _cse166*_cse618
+    _cse1339 = _cse1337 + _cse1338
+    _cse1340 = 2.5*_cse993
+    _cse1341 = 2.5*_cse457
+    _cse1342 = 2.5*_cse464
+    _cse1343 = _cse1011*_cse1340 + _cse1012*_cse1334 + _cse1035 + _cse1327*_cse626 + _cse1328*_cse624 + _cse1341*_cse623 + _cse1342*_cse625
+    _cse1344 = _cse1180 + _cse1339 + _cse1343
+    _cse1345 = -_cse1187
+    _cse1346 = _cse593 + _cse719
+    _cse1347 = 0.5*_cse1346
+    _cse1348 = 0.5*_cse720
+    _cse1349 = _cse596 + _cse721
+    _cse1350 = 0.5*_cse1109 + 0.5*_cse1346 - 0.047708*_cse334 + 2.2659e-5*_cse339 + 0.5*_cse724
+    _cse1351 = 0.5*_cse725
+    _cse1352 = _cse1349 + _cse165 + _cse727
+    _cse1353 = -0.5*_cse1112 + 0.5*_cse129*_cse723 - 0.5*_cse175*_cse723 - 0.051143*_cse334 - 0.5*_cse394*_cse723 + 2.2659e-5*_cse53*_cse81 + 0.5*_cse718*_cse81
+    _cse1354 = 0.5*_cse729
+    _cse1355 = -_cse1114 + _cse115*_cse718 + _cse129*_cse726 + _cse158 - _cse175*_cse726 - _cse224 - _cse394*_cse726
+    _cse1356 = _cse1152 + _cse995
+    _cse1357 = 0.5*_cse1356
+    _cse1358 = _cse1135 + _cse1154 + _cse1356 + 4.5318e-5*_cse751 - 0.095416*_cse755
+    _cse1359 = 0.5*_cse1358
+    _cse1360 = -0.5*_cse1138 + 0.5*_cse129*_cse799 - 0.5*_cse175*_cse799 - 0.5*_cse394*_cse799 + 2.2659e-5*_cse53*_cse750 + 0.5*_cse718*_cse750 - 0.051143*_cse755
+    _cse1361 = 0.5*_cse1153
+    _cse1362 = 0.5*_cse1155
+    _cse1363 = 0.5*_cse1156
+    _cse1364 = _cse1002*_cse1333 + _cse1004*_cse1334 + _cse1323*_cse595 + _cse1324*_cse598 + _cse1325*_cse603 + _cse1326*_cse607 + _cse1327*_cse611 + _cse1328*_cse609 + _cse1332*_cse997
+    _cse1365 = _cse1008*_cse459 - _cse459*_cse765 + _cse746
+    _cse1366 = 0.5*_cse1365
+    _cse1367 = _cse1008*_cse453 - _cse453*_cse765 + _cse748
+    _cse1368 = 0.5*_cse747
+    _cse1369 = 0.5*_cse746
+    _cse1370 = 1.25*_cse746
+    _cse1371 = 1.25*_cse748
+    _cse1372 = _cse1366*_cse234 + _cse1367*_cse195 - _cse1368*_cse228 + _cse1369*_cse171 - _cse1370*_cse168 - _cse1371*_cse155 + _cse146*_cse748 - _cse222*_cse749
+    _cse1373 = _cse1008*_cse757 + _cse1168 - _cse757*_cse765
+    _cse1374 = 0.5*_cse1373
+    _cse1375 = 0.5*_cse1169
+    _cse1376 = 0.5*_cse1168
+    _cse1377 = 1.25*_cse1168
+    _cse1378 = _cse1366*_cse314 + _cse1367*_cse511 - _cse1368*_cse397 + _cse1369*_cse287 - _cse1370*_cse385 - _cse1371*_cse392 + _cse1374*_cse945 - _cse1375*_cse954 + _cse1376*_cse906 - _cse1377*_cse929 + _cse508*_cse748 - _cse531*_cse749
+    _cse1379 = _cse1171 + _cse1173 + _cse1175 + _cse1177 + _cse1343
+    _cse1380 = _cse1366*_cse443 + _cse1367*_cse658 - _cse1368*_cse442 + _cse1369*_cse434 - _cse1370*_cse433 - _cse1371*_cse430 + _cse1374*_cse981 - _cse1375*_cse982 + _cse1376*_cse977 - _cse1377*_cse976 + _cse655*_cse748 - _cse668*_cse749
+    _cse1381 = _cse1375*_cse994
+    _cse1382 = _cse1368*_cse474
+    _cse1383 = _cse714*_cse749
+    _cse1384 = _cse1377*_cse993
+    _cse1385 = _cse1370*_cse464
+    _cse1386 = _cse1371*_cse457
+    _cse1387 = _cse1366*_cse475 + _cse1367*_cse708 + _cse1369*_cse465 + _cse1374*_cse990 + _cse1376*_cse989 + _cse705*_cse748
+    _cse1388 = 0.01*_cse54*_cse632 - 0.01*_cse751
+    _cse1389 = _cse1228*_cse800
+    _cse1390 = 0.5*_cse483
+    _cse1391 = 0.04*_cse54*_cse632 - 0.04*_cse751
+    _cse1392 = _cse1233*_cse800
+    _cse1393 = -_cse1236 - 2*_cse755
+    _cse1394 = _cse1170*_cse817 + _cse1172*_cse793 + _cse1174*_cse1235 + _cse1176*_cse796 + _cse1226*_cse1388 + _cse1231*_cse1391 + _cse1234*_cse483 + _cse1238*_cse1393 + _cse1389 + _cse1390*_cse769 + _cse1392 + _cse166*_cse792 + _cse166*_cse795
+    _cse1395 = _cse1009*_cse1375 + _cse1368*_cse496 + _cse1370*_cse485 + _cse1371*_cse481 + _cse1394 + _cse744*_cse749
+    _cse1396 = _cse1170*_cse821
+    _cse1397 = _cse1174*_cse821
+    _cse1398 = _cse1172*_cse805
+    _cse1399 = _cse1176*_cse805
+    _cse1400 = _cse1251*_cse1388
+    _cse1401 = _cse1251*_cse1391
+    _cse1402 = _cse127*_cse757
+    _cse1403 = _cse1228*_cse1402
+    _cse1404 = _cse1248*_cse1402
+    _cse1405 = _cse1250*_cse459
+    _cse1406 = _cse1405*_cse769
+    _cse1407 = _cse1405*_cse774
+    _cse1408 = _cse127*_cse453
+    _cse1409 = _cse1408*_cse792
+    _cse1410 = _cse1408*_cse803
+    _cse1411 = 0.5*_cse166
+    _cse1412 = _cse800**2
+    _cse1413 = _cse459*_cse641
+    _cse1414 = _cse453*_cse641
+    _cse1415 = _cse1390*_cse811 + _cse1390*_cse812 + _cse1411*_cse816 + _cse1411*_cse818 - _cse1412*_cse641 - _cse1413*_cse458 - _cse1414*_cse452 - _cse756*_cse758
+    _cse1416 = _cse1264 + _cse1415
+    _cse1417 = _cse1250*_cse453
+    _cse1418 = -_cse1272*_cse1393 + _cse1405*_cse811 + _cse1405*_cse812 + _cse1413*_cse646 + _cse1414*_cse804 + _cse1417*_cse816 + _cse1417*_cse818
+    _cse1419 = 1.0*_cse485
+    _cse1420 = 1.0*_cse481
+    _cse1421 = 1.0*_cse496
+    _cse1422 = 1.0*_cse491
+    _cse1423 = -_cse619 - _cse620
+    _cse1424 = _cse1423 + _cse635
+    _cse1425 = _cse1419*_cse296 + _cse1420*_cse343 + _cse1421*_cse322 + _cse1422*_cse352 + _cse1424
+    _cse1426 = _cse1419*_cse429 + _cse1420*_cse431 + _cse1421*_cse436 + _cse1422*_cse441 + _cse1424
+    _cse1427 = _cse1419*_cse455 + _cse1420*_cse469 + _cse1421*_cse470 + _cse1422*_cse476 + _cse1423 + _cse753
+    _cse1428 = -_cse1188 - _cse1190 + _cse1191*_cse195 - _cse1194 - _cse1196 + _cse1208*_cse234 + _cse1210*_cse171 + _cse146*_cse623
+    _cse1429 = 1.0*_cse1009
+    _cse1430 = 1.0*_cse1006
+    _cse1431 = 0.09*_cse0
+    _cse1432 = 0.09*_cse1
+    _cse1433 = -_cse1431*_cse599 - _cse1432*_cse604
+    _cse1434 = _cse1322 + _cse1433
+    _cse1435 = _cse1219 + _cse1433
+    _cse1436 = _cse1419*_cse576 + _cse1420*_cse577 + _cse1421*_cse580 + _cse1422*_cse582 + _cse1429*_cse984 + _cse1430*_cse979
+    _cse1437 = _cse1002*_cse1430 + _cse1004*_cse1429 - _cse1018 - _cse1019 - _cse1337 - _cse1338 + _cse1419*_cse603 + _cse1420*_cse607 + _cse1421*_cse611 + _cse1422*_cse609
+    _cse1438 = _cse1220 + _cse1437
+    _cse1439 = _cse1007*_cse1207 + _cse1191*_cse739 + _cse1208*_cse498 + _cse1210*_cse487 + _cse1240 + _cse623*_cse738
+    _cse1440 = _cse1*_cse127 - _cse225
+    _cse1441 = _cse0*_cse127 - _cse493
+    _cse1442 = 0.025*_cse0*_cse1441 + _cse1440*_cse645
+    _cse1443 = _cse1269 + _cse1442
+    _cse1444 = _cse783 + _cse784
+    _cse1445 = _cse786 + _cse787
+    _cse1446 = 0.5*_cse1445
+    _cse1447 = _cse1444 + _cse227
+    _cse1448 = 0.5*_cse1445 - 0.5*_cse216 + 0.0329105*_cse492 + 2.26465e-5*_cse493 + 0.0329105*_cse494
+    _cse1449 = 0.5*_cse788
+    _cse1450 = 0.5*_cse789
+    _cse1451 = 0.5*_cse1222 + 0.5*_cse175*_cse800 + 0.5*_cse394*_cse800
+    _cse1452 = 0.5*_cse1223
+    _cse1453 = 0.5*_cse1222
+    _cse1454 = 1.25*_cse1222
+    _cse1455 = 2.5*_cse485
+    _cse1456 = 2.5*_cse481
+    _cse1457 = _cse1012*_cse1429 + _cse1239 + _cse1421*_cse626 + _cse1422*_cse624 + _cse1455*_cse625 + _cse1456*_cse623
+    _cse1458 = _cse128*_cse800
+    _cse1459 = 0.5*_cse1441
+    _cse1460 = 0.5*_cse1440
+    _cse1461 = _cse1260*_cse805 + _cse1261*_cse821 + _cse1262*_cse805 + _cse1263*_cse821 + 0.05*_cse127*_cse128*_cse1412 + _cse1459*_cse811 + _cse1459*_cse812 + _cse1460*_cse816 + _cse1460*_cse818
+    _cse1462 = -_cse642 - _cse647
+    _cse1463 = -_cse647 - _cse758
+    _cse1464 = -_cse802 + _cse806
+    _cse1465 = 0.05*_cse173
+    _cse1466 = 0.05*_cse179
+    _cse1467 = _cse1465*_cse291 + _cse1466*_cse280
+    _cse1468 = _cse1183 + _cse1185 + _cse1186
+    _cse1469 = _cse1242 + _cse1243 + _cse1244 + _cse1245 - _cse1247 - _cse1249 - _cse1252 - _cse1253 - _cse1255 - _cse1256 - _cse1258 - _cse1259 - _cse1442
+    _cse1470 = -_cse1274
+    _cse1471 = _cse1396 + _cse1397 + _cse1398 + _cse1399 - _cse1400 - _cse1401 - _cse1403 - _cse1404 - _cse1406 - _cse1407 - _cse1409 - _cse1410 - _cse1442
+    _cse1472 = -_cse1418
+    out = np.empty((6, 36))
+    out[0, 0] = _cse106*_cse114 + _cse114*_cse119 + _cse117*_cse94 + _cse12*_cse14 + _cse139*_cse146 + _cse14*_cse20 + _cse146*_cse168 + _cse15*_cse19 + _cse150*_cse156 + _cse156*_cse171 + _cse16*_cse19 + _cse178*_cse195 + _cse195*_cse228 + _cse215*_cse222 + _cse222*_cse234 + _cse33*_cse41 + _cse41*_cse52 + _cse44*_cse51 + _cse45*_cse51 + _cse74*_cse94
+    out[0, 1] = _cse114*_cse268 - _cse12*_cse403 - _cse146*_cse385 + _cse15*_cse402 + _cse156*_cse287 - _cse195*_cse397 + _cse222*_cse314 - _cse238*_cse404 + _cse242*_cse243 + _cse242*_cse326 + _cse249*_cse51 + _cse276*_cse277 + _cse276*_cse330 + _cse296*_cse297 + _cse296*_cse345 + _cse322*_cse323 + _cse322*_cse354 + _cse324*_cse325 + _cse328*_cse329 + _cse343*_cse344 + _cse352*_cse353 - _cse358*_cse41 - _cse361*_cse362 - _cse370*_cse94 - _cse376*_cse377 - _cse392*_cse393 - _cse400*_cse401 + _cse408
+    out[0, 2] = _cse114*_cse428 - _cse146*_cse433 + _cse156*_cse434 - _cse195*_cse442 + _cse222*_cse443 + _cse243*_cse412 + _cse277*_cse420 + _cse297*_cse429 + _cse323*_cse436 + _cse325*_cse418 + _cse326*_cse412 + _cse329*_cse427 + _cse330*_cse420 + _cse344*_cse431 + _cse345*_cse429 + _cse353*_cse441 + _cse354*_cse436 - _cse362*_cse416 - _cse377*_cse422 - _cse393*_cse430 - _cse401*_cse438 - _cse41*_cse414 + _cse417*_cse51 - _cse424*_cse94
+    out[0, 3] = _cse114*_cse449 - _cse146*_cse464 + _cse156*_cse465 - _cse195*_cse474 + _cse222*_cse475 + _cse277*_cse445 + _cse297*_cse455 + _cse323*_cse470 + _cse329*_cse451 + _cse330*_cse445 + _cse344*_cse469 + _cse345*_cse455 + _cse353*_cse476 + _cse354*_cse470 - _cse377*_cse446 - _cse393*_cse457 - _cse401*_cse471 - _cse448*_cse94
+    out[0, 4] = -_cse146*_cse485 + _cse156*_cse487 - _cse195*_cse496 + _cse222*_cse498 + _cse297*_cse480 + _cse323*_cse490 + _cse344*_cse489 + _cse345*_cse480 + _cse353*_cse500 + _cse354*_cse490 - _cse393*_cse481 - _cse401*_cse491
+    out[0, 5] = 0
+    out[0, 6] = _cse408 + _cse501 + _cse503 + _cse504 + _cse506 + _cse507 + _cse509 + _cse510 + _cse512 - _cse513 + _cse532
+    out[0, 7] = -5.7*_cse18*_cse534 + _cse325*_cse535 + _cse326*_cse536 + _cse329*_cse538 + _cse330*_cse537 + _cse344*_cse553 + _cse345*_cse552 + _cse353*_cse555 + _cse354*_cse554 + _cse404*_cse548 - _cse556 - _cse557 - _cse558 - _cse559 - _cse560 - _cse561 - _cse562 - _cse563 + _cse564
+    out[0, 8] = _cse583 + _cse592
+    out[0, 9] = _cse612 + _cse613
+    out[0, 10] = _cse480*_cse586 + _cse487*_cse527 + _cse490*_cse587 + _cse498*_cse531 - _cse614 - _cse615 - _cse616 - _cse617 + _cse637
+    out[0, 11] = _cse648
+    out[0, 12] = _cse649 + _cse650 + _cse651 + _cse653 + _cse654 + _cse656 + _cse657 + _cse659 + _cse669
+    out[0, 13] = _cse583 + _cse670
+    out[0, 14] = _cse325*_cse675 + _cse326*_cse673 + _cse329*_cse676 + _cse330*_cse677 + _cse344*_cse679 + _cse345*_cse678 + _cse353*_cse681 + _cse354*_cse680 - _cse682 - _cse683 - _cse684 - _cse685 - _cse686 - _cse687 - _cse688 - _cse689 + _cse690
+    out[0, 15] = _cse612 + _cse697
+    out[0, 16] = _cse480*_cse692 + _cse487*_cse665 + _cse490*_cse693 + _cse498*_cse668 + _cse637 - _cse698 - _cse699 - _cse700 - _cse701
+    out[0, 17] = _cse648
+    out[0, 18] = _cse702 + _cse703 + _cse704 + _cse706 + _cse707 + _cse709 + _cse715
+    out[0, 19] = _cse612 + _cse716
+    out[0, 20] = _cse612 + _cse717
+    out[0, 21] = _cse329*_cse722 + _cse330*_cse720 + _cse344*_cse728 + _cse345*_cse725 + _cse353*_cse730 + _cse354*_cse729 - _cse731 - _cse732 - _cse733 - _cse734 - _cse735 - _cse736 + _cse737
+    out[0, 22] = _cse487*_cse712 + _cse498*_cse714 + _cse621 + _cse711*_cse738 + _cse713*_cse739 - _cse740 - _cse742 - _cse743 - _cse745 + _cse754
+    out[0, 23] = _cse647 + _cse759
+    out[0, 24] = _cse760 + _cse761 + _cse762 + _cse763 + _cse767
+    out[0, 25] = _cse768 + _cse780
+    out[0, 26] = _cse780 + _cse781
+    out[0, 27] = _cse754 + _cse779 + _cse782
+    out[0, 28] = 1.0*_cse155*_cse785 + 1.0*_cse168*_cse788 + 1.0*_cse221*_cse790 + 1.0*_cse228*_cse789 + 0.5*_cse480*_cse764 + 0.5*_cse481*_cse487 + 0.5*_cse490*_cse766 + 0.5*_cse491*_cse498 - _cse798
+    out[0, 29] = -_cse802 - _cse806
+    out[0, 30] = 0
+    out[0, 31] = _cse814
+    out[0, 32] = _cse814
+    out[0, 33] = _cse815
+    out[0, 34] = -_cse820
+    out[0, 35] = -_cse823
+    out[1, 0] = _cse106*_cse827 + _cse145*_cse828 - 1.0*_cse15*_cse238 + _cse150*_cse829 + _cse194*_cse830 + _cse215*_cse831 + _cse40*_cse824 + _cse405 + _cse407 + _cse44*_cse825 - _cse501 - _cse503 - _cse504 - _cse506 - _cse507 - _cse509 - _cse510 - _cse512 + _cse513 + _cse532 + _cse826*_cse93
+    out[1, 1] = _cse556 + _cse557 + _cse558 + _cse559 + _cse560 + _cse561 + _cse562 + _cse563 + _cse564
+    out[1, 2] = _cse592 + _cse832
+    out[1, 3] = _cse613 + _cse833
+    out[1, 4] = 0.5*_cse392*_cse487 + 0.5*_cse400*_cse498 + 0.5*_cse480*_cse526 + 0.5*_cse490*_cse530 - _cse614 - _cse615 - _cse616 - _cse617 - _cse835
+    out[1, 5] = _cse836
+    out[1, 6] = -_cse114*_cse538 - _cse117*_cse843 + _cse119*_cse842 - _cse14*_cse534 + _cse146*_cse845 - _cse156*_cse553 + 0.5*_cse16*_cse548 - _cse168*_cse853 + _cse171*_cse852 + _cse195*_cse854 - 2.85*_cse20*_cse548 - _cse222*_cse555 - _cse228*_cse856 + _cse234*_cse855 + _cse242*_cse824 + _cse276*_cse826 + _cse296*_cse828 + _cse322*_cse830 + _cse324*_cse825 + _cse328*_cse827 + _cse343*_cse829 + _cse352*_cse831 + _cse406*_cse534 + _cse41*_cse837 + _cse45*_cse839 - _cse51*_cse535 - _cse52*_cse840 + _cse841*_cse94
+    out[1, 7] = _cse0**2*_cse858 + _cse1**2*_cse858 - 0.5*_cse237*(-1.211535*_cse6 + 0.005668422*_cse8) + _cse249*_cse839 + _cse268*_cse842 + _cse287*_cse852 + _cse314*_cse855 + _cse358*_cse840 + _cse370*_cse843 + _cse385*_cse853 + _cse397*_cse856 + _cse502*_cse837 + _cse505*_cse841 + _cse508*_cse845 + _cse511*_cse854 + _cse515*_cse535 + _cse519*_cse538 + _cse527*_cse553 + _cse531*_cse555 + 0.5*_cse533*(-0.005668422*_cse6 - 1.211535*_cse8) + _cse860*_cse864 + _cse866*_cse869 + _cse876*_cse883 + _cse889*_cse898 + _cse906*_cse921 + _cse929*_cse936 + _cse945*_cse950 + _cse954*_cse964
+    out[1, 8] = -_cse414*_cse840 + _cse417*_cse839 - _cse424*_cse843 + _cse428*_cse842 - _cse433*_cse853 + _cse434*_cse852 - _cse442*_cse856 + _cse443*_cse855 - _cse535*_cse588 - _cse538*_cse663 - _cse553*_cse665 - _cse555*_cse668 + _cse568*_cse825 + _cse570*_cse824 + _cse573*_cse827 + _cse575*_cse826 + _cse576*_cse828 + _cse577*_cse829 + _cse580*_cse830 + _cse582*_cse831 + _cse584*_cse837 + _cse652*_cse841 + _cse655*_cse845 + _cse658*_cse854 + _cse864*_cse966 - _cse869*_cse965 + _cse883*_cse971 - _cse898*_cse970 + _cse921*_cse977 - _cse936*_cse976 + _cse950*_cse981 - _cse964*_cse982 + 1.0*_cse969 + _cse973*_cse974 + _cse979*_cse980 + _cse984*_cse985
+    out[1, 9] = _cse1005 - _cse448*_cse843 + _cse449*_cse842 - _cse464*_cse853 + _cse465*_cse852 - _cse474*_cse856 + _cse475*_cse855 - _cse538*_cse694 - _cse553*_cse712 - _cse555*_cse714 + _cse691*_cse841 + _cse705*_cse845 + _cse708*_cse854 + _cse883*_cse987 - _cse898*_cse991 + _cse921*_cse989 - _cse936*_cse993 + _cse950*_cse990 - _cse964*_cse994
+    out[1, 10] = -_cse1006*_cse936 + _cse1007*_cse950 - _cse1009*_cse964 + _cse1010*_cse920 + _cse1037 - _cse485*_cse853 + _cse487*_cse852 - _cse496*_cse856 + _cse498*_cse855 - _cse553*_cse741 - _cse555*_cse744 + _cse738*_cse845 + _cse739*_cse854
+    out[1, 11] = 0
+    out[1, 12] = _cse1058 + _cse832
+    out[1, 13] = _cse1059 + _cse1060 + _cse1061 + _cse1063 + _cse1064 + _cse1065 + _cse1067 + _cse1068 + _cse1069 + _cse1071 + _cse1072 + _cse1073 + _cse1082
+    out[1, 14] = 1.0*_cse1084 + _cse1086*_cse974 + _cse1087*_cse980 + _cse1088*_cse985 - _cse1090 - _cse1091 - _cse1092 - _cse1093 - _cse1094 - _cse1095 - _cse1096 - _cse1097 - _cse1098 - _cse1099 - _cse1100 - _cse1101 + _cse1102 + _cse673*_cse824 + _cse675*_cse825 + _cse676*_cse827 + _cse677*_cse826 + _cse678*_cse828 + _cse679*_cse829 + _cse680*_cse830 + _cse681*_cse831
+    out[1, 15] = _cse1005 + _cse1103
+    out[1, 16] = _cse1037 + _cse1104
+    out[1, 17] = 0
+    out[1, 18] = _cse1119 + _cse833
+    out[1, 19] = _cse1121 + _cse1122 + _cse1123 + _cse1125 + _cse1126 + _cse1127 + _cse1129 + _cse1130 + _cse1131 + _cse1140
+    out[1, 20] = _cse1005 + _cse1151
+    out[1, 21] = _cse1153*_cse974 + _cse1155*_cse980 + _cse1156*_cse985 + _cse1167 + _cse720*_cse826 + _cse722*_cse827 + _cse725*_cse828 + _cse728*_cse829 + _cse729*_cse830 + _cse730*_cse831
+    out[1, 22] = _cse1179 + _cse1181
+    out[1, 23] = _cse1187
+    out[1, 24] = -_cse1197 - _cse835
+    out[1, 25] = _cse1199 + _cse1200 + _cse1201 + _cse1203 + _cse1204 + _cse1205 + _cse1211
+    out[1, 26] = _cse1016 + _cse1219
+    out[1, 27] = _cse1179 + _cse1221
+    out[1, 28] = 1.0*_cse1223*_cse954 - _cse1241 + 1.0*_cse385*_cse788 + 1.0*_cse392*_cse785 + 1.0*_cse397*_cse789 + 1.0*_cse400*_cse790 + 2.5*_cse477*_cse800*_cse929
+    out[1, 29] = _cse1265
+    out[1, 30] = _cse836
+    out[1, 31] = 0
+    out[1, 32] = 0
+    out[1, 33] = _cse1187
+    out[1, 34] = _cse1271
+    out[1, 35] = _cse1274
+    out[2, 0] = _cse106*_cse1278 + _cse1275*_cse40 + _cse1276*_cse44 + _cse1277*_cse93 + _cse1279*_cse150 + _cse1280*_cse145 + _cse1281*_cse215 + _cse1282*_cse194 - _cse649 - _cse650 - _cse651 - _cse653 - _cse654 - _cse656 - _cse657 - _cse659 + _cse669
+    out[2, 1] = _cse1283 + _cse670
+    out[2, 2] = _cse682 + _cse683 + _cse684 + _cse685 + _cse686 + _cse687 + _cse688 + _cse689 + _cse690
+    out[2, 3] = _cse1284 + _cse697
+    out[2, 4] = -_cse1285 + 0.5*_cse430*_cse487 + 0.5*_cse438*_cse498 + 0.5*_cse480*_cse664 + 0.5*_cse490*_cse667 - _cse698 - _cse699 - _cse700 - _cse701
+    out[2, 5] = _cse836
+    out[2, 6] = _cse1058 + _cse1283
+    out[2, 7] = -_cse1059 - _cse1060 - _cse1061 - _cse1063 - _cse1064 - _cse1065 - _cse1067 - _cse1068 - _cse1069 - _cse1071 - _cse1072 - _cse1073 + _cse1082 + _cse1275*_cse536 + _cse1276*_cse535 + _cse1277*_cse537 + _cse1278*_cse538 + _cse1279*_cse553 + _cse1280*_cse552 + _cse1281*_cse555 + _cse1282*_cse554 + _cse1286*_cse897 + _cse1287*_cse935 + _cse1288*_cse963 + 1.0*_cse868*_cse965
+    out[2, 8] = _cse1090 + _cse1091 + _cse1092 + _cse1093 + _cse1094 + _cse1095 + _cse1096 + _cse1097 + _cse1098 + _cse1099 + _cse1100 + _cse1101 + _cse1102
+    out[2, 9] = _cse1103 + _cse1289
+    out[2, 10] = _cse1104 + _cse1294
+    out[2, 11] = 0
+    out[2, 12] = -_cse114*_cse676 - _cse117*_cse1302 + _cse119*_cse1301 + _cse1275*_cse412 + _cse1276*_cse418 + _cse1277*_cse420 + _cse1278*_cse427 + _cse1279*_cse431 + _cse1280*_cse429 + _cse1281*_cse441 + _cse1282*_cse436 + _cse1296*_cse45 + _cse1297*_cse41 - _cse1298*_cse52 + _cse1299*_cse94 + _cse1304*_cse146 + _cse1306*_cse171 - _cse1307*_cse168 + _cse1308*_cse195 + _cse1309*_cse234 - _cse1310*_cse228 - _cse156*_cse679 - _cse222*_cse681 - _cse51*_cse675
+    out[2, 13] = -0.5*_cse1084 + 1.0*_cse1089 + _cse1275*_cse570 + _cse1276*_cse568 + _cse1277*_cse575 + _cse1278*_cse573 + _cse1279*_cse577 + _cse1280*_cse576 + _cse1281*_cse582 + _cse1282*_cse580 + _cse1286*_cse973 + _cse1287*_cse979 + _cse1288*_cse984 + _cse1296*_cse249 + _cse1297*_cse502 - _cse1298*_cse358 + _cse1299*_cse505 + _cse1301*_cse268 - _cse1302*_cse370 + _cse1304*_cse508 + _cse1306*_cse287 - _cse1307*_cse385 + _cse1308*_cse511 + _cse1309*_cse314 - _cse1310*_cse397 + _cse1311*_cse860 + _cse1313*_cse876 - _cse1314*_cse889 + _cse1316*_cse906 - _cse1317*_cse929 + _cse1318*_cse945 - _cse1319*_cse954 - _cse515*_cse675 - _cse519*_cse676 - _cse527*_cse679 - _cse531*_cse681
+    out[2, 14] = 0.5*_cse1083*_cse965 + _cse1296*_cse417 + _cse1297*_cse584 + _cse1298*_cse414 + _cse1299*_cse652 + _cse1301*_cse428 + _cse1302*_cse424 + _cse1304*_cse655 + _cse1306*_cse434 + _cse1307*_cse433 + _cse1308*_cse658 + _cse1309*_cse443 + _cse1310*_cse442 + _cse1311*_cse966 + _cse1313*_cse971 + _cse1314*_cse970 + _cse1316*_cse977 + _cse1317*_cse976 + _cse1318*_cse981 + _cse1319*_cse982 + _cse588*_cse675 + _cse663*_cse676 + _cse665*_cse679 + _cse668*_cse681
+    out[2, 15] = _cse1289 + _cse1299*_cse691 + _cse1301*_cse449 - _cse1302*_cse448 + _cse1304*_cse705 + _cse1306*_cse465 - _cse1307*_cse464 + _cse1308*_cse708 + _cse1309*_cse475 - _cse1310*_cse474 + _cse1313*_cse987 - _cse1314*_cse991 + _cse1316*_cse989 - _cse1317*_cse993 + _cse1318*_cse990 - _cse1319*_cse994 - _cse676*_cse694 - _cse679*_cse712 - _cse681*_cse714
+    out[2, 16] = -_cse1006*_cse1317 + _cse1007*_cse1318 - _cse1009*_cse1319 + _cse1010*_cse1315 + _cse1294 + _cse1304*_cse738 + _cse1306*_cse487 - _cse1307*_cse485 + _cse1308*_cse739 + _cse1309*_cse498 - _cse1310*_cse496 - _cse679*_cse741 - _cse681*_cse744
+    out[2, 17] = 0
+    out[2, 18] = _cse1119 + _cse1284
+    out[2, 19] = _cse1289 + _cse1320
+    out[2, 20] = _cse1141 + _cse1142 + _cse1143 + _cse1144 + _cse1145 + _cse1146 + _cse1147 + _cse1148 + _cse1149 + _cse1150
+    out[2, 21] = _cse1153*_cse1286 + _cse1155*_cse1287 + _cse1156*_cse1288 + _cse1167 + _cse1277*_cse720 + _cse1278*_cse722 + _cse1279*_cse728 + _cse1280*_cse725 + _cse1281*_cse730 + _cse1282*_cse729
+    out[2, 22] = _cse1181 + _cse1321
+    out[2, 23] = _cse1187
+    out[2, 24] = -_cse1197 - _cse1285
+    out[2, 25] = _cse1293 + _cse1322
+    out[2, 26] = _cse1212 + _cse1213 + _cse1214 + _cse1215 + _cse1216 + _cse1217 + _cse1218
+    out[2, 27] = _cse1221 + _cse1321
+    out[2, 28] = 1.0*_cse1223*_cse982 - _cse1241 + 1.0*_cse430*_cse785 + 1.0*_cse433*_cse788 + 1.0*_cse438*_cse790 + 1.0*_cse442*_cse789 + 2.5*_cse477*_cse800*_cse976
+    out[2, 29] = _cse1265
+    out[2, 30] = _cse836
+    out[2, 31] = 0
+    out[2, 32] = 0
+    out[2, 33] = _cse1187
+    out[2, 34] = _cse1271
+    out[2, 35] = _cse1274
+    out[3, 0] = _cse106*_cse1324 + _cse1323*_cse93 + _cse1325*_cse145 + _cse1326*_cse150 + _cse1327*_cse194 + _cse1328*_cse215 - _cse702 - _cse703 - _cse704 - _cse706 - _cse707 - _cse709 + _cse715
+    out[3, 1] = _cse1329 + _cse716
+    out[3, 2] = _cse1330 + _cse717
+    out[3, 3] = _cse731 + _cse732 + _cse733 + _cse734 + _cse735 + _cse736 + _cse737
+    out[3, 4] = 0.5*_cse457*_cse487 + 1.0*_cse457*_cse489 + 1.0*_cse464*_cse480 + 0.5*_cse471*_cse498 + 1.0*_cse471*_cse500 + 1.0*_cse474*_cse490 + 0.5*_cse480*_cse711 + 0.5*_cse490*_cse713 - _cse740 - _cse742 - _cse743 - _cse745 - _cse753 - _cse779
+    out[3, 5] = _cse1331
+    out[3, 6] = _cse1119 + _cse1329
+    out[3, 7] = _cse1320 + _cse1323*_cse537 + _cse1324*_cse538 + _cse1325*_cse552 + _cse1326*_cse553 + _cse1327*_cse554 + _cse1328*_cse555 + _cse1332*_cse897 + _cse1333*_cse935 + _cse1334*_cse963
+    out[3, 8] = _cse1151 + _cse1335
+    out[3, 9] = _cse1336
+    out[3, 10] = _cse1344
+    out[3, 11] = _cse1345
+    out[3, 12] = _cse1119 + _cse1330
+    out[3, 13] = _cse1320 + _cse1335
+    out[3, 14] = _cse1086*_cse1332 + _cse1087*_cse1333 + _cse1088*_cse1334 + _cse1151 + _cse1323*_cse677 + _cse1324*_cse676 + _cse1325*_cse678 + _cse1326*_cse679 + _cse1327*_cse680 + _cse1328*_cse681
+    out[3, 15] = _cse1336
+    out[3, 16] = _cse1344
+    out[3, 17] = _cse1345
+    out[3, 18] = -_cse114*_cse722 - _cse117*_cse1348 + _cse119*_cse1347 + _cse1323*_cse445 + _cse1324*_cse451 + _cse1325*_cse455 + _cse1326*_cse469 + _cse1327*_cse470 + _cse1328*_cse476 + _cse1349*_cse94 + _cse1350*_cse171 - _cse1351*_cse168 + _cse1352*_cse146 + _cse1353*_cse234 - _cse1354*_cse228 + _cse1355*_cse195 - _cse156*_cse728 - _cse222*_cse730
+    out[3, 19] = _cse1347*_cse268 - _cse1348*_cse370 + _cse1349*_cse505 + _cse1350*_cse287 - _cse1351*_cse385 + _cse1352*_cse508 + _cse1353*_cse314 - _cse1354*_cse397 + _cse1355*_cse511 + _cse1357*_cse876 + _cse1359*_cse906 + _cse1360*_cse945 - _cse1361*_cse889 - _cse1362*_cse929 - _cse1363*_cse954 + _cse1364 - _cse519*_cse722 - _cse527*_cse728 - _cse531*_cse730
+    out[3, 20] = _cse1347*_cse428 - _cse1348*_cse424 + _cse1349*_cse652 + _cse1350*_cse434 - _cse1351*_cse433 + _cse1352*_cse655 + _cse1353*_cse443 - _cse1354*_cse442 + _cse1355*_cse658 + _cse1357*_cse971 + _cse1359*_cse977 + _cse1360*_cse981 - _cse1361*_cse970 - _cse1362*_cse976 - _cse1363*_cse982 + _cse1364 - _cse663*_cse722 - _cse665*_cse728 - _cse668*_cse730
+    out[3, 21] = _cse1347*_cse449 + _cse1348*_cse448 + _cse1349*_cse691 + _cse1350*_cse465 + _cse1351*_cse464 + _cse1352*_cse705 + _cse1353*_cse475 + _cse1354*_cse474 + _cse1355*_cse708 + _cse1357*_cse987 + _cse1359*_cse989 + _cse1360*_cse990 + _cse1361*_cse991 + _cse1362*_cse993 + _cse1363*_cse994 + _cse694*_cse722 + _cse712*_cse728 + _cse714*_cse730
+    out[3, 22] = -_cse1006*_cse1362 + _cse1007*_cse1360 - _cse1009*_cse1363 + _cse1010*_cse1358 + _cse1168*_cse1340 + _cse1169*_cse1334 + _cse1178 + _cse1327*_cse747 + _cse1328*_cse749 + _cse1339 + _cse1341*_cse748 + _cse1342*_cse746 + _cse1350*_cse487 - _cse1351*_cse485 + _cse1352*_cse738 + _cse1353*_cse498 - _cse1354*_cse496 + _cse1355*_cse739 - _cse728*_cse741 - _cse730*_cse744
+    out[3, 23] = 0
+    out[3, 24] = _cse1325*_cse480 + _cse1326*_cse489 + _cse1327*_cse490 + _cse1328*_cse500 + _cse1372 - _cse634 + _cse752 - _cse771 - _cse773 - _cse776 - _cse778
+    out[3, 25] = _cse1378 + _cse1379
+    out[3, 26] = _cse1379 + _cse1380
+    out[3, 27] = _cse1381 + _cse1382 + _cse1383 + _cse1384 + _cse1385 + _cse1386 + _cse1387
+    out[3, 28] = 0.5*_cse1007*_cse1373 + 1.0*_cse1223*_cse994 + 2.5*_cse1224*_cse757*_cse800 + 0.5*_cse135*_cse453*_cse480 + 0.5*_cse135*_cse459*_cse487 + 0.5*_cse1365*_cse498 + 0.5*_cse1367*_cse490 - _cse1395 + 1.0*_cse457*_cse785 + 1.0*_cse464*_cse788 + 1.0*_cse471*_cse790 + 1.0*_cse474*_cse789 + 2.5*_cse477*_cse800*_cse993
+    out[3, 29] = -_cse1264 - _cse1396 - _cse1397 - _cse1398 - _cse1399 + _cse1400 + _cse1401 + _cse1403 + _cse1404 + _cse1406 + _cse1407 + _cse1409 + _cse1410
+    out[3, 30] = _cse1331
+    out[3, 31] = _cse1345
+    out[3, 32] = _cse1345
+    out[3, 33] = 0
+    out[3, 34] = -_cse1416
+    out[3, 35] = _cse1418
+    out[4, 0] = _cse1419*_cse145 + _cse1420*_cse150 + _cse1421*_cse194 + _cse1422*_cse215 - _cse760 - _cse761 - _cse762 - _cse763 + _cse767
+    out[4, 1] = _cse1425 + _cse768
+    out[4, 2] = _cse1426 + _cse781
+    out[4, 3] = _cse1427 + _cse782
+    out[4, 4] = _cse487*_cse741 + _cse498*_cse744 + _cse738*_cse764 + _cse739*_cse766 + _cse798
+    out[4, 5] = _cse820
+    out[4, 6] = _cse1425 + _cse1428
+    out[4, 7] = _cse1419*_cse552 + _cse1420*_cse553 + _cse1421*_cse554 + _cse1422*_cse555 + _cse1429*_cse963 + _cse1430*_cse935 + _cse1434
+    out[4, 8] = _cse1435 + _cse1436
+    out[4, 9] = _cse1438
+    out[4, 10] = _cse1439
+    out[4, 11] = _cse1443
+    out[4, 12] = _cse1426 + _cse1428
+    out[4, 13] = _cse1434 + _cse1436
+    out[4, 14] = _cse1087*_cse1430 + _cse1088*_cse1429 + _cse1419*_cse678 + _cse1420*_cse679 + _cse1421*_cse680 + _cse1422*_cse681 + _cse1435
+    out[4, 15] = _cse1438
+    out[4, 16] = _cse1439
+    out[4, 17] = _cse1443
+    out[4, 18] = _cse1372 + _cse1427
+    out[4, 19] = _cse1378 + _cse1437
+    out[4, 20] = _cse1380 + _cse1437
+    out[4, 21] = _cse1155*_cse1430 + _cse1156*_cse1429 - _cse1381 - _cse1382 - _cse1383 - _cse1384 - _cse1385 - _cse1386 + _cse1387 + _cse1419*_cse725 + _cse1420*_cse728 + _cse1421*_cse729 + _cse1422*_cse730 - _cse1431*_cse483 - _cse1432*_cse166
+    out[4, 22] = _cse1007*_cse1374 + _cse1366*_cse498 + _cse1367*_cse739 + _cse1369*_cse487 + _cse1395 + _cse738*_cse748
+    out[4, 23] = _cse1415 + _cse1442
+    out[4, 24] = _cse1419*_cse480 + _cse1420*_cse489 + _cse1421*_cse490 + _cse1422*_cse500 + _cse1444*_cse146 + _cse1446*_cse171 + _cse1447*_cse195 + _cse1448*_cse234 - _cse1449*_cse168 - _cse1450*_cse228 - _cse156*_cse785 - _cse222*_cse790 + _cse797
+    out[4, 25] = _cse1444*_cse508 + _cse1446*_cse287 + _cse1447*_cse511 + _cse1448*_cse314 - _cse1449*_cse385 - _cse1450*_cse397 + _cse1451*_cse945 - _cse1452*_cse954 + _cse1453*_cse906 - _cse1454*_cse929 + _cse1457 - _cse527*_cse785 - _cse531*_cse790
+    out[4, 26] = _cse1444*_cse655 + _cse1446*_cse434 + _cse1447*_cse658 + _cse1448*_cse443 - _cse1449*_cse433 - _cse1450*_cse442 + _cse1451*_cse981 - _cse1452*_cse982 + _cse1453*_cse977 - _cse1454*_cse976 + _cse1457 - _cse665*_cse785 - _cse668*_cse790
+    out[4, 27] = _cse1169*_cse1429 + _cse1394 + _cse1421*_cse747 + _cse1422*_cse749 + _cse1444*_cse705 + _cse1446*_cse465 + _cse1447*_cse708 + _cse1448*_cse475 - _cse1449*_cse464 - _cse1450*_cse474 + _cse1451*_cse990 - _cse1452*_cse994 + _cse1453*_cse989 - _cse1454*_cse993 + _cse1455*_cse746 + _cse1456*_cse748 - _cse712*_cse785 - _cse714*_cse790
+    out[4, 28] = _cse1007*_cse1451 + _cse1009*_cse1452 + 1.25*_cse135*_cse1412*(-0.0072182*_cse127 - 0.00010018*_cse128) + _cse1444*_cse738 + _cse1446*_cse487 + _cse1447*_cse739 + _cse1448*_cse498 + _cse1449*_cse485 + _cse1450*_cse496 + _cse741*_cse785 + _cse744*_cse790
+    out[4, 29] = _cse1248*_cse1458 + _cse1260*_cse793 + _cse1261*_cse817 + _cse1262*_cse793 + _cse1263*_cse817 + _cse128*_cse1389 - _cse1440*_cse792 - _cse1440*_cse803 - _cse1459*_cse769 - _cse1459*_cse774 - _cse756*_cse802
+    out[4, 30] = _cse820
+    out[4, 31] = _cse1270
+    out[4, 32] = _cse1270
+    out[4, 33] = _cse1416
+    out[4, 34] = 0
+    out[4, 35] = -_cse1461
+    out[5, 0] = 0
+    out[5, 1] = _cse1462
+    out[5, 2] = _cse1462
+    out[5, 3] = _cse1463
+    out[5, 4] = _cse1464
+    out[5, 5] = _cse823
+    out[5, 6] = _cse1462
+    out[5, 7] = _cse1467
+    out[5, 8] = _cse1467
+    out[5, 9] = _cse1468
+    out[5, 10] = _cse1469
+    out[5, 11] = _cse1470
+    out[5, 12] = _cse1462
+    out[5, 13] = _cse1467
+    out[5, 14] = _cse1467
+    out[5, 15] = _cse1468
+    out[5, 16] = _cse1469
+    out[5, 17] = _cse1470
+    out[5, 18] = _cse1463
+    out[5, 19] = _cse1468
+    out[5, 20] = _cse1468
+    out[5, 21] = _cse1465*_cse453 + _cse1466*_cse459
+    out[5, 22] = _cse1471
+    out[5, 23] = _cse1472
+    out[5, 24] = _cse1464
+    out[5, 25] = _cse1469
+    out[5, 26] = _cse1469
+    out[5, 27] = _cse1471
+    out[5, 28] = -1.0*_cse1227*_cse1458 + _cse1234*_cse1441 - _cse128*_cse1392 + 1.0*_cse1440*_cse791 + _cse1440*_cse795 + 1.0*_cse1441*_cse769
+    out[5, 29] = _cse1461
+    out[5, 30] = _cse823
+    out[5, 31] = _cse1470
+    out[5, 32] = _cse1470
+    out[5, 33] = _cse1472
+    out[5, 34] = _cse1461
+    out[5, 35] = 0
+    return out
+
+
+# joint0[0,0,0]_Tx
+def function3(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0.0231501000000000
+    out[3, 0] = 1
+    return out
+
+
+# joint0[0,0,0]_J
+def function4(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint0[0,0,0]_dJ
+def function5(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint1[0,0,0]_Tx
+def function6(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((4, 1))
+    out[0, 0] = -1.6491e-5*_cse0 - 0.0702991*_cse1
+    out[1, 0] = -0.0702991*_cse0 + 1.6491e-5*_cse1
+    out[2, 0] = 0.0892006000000000
+    out[3, 0] = 1
+    return out
+
+
+# joint1[0,0,0]_J
+def function7(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = 0.0702991*_cse0 - 1.6491e-5*_cse1
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -1.6491e-5*_cse0 - 0.0702991*_cse1
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse1
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint1[0,0,0]_dJ
+def function8(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = dq0*(1.6491e-5*_cse0 + 0.0702991*_cse1)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = dq0*(0.0702991*_cse0 - 1.6491e-5*_cse1)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse0*dq0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1*dq0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint2[0,0,0]_Tx
+def function9(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 0.00011502*_cse4
+    _cse6 = _cse3 - 0.00099446*_cse4
+    out = np.empty((4, 1))
+    out[0, 0] = -_cse0*_cse3 - _cse0*_cse5 - _cse0*_cse6 - 1.6491e-5*_cse0 - 0.0702981*_cse1
+    out[1, 0] = -0.0702981*_cse0 + _cse1*_cse3 + _cse1*_cse5 + _cse1*_cse6 + 1.6491e-5*_cse1
+    out[2, 0] = 0.00087944*_cse2 + 0.4251*_cse4 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# joint2[0,0,0]_J
+def function10(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 0.00011502*_cse4
+    _cse6 = _cse3 - 0.00099446*_cse4
+    _cse7 = 0.21255*_cse4
+    _cse8 = 0.00099446*_cse2 + _cse7
+    _cse9 = -_cse1
+    _cse10 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = 0.0702981*_cse0 - _cse1*_cse3 - _cse1*_cse5 - _cse1*_cse6 - 1.6491e-5*_cse1
+    out[0, 1] = 0.00011502*_cse0*_cse2 - _cse0*_cse7 - _cse0*_cse8
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -_cse0*_cse3 - _cse0*_cse5 - _cse0*_cse6 - 1.6491e-5*_cse0 - 0.0702981*_cse1
+    out[1, 1] = -0.00011502*_cse1*_cse2 + _cse1*_cse7 + _cse1*_cse8
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -0.4251*_cse2 + 0.00087944*_cse4
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse9
+    out[3, 2] = _cse9
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse10
+    out[4, 2] = _cse10
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint2[0,0,0]_dJ
+def function11(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q1)
+    _cse1 = math.cos(q0)
+    _cse2 = math.cos(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = 0.00099446*_cse0 + _cse3
+    _cse5 = 0.00011502*_cse0*_cse1 - _cse1*_cse3 - _cse1*_cse4
+    _cse6 = math.sin(q0)
+    _cse7 = 0.21255*_cse0
+    _cse8 = -0.00099446*_cse2 + _cse7
+    _cse9 = 0.00011502*_cse2
+    _cse10 = _cse6*_cse7 + _cse6*_cse9
+    _cse11 = -_cse8
+    _cse12 = 0.00011502*_cse0*_cse6 - _cse3*_cse6 - _cse4*_cse6
+    _cse13 = _cse1*_cse7 + _cse1*_cse9
+    _cse14 = _cse6*dq0
+    _cse15 = -_cse1*dq0
+    out = np.empty((6, 6))
+    out[0, 0] = _cse5*dq1 + dq0*(0.0702981*_cse1 + _cse10 + _cse6*_cse8 + 1.6491e-5*_cse6)
+    out[0, 1] = _cse5*dq0 + dq1*(_cse10 - _cse11*_cse6)
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse12*dq1 + dq0*(-_cse1*_cse8 - 1.6491e-5*_cse1 - _cse13 + 0.0702981*_cse6)
+    out[1, 1] = _cse12*dq0 + dq1*(_cse1*_cse11 - _cse13)
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = dq1*(-0.00087944*_cse0 - 0.4251*_cse2)
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse14
+    out[3, 2] = _cse14
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse15
+    out[4, 2] = _cse15
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint3[0,0,0]_Tx
+def function12(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = 1.6153e-5*_cse6
+    _cse8 = _cse0*_cse2
+    _cse9 = math.cos(q2)
+    _cse10 = 0.20538*_cse9
+    _cse11 = 0.20538*_cse6
+    _cse12 = _cse3 - 0.00099446*_cse4
+    _cse13 = -0.00067934*_cse6 + 0.18677*_cse9
+    _cse14 = _cse13*_cse2
+    _cse15 = 0.18677*_cse6 + 0.00067934*_cse9
+    _cse16 = _cse1*_cse4
+    _cse17 = _cse1*_cse2
+    _cse18 = 1.6153e-5*_cse9
+    out = np.empty((4, 1))
+    out[0, 0] = -_cse0*_cse12 - _cse0*_cse14 - _cse0*_cse3 + 1.6153e-5*_cse0*_cse4*_cse9 - 1.6491e-5*_cse0 - 0.0702981*_cse1 - _cse10*_cse8 - _cse11*_cse5 - _cse15*_cse5 - 0.00011502*_cse5 - _cse7*_cse8
+    out[1, 0] = -0.0702981*_cse0 + _cse1*_cse12 + _cse1*_cse14 + _cse1*_cse3 + 1.6491e-5*_cse1 + _cse10*_cse17 + _cse11*_cse16 + _cse15*_cse16 - _cse16*_cse18 + 0.00011502*_cse16 + _cse17*_cse7
+    out[2, 0] = _cse10*_cse4 - _cse11*_cse2 + _cse13*_cse4 - _cse15*_cse2 + _cse18*_cse2 + 0.00087944*_cse2 + _cse4*_cse7 + 0.4251*_cse4 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# joint3[0,0,0]_J
+def function13(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 0.00011502*_cse4
+    _cse6 = _cse1*_cse2
+    _cse7 = math.sin(q2)
+    _cse8 = 1.6153e-5*_cse7
+    _cse9 = math.cos(q2)
+    _cse10 = 0.20538*_cse9
+    _cse11 = 0.20538*_cse7
+    _cse12 = _cse11*_cse4
+    _cse13 = _cse3 - 0.00099446*_cse4
+    _cse14 = -0.00067934*_cse7 + 0.18677*_cse9
+    _cse15 = _cse14*_cse2
+    _cse16 = 0.18677*_cse7 + 0.00067934*_cse9
+    _cse17 = _cse16*_cse4
+    _cse18 = 0.21255*_cse4
+    _cse19 = _cse18 + 0.00099446*_cse2
+    _cse20 = _cse14*_cse4
+    _cse21 = 0.20538*_cse4*_cse9
+    _cse22 = _cse4*_cse8
+    _cse23 = _cse0*_cse2
+    _cse24 = 1.6153e-5*_cse9
+    _cse25 = -0.20538*_cse0*_cse2*_cse7 + _cse0*_cse20 + _cse0*_cse21 + _cse0*_cse22 + _cse23*_cse24
+    _cse26 = -_cse16
+    _cse27 = _cse1*_cse20 + _cse1*_cse21 + _cse1*_cse22 - _cse11*_cse6 + _cse24*_cse6
+    _cse28 = _cse10*_cse2 + _cse12 + _cse15 + _cse2*_cse8 - 1.6153e-5*_cse4*_cse9
+    _cse29 = -_cse1
+    _cse30 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = 0.0702981*_cse0 - _cse1*_cse12 - _cse1*_cse13 - _cse1*_cse15 - _cse1*_cse17 - _cse1*_cse3 + 1.6153e-5*_cse1*_cse4*_cse9 - _cse1*_cse5 - 1.6491e-5*_cse1 - _cse10*_cse6 - _cse6*_cse8
+    out[0, 1] = _cse0*_cse16*_cse2 - _cse0*_cse18 - _cse0*_cse19 + 0.00011502*_cse0*_cse2 - _cse25
+    out[0, 2] = -_cse23*_cse26 - _cse25
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -_cse0*_cse12 - _cse0*_cse13 - _cse0*_cse15 - _cse0*_cse17 - _cse0*_cse3 + 1.6153e-5*_cse0*_cse4*_cse9 - _cse0*_cse5 - 1.6491e-5*_cse0 - 0.0702981*_cse1 - _cse10*_cse23 - _cse23*_cse8
+    out[1, 1] = _cse1*_cse18 + _cse1*_cse19 - _cse16*_cse6 + _cse27 - 0.00011502*_cse6
+    out[1, 2] = _cse26*_cse6 + _cse27
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse17 - 0.4251*_cse2 - _cse28 + 0.00087944*_cse4
+    out[2, 2] = _cse26*_cse4 - _cse28
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse29
+    out[3, 2] = _cse29
+    out[3, 3] = _cse29
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse30
+    out[4, 2] = _cse30
+    out[4, 3] = _cse30
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint3[0,0,0]_dJ
+def function14(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = math.sin(q2)
+    _cse3 = math.cos(q2)
+    _cse4 = 0.18677*_cse2 + 0.00067934*_cse3
+    _cse5 = -_cse4
+    _cse6 = _cse1*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = 0.00067934*_cse2 - 0.18677*_cse3
+    _cse9 = -_cse8
+    _cse10 = _cse7*_cse9
+    _cse11 = _cse0*_cse7
+    _cse12 = 0.20538*_cse3
+    _cse13 = 1.6153e-5*_cse2
+    _cse14 = _cse0*_cse1
+    _cse15 = 1.6153e-5*_cse3
+    _cse16 = -0.20538*_cse0*_cse1*_cse2 + _cse0*_cse10 + _cse11*_cse12 + _cse11*_cse13 + _cse14*_cse15
+    _cse17 = -_cse0*_cse6 - _cse16
+    _cse18 = 0.21255*_cse7
+    _cse19 = 0.00099446*_cse1 + _cse18
+    _cse20 = _cse0*_cse1*_cse4 + 0.00011502*_cse0*_cse1 - _cse0*_cse18 - _cse0*_cse19 - _cse16
+    _cse21 = math.sin(q0)
+    _cse22 = 0.21255*_cse1
+    _cse23 = _cse22 - 0.00099446*_cse7
+    _cse24 = _cse21*_cse7
+    _cse25 = _cse1*_cse21
+    _cse26 = 0.20538*_cse2
+    _cse27 = _cse15*_cse24
+    _cse28 = _cse12*_cse25 + _cse13*_cse25 + _cse24*_cse26 + _cse25*_cse9 - _cse27
+    _cse29 = _cse21*_cse22 + _cse24*_cse4 + 0.00011502*_cse24 + _cse28
+    _cse30 = _cse24*_cse5
+    _cse31 = _cse28 - _cse30
+    _cse32 = -_cse23
+    _cse33 = -0.20538*_cse1*_cse2*_cse21 + _cse10*_cse21 + _cse12*_cse24 + _cse13*_cse24 + _cse15*_cse25
+    _cse34 = -_cse21*_cse6 - _cse33
+    _cse35 = _cse1*_cse21*_cse4 + 0.00011502*_cse1*_cse21 - _cse18*_cse21 - _cse19*_cse21 - _cse33
+    _cse36 = _cse11*_cse26
+    _cse37 = _cse12*_cse14
+    _cse38 = _cse13*_cse14
+    _cse39 = -1.6153e-5*_cse0*_cse3*_cse7 + _cse14*_cse9 + _cse36 + _cse37 + _cse38
+    _cse40 = _cse0*_cse22 + 0.00011502*_cse0*_cse7 + _cse11*_cse4 + _cse39
+    _cse41 = _cse0*_cse5*_cse7 - _cse39
+    _cse42 = _cse12*_cse7
+    _cse43 = _cse13*_cse7
+    _cse44 = _cse1*_cse15
+    _cse45 = -0.20538*_cse1*_cse2
+    _cse46 = _cse42 + _cse43 + _cse44 + _cse45 + _cse6
+    _cse47 = -_cse10 - _cse46
+    _cse48 = _cse21*dq0
+    _cse49 = -_cse0*dq0
+    out = np.empty((6, 6))
+    out[0, 0] = _cse17*dq2 + _cse20*dq1 + dq0*(0.0702981*_cse0 + _cse21*_cse23 + 1.6491e-5*_cse21 + _cse29)
+    out[0, 1] = _cse20*dq0 + _cse31*dq2 + dq1*(-_cse21*_cse32 + _cse29)
+    out[0, 2] = _cse17*dq0 + _cse31*dq1 + dq2*(1.6153e-5*_cse1*_cse2*_cse21 + 0.20538*_cse1*_cse21*_cse3 + 0.20538*_cse2*_cse21*_cse7 - _cse25*_cse8 - _cse27 - _cse30)
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse34*dq2 + _cse35*dq1 + dq0*(-_cse0*_cse23 - 1.6491e-5*_cse0 + 0.0702981*_cse21 - _cse40)
+    out[1, 1] = _cse35*dq0 + _cse41*dq2 + dq1*(_cse0*_cse32 - _cse40)
+    out[1, 2] = _cse34*dq0 + _cse41*dq1 + dq2*(_cse11*_cse15 + _cse11*_cse5 + _cse14*_cse8 - _cse36 - _cse37 - _cse38)
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse47*dq2 + dq1*(_cse1*_cse4 - 0.00087944*_cse1 - _cse10 - _cse42 - _cse43 - _cse44 - _cse45 - 0.4251*_cse7)
+    out[2, 2] = _cse47*dq1 + dq2*(-_cse46 + _cse7*_cse8)
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse48
+    out[3, 2] = _cse48
+    out[3, 3] = _cse48
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse49
+    out[4, 2] = _cse49
+    out[4, 3] = _cse49
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# joint4[0,0,0]_Tx
+def function15(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = _cse2*_cse6
+    _cse8 = _cse0*_cse7
+    _cse9 = math.cos(q2)
+    _cse10 = _cse2*_cse9
+    _cse11 = _cse0*_cse10
+    _cse12 = _cse4*_cse6
+    _cse13 = _cse0*_cse12
+    _cse14 = _cse3 - 0.00099446*_cse4
+    _cse15 = -0.00067934*_cse6 + 0.18677*_cse9
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.18677*_cse6 + 0.00067934*_cse9
+    _cse18 = math.sin(q3)
+    _cse19 = _cse4*_cse9
+    _cse20 = -_cse0*_cse19 + _cse8
+    _cse21 = math.cos(q3)
+    _cse22 = -_cse11 - _cse13
+    _cse23 = 4.5318e-5*_cse18
+    _cse24 = -0.0075028*_cse18 - 5.5328e-5*_cse21
+    _cse25 = 5.5328e-5*_cse18 - 0.0075028*_cse21
+    _cse26 = _cse1*_cse4
+    _cse27 = _cse1*_cse7
+    _cse28 = _cse1*_cse10
+    _cse29 = _cse1*_cse12
+    _cse30 = _cse28 + _cse29
+    _cse31 = 0.053076*_cse21
+    _cse32 = _cse1*_cse4*_cse9 - _cse27
+    _cse33 = 0.053076*_cse18
+    _cse34 = 4.5318e-5*_cse21
+    _cse35 = _cse4*_cse9 - _cse7
+    _cse36 = -_cse10 - _cse12
+    out = np.empty((4, 1))
+    out[0, 0] = -_cse0*_cse14 - _cse0*_cse16 - _cse0*_cse3 + 1.6153e-5*_cse0*_cse4*_cse9 - 1.6491e-5*_cse0 - 0.1099981*_cse1 - 0.20538*_cse11 - 0.20538*_cse13 - _cse17*_cse5 + 0.053076*_cse18*_cse20 + 4.5318e-5*_cse20*_cse21 + _cse20*_cse24 + 0.053076*_cse21*_cse22 - _cse22*_cse23 + _cse22*_cse25 - 0.00011502*_cse5 - 1.6153e-5*_cse8
+    out[1, 0] = -0.1099981*_cse0 + _cse1*_cse14 + _cse1*_cse16 - 1.6153e-5*_cse1*_cse19 + _cse1*_cse3 + 1.6491e-5*_cse1 + _cse17*_cse26 - _cse23*_cse30 + _cse24*_cse32 + _cse25*_cse30 + 0.00011502*_cse26 + 1.6153e-5*_cse27 + 0.20538*_cse28 + 0.20538*_cse29 + _cse30*_cse31 + _cse32*_cse33 + _cse32*_cse34
+    out[2, 0] = 1.6153e-5*_cse10 + 1.6153e-5*_cse12 + _cse15*_cse4 - _cse17*_cse2 + 0.20538*_cse19 + 0.00087944*_cse2 - _cse23*_cse35 + _cse24*_cse36 + _cse25*_cse35 + _cse31*_cse35 + _cse33*_cse36 + _cse34*_cse36 + 0.4251*_cse4 - 0.20538*_cse7 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# joint4[0,0,0]_J
+def function16(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 0.00011502*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = _cse2*_cse6
+    _cse8 = _cse1*_cse7
+    _cse9 = math.cos(q2)
+    _cse10 = _cse2*_cse9
+    _cse11 = _cse1*_cse10
+    _cse12 = _cse4*_cse6
+    _cse13 = _cse1*_cse12
+    _cse14 = _cse3 - 0.00099446*_cse4
+    _cse15 = -0.00067934*_cse6 + 0.18677*_cse9
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.18677*_cse6 + 0.00067934*_cse9
+    _cse18 = _cse17*_cse4
+    _cse19 = math.sin(q3)
+    _cse20 = _cse4*_cse9
+    _cse21 = _cse1*_cse20
+    _cse22 = -_cse21 + _cse8
+    _cse23 = math.cos(q3)
+    _cse24 = _cse11 + _cse13
+    _cse25 = -_cse24
+    _cse26 = 4.5318e-5*_cse19
+    _cse27 = 0.0075028*_cse19 + 5.5328e-5*_cse23
+    _cse28 = -_cse27
+    _cse29 = 5.5328e-5*_cse19 - 0.0075028*_cse23
+    _cse30 = 0.21255*_cse4
+    _cse31 = 0.00099446*_cse2 + _cse30
+    _cse32 = _cse0*_cse2
+    _cse33 = _cse0*_cse10
+    _cse34 = _cse0*_cse12
+    _cse35 = _cse33 + _cse34
+    _cse36 = 4.5318e-5*_cse23
+    _cse37 = 0.053076*_cse19
+    _cse38 = _cse15*_cse4
+    _cse39 = _cse0*_cse7
+    _cse40 = _cse0*_cse20
+    _cse41 = _cse39 - _cse40
+    _cse42 = 0.053076*_cse23
+    _cse43 = _cse19*_cse41
+    _cse44 = _cse29*_cse41 + _cse41*_cse42 - 4.5318e-5*_cse43
+    _cse45 = -_cse0*_cse38 + _cse28*_cse35 - 1.6153e-5*_cse33 - 1.6153e-5*_cse34 + _cse35*_cse36 + _cse35*_cse37 + 0.20538*_cse39 - 0.20538*_cse40 + _cse44
+    _cse46 = -_cse17
+    _cse47 = -_cse35
+    _cse48 = _cse23*_cse47
+    _cse49 = _cse1*_cse2
+    _cse50 = -_cse22
+    _cse51 = _cse19*_cse50
+    _cse52 = _cse29*_cse50 + _cse42*_cse50 - 4.5318e-5*_cse51
+    _cse53 = _cse1*_cse38 + 1.6153e-5*_cse11 + 1.6153e-5*_cse13 + 0.20538*_cse21 + _cse25*_cse28 + _cse25*_cse36 + _cse25*_cse37 + _cse52 - 0.20538*_cse8
+    _cse54 = _cse23*_cse24
+    _cse55 = -_cse20 + _cse7
+    _cse56 = -_cse10 - _cse12
+    _cse57 = _cse19*_cse56
+    _cse58 = _cse29*_cse56 + _cse42*_cse56 - 4.5318e-5*_cse57
+    _cse59 = -0.20538*_cse10 - 0.20538*_cse12 - _cse16 + 1.6153e-5*_cse20 + _cse28*_cse55 + _cse36*_cse55 + _cse37*_cse55 + _cse58 - 1.6153e-5*_cse7
+    _cse60 = -_cse55
+    _cse61 = _cse23*_cse60
+    _cse62 = -_cse1
+    _cse63 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = 0.1099981*_cse0 - _cse1*_cse14 - _cse1*_cse16 - _cse1*_cse18 - _cse1*_cse3 + 1.6153e-5*_cse1*_cse4*_cse9 - _cse1*_cse5 - 1.6491e-5*_cse1 - 0.20538*_cse11 - 0.20538*_cse13 + 0.053076*_cse19*_cse22 + 4.5318e-5*_cse22*_cse23 + _cse22*_cse28 + 0.053076*_cse23*_cse25 - _cse25*_cse26 + _cse25*_cse29 - 1.6153e-5*_cse8
+    out[0, 1] = -_cse0*_cse30 - _cse0*_cse31 + _cse17*_cse32 + 0.00011502*_cse32 + _cse45
+    out[0, 2] = -_cse32*_cse46 + _cse45
+    out[0, 3] = _cse27*_cse47 - _cse37*_cse47 + _cse44 - 4.5318e-5*_cse48
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -_cse0*_cse14 - _cse0*_cse16 - _cse0*_cse18 - _cse0*_cse3 + 1.6153e-5*_cse0*_cse4*_cse9 - _cse0*_cse5 - 1.6491e-5*_cse0 - 0.1099981*_cse1 + 0.053076*_cse19*_cse41 + 4.5318e-5*_cse23*_cse41 + 0.053076*_cse23*_cse47 - _cse26*_cse47 + _cse28*_cse41 + _cse29*_cse47 - 0.20538*_cse33 - 0.20538*_cse34 - 1.6153e-5*_cse39
+    out[1, 1] = _cse1*_cse30 + _cse1*_cse31 - _cse17*_cse49 - 0.00011502*_cse49 + _cse53
+    out[1, 2] = _cse46*_cse49 + _cse53
+    out[1, 3] = _cse24*_cse27 - _cse24*_cse37 + _cse52 - 4.5318e-5*_cse54
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse18 - 0.4251*_cse2 + 0.00087944*_cse4 + _cse59
+    out[2, 2] = _cse4*_cse46 + _cse59
+    out[2, 3] = _cse27*_cse60 - _cse37*_cse60 + _cse58 - 4.5318e-5*_cse61
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse62
+    out[3, 2] = _cse62
+    out[3, 3] = _cse62
+    out[3, 4] = _cse43 + _cse48
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse63
+    out[4, 2] = _cse63
+    out[4, 3] = _cse63
+    out[4, 4] = _cse51 + _cse54
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse57 + _cse61
+    out[5, 5] = 0
+    return out
+
+
+# joint4[0,0,0]_dJ
+def function17(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q3)
+    _cse1 = math.cos(q3)
+    _cse2 = 0.0075028*_cse0 + 5.5328e-5*_cse1
+    _cse3 = math.cos(q0)
+    _cse4 = math.sin(q1)
+    _cse5 = math.cos(q2)
+    _cse6 = _cse4*_cse5
+    _cse7 = _cse3*_cse6
+    _cse8 = math.sin(q2)
+    _cse9 = math.cos(q1)
+    _cse10 = _cse8*_cse9
+    _cse11 = _cse10*_cse3
+    _cse12 = _cse11 + _cse7
+    _cse13 = -_cse12
+    _cse14 = _cse1*_cse13
+    _cse15 = _cse0*_cse13
+    _cse16 = 5.5328e-5*_cse0 - 0.0075028*_cse1
+    _cse17 = _cse4*_cse8
+    _cse18 = _cse17*_cse3
+    _cse19 = _cse5*_cse9
+    _cse20 = _cse19*_cse3
+    _cse21 = _cse18 - _cse20
+    _cse22 = 0.053076*_cse1
+    _cse23 = _cse0*_cse21
+    _cse24 = _cse16*_cse21 + _cse21*_cse22 - 4.5318e-5*_cse23
+    _cse25 = _cse13*_cse2 - 4.5318e-5*_cse14 - 0.053076*_cse15 + _cse24
+    _cse26 = 0.00067934*_cse5 + 0.18677*_cse8
+    _cse27 = -_cse26
+    _cse28 = _cse27*_cse4
+    _cse29 = -_cse2
+    _cse30 = 4.5318e-5*_cse1
+    _cse31 = _cse0*_cse12
+    _cse32 = -0.18677*_cse5 + 0.00067934*_cse8
+    _cse33 = -_cse32
+    _cse34 = _cse33*_cse9
+    _cse35 = -1.6153e-5*_cse11 + _cse12*_cse29 + _cse12*_cse30 + 0.20538*_cse18 - 0.20538*_cse20 + _cse24 - _cse3*_cse34 + 0.053076*_cse31 - 1.6153e-5*_cse7
+    _cse36 = -_cse28*_cse3 + _cse35
+    _cse37 = 0.21255*_cse9
+    _cse38 = _cse37 + 0.00099446*_cse4
+    _cse39 = 0.00011502*_cse3
+    _cse40 = _cse26*_cse4
+    _cse41 = -_cse3*_cse37 - _cse3*_cse38 + _cse3*_cse40 + _cse35 + _cse39*_cse4
+    _cse42 = math.sin(q0)
+    _cse43 = 0.21255*_cse4
+    _cse44 = _cse43 - 0.00099446*_cse9
+    _cse45 = _cse17*_cse42
+    _cse46 = -_cse42*_cse5*_cse9 + _cse45
+    _cse47 = -_cse46
+    _cse48 = _cse29*_cse47
+    _cse49 = _cse30*_cse47
+    _cse50 = 0.053076*_cse0
+    _cse51 = _cse47*_cse50
+    _cse52 = _cse4*_cse42
+    _cse53 = _cse33*_cse52
+    _cse54 = _cse10*_cse42
+    _cse55 = 0.20538*_cse54
+    _cse56 = _cse42*_cse6
+    _cse57 = 0.20538*_cse56
+    _cse58 = 1.6153e-5*_cse45
+    _cse59 = _cse19*_cse42
+    _cse60 = -1.6153e-5*_cse59
+    _cse61 = _cse42*_cse9
+    _cse62 = _cse54 + _cse56
+    _cse63 = _cse0*_cse62
+    _cse64 = _cse16*_cse62 + _cse22*_cse62 - 4.5318e-5*_cse63
+    _cse65 = _cse26*_cse61 + _cse42*_cse43 + _cse48 + _cse49 + _cse51 + _cse53 + _cse55 + _cse57 + _cse58 + _cse60 + 0.00011502*_cse61 + _cse64
+    _cse66 = _cse1*_cse46
+    _cse67 = _cse0*_cse46
+    _cse68 = _cse2*_cse46 - 4.5318e-5*_cse66 - 0.053076*_cse67
+    _cse69 = _cse64 + _cse68
+    _cse70 = _cse69*dq3
+    _cse71 = -_cse27*_cse61 + _cse48 + _cse49 + _cse51 + _cse55 + _cse57 + _cse58 + _cse60 + _cse64
+    _cse72 = _cse53 + _cse71
+    _cse73 = -_cse44
+    _cse74 = -_cse16
+    _cse75 = -_cse62
+    _cse76 = _cse0*_cse75
+    _cse77 = _cse1*_cse75
+    _cse78 = _cse16*_cse46 + 0.053076*_cse66 - 4.5318e-5*_cse67
+    _cse79 = _cse2*_cse75 - 0.053076*_cse76 - 4.5318e-5*_cse77 + _cse78
+    _cse80 = _cse29*_cse62 + _cse30*_cse62 - _cse34*_cse42 + 0.20538*_cse45 - 1.6153e-5*_cse54 - 1.6153e-5*_cse56 - 0.20538*_cse59 + 0.053076*_cse63 + _cse78
+    _cse81 = -_cse28*_cse42 + _cse80
+    _cse82 = -_cse37*_cse42 - _cse38*_cse42 + _cse40*_cse42 + 0.00011502*_cse52 + _cse80
+    _cse83 = 4.5318e-5*_cse15
+    _cse84 = _cse3*_cse4
+    _cse85 = _cse33*_cse84
+    _cse86 = _cse3*_cse9
+    _cse87 = 0.20538*_cse11
+    _cse88 = 0.20538*_cse7
+    _cse89 = 1.6153e-5*_cse18
+    _cse90 = -0.053076*_cse0*_cse21 - 0.053076*_cse1*_cse13 - 4.5318e-5*_cse1*_cse21 - _cse13*_cse16 - _cse21*_cse29 + _cse26*_cse86 + _cse3*_cse43 - 1.6153e-5*_cse3*_cse5*_cse9 + _cse39*_cse9 + _cse83 + _cse85 + _cse87 + _cse88 + _cse89
+    _cse91 = -_cse21
+    _cse92 = _cse1*_cse91
+    _cse93 = _cse2*_cse91 - _cse50*_cse91 - 4.5318e-5*_cse92
+    _cse94 = _cse13*_cse16 + 0.053076*_cse14 - _cse83
+    _cse95 = _cse93 + _cse94
+    _cse96 = _cse95*dq3
+    _cse97 = 1.6153e-5*_cse20 + _cse21*_cse29 + _cse21*_cse30 + 0.053076*_cse23 + _cse27*_cse86 - _cse87 - _cse88 - _cse89 + _cse94
+    _cse98 = -_cse85 + _cse97
+    _cse99 = _cse10 + _cse6
+    _cse100 = -_cse99
+    _cse101 = _cse1*_cse100
+    _cse102 = _cse100*_cse2 - _cse100*_cse50 - 4.5318e-5*_cse101
+    _cse103 = _cse17 - _cse19
+    _cse104 = _cse0*_cse103
+    _cse105 = _cse103*_cse16 + _cse103*_cse22 - 4.5318e-5*_cse104
+    _cse106 = _cse102 + _cse105
+    _cse107 = _cse106*dq3
+    _cse108 = -_cse34
+    _cse109 = _cse29*_cse99
+    _cse110 = _cse30*_cse99
+    _cse111 = 0.20538*_cse17
+    _cse112 = _cse50*_cse99
+    _cse113 = -0.20538*_cse19
+    _cse114 = -1.6153e-5*_cse10
+    _cse115 = -1.6153e-5*_cse6
+    _cse116 = _cse105 + _cse109 + _cse110 + _cse111 + _cse112 + _cse113 + _cse114 + _cse115 - _cse28
+    _cse117 = _cse108 + _cse116
+    _cse118 = -_cse103
+    _cse119 = _cse0*_cse118
+    _cse120 = _cse42*dq0
+    _cse121 = _cse63 + _cse66
+    _cse122 = -_cse3*dq0
+    _cse123 = _cse15 + _cse92
+    _cse124 = _cse101 + _cse104
+    out = np.empty((6, 6))
+    out[0, 0] = _cse25*dq3 + _cse36*dq2 + _cse41*dq1 + dq0*(0.1099981*_cse3 + _cse42*_cse44 + 1.6491e-5*_cse42 + _cse65)
+    out[0, 1] = _cse41*dq0 + _cse70 + _cse72*dq2 + dq1*(-_cse42*_cse73 + _cse65)
+    out[0, 2] = _cse36*dq0 + _cse70 + _cse72*dq1 + dq2*(-_cse32*_cse52 + _cse71)
+    out[0, 3] = _cse25*dq0 + _cse69*dq1 + _cse69*dq2 + dq3*(_cse68 + _cse74*_cse75 + 4.5318e-5*_cse76 - 0.053076*_cse77)
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse79*dq3 + _cse81*dq2 + _cse82*dq1 + dq0*(-_cse3*_cse44 - 1.6491e-5*_cse3 + 0.1099981*_cse42 - _cse90)
+    out[1, 1] = _cse82*dq0 + _cse96 + _cse98*dq2 + dq1*(_cse3*_cse73 - _cse90)
+    out[1, 2] = _cse81*dq0 + _cse96 + _cse98*dq1 + dq2*(_cse32*_cse84 + _cse97)
+    out[1, 3] = _cse79*dq0 + _cse95*dq1 + _cse95*dq2 + dq3*(-_cse12*_cse22 + _cse12*_cse74 + 4.5318e-5*_cse31 + _cse93)
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse107 + _cse117*dq2 + dq1*(_cse105 + _cse108 + _cse109 + _cse110 + _cse111 + _cse112 + _cse113 + _cse114 + _cse115 - 0.00087944*_cse4 + _cse40 - 0.4251*_cse9)
+    out[2, 2] = _cse107 + _cse117*dq1 + dq2*(_cse116 + _cse32*_cse9)
+    out[2, 3] = _cse106*dq1 + _cse106*dq2 + dq3*(_cse102 - _cse118*_cse22 + _cse118*_cse74 + 4.5318e-5*_cse119)
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse120
+    out[3, 2] = _cse120
+    out[3, 3] = _cse120
+    out[3, 4] = _cse121*dq1 + _cse121*dq2 + dq0*(_cse14 + _cse23) + dq3*(_cse66 - _cse76)
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse122
+    out[4, 2] = _cse122
+    out[4, 3] = _cse122
+    out[4, 4] = _cse123*dq1 + _cse123*dq2 + dq0*(_cse67 + _cse77) + dq3*(-_cse31 + _cse92)
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse124*dq1 + _cse124*dq2 + dq3*(_cse1*_cse100 - _cse119)
+    out[5, 5] = 0
+    return out
+
+
+# joint5[0,0,0]_Tx
+def function18(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = math.sin(q4)
+    _cse7 = math.cos(q4)
+    _cse8 = math.sin(q2)
+    _cse9 = _cse2*_cse8
+    _cse10 = _cse0*_cse9
+    _cse11 = math.cos(q2)
+    _cse12 = _cse11*_cse2
+    _cse13 = _cse0*_cse12
+    _cse14 = _cse4*_cse8
+    _cse15 = _cse0*_cse14
+    _cse16 = _cse3 - 0.00099446*_cse4
+    _cse17 = -5.009e-5*_cse6 + 0.0036091*_cse7
+    _cse18 = 0.18677*_cse11 - 0.00067934*_cse8
+    _cse19 = _cse18*_cse2
+    _cse20 = 0.00067934*_cse11 + 0.18677*_cse8
+    _cse21 = math.sin(q3)
+    _cse22 = _cse11*_cse4
+    _cse23 = -_cse0*_cse22 + _cse10
+    _cse24 = math.cos(q3)
+    _cse25 = -_cse13 - _cse15
+    _cse26 = _cse21*_cse25
+    _cse27 = -0.0075028*_cse21 - 5.5328e-5*_cse24
+    _cse28 = 5.5328e-5*_cse21 - 0.0075028*_cse24
+    _cse29 = _cse23*_cse24 - _cse26
+    _cse30 = 4.5293e-5*_cse7
+    _cse31 = 0.0036091*_cse6 + 5.009e-5*_cse7
+    _cse32 = _cse1*_cse4
+    _cse33 = _cse1*_cse9
+    _cse34 = _cse1*_cse12
+    _cse35 = _cse1*_cse14
+    _cse36 = _cse34 + _cse35
+    _cse37 = _cse21*_cse36
+    _cse38 = 0.102286*_cse24
+    _cse39 = _cse1*_cse11*_cse4 - _cse33
+    _cse40 = 0.102286*_cse21
+    _cse41 = _cse24*_cse39
+    _cse42 = -_cse37 + _cse41
+    _cse43 = 0.010824*_cse6
+    _cse44 = _cse11*_cse4 - _cse9
+    _cse45 = _cse21*_cse44
+    _cse46 = -_cse12 - _cse14
+    _cse47 = _cse24*_cse46 - _cse45
+    out = np.empty((4, 1))
+    out[0, 0] = 1.6153e-5*_cse0*_cse11*_cse4 - _cse0*_cse16 - _cse0*_cse19 - _cse0*_cse3 - 1.6491e-5*_cse0 + _cse1*_cse17 + 4.5293e-5*_cse1*_cse6 + 0.010824*_cse1*_cse7 - 0.1099981*_cse1 - 1.6153e-5*_cse10 - 0.20538*_cse13 - 0.20538*_cse15 - _cse20*_cse5 + 0.102286*_cse21*_cse23 + 4.5318e-5*_cse23*_cse24 + _cse23*_cse27 + 0.102286*_cse24*_cse25 + _cse25*_cse28 - 4.5318e-5*_cse26 - _cse29*_cse30 + _cse29*_cse31 + 0.010824*_cse29*_cse6 - 0.00011502*_cse5
+    out[1, 0] = _cse0*_cse17 + 4.5293e-5*_cse0*_cse6 + 0.010824*_cse0*_cse7 - 0.1099981*_cse0 + _cse1*_cse16 + _cse1*_cse19 - 1.6153e-5*_cse1*_cse22 + _cse1*_cse3 + 1.6491e-5*_cse1 + _cse20*_cse32 + _cse27*_cse39 + _cse28*_cse36 - _cse30*_cse42 + _cse31*_cse42 + 0.00011502*_cse32 + 1.6153e-5*_cse33 + 0.20538*_cse34 + 0.20538*_cse35 + _cse36*_cse38 - 4.5318e-5*_cse37 + _cse39*_cse40 + 4.5318e-5*_cse41 + _cse42*_cse43
+    out[2, 0] = 1.6153e-5*_cse12 + 1.6153e-5*_cse14 + _cse18*_cse4 - _cse2*_cse20 + 0.00087944*_cse2 + 0.20538*_cse22 + 4.5318e-5*_cse24*_cse46 + _cse27*_cse46 + _cse28*_cse44 - _cse30*_cse47 + _cse31*_cse47 + _cse38*_cse44 + 0.4251*_cse4 + _cse40*_cse46 + _cse43*_cse47 - 4.5318e-5*_cse45 - 0.20538*_cse9 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# joint5[0,0,0]_J
+def function19(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q4)
+    _cse3 = math.cos(q4)
+    _cse4 = _cse0*_cse3
+    _cse5 = math.sin(q1)
+    _cse6 = 0.21255*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = 0.00011502*_cse7
+    _cse9 = math.sin(q2)
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse1*_cse10
+    _cse12 = math.cos(q2)
+    _cse13 = _cse12*_cse5
+    _cse14 = _cse1*_cse13
+    _cse15 = _cse7*_cse9
+    _cse16 = _cse1*_cse15
+    _cse17 = _cse6 - 0.00099446*_cse7
+    _cse18 = -5.009e-5*_cse2 + 0.0036091*_cse3
+    _cse19 = 0.18677*_cse12 - 0.00067934*_cse9
+    _cse20 = _cse19*_cse5
+    _cse21 = 0.00067934*_cse12 + 0.18677*_cse9
+    _cse22 = _cse21*_cse7
+    _cse23 = math.sin(q3)
+    _cse24 = _cse12*_cse7
+    _cse25 = _cse1*_cse24
+    _cse26 = _cse11 - _cse25
+    _cse27 = math.cos(q3)
+    _cse28 = _cse14 + _cse16
+    _cse29 = -_cse28
+    _cse30 = _cse23*_cse29
+    _cse31 = 0.0075028*_cse23 + 5.5328e-5*_cse27
+    _cse32 = -_cse31
+    _cse33 = 5.5328e-5*_cse23 - 0.0075028*_cse27
+    _cse34 = _cse26*_cse27 - _cse30
+    _cse35 = 4.5293e-5*_cse3
+    _cse36 = 0.0036091*_cse2 + 5.009e-5*_cse3
+    _cse37 = 0.21255*_cse7
+    _cse38 = _cse37 + 0.00099446*_cse5
+    _cse39 = _cse0*_cse5
+    _cse40 = _cse0*_cse10
+    _cse41 = _cse0*_cse24
+    _cse42 = _cse40 - _cse41
+    _cse43 = _cse23*_cse42
+    _cse44 = _cse0*_cse13
+    _cse45 = _cse0*_cse15
+    _cse46 = _cse44 + _cse45
+    _cse47 = _cse27*_cse46 - _cse43
+    _cse48 = 0.010824*_cse2
+    _cse49 = 0.102286*_cse23
+    _cse50 = _cse19*_cse7
+    _cse51 = _cse27*_cse42
+    _cse52 = _cse33*_cse42 - 4.5318e-5*_cse43 + 0.102286*_cse51
+    _cse53 = -_cse0*_cse50 + 4.5318e-5*_cse27*_cse46 + _cse32*_cse46 - _cse35*_cse47 + _cse36*_cse47 + 0.20538*_cse40 - 0.20538*_cse41 - 1.6153e-5*_cse44 - 1.6153e-5*_cse45 + _cse46*_cse49 + _cse47*_cse48 + _cse52
+    _cse54 = -_cse21
+    _cse55 = -_cse46
+    _cse56 = _cse27*_cse55
+    _cse57 = _cse43 + _cse56
+    _cse58 = -_cse57
+    _cse59 = _cse23*_cse55
+    _cse60 = _cse1*_cse3
+    _cse61 = -_cse36
+    _cse62 = _cse51 - _cse59
+    _cse63 = _cse2*_cse62
+    _cse64 = 0.010824*_cse3
+    _cse65 = _cse1*_cse5
+    _cse66 = -_cse26
+    _cse67 = _cse23*_cse66
+    _cse68 = _cse27*_cse29 - _cse67
+    _cse69 = _cse27*_cse66
+    _cse70 = _cse33*_cse66 - 4.5318e-5*_cse67 + 0.102286*_cse69
+    _cse71 = _cse1*_cse50 - 0.20538*_cse11 + 1.6153e-5*_cse14 + 1.6153e-5*_cse16 + 0.20538*_cse25 + 4.5318e-5*_cse27*_cse29 + _cse29*_cse32 + 0.102286*_cse30 - _cse35*_cse68 + _cse36*_cse68 + _cse48*_cse68 + _cse70
+    _cse72 = _cse27*_cse28
+    _cse73 = _cse67 + _cse72
+    _cse74 = -_cse73
+    _cse75 = _cse23*_cse28
+    _cse76 = _cse69 - _cse75
+    _cse77 = _cse2*_cse76
+    _cse78 = _cse10 - _cse24
+    _cse79 = _cse27*_cse78
+    _cse80 = -_cse13 - _cse15
+    _cse81 = _cse23*_cse80
+    _cse82 = _cse79 - _cse81
+    _cse83 = 0.102286*_cse27*_cse80 + _cse33*_cse80 - 4.5318e-5*_cse81
+    _cse84 = -1.6153e-5*_cse10 - 0.20538*_cse13 - 0.20538*_cse15 - _cse20 + 1.6153e-5*_cse24 + _cse32*_cse78 - _cse35*_cse82 + _cse36*_cse82 + _cse48*_cse82 + _cse49*_cse78 + 4.5318e-5*_cse79 + _cse83
+    _cse85 = -_cse78
+    _cse86 = _cse27*_cse85
+    _cse87 = _cse81 + _cse86
+    _cse88 = -_cse87
+    _cse89 = _cse23*_cse85
+    _cse90 = _cse27*_cse80 - _cse89
+    _cse91 = _cse2*_cse90
+    _cse92 = -_cse1
+    _cse93 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse18 - 4.5293e-5*_cse0*_cse2 + 0.1099981*_cse0 + 1.6153e-5*_cse1*_cse12*_cse7 - _cse1*_cse17 - _cse1*_cse20 - _cse1*_cse22 - _cse1*_cse6 - _cse1*_cse8 - 1.6491e-5*_cse1 - 1.6153e-5*_cse11 - 0.20538*_cse14 - 0.20538*_cse16 + 0.010824*_cse2*_cse34 + 0.102286*_cse23*_cse26 + 4.5318e-5*_cse26*_cse27 + _cse26*_cse32 + 0.102286*_cse27*_cse29 + _cse29*_cse33 - 4.5318e-5*_cse30 - _cse34*_cse35 + _cse34*_cse36 - 0.010824*_cse4
+    out[0, 1] = -_cse0*_cse37 - _cse0*_cse38 + _cse21*_cse39 + 0.00011502*_cse39 + _cse53
+    out[0, 2] = -_cse39*_cse54 + _cse53
+    out[0, 3] = _cse31*_cse55 - _cse35*_cse58 + _cse36*_cse58 + _cse48*_cse58 + _cse52 - 4.5318e-5*_cse56 - 0.102286*_cse59
+    out[0, 4] = -_cse1*_cse48 + _cse1*_cse61 + _cse18*_cse62 + 4.5293e-5*_cse60 + _cse62*_cse64 + 4.5293e-5*_cse63
+    out[0, 5] = 0
+    out[1, 0] = 1.6153e-5*_cse0*_cse12*_cse7 - _cse0*_cse17 - _cse0*_cse20 - _cse0*_cse22 - _cse0*_cse6 - _cse0*_cse8 - 1.6491e-5*_cse0 + _cse1*_cse18 + 4.5293e-5*_cse1*_cse2 + 0.010824*_cse1*_cse3 - 0.1099981*_cse1 + 0.010824*_cse2*_cse62 + 0.102286*_cse23*_cse42 + 4.5318e-5*_cse27*_cse42 + 0.102286*_cse27*_cse55 + _cse32*_cse42 + _cse33*_cse55 - _cse35*_cse62 + _cse36*_cse62 - 1.6153e-5*_cse40 - 0.20538*_cse44 - 0.20538*_cse45 - 4.5318e-5*_cse59
+    out[1, 1] = _cse1*_cse37 + _cse1*_cse38 - _cse21*_cse65 - 0.00011502*_cse65 + _cse71
+    out[1, 2] = _cse54*_cse65 + _cse71
+    out[1, 3] = _cse28*_cse31 - _cse35*_cse74 + _cse36*_cse74 + _cse48*_cse74 + _cse70 - 4.5318e-5*_cse72 - 0.102286*_cse75
+    out[1, 4] = -_cse0*_cse48 + _cse0*_cse61 + _cse18*_cse76 + 4.5293e-5*_cse4 + _cse64*_cse76 + 4.5293e-5*_cse77
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse22 - 0.4251*_cse5 + 0.00087944*_cse7 + _cse84
+    out[2, 2] = _cse54*_cse7 + _cse84
+    out[2, 3] = _cse31*_cse85 - _cse35*_cse88 + _cse36*_cse88 + _cse48*_cse88 + _cse83 - 4.5318e-5*_cse86 - 0.102286*_cse89
+    out[2, 4] = _cse18*_cse90 + _cse64*_cse90 + 4.5293e-5*_cse91
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse92
+    out[3, 2] = _cse92
+    out[3, 3] = _cse92
+    out[3, 4] = _cse57
+    out[3, 5] = -_cse60 - _cse63
+    out[4, 0] = 0
+    out[4, 1] = _cse93
+    out[4, 2] = _cse93
+    out[4, 3] = _cse93
+    out[4, 4] = _cse73
+    out[4, 5] = -_cse4 - _cse77
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse87
+    out[5, 5] = -_cse91
+    return out
+
+
+# joint5[0,0,0]_dJ
+def function20(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q4)
+    _cse2 = _cse0*_cse1
+    _cse3 = math.cos(q4)
+    _cse4 = _cse0*_cse3
+    _cse5 = 0.0036091*_cse1 + 5.009e-5*_cse3
+    _cse6 = -_cse5
+    _cse7 = math.cos(q3)
+    _cse8 = math.cos(q0)
+    _cse9 = math.sin(q1)
+    _cse10 = math.sin(q2)
+    _cse11 = _cse10*_cse9
+    _cse12 = _cse11*_cse8
+    _cse13 = math.cos(q1)
+    _cse14 = math.cos(q2)
+    _cse15 = _cse13*_cse14
+    _cse16 = _cse15*_cse8
+    _cse17 = _cse12 - _cse16
+    _cse18 = _cse17*_cse7
+    _cse19 = math.sin(q3)
+    _cse20 = _cse14*_cse9
+    _cse21 = _cse20*_cse8
+    _cse22 = _cse10*_cse13
+    _cse23 = _cse22*_cse8
+    _cse24 = _cse21 + _cse23
+    _cse25 = -_cse24
+    _cse26 = _cse19*_cse25
+    _cse27 = _cse18 - _cse26
+    _cse28 = _cse1*_cse27
+    _cse29 = 0.010824*_cse3
+    _cse30 = 5.009e-5*_cse1 - 0.0036091*_cse3
+    _cse31 = -_cse30
+    _cse32 = -_cse0*_cse6 + 0.010824*_cse2 + _cse27*_cse29 + _cse27*_cse31 + 4.5293e-5*_cse28 - 4.5293e-5*_cse4
+    _cse33 = _cse17*_cse19
+    _cse34 = _cse25*_cse7
+    _cse35 = _cse33 + _cse34
+    _cse36 = -_cse35
+    _cse37 = 0.0075028*_cse19 + 5.5328e-5*_cse7
+    _cse38 = 0.010824*_cse1
+    _cse39 = 4.5293e-5*_cse3
+    _cse40 = 5.5328e-5*_cse19 - 0.0075028*_cse7
+    _cse41 = _cse17*_cse40 + 0.102286*_cse18 - 4.5318e-5*_cse33
+    _cse42 = _cse25*_cse37 - 0.102286*_cse26 - 4.5318e-5*_cse34 + _cse36*_cse38 - _cse36*_cse39 + _cse36*_cse5 + _cse41
+    _cse43 = 0.18677*_cse10 + 0.00067934*_cse14
+    _cse44 = -_cse43
+    _cse45 = _cse44*_cse9
+    _cse46 = _cse24*_cse7
+    _cse47 = -_cse33 + _cse46
+    _cse48 = -_cse37
+    _cse49 = _cse19*_cse24
+    _cse50 = 0.00067934*_cse10 - 0.18677*_cse14
+    _cse51 = -_cse50
+    _cse52 = _cse13*_cse51
+    _cse53 = 0.20538*_cse12 - 0.20538*_cse16 - 1.6153e-5*_cse21 - 1.6153e-5*_cse23 + _cse24*_cse48 + _cse38*_cse47 - _cse39*_cse47 + _cse41 + 4.5318e-5*_cse46 + _cse47*_cse5 + 0.102286*_cse49 - _cse52*_cse8
+    _cse54 = -_cse45*_cse8 + _cse53
+    _cse55 = 0.21255*_cse13
+    _cse56 = _cse55 + 0.00099446*_cse9
+    _cse57 = 0.00011502*_cse8
+    _cse58 = _cse43*_cse9
+    _cse59 = _cse53 - _cse55*_cse8 - _cse56*_cse8 + _cse57*_cse9 + _cse58*_cse8
+    _cse60 = 0.21255*_cse9
+    _cse61 = -0.00099446*_cse13 + _cse60
+    _cse62 = _cse3*_cse8
+    _cse63 = _cse1*_cse8
+    _cse64 = -0.010824*_cse62 - 4.5293e-5*_cse63
+    _cse65 = _cse0*_cse11
+    _cse66 = -_cse0*_cse13*_cse14 + _cse65
+    _cse67 = -_cse66
+    _cse68 = _cse67*_cse7
+    _cse69 = _cse0*_cse20
+    _cse70 = _cse0*_cse22
+    _cse71 = _cse69 + _cse70
+    _cse72 = _cse19*_cse71
+    _cse73 = _cse68 - _cse72
+    _cse74 = _cse5*_cse73
+    _cse75 = _cse48*_cse67
+    _cse76 = _cse38*_cse73
+    _cse77 = 4.5318e-5*_cse68
+    _cse78 = 0.102286*_cse19
+    _cse79 = _cse67*_cse78
+    _cse80 = -_cse39*_cse73
+    _cse81 = _cse0*_cse9
+    _cse82 = _cse51*_cse81
+    _cse83 = 0.20538*_cse70
+    _cse84 = 0.20538*_cse69
+    _cse85 = 1.6153e-5*_cse65
+    _cse86 = _cse0*_cse15
+    _cse87 = -1.6153e-5*_cse86
+    _cse88 = _cse0*_cse13
+    _cse89 = _cse7*_cse71
+    _cse90 = _cse40*_cse71 - 4.5318e-5*_cse72 + 0.102286*_cse89
+    _cse91 = _cse0*_cse60 + _cse43*_cse88 + _cse74 + _cse75 + _cse76 + _cse77 + _cse79 + _cse80 + _cse82 + _cse83 + _cse84 + _cse85 + _cse87 + 0.00011502*_cse88 + _cse90
+    _cse92 = -_cse61
+    _cse93 = -_cse44*_cse88 + _cse74 + _cse75 + _cse76 + _cse77 + _cse79 + _cse80 + _cse83 + _cse84 + _cse85 + _cse87 + _cse90
+    _cse94 = _cse82 + _cse93
+    _cse95 = _cse66*_cse7
+    _cse96 = _cse72 + _cse95
+    _cse97 = -_cse96
+    _cse98 = _cse19*_cse66
+    _cse99 = _cse37*_cse66 - 4.5318e-5*_cse95 - 0.102286*_cse98
+    _cse100 = _cse38*_cse97 - _cse39*_cse97 + _cse5*_cse97 + _cse90 + _cse99
+    _cse101 = _cse7*_cse71 - _cse98
+    _cse102 = 4.5293e-5*_cse1
+    _cse103 = _cse101*_cse102 + _cse101*_cse29 + _cse101*_cse31
+    _cse104 = _cse100*dq3 + _cse103*dq4
+    _cse105 = -_cse71
+    _cse106 = _cse105*_cse7
+    _cse107 = _cse106 + _cse98
+    _cse108 = -_cse107
+    _cse109 = _cse102*_cse108 + _cse108*_cse29 + _cse108*_cse31
+    _cse110 = -_cse105*_cse19 + _cse95
+    _cse111 = -_cse110
+    _cse112 = -_cse40
+    _cse113 = _cse105*_cse19
+    _cse114 = _cse110*_cse3
+    _cse115 = _cse1*_cse110
+    _cse116 = _cse110*_cse31 + 0.010824*_cse114 + 4.5293e-5*_cse115 + _cse6*_cse8 + 4.5293e-5*_cse62 - 0.010824*_cse63
+    _cse117 = _cse40*_cse66 + 0.102286*_cse95 - 4.5318e-5*_cse98
+    _cse118 = _cse105*_cse37 - 4.5318e-5*_cse106 + _cse108*_cse38 - _cse108*_cse39 + _cse108*_cse5 - 0.102286*_cse113 + _cse117
+    _cse119 = -_cse0*_cse52 + _cse101*_cse38 - _cse101*_cse39 + _cse101*_cse5 + _cse117 + _cse48*_cse71 + 0.20538*_cse65 - 1.6153e-5*_cse69 - 1.6153e-5*_cse70 + 0.102286*_cse72 - 0.20538*_cse86 + 4.5318e-5*_cse89
+    _cse120 = -_cse0*_cse45 + _cse119
+    _cse121 = -_cse0*_cse55 - _cse0*_cse56 + _cse0*_cse58 + _cse119 + 0.00011502*_cse81
+    _cse122 = 4.5293e-5*_cse2
+    _cse123 = 0.010824*_cse4
+    _cse124 = _cse60*_cse8
+    _cse125 = _cse13*_cse57
+    _cse126 = 1.6153e-5*_cse12
+    _cse127 = 0.20538*_cse21
+    _cse128 = 0.20538*_cse23
+    _cse129 = _cse8*_cse9
+    _cse130 = _cse129*_cse51
+    _cse131 = _cse13*_cse8
+    _cse132 = _cse131*_cse43
+    _cse133 = 4.5318e-5*_cse26
+    _cse134 = _cse27*_cse39
+    _cse135 = _cse27*_cse5
+    _cse136 = _cse17*_cse48
+    _cse137 = 0.010824*_cse28
+    _cse138 = 4.5318e-5*_cse18
+    _cse139 = 0.102286*_cse33
+    _cse140 = -_cse134
+    _cse141 = -_cse130
+    _cse142 = 1.6153e-5*_cse16
+    _cse143 = -_cse128
+    _cse144 = -_cse127
+    _cse145 = -_cse126
+    _cse146 = -_cse133 + _cse25*_cse40 + 0.102286*_cse34
+    _cse147 = _cse131*_cse44 + _cse135 + _cse136 + _cse137 + _cse138 + _cse139 + _cse140 + _cse142 + _cse143 + _cse144 + _cse145 + _cse146
+    _cse148 = _cse141 + _cse147
+    _cse149 = -_cse17
+    _cse150 = _cse149*_cse7
+    _cse151 = _cse150 + _cse26
+    _cse152 = -_cse151
+    _cse153 = _cse149*_cse19
+    _cse154 = _cse149*_cse37 - 4.5318e-5*_cse150 - 0.102286*_cse153
+    _cse155 = _cse146 + _cse152*_cse38 - _cse152*_cse39 + _cse152*_cse5 + _cse154
+    _cse156 = -_cse153 + _cse34
+    _cse157 = _cse102*_cse156 + _cse156*_cse29 + _cse156*_cse31
+    _cse158 = _cse155*dq3 + _cse157*dq4
+    _cse159 = -_cse153 - _cse46
+    _cse160 = _cse102*_cse159 + _cse159*_cse29 + _cse159*_cse31
+    _cse161 = _cse150 - _cse19*_cse24
+    _cse162 = -_cse161
+    _cse163 = _cse161*_cse3
+    _cse164 = _cse11 - _cse15
+    _cse165 = _cse164*_cse19
+    _cse166 = _cse20 + _cse22
+    _cse167 = -_cse165 + _cse166*_cse7
+    _cse168 = _cse167*_cse5
+    _cse169 = _cse166*_cse48
+    _cse170 = -_cse52
+    _cse171 = _cse167*_cse38
+    _cse172 = 4.5318e-5*_cse166*_cse7
+    _cse173 = 0.20538*_cse11
+    _cse174 = _cse166*_cse78
+    _cse175 = -0.20538*_cse15
+    _cse176 = -1.6153e-5*_cse22
+    _cse177 = -1.6153e-5*_cse20
+    _cse178 = -_cse167*_cse39
+    _cse179 = _cse164*_cse7
+    _cse180 = _cse164*_cse40 - 4.5318e-5*_cse165 + 0.102286*_cse179
+    _cse181 = _cse168 + _cse169 + _cse171 + _cse172 + _cse173 + _cse174 + _cse175 + _cse176 + _cse177 + _cse178 + _cse180 - _cse45
+    _cse182 = _cse170 + _cse181
+    _cse183 = -_cse166
+    _cse184 = _cse183*_cse7
+    _cse185 = _cse165 + _cse184
+    _cse186 = -_cse185
+    _cse187 = _cse183*_cse19
+    _cse188 = _cse183*_cse37 - 4.5318e-5*_cse184 - 0.102286*_cse187
+    _cse189 = _cse180 + _cse186*_cse38 - _cse186*_cse39 + _cse186*_cse5 + _cse188
+    _cse190 = _cse179 - _cse187
+    _cse191 = _cse102*_cse190 + _cse190*_cse29 + _cse190*_cse31
+    _cse192 = _cse189*dq3 + _cse191*dq4
+    _cse193 = -_cse164
+    _cse194 = _cse193*_cse7
+    _cse195 = -_cse187 - _cse194
+    _cse196 = _cse102*_cse195 + _cse195*_cse29 + _cse195*_cse31
+    _cse197 = _cse19*_cse193
+    _cse198 = -_cse184 + _cse197
+    _cse199 = -_cse198
+    _cse200 = _cse0*dq0
+    _cse201 = _cse1*_cse101
+    _cse202 = _cse1*dq3
+    _cse203 = -_cse8*dq0
+    _cse204 = _cse1*_cse156
+    _cse205 = _cse1*_cse190
+    out = np.empty((6, 6))
+    out[0, 0] = _cse32*dq4 + _cse42*dq3 + _cse54*dq2 + _cse59*dq1 + dq0*(_cse0*_cse61 + 1.6491e-5*_cse0 - _cse31*_cse8 + _cse64 + 0.1099981*_cse8 + _cse91)
+    out[0, 1] = _cse104 + _cse59*dq0 + _cse94*dq2 + dq1*(-_cse0*_cse92 + _cse91)
+    out[0, 2] = _cse104 + _cse54*dq0 + _cse94*dq1 + dq2*(-_cse50*_cse81 + _cse93)
+    out[0, 3] = _cse100*dq1 + _cse100*dq2 + _cse109*dq4 + _cse42*dq0 + dq3*(_cse105*_cse112 - 0.102286*_cse106 + _cse111*_cse38 - _cse111*_cse39 + _cse111*_cse5 + 4.5318e-5*_cse113 + _cse99)
+    out[0, 4] = _cse103*dq1 + _cse103*dq2 + _cse109*dq3 + _cse32*dq0 + dq4*(_cse110*_cse6 + 4.5293e-5*_cse114 - 0.010824*_cse115 + _cse30*_cse8 + _cse64)
+    out[0, 5] = 0
+    out[1, 0] = _cse116*dq4 + _cse118*dq3 + _cse120*dq2 + _cse121*dq1 + dq0*(-_cse0*_cse31 + 0.1099981*_cse0 + 0.010824*_cse1*_cse27 - _cse122 - _cse123 - _cse124 - _cse125 - _cse126 - _cse127 - _cse128 + 1.6153e-5*_cse13*_cse14*_cse8 - _cse130 - _cse132 - _cse133 - _cse134 + 0.102286*_cse17*_cse19 + _cse17*_cse48 + 4.5318e-5*_cse17*_cse7 + _cse25*_cse40 + 0.102286*_cse25*_cse7 + _cse27*_cse5 - _cse61*_cse8 - 1.6491e-5*_cse8)
+    out[1, 1] = _cse121*dq0 + _cse148*dq2 + _cse158 + dq1*(-_cse124 - _cse125 - _cse132 + _cse135 + _cse136 + _cse137 + _cse138 + _cse139 + _cse140 + _cse141 + _cse142 + _cse143 + _cse144 + _cse145 + _cse146 + _cse8*_cse92)
+    out[1, 2] = _cse120*dq0 + _cse148*dq1 + _cse158 + dq2*(_cse129*_cse50 + _cse147)
+    out[1, 3] = _cse118*dq0 + _cse155*dq1 + _cse155*dq2 + _cse160*dq4 + dq3*(_cse112*_cse24 + _cse154 + _cse162*_cse38 - _cse162*_cse39 + _cse162*_cse5 - 0.102286*_cse46 + 4.5318e-5*_cse49)
+    out[1, 4] = _cse116*dq0 + _cse157*dq1 + _cse157*dq2 + _cse160*dq3 + dq4*(_cse0*_cse30 - _cse122 - _cse123 - _cse161*_cse38 + _cse161*_cse6 + 4.5293e-5*_cse163)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse182*dq2 + _cse192 + dq1*(-0.4251*_cse13 + _cse168 + _cse169 + _cse170 + _cse171 + _cse172 + _cse173 + _cse174 + _cse175 + _cse176 + _cse177 + _cse178 + _cse180 + _cse58 - 0.00087944*_cse9)
+    out[2, 2] = _cse182*dq1 + _cse192 + dq2*(_cse13*_cse50 + _cse181)
+    out[2, 3] = _cse189*dq1 + _cse189*dq2 + _cse196*dq4 + dq3*(_cse112*_cse193 + _cse188 - 0.102286*_cse194 + 4.5318e-5*_cse197 + _cse198*_cse38 - _cse198*_cse39 + _cse198*_cse5)
+    out[2, 4] = _cse191*dq1 + _cse191*dq2 + _cse196*dq3 + dq4*(-_cse199*_cse38 + _cse199*_cse39 + _cse199*_cse6)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse200
+    out[3, 2] = _cse200
+    out[3, 3] = _cse200
+    out[3, 4] = _cse110*dq3 + _cse35*dq0 + _cse96*dq1 + _cse96*dq2
+    out[3, 5] = -_cse108*_cse202 - _cse201*dq1 - _cse201*dq2 + dq0*(_cse0*_cse3 - _cse28) + dq4*(_cse1*_cse8 - _cse114)
+    out[4, 0] = 0
+    out[4, 1] = _cse203
+    out[4, 2] = _cse203
+    out[4, 3] = _cse203
+    out[4, 4] = _cse107*dq0 + _cse151*dq1 + _cse151*dq2 + _cse161*dq3
+    out[4, 5] = -_cse159*_cse202 - _cse204*dq1 - _cse204*dq2 + dq0*(-_cse115 - _cse62) + dq4*(_cse0*_cse1 - _cse163)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse185*dq1 + _cse185*dq2 + _cse199*dq3
+    out[5, 5] = -_cse195*_cse202 - _cse199*_cse3*dq4 - _cse205*dq1 - _cse205*dq2
+    return out
+
+
+# link0[0,0,0]_Tx
+def function21(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((4, 1))
+    out[0, 0] = 0
+    out[1, 0] = 0
+    out[2, 0] = 0.0146500000000000
+    out[3, 0] = 1
+    return out
+
+
+# link0[0,0,0]_J
+def function22(q0, q1, q2, q3, q4, q5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link0[0,0,0]_dJ
+def function23(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    out = np.empty((6, 6))
+    out[0, 0] = 0
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = 0
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = 0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = 0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link1[0,0,0]_Tx
+def function24(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((4, 1))
+    out[0, 0] = -0.00011159*_cse0 - 0.0071771*_cse1
+    out[1, 0] = -0.0071771*_cse0 + 0.00011159*_cse1
+    out[2, 0] = 0.0935311000000000
+    out[3, 0] = 1
+    return out
+
+
+# link1[0,0,0]_J
+def function25(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = 0.0071771*_cse0 - 0.00011159*_cse1
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -0.00011159*_cse0 - 0.0071771*_cse1
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = -_cse1
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link1[0,0,0]_dJ
+def function26(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    out = np.empty((6, 6))
+    out[0, 0] = dq0*(0.00011159*_cse0 + 0.0071771*_cse1)
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = dq0*(0.0071771*_cse0 - 0.00011159*_cse1)
+    out[1, 1] = 0
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse0*dq0
+    out[3, 2] = 0
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = -_cse1*dq0
+    out[4, 2] = 0
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link2[0,0,0]_Tx
+def function27(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = 0.21255*_cse2 - 0.00099446*_cse3
+    out = np.empty((4, 1))
+    out[0, 0] = -_cse0*_cse4 - 1.6491e-5*_cse0 - 0.1345331*_cse1
+    out[1, 0] = -0.1345331*_cse0 + _cse1*_cse4 + 1.6491e-5*_cse1
+    out[2, 0] = 0.00099446*_cse2 + 0.21255*_cse3 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# link2[0,0,0]_J
+def function28(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = math.cos(q1)
+    _cse4 = 0.21255*_cse2 - 0.00099446*_cse3
+    _cse5 = 0.00099446*_cse2 + 0.21255*_cse3
+    _cse6 = -_cse1
+    _cse7 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = 0.1345331*_cse0 - _cse1*_cse4 - 1.6491e-5*_cse1
+    out[0, 1] = -_cse0*_cse5
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -_cse0*_cse4 - 1.6491e-5*_cse0 - 0.1345331*_cse1
+    out[1, 1] = _cse1*_cse5
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse4
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse6
+    out[3, 2] = _cse6
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse7
+    out[4, 2] = _cse7
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link2[0,0,0]_dJ
+def function29(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = math.cos(q1)
+    _cse3 = 0.00099446*_cse1 + 0.21255*_cse2
+    _cse4 = _cse3*dq1
+    _cse5 = math.sin(q0)
+    _cse6 = 0.21255*_cse1 - 0.00099446*_cse2
+    _cse7 = _cse0*dq0
+    _cse8 = -_cse6
+    _cse9 = _cse5*dq0
+    _cse10 = -_cse7
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse4 + dq0*(0.1345331*_cse0 + _cse5*_cse6 + 1.6491e-5*_cse5)
+    out[0, 1] = -_cse3*_cse7 - _cse5*_cse8*dq1
+    out[0, 2] = 0
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -_cse4*_cse5 + dq0*(-_cse0*_cse6 - 1.6491e-5*_cse0 + 0.1345331*_cse5)
+    out[1, 1] = _cse0*_cse8*dq1 - _cse3*_cse9
+    out[1, 2] = 0
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse3*dq1
+    out[2, 2] = 0
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse9
+    out[3, 2] = _cse9
+    out[3, 3] = 0
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse10
+    out[4, 2] = _cse10
+    out[4, 3] = 0
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link3[0,0,0]_Tx
+def function30(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = _cse3 - 0.00099446*_cse4
+    _cse7 = math.sin(q2)
+    _cse8 = math.cos(q2)
+    _cse9 = -0.00067934*_cse7 + 0.18677*_cse8
+    _cse10 = _cse2*_cse9
+    _cse11 = 0.18677*_cse7 + 0.00067934*_cse8
+    _cse12 = _cse1*_cse4
+    out = np.empty((4, 1))
+    out[0, 0] = -_cse0*_cse10 - _cse0*_cse3 - _cse0*_cse6 - 1.6491e-5*_cse0 - 0.0124511*_cse1 - _cse11*_cse5 - 0.00011502*_cse5
+    out[1, 0] = -0.0124511*_cse0 + _cse1*_cse10 + _cse1*_cse3 + _cse1*_cse6 + 1.6491e-5*_cse1 + _cse11*_cse12 + 0.00011502*_cse12
+    out[2, 0] = -_cse11*_cse2 + 0.00087944*_cse2 + _cse4*_cse9 + 0.4251*_cse4 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# link3[0,0,0]_J
+def function31(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 0.00011502*_cse4
+    _cse6 = _cse3 - 0.00099446*_cse4
+    _cse7 = math.sin(q2)
+    _cse8 = math.cos(q2)
+    _cse9 = -0.00067934*_cse7 + 0.18677*_cse8
+    _cse10 = _cse2*_cse9
+    _cse11 = 0.18677*_cse7 + 0.00067934*_cse8
+    _cse12 = _cse11*_cse4
+    _cse13 = 0.21255*_cse4
+    _cse14 = _cse13 + 0.00099446*_cse2
+    _cse15 = _cse4*_cse9
+    _cse16 = _cse0*_cse15
+    _cse17 = -_cse11
+    _cse18 = _cse1*_cse2
+    _cse19 = _cse1*_cse15
+    _cse20 = -_cse1
+    _cse21 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = 0.0124511*_cse0 - _cse1*_cse10 - _cse1*_cse12 - _cse1*_cse3 - _cse1*_cse5 - _cse1*_cse6 - 1.6491e-5*_cse1
+    out[0, 1] = _cse0*_cse11*_cse2 - _cse0*_cse13 - _cse0*_cse14 + 0.00011502*_cse0*_cse2 - _cse16
+    out[0, 2] = -_cse0*_cse17*_cse2 - _cse16
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -_cse0*_cse10 - _cse0*_cse12 - _cse0*_cse3 - _cse0*_cse5 - _cse0*_cse6 - 1.6491e-5*_cse0 - 0.0124511*_cse1
+    out[1, 1] = _cse1*_cse13 + _cse1*_cse14 - _cse11*_cse18 - 0.00011502*_cse18 + _cse19
+    out[1, 2] = _cse17*_cse18 + _cse19
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse10 - _cse12 - 0.4251*_cse2 + 0.00087944*_cse4
+    out[2, 2] = -_cse10 + _cse17*_cse4
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse20
+    out[3, 2] = _cse20
+    out[3, 3] = _cse20
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse21
+    out[4, 2] = _cse21
+    out[4, 3] = _cse21
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link3[0,0,0]_dJ
+def function32(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.cos(q0)
+    _cse1 = math.sin(q1)
+    _cse2 = math.sin(q2)
+    _cse3 = math.cos(q2)
+    _cse4 = 0.18677*_cse2 + 0.00067934*_cse3
+    _cse5 = -_cse4
+    _cse6 = _cse1*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = 0.00067934*_cse2 - 0.18677*_cse3
+    _cse9 = -_cse8
+    _cse10 = _cse7*_cse9
+    _cse11 = _cse0*_cse10
+    _cse12 = -_cse0*_cse6 - _cse11
+    _cse13 = 0.21255*_cse7
+    _cse14 = 0.00099446*_cse1 + _cse13
+    _cse15 = _cse0*_cse1*_cse4 + 0.00011502*_cse0*_cse1 - _cse0*_cse13 - _cse0*_cse14 - _cse11
+    _cse16 = math.sin(q0)
+    _cse17 = 0.21255*_cse1
+    _cse18 = _cse17 - 0.00099446*_cse7
+    _cse19 = _cse16*_cse7
+    _cse20 = _cse1*_cse16
+    _cse21 = _cse16*_cse17 + _cse19*_cse4 + 0.00011502*_cse19 + _cse20*_cse9
+    _cse22 = _cse19*_cse5
+    _cse23 = _cse1*_cse16*_cse9 - _cse22
+    _cse24 = -_cse18
+    _cse25 = _cse10*_cse16
+    _cse26 = -_cse16*_cse6 - _cse25
+    _cse27 = _cse1*_cse16*_cse4 + 0.00011502*_cse1*_cse16 - _cse13*_cse16 - _cse14*_cse16 - _cse25
+    _cse28 = _cse0*_cse1
+    _cse29 = _cse28*_cse9
+    _cse30 = _cse0*_cse7
+    _cse31 = _cse0*_cse17 + 0.00011502*_cse0*_cse7 + _cse29 + _cse30*_cse4
+    _cse32 = _cse30*_cse5
+    _cse33 = -_cse29 + _cse32
+    _cse34 = -_cse10 - _cse6
+    _cse35 = _cse16*dq0
+    _cse36 = -_cse0*dq0
+    out = np.empty((6, 6))
+    out[0, 0] = _cse12*dq2 + _cse15*dq1 + dq0*(0.0124511*_cse0 + _cse16*_cse18 + 1.6491e-5*_cse16 + _cse21)
+    out[0, 1] = _cse15*dq0 + _cse23*dq2 + dq1*(-_cse16*_cse24 + _cse21)
+    out[0, 2] = _cse12*dq0 + _cse23*dq1 + dq2*(-_cse20*_cse8 - _cse22)
+    out[0, 3] = 0
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse26*dq2 + _cse27*dq1 + dq0*(-_cse0*_cse18 - 1.6491e-5*_cse0 + 0.0124511*_cse16 - _cse31)
+    out[1, 1] = _cse27*dq0 + _cse33*dq2 + dq1*(_cse0*_cse24 - _cse31)
+    out[1, 2] = _cse26*dq0 + _cse33*dq1 + dq2*(_cse28*_cse8 + _cse32)
+    out[1, 3] = 0
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse34*dq2 + dq1*(_cse1*_cse4 - 0.00087944*_cse1 - _cse10 - 0.4251*_cse7)
+    out[2, 2] = _cse34*dq1 + dq2*(-_cse6 + _cse7*_cse8)
+    out[2, 3] = 0
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse35
+    out[3, 2] = _cse35
+    out[3, 3] = _cse35
+    out[3, 4] = 0
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse36
+    out[4, 2] = _cse36
+    out[4, 3] = _cse36
+    out[4, 4] = 0
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = 0
+    out[5, 5] = 0
+    return out
+
+
+# link4[0,0,0]_Tx
+def function33(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = _cse2*_cse6
+    _cse8 = _cse0*_cse7
+    _cse9 = math.cos(q2)
+    _cse10 = _cse2*_cse9
+    _cse11 = _cse0*_cse10
+    _cse12 = _cse4*_cse6
+    _cse13 = _cse0*_cse12
+    _cse14 = _cse3 - 0.00099446*_cse4
+    _cse15 = -0.00067934*_cse6 + 0.18677*_cse9
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.18677*_cse6 + 0.00067934*_cse9
+    _cse18 = math.sin(q3)
+    _cse19 = math.cos(q3)
+    _cse20 = -0.0075028*_cse18 - 5.5328e-5*_cse19
+    _cse21 = _cse4*_cse9
+    _cse22 = 5.5328e-5*_cse18 - 0.0075028*_cse19
+    _cse23 = _cse1*_cse4
+    _cse24 = _cse1*_cse7
+    _cse25 = _cse1*_cse10
+    _cse26 = _cse1*_cse12
+    out = np.empty((4, 1))
+    out[0, 0] = -_cse0*_cse14 - _cse0*_cse16 - _cse0*_cse3 + 1.6153e-5*_cse0*_cse4*_cse9 - 1.6491e-5*_cse0 - 0.1031281*_cse1 - 0.20538*_cse11 - 0.20538*_cse13 - _cse17*_cse5 + _cse20*(-_cse0*_cse21 + _cse8) + _cse22*(-_cse11 - _cse13) - 0.00011502*_cse5 - 1.6153e-5*_cse8
+    out[1, 0] = -0.1031281*_cse0 + _cse1*_cse14 + _cse1*_cse16 - 1.6153e-5*_cse1*_cse21 + _cse1*_cse3 + 1.6491e-5*_cse1 + _cse17*_cse23 + _cse20*(_cse1*_cse4*_cse9 - _cse24) + _cse22*(_cse25 + _cse26) + 0.00011502*_cse23 + 1.6153e-5*_cse24 + 0.20538*_cse25 + 0.20538*_cse26
+    out[2, 0] = 1.6153e-5*_cse10 + 1.6153e-5*_cse12 + _cse15*_cse4 - _cse17*_cse2 + 0.00087944*_cse2 + _cse20*(-_cse10 - _cse12) + 0.20538*_cse21 + _cse22*(_cse4*_cse9 - _cse7) + 0.4251*_cse4 - 0.20538*_cse7 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# link4[0,0,0]_J
+def function34(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 0.00011502*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = _cse2*_cse6
+    _cse8 = _cse1*_cse7
+    _cse9 = math.cos(q2)
+    _cse10 = _cse2*_cse9
+    _cse11 = _cse1*_cse10
+    _cse12 = _cse4*_cse6
+    _cse13 = _cse1*_cse12
+    _cse14 = _cse3 - 0.00099446*_cse4
+    _cse15 = -0.00067934*_cse6 + 0.18677*_cse9
+    _cse16 = _cse15*_cse2
+    _cse17 = 0.18677*_cse6 + 0.00067934*_cse9
+    _cse18 = _cse17*_cse4
+    _cse19 = math.sin(q3)
+    _cse20 = math.cos(q3)
+    _cse21 = 0.0075028*_cse19 + 5.5328e-5*_cse20
+    _cse22 = -_cse21
+    _cse23 = _cse4*_cse9
+    _cse24 = _cse1*_cse23
+    _cse25 = -_cse24 + _cse8
+    _cse26 = 5.5328e-5*_cse19 - 0.0075028*_cse20
+    _cse27 = _cse11 + _cse13
+    _cse28 = -_cse27
+    _cse29 = 0.21255*_cse4
+    _cse30 = 0.00099446*_cse2 + _cse29
+    _cse31 = _cse0*_cse7
+    _cse32 = _cse0*_cse23
+    _cse33 = _cse31 - _cse32
+    _cse34 = _cse0*_cse10
+    _cse35 = _cse0*_cse12
+    _cse36 = _cse34 + _cse35
+    _cse37 = _cse15*_cse4
+    _cse38 = -0.20538*_cse0*_cse2*_cse6 + _cse0*_cse37 - _cse22*_cse36 - _cse26*_cse33 + 0.20538*_cse32 + 1.6153e-5*_cse34 + 1.6153e-5*_cse35
+    _cse39 = -_cse17
+    _cse40 = -_cse36
+    _cse41 = _cse1*_cse2
+    _cse42 = -_cse25
+    _cse43 = _cse26*_cse42
+    _cse44 = _cse1*_cse37 + 1.6153e-5*_cse11 + 1.6153e-5*_cse13 + _cse22*_cse28 + 0.20538*_cse24 + _cse43 - 0.20538*_cse8
+    _cse45 = 1.6153e-5*_cse7
+    _cse46 = 0.20538*_cse10
+    _cse47 = 0.20538*_cse12
+    _cse48 = -_cse23 + _cse7
+    _cse49 = -_cse10 - _cse12
+    _cse50 = _cse26*_cse49
+    _cse51 = -_cse48
+    _cse52 = -_cse1
+    _cse53 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = 0.1031281*_cse0 - _cse1*_cse14 - _cse1*_cse16 - _cse1*_cse18 - _cse1*_cse3 + 1.6153e-5*_cse1*_cse4*_cse9 - _cse1*_cse5 - 1.6491e-5*_cse1 - 0.20538*_cse11 - 0.20538*_cse13 + _cse22*_cse25 + _cse26*_cse28 - 1.6153e-5*_cse8
+    out[0, 1] = _cse0*_cse17*_cse2 + 0.00011502*_cse0*_cse2 - _cse0*_cse29 - _cse0*_cse30 - _cse38
+    out[0, 2] = -_cse0*_cse2*_cse39 - _cse38
+    out[0, 3] = _cse21*_cse40 + _cse26*_cse33
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = -_cse0*_cse14 - _cse0*_cse16 - _cse0*_cse18 - _cse0*_cse3 + 1.6153e-5*_cse0*_cse4*_cse9 - _cse0*_cse5 - 1.6491e-5*_cse0 - 0.1031281*_cse1 + _cse22*_cse33 + _cse26*_cse40 - 1.6153e-5*_cse31 - 0.20538*_cse34 - 0.20538*_cse35
+    out[1, 1] = _cse1*_cse29 + _cse1*_cse30 - _cse17*_cse41 - 0.00011502*_cse41 + _cse44
+    out[1, 2] = _cse39*_cse41 + _cse44
+    out[1, 3] = _cse21*_cse27 + _cse43
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -_cse16 - _cse18 - 0.4251*_cse2 + _cse22*_cse48 + _cse26*_cse49 + 1.6153e-5*_cse4*_cse9 + 0.00087944*_cse4 - _cse45 - _cse46 - _cse47
+    out[2, 2] = -_cse16 + _cse22*_cse48 + 1.6153e-5*_cse23 + _cse39*_cse4 - _cse45 - _cse46 - _cse47 + _cse50
+    out[2, 3] = _cse21*_cse51 + _cse50
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse52
+    out[3, 2] = _cse52
+    out[3, 3] = _cse52
+    out[3, 4] = _cse19*_cse33 + _cse20*_cse40
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse53
+    out[4, 2] = _cse53
+    out[4, 3] = _cse53
+    out[4, 4] = _cse19*_cse42 + _cse20*_cse27
+    out[4, 5] = 0
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse19*_cse49 + _cse20*_cse51
+    out[5, 5] = 0
+    return out
+
+
+# link4[0,0,0]_dJ
+def function35(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q3)
+    _cse1 = math.cos(q3)
+    _cse2 = 5.5328e-5*_cse0 - 0.0075028*_cse1
+    _cse3 = math.cos(q0)
+    _cse4 = math.sin(q1)
+    _cse5 = math.sin(q2)
+    _cse6 = _cse4*_cse5
+    _cse7 = _cse3*_cse6
+    _cse8 = math.cos(q1)
+    _cse9 = math.cos(q2)
+    _cse10 = _cse8*_cse9
+    _cse11 = _cse10*_cse3
+    _cse12 = -_cse11 + _cse7
+    _cse13 = 0.0075028*_cse0 + 5.5328e-5*_cse1
+    _cse14 = _cse4*_cse9
+    _cse15 = _cse14*_cse3
+    _cse16 = _cse5*_cse8
+    _cse17 = _cse16*_cse3
+    _cse18 = _cse15 + _cse17
+    _cse19 = -_cse18
+    _cse20 = _cse12*_cse2 + _cse13*_cse19
+    _cse21 = 0.18677*_cse5 + 0.00067934*_cse9
+    _cse22 = -_cse21
+    _cse23 = _cse22*_cse4
+    _cse24 = -_cse13
+    _cse25 = 0.00067934*_cse5 - 0.18677*_cse9
+    _cse26 = -_cse25
+    _cse27 = _cse26*_cse8
+    _cse28 = 0.20538*_cse11 - _cse12*_cse2 + 1.6153e-5*_cse15 + 1.6153e-5*_cse17 - _cse18*_cse24 + _cse27*_cse3 - 0.20538*_cse3*_cse4*_cse5
+    _cse29 = -_cse23*_cse3 - _cse28
+    _cse30 = 0.21255*_cse8
+    _cse31 = _cse30 + 0.00099446*_cse4
+    _cse32 = _cse21*_cse3*_cse4 - _cse28 - _cse3*_cse30 - _cse3*_cse31 + 0.00011502*_cse3*_cse4
+    _cse33 = math.sin(q0)
+    _cse34 = 0.21255*_cse4
+    _cse35 = _cse34 - 0.00099446*_cse8
+    _cse36 = _cse14*_cse33
+    _cse37 = _cse16*_cse33
+    _cse38 = _cse36 + _cse37
+    _cse39 = _cse2*_cse38
+    _cse40 = _cse33*_cse6
+    _cse41 = -_cse33*_cse8*_cse9 + _cse40
+    _cse42 = -_cse24*_cse41
+    _cse43 = _cse33*_cse4
+    _cse44 = _cse26*_cse43
+    _cse45 = 0.20538*_cse37
+    _cse46 = 0.20538*_cse36
+    _cse47 = 1.6153e-5*_cse40
+    _cse48 = _cse10*_cse33
+    _cse49 = -1.6153e-5*_cse48
+    _cse50 = _cse33*_cse8
+    _cse51 = _cse21*_cse50 + _cse33*_cse34 + _cse39 + _cse42 + _cse44 + _cse45 + _cse46 + _cse47 + _cse49 + 0.00011502*_cse50
+    _cse52 = _cse13*_cse41
+    _cse53 = _cse39 + _cse52
+    _cse54 = _cse53*dq3
+    _cse55 = -_cse22*_cse50 + _cse39 + _cse42 + _cse45 + _cse46 + _cse47 + _cse49
+    _cse56 = _cse44 + _cse55
+    _cse57 = -_cse35
+    _cse58 = -_cse2
+    _cse59 = -_cse38
+    _cse60 = _cse13*_cse59 + _cse2*_cse41
+    _cse61 = -_cse2*_cse41 - _cse24*_cse38 + _cse27*_cse33 - 0.20538*_cse33*_cse4*_cse5 + 1.6153e-5*_cse36 + 1.6153e-5*_cse37 + 0.20538*_cse48
+    _cse62 = -_cse23*_cse33 - _cse61
+    _cse63 = _cse21*_cse33*_cse4 - _cse30*_cse33 - _cse31*_cse33 + 0.00011502*_cse33*_cse4 - _cse61
+    _cse64 = _cse3*_cse4
+    _cse65 = _cse26*_cse64
+    _cse66 = _cse3*_cse8
+    _cse67 = 0.20538*_cse17
+    _cse68 = 0.20538*_cse15
+    _cse69 = 1.6153e-5*_cse7
+    _cse70 = -_cse12*_cse24 - _cse19*_cse2 + _cse21*_cse66 + _cse3*_cse34 - 1.6153e-5*_cse3*_cse8*_cse9 + 0.00011502*_cse3*_cse8 + _cse65 + _cse67 + _cse68 + _cse69
+    _cse71 = -_cse12
+    _cse72 = _cse13*_cse71
+    _cse73 = _cse19*_cse2
+    _cse74 = _cse72 + _cse73
+    _cse75 = _cse74*dq3
+    _cse76 = 1.6153e-5*_cse11 + _cse12*_cse24 + _cse22*_cse66 - _cse67 - _cse68 - _cse69 + _cse73
+    _cse77 = -_cse65 + _cse76
+    _cse78 = -_cse10 + _cse6
+    _cse79 = _cse2*_cse78
+    _cse80 = _cse14 + _cse16
+    _cse81 = -_cse80
+    _cse82 = _cse13*_cse81
+    _cse83 = _cse79 + _cse82
+    _cse84 = _cse83*dq3
+    _cse85 = 0.20538*_cse10
+    _cse86 = 1.6153e-5*_cse16
+    _cse87 = 1.6153e-5*_cse14
+    _cse88 = -_cse2*_cse78 - _cse24*_cse80 + _cse27 - 0.20538*_cse4*_cse5 + _cse85 + _cse86 + _cse87
+    _cse89 = -_cse23 - _cse88
+    _cse90 = -_cse78
+    _cse91 = _cse33*dq0
+    _cse92 = _cse1*_cse41
+    _cse93 = _cse0*_cse38 + _cse92
+    _cse94 = -_cse3*dq0
+    _cse95 = _cse1*_cse71
+    _cse96 = _cse0*_cse19 + _cse95
+    _cse97 = _cse0*_cse78 + _cse1*_cse81
+    out = np.empty((6, 6))
+    out[0, 0] = _cse20*dq3 + _cse29*dq2 + _cse32*dq1 + dq0*(0.1031281*_cse3 + _cse33*_cse35 + 1.6491e-5*_cse33 + _cse51)
+    out[0, 1] = _cse32*dq0 + _cse54 + _cse56*dq2 + dq1*(-_cse33*_cse57 + _cse51)
+    out[0, 2] = _cse29*dq0 + _cse54 + _cse56*dq1 + dq2*(-_cse25*_cse43 + _cse55)
+    out[0, 3] = _cse20*dq0 + _cse53*dq1 + _cse53*dq2 + dq3*(_cse52 + _cse58*_cse59)
+    out[0, 4] = 0
+    out[0, 5] = 0
+    out[1, 0] = _cse60*dq3 + _cse62*dq2 + _cse63*dq1 + dq0*(-_cse3*_cse35 - 1.6491e-5*_cse3 + 0.1031281*_cse33 - _cse70)
+    out[1, 1] = _cse63*dq0 + _cse75 + _cse77*dq2 + dq1*(_cse3*_cse57 - _cse70)
+    out[1, 2] = _cse62*dq0 + _cse75 + _cse77*dq1 + dq2*(_cse25*_cse64 + _cse76)
+    out[1, 3] = _cse60*dq0 + _cse74*dq1 + _cse74*dq2 + dq3*(_cse18*_cse58 + _cse72)
+    out[1, 4] = 0
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse84 + _cse89*dq2 + dq1*(_cse21*_cse4 - 0.00087944*_cse4 - 0.4251*_cse8 - _cse88)
+    out[2, 2] = _cse84 + _cse89*dq1 + dq2*(-_cse23 + _cse24*_cse80 + _cse25*_cse8 + 0.20538*_cse6 + _cse79 - _cse85 - _cse86 - _cse87)
+    out[2, 3] = _cse83*dq1 + _cse83*dq2 + dq3*(_cse58*_cse90 + _cse82)
+    out[2, 4] = 0
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse91
+    out[3, 2] = _cse91
+    out[3, 3] = _cse91
+    out[3, 4] = _cse93*dq1 + _cse93*dq2 + dq0*(_cse0*_cse12 + _cse1*_cse19) + dq3*(-_cse0*_cse59 + _cse92)
+    out[3, 5] = 0
+    out[4, 0] = 0
+    out[4, 1] = _cse94
+    out[4, 2] = _cse94
+    out[4, 3] = _cse94
+    out[4, 4] = _cse96*dq1 + _cse96*dq2 + dq0*(_cse0*_cse41 + _cse1*_cse59) + dq3*(-_cse0*_cse18 + _cse95)
+    out[4, 5] = 0
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse97*dq1 + _cse97*dq2 + dq3*(-_cse0*_cse90 + _cse1*_cse81)
+    out[5, 5] = 0
+    return out
+
+
+# link5[0,0,0]_Tx
+def function36(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = _cse2*_cse6
+    _cse8 = _cse0*_cse7
+    _cse9 = math.cos(q2)
+    _cse10 = _cse2*_cse9
+    _cse11 = _cse0*_cse10
+    _cse12 = _cse4*_cse6
+    _cse13 = _cse0*_cse12
+    _cse14 = _cse3 - 0.00099446*_cse4
+    _cse15 = math.sin(q4)
+    _cse16 = math.cos(q4)
+    _cse17 = -5.009e-5*_cse15 + 0.0036091*_cse16
+    _cse18 = -0.00067934*_cse6 + 0.18677*_cse9
+    _cse19 = _cse18*_cse2
+    _cse20 = 0.18677*_cse6 + 0.00067934*_cse9
+    _cse21 = math.sin(q3)
+    _cse22 = _cse4*_cse9
+    _cse23 = -_cse0*_cse22 + _cse8
+    _cse24 = math.cos(q3)
+    _cse25 = -_cse11 - _cse13
+    _cse26 = _cse21*_cse25
+    _cse27 = -0.0075028*_cse21 - 5.5328e-5*_cse24
+    _cse28 = 5.5328e-5*_cse21 - 0.0075028*_cse24
+    _cse29 = 0.0036091*_cse15 + 5.009e-5*_cse16
+    _cse30 = _cse1*_cse4
+    _cse31 = _cse1*_cse7
+    _cse32 = _cse1*_cse10
+    _cse33 = _cse1*_cse12
+    _cse34 = _cse32 + _cse33
+    _cse35 = _cse21*_cse34
+    _cse36 = 0.095416*_cse24
+    _cse37 = _cse1*_cse4*_cse9 - _cse31
+    _cse38 = 0.095416*_cse21
+    _cse39 = _cse24*_cse37
+    _cse40 = _cse4*_cse9 - _cse7
+    _cse41 = _cse21*_cse40
+    _cse42 = -_cse10 - _cse12
+    out = np.empty((4, 1))
+    out[0, 0] = -_cse0*_cse14 - _cse0*_cse19 - _cse0*_cse3 + 1.6153e-5*_cse0*_cse4*_cse9 - 1.6491e-5*_cse0 + _cse1*_cse17 - 0.1099981*_cse1 - 0.20538*_cse11 - 0.20538*_cse13 - _cse20*_cse5 + 0.095416*_cse21*_cse23 + 4.5318e-5*_cse23*_cse24 + _cse23*_cse27 + 0.095416*_cse24*_cse25 + _cse25*_cse28 - 4.5318e-5*_cse26 + _cse29*(_cse23*_cse24 - _cse26) - 0.00011502*_cse5 - 1.6153e-5*_cse8
+    out[1, 0] = _cse0*_cse17 - 0.1099981*_cse0 + _cse1*_cse14 + _cse1*_cse19 - 1.6153e-5*_cse1*_cse22 + _cse1*_cse3 + 1.6491e-5*_cse1 + _cse20*_cse30 + _cse27*_cse37 + _cse28*_cse34 + _cse29*(-_cse35 + _cse39) + 0.00011502*_cse30 + 1.6153e-5*_cse31 + 0.20538*_cse32 + 0.20538*_cse33 + _cse34*_cse36 - 4.5318e-5*_cse35 + _cse37*_cse38 + 4.5318e-5*_cse39
+    out[2, 0] = 1.6153e-5*_cse10 + 1.6153e-5*_cse12 + _cse18*_cse4 - _cse2*_cse20 + 0.00087944*_cse2 + 0.20538*_cse22 + 4.5318e-5*_cse24*_cse42 + _cse27*_cse42 + _cse28*_cse40 + _cse29*(_cse24*_cse42 - _cse41) + _cse36*_cse40 + _cse38*_cse42 + 0.4251*_cse4 - 4.5318e-5*_cse41 - 0.20538*_cse7 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# link5[0,0,0]_J
+def function37(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = 0.00011502*_cse4
+    _cse6 = math.sin(q2)
+    _cse7 = _cse2*_cse6
+    _cse8 = _cse1*_cse7
+    _cse9 = math.cos(q2)
+    _cse10 = _cse2*_cse9
+    _cse11 = _cse1*_cse10
+    _cse12 = _cse4*_cse6
+    _cse13 = _cse1*_cse12
+    _cse14 = _cse3 - 0.00099446*_cse4
+    _cse15 = math.sin(q4)
+    _cse16 = math.cos(q4)
+    _cse17 = -5.009e-5*_cse15 + 0.0036091*_cse16
+    _cse18 = -0.00067934*_cse6 + 0.18677*_cse9
+    _cse19 = _cse18*_cse2
+    _cse20 = 0.18677*_cse6 + 0.00067934*_cse9
+    _cse21 = _cse20*_cse4
+    _cse22 = math.sin(q3)
+    _cse23 = _cse4*_cse9
+    _cse24 = _cse1*_cse23
+    _cse25 = -_cse24 + _cse8
+    _cse26 = math.cos(q3)
+    _cse27 = _cse11 + _cse13
+    _cse28 = -_cse27
+    _cse29 = _cse22*_cse28
+    _cse30 = 0.0075028*_cse22 + 5.5328e-5*_cse26
+    _cse31 = -_cse30
+    _cse32 = 5.5328e-5*_cse22 - 0.0075028*_cse26
+    _cse33 = 0.0036091*_cse15 + 5.009e-5*_cse16
+    _cse34 = 0.21255*_cse4
+    _cse35 = 0.00099446*_cse2 + _cse34
+    _cse36 = _cse0*_cse2
+    _cse37 = _cse0*_cse7
+    _cse38 = _cse0*_cse23
+    _cse39 = _cse37 - _cse38
+    _cse40 = _cse22*_cse39
+    _cse41 = _cse0*_cse10
+    _cse42 = _cse0*_cse12
+    _cse43 = _cse41 + _cse42
+    _cse44 = 0.095416*_cse22
+    _cse45 = _cse18*_cse4
+    _cse46 = _cse26*_cse39
+    _cse47 = _cse32*_cse39 - 4.5318e-5*_cse40 + 0.095416*_cse46
+    _cse48 = -_cse0*_cse45 + 4.5318e-5*_cse26*_cse43 + _cse31*_cse43 + _cse33*(_cse26*_cse43 - _cse40) + 0.20538*_cse37 - 0.20538*_cse38 - 1.6153e-5*_cse41 - 1.6153e-5*_cse42 + _cse43*_cse44 + _cse47
+    _cse49 = -_cse20
+    _cse50 = -_cse43
+    _cse51 = _cse26*_cse50
+    _cse52 = _cse40 + _cse51
+    _cse53 = _cse22*_cse50
+    _cse54 = -_cse33
+    _cse55 = _cse46 - _cse53
+    _cse56 = _cse1*_cse2
+    _cse57 = -_cse25
+    _cse58 = _cse22*_cse57
+    _cse59 = _cse26*_cse57
+    _cse60 = _cse32*_cse57 - 4.5318e-5*_cse58 + 0.095416*_cse59
+    _cse61 = _cse1*_cse45 + 1.6153e-5*_cse11 + 1.6153e-5*_cse13 + 0.20538*_cse24 + 4.5318e-5*_cse26*_cse28 + _cse28*_cse31 + 0.095416*_cse29 + _cse33*(_cse26*_cse28 - _cse58) + _cse60 - 0.20538*_cse8
+    _cse62 = _cse26*_cse27
+    _cse63 = _cse58 + _cse62
+    _cse64 = _cse22*_cse27
+    _cse65 = _cse59 - _cse64
+    _cse66 = -_cse23 + _cse7
+    _cse67 = _cse26*_cse66
+    _cse68 = -_cse10 - _cse12
+    _cse69 = _cse22*_cse68
+    _cse70 = 0.095416*_cse26*_cse68 + _cse32*_cse68 - 4.5318e-5*_cse69
+    _cse71 = -0.20538*_cse10 - 0.20538*_cse12 - _cse19 + 1.6153e-5*_cse23 + _cse31*_cse66 + _cse33*(_cse67 - _cse69) + _cse44*_cse66 + 4.5318e-5*_cse67 - 1.6153e-5*_cse7 + _cse70
+    _cse72 = -_cse66
+    _cse73 = _cse26*_cse72
+    _cse74 = _cse69 + _cse73
+    _cse75 = _cse22*_cse72
+    _cse76 = _cse26*_cse68 - _cse75
+    _cse77 = -_cse1
+    _cse78 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse17 + 0.1099981*_cse0 - _cse1*_cse14 - _cse1*_cse19 - _cse1*_cse21 - _cse1*_cse3 + 1.6153e-5*_cse1*_cse4*_cse9 - _cse1*_cse5 - 1.6491e-5*_cse1 - 0.20538*_cse11 - 0.20538*_cse13 + 0.095416*_cse22*_cse25 + 4.5318e-5*_cse25*_cse26 + _cse25*_cse31 + 0.095416*_cse26*_cse28 + _cse28*_cse32 - 4.5318e-5*_cse29 + _cse33*(_cse25*_cse26 - _cse29) - 1.6153e-5*_cse8
+    out[0, 1] = -_cse0*_cse34 - _cse0*_cse35 + _cse20*_cse36 + 0.00011502*_cse36 + _cse48
+    out[0, 2] = -_cse36*_cse49 + _cse48
+    out[0, 3] = _cse30*_cse50 - _cse33*_cse52 + _cse47 - 4.5318e-5*_cse51 - 0.095416*_cse53
+    out[0, 4] = _cse1*_cse54 + _cse17*_cse55
+    out[0, 5] = 0
+    out[1, 0] = -_cse0*_cse14 - _cse0*_cse19 - _cse0*_cse21 - _cse0*_cse3 + 1.6153e-5*_cse0*_cse4*_cse9 - _cse0*_cse5 - 1.6491e-5*_cse0 + _cse1*_cse17 - 0.1099981*_cse1 + 0.095416*_cse22*_cse39 + 4.5318e-5*_cse26*_cse39 + 0.095416*_cse26*_cse50 + _cse31*_cse39 + _cse32*_cse50 + _cse33*_cse55 - 1.6153e-5*_cse37 - 0.20538*_cse41 - 0.20538*_cse42 - 4.5318e-5*_cse53
+    out[1, 1] = _cse1*_cse34 + _cse1*_cse35 - _cse20*_cse56 - 0.00011502*_cse56 + _cse61
+    out[1, 2] = _cse49*_cse56 + _cse61
+    out[1, 3] = _cse27*_cse30 - _cse33*_cse63 + _cse60 - 4.5318e-5*_cse62 - 0.095416*_cse64
+    out[1, 4] = _cse0*_cse54 + _cse17*_cse65
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = -0.4251*_cse2 - _cse21 + 0.00087944*_cse4 + _cse71
+    out[2, 2] = _cse4*_cse49 + _cse71
+    out[2, 3] = _cse30*_cse72 - _cse33*_cse74 + _cse70 - 4.5318e-5*_cse73 - 0.095416*_cse75
+    out[2, 4] = _cse17*_cse76
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse77
+    out[3, 2] = _cse77
+    out[3, 3] = _cse77
+    out[3, 4] = _cse52
+    out[3, 5] = -_cse1*_cse16 - _cse15*_cse55
+    out[4, 0] = 0
+    out[4, 1] = _cse78
+    out[4, 2] = _cse78
+    out[4, 3] = _cse78
+    out[4, 4] = _cse63
+    out[4, 5] = -_cse0*_cse16 - _cse15*_cse65
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse74
+    out[5, 5] = -_cse15*_cse76
+    return out
+
+
+# link5[0,0,0]_dJ
+def function38(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q4)
+    _cse2 = math.cos(q4)
+    _cse3 = 0.0036091*_cse1 + 5.009e-5*_cse2
+    _cse4 = -_cse3
+    _cse5 = 5.009e-5*_cse1 - 0.0036091*_cse2
+    _cse6 = -_cse5
+    _cse7 = math.cos(q3)
+    _cse8 = math.cos(q0)
+    _cse9 = math.sin(q1)
+    _cse10 = math.sin(q2)
+    _cse11 = _cse10*_cse9
+    _cse12 = _cse11*_cse8
+    _cse13 = math.cos(q1)
+    _cse14 = math.cos(q2)
+    _cse15 = _cse13*_cse14
+    _cse16 = _cse15*_cse8
+    _cse17 = _cse12 - _cse16
+    _cse18 = _cse17*_cse7
+    _cse19 = math.sin(q3)
+    _cse20 = _cse14*_cse9
+    _cse21 = _cse20*_cse8
+    _cse22 = _cse10*_cse13
+    _cse23 = _cse22*_cse8
+    _cse24 = _cse21 + _cse23
+    _cse25 = -_cse24
+    _cse26 = _cse19*_cse25
+    _cse27 = _cse18 - _cse26
+    _cse28 = -_cse0*_cse4 + _cse27*_cse6
+    _cse29 = _cse17*_cse19
+    _cse30 = _cse25*_cse7
+    _cse31 = _cse29 + _cse30
+    _cse32 = 0.0075028*_cse19 + 5.5328e-5*_cse7
+    _cse33 = 5.5328e-5*_cse19 - 0.0075028*_cse7
+    _cse34 = _cse17*_cse33 + 0.095416*_cse18 - 4.5318e-5*_cse29
+    _cse35 = _cse25*_cse32 - 0.095416*_cse26 - _cse3*_cse31 - 4.5318e-5*_cse30 + _cse34
+    _cse36 = 0.18677*_cse10 + 0.00067934*_cse14
+    _cse37 = -_cse36
+    _cse38 = _cse37*_cse9
+    _cse39 = _cse24*_cse7
+    _cse40 = -_cse32
+    _cse41 = _cse19*_cse24
+    _cse42 = 0.00067934*_cse10 - 0.18677*_cse14
+    _cse43 = -_cse42
+    _cse44 = _cse13*_cse43
+    _cse45 = 0.20538*_cse12 - 0.20538*_cse16 - 1.6153e-5*_cse21 - 1.6153e-5*_cse23 + _cse24*_cse40 + _cse3*(-_cse29 + _cse39) + _cse34 + 4.5318e-5*_cse39 + 0.095416*_cse41 - _cse44*_cse8
+    _cse46 = -_cse38*_cse8 + _cse45
+    _cse47 = 0.21255*_cse13
+    _cse48 = _cse47 + 0.00099446*_cse9
+    _cse49 = 0.00011502*_cse8
+    _cse50 = _cse36*_cse9
+    _cse51 = _cse45 - _cse47*_cse8 - _cse48*_cse8 + _cse49*_cse9 + _cse50*_cse8
+    _cse52 = 0.21255*_cse9
+    _cse53 = -0.00099446*_cse13 + _cse52
+    _cse54 = _cse0*_cse11
+    _cse55 = -_cse0*_cse13*_cse14 + _cse54
+    _cse56 = -_cse55
+    _cse57 = _cse56*_cse7
+    _cse58 = _cse0*_cse20
+    _cse59 = _cse0*_cse22
+    _cse60 = _cse58 + _cse59
+    _cse61 = _cse19*_cse60
+    _cse62 = _cse3*(_cse57 - _cse61)
+    _cse63 = _cse40*_cse56
+    _cse64 = 4.5318e-5*_cse57
+    _cse65 = 0.095416*_cse19
+    _cse66 = _cse56*_cse65
+    _cse67 = _cse0*_cse9
+    _cse68 = _cse43*_cse67
+    _cse69 = 0.20538*_cse59
+    _cse70 = 0.20538*_cse58
+    _cse71 = 1.6153e-5*_cse54
+    _cse72 = _cse0*_cse15
+    _cse73 = -1.6153e-5*_cse72
+    _cse74 = _cse0*_cse13
+    _cse75 = _cse60*_cse7
+    _cse76 = _cse33*_cse60 - 4.5318e-5*_cse61 + 0.095416*_cse75
+    _cse77 = _cse0*_cse52 + _cse36*_cse74 + _cse62 + _cse63 + _cse64 + _cse66 + _cse68 + _cse69 + _cse70 + _cse71 + _cse73 + 0.00011502*_cse74 + _cse76
+    _cse78 = -_cse53
+    _cse79 = -_cse37*_cse74 + _cse62 + _cse63 + _cse64 + _cse66 + _cse69 + _cse70 + _cse71 + _cse73 + _cse76
+    _cse80 = _cse68 + _cse79
+    _cse81 = _cse55*_cse7
+    _cse82 = _cse61 + _cse81
+    _cse83 = _cse19*_cse55
+    _cse84 = _cse32*_cse55 - 4.5318e-5*_cse81 - 0.095416*_cse83
+    _cse85 = -_cse3*_cse82 + _cse76 + _cse84
+    _cse86 = _cse60*_cse7 - _cse83
+    _cse87 = _cse6*dq4
+    _cse88 = _cse85*dq3 + _cse86*_cse87
+    _cse89 = -_cse60
+    _cse90 = _cse7*_cse89
+    _cse91 = _cse83 + _cse90
+    _cse92 = -_cse91
+    _cse93 = -_cse19*_cse89 + _cse81
+    _cse94 = -_cse33
+    _cse95 = _cse19*_cse89
+    _cse96 = _cse6*_cse86
+    _cse97 = _cse6*dq3
+    _cse98 = _cse4*_cse8 + _cse6*_cse93
+    _cse99 = _cse33*_cse55 + 0.095416*_cse81 - 4.5318e-5*_cse83
+    _cse100 = _cse3*_cse92 + _cse32*_cse89 - 4.5318e-5*_cse90 - 0.095416*_cse95 + _cse99
+    _cse101 = -_cse0*_cse44 + _cse3*_cse86 + _cse40*_cse60 + 0.20538*_cse54 - 1.6153e-5*_cse58 - 1.6153e-5*_cse59 + 0.095416*_cse61 - 0.20538*_cse72 + 4.5318e-5*_cse75 + _cse99
+    _cse102 = -_cse0*_cse38 + _cse101
+    _cse103 = -_cse0*_cse47 - _cse0*_cse48 + _cse0*_cse50 + _cse101 + 0.00011502*_cse67
+    _cse104 = _cse52*_cse8
+    _cse105 = _cse13*_cse49
+    _cse106 = 1.6153e-5*_cse12
+    _cse107 = 0.20538*_cse21
+    _cse108 = 0.20538*_cse23
+    _cse109 = _cse8*_cse9
+    _cse110 = _cse109*_cse43
+    _cse111 = _cse13*_cse8
+    _cse112 = _cse111*_cse36
+    _cse113 = 4.5318e-5*_cse26
+    _cse114 = _cse27*_cse3
+    _cse115 = _cse17*_cse40
+    _cse116 = 4.5318e-5*_cse18
+    _cse117 = 0.095416*_cse29
+    _cse118 = -_cse110
+    _cse119 = 1.6153e-5*_cse16
+    _cse120 = -_cse108
+    _cse121 = -_cse107
+    _cse122 = -_cse106
+    _cse123 = -_cse113 + _cse25*_cse33 + 0.095416*_cse30
+    _cse124 = _cse111*_cse37 + _cse114 + _cse115 + _cse116 + _cse117 + _cse119 + _cse120 + _cse121 + _cse122 + _cse123
+    _cse125 = _cse118 + _cse124
+    _cse126 = -_cse17
+    _cse127 = _cse126*_cse7
+    _cse128 = _cse127 + _cse26
+    _cse129 = _cse126*_cse19
+    _cse130 = _cse126*_cse32 - 4.5318e-5*_cse127 - 0.095416*_cse129
+    _cse131 = _cse123 - _cse128*_cse3 + _cse130
+    _cse132 = -_cse129 + _cse30
+    _cse133 = _cse131*dq3 + _cse132*_cse87
+    _cse134 = -_cse129 - _cse39
+    _cse135 = _cse127 - _cse19*_cse24
+    _cse136 = _cse132*_cse6
+    _cse137 = _cse11 - _cse15
+    _cse138 = _cse137*_cse19
+    _cse139 = _cse20 + _cse22
+    _cse140 = _cse3*(-_cse138 + _cse139*_cse7)
+    _cse141 = _cse139*_cse40
+    _cse142 = -_cse44
+    _cse143 = 4.5318e-5*_cse139*_cse7
+    _cse144 = _cse139*_cse65
+    _cse145 = 0.20538*_cse11
+    _cse146 = -0.20538*_cse15
+    _cse147 = -1.6153e-5*_cse22
+    _cse148 = -1.6153e-5*_cse20
+    _cse149 = _cse137*_cse7
+    _cse150 = _cse137*_cse33 - 4.5318e-5*_cse138 + 0.095416*_cse149
+    _cse151 = _cse140 + _cse141 + _cse143 + _cse144 + _cse145 + _cse146 + _cse147 + _cse148 + _cse150 - _cse38
+    _cse152 = _cse142 + _cse151
+    _cse153 = -_cse139
+    _cse154 = _cse153*_cse7
+    _cse155 = _cse138 + _cse154
+    _cse156 = _cse153*_cse19
+    _cse157 = _cse153*_cse32 - 4.5318e-5*_cse154 - 0.095416*_cse156
+    _cse158 = _cse150 - _cse155*_cse3 + _cse157
+    _cse159 = _cse149 - _cse156
+    _cse160 = _cse158*dq3 + _cse159*_cse87
+    _cse161 = -_cse137
+    _cse162 = _cse161*_cse7
+    _cse163 = -_cse156 - _cse162
+    _cse164 = _cse161*_cse19
+    _cse165 = -_cse154 + _cse164
+    _cse166 = _cse159*_cse6
+    _cse167 = -_cse165
+    _cse168 = _cse167*dq4
+    _cse169 = _cse0*dq0
+    _cse170 = _cse1*_cse86
+    _cse171 = _cse1*dq3
+    _cse172 = -_cse8*dq0
+    _cse173 = _cse1*_cse132
+    _cse174 = _cse1*_cse159
+    out = np.empty((6, 6))
+    out[0, 0] = _cse28*dq4 + _cse35*dq3 + _cse46*dq2 + _cse51*dq1 + dq0*(_cse0*_cse53 + 1.6491e-5*_cse0 - _cse6*_cse8 + _cse77 + 0.1099981*_cse8)
+    out[0, 1] = _cse51*dq0 + _cse80*dq2 + _cse88 + dq1*(-_cse0*_cse78 + _cse77)
+    out[0, 2] = _cse46*dq0 + _cse80*dq1 + _cse88 + dq2*(-_cse42*_cse67 + _cse79)
+    out[0, 3] = _cse35*dq0 + _cse85*dq1 + _cse85*dq2 + _cse87*_cse92 + dq3*(-_cse3*_cse93 + _cse84 + _cse89*_cse94 - 0.095416*_cse90 + 4.5318e-5*_cse95)
+    out[0, 4] = _cse28*dq0 + _cse92*_cse97 + _cse96*dq1 + _cse96*dq2 + dq4*(_cse4*_cse93 + _cse5*_cse8)
+    out[0, 5] = 0
+    out[1, 0] = _cse100*dq3 + _cse102*dq2 + _cse103*dq1 + _cse98*dq4 + dq0*(-_cse0*_cse6 + 0.1099981*_cse0 - _cse104 - _cse105 - _cse106 - _cse107 - _cse108 - _cse110 - _cse112 - _cse113 + 1.6153e-5*_cse13*_cse14*_cse8 + 0.095416*_cse17*_cse19 + _cse17*_cse40 + 4.5318e-5*_cse17*_cse7 + _cse25*_cse33 + 0.095416*_cse25*_cse7 + _cse27*_cse3 - _cse53*_cse8 - 1.6491e-5*_cse8)
+    out[1, 1] = _cse103*dq0 + _cse125*dq2 + _cse133 + dq1*(-_cse104 - _cse105 - _cse112 + _cse114 + _cse115 + _cse116 + _cse117 + _cse118 + _cse119 + _cse120 + _cse121 + _cse122 + _cse123 + _cse78*_cse8)
+    out[1, 2] = _cse102*dq0 + _cse125*dq1 + _cse133 + dq2*(_cse109*_cse42 + _cse124)
+    out[1, 3] = _cse100*dq0 + _cse131*dq1 + _cse131*dq2 + _cse134*_cse87 + dq3*(_cse130 - _cse135*_cse3 + _cse24*_cse94 - 0.095416*_cse39 + 4.5318e-5*_cse41)
+    out[1, 4] = _cse134*_cse97 + _cse136*dq1 + _cse136*dq2 + _cse98*dq0 + dq4*(_cse0*_cse5 + _cse135*_cse4)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse152*dq2 + _cse160 + dq1*(-0.4251*_cse13 + _cse140 + _cse141 + _cse142 + _cse143 + _cse144 + _cse145 + _cse146 + _cse147 + _cse148 + _cse150 + _cse50 - 0.00087944*_cse9)
+    out[2, 2] = _cse152*dq1 + _cse160 + dq2*(_cse13*_cse42 + _cse151)
+    out[2, 3] = _cse158*dq1 + _cse158*dq2 + _cse163*_cse87 + dq3*(_cse157 + _cse161*_cse94 - 0.095416*_cse162 + 4.5318e-5*_cse164 + _cse165*_cse3)
+    out[2, 4] = _cse163*_cse97 + _cse166*dq1 + _cse166*dq2 + _cse168*_cse4
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse169
+    out[3, 2] = _cse169
+    out[3, 3] = _cse169
+    out[3, 4] = _cse31*dq0 + _cse82*dq1 + _cse82*dq2 + _cse93*dq3
+    out[3, 5] = -_cse170*dq1 - _cse170*dq2 - _cse171*_cse92 + dq0*(_cse0*_cse2 - _cse1*_cse27) + dq4*(_cse1*_cse8 - _cse2*_cse93)
+    out[4, 0] = 0
+    out[4, 1] = _cse172
+    out[4, 2] = _cse172
+    out[4, 3] = _cse172
+    out[4, 4] = _cse128*dq1 + _cse128*dq2 + _cse135*dq3 + _cse91*dq0
+    out[4, 5] = -_cse134*_cse171 - _cse173*dq1 - _cse173*dq2 + dq0*(-_cse1*_cse93 - _cse2*_cse8) + dq4*(_cse0*_cse1 - _cse135*_cse2)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse155*dq1 + _cse155*dq2 + _cse167*dq3
+    out[5, 5] = -_cse163*_cse171 - _cse168*_cse2 - _cse174*dq1 - _cse174*dq2
+    return out
+
+
+# link6[0,0,0]_Tx
+def function39(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = math.sin(q4)
+    _cse7 = math.cos(q4)
+    _cse8 = 0.065821*_cse7
+    _cse9 = math.sin(q2)
+    _cse10 = _cse2*_cse9
+    _cse11 = _cse0*_cse10
+    _cse12 = math.cos(q2)
+    _cse13 = _cse12*_cse2
+    _cse14 = _cse0*_cse13
+    _cse15 = _cse4*_cse9
+    _cse16 = _cse0*_cse15
+    _cse17 = _cse3 - 0.00099446*_cse4
+    _cse18 = -5.009e-5*_cse6 + 0.0036091*_cse7
+    _cse19 = 0.18677*_cse12 - 0.00067934*_cse9
+    _cse20 = _cse19*_cse2
+    _cse21 = 0.00067934*_cse12 + 0.18677*_cse9
+    _cse22 = math.sin(q3)
+    _cse23 = _cse12*_cse4
+    _cse24 = -_cse0*_cse23 + _cse11
+    _cse25 = math.cos(q3)
+    _cse26 = -_cse14 - _cse16
+    _cse27 = _cse22*_cse26
+    _cse28 = -0.0075028*_cse22 - 5.5328e-5*_cse25
+    _cse29 = 5.5328e-5*_cse22 - 0.0075028*_cse25
+    _cse30 = _cse24*_cse25 - _cse27
+    _cse31 = 0.065821*_cse6
+    _cse32 = 4.5293e-5*_cse7
+    _cse33 = 0.0036091*_cse6 + 5.009e-5*_cse7
+    _cse34 = _cse1*_cse4
+    _cse35 = _cse1*_cse10
+    _cse36 = _cse1*_cse13
+    _cse37 = _cse1*_cse15
+    _cse38 = _cse36 + _cse37
+    _cse39 = _cse22*_cse38
+    _cse40 = 0.102286*_cse25
+    _cse41 = _cse1*_cse12*_cse4 - _cse35
+    _cse42 = 0.102286*_cse22
+    _cse43 = _cse25*_cse41
+    _cse44 = -_cse39 + _cse43
+    _cse45 = -_cse10 + _cse12*_cse4
+    _cse46 = _cse22*_cse45
+    _cse47 = -_cse13 - _cse15
+    _cse48 = _cse25*_cse47 - _cse46
+    out = np.empty((4, 1))
+    out[0, 0] = 1.6153e-5*_cse0*_cse12*_cse4 - _cse0*_cse17 - _cse0*_cse20 - _cse0*_cse3 - 1.6491e-5*_cse0 + _cse1*_cse18 + 4.5293e-5*_cse1*_cse6 - _cse1*_cse8 - 0.1099981*_cse1 - 1.6153e-5*_cse11 - 0.20538*_cse14 - 0.20538*_cse16 - _cse21*_cse5 + 0.102286*_cse22*_cse24 + 4.5318e-5*_cse24*_cse25 + _cse24*_cse28 + 0.102286*_cse25*_cse26 + _cse26*_cse29 - 4.5318e-5*_cse27 - _cse30*_cse31 - _cse30*_cse32 + _cse30*_cse33 - 0.00011502*_cse5
+    out[1, 0] = _cse0*_cse18 + 4.5293e-5*_cse0*_cse6 - _cse0*_cse8 - 0.1099981*_cse0 + _cse1*_cse17 + _cse1*_cse20 - 1.6153e-5*_cse1*_cse23 + _cse1*_cse3 + 1.6491e-5*_cse1 + _cse21*_cse34 + _cse28*_cse41 + _cse29*_cse38 - _cse31*_cse44 - _cse32*_cse44 + _cse33*_cse44 + 0.00011502*_cse34 + 1.6153e-5*_cse35 + 0.20538*_cse36 + 0.20538*_cse37 + _cse38*_cse40 - 4.5318e-5*_cse39 + _cse41*_cse42 + 4.5318e-5*_cse43
+    out[2, 0] = -0.20538*_cse10 + 1.6153e-5*_cse13 + 1.6153e-5*_cse15 + _cse19*_cse4 - _cse2*_cse21 + 0.00087944*_cse2 + 0.20538*_cse23 + 4.5318e-5*_cse25*_cse47 + _cse28*_cse47 + _cse29*_cse45 - _cse31*_cse48 - _cse32*_cse48 + _cse33*_cse48 + 0.4251*_cse4 + _cse40*_cse45 + _cse42*_cse47 - 4.5318e-5*_cse46 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# link6[0,0,0]_J
+def function40(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q4)
+    _cse3 = math.cos(q4)
+    _cse4 = math.sin(q1)
+    _cse5 = 0.21255*_cse4
+    _cse6 = math.cos(q1)
+    _cse7 = 0.00011502*_cse6
+    _cse8 = math.sin(q2)
+    _cse9 = _cse4*_cse8
+    _cse10 = _cse1*_cse9
+    _cse11 = math.cos(q2)
+    _cse12 = _cse11*_cse4
+    _cse13 = _cse1*_cse12
+    _cse14 = _cse6*_cse8
+    _cse15 = _cse1*_cse14
+    _cse16 = _cse5 - 0.00099446*_cse6
+    _cse17 = -5.009e-5*_cse2 + 0.0036091*_cse3
+    _cse18 = 0.18677*_cse11 - 0.00067934*_cse8
+    _cse19 = _cse18*_cse4
+    _cse20 = 0.00067934*_cse11 + 0.18677*_cse8
+    _cse21 = _cse20*_cse6
+    _cse22 = math.sin(q3)
+    _cse23 = _cse11*_cse6
+    _cse24 = _cse1*_cse23
+    _cse25 = _cse10 - _cse24
+    _cse26 = math.cos(q3)
+    _cse27 = _cse13 + _cse15
+    _cse28 = -_cse27
+    _cse29 = _cse22*_cse28
+    _cse30 = 0.0075028*_cse22 + 5.5328e-5*_cse26
+    _cse31 = -_cse30
+    _cse32 = 5.5328e-5*_cse22 - 0.0075028*_cse26
+    _cse33 = _cse25*_cse26 - _cse29
+    _cse34 = 0.065821*_cse2
+    _cse35 = 4.5293e-5*_cse3
+    _cse36 = 0.0036091*_cse2 + 5.009e-5*_cse3
+    _cse37 = _cse0*_cse4
+    _cse38 = 0.21255*_cse6
+    _cse39 = _cse0*_cse9
+    _cse40 = _cse0*_cse12
+    _cse41 = 1.6153e-5*_cse40
+    _cse42 = _cse0*_cse14
+    _cse43 = 1.6153e-5*_cse42
+    _cse44 = _cse0*_cse23
+    _cse45 = 0.20538*_cse44
+    _cse46 = _cse38 + 0.00099446*_cse4
+    _cse47 = _cse18*_cse6
+    _cse48 = _cse0*_cse47
+    _cse49 = _cse40 + _cse42
+    _cse50 = 0.102286*_cse22
+    _cse51 = _cse39 - _cse44
+    _cse52 = _cse22*_cse51
+    _cse53 = 4.5318e-5*_cse52
+    _cse54 = _cse26*_cse51
+    _cse55 = _cse26*_cse49 - _cse52
+    _cse56 = _cse34*_cse55
+    _cse57 = _cse35*_cse55
+    _cse58 = -_cse20
+    _cse59 = -0.102286*_cse26*_cse51 - _cse32*_cse51 + _cse53
+    _cse60 = -_cse49
+    _cse61 = _cse26*_cse60
+    _cse62 = _cse52 + _cse61
+    _cse63 = -_cse62
+    _cse64 = _cse22*_cse60
+    _cse65 = _cse1*_cse3
+    _cse66 = -_cse36
+    _cse67 = _cse54 - _cse64
+    _cse68 = _cse2*_cse67
+    _cse69 = 0.065821*_cse3
+    _cse70 = _cse1*_cse4
+    _cse71 = -_cse25
+    _cse72 = _cse22*_cse71
+    _cse73 = _cse26*_cse28 - _cse72
+    _cse74 = _cse26*_cse71
+    _cse75 = 4.5318e-5*_cse72
+    _cse76 = _cse1*_cse47 - 0.20538*_cse10 + 1.6153e-5*_cse13 + 1.6153e-5*_cse15 + 0.20538*_cse24 + 4.5318e-5*_cse26*_cse28 + _cse28*_cse31 + 0.102286*_cse29 + _cse32*_cse71 - _cse34*_cse73 - _cse35*_cse73 + _cse36*_cse73 + 0.102286*_cse74 - _cse75
+    _cse77 = _cse22*_cse27
+    _cse78 = _cse26*_cse27
+    _cse79 = _cse72 + _cse78
+    _cse80 = -_cse79
+    _cse81 = _cse0*_cse3
+    _cse82 = _cse74 - _cse77
+    _cse83 = _cse2*_cse82
+    _cse84 = -_cse23 + _cse9
+    _cse85 = _cse26*_cse84
+    _cse86 = -_cse12 - _cse14
+    _cse87 = _cse22*_cse86
+    _cse88 = _cse85 - _cse87
+    _cse89 = 0.20538*_cse14
+    _cse90 = 0.20538*_cse12
+    _cse91 = 1.6153e-5*_cse9
+    _cse92 = _cse35*_cse88
+    _cse93 = _cse34*_cse88
+    _cse94 = 4.5318e-5*_cse87
+    _cse95 = -0.102286*_cse26*_cse86 - _cse32*_cse86 + _cse94
+    _cse96 = -_cse84
+    _cse97 = _cse26*_cse96
+    _cse98 = _cse87 + _cse97
+    _cse99 = -_cse98
+    _cse100 = _cse22*_cse96
+    _cse101 = -_cse100 + _cse26*_cse86
+    _cse102 = _cse101*_cse2
+    _cse103 = -_cse1
+    _cse104 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse17 - 4.5293e-5*_cse0*_cse2 + 0.065821*_cse0*_cse3 + 0.1099981*_cse0 + 1.6153e-5*_cse1*_cse11*_cse6 - _cse1*_cse16 - _cse1*_cse19 - _cse1*_cse21 - _cse1*_cse5 - _cse1*_cse7 - 1.6491e-5*_cse1 - 1.6153e-5*_cse10 - 0.20538*_cse13 - 0.20538*_cse15 + 0.102286*_cse22*_cse25 + 4.5318e-5*_cse25*_cse26 + _cse25*_cse31 + 0.102286*_cse26*_cse28 + _cse28*_cse32 - 4.5318e-5*_cse29 - _cse33*_cse34 - _cse33*_cse35 + _cse33*_cse36
+    out[0, 1] = -_cse0*_cse38 - _cse0*_cse46 + _cse20*_cse37 + 4.5318e-5*_cse26*_cse49 + _cse31*_cse49 + _cse32*_cse51 + _cse36*_cse55 + 0.00011502*_cse37 + 0.20538*_cse39 - _cse41 - _cse43 - _cse45 - _cse48 + _cse49*_cse50 - _cse53 + 0.102286*_cse54 - _cse56 - _cse57
+    out[0, 2] = 0.20538*_cse0*_cse4*_cse8 + 0.102286*_cse22*_cse49 + 4.5318e-5*_cse26*_cse49 + _cse31*_cse49 + _cse36*_cse55 - _cse37*_cse58 - _cse41 - _cse43 - _cse45 - _cse48 - _cse56 - _cse57 - _cse59
+    out[0, 3] = _cse30*_cse60 - _cse34*_cse63 - _cse35*_cse63 + _cse36*_cse63 - _cse59 - 4.5318e-5*_cse61 - 0.102286*_cse64
+    out[0, 4] = _cse1*_cse34 + _cse1*_cse66 + _cse17*_cse67 + 4.5293e-5*_cse65 - _cse67*_cse69 + 4.5293e-5*_cse68
+    out[0, 5] = 0
+    out[1, 0] = 1.6153e-5*_cse0*_cse11*_cse6 - _cse0*_cse16 - _cse0*_cse19 - _cse0*_cse21 - _cse0*_cse5 - _cse0*_cse7 - 1.6491e-5*_cse0 + _cse1*_cse17 + 4.5293e-5*_cse1*_cse2 - 0.1099981*_cse1 + 0.102286*_cse22*_cse51 + 4.5318e-5*_cse26*_cse51 + 0.102286*_cse26*_cse60 + _cse31*_cse51 + _cse32*_cse60 - _cse35*_cse67 + _cse36*_cse67 - 1.6153e-5*_cse39 - 0.20538*_cse40 - 0.20538*_cse42 - 4.5318e-5*_cse64 - 0.065821*_cse65 - 0.065821*_cse68
+    out[1, 1] = _cse1*_cse38 + _cse1*_cse46 - _cse20*_cse70 - 0.00011502*_cse70 + _cse76
+    out[1, 2] = _cse58*_cse70 + _cse76
+    out[1, 3] = 0.102286*_cse26*_cse71 + _cse27*_cse30 + _cse32*_cse71 - _cse34*_cse80 - _cse35*_cse80 + _cse36*_cse80 - _cse75 - 0.102286*_cse77 - 4.5318e-5*_cse78
+    out[1, 4] = _cse0*_cse34 + _cse0*_cse66 + _cse17*_cse82 - _cse69*_cse82 + 4.5293e-5*_cse81 + 4.5293e-5*_cse83
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 1.6153e-5*_cse11*_cse6 - _cse19 - _cse21 + 0.102286*_cse22*_cse84 + 4.5318e-5*_cse26*_cse84 + _cse31*_cse84 + _cse36*_cse88 - 0.4251*_cse4 + 0.00087944*_cse6 - _cse89 - _cse90 - _cse91 - _cse92 - _cse93 - _cse95
+    out[2, 2] = -_cse19 + 1.6153e-5*_cse23 + 0.102286*_cse26*_cse86 + _cse31*_cse84 + _cse32*_cse86 + _cse36*_cse88 + _cse50*_cse84 + _cse58*_cse6 + 4.5318e-5*_cse85 - _cse89 - _cse90 - _cse91 - _cse92 - _cse93 - _cse94
+    out[2, 3] = -0.102286*_cse100 + _cse30*_cse96 - _cse34*_cse99 - _cse35*_cse99 + _cse36*_cse99 - _cse95 - 4.5318e-5*_cse97
+    out[2, 4] = _cse101*_cse17 - _cse101*_cse69 + 4.5293e-5*_cse102
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse103
+    out[3, 2] = _cse103
+    out[3, 3] = _cse103
+    out[3, 4] = _cse62
+    out[3, 5] = -_cse65 - _cse68
+    out[4, 0] = 0
+    out[4, 1] = _cse104
+    out[4, 2] = _cse104
+    out[4, 3] = _cse104
+    out[4, 4] = _cse79
+    out[4, 5] = -_cse81 - _cse83
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse98
+    out[5, 5] = -_cse102
+    return out
+
+
+# link6[0,0,0]_dJ
+def function41(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q4)
+    _cse2 = _cse0*_cse1
+    _cse3 = math.cos(q4)
+    _cse4 = _cse0*_cse3
+    _cse5 = 0.0036091*_cse1 + 5.009e-5*_cse3
+    _cse6 = -_cse5
+    _cse7 = math.cos(q3)
+    _cse8 = math.cos(q0)
+    _cse9 = math.sin(q1)
+    _cse10 = math.sin(q2)
+    _cse11 = _cse10*_cse9
+    _cse12 = _cse11*_cse8
+    _cse13 = math.cos(q1)
+    _cse14 = math.cos(q2)
+    _cse15 = _cse13*_cse14
+    _cse16 = _cse15*_cse8
+    _cse17 = _cse12 - _cse16
+    _cse18 = _cse17*_cse7
+    _cse19 = math.sin(q3)
+    _cse20 = _cse14*_cse9
+    _cse21 = _cse20*_cse8
+    _cse22 = _cse10*_cse13
+    _cse23 = _cse22*_cse8
+    _cse24 = _cse21 + _cse23
+    _cse25 = -_cse24
+    _cse26 = _cse19*_cse25
+    _cse27 = _cse18 - _cse26
+    _cse28 = 0.065821*_cse3
+    _cse29 = 5.009e-5*_cse1 - 0.0036091*_cse3
+    _cse30 = -_cse29
+    _cse31 = -_cse0*_cse6 + 4.5293e-5*_cse1*_cse27 - 0.065821*_cse2 - _cse27*_cse28 + _cse27*_cse30 - 4.5293e-5*_cse4
+    _cse32 = _cse17*_cse19
+    _cse33 = _cse25*_cse7
+    _cse34 = _cse32 + _cse33
+    _cse35 = -_cse34
+    _cse36 = 0.0075028*_cse19 + 5.5328e-5*_cse7
+    _cse37 = 4.5293e-5*_cse3
+    _cse38 = 0.065821*_cse1
+    _cse39 = 5.5328e-5*_cse19 - 0.0075028*_cse7
+    _cse40 = 4.5318e-5*_cse32
+    _cse41 = -_cse17*_cse39 - 0.102286*_cse17*_cse7 + _cse40
+    _cse42 = _cse25*_cse36 - 0.102286*_cse26 - 4.5318e-5*_cse33 - _cse35*_cse37 - _cse35*_cse38 + _cse35*_cse5 - _cse41
+    _cse43 = _cse24*_cse7
+    _cse44 = -_cse32 + _cse43
+    _cse45 = -_cse36
+    _cse46 = _cse37*_cse44
+    _cse47 = _cse38*_cse44
+    _cse48 = 0.00067934*_cse10 - 0.18677*_cse14
+    _cse49 = -_cse48
+    _cse50 = _cse13*_cse49
+    _cse51 = _cse50*_cse8
+    _cse52 = 0.18677*_cse10 + 0.00067934*_cse14
+    _cse53 = -_cse52
+    _cse54 = _cse53*_cse9
+    _cse55 = 0.20538*_cse16
+    _cse56 = 1.6153e-5*_cse23
+    _cse57 = 1.6153e-5*_cse21
+    _cse58 = 0.20538*_cse10*_cse8*_cse9 + 0.102286*_cse19*_cse24 + _cse24*_cse45 + 4.5318e-5*_cse24*_cse7 - _cse41 + _cse44*_cse5 - _cse46 - _cse47 - _cse51 - _cse54*_cse8 - _cse55 - _cse56 - _cse57
+    _cse59 = 0.00011502*_cse8
+    _cse60 = 0.21255*_cse13
+    _cse61 = _cse60 + 0.00099446*_cse9
+    _cse62 = _cse52*_cse9
+    _cse63 = 0.20538*_cse12 + _cse17*_cse39 + 0.102286*_cse18 + 0.102286*_cse19*_cse24 + _cse24*_cse45 - _cse40 + 4.5318e-5*_cse43 + _cse44*_cse5 - _cse46 - _cse47 - _cse51 - _cse55 - _cse56 - _cse57 + _cse59*_cse9 - _cse60*_cse8 - _cse61*_cse8 + _cse62*_cse8
+    _cse64 = 0.21255*_cse9
+    _cse65 = -0.00099446*_cse13 + _cse64
+    _cse66 = _cse3*_cse8
+    _cse67 = _cse1*_cse8
+    _cse68 = 0.065821*_cse66 - 4.5293e-5*_cse67
+    _cse69 = _cse0*_cse11
+    _cse70 = -_cse0*_cse13*_cse14 + _cse69
+    _cse71 = -_cse70
+    _cse72 = _cse7*_cse71
+    _cse73 = _cse0*_cse20
+    _cse74 = _cse0*_cse22
+    _cse75 = _cse73 + _cse74
+    _cse76 = _cse19*_cse75
+    _cse77 = _cse72 - _cse76
+    _cse78 = _cse5*_cse77
+    _cse79 = _cse39*_cse75
+    _cse80 = _cse45*_cse71
+    _cse81 = 4.5318e-5*_cse72
+    _cse82 = 0.102286*_cse19
+    _cse83 = _cse71*_cse82
+    _cse84 = _cse7*_cse75
+    _cse85 = 0.102286*_cse84
+    _cse86 = 4.5318e-5*_cse76
+    _cse87 = -_cse86
+    _cse88 = -_cse37*_cse77
+    _cse89 = -_cse38*_cse77
+    _cse90 = _cse0*_cse9
+    _cse91 = _cse49*_cse90
+    _cse92 = 0.20538*_cse74
+    _cse93 = 0.20538*_cse73
+    _cse94 = 1.6153e-5*_cse69
+    _cse95 = _cse0*_cse15
+    _cse96 = -1.6153e-5*_cse95
+    _cse97 = _cse0*_cse13
+    _cse98 = _cse0*_cse64 + _cse52*_cse97 + _cse78 + _cse79 + _cse80 + _cse81 + _cse83 + _cse85 + _cse87 + _cse88 + _cse89 + _cse91 + _cse92 + _cse93 + _cse94 + _cse96 + 0.00011502*_cse97
+    _cse99 = -_cse65
+    _cse100 = -_cse53*_cse97 + _cse78 + _cse79 + _cse80 + _cse81 + _cse83 + _cse85 + _cse87 + _cse88 + _cse89 + _cse92 + _cse93 + _cse94 + _cse96
+    _cse101 = _cse100 + _cse91
+    _cse102 = _cse7*_cse70
+    _cse103 = _cse102 + _cse76
+    _cse104 = -_cse103
+    _cse105 = _cse19*_cse70
+    _cse106 = 4.5318e-5*_cse102 + 0.102286*_cse105 - _cse36*_cse70
+    _cse107 = -_cse104*_cse37 - _cse104*_cse38 + _cse104*_cse5 - _cse106 + _cse39*_cse75 + 0.102286*_cse7*_cse75 - _cse86
+    _cse108 = -_cse105 + _cse7*_cse75
+    _cse109 = 4.5293e-5*_cse1
+    _cse110 = _cse108*_cse109 - _cse108*_cse28 + _cse108*_cse30
+    _cse111 = _cse107*dq3 + _cse110*dq4
+    _cse112 = -_cse75
+    _cse113 = _cse112*_cse7
+    _cse114 = _cse105 + _cse113
+    _cse115 = -_cse114
+    _cse116 = _cse109*_cse115 - _cse115*_cse28 + _cse115*_cse30
+    _cse117 = _cse102 - _cse112*_cse19
+    _cse118 = -_cse117
+    _cse119 = -_cse39
+    _cse120 = _cse117*_cse3
+    _cse121 = _cse1*_cse117
+    _cse122 = _cse117*_cse30 - 0.065821*_cse120 + 4.5293e-5*_cse121 + _cse6*_cse8 + 4.5293e-5*_cse66 + 0.065821*_cse67
+    _cse123 = 4.5318e-5*_cse105
+    _cse124 = _cse123 - _cse39*_cse70 - 0.102286*_cse7*_cse70
+    _cse125 = -0.102286*_cse112*_cse19 + _cse112*_cse36 - 4.5318e-5*_cse113 - _cse115*_cse37 - _cse115*_cse38 + _cse115*_cse5 - _cse124
+    _cse126 = _cse108*_cse37
+    _cse127 = _cse108*_cse38
+    _cse128 = _cse0*_cse50
+    _cse129 = 0.20538*_cse95
+    _cse130 = 1.6153e-5*_cse74
+    _cse131 = 1.6153e-5*_cse73
+    _cse132 = 0.20538*_cse0*_cse10*_cse9 - _cse0*_cse54 + _cse108*_cse5 - _cse124 - _cse126 - _cse127 - _cse128 - _cse129 - _cse130 - _cse131 + 0.102286*_cse19*_cse75 + _cse45*_cse75 + 4.5318e-5*_cse7*_cse75
+    _cse133 = -_cse0*_cse60 - _cse0*_cse61 + _cse0*_cse62 + 0.102286*_cse102 + _cse108*_cse5 - _cse123 - _cse126 - _cse127 - _cse128 - _cse129 - _cse130 - _cse131 + _cse39*_cse70 + _cse45*_cse75 + 0.20538*_cse69 + 0.102286*_cse76 + 4.5318e-5*_cse84 + 0.00011502*_cse90
+    _cse134 = 4.5293e-5*_cse2
+    _cse135 = _cse27*_cse37
+    _cse136 = _cse1*_cse27
+    _cse137 = 0.065821*_cse136
+    _cse138 = _cse8*_cse9
+    _cse139 = _cse138*_cse49
+    _cse140 = _cse13*_cse8
+    _cse141 = 0.20538*_cse23
+    _cse142 = 0.20538*_cse21
+    _cse143 = 1.6153e-5*_cse12
+    _cse144 = 4.5318e-5*_cse26
+    _cse145 = _cse144 - _cse25*_cse39 - 0.102286*_cse25*_cse7
+    _cse146 = -1.6153e-5*_cse13*_cse14*_cse8 + _cse13*_cse59 + _cse135 + _cse137 + _cse139 + _cse140*_cse52 + _cse141 + _cse142 + _cse143 + _cse145 - 0.102286*_cse17*_cse19 - _cse17*_cse45 - 4.5318e-5*_cse17*_cse7 - _cse27*_cse5 + _cse64*_cse8
+    _cse147 = -_cse135 - _cse137 + _cse140*_cse53 - _cse141 - _cse142 - _cse143 - _cse144 + 1.6153e-5*_cse16 + _cse17*_cse45 + 4.5318e-5*_cse18 + _cse25*_cse39 + _cse27*_cse5 + 0.102286*_cse32 + 0.102286*_cse33
+    _cse148 = -_cse139 + _cse147
+    _cse149 = -_cse17
+    _cse150 = _cse149*_cse7
+    _cse151 = _cse150 + _cse26
+    _cse152 = -_cse151
+    _cse153 = _cse149*_cse19
+    _cse154 = -_cse149*_cse36 + 4.5318e-5*_cse150 + 0.102286*_cse153
+    _cse155 = -_cse145 - _cse152*_cse37 - _cse152*_cse38 + _cse152*_cse5 - _cse154
+    _cse156 = -_cse153 + _cse33
+    _cse157 = _cse109*_cse156 - _cse156*_cse28 + _cse156*_cse30
+    _cse158 = _cse155*dq3 + _cse157*dq4
+    _cse159 = -_cse153 - _cse43
+    _cse160 = _cse109*_cse159 - _cse159*_cse28 + _cse159*_cse30
+    _cse161 = _cse150 - _cse19*_cse24
+    _cse162 = -_cse161
+    _cse163 = _cse161*_cse3
+    _cse164 = _cse11 - _cse15
+    _cse165 = _cse164*_cse19
+    _cse166 = _cse20 + _cse22
+    _cse167 = -_cse165 + _cse166*_cse7
+    _cse168 = 0.20538*_cse15
+    _cse169 = 1.6153e-5*_cse22
+    _cse170 = 1.6153e-5*_cse20
+    _cse171 = _cse167*_cse37
+    _cse172 = _cse167*_cse38
+    _cse173 = 4.5318e-5*_cse165
+    _cse174 = -_cse164*_cse39 - 0.102286*_cse164*_cse7 + _cse173
+    _cse175 = -0.20538*_cse10*_cse9 - 0.102286*_cse166*_cse19 - _cse166*_cse45 - 4.5318e-5*_cse166*_cse7 - _cse167*_cse5 + _cse168 + _cse169 + _cse170 + _cse171 + _cse172 + _cse174 + _cse50
+    _cse176 = -_cse175 - _cse54
+    _cse177 = -_cse166
+    _cse178 = _cse177*_cse7
+    _cse179 = _cse165 + _cse178
+    _cse180 = -_cse179
+    _cse181 = _cse177*_cse19
+    _cse182 = -_cse177*_cse36 + 4.5318e-5*_cse178 + 0.102286*_cse181
+    _cse183 = -_cse174 - _cse180*_cse37 - _cse180*_cse38 + _cse180*_cse5 - _cse182
+    _cse184 = _cse164*_cse7
+    _cse185 = -_cse181 + _cse184
+    _cse186 = _cse109*_cse185 - _cse185*_cse28 + _cse185*_cse30
+    _cse187 = _cse183*dq3 + _cse186*dq4
+    _cse188 = -_cse164
+    _cse189 = _cse188*_cse7
+    _cse190 = -_cse181 - _cse189
+    _cse191 = _cse109*_cse190 - _cse190*_cse28 + _cse190*_cse30
+    _cse192 = -_cse178 + _cse188*_cse19
+    _cse193 = -_cse192
+    _cse194 = _cse0*dq0
+    _cse195 = _cse1*_cse108
+    _cse196 = _cse1*dq3
+    _cse197 = -_cse8*dq0
+    _cse198 = _cse1*_cse156
+    _cse199 = _cse1*_cse185
+    out = np.empty((6, 6))
+    out[0, 0] = _cse31*dq4 + _cse42*dq3 + _cse58*dq2 + _cse63*dq1 + dq0*(_cse0*_cse65 + 1.6491e-5*_cse0 - _cse30*_cse8 + _cse68 + 0.1099981*_cse8 + _cse98)
+    out[0, 1] = _cse101*dq2 + _cse111 + _cse63*dq0 + dq1*(-_cse0*_cse99 + _cse98)
+    out[0, 2] = _cse101*dq1 + _cse111 + _cse58*dq0 + dq2*(_cse100 - _cse48*_cse90)
+    out[0, 3] = _cse107*dq1 + _cse107*dq2 + _cse116*dq4 + _cse42*dq0 + dq3*(-_cse106 + _cse112*_cse119 + 4.5318e-5*_cse112*_cse19 - 0.102286*_cse113 - _cse118*_cse37 - _cse118*_cse38 + _cse118*_cse5)
+    out[0, 4] = _cse110*dq1 + _cse110*dq2 + _cse116*dq3 + _cse31*dq0 + dq4*(_cse117*_cse6 + 4.5293e-5*_cse120 + 0.065821*_cse121 + _cse29*_cse8 + _cse68)
+    out[0, 5] = 0
+    out[1, 0] = _cse122*dq4 + _cse125*dq3 + _cse132*dq2 + _cse133*dq1 + dq0*(0.065821*_cse0*_cse3 - _cse0*_cse30 + 0.1099981*_cse0 - _cse134 - _cse146 - _cse65*_cse8 - 1.6491e-5*_cse8)
+    out[1, 1] = _cse133*dq0 + _cse148*dq2 + _cse158 + dq1*(-_cse146 + _cse8*_cse99)
+    out[1, 2] = _cse132*dq0 + _cse148*dq1 + _cse158 + dq2*(_cse138*_cse48 + _cse147)
+    out[1, 3] = _cse125*dq0 + _cse155*dq1 + _cse155*dq2 + _cse160*dq4 + dq3*(_cse119*_cse24 - _cse154 - _cse162*_cse37 - _cse162*_cse38 + _cse162*_cse5 + 4.5318e-5*_cse19*_cse24 - 0.102286*_cse43)
+    out[1, 4] = _cse122*dq0 + _cse157*dq1 + _cse157*dq2 + _cse160*dq3 + dq4*(_cse0*_cse29 - _cse134 + _cse161*_cse38 + _cse161*_cse6 + 4.5293e-5*_cse163 + 0.065821*_cse4)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse176*dq2 + _cse187 + dq1*(-0.4251*_cse13 - _cse175 + _cse52*_cse9 - 0.00087944*_cse9)
+    out[2, 2] = _cse176*dq1 + _cse187 + dq2*(0.20538*_cse11 + _cse13*_cse48 + _cse164*_cse39 + _cse166*_cse45 + 4.5318e-5*_cse166*_cse7 + _cse166*_cse82 + _cse167*_cse5 - _cse168 - _cse169 - _cse170 - _cse171 - _cse172 - _cse173 + 0.102286*_cse184 - _cse54)
+    out[2, 3] = _cse183*dq1 + _cse183*dq2 + _cse191*dq4 + dq3*(_cse119*_cse188 - _cse182 + 4.5318e-5*_cse188*_cse19 - 0.102286*_cse189 - _cse192*_cse37 - _cse192*_cse38 + _cse192*_cse5)
+    out[2, 4] = _cse186*dq1 + _cse186*dq2 + _cse191*dq3 + dq4*(_cse193*_cse37 + _cse193*_cse38 + _cse193*_cse6)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse194
+    out[3, 2] = _cse194
+    out[3, 3] = _cse194
+    out[3, 4] = _cse103*dq1 + _cse103*dq2 + _cse117*dq3 + _cse34*dq0
+    out[3, 5] = -_cse115*_cse196 - _cse195*dq1 - _cse195*dq2 + dq0*(_cse0*_cse3 - _cse136) + dq4*(_cse1*_cse8 - _cse120)
+    out[4, 0] = 0
+    out[4, 1] = _cse197
+    out[4, 2] = _cse197
+    out[4, 3] = _cse197
+    out[4, 4] = _cse114*dq0 + _cse151*dq1 + _cse151*dq2 + _cse161*dq3
+    out[4, 5] = -_cse159*_cse196 - _cse198*dq1 - _cse198*dq2 + dq0*(-_cse121 - _cse66) + dq4*(_cse0*_cse1 - _cse163)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse179*dq1 + _cse179*dq2 + _cse193*dq3
+    out[5, 5] = -_cse190*_cse196 - _cse193*_cse3*dq4 - _cse199*dq1 - _cse199*dq2
+    return out
+
+
+# EE[0,0,0]_Tx
+def function42(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = math.sin(q4)
+    _cse7 = math.cos(q4)
+    _cse8 = 0.065821*_cse7
+    _cse9 = math.sin(q2)
+    _cse10 = _cse2*_cse9
+    _cse11 = _cse0*_cse10
+    _cse12 = math.cos(q2)
+    _cse13 = _cse12*_cse2
+    _cse14 = _cse0*_cse13
+    _cse15 = _cse4*_cse9
+    _cse16 = _cse0*_cse15
+    _cse17 = _cse3 - 0.00099446*_cse4
+    _cse18 = -5.009e-5*_cse6 + 0.0036091*_cse7
+    _cse19 = 0.18677*_cse12 - 0.00067934*_cse9
+    _cse20 = _cse19*_cse2
+    _cse21 = 0.00067934*_cse12 + 0.18677*_cse9
+    _cse22 = math.sin(q3)
+    _cse23 = _cse12*_cse4
+    _cse24 = -_cse0*_cse23 + _cse11
+    _cse25 = math.cos(q3)
+    _cse26 = -_cse14 - _cse16
+    _cse27 = _cse22*_cse26
+    _cse28 = -0.0075028*_cse22 - 5.5328e-5*_cse25
+    _cse29 = 5.5328e-5*_cse22 - 0.0075028*_cse25
+    _cse30 = _cse24*_cse25 - _cse27
+    _cse31 = 0.065821*_cse6
+    _cse32 = 4.5293e-5*_cse7
+    _cse33 = 0.0036091*_cse6 + 5.009e-5*_cse7
+    _cse34 = _cse1*_cse4
+    _cse35 = _cse1*_cse10
+    _cse36 = _cse1*_cse13
+    _cse37 = _cse1*_cse15
+    _cse38 = _cse36 + _cse37
+    _cse39 = _cse22*_cse38
+    _cse40 = 0.102286*_cse25
+    _cse41 = _cse1*_cse12*_cse4 - _cse35
+    _cse42 = 0.102286*_cse22
+    _cse43 = _cse25*_cse41
+    _cse44 = -_cse39 + _cse43
+    _cse45 = -_cse10 + _cse12*_cse4
+    _cse46 = _cse22*_cse45
+    _cse47 = -_cse13 - _cse15
+    _cse48 = _cse25*_cse47 - _cse46
+    out = np.empty((4, 1))
+    out[0, 0] = 1.6153e-5*_cse0*_cse12*_cse4 - _cse0*_cse17 - _cse0*_cse20 - _cse0*_cse3 - 1.6491e-5*_cse0 + _cse1*_cse18 + 4.5293e-5*_cse1*_cse6 - _cse1*_cse8 - 0.1099981*_cse1 - 1.6153e-5*_cse11 - 0.20538*_cse14 - 0.20538*_cse16 - _cse21*_cse5 + 0.102286*_cse22*_cse24 + 4.5318e-5*_cse24*_cse25 + _cse24*_cse28 + 0.102286*_cse25*_cse26 + _cse26*_cse29 - 4.5318e-5*_cse27 - _cse30*_cse31 - _cse30*_cse32 + _cse30*_cse33 - 0.00011502*_cse5
+    out[1, 0] = _cse0*_cse18 + 4.5293e-5*_cse0*_cse6 - _cse0*_cse8 - 0.1099981*_cse0 + _cse1*_cse17 + _cse1*_cse20 - 1.6153e-5*_cse1*_cse23 + _cse1*_cse3 + 1.6491e-5*_cse1 + _cse21*_cse34 + _cse28*_cse41 + _cse29*_cse38 - _cse31*_cse44 - _cse32*_cse44 + _cse33*_cse44 + 0.00011502*_cse34 + 1.6153e-5*_cse35 + 0.20538*_cse36 + 0.20538*_cse37 + _cse38*_cse40 - 4.5318e-5*_cse39 + _cse41*_cse42 + 4.5318e-5*_cse43
+    out[2, 0] = -0.20538*_cse10 + 1.6153e-5*_cse13 + 1.6153e-5*_cse15 + _cse19*_cse4 - _cse2*_cse21 + 0.00087944*_cse2 + 0.20538*_cse23 + 4.5318e-5*_cse25*_cse47 + _cse28*_cse47 + _cse29*_cse45 - _cse31*_cse48 - _cse32*_cse48 + _cse33*_cse48 + 0.4251*_cse4 + _cse40*_cse45 + _cse42*_cse47 - 4.5318e-5*_cse46 + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# EE[0,0,0]_J
+def function43(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q4)
+    _cse3 = math.cos(q4)
+    _cse4 = math.sin(q1)
+    _cse5 = 0.21255*_cse4
+    _cse6 = math.cos(q1)
+    _cse7 = 0.00011502*_cse6
+    _cse8 = math.sin(q2)
+    _cse9 = _cse4*_cse8
+    _cse10 = _cse1*_cse9
+    _cse11 = math.cos(q2)
+    _cse12 = _cse11*_cse4
+    _cse13 = _cse1*_cse12
+    _cse14 = _cse6*_cse8
+    _cse15 = _cse1*_cse14
+    _cse16 = _cse5 - 0.00099446*_cse6
+    _cse17 = -5.009e-5*_cse2 + 0.0036091*_cse3
+    _cse18 = 0.18677*_cse11 - 0.00067934*_cse8
+    _cse19 = _cse18*_cse4
+    _cse20 = 0.00067934*_cse11 + 0.18677*_cse8
+    _cse21 = _cse20*_cse6
+    _cse22 = math.sin(q3)
+    _cse23 = _cse11*_cse6
+    _cse24 = _cse1*_cse23
+    _cse25 = _cse10 - _cse24
+    _cse26 = math.cos(q3)
+    _cse27 = _cse13 + _cse15
+    _cse28 = -_cse27
+    _cse29 = _cse22*_cse28
+    _cse30 = 0.0075028*_cse22 + 5.5328e-5*_cse26
+    _cse31 = -_cse30
+    _cse32 = 5.5328e-5*_cse22 - 0.0075028*_cse26
+    _cse33 = _cse25*_cse26 - _cse29
+    _cse34 = 0.065821*_cse2
+    _cse35 = 4.5293e-5*_cse3
+    _cse36 = 0.0036091*_cse2 + 5.009e-5*_cse3
+    _cse37 = _cse0*_cse4
+    _cse38 = 0.21255*_cse6
+    _cse39 = _cse0*_cse9
+    _cse40 = _cse0*_cse12
+    _cse41 = 1.6153e-5*_cse40
+    _cse42 = _cse0*_cse14
+    _cse43 = 1.6153e-5*_cse42
+    _cse44 = _cse0*_cse23
+    _cse45 = 0.20538*_cse44
+    _cse46 = _cse38 + 0.00099446*_cse4
+    _cse47 = _cse18*_cse6
+    _cse48 = _cse0*_cse47
+    _cse49 = _cse40 + _cse42
+    _cse50 = 0.102286*_cse22
+    _cse51 = _cse39 - _cse44
+    _cse52 = _cse22*_cse51
+    _cse53 = 4.5318e-5*_cse52
+    _cse54 = _cse26*_cse51
+    _cse55 = _cse26*_cse49 - _cse52
+    _cse56 = _cse34*_cse55
+    _cse57 = _cse35*_cse55
+    _cse58 = -_cse20
+    _cse59 = -0.102286*_cse26*_cse51 - _cse32*_cse51 + _cse53
+    _cse60 = -_cse49
+    _cse61 = _cse26*_cse60
+    _cse62 = _cse52 + _cse61
+    _cse63 = -_cse62
+    _cse64 = _cse22*_cse60
+    _cse65 = _cse1*_cse3
+    _cse66 = -_cse36
+    _cse67 = _cse54 - _cse64
+    _cse68 = _cse2*_cse67
+    _cse69 = 0.065821*_cse3
+    _cse70 = _cse1*_cse4
+    _cse71 = -_cse25
+    _cse72 = _cse22*_cse71
+    _cse73 = _cse26*_cse28 - _cse72
+    _cse74 = _cse26*_cse71
+    _cse75 = 4.5318e-5*_cse72
+    _cse76 = _cse1*_cse47 - 0.20538*_cse10 + 1.6153e-5*_cse13 + 1.6153e-5*_cse15 + 0.20538*_cse24 + 4.5318e-5*_cse26*_cse28 + _cse28*_cse31 + 0.102286*_cse29 + _cse32*_cse71 - _cse34*_cse73 - _cse35*_cse73 + _cse36*_cse73 + 0.102286*_cse74 - _cse75
+    _cse77 = _cse22*_cse27
+    _cse78 = _cse26*_cse27
+    _cse79 = _cse72 + _cse78
+    _cse80 = -_cse79
+    _cse81 = _cse0*_cse3
+    _cse82 = _cse74 - _cse77
+    _cse83 = _cse2*_cse82
+    _cse84 = -_cse23 + _cse9
+    _cse85 = _cse26*_cse84
+    _cse86 = -_cse12 - _cse14
+    _cse87 = _cse22*_cse86
+    _cse88 = _cse85 - _cse87
+    _cse89 = 0.20538*_cse14
+    _cse90 = 0.20538*_cse12
+    _cse91 = 1.6153e-5*_cse9
+    _cse92 = _cse35*_cse88
+    _cse93 = _cse34*_cse88
+    _cse94 = 4.5318e-5*_cse87
+    _cse95 = -0.102286*_cse26*_cse86 - _cse32*_cse86 + _cse94
+    _cse96 = -_cse84
+    _cse97 = _cse26*_cse96
+    _cse98 = _cse87 + _cse97
+    _cse99 = -_cse98
+    _cse100 = _cse22*_cse96
+    _cse101 = -_cse100 + _cse26*_cse86
+    _cse102 = _cse101*_cse2
+    _cse103 = -_cse1
+    _cse104 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse17 - 4.5293e-5*_cse0*_cse2 + 0.065821*_cse0*_cse3 + 0.1099981*_cse0 + 1.6153e-5*_cse1*_cse11*_cse6 - _cse1*_cse16 - _cse1*_cse19 - _cse1*_cse21 - _cse1*_cse5 - _cse1*_cse7 - 1.6491e-5*_cse1 - 1.6153e-5*_cse10 - 0.20538*_cse13 - 0.20538*_cse15 + 0.102286*_cse22*_cse25 + 4.5318e-5*_cse25*_cse26 + _cse25*_cse31 + 0.102286*_cse26*_cse28 + _cse28*_cse32 - 4.5318e-5*_cse29 - _cse33*_cse34 - _cse33*_cse35 + _cse33*_cse36
+    out[0, 1] = -_cse0*_cse38 - _cse0*_cse46 + _cse20*_cse37 + 4.5318e-5*_cse26*_cse49 + _cse31*_cse49 + _cse32*_cse51 + _cse36*_cse55 + 0.00011502*_cse37 + 0.20538*_cse39 - _cse41 - _cse43 - _cse45 - _cse48 + _cse49*_cse50 - _cse53 + 0.102286*_cse54 - _cse56 - _cse57
+    out[0, 2] = 0.20538*_cse0*_cse4*_cse8 + 0.102286*_cse22*_cse49 + 4.5318e-5*_cse26*_cse49 + _cse31*_cse49 + _cse36*_cse55 - _cse37*_cse58 - _cse41 - _cse43 - _cse45 - _cse48 - _cse56 - _cse57 - _cse59
+    out[0, 3] = _cse30*_cse60 - _cse34*_cse63 - _cse35*_cse63 + _cse36*_cse63 - _cse59 - 4.5318e-5*_cse61 - 0.102286*_cse64
+    out[0, 4] = _cse1*_cse34 + _cse1*_cse66 + _cse17*_cse67 + 4.5293e-5*_cse65 - _cse67*_cse69 + 4.5293e-5*_cse68
+    out[0, 5] = 0
+    out[1, 0] = 1.6153e-5*_cse0*_cse11*_cse6 - _cse0*_cse16 - _cse0*_cse19 - _cse0*_cse21 - _cse0*_cse5 - _cse0*_cse7 - 1.6491e-5*_cse0 + _cse1*_cse17 + 4.5293e-5*_cse1*_cse2 - 0.1099981*_cse1 + 0.102286*_cse22*_cse51 + 4.5318e-5*_cse26*_cse51 + 0.102286*_cse26*_cse60 + _cse31*_cse51 + _cse32*_cse60 - _cse35*_cse67 + _cse36*_cse67 - 1.6153e-5*_cse39 - 0.20538*_cse40 - 0.20538*_cse42 - 4.5318e-5*_cse64 - 0.065821*_cse65 - 0.065821*_cse68
+    out[1, 1] = _cse1*_cse38 + _cse1*_cse46 - _cse20*_cse70 - 0.00011502*_cse70 + _cse76
+    out[1, 2] = _cse58*_cse70 + _cse76
+    out[1, 3] = 0.102286*_cse26*_cse71 + _cse27*_cse30 + _cse32*_cse71 - _cse34*_cse80 - _cse35*_cse80 + _cse36*_cse80 - _cse75 - 0.102286*_cse77 - 4.5318e-5*_cse78
+    out[1, 4] = _cse0*_cse34 + _cse0*_cse66 + _cse17*_cse82 - _cse69*_cse82 + 4.5293e-5*_cse81 + 4.5293e-5*_cse83
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = 1.6153e-5*_cse11*_cse6 - _cse19 - _cse21 + 0.102286*_cse22*_cse84 + 4.5318e-5*_cse26*_cse84 + _cse31*_cse84 + _cse36*_cse88 - 0.4251*_cse4 + 0.00087944*_cse6 - _cse89 - _cse90 - _cse91 - _cse92 - _cse93 - _cse95
+    out[2, 2] = -_cse19 + 1.6153e-5*_cse23 + 0.102286*_cse26*_cse86 + _cse31*_cse84 + _cse32*_cse86 + _cse36*_cse88 + _cse50*_cse84 + _cse58*_cse6 + 4.5318e-5*_cse85 - _cse89 - _cse90 - _cse91 - _cse92 - _cse93 - _cse94
+    out[2, 3] = -0.102286*_cse100 + _cse30*_cse96 - _cse34*_cse99 - _cse35*_cse99 + _cse36*_cse99 - _cse95 - 4.5318e-5*_cse97
+    out[2, 4] = _cse101*_cse17 - _cse101*_cse69 + 4.5293e-5*_cse102
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse103
+    out[3, 2] = _cse103
+    out[3, 3] = _cse103
+    out[3, 4] = _cse62
+    out[3, 5] = -_cse65 - _cse68
+    out[4, 0] = 0
+    out[4, 1] = _cse104
+    out[4, 2] = _cse104
+    out[4, 3] = _cse104
+    out[4, 4] = _cse79
+    out[4, 5] = -_cse81 - _cse83
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse98
+    out[5, 5] = -_cse102
+    return out
+
+
+# EE[0,0,0]_dJ
+def function44(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.sin(q4)
+    _cse2 = _cse0*_cse1
+    _cse3 = math.cos(q4)
+    _cse4 = _cse0*_cse3
+    _cse5 = 0.0036091*_cse1 + 5.009e-5*_cse3
+    _cse6 = -_cse5
+    _cse7 = math.cos(q3)
+    _cse8 = math.cos(q0)
+    _cse9 = math.sin(q1)
+    _cse10 = math.sin(q2)
+    _cse11 = _cse10*_cse9
+    _cse12 = _cse11*_cse8
+    _cse13 = math.cos(q1)
+    _cse14 = math.cos(q2)
+    _cse15 = _cse13*_cse14
+    _cse16 = _cse15*_cse8
+    _cse17 = _cse12 - _cse16
+    _cse18 = _cse17*_cse7
+    _cse19 = math.sin(q3)
+    _cse20 = _cse14*_cse9
+    _cse21 = _cse20*_cse8
+    _cse22 = _cse10*_cse13
+    _cse23 = _cse22*_cse8
+    _cse24 = _cse21 + _cse23
+    _cse25 = -_cse24
+    _cse26 = _cse19*_cse25
+    _cse27 = _cse18 - _cse26
+    _cse28 = 0.065821*_cse3
+    _cse29 = 5.009e-5*_cse1 - 0.0036091*_cse3
+    _cse30 = -_cse29
+    _cse31 = -_cse0*_cse6 + 4.5293e-5*_cse1*_cse27 - 0.065821*_cse2 - _cse27*_cse28 + _cse27*_cse30 - 4.5293e-5*_cse4
+    _cse32 = _cse17*_cse19
+    _cse33 = _cse25*_cse7
+    _cse34 = _cse32 + _cse33
+    _cse35 = -_cse34
+    _cse36 = 0.0075028*_cse19 + 5.5328e-5*_cse7
+    _cse37 = 4.5293e-5*_cse3
+    _cse38 = 0.065821*_cse1
+    _cse39 = 5.5328e-5*_cse19 - 0.0075028*_cse7
+    _cse40 = 4.5318e-5*_cse32
+    _cse41 = -_cse17*_cse39 - 0.102286*_cse17*_cse7 + _cse40
+    _cse42 = _cse25*_cse36 - 0.102286*_cse26 - 4.5318e-5*_cse33 - _cse35*_cse37 - _cse35*_cse38 + _cse35*_cse5 - _cse41
+    _cse43 = _cse24*_cse7
+    _cse44 = -_cse32 + _cse43
+    _cse45 = -_cse36
+    _cse46 = _cse37*_cse44
+    _cse47 = _cse38*_cse44
+    _cse48 = 0.00067934*_cse10 - 0.18677*_cse14
+    _cse49 = -_cse48
+    _cse50 = _cse13*_cse49
+    _cse51 = _cse50*_cse8
+    _cse52 = 0.18677*_cse10 + 0.00067934*_cse14
+    _cse53 = -_cse52
+    _cse54 = _cse53*_cse9
+    _cse55 = 0.20538*_cse16
+    _cse56 = 1.6153e-5*_cse23
+    _cse57 = 1.6153e-5*_cse21
+    _cse58 = 0.20538*_cse10*_cse8*_cse9 + 0.102286*_cse19*_cse24 + _cse24*_cse45 + 4.5318e-5*_cse24*_cse7 - _cse41 + _cse44*_cse5 - _cse46 - _cse47 - _cse51 - _cse54*_cse8 - _cse55 - _cse56 - _cse57
+    _cse59 = 0.00011502*_cse8
+    _cse60 = 0.21255*_cse13
+    _cse61 = _cse60 + 0.00099446*_cse9
+    _cse62 = _cse52*_cse9
+    _cse63 = 0.20538*_cse12 + _cse17*_cse39 + 0.102286*_cse18 + 0.102286*_cse19*_cse24 + _cse24*_cse45 - _cse40 + 4.5318e-5*_cse43 + _cse44*_cse5 - _cse46 - _cse47 - _cse51 - _cse55 - _cse56 - _cse57 + _cse59*_cse9 - _cse60*_cse8 - _cse61*_cse8 + _cse62*_cse8
+    _cse64 = 0.21255*_cse9
+    _cse65 = -0.00099446*_cse13 + _cse64
+    _cse66 = _cse3*_cse8
+    _cse67 = _cse1*_cse8
+    _cse68 = 0.065821*_cse66 - 4.5293e-5*_cse67
+    _cse69 = _cse0*_cse11
+    _cse70 = -_cse0*_cse13*_cse14 + _cse69
+    _cse71 = -_cse70
+    _cse72 = _cse7*_cse71
+    _cse73 = _cse0*_cse20
+    _cse74 = _cse0*_cse22
+    _cse75 = _cse73 + _cse74
+    _cse76 = _cse19*_cse75
+    _cse77 = _cse72 - _cse76
+    _cse78 = _cse5*_cse77
+    _cse79 = _cse39*_cse75
+    _cse80 = _cse45*_cse71
+    _cse81 = 4.5318e-5*_cse72
+    _cse82 = 0.102286*_cse19
+    _cse83 = _cse71*_cse82
+    _cse84 = _cse7*_cse75
+    _cse85 = 0.102286*_cse84
+    _cse86 = 4.5318e-5*_cse76
+    _cse87 = -_cse86
+    _cse88 = -_cse37*_cse77
+    _cse89 = -_cse38*_cse77
+    _cse90 = _cse0*_cse9
+    _cse91 = _cse49*_cse90
+    _cse92 = 0.20538*_cse74
+    _cse93 = 0.20538*_cse73
+    _cse94 = 1.6153e-5*_cse69
+    _cse95 = _cse0*_cse15
+    _cse96 = -1.6153e-5*_cse95
+    _cse97 = _cse0*_cse13
+    _cse98 = _cse0*_cse64 + _cse52*_cse97 + _cse78 + _cse79 + _cse80 + _cse81 + _cse83 + _cse85 + _cse87 + _cse88 + _cse89 + _cse91 + _cse92 + _cse93 + _cse94 + _cse96 + 0.00011502*_cse97
+    _cse99 = -_cse65
+    _cse100 = -_cse53*_cse97 + _cse78 + _cse79 + _cse80 + _cse81 + _cse83 + _cse85 + _cse87 + _cse88 + _cse89 + _cse92 + _cse93 + _cse94 + _cse96
+    _cse101 = _cse100 + _cse91
+    _cse102 = _cse7*_cse70
+    _cse103 = _cse102 + _cse76
+    _cse104 = -_cse103
+    _cse105 = _cse19*_cse70
+    _cse106 = 4.5318e-5*_cse102 + 0.102286*_cse105 - _cse36*_cse70
+    _cse107 = -_cse104*_cse37 - _cse104*_cse38 + _cse104*_cse5 - _cse106 + _cse39*_cse75 + 0.102286*_cse7*_cse75 - _cse86
+    _cse108 = -_cse105 + _cse7*_cse75
+    _cse109 = 4.5293e-5*_cse1
+    _cse110 = _cse108*_cse109 - _cse108*_cse28 + _cse108*_cse30
+    _cse111 = _cse107*dq3 + _cse110*dq4
+    _cse112 = -_cse75
+    _cse113 = _cse112*_cse7
+    _cse114 = _cse105 + _cse113
+    _cse115 = -_cse114
+    _cse116 = _cse109*_cse115 - _cse115*_cse28 + _cse115*_cse30
+    _cse117 = _cse102 - _cse112*_cse19
+    _cse118 = -_cse117
+    _cse119 = -_cse39
+    _cse120 = _cse117*_cse3
+    _cse121 = _cse1*_cse117
+    _cse122 = _cse117*_cse30 - 0.065821*_cse120 + 4.5293e-5*_cse121 + _cse6*_cse8 + 4.5293e-5*_cse66 + 0.065821*_cse67
+    _cse123 = 4.5318e-5*_cse105
+    _cse124 = _cse123 - _cse39*_cse70 - 0.102286*_cse7*_cse70
+    _cse125 = -0.102286*_cse112*_cse19 + _cse112*_cse36 - 4.5318e-5*_cse113 - _cse115*_cse37 - _cse115*_cse38 + _cse115*_cse5 - _cse124
+    _cse126 = _cse108*_cse37
+    _cse127 = _cse108*_cse38
+    _cse128 = _cse0*_cse50
+    _cse129 = 0.20538*_cse95
+    _cse130 = 1.6153e-5*_cse74
+    _cse131 = 1.6153e-5*_cse73
+    _cse132 = 0.20538*_cse0*_cse10*_cse9 - _cse0*_cse54 + _cse108*_cse5 - _cse124 - _cse126 - _cse127 - _cse128 - _cse129 - _cse130 - _cse131 + 0.102286*_cse19*_cse75 + _cse45*_cse75 + 4.5318e-5*_cse7*_cse75
+    _cse133 = -_cse0*_cse60 - _cse0*_cse61 + _cse0*_cse62 + 0.102286*_cse102 + _cse108*_cse5 - _cse123 - _cse126 - _cse127 - _cse128 - _cse129 - _cse130 - _cse131 + _cse39*_cse70 + _cse45*_cse75 + 0.20538*_cse69 + 0.102286*_cse76 + 4.5318e-5*_cse84 + 0.00011502*_cse90
+    _cse134 = 4.5293e-5*_cse2
+    _cse135 = _cse27*_cse37
+    _cse136 = _cse1*_cse27
+    _cse137 = 0.065821*_cse136
+    _cse138 = _cse8*_cse9
+    _cse139 = _cse138*_cse49
+    _cse140 = _cse13*_cse8
+    _cse141 = 0.20538*_cse23
+    _cse142 = 0.20538*_cse21
+    _cse143 = 1.6153e-5*_cse12
+    _cse144 = 4.5318e-5*_cse26
+    _cse145 = _cse144 - _cse25*_cse39 - 0.102286*_cse25*_cse7
+    _cse146 = -1.6153e-5*_cse13*_cse14*_cse8 + _cse13*_cse59 + _cse135 + _cse137 + _cse139 + _cse140*_cse52 + _cse141 + _cse142 + _cse143 + _cse145 - 0.102286*_cse17*_cse19 - _cse17*_cse45 - 4.5318e-5*_cse17*_cse7 - _cse27*_cse5 + _cse64*_cse8
+    _cse147 = -_cse135 - _cse137 + _cse140*_cse53 - _cse141 - _cse142 - _cse143 - _cse144 + 1.6153e-5*_cse16 + _cse17*_cse45 + 4.5318e-5*_cse18 + _cse25*_cse39 + _cse27*_cse5 + 0.102286*_cse32 + 0.102286*_cse33
+    _cse148 = -_cse139 + _cse147
+    _cse149 = -_cse17
+    _cse150 = _cse149*_cse7
+    _cse151 = _cse150 + _cse26
+    _cse152 = -_cse151
+    _cse153 = _cse149*_cse19
+    _cse154 = -_cse149*_cse36 + 4.5318e-5*_cse150 + 0.102286*_cse153
+    _cse155 = -_cse145 - _cse152*_cse37 - _cse152*_cse38 + _cse152*_cse5 - _cse154
+    _cse156 = -_cse153 + _cse33
+    _cse157 = _cse109*_cse156 - _cse156*_cse28 + _cse156*_cse30
+    _cse158 = _cse155*dq3 + _cse157*dq4
+    _cse159 = -_cse153 - _cse43
+    _cse160 = _cse109*_cse159 - _cse159*_cse28 + _cse159*_cse30
+    _cse161 = _cse150 - _cse19*_cse24
+    _cse162 = -_cse161
+    _cse163 = _cse161*_cse3
+    _cse164 = _cse11 - _cse15
+    _cse165 = _cse164*_cse19
+    _cse166 = _cse20 + _cse22
+    _cse167 = -_cse165 + _cse166*_cse7
+    _cse168 = 0.20538*_cse15
+    _cse169 = 1.6153e-5*_cse22
+    _cse170 = 1.6153e-5*_cse20
+    _cse171 = _cse167*_cse37
+    _cse172 = _cse167*_cse38
+    _cse173 = 4.5318e-5*_cse165
+    _cse174 = -_cse164*_cse39 - 0.102286*_cse164*_cse7 + _cse173
+    _cse175 = -0.20538*_cse10*_cse9 - 0.102286*_cse166*_cse19 - _cse166*_cse45 - 4.5318e-5*_cse166*_cse7 - _cse167*_cse5 + _cse168 + _cse169 + _cse170 + _cse171 + _cse172 + _cse174 + _cse50
+    _cse176 = -_cse175 - _cse54
+    _cse177 = -_cse166
+    _cse178 = _cse177*_cse7
+    _cse179 = _cse165 + _cse178
+    _cse180 = -_cse179
+    _cse181 = _cse177*_cse19
+    _cse182 = -_cse177*_cse36 + 4.5318e-5*_cse178 + 0.102286*_cse181
+    _cse183 = -_cse174 - _cse180*_cse37 - _cse180*_cse38 + _cse180*_cse5 - _cse182
+    _cse184 = _cse164*_cse7
+    _cse185 = -_cse181 + _cse184
+    _cse186 = _cse109*_cse185 - _cse185*_cse28 + _cse185*_cse30
+    _cse187 = _cse183*dq3 + _cse186*dq4
+    _cse188 = -_cse164
+    _cse189 = _cse188*_cse7
+    _cse190 = -_cse181 - _cse189
+    _cse191 = _cse109*_cse190 - _cse190*_cse28 + _cse190*_cse30
+    _cse192 = -_cse178 + _cse188*_cse19
+    _cse193 = -_cse192
+    _cse194 = _cse0*dq0
+    _cse195 = _cse1*_cse108
+    _cse196 = _cse1*dq3
+    _cse197 = -_cse8*dq0
+    _cse198 = _cse1*_cse156
+    _cse199 = _cse1*_cse185
+    out = np.empty((6, 6))
+    out[0, 0] = _cse31*dq4 + _cse42*dq3 + _cse58*dq2 + _cse63*dq1 + dq0*(_cse0*_cse65 + 1.6491e-5*_cse0 - _cse30*_cse8 + _cse68 + 0.1099981*_cse8 + _cse98)
+    out[0, 1] = _cse101*dq2 + _cse111 + _cse63*dq0 + dq1*(-_cse0*_cse99 + _cse98)
+    out[0, 2] = _cse101*dq1 + _cse111 + _cse58*dq0 + dq2*(_cse100 - _cse48*_cse90)
+    out[0, 3] = _cse107*dq1 + _cse107*dq2 + _cse116*dq4 + _cse42*dq0 + dq3*(-_cse106 + _cse112*_cse119 + 4.5318e-5*_cse112*_cse19 - 0.102286*_cse113 - _cse118*_cse37 - _cse118*_cse38 + _cse118*_cse5)
+    out[0, 4] = _cse110*dq1 + _cse110*dq2 + _cse116*dq3 + _cse31*dq0 + dq4*(_cse117*_cse6 + 4.5293e-5*_cse120 + 0.065821*_cse121 + _cse29*_cse8 + _cse68)
+    out[0, 5] = 0
+    out[1, 0] = _cse122*dq4 + _cse125*dq3 + _cse132*dq2 + _cse133*dq1 + dq0*(0.065821*_cse0*_cse3 - _cse0*_cse30 + 0.1099981*_cse0 - _cse134 - _cse146 - _cse65*_cse8 - 1.6491e-5*_cse8)
+    out[1, 1] = _cse133*dq0 + _cse148*dq2 + _cse158 + dq1*(-_cse146 + _cse8*_cse99)
+    out[1, 2] = _cse132*dq0 + _cse148*dq1 + _cse158 + dq2*(_cse138*_cse48 + _cse147)
+    out[1, 3] = _cse125*dq0 + _cse155*dq1 + _cse155*dq2 + _cse160*dq4 + dq3*(_cse119*_cse24 - _cse154 - _cse162*_cse37 - _cse162*_cse38 + _cse162*_cse5 + 4.5318e-5*_cse19*_cse24 - 0.102286*_cse43)
+    out[1, 4] = _cse122*dq0 + _cse157*dq1 + _cse157*dq2 + _cse160*dq3 + dq4*(_cse0*_cse29 - _cse134 + _cse161*_cse38 + _cse161*_cse6 + 4.5293e-5*_cse163 + 0.065821*_cse4)
+    out[1, 5] = 0
+    out[2, 0] = 0
+    out[2, 1] = _cse176*dq2 + _cse187 + dq1*(-0.4251*_cse13 - _cse175 + _cse52*_cse9 - 0.00087944*_cse9)
+    out[2, 2] = _cse176*dq1 + _cse187 + dq2*(0.20538*_cse11 + _cse13*_cse48 + _cse164*_cse39 + _cse166*_cse45 + 4.5318e-5*_cse166*_cse7 + _cse166*_cse82 + _cse167*_cse5 - _cse168 - _cse169 - _cse170 - _cse171 - _cse172 - _cse173 + 0.102286*_cse184 - _cse54)
+    out[2, 3] = _cse183*dq1 + _cse183*dq2 + _cse191*dq4 + dq3*(_cse119*_cse188 - _cse182 + 4.5318e-5*_cse188*_cse19 - 0.102286*_cse189 - _cse192*_cse37 - _cse192*_cse38 + _cse192*_cse5)
+    out[2, 4] = _cse186*dq1 + _cse186*dq2 + _cse191*dq3 + dq4*(_cse193*_cse37 + _cse193*_cse38 + _cse193*_cse6)
+    out[2, 5] = 0
+    out[3, 0] = 0
+    out[3, 1] = _cse194
+    out[3, 2] = _cse194
+    out[3, 3] = _cse194
+    out[3, 4] = _cse103*dq1 + _cse103*dq2 + _cse117*dq3 + _cse34*dq0
+    out[3, 5] = -_cse115*_cse196 - _cse195*dq1 - _cse195*dq2 + dq0*(_cse0*_cse3 - _cse136) + dq4*(_cse1*_cse8 - _cse120)
+    out[4, 0] = 0
+    out[4, 1] = _cse197
+    out[4, 2] = _cse197
+    out[4, 3] = _cse197
+    out[4, 4] = _cse114*dq0 + _cse151*dq1 + _cse151*dq2 + _cse161*dq3
+    out[4, 5] = -_cse159*_cse196 - _cse198*dq1 - _cse198*dq2 + dq0*(-_cse121 - _cse66) + dq4*(_cse0*_cse1 - _cse163)
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse179*dq1 + _cse179*dq2 + _cse193*dq3
+    out[5, 5] = -_cse190*_cse196 - _cse193*_cse3*dq4 - _cse199*dq1 - _cse199*dq2
+    return out
+
+
+# EE_Tx
+def function45(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q1)
+    _cse3 = 0.21255*_cse2
+    _cse4 = math.cos(q1)
+    _cse5 = _cse0*_cse4
+    _cse6 = math.sin(q4)
+    _cse7 = math.cos(q4)
+    _cse8 = _cse1*_cse7
+    _cse9 = math.sin(q2)
+    _cse10 = _cse2*_cse9
+    _cse11 = _cse0*_cse10
+    _cse12 = math.cos(q2)
+    _cse13 = _cse12*_cse2
+    _cse14 = _cse0*_cse13
+    _cse15 = _cse4*_cse9
+    _cse16 = _cse0*_cse15
+    _cse17 = _cse3 - 0.00099446*_cse4
+    _cse18 = -5.009e-5*_cse6 + 0.0036091*_cse7
+    _cse19 = 0.18677*_cse12 - 0.00067934*_cse9
+    _cse20 = _cse19*_cse2
+    _cse21 = 0.00067934*_cse12 + 0.18677*_cse9
+    _cse22 = math.sin(q3)
+    _cse23 = _cse12*_cse4
+    _cse24 = -_cse0*_cse23 + _cse11
+    _cse25 = math.cos(q3)
+    _cse26 = -_cse14 - _cse16
+    _cse27 = _cse22*_cse26
+    _cse28 = -0.0075028*_cse22 - 5.5328e-5*_cse25
+    _cse29 = 5.5328e-5*_cse22 - 0.0075028*_cse25
+    _cse30 = _cse24*_cse25 - _cse27
+    _cse31 = _cse30*_cse6
+    _cse32 = _cse30*_cse7
+    _cse33 = 0.0036091*_cse6 + 5.009e-5*_cse7
+    _cse34 = math.cos(q5)
+    _cse35 = _cse22*_cse24 + _cse25*_cse26
+    _cse36 = math.sin(q5)
+    _cse37 = -_cse1*_cse6 + _cse32
+    _cse38 = _cse0*_cse6
+    _cse39 = _cse0*_cse7
+    _cse40 = _cse1*_cse4
+    _cse41 = _cse1*_cse10
+    _cse42 = _cse1*_cse13
+    _cse43 = _cse1*_cse15
+    _cse44 = _cse42 + _cse43
+    _cse45 = _cse22*_cse44
+    _cse46 = _cse25*_cse44
+    _cse47 = _cse1*_cse12*_cse4 - _cse41
+    _cse48 = _cse22*_cse47
+    _cse49 = _cse25*_cse47
+    _cse50 = -_cse45 + _cse49
+    _cse51 = _cse50*_cse6
+    _cse52 = _cse50*_cse7
+    _cse53 = _cse46 + _cse48
+    _cse54 = -_cse38 + _cse52
+    _cse55 = -_cse10 + _cse12*_cse4
+    _cse56 = _cse22*_cse55
+    _cse57 = _cse25*_cse55
+    _cse58 = -_cse13 - _cse15
+    _cse59 = _cse22*_cse58
+    _cse60 = _cse25*_cse58 - _cse56
+    _cse61 = _cse6*_cse60
+    _cse62 = _cse60*_cse7
+    _cse63 = _cse57 + _cse59
+    out = np.empty((4, 1))
+    out[0, 0] = 1.6153e-5*_cse0*_cse12*_cse4 - _cse0*_cse17 - _cse0*_cse20 - _cse0*_cse3 - 1.6491e-5*_cse0 + _cse1*_cse18 + 4.5293e-5*_cse1*_cse6 - 0.1099981*_cse1 - 1.6153e-5*_cse11 - 0.20538*_cse14 - 0.20538*_cse16 - _cse21*_cse5 + 0.102286*_cse22*_cse24 + 4.5318e-5*_cse24*_cse25 + _cse24*_cse28 + 0.102286*_cse25*_cse26 + _cse26*_cse29 - 4.5318e-5*_cse27 + _cse30*_cse33 - 0.065821*_cse31 - 4.5293e-5*_cse32 - 0.00011502*_cse5 - 0.065821*_cse8 + x*(_cse34*_cse35 + _cse36*_cse37) + y*(_cse34*_cse37 - _cse35*_cse36) + z*(-_cse31 - _cse8)
+    out[1, 0] = _cse0*_cse18 - 0.1099981*_cse0 + _cse1*_cse17 + _cse1*_cse20 - 1.6153e-5*_cse1*_cse23 + _cse1*_cse3 + 1.6491e-5*_cse1 + _cse21*_cse40 + _cse28*_cse47 + _cse29*_cse44 + _cse33*_cse50 + 4.5293e-5*_cse38 - 0.065821*_cse39 + 0.00011502*_cse40 + 1.6153e-5*_cse41 + 0.20538*_cse42 + 0.20538*_cse43 - 4.5318e-5*_cse45 + 0.102286*_cse46 + 0.102286*_cse48 + 4.5318e-5*_cse49 - 0.065821*_cse51 - 4.5293e-5*_cse52 + x*(_cse34*_cse53 + _cse36*_cse54) + y*(_cse34*_cse54 - _cse36*_cse53) + z*(-_cse39 - _cse51)
+    out[2, 0] = -0.20538*_cse10 + 1.6153e-5*_cse13 + 1.6153e-5*_cse15 + _cse19*_cse4 - _cse2*_cse21 + 0.00087944*_cse2 + 0.20538*_cse23 + 4.5318e-5*_cse25*_cse58 + _cse28*_cse58 + _cse29*_cse55 + _cse33*_cse60 + 0.4251*_cse4 - 4.5318e-5*_cse56 + 0.102286*_cse57 + 0.102286*_cse59 - _cse61*z - 0.065821*_cse61 - 4.5293e-5*_cse62 + x*(_cse34*_cse63 + _cse36*_cse62) + y*(_cse34*_cse62 - _cse36*_cse63) + 0.0892006
+    out[3, 0] = 1
+    return out
+
+
+# EE_J
+def function46(q0, q1, q2, q3, q4, q5, x, y, z):
+    _cse0 = math.sin(q0)
+    _cse1 = math.cos(q0)
+    _cse2 = math.sin(q4)
+    _cse3 = _cse0*_cse2
+    _cse4 = math.cos(q4)
+    _cse5 = math.sin(q1)
+    _cse6 = 0.21255*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = 0.00011502*_cse7
+    _cse9 = math.sin(q2)
+    _cse10 = _cse5*_cse9
+    _cse11 = _cse1*_cse10
+    _cse12 = math.cos(q2)
+    _cse13 = _cse12*_cse5
+    _cse14 = _cse1*_cse13
+    _cse15 = _cse7*_cse9
+    _cse16 = _cse1*_cse15
+    _cse17 = _cse6 - 0.00099446*_cse7
+    _cse18 = -5.009e-5*_cse2 + 0.0036091*_cse4
+    _cse19 = 0.18677*_cse12 - 0.00067934*_cse9
+    _cse20 = _cse19*_cse5
+    _cse21 = 0.00067934*_cse12 + 0.18677*_cse9
+    _cse22 = _cse21*_cse7
+    _cse23 = math.sin(q3)
+    _cse24 = _cse12*_cse7
+    _cse25 = _cse1*_cse24
+    _cse26 = _cse11 - _cse25
+    _cse27 = math.cos(q3)
+    _cse28 = _cse14 + _cse16
+    _cse29 = -_cse28
+    _cse30 = _cse23*_cse29
+    _cse31 = 0.0075028*_cse23 + 5.5328e-5*_cse27
+    _cse32 = -_cse31
+    _cse33 = 5.5328e-5*_cse23 - 0.0075028*_cse27
+    _cse34 = _cse26*_cse27 - _cse30
+    _cse35 = _cse2*_cse34
+    _cse36 = _cse34*_cse4
+    _cse37 = 0.0036091*_cse2 + 5.009e-5*_cse4
+    _cse38 = _cse0*_cse4
+    _cse39 = math.cos(q5)
+    _cse40 = _cse27*_cse29
+    _cse41 = _cse23*_cse26 + _cse40
+    _cse42 = math.sin(q5)
+    _cse43 = _cse3 + _cse36
+    _cse44 = 0.21255*_cse7
+    _cse45 = _cse44 + 0.00099446*_cse5
+    _cse46 = _cse0*_cse5
+    _cse47 = _cse0*_cse13
+    _cse48 = _cse0*_cse15
+    _cse49 = _cse47 + _cse48
+    _cse50 = _cse23*_cse49
+    _cse51 = _cse0*_cse10
+    _cse52 = _cse0*_cse24
+    _cse53 = _cse51 - _cse52
+    _cse54 = _cse27*_cse53
+    _cse55 = _cse50 + _cse54
+    _cse56 = _cse23*_cse53
+    _cse57 = _cse27*_cse49 - _cse56
+    _cse58 = _cse4*_cse57
+    _cse59 = _cse2*_cse57
+    _cse60 = _cse19*_cse7
+    _cse61 = _cse33*_cse53 + 0.102286*_cse54 - 4.5318e-5*_cse56
+    _cse62 = -_cse0*_cse60 + 4.5318e-5*_cse27*_cse49 + _cse32*_cse49 + _cse37*_cse57 - 1.6153e-5*_cse47 - 1.6153e-5*_cse48 + 0.102286*_cse50 + 0.20538*_cse51 - 0.20538*_cse52 - 4.5293e-5*_cse58 - _cse59*z - 0.065821*_cse59 + _cse61 + x*(_cse39*_cse55 + _cse42*_cse58) + y*(_cse39*_cse58 - _cse42*_cse55)
+    _cse63 = -_cse21
+    _cse64 = -_cse49
+    _cse65 = _cse23*_cse64
+    _cse66 = _cse54 - _cse65
+    _cse67 = _cse27*_cse64
+    _cse68 = _cse56 + _cse67
+    _cse69 = -_cse68
+    _cse70 = _cse4*_cse69
+    _cse71 = _cse2*_cse69
+    _cse72 = _cse1*_cse4
+    _cse73 = -_cse37
+    _cse74 = _cse2*_cse66
+    _cse75 = _cse4*_cse66
+    _cse76 = -_cse1*_cse2 + _cse75
+    _cse77 = -_cse72 - _cse74
+    _cse78 = _cse42*x
+    _cse79 = _cse39*y
+    _cse80 = _cse39*_cse76 - _cse42*_cse68
+    _cse81 = _cse39*_cse68 + _cse42*_cse76
+    _cse82 = _cse1*_cse5
+    _cse83 = -_cse26
+    _cse84 = _cse27*_cse83
+    _cse85 = _cse30 + _cse84
+    _cse86 = _cse23*_cse83
+    _cse87 = _cse27*_cse29 - _cse86
+    _cse88 = _cse4*_cse87
+    _cse89 = _cse2*_cse87
+    _cse90 = _cse33*_cse83 + 0.102286*_cse84 - 4.5318e-5*_cse86
+    _cse91 = _cse1*_cse60 - 0.20538*_cse11 + 1.6153e-5*_cse14 + 1.6153e-5*_cse16 + 0.20538*_cse25 + _cse29*_cse32 + 0.102286*_cse30 + _cse37*_cse87 + 4.5318e-5*_cse40 - 4.5293e-5*_cse88 - _cse89*z - 0.065821*_cse89 + _cse90 + x*(_cse39*_cse85 + _cse42*_cse88) + y*(_cse39*_cse88 - _cse42*_cse85)
+    _cse92 = _cse23*_cse28
+    _cse93 = _cse84 - _cse92
+    _cse94 = _cse27*_cse28
+    _cse95 = _cse86 + _cse94
+    _cse96 = -_cse95
+    _cse97 = _cse4*_cse96
+    _cse98 = _cse2*_cse96
+    _cse99 = _cse2*_cse93
+    _cse100 = _cse4*_cse93
+    _cse101 = -_cse0*_cse2 + _cse100
+    _cse102 = -_cse38 - _cse99
+    _cse103 = _cse10 - _cse24
+    _cse104 = _cse103*_cse23
+    _cse105 = -_cse13 - _cse15
+    _cse106 = _cse105*_cse27
+    _cse107 = _cse104 + _cse106
+    _cse108 = _cse103*_cse27
+    _cse109 = _cse105*_cse23
+    _cse110 = _cse108 - _cse109
+    _cse111 = _cse110*_cse4
+    _cse112 = _cse110*_cse2
+    _cse113 = _cse105*_cse33 + 0.102286*_cse106 - 4.5318e-5*_cse109
+    _cse114 = -1.6153e-5*_cse10 + _cse103*_cse32 + 0.102286*_cse104 + 4.5318e-5*_cse108 + _cse110*_cse37 - 4.5293e-5*_cse111 - _cse112*z - 0.065821*_cse112 + _cse113 - 0.20538*_cse13 - 0.20538*_cse15 - _cse20 + 1.6153e-5*_cse24 + x*(_cse107*_cse39 + _cse111*_cse42) + y*(-_cse107*_cse42 + _cse110*_cse39*_cse4)
+    _cse115 = -_cse103
+    _cse116 = _cse115*_cse23
+    _cse117 = _cse105*_cse27 - _cse116
+    _cse118 = _cse117*_cse39
+    _cse119 = _cse115*_cse27
+    _cse120 = _cse109 + _cse119
+    _cse121 = -_cse120
+    _cse122 = _cse121*_cse4
+    _cse123 = _cse117*_cse42
+    _cse124 = _cse121*_cse2
+    _cse125 = _cse117*_cse4
+    _cse126 = -_cse1
+    _cse127 = -_cse0
+    out = np.empty((6, 6))
+    out[0, 0] = -_cse0*_cse18 + 0.065821*_cse0*_cse4 + 0.1099981*_cse0 + 1.6153e-5*_cse1*_cse12*_cse7 - _cse1*_cse17 - _cse1*_cse20 - _cse1*_cse22 - _cse1*_cse6 - _cse1*_cse8 - 1.6491e-5*_cse1 - 1.6153e-5*_cse11 - 0.20538*_cse14 - 0.20538*_cse16 + 0.102286*_cse23*_cse26 + 4.5318e-5*_cse26*_cse27 + _cse26*_cse32 + 0.102286*_cse27*_cse29 + _cse29*_cse33 - 4.5293e-5*_cse3 - 4.5318e-5*_cse30 + _cse34*_cse37 - 0.065821*_cse35 - 4.5293e-5*_cse36 + x*(_cse39*_cse41 + _cse42*_cse43) + y*(_cse39*_cse43 - _cse41*_cse42) + z*(-_cse35 + _cse38)
+    out[0, 1] = -_cse0*_cse44 - _cse0*_cse45 + _cse21*_cse46 + 0.00011502*_cse46 + _cse62
+    out[0, 2] = -_cse46*_cse63 + _cse62
+    out[0, 3] = _cse31*_cse64 + _cse37*_cse69 + _cse61 - 0.102286*_cse65 - 4.5318e-5*_cse67 - 4.5293e-5*_cse70 - _cse71*z - 0.065821*_cse71 + x*(_cse39*_cse66 + _cse42*_cse70) + y*(_cse39*_cse70 - _cse42*_cse66)
+    out[0, 4] = 0.065821*_cse1*_cse2 + _cse1*_cse73 + _cse18*_cse66 + 4.5293e-5*_cse72 + 4.5293e-5*_cse74 - 0.065821*_cse75 - _cse76*z + _cse77*_cse78 + _cse77*_cse79
+    out[0, 5] = _cse80*x - _cse81*y
+    out[1, 0] = 1.6153e-5*_cse0*_cse12*_cse7 - _cse0*_cse17 - _cse0*_cse20 - _cse0*_cse22 - _cse0*_cse6 - _cse0*_cse8 - 1.6491e-5*_cse0 + _cse1*_cse18 + 4.5293e-5*_cse1*_cse2 - 0.1099981*_cse1 + 0.102286*_cse23*_cse53 + 4.5318e-5*_cse27*_cse53 + 0.102286*_cse27*_cse64 + _cse32*_cse53 + _cse33*_cse64 + _cse37*_cse66 - 0.20538*_cse47 - 0.20538*_cse48 - 1.6153e-5*_cse51 - 4.5318e-5*_cse65 - 0.065821*_cse72 - 0.065821*_cse74 - 4.5293e-5*_cse75 + _cse77*z + _cse80*y + _cse81*x
+    out[1, 1] = _cse1*_cse44 + _cse1*_cse45 - _cse21*_cse82 - 0.00011502*_cse82 + _cse91
+    out[1, 2] = _cse63*_cse82 + _cse91
+    out[1, 3] = _cse28*_cse31 + _cse37*_cse96 + _cse90 - 0.102286*_cse92 - 4.5318e-5*_cse94 - 4.5293e-5*_cse97 - _cse98*z - 0.065821*_cse98 + x*(_cse39*_cse93 + _cse42*_cse97) + y*(_cse39*_cse97 - _cse42*_cse93)
+    out[1, 4] = _cse0*_cse73 - 0.065821*_cse100 - _cse101*z + _cse102*_cse78 + _cse102*_cse79 + _cse18*_cse93 + 0.065821*_cse3 + 4.5293e-5*_cse38 + 4.5293e-5*_cse99
+    out[1, 5] = x*(_cse101*_cse39 - _cse42*_cse95) + y*(-_cse101*_cse42 - _cse39*_cse95)
+    out[2, 0] = 0
+    out[2, 1] = _cse114 - _cse22 - 0.4251*_cse5 + 0.00087944*_cse7
+    out[2, 2] = _cse114 + _cse63*_cse7
+    out[2, 3] = _cse113 + _cse115*_cse31 - 0.102286*_cse116 - 4.5318e-5*_cse119 + _cse121*_cse37 - 4.5293e-5*_cse122 - _cse124*z - 0.065821*_cse124 + x*(_cse118 + _cse122*_cse42) + y*(_cse121*_cse39*_cse4 - _cse123)
+    out[2, 4] = _cse117*_cse18 + 4.5293e-5*_cse117*_cse2 - _cse118*_cse2*y - _cse123*_cse2*x - _cse125*z - 0.065821*_cse125
+    out[2, 5] = x*(_cse118*_cse4 - _cse120*_cse42) + y*(-_cse120*_cse39 - _cse123*_cse4)
+    out[3, 0] = 0
+    out[3, 1] = _cse126
+    out[3, 2] = _cse126
+    out[3, 3] = _cse126
+    out[3, 4] = _cse68
+    out[3, 5] = _cse77
+    out[4, 0] = 0
+    out[4, 1] = _cse127
+    out[4, 2] = _cse127
+    out[4, 3] = _cse127
+    out[4, 4] = _cse95
+    out[4, 5] = _cse102
+    out[5, 0] = 1
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse120
+    out[5, 5] = -_cse117*_cse2
+    return out
+
+
+# EE_dJ
+def function47(q0, q1, q2, q3, q4, q5, dq0, dq1, dq2, dq3, dq4, dq5, x, y, z):
+    _cse0 = math.sin(q5)
+    _cse1 = math.sin(q3)
+    _cse2 = math.cos(q0)
+    _cse3 = math.sin(q1)
+    _cse4 = math.sin(q2)
+    _cse5 = _cse3*_cse4
+    _cse6 = _cse2*_cse5
+    _cse7 = math.cos(q1)
+    _cse8 = math.cos(q2)
+    _cse9 = _cse7*_cse8
+    _cse10 = _cse2*_cse9
+    _cse11 = -_cse10 + _cse6
+    _cse12 = _cse1*_cse11
+    _cse13 = math.cos(q3)
+    _cse14 = _cse3*_cse8
+    _cse15 = _cse14*_cse2
+    _cse16 = _cse4*_cse7
+    _cse17 = _cse16*_cse2
+    _cse18 = _cse15 + _cse17
+    _cse19 = -_cse18
+    _cse20 = _cse13*_cse19
+    _cse21 = _cse12 + _cse20
+    _cse22 = _cse0*_cse21
+    _cse23 = math.cos(q5)
+    _cse24 = math.sin(q0)
+    _cse25 = math.sin(q4)
+    _cse26 = _cse24*_cse25
+    _cse27 = math.cos(q4)
+    _cse28 = _cse11*_cse13
+    _cse29 = _cse1*_cse19
+    _cse30 = _cse28 - _cse29
+    _cse31 = _cse27*_cse30
+    _cse32 = _cse26 + _cse31
+    _cse33 = -_cse22 + _cse23*_cse32
+    _cse34 = _cse21*_cse23
+    _cse35 = _cse0*_cse32 + _cse34
+    _cse36 = _cse33*x - _cse35*y
+    _cse37 = _cse24*_cse27
+    _cse38 = 0.0036091*_cse25 + 5.009e-5*_cse27
+    _cse39 = -_cse38
+    _cse40 = _cse25*_cse30
+    _cse41 = 5.009e-5*_cse25 - 0.0036091*_cse27
+    _cse42 = -_cse41
+    _cse43 = _cse37 - _cse40
+    _cse44 = _cse0*x
+    _cse45 = _cse23*y
+    _cse46 = -_cse24*_cse39 - 0.065821*_cse26 + _cse30*_cse42 - 0.065821*_cse31 - _cse32*z - 4.5293e-5*_cse37 + 4.5293e-5*_cse40 + _cse43*_cse44 + _cse43*_cse45
+    _cse47 = -_cse21
+    _cse48 = _cse27*_cse47
+    _cse49 = _cse0*_cse30
+    _cse50 = 0.0075028*_cse1 + 5.5328e-5*_cse13
+    _cse51 = _cse25*_cse47
+    _cse52 = 5.5328e-5*_cse1 - 0.0075028*_cse13
+    _cse53 = _cse11*_cse52 - 4.5318e-5*_cse12 + 0.102286*_cse28
+    _cse54 = _cse19*_cse50 - 4.5318e-5*_cse20 - 0.102286*_cse29 + _cse38*_cse47 - 4.5293e-5*_cse48 - _cse51*z - 0.065821*_cse51 + _cse53 + x*(_cse0*_cse48 + _cse23*_cse30) + y*(_cse23*_cse48 - _cse49)
+    _cse55 = 0.18677*_cse4 + 0.00067934*_cse8
+    _cse56 = -_cse55
+    _cse57 = _cse3*_cse56
+    _cse58 = _cse1*_cse18
+    _cse59 = _cse28 + _cse58
+    _cse60 = _cse13*_cse18
+    _cse61 = -_cse12 + _cse60
+    _cse62 = _cse27*_cse61
+    _cse63 = -_cse50
+    _cse64 = _cse25*_cse61
+    _cse65 = 0.00067934*_cse4 - 0.18677*_cse8
+    _cse66 = -_cse65
+    _cse67 = _cse66*_cse7
+    _cse68 = -0.20538*_cse10 - 1.6153e-5*_cse15 - 1.6153e-5*_cse17 + _cse18*_cse63 - _cse2*_cse67 + _cse38*_cse61 + _cse53 + 0.102286*_cse58 + 0.20538*_cse6 + 4.5318e-5*_cse60 - 4.5293e-5*_cse62 - _cse64*z - 0.065821*_cse64 + x*(_cse0*_cse62 + _cse23*_cse59) + y*(-_cse0*_cse59 + _cse23*_cse62)
+    _cse69 = -_cse2*_cse57 + _cse68
+    _cse70 = 0.21255*_cse7
+    _cse71 = 0.00099446*_cse3 + _cse70
+    _cse72 = 0.00011502*_cse2
+    _cse73 = _cse3*_cse55
+    _cse74 = -_cse2*_cse70 - _cse2*_cse71 + _cse2*_cse73 + _cse3*_cse72 + _cse68
+    _cse75 = _cse14*_cse24
+    _cse76 = _cse16*_cse24
+    _cse77 = _cse75 + _cse76
+    _cse78 = _cse13*_cse77
+    _cse79 = _cse24*_cse5
+    _cse80 = -_cse24*_cse7*_cse8 + _cse79
+    _cse81 = -_cse80
+    _cse82 = _cse1*_cse81
+    _cse83 = _cse78 + _cse82
+    _cse84 = _cse23*_cse83
+    _cse85 = _cse2*_cse25
+    _cse86 = _cse13*_cse81
+    _cse87 = _cse1*_cse77
+    _cse88 = _cse86 - _cse87
+    _cse89 = _cse27*_cse88
+    _cse90 = _cse85 + _cse89
+    _cse91 = _cse0*_cse83
+    _cse92 = _cse2*_cse27
+    _cse93 = _cse25*_cse88
+    _cse94 = 0.21255*_cse3
+    _cse95 = -0.00099446*_cse7 + _cse94
+    _cse96 = -4.5293e-5*_cse85 + 0.065821*_cse92
+    _cse97 = _cse24*_cse7
+    _cse98 = _cse38*_cse88
+    _cse99 = _cse63*_cse81
+    _cse100 = 4.5318e-5*_cse86
+    _cse101 = 0.102286*_cse82
+    _cse102 = -4.5293e-5*_cse89
+    _cse103 = -0.065821*_cse93
+    _cse104 = _cse24*_cse3
+    _cse105 = 0.20538*_cse76
+    _cse106 = 0.20538*_cse75
+    _cse107 = 1.6153e-5*_cse79
+    _cse108 = _cse24*_cse9
+    _cse109 = -1.6153e-5*_cse108
+    _cse110 = _cse52*_cse77 + 0.102286*_cse78 - 4.5318e-5*_cse87
+    _cse111 = _cse100 + _cse101 + _cse102 + _cse103 + _cse104*_cse66 + _cse105 + _cse106 + _cse107 + _cse109 + _cse110 + _cse98 + _cse99
+    _cse112 = _cse111 + _cse24*_cse94 + _cse55*_cse97 + 0.00011502*_cse97
+    _cse113 = x*(_cse0*_cse89 + _cse84)
+    _cse114 = y*(_cse23*_cse27*_cse88 - _cse91)
+    _cse115 = -_cse93*z
+    _cse116 = -_cse95
+    _cse117 = _cse113 + _cse114 + _cse115 - _cse56*_cse97
+    _cse118 = _cse111 + _cse117
+    _cse119 = _cse1*_cse80
+    _cse120 = -_cse119 + _cse13*_cse77
+    _cse121 = _cse120*_cse23
+    _cse122 = _cse13*_cse80
+    _cse123 = _cse122 + _cse87
+    _cse124 = -_cse123
+    _cse125 = _cse124*_cse27
+    _cse126 = _cse0*_cse120
+    _cse127 = _cse124*_cse25
+    _cse128 = -0.102286*_cse119 - 4.5318e-5*_cse122 + _cse50*_cse80
+    _cse129 = _cse110 + _cse124*_cse38 - 4.5293e-5*_cse125 - _cse127*z - 0.065821*_cse127 + _cse128 + x*(_cse0*_cse125 + _cse121) + y*(_cse124*_cse23*_cse27 - _cse126)
+    _cse130 = _cse120*_cse27
+    _cse131 = _cse25*x
+    _cse132 = _cse25*y
+    _cse133 = 4.5293e-5*_cse120*_cse25 + _cse120*_cse42 - _cse121*_cse132 - _cse126*_cse131 - _cse130*z - 0.065821*_cse130
+    _cse134 = -_cse0*_cse123 + _cse121*_cse27
+    _cse135 = _cse123*_cse23 + _cse126*_cse27
+    _cse136 = _cse134*x - _cse135*y
+    _cse137 = _cse129*dq3 + _cse133*dq4 + _cse136*dq5
+    _cse138 = -_cse77
+    _cse139 = -_cse1*_cse138 + _cse122
+    _cse140 = _cse13*_cse138
+    _cse141 = _cse119 + _cse140
+    _cse142 = -_cse141
+    _cse143 = _cse142*_cse23
+    _cse144 = -_cse0*_cse139 + _cse143*_cse27
+    _cse145 = _cse0*_cse142
+    _cse146 = _cse139*_cse23 + _cse145*_cse27
+    _cse147 = _cse144*x - _cse146*y
+    _cse148 = _cse142*_cse27
+    _cse149 = -_cse131*_cse145 - _cse132*_cse143 + 4.5293e-5*_cse142*_cse25 + _cse142*_cse42 - _cse148*z - 0.065821*_cse148
+    _cse150 = -_cse139
+    _cse151 = _cse150*_cse27
+    _cse152 = -_cse52
+    _cse153 = _cse1*_cse138
+    _cse154 = _cse150*_cse25
+    _cse155 = _cse139*_cse25
+    _cse156 = _cse155 + _cse92
+    _cse157 = -_cse156
+    _cse158 = _cse23*x
+    _cse159 = _cse0*y
+    _cse160 = _cse157*_cse158 - _cse157*_cse159
+    _cse161 = _cse139*_cse27
+    _cse162 = _cse161 - _cse2*_cse25
+    _cse163 = -_cse162
+    _cse164 = -_cse0*_cse141 + _cse162*_cse23
+    _cse165 = -_cse0*_cse162 - _cse141*_cse23
+    _cse166 = _cse164*x + _cse165*y
+    _cse167 = _cse139*_cse42 + 4.5293e-5*_cse155 + _cse157*_cse44 + _cse157*_cse45 - 0.065821*_cse161 + _cse163*z + _cse2*_cse39 + 0.065821*_cse85 + 4.5293e-5*_cse92
+    _cse168 = _cse142*_cse25
+    _cse169 = -4.5318e-5*_cse119 + 0.102286*_cse122 + _cse52*_cse80
+    _cse170 = _cse138*_cse50 - 4.5318e-5*_cse140 + _cse142*_cse38 + _cse144*y + _cse146*x - 4.5293e-5*_cse148 - 0.102286*_cse153 - _cse168*z - 0.065821*_cse168 + _cse169
+    _cse171 = _cse120*_cse25
+    _cse172 = -0.20538*_cse108 + _cse120*_cse38 - 4.5293e-5*_cse130 + _cse134*y + _cse135*x + _cse169 - _cse171*z - 0.065821*_cse171 - _cse24*_cse67 + _cse63*_cse77 - 1.6153e-5*_cse75 - 1.6153e-5*_cse76 + 4.5318e-5*_cse78 + 0.20538*_cse79 + 0.102286*_cse87
+    _cse173 = _cse172 - _cse24*_cse57
+    _cse174 = 0.00011502*_cse104 + _cse172 - _cse24*_cse70 - _cse24*_cse71 + _cse24*_cse73
+    _cse175 = 4.5293e-5*_cse26
+    _cse176 = 4.5318e-5*_cse29
+    _cse177 = 4.5293e-5*_cse31
+    _cse178 = 0.065821*_cse40
+    _cse179 = _cse2*_cse3
+    _cse180 = _cse179*_cse66
+    _cse181 = _cse2*_cse7
+    _cse182 = 0.20538*_cse17
+    _cse183 = 0.20538*_cse15
+    _cse184 = 1.6153e-5*_cse6
+    _cse185 = -0.102286*_cse1*_cse11 - 4.5318e-5*_cse11*_cse13 - _cse11*_cse63 - 0.102286*_cse13*_cse19 + _cse176 + _cse177 + _cse178 + _cse180 + _cse181*_cse55 + _cse182 + _cse183 + _cse184 - _cse19*_cse52 - 1.6153e-5*_cse2*_cse7*_cse8 + _cse2*_cse94 - _cse30*_cse38 + _cse7*_cse72
+    _cse186 = _cse27*_cse49 + _cse34
+    _cse187 = -_cse22 + _cse23*_cse27*_cse30
+    _cse188 = _cse40*z
+    _cse189 = -_cse176 + _cse19*_cse52 + 0.102286*_cse20
+    _cse190 = 1.6153e-5*_cse10 + _cse11*_cse63 + 0.102286*_cse12 - _cse177 - _cse178 + _cse181*_cse56 - _cse182 - _cse183 - _cse184 + _cse186*x + _cse187*y - _cse188 + _cse189 + 4.5318e-5*_cse28 + _cse30*_cse38
+    _cse191 = -_cse180 + _cse190
+    _cse192 = -_cse11
+    _cse193 = _cse1*_cse192
+    _cse194 = -_cse193 + _cse20
+    _cse195 = _cse194*_cse23
+    _cse196 = _cse13*_cse192
+    _cse197 = _cse196 + _cse29
+    _cse198 = -_cse197
+    _cse199 = _cse198*_cse27
+    _cse200 = _cse0*_cse194
+    _cse201 = _cse198*_cse25
+    _cse202 = _cse192*_cse50 - 0.102286*_cse193 - 4.5318e-5*_cse196
+    _cse203 = _cse189 + _cse198*_cse38 - 4.5293e-5*_cse199 - _cse201*z - 0.065821*_cse201 + _cse202 + x*(_cse0*_cse199 + _cse195) + y*(_cse198*_cse23*_cse27 - _cse200)
+    _cse204 = _cse194*_cse27
+    _cse205 = -_cse131*_cse200 - _cse132*_cse195 + 4.5293e-5*_cse194*_cse25 + _cse194*_cse42 - _cse204*z - 0.065821*_cse204
+    _cse206 = x*(-_cse0*_cse197 + _cse195*_cse27) + y*(-_cse197*_cse23 - _cse200*_cse27)
+    _cse207 = _cse203*dq3 + _cse205*dq4 + _cse206*dq5
+    _cse208 = -_cse1*_cse18 + _cse196
+    _cse209 = _cse193 + _cse60
+    _cse210 = -_cse209
+    _cse211 = _cse210*_cse23
+    _cse212 = _cse0*_cse210
+    _cse213 = x*(-_cse0*_cse208 + _cse211*_cse27) + y*(-_cse208*_cse23 - _cse212*_cse27)
+    _cse214 = _cse210*_cse27
+    _cse215 = -_cse131*_cse212 - _cse132*_cse211 + 4.5293e-5*_cse210*_cse25 + _cse210*_cse42 - _cse214*z - 0.065821*_cse214
+    _cse216 = -_cse208
+    _cse217 = _cse216*_cse27
+    _cse218 = _cse216*_cse25
+    _cse219 = _cse208*_cse25
+    _cse220 = _cse219 + _cse37
+    _cse221 = -_cse220
+    _cse222 = _cse158*_cse221 - _cse159*_cse221
+    _cse223 = _cse208*_cse27
+    _cse224 = _cse223 - _cse26
+    _cse225 = -_cse224
+    _cse226 = _cse14 + _cse16
+    _cse227 = _cse1*_cse226
+    _cse228 = _cse5 - _cse9
+    _cse229 = _cse13*_cse228
+    _cse230 = _cse227 + _cse229
+    _cse231 = _cse1*_cse228
+    _cse232 = _cse13*_cse226 - _cse231
+    _cse233 = _cse232*_cse27
+    _cse234 = x*(_cse0*_cse233 + _cse23*_cse230)
+    _cse235 = y*(-_cse0*_cse230 + _cse23*_cse233)
+    _cse236 = _cse232*_cse38
+    _cse237 = _cse226*_cse63
+    _cse238 = -_cse67
+    _cse239 = 4.5318e-5*_cse13*_cse226
+    _cse240 = 0.20538*_cse5
+    _cse241 = 0.102286*_cse227
+    _cse242 = -0.20538*_cse9
+    _cse243 = -1.6153e-5*_cse16
+    _cse244 = -1.6153e-5*_cse14
+    _cse245 = -4.5293e-5*_cse233
+    _cse246 = _cse232*_cse25
+    _cse247 = -0.065821*_cse246
+    _cse248 = -_cse246*z
+    _cse249 = _cse228*_cse52 + 0.102286*_cse229 - 4.5318e-5*_cse231
+    _cse250 = _cse234 + _cse235 + _cse236 + _cse237 + _cse239 + _cse240 + _cse241 + _cse242 + _cse243 + _cse244 + _cse245 + _cse247 + _cse248 + _cse249 - _cse57
+    _cse251 = _cse238 + _cse250
+    _cse252 = -_cse226
+    _cse253 = _cse1*_cse252
+    _cse254 = _cse229 - _cse253
+    _cse255 = _cse23*_cse254
+    _cse256 = _cse13*_cse252
+    _cse257 = _cse231 + _cse256
+    _cse258 = -_cse257
+    _cse259 = _cse258*_cse27
+    _cse260 = _cse0*_cse254
+    _cse261 = _cse25*_cse258
+    _cse262 = _cse252*_cse50 - 0.102286*_cse253 - 4.5318e-5*_cse256
+    _cse263 = _cse249 + _cse258*_cse38 - 4.5293e-5*_cse259 - _cse261*z - 0.065821*_cse261 + _cse262 + x*(_cse0*_cse259 + _cse255) + y*(_cse23*_cse259 - _cse260)
+    _cse264 = _cse254*_cse27
+    _cse265 = -_cse131*_cse260 - _cse132*_cse255 + 4.5293e-5*_cse25*_cse254 + _cse254*_cse42 - _cse264*z - 0.065821*_cse264
+    _cse266 = x*(-_cse0*_cse257 + _cse23*_cse254*_cse27) + y*(-_cse23*_cse257 - _cse260*_cse27)
+    _cse267 = _cse263*dq3 + _cse265*dq4 + _cse266*dq5
+    _cse268 = -_cse228
+    _cse269 = _cse1*_cse268
+    _cse270 = -_cse256 + _cse269
+    _cse271 = -_cse270
+    _cse272 = _cse0*_cse271
+    _cse273 = _cse13*_cse268
+    _cse274 = _cse253 + _cse273
+    _cse275 = -_cse274
+    _cse276 = _cse23*_cse271
+    _cse277 = _cse0*_cse275
+    _cse278 = x*(_cse23*_cse27*_cse275 - _cse272) + y*(-_cse27*_cse277 - _cse276)
+    _cse279 = _cse27*_cse275
+    _cse280 = _cse23*_cse275
+    _cse281 = -_cse131*_cse277 - _cse132*_cse280 + 4.5293e-5*_cse25*_cse275 + _cse275*_cse42 - _cse279*z - 0.065821*_cse279
+    _cse282 = _cse27*_cse270
+    _cse283 = _cse25*_cse270
+    _cse284 = _cse0*_cse25*_cse271*y - _cse131*_cse276
+    _cse285 = _cse25*_cse271
+    _cse286 = _cse27*_cse271
+    _cse287 = _cse27*_cse272
+    _cse288 = _cse27*_cse276
+    _cse289 = _cse24*dq0
+    _cse290 = -_cse2*dq0
+    _cse291 = _cse25*dq3
+    _cse292 = _cse194*_cse25
+    _cse293 = _cse25*_cse254
+    out = np.empty((6, 6))
+    out[0, 0] = _cse36*dq5 + _cse46*dq4 + _cse54*dq3 + _cse69*dq2 + _cse74*dq1 + dq0*(_cse112 - _cse2*_cse42 + 0.1099981*_cse2 + _cse24*_cse95 + 1.6491e-5*_cse24 + _cse96 + x*(_cse0*_cse90 + _cse84) + y*(_cse23*_cse90 - _cse91) + z*(_cse92 - _cse93))
+    out[0, 1] = _cse118*dq2 + _cse137 + _cse74*dq0 + dq1*(_cse112 + _cse113 + _cse114 + _cse115 - _cse116*_cse24)
+    out[0, 2] = _cse118*dq1 + _cse137 + _cse69*dq0 + dq2*(_cse100 + _cse101 + _cse102 + _cse103 - _cse104*_cse65 + _cse105 + _cse106 + _cse107 + _cse109 + _cse110 + _cse117 + _cse98 + _cse99)
+    out[0, 3] = _cse129*dq1 + _cse129*dq2 + _cse147*dq5 + _cse149*dq4 + _cse54*dq0 + dq3*(_cse128 + _cse138*_cse152 - 0.102286*_cse140 + _cse150*_cse38 - 4.5293e-5*_cse151 + 4.5318e-5*_cse153 - _cse154*z - 0.065821*_cse154 + x*(_cse0*_cse151 + _cse143) + y*(-_cse145 + _cse150*_cse23*_cse27))
+    out[0, 4] = _cse133*dq1 + _cse133*dq2 + _cse149*dq3 + _cse160*dq5 + _cse46*dq0 + dq4*(_cse139*_cse39 + 0.065821*_cse155 + _cse156*z + 4.5293e-5*_cse161 + _cse163*_cse44 + _cse163*_cse45 + _cse2*_cse41 + _cse96)
+    out[0, 5] = _cse136*dq1 + _cse136*dq2 + _cse147*dq3 + _cse160*dq4 + _cse36*dq0 + dq5*(-_cse164*y + _cse165*x)
+    out[1, 0] = _cse166*dq5 + _cse167*dq4 + _cse170*dq3 + _cse173*dq2 + _cse174*dq1 + dq0*(-_cse175 - _cse185 - _cse2*_cse95 - 1.6491e-5*_cse2 + 0.065821*_cse24*_cse27 - _cse24*_cse42 + 0.1099981*_cse24 + _cse33*y + _cse35*x + _cse43*z)
+    out[1, 1] = _cse174*dq0 + _cse191*dq2 + _cse207 + dq1*(_cse116*_cse2 - _cse185 + _cse186*x + _cse187*y - _cse188)
+    out[1, 2] = _cse173*dq0 + _cse191*dq1 + _cse207 + dq2*(_cse179*_cse65 + _cse190)
+    out[1, 3] = _cse170*dq0 + _cse203*dq1 + _cse203*dq2 + _cse213*dq5 + _cse215*dq4 + dq3*(_cse152*_cse18 + _cse202 + _cse216*_cse38 - 4.5293e-5*_cse217 - _cse218*z - 0.065821*_cse218 + 4.5318e-5*_cse58 - 0.102286*_cse60 + x*(_cse0*_cse217 + _cse211) + y*(-_cse212 + _cse216*_cse23*_cse27))
+    out[1, 4] = _cse167*dq0 + _cse205*dq1 + _cse205*dq2 + _cse215*dq3 + _cse222*dq5 + dq4*(-_cse175 + _cse208*_cse39 + 0.065821*_cse219 + _cse220*z + 4.5293e-5*_cse223 + _cse225*_cse44 + _cse225*_cse45 + _cse24*_cse41 + 0.065821*_cse37)
+    out[1, 5] = _cse166*dq0 + _cse206*dq1 + _cse206*dq2 + _cse213*dq3 + _cse222*dq4 + dq5*(x*(-_cse0*_cse224 - _cse209*_cse23) + y*(_cse0*_cse209 - _cse224*_cse23))
+    out[2, 0] = 0
+    out[2, 1] = _cse251*dq2 + _cse267 + dq1*(_cse234 + _cse235 + _cse236 + _cse237 + _cse238 + _cse239 + _cse240 + _cse241 + _cse242 + _cse243 + _cse244 + _cse245 + _cse247 + _cse248 + _cse249 - 0.00087944*_cse3 - 0.4251*_cse7 + _cse73)
+    out[2, 2] = _cse251*dq1 + _cse267 + dq2*(_cse250 + _cse65*_cse7)
+    out[2, 3] = _cse263*dq1 + _cse263*dq2 + _cse278*dq5 + _cse281*dq4 + dq3*(_cse152*_cse268 + _cse262 + 4.5318e-5*_cse269 + _cse270*_cse38 - 0.102286*_cse273 - 4.5293e-5*_cse282 - _cse283*z - 0.065821*_cse283 + x*(_cse0*_cse282 + _cse280) + y*(_cse23*_cse282 - _cse277))
+    out[2, 4] = _cse265*dq1 + _cse265*dq2 + _cse281*dq3 + _cse284*dq5 + dq4*(_cse271*_cse39 + _cse285*z + 0.065821*_cse285 + 4.5293e-5*_cse286 - _cse287*x - _cse288*y)
+    out[2, 5] = _cse266*dq1 + _cse266*dq2 + _cse278*dq3 + _cse284*dq4 + dq5*(x*(-_cse23*_cse274 - _cse287) + y*(_cse0*_cse274 - _cse288))
+    out[3, 0] = 0
+    out[3, 1] = _cse289
+    out[3, 2] = _cse289
+    out[3, 3] = _cse289
+    out[3, 4] = _cse123*dq1 + _cse123*dq2 + _cse139*dq3 + _cse21*dq0
+    out[3, 5] = _cse163*dq4 - _cse168*dq3 - _cse171*dq1 - _cse171*dq2 + _cse43*dq0
+    out[4, 0] = 0
+    out[4, 1] = _cse290
+    out[4, 2] = _cse290
+    out[4, 3] = _cse290
+    out[4, 4] = _cse141*dq0 + _cse197*dq1 + _cse197*dq2 + _cse208*dq3
+    out[4, 5] = _cse157*dq0 - _cse210*_cse291 + _cse225*dq4 - _cse292*dq1 - _cse292*dq2
+    out[5, 0] = 0
+    out[5, 1] = 0
+    out[5, 2] = 0
+    out[5, 3] = 0
+    out[5, 4] = _cse257*dq1 + _cse257*dq2 + _cse271*dq3
+    out[5, 5] = -_cse275*_cse291 - _cse286*dq4 - _cse293*dq1 - _cse293*dq2
+    return out
+
+
+FUNCTIONS = {
+    'M': function0,
+    'g': function1,
+    'Gamma': function2,
+    'joint0[0,0,0]_Tx': function3,
+    'joint0[0,0,0]_J': function4,
+    'joint0[0,0,0]_dJ': function5,
+    'joint1[0,0,0]_Tx': function6,
+    'joint1[0,0,0]_J': function7,
+    'joint1[0,0,0]_dJ': function8,
+    'joint2[0,0,0]_Tx': function9,
+    'joint2[0,0,0]_J': function10,
+    'joint2[0,0,0]_dJ': function11,
+    'joint3[0,0,0]_Tx': function12,
+    'joint3[0,0,0]_J': function13,
+    'joint3[0,0,0]_dJ': function14,
+    'joint4[0,0,0]_Tx': function15,
+    'joint4[0,0,0]_J': function16,
+    'joint4[0,0,0]_dJ': function17,
+    'joint5[0,0,0]_Tx': function18,
+    'joint5[0,0,0]_J': function19,
+    'joint5[0,0,0]_dJ': function20,
+    'link0[0,0,0]_Tx': function21,
+    'link0[0,0,0]_J': function22,
+    'link0[0,0,0]_dJ': function23,
+    'link1[0,0,0]_Tx': function24,
+    'link1[0,0,0]_J': function25,
+    'link1[0,0,0]_dJ': function26,
+    'link2[0,0,0]_Tx': function27,
+    'link2[0,0,0]_J': function28,
+    'link2[0,0,0]_dJ': function29,
+    'link3[0,0,0]_Tx': function30,
+    'link3[0,0,0]_J': function31,
+    'link3[0,0,0]_dJ': function32,
+    'link4[0,0,0]_Tx': function33,
+    'link4[0,0,0]_J': function34,
+    'link4[0,0,0]_dJ': function35,
+    'link5[0,0,0]_Tx': function36,
+    'link5[0,0,0]_J': function37,
+    'link5[0,0,0]_dJ': function38,
+    'link6[0,0,0]_Tx': function39,
+    'link6[0,0,0]_J': function40,
+    'link6[0,0,0]_dJ': function41,
+    'EE[0,0,0]_Tx': function42,
+    'EE[0,0,0]_J': function43,
+    'EE[0,0,0]_dJ': function44,
+    'EE_Tx': function45,
+    'EE_J': function46,
+    'EE_dJ': function47,
+}
@@ -2,3 +2,9 @@ from .floating import Floating
 from .osc import OSC
 from .joint import Joint
 from .sliding import Sliding
+from .batch_osc import BatchOSC
+from .multi_rate import MultiRateDynamics
+from .controller_stack import ControlContext, ControllerStack
+from .feedforward import Feedforward
+from .mpc import MPC
+from .qp import QP
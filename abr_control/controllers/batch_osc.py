@@ -0,0 +1,224 @@
+import numpy as np
+
+from .osc import OSC
+
+
+def _matvec(A, v):
+    """ Multiplies each matrix in A by the matching vector in v """
+
+    return np.matmul(A, v[..., None])[..., 0]
+
+
+class BatchOSC(OSC):
+    """ Implements an operational space controller for a batch of arms
+
+    Generates the control signals for K arms with the same robot config
+    in one vectorized step, such as for a fleet of simulated arms. The
+    joint angles and velocities are passed in with shape (K, N_JOINTS),
+    and the kinematics and dynamics are evaluated with the batch accessors
+    of the robot config. The control signal of each arm is the same as
+    from OSC.generate. Only position degrees of freedom can be controlled.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    kp : float, optional (Default: 1)
+        proportional gain term
+    kv : float, optional (Default: None)
+        derivative gain term, a good starting point is sqrt(kp)
+    ki : float, optional (Default: 0)
+        integral gain term on the position error
+    vmax : float, optional (Default: 0.5)
+        The max allowed velocity of the end-effector [meters/second].
+        If the control signal specifies something above this
+        value it is clipped, if set to None no clipping occurs
+    null_control : boolean, optional (Default: True)
+        Apply a secondary control signal which
+        drives the arm to specified resting joint angles without
+        affecting the movement of the end-effector
+    use_g : boolean, optional (Default: True)
+        calculate and compensate for the effects of gravity
+    use_C : boolean, optional (Default: False)
+        calculate and compensate for the Coriolis and
+        centripetal effects of the arm
+    use_dJ : boolean, optional (Default: False)
+        use the Jacobian derivative wrt time
+    ctrlr_dof : list of booleans, optional (Default: None)
+        mask over the [x, y, z, alpha, beta, gamma] degrees of freedom
+        of the task space to control, only [x, y, z] can be True.
+        If None the position [x, y, z] is controlled
+    rcond : float, optional (Default: None)
+        singular values of the inverse task space inertia matrix below
+        rcond * the largest singular value are set to 0 when it is
+        inverted, to handle singularities. If None .04
+
+    Attributes
+    ----------
+    integrated_error : float numpy.array
+        task-space integrated error term of each arm, shape (K, 3)
+    """
+
+    def __init__(self, robot_config, kp=1, kv=None, ki=0, vmax=0.5,
+                 null_control=True, use_g=True, use_C=False, use_dJ=False,
+                 ctrlr_dof=None, rcond=None):
+
+        super(BatchOSC, self).__init__(
+            robot_config, kp=kp, kv=kv, ki=ki, vmax=vmax,
+            null_control=null_control, use_g=use_g, use_C=use_C,
+            use_dJ=use_dJ, ctrlr_dof=ctrlr_dof, rcond=rcond)
+
+        if self._n_position < self.n_dof:
+            raise Exception('BatchOSC only controls the position, use '
+                            'OSC to control the orientation')
+
+    def generate(self, q, dq,
+                 target_pos, target_vel=np.zeros(3),
+                 ref_frame='EE', offset=[0, 0, 0], ee_force=None):
+        """ Generates the control signals to move each EE to its target
+
+        Returns the control signals, shape (K, N_JOINTS)
+
+        Parameters
+        ----------
+        q : float numpy.array
+            current joint angles [radians], shape (K, N_JOINTS)
+        dq : float numpy.array
+            current joint velocities [radians/second], shape (K, N_JOINTS)
+        target_pos : float numpy.array
+            desired [x, y, z] position of each arm [meters], shape (K, 3),
+            or shape (3,) for the same target for every arm
+        target_vel : float numpy.array, optional (Default: numpy.zeros)
+            desired [x, y, z] velocity [meters/second], shape (K, 3) or (3,)
+        ref_frame : string, optional (Default: 'EE')
+            the point being controlled, default is the end-effector.
+        offset : list, optional (Default: [0, 0, 0])
+            point of interest inside the frame of reference [meters]
+        ee_force: float array, Optional, (Default: None)
+            if there are any additional forces to add in task space,
+            add them here, one for each controlled degree of freedom
+        """
+
+        q = np.asarray(q, dtype='float64')
+        dq = np.asarray(dq, dtype='float64')
+
+        # calculate the end-effector position information
+        xyz = self.robot_config.Tx(ref_frame, q, x=offset)
+
+        # calculate the Jacobians for the point of interest and the
+        # reference frame, isolating the controlled degrees of freedom
+        J = self.robot_config.J(ref_frame, q, x=offset)[:, self._rows]
+        if any(offset):
+            JEE = self.robot_config.J(ref_frame, q)[:, self._rows]
+        else:
+            JEE = J
+
+        # calculate the inertia matrix in joint space
+        M = self.robot_config.M(q)
+
+        # calculate the inertia matrix in task space
+        MinvJT = np.linalg.solve(M, np.swapaxes(JEE, 1, 2))
+        Mx_inv = np.matmul(JEE, MinvJT)
+        # singular values < (rcond * max(singular_values)) set to 0
+        Mx = np.linalg.pinv(Mx_inv, rcond=self.rcond)
+        self._null_space = (J, Mx, MinvJT)
+
+        # calculate the position error
+        xyz_error = xyz - target_pos
+        x_tilde = xyz_error[:, self._position_dof]
+        target_vel = np.asarray(target_vel)[..., self._position_dof]
+
+        if self.vmax is not None:
+            # implement velocity limiting
+            with np.errstate(divide='ignore'):
+                sat = self.vmax / (self.lamb * np.abs(x_tilde))
+            scale = np.ones(x_tilde.shape)
+            clipped_arms = np.where(np.any(sat < 1, axis=1))[0]
+            if clipped_arms.size > 0:
+                index = np.argmin(sat[clipped_arms], axis=1)
+                unclipped = self.kp * x_tilde[clipped_arms, index]
+                clipped = (self.kv * self.vmax *
+                           np.sign(x_tilde[clipped_arms, index]))
+                scale[clipped_arms] = (clipped / unclipped)[:, None]
+                scale[clipped_arms, index] = 1
+
+            dx = _matvec(J, dq)
+            u_task = -self.kv * (dx - target_vel -
+                                 np.clip(sat / scale, 0, 1) *
+                                 -self.lamb * scale * x_tilde)
+        else:
+            # generate (x,y,z) force without velocity limiting)
+            u_task = -self.kp * x_tilde
+
+        if self.use_dJ:
+            # add in estimate of current acceleration
+            dJ = self.robot_config.dJ(ref_frame, q=q, dq=dq)
+            # apply mask
+            dJ = dJ[:, self._rows]
+            u_task -= _matvec(dJ, dq)
+
+        if self.ki != 0:
+            # add in the integrated error term
+            self.integrated_error = self.integrated_error + xyz_error
+            u_task -= self.ki * self.integrated_error[:, self._position_dof]
+
+        # add in any specified additional task space force
+        if ee_force is not None:
+            u_task += ee_force
+
+        # incorporate task space inertia matrix
+        u = _matvec(np.swapaxes(J, 1, 2), _matvec(Mx, u_task))
+
+        if self.vmax is None:
+            u -= _matvec(M, dq)
+
+        if self.use_C:
+            # add in estimation of full centrifugal and Coriolis effects
+            u -= self.robot_config.c(q=q, dq=dq)
+
+        # store the current control signal u for training in case
+        # dynamics adaptation signal is being used
+        # NOTE: training signal should not include gravity compensation
+        self.training_signal = np.copy(u)
+
+        # cancel out effects of gravity
+        if self.use_g:
+            u -= self.robot_config.g(q=q)
+
+        if self.null_control:
+            # calculated desired joint angle acceleration using rest angles
+            q_des = ((self.robot_config.REST_ANGLES - q + np.pi) %
+                     (np.pi * 2) - np.pi)
+            q_des[:, self.rest_indices] = 0.0
+            dq_des = np.zeros(dq.shape)
+            dq_des[:, self.null_indices] = dq[:, self.null_indices]
+
+            u_null = _matvec(M, self.nkp * q_des - self.nkv * dq_des)
+            u += self.project_null_space(u_null)
+
+        return u
+
+    def project_null_space(self, u, out=None):
+        """ Projects joint space signals into the null space of each task
+
+        The batch version of OSC.project_null_space, u is of shape
+        (K, N_JOINTS).
+
+        Parameters
+        ----------
+        u : float numpy.array
+            the joint space signals to project [Nm], shape (K, N_JOINTS)
+        out : float numpy.array, optional (Default: None)
+            the array to write the projected signals to, can be u
+        """
+
+        if self._null_space is None:
+            raise Exception('generate must be called before projecting '
+                            'into the null space of the task')
+        J, Mx, MinvJT = self._null_space
+
+        # Jbar^T u = Mx (M^-1 JEE^T)^T u
+        projected = _matvec(Mx, _matvec(np.swapaxes(MinvJT, 1, 2), u))
+        return np.subtract(u, _matvec(np.swapaxes(J, 1, 2), projected),
+                           out=out)
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class Controller:
     """
     The base functions for all controllers
@@ -7,10 +10,23 @@ class Controller:
     robot_config : class instance
         contains all relevant information about the arm
         such as: number of joints, number of links, mass information etc.
+    preallocate : boolean, optional (Default: False)
+        if True the control signal is returned in a buffer allocated at
+        construction, which is overwritten on the next call to generate,
+        instead of a copy of it. The controllers calculate the signal in
+        preallocated buffers, but the arrays returned by the robot config
+        and some intermediate results are still allocated each time
+        step. Copy the signal if it needs to be kept between time steps
     """
 
-    def __init__(self, robot_config):
+    def __init__(self, robot_config, preallocate=False):
         self.robot_config = robot_config
+        self.preallocate = preallocate
+
+    def _output(self, u):
+        """ Returns the control signal buffer, or a copy of it """
+
+        return u if self.preallocate else np.copy(u)
 
     def generate(self, q, dq):
         """
@@ -0,0 +1,282 @@
+import numpy as np
+
+from .controller import Controller
+
+
+class ControlContext():
+    """ Caches the kinematics and dynamics of a robot config for one tick
+
+    Wraps a robot config so that controllers and signals created with the
+    same context share the functions evaluated for the current joint
+    angles and velocities, instead of each evaluating M, the transforms
+    and the Jacobians again. The results are cached until update is
+    called with the next q and dq, by ControllerStack.generate each tick.
+    Calls for any other joint angles, or for a batch, are passed through
+    to the robot config, as are all other functions and attributes.
+
+        context = ControlContext(robot_config)
+        ctrlr = ControllerStack(
+            OSC(context, kp=100),
+            signals=[signals.AvoidObstacles(context, obstacles)])
+
+    The inverse of M is also cached, with M_inv, and OSC shares its task
+    space inertia matrix through task_inertia.
+
+    NOTE: the cached arrays are returned, and must not be modified.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+
+    Attributes
+    ----------
+    q : numpy.array
+        the joint angles of the current tick [radians]
+    dq : numpy.array
+        the joint velocities of the current tick [radians/second]
+    n_evaluations : dict
+        the number of evaluations of each function, by name
+    n_hits : dict
+        the number of calls of each function answered from the cache
+    """
+
+    def __init__(self, robot_config):
+
+        self.robot_config = robot_config
+        self.q = None
+        self.dq = None
+        self._cache = {}
+        self.n_evaluations = {}
+        self.n_hits = {}
+
+    def __getattr__(self, name):
+        # only called for attributes not found on the context
+        if name == 'robot_config':
+            raise AttributeError(name)
+        return getattr(self.robot_config, name)
+
+    def update(self, q, dq=None):
+        """ Sets the joint angles and velocities of the current tick
+        and clears the cache
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians]
+        dq : numpy.array, optional (Default: None)
+            joint velocities [radians/second]
+        """
+
+        self.q = q
+        self.dq = dq
+        self._cache.clear()
+
+    def _is_current(self, q, dq=None):
+        """ Checks if q and dq are those of the current tick """
+
+        if self.q is None or np.ndim(q) > 1:
+            return False
+        if q is not self.q and not np.array_equal(q, self.q):
+            return False
+        if dq is not None and dq is not self.dq and (
+                self.dq is None or not np.array_equal(dq, self.dq)):
+            return False
+        return True
+
+    def _cached(self, key, function, q, dq=None):
+        """ Returns the cached result for key if q and dq are current,
+        else calls function
+        """
+
+        if not self._is_current(q, dq):
+            return function()
+
+        name = key[0]
+        if key in self._cache:
+            self.n_hits[name] = self.n_hits.get(name, 0) + 1
+            return self._cache[key]
+
+        value = function()
+        self._cache[key] = value
+        self.n_evaluations[name] = self.n_evaluations.get(name, 0) + 1
+        return value
+
+    def c(self, q, dq):
+        """ Returns the centripetal and Coriolis forces, see BaseConfig.c
+        """
+
+        return self._cached(('c',), lambda: self.robot_config.c(q, dq),
+                            q, dq)
+
+    def dJ(self, name, q, dq, x=[0, 0, 0]):
+        """ Returns the derivative of the Jacobian, see BaseConfig.dJ """
+
+        return self._cached(
+            ('dJ', name, tuple(x)),
+            lambda: self.robot_config.dJ(name, q=q, dq=dq, x=x), q, dq)
+
+    def g(self, q):
+        """ Returns the force of gravity in joint space, see BaseConfig.g
+        """
+
+        return self._cached(('g',), lambda: self.robot_config.g(q), q)
+
+    def Gamma(self, q):
+        """ Returns the Christoffel symbols, see BaseConfig.Gamma """
+
+        return self._cached(('Gamma',), lambda: self.robot_config.Gamma(q), q)
+
+    def J(self, name, q, x=[0, 0, 0]):
+        """ Returns the Jacobian, see BaseConfig.J """
+
+        return self._cached(
+            ('J', name, tuple(x)),
+            lambda: self.robot_config.J(name, q, x=x), q)
+
+    def M(self, q):
+        """ Returns the inertia matrix in joint space, see BaseConfig.M """
+
+        return self._cached(('M',), lambda: self.robot_config.M(q), q)
+
+    def M_inv(self, q):
+        """ Returns the inverse of the inertia matrix in joint space
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians]
+        """
+
+        return self._cached(('M_inv',), lambda: np.linalg.inv(self.M(q)), q)
+
+    def task_inertia(self, key, q, function):
+        """ Returns the task space inertia matrix and M^-1 J^T of a task
+
+        Controllers pass in how they calculate the pair, so it is
+        calculated once per tick for each key, and shared by the
+        controllers created with this context that have the same task.
+
+        Parameters
+        ----------
+        key : tuple
+            identifies the task and how it is calculated, ex: the frame,
+            the controlled degrees of freedom, and the rcond of OSC
+        q : numpy.array
+            joint angles [radians]
+        function : callable
+            called without arguments to calculate (Mx, M^-1 J^T)
+        """
+
+        return self._cached(('task_inertia',) + tuple(key), function, q)
+
+    def R(self, name, q):
+        """ Returns the rotation matrix of a frame, see BaseConfig.R """
+
+        return self._cached(('R', name), lambda: self.robot_config.R(name, q),
+                            q)
+
+    def S(self, q, dq):
+        """ Returns the centripetal and Coriolis forces matrix, see
+        BaseConfig.S
+        """
+
+        return self._cached(('S',), lambda: self.robot_config.S(q, dq),
+                            q, dq)
+
+    def T_inv(self, name, q, x=[0, 0, 0]):
+        """ Returns the inverse transform of a frame, see BaseConfig.T_inv
+        """
+
+        return self._cached(
+            ('T_inv', name, tuple(x)),
+            lambda: self.robot_config.T_inv(name, q, x=x), q)
+
+    def Tx(self, name, q, x=[0, 0, 0]):
+        """ Returns the position of a point, see BaseConfig.Tx """
+
+        return self._cached(
+            ('Tx', name, tuple(x)),
+            lambda: self.robot_config.Tx(name, q, x=x), q)
+
+
+class ControllerStack(Controller):
+    """ Sums the control signals of a controller and additive signals
+
+    Each call to generate updates the ControlContext of the controller
+    and signals, if they were created with one, so the kinematics and
+    dynamics they share are evaluated once per tick.
+
+    With null_space set, the signals are added with strict task priority:
+    each is projected into the null space of the controller's task with
+    controller.project_null_space before being added, so that it does
+    not affect the task, such as the end-effector position of OSC.
+
+    Parameters
+    ----------
+    controller : class instance
+        the primary controller, such as OSC
+    signals : list of class instances, optional (Default: None)
+        additive signals, the output of their generate(q) functions is
+        added to the control signal
+    null_space : boolean or list of booleans, optional (Default: False)
+        project the signals into the null space of the controller's task,
+        for all signals, or one entry for each signal
+
+    Attributes
+    ----------
+    contexts : list of ControlContext
+        the contexts of the controller and signals, updated each tick
+    u_signals : list of numpy.array
+        the signal added by each of the signals on the last tick, after
+        any null space projection
+    """
+
+    def __init__(self, controller, signals=None, null_space=False):
+
+        super(ControllerStack, self).__init__(controller.robot_config)
+
+        self.controller = controller
+        self.signals = [] if signals is None else list(signals)
+        if isinstance(null_space, bool):
+            null_space = [null_space] * len(self.signals)
+        if len(null_space) != len(self.signals):
+            raise Exception('null_space needs one entry for each signal')
+        if any(null_space) and not hasattr(controller, 'project_null_space'):
+            raise Exception('%s does not define a null space to project '
+                            'the signals into' % type(controller).__name__)
+        self.null_space = list(null_space)
+        self.u_signals = [None] * len(self.signals)
+
+        self.contexts = []
+        for component in [controller] + self.signals:
+            config = getattr(component, 'robot_config', None)
+            if isinstance(config, ControlContext) and not any(
+                    config is context for context in self.contexts):
+                self.contexts.append(config)
+
+    def generate(self, q, dq, **kwargs):
+        """ Generates the summed control signal
+
+        Parameters
+        ----------
+        q : float numpy.array
+            current joint angles [radians]
+        dq : float numpy.array
+            current joint velocities [radians/second]
+        kwargs : optional
+            passed to controller.generate, such as target_pos for OSC
+        """
+
+        for context in self.contexts:
+            context.update(q, dq)
+
+        u = self.controller.generate(q=q, dq=dq, **kwargs)
+        for ii, signal in enumerate(self.signals):
+            u_signal = signal.generate(q)
+            if self.null_space[ii]:
+                u_signal = self.controller.project_null_space(u_signal)
+            self.u_signals[ii] = u_signal
+            u += u_signal
+        return u
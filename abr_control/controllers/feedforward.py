@@ -0,0 +1,177 @@
+import numpy as np
+
+from . import controller
+
+
+class Feedforward(controller.Controller):
+    """ Tracks a joint space trajectory with precomputed inverse dynamics
+
+    The inverse dynamics feedforward torques, M ddq + c - g, and the
+    inertia matrices along a planned trajectory, such as from
+    path_planners.Linear or SecondOrder in joint space, are evaluated in
+    one batch by plan before the motion starts. Online, generate only
+    adds a PD correction scaled by the stored inertia matrix,
+
+        u = u_ff + M(q_d) (kp * (q_d - q) + kv * (dq_d - dq))
+
+    so no kinematics or dynamics are evaluated at each time step. The
+    plan can be saved and loaded for repeated motions.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    kp : float, optional (Default: 1)
+        proportional gain term
+    kv : float, optional (Default: None)
+        derivative gain term, a good starting point is sqrt(kp)
+    preallocate : boolean, optional (Default: False)
+        if True the control signal is returned in a buffer that is
+        overwritten on the next call to generate
+
+    Attributes
+    ----------
+    trajectory : numpy.array
+        the planned joint angles and velocities, [q, dq] on each row
+    u_feedforward : numpy.array
+        the feedforward torques for each time step of the trajectory [Nm]
+    M_trajectory : numpy.array
+        the inertia matrix for each time step of the trajectory
+    n : int
+        the index of the time step used by the next call to generate
+    """
+
+    def __init__(self, robot_config, kp=1, kv=None, preallocate=False):
+        super(Feedforward, self).__init__(
+            robot_config, preallocate=preallocate)
+
+        self.kp = kp
+        self.kv = np.sqrt(self.kp) if kv is None else kv
+
+        self.trajectory = None
+        self.u_feedforward = None
+        self.M_trajectory = None
+        self.n = 0
+
+        # workspace for the control signal
+        self._u = np.zeros(robot_config.N_JOINTS)
+        self._q_tilde = np.zeros(robot_config.N_JOINTS)
+        self._dq_tilde = np.zeros(robot_config.N_JOINTS)
+
+    def plan(self, trajectory, dt=0.001, ddq=None):
+        """ Evaluates the feedforward torques along a trajectory
+
+        Returns the feedforward torques, shape (n_timesteps, N_JOINTS)
+
+        Parameters
+        ----------
+        trajectory : numpy.array
+            joint angles and velocities for each time step, [q, dq] on
+            each row, as path_planner.trajectory in joint space
+        dt : float, optional (Default: 0.001)
+            the time step of the trajectory [seconds]
+        ddq : numpy.array, optional (Default: None)
+            joint accelerations for each time step [radians/second**2],
+            if None they are calculated from the velocities by finite
+            differences
+        """
+
+        N = self.robot_config.N_JOINTS
+        trajectory = np.asarray(trajectory, dtype='float64')
+        if trajectory.ndim != 2 or trajectory.shape[1] != 2 * N:
+            raise Exception('trajectory must have shape (n_timesteps, %i)'
+                            % (2 * N))
+        q = trajectory[:, :N]
+        dq = trajectory[:, N:]
+        if ddq is None:
+            if trajectory.shape[0] > 1:
+                ddq = np.gradient(dq, dt, axis=0)
+            else:
+                ddq = np.zeros(dq.shape)
+
+        # evaluate the dynamics for all time steps in one batch
+        self.M_trajectory = np.asarray(self.robot_config.M(q),
+                                       dtype='float64')
+        self.u_feedforward = (
+            np.einsum('kij,kj->ki', self.M_trajectory, ddq) +
+            self.robot_config.c(q, dq) - self.robot_config.g(q))
+        self.trajectory = trajectory
+        self.n = 0
+
+        return self.u_feedforward
+
+    def save(self, filename):
+        """ Saves the planned trajectory and torques to a .npz file
+
+        Parameters
+        ----------
+        filename : string
+            the file to save to
+        """
+
+        if self.trajectory is None:
+            raise Exception('plan must be called before saving')
+        np.savez(filename, trajectory=self.trajectory,
+                 u_feedforward=self.u_feedforward,
+                 M_trajectory=self.M_trajectory)
+
+    def load(self, filename):
+        """ Loads a trajectory and torques saved with save
+
+        Parameters
+        ----------
+        filename : string
+            the .npz file to load
+        """
+
+        data = np.load(filename)
+        if data['trajectory'].shape[1] != 2 * self.robot_config.N_JOINTS:
+            raise Exception('%s was planned for a different number of '
+                            'joints' % filename)
+        self.trajectory = data['trajectory']
+        self.u_feedforward = data['u_feedforward']
+        self.M_trajectory = data['M_trajectory']
+        self.n = 0
+
+    def generate(self, q, dq, step=None):
+        """ Generates the control signal for a step along the trajectory
+
+        Parameters
+        ----------
+        q : float numpy.array
+            current joint angles [radians]
+        dq : float numpy.array
+            current joint velocities [radians/second]
+        step : int, optional (Default: None)
+            the index of the time step along the trajectory, if None the
+            step after the last call is used. After the end of the
+            trajectory the last step is held
+        """
+
+        if self.trajectory is None:
+            raise Exception('plan or load must be called before generate')
+
+        if step is None:
+            step = self.n
+        step = min(step, self.trajectory.shape[0] - 1)
+        self.n = step + 1
+
+        N = self.robot_config.N_JOINTS
+        target = self.trajectory[step]
+
+        # calculate the direction for each joint to move, wrapping
+        # around the -pi to pi limits to find the shortest distance
+        q_tilde = np.subtract(target[:N], q, out=self._q_tilde)
+        q_tilde += np.pi
+        np.mod(q_tilde, np.pi * 2, out=q_tilde)
+        q_tilde -= np.pi
+
+        dq_tilde = np.subtract(target[N:], dq, out=self._dq_tilde)
+        dq_tilde *= self.kv
+        q_tilde *= self.kp
+        dq_tilde += q_tilde
+        u = np.matmul(self.M_trajectory[step], dq_tilde, out=self._u)
+        u += self.u_feedforward[step]
+
+        return self._output(u)
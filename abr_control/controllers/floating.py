@@ -17,12 +17,19 @@ class Floating(controller.Controller):
         such as: number of joints, number of links, mass information etc.
     dynamic : boolean, optional (Default: False)
         accounts for joint velocity / inertia in controller if True
+    preallocate : boolean, optional (Default: False)
+        if True the control signal is returned in a buffer that is
+        overwritten on the next call to generate
     """
 
-    def __init__(self, robot_config, dynamic=False):
-        super(Floating, self).__init__(robot_config)
+    def __init__(self, robot_config, dynamic=False, preallocate=False):
+        super(Floating, self).__init__(robot_config, preallocate=preallocate)
         self.dynamic = dynamic
 
+        # workspace for the control signal
+        self._u = np.zeros(robot_config.N_JOINTS)
+        self._Mdq = np.zeros(robot_config.N_JOINTS)
+
     def generate(self, q, dq=None):
         """ Generates the control signal to compensate for gravity
 
@@ -36,11 +43,11 @@ class Floating(controller.Controller):
 
         # calculate the effect of gravity in joint space
         g = self.robot_config.g(q)
-        u = -g
+        u = np.negative(g, out=self._u)
 
         if self.dynamic:
             # compensate for current velocity
             M = self.robot_config.M(q)
-            u -= np.dot(M, dq)
+            u -= np.matmul(M, dq, out=self._Mdq)
 
-        return u
+        return self._output(u)
@@ -17,16 +17,23 @@ class Joint(controller.Controller):
         proportional gain term
     kv : float, optional (Default: None)
         derivative gain term, a good starting point is sqrt(kp)
+    preallocate : boolean, optional (Default: False)
+        if True the control signal is returned in a buffer that is
+        overwritten on the next call to generate
     """
 
-    def __init__(self, robot_config, kp=1, kv=None):
-        super(Joint, self).__init__(robot_config)
+    def __init__(self, robot_config, kp=1, kv=None, preallocate=False):
+        super(Joint, self).__init__(robot_config, preallocate=preallocate)
 
         self.kp = kp
         self.kv = np.sqrt(self.kp) if kv is None else kv
         self.ZEROS_N_JOINTS = np.zeros(robot_config.N_JOINTS)
         self.q_tilde = np.copy(self.ZEROS_N_JOINTS)
 
+        # workspace for the control signal
+        self._u = np.zeros(robot_config.N_JOINTS)
+        self._dq_tilde = np.zeros(robot_config.N_JOINTS)
+
     def generate(self, q, dq, target_pos, target_vel=None):
         """Generate a joint space control signal
 
@@ -47,13 +54,18 @@ class Joint(controller.Controller):
 
         # calculate the direction for each joint to move, wrapping
         # around the -pi to pi limits to find the shortest distance
-        self.q_tilde = ((target_pos - q + np.pi) % (np.pi * 2)) - np.pi
+        q_tilde = np.subtract(target_pos, q, out=self.q_tilde)
+        q_tilde += np.pi
+        np.mod(q_tilde, np.pi * 2, out=q_tilde)
+        q_tilde -= np.pi
 
         # get the joint space inertia matrix
         M = self.robot_config.M(q)
-        u = np.dot(M, (self.kp * self.q_tilde +
-                       self.kv * (target_vel - dq)))
+        dq_tilde = np.subtract(target_vel, dq, out=self._dq_tilde)
+        dq_tilde *= self.kv
+        dq_tilde += np.multiply(q_tilde, self.kp, out=self._u)
+        u = np.matmul(M, dq_tilde, out=self._u)
         # account for gravity
         u -= self.robot_config.g(q)
 
-        return u
+        return self._output(u)
@@ -0,0 +1,239 @@
+import collections
+import timeit
+
+import numpy as np
+
+from . import controller
+
+
+class MPC(controller.Controller):
+    """ Implements a sampling based model predictive controller (MPC)
+
+    Optimizes the joint torques over a short horizon to move the
+    end-effector to a target. Each call to generate samples n_samples
+    torque sequences around the current plan, rolls the arm dynamics
+    forward for all of them in parallel with the batch accessors of the
+    robot config, and updates the plan from their costs, with either
+    model predictive path integral control (MPPI) or the cross entropy
+    method (CEM). The first torque of the plan is applied, and the plan
+    is shifted by one step to warm start the next call.
+
+    The torques are optimized on top of gravity compensation, u = v - g,
+    so gravity cancels out of the rollouts, which only need M and the
+    Christoffel symbols for c. The forward dynamics are
+    ddq = M^-1 (u - c + g) = M^-1 (v - c).
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    horizon : int, optional (Default: 10)
+        the number of time steps to optimize over
+    dt : float, optional (Default: 0.01)
+        the time step of the rollouts [seconds], the plan is shifted by
+        one step each call to generate, so this should match the period
+        generate is called at
+    n_samples : int, optional (Default: 64)
+        the number of torque sequences rolled out each iteration
+    n_iterations : int, optional (Default: 1)
+        the number of sampling iterations per call to generate
+    method : string, optional (Default: 'mppi')
+        'mppi' weights the samples by exp(-cost / temperature),
+        'cem' refits the mean and standard deviation to the n_elites
+        lowest cost samples
+    sigma : float or numpy.array, optional (Default: 1.0)
+        the standard deviation of the sampled torques [Nm], for all
+        joints or one for each joint
+    temperature : float, optional (Default: 1.0)
+        the MPPI temperature, lower values weight the best samples more
+    n_elites : int, optional (Default: None)
+        the number of samples CEM refits to, if None n_samples / 8
+    u_max : float or numpy.array, optional (Default: None)
+        the limit on the magnitude of the output torques u = v - g [Nm],
+        the sampled torques v are clipped to g +/- u_max with g at the
+        current joint angles, so the torque applied is the one optimized.
+        If None no limit
+    w_position : float, optional (Default: 100)
+        weight of the squared distance of the end-effector to the target
+    w_velocity : float, optional (Default: .1)
+        weight of the squared joint velocities
+    w_control : float, optional (Default: .001)
+        weight of the squared torques v
+    w_terminal : float, optional (Default: 1000)
+        weight of the squared distance to the target at the end of the
+        horizon
+    freeze_dynamics : boolean, optional (Default: False)
+        if True M and the Christoffel symbols are evaluated once at the
+        current joint angles and held over the horizon, so that only the
+        end-effector position is evaluated for each sample and step.
+        Much faster, and accurate for short horizons
+    n_history : int, optional (Default: 1000)
+        the number of calls to generate the solve times are kept for
+    seed : int, optional (Default: None)
+        the seed of the random number generator for the samples
+
+    Attributes
+    ----------
+    plan : numpy.array
+        the mean torque sequence v, shape (horizon, N_JOINTS)
+    cost : float
+        the lowest cost of the samples of the last call to generate
+    solve_time : float
+        the time taken by the last call to generate [seconds]
+    solve_times : collections.deque of floats
+        the time taken by the last n_history calls to generate [seconds]
+    """
+
+    def __init__(self, robot_config, horizon=10, dt=0.01, n_samples=64,
+                 n_iterations=1, method='mppi', sigma=1.0, temperature=1.0,
+                 n_elites=None, u_max=None, w_position=100, w_velocity=.1,
+                 w_control=.001, w_terminal=1000, freeze_dynamics=False,
+                 n_history=1000, seed=None):
+
+        super(MPC, self).__init__(robot_config)
+
+        if method not in ['mppi', 'cem']:
+            raise Exception('method must be one of mppi or cem')
+        N_JOINTS = robot_config.N_JOINTS
+        self.horizon = horizon
+        self.dt = dt
+        self.n_samples = n_samples
+        self.n_iterations = n_iterations
+        self.method = method
+        self.sigma = np.ones(N_JOINTS) * sigma
+        self.temperature = temperature
+        self.n_elites = (max(int(n_samples / 8), 2) if n_elites is None
+                         else n_elites)
+        self.u_max = None if u_max is None else np.ones(N_JOINTS) * u_max
+        self.w_position = w_position
+        self.w_velocity = w_velocity
+        self.w_control = w_control
+        self.w_terminal = w_terminal
+        self.freeze_dynamics = freeze_dynamics
+        self.n_history = n_history
+        self.rng = np.random.RandomState(seed)
+
+        self.plan = np.zeros((horizon, N_JOINTS))
+        self.cost = None
+        self.solve_time = None
+        self.solve_times = collections.deque(maxlen=self.n_history)
+
+    def reset(self):
+        """ Clears the plan and the solve times """
+
+        self.plan.fill(0)
+        self.cost = None
+        self.solve_time = None
+        self.solve_times = collections.deque(maxlen=self.n_history)
+
+    def rollout(self, q, dq, V, target_pos, ref_frame='EE', offset=[0, 0, 0]):
+        """ Rolls the dynamics forward for a batch of torque sequences
+
+        Returns the cost of each sequence, shape (K,)
+
+        Parameters
+        ----------
+        q : float numpy.array
+            current joint angles [radians]
+        dq : float numpy.array
+            current joint velocities [radians/second]
+        V : float numpy.array
+            torques on top of gravity compensation, shape
+            (K, horizon, N_JOINTS) [Nm]
+        target_pos : float numpy.array
+            desired [x, y, z] position [meters]
+        ref_frame : string, optional (Default: 'EE')
+            the point being controlled, default is the end-effector.
+        offset : list, optional (Default: [0, 0, 0])
+            point of interest inside the frame of reference [meters]
+        """
+
+        K = V.shape[0]
+        q = np.tile(np.asarray(q, dtype='float64'), (K, 1))
+        dq = np.tile(np.asarray(dq, dtype='float64'), (K, 1))
+        cost = self.w_control * np.sum(V**2, axis=(1, 2))
+
+        if self.freeze_dynamics:
+            M_inv = np.linalg.inv(self.robot_config.M(q[0]))
+            Gamma = self.robot_config.Gamma(q[0])
+
+        for t in range(V.shape[1]):
+            if self.freeze_dynamics:
+                c = np.einsum('kij,...i,...j->...k', Gamma, dq, dq)
+                ddq = np.dot(V[:, t] - c, M_inv.T)
+            else:
+                M = self.robot_config.M(q)
+                c = self.robot_config.c(q, dq)
+                ddq = np.linalg.solve(M, (V[:, t] - c)[..., None])[..., 0]
+            # semi-implicit Euler integration
+            dq = dq + ddq * self.dt
+            q = q + dq * self.dt
+
+            xyz = self.robot_config.Tx(ref_frame, q, x=offset)
+            error = np.sum((xyz - target_pos)**2, axis=1)
+            cost += (self.w_position * error +
+                     self.w_velocity * np.sum(dq**2, axis=1))
+        cost += self.w_terminal * error
+
+        return cost
+
+    def generate(self, q, dq, target_pos, ref_frame='EE', offset=[0, 0, 0]):
+        """ Generates the control signal to move the EE to a target
+
+        Parameters
+        ----------
+        q : float numpy.array
+            current joint angles [radians]
+        dq : float numpy.array
+            current joint velocities [radians/second]
+        target_pos : float numpy.array
+            desired [x, y, z] position [meters]
+        ref_frame : string, optional (Default: 'EE')
+            the point being controlled, default is the end-effector.
+        offset : list, optional (Default: [0, 0, 0])
+            point of interest inside the frame of reference [meters]
+        """
+
+        start = timeit.default_timer()
+        target_pos = np.asarray(target_pos, dtype='float64')
+        sigma = np.copy(self.sigma)
+        g = self.robot_config.g(q)
+        if self.u_max is not None:
+            # bound v so that the output u = v - g is within u_max
+            v_min = g - self.u_max
+            v_max = g + self.u_max
+
+        for ii in range(self.n_iterations):
+            noise = self.rng.randn(
+                self.n_samples, self.horizon, self.robot_config.N_JOINTS)
+            noise *= sigma
+            # keep the current plan as one of the samples
+            noise[0] = 0
+            V = self.plan + noise
+            if self.u_max is not None:
+                np.clip(V, v_min, v_max, out=V)
+
+            cost = self.rollout(q, dq, V, target_pos, ref_frame, offset)
+
+            if self.method == 'mppi':
+                weights = np.exp(-(cost - np.min(cost)) / self.temperature)
+                weights /= np.sum(weights)
+                self.plan = np.einsum('k,kij->ij', weights, V)
+            else:
+                elites = V[np.argsort(cost)[:self.n_elites]]
+                self.plan = np.mean(elites, axis=0)
+                # only refit the spread within the iterations of a call
+                sigma = np.maximum(np.std(elites, axis=0), 1e-3 * self.sigma)
+        self.cost = np.min(cost)
+
+        # apply the first torque of the plan, with gravity compensation,
+        # the plan averages samples within the bounds so u is within u_max
+        u = self.plan[0] - g
+
+        # warm start the next call with the plan shifted by one step
+        self.plan = np.vstack([self.plan[1:], self.plan[-1:]])
+
+        self.solve_time = timeit.default_timer() - start
+        self.solve_times.append(self.solve_time)
+        return u
@@ -0,0 +1,214 @@
+import numpy as np
+
+
+class MultiRateDynamics():
+    """ Evaluates the dynamics terms of a robot config at a lower rate
+
+    Wraps a robot config so that M, g, and the Christoffel symbols Gamma,
+    which c and S are calculated from, are only evaluated every
+    refresh_every calls, or when the joint angles have moved more than
+    q_threshold since the last evaluation. In between the stored values
+    are returned. c and S are calculated from the stored Gamma and the
+    current joint velocities, so they are exact in dq. All other
+    functions and attributes, such as Tx and J, are passed through to
+    the robot config, and so are evaluated at the full rate.
+
+    Pass to a controller in place of the robot config:
+
+        ctrlr = OSC(MultiRateDynamics(robot_config, refresh_every=10))
+
+    NOTE: the stored arrays are returned, and must not be modified.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    refresh_every : int, optional (Default: 10)
+        each term is evaluated at least once every refresh_every calls,
+        if None there is no limit
+    q_threshold : float, optional (Default: None)
+        the largest distance ||q - q_evaluated|| [radians] a stored term
+        is returned for, if None there is no limit
+    terms : list of strings, optional (Default: ['M', 'g', 'Gamma'])
+        the terms evaluated at the lower rate, the rest are passed through
+    measure_error : boolean, optional (Default: False)
+        also evaluate the exact term on every call where the stored one
+        is returned, and record the relative error in stats. For
+        measuring the effect of the bounds only, as it removes the savings
+
+    Attributes
+    ----------
+    robot_config : class instance
+        the wrapped robot config
+    """
+
+    def __init__(self, robot_config, refresh_every=10, q_threshold=None,
+                 terms=['M', 'g', 'Gamma'], measure_error=False):
+
+        if refresh_every is None and q_threshold is None:
+            raise Exception('At least one of refresh_every and q_threshold '
+                            'must be set to bound the staleness of the terms')
+        for term in terms:
+            if term not in ['M', 'g', 'Gamma']:
+                raise Exception('%s can not be evaluated at a lower rate, '
+                                'choose from M, g, and Gamma' % term)
+
+        self.robot_config = robot_config
+        self.refresh_every = refresh_every
+        self.q_threshold = q_threshold
+        self.terms = list(terms)
+        self.measure_error = measure_error
+        self.reset()
+
+    def __getattr__(self, name):
+        # only called for attributes not found on the wrapper
+        if name == 'robot_config':
+            raise AttributeError(name)
+        return getattr(self.robot_config, name)
+
+    def reset(self):
+        """ Clears the stored terms and the statistics """
+
+        self._stored = {term: None for term in self.terms}
+        self._stats = {term: {
+            'n_calls': 0,
+            'n_refresh': 0,
+            'n_prefetch': 0,
+            'age': 0,
+            'max_age': 0,
+            'max_q_drift': 0.0,
+            # running statistics of the measured errors, so they take
+            # constant memory however long the controller runs
+            'n_errors': 0,
+            'sum_error': 0.0,
+            'max_error': 0.0} for term in self.terms}
+
+    def _evaluate(self, term, q):
+        """ Returns the stored term if within the bounds, else evaluates
+        and stores the term for the joint angles q
+        """
+
+        function = getattr(self.robot_config, term)
+        if term not in self._stored or np.ndim(q) > 1:
+            return function(q)
+
+        stats = self._stats[term]
+        stats['n_calls'] += 1
+        stored = self._stored[term]
+        if stored is not None:
+            stored_q, value = stored
+            stale = (self.refresh_every is not None and
+                     stats['age'] + 1 >= self.refresh_every)
+            if not stale:
+                drift = np.linalg.norm(q - stored_q)
+                stale = (self.q_threshold is not None and
+                         drift > self.q_threshold)
+            if not stale:
+                stats['age'] += 1
+                stats['max_age'] = max(stats['max_age'], stats['age'])
+                stats['max_q_drift'] = max(
+                    stats['max_q_drift'], float(drift))
+                if self.measure_error:
+                    exact = function(q)
+                    error = float(np.linalg.norm(value - exact) /
+                                  max(np.linalg.norm(exact), 1e-12))
+                    stats['n_errors'] += 1
+                    stats['sum_error'] += error
+                    stats['max_error'] = max(stats['max_error'], error)
+                return value
+
+        value = function(q)
+        self._stored[term] = (np.array(q, dtype='float64'), value)
+        stats['n_refresh'] += 1
+        stats['age'] = 0
+        return value
+
+    def refresh(self):
+        """ Evaluates all terms again on their next call """
+
+        self._stored = {term: None for term in self.terms}
+
+    def prefetch(self, q):
+        """ Evaluates and stores all terms for the joint angles q
+
+        Used to evaluate the terms ahead of time for the predicted joint
+        angles of the next time step, ex: while waiting on the interface.
+        The stored terms are returned on the following calls within the
+        bounds, so with refresh_every=None and q_threshold set, the
+        terms are evaluated again only if the prediction was off by more
+        than q_threshold.
+
+        Parameters
+        ----------
+        q : numpy.array
+            the predicted joint angles [radians]
+        """
+
+        for term in self.terms:
+            value = getattr(self.robot_config, term)(q)
+            self._stored[term] = (np.array(q, dtype='float64'), value)
+            self._stats[term]['n_prefetch'] += 1
+            self._stats[term]['age'] = 0
+
+    def M(self, q):
+        """ Returns the inertia matrix in joint space, see BaseConfig.M """
+
+        return self._evaluate('M', q)
+
+    def g(self, q):
+        """ Returns the force of gravity in joint space, see BaseConfig.g
+        """
+
+        return self._evaluate('g', q)
+
+    def Gamma(self, q):
+        """ Returns the Christoffel symbols, see BaseConfig.Gamma """
+
+        return self._evaluate('Gamma', q)
+
+    def c(self, q, dq):
+        """ Calculates the complete centripetal and Coriolis forces
+        from the Christoffel symbols, see BaseConfig.c
+        """
+
+        Gamma = self.Gamma(q)
+        c = np.einsum('...kij,...i,...j->...k', Gamma, dq, dq)
+        return np.asarray(c, dtype='float32')
+
+    def S(self, q, dq):
+        """ Calculates the centripetal and Coriolis forces matrix
+        from the Christoffel symbols, see BaseConfig.S
+        """
+
+        Gamma = self.Gamma(q)
+        S = np.einsum('...kij,...i->...kj', Gamma, dq)
+        return np.asarray(S, dtype='float32')
+
+    def stats(self):
+        """ Returns a dictionary of statistics for each term
+
+        n_calls and n_refresh count the calls and evaluations of the term,
+        refresh_rate is their ratio, n_prefetch counts the evaluations
+        in prefetch, max_age the most calls a stored term
+        was returned for, and max_q_drift the largest distance of q from
+        the joint angles it was evaluated at. If measure_error is True,
+        mean_error and max_error are the relative errors of the stored
+        term from the exact one.
+        """
+
+        stats = {}
+        for term in self.terms:
+            term_stats = self._stats[term]
+            stats[term] = {
+                key: term_stats[key] for key in
+                ['n_calls', 'n_refresh', 'n_prefetch', 'max_age',
+                 'max_q_drift']}
+            stats[term]['refresh_rate'] = (
+                term_stats['n_refresh'] / float(max(term_stats['n_calls'], 1)))
+            if self.measure_error:
+                stats[term]['mean_error'] = (
+                    term_stats['sum_error'] /
+                    max(term_stats['n_errors'], 1))
+                stats[term]['max_error'] = term_stats['max_error']
+        return stats
@@ -1,11 +1,20 @@
 import numpy as np
+import scipy.linalg
 
 from . import controller
+from abr_control.utils import transformations
 
 
 class OSC(controller.Controller):
     """ Implements an operational space controller (OSC)
 
+    The control signal, the rows of the Jacobians, and the factors of the
+    task space inertia matrix are calculated in buffers allocated at
+    construction. Each call still allocates the arrays returned by the
+    robot config, and small arrays for the orientation error, for the
+    Jacobian of the reference frame derived for an offset, and for the
+    pseudo-inverses used near singularities.
+
     Parameters
     ----------
     robot_config : class instance
@@ -16,7 +25,9 @@ class OSC(controller.Controller):
     kv : float, optional (Default: None)
         derivative gain term, a good starting point is sqrt(kp)
     ki : float, optional (Default: 0)
-        integral gain term
+        integral gain term on the position error
+    ko : float, optional (Default: None)
+        proportional gain term on the orientation error, if None kp
     vmax : float, optional (Default: 0.5)
         The max allowed velocity of the end-effector [meters/second].
         If the control signal specifies something above this
@@ -32,6 +43,21 @@ class OSC(controller.Controller):
         centripetal effects of the arm
     use_dJ : boolean, optional (Default: False)
         use the Jacobian derivative wrt time
+    ctrlr_dof : list of booleans, optional (Default: None)
+        mask over the [x, y, z, alpha, beta, gamma] degrees of freedom
+        of the task space to control, with the orientation given by
+        the rotations about the x, y, and z axes. If None only the
+        position [x, y, z] is controlled
+    rcond : float, optional (Default: None)
+        singular values of the inverse task space inertia matrix below
+        rcond * the largest singular value are set to 0 when it is
+        inverted, to handle singularities. The position and orientation
+        blocks are scaled to the same size first. If None .04 when only
+        the position is controlled, and .001 when the orientation is,
+        as the 6 degree of freedom matrix is less well conditioned
+    preallocate : boolean, optional (Default: False)
+        if True the control signal is returned in a buffer that is
+        overwritten on the next call to generate
 
     Attributes
     ----------
@@ -42,14 +68,16 @@ class OSC(controller.Controller):
     integrated_error : float list, optional (Default: None)
         task-space integrated error term
     """
-    def __init__(self, robot_config, kp=1, kv=None, ki=0, vmax=0.5,
-                 null_control=True, use_g=True, use_C=False, use_dJ=False):
+    def __init__(self, robot_config, kp=1, kv=None, ki=0, ko=None, vmax=0.5,
+                 null_control=True, use_g=True, use_C=False, use_dJ=False,
+                 ctrlr_dof=None, rcond=None, preallocate=False):
 
-        super(OSC, self).__init__(robot_config)
+        super(OSC, self).__init__(robot_config, preallocate=preallocate)
 
         self.kp = kp
         self.kv = np.sqrt(self.kp) if kv is None else kv
         self.ki = ki
+        self.ko = self.kp if ko is None else ko
         self.vmax = vmax
         self.lamb = self.kp / self.kv
         self.null_control = null_control
@@ -57,19 +85,83 @@ class OSC(controller.Controller):
         self.use_C = use_C
         self.use_dJ = use_dJ
 
+        if ctrlr_dof is None:
+            ctrlr_dof = [True, True, True, False, False, False]
+        self.ctrlr_dof = np.asarray(ctrlr_dof, dtype=bool)
+        if self.ctrlr_dof.shape != (6,) or not np.any(self.ctrlr_dof):
+            raise Exception('ctrlr_dof must be 6 booleans, with at least '
+                            'one True')
+        self.n_dof = int(np.sum(self.ctrlr_dof))
+        self._position_dof = self.ctrlr_dof[:3]
+        self._orientation_dof = self.ctrlr_dof[3:]
+        self._n_position = int(np.sum(self._position_dof))
+        self._position_indices = np.where(self._position_dof)[0]
+        # the rows of the Jacobian to control, as a slice if possible
+        # to avoid copying them
+        rows = np.where(self.ctrlr_dof)[0]
+        if np.all(np.diff(rows) == 1):
+            rows = slice(rows[0], rows[-1] + 1)
+        self._rows = rows
+        self._scale_blocks = 0 < self._n_position < self.n_dof
+        if rcond is None:
+            rcond = .04 if self._n_position == self.n_dof else .001
+        self.rcond = rcond
+
         self.integrated_error = np.array([0.0, 0.0, 0.0])
 
         # null_indices is a mask for identifying which joints have REST_ANGLES
         self.null_indices = ~np.isnan(self.robot_config.REST_ANGLES)
+        self.rest_indices = ~self.null_indices
         self.dq_des = np.zeros(self.robot_config.N_JOINTS)
         self.IDENTITY_N_JOINTS = np.eye(self.robot_config.N_JOINTS)
+        self.IDENTITY_N_DOF = np.eye(self.n_dof)
         # null space filter gains
         self.nkp = self.kp * .1
         self.nkv = np.sqrt(self.nkp)
+        # whether the Jacobian of the reference frame can be calculated
+        # from the Jacobian at the offset, for each frame and offset
+        self._derive_JEE = {}
+
+        # workspace for the control signal and the task space inertia,
+        # so that generate works in place, see the class documentation
+        # for what is still allocated each call
+        N_JOINTS = self.robot_config.N_JOINTS
+        self._u = np.zeros(N_JOINTS)
+        self._u_task = np.zeros(self.n_dof)
+        self._J = np.zeros((self.n_dof, N_JOINTS))
+        self._JEE = np.zeros((self.n_dof, N_JOINTS))
+        self._dJ = np.zeros((self.n_dof, N_JOINTS))
+        self._target_velocity = np.zeros(self._n_position)
+        self._integrated = np.zeros(self._n_position)
+        # LAPACK works in place on Fortran ordered float64 arrays
+        self._M_factor = np.zeros((N_JOINTS, N_JOINTS), order='F')
+        self._MinvJT = np.zeros((N_JOINTS, self.n_dof), order='F')
+        self._Mx_inv = np.zeros((self.n_dof, self.n_dof), order='F')
+        self._Mx_factor = np.zeros((self.n_dof, self.n_dof), order='F')
+        self._Mx = np.zeros((self.n_dof, self.n_dof), order='F')
+        self._abs_dof = np.zeros((self.n_dof, self.n_dof))
+        self._column_sums = np.zeros(self.n_dof)
+        self._block_scale = np.zeros(self.n_dof)
+        self._xyz_error = np.zeros(3)
+        self._x_tilde = np.zeros(self._n_position)
+        self._sat = np.zeros(self._n_position)
+        self._scale = np.ones(self._n_position, dtype='float32')
+        self._position = np.zeros(self._n_position)
+        self._task = np.zeros(self.n_dof)
+        self._joints = np.zeros(N_JOINTS)
+        self._q_des = np.zeros(N_JOINTS)
+        self._u_null = np.zeros(N_JOINTS)
+        self._projected = np.zeros(self.n_dof)
+        self._transform = np.eye(4)
+        # the factors of the null space projection from the last call
+        # to generate, see project_null_space
+        self._null_space = None
+        self.training_signal = np.zeros(N_JOINTS)
 
     def generate(self, q, dq,
                  target_pos, target_vel=np.zeros(3),
-                 ref_frame='EE', offset=[0, 0, 0], ee_force=None):
+                 ref_frame='EE', offset=[0, 0, 0], ee_force=None,
+                 target_orientation=None):
         """ Generates the control signal to move the EE to a target
 
         Parameters
@@ -79,85 +171,131 @@ class OSC(controller.Controller):
         dq : float numpy.array
             current joint velocities [radians/second]
         target_pos : float numpy.array
-            desired joint angles [radians]
+            desired [x, y, z] position [meters]
         target_vel : float numpy.array, optional (Default: numpy.zeros)
-            desired joint velocities [radians/sec]
+            desired [x, y, z] velocity [meters/second], followed by the
+            desired angular velocity [radians/second] if 6 values
         ref_frame : string, optional (Default: 'EE')
             the point being controlled, default is the end-effector.
         offset : list, optional (Default: [0, 0, 0])
             point of interest inside the frame of reference [meters]
         ee_force: float array, Optional, (Default: None)
             if there are any additional forces to add in task space,
-            add them here
+            add them here, one for each controlled degree of freedom
+        target_orientation : float numpy.array, optional (Default: None)
+            desired orientation as a quaternion [w, x, y, z], required
+            if any orientation degrees of freedom are controlled
         """
 
         # calculate the end-effector position information
         xyz = self.robot_config.Tx(ref_frame, q, x=offset)
 
-        # calculate the Jacobian for the end effector
-        J = self.robot_config.J(ref_frame, q, x=offset)
-        # isolate position component of Jacobian
-        J = J[:3]
+        # calculate the Jacobians for the point of interest and the
+        # reference frame, isolating the controlled degrees of freedom
+        J, JEE = self._jacobians(ref_frame, q, offset, xyz)
+        if JEE is J:
+            J = JEE = self._select_rows(J, self._J)
+        else:
+            J = self._select_rows(J, self._J)
+            JEE = self._select_rows(JEE, self._JEE)
 
         # calculate the inertia matrix in joint space
         M = self.robot_config.M(q)
 
-        # calculate the inertia matrix in task space
-        M_inv = np.linalg.inv(M)
-        # calculate the Jacobian for end-effector with no offset
-        JEE = self.robot_config.J(ref_frame, q)[:3]
-        Mx_inv = np.dot(JEE, np.dot(M_inv, JEE.T))
-        # using the rcond to set singular values < thresh to 0
-        # is slightly faster than doing it manually with svd
-        # singular values < (rcond * max(singular_values)) set to 0
-        Mx = np.linalg.pinv(Mx_inv, rcond=.04)
-
-        u_task = np.zeros(3)  # task space control signal
+        # calculate the inertia matrix in task space, once per tick for
+        # the controllers sharing a ControlContext with the same task
+        task_inertia = getattr(self.robot_config, 'task_inertia', None)
+        if task_inertia is None:
+            Mx, MinvJT = self._task_inertia(M, JEE)
+        else:
+            Mx, MinvJT = task_inertia(
+                (ref_frame, tuple(self.ctrlr_dof), self.rcond), q,
+                lambda: self._task_inertia(M, JEE))
+        self._null_space = (J, Mx, MinvJT)
+
+        u_task = self._u_task  # task space control signal
+        u_task.fill(0)
+        n_position = self._n_position
+        target_velocity = target_vel[:3]
+        if n_position < 3:
+            target_velocity = self._target_velocity
+            for ii, index in enumerate(self._position_indices):
+                target_velocity[ii] = target_vel[index]
 
         # calculate the position error
-        x_tilde = np.array(xyz - target_pos)
+        xyz_error = np.subtract(xyz, target_pos, out=self._xyz_error)
+        x_tilde = np.compress(self._position_dof, xyz_error,
+                              out=self._x_tilde)
+        u_position = u_task[:n_position]
 
-        if self.vmax is not None:
+        if self.vmax is not None and n_position > 0:
             # implement velocity limiting
-            sat = self.vmax / (self.lamb * np.abs(x_tilde))
-            if np.any(sat < 1):
+            sat = np.abs(x_tilde, out=self._sat)
+            sat *= self.lamb
+            np.divide(self.vmax, sat, out=sat)
+            scale = self._scale
+            scale.fill(1)
+            if sat.min() < 1:
                 index = np.argmin(sat)
                 unclipped = self.kp * x_tilde[index]
                 clipped = self.kv * self.vmax * np.sign(x_tilde[index])
-                scale = np.ones(3, dtype='float32') * clipped / unclipped
+                scale *= clipped / unclipped
                 scale[index] = 1
-            else:
-                scale = np.ones(3, dtype='float32')
 
-            dx = np.dot(J, dq)
-            u_task[:3] = -self.kv * (dx - target_vel -
-                                     np.clip(sat / scale, 0, 1) *
-                                     -self.lamb * scale * x_tilde)
+            dx = np.matmul(J[:n_position], dq, out=u_position)
+            u_position -= target_velocity
+            position = np.divide(sat, scale, out=self._position)
+            np.clip(position, 0, 1, out=position)
+            position *= -self.lamb
+            position *= scale
+            position *= x_tilde
+            dx -= position
+            u_position *= -self.kv
         else:
             # generate (x,y,z) force without velocity limiting)
-            u_task[:3] = -self.kp * x_tilde
+            np.multiply(x_tilde, -self.kp, out=u_position)
+
+        if n_position < self.n_dof:
+            if target_orientation is None:
+                raise Exception('target_orientation is required to '
+                                'control the orientation')
+            # generate the torque about the rotation to the target
+            u_orientation = u_task[n_position:]
+            u_orientation[:] = self.ko * self._orientation_error(
+                ref_frame, q, target_orientation)[self._orientation_dof]
+            if self.vmax is not None:
+                # damp the angular velocity
+                dw = np.matmul(J[n_position:], dq)
+                if len(target_vel) > 3:
+                    dw -= np.compress(self._orientation_dof, target_vel[3:])
+                u_orientation -= self.kv * dw
 
         if self.use_dJ:
             # add in estimate of current acceleration
             dJ = self.robot_config.dJ(ref_frame, q=q, dq=dq)
             # apply mask
-            dJ = dJ[:3]
-            u_task -= np.dot(dJ, dq)
+            dJ = self._select_rows(dJ, self._dJ)
+            u_task -= np.matmul(dJ, dq, out=self._task)
 
         if self.ki != 0:
             # add in the integrated error term
-            self.integrated_error += x_tilde
-            u_task -= self.ki * self.integrated_error
+            self.integrated_error += xyz_error
+            integrated = np.compress(self._position_dof,
+                                     self.integrated_error,
+                                     out=self._integrated)
+            integrated *= self.ki
+            u_position -= integrated
 
         # add in any specified additional task space force
         if ee_force is not None:
             u_task += ee_force
 
         # incorporate task space inertia matrix
-        u = np.dot(J.T, np.dot(Mx, u_task))
+        u = np.matmul(J.T, np.matmul(Mx, u_task, out=self._task),
+                      out=self._u)
 
         if self.vmax is None:
-            u -= np.dot(M, dq)
+            u -= np.matmul(M, dq, out=self._joints)
 
         if self.use_C:
             # add in estimation of full centrifugal and Coriolis effects
@@ -166,7 +304,10 @@ class OSC(controller.Controller):
         # store the current control signal u for training in case
         # dynamics adaptation signal is being used
         # NOTE: training signal should not include gravity compensation
-        self.training_signal = np.copy(u)
+        if self.preallocate:
+            np.copyto(self.training_signal, u)
+        else:
+            self.training_signal = np.copy(u)
 
         # cancel out effects of gravity
         if self.use_g:
@@ -174,16 +315,218 @@ class OSC(controller.Controller):
 
         if self.null_control:
             # calculated desired joint angle acceleration using rest angles
-            q_des = ((self.robot_config.REST_ANGLES - q + np.pi) %
-                     (np.pi * 2) - np.pi)
-            q_des[~self.null_indices] = 0.0
-            self.dq_des[self.null_indices] = dq[self.null_indices]
+            q_des = np.subtract(self.robot_config.REST_ANGLES, q,
+                                out=self._q_des)
+            q_des += np.pi
+            np.mod(q_des, np.pi * 2, out=q_des)
+            q_des -= np.pi
+            q_des[self.rest_indices] = 0.0
+            np.copyto(self.dq_des, dq, where=self.null_indices)
+
+            q_des *= self.nkp
+            q_des -= np.multiply(self.dq_des, self.nkv, out=self._joints)
+            u_null = np.matmul(M, q_des, out=self._u_null)
+
+            u += self.project_null_space(u_null, out=u_null)
+
+        return self._output(u)
+
+    def project_null_space(self, u, out=None):
+        """ Projects a joint space signal into the null space of the task
+
+        Filters out the component of u that would affect the task of the
+        last call to generate, so secondary signals such as joint limit
+        avoidance or a resting posture can be added to the control signal
+        without disturbing the end-effector. The projection
+        u - J^T (Jbar^T u), with Jbar = M^-1 JEE^T Mx, is calculated as
+        matrix-vector products from the factors already calculated for
+        the task, without forming the N_JOINTS x N_JOINTS filter.
+
+        Parameters
+        ----------
+        u : float numpy.array
+            the joint space signal to project [Nm]
+        out : float numpy.array, optional (Default: None)
+            the array to write the projected signal to, can be u
+        """
+
+        if self._null_space is None:
+            raise Exception('generate must be called before projecting '
+                            'into the null space of the task')
+        J, Mx, MinvJT = self._null_space
+
+        # Jbar^T u = Mx (M^-1 JEE^T)^T u
+        projected = np.matmul(MinvJT.T, u, out=self._projected)
+        projected = np.matmul(Mx, projected, out=self._task)
+        return np.subtract(u, np.matmul(J.T, projected, out=self._joints),
+                           out=out)
+
+    def _select_rows(self, matrix, out):
+        """ Returns the rows of the controlled degrees of freedom
+
+        A view is returned when the rows are contiguous, otherwise they
+        are copied into out one at a time, as indexing with an array of
+        rows would allocate a new array.
+        """
+
+        if isinstance(self._rows, slice):
+            return matrix[self._rows]
+        for ii, row in enumerate(self._rows):
+            out[ii] = matrix[row]
+        return out
 
-            u_null = np.dot(M, (self.nkp * q_des - self.nkv * self.dq_des))
+    def _orientation_error(self, ref_frame, q, target_orientation):
+        """ Returns the rotation from the current to the target orientation
 
-            Jbar = np.dot(M_inv, np.dot(JEE.T, Mx))
-            null_filter = (self.IDENTITY_N_JOINTS - np.dot(J.T, Jbar.T))
+        The rotation is calculated as the quaternion q_target q_current^*
+        and returned as the rotation vector, its axis scaled by its angle
+        [radians], in world coordinates like the orientation rows of the
+        Jacobian. The shortest of the two rotations to the target is used.
 
-            u += np.dot(null_filter, u_null)
+        Parameters
+        ----------
+        ref_frame : string
+            the frame of reference of the point being controlled
+        q : float numpy.array
+            current joint angles [radians]
+        target_orientation : float numpy.array
+            desired orientation as a quaternion [w, x, y, z]
+        """
+
+        # the rotation is placed in a transform to use the faster method
+        # of calculating its quaternion, for precise rotation matrices
+        self._transform[:3, :3] = self.robot_config.R(ref_frame, q)
+        quaternion = transformations.quaternion_from_matrix(
+            self._transform, isprecise=True)
+        rotation = transformations.quaternion_multiply(
+            target_orientation,
+            transformations.quaternion_conjugate(quaternion))
+        if rotation[0] < 0:
+            rotation *= -1
+
+        sin_half_angle = np.linalg.norm(rotation[1:])
+        if sin_half_angle < 1e-12:
+            return 2 * rotation[1:]
+        angle = 2 * np.arctan2(sin_half_angle, rotation[0])
+        return rotation[1:] * (angle / sin_half_angle)
+
+    def _jacobians(self, ref_frame, q, offset, xyz):
+        """ Returns the Jacobians at the offset and the frame
+
+        The Jacobian of the reference frame is used to calculate the task
+        space inertia. It is the same function as the Jacobian at the
+        offset when the offset is zero. For the end-effector it can be
+        calculated from the Jacobian at the offset, which moves relative
+        to the frame by the rotation of the offset,
+        J_offset = J_frame - [R x]_cross J_orientation. This only holds
+        while the rotations of the model are orthonormal, so the first
+        time an offset is used the result is checked against evaluating
+        the Jacobian of the frame, which is used from then on if they
+        differ. The orientation rows of the Jacobians of the other joints
+        and links do not cover the same joints as their position rows, so
+        there the Jacobian is always evaluated again.
+
+        Parameters
+        ----------
+        ref_frame : string
+            the frame of reference of the point being controlled
+        q : float numpy.array
+            current joint angles [radians]
+        offset : list
+            point of interest inside the frame of reference [meters]
+        xyz : float numpy.array
+            the position of the point of interest [meters]
+        """
+
+        J = self.robot_config.J(ref_frame, q, x=offset)
+        if not any(offset):
+            return J, J
+
+        key = (ref_frame, tuple(offset))
+        derive = self._derive_JEE.get(key, ref_frame == 'EE')
+        if derive:
+            # the cross product matrix of the offset rotated into
+            # world coordinates
+            x, y, z = xyz - self.robot_config.Tx(ref_frame, q)
+            Rx_cross = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+            JEE = np.vstack([J[:3] + np.dot(Rx_cross, J[3:]), J[3:]])
+        if key not in self._derive_JEE or not derive:
+            JEE_evaluated = self.robot_config.J(ref_frame, q)
+            if key not in self._derive_JEE:
+                self._derive_JEE[key] = derive and np.allclose(
+                    JEE, JEE_evaluated, rtol=0, atol=1e-6)
+            JEE = JEE_evaluated
+        return J, JEE
+
+    def _task_inertia(self, M, JEE):
+        """ Returns the task space inertia matrix and M^-1 JEE^T
+
+        M is factored with a Cholesky decomposition and solved against
+        JEE^T instead of being inverted. The inverse task space inertia
+        matrix is inverted from its Cholesky factors while it is well
+        conditioned, which is checked with its 1-norm condition number,
+        an upper bound on the 2-norm condition number of a symmetric
+        matrix. Near singularities the pseudo-inverse sets singular
+        values < (rcond * the largest singular value) to 0.
+
+        Parameters
+        ----------
+        M : float numpy.array
+            the joint space inertia matrix
+        JEE : float numpy.array
+            the Jacobian of the reference frame, for the controlled
+            degrees of freedom
+        """
+
+        # factor a copy of M, solving into a copy of JEE^T
+        np.copyto(self._M_factor, M)
+        L, info = scipy.linalg.lapack.dpotrf(
+            self._M_factor, lower=True, overwrite_a=True)
+        if info == 0:
+            np.copyto(self._MinvJT, JEE.T)
+            MinvJT = scipy.linalg.lapack.dpotrs(
+                L, self._MinvJT, lower=True, overwrite_b=True)[0]
+        else:
+            # M is not positive definite, from a poor model of the arm
+            MinvJT = np.dot(np.linalg.pinv(M), JEE.T)
+        Mx_inv = np.matmul(JEE, MinvJT, out=self._Mx_inv)
+
+        if self._scale_blocks:
+            # scale the position and orientation blocks to the same size,
+            # so that the threshold on the singular values is independent
+            # of their units
+            n_position = self._n_position
+            diagonal = Mx_inv.diagonal()
+            scale = self._block_scale
+            scale[:n_position] = 1 / np.sqrt(np.mean(diagonal[:n_position]))
+            scale[n_position:] = 1 / np.sqrt(np.mean(diagonal[n_position:]))
+            Mx_inv *= scale[:, None]
+            Mx_inv *= scale[None, :]
+
+        np.copyto(self._Mx_factor, Mx_inv)
+        L, info = scipy.linalg.lapack.dpotrf(
+            self._Mx_factor, lower=True, overwrite_a=True)
+        if info == 0:
+            np.copyto(self._Mx, self.IDENTITY_N_DOF)
+            Mx, info = scipy.linalg.lapack.dpotrs(
+                L, self._Mx, lower=True, overwrite_b=True)
+        if info != 0 or (
+                self._norm_1(Mx_inv) * self._norm_1(Mx)) > 1 / self.rcond:
+            # using the rcond to set singular values < thresh to 0
+            # is slightly faster than doing it manually with svd
+            # singular values < (rcond * max(singular_values)) set to 0
+            Mx = np.linalg.pinv(Mx_inv, rcond=self.rcond)
+
+        if self._scale_blocks:
+            Mx *= scale[:, None]
+            Mx *= scale[None, :]
+
+        return Mx, MinvJT
+
+    def _norm_1(self, matrix):
+        """ Returns the 1-norm of an n_dof x n_dof matrix, the largest
+        absolute column sum
+        """
 
-        return u
+        absolute = np.abs(matrix, out=self._abs_dof)
+        return np.sum(absolute, axis=0, out=self._column_sums).max()
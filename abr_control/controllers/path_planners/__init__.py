@@ -1,2 +1,3 @@
 from .linear import Linear
 from .second_order import SecondOrder
+from .ilqr import ILQR
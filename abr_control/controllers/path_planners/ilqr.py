@@ -0,0 +1,335 @@
+from collections import OrderedDict
+import timeit
+
+import numpy as np
+
+from .path_planner import PathPlanner
+
+
+class ILQR(PathPlanner):
+    """ Optimizes a joint torque trajectory with iterative LQR
+
+    Finds a locally optimal torque trajectory that moves the arm from a
+    start to a target joint state, along with a time-varying feedback
+    policy u_t + K_t (x - x_t) to follow it. The dynamics are linearized
+    around the whole trajectory in one batch each iteration, with
+    robot_config.linearize and the analytic dynamics derivatives.
+
+    The cost over the trajectory is
+
+        sum_t dt * ((x_t - x_goal)^T Q (x_t - x_goal) +
+                    (u_t - u_goal)^T R (u_t - u_goal))
+        + (x_T - x_goal)^T Qf (x_T - x_goal)
+
+    with the state x = [q, dq], and u_goal = -g(q_goal) the torque that
+    holds the arm at the target.
+
+    Solutions are cached under the start and target states rounded to
+    cache_resolution, so planning a repeated motion returns the cached
+    solution. The last solution warm starts the next one, if no
+    initial torques are given and there is no cached solution.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    n_timesteps : int, optional (Default: 50)
+        the number of time steps of the trajectory
+    dt : float, optional (Default: 0.01)
+        the time step of the trajectory [seconds]
+    Q : numpy.array, optional (Default: None)
+        the state cost matrix, shape (2*N_JOINTS, 2*N_JOINTS), if None
+        1 on the joint angles and .1 on the joint velocities
+    R : numpy.array, optional (Default: None)
+        the torque cost matrix, shape (N_JOINTS, N_JOINTS), if None .001
+        on each joint
+    Qf : numpy.array, optional (Default: None)
+        the final state cost matrix, if None 1000 on the joint angles
+        and 100 on the joint velocities
+    max_iterations : int, optional (Default: 50)
+        the most iterations to run
+    tolerance : float, optional (Default: 1e-4)
+        stop once the relative reduction of the cost is below tolerance
+    cache_resolution : float, optional (Default: .01)
+        the rounding of the start and target states for the cache keys,
+        if None solutions are not cached
+    max_cache : int, optional (Default: 100)
+        the most solutions to cache, the least recently used is dropped
+    verbose : boolean, optional (Default: False)
+        print the cost after each iteration
+
+    Attributes
+    ----------
+    trajectory : numpy.array
+        the planned states [q, dq], shape (n_timesteps + 1, 2*N_JOINTS)
+    u : numpy.array
+        the planned torques, shape (n_timesteps, N_JOINTS)
+    K : numpy.array
+        the feedback gains, shape (n_timesteps, N_JOINTS, 2*N_JOINTS)
+    cost : float
+        the cost of the planned trajectory
+    n_iterations : int
+        the number of iterations run by the last call to generate_path
+    solve_time : float
+        the time taken by the last call to generate_path [seconds]
+    cache_hit : boolean
+        True if the last call to generate_path used a cached solution
+    """
+
+    def __init__(self, robot_config, n_timesteps=50, dt=0.01, Q=None, R=None,
+                 Qf=None, max_iterations=50, tolerance=1e-4,
+                 cache_resolution=.01, max_cache=100, verbose=False):
+        super(ILQR, self).__init__(robot_config)
+
+        N = robot_config.N_JOINTS
+        self.n_timesteps = n_timesteps
+        self.dt = dt
+        self.Q = (np.diag([1.0] * N + [.1] * N) if Q is None
+                  else np.asarray(Q, dtype='float64'))
+        self.R = np.eye(N) * .001 if R is None else np.asarray(R)
+        self.Qf = (np.diag([1000.0] * N + [100.0] * N) if Qf is None
+                   else np.asarray(Qf, dtype='float64'))
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.cache_resolution = cache_resolution
+        self.max_cache = max_cache
+        self.verbose = verbose
+
+        self.cache = OrderedDict()
+        self.trajectory = None
+        self.u = None
+        self.K = None
+        self.cost = None
+        self.n_iterations = 0
+        self.solve_time = None
+        self.cache_hit = False
+        self.n = 0
+
+    def _step(self, x, u):
+        """ Moves the state forward one time step with forward Euler,
+        matching the 'euler' discretization of robot_config.linearize
+        """
+
+        N = self.robot_config.N_JOINTS
+        q = x[:N]
+        dq = x[N:]
+        M = np.asarray(self.robot_config.M(q), dtype='float64')
+        ddq = np.linalg.solve(
+            M, u - self.robot_config.c(q, dq) + self.robot_config.g(q))
+        return np.hstack([q + dq * self.dt, dq + ddq * self.dt])
+
+    def _rollout(self, x0, u, x_goal, u_goal, x_ref=None, K=None):
+        """ Simulates the torques from x0 and returns the states,
+        torques, and cost. With x_ref and K, the feedback policy
+        u + K (x - x_ref) is applied.
+        """
+
+        T = u.shape[0]
+        x = np.zeros((T + 1, x0.shape[0]))
+        x[0] = x0
+        u = np.array(u)
+        for t in range(T):
+            if K is not None:
+                u[t] += np.dot(K[t], x[t] - x_ref[t])
+            x[t + 1] = self._step(x[t], u[t])
+        return x, u, self._cost(x, u, x_goal, u_goal)
+
+    def _cost(self, x, u, x_goal, u_goal):
+        """ Returns the cost of a trajectory """
+
+        e = x - x_goal
+        e_u = u - u_goal
+        return (self.dt * (np.einsum('ti,ij,tj->', e[:-1], self.Q, e[:-1]) +
+                           np.einsum('ti,ij,tj->', e_u, self.R, e_u)) +
+                np.dot(e[-1], np.dot(self.Qf, e[-1])))
+
+    def _backward(self, x, u, x_goal, u_goal, Ad, Bd, mu):
+        """ Computes the feedforward and feedback gains
+
+        Returns the gains k and K, and the expected cost reduction terms,
+        or None if Q_uu is not positive definite with regularization mu
+        """
+
+        T, N = u.shape
+        k = np.zeros((T, N))
+        K = np.zeros((T, N, x.shape[1]))
+        V_x = 2 * np.dot(self.Qf, x[-1] - x_goal)
+        V_xx = 2 * self.Qf
+        expected = np.zeros(2)
+        l_xx = 2 * self.dt * self.Q
+        l_uu = 2 * self.dt * self.R
+
+        for t in range(T - 1, -1, -1):
+            A = Ad[t]
+            B = Bd[t]
+            l_x = np.dot(l_xx, x[t] - x_goal)
+            l_u = np.dot(l_uu, u[t] - u_goal)
+
+            Q_x = l_x + np.dot(A.T, V_x)
+            Q_u = l_u + np.dot(B.T, V_x)
+            V_xx_A = np.dot(V_xx, A)
+            Q_xx = l_xx + np.dot(A.T, V_xx_A)
+            Q_ux = np.dot(B.T, V_xx_A)
+            # regularize the control Hessian, so that the steps are
+            # smaller and the matrix stays positive definite
+            Q_uu = l_uu + np.dot(B.T, np.dot(V_xx, B)) + mu * np.eye(N)
+
+            try:
+                L = np.linalg.cholesky(Q_uu)
+            except np.linalg.LinAlgError:
+                return None
+            gains = -np.linalg.solve(
+                L.T, np.linalg.solve(L, np.column_stack([Q_u, Q_ux])))
+            k[t] = gains[:, 0]
+            K[t] = gains[:, 1:]
+
+            expected += [np.dot(k[t], Q_u),
+                         .5 * np.dot(k[t], np.dot(Q_uu, k[t]))]
+            V_x = (Q_x + np.dot(K[t].T, np.dot(Q_uu, k[t])) +
+                   np.dot(K[t].T, Q_u) + np.dot(Q_ux.T, k[t]))
+            V_xx = (Q_xx + np.dot(K[t].T, np.dot(Q_uu, K[t])) +
+                    np.dot(K[t].T, Q_ux) + np.dot(Q_ux.T, K[t]))
+            V_xx = .5 * (V_xx + V_xx.T)
+
+        return k, K, expected
+
+    def _cache_key(self, x0, x_goal):
+        """ Returns the start and target states rounded for the cache """
+
+        return (tuple(np.round(x0 / self.cache_resolution).astype(int)),
+                tuple(np.round(x_goal / self.cache_resolution).astype(int)))
+
+    def generate_path(self, state, target, u_init=None):
+        """ Optimizes the torque trajectory from state to target
+
+        Returns the planned states, shape (n_timesteps + 1, 2*N_JOINTS)
+
+        Parameters
+        ----------
+        state : numpy.array
+            the current joint angles and velocities, [q, dq]
+        target : numpy.array
+            the target joint angles, or angles and velocities [q, dq]
+        u_init : numpy.array, optional (Default: None)
+            the torques to start optimizing from, shape
+            (n_timesteps, N_JOINTS). If None, the cached solution for the
+            start and target, else the last solution, else the torques
+            that hold the arm at the start
+        """
+
+        start = timeit.default_timer()
+        N = self.robot_config.N_JOINTS
+        x0 = np.asarray(state, dtype='float64')
+        x_goal = np.zeros(2 * N)
+        x_goal[:len(target)] = target
+        u_goal = -np.asarray(self.robot_config.g(x_goal[:N]),
+                             dtype='float64')
+        T = self.n_timesteps
+        self.n = 0
+
+        key = None
+        if self.cache_resolution is not None:
+            key = self._cache_key(x0, x_goal)
+        self.cache_hit = u_init is None and key in self.cache
+        if self.cache_hit:
+            self.cache.move_to_end(key)
+            self.trajectory, self.u, self.K, self.cost = self.cache[key]
+            self.n_iterations = 0
+            self.solve_time = timeit.default_timer() - start
+            return self.trajectory
+
+        if u_init is None:
+            if self.u is not None and self.u.shape == (T, N):
+                # warm start from the last solution
+                u_init = self.u
+            else:
+                u_init = np.tile(-np.asarray(
+                    self.robot_config.g(x0[:N]), dtype='float64'), (T, 1))
+
+        x, u, cost = self._rollout(x0, u_init, x_goal, u_goal)
+        mu = 1e-6
+        self.n_iterations = 0
+        K = np.zeros((T, N, 2 * N))
+        for ii in range(self.max_iterations):
+            self.n_iterations = ii + 1
+            # linearize the dynamics around the whole trajectory at once
+            _, _, Ad, Bd = self.robot_config.linearize(
+                x[:-1, :N], x[:-1, N:], u, dt=self.dt,
+                discretization='euler')
+
+            backward = self._backward(x, u, x_goal, u_goal, Ad, Bd, mu)
+            while backward is None:
+                mu = max(mu * 10, 1e-6)
+                backward = self._backward(x, u, x_goal, u_goal, Ad, Bd, mu)
+            k, K_new, expected = backward
+
+            # line search on the step size
+            improved = False
+            for alpha in [1.0, .5, .25, .1, .05, .01]:
+                x_new, u_new, cost_new = self._rollout(
+                    x0, u + alpha * k, x_goal, u_goal, x_ref=x, K=K_new)
+                reduction = -(alpha * expected[0] + alpha**2 * expected[1])
+                if cost_new < cost and (
+                        reduction <= 0 or (cost - cost_new) > .1 * reduction):
+                    improved = True
+                    break
+
+            if improved:
+                relative = (cost - cost_new) / cost
+                x, u, K, cost = x_new, u_new, K_new, cost_new
+                mu = max(mu / 10, 1e-6)
+                if self.verbose:
+                    print('iteration %i: cost %.6f' % (ii, cost))
+                if relative < self.tolerance:
+                    break
+            else:
+                mu *= 10
+                if mu > 1e6:
+                    break
+
+        self.trajectory = x
+        self.u = u
+        self.K = K
+        self.cost = cost
+        if key is not None:
+            self.cache[key] = (x, u, K, cost)
+            if len(self.cache) > self.max_cache:
+                self.cache.popitem(last=False)
+        self.solve_time = timeit.default_timer() - start
+
+        return self.trajectory
+
+    def next_target(self):
+        """ Return the next target state along the planned trajectory """
+
+        self.target = self.trajectory[min(self.n, self.n_timesteps)]
+        self.n += 1
+
+        return self.target
+
+    def control(self, q, dq, step=None):
+        """ Returns the torques of the feedback policy for a time step
+
+        u_t + K_t ([q, dq] - x_t), after the end of the trajectory the
+        last step is held
+
+        Parameters
+        ----------
+        q : numpy.array
+            current joint angles [radians]
+        dq : numpy.array
+            current joint velocities [radians/second]
+        step : int, optional (Default: None)
+            the time step along the trajectory, if None the step after
+            the last call
+        """
+
+        if self.u is None:
+            raise Exception('generate_path must be called before control')
+        if step is None:
+            step = self.n
+            self.n += 1
+        step = min(step, self.n_timesteps - 1)
+        x = np.hstack([q, dq])
+        return self.u[step] + np.dot(self.K[step], x - self.trajectory[step])
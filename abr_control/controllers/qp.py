@@ -0,0 +1,377 @@
+import collections
+import timeit
+
+import numpy as np
+import scipy.linalg
+
+from . import controller
+
+
+class QP(controller.Controller):
+    """ Implements a quadratic program (QP) based task space controller
+
+    Each call to generate solves for the joint accelerations ddq that
+    best move the end-effector toward the target, subject to torque
+    limits, joint limits, and obstacle clearances, instead of adding
+    potential fields such as AvoidJointLimits and AvoidObstacles to the
+    OSC signal. The QP is
+
+        min 1/2 ||J ddq + dJ dq - ddx_des||^2 +
+            w_posture / 2 ||ddq - ddq_posture||^2
+
+        s.t. -u_max <= M ddq + c - g <= u_max
+             q_min <= q + dq T + 1/2 ddq T^2 <= q_max
+             d + n^T J_p (dq T + 1/2 ddq T^2) >= clearance
+
+    with ddx_des = kp (target - x) + kv (target_vel - dx), T the
+    horizon, and for each link within threshold of an obstacle, d the
+    distance of its closest point to the surface of the obstacle, n the
+    direction away from the obstacle and J_p the Jacobian of the point.
+    The torques u = M ddq + c - g are returned.
+
+    The QP is solved with the alternating direction method of
+    multipliers (ADMM), as in OSQP, with the rows of the constraints
+    normalized. Each call is warm started with the previous solution,
+    its dual variables, which are nonzero only for the active
+    constraints, and the step size rho. If the constraints can not all
+    be met, ex: the torques can not stop the arm before a joint limit,
+    the solver stops at max_iterations and the torques are clipped to
+    u_max.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    kp : float, optional (Default: 1)
+        proportional gain term
+    kv : float, optional (Default: None)
+        derivative gain term, a good starting point is sqrt(kp)
+    w_posture : float, optional (Default: .001)
+        weight of the joint acceleration toward the resting joint angles,
+        relative to the task, keeps the QP strictly convex
+    null_control : boolean, optional (Default: True)
+        drive the joints toward robot_config.REST_ANGLES, if False the
+        posture term only damps the joint velocities
+    use_dJ : boolean, optional (Default: False)
+        use the Jacobian derivative wrt time
+    u_max : float or numpy.array, optional (Default: None)
+        the torque limits [Nm], for all joints or one for each joint,
+        if None the torques are not constrained
+    min_joint_angles : numpy.array, optional (Default: None)
+        the lower bound on the joint angles [radians], use numpy.nan
+        for joints without a limit, if None no lower limits
+    max_joint_angles : numpy.array, optional (Default: None)
+        the upper bound on the joint angles [radians], use numpy.nan
+        for joints without a limit, if None no upper limits
+    obstacles : list of list of floats, optional (Default: [])
+        the obstacles to avoid, [x, y, z, radius] for each [meters]
+    threshold : float, optional (Default: .2)
+        the distance of a link to an obstacle within which its clearance
+        is constrained [meters]
+    clearance : float, optional (Default: .02)
+        the smallest distance of the links to the obstacles [meters]
+    horizon : float, optional (Default: .05)
+        the time T the joint limits and clearances are predicted over
+        [seconds], longer horizons start braking earlier
+    rho : float, optional (Default: .1)
+        the initial ADMM step size, adapted to the residuals
+    alpha : float, optional (Default: 1.6)
+        the ADMM relaxation factor, between 0 and 2
+    tolerance : float, optional (Default: 1e-4)
+        the absolute and relative tolerance on the residuals
+    max_iterations : int, optional (Default: 200)
+        the most ADMM iterations per call to generate
+    n_history : int, optional (Default: 1000)
+        the number of calls to generate the iterations and solve times
+        are kept for
+    preallocate : boolean, optional (Default: False)
+        if True the control signal is returned in a buffer that is
+        overwritten on the next call to generate
+
+    Attributes
+    ----------
+    ddq : numpy.array
+        the joint accelerations solved for on the last call [rad/s**2]
+    active : numpy.array of booleans
+        which constraints were active on the last call, in the order of
+        constraint_names
+    constraint_names : list of strings
+        the name of each constraint, 'torque%i', 'joint_limit%i', and
+        'obstacle%i_link%i'
+    n_iterations : int
+        the ADMM iterations on the last call
+    solve_time : float
+        the time taken by the last call to generate [seconds]
+    iterations : collections.deque of ints
+        the ADMM iterations of the last n_history calls to generate
+    solve_times : collections.deque of floats
+        the time taken by the last n_history calls to generate [seconds]
+    """
+
+    def __init__(self, robot_config, kp=1, kv=None, w_posture=.001,
+                 null_control=True, use_dJ=False, u_max=None,
+                 min_joint_angles=None, max_joint_angles=None, obstacles=[],
+                 threshold=.2, clearance=.02, horizon=.05, rho=.1,
+                 alpha=1.6, tolerance=1e-4, max_iterations=200,
+                 n_history=1000, preallocate=False):
+
+        super(QP, self).__init__(robot_config, preallocate=preallocate)
+
+        N_JOINTS = robot_config.N_JOINTS
+        self.kp = kp
+        self.kv = np.sqrt(self.kp) if kv is None else kv
+        self.w_posture = w_posture
+        self.null_control = null_control
+        self.use_dJ = use_dJ
+        self.u_max = None if u_max is None else np.ones(N_JOINTS) * u_max
+        self.min_joint_angles = np.asarray(
+            np.nan * np.ones(N_JOINTS) if min_joint_angles is None
+            else min_joint_angles, dtype='float64')
+        self.max_joint_angles = np.asarray(
+            np.nan * np.ones(N_JOINTS) if max_joint_angles is None
+            else max_joint_angles, dtype='float64')
+        if (self.min_joint_angles.shape != (N_JOINTS,) or
+                self.max_joint_angles.shape != (N_JOINTS,)):
+            raise Exception('joint angles vector incorrect size')
+        self.threshold = threshold
+        self.clearance = clearance
+        self.horizon = horizon
+        self.rho_init = rho
+        self.alpha = alpha
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.n_history = n_history
+        # the ADMM regularization of the x update
+        self.sigma = 1e-6
+
+        # null_indices is a mask for identifying which joints have REST_ANGLES
+        self.null_indices = ~np.isnan(self.robot_config.REST_ANGLES)
+        self.nkp = self.kp * .1
+        self.nkv = np.sqrt(self.nkp)
+
+        self.set_obstacles(obstacles)
+
+    def set_obstacles(self, obstacles):
+        """ Specify the locations of the obstacles to avoid
+
+        Clears the warm start, as the number of constraints changes.
+
+        Parameters
+        ----------
+        obstacles : list of list of floats
+            the obstacles to avoid, [x, y, z, radius] for each [meters]
+        """
+
+        self.obstacles = np.array(obstacles, dtype='float64').reshape(-1, 4)
+        N_JOINTS = self.robot_config.N_JOINTS
+        self.constraint_names = (
+            ['torque%i' % ii for ii in range(N_JOINTS)] +
+            ['joint_limit%i' % ii for ii in range(N_JOINTS)] +
+            ['obstacle%i_link%i' % (jj, ii + 1)
+             for jj in range(len(self.obstacles))
+             for ii in range(N_JOINTS)])
+        self.reset()
+
+    def reset(self):
+        """ Clears the warm start and the solve statistics """
+
+        n_rows = len(self.constraint_names)
+        self.ddq = np.zeros(self.robot_config.N_JOINTS)
+        self.active = np.zeros(n_rows, dtype=bool)
+        # the dual variables of the last solution, unscaled
+        self._y = np.zeros(n_rows)
+        self.rho = self.rho_init
+        self.n_iterations = 0
+        self.solve_time = None
+        self.iterations = collections.deque(maxlen=self.n_history)
+        self.solve_times = collections.deque(maxlen=self.n_history)
+
+    def _obstacle_constraints(self, q, dq, A, lower):
+        """ Fills in the clearance constraints for the links within
+        threshold of an obstacle, the rest are left unconstrained
+        """
+
+        N_JOINTS = self.robot_config.N_JOINTS
+        T = self.horizon
+        row = 2 * N_JOINTS
+        for obstacle in self.obstacles:
+            v = obstacle[:3]
+            for ii in range(N_JOINTS):
+                # find the closest point of the link to the obstacle
+                p1 = self.robot_config.Tx('joint%i' % ii, q=q)
+                if ii == N_JOINTS - 1:
+                    p2 = self.robot_config.Tx('EE', q=q)
+                else:
+                    p2 = self.robot_config.Tx('joint%i' % (ii + 1), q=q)
+                vec_line = p2 - p1
+                projection = np.clip(
+                    np.dot(v - p1, vec_line) / max(np.sum(vec_line**2),
+                                                   1e-12), 0, 1)
+                closest = p1 + projection * vec_line
+                dist = np.linalg.norm(closest - v)
+                distance = dist - obstacle[3]
+
+                if distance < self.threshold and dist > 1e-9:
+                    normal = (closest - v) / dist
+                    # get offset of closest point from link's reference
+                    # frame, link i+1 is from joint i to joint i+1
+                    T_inv = self.robot_config.T_inv('link%i' % (ii + 1), q=q)
+                    m = np.dot(T_inv, np.hstack([closest, [1]]))[:-1]
+                    Jp = self.robot_config.J('link%i' % (ii + 1), x=m, q=q)
+                    A[row] = np.dot(normal, Jp[:3])
+                    lower[row] = 2 * (self.clearance - distance -
+                                      np.dot(A[row], dq) * T) / T**2
+                row += 1
+
+    def _solve(self, P, q_vec, A, lower, upper):
+        """ Solves min 1/2 x^T P x + q_vec^T x s.t. lower <= A x <= upper
+        with ADMM, warm started from the last solution
+
+        Returns the solution and the number of iterations
+        """
+
+        # normalize the rows of the constraints, rows without
+        # constraints are removed from the problem by their bounds
+        norms = np.linalg.norm(A, axis=1)
+        unconstrained = (norms < 1e-9) | (np.isinf(lower) & np.isinf(upper))
+        scale = 1.0 / np.where(unconstrained, 1.0, norms)
+        A = A * scale[:, None]
+        lower = np.where(unconstrained, -np.inf, lower * scale)
+        upper = np.where(unconstrained, np.inf, upper * scale)
+        A[unconstrained] = 0
+
+        x = np.copy(self.ddq)
+        y = self._y / scale
+        y[unconstrained] = 0
+        z = np.clip(np.dot(A, x), lower, upper)
+        rho = np.where(unconstrained, 1e-6, self.rho)
+
+        identity = np.eye(P.shape[0])
+
+        def factor(rho):
+            return scipy.linalg.cho_factor(
+                P + self.sigma * identity + np.dot(A.T, rho[:, None] * A))
+
+        cho = factor(rho)
+        alpha = self.alpha
+        for ii in range(self.max_iterations):
+            rhs = self.sigma * x - q_vec + np.dot(A.T, rho * z - y)
+            x_tilde = scipy.linalg.cho_solve(cho, rhs)
+            z_tilde = np.dot(A, x_tilde)
+            x = alpha * x_tilde + (1 - alpha) * x
+            z_relaxed = alpha * z_tilde + (1 - alpha) * z
+            z_next = np.clip(z_relaxed + y / rho, lower, upper)
+            y = y + rho * (z_relaxed - z_next)
+            z = z_next
+
+            # check the primal and dual residuals
+            Ax = np.dot(A, x)
+            Px = np.dot(P, x)
+            ATy = np.dot(A.T, y)
+            r_primal = np.max(np.abs(Ax - z), initial=0)
+            r_dual = np.max(np.abs(Px + q_vec + ATy))
+            primal_scale = max(np.max(np.abs(Ax), initial=0),
+                               np.max(np.abs(z), initial=0), 1e-12)
+            dual_scale = max(np.max(np.abs(Px)), np.max(np.abs(ATy)),
+                             np.max(np.abs(q_vec)), 1e-12)
+            if (r_primal < self.tolerance * (1 + primal_scale) and
+                    r_dual < self.tolerance * (1 + dual_scale)):
+                break
+
+            if ii % 10 == 9:
+                # balance the residuals by adapting the step size
+                ratio = np.sqrt((r_primal / primal_scale) /
+                                max(r_dual / dual_scale, 1e-12))
+                if ratio > 5 or ratio < .2:
+                    self.rho = np.clip(self.rho * ratio, 1e-3, 1e3)
+                    rho = np.where(unconstrained, 1e-6, self.rho)
+                    cho = factor(rho)
+
+        # the constraints held at their bounds by the last projection
+        self.active = (z == lower) | (z == upper)
+        y[~self.active] = 0
+        self._y = y * scale
+        return x, ii + 1
+
+    def generate(self, q, dq, target_pos, target_vel=np.zeros(3),
+                 ref_frame='EE', offset=[0, 0, 0]):
+        """ Generates the control signal to move the EE to a target
+
+        Parameters
+        ----------
+        q : float numpy.array
+            current joint angles [radians]
+        dq : float numpy.array
+            current joint velocities [radians/second]
+        target_pos : float numpy.array
+            desired [x, y, z] position [meters]
+        target_vel : float numpy.array, optional (Default: numpy.zeros)
+            desired [x, y, z] velocity [meters/second]
+        ref_frame : string, optional (Default: 'EE')
+            the point being controlled, default is the end-effector.
+        offset : list, optional (Default: [0, 0, 0])
+            point of interest inside the frame of reference [meters]
+        """
+
+        start = timeit.default_timer()
+        N_JOINTS = self.robot_config.N_JOINTS
+        q = np.asarray(q, dtype='float64')
+        dq = np.asarray(dq, dtype='float64')
+
+        xyz = self.robot_config.Tx(ref_frame, q, x=offset)
+        J = np.asarray(self.robot_config.J(ref_frame, q, x=offset)[:3],
+                       dtype='float64')
+        M = np.asarray(self.robot_config.M(q), dtype='float64')
+        c = self.robot_config.c(q, dq)
+        g = self.robot_config.g(q)
+
+        # the desired task space acceleration
+        ddx = (self.kp * (target_pos - xyz) +
+               self.kv * (target_vel[:3] - np.dot(J, dq)))
+        if self.use_dJ:
+            ddx -= np.dot(self.robot_config.dJ(ref_frame, q=q, dq=dq)[:3], dq)
+
+        # the desired joint acceleration of the posture term
+        ddq_posture = -self.nkv * dq
+        if self.null_control:
+            q_des = self.robot_config.REST_ANGLES - q
+            q_des = (q_des + np.pi) % (np.pi * 2) - np.pi
+            ddq_posture[self.null_indices] += (
+                self.nkp * q_des[self.null_indices])
+
+        P = np.dot(J.T, J) + self.w_posture * np.eye(N_JOINTS)
+        q_vec = -np.dot(J.T, ddx) - self.w_posture * ddq_posture
+
+        # the constraints, torques, then joint limits, then obstacles
+        n_rows = len(self.constraint_names)
+        A = np.zeros((n_rows, N_JOINTS))
+        lower = -np.inf * np.ones(n_rows)
+        upper = np.inf * np.ones(n_rows)
+        if self.u_max is not None:
+            A[:N_JOINTS] = M
+            lower[:N_JOINTS] = -self.u_max - c + g
+            upper[:N_JOINTS] = self.u_max - c + g
+        T = self.horizon
+        limits = slice(N_JOINTS, 2 * N_JOINTS)
+        A[limits] = np.eye(N_JOINTS)
+        with np.errstate(invalid='ignore'):
+            lower[limits] = np.where(
+                np.isnan(self.min_joint_angles), -np.inf,
+                2 * (self.min_joint_angles - q - dq * T) / T**2)
+            upper[limits] = np.where(
+                np.isnan(self.max_joint_angles), np.inf,
+                2 * (self.max_joint_angles - q - dq * T) / T**2)
+        if len(self.obstacles) > 0:
+            self._obstacle_constraints(q, dq, A, lower)
+
+        self.ddq, self.n_iterations = self._solve(P, q_vec, A, lower, upper)
+
+        u = np.dot(M, self.ddq) + c - g
+        if self.u_max is not None:
+            u = np.clip(u, -self.u_max, self.u_max)
+
+        self.solve_time = timeit.default_timer() - start
+        self.iterations.append(self.n_iterations)
+        self.solve_times.append(self.solve_time)
+        return self._output(u)
@@ -29,6 +29,8 @@ class AvoidJointLimits(Signal):
         True for gradient of force, False for a sudden opposing force (Wall)
 
     NOTE: use None as a placeholder for joints that have no limits
+    NOTE: to push away from the limits without disturbing the task of an
+    OSC controller, pass the signal through OSC.project_null_space
     """
 
     def __init__(self, robot_config,
@@ -36,8 +36,9 @@ class AvoidObstacles(Signal):
 
         u_psp = np.zeros(self.robot_config.N_JOINTS, dtype='float32')
 
-        # calculate the inertia matrix in joint space
-        M = self.robot_config.M(q)
+        # the inverse of the inertia matrix in joint space, calculated
+        # once the first link is within the threshold of an obstacle
+        M_inv = None
 
         # add in obstacle avoidance
         for obstacle in self.obstacles:
@@ -91,9 +92,17 @@ class AvoidObstacles(Signal):
                     # calculate the Jacobian for this point
                     Jpsp = self.robot_config.J('link%i' % (ii+1), x=m, q=q)[:3]
 
+                    if M_inv is None:
+                        # use the cached inverse if the robot config
+                        # is a ControlContext
+                        if hasattr(self.robot_config, 'M_inv'):
+                            M_inv = self.robot_config.M_inv(q)
+                        else:
+                            M_inv = np.linalg.inv(self.robot_config.M(q))
+
                     # calculate the inertia matrix for the
                     # point subjected to the potential space
-                    Mxpsp_inv = np.dot(Jpsp, np.dot(np.linalg.inv(M), Jpsp.T))
+                    Mxpsp_inv = np.dot(Jpsp, np.dot(M_inv, Jpsp.T))
                     # using the rcond to set singular values < thresh to 0
                     # is slightly faster than doing it manually with svd
                     Mxpsp = np.linalg.pinv(Mxpsp_inv, rcond=.01)
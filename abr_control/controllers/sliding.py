@@ -19,18 +19,33 @@ class Sliding(controller.Controller):
     cartesian : boolean, optional (Default: True)
         if True transforms control from Cartesian into joint space
         if False control assumed to be entirely in joint space
+    preallocate : boolean, optional (Default: False)
+        if True the control signal is returned in a buffer that is
+        overwritten on the next call to generate
 
     """
     def __init__(self, robot_config,
                  kd=160.0, lamb=30.0,
-                 cartesian=True):
+                 cartesian=True, preallocate=False):
 
-        super(Sliding, self).__init__(robot_config)
+        super(Sliding, self).__init__(robot_config, preallocate=preallocate)
 
         self.kd = kd
         self.lamb = lamb
         self.cartesian = cartesian
 
+        # workspace for the control signal
+        N_JOINTS = robot_config.N_JOINTS
+        self.ZEROS_3 = np.zeros(3)
+        self.ZEROS_N_JOINTS = np.zeros(N_JOINTS)
+        self._dxyz = np.zeros(3)
+        self._task = np.zeros(3)
+        self._dq_ref = np.zeros(N_JOINTS)
+        self._ddq_ref = np.zeros(N_JOINTS)
+        self._s = np.zeros(N_JOINTS)
+        self._u = np.zeros(N_JOINTS)
+        self._joints = np.zeros(N_JOINTS)
+
     def generate(self, q, dq,
                  target_pos, target_vel=None, target_acc=None,
                  ref_frame='EE', offset=[0, 0, 0]):
@@ -53,41 +68,50 @@ class Sliding(controller.Controller):
         """
         if self.cartesian:
             if target_vel is None:
-                target_vel = np.zeros(3)
+                target_vel = self.ZEROS_3
             if target_acc is None:
-                target_acc = np.zeros(3)
+                target_acc = self.ZEROS_3
 
             # calculate the position Jacobian for the end effector
             J = self.robot_config.J(ref_frame, q, x=offset)[:3]
 
             # calculate the end-effector position information
             xyz = self.robot_config.Tx(ref_frame, q, x=offset)
-            dxyz = np.dot(J, dq)
+            dxyz = np.matmul(J, dq, out=self._dxyz)
 
             J_inv = np.linalg.pinv(J)
             dJ = self.robot_config.dJ(ref_frame, q, dq, x=offset)[:3]
 
-            dq_ref = np.dot(
-                J_inv,
-                target_vel + self.lamb * (target_pos - xyz))
-            ddq_ref = np.dot(
-                J_inv,
-                target_acc + self.lamb * (target_vel - dxyz) -
-                np.dot(dJ, dq_ref))
+            # target_vel + lamb * (target_pos - xyz)
+            task = np.subtract(target_pos, xyz, out=self._task)
+            task *= self.lamb
+            task += target_vel
+            dq_ref = np.matmul(J_inv, task, out=self._dq_ref)
+
+            # target_acc + lamb * (target_vel - dxyz) - dJ dq_ref
+            task = np.subtract(target_vel, dxyz, out=self._task)
+            task *= self.lamb
+            task += target_acc
+            task -= np.matmul(dJ, dq_ref, out=self._dxyz)
+            ddq_ref = np.matmul(J_inv, task, out=self._ddq_ref)
         else:
             if target_vel is None:
-                target_vel = np.zeros(self.robot_config.N_JOINTS)
+                target_vel = self.ZEROS_N_JOINTS
             if target_acc is None:
-                target_acc = np.zeros(self.robot_config.N_JOINTS)
+                target_acc = self.ZEROS_N_JOINTS
 
-            q_tilde = q - target_pos
-            dq_tilde = dq - target_vel
-            dq_ref = target_vel - self.lamb * q_tilde
-            ddq_ref = target_acc - self.lamb * dq_tilde
+            # target_vel - lamb * q_tilde
+            dq_ref = np.subtract(q, target_pos, out=self._dq_ref)
+            dq_ref *= -self.lamb
+            dq_ref += target_vel
+            # target_acc - lamb * dq_tilde
+            ddq_ref = np.subtract(dq, target_vel, out=self._ddq_ref)
+            ddq_ref *= -self.lamb
+            ddq_ref += target_acc
 
         # store the control signal s for training in case
         # dynamics adaptation signal is being used
-        self.s = dq - dq_ref
+        self.s = self._output(np.subtract(dq, dq_ref, out=self._s))
 
         # calculate the inertia matrix in joint space
         M = self.robot_config.M(q)
@@ -96,6 +120,9 @@ class Sliding(controller.Controller):
         # calculate the effects of gravity
         g = self.robot_config.g(q=q)
 
-        u = np.dot(M, ddq_ref) + np.dot(S, dq_ref) + g - self.kd * self.s
+        u = np.matmul(M, ddq_ref, out=self._u)
+        u += np.matmul(S, dq_ref, out=self._joints)
+        u += g
+        u -= np.multiply(self.s, self.kd, out=self._joints)
 
-        return u
+        return self._output(u)
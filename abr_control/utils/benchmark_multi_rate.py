@@ -0,0 +1,176 @@
+"""
+Measures the effect of evaluating M, g, and Gamma at a lower rate on
+the time per step and tracking error of the operational space controller.
+The arm is simulated with its exact dynamics, reaching to a sequence of
+targets, once with the terms evaluated every step and once for each of
+the staleness bounds.
+
+Example usage:
+
+    python -m abr_control.utils.benchmark_multi_rate twolink
+    python -m abr_control.utils.benchmark_multi_rate ur5 --n_steps 3000
+"""
+import argparse
+import importlib
+import timeit
+
+import numpy as np
+
+from abr_control.controllers import OSC, MultiRateDynamics
+
+
+def simulate(robot_config, ctrlr, targets, n_steps, q_init, dt=.001):
+    """ Simulates the arm controlled by ctrlr, with its exact dynamics
+
+    Returns the end-effector path, the distance to the target at each
+    step, and the mean time of ctrlr.generate [seconds].
+
+    Parameters
+    ----------
+    robot_config : class instance
+        the robot config used to simulate the arm
+    ctrlr : class instance
+        the controller, can be created with a MultiRateDynamics config
+    targets : list of numpy.array
+        the [x, y, z] targets, each held for an equal number of steps
+    n_steps : int
+        the number of time steps to simulate
+    q_init : numpy.array
+        the starting joint angles [radians]
+    dt : float, optional (Default: .001)
+        the time step [seconds]
+    """
+
+    q = np.array(q_init, dtype='float64')
+    dq = np.zeros(robot_config.N_JOINTS)
+    ee_path = np.zeros((n_steps, 3))
+    error = np.zeros(n_steps)
+    generate_time = 0.0
+    steps_per_target = int(np.ceil(n_steps / float(len(targets))))
+
+    for ii in range(n_steps):
+        target = targets[ii // steps_per_target]
+        start = timeit.default_timer()
+        u = ctrlr.generate(q=q, dq=dq, target_pos=target)
+        generate_time += timeit.default_timer() - start
+
+        # tau = M ddq + c - g
+        ddq = np.linalg.solve(robot_config.M(q),
+                              u - robot_config.c(q, dq) + robot_config.g(q))
+        dq += ddq * dt
+        q += dq * dt
+
+        ee_path[ii] = robot_config.Tx('EE', q)
+        error[ii] = np.linalg.norm(ee_path[ii] - target)
+
+    return ee_path, error, generate_time / n_steps
+
+
+def benchmark(robot_config, refresh_every=[2, 5, 10, 20, 50],
+              q_thresholds=[.005, .02, .05], n_steps=2000, n_targets=4,
+              seed=0, **ctrlr_kwargs):
+    """ Prints the time per step and tracking error for each bound
+
+    Returns a dictionary from the bound to the results.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    refresh_every : list of ints, optional (Default: [2, 5, 10, 20, 50])
+        the refresh_every bounds to test
+    q_thresholds : list of floats, optional (Default: [.005, .02, .05])
+        the q_threshold bounds to test, with refresh_every=None
+    n_steps : int, optional (Default: 2000)
+        the number of time steps to simulate
+    n_targets : int, optional (Default: 4)
+        the number of targets to reach to
+    seed : int, optional (Default: 0)
+        the seed for generating the targets
+    ctrlr_kwargs : optional
+        passed to OSC, by default kp=100. Coriolis compensation is left
+        off, as OSC subtracts c while the simulation integrates
+        tau = M ddq + c - g, as BaseConfig.linearize does
+    """
+
+    # start at the rest angles, with 0 for joints without one, and
+    # generate reachable targets near them
+    q_init = np.nan_to_num(
+        np.array(robot_config.REST_ANGLES, dtype='float64'))
+    rng = np.random.RandomState(seed)
+    targets = [robot_config.Tx('EE', q_init + rng.uniform(
+        -.5, .5, robot_config.N_JOINTS)) for ii in range(n_targets)]
+    kwargs = {'kp': 100}
+    kwargs.update(ctrlr_kwargs)
+
+    bounds = ([(None, None)] + [(k, None) for k in refresh_every] +
+              [(None, threshold) for threshold in q_thresholds])
+    results = {}
+    print('%s OSC with multi-rate dynamics, %i steps' % (
+        robot_config.ROBOT_NAME, n_steps))
+    print('%-14s %10s %10s %12s %12s %14s' % (
+        'bound', 'step [us]', 'speedup', 'M refresh', 'RMS error',
+        'max path diff'))
+    for k, threshold in bounds:
+        if k is None and threshold is None:
+            config = robot_config
+            label = 'exact'
+        else:
+            config = MultiRateDynamics(robot_config, refresh_every=k,
+                                       q_threshold=threshold)
+            label = 'k=%i' % k if k is not None else 'drift>%g' % threshold
+        ctrlr = OSC(config, **kwargs)
+        # load the functions before timing
+        ctrlr.generate(q=q_init,
+                       dq=np.zeros(robot_config.N_JOINTS),
+                       target_pos=targets[0])
+        if config is not robot_config:
+            config.reset()
+
+        ee_path, error, step_time = simulate(
+            robot_config, ctrlr, targets, n_steps, q_init)
+        result = {
+            'step_time': step_time,
+            'rms_error': np.sqrt(np.mean(error**2)),
+            'ee_path': ee_path,
+            'refresh_rate': (1.0 if config is robot_config else
+                             config.stats()['M']['refresh_rate'])}
+        if label == 'exact':
+            exact = result
+        result['speedup'] = exact['step_time'] / step_time
+        result['max_path_diff'] = np.max(np.linalg.norm(
+            ee_path - exact['ee_path'], axis=1))
+        results[(k, threshold)] = result
+
+        print('%-14s %10.1f %10.2f %12.3f %12.5f %14.5f' % (
+            label, step_time * 1e6, result['speedup'],
+            result['refresh_rate'], result['rms_error'],
+            result['max_path_diff']))
+
+    return results
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Time and measure the tracking error of OSC with '
+                    'M, g, and Gamma evaluated at a lower rate')
+    parser.add_argument('arm', help='name of the arm, ex: ur5')
+    parser.add_argument('--hand_attached', action='store_true',
+                        help='use the config with the hand attached (jaco2)')
+    parser.add_argument('--use_cython', action='store_true')
+    parser.add_argument('--n_steps', type=int, default=2000)
+    args = parser.parse_args(args)
+
+    config_module = importlib.import_module(
+        'abr_control.arms.%s.config' % args.arm)
+    kwargs = {'use_cython': args.use_cython}
+    if args.hand_attached:
+        kwargs['hand_attached'] = True
+    robot_config = config_module.Config(**kwargs)
+
+    return benchmark(robot_config, n_steps=args.n_steps)
+
+
+if __name__ == '__main__':
+    main()
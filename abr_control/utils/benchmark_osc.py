@@ -0,0 +1,118 @@
+"""
+Times the operational space controller for an arm, comparing the
+Jacobians and task space inertia matrix calculated in OSC.generate
+against evaluating the Jacobian twice and inverting M and Mx_inv.
+
+Example usage:
+
+    python -m abr_control.utils.benchmark_osc ur5
+    python -m abr_control.utils.benchmark_osc jaco2 --hand_attached
+"""
+import argparse
+import importlib
+import timeit
+
+import numpy as np
+
+from abr_control.controllers import OSC
+
+
+def _previous_task_inertia(robot_config, q, ref_frame, offset):
+    """ The position, Jacobians, and task space inertia matrix calculated
+    with an evaluation of the Jacobian for the offset and the frame, and
+    the inverses of M and Mx_inv
+    """
+
+    xyz = robot_config.Tx(ref_frame, q, x=offset)
+    J = robot_config.J(ref_frame, q, x=offset)[:3]
+    M = robot_config.M(q)
+    M_inv = np.linalg.inv(M)
+    JEE = robot_config.J(ref_frame, q)[:3]
+    Mx_inv = np.dot(JEE, np.dot(M_inv, JEE.T))
+    Mx = np.linalg.pinv(Mx_inv, rcond=.04)
+    return xyz, J, Mx, np.dot(M_inv, JEE.T)
+
+
+def benchmark(robot_config, offsets=[[0, 0, 0], [0, 0, .05]],
+              n_trials=1000, ref_frame='EE'):
+    """ Prints the time per step of each calculation, in microseconds
+
+    Returns a dictionary from (offset, calculation) to the mean time.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    offsets : list of lists, optional (Default: [[0, 0, 0], [0, 0, .05]])
+        the points of interest inside the reference frame to time
+    n_trials : int, optional (Default: 1000)
+        the number of random joint angles to time each calculation over
+    ref_frame : string, optional (Default: 'EE')
+        the point being controlled
+    """
+
+    ctrlr = OSC(robot_config, kp=100)
+    q_trials = np.random.uniform(
+        -np.pi, np.pi, (n_trials, robot_config.N_JOINTS))
+    dq = np.zeros(robot_config.N_JOINTS)
+    target = np.array([.2, .2, .5])
+
+    def previous(q, offset):
+        _previous_task_inertia(robot_config, q, ref_frame, offset)
+
+    def current(q, offset):
+        xyz = robot_config.Tx(ref_frame, q, x=offset)
+        J, JEE = ctrlr._jacobians(ref_frame, q, offset, xyz)
+        JEE = ctrlr._select_rows(JEE, ctrlr._JEE)
+        ctrlr._task_inertia(robot_config.M(q), JEE)
+
+    def generate(q, offset):
+        ctrlr.generate(q, dq, target, ref_frame=ref_frame, offset=offset)
+
+    times = {}
+    print('%s OSC time per step [microseconds]' % robot_config.ROBOT_NAME)
+    print('%-18s %12s %12s %12s %12s' % (
+        'offset', 'two J + inv', 'OSC', 'saving', 'generate'))
+    for offset in offsets:
+        # load the functions before timing
+        previous(q_trials[0], offset)
+        generate(q_trials[0], offset)
+        for label, function in [('previous', previous),
+                                ('current', current),
+                                ('generate', generate)]:
+            start = timeit.default_timer()
+            for q in q_trials:
+                function(q, offset)
+            times[(tuple(offset), label)] = (
+                (timeit.default_timer() - start) / n_trials * 1e6)
+        row = [times[(tuple(offset), label)]
+               for label in ['previous', 'current', 'generate']]
+        print('%-18s %12.1f %12.1f %11.0f%% %12.1f' % (
+            str(offset), row[0], row[1], (1 - row[1] / row[0]) * 100, row[2]))
+
+    return times
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Time the operational space controller for an arm')
+    parser.add_argument('arm', help='name of the arm, ex: ur5')
+    parser.add_argument('--hand_attached', action='store_true',
+                        help='use the config with the hand attached (jaco2)')
+    parser.add_argument('--use_cython', action='store_true')
+    parser.add_argument('--n_trials', type=int, default=1000)
+    args = parser.parse_args(args)
+
+    config_module = importlib.import_module(
+        'abr_control.arms.%s.config' % args.arm)
+    kwargs = {'use_cython': args.use_cython}
+    if args.hand_attached:
+        kwargs['hand_attached'] = True
+    robot_config = config_module.Config(**kwargs)
+
+    return benchmark(robot_config, n_trials=args.n_trials)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+import importlib.util
+import re
+import sys
+
+import sympy as sp
+from sympy.printing.pycode import pycode
+
+
+def function_source(name, expression, parameters, cse=True,
+                    decorator=None):
+    """ Prints an expression as a scalar Python function
+
+    The function takes scalar parameters, evaluates the expression using
+    the math module, and returns a numpy.array of expression.shape.
+    The generated code needs only math and numpy to run.
+
+    Parameters
+    ----------
+    name : string
+        name of the generated function
+    expression : sympy.Matrix
+        the expression to print
+    parameters : list of sympy.Symbol
+        the input parameters of the function
+    cse : boolean, optional (Default: True)
+        if True common subexpressions are calculated once
+    decorator : string, optional (Default: None)
+        a decorator to add to the function, ex: '@numba.njit(cache=True)'
+    """
+
+    shape = expression.shape
+    names = [str(parameter) for parameter in parameters]
+    entries = list(expression)
+    if cse:
+        replacements, entries = sp.cse(
+            entries, symbols=sp.numbered_symbols('_cse'))
+    else:
+        replacements = []
+
+    lines = [] if decorator is None else [decorator]
+    lines.append('def %s(%s):' % (name, ', '.join(names)))
+    for symbol, subexpression in replacements:
+        lines.append('    %s = %s' % (
+            symbol, pycode(subexpression, fully_qualified_modules=True)))
+    lines.append('    out = np.empty((%i, %i))' % shape)
+    for ii, entry in enumerate(entries):
+        lines.append('    out[%i, %i] = %s' % (
+            ii // shape[1], ii % shape[1],
+            pycode(entry, fully_qualified_modules=True)))
+    lines.append('    return out')
+
+    return '\n'.join(lines)
+
+
+def numba_source(expression, parameters, cse=True):
+    """ Prints an expression as Numba compiled scalar Python code
+
+    The generated module defines two functions:
+    function(*parameters), which takes scalar parameters and returns a
+    numpy.array of expression.shape, and batch_function(*parameters),
+    which takes one array of shape (K,) for each parameter and returns a
+    numpy.array of shape (K,) + expression.shape, evaluating the batch in
+    parallel. Both are compiled with cache=True, so the machine code is
+    saved next to the module and reused by later processes.
+
+    Parameters
+    ----------
+    expression : sympy.Matrix
+        the expression to print
+    parameters : list of sympy.Symbol
+        the input parameters of the function
+    cse : boolean, optional (Default: True)
+        if True common subexpressions are calculated once
+    """
+
+    shape = expression.shape
+    names = [str(parameter) for parameter in parameters]
+
+    lines = [
+        '# generated by abr_control.utils.codegen, do not edit',
+        'import math',
+        '',
+        'import numba',
+        'import numpy as np',
+        '',
+        '',
+        function_source('function', expression, parameters, cse=cse,
+                        decorator='@numba.njit(cache=True)'),
+        '',
+        '',
+        '@numba.njit(cache=True, parallel=True)',
+        'def batch_function(%s):' % ', '.join(names),
+        '    n_batch = %s.shape[0]' % names[0],
+        '    out = np.empty((n_batch, %i, %i))' % shape,
+        '    for kk in numba.prange(n_batch):',
+        '        out[kk] = function(%s)' % ', '.join(
+            ['%s[kk]' % name for name in names]),
+        '    return out',
+        '']
+
+    return '\n'.join(lines)
+
+
+def module_name(name):
+    """ Returns the module name load_module registers a module under """
+
+    return re.sub(r'\W', '_', name)
+
+
+def load_module(path, name):
+    """ Imports a generated Python module from file
+
+    Parameters
+    ----------
+    path : string
+        location of the .py file
+    name : string
+        used to create a unique module name
+    """
+
+    name = module_name(name)
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Numba looks the module up by name when loading cached functions
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
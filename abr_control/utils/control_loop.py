@@ -0,0 +1,337 @@
+"""
+A fixed rate loop around an interface and a controller
+
+Each tick the feedback is read from the interface, the control signal is
+generated by the controller plus any additive signals, and sent back to
+the interface. The time of each step is recorded, so that the latency,
+deadline misses and jitter of the loop can be reported.
+
+In pipelined mode the feedback is read and the control signal sent on a
+worker thread. While the feedback is being read, the main thread
+evaluates the terms of the dynamics that only depend on q for the
+predicted joint angles, and while the control signal is being sent it
+runs the callback.
+
+Example usage:
+
+    loop = ControlLoop(interface, OSC(robot_config, kp=200),
+                       signals=[avoid], rate=1000)
+    loop.run(n_steps=5000, generate_kwargs={'target_pos': target_xyz})
+    loop.print_stats()
+"""
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import time
+
+import numpy as np
+
+
+class ControlLoop():
+    """ Runs a controller on an interface at a fixed rate
+
+    The start of each tick is scheduled at a multiple of the period from
+    the start of the loop. The loop sleeps until spin_time before the
+    start of the tick, and then spins on the clock until it is reached,
+    because sleeping alone can wake up late by more than a millisecond.
+
+    With pipelined=True, get_feedback and send_forces run on a worker
+    thread, overlapping the time the interface blocks on the network or
+    simulation with computation on the main thread. Each tick the read of
+    the feedback is started first. While the worker waits on it, if the
+    controller's robot config is a MultiRateDynamics, its M, g, and Gamma
+    are prefetched for the joint angles predicted from the last feedback
+    as q + dq * predict_dt. The control signal is then generated from the
+    new feedback, so pipelining adds no delay to the control path, and
+    the callback runs while the worker sends it. With refresh_every=None
+    and a q_threshold on the MultiRateDynamics, the controller uses the
+    prefetched terms whenever the prediction was close enough:
+
+        config = MultiRateDynamics(robot_config, refresh_every=None,
+                                   q_threshold=.01)
+        loop = ControlLoop(interface, OSC(config), pipelined=True)
+
+    Parameters
+    ----------
+    interface : class instance
+        the connected interface to the arm, with get_feedback and
+        send_forces functions
+    controller : class instance
+        the controller, its generate function is called with the q and dq
+        from the feedback and the generate_kwargs passed to run
+    signals : list of class instances, optional (Default: None)
+        additive signals, the output of their generate(q) functions is
+        added to the control signal
+    rate : float, optional (Default: 1000)
+        the target rate of the loop [Hz]
+    spin_time : float, optional (Default: .002)
+        the time before the start of each tick to stop sleeping and spin
+        on the clock [seconds]
+    catch_up : boolean, optional (Default: False)
+        if True, after a deadline miss ticks run back to back until the
+        loop is back on schedule. If False the schedule restarts from the
+        end of the late tick, so that the ticks are never closer together
+        than the period
+    disable_gc : boolean, optional (Default: True)
+        disable Python's garbage collector while the loop runs, to avoid
+        collection pauses in the middle of a tick
+    print_every : int, optional (Default: None)
+        print the number of ticks and deadline misses every print_every
+        ticks, if None nothing is printed
+    pipelined : boolean, optional (Default: False)
+        run the interface on a worker thread, overlapping its I/O with
+        computation on the main thread. The callback then runs while
+        the worker is using the interface, so must not call it
+    predict_dt : float, optional (Default: None)
+        the time between feedbacks used to predict the joint angles being
+        read in pipelined mode [seconds], if None the period of the loop
+
+    Attributes
+    ----------
+    n_ticks : int
+        the number of ticks run in the last call to run
+    latency : numpy.array
+        time from the start of each tick to sending the control signal,
+        including reading the feedback [seconds]
+    busy : numpy.array
+        time from the start to the end of each tick, including waiting on
+        the interface [seconds]
+    jitter : numpy.array
+        time between the scheduled and actual start of each tick [seconds]
+    tick_start : numpy.array
+        the start time of each tick, from the start of the loop [seconds]
+    missed : numpy.array
+        True for the ticks that ended after the start of the next tick
+    q_track, dq_track, u_track : numpy.array
+        the feedback and control signal of each tick, if track is True
+    """
+
+    def __init__(self, interface, controller, signals=None, rate=1000.0,
+                 spin_time=.002, catch_up=False, disable_gc=True,
+                 print_every=None, pipelined=False, predict_dt=None):
+
+        self.interface = interface
+        self.controller = controller
+        self.signals = [] if signals is None else list(signals)
+        self.rate = rate
+        self.period = 1.0 / rate
+        self.spin_time = spin_time
+        self.catch_up = catch_up
+        self.disable_gc = disable_gc
+        self.print_every = print_every
+        self.pipelined = pipelined
+        self.predict_dt = predict_dt
+
+        self.n_ticks = 0
+        self.latency = np.zeros(0)
+        self.busy = np.zeros(0)
+        self.jitter = np.zeros(0)
+        self.tick_start = np.zeros(0)
+        self.missed = np.zeros(0, dtype=bool)
+        self.q_track = self.dq_track = self.u_track = None
+
+    def _allocate(self, n_steps, track):
+        """ Allocates the arrays recording each tick before the loop """
+
+        self.n_ticks = 0
+        self.latency = np.zeros(n_steps)
+        self.busy = np.zeros(n_steps)
+        self.jitter = np.zeros(n_steps)
+        self.tick_start = np.zeros(n_steps)
+        self.missed = np.zeros(n_steps, dtype=bool)
+        if track:
+            shape = (n_steps, self.interface.robot_config.N_JOINTS)
+            self.q_track = np.zeros(shape)
+            self.dq_track = np.zeros(shape)
+            self.u_track = np.zeros(shape)
+        else:
+            self.q_track = self.dq_track = self.u_track = None
+
+    def _wait(self, clock, until):
+        """ Sleeps, then spins on the clock until the time until """
+
+        remaining = until - clock()
+        if remaining > self.spin_time:
+            time.sleep(remaining - self.spin_time)
+        while clock() < until:
+            pass
+
+    def _generate(self, feedback, generate_kwargs):
+        """ Generates the control signal from the feedback """
+
+        q = feedback['q']
+        u = self.controller.generate(q=q, dq=feedback['dq'],
+                                     **generate_kwargs)
+        for signal in self.signals:
+            u += signal.generate(q)
+        return u
+
+    def _read_feedback(self):
+        """ Returns the feedback with copies of q and dq
+
+        Run on the worker thread in pipelined mode. The joint angles and
+        velocities are copied, as interfaces can update them in place
+        while the main thread is still using them.
+        """
+
+        feedback = dict(self.interface.get_feedback())
+        feedback['q'] = np.array(feedback['q'], dtype='float64')
+        feedback['dq'] = np.array(feedback['dq'], dtype='float64')
+        return feedback
+
+    def run(self, n_steps, generate_kwargs=None, callback=None, track=False):
+        """ Runs the control loop for n_steps ticks
+
+        Returns the number of ticks run. If interrupted, the ticks run
+        so far are kept for the statistics.
+
+        Parameters
+        ----------
+        n_steps : int
+            the number of ticks to run
+        generate_kwargs : dict or callable, optional (Default: None)
+            the arguments passed to controller.generate other than q and
+            dq, ex: {'target_pos': target_xyz}. If callable, it is called
+            at the start of each tick as generate_kwargs(tick, self)
+            and returns the dictionary, for changing targets
+        callback : callable, optional (Default: None)
+            called at the end of each tick as callback(tick, feedback, u),
+            ex: to update a display or record data. If it returns False
+            the loop stops. The callback counts towards the deadline
+        track : boolean, optional (Default: False)
+            record q, dq, and u of each tick in q_track, dq_track, u_track
+        """
+
+        self._allocate(n_steps, track)
+        if generate_kwargs is None:
+            generate_kwargs = {}
+        update_kwargs = callable(generate_kwargs)
+        kwargs = generate_kwargs
+
+        if self.pipelined:
+            worker = ThreadPoolExecutor(max_workers=1)
+            # the last feedback, used to predict the joint angles being read
+            feedback = None
+            prefetch = getattr(self.controller.robot_config, 'prefetch', None)
+            predict_dt = (self.period if self.predict_dt is None
+                          else self.predict_dt)
+
+        clock = time.perf_counter
+        gc_enabled = gc.isenabled()
+        if self.disable_gc:
+            gc.disable()
+
+        tick = 0
+        start = clock()
+        next_tick = start
+        try:
+            while tick < n_steps:
+                self._wait(clock, next_tick)
+                tick_start = clock()
+                if update_kwargs:
+                    kwargs = generate_kwargs(tick, self)
+
+                if self.pipelined:
+                    reading = worker.submit(self._read_feedback)
+                    # while the interface is busy, evaluate the terms that
+                    # only depend on q for the predicted joint angles
+                    if prefetch is not None and feedback is not None:
+                        prefetch(feedback['q'] + feedback['dq'] * predict_dt)
+                    feedback = reading.result()
+                    u = self._generate(feedback, kwargs)
+                    sending = worker.submit(self.interface.send_forces, u)
+                    sent = clock()
+                else:
+                    feedback = self.interface.get_feedback()
+                    u = self._generate(feedback, kwargs)
+                    self.interface.send_forces(u)
+                    sent = clock()
+
+                stop = (callback is not None and
+                        callback(tick, feedback, u) is False)
+                if track:
+                    self.q_track[tick] = feedback['q']
+                    self.dq_track[tick] = feedback['dq']
+                    self.u_track[tick] = u
+                if self.pipelined:
+                    # u can be reused by the controller in the next tick
+                    sending.result()
+
+                now = clock()
+                self.latency[tick] = sent - tick_start
+                self.busy[tick] = now - tick_start
+                self.jitter[tick] = tick_start - next_tick
+                self.tick_start[tick] = tick_start - start
+                next_tick += self.period
+                if now > next_tick:
+                    self.missed[tick] = True
+                    if not self.catch_up:
+                        next_tick = now
+                tick += 1
+
+                if self.print_every is not None and \
+                        tick % self.print_every == 0:
+                    print('%i ticks, %i deadline misses' % (
+                        tick, np.sum(self.missed[:tick])))
+                if stop:
+                    break
+        finally:
+            self.n_ticks = tick
+            if self.pipelined:
+                worker.shutdown(wait=True)
+            if self.disable_gc and gc_enabled:
+                gc.enable()
+
+        return self.n_ticks
+
+    def stats(self):
+        """ Returns a dictionary of the timing statistics of the last run
+
+        Times are in seconds. The latency is from the start of each tick
+        to sending the control signal, busy is the time until the end of
+        the tick, the jitter is the delay of the start of each tick from
+        its schedule, and the period is the time between the starts of
+        consecutive ticks.
+        """
+
+        n = self.n_ticks
+        if n == 0:
+            raise Exception('run must be called before the statistics '
+                            'can be calculated')
+        n_missed = int(np.sum(self.missed[:n]))
+
+        stats = {
+            'n_ticks': n,
+            'n_missed': n_missed,
+            'miss_rate': n_missed / float(n),
+            'target_period': self.period,
+            'latency_median': np.median(self.latency[:n]),
+        }
+        for name in ['latency', 'busy', 'jitter']:
+            times = getattr(self, name)[:n]
+            stats.update({
+                name + '_mean': np.mean(times),
+                name + '_std': np.std(times),
+                name + '_p99': np.percentile(times, 99),
+                name + '_max': np.max(times)})
+        if n > 1:
+            period = np.diff(self.tick_start[:n])
+            stats.update({
+                'rate': 1.0 / np.mean(period),
+                'period_std': np.std(period),
+                'period_max': np.max(period)})
+        return stats
+
+    def print_stats(self):
+        """ Prints the timing statistics of the last run, in microseconds
+        """
+
+        stats = self.stats()
+        print('%i ticks at %.1f Hz, %i deadline misses (%.2f%%)' % (
+            stats['n_ticks'], stats.get('rate', self.rate),
+            stats['n_missed'], stats['miss_rate'] * 100))
+        print('%-10s %10s %10s %10s %10s' % (
+            '[us]', 'mean', 'std', 'p99', 'max'))
+        for name in ['latency', 'busy', 'jitter']:
+            print('%-10s %10.1f %10.1f %10.1f %10.1f' % tuple(
+                [name] + [stats['%s_%s' % (name, key)] * 1e6
+                          for key in ['mean', 'std', 'p99', 'max']]))
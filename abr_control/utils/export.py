@@ -0,0 +1,403 @@
+"""
+Export a robot config as a standalone Python package
+
+The exported package contains the kinematics and dynamics functions of
+the config printed as plain Python code, along with its constants. It
+depends only on numpy, so it imports in milliseconds on a control host
+without SymPy, the abr_control cache, or any generation step. Its Config
+class provides the same accessors as the robot config, so it can be
+passed to the controllers directly.
+
+Example usage:
+
+    from abr_control.arms import ur5
+    from abr_control.utils import export
+
+    export.export_model(ur5.Config(), 'deploy/', names=['EE'])
+
+    # then on the control host, with deploy/ on the path
+    # or after `pip install deploy/ur5_model`
+    import ur5_model
+    robot_config = ur5_model.Config()
+"""
+import os
+
+import numpy as np
+
+import abr_control.utils.codegen
+import abr_control.utils.os_utils
+from abr_control.version import version
+
+
+CONFIG_TEMPLATE = '''"""
+Standalone %(ROBOT_NAME)s model, exported from abr_control %(version)s
+
+Config hash: %(config_hash)s
+"""
+import numpy as np
+
+from . import functions
+
+
+class Config():
+    """ Standalone robot config for the %(ROBOT_NAME)s
+
+    Provides the Tx, J, dJ, R, orientation, T_inv, M, g, c, and S
+    accessors of the abr_control robot config, for the names %(names)s
+    """
+
+    N_JOINTS = %(N_JOINTS)i
+    N_LINKS = %(N_LINKS)i
+    ROBOT_NAME = %(ROBOT_NAME)r
+    CONFIG_HASH = %(config_hash)r
+    REST_ANGLES = np.array(%(REST_ANGLES)s)
+    MEANS = %(MEANS)s
+    SCALES = %(SCALES)s
+
+    def _function(self, name, x, kind):
+        funcname = name + '[0,0,0]' if np.allclose(x, 0) else name
+        try:
+            return functions.FUNCTIONS[funcname + '_' + kind]
+        except KeyError:
+            raise Exception('%%s not exported for %%s' %% (kind, funcname))
+
+    def c(self, q, dq):
+        Gamma = self.Gamma(q)
+        c = np.einsum('kij,i,j->k', Gamma, dq, dq)
+        return np.asarray(c, dtype='float32')
+
+    def dJ(self, name, q, dq, x=[0, 0, 0]):
+        parameters = tuple(q) + tuple(dq) + tuple(x)
+        return np.array(self._function(name, x, 'dJ')(*parameters),
+                        dtype='float32')
+
+    def g(self, q):
+        return np.array(functions.FUNCTIONS['g'](*q),
+                        dtype='float32').flatten()
+
+    def Gamma(self, q):
+        return np.array(functions.FUNCTIONS['Gamma'](*q),
+                        dtype='float32').reshape(
+                            (self.N_JOINTS, self.N_JOINTS, self.N_JOINTS))
+
+    def J(self, name, q, x=[0, 0, 0]):
+        parameters = tuple(q) + tuple(x)
+        return np.array(self._function(name, x, 'J')(*parameters),
+                        dtype='float32')
+
+    def M(self, q):
+        return np.array(functions.FUNCTIONS['M'](*q), dtype='float32')
+
+    def orientation(self, name, q):
+        # the quaternion [w, x, y, z] is the eigenvector of K with the
+        # largest eigenvalue, as in abr_control.utils.transformations
+        R = np.asarray(self.R(name, q), dtype='float64')
+        K = np.array([
+            [R[0, 0] - R[1, 1] - R[2, 2], 0.0, 0.0, 0.0],
+            [R[0, 1] + R[1, 0], R[1, 1] - R[0, 0] - R[2, 2], 0.0, 0.0],
+            [R[0, 2] + R[2, 0], R[1, 2] + R[2, 1],
+             R[2, 2] - R[0, 0] - R[1, 1], 0.0],
+            [R[2, 1] - R[1, 2], R[0, 2] - R[2, 0], R[1, 0] - R[0, 1],
+             R[0, 0] + R[1, 1] + R[2, 2]]]) / 3.0
+        w, V = np.linalg.eigh(K)
+        quaternion = V[[3, 0, 1, 2], np.argmax(w)]
+        if quaternion[0] < 0.0:
+            quaternion = -quaternion
+        return quaternion
+
+    def R(self, name, q):
+        try:
+            function = functions.FUNCTIONS[name + '_R']
+        except KeyError:
+            raise Exception('R not exported for %%s' %% name)
+        return np.array(function(*q), dtype='float32')
+
+    def S(self, q, dq):
+        Gamma = self.Gamma(q)
+        S = np.einsum('kij,i->kj', Gamma, dq)
+        return np.asarray(S, dtype='float32')
+
+    def scaledown(self, name, x):
+        if self.MEANS is None or self.SCALES is None:
+            raise Exception('Mean and/or scaling not defined')
+        return (x - self.MEANS[name]) / self.SCALES[name]
+
+    def scaleup(self, name, x):
+        if self.MEANS is None or self.SCALES is None:
+            raise Exception('Mean and/or scaling not defined')
+        return x * self.SCALES[name] + self.MEANS[name]
+
+    def T_inv(self, name, q, x=[0, 0, 0]):
+        parameters = tuple(q) + tuple(x)
+        return self._function(name, x, 'Tinv')(*parameters)
+
+    def Tx(self, name, q, x=[0, 0, 0]):
+        parameters = tuple(q) + tuple(x)
+        return self._function(name, x, 'Tx')(*parameters)[:-1].flatten()
+'''
+
+SETUP_TEMPLATE = '''from setuptools import setup
+
+setup(
+    name=%(package_name)r,
+    version=%(version)r,
+    description='Standalone %(ROBOT_NAME)s model exported from abr_control',
+    packages=[%(package_name)r],
+    install_requires=['numpy'],
+)
+'''
+
+
+def _array_source(value):
+    """ Prints a numpy.array or dictionary of arrays as Python source """
+
+    if value is None:
+        return 'None'
+    if isinstance(value, dict):
+        return '{%s}' % ', '.join(['%r: %s' % (key, _array_source(value[key]))
+                                   for key in sorted(value)])
+    return 'np.array(%r)' % np.asarray(value, dtype='float64').tolist()
+
+
+def _dynamics_expressions(robot_config):
+    """ Returns the M, g, and Christoffel symbol expressions of a config
+
+    Any expressions that are not saved yet are generated.
+    """
+
+    q = robot_config.q
+    return [
+        ('M', robot_config._calc_M(lambdify=False), q),
+        ('g', robot_config._calc_g(lambdify=False), q),
+        ('Gamma', robot_config._calc_Gamma(lambdify=False), q)]
+
+
+def _kinematics_expressions(robot_config, names, offsets=False):
+    """ Returns the Tx, J, and dJ expressions for each of names
+
+    Any expressions that are not saved yet are generated.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    names : list of strings
+        the joints, links, or end-effector to get the expressions for
+    offsets : boolean, optional (Default: False)
+        if True, expressions for a variable [x, y, z] offset are
+        returned alongside the expressions for no offset
+    """
+
+    q = robot_config.q
+    dq = robot_config.dq
+    x = robot_config.x
+
+    expressions = []
+    x_values = [[0, 0, 0]] + ([[1, 1, 1]] if offsets else [])
+    for name in names:
+        for x_value in x_values:
+            funcname = name + '[0,0,0]' if np.allclose(x_value, 0) else name
+            expressions += [
+                (funcname + '_Tx', robot_config._calc_Tx(
+                    name, x=x_value, lambdify=False), q + x),
+                (funcname + '_J', robot_config._calc_J(
+                    name, x=x_value, lambdify=False), q + x),
+                (funcname + '_dJ', robot_config._calc_dJ(
+                    name, x=x_value, lambdify=False), q + dq + x)]
+    return expressions
+
+
+def _rotation_expressions(robot_config, names, offsets=False):
+    """ Returns the R and T_inv expressions for each of names
+
+    Any expressions that are not saved yet are generated.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    names : list of strings
+        the joints, links, or end-effector to get the expressions for
+    offsets : boolean, optional (Default: False)
+        if True, the T_inv expression for a variable [x, y, z] offset is
+        returned alongside the expression for no offset
+    """
+
+    q = robot_config.q
+    x = robot_config.x
+
+    expressions = []
+    x_values = [[0, 0, 0]] + ([[1, 1, 1]] if offsets else [])
+    for name in names:
+        expressions.append((name + '_R', robot_config._calc_R(
+            name, lambdify=False), q))
+        for x_value in x_values:
+            funcname = name + '[0,0,0]' if np.allclose(x_value, 0) else name
+            expressions.append((funcname + '_Tinv', robot_config._calc_T_inv(
+                name, x=x_value, lambdify=False), q + x))
+    return expressions
+
+
+def _functions_source(expressions, header=[]):
+    """ Prints expressions as plain Python functions
+
+    Returns the lines of a module defining one function for each
+    expression, and a FUNCTIONS dictionary from name to function.
+
+    Parameters
+    ----------
+    expressions : list of tuples
+        (name, sympy.Matrix, parameters) for each function
+    header : list of strings, optional (Default: [])
+        lines to add after the imports
+    """
+
+    lines = [
+        '# generated by abr_control.utils.export, do not edit',
+        'import math',
+        '',
+        'import numpy as np',
+        ''] + header
+    for ii, (funcname, expression, parameters) in enumerate(expressions):
+        lines += [
+            '',
+            '# %s' % funcname,
+            abr_control.utils.codegen.function_source(
+                'function%i' % ii, expression, parameters),
+            '']
+    lines += [
+        '',
+        'FUNCTIONS = {'] + [
+        '    %r: function%i,' % (funcname, ii)
+        for ii, (funcname, _, _) in enumerate(expressions)] + [
+        '}',
+        '']
+    return lines
+
+
+def export_model(robot_config, folder, package_name=None, names=['EE'],
+                 offsets=True):
+    """ Writes a standalone Python package for a robot config
+
+    Creates folder/package_name/setup.py and the package
+    folder/package_name/package_name, which can be copied onto
+    a control host, or built into a wheel with
+    `pip wheel folder/package_name`.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    folder : string
+        the folder to write the package to
+    package_name : string, optional (Default: None)
+        the name of the package, if None ROBOT_NAME + '_model'
+    names : list of strings, optional (Default: ['EE'])
+        the joints, links, or end-effector to export Tx, J, dJ, R, and
+        T_inv for, ex: add the links for AvoidObstacles
+    offsets : boolean, optional (Default: True)
+        if True, functions for a variable [x, y, z] offset inside the
+        reference frame of each name are exported alongside the
+        functions for no offset
+    """
+
+    if package_name is None:
+        package_name = robot_config.ROBOT_NAME + '_model'
+
+    expressions = (_dynamics_expressions(robot_config) +
+                   _kinematics_expressions(robot_config, names, offsets) +
+                   _rotation_expressions(robot_config, names, offsets))
+    print('Writing %s functions' % package_name)
+    function_lines = _functions_source(expressions)
+
+    template_values = {
+        'ROBOT_NAME': robot_config.ROBOT_NAME,
+        'N_JOINTS': robot_config.N_JOINTS,
+        'N_LINKS': robot_config.N_LINKS,
+        'REST_ANGLES': np.asarray(robot_config.REST_ANGLES,
+                                  dtype='float64').tolist(),
+        'MEANS': _array_source(robot_config.MEANS),
+        'SCALES': _array_source(robot_config.SCALES),
+        'config_hash': robot_config.config_hash,
+        'names': ', '.join(names),
+        'package_name': package_name,
+        'version': version,
+    }
+
+    package_folder = os.path.join(folder, package_name, package_name)
+    abr_control.utils.os_utils.makedirs(package_folder)
+    with open(os.path.join(package_folder, 'functions.py'), 'w') as wfile:
+        wfile.write('\n'.join(function_lines))
+    with open(os.path.join(package_folder, '__init__.py'), 'w') as wfile:
+        wfile.write(CONFIG_TEMPLATE % template_values)
+    with open(os.path.join(folder, package_name, 'setup.py'), 'w') as wfile:
+        wfile.write(SETUP_TEMPLATE % template_values)
+
+    print('Exported %s to %s' % (package_name,
+                                 os.path.join(folder, package_name)))
+    return os.path.join(folder, package_name)
+
+
+def pregenerate(robot_config, module_file=None):
+    """ Writes the pre-generated functions module for a robot config
+
+    The module holds M, g, the Christoffel symbols, and Tx, J, and dJ for
+    every joint, link, and the end-effector, along with Tx, J, and dJ for
+    a variable offset from the end-effector. It is stamped with the
+    config hash and abr_control version, and is loaded by the config
+    in place of generating the functions while both match.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    module_file : string, optional (Default: None)
+        the file to write, if None it is written to the saved_functions
+        folder next to the config file, where the config looks for it
+    """
+
+    if module_file is None:
+        module_file = robot_config._pregenerated_file()
+
+    names = (['joint%i' % ii for ii in range(robot_config.N_JOINTS)] +
+             ['link%i' % ii for ii in range(robot_config.N_LINKS)])
+    expressions = (
+        _dynamics_expressions(robot_config) +
+        _kinematics_expressions(robot_config, names, offsets=False) +
+        _kinematics_expressions(robot_config, ['EE'], offsets=True))
+    print('Writing pre-generated %s functions' % robot_config.ROBOT_NAME)
+    function_lines = _functions_source(expressions, header=[
+        'VERSION = %r' % version,
+        'CONFIG_HASH = %r' % robot_config.config_hash,
+        ''])
+
+    abr_control.utils.os_utils.makedirs(os.path.dirname(module_file))
+    with open(module_file, 'w') as wfile:
+        wfile.write('\n'.join(function_lines))
+
+    print('Saved pre-generated functions to %s' % module_file)
+    return module_file
+
+
+if __name__ == '__main__':
+    # regenerate the functions shipped with the bundled arms, run with
+    # python -m abr_control.utils.export [arm names]
+    import importlib
+    import sys
+
+    arms = {
+        'onelink': [{}],
+        'twolink': [{}],
+        'threelink': [{}],
+        'ur5': [{}],
+        'jaco2': [{'hand_attached': False}, {'hand_attached': True}],
+    }
+    for arm in sys.argv[1:] or sorted(arms):
+        config_module = importlib.import_module(
+            'abr_control.arms.%s.config' % arm)
+        for kwargs in arms[arm]:
+            pregenerate(config_module.Config(**kwargs))
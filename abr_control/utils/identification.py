@@ -0,0 +1,199 @@
+"""
+Identify the inertial parameters of a robot from logged runs, using the
+dynamics regressor of the robot config, such that the applied joint torques
+are u = np.dot(Y(q, dq, ddq), theta)
+
+The identified theta can be passed back into the config with
+robot_config.set_dynamics_parameters(theta)
+"""
+import glob
+import os
+
+import numpy as np
+
+
+class RecursiveLeastSquares():
+    """ Incrementally solves for the dynamics parameters
+
+    Implemented in information form, so that a whole batch of samples can
+    be added in a single update. The current parameters of the config are
+    used as the prior, which keeps parameters that are not excited by the
+    logged movements near their specified values.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    theta_init : numpy.array, optional (Default: None)
+        the initial parameter estimate, if None the
+        robot_config.get_dynamics_parameters() values are used
+    P_init : float, optional (Default: 1e2)
+        the initial variance of the parameter estimates
+    forgetting : float, optional (Default: 1.0)
+        factor in (0, 1] that old samples are discounted by with
+        each update, 1 weighs all samples equally
+
+    Attributes
+    ----------
+    R : numpy.array
+        the information matrix, the inverse of the estimate covariance
+    b : numpy.array
+        the information vector, such that theta = R^-1 b
+    n_samples : int
+        the number of samples that have been added
+    """
+
+    def __init__(self, robot_config, theta_init=None, P_init=1e2,
+                 forgetting=1.0):
+
+        self.robot_config = robot_config
+        self.forgetting = forgetting
+
+        if theta_init is None:
+            theta_init = robot_config.get_dynamics_parameters()
+        theta_init = np.asarray(theta_init, dtype='float64')
+
+        self.R = np.eye(theta_init.shape[0]) / P_init
+        self.b = np.dot(self.R, theta_init)
+        self.theta = np.copy(theta_init)
+        self.n_samples = 0
+
+    def update(self, Y, u):
+        """ Adds a batch of samples and updates the parameter estimate
+
+        Parameters
+        ----------
+        Y : numpy.array
+            the regressor for each sample, shape (K, N_JOINTS, P)
+        u : numpy.array
+            the applied joint torques for each sample, shape (K, N_JOINTS)
+        """
+
+        Y = np.asarray(Y).reshape(-1, self.R.shape[0])
+        u = np.asarray(u).reshape(-1)
+
+        self.R = self.forgetting * self.R + np.dot(Y.T, Y)
+        self.b = self.forgetting * self.b + np.dot(Y.T, u)
+        self.theta = np.linalg.solve(self.R, self.b)
+        self.n_samples += Y.shape[0] // self.robot_config.N_JOINTS
+
+        return self.theta
+
+    def fit(self, q, dq, ddq, u, batch_size=500):
+        """ Evaluates the regressor in batches and adds each one
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians], shape (K, N_JOINTS)
+        dq : numpy.array
+            joint velocities [radians/second], shape (K, N_JOINTS)
+        ddq : numpy.array
+            joint accelerations [radians/second**2], shape (K, N_JOINTS)
+        u : numpy.array
+            the applied joint torques [Nm], shape (K, N_JOINTS)
+        batch_size : int, optional (Default: 500)
+            the number of samples to evaluate the regressor for at once
+        """
+
+        for ii in range(0, len(q), batch_size):
+            batch = slice(ii, ii + batch_size)
+            Y = self.robot_config.Y(q[batch], dq[batch], ddq[batch])
+            self.update(Y, u[batch])
+
+        return self.theta
+
+    def residual(self, q, dq, ddq, u):
+        """ Returns the RMS torque error of the current estimate
+
+        Parameters
+        ----------
+        q : numpy.array
+            joint angles [radians], shape (K, N_JOINTS)
+        dq : numpy.array
+            joint velocities [radians/second], shape (K, N_JOINTS)
+        ddq : numpy.array
+            joint accelerations [radians/second**2], shape (K, N_JOINTS)
+        u : numpy.array
+            the applied joint torques [Nm], shape (K, N_JOINTS)
+        """
+
+        Y = self.robot_config.Y(q, dq, ddq)
+        error = np.einsum('kjp,p->kj', Y, self.theta) - u
+        return np.sqrt(np.mean(error**2, axis=0))
+
+
+def load_run(folder, dt=None):
+    """ Loads the q, dq, and u tracked during a run
+
+    Reads the files saved to a run%i_data folder by
+    abr_control.utils.adapt_training, and estimates the joint
+    accelerations by differentiating the joint velocities.
+
+    Parameters
+    ----------
+    folder : string
+        the run%i_data folder to load from
+    dt : float, optional (Default: None)
+        the time step between samples [seconds], if None the
+        saved loop times are used
+    """
+
+    run_num = int(os.path.basename(os.path.normpath(folder))
+                  .split('run')[-1].split('_')[0])
+    data = {}
+    for key in ['q', 'dq', 'u']:
+        data[key] = np.squeeze(np.load(
+            '%s/%s%i.npz' % (folder, key, run_num))[key], axis=0)
+
+    if dt is None:
+        loop_times = np.squeeze(np.load(
+            '%s/time%i.npz' % (folder, run_num))['time'], axis=0)
+        t = np.cumsum(loop_times)
+        data['ddq'] = np.gradient(data['dq'], t, axis=0)
+    else:
+        data['ddq'] = np.gradient(data['dq'], dt, axis=0)
+
+    return data
+
+
+def identify(robot_config, folders, dt=None, batch_size=500,
+             rls=None, verbose=True):
+    """ Streams logged runs through recursive least squares
+
+    Each run is loaded, added, and released one at a time, so the
+    number of runs is not limited by memory.
+
+    Parameters
+    ----------
+    robot_config : class instance
+        contains all relevant information about the arm
+        such as: number of joints, number of links, mass information etc.
+    folders : string or list of strings
+        run%i_data folders to load from, a string is expanded with glob
+    dt : float, optional (Default: None)
+        the time step between samples [seconds], if None the
+        saved loop times are used
+    batch_size : int, optional (Default: 500)
+        the number of samples to evaluate the regressor for at once
+    rls : RecursiveLeastSquares, optional (Default: None)
+        an estimator to continue updating, if None a new one is created
+    verbose : boolean, optional (Default: True)
+        print the torque residual after each run
+    """
+
+    if isinstance(folders, str):
+        folders = sorted(glob.glob(folders))
+    if rls is None:
+        rls = RecursiveLeastSquares(robot_config)
+
+    for folder in folders:
+        data = load_run(folder, dt=dt)
+        rls.fit(data['q'], data['dq'], data['ddq'], data['u'],
+                batch_size=batch_size)
+        if verbose:
+            print('%s: RMS torque residual ' % folder,
+                  rls.residual(data['q'], data['dq'], data['ddq'], data['u']))
+
+    return rls.theta
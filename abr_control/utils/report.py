@@ -0,0 +1,39 @@
+"""
+Prints the complexity and cost of the functions generated for an arm,
+to track expression size and evaluation time as configs change.
+
+Example usage:
+
+    python -m abr_control.utils.report ur5
+    python -m abr_control.utils.report jaco2 --hand_attached M g
+"""
+import argparse
+import importlib
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Report on the functions generated for a robot config')
+    parser.add_argument('arm', help='name of the arm, ex: ur5')
+    parser.add_argument('functions', nargs='*',
+                        help='functions to report on, default all saved')
+    parser.add_argument('--hand_attached', action='store_true',
+                        help='use the config with the hand attached (jaco2)')
+    parser.add_argument('--use_cython', action='store_true')
+    parser.add_argument('--use_numba', action='store_true')
+    parser.add_argument('--n_trials', type=int, default=1000)
+    args = parser.parse_args(args)
+
+    config_module = importlib.import_module(
+        'abr_control.arms.%s.config' % args.arm)
+    kwargs = {'use_cython': args.use_cython, 'use_numba': args.use_numba}
+    if args.hand_attached:
+        kwargs['hand_attached'] = True
+    robot_config = config_module.Config(**kwargs)
+
+    return robot_config.report(functions=args.functions or None,
+                               n_trials=args.n_trials)
+
+
+if __name__ == '__main__':
+    main()